@@ -2,20 +2,26 @@ import abc
 import re
 import asyncio
 import collections
+import copy
+import functools
 import logging
 import platform
 import time
 import typing
 
 from .. import version, helpers, __name__ as __base_name__
-from ..crypto import rsa
+from ..crypto import rsa, AuthKey
 from ..entitycache import EntityCache
+from ..floodlimiter import FloodLimiter
+from ..metrics import Metrics
+from ..responsecache import ResponseCache
 from ..extensions.markup import markdown
 from ..network import MTProtoSender, Connection, ConnectionTcpFull, TcpMTProxy
 from ..sessions import Session, SQLiteSession, MemorySession
 from ..statecache import StateCache
 from ..tl import functions, types
 from ..tl.alltlobjects import LAYER
+from ..tl.core import GzipPacked
 
 DEFAULT_DC_ID = 2
 DEFAULT_IPV4_IP = '149.154.167.51'
@@ -208,6 +214,117 @@ class TelegramBaseClient(abc.ABC):
             so event handlers, conversations, and QR login will not work.
             However, certain scripts don't need updates, so this will reduce
             the amount of bandwidth used.
+
+        connection_pool_size (`int`, optional):
+            How many connections to the home data center should be used
+            to send requests. By default a single connection is used.
+
+            Additional connections share the authorization key, but each
+            has its own MTProto session, so requests can be spread across
+            several sockets instead of queueing behind each other in one.
+            Requests are sent through the connection with the least amount
+            of requests in flight. Ordered requests and updates always go
+            through the first connection.
+
+        batch_delay (`float`, optional):
+            The maximum time in seconds to wait for more requests before
+            sending a batch while requests are being made in bursts, so
+            that more of them are packed into the same container. It has
+            no effect when requests are made one at a time. By default,
+            batches are sent without waiting.
+
+        batch_size (`int`, optional):
+            The amount of queued bytes after which a batch is sent without
+            waiting the rest of `batch_delay`. Defaults to the maximum size
+            of a container.
+
+        max_in_flight (`int`, optional):
+            The maximum amount of requests that may be waiting for a
+            response at the same time through each connection. Requests
+            made past this limit wait until a previous one completes
+            before being sent. By default there is no limit.
+
+        buffered_protocol (`bool`, optional):
+            Whether the connections should read from the network through
+            an ``asyncio.BufferedProtocol``, which frames the packets as
+            soon as they arrive instead of reading them one by one from a
+            stream. Needs Python 3.7 or later, and is not used by the HTTP
+            and MTProxy connection modes. Defaults to `False`.
+
+        lazy_updates (`bool`, optional):
+            Whether updates which come alone (inside :tl:`UpdateShort`)
+            should only be deserialized if there is an event handler
+            that may handle them. This saves a lot of work in large
+            groups, where most of these are typing or status updates.
+            Defaults to `False`.
+
+        crypto_offload_threshold (`int`, optional):
+            Messages of at least this many bytes will be encrypted and
+            decrypted in the event loop's default executor, so that large
+            uploads and downloads don't block the other tasks meanwhile.
+            It's only worth it with ``cryptg`` installed (pure Python
+            encryption holds the GIL). By default, everything is done in
+            the event loop.
+
+        gzip_level (`int`, optional):
+            The compression level (1 to 9) used for large requests, or 0
+            to never compress them. Lower levels use less CPU but may save
+            less bandwidth. File parts are never compressed, and neither is
+            data that doesn't look like it would compress well. Defaults
+            to 9, like ``gzip``.
+
+        coalesce_requests (`bool`, optional):
+            Whether identical read-only requests (like getting the same
+            full channel or user) made while an earlier one is still
+            waiting for its result should share that result instead of
+            being sent again. All the callers get the same object back.
+            Defaults to `False`.
+
+        response_cache (`bool` | `ResponseCache <telethon.responsecache.ResponseCache>`, optional):
+            Whether the results of some read-only requests (like getting
+            the configuration, full channels or sticker sets) should be
+            reused for a while when the same request is made again. Pass
+            your own instance to change which requests are cached, for
+            how long, or to read its hit and miss counters. Defaults to
+            `False`.
+
+        metrics (`bool` | `Metrics <telethon.metrics.Metrics>`, optional):
+            Whether to record metrics about the requests, connections and
+            messages sent by this client, which can be exported with
+            `telethon.metrics.export_prometheus`. Pass your own instance
+            to give it labels (like a name for this client). Defaults to
+            `False`, in which case nothing is recorded.
+
+            The gauges of queued and pending requests are labelled by the
+            ``sender`` they belong to: ``main``, ``pool-N`` for the rest of
+            the connection pool, and ``dc-N`` for other data centers.
+
+        trace_callback (`callable`, optional):
+            A function called as ``callback(stage, state)`` whenever a
+            request goes through a stage of its life, in order to find out
+            where the time is spent. The stages are ``'created'``,
+            ``'packed'``, ``'encrypted'``, ``'written'``, ``'acked'``,
+            ``'result'`` and ``'error'`` (which also gets the error as the
+            third argument). ``state.request`` is the request, and
+            ``state.msg_id`` its message ID once packed. It must be quick,
+            because it runs inside the network loops.
+
+        flood_limiter (`bool` | `FloodLimiter <telethon.floodlimiter.FloodLimiter>`, optional):
+            Whether to learn how often each method can be used from the
+            flood waits (and how often messages can be sent to chats in
+            slow mode), and pace the requests accordingly before sending
+            them. This gives a steadier throughput than sending as fast
+            as possible and then sleeping. Delays above the
+            `flood_sleep_threshold` raise `FloodWaitError` right away.
+            Defaults to `False`.
+
+        happy_eyeballs_delay (`float`, optional):
+            If set, connecting to a data center tries all of its known
+            addresses (both IPv4 and IPv6) instead of only one, starting
+            a new attempt every this many seconds (or as soon as the
+            previous fails) and keeping whichever connects first. The
+            fastest addresses are tried first the next time. It's not
+            used with proxies. By default, only one address is tried.
     """
 
     # Current TelegramClient version
@@ -244,7 +361,21 @@ class TelegramBaseClient(abc.ABC):
             system_lang_code: str = 'en',
             loop: asyncio.AbstractEventLoop = None,
             base_logger: typing.Union[str, logging.Logger] = None,
-            receive_updates: bool = True
+            receive_updates: bool = True,
+            connection_pool_size: int = 1,
+            batch_delay: float = None,
+            batch_size: int = None,
+            max_in_flight: int = None,
+            buffered_protocol: bool = False,
+            lazy_updates: bool = False,
+            crypto_offload_threshold: int = None,
+            gzip_level: int = GzipPacked.DEFAULT_LEVEL,
+            coalesce_requests: bool = False,
+            response_cache: 'typing.Union[bool, ResponseCache]' = False,
+            metrics: 'typing.Union[bool, Metrics]' = False,
+            trace_callback: typing.Callable = None,
+            flood_limiter: 'typing.Union[bool, FloodLimiter]' = False,
+            happy_eyeballs_delay: float = None
     ):
         if not api_id or not api_hash:
             raise ValueError(
@@ -348,6 +479,19 @@ class TelegramBaseClient(abc.ABC):
         self._local_addr = local_addr
         self._timeout = timeout
         self._auto_reconnect = auto_reconnect
+        self._batch_delay = batch_delay
+        self._batch_size = batch_size
+        self._max_in_flight = max_in_flight
+        self._buffered_protocol = buffered_protocol
+        self._happy_eyeballs_delay = happy_eyeballs_delay
+        self._rtts = {}  # how long connecting to each address took, see `Connection`
+        self._crypto_offload_threshold = crypto_offload_threshold
+        self._gzip_level = gzip_level
+
+        if metrics is True:
+            metrics = Metrics()
+        self._metrics = metrics or None
+        self._trace_callback = trace_callback
 
         assert isinstance(connection, type)
         self._connection = connection
@@ -387,12 +531,37 @@ class TelegramBaseClient(abc.ABC):
             connect_timeout=self._timeout,
             auth_key_callback=self._auth_key_callback,
             update_callback=self._handle_update,
-            auto_reconnect_callback=self._handle_auto_reconnect
+            auto_reconnect_callback=self._handle_auto_reconnect,
+            batch_delay=self._batch_delay,
+            batch_size=self._batch_size,
+            max_in_flight=self._max_in_flight,
+            lazy_updates=lazy_updates,
+            crypto_offload_threshold=self._crypto_offload_threshold,
+            gzip_level=self._gzip_level,
+            metrics=self._metrics,
+            trace_callback=self._trace_callback
         )
 
+        # Senders sharing the auth key of ``_sender`` (which is included)
+        # to spread requests to the home DC over several connections.
+        self._connection_pool_size = max(connection_pool_size or 1, 1)
+        self._sender_pool = []
+
         # Remember flood-waited requests to avoid making them again
         self._flood_waited_requests = {}
 
+        if flood_limiter is True:
+            flood_limiter = FloodLimiter()
+        self._flood_limiter = flood_limiter or None
+
+        # Futures of the read-only requests in flight, by sender and bytes
+        self._coalesce_requests = coalesce_requests
+        self._coalesced_requests = {}
+
+        if response_cache is True:
+            response_cache = ResponseCache()
+        self._response_cache = response_cache or None
+
         # Cache ``{dc_id: (_ExportState, MTProtoSender)}`` for all borrowed senders
         self._borrowed_senders = {}
         self._borrow_sender_lock = asyncio.Lock()
@@ -419,6 +588,10 @@ class TelegramBaseClient(abc.ABC):
         # Some further state for subclasses
         self._event_builders = []
 
+        # Constructor IDs of the updates the event builders may handle,
+        # computed when needed (`None` when the handlers have changed).
+        self._wanted_updates = None
+
         # {chat_id: {Conversation}}
         self._conversations = collections.defaultdict(set)
 
@@ -531,13 +704,10 @@ class TelegramBaseClient(abc.ABC):
         self._state_cache = StateCache(
             await self.session.get_update_state(0), self._log)
 
-        if not await self._sender.connect(self._connection(
+        if not await self._sender.connect(self._new_connection(
             self.session.server_address,
             self.session.port,
-            self.session.dc_id,
-            loggers=self._log,
-            proxy=self._proxy,
-            local_addr=self._local_addr
+            self.session.dc_id
         )):
             # We don't want to init or modify anything if we were already connected
             return
@@ -547,10 +717,20 @@ class TelegramBaseClient(abc.ABC):
 
         self._init_request.query = functions.help.GetConfigRequest()
 
-        await self._sender.send(functions.InvokeWithLayerRequest(
+        config = await self._sender.send(functions.InvokeWithLayerRequest(
             LAYER, self._init_request
         ))
 
+        # Knowing the addresses of the data centers, the connections made
+        # from now on (including reconnections) can race all of them
+        if isinstance(config, types.Config):
+            self.__class__._config = config
+            if self._happy_eyeballs_delay is not None and not self._proxy:
+                self._sender._connection._set_addresses(
+                    self._dc_addresses(self.session.dc_id))
+
+        await self._connect_sender_pool()
+
         self._updates_handle = self.loop.create_task(self._update_loop())
 
     def is_connected(self: 'TelegramClient') -> bool:
@@ -616,13 +796,14 @@ class TelegramBaseClient(abc.ABC):
         # the `_sender`, so the only way to change proxy between those
         # is to directly inject parameters.
 
-        connection = getattr(self._sender, "_connection", None)
-        if connection:
-            if isinstance(connection, TcpMTProxy):
-                connection._ip = proxy[0]
-                connection._port = proxy[1]
-            else:
-                connection._proxy = proxy
+        for sender in self._sender_pool or [self._sender]:
+            connection = getattr(sender, "_connection", None)
+            if connection:
+                if isinstance(connection, TcpMTProxy):
+                    connection._ip = proxy[0]
+                    connection._port = proxy[1]
+                else:
+                    connection._proxy = proxy
 
     async def _disconnect_coro(self: 'TelegramClient'):
         await self._disconnect()
@@ -670,10 +851,92 @@ class TelegramBaseClient(abc.ABC):
         file; user disconnects however should close it since it means that
         their job with the client is complete and we should clean it up all.
         """
+        for sender in list(self._sender_pool):
+            if sender is not self._sender:
+                await sender.disconnect()
+
+        self._sender_pool = []
         await self._sender.disconnect()
         await helpers._cancel(self._log[__name__],
                               updates_handle=self._updates_handle)
 
+    async def _connect_sender_pool(self: 'TelegramClient'):
+        """
+        Connects the additional senders used to spread requests to the
+        home data center. The main sender must be connected beforehand,
+        since its authorization key is used by all of them.
+
+        Each sender has its own copy of the key, which it never resets
+        nor generates (only the main sender saves it in the session).
+        Senders which fail to connect are left out of the pool, and
+        those which disconnect later are removed from it.
+        """
+        self._sender_pool = [self._sender]
+        for i in range(1, self._connection_pool_size):
+            sender = MTProtoSender(
+                AuthKey(self._sender.auth_key.key),
+                manage_auth_key=False,
+                loggers=self._log,
+                retries=self._connection_retries,
+                delay=self._retry_delay,
+                auto_reconnect=self._auto_reconnect,
+                connect_timeout=self._timeout,
+                batch_delay=self._batch_delay,
+                batch_size=self._batch_size,
+                max_in_flight=self._max_in_flight,
+                crypto_offload_threshold=self._crypto_offload_threshold,
+                gzip_level=self._gzip_level,
+                metrics=self._metrics,
+                metrics_label='pool-{}'.format(i),
+                trace_callback=self._trace_callback
+            )
+            try:
+                await sender.connect(self._new_connection(
+                    self.session.server_address,
+                    self.session.port,
+                    self.session.dc_id
+                ))
+                # The pool must not be subscribed to updates (they would be
+                # received more than once), and the main init is left as-is.
+                init = copy.copy(self._init_request)
+                init.query = functions.InvokeWithoutUpdatesRequest(
+                    functions.help.GetConfigRequest())
+                await sender.send(functions.InvokeWithLayerRequest(LAYER, init))
+            except (ConnectionError, asyncio.TimeoutError) as e:
+                self._log[__name__].warning(
+                    'Failed to connect sender %d of the pool: %s: %s',
+                    len(self._sender_pool), type(e).__name__, e)
+                await sender.disconnect()
+            else:
+                self._sender_pool.append(sender)
+                sender.disconnected.add_done_callback(
+                    functools.partial(self._drop_pool_sender, sender))
+
+    def _drop_pool_sender(self: 'TelegramClient', sender, disconnected):
+        if sender in self._sender_pool:
+            self._sender_pool.remove(sender)
+        if not disconnected.cancelled() and disconnected.exception():
+            self._log[__name__].warning(
+                'Removed a sender from the pool after it disconnected: %s',
+                disconnected.exception())
+
+    def _pick_pool_sender(self: 'TelegramClient'):
+        """
+        Picks the connected sender from the pool with the least amount
+        of requests in flight. The main sender is preferred on ties.
+        """
+        best = self._sender
+        best_count = best.queue_depth
+        for sender in self._sender_pool:
+            if sender is best or not sender._transport_connected():
+                continue
+
+            count = sender.queue_depth
+            if count < best_count:
+                best, best_count = sender, count
+
+        return best
+
     async def _switch_dc(self: 'TelegramClient', new_dc):
         """
         Permanently switches the current connection to the new data center.
@@ -714,13 +977,14 @@ class TelegramBaseClient(abc.ABC):
                 if pk.dc_id == dc_id:
                     rsa.add_key(pk.public_key, old=False)
 
+        # Out of several options, prefer the ones that connected fastest
         try:
-            return next(
+            return min((
                 dc for dc in cls._config.dc_options
                 if dc.id == dc_id
                 and bool(dc.ipv6) == self._use_ipv6 and bool(dc.cdn) == cdn
-            )
-        except StopIteration:
+            ), key=lambda dc: Connection._rtt_key(self._rtts, (dc.ip_address, dc.port)))
+        except ValueError:
             self._log[__name__].warning(
                 'Failed to get DC %s (cdn = %s) with use_ipv6 = %s; retrying ignoring IPv6 check',
                 dc_id, cdn, self._use_ipv6
@@ -733,6 +997,49 @@ class TelegramBaseClient(abc.ABC):
             except StopIteration:
                 raise ValueError(f'Failed to get DC {dc_id} (cdn = {cdn})')
 
+    def _new_connection(self: 'TelegramClient', ip, port, dc_id):
+        """
+        Creates a new connection to the given address, which will race
+        the rest of known addresses of the data center if the client uses
+        `happy_eyeballs_delay` (and no proxy).
+        """
+        kwargs = {}
+        if self._happy_eyeballs_delay is not None and not self._proxy:
+            kwargs['addresses'] = self._dc_addresses(dc_id)
+            kwargs['happy_eyeballs_delay'] = self._happy_eyeballs_delay
+            kwargs['rtts'] = self._rtts
+
+        return self._connection(
+            ip,
+            port,
+            dc_id,
+            loggers=self._log,
+            proxy=self._proxy,
+            local_addr=self._local_addr,
+            buffered=self._buffered_protocol,
+            **kwargs
+        )
+
+    def _dc_addresses(self: 'TelegramClient', dc_id):
+        """
+        The ``(ip, port)`` of the known options to connect to the data
+        center (none if the configuration hasn't been fetched yet).
+        """
+        if not self._config:
+            return []
+
+        local_ipv6 = None
+        if self._local_addr is not None:
+            local = self._local_addr if isinstance(self._local_addr, str) else self._local_addr[0]
+            local_ipv6 = ':' in local
+
+        return [
+            (dc.ip_address, dc.port) for dc in self._config.dc_options
+            if dc.id == dc_id and not dc.cdn and not dc.media_only
+            and not dc.tcpo_only
+            and (local_ipv6 is None or bool(dc.ipv6) == local_ipv6)
+        ]
+
     async def _create_exported_sender(self: 'TelegramClient', dc_id):
         """
         Creates a new exported `MTProtoSender` for the given `dc_id` and
@@ -745,14 +1052,16 @@ class TelegramBaseClient(abc.ABC):
         #
         # If one were to do that, Telegram would reset the connection
         # with no further clues.
-        sender = MTProtoSender(None, loggers=self._log)
-        await sender.connect(self._connection(
+        sender = MTProtoSender(
+            None, loggers=self._log,
+            crypto_offload_threshold=self._crypto_offload_threshold,
+            gzip_level=self._gzip_level, metrics=self._metrics,
+            metrics_label='dc-{}'.format(dc_id),
+            trace_callback=self._trace_callback)
+        await sender.connect(self._new_connection(
             dc.ip_address,
             dc.port,
-            dc.id,
-            loggers=self._log,
-            proxy=self._proxy,
-            local_addr=self._local_addr
+            dc.id
         ))
         self._log[__name__].info('Exporting auth for new borrowed sender in %s', dc)
         auth = await self(functions.auth.ExportAuthorizationRequest(dc_id))
@@ -781,13 +1090,10 @@ class TelegramBaseClient(abc.ABC):
 
             elif state.need_connect():
                 dc = await self._get_dc(dc_id)
-                await sender.connect(self._connection(
+                await sender.connect(self._new_connection(
                     dc.ip_address,
                     dc.port,
-                    dc.id,
-                    loggers=self._log,
-                    proxy=self._proxy,
-                    local_addr=self._local_addr
+                    dc.id
                 ))
 
             state.add_borrow()
@@ -841,7 +1147,8 @@ class TelegramBaseClient(abc.ABC):
             session.dc_id,
             loggers=self._log,
             proxy=self._proxy,
-            local_addr=self._local_addr
+            local_addr=self._local_addr,
+            buffered=self._buffered_protocol
         ))
         return client
 
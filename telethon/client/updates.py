@@ -11,6 +11,7 @@ import logging
 from .. import events, utils, errors
 from ..events.common import EventBuilder, EventCommon
 from ..tl import types, functions
+from ..tl.core import LazyUpdate
 
 if typing.TYPE_CHECKING:
     from .telegramclient import TelegramClient
@@ -18,6 +19,22 @@ if typing.TYPE_CHECKING:
 
 Callback = typing.Callable[[typing.Any], typing.Any]
 
+# Every :tl:`Update` type, filled the first time it's needed
+_update_types = []
+
+
+def _update_constructors(update_types):
+    """
+    Returns the constructor IDs of every :tl:`Update` which is an instance
+    of `update_types` (anything accepted by `isinstance`, or `None` for all).
+    """
+    if not _update_types:
+        _update_types.extend(types.TypeUpdate.__args__)
+
+    return {x.CONSTRUCTOR_ID for x in _update_types
+            if update_types is None or issubclass(x, update_types)}
+
+
 class UpdateMethods:
 
     # region Public methods
@@ -155,6 +172,7 @@ class UpdateMethods:
         if builders is not None:
             for event in builders:
                 self._event_builders.append((event, callback))
+            self._wanted_updates = None
             return
 
         if isinstance(event, type):
@@ -163,6 +181,7 @@ class UpdateMethods:
             event = events.Raw()
 
         self._event_builders.append((event, callback))
+        self._wanted_updates = None
 
     def remove_event_handler(
             self: 'TelegramClient',
@@ -201,6 +220,7 @@ class UpdateMethods:
                 del self._event_builders[i]
                 found += 1
 
+        self._wanted_updates = None
         return found
 
     def list_event_handlers(self: 'TelegramClient')\
@@ -301,6 +321,15 @@ class UpdateMethods:
     # the order that the updates arrive in to update the pts and date to
     # be always-increasing. There is also no need to make this async.
     async def _handle_update(self: 'TelegramClient', update):
+        if (isinstance(update, types.UpdateShort)
+                and isinstance(update.update, LazyUpdate)):
+            if not self._wants_update(update.update):
+                # No handler would see it, so it's not worth decoding
+                self._state_cache.update(update)
+                return
+
+            update.update = update.update.decode()
+
         await self.session.process_entities(update)
         self._entity_cache.add(update)
 
@@ -336,6 +365,26 @@ class UpdateMethods:
 
         self._state_cache.update(update)
 
+    def _wants_update(self: 'TelegramClient', update):
+        """
+        Whether the `LazyUpdate` needs to be decoded, either because it
+        affects the update state or because some handler may use it.
+        """
+        if self._state_cache.update(update, check_only=True):
+            return True
+
+        # Conversations may wait for any event, so don't bother
+        if any(self._conversations.values()):
+            return True
+
+        if self._wanted_updates is None:
+            self._wanted_updates = set()
+            for builder, _ in self._event_builders:
+                self._wanted_updates.update(
+                    _update_constructors(builder._update_types))
+
+        return update.CONSTRUCTOR_ID in self._wanted_updates
+
     async def _update_loop(self: 'TelegramClient'):
         # Pings' ID don't really need to be secure, just "random"
         rnd = lambda: random.randrange(-2**63, 2**63)
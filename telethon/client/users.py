@@ -1,16 +1,46 @@
 import asyncio
+import collections
 import datetime
+import functools
+import inspect
 import itertools
+import math
 import time
 import typing
 
 from .. import errors, helpers, utils, hints
 from ..errors import MultiError, RPCError
 from ..helpers import retry_range
+from ..network.requeststate import request_name, _unwrap
+from ..requestiter import RequestIter
 from ..tl import TLRequest, types, functions
 
 _NOT_A_REQUEST = lambda: TypeError('You can only invoke requests, not types!')
 
+# Read-only requests which can share the result of an identical one that
+# is already in flight (only used if the client has ``coalesce_requests``).
+_COALESCED_REQUESTS = (
+    'help.GetConfigRequest',
+    'help.GetNearestDcRequest',
+    'users.GetUsersRequest',
+    'users.GetFullUserRequest',
+    'messages.GetChatsRequest',
+    'messages.GetFullChatRequest',
+    'messages.GetMessagesRequest',
+    'messages.GetStickerSetRequest',
+    'channels.GetChannelsRequest',
+    'channels.GetFullChannelRequest',
+    'channels.GetMessagesRequest',
+    'channels.GetParticipantRequest',
+    'contacts.ResolveUsernameRequest',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _coalesced_ids():
+    # Only imported the first time, since most clients don't coalesce
+    return frozenset(map(helpers._constructor_id, _COALESCED_REQUESTS))
+
 if typing.TYPE_CHECKING:
     from .telegramclient import TelegramClient
 
@@ -25,15 +55,90 @@ def _fmt_flood(delay, request, *, early=False, td=datetime.timedelta):
     )
 
 
+class _RequestsIter(RequestIter):
+    async def _init(self, requests, concurrency, return_exceptions):
+        try:
+            self.total = len(requests)
+        except TypeError:
+            pass
+
+        self._requests = iter(requests)
+        self._concurrency = max(concurrency, 1)
+        self._return_exceptions = return_exceptions
+        self._pending = collections.deque()
+        self._fill()
+
+    def _fill(self):
+        # Each request goes through the client on its own, so that flood
+        # waits and internal errors are handled (and retried) per item,
+        # while the sender packs those in flight together in containers.
+        while len(self._pending) < self._concurrency:
+            try:
+                request = next(self._requests)
+            except StopIteration:
+                break
+            self._pending.append(asyncio.ensure_future(self.client(request)))
+
+    def _cancel(self):
+        for task in self._pending:
+            task.cancel()
+        self._pending.clear()
+
+    async def _load_next_chunk(self):
+        if not self._pending:
+            return True
+
+        try:
+            await asyncio.wait([self._pending[0]])
+        except BaseException:
+            self._cancel()
+            raise
+
+        # Results are returned in order, so only those done from the
+        # start can be emitted, but there may be several by now.
+        while self._pending and self._pending[0].done():
+            try:
+                result = self._pending.popleft().result()
+            except Exception as e:
+                if not self._return_exceptions:
+                    self._cancel()
+                    raise
+                result = e
+            self.buffer.append(result)
+
+        self._fill()
+        return not self._pending
+
+
 class UserMethods:
     async def __call__(self: 'TelegramClient', request, ordered=False, flood_sleep_threshold=None):
-        return await self._call(self._sender, request, ordered=ordered)
+        cache = self._response_cache
+        if cache is None or not isinstance(request, TLRequest) or not cache.cacheable(request):
+            return await self._call(self._sender, request, ordered=ordered)
+
+        # The cache is keyed by the bytes, which need the entities resolved
+        await request.resolve(self, utils)
+        result = cache.get(request)
+        if result is None:
+            result = await self._call(self._sender, request, ordered=ordered)
+            cache.add(request, result)
+
+        return result
 
     async def _call(self: 'TelegramClient', sender, request, ordered=False, flood_sleep_threshold=None):
         if flood_sleep_threshold is None:
             flood_sleep_threshold = self.flood_sleep_threshold
         requests = list(request) if utils.is_list_like(request) else [request]
         request = list(request) if utils.is_list_like(request) else request
+        target = sender
+
+        # Ordered requests must all go through the same session, so they
+        # are only spread across the pool when there is no ordering.
+        pooled = False
+        if sender is self._sender and not ordered and len(self._sender_pool) > 1:
+            sender = self._pick_pool_sender()
+            pooled = sender is not self._sender
+
         for i, r in enumerate(requests):
             if not isinstance(r, TLRequest):
                 raise _NOT_A_REQUEST()
@@ -52,18 +157,64 @@ class UserMethods:
                 else:
                     raise errors.FloodWaitError(request=r, capture=diff)
 
-            if self._no_updates:
+            # Updates are only received through the main sender, otherwise
+            # the additional sessions of the pool would get them duplicated.
+            if self._no_updates or pooled:
                 if utils.is_list_like(request):
                     request[i] = functions.InvokeWithoutUpdatesRequest(r)
                 else:
                     # This should only run once as requests should be a list of 1 item
                     request = functions.InvokeWithoutUpdatesRequest(r)
 
+        if (self._coalesce_requests and len(requests) == 1
+                and requests[0].CONSTRUCTOR_ID in _coalesced_ids()):
+            key = (target, bytes(requests[0]))
+            while key in self._coalesced_requests:
+                future = self._coalesced_requests[key]
+                try:
+                    # Shielded so that a cancelled caller doesn't cancel the rest
+                    return await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # If it was the caller who sent it who got cancelled,
+                    # the request has to be sent again (maybe by this one).
+                    if not future.cancelled():
+                        raise
+
+            future = self._coalesced_requests[key] = \
+                asyncio.get_event_loop().create_future()
+            try:
+                result = await self._invoke(
+                    sender, request, requests, ordered, pooled, flood_sleep_threshold)
+            except Exception as e:
+                future.set_exception(e)
+                # Nobody else may be waiting, so retrieve it to avoid warnings
+                future.exception()
+                raise
+            except BaseException:
+                future.cancel()
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                del self._coalesced_requests[key]
+
+        return await self._invoke(
+            sender, request, requests, ordered, pooled, flood_sleep_threshold)
+
+    async def _invoke(self: 'TelegramClient', sender, request, requests, ordered, pooled,
+                      flood_sleep_threshold):
+        if self._flood_limiter is not None:
+            await self._pace(requests, flood_sleep_threshold)
+
         request_index = 0
         last_error = None
         self._last_request = time.time()
 
         for attempt in retry_range(self._request_retries):
+            if last_error is not None and self._metrics is not None:
+                self._metrics.inc('request_retries_total', request_name(last_error.request))
+
             try:
                 future = sender.send(request, ordered=ordered)
                 if isinstance(future, list):
@@ -78,6 +229,8 @@ class UserMethods:
                             continue
                         await self.session.process_entities(result)
                         self._entity_cache.add(result)
+                        if self._flood_limiter is not None:
+                            self._flood_limiter.succeeded(requests[len(results)])
                         exceptions.append(None)
                         results.append(result)
                         request_index += 1
@@ -89,6 +242,8 @@ class UserMethods:
                     result = await future
                     await self.session.process_entities(result)
                     self._entity_cache.add(result)
+                    if self._flood_limiter is not None:
+                        self._flood_limiter.succeeded(requests[0])
                     return result
             except (errors.ServerError, errors.RpcCallFailError,
                     errors.RpcMcgetFailError, errors.InterdcCallErrorError,
@@ -105,10 +260,23 @@ class UserMethods:
                 if utils.is_list_like(request):
                     request = request[request_index]
 
+                if self._flood_limiter is not None:
+                    if isinstance(e, errors.SlowModeWaitError):
+                        self._flood_limiter.slow_mode_wait(request, e.seconds)
+                    else:
+                        self._flood_limiter.flood_wait(request, e.seconds)
+
+                if self._metrics is not None:
+                    self._metrics.inc('flood_waits_total', request_name(request))
+                    self._metrics.inc(
+                        'flood_wait_seconds_total', request_name(request), e.seconds)
+
                 # SLOW_MODE_WAIT is chat-specific, not request-specific
                 if not isinstance(e, errors.SlowModeWaitError):
+                    # Recorded for the request itself and not its wrappers,
+                    # which is what's looked up before sending the next one
                     self._flood_waited_requests\
-                        [request.CONSTRUCTOR_ID] = time.time() + e.seconds
+                        [_unwrap(request).CONSTRUCTOR_ID] = time.time() + e.seconds
 
                 # In test servers, FLOOD_WAIT_0 has been observed, and sleeping for
                 # such a short amount will cause retries very fast leading to issues.
@@ -130,12 +298,41 @@ class UserMethods:
                 if should_raise and await self.is_user_authorized():
                     raise
                 await self._switch_dc(e.new_dc)
+                if pooled:
+                    # The pool was disconnected with the old data center
+                    sender = self._sender
 
         if self._raise_last_call_error and last_error is not None:
             raise last_error
         raise ValueError('Request was unsuccessful {} time(s)'
                          .format(attempt))
 
+    async def _pace(self: 'TelegramClient', requests, flood_sleep_threshold):
+        """
+        Waits until the flood limiter allows sending the requests.
+
+        The slots are given back if the requests won't be sent after all,
+        or else every rejected call would push the schedule further back.
+        """
+        delay, slowest = 0, None
+        for r in requests:
+            d = self._flood_limiter.reserve(r)
+            if d > delay:
+                delay, slowest = d, r
+
+        try:
+            if delay > flood_sleep_threshold:
+                raise errors.FloodWaitError(request=slowest, capture=math.ceil(delay))
+            elif delay > 0:
+                self._log[__name__].debug(
+                    'Pacing %s for %.2fs to avoid a flood wait',
+                    slowest.__class__.__name__, delay)
+                await asyncio.sleep(delay)
+        except BaseException:
+            for r in reversed(requests):
+                self._flood_limiter.release(r)
+            raise
+
     # region Public methods
 
     async def get_me(self: 'TelegramClient', input_peer: bool = False) \
@@ -513,6 +710,79 @@ class UserMethods:
 
         return utils.get_peer_id(peer, add_mark=add_mark)
 
+    def iter_requests(
+            self: 'TelegramClient',
+            requests: 'typing.Iterable[TLRequest]',
+            *,
+            concurrency: int = 100,
+            return_exceptions: bool = False) -> _RequestsIter:
+        """
+        Iterator over the results of making many requests, in the same
+        order as the requests, while keeping up to ``concurrency`` of them
+        in flight at once.
+
+        Unlike ``client([...])``, each request is made on its own, so that
+        flood waits (up to `flood_sleep_threshold`) and internal server
+        errors are handled for each of them as if they were made one by
+        one. The ones in flight at the same time still share containers.
+        The requests are only taken from the iterable as they're needed.
+
+        Arguments
+            requests (`iterable`):
+                The requests to make.
+
+            concurrency (`int`, optional):
+                How many requests may be waiting for their result at once.
+
+            return_exceptions (`bool`, optional):
+                Whether the errors of the requests that fail should be
+                returned in their place. By default, the first error is
+                raised and the rest of requests in flight are cancelled.
+
+        Yields
+            The result of each request (or its error).
+
+        Example
+            .. code-block:: python
+
+                from telethon import functions
+
+                requests = (functions.messages.GetMessagesRequest([i])
+                            for i in range(1, 10000))
+
+                async for result in client.iter_requests(requests, concurrency=50):
+                    print(result.messages)
+        """
+        return _RequestsIter(
+            self,
+            None,
+            requests=requests,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions
+        )
+
+    async def gather_requests(
+            self: 'TelegramClient',
+            *args,
+            **kwargs) -> 'hints.TotalList':
+        """
+        Same as `iter_requests()`, but returns a
+        `TotalList <telethon.helpers.TotalList>` instead.
+
+        Example
+            .. code-block:: python
+
+                from telethon import functions
+
+                users = await client.gather_requests(
+                    [functions.users.GetUsersRequest([u]) for u in ids],
+                    return_exceptions=True
+                )
+        """
+        return await self.iter_requests(*args, **kwargs).collect()
+
+    gather_requests.__signature__ = inspect.signature(iter_requests)
+
     # endregion
 
     # region Private methods
@@ -0,0 +1,9 @@
+"""
+Prints the speed of every available AES backend, marking those in use.
+"""
+from . import backends
+
+
+for name, mode, speed in backends.benchmark():
+    active = '*' if backends.get_backend(mode) == name else ' '
+    print('{} {:<14} {:<4} {:10.2f} MB/s'.format(active, name, mode.upper(), speed))
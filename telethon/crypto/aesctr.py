@@ -1,13 +1,14 @@
 """
 This module holds the AESModeCTR wrapper class.
 """
-import pyaes
+from . import backends
 
 
 class AESModeCTR:
-    """Wrapper around pyaes.AESModeOfOperationCTR mode with custom IV"""
-    # TODO Maybe make a pull request to pyaes to support iv on CTR
-
+    """
+    Wrapper around the AES CTR mode of the best available backend
+    (see `telethon.crypto.backends`) with custom IV.
+    """
     def __init__(self, key, iv):
         """
         Initializes the AES CTR mode with the given key/iv pair.
@@ -15,13 +16,10 @@ class AESModeCTR:
         :param key: the key to be used as bytes.
         :param iv: the bytes initialization vector. Must have a length of 16.
         """
-        # TODO Use libssl if available
         assert isinstance(key, bytes)
-        self._aes = pyaes.AESModeOfOperationCTR(key)
-
         assert isinstance(iv, bytes)
         assert len(iv) == 16
-        self._aes._counter._counter = list(iv)
+        self._aes = backends._active['ctr'].new_ctr(key, iv)
 
     def encrypt(self, data):
         """
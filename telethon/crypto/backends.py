@@ -0,0 +1,285 @@
+"""
+Registry of the available AES implementations ("backends").
+
+The AES IGE mode is used to encrypt every MTProto message, and the AES CTR
+mode by obfuscated connections, MTProxy and CDN downloads. Each backend may
+support either or both, and the best available one is picked per mode:
+
+* cryptg (IGE).
+* cryptography (CTR).
+* libssl through ctypes (IGE, and CTR if the EVP interface is found).
+* pyaes (IGE and CTR), pure Python and much slower, always available.
+
+The active backends can be changed at runtime with `set_backend`, and
+running this module prints how fast each of them is on this machine::
+
+    python -m telethon.crypto
+"""
+import logging
+import os
+import time
+
+import pyaes
+
+from . import libssl
+
+try:
+    from cryptography.hazmat.primitives.ciphers import (
+        Cipher as _Cipher, algorithms as _algorithms, modes as _modes
+    )
+except ImportError:
+    _Cipher = None
+
+
+__log__ = logging.getLogger(__name__)
+
+MODES = ('ige', 'ctr')
+
+
+class Backend:
+    """
+    A named AES implementation. Any of the functions may be `None` if
+    the backend doesn't support that mode.
+
+    ``encrypt_ige(data, key, iv)`` and ``decrypt_ige(data, key, iv)``
+    return the processed bytes, and ``new_ctr(key, iv)`` returns an object
+    with ``encrypt(data)`` and ``decrypt(data)`` methods which continue
+    the same stream between calls.
+    """
+    def __init__(self, name, *, encrypt_ige=None, decrypt_ige=None, new_ctr=None):
+        self.name = name
+        self.encrypt_ige = encrypt_ige
+        self.decrypt_ige = decrypt_ige
+        self.new_ctr = new_ctr
+
+    def supports(self, mode):
+        if mode == 'ige':
+            return bool(self.encrypt_ige and self.decrypt_ige)
+        elif mode == 'ctr':
+            return bool(self.new_ctr)
+        else:
+            raise ValueError('Unknown AES mode: {}'.format(mode))
+
+
+# Registered backends, from most to least preferred
+_backends = []
+
+# The backend in use for each mode
+_active = {}
+
+
+def register(backend, *, preferred=False):
+    """
+    Registers a new `Backend`, replacing the one with the same name if any.
+
+    Unless ``preferred`` is `True`, it's only used for the modes that
+    no previously registered backend supports (or after `set_backend`).
+    """
+    _backends[:] = [b for b in _backends if b.name != backend.name]
+    if preferred:
+        _backends.insert(0, backend)
+    else:
+        _backends.append(backend)
+
+    for mode in MODES:
+        if backend.supports(mode) and (preferred or mode not in _active):
+            _active[mode] = backend
+
+
+def get_backends(mode=None):
+    """
+    Returns the names of the registered backends, most preferred first,
+    only including those that support the given mode if any.
+    """
+    return [b.name for b in _backends if mode is None or b.supports(mode)]
+
+
+def get_backend(mode):
+    """
+    Returns the name of the backend in use for the given mode.
+    """
+    return _get(mode).name
+
+
+def set_backend(name, mode=None):
+    """
+    Uses the backend with the given name for the given mode, or for all
+    the modes it supports if no mode is given.
+    """
+    try:
+        backend = next(b for b in _backends if b.name == name)
+    except StopIteration:
+        raise ValueError('Unknown or unavailable backend: {}'.format(name)) from None
+
+    modes = [m for m in MODES if backend.supports(m)] if mode is None else [mode]
+    for mode in modes:
+        if not backend.supports(mode):
+            raise ValueError('Backend {} does not support {}'.format(name, mode))
+
+    for mode in modes:
+        _active[mode] = backend
+        __log__.info('Using %s for AES %s', name, mode.upper())
+
+
+def _get(mode):
+    try:
+        return _active[mode]
+    except KeyError:
+        raise ValueError('Unknown AES mode: {}'.format(mode)) from None
+
+
+def benchmark(size=1024 * 1024, duration=0.5):
+    """
+    Measures the throughput of every registered backend in each mode.
+
+    Returns a list of ``(backend name, mode, megabytes per second)``.
+    Slow backends are measured on smaller inputs to keep it quick.
+    """
+    key = os.urandom(32)
+    iv = os.urandom(32)
+    results = []
+    for backend in _backends:
+        data = os.urandom(size if backend.name != 'pyaes' else size // 64)
+        for mode in MODES:
+            if not backend.supports(mode):
+                continue
+
+            if mode == 'ige':
+                def run():
+                    backend.decrypt_ige(backend.encrypt_ige(data, key, iv), key, iv)
+                work = 2 * len(data)
+            else:
+                ctr = backend.new_ctr(key, iv[:16])
+                def run():
+                    ctr.encrypt(data)
+                work = len(data)
+
+            rounds = 0
+            start = time.perf_counter()
+            while True:
+                run()
+                rounds += 1
+                elapsed = time.perf_counter() - start
+                if elapsed >= duration:
+                    break
+
+            results.append((backend.name, mode, rounds * work / elapsed / 1e6))
+
+    return results
+
+
+# region Built-in backends
+
+def _pyaes_decrypt_ige(cipher_text, key, iv):
+    iv1 = iv[:len(iv) // 2]
+    iv2 = iv[len(iv) // 2:]
+
+    aes = pyaes.AES(key)
+
+    plain_text = []
+    blocks_count = len(cipher_text) // 16
+
+    cipher_text_block = [0] * 16
+    for block_index in range(blocks_count):
+        for i in range(16):
+            cipher_text_block[i] = \
+                cipher_text[block_index * 16 + i] ^ iv2[i]
+
+        plain_text_block = aes.decrypt(cipher_text_block)
+
+        for i in range(16):
+            plain_text_block[i] ^= iv1[i]
+
+        iv1 = cipher_text[block_index * 16:block_index * 16 + 16]
+        iv2 = plain_text_block
+
+        plain_text.extend(plain_text_block)
+
+    return bytes(plain_text)
+
+
+def _pyaes_encrypt_ige(plain_text, key, iv):
+    iv1 = iv[:len(iv) // 2]
+    iv2 = iv[len(iv) // 2:]
+
+    aes = pyaes.AES(key)
+
+    cipher_text = []
+    blocks_count = len(plain_text) // 16
+
+    for block_index in range(blocks_count):
+        plain_text_block = list(
+            plain_text[block_index * 16:block_index * 16 + 16]
+        )
+        for i in range(16):
+            plain_text_block[i] ^= iv1[i]
+
+        cipher_text_block = aes.encrypt(plain_text_block)
+
+        for i in range(16):
+            cipher_text_block[i] ^= iv2[i]
+
+        iv1 = cipher_text_block
+        iv2 = plain_text[block_index * 16:block_index * 16 + 16]
+
+        cipher_text.extend(cipher_text_block)
+
+    return bytes(cipher_text)
+
+
+def _pyaes_new_ctr(key, iv):
+    # TODO Maybe make a pull request to pyaes to support iv on CTR
+    aes = pyaes.AESModeOfOperationCTR(bytes(key))
+    aes._counter._counter = list(iv)
+    return aes
+
+
+class _CryptographyCTR:
+    def __init__(self, key, iv):
+        self._encryptor = _Cipher(
+            _algorithms.AES(bytes(key)), _modes.CTR(bytes(iv))).encryptor()
+
+    def encrypt(self, data):
+        return self._encryptor.update(data)
+
+    decrypt = encrypt
+
+
+def _register_builtin():
+    try:
+        import cryptg
+    except ImportError:
+        pass
+    else:
+        register(Backend(
+            'cryptg',
+            encrypt_ige=cryptg.encrypt_ige,
+            decrypt_ige=cryptg.decrypt_ige
+        ))
+
+    if _Cipher:
+        register(Backend('cryptography', new_ctr=_CryptographyCTR))
+
+    if libssl.encrypt_ige or libssl.AESModeCTR:
+        register(Backend(
+            'libssl',
+            encrypt_ige=libssl.encrypt_ige,
+            decrypt_ige=libssl.decrypt_ige,
+            new_ctr=libssl.AESModeCTR
+        ))
+
+    register(Backend(
+        'pyaes',
+        encrypt_ige=_pyaes_encrypt_ige,
+        decrypt_ige=_pyaes_decrypt_ige,
+        new_ctr=_pyaes_new_ctr
+    ))
+
+    for mode in MODES:
+        __log__.info('%s will be used for AES %s', _active[mode].name, mode.upper())
+
+
+_register_builtin()
+
+# endregion
+
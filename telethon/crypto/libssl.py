@@ -1,5 +1,6 @@
 """
-Helper module around the system's libssl library if available for IGE mode.
+Helper module around the system's libssl library if available for IGE
+and CTR modes.
 """
 import ctypes
 import ctypes.util
@@ -95,46 +96,89 @@ else:
             ('rounds', ctypes.c_uint),
         ]
 
-    def decrypt_ige(cipher_text, key, iv):
+    def _ige(data, key, iv, set_key, mode):
         aes_key = AES_KEY()
         key_len = ctypes.c_int(8 * len(key))
-        key = (ctypes.c_ubyte * len(key))(*key)
-        iv = (ctypes.c_ubyte * len(iv))(*iv)
+        key = (ctypes.c_ubyte * len(key)).from_buffer_copy(key)
+        iv = (ctypes.c_ubyte * len(iv)).from_buffer_copy(iv)
 
-        in_len = ctypes.c_size_t(len(cipher_text))
-        in_ptr = (ctypes.c_ubyte * len(cipher_text))(*cipher_text)
-        out_ptr = (ctypes.c_ubyte * len(cipher_text))()
+        in_len = ctypes.c_size_t(len(data))
+        in_ptr = (ctypes.c_ubyte * len(data)).from_buffer_copy(data)
+        out_ptr = (ctypes.c_ubyte * len(data))()
 
-        _libssl.AES_set_decrypt_key(key, key_len, ctypes.byref(aes_key))
+        set_key(key, key_len, ctypes.byref(aes_key))
         _libssl.AES_ige_encrypt(
             ctypes.byref(in_ptr),
             ctypes.byref(out_ptr),
             in_len,
             ctypes.byref(aes_key),
             ctypes.byref(iv),
-            AES_DECRYPT
+            mode
         )
 
         return bytes(out_ptr)
 
-    def encrypt_ige(plain_text, key, iv):
-        aes_key = AES_KEY()
-        key_len = ctypes.c_int(8 * len(key))
-        key = (ctypes.c_ubyte * len(key))(*key)
-        iv = (ctypes.c_ubyte * len(iv))(*iv)
+    def decrypt_ige(cipher_text, key, iv):
+        return _ige(cipher_text, key, iv,
+                    _libssl.AES_set_decrypt_key, AES_DECRYPT)
 
-        in_len = ctypes.c_size_t(len(plain_text))
-        in_ptr = (ctypes.c_ubyte * len(plain_text))(*plain_text)
-        out_ptr = (ctypes.c_ubyte * len(plain_text))()
+    def encrypt_ige(plain_text, key, iv):
+        return _ige(plain_text, key, iv,
+                    _libssl.AES_set_encrypt_key, AES_ENCRYPT)
 
-        _libssl.AES_set_encrypt_key(key, key_len, ctypes.byref(aes_key))
-        _libssl.AES_ige_encrypt(
-            ctypes.byref(in_ptr),
-            ctypes.byref(out_ptr),
-            in_len,
-            ctypes.byref(aes_key),
-            ctypes.byref(iv),
-            AES_ENCRYPT
-        )
 
-        return bytes(out_ptr)
+# The EVP interface lives in libcrypto, but is reachable through libssl
+try:
+    _EVP_CIPHER_CTX_new = _libssl.EVP_CIPHER_CTX_new
+    _EVP_CIPHER_CTX_free = _libssl.EVP_CIPHER_CTX_free
+    _EVP_EncryptInit_ex = _libssl.EVP_EncryptInit_ex
+    _EVP_EncryptUpdate = _libssl.EVP_EncryptUpdate
+    _EVP_CTR_CIPHERS = {
+        16: _libssl.EVP_aes_128_ctr,
+        24: _libssl.EVP_aes_192_ctr,
+        32: _libssl.EVP_aes_256_ctr,
+    }
+except AttributeError:  # also if _libssl is None
+    AESModeCTR = None
+else:
+    _EVP_CIPHER_CTX_new.restype = ctypes.c_void_p
+    _EVP_CIPHER_CTX_free.argtypes = [ctypes.c_void_p]
+    _EVP_EncryptInit_ex.argtypes = [
+        ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p,
+        ctypes.c_char_p, ctypes.c_char_p
+    ]
+    _EVP_EncryptUpdate.argtypes = [
+        ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_int),
+        ctypes.c_char_p, ctypes.c_int
+    ]
+    for _cipher in _EVP_CTR_CIPHERS.values():
+        _cipher.restype = ctypes.c_void_p
+
+    class AESModeCTR:
+        """AES CTR mode through an EVP cipher context"""
+        def __init__(self, key, iv):
+            self._ctx = None
+            cipher = _EVP_CTR_CIPHERS[len(key)]()
+            ctx = _EVP_CIPHER_CTX_new()
+            if not ctx:
+                raise MemoryError('EVP_CIPHER_CTX_new failed')
+
+            self._ctx = ctx
+            if not _EVP_EncryptInit_ex(ctx, cipher, None, bytes(key), bytes(iv)):
+                raise ValueError('EVP_EncryptInit_ex failed')
+
+        def encrypt(self, data):
+            data = bytes(data)
+            out = ctypes.create_string_buffer(len(data))
+            out_len = ctypes.c_int()
+            _EVP_EncryptUpdate(
+                self._ctx, out, ctypes.byref(out_len), data, len(data))
+            return out.raw[:out_len.value]
+
+        # CTR is symmetric
+        decrypt = encrypt
+
+        def __del__(self):
+            if self._ctx:
+                _EVP_CIPHER_CTX_free(self._ctx)
+                self._ctx = None
@@ -90,6 +90,7 @@ class Album(EventBuilder):
                 # Replying to the fifth item in the album
                 await event.messages[4].reply('Cool!')
     """
+    _update_types = (types.UpdateNewMessage, types.UpdateNewChannelMessage)
 
     def __init__(
             self, chats=None, *, blacklist_chats=False, func=None):
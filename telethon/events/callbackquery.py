@@ -55,6 +55,7 @@ class CallbackQuery(EventBuilder):
                     Button.inline('Nope', b'no')
                 ])
     """
+    _update_types = (types.UpdateBotCallbackQuery, types.UpdateInlineBotCallbackQuery)
     def __init__(
             self, chats=None, *, blacklist_chats=False, func=None, data=None, pattern=None):
         super().__init__(chats, blacklist_chats=blacklist_chats, func=func)
@@ -30,6 +30,14 @@ class ChatAction(EventBuilder):
                 if event.user_joined:
                     await event.reply('Welcome to the group!')
     """
+    _update_types = (
+        types.UpdatePinnedChannelMessages,
+        types.UpdatePinnedMessages,
+        types.UpdateChatParticipantAdd,
+        types.UpdateChatParticipantDelete,
+        types.UpdateNewMessage,
+        types.UpdateNewChannelMessage
+    )
 
     @classmethod
     def build(cls, update, others=None, self_id=None):
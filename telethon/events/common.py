@@ -65,6 +65,10 @@ class EventBuilder(abc.ABC):
                 async def handler(event):
                     pass  # code here
     """
+    # The :tl:`Update` types this builder may build events from, used to
+    # skip decoding the rest (see ``lazy_updates``). `None` means any.
+    _update_types = None
+
     def __init__(self, chats=None, *, blacklist_chats=False, func=None):
         self.chats = chats
         self.blacklist_chats = bool(blacklist_chats)
@@ -47,6 +47,7 @@ class InlineQuery(EventBuilder):
                     builder.article('lowercase', text=event.text.lower()),
                 ])
     """
+    _update_types = (types.UpdateBotInlineQuery,)
     def __init__(
             self, users=None, *, blacklist_users=False, func=None, pattern=None):
         super().__init__(users, blacklist_chats=blacklist_users, func=func)
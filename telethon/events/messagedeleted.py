@@ -35,6 +35,7 @@ class MessageDeleted(EventBuilder):
                 for msg_id in event.deleted_ids:
                     print('Message', msg_id, 'was deleted in', event.chat_id)
     """
+    _update_types = (types.UpdateDeleteMessages, types.UpdateDeleteChannelMessages)
     @classmethod
     def build(cls, update, others=None, self_id=None):
         if isinstance(update, types.UpdateDeleteMessages):
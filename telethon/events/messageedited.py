@@ -42,6 +42,7 @@ class MessageEdited(NewMessage):
                 # Log the date of new edits
                 print('Message', event.id, 'changed at', event.date)
     """
+    _update_types = (types.UpdateEditMessage, types.UpdateEditChannelMessage)
     @classmethod
     def build(cls, update, others=None, self_id=None):
         if isinstance(update, (types.UpdateEditMessage,
@@ -29,6 +29,14 @@ class MessageRead(EventBuilder):
                 # Log when you read message in a chat (from your "inbox")
                 print('You have read messages until', event.max_id)
     """
+    _update_types = (
+        types.UpdateReadHistoryInbox,
+        types.UpdateReadHistoryOutbox,
+        types.UpdateReadChannelInbox,
+        types.UpdateReadChannelOutbox,
+        types.UpdateReadMessagesContents,
+        types.UpdateChannelReadMessagesContents
+    )
     def __init__(
             self, chats=None, *, blacklist_chats=False, func=None, inbox=False):
         super().__init__(chats, blacklist_chats=blacklist_chats, func=func)
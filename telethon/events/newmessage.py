@@ -56,6 +56,12 @@ class NewMessage(EventBuilder):
                 await asyncio.sleep(5)
                 await client.delete_messages(event.chat_id, [event.id, m.id])
     """
+    _update_types = (
+        types.UpdateNewMessage,
+        types.UpdateNewChannelMessage,
+        types.UpdateShortMessage,
+        types.UpdateShortChatMessage
+    )
     def __init__(self, chats=None, *, blacklist_chats=False, func=None,
                  incoming=None, outgoing=None,
                  from_users=None, forwards=None, pattern=None):
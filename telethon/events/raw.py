@@ -38,6 +38,8 @@ class Raw(EventBuilder):
 
             self.types = tuple(types)
 
+        self._update_types = self.types
+
     async def resolve(self, client):
         self.resolved = True
 
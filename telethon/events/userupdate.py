@@ -48,6 +48,12 @@ class UserUpdate(EventBuilder):
                 if event.uploading:
                     await client.send_message(event.user_id, 'What are you sending?')
     """
+    _update_types = (
+        types.UpdateUserStatus,
+        types.UpdateChannelUserTyping,
+        types.UpdateChatUserTyping,
+        types.UpdateUserTyping
+    )
     @classmethod
     def build(cls, update, others=None, self_id=None):
         if isinstance(update, types.UpdateUserStatus):
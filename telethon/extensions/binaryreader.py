@@ -1,11 +1,10 @@
 """
 This module contains the BinaryReader utility class.
 """
-import os
+import struct
 import time
 from datetime import datetime, timezone, timedelta
 from io import BytesIO
-from struct import unpack
 
 from ..errors import TypeNotFoundError
 from ..tl.alltlobjects import tlobjects
@@ -14,39 +13,105 @@ from ..tl.core import core_objects
 _EPOCH_NAIVE = datetime(*time.gmtime(0)[:6])
 _EPOCH = _EPOCH_NAIVE.replace(tzinfo=timezone.utc)
 
+# "All numbers are written as little endian."
+# https://core.telegram.org/mtproto
+_INT = struct.Struct('<i')
+_UINT = struct.Struct('<I')
+_LONG = struct.Struct('<q')
+_ULONG = struct.Struct('<Q')
+_FLOAT = struct.Struct('<f')
+_DOUBLE = struct.Struct('<d')
+
 
 class BinaryReader:
     """
     Small utility class to read binary data.
+
+    The data (`bytes`, `bytearray` or `memoryview`) is never copied as a
+    whole. Numbers are unpacked from it in place at the current position,
+    and only the byte strings that are read are copied out of it.
     """
 
     def __init__(self, data):
-        self.stream = BytesIO(data)
-        self._last = None  # Should come in handy to spot -404 errors
+        self._data = data
+        self._pos = 0
+
+    def _error(self, length):
+        got = self._data[self._pos:self._pos + length]
+        return BufferError(
+            'No more data left to read (need {}, got {}: {}); at position {}'
+            .format(length, len(got), repr(bytes(got)), self._pos)
+        )
 
     # region Reading
 
-    # "All numbers are written as little endian."
-    # https://core.telegram.org/mtproto
     def read_byte(self):
         """Reads a single byte value."""
-        return self.read(1)[0]
+        try:
+            value = self._data[self._pos]
+        except IndexError:
+            raise self._error(1) from None
+        self._pos += 1
+        return value
 
     def read_int(self, signed=True):
         """Reads an integer (4 bytes) value."""
-        return int.from_bytes(self.read(4), byteorder='little', signed=signed)
+        try:
+            value = (_INT if signed else _UINT).unpack_from(self._data, self._pos)[0]
+        except struct.error:
+            raise self._error(4) from None
+        self._pos += 4
+        return value
 
     def read_long(self, signed=True):
         """Reads a long integer (8 bytes) value."""
-        return int.from_bytes(self.read(8), byteorder='little', signed=signed)
+        try:
+            value = (_LONG if signed else _ULONG).unpack_from(self._data, self._pos)[0]
+        except struct.error:
+            raise self._error(8) from None
+        self._pos += 8
+        return value
 
     def read_float(self):
         """Reads a real floating point (4 bytes) value."""
-        return unpack('<f', self.read(4))[0]
+        try:
+            value = _FLOAT.unpack_from(self._data, self._pos)[0]
+        except struct.error:
+            raise self._error(4) from None
+        self._pos += 4
+        return value
 
     def read_double(self):
         """Reads a real floating point (8 bytes) value."""
-        return unpack('<d', self.read(8))[0]
+        try:
+            value = _DOUBLE.unpack_from(self._data, self._pos)[0]
+        except struct.error:
+            raise self._error(8) from None
+        self._pos += 8
+        return value
+
+    def read_struct(self, fmt):
+        """Reads the values of the given precompiled `struct.Struct`."""
+        try:
+            values = fmt.unpack_from(self._data, self._pos)
+        except struct.error:
+            raise self._error(fmt.size) from None
+        self._pos += fmt.size
+        return values
+
+    def read_array(self, fmt, count):
+        """
+        Reads a list of ``count`` numbers of the given `struct` format
+        character (such as ``'q'`` for longs) at once.
+        """
+        size = struct.calcsize(fmt) * count
+        try:
+            values = struct.unpack_from(
+                '<{}{}'.format(count, fmt), self._data, self._pos)
+        except struct.error:
+            raise self._error(size) from None
+        self._pos += size
+        return list(values)
 
     def read_large_int(self, bits, signed=True):
         """Reads a n-bits long integer value."""
@@ -55,19 +120,27 @@ class BinaryReader:
 
     def read(self, length=-1):
         """Read the given amount of bytes, or -1 to read all remaining."""
-        result = self.stream.read(length)
-        if (length >= 0) and (len(result) != length):
-            raise BufferError(
-                'No more data left to read (need {}, got {}: {}); last read {}'
-                .format(length, len(result), repr(result), repr(self._last))
-            )
+        start = self._pos
+        end = len(self._data) if length < 0 else start + length
+        if end > len(self._data):
+            raise self._error(length)
 
-        self._last = result
-        return result
+        self._pos = end
+        result = self._data[start:end]
+        return result if type(result) is bytes else bytes(result)
 
     def get_bytes(self):
         """Gets the byte array representing the current buffer as a whole."""
-        return self.stream.getvalue()
+        return bytes(self._data)
+
+    @property
+    def stream(self):
+        """
+        A new `io.BytesIO` with a copy of the data left to read, kept for
+        compatibility since the reader no longer reads from a stream.
+        Reading from it doesn't advance the reader.
+        """
+        return BytesIO(self._data[self._pos:])
 
     # endregion
 
@@ -78,21 +151,27 @@ class BinaryReader:
         Reads a Telegram-encoded byte array, without the need of
         specifying its length.
         """
-        first_byte = self.read_byte()
-        if first_byte == 254:
-            length = self.read_byte() | (self.read_byte() << 8) | (
-                self.read_byte() << 16)
-            padding = length % 4
-        else:
-            length = first_byte
-            padding = (length + 1) % 4
-
-        data = self.read(length)
-        if padding > 0:
-            padding = 4 - padding
-            self.read(padding)
-
-        return data
+        data = self._data
+        pos = self._pos
+        try:
+            length = data[pos]
+            if length == 254:
+                length = _UINT.unpack_from(data, pos)[0] >> 8
+                start = pos + 4
+            else:
+                start = pos + 1
+        except (IndexError, struct.error):
+            raise self._error(1) from None
+
+        # The length, data and padding take a multiple of 4 bytes
+        end = start + length
+        new_pos = pos + ((end - pos + 3) & ~3)
+        if new_pos > len(data):
+            raise self._error(new_pos - pos)
+
+        self._pos = new_pos
+        result = data[start:end]
+        return result if type(result) is bytes else bytes(result)
 
     def tgread_string(self):
         """Reads a Telegram-encoded string."""
@@ -152,25 +231,26 @@ class BinaryReader:
     # endregion
 
     def close(self):
-        """Closes the reader, freeing the BytesIO stream."""
-        self.stream.close()
+        """Closes the reader, releasing the data."""
+        self._data = b''
+        self._pos = 0
 
     # region Position related
 
     def tell_position(self):
         """Tells the current position on the stream."""
-        return self.stream.tell()
+        return self._pos
 
     def set_position(self, position):
         """Sets the current position on the stream."""
-        self.stream.seek(position)
+        self._pos = position
 
     def seek(self, offset):
         """
         Seeks the stream position given an offset from the current position.
         The offset may be negative.
         """
-        self.stream.seek(offset, os.SEEK_CUR)
+        self._pos += offset
 
     # endregion
 
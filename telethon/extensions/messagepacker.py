@@ -1,11 +1,25 @@
 import asyncio
 import collections
-import io
 import struct
 
 from ..tl import TLRequest
 from ..tl.core.messagecontainer import MessageContainer
 from ..tl.core.tlmessage import TLMessage
+from ..network.requeststate import PRIORITY_BULK
+
+# Outer message header (msg_id, seq_no, length) followed by the
+# container constructor and the amount of messages it contains.
+_CONTAINER_HEADER = struct.Struct('<qiiIi')
+
+# Besides the payload, every message has a 16-byte header and may need
+# 12 more bytes to be wrapped in ``invokeAfterMsg``, while the maximum
+# size checks only account for `TLMessage.SIZE_OVERHEAD` of them.
+_BUFFER_SIZE = (_CONTAINER_HEADER.size + MessageContainer.MAXIMUM_SIZE
+                + (MessageContainer.MAXIMUM_LENGTH + 1) * 16)
+
+# How many batches in a row may leave bulk requests out
+# before they are given precedence over interactive ones.
+_BULK_WEIGHT = 4
 
 
 class MessagePacker:
@@ -20,92 +34,224 @@ class MessagePacker:
     This addresses several needs: outgoing messages will be smaller, so the
     encryption and network overhead also is smaller. It's also a central
     point where outgoing requests are put, and where ready-messages are get.
+
+    If ``batch_delay`` is given, batches are given up to that many seconds
+    to grow (until ``batch_size`` bytes are queued) before being packed.
+    This only happens while the queue is busy, that is, when there were
+    requests waiting by the time the next batch was requested (service
+    messages such as acknowledgements don't count, since the sender
+    queues them before every batch). A request arriving to an idle queue
+    is always packed right away.
+
+    If ``metrics`` are given, the size of every batch is recorded in them,
+    and ``trace_callback`` is called with ``('packed', state)`` whenever a
+    state is assigned its message ID.
     """
 
-    def __init__(self, state, loggers):
+    def __init__(self, state, loggers, *, batch_delay=None, batch_size=None,
+                 metrics=None, trace_callback=None):
         self._state = state
-        self._deque = collections.deque()
+        self._metrics = metrics
+        self._trace_callback = trace_callback
+        # One queue per priority class, see `_schedule`
+        self._queues = (collections.deque(), collections.deque())
+        self._bulk_skipped = 0
         self._ready = asyncio.Event()
         self._log = loggers[__name__]
+        self._buffer = _SendBuffer(_BUFFER_SIZE)
+        self._batch_delay = batch_delay
+        self._batch_size = min(
+            batch_size or MessageContainer.MAXIMUM_SIZE,
+            MessageContainer.MAXIMUM_SIZE
+        )
+        self._queued_size = 0
+
+        # Statistics about the batches that have been packed
+        self.batch_count = 0
+        self.batch_bytes = 0
+        self.message_count = 0
+
+    def __len__(self):
+        return sum(map(len, self._queues))
+
+    @property
+    def fill_ratio(self):
+        """
+        Average ratio (between 0 and 1) of the maximum container
+        size used by the batches that have been packed so far.
+        """
+        if not self.batch_count:
+            return 0.0
+        return self.batch_bytes / (
+            self.batch_count * MessageContainer.MAXIMUM_SIZE)
 
     def append(self, state):
-        self._deque.append(state)
+        self._queues[state.priority].append(state)
+        self._queued_size += len(state.data)
         self._ready.set()
 
     def extend(self, states):
-        self._deque.extend(states)
+        for state in states:
+            self._queues[state.priority].append(state)
+            self._queued_size += len(state.data)
         self._ready.set()
 
+    async def _wait_batch(self):
+        """
+        Waits until enough data is queued to fill
+        a batch, or until the batch delay expires.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self._batch_delay
+        while (self._queued_size < self._batch_size
+               and len(self) <= MessageContainer.MAXIMUM_LENGTH):
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                break
+
+    def _has_requests(self):
+        """
+        Whether any content-related message (a request) is queued.
+        """
+        return any(isinstance(state.request, TLRequest)
+                   for queue in self._queues for state in queue)
+
+    def _schedule(self):
+        """
+        Returns the queues in the order they should fill the next batch.
+
+        Interactive requests go first, and bulk requests take whatever
+        room is left. If bulk requests were left out of too many batches
+        in a row, they go first once so they can never be starved.
+        """
+        interactive, bulk = self._queues
+        if bulk and self._bulk_skipped >= _BULK_WEIGHT:
+            return bulk, interactive
+        return interactive, bulk
+
     async def get(self):
         """
         Returns (batch, data) if one or more items could be retrieved.
 
+        The returned data is a view into a buffer that is reused by the
+        next call, so it must be consumed before getting the next batch.
+
         If the cancellation occurs or only invalid items were in the
         queue, (None, None) will be returned instead.
         """
-        if not self._deque:
+        if not len(self):
             self._ready.clear()
             await self._ready.wait()
+        elif self._batch_delay and self._has_requests():
+            await self._wait_batch()
 
-        buffer = io.BytesIO()
+        buffer = self._buffer
+        buffer.pos = _CONTAINER_HEADER.size
         batch = []
         size = 0
+        bulk_packed = False
 
         # Fill a new batch to return while the size is small enough,
         # as long as we don't exceed the maximum length of messages.
-        while self._deque and len(batch) <= MessageContainer.MAXIMUM_LENGTH:
-            state = self._deque.popleft()
-            size += len(state.data) + TLMessage.SIZE_OVERHEAD
-
-            if size <= MessageContainer.MAXIMUM_SIZE:
-                state.msg_id = self._state.write_data_as_message(
-                    buffer, state.data, isinstance(state.request, TLRequest),
-                    after_id=state.after.msg_id if state.after else None
-                )
-                batch.append(state)
-                self._log.debug('Assigned msg_id = %d to %s (%x)',
-                                state.msg_id, state.request.__class__.__name__,
-                                id(state.request))
-                continue
+        for queue in self._schedule():
+            while queue and len(batch) <= MessageContainer.MAXIMUM_LENGTH:
+                state = queue.popleft()
+                self._queued_size -= len(state.data)
+                size += len(state.data) + TLMessage.SIZE_OVERHEAD
 
-            if batch:
-                # Put the item back since it can't be sent in this batch
-                self._deque.appendleft(state)
-                break
+                if size <= MessageContainer.MAXIMUM_SIZE:
+                    state.msg_id = self._state.write_data_as_message(
+                        buffer, state.data, isinstance(state.request, TLRequest),
+                        after_id=state.after.msg_id if state.after else None,
+                        compress=state.compress
+                    )
+                    batch.append(state)
+                    bulk_packed |= state.priority == PRIORITY_BULK
+                    self._log.debug('Assigned msg_id = %d to %s (%x)',
+                                    state.msg_id, state.request.__class__.__name__,
+                                    id(state.request))
+                    if self._trace_callback is not None:
+                        self._trace_callback('packed', state)
+                    continue
 
-            # If a single message exceeds the maximum size, then the
-            # message payload cannot be sent. Telegram would forcibly
-            # close the connection; message would never be confirmed.
-            #
-            # We don't put the item back because it can never be sent.
-            # If we did, we would loop again and reach this same path.
-            # Setting the exception twice results in `InvalidStateError`
-            # and this method should never return with error, which we
-            # really want to avoid.
-            self._log.warning(
-                'Message payload for %s is too long (%d) and cannot be sent',
-                state.request.__class__.__name__, len(state.data)
-            )
-            state.future.set_exception(
-                ValueError('Request payload is too big'))
+                if batch:
+                    # Put the item back since it can't be sent in this batch
+                    queue.appendleft(state)
+                    self._queued_size += len(state.data)
+                    break
+
+                # If a single message exceeds the maximum size, then the
+                # message payload cannot be sent. Telegram would forcibly
+                # close the connection; message would never be confirmed.
+                #
+                # We don't put the item back because it can never be sent.
+                # If we did, we would loop again and reach this same path.
+                # Setting the exception twice results in `InvalidStateError`
+                # and this method should never return with error, which we
+                # really want to avoid.
+                self._log.warning(
+                    'Message payload for %s is too long (%d) and cannot be sent',
+                    state.request.__class__.__name__, len(state.data)
+                )
+                state.future.set_exception(
+                    ValueError('Request payload is too big'))
+
+                size = 0
+                continue
 
-            size = 0
-            continue
+        if bulk_packed or not self._queues[PRIORITY_BULK]:
+            self._bulk_skipped = 0
+        else:
+            self._bulk_skipped += 1
 
         if not batch:
             return None, None
 
+        start = _CONTAINER_HEADER.size
         if len(batch) > 1:
-            # Inlined code to pack several messages into a container
-            data = struct.pack(
-                '<Ii', MessageContainer.CONSTRUCTOR_ID, len(batch)
-            ) + buffer.getvalue()
-            buffer = io.BytesIO()
-            container_id = self._state.write_data_as_message(
-                buffer, data, content_related=False
+            # Inlined code to pack several messages into a container.
+            # Room for its header was left at the start of the buffer,
+            # so the messages don't need to be copied to prepend it.
+            start = 0
+            container_id = self._state.write_container_header(
+                buffer.data, start, len(batch),
+                buffer.pos - _CONTAINER_HEADER.size
             )
             for s in batch:
                 s.container_id = container_id
 
-        data = buffer.getvalue()
-        return batch, data
+        size = buffer.pos - _CONTAINER_HEADER.size
+        self.batch_count += 1
+        self.batch_bytes += size
+        self.message_count += len(batch)
+        if self._metrics is not None:
+            self._metrics.observe('container_messages', len(batch))
+            self._metrics.observe(
+                'container_fill_ratio', size / MessageContainer.MAXIMUM_SIZE)
+        return batch, buffer.view[start:buffer.pos]
+
+
+class _SendBuffer:
+    """
+    Preallocated buffer where the outgoing messages are written.
+
+    It is large enough to hold the biggest possible container,
+    so it never needs to grow and can be reused for every batch.
+    """
+    __slots__ = ('data', 'view', 'pos')
+
+    def __init__(self, size):
+        self.data = bytearray(size)
+        self.view = memoryview(self.data)
+        self.pos = 0
+
+    def write(self, data):
+        end = self.pos + len(data)
+        self.data[self.pos:end] = data
+        self.pos = end
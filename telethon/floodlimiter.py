@@ -0,0 +1,169 @@
+import collections
+import time
+
+from . import utils
+from .network.requeststate import _unwrap
+
+
+# How many of the last send times are kept to estimate the rate of requests
+_HISTORY = 32
+
+# After a flood wait, the rate is set to this fraction of the observed one,
+# and it then grows back (by `_RECOVERY` with every success) to the ceiling
+_DECREASE = 0.5
+_CEILING = 0.9
+_RECOVERY = 1.01
+
+
+class _Bucket:
+    """
+    Paces the requests of a single method (or chat), using the "generic
+    cell rate algorithm" variant of a token bucket: requests are spaced
+    ``1 / rate`` seconds apart, but up to ``burst`` of them can go at once.
+    """
+    __slots__ = ('rate', 'ceiling', 'burst', 'tat', 'blocked_until', 'history',
+                 'last_success')
+
+    def __init__(self):
+        self.rate = None  # no limit known yet
+        self.ceiling = None
+        self.burst = 1
+        self.tat = 0.0  # theoretical arrival time of the next request
+        self.blocked_until = 0.0
+        self.history = collections.deque(maxlen=_HISTORY)
+        self.last_success = None
+
+    def reserve(self, now):
+        self.history.append(now)
+        start = max(now, self.blocked_until)
+        if self.rate is None:
+            return start - now
+
+        interval = 1 / self.rate
+        tat = max(self.tat, start)
+        start = max(start, tat - (self.burst - 1) * interval)
+        self.tat = tat + interval
+        return start - now
+
+    def release(self):
+        # Undoes the last `reserve`, as if it had never been made
+        if self.history:
+            self.history.pop()
+        if self.rate is not None:
+            self.tat -= 1 / self.rate
+
+    def observed_rate(self):
+        if len(self.history) < 2 or self.history[-1] <= self.history[0]:
+            return None
+        return (len(self.history) - 1) / (self.history[-1] - self.history[0])
+
+
+class FloodLimiter:
+    """
+    Learns how fast each method can be used from the flood waits that
+    Telegram returns, and paces the requests accordingly, so that they
+    are sent at a steady rate instead of in bursts followed by long waits.
+
+    A flood wait halves the rate at which the method was being used, and
+    every success raises it again slowly up to 90% of the rate that caused
+    it. Slow mode waits are learnt per chat instead, as one message every
+    so many seconds.
+
+    Args:
+        burst (`int`, optional):
+            How many requests may be sent at once, if there was time
+            enough since the last ones, before pacing them.
+    """
+    def __init__(self, *, burst=5):
+        self._burst = burst
+        self._buckets = {}
+
+    def _buckets_for(self, request, create):
+        request = _unwrap(request)
+        keys = [request.CONSTRUCTOR_ID]
+        peer = getattr(request, 'peer', None)
+        if peer is not None:
+            try:
+                keys.append(('slow_mode', utils.get_peer_id(peer)))
+            except TypeError:
+                pass
+
+        buckets = []
+        for key in keys:
+            bucket = self._buckets.get(key)
+            if bucket is None and create and not isinstance(key, tuple):
+                bucket = self._buckets[key] = _Bucket()
+            if bucket is not None:
+                buckets.append(bucket)
+
+        return buckets
+
+    def reserve(self, request):
+        """
+        Reserves a slot to send the request, returning for how many
+        seconds the caller should wait before sending it.
+        """
+        now = time.monotonic()
+        return max(b.reserve(now) for b in self._buckets_for(request, True))
+
+    def release(self, request):
+        """
+        Gives back the slot reserved for the request, if it won't be sent
+        after all (the wait was too long, or it was cancelled). Slots must
+        be released in the reverse order they were reserved.
+        """
+        for bucket in self._buckets_for(request, False):
+            bucket.release()
+
+    def succeeded(self, request):
+        """
+        Lets the limiter know that the request didn't cause a flood wait.
+        """
+        now = time.monotonic()
+        for bucket in self._buckets_for(request, False):
+            bucket.last_success = now
+            if bucket.rate is not None:
+                bucket.rate = min(bucket.rate * _RECOVERY, bucket.ceiling)
+
+    def flood_wait(self, request, seconds):
+        """
+        Lets the limiter know that the request caused a flood wait.
+        """
+        request = _unwrap(request)
+        bucket = self._buckets.setdefault(request.CONSTRUCTOR_ID, _Bucket())
+        observed = bucket.observed_rate() or 1 / max(seconds, 1)
+        if bucket.rate is not None:
+            observed = min(observed, bucket.rate)
+
+        bucket.rate = observed * _DECREASE
+        bucket.ceiling = observed * _CEILING
+        bucket.burst = self._burst
+        bucket.blocked_until = time.monotonic() + seconds
+        bucket.tat = bucket.blocked_until
+
+    def slow_mode_wait(self, request, seconds):
+        """
+        Lets the limiter know that the request's chat is in slow mode.
+        """
+        peer = getattr(_unwrap(request), 'peer', None)
+        if peer is None:
+            return
+
+        try:
+            key = ('slow_mode', utils.get_peer_id(peer))
+        except TypeError:
+            return
+
+        # The wait is what's left of the period since the last message
+        # that went through, so the period is only known once there is one.
+        bucket = self._buckets.setdefault(key, _Bucket())
+        now = time.monotonic()
+        period = seconds
+        if bucket.last_success is not None:
+            period = max(period, now + seconds - bucket.last_success)
+        if bucket.rate is not None:
+            period = max(period, 1 / bucket.rate)
+
+        bucket.rate = bucket.ceiling = 1 / max(period, 1)
+        bucket.blocked_until = now + seconds
+        bucket.tat = bucket.blocked_until
@@ -7,6 +7,7 @@ import struct
 import inspect
 import logging
 import functools
+import importlib
 from pathlib import Path
 from hashlib import sha1
 
@@ -213,6 +214,17 @@ def _sync_exit(self, *args):
     return loop.run_until_complete(self.__aexit__(*args))
 
 
+def _constructor_id(path):
+    """
+    Returns the constructor ID of the request at the given path inside
+    ``telethon.tl.functions`` (such as ``'help.GetConfigRequest'``). The
+    request is only imported now, so that tables of requests can be kept
+    by name without importing them along with the library.
+    """
+    module, name = ('.tl.functions.' + path).rsplit('.', 1)
+    return getattr(importlib.import_module(module, __package__), name).CONSTRUCTOR_ID
+
+
 def _entity_type(entity):
     # This could be a `utils` method that just ran a few `isinstance` on
     # `utils.get_peer(...)`'s result. However, there are *a lot* of auto
@@ -307,6 +319,60 @@ class TotalList(list):
             ', '.join(repr(x) for x in self), self.total)
 
 
+class _LazyDict(dict):
+    """
+    A dictionary which only imports its values the first time they're
+    used, from the ``{key: 'module.name'}`` paths it was given (which
+    may be relative to ``package``).
+
+    Iterating over it (or getting its length) imports all the values.
+    """
+    def __init__(self, package, paths):
+        super().__init__()
+        self._package = package
+        self._paths = paths
+
+    def __missing__(self, key):
+        module, name = self._paths[key].rsplit('.', 1)
+        value = getattr(importlib.import_module(module, self._package), name)
+        self[key] = value
+        return value
+
+    def __contains__(self, key):
+        return key in self._paths or super().__contains__(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def _load(self):
+        for key in self._paths:
+            if not super().__contains__(key):
+                self.__missing__(key)
+
+    def __iter__(self):
+        self._load()
+        return super().__iter__()
+
+    def __len__(self):
+        self._load()
+        return super().__len__()
+
+    def keys(self):
+        self._load()
+        return super().keys()
+
+    def values(self):
+        self._load()
+        return super().values()
+
+    def items(self):
+        self._load()
+        return super().items()
+
+
 class _FileStream(io.IOBase):
     """
     Proxy around things that represent a file and need to be used as streams
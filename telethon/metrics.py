@@ -0,0 +1,233 @@
+"""
+Counters, gauges and histograms about what the protocol layer is doing,
+which can be exported in the Prometheus text format.
+
+Every client created with ``metrics=True`` (or given its own `Metrics`)
+records into its own instance, and all of them are registered in the
+default `REGISTRY`, so they can be exported together:
+
+.. code-block:: python
+
+    from telethon import metrics
+
+    client = TelegramClient(..., metrics=metrics.Metrics({'client': 'bot'}))
+    ...
+    print(metrics.export_prometheus())
+
+When a client has no metrics (the default), nothing is recorded at all.
+"""
+import bisect
+import math
+import weakref
+
+
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+_COUNT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 1024)
+_RATIO_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 1)
+
+# ``{name: (type, label name, buckets, help)}`` of the known metrics
+METRICS = {
+    'requests_total': (
+        'counter', 'request', None, 'Requests answered by Telegram'),
+    'request_errors_total': (
+        'counter', 'request', None, 'Requests answered with an RPC error'),
+    'request_latency_seconds': (
+        'histogram', 'request', _LATENCY_BUCKETS,
+        'Time from sending a request until its answer arrives'),
+    'request_retries_total': (
+        'counter', 'request', None, 'Requests made again after an error'),
+    'flood_waits_total': (
+        'counter', 'request', None, 'Flood waits received'),
+    'flood_wait_seconds_total': (
+        'counter', 'request', None, 'Seconds of flood wait received'),
+    'container_messages': (
+        'histogram', None, _COUNT_BUCKETS, 'Messages sent in each batch'),
+    'container_fill_ratio': (
+        'histogram', None, _RATIO_BUCKETS,
+        'How full each batch is compared to the maximum container size'),
+    'bytes_sent_total': (
+        'counter', None, None, 'Bytes sent to Telegram, before framing'),
+    'bytes_received_total': (
+        'counter', None, None, 'Bytes received from Telegram, after framing'),
+    'bad_server_salts_total': (
+        'counter', None, None, 'Messages sent again due to a bad salt'),
+    'bad_msg_notifications_total': (
+        'counter', 'code', None, 'Bad message notifications received'),
+    'connections_total': (
+        'counter', None, None, 'Successful connections made'),
+    'connection_errors_total': (
+        'counter', None, None, 'Failed connection attempts'),
+    'reconnects_total': (
+        'counter', None, None, 'Automatic reconnections started'),
+    'send_queue_depth': (
+        'gauge', 'sender', None, 'Messages waiting to be sent'),
+    'pending_requests': (
+        'gauge', 'sender', None, 'Requests sent and waiting for their answer'),
+    'waiting_requests': (
+        'gauge', 'sender', None, 'Requests waiting for the in-flight limit'),
+}
+
+_PREFIX = 'telethon_'
+
+
+class Histogram:
+    """
+    Counts observations in buckets by their upper bound (not cumulative),
+    plus the sum and amount of all of them.
+    """
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """
+    The metrics of a single client.
+
+    Args:
+        labels (`dict`, optional):
+            Labels added to every exported metric of this instance, so
+            that several clients can be told apart (e.g. their name).
+
+        registry (`Registry`, optional):
+            The registry where this instance is added. Defaults to the
+            global `REGISTRY`, and may be `False` to not register it.
+    """
+    def __init__(self, labels=None, *, registry=None):
+        self.labels = dict(labels or {})
+        # ``{(name, label value): value}`` for counters and gauges
+        self._values = {}
+        # ``{(name, label value): Histogram}``
+        self._histograms = {}
+
+        if registry is None:
+            registry = REGISTRY
+        if registry is not False:
+            registry.register(self)
+
+    def inc(self, name, label=None, value=1):
+        """
+        Increments the counter by the given value.
+        """
+        key = (name, label)
+        self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, name, value, label=None):
+        """
+        Sets the gauge to the given value.
+        """
+        self._values[name, label] = value
+
+    def observe(self, name, value, label=None):
+        """
+        Adds an observation to the histogram.
+        """
+        histogram = self._histograms.get((name, label))
+        if histogram is None:
+            histogram = self._histograms[name, label] = \
+                Histogram(METRICS[name][2])
+
+        histogram.observe(value)
+
+    def get(self, name, label=None):
+        """
+        Returns the value of the counter or gauge, or the `Histogram`.
+        """
+        if METRICS[name][0] == 'histogram':
+            return self._histograms.get((name, label))
+        return self._values.get((name, label), 0)
+
+
+class Registry:
+    """
+    Weakly references all the `Metrics` to be exported together.
+    """
+    def __init__(self):
+        self._metrics = weakref.WeakSet()
+
+    def register(self, metrics):
+        self._metrics.add(metrics)
+
+    def unregister(self, metrics):
+        self._metrics.discard(metrics)
+
+    def __iter__(self):
+        return iter(list(self._metrics))
+
+
+REGISTRY = Registry()
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _fmt_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(
+        '{}="{}"'.format(k, _escape(v)) for k, v in labels.items()) + '}'
+
+
+def _fmt_value(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def export_prometheus(source=None):
+    """
+    Returns the metrics of the given `Metrics` or `Registry` (by default,
+    the global `REGISTRY`) in the Prometheus text exposition format.
+    """
+    if source is None:
+        source = REGISTRY
+    all_metrics = [source] if isinstance(source, Metrics) else list(source)
+
+    lines = []
+    for name, (kind, label_name, _, text) in METRICS.items():
+        full_name = _PREFIX + name
+        samples = []
+        for metrics in all_metrics:
+            store = metrics._histograms if kind == 'histogram' else metrics._values
+            for (n, label), value in store.items():
+                if n != name:
+                    continue
+
+                labels = dict(metrics.labels)
+                if label_name is not None:
+                    labels[label_name] = label
+
+                if kind != 'histogram':
+                    samples.append('{}{} {}'.format(
+                        full_name, _fmt_labels(labels), _fmt_value(value)))
+                    continue
+
+                cumulative = 0
+                for bound, count in zip(value.buckets + (math.inf,), value.counts):
+                    cumulative += count
+                    samples.append('{}_bucket{} {}'.format(
+                        full_name,
+                        _fmt_labels(dict(labels, le=_fmt_value(bound))),
+                        cumulative
+                    ))
+                samples.append('{}_sum{} {}'.format(
+                    full_name, _fmt_labels(labels), _fmt_value(value.sum)))
+                samples.append('{}_count{} {}'.format(
+                    full_name, _fmt_labels(labels), value.count))
+
+        if samples:
+            lines.append('# HELP {} {}'.format(full_name, text))
+            lines.append('# TYPE {} {}'.format(full_name, kind))
+            lines.extend(samples)
+
+    return '\n'.join(lines) + '\n' if lines else ''
@@ -1,7 +1,9 @@
 import abc
 import asyncio
+import math
 import socket
 import sys
+import time
 
 try:
     import ssl as ssl_mod
@@ -13,6 +15,7 @@ try:
 except ImportError:
     python_socks = None
 
+from .protocol import PacketProtocol
 from ...errors import InvalidChecksumError
 from ... import helpers
 
@@ -28,20 +31,44 @@ class Connection(abc.ABC):
     The only error that will raise from send and receive methods is
     ``ConnectionError``, which will raise when attempting to send if
     the client is disconnected (includes remote disconnections).
+
+    If ``buffered`` is `True` and the codec supports it, the data is read
+    through a `PacketProtocol` instead, which frames the packets as soon
+    as they arrive and hands them to `recv` without going through queues.
+
+    If ``addresses`` are given (other ``(ip, port)`` of the same data
+    center), connecting races them all with ``ip:port``, starting one
+    more attempt every ``happy_eyeballs_delay`` seconds (or as soon as
+    the previous one fails), and keeps the first to connect. They are
+    tried from the fastest to connect last time, as recorded in ``rtts``
+    (a ``{(ip, port): seconds}`` dict, which may be shared by several
+    connections, such as all those made by the same client).
     """
     # this static attribute should be redefined by `Connection` subclasses and
     # should be one of `PacketCodec` implementations
     packet_codec = None
 
-    def __init__(self, ip, port, dc_id, *, loggers, proxy=None, local_addr=None):
+    def __init__(self, ip, port, dc_id, *, loggers, proxy=None, local_addr=None,
+                 buffered=False, addresses=None, happy_eyeballs_delay=0.25,
+                 rtts=None):
         self._ip = ip
         self._port = port
+        self._addresses = None
+        self._set_addresses(addresses)
+        self._happy_eyeballs_delay = happy_eyeballs_delay
+
+        # ``{(ip, port): seconds}`` with the smoothed time it took to connect
+        # to each address (infinite if the last attempt failed), so that the
+        # fastest addresses are preferred later on
+        self._rtts = {} if rtts is None else rtts
         self._dc_id = dc_id  # only for MTProxy, it's an abstraction leak
         self._log = loggers[__name__]
         self._proxy = proxy
         self._local_addr = local_addr
+        self._buffered = buffered
         self._reader = None
         self._writer = None
+        self._protocol = None
         self._connected = False
         self._send_task = None
         self._recv_task = None
@@ -50,6 +77,9 @@ class Connection(abc.ABC):
         self._send_queue = asyncio.Queue(1)
         self._recv_queue = asyncio.Queue(1)
 
+        # Set by the sender using this connection, if it records metrics
+        self._metrics = None
+
     @staticmethod
     def _wrap_socket_ssl(sock):
         if ssl_mod is None:
@@ -198,6 +228,100 @@ class Connection(abc.ABC):
 
         return sock
 
+    def _set_addresses(self, addresses):
+        """
+        Sets the addresses to race with ``ip:port`` on the next connect.
+        """
+        if addresses:
+            self._addresses = [(self._ip, self._port)]
+            self._addresses.extend(a for a in addresses if a not in self._addresses)
+        else:
+            self._addresses = None
+
+    def _record_rtt(self, address, rtt):
+        old = self._rtts.get(address, math.inf)
+        if rtt is None:
+            self._rtts[address] = math.inf
+        elif old == math.inf:
+            self._rtts[address] = rtt
+        else:
+            # Smoothed like TCP's round-trip time estimate
+            self._rtts[address] = 0.875 * old + 0.125 * rtt
+
+    @staticmethod
+    def _rtt_key(rtts, address):
+        """
+        Sort key to try the addresses known to be fast first, then the
+        unknown ones, and the ones which failed last, according to the
+        ``rtts`` of a connection.
+        """
+        rtt = rtts.get(address)
+        if rtt is None:
+            return 1, 0
+        return (2, 0) if rtt == math.inf else (0, rtt)
+
+    async def _connect_socket(self, ip, port, local_addr):
+        loop = asyncio.get_event_loop()
+        sock = socket.socket(
+            socket.AF_INET6 if ':' in ip else socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setblocking(False)
+            if local_addr is not None:
+                sock.bind(local_addr)
+
+            start = time.monotonic()
+            await loop.sock_connect(sock, (ip, port))
+        except OSError:
+            sock.close()
+            self._record_rtt((ip, port), None)
+            raise
+        except BaseException:
+            sock.close()
+            raise
+
+        self._record_rtt((ip, port), time.monotonic() - start)
+        return sock, ip, port
+
+    async def _race(self, local_addr):
+        """
+        Connects a socket to the first of the `_addresses` to respond,
+        starting the attempts one after another, and returns it along
+        with its address. The rest of attempts are cancelled.
+        """
+        addresses = iter(sorted(
+            self._addresses, key=lambda a: self._rtt_key(self._rtts, a)))
+        pending = set()
+        error = None
+        try:
+            while True:
+                address = next(addresses, None)
+                if address is not None:
+                    pending.add(asyncio.ensure_future(
+                        self._connect_socket(*address, local_addr)))
+                elif not pending:
+                    raise error
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self._happy_eyeballs_delay if address else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                winner = None
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        self._log.info('Failed to connect: %s', error)
+                    elif winner is None:
+                        winner = task.result()
+                    else:
+                        task.result()[0].close()
+
+                if winner is not None:
+                    return winner
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def _connect(self, timeout=None, ssl=None):
         if self._local_addr is not None:
             # NOTE: If port is not specified, we use 0 port
@@ -212,7 +336,14 @@ class Connection(abc.ABC):
         else:
             local_addr = None
 
-        if not self._proxy:
+        if self._addresses and not self._proxy:
+            sock, self._ip, self._port = await asyncio.wait_for(
+                self._race(local_addr), timeout=timeout)
+            self._log.debug('Connected to %s:%s first', self._ip, self._port)
+            await self._sock_connect(sock, ssl)
+        elif self._use_protocol():
+            await self._protocol_connect(timeout, ssl, local_addr)
+        elif not self._proxy:
             self._reader, self._writer = await asyncio.wait_for(
                 asyncio.open_connection(
                     host=self._ip,
@@ -234,15 +365,80 @@ class Connection(abc.ABC):
             self._reader, self._writer = await asyncio.open_connection(sock=sock)
 
         self._codec = self.packet_codec(self)
+        if self._protocol:
+            self._protocol.codec = self._codec
+
         self._init_conn()
         await self._writer.drain()
 
+    async def _sock_connect(self, sock, ssl):
+        server_hostname = self._ip if ssl else None
+        try:
+            if self._use_protocol():
+                self._protocol = PacketProtocol(self._log)
+                await asyncio.get_event_loop().create_connection(
+                    lambda: self._protocol, sock=sock, ssl=ssl,
+                    server_hostname=server_hostname)
+                self._reader = None
+                self._writer = self._protocol
+            else:
+                self._reader, self._writer = await asyncio.open_connection(
+                    sock=sock, ssl=ssl, server_hostname=server_hostname)
+        except BaseException:
+            sock.close()
+            raise
+
+    def _use_protocol(self):
+        return (
+            self._buffered
+            and sys.version_info >= (3, 7)
+            and self.packet_codec is not None
+            and self.packet_codec.decode_packet is not PacketCodec.decode_packet
+        )
+
+    async def _protocol_connect(self, timeout, ssl, local_addr):
+        loop = asyncio.get_event_loop()
+        self._protocol = PacketProtocol(self._log)
+        if not self._proxy:
+            await asyncio.wait_for(
+                loop.create_connection(
+                    lambda: self._protocol,
+                    host=self._ip,
+                    port=self._port,
+                    ssl=ssl,
+                    local_addr=local_addr
+                ), timeout=timeout)
+        else:
+            sock = await self._proxy_connect(
+                timeout=timeout,
+                local_addr=local_addr
+            )
+            if ssl:
+                sock = self._wrap_socket_ssl(sock)
+
+            await loop.create_connection(lambda: self._protocol, sock=sock)
+
+        # The protocol takes the place of the stream writer, and there
+        # is no reader because the protocol frames the packets itself.
+        self._reader = None
+        self._writer = self._protocol
+
     async def connect(self, timeout=None, ssl=None):
         """
         Establishes a connection with the server.
         """
-        await self._connect(timeout=timeout, ssl=ssl)
+        try:
+            await self._connect(timeout=timeout, ssl=ssl)
+        except BaseException:
+            if self._metrics is not None:
+                self._metrics.inc('connection_errors_total')
+            raise
+
         self._connected = True
+        if self._metrics is not None:
+            self._metrics.inc('connections_total')
+        if self._protocol:
+            return
 
         loop = asyncio.get_event_loop()
         self._send_task = loop.create_task(self._send_loop())
@@ -282,6 +478,13 @@ class Connection(abc.ABC):
         if not self._connected:
             raise ConnectionError('Not connected')
 
+        if self._metrics is not None:
+            self._metrics.inc('bytes_sent_total', value=len(data))
+
+        if self._protocol:
+            self._send(data)
+            return self._protocol.drain()
+
         return self._send_queue.put(data)
 
     async def recv(self):
@@ -290,9 +493,22 @@ class Connection(abc.ABC):
 
         This method returns a coroutine.
         """
+        if self._protocol:
+            try:
+                result = await self._protocol.read_packet()
+            except ConnectionError:
+                self._connected = False
+                raise
+
+            if self._metrics is not None:
+                self._metrics.inc('bytes_received_total', value=len(result))
+            return result
+
         while self._connected:
             result = await self._recv_queue.get()
-            if result:  # None = sentinel value = keep trying
+            if result is not None:  # None = sentinel value = keep trying
+                if self._metrics is not None:
+                    self._metrics.inc('bytes_received_total', value=len(result))
                 return result
 
         raise ConnectionError('Not connected')
@@ -348,6 +564,14 @@ class Connection(abc.ABC):
             except asyncio.CancelledError:
                 break
 
+    def needs_long_poll(self):
+        """
+        Whether the sender should send a long poll (:tl:`HttpWait`) so
+        that the server has a request to respond to. Only connection modes
+        where the server can't send data on its own need it.
+        """
+        return False
+
     def _init_conn(self):
         """
         This method will be called after `connect` is called.
@@ -385,6 +609,8 @@ class ObfuscatedConnection(Connection):
     def _init_conn(self):
         self._obfuscation = self.obfuscated_io(self)
         self._writer.write(self._obfuscation.header)
+        if self._protocol:
+            self._protocol.decrypt = self._obfuscation._decrypt.encrypt
 
     def _send(self, data):
         self._obfuscation.write(self._codec.encode_packet(data))
@@ -425,3 +651,13 @@ class PacketCodec(abc.ABC):
         `readexactly(n)` method.
         """
         raise NotImplementedError
+
+    def decode_packet(self, data):
+        """
+        Decodes the first packet from the received `data` (a memoryview)
+        and returns ``(packet, length)``, where ``length`` is how many
+        bytes it took, or ``(None, 0)`` if the packet is not complete yet.
+
+        Codecs which don't implement it can't be used with `PacketProtocol`.
+        """
+        raise NotImplementedError
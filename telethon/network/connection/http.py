@@ -1,4 +1,5 @@
 import asyncio
+import struct
 
 from .connection import Connection, PacketCodec
 
@@ -10,30 +11,79 @@ class HttpPacketCodec(PacketCodec):
     tag = None
     obfuscate_tag = None
 
+    def __init__(self, connection):
+        super().__init__(connection)
+        # Only the length changes between requests, so the rest is built once
+        self._header = ('POST /api HTTP/1.1\r\n'
+                        'Host: {}:{}\r\n'
+                        'Content-Type: application/x-www-form-urlencoded\r\n'
+                        'Connection: keep-alive\r\n'
+                        'Keep-Alive: timeout=100000, max=10000000\r\n'
+                        'Content-Length: '
+                        .format(connection._ip, connection._port)
+                        .encode('ascii'))
+
     def encode_packet(self, data):
-        return ('POST /api HTTP/1.1\r\n'
-                'Host: {}:{}\r\n'
-                'Content-Type: application/x-www-form-urlencoded\r\n'
-                'Connection: keep-alive\r\n'
-                'Keep-Alive: timeout=100000, max=10000000\r\n'
-                'Content-Length: {}\r\n\r\n'
-                .format(self._conn._ip, self._conn._port, len(data))
-                .encode('ascii') + data)
+        return b''.join((
+            self._header, str(len(data)).encode('ascii'), b'\r\n\r\n', data))
 
     async def read_packet(self, reader):
+        # Responses come in the same order as the requests were sent, so
+        # many requests can be pipelined over the same connection.
+        status = None
+        length = 0
         while True:
             line = await reader.readline()
-            if not line or line[-1] != b'\n':
+            if not line or line[-1] != 10:  # b'\n'
                 raise asyncio.IncompleteReadError(line, None)
 
-            if line.lower().startswith(b'content-length: '):
-                await reader.readexactly(2)
-                length = int(line[16:-2])
-                return await reader.readexactly(length)
+            if status is None:
+                # "HTTP/1.1 200 OK"
+                status = int(line.split(None, 2)[1])
+            elif line == b'\r\n':
+                break
+            elif line[:15].lower() == b'content-length:':
+                length = int(line[15:])
+
+        data = await reader.readexactly(length) if length else b''
+        self._conn._response_received()
+        if status != 200:
+            # Same as the error codes of other modes (e.g. -404 for a
+            # broken authorization key), which the sender knows about.
+            return struct.pack('<i', -status)
+
+        return data
 
 
 class ConnectionHttp(Connection):
+    """
+    Sends each packet in its own ``POST`` request, pipelined over a
+    single keep-alive connection. Telegram can only send data in the
+    response to a request, so the sender keeps up to `long_polls` of
+    them waiting (with :tl:`HttpWait`) for up to `long_poll_timeout`
+    seconds, for the results and updates to always have a way back.
+
+    Empty responses (of a long poll that timed out) are received as
+    empty packets.
+    """
     packet_codec = HttpPacketCodec
+    long_polls = 2
+    long_poll_timeout = 25
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._waiting_requests = 0
 
     async def connect(self, timeout=None, ssl=None):
+        self._waiting_requests = 0
         await super().connect(timeout=timeout, ssl=self._port == SSL_PORT)
+
+    def send(self, data):
+        self._waiting_requests += 1
+        return super().send(data)
+
+    def _response_received(self):
+        self._waiting_requests -= 1
+
+    def needs_long_poll(self):
+        return self._connected and self._waiting_requests < self.long_polls
@@ -0,0 +1,197 @@
+import asyncio
+import collections
+
+from ...errors import InvalidChecksumError
+
+
+# Available since Python 3.7, `Connection` won't use it on older versions
+_BufferedProtocol = getattr(asyncio, 'BufferedProtocol', asyncio.Protocol)
+
+# Initial size of the receive buffer. It only grows if a single packet
+# does not fit in it, which for Telegram is rare (files come in parts).
+_BUFFER_SIZE = 256 * 1024
+
+# Free space below which the unframed bytes are moved back to the start
+_MIN_FREE = 16 * 1024
+
+# Complete packets not read yet above which the transport stops reading,
+# and below which it starts again, so a slow reader doesn't make them pile.
+_HIGH_WATER = 32
+_LOW_WATER = _HIGH_WATER // 4
+
+
+class PacketProtocol(_BufferedProtocol):
+    """
+    An ``asyncio.BufferedProtocol`` that lets the event loop read straight
+    into a buffer from which the packets are framed by the connection's
+    `PacketCodec`, as soon as the data arrives, with no coroutine involved.
+
+    Complete packets are kept until `read_packet` is called (reading from
+    the transport is paused while too many are kept), and writing
+    mimics ``asyncio.StreamWriter`` so that the rest of the `Connection`
+    (including obfuscation) can use the protocol as its writer.
+    """
+    def __init__(self, log):
+        self._log = log
+        self._buffer = bytearray(_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # first byte not framed yet
+        self._end = 0  # one past the last byte received
+        self._packets = collections.deque()
+        self._transport = None
+        self._waiter = None
+        self._drain_waiter = None
+        self._paused = False
+        self._reading_paused = False
+        self._closed = asyncio.get_event_loop().create_future()
+        self._error = None
+
+        # Set by the connection once known. Incoming bytes are decrypted
+        # with `decrypt` (if any) before they're framed with `codec`.
+        self.codec = None
+        self.decrypt = None
+
+    # Protocol callbacks
+
+    def connection_made(self, transport):
+        self._transport = transport
+
+    def get_buffer(self, sizehint):
+        if len(self._buffer) - self._end < _MIN_FREE:
+            pending = self._end - self._start
+            if pending + _MIN_FREE > len(self._buffer):
+                # The loop may still hold a view of the old buffer, so
+                # it can't be resized in-place (only replaced).
+                buffer = bytearray(2 * len(self._buffer))
+                buffer[:pending] = self._view[self._start:self._end]
+                self._buffer = buffer
+                self._view = memoryview(buffer)
+            else:
+                self._buffer[:pending] = self._view[self._start:self._end].tobytes()
+
+            self._start = 0
+            self._end = pending
+
+        return self._view[self._end:]
+
+    def buffer_updated(self, nbytes):
+        start = self._end
+        self._end += nbytes
+        if self.decrypt:
+            self._buffer[start:self._end] = \
+                self.decrypt(self._view[start:self._end].tobytes())
+
+        if self.codec is None:
+            return
+
+        try:
+            while self._start < self._end:
+                packet, length = self.codec.decode_packet(
+                    self._view[self._start:self._end])
+                if not length:
+                    break
+
+                self._start += length
+                self._packets.append(packet)
+        except InvalidChecksumError as e:
+            self._log.info('The server response had an invalid checksum')
+            self._error = e
+            self._transport.close()
+        except Exception as e:
+            self._log.exception('Unexpected exception framing a packet')
+            self._error = e
+            self._transport.close()
+
+        if self._start == self._end:
+            self._start = self._end = 0
+
+        if self._packets:
+            self._wake_up()
+
+        if len(self._packets) >= _HIGH_WATER and not self._reading_paused \
+                and not self._transport.is_closing():
+            self._reading_paused = True
+            self._transport.pause_reading()
+
+    def eof_received(self):
+        self._log.info('The server closed the connection')
+        # Returning a falsy value lets the transport close itself
+
+    def connection_lost(self, exc):
+        if self._error is None:
+            self._error = exc or ConnectionError('Not connected')
+
+        self._transport = None
+        self._wake_up()
+        if self._drain_waiter and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+    def pause_writing(self):
+        self._paused = True
+
+    def resume_writing(self):
+        self._paused = False
+        if self._drain_waiter and not self._drain_waiter.done():
+            self._drain_waiter.set_result(None)
+
+    # Reading
+
+    async def read_packet(self):
+        """
+        Returns the next complete packet, waiting for it if needed.
+
+        Pending packets are still returned after the connection is lost,
+        and ``ConnectionError`` is raised only once there are none left.
+        """
+        while not self._packets:
+            if self._transport is None:
+                raise ConnectionError('Not connected') from self._error
+
+            self._waiter = asyncio.get_event_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+
+        packet = self._packets.popleft()
+        if self._reading_paused and len(self._packets) <= _LOW_WATER \
+                and self._transport is not None:
+            self._reading_paused = False
+            self._transport.resume_reading()
+
+        return packet
+
+    def _wake_up(self):
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    # Writing (same interface as ``asyncio.StreamWriter``)
+
+    def write(self, data):
+        if self._transport is None or self._transport.is_closing():
+            raise ConnectionError('Not connected')
+
+        self._transport.write(data)
+
+    async def drain(self):
+        if self._transport is None:
+            raise ConnectionError('Not connected')
+
+        if self._paused:
+            self._drain_waiter = asyncio.get_event_loop().create_future()
+            try:
+                await self._drain_waiter
+            finally:
+                self._drain_waiter = None
+
+            if self._transport is None:
+                raise ConnectionError('Not connected')
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+
+    async def wait_closed(self):
+        await asyncio.shield(self._closed)
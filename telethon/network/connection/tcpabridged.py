@@ -23,6 +23,25 @@ class AbridgedPacketCodec(PacketCodec):
 
         return await reader.readexactly(length << 2)
 
+    def decode_packet(self, data):
+        if not data:
+            return None, 0
+
+        length = data[0]
+        if length < 127:
+            header = 1
+        elif len(data) < 4:
+            return None, 0
+        else:
+            header = 4
+            length = int.from_bytes(data[1:4], 'little')
+
+        length = header + (length << 2)
+        if len(data) < length:
+            return None, 0
+
+        return bytes(data[header:length]), length
+
 
 class ConnectionTcpAbridged(Connection):
     """
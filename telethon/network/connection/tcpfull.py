@@ -34,6 +34,21 @@ class FullPacketCodec(PacketCodec):
 
         return body
 
+    def decode_packet(self, data):
+        if len(data) < 8:
+            return None, 0
+
+        packet_len, seq = struct.unpack_from('<ii', data)
+        if len(data) < packet_len:
+            return None, 0
+
+        checksum = struct.unpack_from('<I', data, packet_len - 4)[0]
+        valid_checksum = crc32(data[:packet_len - 4])
+        if checksum != valid_checksum:
+            raise InvalidChecksumError(checksum, valid_checksum)
+
+        return bytes(data[8:packet_len - 4]), packet_len
+
 
 class ConnectionTcpFull(Connection):
     """
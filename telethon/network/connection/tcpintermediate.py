@@ -16,6 +16,16 @@ class IntermediatePacketCodec(PacketCodec):
         length = struct.unpack('<i', await reader.readexactly(4))[0]
         return await reader.readexactly(length)
 
+    def decode_packet(self, data):
+        if len(data) < 4:
+            return None, 0
+
+        length = struct.unpack_from('<i', data)[0] + 4
+        if len(data) < length:
+            return None, 0
+
+        return bytes(data[4:length]), length
+
 
 class RandomizedIntermediatePacketCodec(IntermediatePacketCodec):
     """
@@ -37,6 +47,14 @@ class RandomizedIntermediatePacketCodec(IntermediatePacketCodec):
             return packet_with_padding[:-pad_size]
         return packet_with_padding
 
+    def decode_packet(self, data):
+        packet_with_padding, length = super().decode_packet(data)
+        if packet_with_padding:
+            pad_size = len(packet_with_padding) % 4
+            if pad_size > 0:
+                return packet_with_padding[:-pad_size], length
+        return packet_with_padding, length
+
 
 class ConnectionTcpIntermediate(Connection):
     """
@@ -95,8 +95,11 @@ class TcpMTProxy(ObfuscatedConnection):
     obfuscated_io = MTProxyIO
 
     # noinspection PyUnusedLocal
-    def __init__(self, ip, port, dc_id, *, loggers, proxy=None, local_addr=None):
-        # connect to proxy's host and port instead of telegram's ones
+    def __init__(self, ip, port, dc_id, *, loggers, proxy=None, local_addr=None,
+                 buffered=False):
+        # connect to proxy's host and port instead of telegram's ones.
+        # `buffered` is ignored because waiting for the proxy to close
+        # the connection (see `_connect`) needs the stream reader.
         proxy_host, proxy_port = self.address_info(proxy)
         self._secret = bytes.fromhex(proxy[2])
         super().__init__(
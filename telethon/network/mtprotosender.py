@@ -1,11 +1,12 @@
 import asyncio
 import collections
 import struct
+import time
 
 from . import authenticator
 from ..extensions.messagepacker import MessagePacker
 from .mtprotoplainsender import MTProtoPlainSender
-from .requeststate import RequestState
+from .requeststate import RequestState, request_name
 from .mtprotostate import MTProtoState
 from ..tl.tlobject import TLRequest
 from .. import helpers, utils
@@ -16,16 +17,28 @@ from ..errors import (
 from ..extensions import BinaryReader
 from ..tl.core import RpcResult, MessageContainer, GzipPacked
 from ..tl.functions.auth import LogOutRequest
-from ..tl.functions import PingRequest, DestroySessionRequest
+from ..tl.functions import (
+    PingRequest, DestroySessionRequest, GetFutureSaltsRequest
+)
 from ..tl.types import (
     MsgsAck, Pong, BadServerSalt, BadMsgNotification, FutureSalts,
     MsgNewDetailedInfo, NewSessionCreated, MsgDetailedInfo, MsgsStateReq,
     MsgsStateInfo, MsgsAllInfo, MsgResendReq, upload, DestroySessionOk, DestroySessionNone,
+    HttpWait
 )
 from ..crypto import AuthKey
 from ..helpers import retry_range
 
 
+# How many salts to request at once (the maximum), and how long before the
+# last one expires to request more. Each salt is valid for about an hour.
+_FUTURE_SALTS_COUNT = 64
+_FUTURE_SALTS_MARGIN = 60 * 60
+
+# Minimum seconds between requests for salts, in case they keep failing
+_FUTURE_SALTS_RETRY_DELAY = 60
+
+
 class MTProtoSender:
     """
     MTProto Mobile Protocol sender
@@ -39,12 +52,19 @@ class MTProtoSender:
     be sent successfully.
 
     A new authorization key will be generated on connection if no other
-    key exists yet.
+    key exists yet, unless ``manage_auth_key`` is `False`. Then the key
+    is never generated nor reset (not even if the server says it's
+    broken), and the sender fails to connect or disconnects instead.
     """
     def __init__(self, auth_key, *, loggers,
                  retries=5, delay=1, auto_reconnect=True, connect_timeout=None,
                  auth_key_callback=None,
-                 update_callback=None, auto_reconnect_callback=None):
+                 update_callback=None, auto_reconnect_callback=None,
+                 batch_delay=None, batch_size=None, max_in_flight=None,
+                 lazy_updates=False, crypto_offload_threshold=None,
+                 gzip_level=GzipPacked.DEFAULT_LEVEL, metrics=None,
+                 trace_callback=None, manage_auth_key=True,
+                 metrics_label='main'):
         self._connection = None
         self._loggers = loggers
         self._log = loggers[__name__]
@@ -53,11 +73,21 @@ class MTProtoSender:
         self._auto_reconnect = auto_reconnect
         self._connect_timeout = connect_timeout
         self._auth_key_callback = auth_key_callback
+        self._manage_auth_key = manage_auth_key
         self._update_callback = update_callback
         self._auto_reconnect_callback = auto_reconnect_callback
         self._connect_lock = asyncio.Lock()
         self._ping = None
 
+        # Optional `telethon.metrics.Metrics` where the activity is recorded.
+        # Several senders may share it, so their gauges are labelled apart.
+        self._metrics = metrics
+        self._metrics_label = metrics_label
+
+        # Optional ``callback(stage, state, error=None)`` called as each
+        # request goes through the stages of its life, see `_trace`.
+        self._trace_callback = trace_callback
+
         # Whether the user has explicitly connected or disconnected.
         #
         # If a disconnection happens for any other reason and it
@@ -75,15 +105,42 @@ class MTProtoSender:
 
         # Preserving the references of the AuthKey and state is important
         self.auth_key = auth_key or AuthKey(None)
-        self._state = MTProtoState(self.auth_key, loggers=self._loggers)
+        self._state = MTProtoState(
+            self.auth_key, loggers=self._loggers, lazy_updates=lazy_updates,
+            gzip_level=gzip_level)
 
         # Outgoing messages are put in a queue and sent in a batch.
         # Note that here we're also storing their ``_RequestState``.
-        self._send_queue = MessagePacker(self._state, loggers=self._loggers)
+        self._send_queue = MessagePacker(
+            self._state, loggers=self._loggers,
+            batch_delay=batch_delay, batch_size=batch_size, metrics=metrics,
+            trace_callback=trace_callback and self._trace)
 
         # Sent states are remembered until a response is received.
         self._pending_state = {}
 
+        # Amount of requests sent through `send` whose future is not done
+        # yet. Past ``max_in_flight``, new requests wait for room (before
+        # they are serialized) in a FIFO of ``(count, waiter, since)``.
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._waiting = collections.deque()
+        self._waiting_count = 0
+
+        # Payloads of at least this many bytes are encrypted and decrypted
+        # in the loop's default executor instead of blocking the loop.
+        self._crypto_offload_threshold = crypto_offload_threshold
+
+        # When the last request for future salts was made (monotonic time)
+        self._future_salts_requested = None
+
+        # Whether a long poll is in the send queue (for the HTTP mode)
+        self._long_poll_queued = False
+
+        # Statistics about the requests that had to wait for capacity
+        self.wait_count = 0
+        self.wait_time = 0.0
+
         # Responses must be acknowledged, and we can also batch these.
         self._pending_ack = set()
 
@@ -124,6 +181,7 @@ class MTProtoSender:
                 return False
 
             self._connection = connection
+            self._connection._metrics = self._metrics
             await self._connect()
             self._user_connected = True
             return True
@@ -131,6 +189,16 @@ class MTProtoSender:
     def is_connected(self):
         return self._user_connected
 
+    @property
+    def queue_depth(self):
+        """
+        Amount of requests which have been sent through `send` but not
+        answered yet, including those still waiting for room under the
+        ``max_in_flight`` limit.
+        """
+        return (self._waiting_count + len(self._send_queue)
+                + len(self._pending_state))
+
     def _transport_connected(self):
         return (
             not self._reconnecting
@@ -145,7 +213,7 @@ class MTProtoSender:
         """
         await self._disconnect()
 
-    def send(self, request, ordered=False):
+    def send(self, request, ordered=False, priority=None):
         """
         This method enqueues the given request to be sent. Its send
         state will be saved until a response arrives, and a ``Future``
@@ -167,37 +235,254 @@ class MTProtoSender:
 
         Since the receiving part is "built in" the future, it's
         impossible to await receive a result that was never sent.
+
+        If there are ``max_in_flight`` requests without a response already,
+        the request won't be serialized nor enqueued until there's room for
+        it, so the returned future will also take longer to complete.
+
+        The priority class (see `RequestState`) is inferred from the type
+        of the request unless given. All the requests in a list share the
+        same class, taken from the first one if not given, so that they
+        stay in the same queue and their order is kept.
         """
         if not self._user_connected:
             raise ConnectionError('Cannot send requests while disconnected')
 
+        if self._max_in_flight is None:
+            return self._enqueue(request, ordered, priority)
+
+        loop = asyncio.get_event_loop()
+        count = len(request) if utils.is_list_like(request) else 1
+        futures = [loop.create_future() for _ in range(count)]
+        task = loop.create_task(
+            self._enqueue_when_room(request, ordered, priority, futures))
+
+        def cancel_waiting(future):
+            if future.cancelled() and not task.done():
+                task.cancel()
+
+        for future in futures:
+            future.add_done_callback(cancel_waiting)
+
+        return futures if utils.is_list_like(request) else futures[0]
+
+    def _enqueue(self, request, ordered, priority, futures=None):
+        """
+        Serializes the request (or list of requests) into states and puts
+        them in the send queue, returning their future (or futures).
+        """
         if not utils.is_list_like(request):
             try:
-                state = RequestState(request)
+                state = RequestState(request, priority=priority,
+                                     future=futures and futures[0])
             except struct.error as e:
                 # "struct.error: required argument is not an integer" is not
                 # very helpful; log the request to find out what wasn't int.
                 self._log.error('Request caused struct.error: %s: %s', e, request)
                 raise
 
+            if self._trace_callback is not None:
+                state.traced = True
+                self._trace('created', state)
+
             self._send_queue.append(state)
             return state.future
         else:
             states = []
-            futures = []
             state = None
-            for req in request:
+            for i, req in enumerate(request):
                 try:
-                    state = RequestState(req, after=ordered and state)
+                    state = RequestState(req, after=ordered and state,
+                                         priority=priority,
+                                         future=futures and futures[i])
+                    priority = state.priority
                 except struct.error as e:
                     self._log.error('Request caused struct.error: %s: %s', e, request)
                     raise
 
                 states.append(state)
-                futures.append(state.future)
+                if self._trace_callback is not None:
+                    state.traced = True
+                    self._trace('created', state)
 
             self._send_queue.extend(states)
-            return futures
+            return [state.future for state in states]
+
+    def _trace(self, stage, state, error=None):
+        """
+        Calls the trace callback for the state at the given stage, which
+        is one of (in order) ``'created'``, ``'packed'`` (the message ID
+        was assigned), ``'encrypted'``, ``'written'`` (to the connection),
+        ``'acked'`` (by the server), ``'result'`` (received) and, if the
+        result was an RPC error, ``'error'`` along with the error.
+
+        Only the states of requests made through `send` are traced, not
+        those created internally (such as acknowledgements or salts).
+
+        The callback should be quick since it runs in the middle of the
+        send and receive loops, and it's not allowed to break them.
+        """
+        if not state.traced:
+            return
+
+        try:
+            if error is None:
+                self._trace_callback(stage, state)
+            else:
+                self._trace_callback(stage, state, error)
+        except Exception:
+            self._log.exception('Unhandled exception in the trace callback')
+
+    def _trace_batch(self, stage, batch):
+        for state in batch:
+            for s in (state if isinstance(state, list) else (state,)):
+                self._trace(stage, s)
+
+    def _record_sent(self, batch):
+        """
+        Records the time the states in the batch were sent at, to later
+        measure their latency, and the current depth of the queues.
+        """
+        now = time.monotonic()
+        for state in batch:
+            for s in (state if isinstance(state, list) else (state,)):
+                s.sent_at = now
+
+        self._metrics.set('send_queue_depth', len(self._send_queue),
+                          self._metrics_label)
+        self._metrics.set('pending_requests', len(self._pending_state),
+                          self._metrics_label)
+        self._metrics.set('waiting_requests', self._waiting_count,
+                          self._metrics_label)
+
+    def _record_result(self, state, error=False):
+        """
+        Records that the request of the state was answered.
+        """
+        name = request_name(state.request)
+        self._metrics.inc('requests_total', name)
+        if error:
+            self._metrics.inc('request_errors_total', name)
+        if state.sent_at is not None:
+            self._metrics.observe(
+                'request_latency_seconds', time.monotonic() - state.sent_at, name)
+
+    def _update_salt(self):
+        """
+        Switches salts as the schedule says, and requests more future
+        salts before the ones known run out. This way salts don't expire
+        while they're in use, which would cost a `BadServerSalt` and
+        having to re-send the messages.
+        """
+        if self._state.update_salt() > _FUTURE_SALTS_MARGIN:
+            return
+
+        now = time.monotonic()
+        if (self._future_salts_requested is None
+                or now - self._future_salts_requested > _FUTURE_SALTS_RETRY_DELAY):
+            self._log.debug('Requesting future salts')
+            self._future_salts_requested = now
+            self._send_queue.append(
+                RequestState(GetFutureSaltsRequest(_FUTURE_SALTS_COUNT)))
+
+    def _long_poll(self):
+        """
+        Keeps enough long polls waiting on the server for the connection
+        modes that need them (HTTP), so it can always send back results
+        and updates. They're queued one at a time because a single request
+        (to which the server can only respond once) carries all the queue.
+        """
+        if not self._long_poll_queued and self._connection.needs_long_poll():
+            self._long_poll_queued = True
+            self._send_queue.append(RequestState(HttpWait(
+                max_delay=0,
+                wait_after=0,
+                max_wait=int(self._connection.long_poll_timeout * 1000)
+            )))
+
+    def _offload_crypto(self, data):
+        return (self._crypto_offload_threshold is not None
+                and len(data) >= self._crypto_offload_threshold)
+
+    async def _enqueue_when_room(self, request, ordered, priority, futures):
+        """
+        Waits until there's room for the requests under the limit of
+        requests in flight, and only then enqueues them with the futures
+        that `send` already handed out.
+
+        The requests of a list are never split, and if there are more
+        than the limit they're let through once nothing else is in flight.
+        """
+        count = len(futures)
+        try:
+            await self._reserve(count)
+        except (asyncio.CancelledError, Exception) as e:
+            for future in futures:
+                if future.done():
+                    pass
+                elif isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            return
+
+        for future in futures:
+            future.add_done_callback(self._release_in_flight)
+        try:
+            if not self._user_connected:
+                raise ConnectionError('Cannot send requests while disconnected')
+
+            self._enqueue(request, ordered, priority, futures)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+
+    async def _reserve(self, count):
+        """
+        Takes room for ``count`` requests in flight, waiting (in order of
+        arrival) until there is as much room if there isn't yet.
+        """
+        if not self._waiting and not self._is_full(count):
+            self._in_flight += count
+            return
+
+        waiter = asyncio.get_event_loop().create_future()
+        entry = (count, waiter, time.monotonic())
+        self._waiting.append(entry)
+        self._waiting_count += count
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The room was taken but won't be used, give it back
+                self._in_flight -= count
+            elif entry in self._waiting:
+                self._waiting.remove(entry)
+                self._waiting_count -= count
+            self._wake_waiting()
+            raise
+
+    def _is_full(self, count):
+        # Going past the limit is fine if nothing else is in flight
+        return self._in_flight and self._in_flight + count > self._max_in_flight
+
+    def _release_in_flight(self, _future):
+        self._in_flight -= 1
+        self._wake_waiting()
+
+    def _wake_waiting(self):
+        while self._waiting:
+            count, waiter, since = self._waiting[0]
+            if self._is_full(count):
+                break
+
+            self._waiting.popleft()
+            self._waiting_count -= count
+            self._in_flight += count
+            self.wait_count += count
+            self.wait_time += (time.monotonic() - since) * count
+            waiter.set_result(None)
 
     @property
     def disconnected(self):
@@ -219,6 +504,8 @@ class MTProtoSender:
         receive loops.
         """
         self._log.info('Connecting to %s...', self._connection)
+        if not self.auth_key and not self._manage_auth_key:
+            raise ConnectionError('There is no authorization key to connect with')
 
         connected = False
 
@@ -256,6 +543,7 @@ class MTProtoSender:
             await self._disconnect(error=e)
             raise e
 
+        self._long_poll_queued = False
         loop = asyncio.get_event_loop()
         self._log.debug('Starting send loop')
         self._send_loop_handle = loop.create_task(self._send_loop())
@@ -323,6 +611,16 @@ class MTProtoSender:
                     state.future.cancel()
 
             self._pending_state.clear()
+
+            # Requests waiting for room were never enqueued and never will
+            waiting, self._waiting = self._waiting, collections.deque()
+            self._waiting_count = 0
+            for _, waiter, _ in waiting:
+                if error:
+                    waiter.set_exception(error)
+                else:
+                    waiter.cancel()
+
             await helpers._cancel(
                 self._log,
                 send_loop_handle=self._send_loop_handle,
@@ -343,6 +641,8 @@ class MTProtoSender:
         Cleanly disconnects and then reconnects.
         """
         self._log.info('Closing current connection to begin reconnect...')
+        if self._metrics is not None:
+            self._metrics.inc('reconnects_total')
         await self._connection.disconnect()
 
         await helpers._cancel(
@@ -377,11 +677,8 @@ class MTProtoSender:
             except BufferError as e:
                 # TODO there should probably only be one place to except all these errors
                 if isinstance(e, InvalidBufferError) and e.code == 404:
-                    self._log.info('Broken authorization key; resetting')
-                    self.auth_key.key = None
-                    if self._auth_key_callback:
-                        await self._auth_key_callback(None)
-
+                    await self._reset_auth_key()
+                    last_error = e
                     ok = False
                     break
                 else:
@@ -410,6 +707,21 @@ class MTProtoSender:
             error = last_error.with_traceback(None) if last_error else None
             await self._disconnect(error=error)
 
+    async def _reset_auth_key(self):
+        """
+        Forgets the authorization key after the server said it's broken,
+        so that a new one is generated the next time. The caller must then
+        disconnect (the key is kept as-is if it's not managed here).
+        """
+        if not self._manage_auth_key:
+            self._log.info('Broken authorization key; disconnecting')
+            return
+
+        self._log.info('Broken authorization key; resetting')
+        self.auth_key.key = None
+        if self._auth_key_callback:
+            await self._auth_key_callback(None)
+
     def _start_reconnect(self, error):
         """Starts a reconnection in the background."""
         if self._user_connected and not self._reconnecting:
@@ -453,6 +765,8 @@ class MTProtoSender:
                 self._last_acks.append(ack)
                 self._pending_ack.clear()
 
+            self._long_poll()
+
             self._log.debug('Waiting for messages to send...')
             # TODO Wait for the connection send queue to be empty?
             # This means that while it's not empty we can wait for
@@ -462,11 +776,6 @@ class MTProtoSender:
             if not data:
                 continue
 
-            self._log.debug('Encrypting %d message(s) in %d bytes for sending',
-                            len(batch), len(data))
-
-            data = self._state.encrypt_message_data(data)
-
             # Whether sending succeeds or not, the popped requests are now
             # pending because they're removed from the queue. If a reconnect
             # occurs, they will be removed from pending state and re-enqueued
@@ -481,6 +790,25 @@ class MTProtoSender:
                         if isinstance(s.request, TLRequest):
                             self._pending_state[s.msg_id] = s
 
+            if self._metrics is not None:
+                self._record_sent(batch)
+
+            self._update_salt()
+
+            self._log.debug('Encrypting %d message(s) in %d bytes for sending',
+                            len(batch), len(data))
+
+            # Nothing else is sent until this batch is, even if the
+            # encryption is offloaded, so the order is never altered.
+            if self._offload_crypto(data):
+                data = await asyncio.get_event_loop().run_in_executor(
+                    None, self._state.encrypt_message_data, data)
+            else:
+                data = self._state.encrypt_message_data(data)
+
+            if self._trace_callback is not None:
+                self._trace_batch('encrypted', batch)
+
             try:
                 await self._connection.send(data)
             except IOError as e:
@@ -488,6 +816,12 @@ class MTProtoSender:
                 self._start_reconnect(e)
                 return
 
+            # Whatever was sent, it's a request the server may respond to
+            self._long_poll_queued = False
+
+            if self._trace_callback is not None:
+                self._trace_batch('written', batch)
+
             self._log.debug('Encrypted messages put in a queue to be sent')
 
     async def _recv_loop(self):
@@ -506,8 +840,17 @@ class MTProtoSender:
                 self._start_reconnect(e)
                 return
 
+            self._long_poll()
+            if not body:
+                continue  # a long poll which timed out
+
             try:
-                message = self._state.decrypt_message_data(body)
+                if self._offload_crypto(body):
+                    body = await asyncio.get_event_loop().run_in_executor(
+                        None, self._state.decrypt_message_body, body)
+                    message = self._state.unpack_message(body)
+                else:
+                    message = self._state.decrypt_message_data(body)
             except TypeNotFoundError as e:
                 # Received object which we don't know how to deserialize
                 self._log.info('Type %08x not found, remaining data %r',
@@ -521,11 +864,7 @@ class MTProtoSender:
                 continue
             except BufferError as e:
                 if isinstance(e, InvalidBufferError) and e.code == 404:
-                    self._log.info('Broken authorization key; resetting')
-                    self.auth_key.key = None
-                    if self._auth_key_callback:
-                        await self._auth_key_callback(None)
-
+                    await self._reset_auth_key()
                     await self._disconnect(error=e)
                 else:
                     self._log.warning('Invalid buffer %s', e)
@@ -604,8 +943,15 @@ class MTProtoSender:
                 self._log.info('Received response without parent request: %s', rpc_result.body)
             return
 
+        if self._metrics is not None:
+            self._record_result(state, error=rpc_result.error is not None)
+        if self._trace_callback is not None:
+            self._trace('result', state)
+
         if rpc_result.error:
             error = rpc_message_to_error(rpc_result.error, state.request)
+            if self._trace_callback is not None:
+                self._trace('error', state, error)
             self._send_queue.append(
                 RequestState(MsgsAck([state.msg_id])))
 
@@ -682,6 +1028,9 @@ class MTProtoSender:
         bad_salt = message.obj
         self._log.debug('Handling bad salt for message %d', bad_salt.bad_msg_id)
         self._state.salt = bad_salt.new_server_salt
+        self._state.clear_future_salts()
+        if self._metrics is not None:
+            self._metrics.inc('bad_server_salts_total')
         states = self._pop_states(bad_salt.bad_msg_id)
         self._send_queue.extend(states)
 
@@ -699,6 +1048,8 @@ class MTProtoSender:
         states = self._pop_states(bad_msg.bad_msg_id)
 
         self._log.debug('Handling bad msg %s', bad_msg)
+        if self._metrics is not None:
+            self._metrics.inc('bad_msg_notifications_total', bad_msg.error_code)
         if bad_msg.error_code in (16, 17):
             # Sent msg_id too low or too high (respectively).
             # Use the current msg_id to determine the right time offset.
@@ -757,6 +1108,7 @@ class MTProtoSender:
         # TODO https://goo.gl/LMyN7A
         self._log.debug('Handling new session created')
         self._state.salt = message.obj.server_salt
+        self._state.clear_future_salts()
 
     async def _handle_ack(self, message):
         """
@@ -777,6 +1129,9 @@ class MTProtoSender:
         self._log.debug('Handling acknowledge for %s', str(ack.msg_ids))
         for msg_id in ack.msg_ids:
             state = self._pending_state.get(msg_id)
+            if state and self._trace_callback is not None:
+                self._trace('acked', state)
+
             if state and isinstance(state.request, LogOutRequest):
                 del self._pending_state[msg_id]
                 if not state.future.cancelled():
@@ -790,10 +1145,9 @@ class MTProtoSender:
             future_salts#ae500895 req_msg_id:long now:int
             salts:vector<future_salt> = FutureSalts;
         """
-        # TODO save these salts and automatically adjust to the
-        # correct one whenever the salt in use expires.
-        self._log.debug('Handling future salts for message %d', message.msg_id)
-        state = self._pending_state.pop(message.msg_id, None)
+        self._log.debug('Handling future salts for message %d', message.obj.req_msg_id)
+        self._state.set_future_salts(message.obj)
+        state = self._pending_state.pop(message.obj.req_msg_id, None)
         if state:
             state.future.set_result(message.obj)
 
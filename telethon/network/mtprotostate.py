@@ -6,10 +6,16 @@ from hashlib import sha256
 from ..crypto import AES
 from ..errors import SecurityError, InvalidBufferError
 from ..extensions import BinaryReader
-from ..tl.core import TLMessage
+from ..tl.core import TLMessage, LazyUpdate
 from ..tl.tlobject import TLRequest
 from ..tl.functions import InvokeAfterMsgRequest
 from ..tl.core.gzippacked import GzipPacked
+from ..tl.core.messagecontainer import MessageContainer
+from ..tl.alltlobjects import tlobjects
+
+_MESSAGE_HEADER = struct.Struct('<qii')
+_CONTAINER_HEADER = struct.Struct('<qiiIi')
+_SALT_SESSION = struct.Struct('<qq')
 
 
 class _OpaqueRequest(TLRequest):
@@ -23,7 +29,6 @@ class _OpaqueRequest(TLRequest):
         return self.data
 
 
-
 class MTProtoState:
     """
     `telethon.network.mtprotosender.MTProtoSender` needs to hold a state
@@ -47,12 +52,19 @@ class MTProtoState:
     many methods that would be needed to make it convenient to use for the
     authentication process, at which point the `MTProtoPlainSender` is better.
     """
-    def __init__(self, auth_key, loggers):
+    def __init__(self, auth_key, loggers, lazy_updates=False,
+                 gzip_level=GzipPacked.DEFAULT_LEVEL):
         self.auth_key = auth_key
         self._log = loggers[__name__]
+        self.lazy_updates = lazy_updates
+        self.gzip_level = gzip_level
         self.time_offset = 0
         self.salt = 0
 
+        # Upcoming salts as ``(valid_since, valid_until, salt)`` tuples,
+        # sorted, with the times as server timestamps. See `update_salt`.
+        self._salts = []
+
         self.id = self._sequence = self._last_msg_id = None
         self.reset()
 
@@ -65,6 +77,45 @@ class MTProtoState:
         self._sequence = 0
         self._last_msg_id = 0
 
+        # Salts belong to the session, so the schedule is no longer valid
+        self._salts = []
+
+    def set_future_salts(self, future_salts):
+        """
+        Stores the salts from a :tl:`FutureSalts` as the schedule to follow.
+        """
+        self._salts = sorted(
+            (s.valid_since.timestamp(), s.valid_until.timestamp(), s.salt)
+            for s in future_salts.salts
+        )
+        self.update_salt()
+
+    def clear_future_salts(self):
+        """
+        Forgets the schedule of salts, for instance because it was wrong.
+        """
+        self._salts = []
+
+    def update_salt(self):
+        """
+        Switches to the newest salt from the schedule that is already valid.
+
+        Returns for how many more seconds the schedule has valid salts,
+        which will be negative or zero if there is no schedule to follow.
+        """
+        now = time.time() + self.time_offset
+        salts = self._salts
+        while len(salts) > 1 and salts[1][0] <= now:
+            del salts[0]
+
+        if not salts:
+            return 0
+
+        if salts[0][0] <= now:
+            self.salt = salts[0][2]
+
+        return salts[-1][1] - now
+
     def update_message_id(self, message):
         """
         Updates the message ID to a new one,
@@ -89,51 +140,93 @@ class MTProtoState:
         return aes_key, aes_iv
 
     def write_data_as_message(self, buffer, data, content_related,
-                              *, after_id=None):
+                              *, after_id=None, compress=True):
         """
         Writes a message containing the given data into buffer.
 
+        If ``compress`` is `False`, gzip is not even attempted.
+
         Returns the message id.
         """
         msg_id = self._get_new_msg_id()
         seq_no = self._get_seq_no(content_related)
         if after_id is None:
-            body = GzipPacked.gzip_if_smaller(content_related, data)
+            body = data
         else:
             # The `RequestState` stores `bytes(request)`, not the request itself.
             # `invokeAfterMsg` wants a `TLRequest` though, hence the wrapping.
-            body = GzipPacked.gzip_if_smaller(content_related,
-                bytes(InvokeAfterMsgRequest(after_id, _OpaqueRequest(data))))
+            body = bytes(InvokeAfterMsgRequest(after_id, _OpaqueRequest(data)))
 
-        buffer.write(struct.pack('<qii', msg_id, seq_no, len(body)))
+        if compress:
+            body = GzipPacked.gzip_if_smaller(
+                content_related, body, self.gzip_level)
+
+        buffer.write(_MESSAGE_HEADER.pack(msg_id, seq_no, len(body)))
         buffer.write(body)
         return msg_id
 
+    def write_container_header(self, buffer, offset, count, length):
+        """
+        Writes the header of a container with ``count`` messages into the
+        buffer at the given offset. The ``length`` bytes of the messages
+        must already be present in the buffer right after the header.
+
+        Returns the message id of the container.
+        """
+        msg_id = self._get_new_msg_id()
+        seq_no = self._get_seq_no(False)
+        _CONTAINER_HEADER.pack_into(
+            buffer, offset, msg_id, seq_no, length + 8,
+            MessageContainer.CONSTRUCTOR_ID, count
+        )
+        return msg_id
+
     def encrypt_message_data(self, data):
         """
         Encrypts the given message data using the current authorization key
         following MTProto 2.0 guidelines core.telegram.org/mtproto/description.
+
+        The data may be any bytes-like object. The plain text is copied
+        once, when it's joined with its header and padding. The backend
+        returns the cipher text as a new object, which is copied once
+        more to prepend the key id and message key.
+
+        It only reads from the state, so it's safe to call from another
+        thread as long as the state is not reset in the meantime.
         """
-        data = struct.pack('<qq', self.salt, self.id) + data
-        padding = os.urandom(-(len(data) + 12) % 16 + 12)
+        padding = -(len(data) + 16 + 12) % 16 + 12
+        data = b''.join((
+            _SALT_SESSION.pack(self.salt, self.id),
+            data,
+            os.urandom(padding)
+        ))
 
         # Being substr(what, offset, length); x = 0 for client
         # "msg_key_large = SHA256(substr(auth_key, 88+x, 32) + pt + padding)"
-        msg_key_large = sha256(
-            self.auth_key.key[88:88 + 32] + data + padding).digest()
+        msg_key_large = sha256(self.auth_key.key[88:88 + 32])
+        msg_key_large.update(data)
+        msg_key_large = msg_key_large.digest()
 
         # "msg_key = substr (msg_key_large, 8, 16)"
         msg_key = msg_key_large[8:24]
         aes_key, aes_iv = self._calc_key(self.auth_key.key, msg_key, True)
 
         key_id = struct.pack('<Q', self.auth_key.key_id)
-        return (key_id + msg_key +
-                AES.encrypt_ige(data + padding, aes_key, aes_iv))
+        return key_id + msg_key + AES.encrypt_ige(data, aes_key, aes_iv)
 
     def decrypt_message_data(self, body):
         """
         Inverse of `encrypt_message_data` for incoming server messages.
         """
+        return self.unpack_message(self.decrypt_message_body(body))
+
+    def decrypt_message_body(self, body):
+        """
+        First half of `decrypt_message_data`. Decrypts the body and checks
+        its message key, returning the plain text to `unpack_message`.
+
+        Unlike the second half, it's safe to call from another thread.
+        """
         if len(body) < 8:
             raise InvalidBufferError(body)
 
@@ -153,6 +246,13 @@ class MTProtoState:
             raise SecurityError(
                 "Received msg_key doesn't match with expected one")
 
+        return body
+
+    def unpack_message(self, body):
+        """
+        Second half of `decrypt_message_data`. Reads the `TLMessage` from
+        the plain text returned by `decrypt_message_body`.
+        """
         reader = BinaryReader(body)
         reader.read_long()  # remote_salt
         if reader.read_long() != self.id:
@@ -160,15 +260,39 @@ class MTProtoState:
 
         remote_msg_id = reader.read_long()
         remote_sequence = reader.read_int()
-        reader.read_int()  # msg_len for the inner object, padding ignored
+        msg_len = reader.read_int()  # for the inner object, padding ignored
 
         # We could read msg_len bytes and use those in a new reader to read
         # the next TLObject without including the padding, but since the
         # reader isn't used for anything else after this, it's unnecessary.
-        obj = reader.tgread_object()
+        if self.lazy_updates:
+            obj = self._read_lazily(reader, msg_len)
+        else:
+            obj = reader.tgread_object()
 
         return TLMessage(remote_msg_id, remote_sequence, obj)
 
+    def _read_lazily(self, reader, length):
+        """
+        Like ``reader.tgread_object()``, but leaves the update inside
+        :tl:`UpdateShort` as a `LazyUpdate`, even inside containers.
+        """
+        constructor = reader.read_int(signed=False)
+        if constructor == MessageContainer.CONSTRUCTOR_ID:
+            return MessageContainer.from_reader(reader, self._read_lazily)
+
+        if constructor == LazyUpdate.UPDATE_SHORT_ID and length >= 12:
+            data = reader.read(length - 8)
+            update_id = int.from_bytes(data[:4], 'little')
+            if update_id in tlobjects:
+                update = LazyUpdate(update_id, data)
+                return tlobjects[constructor](update, reader.tgread_date())
+
+            reader.seek(-len(data))  # let it fail with TypeNotFoundError
+
+        reader.seek(-4)
+        return reader.tgread_object()
+
     def _get_new_msg_id(self):
         """
         Generates a new unique message ID based on the current
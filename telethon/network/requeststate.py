@@ -1,5 +1,52 @@
 import asyncio
 
+from ..tl.functions import (
+    InvokeAfterMsgRequest, InvokeWithLayerRequest, InvokeWithoutUpdatesRequest
+)
+from ..tl.functions.upload import (
+    SaveFilePartRequest, SaveBigFilePartRequest, GetFileRequest,
+    GetCdnFileRequest, GetWebFileRequest
+)
+
+# Priority classes for outgoing requests. Interactive requests are packed
+# before bulk ones (file transfers), so that large parts don't delay them.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+
+_WRAPPER_REQUESTS = (
+    InvokeAfterMsgRequest, InvokeWithLayerRequest, InvokeWithoutUpdatesRequest
+)
+_BULK_REQUESTS = (
+    SaveFilePartRequest, SaveBigFilePartRequest, GetFileRequest,
+    GetCdnFileRequest, GetWebFileRequest
+)
+
+# Requests carrying file contents, which are most likely compressed already
+_FILE_PART_REQUESTS = (SaveFilePartRequest, SaveBigFilePartRequest)
+
+
+def _unwrap(request):
+    while isinstance(request, _WRAPPER_REQUESTS):
+        request = request.query
+
+    return request
+
+
+def request_name(request):
+    """
+    Name of the given request's type, without the wrappers, for metrics.
+    """
+    return _unwrap(request).__class__.__name__
+
+
+def infer_priority(request):
+    """
+    Infers the priority class of the given request from its type.
+    """
+    request = _unwrap(request)
+    return PRIORITY_BULK if isinstance(request, _BULK_REQUESTS) \
+        else PRIORITY_INTERACTIVE
+
 
 class RequestState:
     """
@@ -7,13 +54,22 @@ class RequestState:
     in particular the message ID assigned to the request, the container ID
     it belongs to, the request itself, the request as bytes, and the future
     result that will eventually be resolved.
+
+    If no priority class is given, it's inferred from the request type.
+    Whether the request is worth compressing is also decided by its type.
+    The future may be given if it was handed out before the state existed.
     """
-    __slots__ = ('container_id', 'msg_id', 'request', 'data', 'future', 'after')
+    __slots__ = ('container_id', 'msg_id', 'request', 'data', 'future', 'after',
+                 'priority', 'compress', 'sent_at', 'traced')
 
-    def __init__(self, request, after=None):
+    def __init__(self, request, after=None, priority=None, future=None):
         self.container_id = None
         self.msg_id = None
         self.request = request
         self.data = bytes(request)
-        self.future = asyncio.Future()
+        self.future = asyncio.Future() if future is None else future
         self.after = after
+        self.priority = infer_priority(request) if priority is None else priority
+        self.compress = not isinstance(_unwrap(request), _FILE_PART_REQUESTS)
+        self.sent_at = None  # only set to measure the latency in metrics
+        self.traced = False  # only set if it came from `MTProtoSender.send`
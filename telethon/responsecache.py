@@ -0,0 +1,111 @@
+import collections
+import struct
+import time
+
+from . import helpers
+
+
+# Default seconds for which the result of each request is reused (by
+# name, so that importing this doesn't import the requests)
+DEFAULT_TTLS = {
+    'help.GetConfigRequest': 60 * 60,
+    'help.GetNearestDcRequest': 60 * 60,
+    'messages.GetStickerSetRequest': 60 * 60,
+    'channels.GetFullChannelRequest': 60,
+    'messages.GetFullChatRequest': 60,
+    'users.GetFullUserRequest': 60,
+}
+
+
+class ResponseCache:
+    """
+    In-memory cache of the results of read-only requests, keyed by the
+    serialized request, so that making the same request again shortly
+    after doesn't need to reach Telegram at all.
+
+    Args:
+        ttls (`dict`, optional):
+            Maps request types (or their constructor IDs) to the amount
+            of seconds their results are valid for, on top of (or
+            overriding) `DEFAULT_TTLS`. Use ``0`` to not cache a type.
+
+        max_size (`int`, optional):
+            How many results to keep at most. The least recently used
+            ones are evicted first.
+
+    The counters of `hits` and `misses` only take cacheable requests into
+    account. Nothing is invalidated when other requests change the data,
+    so `invalidate` should be used if outdated results are a problem.
+    """
+    def __init__(self, ttls=None, *, max_size=1024):
+        self.ttls = {helpers._constructor_id(name): ttl
+                     for name, ttl in DEFAULT_TTLS.items()}
+        for request, ttl in (ttls or {}).items():
+            self.ttls[getattr(request, 'CONSTRUCTOR_ID', request)] = ttl
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        # ``{request bytes: (expiration, result)}``, least recent first
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def cacheable(self, request):
+        """
+        Whether the results of this request may be cached.
+        """
+        return bool(self.ttls.get(request.CONSTRUCTOR_ID))
+
+    def get(self, request):
+        """
+        Returns the cached result for the request, or `None` if there is
+        none or it has expired.
+        """
+        if not self.cacheable(request):
+            return None
+
+        key = bytes(request)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def add(self, request, result):
+        """
+        Caches the result of the request, if its type is cacheable.
+        """
+        ttl = self.ttls.get(request.CONSTRUCTOR_ID)
+        if not ttl:
+            return
+
+        key = bytes(request)
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, request=None):
+        """
+        Forgets the cached result of the given request, all the results
+        of the given request type (class), or everything if `None`.
+        """
+        if request is None:
+            self._entries.clear()
+        elif isinstance(request, type):
+            prefix = struct.pack('<I', request.CONSTRUCTOR_ID)
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+        else:
+            self._entries.pop(bytes(request), None)
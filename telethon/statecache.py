@@ -9,14 +9,13 @@ _has_channel_id = []
 
 # TODO EntityCache does the same. Reuse?
 def _fill():
-    for name in dir(types):
-        update = getattr(types, name)
-        if getattr(update, 'SUBCLASS_OF_ID', None) == 0x9f89304e:
-            cid = update.CONSTRUCTOR_ID
-            sig = inspect.signature(update.__init__)
-            for param in sig.parameters.values():
-                if param.name == 'channel_id' and param.annotation == int:
-                    _has_channel_id.append(cid)
+    # Only the updates are needed, so there's no need to import every type
+    for update in types.TypeUpdate.__args__:
+        cid = update.CONSTRUCTOR_ID
+        sig = inspect.signature(update.__init__)
+        for param in sig.parameters.values():
+            if param.name == 'channel_id' and param.annotation == int:
+                _has_channel_id.append(cid)
 
     if not _has_channel_id:
         raise RuntimeError('FIXME: Did the init signature or updates change?')
@@ -1,32 +1,59 @@
 import gzip
 import struct
+import zlib
 
 from .. import TLObject
 
 
+# Data larger than this is only compressed if a sample of it compresses
+# well, which avoids compressing big payloads that won't get any smaller.
+_SAMPLE_THRESHOLD = 8192
+_SAMPLE_SIZE = 2048
+_SAMPLE_MAX_RATIO = 0.9
+
+
 class GzipPacked(TLObject):
     CONSTRUCTOR_ID = 0x3072cfa1
 
-    def __init__(self, data):
+    # The same level as `gzip.compress`
+    DEFAULT_LEVEL = 9
+
+    def __init__(self, data, level=DEFAULT_LEVEL):
         self.data = data
+        self.level = level
 
     @staticmethod
-    def gzip_if_smaller(content_related, data):
+    def gzip_if_smaller(content_related, data, level=DEFAULT_LEVEL):
         """Calls bytes(request), and based on a certain threshold,
            optionally gzips the resulting data. If the gzipped data is
            smaller than the original byte array, this is returned instead.
 
-           Note that this only applies to content related requests.
+           Note that this only applies to content related requests, and
+           that a level of 0 disables compression altogether.
         """
-        if content_related and len(data) > 512:
-            gzipped = bytes(GzipPacked(data))
-            return gzipped if len(gzipped) < len(data) else data
-        else:
+        if not content_related or len(data) <= 512 or not level:
+            return data
+
+        if len(data) > _SAMPLE_THRESHOLD and not GzipPacked._compressible(data):
             return data
 
+        gzipped = bytes(GzipPacked(data, level))
+        return gzipped if len(gzipped) < len(data) else data
+
+    @staticmethod
+    def _compressible(data):
+        """
+        Estimates whether the data is worth compressing by quickly
+        compressing a sample from the start and the middle of it.
+        """
+        middle = len(data) // 2
+        sample = bytes(data[:_SAMPLE_SIZE]) + \
+            bytes(data[middle:middle + _SAMPLE_SIZE])
+        return len(zlib.compress(sample, 1)) < len(sample) * _SAMPLE_MAX_RATIO
+
     def __bytes__(self):
         return struct.pack('<I', GzipPacked.CONSTRUCTOR_ID) + \
-               TLObject.serialize_bytes(gzip.compress(self.data))
+               TLObject.serialize_bytes(gzip.compress(self.data, self.level))
 
     @staticmethod
     def read(reader):
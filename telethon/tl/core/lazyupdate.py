@@ -0,0 +1,36 @@
+from ..tlobject import TLObject
+
+
+class LazyUpdate(TLObject):
+    """
+    An :tl:`Update` that has only been read as its constructor ID and its
+    raw bytes. It is deserialized into the real type by `decode`, so that
+    updates nobody will see (like typing or status noise) cost nothing.
+    """
+    SUBCLASS_OF_ID = 0x9f89304e  # crc32(b'Update')
+
+    # Only updates inside :tl:`UpdateShort` are left undecoded, because
+    # the message length tells where they end without having to read them.
+    UPDATE_SHORT_ID = 0x78d4dec1
+
+    def __init__(self, constructor_id, data):
+        self.CONSTRUCTOR_ID = constructor_id
+        self.data = data
+
+    def decode(self):
+        """
+        Deserializes and returns the real :tl:`Update`.
+        """
+        from ...extensions import BinaryReader
+        with BinaryReader(self.data) as reader:
+            return reader.tgread_object()
+
+    def _bytes(self):
+        return self.data
+
+    def to_dict(self):
+        return {
+            '_': 'LazyUpdate',
+            'constructor_id': self.CONSTRUCTOR_ID,
+            'data': self.data
+        }
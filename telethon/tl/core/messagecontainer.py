@@ -33,15 +33,19 @@ class MessageContainer(TLObject):
         }
 
     @classmethod
-    def from_reader(cls, reader):
-        # This assumes that .read_* calls are done in the order they appear
+    def from_reader(cls, reader, read_object=None):
+        # This assumes that .read_* calls are done in the order they appear.
+        # If given, read_object(reader, length) reads the inner objects.
         messages = []
         for _ in range(reader.read_int()):
             msg_id = reader.read_long()
             seq_no = reader.read_int()
             length = reader.read_int()
             before = reader.tell_position()
-            obj = reader.tgread_object()  # May over-read e.g. RpcResult
+            if read_object:
+                obj = read_object(reader, length)
+            else:
+                obj = reader.tgread_object()  # May over-read e.g. RpcResult
             reader.set_position(before + length)
             messages.append(TLMessage(msg_id, seq_no, obj))
         return MessageContainer(messages)
@@ -1,7 +1,6 @@
 import datetime
 
-from .. import TLObject
-from ..functions.messages import SaveDraftRequest
+from .. import TLObject, functions
 from ..types import DraftMessage
 from ...errors import RPCError
 from ...extensions.markup import markdown
@@ -134,7 +133,7 @@ class Draft:
         raw_text, entities =\
             await self._client._parse_message_text(text, parse_mode)
 
-        result = await self._client(SaveDraftRequest(
+        result = await self._client(functions.messages.SaveDraftRequest(
             peer=self._peer,
             message=raw_text,
             no_webpage=not link_preview,
@@ -35,6 +35,9 @@ class TLObject:
     CONSTRUCTOR_ID = None
     SUBCLASS_OF_ID = None
 
+    # The generated types only have slots for their arguments
+    __slots__ = ()
+
     @staticmethod
     def pretty_format(obj, indent=None):
         """
@@ -163,6 +166,28 @@ class TLObject:
     def __ne__(self, o):
         return not isinstance(o, type(self)) or self.to_dict() != o.to_dict()
 
+    def __getstate__(self):
+        # Needed to pickle the slots with any protocol, along with the
+        # __dict__ of subclasses. The slots are read through their own
+        # descriptor in case a subclass has a property of the same name.
+        state = dict(getattr(self, '__dict__', ()))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                try:
+                    state[name] = cls.__dict__[name].__get__(self, cls)
+                except AttributeError:
+                    pass  # never set
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name in state:
+                    cls.__dict__[name].__set__(self, state.pop(name))
+        if state:
+            self.__dict__.update(state)
+
     def __str__(self):
         return TLObject.pretty_format(self)
 
@@ -214,6 +239,8 @@ class TLRequest(TLObject):
     """
     Represents a content-related `TLObject` (a request that can be sent).
     """
+    __slots__ = ()
+
     @staticmethod
     def read_result(reader):
         return reader.tgread_object()
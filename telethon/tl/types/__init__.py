@@ -0,0 +1,1944 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import account, auth, bots, channels, chatlists, contacts, fragment, help, messages, payments, phone, photos, premium, smsjobs, stats, stickers, storage, stories, updates, upload, users
+    from ._accesspointrule import AccessPointRule, TypeAccessPointRule
+    from ._accountdaysttl import AccountDaysTTL, TypeAccountDaysTTL
+    from ._attachmenubot import AttachMenuBot, TypeAttachMenuBot
+    from ._attachmenuboticon import AttachMenuBotIcon, TypeAttachMenuBotIcon
+    from ._attachmenuboticoncolor import AttachMenuBotIconColor, TypeAttachMenuBotIconColor
+    from ._attachmenubots import AttachMenuBots, AttachMenuBotsNotModified, TypeAttachMenuBots
+    from ._attachmenubotsbot import AttachMenuBotsBot, TypeAttachMenuBotsBot
+    from ._attachmenupeertype import AttachMenuPeerTypeBotPM, AttachMenuPeerTypeBroadcast, AttachMenuPeerTypeChat, AttachMenuPeerTypePM, AttachMenuPeerTypeSameBotPM, TypeAttachMenuPeerType
+    from ._authorization import Authorization, TypeAuthorization
+    from ._autodownloadsettings import AutoDownloadSettings, TypeAutoDownloadSettings
+    from ._autosaveexception import AutoSaveException, TypeAutoSaveException
+    from ._autosavesettings import AutoSaveSettings, TypeAutoSaveSettings
+    from ._availableeffect import AvailableEffect, TypeAvailableEffect
+    from ._availablereaction import AvailableReaction, TypeAvailableReaction
+    from ._badmsgnotification import BadMsgNotification, BadServerSalt, TypeBadMsgNotification
+    from ._bankcardopenurl import BankCardOpenUrl, TypeBankCardOpenUrl
+    from ._basetheme import BaseThemeArctic, BaseThemeClassic, BaseThemeDay, BaseThemeNight, BaseThemeTinted, TypeBaseTheme
+    from ._bindauthkeyinner import BindAuthKeyInner, TypeBindAuthKeyInner
+    from ._birthday import Birthday, TypeBirthday
+    from ._boost import Boost, TypeBoost
+    from ._botapp import BotApp, BotAppNotModified, TypeBotApp
+    from ._botappsettings import BotAppSettings, TypeBotAppSettings
+    from ._botbusinessconnection import BotBusinessConnection, TypeBotBusinessConnection
+    from ._botcommand import BotCommand, TypeBotCommand
+    from ._botcommandscope import BotCommandScopeChatAdmins, BotCommandScopeChats, BotCommandScopeDefault, BotCommandScopePeer, BotCommandScopePeerAdmins, BotCommandScopePeerUser, BotCommandScopeUsers, TypeBotCommandScope
+    from ._botinfo import BotInfo, TypeBotInfo
+    from ._botinlinemessage import BotInlineMessageMediaAuto, BotInlineMessageMediaContact, BotInlineMessageMediaGeo, BotInlineMessageMediaInvoice, BotInlineMessageMediaVenue, BotInlineMessageMediaWebPage, BotInlineMessageText, TypeBotInlineMessage
+    from ._botinlineresult import BotInlineMediaResult, BotInlineResult, TypeBotInlineResult
+    from ._botmenubutton import BotMenuButton, BotMenuButtonCommands, BotMenuButtonDefault, TypeBotMenuButton
+    from ._botpreviewmedia import BotPreviewMedia, TypeBotPreviewMedia
+    from ._botverification import BotVerification, TypeBotVerification
+    from ._botverifiersettings import BotVerifierSettings, TypeBotVerifierSettings
+    from ._broadcastrevenuebalances import BroadcastRevenueBalances, TypeBroadcastRevenueBalances
+    from ._broadcastrevenuetransaction import BroadcastRevenueTransactionProceeds, BroadcastRevenueTransactionRefund, BroadcastRevenueTransactionWithdrawal, TypeBroadcastRevenueTransaction
+    from ._businessawaymessage import BusinessAwayMessage, TypeBusinessAwayMessage
+    from ._businessawaymessageschedule import BusinessAwayMessageScheduleAlways, BusinessAwayMessageScheduleCustom, BusinessAwayMessageScheduleOutsideWorkHours, TypeBusinessAwayMessageSchedule
+    from ._businessbotrecipients import BusinessBotRecipients, TypeBusinessBotRecipients
+    from ._businessbotrights import BusinessBotRights, TypeBusinessBotRights
+    from ._businesschatlink import BusinessChatLink, TypeBusinessChatLink
+    from ._businessgreetingmessage import BusinessGreetingMessage, TypeBusinessGreetingMessage
+    from ._businessintro import BusinessIntro, TypeBusinessIntro
+    from ._businesslocation import BusinessLocation, TypeBusinessLocation
+    from ._businessrecipients import BusinessRecipients, TypeBusinessRecipients
+    from ._businessweeklyopen import BusinessWeeklyOpen, TypeBusinessWeeklyOpen
+    from ._businessworkhours import BusinessWorkHours, TypeBusinessWorkHours
+    from ._cdnconfig import CdnConfig, TypeCdnConfig
+    from ._cdnpublickey import CdnPublicKey, TypeCdnPublicKey
+    from ._channeladminlogevent import ChannelAdminLogEvent, TypeChannelAdminLogEvent
+    from ._channeladminlogeventaction import ChannelAdminLogEventActionChangeAbout, ChannelAdminLogEventActionChangeAvailableReactions, ChannelAdminLogEventActionChangeEmojiStatus, ChannelAdminLogEventActionChangeEmojiStickerSet, ChannelAdminLogEventActionChangeHistoryTTL, ChannelAdminLogEventActionChangeLinkedChat, ChannelAdminLogEventActionChangeLocation, ChannelAdminLogEventActionChangePeerColor, ChannelAdminLogEventActionChangePhoto, ChannelAdminLogEventActionChangeProfilePeerColor, ChannelAdminLogEventActionChangeStickerSet, ChannelAdminLogEventActionChangeTitle, ChannelAdminLogEventActionChangeUsername, ChannelAdminLogEventActionChangeUsernames, ChannelAdminLogEventActionChangeWallpaper, ChannelAdminLogEventActionCreateTopic, ChannelAdminLogEventActionDefaultBannedRights, ChannelAdminLogEventActionDeleteMessage, ChannelAdminLogEventActionDeleteTopic, ChannelAdminLogEventActionDiscardGroupCall, ChannelAdminLogEventActionEditMessage, ChannelAdminLogEventActionEditTopic, ChannelAdminLogEventActionExportedInviteDelete, ChannelAdminLogEventActionExportedInviteEdit, ChannelAdminLogEventActionExportedInviteRevoke, ChannelAdminLogEventActionParticipantInvite, ChannelAdminLogEventActionParticipantJoin, ChannelAdminLogEventActionParticipantJoinByInvite, ChannelAdminLogEventActionParticipantJoinByRequest, ChannelAdminLogEventActionParticipantLeave, ChannelAdminLogEventActionParticipantMute, ChannelAdminLogEventActionParticipantSubExtend, ChannelAdminLogEventActionParticipantToggleAdmin, ChannelAdminLogEventActionParticipantToggleBan, ChannelAdminLogEventActionParticipantUnmute, ChannelAdminLogEventActionParticipantVolume, ChannelAdminLogEventActionPinTopic, ChannelAdminLogEventActionSendMessage, ChannelAdminLogEventActionStartGroupCall, ChannelAdminLogEventActionStopPoll, ChannelAdminLogEventActionToggleAntiSpam, ChannelAdminLogEventActionToggleForum, ChannelAdminLogEventActionToggleGroupCallSetting, ChannelAdminLogEventActionToggleInvites, ChannelAdminLogEventActionToggleNoForwards, ChannelAdminLogEventActionTogglePreHistoryHidden, ChannelAdminLogEventActionToggleSignatureProfiles, ChannelAdminLogEventActionToggleSignatures, ChannelAdminLogEventActionToggleSlowMode, ChannelAdminLogEventActionUpdatePinned, TypeChannelAdminLogEventAction
+    from ._channeladminlogeventsfilter import ChannelAdminLogEventsFilter, TypeChannelAdminLogEventsFilter
+    from ._channellocation import ChannelLocation, ChannelLocationEmpty, TypeChannelLocation
+    from ._channelmessagesfilter import ChannelMessagesFilter, ChannelMessagesFilterEmpty, TypeChannelMessagesFilter
+    from ._channelparticipant import ChannelParticipant, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantCreator, ChannelParticipantLeft, ChannelParticipantSelf, TypeChannelParticipant
+    from ._channelparticipantsfilter import ChannelParticipantsAdmins, ChannelParticipantsBanned, ChannelParticipantsBots, ChannelParticipantsContacts, ChannelParticipantsKicked, ChannelParticipantsMentions, ChannelParticipantsRecent, ChannelParticipantsSearch, TypeChannelParticipantsFilter
+    from ._chat import Channel, ChannelForbidden, Chat, ChatEmpty, ChatForbidden, TypeChat
+    from ._chatadminrights import ChatAdminRights, TypeChatAdminRights
+    from ._chatadminwithinvites import ChatAdminWithInvites, TypeChatAdminWithInvites
+    from ._chatbannedrights import ChatBannedRights, TypeChatBannedRights
+    from ._chatfull import ChannelFull, ChatFull, TypeChatFull
+    from ._chatinvite import ChatInvite, ChatInviteAlready, ChatInvitePeek, TypeChatInvite
+    from ._chatinviteimporter import ChatInviteImporter, TypeChatInviteImporter
+    from ._chatonlines import ChatOnlines, TypeChatOnlines
+    from ._chatparticipant import ChatParticipant, ChatParticipantAdmin, ChatParticipantCreator, TypeChatParticipant
+    from ._chatparticipants import ChatParticipants, ChatParticipantsForbidden, TypeChatParticipants
+    from ._chatphoto import ChatPhoto, ChatPhotoEmpty, TypeChatPhoto
+    from ._chatreactions import ChatReactionsAll, ChatReactionsNone, ChatReactionsSome, TypeChatReactions
+    from ._client_dh_inner_data import ClientDHInnerData, TypeClient_DH_Inner_Data
+    from ._codesettings import CodeSettings, TypeCodeSettings
+    from ._config import Config, TypeConfig
+    from ._connectedbot import ConnectedBot, TypeConnectedBot
+    from ._connectedbotstarref import ConnectedBotStarRef, TypeConnectedBotStarRef
+    from ._contact import Contact, TypeContact
+    from ._contactbirthday import ContactBirthday, TypeContactBirthday
+    from ._contactstatus import ContactStatus, TypeContactStatus
+    from ._datajson import DataJSON, TypeDataJSON
+    from ._dcoption import DcOption, TypeDcOption
+    from ._defaulthistoryttl import DefaultHistoryTTL, TypeDefaultHistoryTTL
+    from ._destroyauthkeyres import DestroyAuthKeyFail, DestroyAuthKeyNone, DestroyAuthKeyOk, TypeDestroyAuthKeyRes
+    from ._destroysessionres import DestroySessionNone, DestroySessionOk, TypeDestroySessionRes
+    from ._dialog import Dialog, DialogFolder, TypeDialog
+    from ._dialogfilter import DialogFilter, DialogFilterChatlist, DialogFilterDefault, TypeDialogFilter
+    from ._dialogfiltersuggested import DialogFilterSuggested, TypeDialogFilterSuggested
+    from ._dialogpeer import DialogPeer, DialogPeerFolder, TypeDialogPeer
+    from ._disallowedgiftssettings import DisallowedGiftsSettings, TypeDisallowedGiftsSettings
+    from ._document import Document, DocumentEmpty, TypeDocument
+    from ._documentattribute import DocumentAttributeAnimated, DocumentAttributeAudio, DocumentAttributeCustomEmoji, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeImageSize, DocumentAttributeSticker, DocumentAttributeVideo, TypeDocumentAttribute
+    from ._draftmessage import DraftMessage, DraftMessageEmpty, TypeDraftMessage
+    from ._emailverification import EmailVerificationApple, EmailVerificationCode, EmailVerificationGoogle, TypeEmailVerification
+    from ._emailverifypurpose import EmailVerifyPurposeLoginChange, EmailVerifyPurposeLoginSetup, EmailVerifyPurposePassport, TypeEmailVerifyPurpose
+    from ._emojigroup import EmojiGroup, EmojiGroupGreeting, EmojiGroupPremium, TypeEmojiGroup
+    from ._emojikeyword import EmojiKeyword, EmojiKeywordDeleted, TypeEmojiKeyword
+    from ._emojikeywordsdifference import EmojiKeywordsDifference, TypeEmojiKeywordsDifference
+    from ._emojilanguage import EmojiLanguage, TypeEmojiLanguage
+    from ._emojilist import EmojiList, EmojiListNotModified, TypeEmojiList
+    from ._emojistatus import EmojiStatus, EmojiStatusCollectible, EmojiStatusEmpty, InputEmojiStatusCollectible, TypeEmojiStatus
+    from ._emojiurl import EmojiURL, TypeEmojiURL
+    from ._encryptedchat import EncryptedChat, EncryptedChatDiscarded, EncryptedChatEmpty, EncryptedChatRequested, EncryptedChatWaiting, TypeEncryptedChat
+    from ._encryptedfile import EncryptedFile, EncryptedFileEmpty, TypeEncryptedFile
+    from ._encryptedmessage import EncryptedMessage, EncryptedMessageService, TypeEncryptedMessage
+    from ._exportedchatinvite import ChatInviteExported, ChatInvitePublicJoinRequests, TypeExportedChatInvite
+    from ._exportedchatlistinvite import ExportedChatlistInvite, TypeExportedChatlistInvite
+    from ._exportedcontacttoken import ExportedContactToken, TypeExportedContactToken
+    from ._exportedmessagelink import ExportedMessageLink, TypeExportedMessageLink
+    from ._exportedstorylink import ExportedStoryLink, TypeExportedStoryLink
+    from ._factcheck import FactCheck, TypeFactCheck
+    from ._filehash import FileHash, TypeFileHash
+    from ._folder import Folder, TypeFolder
+    from ._folderpeer import FolderPeer, TypeFolderPeer
+    from ._forumtopic import ForumTopic, ForumTopicDeleted, TypeForumTopic
+    from ._foundstory import FoundStory, TypeFoundStory
+    from ._futuresalt import FutureSalt, TypeFutureSalt
+    from ._futuresalts import FutureSalts, TypeFutureSalts
+    from ._game import Game, TypeGame
+    from ._geopoint import GeoPoint, GeoPointEmpty, TypeGeoPoint
+    from ._geopointaddress import GeoPointAddress, TypeGeoPointAddress
+    from ._globalprivacysettings import GlobalPrivacySettings, TypeGlobalPrivacySettings
+    from ._groupcall import GroupCall, GroupCallDiscarded, TypeGroupCall
+    from ._groupcallparticipant import GroupCallParticipant, TypeGroupCallParticipant
+    from ._groupcallparticipantvideo import GroupCallParticipantVideo, TypeGroupCallParticipantVideo
+    from ._groupcallparticipantvideosourcegroup import GroupCallParticipantVideoSourceGroup, TypeGroupCallParticipantVideoSourceGroup
+    from ._groupcallstreamchannel import GroupCallStreamChannel, TypeGroupCallStreamChannel
+    from ._highscore import HighScore, TypeHighScore
+    from ._httpwait import HttpWait, TypeHttpWait
+    from ._importedcontact import ImportedContact, TypeImportedContact
+    from ._inlinebotswitchpm import InlineBotSwitchPM, TypeInlineBotSwitchPM
+    from ._inlinebotwebview import InlineBotWebView, TypeInlineBotWebView
+    from ._inlinequerypeertype import InlineQueryPeerTypeBotPM, InlineQueryPeerTypeBroadcast, InlineQueryPeerTypeChat, InlineQueryPeerTypeMegagroup, InlineQueryPeerTypePM, InlineQueryPeerTypeSameBotPM, TypeInlineQueryPeerType
+    from ._inputappevent import InputAppEvent, TypeInputAppEvent
+    from ._inputbotapp import InputBotAppID, InputBotAppShortName, TypeInputBotApp
+    from ._inputbotinlinemessage import InputBotInlineMessageGame, InputBotInlineMessageMediaAuto, InputBotInlineMessageMediaContact, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaWebPage, InputBotInlineMessageText, TypeInputBotInlineMessage
+    from ._inputbotinlinemessageid import InputBotInlineMessageID, InputBotInlineMessageID64, TypeInputBotInlineMessageID
+    from ._inputbotinlineresult import InputBotInlineResult, InputBotInlineResultDocument, InputBotInlineResultGame, InputBotInlineResultPhoto, TypeInputBotInlineResult
+    from ._inputbusinessawaymessage import InputBusinessAwayMessage, TypeInputBusinessAwayMessage
+    from ._inputbusinessbotrecipients import InputBusinessBotRecipients, TypeInputBusinessBotRecipients
+    from ._inputbusinesschatlink import InputBusinessChatLink, TypeInputBusinessChatLink
+    from ._inputbusinessgreetingmessage import InputBusinessGreetingMessage, TypeInputBusinessGreetingMessage
+    from ._inputbusinessintro import InputBusinessIntro, TypeInputBusinessIntro
+    from ._inputbusinessrecipients import InputBusinessRecipients, TypeInputBusinessRecipients
+    from ._inputchannel import InputChannel, InputChannelEmpty, InputChannelFromMessage, TypeInputChannel
+    from ._inputchatlist import InputChatlistDialogFilter, TypeInputChatlist
+    from ._inputchatphoto import InputChatPhoto, InputChatPhotoEmpty, InputChatUploadedPhoto, TypeInputChatPhoto
+    from ._inputcheckpasswordsrp import InputCheckPasswordEmpty, InputCheckPasswordSRP, TypeInputCheckPasswordSRP
+    from ._inputclientproxy import InputClientProxy, TypeInputClientProxy
+    from ._inputcollectible import InputCollectiblePhone, InputCollectibleUsername, TypeInputCollectible
+    from ._inputcontact import InputPhoneContact, TypeInputContact
+    from ._inputdialogpeer import InputDialogPeer, InputDialogPeerFolder, TypeInputDialogPeer
+    from ._inputdocument import InputDocument, InputDocumentEmpty, TypeInputDocument
+    from ._inputencryptedchat import InputEncryptedChat, TypeInputEncryptedChat
+    from ._inputencryptedfile import InputEncryptedFile, InputEncryptedFileBigUploaded, InputEncryptedFileEmpty, InputEncryptedFileUploaded, TypeInputEncryptedFile
+    from ._inputfile import InputFile, InputFileBig, InputFileStoryDocument, TypeInputFile
+    from ._inputfilelocation import InputDocumentFileLocation, InputEncryptedFileLocation, InputFileLocation, InputGroupCallStream, InputPeerPhotoFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputSecureFileLocation, InputStickerSetThumb, InputTakeoutFileLocation, TypeInputFileLocation
+    from ._inputfolderpeer import InputFolderPeer, TypeInputFolderPeer
+    from ._inputgame import InputGameID, InputGameShortName, TypeInputGame
+    from ._inputgeopoint import InputGeoPoint, InputGeoPointEmpty, TypeInputGeoPoint
+    from ._inputgroupcall import InputGroupCall, TypeInputGroupCall
+    from ._inputinvoice import InputInvoiceChatInviteSubscription, InputInvoiceMessage, InputInvoicePremiumGiftCode, InputInvoicePremiumGiftStars, InputInvoiceSlug, InputInvoiceStarGift, InputInvoiceStarGiftTransfer, InputInvoiceStarGiftUpgrade, InputInvoiceStars, TypeInputInvoice
+    from ._inputmedia import InputMediaContact, InputMediaDice, InputMediaDocument, InputMediaDocumentExternal, InputMediaEmpty, InputMediaGame, InputMediaGeoLive, InputMediaGeoPoint, InputMediaInvoice, InputMediaPaidMedia, InputMediaPhoto, InputMediaPhotoExternal, InputMediaPoll, InputMediaStory, InputMediaUploadedDocument, InputMediaUploadedPhoto, InputMediaVenue, InputMediaWebPage, TypeInputMedia
+    from ._inputmessage import InputMessageCallbackQuery, InputMessageID, InputMessagePinned, InputMessageReplyTo, TypeInputMessage
+    from ._inputnotifypeer import InputNotifyBroadcasts, InputNotifyChats, InputNotifyForumTopic, InputNotifyPeer, InputNotifyUsers, TypeInputNotifyPeer
+    from ._inputpaymentcredentials import InputPaymentCredentials, InputPaymentCredentialsApplePay, InputPaymentCredentialsGooglePay, InputPaymentCredentialsSaved, TypeInputPaymentCredentials
+    from ._inputpeer import InputPeerChannel, InputPeerChannelFromMessage, InputPeerChat, InputPeerEmpty, InputPeerSelf, InputPeerUser, InputPeerUserFromMessage, TypeInputPeer
+    from ._inputpeernotifysettings import InputPeerNotifySettings, TypeInputPeerNotifySettings
+    from ._inputphonecall import InputPhoneCall, TypeInputPhoneCall
+    from ._inputphoto import InputPhoto, InputPhotoEmpty, TypeInputPhoto
+    from ._inputprivacykey import InputPrivacyKeyAbout, InputPrivacyKeyAddedByPhone, InputPrivacyKeyBirthday, InputPrivacyKeyChatInvite, InputPrivacyKeyForwards, InputPrivacyKeyNoPaidMessages, InputPrivacyKeyPhoneCall, InputPrivacyKeyPhoneNumber, InputPrivacyKeyPhoneP2P, InputPrivacyKeyProfilePhoto, InputPrivacyKeyStarGiftsAutoSave, InputPrivacyKeyStatusTimestamp, InputPrivacyKeyVoiceMessages, TypeInputPrivacyKey
+    from ._inputprivacyrule import InputPrivacyValueAllowAll, InputPrivacyValueAllowBots, InputPrivacyValueAllowChatParticipants, InputPrivacyValueAllowCloseFriends, InputPrivacyValueAllowContacts, InputPrivacyValueAllowPremium, InputPrivacyValueAllowUsers, InputPrivacyValueDisallowAll, InputPrivacyValueDisallowBots, InputPrivacyValueDisallowChatParticipants, InputPrivacyValueDisallowContacts, InputPrivacyValueDisallowUsers, TypeInputPrivacyRule
+    from ._inputquickreplyshortcut import InputQuickReplyShortcut, InputQuickReplyShortcutId, TypeInputQuickReplyShortcut
+    from ._inputreplyto import InputReplyToMessage, InputReplyToStory, TypeInputReplyTo
+    from ._inputsavedstargift import InputSavedStarGiftChat, InputSavedStarGiftUser, TypeInputSavedStarGift
+    from ._inputsecurefile import InputSecureFile, InputSecureFileUploaded, TypeInputSecureFile
+    from ._inputsecurevalue import InputSecureValue, TypeInputSecureValue
+    from ._inputsinglemedia import InputSingleMedia, TypeInputSingleMedia
+    from ._inputstarstransaction import InputStarsTransaction, TypeInputStarsTransaction
+    from ._inputstickeredmedia import InputStickeredMediaDocument, InputStickeredMediaPhoto, TypeInputStickeredMedia
+    from ._inputstickerset import InputStickerSetAnimatedEmoji, InputStickerSetAnimatedEmojiAnimations, InputStickerSetDice, InputStickerSetEmojiChannelDefaultStatuses, InputStickerSetEmojiDefaultStatuses, InputStickerSetEmojiDefaultTopicIcons, InputStickerSetEmojiGenericAnimations, InputStickerSetEmpty, InputStickerSetID, InputStickerSetPremiumGifts, InputStickerSetShortName, TypeInputStickerSet
+    from ._inputstickersetitem import InputStickerSetItem, TypeInputStickerSetItem
+    from ._inputstorepaymentpurpose import InputStorePaymentAuthCode, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentPremiumSubscription, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentStarsTopup, TypeInputStorePaymentPurpose
+    from ._inputtheme import InputTheme, InputThemeSlug, TypeInputTheme
+    from ._inputthemesettings import InputThemeSettings, TypeInputThemeSettings
+    from ._inputuser import InputUser, InputUserEmpty, InputUserFromMessage, InputUserSelf, TypeInputUser
+    from ._inputwallpaper import InputWallPaper, InputWallPaperNoFile, InputWallPaperSlug, TypeInputWallPaper
+    from ._inputwebdocument import InputWebDocument, TypeInputWebDocument
+    from ._inputwebfilelocation import InputWebFileAudioAlbumThumbLocation, InputWebFileGeoPointLocation, InputWebFileLocation, TypeInputWebFileLocation
+    from ._invoice import Invoice, TypeInvoice
+    from ._ipport import IpPort, IpPortSecret, TypeIpPort
+    from ._jsonobjectvalue import JsonObjectValue, TypeJSONObjectValue
+    from ._jsonvalue import JsonArray, JsonBool, JsonNull, JsonNumber, JsonObject, JsonString, TypeJSONValue
+    from ._keyboardbutton import InputKeyboardButtonRequestPeer, InputKeyboardButtonUrlAuth, InputKeyboardButtonUserProfile, KeyboardButton, KeyboardButtonBuy, KeyboardButtonCallback, KeyboardButtonCopy, KeyboardButtonGame, KeyboardButtonRequestGeoLocation, KeyboardButtonRequestPeer, KeyboardButtonRequestPhone, KeyboardButtonRequestPoll, KeyboardButtonSimpleWebView, KeyboardButtonSwitchInline, KeyboardButtonUrl, KeyboardButtonUrlAuth, KeyboardButtonUserProfile, KeyboardButtonWebView, TypeKeyboardButton
+    from ._keyboardbuttonrow import KeyboardButtonRow, TypeKeyboardButtonRow
+    from ._labeledprice import LabeledPrice, TypeLabeledPrice
+    from ._langpackdifference import LangPackDifference, TypeLangPackDifference
+    from ._langpacklanguage import LangPackLanguage, TypeLangPackLanguage
+    from ._langpackstring import LangPackString, LangPackStringDeleted, LangPackStringPluralized, TypeLangPackString
+    from ._maskcoords import MaskCoords, TypeMaskCoords
+    from ._mediaarea import InputMediaAreaChannelPost, InputMediaAreaVenue, MediaAreaChannelPost, MediaAreaGeoPoint, MediaAreaStarGift, MediaAreaSuggestedReaction, MediaAreaUrl, MediaAreaVenue, MediaAreaWeather, TypeMediaArea
+    from ._mediaareacoordinates import MediaAreaCoordinates, TypeMediaAreaCoordinates
+    from ._message import Message, MessageEmpty, MessageService, TypeMessage
+    from ._messageaction import MessageActionBoostApply, MessageActionBotAllowed, MessageActionChannelCreate, MessageActionChannelMigrateFrom, MessageActionChatAddUser, MessageActionChatCreate, MessageActionChatDeletePhoto, MessageActionChatDeleteUser, MessageActionChatEditPhoto, MessageActionChatEditTitle, MessageActionChatJoinedByLink, MessageActionChatJoinedByRequest, MessageActionChatMigrateTo, MessageActionContactSignUp, MessageActionCustomAction, MessageActionEmpty, MessageActionGameScore, MessageActionGeoProximityReached, MessageActionGiftCode, MessageActionGiftPremium, MessageActionGiftStars, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionGroupCall, MessageActionGroupCallScheduled, MessageActionHistoryClear, MessageActionInviteToGroupCall, MessageActionPaidMessagesPrice, MessageActionPaidMessagesRefunded, MessageActionPaymentRefunded, MessageActionPaymentSent, MessageActionPaymentSentMe, MessageActionPhoneCall, MessageActionPinMessage, MessageActionPrizeStars, MessageActionRequestedPeer, MessageActionRequestedPeerSentMe, MessageActionScreenshotTaken, MessageActionSecureValuesSent, MessageActionSecureValuesSentMe, MessageActionSetChatTheme, MessageActionSetChatWallPaper, MessageActionSetMessagesTTL, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionSuggestProfilePhoto, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionWebViewDataSent, MessageActionWebViewDataSentMe, TypeMessageAction
+    from ._messageentity import InputMessageEntityMentionName, MessageEntityBankCard, MessageEntityBlockquote, MessageEntityBold, MessageEntityBotCommand, MessageEntityCashtag, MessageEntityCode, MessageEntityCustomEmoji, MessageEntityEmail, MessageEntityHashtag, MessageEntityItalic, MessageEntityMention, MessageEntityMentionName, MessageEntityPhone, MessageEntityPre, MessageEntitySpoiler, MessageEntityStrike, MessageEntityTextUrl, MessageEntityUnderline, MessageEntityUnknown, MessageEntityUrl, TypeMessageEntity
+    from ._messageextendedmedia import MessageExtendedMedia, MessageExtendedMediaPreview, TypeMessageExtendedMedia
+    from ._messagefwdheader import MessageFwdHeader, TypeMessageFwdHeader
+    from ._messagemedia import MessageMediaContact, MessageMediaDice, MessageMediaDocument, MessageMediaEmpty, MessageMediaGame, MessageMediaGeo, MessageMediaGeoLive, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaInvoice, MessageMediaPaidMedia, MessageMediaPhoto, MessageMediaPoll, MessageMediaStory, MessageMediaUnsupported, MessageMediaVenue, MessageMediaWebPage, TypeMessageMedia
+    from ._messagepeerreaction import MessagePeerReaction, TypeMessagePeerReaction
+    from ._messagepeervote import MessagePeerVote, MessagePeerVoteInputOption, MessagePeerVoteMultiple, TypeMessagePeerVote
+    from ._messagerange import MessageRange, TypeMessageRange
+    from ._messagereactions import MessageReactions, TypeMessageReactions
+    from ._messagereactor import MessageReactor, TypeMessageReactor
+    from ._messagereplies import MessageReplies, TypeMessageReplies
+    from ._messagereplyheader import MessageReplyHeader, MessageReplyStoryHeader, TypeMessageReplyHeader
+    from ._messagereportoption import MessageReportOption, TypeMessageReportOption
+    from ._messagesfilter import InputMessagesFilterChatPhotos, InputMessagesFilterContacts, InputMessagesFilterDocument, InputMessagesFilterEmpty, InputMessagesFilterGeo, InputMessagesFilterGif, InputMessagesFilterMusic, InputMessagesFilterMyMentions, InputMessagesFilterPhoneCalls, InputMessagesFilterPhotoVideo, InputMessagesFilterPhotos, InputMessagesFilterPinned, InputMessagesFilterRoundVideo, InputMessagesFilterRoundVoice, InputMessagesFilterUrl, InputMessagesFilterVideo, InputMessagesFilterVoice, TypeMessagesFilter
+    from ._messageviews import MessageViews, TypeMessageViews
+    from ._missinginvitee import MissingInvitee, TypeMissingInvitee
+    from ._msgdetailedinfo import MsgDetailedInfo, MsgNewDetailedInfo, TypeMsgDetailedInfo
+    from ._msgresendreq import MsgResendReq, TypeMsgResendReq
+    from ._msgsack import MsgsAck, TypeMsgsAck
+    from ._msgsallinfo import MsgsAllInfo, TypeMsgsAllInfo
+    from ._msgsstateinfo import MsgsStateInfo, TypeMsgsStateInfo
+    from ._msgsstatereq import MsgsStateReq, TypeMsgsStateReq
+    from ._myboost import MyBoost, TypeMyBoost
+    from ._nearestdc import NearestDc, TypeNearestDc
+    from ._newsession import NewSessionCreated, TypeNewSession
+    from ._notificationsound import NotificationSoundDefault, NotificationSoundLocal, NotificationSoundNone, NotificationSoundRingtone, TypeNotificationSound
+    from ._notifypeer import NotifyBroadcasts, NotifyChats, NotifyForumTopic, NotifyPeer, NotifyUsers, TypeNotifyPeer
+    from ._outboxreaddate import OutboxReadDate, TypeOutboxReadDate
+    from ._p_q_inner_data import PQInnerData, PQInnerDataDc, PQInnerDataTemp, PQInnerDataTempDc, TypeP_Q_inner_data
+    from ._page import Page, TypePage
+    from ._pageblock import PageBlockAnchor, PageBlockAudio, PageBlockAuthorDate, PageBlockBlockquote, PageBlockChannel, PageBlockCollage, PageBlockCover, PageBlockDetails, PageBlockDivider, PageBlockEmbed, PageBlockEmbedPost, PageBlockFooter, PageBlockHeader, PageBlockKicker, PageBlockList, PageBlockMap, PageBlockOrderedList, PageBlockParagraph, PageBlockPhoto, PageBlockPreformatted, PageBlockPullquote, PageBlockRelatedArticles, PageBlockSlideshow, PageBlockSubheader, PageBlockSubtitle, PageBlockTable, PageBlockTitle, PageBlockUnsupported, PageBlockVideo, TypePageBlock
+    from ._pagecaption import PageCaption, TypePageCaption
+    from ._pagelistitem import PageListItemBlocks, PageListItemText, TypePageListItem
+    from ._pagelistordereditem import PageListOrderedItemBlocks, PageListOrderedItemText, TypePageListOrderedItem
+    from ._pagerelatedarticle import PageRelatedArticle, TypePageRelatedArticle
+    from ._pagetablecell import PageTableCell, TypePageTableCell
+    from ._pagetablerow import PageTableRow, TypePageTableRow
+    from ._paidreactionprivacy import PaidReactionPrivacyAnonymous, PaidReactionPrivacyDefault, PaidReactionPrivacyPeer, TypePaidReactionPrivacy
+    from ._passwordkdfalgo import PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow, PasswordKdfAlgoUnknown, TypePasswordKdfAlgo
+    from ._paymentcharge import PaymentCharge, TypePaymentCharge
+    from ._paymentformmethod import PaymentFormMethod, TypePaymentFormMethod
+    from ._paymentrequestedinfo import PaymentRequestedInfo, TypePaymentRequestedInfo
+    from ._paymentsavedcredentials import PaymentSavedCredentialsCard, TypePaymentSavedCredentials
+    from ._peer import PeerChannel, PeerChat, PeerUser, TypePeer
+    from ._peerblocked import PeerBlocked, TypePeerBlocked
+    from ._peercolor import PeerColor, TypePeerColor
+    from ._peerlocated import PeerLocated, PeerSelfLocated, TypePeerLocated
+    from ._peernotifysettings import PeerNotifySettings, TypePeerNotifySettings
+    from ._peersettings import PeerSettings, TypePeerSettings
+    from ._peerstories import PeerStories, TypePeerStories
+    from ._phonecall import PhoneCall, PhoneCallAccepted, PhoneCallDiscarded, PhoneCallEmpty, PhoneCallRequested, PhoneCallWaiting, TypePhoneCall
+    from ._phonecalldiscardreason import PhoneCallDiscardReasonAllowGroupCall, PhoneCallDiscardReasonBusy, PhoneCallDiscardReasonDisconnect, PhoneCallDiscardReasonHangup, PhoneCallDiscardReasonMissed, TypePhoneCallDiscardReason
+    from ._phonecallprotocol import PhoneCallProtocol, TypePhoneCallProtocol
+    from ._phoneconnection import PhoneConnection, PhoneConnectionWebrtc, TypePhoneConnection
+    from ._photo import Photo, PhotoEmpty, TypePhoto
+    from ._photosize import PhotoCachedSize, PhotoPathSize, PhotoSize, PhotoSizeEmpty, PhotoSizeProgressive, PhotoStrippedSize, TypePhotoSize
+    from ._poll import Poll, TypePoll
+    from ._pollanswer import PollAnswer, TypePollAnswer
+    from ._pollanswervoters import PollAnswerVoters, TypePollAnswerVoters
+    from ._pollresults import PollResults, TypePollResults
+    from ._pong import Pong, TypePong
+    from ._popularcontact import PopularContact, TypePopularContact
+    from ._postaddress import PostAddress, TypePostAddress
+    from ._postinteractioncounters import PostInteractionCountersMessage, PostInteractionCountersStory, TypePostInteractionCounters
+    from ._premiumgiftcodeoption import PremiumGiftCodeOption, TypePremiumGiftCodeOption
+    from ._premiumsubscriptionoption import PremiumSubscriptionOption, TypePremiumSubscriptionOption
+    from ._prepaidgiveaway import PrepaidGiveaway, PrepaidStarsGiveaway, TypePrepaidGiveaway
+    from ._privacykey import PrivacyKeyAbout, PrivacyKeyAddedByPhone, PrivacyKeyBirthday, PrivacyKeyChatInvite, PrivacyKeyForwards, PrivacyKeyNoPaidMessages, PrivacyKeyPhoneCall, PrivacyKeyPhoneNumber, PrivacyKeyPhoneP2P, PrivacyKeyProfilePhoto, PrivacyKeyStarGiftsAutoSave, PrivacyKeyStatusTimestamp, PrivacyKeyVoiceMessages, TypePrivacyKey
+    from ._privacyrule import PrivacyValueAllowAll, PrivacyValueAllowBots, PrivacyValueAllowChatParticipants, PrivacyValueAllowCloseFriends, PrivacyValueAllowContacts, PrivacyValueAllowPremium, PrivacyValueAllowUsers, PrivacyValueDisallowAll, PrivacyValueDisallowBots, PrivacyValueDisallowChatParticipants, PrivacyValueDisallowContacts, PrivacyValueDisallowUsers, TypePrivacyRule
+    from ._publicforward import PublicForwardMessage, PublicForwardStory, TypePublicForward
+    from ._quickreply import QuickReply, TypeQuickReply
+    from ._reaction import ReactionCustomEmoji, ReactionEmoji, ReactionEmpty, ReactionPaid, TypeReaction
+    from ._reactioncount import ReactionCount, TypeReactionCount
+    from ._reactionnotificationsfrom import ReactionNotificationsFromAll, ReactionNotificationsFromContacts, TypeReactionNotificationsFrom
+    from ._reactionsnotifysettings import ReactionsNotifySettings, TypeReactionsNotifySettings
+    from ._readparticipantdate import ReadParticipantDate, TypeReadParticipantDate
+    from ._receivednotifymessage import ReceivedNotifyMessage, TypeReceivedNotifyMessage
+    from ._recentmeurl import RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet, RecentMeUrlUnknown, RecentMeUrlUser, TypeRecentMeUrl
+    from ._replymarkup import ReplyInlineMarkup, ReplyKeyboardForceReply, ReplyKeyboardHide, ReplyKeyboardMarkup, TypeReplyMarkup
+    from ._reportreason import InputReportReasonChildAbuse, InputReportReasonCopyright, InputReportReasonFake, InputReportReasonGeoIrrelevant, InputReportReasonIllegalDrugs, InputReportReasonOther, InputReportReasonPersonalDetails, InputReportReasonPornography, InputReportReasonSpam, InputReportReasonViolence, TypeReportReason
+    from ._reportresult import ReportResultAddComment, ReportResultChooseOption, ReportResultReported, TypeReportResult
+    from ._requestedpeer import RequestedPeerChannel, RequestedPeerChat, RequestedPeerUser, TypeRequestedPeer
+    from ._requestpeertype import RequestPeerTypeBroadcast, RequestPeerTypeChat, RequestPeerTypeUser, TypeRequestPeerType
+    from ._requirementtocontact import RequirementToContactEmpty, RequirementToContactPaidMessages, RequirementToContactPremium, TypeRequirementToContact
+    from ._respq import ResPQ, TypeResPQ
+    from ._restrictionreason import RestrictionReason, TypeRestrictionReason
+    from ._richtext import TextAnchor, TextBold, TextConcat, TextEmail, TextEmpty, TextFixed, TextImage, TextItalic, TextMarked, TextPhone, TextPlain, TextStrike, TextSubscript, TextSuperscript, TextUnderline, TextUrl, TypeRichText
+    from ._rpcdropanswer import RpcAnswerDropped, RpcAnswerDroppedRunning, RpcAnswerUnknown, TypeRpcDropAnswer
+    from ._rpcerror import RpcError, TypeRpcError
+    from ._savedcontact import SavedPhoneContact, TypeSavedContact
+    from ._saveddialog import SavedDialog, TypeSavedDialog
+    from ._savedreactiontag import SavedReactionTag, TypeSavedReactionTag
+    from ._savedstargift import SavedStarGift, TypeSavedStarGift
+    from ._searchresultscalendarperiod import SearchResultsCalendarPeriod, TypeSearchResultsCalendarPeriod
+    from ._searchresultsposition import SearchResultPosition, TypeSearchResultsPosition
+    from ._securecredentialsencrypted import SecureCredentialsEncrypted, TypeSecureCredentialsEncrypted
+    from ._securedata import SecureData, TypeSecureData
+    from ._securefile import SecureFile, SecureFileEmpty, TypeSecureFile
+    from ._securepasswordkdfalgo import SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000, SecurePasswordKdfAlgoSHA512, SecurePasswordKdfAlgoUnknown, TypeSecurePasswordKdfAlgo
+    from ._secureplaindata import SecurePlainEmail, SecurePlainPhone, TypeSecurePlainData
+    from ._securerequiredtype import SecureRequiredType, SecureRequiredTypeOneOf, TypeSecureRequiredType
+    from ._securesecretsettings import SecureSecretSettings, TypeSecureSecretSettings
+    from ._securevalue import SecureValue, TypeSecureValue
+    from ._securevalueerror import SecureValueError, SecureValueErrorData, SecureValueErrorFile, SecureValueErrorFiles, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles, TypeSecureValueError
+    from ._securevaluehash import SecureValueHash, TypeSecureValueHash
+    from ._securevaluetype import SecureValueTypeAddress, SecureValueTypeBankStatement, SecureValueTypeDriverLicense, SecureValueTypeEmail, SecureValueTypeIdentityCard, SecureValueTypeInternalPassport, SecureValueTypePassport, SecureValueTypePassportRegistration, SecureValueTypePersonalDetails, SecureValueTypePhone, SecureValueTypeRentalAgreement, SecureValueTypeTemporaryRegistration, SecureValueTypeUtilityBill, TypeSecureValueType
+    from ._sendaspeer import SendAsPeer, TypeSendAsPeer
+    from ._sendmessageaction import SendMessageCancelAction, SendMessageChooseContactAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen, SendMessageGamePlayAction, SendMessageGeoLocationAction, SendMessageHistoryImportAction, SendMessageRecordAudioAction, SendMessageRecordRoundAction, SendMessageRecordVideoAction, SendMessageTypingAction, SendMessageUploadAudioAction, SendMessageUploadDocumentAction, SendMessageUploadPhotoAction, SendMessageUploadRoundAction, SendMessageUploadVideoAction, SpeakingInGroupCallAction, TypeSendMessageAction
+    from ._server_dh_inner_data import ServerDHInnerData, TypeServer_DH_inner_data
+    from ._server_dh_params import ServerDHParamsFail, ServerDHParamsOk, TypeServer_DH_Params
+    from ._set_client_dh_params_answer import DhGenFail, DhGenOk, DhGenRetry, TypeSet_client_DH_params_answer
+    from ._shippingoption import ShippingOption, TypeShippingOption
+    from ._smsjob import SmsJob, TypeSmsJob
+    from ._sponsoredmessage import SponsoredMessage, TypeSponsoredMessage
+    from ._sponsoredmessagereportoption import SponsoredMessageReportOption, TypeSponsoredMessageReportOption
+    from ._sponsoredpeer import SponsoredPeer, TypeSponsoredPeer
+    from ._stargift import StarGift, StarGiftUnique, TypeStarGift
+    from ._stargiftattribute import StarGiftAttributeBackdrop, StarGiftAttributeModel, StarGiftAttributeOriginalDetails, StarGiftAttributePattern, TypeStarGiftAttribute
+    from ._starrefprogram import StarRefProgram, TypeStarRefProgram
+    from ._starsamount import StarsAmount, TypeStarsAmount
+    from ._starsgiftoption import StarsGiftOption, TypeStarsGiftOption
+    from ._starsgiveawayoption import StarsGiveawayOption, TypeStarsGiveawayOption
+    from ._starsgiveawaywinnersoption import StarsGiveawayWinnersOption, TypeStarsGiveawayWinnersOption
+    from ._starsrevenuestatus import StarsRevenueStatus, TypeStarsRevenueStatus
+    from ._starssubscription import StarsSubscription, TypeStarsSubscription
+    from ._starssubscriptionpricing import StarsSubscriptionPricing, TypeStarsSubscriptionPricing
+    from ._starstopupoption import StarsTopupOption, TypeStarsTopupOption
+    from ._starstransaction import StarsTransaction, TypeStarsTransaction
+    from ._starstransactionpeer import StarsTransactionPeer, StarsTransactionPeerAPI, StarsTransactionPeerAds, StarsTransactionPeerAppStore, StarsTransactionPeerFragment, StarsTransactionPeerPlayMarket, StarsTransactionPeerPremiumBot, StarsTransactionPeerUnsupported, TypeStarsTransactionPeer
+    from ._statsabsvalueandprev import StatsAbsValueAndPrev, TypeStatsAbsValueAndPrev
+    from ._statsdaterangedays import StatsDateRangeDays, TypeStatsDateRangeDays
+    from ._statsgraph import StatsGraph, StatsGraphAsync, StatsGraphError, TypeStatsGraph
+    from ._statsgrouptopadmin import StatsGroupTopAdmin, TypeStatsGroupTopAdmin
+    from ._statsgrouptopinviter import StatsGroupTopInviter, TypeStatsGroupTopInviter
+    from ._statsgrouptopposter import StatsGroupTopPoster, TypeStatsGroupTopPoster
+    from ._statspercentvalue import StatsPercentValue, TypeStatsPercentValue
+    from ._statsurl import StatsURL, TypeStatsURL
+    from ._stickerkeyword import StickerKeyword, TypeStickerKeyword
+    from ._stickerpack import StickerPack, TypeStickerPack
+    from ._stickerset import StickerSet, TypeStickerSet
+    from ._stickersetcovered import StickerSetCovered, StickerSetFullCovered, StickerSetMultiCovered, StickerSetNoCovered, TypeStickerSetCovered
+    from ._storiesstealthmode import StoriesStealthMode, TypeStoriesStealthMode
+    from ._storyfwdheader import StoryFwdHeader, TypeStoryFwdHeader
+    from ._storyitem import StoryItem, StoryItemDeleted, StoryItemSkipped, TypeStoryItem
+    from ._storyreaction import StoryReaction, StoryReactionPublicForward, StoryReactionPublicRepost, TypeStoryReaction
+    from ._storyview import StoryView, StoryViewPublicForward, StoryViewPublicRepost, TypeStoryView
+    from ._storyviews import StoryViews, TypeStoryViews
+    from ._textwithentities import TextWithEntities, TypeTextWithEntities
+    from ._theme import Theme, TypeTheme
+    from ._themesettings import ThemeSettings, TypeThemeSettings
+    from ._timezone import Timezone, TypeTimezone
+    from ._tlsblock import TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockRandom, TlsBlockScope, TlsBlockString, TlsBlockZero, TypeTlsBlock
+    from ._tlsclienthello import TlsClientHello, TypeTlsClientHello
+    from ._toppeer import TopPeer, TypeTopPeer
+    from ._toppeercategory import TopPeerCategoryBotsApp, TopPeerCategoryBotsInline, TopPeerCategoryBotsPM, TopPeerCategoryChannels, TopPeerCategoryCorrespondents, TopPeerCategoryForwardChats, TopPeerCategoryForwardUsers, TopPeerCategoryGroups, TopPeerCategoryPhoneCalls, TypeTopPeerCategory
+    from ._toppeercategorypeers import TopPeerCategoryPeers, TypeTopPeerCategoryPeers
+    from ._update import TypeUpdate, UpdateAttachMenuBots, UpdateAutoSaveSettings, UpdateBotBusinessConnect, UpdateBotCallbackQuery, UpdateBotChatBoost, UpdateBotChatInviteRequester, UpdateBotCommands, UpdateBotDeleteBusinessMessage, UpdateBotEditBusinessMessage, UpdateBotInlineQuery, UpdateBotInlineSend, UpdateBotMenuButton, UpdateBotMessageReaction, UpdateBotMessageReactions, UpdateBotNewBusinessMessage, UpdateBotPrecheckoutQuery, UpdateBotPurchasedPaidMedia, UpdateBotShippingQuery, UpdateBotStopped, UpdateBotWebhookJSON, UpdateBotWebhookJSONQuery, UpdateBroadcastRevenueTransactions, UpdateBusinessBotCallbackQuery, UpdateChannel, UpdateChannelAvailableMessages, UpdateChannelMessageForwards, UpdateChannelMessageViews, UpdateChannelParticipant, UpdateChannelPinnedTopic, UpdateChannelPinnedTopics, UpdateChannelReadMessagesContents, UpdateChannelTooLong, UpdateChannelUserTyping, UpdateChannelViewForumAsMessages, UpdateChannelWebPage, UpdateChat, UpdateChatDefaultBannedRights, UpdateChatParticipant, UpdateChatParticipantAdd, UpdateChatParticipantAdmin, UpdateChatParticipantDelete, UpdateChatParticipants, UpdateChatUserTyping, UpdateConfig, UpdateContactsReset, UpdateDcOptions, UpdateDeleteChannelMessages, UpdateDeleteMessages, UpdateDeleteQuickReply, UpdateDeleteQuickReplyMessages, UpdateDeleteScheduledMessages, UpdateDialogFilter, UpdateDialogFilterOrder, UpdateDialogFilters, UpdateDialogPinned, UpdateDialogUnreadMark, UpdateDraftMessage, UpdateEditChannelMessage, UpdateEditMessage, UpdateEncryptedChatTyping, UpdateEncryptedMessagesRead, UpdateEncryption, UpdateFavedStickers, UpdateFolderPeers, UpdateGeoLiveViewed, UpdateGroupCall, UpdateGroupCallConnection, UpdateGroupCallParticipants, UpdateInlineBotCallbackQuery, UpdateLangPack, UpdateLangPackTooLong, UpdateLoginToken, UpdateMessageExtendedMedia, UpdateMessageID, UpdateMessagePoll, UpdateMessagePollVote, UpdateMessageReactions, UpdateMoveStickerSetToTop, UpdateNewAuthorization, UpdateNewChannelMessage, UpdateNewEncryptedMessage, UpdateNewMessage, UpdateNewQuickReply, UpdateNewScheduledMessage, UpdateNewStickerSet, UpdateNewStoryReaction, UpdateNotifySettings, UpdatePaidReactionPrivacy, UpdatePeerBlocked, UpdatePeerHistoryTTL, UpdatePeerLocated, UpdatePeerSettings, UpdatePeerWallpaper, UpdatePendingJoinRequests, UpdatePhoneCall, UpdatePhoneCallSignalingData, UpdatePinnedChannelMessages, UpdatePinnedDialogs, UpdatePinnedMessages, UpdatePinnedSavedDialogs, UpdatePrivacy, UpdatePtsChanged, UpdateQuickReplies, UpdateQuickReplyMessage, UpdateReadChannelDiscussionInbox, UpdateReadChannelDiscussionOutbox, UpdateReadChannelInbox, UpdateReadChannelOutbox, UpdateReadFeaturedEmojiStickers, UpdateReadFeaturedStickers, UpdateReadHistoryInbox, UpdateReadHistoryOutbox, UpdateReadMessagesContents, UpdateReadStories, UpdateRecentEmojiStatuses, UpdateRecentReactions, UpdateRecentStickers, UpdateSavedDialogPinned, UpdateSavedGifs, UpdateSavedReactionTags, UpdateSavedRingtones, UpdateSentPhoneCode, UpdateSentStoryReaction, UpdateServiceNotification, UpdateSmsJob, UpdateStarsBalance, UpdateStarsRevenueStatus, UpdateStickerSets, UpdateStickerSetsOrder, UpdateStoriesStealthMode, UpdateStory, UpdateStoryID, UpdateTheme, UpdateTranscribedAudio, UpdateUser, UpdateUserEmojiStatus, UpdateUserName, UpdateUserPhone, UpdateUserStatus, UpdateUserTyping, UpdateWebPage, UpdateWebViewResultSent
+    from ._updates import TypeUpdates, UpdateShort, UpdateShortChatMessage, UpdateShortMessage, UpdateShortSentMessage, Updates, UpdatesCombined, UpdatesTooLong
+    from ._urlauthresult import TypeUrlAuthResult, UrlAuthResultAccepted, UrlAuthResultDefault, UrlAuthResultRequest
+    from ._user import TypeUser, User, UserEmpty
+    from ._userfull import TypeUserFull, UserFull
+    from ._username import TypeUsername, Username
+    from ._userprofilephoto import TypeUserProfilePhoto, UserProfilePhoto, UserProfilePhotoEmpty
+    from ._userstatus import TypeUserStatus, UserStatusEmpty, UserStatusLastMonth, UserStatusLastWeek, UserStatusOffline, UserStatusOnline, UserStatusRecently
+    from ._videosize import TypeVideoSize, VideoSize, VideoSizeEmojiMarkup, VideoSizeStickerMarkup
+    from ._wallpaper import TypeWallPaper, WallPaper, WallPaperNoFile
+    from ._wallpapersettings import TypeWallPaperSettings, WallPaperSettings
+    from ._webauthorization import TypeWebAuthorization, WebAuthorization
+    from ._webdocument import TypeWebDocument, WebDocument, WebDocumentNoProxy
+    from ._webpage import TypeWebPage, WebPage, WebPageEmpty, WebPageNotModified, WebPagePending
+    from ._webpageattribute import TypeWebPageAttribute, WebPageAttributeStickerSet, WebPageAttributeStory, WebPageAttributeTheme, WebPageAttributeUniqueStarGift
+    from ._webviewmessagesent import TypeWebViewMessageSent, WebViewMessageSent
+    from ._webviewresult import TypeWebViewResult, WebViewResultUrl
+
+_namespaces = ('account', 'auth', 'bots', 'channels', 'chatlists', 'contacts', 'fragment', 'help', 'messages', 'payments', 'phone', 'photos', 'premium', 'smsjobs', 'stats', 'stickers', 'storage', 'stories', 'updates', 'upload', 'users')
+_modules = {
+    'AccessPointRule': '._accesspointrule',
+    'AccountDaysTTL': '._accountdaysttl',
+    'AttachMenuBot': '._attachmenubot',
+    'AttachMenuBotIcon': '._attachmenuboticon',
+    'AttachMenuBotIconColor': '._attachmenuboticoncolor',
+    'AttachMenuBots': '._attachmenubots',
+    'AttachMenuBotsBot': '._attachmenubotsbot',
+    'AttachMenuBotsNotModified': '._attachmenubots',
+    'AttachMenuPeerTypeBotPM': '._attachmenupeertype',
+    'AttachMenuPeerTypeBroadcast': '._attachmenupeertype',
+    'AttachMenuPeerTypeChat': '._attachmenupeertype',
+    'AttachMenuPeerTypePM': '._attachmenupeertype',
+    'AttachMenuPeerTypeSameBotPM': '._attachmenupeertype',
+    'Authorization': '._authorization',
+    'AutoDownloadSettings': '._autodownloadsettings',
+    'AutoSaveException': '._autosaveexception',
+    'AutoSaveSettings': '._autosavesettings',
+    'AvailableEffect': '._availableeffect',
+    'AvailableReaction': '._availablereaction',
+    'BadMsgNotification': '._badmsgnotification',
+    'BadServerSalt': '._badmsgnotification',
+    'BankCardOpenUrl': '._bankcardopenurl',
+    'BaseThemeArctic': '._basetheme',
+    'BaseThemeClassic': '._basetheme',
+    'BaseThemeDay': '._basetheme',
+    'BaseThemeNight': '._basetheme',
+    'BaseThemeTinted': '._basetheme',
+    'BindAuthKeyInner': '._bindauthkeyinner',
+    'Birthday': '._birthday',
+    'Boost': '._boost',
+    'BotApp': '._botapp',
+    'BotAppNotModified': '._botapp',
+    'BotAppSettings': '._botappsettings',
+    'BotBusinessConnection': '._botbusinessconnection',
+    'BotCommand': '._botcommand',
+    'BotCommandScopeChatAdmins': '._botcommandscope',
+    'BotCommandScopeChats': '._botcommandscope',
+    'BotCommandScopeDefault': '._botcommandscope',
+    'BotCommandScopePeer': '._botcommandscope',
+    'BotCommandScopePeerAdmins': '._botcommandscope',
+    'BotCommandScopePeerUser': '._botcommandscope',
+    'BotCommandScopeUsers': '._botcommandscope',
+    'BotInfo': '._botinfo',
+    'BotInlineMediaResult': '._botinlineresult',
+    'BotInlineMessageMediaAuto': '._botinlinemessage',
+    'BotInlineMessageMediaContact': '._botinlinemessage',
+    'BotInlineMessageMediaGeo': '._botinlinemessage',
+    'BotInlineMessageMediaInvoice': '._botinlinemessage',
+    'BotInlineMessageMediaVenue': '._botinlinemessage',
+    'BotInlineMessageMediaWebPage': '._botinlinemessage',
+    'BotInlineMessageText': '._botinlinemessage',
+    'BotInlineResult': '._botinlineresult',
+    'BotMenuButton': '._botmenubutton',
+    'BotMenuButtonCommands': '._botmenubutton',
+    'BotMenuButtonDefault': '._botmenubutton',
+    'BotPreviewMedia': '._botpreviewmedia',
+    'BotVerification': '._botverification',
+    'BotVerifierSettings': '._botverifiersettings',
+    'BroadcastRevenueBalances': '._broadcastrevenuebalances',
+    'BroadcastRevenueTransactionProceeds': '._broadcastrevenuetransaction',
+    'BroadcastRevenueTransactionRefund': '._broadcastrevenuetransaction',
+    'BroadcastRevenueTransactionWithdrawal': '._broadcastrevenuetransaction',
+    'BusinessAwayMessage': '._businessawaymessage',
+    'BusinessAwayMessageScheduleAlways': '._businessawaymessageschedule',
+    'BusinessAwayMessageScheduleCustom': '._businessawaymessageschedule',
+    'BusinessAwayMessageScheduleOutsideWorkHours': '._businessawaymessageschedule',
+    'BusinessBotRecipients': '._businessbotrecipients',
+    'BusinessBotRights': '._businessbotrights',
+    'BusinessChatLink': '._businesschatlink',
+    'BusinessGreetingMessage': '._businessgreetingmessage',
+    'BusinessIntro': '._businessintro',
+    'BusinessLocation': '._businesslocation',
+    'BusinessRecipients': '._businessrecipients',
+    'BusinessWeeklyOpen': '._businessweeklyopen',
+    'BusinessWorkHours': '._businessworkhours',
+    'CdnConfig': '._cdnconfig',
+    'CdnPublicKey': '._cdnpublickey',
+    'Channel': '._chat',
+    'ChannelAdminLogEvent': '._channeladminlogevent',
+    'ChannelAdminLogEventActionChangeAbout': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeAvailableReactions': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeEmojiStatus': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeEmojiStickerSet': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeHistoryTTL': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeLinkedChat': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeLocation': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangePeerColor': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangePhoto': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeProfilePeerColor': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeStickerSet': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeTitle': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeUsername': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeUsernames': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionChangeWallpaper': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionCreateTopic': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionDefaultBannedRights': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionDeleteMessage': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionDeleteTopic': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionDiscardGroupCall': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionEditMessage': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionEditTopic': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionExportedInviteDelete': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionExportedInviteEdit': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionExportedInviteRevoke': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantInvite': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantJoin': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantJoinByInvite': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantJoinByRequest': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantLeave': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantMute': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantSubExtend': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantToggleAdmin': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantToggleBan': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantUnmute': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionParticipantVolume': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionPinTopic': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionSendMessage': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionStartGroupCall': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionStopPoll': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleAntiSpam': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleForum': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleGroupCallSetting': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleInvites': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleNoForwards': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionTogglePreHistoryHidden': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleSignatureProfiles': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleSignatures': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionToggleSlowMode': '._channeladminlogeventaction',
+    'ChannelAdminLogEventActionUpdatePinned': '._channeladminlogeventaction',
+    'ChannelAdminLogEventsFilter': '._channeladminlogeventsfilter',
+    'ChannelForbidden': '._chat',
+    'ChannelFull': '._chatfull',
+    'ChannelLocation': '._channellocation',
+    'ChannelLocationEmpty': '._channellocation',
+    'ChannelMessagesFilter': '._channelmessagesfilter',
+    'ChannelMessagesFilterEmpty': '._channelmessagesfilter',
+    'ChannelParticipant': '._channelparticipant',
+    'ChannelParticipantAdmin': '._channelparticipant',
+    'ChannelParticipantBanned': '._channelparticipant',
+    'ChannelParticipantCreator': '._channelparticipant',
+    'ChannelParticipantLeft': '._channelparticipant',
+    'ChannelParticipantSelf': '._channelparticipant',
+    'ChannelParticipantsAdmins': '._channelparticipantsfilter',
+    'ChannelParticipantsBanned': '._channelparticipantsfilter',
+    'ChannelParticipantsBots': '._channelparticipantsfilter',
+    'ChannelParticipantsContacts': '._channelparticipantsfilter',
+    'ChannelParticipantsKicked': '._channelparticipantsfilter',
+    'ChannelParticipantsMentions': '._channelparticipantsfilter',
+    'ChannelParticipantsRecent': '._channelparticipantsfilter',
+    'ChannelParticipantsSearch': '._channelparticipantsfilter',
+    'Chat': '._chat',
+    'ChatAdminRights': '._chatadminrights',
+    'ChatAdminWithInvites': '._chatadminwithinvites',
+    'ChatBannedRights': '._chatbannedrights',
+    'ChatEmpty': '._chat',
+    'ChatForbidden': '._chat',
+    'ChatFull': '._chatfull',
+    'ChatInvite': '._chatinvite',
+    'ChatInviteAlready': '._chatinvite',
+    'ChatInviteExported': '._exportedchatinvite',
+    'ChatInviteImporter': '._chatinviteimporter',
+    'ChatInvitePeek': '._chatinvite',
+    'ChatInvitePublicJoinRequests': '._exportedchatinvite',
+    'ChatOnlines': '._chatonlines',
+    'ChatParticipant': '._chatparticipant',
+    'ChatParticipantAdmin': '._chatparticipant',
+    'ChatParticipantCreator': '._chatparticipant',
+    'ChatParticipants': '._chatparticipants',
+    'ChatParticipantsForbidden': '._chatparticipants',
+    'ChatPhoto': '._chatphoto',
+    'ChatPhotoEmpty': '._chatphoto',
+    'ChatReactionsAll': '._chatreactions',
+    'ChatReactionsNone': '._chatreactions',
+    'ChatReactionsSome': '._chatreactions',
+    'ClientDHInnerData': '._client_dh_inner_data',
+    'CodeSettings': '._codesettings',
+    'Config': '._config',
+    'ConnectedBot': '._connectedbot',
+    'ConnectedBotStarRef': '._connectedbotstarref',
+    'Contact': '._contact',
+    'ContactBirthday': '._contactbirthday',
+    'ContactStatus': '._contactstatus',
+    'DataJSON': '._datajson',
+    'DcOption': '._dcoption',
+    'DefaultHistoryTTL': '._defaulthistoryttl',
+    'DestroyAuthKeyFail': '._destroyauthkeyres',
+    'DestroyAuthKeyNone': '._destroyauthkeyres',
+    'DestroyAuthKeyOk': '._destroyauthkeyres',
+    'DestroySessionNone': '._destroysessionres',
+    'DestroySessionOk': '._destroysessionres',
+    'DhGenFail': '._set_client_dh_params_answer',
+    'DhGenOk': '._set_client_dh_params_answer',
+    'DhGenRetry': '._set_client_dh_params_answer',
+    'Dialog': '._dialog',
+    'DialogFilter': '._dialogfilter',
+    'DialogFilterChatlist': '._dialogfilter',
+    'DialogFilterDefault': '._dialogfilter',
+    'DialogFilterSuggested': '._dialogfiltersuggested',
+    'DialogFolder': '._dialog',
+    'DialogPeer': '._dialogpeer',
+    'DialogPeerFolder': '._dialogpeer',
+    'DisallowedGiftsSettings': '._disallowedgiftssettings',
+    'Document': '._document',
+    'DocumentAttributeAnimated': '._documentattribute',
+    'DocumentAttributeAudio': '._documentattribute',
+    'DocumentAttributeCustomEmoji': '._documentattribute',
+    'DocumentAttributeFilename': '._documentattribute',
+    'DocumentAttributeHasStickers': '._documentattribute',
+    'DocumentAttributeImageSize': '._documentattribute',
+    'DocumentAttributeSticker': '._documentattribute',
+    'DocumentAttributeVideo': '._documentattribute',
+    'DocumentEmpty': '._document',
+    'DraftMessage': '._draftmessage',
+    'DraftMessageEmpty': '._draftmessage',
+    'EmailVerificationApple': '._emailverification',
+    'EmailVerificationCode': '._emailverification',
+    'EmailVerificationGoogle': '._emailverification',
+    'EmailVerifyPurposeLoginChange': '._emailverifypurpose',
+    'EmailVerifyPurposeLoginSetup': '._emailverifypurpose',
+    'EmailVerifyPurposePassport': '._emailverifypurpose',
+    'EmojiGroup': '._emojigroup',
+    'EmojiGroupGreeting': '._emojigroup',
+    'EmojiGroupPremium': '._emojigroup',
+    'EmojiKeyword': '._emojikeyword',
+    'EmojiKeywordDeleted': '._emojikeyword',
+    'EmojiKeywordsDifference': '._emojikeywordsdifference',
+    'EmojiLanguage': '._emojilanguage',
+    'EmojiList': '._emojilist',
+    'EmojiListNotModified': '._emojilist',
+    'EmojiStatus': '._emojistatus',
+    'EmojiStatusCollectible': '._emojistatus',
+    'EmojiStatusEmpty': '._emojistatus',
+    'EmojiURL': '._emojiurl',
+    'EncryptedChat': '._encryptedchat',
+    'EncryptedChatDiscarded': '._encryptedchat',
+    'EncryptedChatEmpty': '._encryptedchat',
+    'EncryptedChatRequested': '._encryptedchat',
+    'EncryptedChatWaiting': '._encryptedchat',
+    'EncryptedFile': '._encryptedfile',
+    'EncryptedFileEmpty': '._encryptedfile',
+    'EncryptedMessage': '._encryptedmessage',
+    'EncryptedMessageService': '._encryptedmessage',
+    'ExportedChatlistInvite': '._exportedchatlistinvite',
+    'ExportedContactToken': '._exportedcontacttoken',
+    'ExportedMessageLink': '._exportedmessagelink',
+    'ExportedStoryLink': '._exportedstorylink',
+    'FactCheck': '._factcheck',
+    'FileHash': '._filehash',
+    'Folder': '._folder',
+    'FolderPeer': '._folderpeer',
+    'ForumTopic': '._forumtopic',
+    'ForumTopicDeleted': '._forumtopic',
+    'FoundStory': '._foundstory',
+    'FutureSalt': '._futuresalt',
+    'FutureSalts': '._futuresalts',
+    'Game': '._game',
+    'GeoPoint': '._geopoint',
+    'GeoPointAddress': '._geopointaddress',
+    'GeoPointEmpty': '._geopoint',
+    'GlobalPrivacySettings': '._globalprivacysettings',
+    'GroupCall': '._groupcall',
+    'GroupCallDiscarded': '._groupcall',
+    'GroupCallParticipant': '._groupcallparticipant',
+    'GroupCallParticipantVideo': '._groupcallparticipantvideo',
+    'GroupCallParticipantVideoSourceGroup': '._groupcallparticipantvideosourcegroup',
+    'GroupCallStreamChannel': '._groupcallstreamchannel',
+    'HighScore': '._highscore',
+    'HttpWait': '._httpwait',
+    'ImportedContact': '._importedcontact',
+    'InlineBotSwitchPM': '._inlinebotswitchpm',
+    'InlineBotWebView': '._inlinebotwebview',
+    'InlineQueryPeerTypeBotPM': '._inlinequerypeertype',
+    'InlineQueryPeerTypeBroadcast': '._inlinequerypeertype',
+    'InlineQueryPeerTypeChat': '._inlinequerypeertype',
+    'InlineQueryPeerTypeMegagroup': '._inlinequerypeertype',
+    'InlineQueryPeerTypePM': '._inlinequerypeertype',
+    'InlineQueryPeerTypeSameBotPM': '._inlinequerypeertype',
+    'InputAppEvent': '._inputappevent',
+    'InputBotAppID': '._inputbotapp',
+    'InputBotAppShortName': '._inputbotapp',
+    'InputBotInlineMessageGame': '._inputbotinlinemessage',
+    'InputBotInlineMessageID': '._inputbotinlinemessageid',
+    'InputBotInlineMessageID64': '._inputbotinlinemessageid',
+    'InputBotInlineMessageMediaAuto': '._inputbotinlinemessage',
+    'InputBotInlineMessageMediaContact': '._inputbotinlinemessage',
+    'InputBotInlineMessageMediaGeo': '._inputbotinlinemessage',
+    'InputBotInlineMessageMediaInvoice': '._inputbotinlinemessage',
+    'InputBotInlineMessageMediaVenue': '._inputbotinlinemessage',
+    'InputBotInlineMessageMediaWebPage': '._inputbotinlinemessage',
+    'InputBotInlineMessageText': '._inputbotinlinemessage',
+    'InputBotInlineResult': '._inputbotinlineresult',
+    'InputBotInlineResultDocument': '._inputbotinlineresult',
+    'InputBotInlineResultGame': '._inputbotinlineresult',
+    'InputBotInlineResultPhoto': '._inputbotinlineresult',
+    'InputBusinessAwayMessage': '._inputbusinessawaymessage',
+    'InputBusinessBotRecipients': '._inputbusinessbotrecipients',
+    'InputBusinessChatLink': '._inputbusinesschatlink',
+    'InputBusinessGreetingMessage': '._inputbusinessgreetingmessage',
+    'InputBusinessIntro': '._inputbusinessintro',
+    'InputBusinessRecipients': '._inputbusinessrecipients',
+    'InputChannel': '._inputchannel',
+    'InputChannelEmpty': '._inputchannel',
+    'InputChannelFromMessage': '._inputchannel',
+    'InputChatPhoto': '._inputchatphoto',
+    'InputChatPhotoEmpty': '._inputchatphoto',
+    'InputChatUploadedPhoto': '._inputchatphoto',
+    'InputChatlistDialogFilter': '._inputchatlist',
+    'InputCheckPasswordEmpty': '._inputcheckpasswordsrp',
+    'InputCheckPasswordSRP': '._inputcheckpasswordsrp',
+    'InputClientProxy': '._inputclientproxy',
+    'InputCollectiblePhone': '._inputcollectible',
+    'InputCollectibleUsername': '._inputcollectible',
+    'InputDialogPeer': '._inputdialogpeer',
+    'InputDialogPeerFolder': '._inputdialogpeer',
+    'InputDocument': '._inputdocument',
+    'InputDocumentEmpty': '._inputdocument',
+    'InputDocumentFileLocation': '._inputfilelocation',
+    'InputEmojiStatusCollectible': '._emojistatus',
+    'InputEncryptedChat': '._inputencryptedchat',
+    'InputEncryptedFile': '._inputencryptedfile',
+    'InputEncryptedFileBigUploaded': '._inputencryptedfile',
+    'InputEncryptedFileEmpty': '._inputencryptedfile',
+    'InputEncryptedFileLocation': '._inputfilelocation',
+    'InputEncryptedFileUploaded': '._inputencryptedfile',
+    'InputFile': '._inputfile',
+    'InputFileBig': '._inputfile',
+    'InputFileLocation': '._inputfilelocation',
+    'InputFileStoryDocument': '._inputfile',
+    'InputFolderPeer': '._inputfolderpeer',
+    'InputGameID': '._inputgame',
+    'InputGameShortName': '._inputgame',
+    'InputGeoPoint': '._inputgeopoint',
+    'InputGeoPointEmpty': '._inputgeopoint',
+    'InputGroupCall': '._inputgroupcall',
+    'InputGroupCallStream': '._inputfilelocation',
+    'InputInvoiceChatInviteSubscription': '._inputinvoice',
+    'InputInvoiceMessage': '._inputinvoice',
+    'InputInvoicePremiumGiftCode': '._inputinvoice',
+    'InputInvoicePremiumGiftStars': '._inputinvoice',
+    'InputInvoiceSlug': '._inputinvoice',
+    'InputInvoiceStarGift': '._inputinvoice',
+    'InputInvoiceStarGiftTransfer': '._inputinvoice',
+    'InputInvoiceStarGiftUpgrade': '._inputinvoice',
+    'InputInvoiceStars': '._inputinvoice',
+    'InputKeyboardButtonRequestPeer': '._keyboardbutton',
+    'InputKeyboardButtonUrlAuth': '._keyboardbutton',
+    'InputKeyboardButtonUserProfile': '._keyboardbutton',
+    'InputMediaAreaChannelPost': '._mediaarea',
+    'InputMediaAreaVenue': '._mediaarea',
+    'InputMediaContact': '._inputmedia',
+    'InputMediaDice': '._inputmedia',
+    'InputMediaDocument': '._inputmedia',
+    'InputMediaDocumentExternal': '._inputmedia',
+    'InputMediaEmpty': '._inputmedia',
+    'InputMediaGame': '._inputmedia',
+    'InputMediaGeoLive': '._inputmedia',
+    'InputMediaGeoPoint': '._inputmedia',
+    'InputMediaInvoice': '._inputmedia',
+    'InputMediaPaidMedia': '._inputmedia',
+    'InputMediaPhoto': '._inputmedia',
+    'InputMediaPhotoExternal': '._inputmedia',
+    'InputMediaPoll': '._inputmedia',
+    'InputMediaStory': '._inputmedia',
+    'InputMediaUploadedDocument': '._inputmedia',
+    'InputMediaUploadedPhoto': '._inputmedia',
+    'InputMediaVenue': '._inputmedia',
+    'InputMediaWebPage': '._inputmedia',
+    'InputMessageCallbackQuery': '._inputmessage',
+    'InputMessageEntityMentionName': '._messageentity',
+    'InputMessageID': '._inputmessage',
+    'InputMessagePinned': '._inputmessage',
+    'InputMessageReplyTo': '._inputmessage',
+    'InputMessagesFilterChatPhotos': '._messagesfilter',
+    'InputMessagesFilterContacts': '._messagesfilter',
+    'InputMessagesFilterDocument': '._messagesfilter',
+    'InputMessagesFilterEmpty': '._messagesfilter',
+    'InputMessagesFilterGeo': '._messagesfilter',
+    'InputMessagesFilterGif': '._messagesfilter',
+    'InputMessagesFilterMusic': '._messagesfilter',
+    'InputMessagesFilterMyMentions': '._messagesfilter',
+    'InputMessagesFilterPhoneCalls': '._messagesfilter',
+    'InputMessagesFilterPhotoVideo': '._messagesfilter',
+    'InputMessagesFilterPhotos': '._messagesfilter',
+    'InputMessagesFilterPinned': '._messagesfilter',
+    'InputMessagesFilterRoundVideo': '._messagesfilter',
+    'InputMessagesFilterRoundVoice': '._messagesfilter',
+    'InputMessagesFilterUrl': '._messagesfilter',
+    'InputMessagesFilterVideo': '._messagesfilter',
+    'InputMessagesFilterVoice': '._messagesfilter',
+    'InputNotifyBroadcasts': '._inputnotifypeer',
+    'InputNotifyChats': '._inputnotifypeer',
+    'InputNotifyForumTopic': '._inputnotifypeer',
+    'InputNotifyPeer': '._inputnotifypeer',
+    'InputNotifyUsers': '._inputnotifypeer',
+    'InputPaymentCredentials': '._inputpaymentcredentials',
+    'InputPaymentCredentialsApplePay': '._inputpaymentcredentials',
+    'InputPaymentCredentialsGooglePay': '._inputpaymentcredentials',
+    'InputPaymentCredentialsSaved': '._inputpaymentcredentials',
+    'InputPeerChannel': '._inputpeer',
+    'InputPeerChannelFromMessage': '._inputpeer',
+    'InputPeerChat': '._inputpeer',
+    'InputPeerEmpty': '._inputpeer',
+    'InputPeerNotifySettings': '._inputpeernotifysettings',
+    'InputPeerPhotoFileLocation': '._inputfilelocation',
+    'InputPeerSelf': '._inputpeer',
+    'InputPeerUser': '._inputpeer',
+    'InputPeerUserFromMessage': '._inputpeer',
+    'InputPhoneCall': '._inputphonecall',
+    'InputPhoneContact': '._inputcontact',
+    'InputPhoto': '._inputphoto',
+    'InputPhotoEmpty': '._inputphoto',
+    'InputPhotoFileLocation': '._inputfilelocation',
+    'InputPhotoLegacyFileLocation': '._inputfilelocation',
+    'InputPrivacyKeyAbout': '._inputprivacykey',
+    'InputPrivacyKeyAddedByPhone': '._inputprivacykey',
+    'InputPrivacyKeyBirthday': '._inputprivacykey',
+    'InputPrivacyKeyChatInvite': '._inputprivacykey',
+    'InputPrivacyKeyForwards': '._inputprivacykey',
+    'InputPrivacyKeyNoPaidMessages': '._inputprivacykey',
+    'InputPrivacyKeyPhoneCall': '._inputprivacykey',
+    'InputPrivacyKeyPhoneNumber': '._inputprivacykey',
+    'InputPrivacyKeyPhoneP2P': '._inputprivacykey',
+    'InputPrivacyKeyProfilePhoto': '._inputprivacykey',
+    'InputPrivacyKeyStarGiftsAutoSave': '._inputprivacykey',
+    'InputPrivacyKeyStatusTimestamp': '._inputprivacykey',
+    'InputPrivacyKeyVoiceMessages': '._inputprivacykey',
+    'InputPrivacyValueAllowAll': '._inputprivacyrule',
+    'InputPrivacyValueAllowBots': '._inputprivacyrule',
+    'InputPrivacyValueAllowChatParticipants': '._inputprivacyrule',
+    'InputPrivacyValueAllowCloseFriends': '._inputprivacyrule',
+    'InputPrivacyValueAllowContacts': '._inputprivacyrule',
+    'InputPrivacyValueAllowPremium': '._inputprivacyrule',
+    'InputPrivacyValueAllowUsers': '._inputprivacyrule',
+    'InputPrivacyValueDisallowAll': '._inputprivacyrule',
+    'InputPrivacyValueDisallowBots': '._inputprivacyrule',
+    'InputPrivacyValueDisallowChatParticipants': '._inputprivacyrule',
+    'InputPrivacyValueDisallowContacts': '._inputprivacyrule',
+    'InputPrivacyValueDisallowUsers': '._inputprivacyrule',
+    'InputQuickReplyShortcut': '._inputquickreplyshortcut',
+    'InputQuickReplyShortcutId': '._inputquickreplyshortcut',
+    'InputReplyToMessage': '._inputreplyto',
+    'InputReplyToStory': '._inputreplyto',
+    'InputReportReasonChildAbuse': '._reportreason',
+    'InputReportReasonCopyright': '._reportreason',
+    'InputReportReasonFake': '._reportreason',
+    'InputReportReasonGeoIrrelevant': '._reportreason',
+    'InputReportReasonIllegalDrugs': '._reportreason',
+    'InputReportReasonOther': '._reportreason',
+    'InputReportReasonPersonalDetails': '._reportreason',
+    'InputReportReasonPornography': '._reportreason',
+    'InputReportReasonSpam': '._reportreason',
+    'InputReportReasonViolence': '._reportreason',
+    'InputSavedStarGiftChat': '._inputsavedstargift',
+    'InputSavedStarGiftUser': '._inputsavedstargift',
+    'InputSecureFile': '._inputsecurefile',
+    'InputSecureFileLocation': '._inputfilelocation',
+    'InputSecureFileUploaded': '._inputsecurefile',
+    'InputSecureValue': '._inputsecurevalue',
+    'InputSingleMedia': '._inputsinglemedia',
+    'InputStarsTransaction': '._inputstarstransaction',
+    'InputStickerSetAnimatedEmoji': '._inputstickerset',
+    'InputStickerSetAnimatedEmojiAnimations': '._inputstickerset',
+    'InputStickerSetDice': '._inputstickerset',
+    'InputStickerSetEmojiChannelDefaultStatuses': '._inputstickerset',
+    'InputStickerSetEmojiDefaultStatuses': '._inputstickerset',
+    'InputStickerSetEmojiDefaultTopicIcons': '._inputstickerset',
+    'InputStickerSetEmojiGenericAnimations': '._inputstickerset',
+    'InputStickerSetEmpty': '._inputstickerset',
+    'InputStickerSetID': '._inputstickerset',
+    'InputStickerSetItem': '._inputstickersetitem',
+    'InputStickerSetPremiumGifts': '._inputstickerset',
+    'InputStickerSetShortName': '._inputstickerset',
+    'InputStickerSetThumb': '._inputfilelocation',
+    'InputStickeredMediaDocument': '._inputstickeredmedia',
+    'InputStickeredMediaPhoto': '._inputstickeredmedia',
+    'InputStorePaymentAuthCode': '._inputstorepaymentpurpose',
+    'InputStorePaymentGiftPremium': '._inputstorepaymentpurpose',
+    'InputStorePaymentPremiumGiftCode': '._inputstorepaymentpurpose',
+    'InputStorePaymentPremiumGiveaway': '._inputstorepaymentpurpose',
+    'InputStorePaymentPremiumSubscription': '._inputstorepaymentpurpose',
+    'InputStorePaymentStarsGift': '._inputstorepaymentpurpose',
+    'InputStorePaymentStarsGiveaway': '._inputstorepaymentpurpose',
+    'InputStorePaymentStarsTopup': '._inputstorepaymentpurpose',
+    'InputTakeoutFileLocation': '._inputfilelocation',
+    'InputTheme': '._inputtheme',
+    'InputThemeSettings': '._inputthemesettings',
+    'InputThemeSlug': '._inputtheme',
+    'InputUser': '._inputuser',
+    'InputUserEmpty': '._inputuser',
+    'InputUserFromMessage': '._inputuser',
+    'InputUserSelf': '._inputuser',
+    'InputWallPaper': '._inputwallpaper',
+    'InputWallPaperNoFile': '._inputwallpaper',
+    'InputWallPaperSlug': '._inputwallpaper',
+    'InputWebDocument': '._inputwebdocument',
+    'InputWebFileAudioAlbumThumbLocation': '._inputwebfilelocation',
+    'InputWebFileGeoPointLocation': '._inputwebfilelocation',
+    'InputWebFileLocation': '._inputwebfilelocation',
+    'Invoice': '._invoice',
+    'IpPort': '._ipport',
+    'IpPortSecret': '._ipport',
+    'JsonArray': '._jsonvalue',
+    'JsonBool': '._jsonvalue',
+    'JsonNull': '._jsonvalue',
+    'JsonNumber': '._jsonvalue',
+    'JsonObject': '._jsonvalue',
+    'JsonObjectValue': '._jsonobjectvalue',
+    'JsonString': '._jsonvalue',
+    'KeyboardButton': '._keyboardbutton',
+    'KeyboardButtonBuy': '._keyboardbutton',
+    'KeyboardButtonCallback': '._keyboardbutton',
+    'KeyboardButtonCopy': '._keyboardbutton',
+    'KeyboardButtonGame': '._keyboardbutton',
+    'KeyboardButtonRequestGeoLocation': '._keyboardbutton',
+    'KeyboardButtonRequestPeer': '._keyboardbutton',
+    'KeyboardButtonRequestPhone': '._keyboardbutton',
+    'KeyboardButtonRequestPoll': '._keyboardbutton',
+    'KeyboardButtonRow': '._keyboardbuttonrow',
+    'KeyboardButtonSimpleWebView': '._keyboardbutton',
+    'KeyboardButtonSwitchInline': '._keyboardbutton',
+    'KeyboardButtonUrl': '._keyboardbutton',
+    'KeyboardButtonUrlAuth': '._keyboardbutton',
+    'KeyboardButtonUserProfile': '._keyboardbutton',
+    'KeyboardButtonWebView': '._keyboardbutton',
+    'LabeledPrice': '._labeledprice',
+    'LangPackDifference': '._langpackdifference',
+    'LangPackLanguage': '._langpacklanguage',
+    'LangPackString': '._langpackstring',
+    'LangPackStringDeleted': '._langpackstring',
+    'LangPackStringPluralized': '._langpackstring',
+    'MaskCoords': '._maskcoords',
+    'MediaAreaChannelPost': '._mediaarea',
+    'MediaAreaCoordinates': '._mediaareacoordinates',
+    'MediaAreaGeoPoint': '._mediaarea',
+    'MediaAreaStarGift': '._mediaarea',
+    'MediaAreaSuggestedReaction': '._mediaarea',
+    'MediaAreaUrl': '._mediaarea',
+    'MediaAreaVenue': '._mediaarea',
+    'MediaAreaWeather': '._mediaarea',
+    'Message': '._message',
+    'MessageActionBoostApply': '._messageaction',
+    'MessageActionBotAllowed': '._messageaction',
+    'MessageActionChannelCreate': '._messageaction',
+    'MessageActionChannelMigrateFrom': '._messageaction',
+    'MessageActionChatAddUser': '._messageaction',
+    'MessageActionChatCreate': '._messageaction',
+    'MessageActionChatDeletePhoto': '._messageaction',
+    'MessageActionChatDeleteUser': '._messageaction',
+    'MessageActionChatEditPhoto': '._messageaction',
+    'MessageActionChatEditTitle': '._messageaction',
+    'MessageActionChatJoinedByLink': '._messageaction',
+    'MessageActionChatJoinedByRequest': '._messageaction',
+    'MessageActionChatMigrateTo': '._messageaction',
+    'MessageActionContactSignUp': '._messageaction',
+    'MessageActionCustomAction': '._messageaction',
+    'MessageActionEmpty': '._messageaction',
+    'MessageActionGameScore': '._messageaction',
+    'MessageActionGeoProximityReached': '._messageaction',
+    'MessageActionGiftCode': '._messageaction',
+    'MessageActionGiftPremium': '._messageaction',
+    'MessageActionGiftStars': '._messageaction',
+    'MessageActionGiveawayLaunch': '._messageaction',
+    'MessageActionGiveawayResults': '._messageaction',
+    'MessageActionGroupCall': '._messageaction',
+    'MessageActionGroupCallScheduled': '._messageaction',
+    'MessageActionHistoryClear': '._messageaction',
+    'MessageActionInviteToGroupCall': '._messageaction',
+    'MessageActionPaidMessagesPrice': '._messageaction',
+    'MessageActionPaidMessagesRefunded': '._messageaction',
+    'MessageActionPaymentRefunded': '._messageaction',
+    'MessageActionPaymentSent': '._messageaction',
+    'MessageActionPaymentSentMe': '._messageaction',
+    'MessageActionPhoneCall': '._messageaction',
+    'MessageActionPinMessage': '._messageaction',
+    'MessageActionPrizeStars': '._messageaction',
+    'MessageActionRequestedPeer': '._messageaction',
+    'MessageActionRequestedPeerSentMe': '._messageaction',
+    'MessageActionScreenshotTaken': '._messageaction',
+    'MessageActionSecureValuesSent': '._messageaction',
+    'MessageActionSecureValuesSentMe': '._messageaction',
+    'MessageActionSetChatTheme': '._messageaction',
+    'MessageActionSetChatWallPaper': '._messageaction',
+    'MessageActionSetMessagesTTL': '._messageaction',
+    'MessageActionStarGift': '._messageaction',
+    'MessageActionStarGiftUnique': '._messageaction',
+    'MessageActionSuggestProfilePhoto': '._messageaction',
+    'MessageActionTopicCreate': '._messageaction',
+    'MessageActionTopicEdit': '._messageaction',
+    'MessageActionWebViewDataSent': '._messageaction',
+    'MessageActionWebViewDataSentMe': '._messageaction',
+    'MessageEmpty': '._message',
+    'MessageEntityBankCard': '._messageentity',
+    'MessageEntityBlockquote': '._messageentity',
+    'MessageEntityBold': '._messageentity',
+    'MessageEntityBotCommand': '._messageentity',
+    'MessageEntityCashtag': '._messageentity',
+    'MessageEntityCode': '._messageentity',
+    'MessageEntityCustomEmoji': '._messageentity',
+    'MessageEntityEmail': '._messageentity',
+    'MessageEntityHashtag': '._messageentity',
+    'MessageEntityItalic': '._messageentity',
+    'MessageEntityMention': '._messageentity',
+    'MessageEntityMentionName': '._messageentity',
+    'MessageEntityPhone': '._messageentity',
+    'MessageEntityPre': '._messageentity',
+    'MessageEntitySpoiler': '._messageentity',
+    'MessageEntityStrike': '._messageentity',
+    'MessageEntityTextUrl': '._messageentity',
+    'MessageEntityUnderline': '._messageentity',
+    'MessageEntityUnknown': '._messageentity',
+    'MessageEntityUrl': '._messageentity',
+    'MessageExtendedMedia': '._messageextendedmedia',
+    'MessageExtendedMediaPreview': '._messageextendedmedia',
+    'MessageFwdHeader': '._messagefwdheader',
+    'MessageMediaContact': '._messagemedia',
+    'MessageMediaDice': '._messagemedia',
+    'MessageMediaDocument': '._messagemedia',
+    'MessageMediaEmpty': '._messagemedia',
+    'MessageMediaGame': '._messagemedia',
+    'MessageMediaGeo': '._messagemedia',
+    'MessageMediaGeoLive': '._messagemedia',
+    'MessageMediaGiveaway': '._messagemedia',
+    'MessageMediaGiveawayResults': '._messagemedia',
+    'MessageMediaInvoice': '._messagemedia',
+    'MessageMediaPaidMedia': '._messagemedia',
+    'MessageMediaPhoto': '._messagemedia',
+    'MessageMediaPoll': '._messagemedia',
+    'MessageMediaStory': '._messagemedia',
+    'MessageMediaUnsupported': '._messagemedia',
+    'MessageMediaVenue': '._messagemedia',
+    'MessageMediaWebPage': '._messagemedia',
+    'MessagePeerReaction': '._messagepeerreaction',
+    'MessagePeerVote': '._messagepeervote',
+    'MessagePeerVoteInputOption': '._messagepeervote',
+    'MessagePeerVoteMultiple': '._messagepeervote',
+    'MessageRange': '._messagerange',
+    'MessageReactions': '._messagereactions',
+    'MessageReactor': '._messagereactor',
+    'MessageReplies': '._messagereplies',
+    'MessageReplyHeader': '._messagereplyheader',
+    'MessageReplyStoryHeader': '._messagereplyheader',
+    'MessageReportOption': '._messagereportoption',
+    'MessageService': '._message',
+    'MessageViews': '._messageviews',
+    'MissingInvitee': '._missinginvitee',
+    'MsgDetailedInfo': '._msgdetailedinfo',
+    'MsgNewDetailedInfo': '._msgdetailedinfo',
+    'MsgResendReq': '._msgresendreq',
+    'MsgsAck': '._msgsack',
+    'MsgsAllInfo': '._msgsallinfo',
+    'MsgsStateInfo': '._msgsstateinfo',
+    'MsgsStateReq': '._msgsstatereq',
+    'MyBoost': '._myboost',
+    'NearestDc': '._nearestdc',
+    'NewSessionCreated': '._newsession',
+    'NotificationSoundDefault': '._notificationsound',
+    'NotificationSoundLocal': '._notificationsound',
+    'NotificationSoundNone': '._notificationsound',
+    'NotificationSoundRingtone': '._notificationsound',
+    'NotifyBroadcasts': '._notifypeer',
+    'NotifyChats': '._notifypeer',
+    'NotifyForumTopic': '._notifypeer',
+    'NotifyPeer': '._notifypeer',
+    'NotifyUsers': '._notifypeer',
+    'OutboxReadDate': '._outboxreaddate',
+    'PQInnerData': '._p_q_inner_data',
+    'PQInnerDataDc': '._p_q_inner_data',
+    'PQInnerDataTemp': '._p_q_inner_data',
+    'PQInnerDataTempDc': '._p_q_inner_data',
+    'Page': '._page',
+    'PageBlockAnchor': '._pageblock',
+    'PageBlockAudio': '._pageblock',
+    'PageBlockAuthorDate': '._pageblock',
+    'PageBlockBlockquote': '._pageblock',
+    'PageBlockChannel': '._pageblock',
+    'PageBlockCollage': '._pageblock',
+    'PageBlockCover': '._pageblock',
+    'PageBlockDetails': '._pageblock',
+    'PageBlockDivider': '._pageblock',
+    'PageBlockEmbed': '._pageblock',
+    'PageBlockEmbedPost': '._pageblock',
+    'PageBlockFooter': '._pageblock',
+    'PageBlockHeader': '._pageblock',
+    'PageBlockKicker': '._pageblock',
+    'PageBlockList': '._pageblock',
+    'PageBlockMap': '._pageblock',
+    'PageBlockOrderedList': '._pageblock',
+    'PageBlockParagraph': '._pageblock',
+    'PageBlockPhoto': '._pageblock',
+    'PageBlockPreformatted': '._pageblock',
+    'PageBlockPullquote': '._pageblock',
+    'PageBlockRelatedArticles': '._pageblock',
+    'PageBlockSlideshow': '._pageblock',
+    'PageBlockSubheader': '._pageblock',
+    'PageBlockSubtitle': '._pageblock',
+    'PageBlockTable': '._pageblock',
+    'PageBlockTitle': '._pageblock',
+    'PageBlockUnsupported': '._pageblock',
+    'PageBlockVideo': '._pageblock',
+    'PageCaption': '._pagecaption',
+    'PageListItemBlocks': '._pagelistitem',
+    'PageListItemText': '._pagelistitem',
+    'PageListOrderedItemBlocks': '._pagelistordereditem',
+    'PageListOrderedItemText': '._pagelistordereditem',
+    'PageRelatedArticle': '._pagerelatedarticle',
+    'PageTableCell': '._pagetablecell',
+    'PageTableRow': '._pagetablerow',
+    'PaidReactionPrivacyAnonymous': '._paidreactionprivacy',
+    'PaidReactionPrivacyDefault': '._paidreactionprivacy',
+    'PaidReactionPrivacyPeer': '._paidreactionprivacy',
+    'PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow': '._passwordkdfalgo',
+    'PasswordKdfAlgoUnknown': '._passwordkdfalgo',
+    'PaymentCharge': '._paymentcharge',
+    'PaymentFormMethod': '._paymentformmethod',
+    'PaymentRequestedInfo': '._paymentrequestedinfo',
+    'PaymentSavedCredentialsCard': '._paymentsavedcredentials',
+    'PeerBlocked': '._peerblocked',
+    'PeerChannel': '._peer',
+    'PeerChat': '._peer',
+    'PeerColor': '._peercolor',
+    'PeerLocated': '._peerlocated',
+    'PeerNotifySettings': '._peernotifysettings',
+    'PeerSelfLocated': '._peerlocated',
+    'PeerSettings': '._peersettings',
+    'PeerStories': '._peerstories',
+    'PeerUser': '._peer',
+    'PhoneCall': '._phonecall',
+    'PhoneCallAccepted': '._phonecall',
+    'PhoneCallDiscardReasonAllowGroupCall': '._phonecalldiscardreason',
+    'PhoneCallDiscardReasonBusy': '._phonecalldiscardreason',
+    'PhoneCallDiscardReasonDisconnect': '._phonecalldiscardreason',
+    'PhoneCallDiscardReasonHangup': '._phonecalldiscardreason',
+    'PhoneCallDiscardReasonMissed': '._phonecalldiscardreason',
+    'PhoneCallDiscarded': '._phonecall',
+    'PhoneCallEmpty': '._phonecall',
+    'PhoneCallProtocol': '._phonecallprotocol',
+    'PhoneCallRequested': '._phonecall',
+    'PhoneCallWaiting': '._phonecall',
+    'PhoneConnection': '._phoneconnection',
+    'PhoneConnectionWebrtc': '._phoneconnection',
+    'Photo': '._photo',
+    'PhotoCachedSize': '._photosize',
+    'PhotoEmpty': '._photo',
+    'PhotoPathSize': '._photosize',
+    'PhotoSize': '._photosize',
+    'PhotoSizeEmpty': '._photosize',
+    'PhotoSizeProgressive': '._photosize',
+    'PhotoStrippedSize': '._photosize',
+    'Poll': '._poll',
+    'PollAnswer': '._pollanswer',
+    'PollAnswerVoters': '._pollanswervoters',
+    'PollResults': '._pollresults',
+    'Pong': '._pong',
+    'PopularContact': '._popularcontact',
+    'PostAddress': '._postaddress',
+    'PostInteractionCountersMessage': '._postinteractioncounters',
+    'PostInteractionCountersStory': '._postinteractioncounters',
+    'PremiumGiftCodeOption': '._premiumgiftcodeoption',
+    'PremiumSubscriptionOption': '._premiumsubscriptionoption',
+    'PrepaidGiveaway': '._prepaidgiveaway',
+    'PrepaidStarsGiveaway': '._prepaidgiveaway',
+    'PrivacyKeyAbout': '._privacykey',
+    'PrivacyKeyAddedByPhone': '._privacykey',
+    'PrivacyKeyBirthday': '._privacykey',
+    'PrivacyKeyChatInvite': '._privacykey',
+    'PrivacyKeyForwards': '._privacykey',
+    'PrivacyKeyNoPaidMessages': '._privacykey',
+    'PrivacyKeyPhoneCall': '._privacykey',
+    'PrivacyKeyPhoneNumber': '._privacykey',
+    'PrivacyKeyPhoneP2P': '._privacykey',
+    'PrivacyKeyProfilePhoto': '._privacykey',
+    'PrivacyKeyStarGiftsAutoSave': '._privacykey',
+    'PrivacyKeyStatusTimestamp': '._privacykey',
+    'PrivacyKeyVoiceMessages': '._privacykey',
+    'PrivacyValueAllowAll': '._privacyrule',
+    'PrivacyValueAllowBots': '._privacyrule',
+    'PrivacyValueAllowChatParticipants': '._privacyrule',
+    'PrivacyValueAllowCloseFriends': '._privacyrule',
+    'PrivacyValueAllowContacts': '._privacyrule',
+    'PrivacyValueAllowPremium': '._privacyrule',
+    'PrivacyValueAllowUsers': '._privacyrule',
+    'PrivacyValueDisallowAll': '._privacyrule',
+    'PrivacyValueDisallowBots': '._privacyrule',
+    'PrivacyValueDisallowChatParticipants': '._privacyrule',
+    'PrivacyValueDisallowContacts': '._privacyrule',
+    'PrivacyValueDisallowUsers': '._privacyrule',
+    'PublicForwardMessage': '._publicforward',
+    'PublicForwardStory': '._publicforward',
+    'QuickReply': '._quickreply',
+    'ReactionCount': '._reactioncount',
+    'ReactionCustomEmoji': '._reaction',
+    'ReactionEmoji': '._reaction',
+    'ReactionEmpty': '._reaction',
+    'ReactionNotificationsFromAll': '._reactionnotificationsfrom',
+    'ReactionNotificationsFromContacts': '._reactionnotificationsfrom',
+    'ReactionPaid': '._reaction',
+    'ReactionsNotifySettings': '._reactionsnotifysettings',
+    'ReadParticipantDate': '._readparticipantdate',
+    'ReceivedNotifyMessage': '._receivednotifymessage',
+    'RecentMeUrlChat': '._recentmeurl',
+    'RecentMeUrlChatInvite': '._recentmeurl',
+    'RecentMeUrlStickerSet': '._recentmeurl',
+    'RecentMeUrlUnknown': '._recentmeurl',
+    'RecentMeUrlUser': '._recentmeurl',
+    'ReplyInlineMarkup': '._replymarkup',
+    'ReplyKeyboardForceReply': '._replymarkup',
+    'ReplyKeyboardHide': '._replymarkup',
+    'ReplyKeyboardMarkup': '._replymarkup',
+    'ReportResultAddComment': '._reportresult',
+    'ReportResultChooseOption': '._reportresult',
+    'ReportResultReported': '._reportresult',
+    'RequestPeerTypeBroadcast': '._requestpeertype',
+    'RequestPeerTypeChat': '._requestpeertype',
+    'RequestPeerTypeUser': '._requestpeertype',
+    'RequestedPeerChannel': '._requestedpeer',
+    'RequestedPeerChat': '._requestedpeer',
+    'RequestedPeerUser': '._requestedpeer',
+    'RequirementToContactEmpty': '._requirementtocontact',
+    'RequirementToContactPaidMessages': '._requirementtocontact',
+    'RequirementToContactPremium': '._requirementtocontact',
+    'ResPQ': '._respq',
+    'RestrictionReason': '._restrictionreason',
+    'RpcAnswerDropped': '._rpcdropanswer',
+    'RpcAnswerDroppedRunning': '._rpcdropanswer',
+    'RpcAnswerUnknown': '._rpcdropanswer',
+    'RpcError': '._rpcerror',
+    'SavedDialog': '._saveddialog',
+    'SavedPhoneContact': '._savedcontact',
+    'SavedReactionTag': '._savedreactiontag',
+    'SavedStarGift': '._savedstargift',
+    'SearchResultPosition': '._searchresultsposition',
+    'SearchResultsCalendarPeriod': '._searchresultscalendarperiod',
+    'SecureCredentialsEncrypted': '._securecredentialsencrypted',
+    'SecureData': '._securedata',
+    'SecureFile': '._securefile',
+    'SecureFileEmpty': '._securefile',
+    'SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000': '._securepasswordkdfalgo',
+    'SecurePasswordKdfAlgoSHA512': '._securepasswordkdfalgo',
+    'SecurePasswordKdfAlgoUnknown': '._securepasswordkdfalgo',
+    'SecurePlainEmail': '._secureplaindata',
+    'SecurePlainPhone': '._secureplaindata',
+    'SecureRequiredType': '._securerequiredtype',
+    'SecureRequiredTypeOneOf': '._securerequiredtype',
+    'SecureSecretSettings': '._securesecretsettings',
+    'SecureValue': '._securevalue',
+    'SecureValueError': '._securevalueerror',
+    'SecureValueErrorData': '._securevalueerror',
+    'SecureValueErrorFile': '._securevalueerror',
+    'SecureValueErrorFiles': '._securevalueerror',
+    'SecureValueErrorFrontSide': '._securevalueerror',
+    'SecureValueErrorReverseSide': '._securevalueerror',
+    'SecureValueErrorSelfie': '._securevalueerror',
+    'SecureValueErrorTranslationFile': '._securevalueerror',
+    'SecureValueErrorTranslationFiles': '._securevalueerror',
+    'SecureValueHash': '._securevaluehash',
+    'SecureValueTypeAddress': '._securevaluetype',
+    'SecureValueTypeBankStatement': '._securevaluetype',
+    'SecureValueTypeDriverLicense': '._securevaluetype',
+    'SecureValueTypeEmail': '._securevaluetype',
+    'SecureValueTypeIdentityCard': '._securevaluetype',
+    'SecureValueTypeInternalPassport': '._securevaluetype',
+    'SecureValueTypePassport': '._securevaluetype',
+    'SecureValueTypePassportRegistration': '._securevaluetype',
+    'SecureValueTypePersonalDetails': '._securevaluetype',
+    'SecureValueTypePhone': '._securevaluetype',
+    'SecureValueTypeRentalAgreement': '._securevaluetype',
+    'SecureValueTypeTemporaryRegistration': '._securevaluetype',
+    'SecureValueTypeUtilityBill': '._securevaluetype',
+    'SendAsPeer': '._sendaspeer',
+    'SendMessageCancelAction': '._sendmessageaction',
+    'SendMessageChooseContactAction': '._sendmessageaction',
+    'SendMessageChooseStickerAction': '._sendmessageaction',
+    'SendMessageEmojiInteraction': '._sendmessageaction',
+    'SendMessageEmojiInteractionSeen': '._sendmessageaction',
+    'SendMessageGamePlayAction': '._sendmessageaction',
+    'SendMessageGeoLocationAction': '._sendmessageaction',
+    'SendMessageHistoryImportAction': '._sendmessageaction',
+    'SendMessageRecordAudioAction': '._sendmessageaction',
+    'SendMessageRecordRoundAction': '._sendmessageaction',
+    'SendMessageRecordVideoAction': '._sendmessageaction',
+    'SendMessageTypingAction': '._sendmessageaction',
+    'SendMessageUploadAudioAction': '._sendmessageaction',
+    'SendMessageUploadDocumentAction': '._sendmessageaction',
+    'SendMessageUploadPhotoAction': '._sendmessageaction',
+    'SendMessageUploadRoundAction': '._sendmessageaction',
+    'SendMessageUploadVideoAction': '._sendmessageaction',
+    'ServerDHInnerData': '._server_dh_inner_data',
+    'ServerDHParamsFail': '._server_dh_params',
+    'ServerDHParamsOk': '._server_dh_params',
+    'ShippingOption': '._shippingoption',
+    'SmsJob': '._smsjob',
+    'SpeakingInGroupCallAction': '._sendmessageaction',
+    'SponsoredMessage': '._sponsoredmessage',
+    'SponsoredMessageReportOption': '._sponsoredmessagereportoption',
+    'SponsoredPeer': '._sponsoredpeer',
+    'StarGift': '._stargift',
+    'StarGiftAttributeBackdrop': '._stargiftattribute',
+    'StarGiftAttributeModel': '._stargiftattribute',
+    'StarGiftAttributeOriginalDetails': '._stargiftattribute',
+    'StarGiftAttributePattern': '._stargiftattribute',
+    'StarGiftUnique': '._stargift',
+    'StarRefProgram': '._starrefprogram',
+    'StarsAmount': '._starsamount',
+    'StarsGiftOption': '._starsgiftoption',
+    'StarsGiveawayOption': '._starsgiveawayoption',
+    'StarsGiveawayWinnersOption': '._starsgiveawaywinnersoption',
+    'StarsRevenueStatus': '._starsrevenuestatus',
+    'StarsSubscription': '._starssubscription',
+    'StarsSubscriptionPricing': '._starssubscriptionpricing',
+    'StarsTopupOption': '._starstopupoption',
+    'StarsTransaction': '._starstransaction',
+    'StarsTransactionPeer': '._starstransactionpeer',
+    'StarsTransactionPeerAPI': '._starstransactionpeer',
+    'StarsTransactionPeerAds': '._starstransactionpeer',
+    'StarsTransactionPeerAppStore': '._starstransactionpeer',
+    'StarsTransactionPeerFragment': '._starstransactionpeer',
+    'StarsTransactionPeerPlayMarket': '._starstransactionpeer',
+    'StarsTransactionPeerPremiumBot': '._starstransactionpeer',
+    'StarsTransactionPeerUnsupported': '._starstransactionpeer',
+    'StatsAbsValueAndPrev': '._statsabsvalueandprev',
+    'StatsDateRangeDays': '._statsdaterangedays',
+    'StatsGraph': '._statsgraph',
+    'StatsGraphAsync': '._statsgraph',
+    'StatsGraphError': '._statsgraph',
+    'StatsGroupTopAdmin': '._statsgrouptopadmin',
+    'StatsGroupTopInviter': '._statsgrouptopinviter',
+    'StatsGroupTopPoster': '._statsgrouptopposter',
+    'StatsPercentValue': '._statspercentvalue',
+    'StatsURL': '._statsurl',
+    'StickerKeyword': '._stickerkeyword',
+    'StickerPack': '._stickerpack',
+    'StickerSet': '._stickerset',
+    'StickerSetCovered': '._stickersetcovered',
+    'StickerSetFullCovered': '._stickersetcovered',
+    'StickerSetMultiCovered': '._stickersetcovered',
+    'StickerSetNoCovered': '._stickersetcovered',
+    'StoriesStealthMode': '._storiesstealthmode',
+    'StoryFwdHeader': '._storyfwdheader',
+    'StoryItem': '._storyitem',
+    'StoryItemDeleted': '._storyitem',
+    'StoryItemSkipped': '._storyitem',
+    'StoryReaction': '._storyreaction',
+    'StoryReactionPublicForward': '._storyreaction',
+    'StoryReactionPublicRepost': '._storyreaction',
+    'StoryView': '._storyview',
+    'StoryViewPublicForward': '._storyview',
+    'StoryViewPublicRepost': '._storyview',
+    'StoryViews': '._storyviews',
+    'TextAnchor': '._richtext',
+    'TextBold': '._richtext',
+    'TextConcat': '._richtext',
+    'TextEmail': '._richtext',
+    'TextEmpty': '._richtext',
+    'TextFixed': '._richtext',
+    'TextImage': '._richtext',
+    'TextItalic': '._richtext',
+    'TextMarked': '._richtext',
+    'TextPhone': '._richtext',
+    'TextPlain': '._richtext',
+    'TextStrike': '._richtext',
+    'TextSubscript': '._richtext',
+    'TextSuperscript': '._richtext',
+    'TextUnderline': '._richtext',
+    'TextUrl': '._richtext',
+    'TextWithEntities': '._textwithentities',
+    'Theme': '._theme',
+    'ThemeSettings': '._themesettings',
+    'Timezone': '._timezone',
+    'TlsBlockDomain': '._tlsblock',
+    'TlsBlockGrease': '._tlsblock',
+    'TlsBlockPublicKey': '._tlsblock',
+    'TlsBlockRandom': '._tlsblock',
+    'TlsBlockScope': '._tlsblock',
+    'TlsBlockString': '._tlsblock',
+    'TlsBlockZero': '._tlsblock',
+    'TlsClientHello': '._tlsclienthello',
+    'TopPeer': '._toppeer',
+    'TopPeerCategoryBotsApp': '._toppeercategory',
+    'TopPeerCategoryBotsInline': '._toppeercategory',
+    'TopPeerCategoryBotsPM': '._toppeercategory',
+    'TopPeerCategoryChannels': '._toppeercategory',
+    'TopPeerCategoryCorrespondents': '._toppeercategory',
+    'TopPeerCategoryForwardChats': '._toppeercategory',
+    'TopPeerCategoryForwardUsers': '._toppeercategory',
+    'TopPeerCategoryGroups': '._toppeercategory',
+    'TopPeerCategoryPeers': '._toppeercategorypeers',
+    'TopPeerCategoryPhoneCalls': '._toppeercategory',
+    'TypeAccessPointRule': '._accesspointrule',
+    'TypeAccountDaysTTL': '._accountdaysttl',
+    'TypeAttachMenuBot': '._attachmenubot',
+    'TypeAttachMenuBotIcon': '._attachmenuboticon',
+    'TypeAttachMenuBotIconColor': '._attachmenuboticoncolor',
+    'TypeAttachMenuBots': '._attachmenubots',
+    'TypeAttachMenuBotsBot': '._attachmenubotsbot',
+    'TypeAttachMenuPeerType': '._attachmenupeertype',
+    'TypeAuthorization': '._authorization',
+    'TypeAutoDownloadSettings': '._autodownloadsettings',
+    'TypeAutoSaveException': '._autosaveexception',
+    'TypeAutoSaveSettings': '._autosavesettings',
+    'TypeAvailableEffect': '._availableeffect',
+    'TypeAvailableReaction': '._availablereaction',
+    'TypeBadMsgNotification': '._badmsgnotification',
+    'TypeBankCardOpenUrl': '._bankcardopenurl',
+    'TypeBaseTheme': '._basetheme',
+    'TypeBindAuthKeyInner': '._bindauthkeyinner',
+    'TypeBirthday': '._birthday',
+    'TypeBoost': '._boost',
+    'TypeBotApp': '._botapp',
+    'TypeBotAppSettings': '._botappsettings',
+    'TypeBotBusinessConnection': '._botbusinessconnection',
+    'TypeBotCommand': '._botcommand',
+    'TypeBotCommandScope': '._botcommandscope',
+    'TypeBotInfo': '._botinfo',
+    'TypeBotInlineMessage': '._botinlinemessage',
+    'TypeBotInlineResult': '._botinlineresult',
+    'TypeBotMenuButton': '._botmenubutton',
+    'TypeBotPreviewMedia': '._botpreviewmedia',
+    'TypeBotVerification': '._botverification',
+    'TypeBotVerifierSettings': '._botverifiersettings',
+    'TypeBroadcastRevenueBalances': '._broadcastrevenuebalances',
+    'TypeBroadcastRevenueTransaction': '._broadcastrevenuetransaction',
+    'TypeBusinessAwayMessage': '._businessawaymessage',
+    'TypeBusinessAwayMessageSchedule': '._businessawaymessageschedule',
+    'TypeBusinessBotRecipients': '._businessbotrecipients',
+    'TypeBusinessBotRights': '._businessbotrights',
+    'TypeBusinessChatLink': '._businesschatlink',
+    'TypeBusinessGreetingMessage': '._businessgreetingmessage',
+    'TypeBusinessIntro': '._businessintro',
+    'TypeBusinessLocation': '._businesslocation',
+    'TypeBusinessRecipients': '._businessrecipients',
+    'TypeBusinessWeeklyOpen': '._businessweeklyopen',
+    'TypeBusinessWorkHours': '._businessworkhours',
+    'TypeCdnConfig': '._cdnconfig',
+    'TypeCdnPublicKey': '._cdnpublickey',
+    'TypeChannelAdminLogEvent': '._channeladminlogevent',
+    'TypeChannelAdminLogEventAction': '._channeladminlogeventaction',
+    'TypeChannelAdminLogEventsFilter': '._channeladminlogeventsfilter',
+    'TypeChannelLocation': '._channellocation',
+    'TypeChannelMessagesFilter': '._channelmessagesfilter',
+    'TypeChannelParticipant': '._channelparticipant',
+    'TypeChannelParticipantsFilter': '._channelparticipantsfilter',
+    'TypeChat': '._chat',
+    'TypeChatAdminRights': '._chatadminrights',
+    'TypeChatAdminWithInvites': '._chatadminwithinvites',
+    'TypeChatBannedRights': '._chatbannedrights',
+    'TypeChatFull': '._chatfull',
+    'TypeChatInvite': '._chatinvite',
+    'TypeChatInviteImporter': '._chatinviteimporter',
+    'TypeChatOnlines': '._chatonlines',
+    'TypeChatParticipant': '._chatparticipant',
+    'TypeChatParticipants': '._chatparticipants',
+    'TypeChatPhoto': '._chatphoto',
+    'TypeChatReactions': '._chatreactions',
+    'TypeClient_DH_Inner_Data': '._client_dh_inner_data',
+    'TypeCodeSettings': '._codesettings',
+    'TypeConfig': '._config',
+    'TypeConnectedBot': '._connectedbot',
+    'TypeConnectedBotStarRef': '._connectedbotstarref',
+    'TypeContact': '._contact',
+    'TypeContactBirthday': '._contactbirthday',
+    'TypeContactStatus': '._contactstatus',
+    'TypeDataJSON': '._datajson',
+    'TypeDcOption': '._dcoption',
+    'TypeDefaultHistoryTTL': '._defaulthistoryttl',
+    'TypeDestroyAuthKeyRes': '._destroyauthkeyres',
+    'TypeDestroySessionRes': '._destroysessionres',
+    'TypeDialog': '._dialog',
+    'TypeDialogFilter': '._dialogfilter',
+    'TypeDialogFilterSuggested': '._dialogfiltersuggested',
+    'TypeDialogPeer': '._dialogpeer',
+    'TypeDisallowedGiftsSettings': '._disallowedgiftssettings',
+    'TypeDocument': '._document',
+    'TypeDocumentAttribute': '._documentattribute',
+    'TypeDraftMessage': '._draftmessage',
+    'TypeEmailVerification': '._emailverification',
+    'TypeEmailVerifyPurpose': '._emailverifypurpose',
+    'TypeEmojiGroup': '._emojigroup',
+    'TypeEmojiKeyword': '._emojikeyword',
+    'TypeEmojiKeywordsDifference': '._emojikeywordsdifference',
+    'TypeEmojiLanguage': '._emojilanguage',
+    'TypeEmojiList': '._emojilist',
+    'TypeEmojiStatus': '._emojistatus',
+    'TypeEmojiURL': '._emojiurl',
+    'TypeEncryptedChat': '._encryptedchat',
+    'TypeEncryptedFile': '._encryptedfile',
+    'TypeEncryptedMessage': '._encryptedmessage',
+    'TypeExportedChatInvite': '._exportedchatinvite',
+    'TypeExportedChatlistInvite': '._exportedchatlistinvite',
+    'TypeExportedContactToken': '._exportedcontacttoken',
+    'TypeExportedMessageLink': '._exportedmessagelink',
+    'TypeExportedStoryLink': '._exportedstorylink',
+    'TypeFactCheck': '._factcheck',
+    'TypeFileHash': '._filehash',
+    'TypeFolder': '._folder',
+    'TypeFolderPeer': '._folderpeer',
+    'TypeForumTopic': '._forumtopic',
+    'TypeFoundStory': '._foundstory',
+    'TypeFutureSalt': '._futuresalt',
+    'TypeFutureSalts': '._futuresalts',
+    'TypeGame': '._game',
+    'TypeGeoPoint': '._geopoint',
+    'TypeGeoPointAddress': '._geopointaddress',
+    'TypeGlobalPrivacySettings': '._globalprivacysettings',
+    'TypeGroupCall': '._groupcall',
+    'TypeGroupCallParticipant': '._groupcallparticipant',
+    'TypeGroupCallParticipantVideo': '._groupcallparticipantvideo',
+    'TypeGroupCallParticipantVideoSourceGroup': '._groupcallparticipantvideosourcegroup',
+    'TypeGroupCallStreamChannel': '._groupcallstreamchannel',
+    'TypeHighScore': '._highscore',
+    'TypeHttpWait': '._httpwait',
+    'TypeImportedContact': '._importedcontact',
+    'TypeInlineBotSwitchPM': '._inlinebotswitchpm',
+    'TypeInlineBotWebView': '._inlinebotwebview',
+    'TypeInlineQueryPeerType': '._inlinequerypeertype',
+    'TypeInputAppEvent': '._inputappevent',
+    'TypeInputBotApp': '._inputbotapp',
+    'TypeInputBotInlineMessage': '._inputbotinlinemessage',
+    'TypeInputBotInlineMessageID': '._inputbotinlinemessageid',
+    'TypeInputBotInlineResult': '._inputbotinlineresult',
+    'TypeInputBusinessAwayMessage': '._inputbusinessawaymessage',
+    'TypeInputBusinessBotRecipients': '._inputbusinessbotrecipients',
+    'TypeInputBusinessChatLink': '._inputbusinesschatlink',
+    'TypeInputBusinessGreetingMessage': '._inputbusinessgreetingmessage',
+    'TypeInputBusinessIntro': '._inputbusinessintro',
+    'TypeInputBusinessRecipients': '._inputbusinessrecipients',
+    'TypeInputChannel': '._inputchannel',
+    'TypeInputChatPhoto': '._inputchatphoto',
+    'TypeInputChatlist': '._inputchatlist',
+    'TypeInputCheckPasswordSRP': '._inputcheckpasswordsrp',
+    'TypeInputClientProxy': '._inputclientproxy',
+    'TypeInputCollectible': '._inputcollectible',
+    'TypeInputContact': '._inputcontact',
+    'TypeInputDialogPeer': '._inputdialogpeer',
+    'TypeInputDocument': '._inputdocument',
+    'TypeInputEncryptedChat': '._inputencryptedchat',
+    'TypeInputEncryptedFile': '._inputencryptedfile',
+    'TypeInputFile': '._inputfile',
+    'TypeInputFileLocation': '._inputfilelocation',
+    'TypeInputFolderPeer': '._inputfolderpeer',
+    'TypeInputGame': '._inputgame',
+    'TypeInputGeoPoint': '._inputgeopoint',
+    'TypeInputGroupCall': '._inputgroupcall',
+    'TypeInputInvoice': '._inputinvoice',
+    'TypeInputMedia': '._inputmedia',
+    'TypeInputMessage': '._inputmessage',
+    'TypeInputNotifyPeer': '._inputnotifypeer',
+    'TypeInputPaymentCredentials': '._inputpaymentcredentials',
+    'TypeInputPeer': '._inputpeer',
+    'TypeInputPeerNotifySettings': '._inputpeernotifysettings',
+    'TypeInputPhoneCall': '._inputphonecall',
+    'TypeInputPhoto': '._inputphoto',
+    'TypeInputPrivacyKey': '._inputprivacykey',
+    'TypeInputPrivacyRule': '._inputprivacyrule',
+    'TypeInputQuickReplyShortcut': '._inputquickreplyshortcut',
+    'TypeInputReplyTo': '._inputreplyto',
+    'TypeInputSavedStarGift': '._inputsavedstargift',
+    'TypeInputSecureFile': '._inputsecurefile',
+    'TypeInputSecureValue': '._inputsecurevalue',
+    'TypeInputSingleMedia': '._inputsinglemedia',
+    'TypeInputStarsTransaction': '._inputstarstransaction',
+    'TypeInputStickerSet': '._inputstickerset',
+    'TypeInputStickerSetItem': '._inputstickersetitem',
+    'TypeInputStickeredMedia': '._inputstickeredmedia',
+    'TypeInputStorePaymentPurpose': '._inputstorepaymentpurpose',
+    'TypeInputTheme': '._inputtheme',
+    'TypeInputThemeSettings': '._inputthemesettings',
+    'TypeInputUser': '._inputuser',
+    'TypeInputWallPaper': '._inputwallpaper',
+    'TypeInputWebDocument': '._inputwebdocument',
+    'TypeInputWebFileLocation': '._inputwebfilelocation',
+    'TypeInvoice': '._invoice',
+    'TypeIpPort': '._ipport',
+    'TypeJSONObjectValue': '._jsonobjectvalue',
+    'TypeJSONValue': '._jsonvalue',
+    'TypeKeyboardButton': '._keyboardbutton',
+    'TypeKeyboardButtonRow': '._keyboardbuttonrow',
+    'TypeLabeledPrice': '._labeledprice',
+    'TypeLangPackDifference': '._langpackdifference',
+    'TypeLangPackLanguage': '._langpacklanguage',
+    'TypeLangPackString': '._langpackstring',
+    'TypeMaskCoords': '._maskcoords',
+    'TypeMediaArea': '._mediaarea',
+    'TypeMediaAreaCoordinates': '._mediaareacoordinates',
+    'TypeMessage': '._message',
+    'TypeMessageAction': '._messageaction',
+    'TypeMessageEntity': '._messageentity',
+    'TypeMessageExtendedMedia': '._messageextendedmedia',
+    'TypeMessageFwdHeader': '._messagefwdheader',
+    'TypeMessageMedia': '._messagemedia',
+    'TypeMessagePeerReaction': '._messagepeerreaction',
+    'TypeMessagePeerVote': '._messagepeervote',
+    'TypeMessageRange': '._messagerange',
+    'TypeMessageReactions': '._messagereactions',
+    'TypeMessageReactor': '._messagereactor',
+    'TypeMessageReplies': '._messagereplies',
+    'TypeMessageReplyHeader': '._messagereplyheader',
+    'TypeMessageReportOption': '._messagereportoption',
+    'TypeMessageViews': '._messageviews',
+    'TypeMessagesFilter': '._messagesfilter',
+    'TypeMissingInvitee': '._missinginvitee',
+    'TypeMsgDetailedInfo': '._msgdetailedinfo',
+    'TypeMsgResendReq': '._msgresendreq',
+    'TypeMsgsAck': '._msgsack',
+    'TypeMsgsAllInfo': '._msgsallinfo',
+    'TypeMsgsStateInfo': '._msgsstateinfo',
+    'TypeMsgsStateReq': '._msgsstatereq',
+    'TypeMyBoost': '._myboost',
+    'TypeNearestDc': '._nearestdc',
+    'TypeNewSession': '._newsession',
+    'TypeNotificationSound': '._notificationsound',
+    'TypeNotifyPeer': '._notifypeer',
+    'TypeOutboxReadDate': '._outboxreaddate',
+    'TypeP_Q_inner_data': '._p_q_inner_data',
+    'TypePage': '._page',
+    'TypePageBlock': '._pageblock',
+    'TypePageCaption': '._pagecaption',
+    'TypePageListItem': '._pagelistitem',
+    'TypePageListOrderedItem': '._pagelistordereditem',
+    'TypePageRelatedArticle': '._pagerelatedarticle',
+    'TypePageTableCell': '._pagetablecell',
+    'TypePageTableRow': '._pagetablerow',
+    'TypePaidReactionPrivacy': '._paidreactionprivacy',
+    'TypePasswordKdfAlgo': '._passwordkdfalgo',
+    'TypePaymentCharge': '._paymentcharge',
+    'TypePaymentFormMethod': '._paymentformmethod',
+    'TypePaymentRequestedInfo': '._paymentrequestedinfo',
+    'TypePaymentSavedCredentials': '._paymentsavedcredentials',
+    'TypePeer': '._peer',
+    'TypePeerBlocked': '._peerblocked',
+    'TypePeerColor': '._peercolor',
+    'TypePeerLocated': '._peerlocated',
+    'TypePeerNotifySettings': '._peernotifysettings',
+    'TypePeerSettings': '._peersettings',
+    'TypePeerStories': '._peerstories',
+    'TypePhoneCall': '._phonecall',
+    'TypePhoneCallDiscardReason': '._phonecalldiscardreason',
+    'TypePhoneCallProtocol': '._phonecallprotocol',
+    'TypePhoneConnection': '._phoneconnection',
+    'TypePhoto': '._photo',
+    'TypePhotoSize': '._photosize',
+    'TypePoll': '._poll',
+    'TypePollAnswer': '._pollanswer',
+    'TypePollAnswerVoters': '._pollanswervoters',
+    'TypePollResults': '._pollresults',
+    'TypePong': '._pong',
+    'TypePopularContact': '._popularcontact',
+    'TypePostAddress': '._postaddress',
+    'TypePostInteractionCounters': '._postinteractioncounters',
+    'TypePremiumGiftCodeOption': '._premiumgiftcodeoption',
+    'TypePremiumSubscriptionOption': '._premiumsubscriptionoption',
+    'TypePrepaidGiveaway': '._prepaidgiveaway',
+    'TypePrivacyKey': '._privacykey',
+    'TypePrivacyRule': '._privacyrule',
+    'TypePublicForward': '._publicforward',
+    'TypeQuickReply': '._quickreply',
+    'TypeReaction': '._reaction',
+    'TypeReactionCount': '._reactioncount',
+    'TypeReactionNotificationsFrom': '._reactionnotificationsfrom',
+    'TypeReactionsNotifySettings': '._reactionsnotifysettings',
+    'TypeReadParticipantDate': '._readparticipantdate',
+    'TypeReceivedNotifyMessage': '._receivednotifymessage',
+    'TypeRecentMeUrl': '._recentmeurl',
+    'TypeReplyMarkup': '._replymarkup',
+    'TypeReportReason': '._reportreason',
+    'TypeReportResult': '._reportresult',
+    'TypeRequestPeerType': '._requestpeertype',
+    'TypeRequestedPeer': '._requestedpeer',
+    'TypeRequirementToContact': '._requirementtocontact',
+    'TypeResPQ': '._respq',
+    'TypeRestrictionReason': '._restrictionreason',
+    'TypeRichText': '._richtext',
+    'TypeRpcDropAnswer': '._rpcdropanswer',
+    'TypeRpcError': '._rpcerror',
+    'TypeSavedContact': '._savedcontact',
+    'TypeSavedDialog': '._saveddialog',
+    'TypeSavedReactionTag': '._savedreactiontag',
+    'TypeSavedStarGift': '._savedstargift',
+    'TypeSearchResultsCalendarPeriod': '._searchresultscalendarperiod',
+    'TypeSearchResultsPosition': '._searchresultsposition',
+    'TypeSecureCredentialsEncrypted': '._securecredentialsencrypted',
+    'TypeSecureData': '._securedata',
+    'TypeSecureFile': '._securefile',
+    'TypeSecurePasswordKdfAlgo': '._securepasswordkdfalgo',
+    'TypeSecurePlainData': '._secureplaindata',
+    'TypeSecureRequiredType': '._securerequiredtype',
+    'TypeSecureSecretSettings': '._securesecretsettings',
+    'TypeSecureValue': '._securevalue',
+    'TypeSecureValueError': '._securevalueerror',
+    'TypeSecureValueHash': '._securevaluehash',
+    'TypeSecureValueType': '._securevaluetype',
+    'TypeSendAsPeer': '._sendaspeer',
+    'TypeSendMessageAction': '._sendmessageaction',
+    'TypeServer_DH_Params': '._server_dh_params',
+    'TypeServer_DH_inner_data': '._server_dh_inner_data',
+    'TypeSet_client_DH_params_answer': '._set_client_dh_params_answer',
+    'TypeShippingOption': '._shippingoption',
+    'TypeSmsJob': '._smsjob',
+    'TypeSponsoredMessage': '._sponsoredmessage',
+    'TypeSponsoredMessageReportOption': '._sponsoredmessagereportoption',
+    'TypeSponsoredPeer': '._sponsoredpeer',
+    'TypeStarGift': '._stargift',
+    'TypeStarGiftAttribute': '._stargiftattribute',
+    'TypeStarRefProgram': '._starrefprogram',
+    'TypeStarsAmount': '._starsamount',
+    'TypeStarsGiftOption': '._starsgiftoption',
+    'TypeStarsGiveawayOption': '._starsgiveawayoption',
+    'TypeStarsGiveawayWinnersOption': '._starsgiveawaywinnersoption',
+    'TypeStarsRevenueStatus': '._starsrevenuestatus',
+    'TypeStarsSubscription': '._starssubscription',
+    'TypeStarsSubscriptionPricing': '._starssubscriptionpricing',
+    'TypeStarsTopupOption': '._starstopupoption',
+    'TypeStarsTransaction': '._starstransaction',
+    'TypeStarsTransactionPeer': '._starstransactionpeer',
+    'TypeStatsAbsValueAndPrev': '._statsabsvalueandprev',
+    'TypeStatsDateRangeDays': '._statsdaterangedays',
+    'TypeStatsGraph': '._statsgraph',
+    'TypeStatsGroupTopAdmin': '._statsgrouptopadmin',
+    'TypeStatsGroupTopInviter': '._statsgrouptopinviter',
+    'TypeStatsGroupTopPoster': '._statsgrouptopposter',
+    'TypeStatsPercentValue': '._statspercentvalue',
+    'TypeStatsURL': '._statsurl',
+    'TypeStickerKeyword': '._stickerkeyword',
+    'TypeStickerPack': '._stickerpack',
+    'TypeStickerSet': '._stickerset',
+    'TypeStickerSetCovered': '._stickersetcovered',
+    'TypeStoriesStealthMode': '._storiesstealthmode',
+    'TypeStoryFwdHeader': '._storyfwdheader',
+    'TypeStoryItem': '._storyitem',
+    'TypeStoryReaction': '._storyreaction',
+    'TypeStoryView': '._storyview',
+    'TypeStoryViews': '._storyviews',
+    'TypeTextWithEntities': '._textwithentities',
+    'TypeTheme': '._theme',
+    'TypeThemeSettings': '._themesettings',
+    'TypeTimezone': '._timezone',
+    'TypeTlsBlock': '._tlsblock',
+    'TypeTlsClientHello': '._tlsclienthello',
+    'TypeTopPeer': '._toppeer',
+    'TypeTopPeerCategory': '._toppeercategory',
+    'TypeTopPeerCategoryPeers': '._toppeercategorypeers',
+    'TypeUpdate': '._update',
+    'TypeUpdates': '._updates',
+    'TypeUrlAuthResult': '._urlauthresult',
+    'TypeUser': '._user',
+    'TypeUserFull': '._userfull',
+    'TypeUserProfilePhoto': '._userprofilephoto',
+    'TypeUserStatus': '._userstatus',
+    'TypeUsername': '._username',
+    'TypeVideoSize': '._videosize',
+    'TypeWallPaper': '._wallpaper',
+    'TypeWallPaperSettings': '._wallpapersettings',
+    'TypeWebAuthorization': '._webauthorization',
+    'TypeWebDocument': '._webdocument',
+    'TypeWebPage': '._webpage',
+    'TypeWebPageAttribute': '._webpageattribute',
+    'TypeWebViewMessageSent': '._webviewmessagesent',
+    'TypeWebViewResult': '._webviewresult',
+    'UpdateAttachMenuBots': '._update',
+    'UpdateAutoSaveSettings': '._update',
+    'UpdateBotBusinessConnect': '._update',
+    'UpdateBotCallbackQuery': '._update',
+    'UpdateBotChatBoost': '._update',
+    'UpdateBotChatInviteRequester': '._update',
+    'UpdateBotCommands': '._update',
+    'UpdateBotDeleteBusinessMessage': '._update',
+    'UpdateBotEditBusinessMessage': '._update',
+    'UpdateBotInlineQuery': '._update',
+    'UpdateBotInlineSend': '._update',
+    'UpdateBotMenuButton': '._update',
+    'UpdateBotMessageReaction': '._update',
+    'UpdateBotMessageReactions': '._update',
+    'UpdateBotNewBusinessMessage': '._update',
+    'UpdateBotPrecheckoutQuery': '._update',
+    'UpdateBotPurchasedPaidMedia': '._update',
+    'UpdateBotShippingQuery': '._update',
+    'UpdateBotStopped': '._update',
+    'UpdateBotWebhookJSON': '._update',
+    'UpdateBotWebhookJSONQuery': '._update',
+    'UpdateBroadcastRevenueTransactions': '._update',
+    'UpdateBusinessBotCallbackQuery': '._update',
+    'UpdateChannel': '._update',
+    'UpdateChannelAvailableMessages': '._update',
+    'UpdateChannelMessageForwards': '._update',
+    'UpdateChannelMessageViews': '._update',
+    'UpdateChannelParticipant': '._update',
+    'UpdateChannelPinnedTopic': '._update',
+    'UpdateChannelPinnedTopics': '._update',
+    'UpdateChannelReadMessagesContents': '._update',
+    'UpdateChannelTooLong': '._update',
+    'UpdateChannelUserTyping': '._update',
+    'UpdateChannelViewForumAsMessages': '._update',
+    'UpdateChannelWebPage': '._update',
+    'UpdateChat': '._update',
+    'UpdateChatDefaultBannedRights': '._update',
+    'UpdateChatParticipant': '._update',
+    'UpdateChatParticipantAdd': '._update',
+    'UpdateChatParticipantAdmin': '._update',
+    'UpdateChatParticipantDelete': '._update',
+    'UpdateChatParticipants': '._update',
+    'UpdateChatUserTyping': '._update',
+    'UpdateConfig': '._update',
+    'UpdateContactsReset': '._update',
+    'UpdateDcOptions': '._update',
+    'UpdateDeleteChannelMessages': '._update',
+    'UpdateDeleteMessages': '._update',
+    'UpdateDeleteQuickReply': '._update',
+    'UpdateDeleteQuickReplyMessages': '._update',
+    'UpdateDeleteScheduledMessages': '._update',
+    'UpdateDialogFilter': '._update',
+    'UpdateDialogFilterOrder': '._update',
+    'UpdateDialogFilters': '._update',
+    'UpdateDialogPinned': '._update',
+    'UpdateDialogUnreadMark': '._update',
+    'UpdateDraftMessage': '._update',
+    'UpdateEditChannelMessage': '._update',
+    'UpdateEditMessage': '._update',
+    'UpdateEncryptedChatTyping': '._update',
+    'UpdateEncryptedMessagesRead': '._update',
+    'UpdateEncryption': '._update',
+    'UpdateFavedStickers': '._update',
+    'UpdateFolderPeers': '._update',
+    'UpdateGeoLiveViewed': '._update',
+    'UpdateGroupCall': '._update',
+    'UpdateGroupCallConnection': '._update',
+    'UpdateGroupCallParticipants': '._update',
+    'UpdateInlineBotCallbackQuery': '._update',
+    'UpdateLangPack': '._update',
+    'UpdateLangPackTooLong': '._update',
+    'UpdateLoginToken': '._update',
+    'UpdateMessageExtendedMedia': '._update',
+    'UpdateMessageID': '._update',
+    'UpdateMessagePoll': '._update',
+    'UpdateMessagePollVote': '._update',
+    'UpdateMessageReactions': '._update',
+    'UpdateMoveStickerSetToTop': '._update',
+    'UpdateNewAuthorization': '._update',
+    'UpdateNewChannelMessage': '._update',
+    'UpdateNewEncryptedMessage': '._update',
+    'UpdateNewMessage': '._update',
+    'UpdateNewQuickReply': '._update',
+    'UpdateNewScheduledMessage': '._update',
+    'UpdateNewStickerSet': '._update',
+    'UpdateNewStoryReaction': '._update',
+    'UpdateNotifySettings': '._update',
+    'UpdatePaidReactionPrivacy': '._update',
+    'UpdatePeerBlocked': '._update',
+    'UpdatePeerHistoryTTL': '._update',
+    'UpdatePeerLocated': '._update',
+    'UpdatePeerSettings': '._update',
+    'UpdatePeerWallpaper': '._update',
+    'UpdatePendingJoinRequests': '._update',
+    'UpdatePhoneCall': '._update',
+    'UpdatePhoneCallSignalingData': '._update',
+    'UpdatePinnedChannelMessages': '._update',
+    'UpdatePinnedDialogs': '._update',
+    'UpdatePinnedMessages': '._update',
+    'UpdatePinnedSavedDialogs': '._update',
+    'UpdatePrivacy': '._update',
+    'UpdatePtsChanged': '._update',
+    'UpdateQuickReplies': '._update',
+    'UpdateQuickReplyMessage': '._update',
+    'UpdateReadChannelDiscussionInbox': '._update',
+    'UpdateReadChannelDiscussionOutbox': '._update',
+    'UpdateReadChannelInbox': '._update',
+    'UpdateReadChannelOutbox': '._update',
+    'UpdateReadFeaturedEmojiStickers': '._update',
+    'UpdateReadFeaturedStickers': '._update',
+    'UpdateReadHistoryInbox': '._update',
+    'UpdateReadHistoryOutbox': '._update',
+    'UpdateReadMessagesContents': '._update',
+    'UpdateReadStories': '._update',
+    'UpdateRecentEmojiStatuses': '._update',
+    'UpdateRecentReactions': '._update',
+    'UpdateRecentStickers': '._update',
+    'UpdateSavedDialogPinned': '._update',
+    'UpdateSavedGifs': '._update',
+    'UpdateSavedReactionTags': '._update',
+    'UpdateSavedRingtones': '._update',
+    'UpdateSentPhoneCode': '._update',
+    'UpdateSentStoryReaction': '._update',
+    'UpdateServiceNotification': '._update',
+    'UpdateShort': '._updates',
+    'UpdateShortChatMessage': '._updates',
+    'UpdateShortMessage': '._updates',
+    'UpdateShortSentMessage': '._updates',
+    'UpdateSmsJob': '._update',
+    'UpdateStarsBalance': '._update',
+    'UpdateStarsRevenueStatus': '._update',
+    'UpdateStickerSets': '._update',
+    'UpdateStickerSetsOrder': '._update',
+    'UpdateStoriesStealthMode': '._update',
+    'UpdateStory': '._update',
+    'UpdateStoryID': '._update',
+    'UpdateTheme': '._update',
+    'UpdateTranscribedAudio': '._update',
+    'UpdateUser': '._update',
+    'UpdateUserEmojiStatus': '._update',
+    'UpdateUserName': '._update',
+    'UpdateUserPhone': '._update',
+    'UpdateUserStatus': '._update',
+    'UpdateUserTyping': '._update',
+    'UpdateWebPage': '._update',
+    'UpdateWebViewResultSent': '._update',
+    'Updates': '._updates',
+    'UpdatesCombined': '._updates',
+    'UpdatesTooLong': '._updates',
+    'UrlAuthResultAccepted': '._urlauthresult',
+    'UrlAuthResultDefault': '._urlauthresult',
+    'UrlAuthResultRequest': '._urlauthresult',
+    'User': '._user',
+    'UserEmpty': '._user',
+    'UserFull': '._userfull',
+    'UserProfilePhoto': '._userprofilephoto',
+    'UserProfilePhotoEmpty': '._userprofilephoto',
+    'UserStatusEmpty': '._userstatus',
+    'UserStatusLastMonth': '._userstatus',
+    'UserStatusLastWeek': '._userstatus',
+    'UserStatusOffline': '._userstatus',
+    'UserStatusOnline': '._userstatus',
+    'UserStatusRecently': '._userstatus',
+    'Username': '._username',
+    'VideoSize': '._videosize',
+    'VideoSizeEmojiMarkup': '._videosize',
+    'VideoSizeStickerMarkup': '._videosize',
+    'WallPaper': '._wallpaper',
+    'WallPaperNoFile': '._wallpaper',
+    'WallPaperSettings': '._wallpapersettings',
+    'WebAuthorization': '._webauthorization',
+    'WebDocument': '._webdocument',
+    'WebDocumentNoProxy': '._webdocument',
+    'WebPage': '._webpage',
+    'WebPageAttributeStickerSet': '._webpageattribute',
+    'WebPageAttributeStory': '._webpageattribute',
+    'WebPageAttributeTheme': '._webpageattribute',
+    'WebPageAttributeUniqueStarGift': '._webpageattribute',
+    'WebPageEmpty': '._webpage',
+    'WebPageNotModified': '._webpage',
+    'WebPagePending': '._webpage',
+    'WebViewMessageSent': '._webviewmessagesent',
+    'WebViewResultUrl': '._webviewresult',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
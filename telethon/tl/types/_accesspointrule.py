@@ -0,0 +1,52 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeIpPort
+
+
+
+class AccessPointRule(TLObject):
+    CONSTRUCTOR_ID = 0x4679b65f
+    SUBCLASS_OF_ID = 0xb1aca0fd
+    __slots__ = ('phone_prefix_rules', 'dc_id', 'ips')
+
+    def __init__(self, phone_prefix_rules: str, dc_id: int, ips: List['TypeIpPort']):
+        """
+        Constructor for AccessPointRule: Instance of AccessPointRule.
+        """
+        self.phone_prefix_rules = phone_prefix_rules
+        self.dc_id = dc_id
+        self.ips = ips
+
+    def to_dict(self):
+        return {
+            '_': 'AccessPointRule',
+            'phone_prefix_rules': self.phone_prefix_rules,
+            'dc_id': self.dc_id,
+            'ips': [] if self.ips is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.ips]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'_\xb6yF',
+            self.serialize_bytes(self.phone_prefix_rules),
+            struct.pack('<i', self.dc_id),
+            struct.pack('<i', len(self.ips)),b''.join(x._bytes() for x in self.ips),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone_prefix_rules = reader.tgread_string()
+        _dc_id = reader.read_int()
+        _ips = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _ips.append(_x)
+
+        return cls(phone_prefix_rules=_phone_prefix_rules, dc_id=_dc_id, ips=_ips)
+
+TypeAccessPointRule = AccessPointRule
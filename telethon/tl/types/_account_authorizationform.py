@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSecureRequiredType, TypeSecureValue, TypeSecureValueError, TypeUser
+
+
+
+class AuthorizationForm(TLObject):
+    CONSTRUCTOR_ID = 0xad2e1cd8
+    SUBCLASS_OF_ID = 0x78049a94
+    __slots__ = ('required_types', 'values', 'errors', 'users', 'privacy_policy_url')
+
+    def __init__(self, required_types: List['TypeSecureRequiredType'], values: List['TypeSecureValue'], errors: List['TypeSecureValueError'], users: List['TypeUser'], privacy_policy_url: Optional[str]=None):
+        """
+        Constructor for account.AuthorizationForm: Instance of AuthorizationForm.
+        """
+        self.required_types = required_types
+        self.values = values
+        self.errors = errors
+        self.users = users
+        self.privacy_policy_url = privacy_policy_url
+
+    def to_dict(self):
+        return {
+            '_': 'AuthorizationForm',
+            'required_types': [] if self.required_types is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.required_types],
+            'values': [] if self.values is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.values],
+            'errors': [] if self.errors is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.errors],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'privacy_policy_url': self.privacy_policy_url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd8\x1c.\xad',
+            struct.pack('<I', (0 if self.privacy_policy_url is None or self.privacy_policy_url is False else 1)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.required_types)),b''.join(x._bytes() for x in self.required_types),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.values)),b''.join(x._bytes() for x in self.values),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.errors)),b''.join(x._bytes() for x in self.errors),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            b'' if self.privacy_policy_url is None or self.privacy_policy_url is False else (self.serialize_bytes(self.privacy_policy_url)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        reader.read_int()
+        _required_types = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _required_types.append(_x)
+
+        reader.read_int()
+        _values = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _values.append(_x)
+
+        reader.read_int()
+        _errors = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _errors.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        if flags & 1:
+            _privacy_policy_url = reader.tgread_string()
+        else:
+            _privacy_policy_url = None
+        return cls(required_types=_required_types, values=_values, errors=_errors, users=_users, privacy_policy_url=_privacy_policy_url)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAuthorization
+
+
+
+class Authorizations(TLObject):
+    CONSTRUCTOR_ID = 0x4bff8ea0
+    SUBCLASS_OF_ID = 0xbf5e0ff
+    __slots__ = ('authorization_ttl_days', 'authorizations')
+
+    def __init__(self, authorization_ttl_days: int, authorizations: List['TypeAuthorization']):
+        """
+        Constructor for account.Authorizations: Instance of Authorizations.
+        """
+        self.authorization_ttl_days = authorization_ttl_days
+        self.authorizations = authorizations
+
+    def to_dict(self):
+        return {
+            '_': 'Authorizations',
+            'authorization_ttl_days': self.authorization_ttl_days,
+            'authorizations': [] if self.authorizations is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.authorizations]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0\x8e\xffK',
+            struct.pack('<i', self.authorization_ttl_days),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.authorizations)),b''.join(x._bytes() for x in self.authorizations),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _authorization_ttl_days = reader.read_int()
+        reader.read_int()
+        _authorizations = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _authorizations.append(_x)
+
+        return cls(authorization_ttl_days=_authorization_ttl_days, authorizations=_authorizations)
+
@@ -0,0 +1,47 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAutoDownloadSettings
+
+
+
+class AutoDownloadSettings(TLObject):
+    CONSTRUCTOR_ID = 0x63cacf26
+    SUBCLASS_OF_ID = 0x2fb85921
+    __slots__ = ('low', 'medium', 'high')
+
+    def __init__(self, low: 'TypeAutoDownloadSettings', medium: 'TypeAutoDownloadSettings', high: 'TypeAutoDownloadSettings'):
+        """
+        Constructor for account.AutoDownloadSettings: Instance of AutoDownloadSettings.
+        """
+        self.low = low
+        self.medium = medium
+        self.high = high
+
+    def to_dict(self):
+        return {
+            '_': 'AutoDownloadSettings',
+            'low': self.low.to_dict() if isinstance(self.low, TLObject) else self.low,
+            'medium': self.medium.to_dict() if isinstance(self.medium, TLObject) else self.medium,
+            'high': self.high.to_dict() if isinstance(self.high, TLObject) else self.high
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'&\xcf\xcac',
+            self.low._bytes(),
+            self.medium._bytes(),
+            self.high._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _low = reader.tgread_object()
+        _medium = reader.tgread_object()
+        _high = reader.tgread_object()
+        return cls(low=_low, medium=_medium, high=_high)
+
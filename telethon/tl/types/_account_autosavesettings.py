@@ -0,0 +1,74 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAutoSaveException, TypeAutoSaveSettings, TypeChat, TypeUser
+
+
+
+class AutoSaveSettings(TLObject):
+    CONSTRUCTOR_ID = 0x4c3e069d
+    SUBCLASS_OF_ID = 0x48cf2f02
+    __slots__ = ('users_settings', 'chats_settings', 'broadcasts_settings', 'exceptions', 'chats', 'users')
+
+    def __init__(self, users_settings: 'TypeAutoSaveSettings', chats_settings: 'TypeAutoSaveSettings', broadcasts_settings: 'TypeAutoSaveSettings', exceptions: List['TypeAutoSaveException'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for account.AutoSaveSettings: Instance of AutoSaveSettings.
+        """
+        self.users_settings = users_settings
+        self.chats_settings = chats_settings
+        self.broadcasts_settings = broadcasts_settings
+        self.exceptions = exceptions
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'AutoSaveSettings',
+            'users_settings': self.users_settings.to_dict() if isinstance(self.users_settings, TLObject) else self.users_settings,
+            'chats_settings': self.chats_settings.to_dict() if isinstance(self.chats_settings, TLObject) else self.chats_settings,
+            'broadcasts_settings': self.broadcasts_settings.to_dict() if isinstance(self.broadcasts_settings, TLObject) else self.broadcasts_settings,
+            'exceptions': [] if self.exceptions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.exceptions],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9d\x06>L',
+            self.users_settings._bytes(),
+            self.chats_settings._bytes(),
+            self.broadcasts_settings._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.exceptions)),b''.join(x._bytes() for x in self.exceptions),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _users_settings = reader.tgread_object()
+        _chats_settings = reader.tgread_object()
+        _broadcasts_settings = reader.tgread_object()
+        reader.read_int()
+        _exceptions = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _exceptions.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(users_settings=_users_settings, chats_settings=_chats_settings, broadcasts_settings=_broadcasts_settings, exceptions=_exceptions, chats=_chats, users=_users)
+
@@ -0,0 +1,62 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBusinessChatLink, TypeChat, TypeUser
+
+
+
+class BusinessChatLinks(TLObject):
+    CONSTRUCTOR_ID = 0xec43a2d1
+    SUBCLASS_OF_ID = 0xc6ba4a31
+    __slots__ = ('links', 'chats', 'users')
+
+    def __init__(self, links: List['TypeBusinessChatLink'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for account.BusinessChatLinks: Instance of BusinessChatLinks.
+        """
+        self.links = links
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessChatLinks',
+            'links': [] if self.links is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.links],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1\xa2C\xec',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.links)),b''.join(x._bytes() for x in self.links),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _links = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _links.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(links=_links, chats=_chats, users=_users)
+
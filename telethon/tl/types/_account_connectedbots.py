@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeConnectedBot, TypeUser
+
+
+
+class ConnectedBots(TLObject):
+    CONSTRUCTOR_ID = 0x17d7f87b
+    SUBCLASS_OF_ID = 0xe4caf7d3
+    __slots__ = ('connected_bots', 'users')
+
+    def __init__(self, connected_bots: List['TypeConnectedBot'], users: List['TypeUser']):
+        """
+        Constructor for account.ConnectedBots: Instance of ConnectedBots.
+        """
+        self.connected_bots = connected_bots
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ConnectedBots',
+            'connected_bots': [] if self.connected_bots is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.connected_bots],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'{\xf8\xd7\x17',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.connected_bots)),b''.join(x._bytes() for x in self.connected_bots),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _connected_bots = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _connected_bots.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(connected_bots=_connected_bots, users=_users)
+
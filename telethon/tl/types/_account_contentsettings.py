@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ContentSettings(TLObject):
+    CONSTRUCTOR_ID = 0x57e28221
+    SUBCLASS_OF_ID = 0xae3ff891
+    __slots__ = ('sensitive_enabled', 'sensitive_can_change')
+
+    def __init__(self, sensitive_enabled: Optional[bool]=None, sensitive_can_change: Optional[bool]=None):
+        """
+        Constructor for account.ContentSettings: Instance of ContentSettings.
+        """
+        self.sensitive_enabled = sensitive_enabled
+        self.sensitive_can_change = sensitive_can_change
+
+    def to_dict(self):
+        return {
+            '_': 'ContentSettings',
+            'sensitive_enabled': self.sensitive_enabled,
+            'sensitive_can_change': self.sensitive_can_change
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'!\x82\xe2W',
+            struct.pack('<I', (0 if self.sensitive_enabled is None or self.sensitive_enabled is False else 1) | (0 if self.sensitive_can_change is None or self.sensitive_can_change is False else 2)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _sensitive_enabled = bool(flags & 1)
+        _sensitive_can_change = bool(flags & 2)
+        return cls(sensitive_enabled=_sensitive_enabled, sensitive_can_change=_sensitive_can_change)
+
@@ -0,0 +1,72 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.auth import TypeSentCode
+
+
+
+class EmailVerified(TLObject):
+    CONSTRUCTOR_ID = 0x2b96cd1b
+    SUBCLASS_OF_ID = 0x64833188
+    __slots__ = ('email',)
+
+    def __init__(self, email: str):
+        """
+        Constructor for account.EmailVerified: Instance of either EmailVerified, EmailVerifiedLogin.
+        """
+        self.email = email
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerified',
+            'email': self.email
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1b\xcd\x96+',
+            self.serialize_bytes(self.email),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _email = reader.tgread_string()
+        return cls(email=_email)
+
+
+class EmailVerifiedLogin(TLObject):
+    CONSTRUCTOR_ID = 0xe1bb0d61
+    SUBCLASS_OF_ID = 0x64833188
+    __slots__ = ('email', 'sent_code')
+
+    def __init__(self, email: str, sent_code: 'TypeSentCode'):
+        """
+        Constructor for account.EmailVerified: Instance of either EmailVerified, EmailVerifiedLogin.
+        """
+        self.email = email
+        self.sent_code = sent_code
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerifiedLogin',
+            'email': self.email,
+            'sent_code': self.sent_code.to_dict() if isinstance(self.sent_code, TLObject) else self.sent_code
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'a\r\xbb\xe1',
+            self.serialize_bytes(self.email),
+            self.sent_code._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _email = reader.tgread_string()
+        _sent_code = reader.tgread_object()
+        return cls(email=_email, sent_code=_sent_code)
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeEmojiStatus
+
+
+
+class EmojiStatuses(TLObject):
+    CONSTRUCTOR_ID = 0x90c467d1
+    SUBCLASS_OF_ID = 0xd3e005ca
+    __slots__ = ('hash', 'statuses')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, statuses: List['TypeEmojiStatus']):
+        """
+        Constructor for account.EmojiStatuses: Instance of either EmojiStatusesNotModified, EmojiStatuses.
+        """
+        self.hash = hash
+        self.statuses = statuses
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiStatuses',
+            'hash': self.hash,
+            'statuses': [] if self.statuses is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.statuses]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1g\xc4\x90',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.statuses)),b''.join(x._bytes() for x in self.statuses),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _statuses = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _statuses.append(_x)
+
+        return cls(hash=_hash, statuses=_statuses)
+
+
+class EmojiStatusesNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xd08ce645
+    SUBCLASS_OF_ID = 0xd3e005ca
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiStatusesNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'E\xe6\x8c\xd0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PaidMessagesRevenue(TLObject):
+    CONSTRUCTOR_ID = 0x1e109708
+    SUBCLASS_OF_ID = 0x152f0c57
+    __slots__ = ('stars_amount',)
+
+    def __init__(self, stars_amount: int):
+        """
+        Constructor for account.PaidMessagesRevenue: Instance of PaidMessagesRevenue.
+        """
+        self.stars_amount = stars_amount
+
+    def to_dict(self):
+        return {
+            '_': 'PaidMessagesRevenue',
+            'stars_amount': self.stars_amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08\x97\x10\x1e',
+            struct.pack('<q', self.stars_amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stars_amount = reader.read_long()
+        return cls(stars_amount=_stars_amount)
+
@@ -0,0 +1,109 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePasswordKdfAlgo, TypeSecurePasswordKdfAlgo
+
+
+
+class Password(TLObject):
+    CONSTRUCTOR_ID = 0x957b50fb
+    SUBCLASS_OF_ID = 0x53a211a3
+    __slots__ = ('new_algo', 'new_secure_algo', 'secure_random', 'has_recovery', 'has_secure_values', 'has_password', 'current_algo', 'srp_B', 'srp_id', 'hint', 'email_unconfirmed_pattern', 'pending_reset_date', 'login_email_pattern')
+
+    def __init__(self, new_algo: 'TypePasswordKdfAlgo', new_secure_algo: 'TypeSecurePasswordKdfAlgo', secure_random: bytes, has_recovery: Optional[bool]=None, has_secure_values: Optional[bool]=None, has_password: Optional[bool]=None, current_algo: Optional['TypePasswordKdfAlgo']=None, srp_B: Optional[bytes]=None, srp_id: Optional[int]=None, hint: Optional[str]=None, email_unconfirmed_pattern: Optional[str]=None, pending_reset_date: Optional[datetime]=None, login_email_pattern: Optional[str]=None):
+        """
+        Constructor for account.Password: Instance of Password.
+        """
+        self.new_algo = new_algo
+        self.new_secure_algo = new_secure_algo
+        self.secure_random = secure_random
+        self.has_recovery = has_recovery
+        self.has_secure_values = has_secure_values
+        self.has_password = has_password
+        self.current_algo = current_algo
+        self.srp_B = srp_B
+        self.srp_id = srp_id
+        self.hint = hint
+        self.email_unconfirmed_pattern = email_unconfirmed_pattern
+        self.pending_reset_date = pending_reset_date
+        self.login_email_pattern = login_email_pattern
+
+    def to_dict(self):
+        return {
+            '_': 'Password',
+            'new_algo': self.new_algo.to_dict() if isinstance(self.new_algo, TLObject) else self.new_algo,
+            'new_secure_algo': self.new_secure_algo.to_dict() if isinstance(self.new_secure_algo, TLObject) else self.new_secure_algo,
+            'secure_random': self.secure_random,
+            'has_recovery': self.has_recovery,
+            'has_secure_values': self.has_secure_values,
+            'has_password': self.has_password,
+            'current_algo': self.current_algo.to_dict() if isinstance(self.current_algo, TLObject) else self.current_algo,
+            'srp_B': self.srp_B,
+            'srp_id': self.srp_id,
+            'hint': self.hint,
+            'email_unconfirmed_pattern': self.email_unconfirmed_pattern,
+            'pending_reset_date': self.pending_reset_date,
+            'login_email_pattern': self.login_email_pattern
+        }
+
+    def _bytes(self):
+        assert ((self.has_password or self.has_password is not None) and (self.current_algo or self.current_algo is not None) and (self.srp_B or self.srp_B is not None) and (self.srp_id or self.srp_id is not None)) or ((self.has_password is None or self.has_password is False) and (self.current_algo is None or self.current_algo is False) and (self.srp_B is None or self.srp_B is False) and (self.srp_id is None or self.srp_id is False)), 'has_password, current_algo, srp_B, srp_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xfbP{\x95',
+            struct.pack('<I', (0 if self.has_recovery is None or self.has_recovery is False else 1) | (0 if self.has_secure_values is None or self.has_secure_values is False else 2) | (0 if self.has_password is None or self.has_password is False else 4) | (0 if self.current_algo is None or self.current_algo is False else 4) | (0 if self.srp_B is None or self.srp_B is False else 4) | (0 if self.srp_id is None or self.srp_id is False else 4) | (0 if self.hint is None or self.hint is False else 8) | (0 if self.email_unconfirmed_pattern is None or self.email_unconfirmed_pattern is False else 16) | (0 if self.pending_reset_date is None or self.pending_reset_date is False else 32) | (0 if self.login_email_pattern is None or self.login_email_pattern is False else 64)),
+            b'' if self.current_algo is None or self.current_algo is False else (self.current_algo._bytes()),
+            b'' if self.srp_B is None or self.srp_B is False else (self.serialize_bytes(self.srp_B)),
+            b'' if self.srp_id is None or self.srp_id is False else (struct.pack('<q', self.srp_id)),
+            b'' if self.hint is None or self.hint is False else (self.serialize_bytes(self.hint)),
+            b'' if self.email_unconfirmed_pattern is None or self.email_unconfirmed_pattern is False else (self.serialize_bytes(self.email_unconfirmed_pattern)),
+            self.new_algo._bytes(),
+            self.new_secure_algo._bytes(),
+            self.serialize_bytes(self.secure_random),
+            b'' if self.pending_reset_date is None or self.pending_reset_date is False else (self.serialize_datetime(self.pending_reset_date)),
+            b'' if self.login_email_pattern is None or self.login_email_pattern is False else (self.serialize_bytes(self.login_email_pattern)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _has_recovery = bool(flags & 1)
+        _has_secure_values = bool(flags & 2)
+        _has_password = bool(flags & 4)
+        if flags & 4:
+            _current_algo = reader.tgread_object()
+        else:
+            _current_algo = None
+        if flags & 4:
+            _srp_B = reader.tgread_bytes()
+        else:
+            _srp_B = None
+        if flags & 4:
+            _srp_id = reader.read_long()
+        else:
+            _srp_id = None
+        if flags & 8:
+            _hint = reader.tgread_string()
+        else:
+            _hint = None
+        if flags & 16:
+            _email_unconfirmed_pattern = reader.tgread_string()
+        else:
+            _email_unconfirmed_pattern = None
+        _new_algo = reader.tgread_object()
+        _new_secure_algo = reader.tgread_object()
+        _secure_random = reader.tgread_bytes()
+        if flags & 32:
+            _pending_reset_date = reader.tgread_date()
+        else:
+            _pending_reset_date = None
+        if flags & 64:
+            _login_email_pattern = reader.tgread_string()
+        else:
+            _login_email_pattern = None
+        return cls(new_algo=_new_algo, new_secure_algo=_new_secure_algo, secure_random=_secure_random, has_recovery=_has_recovery, has_secure_values=_has_secure_values, has_password=_has_password, current_algo=_current_algo, srp_B=_srp_B, srp_id=_srp_id, hint=_hint, email_unconfirmed_pattern=_email_unconfirmed_pattern, pending_reset_date=_pending_reset_date, login_email_pattern=_login_email_pattern)
+
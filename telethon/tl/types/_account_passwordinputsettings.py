@@ -0,0 +1,74 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePasswordKdfAlgo, TypeSecureSecretSettings
+
+
+
+class PasswordInputSettings(TLObject):
+    CONSTRUCTOR_ID = 0xc23727c9
+    SUBCLASS_OF_ID = 0xc426ca6
+    __slots__ = ('new_algo', 'new_password_hash', 'hint', 'email', 'new_secure_settings')
+
+    def __init__(self, new_algo: Optional['TypePasswordKdfAlgo']=None, new_password_hash: Optional[bytes]=None, hint: Optional[str]=None, email: Optional[str]=None, new_secure_settings: Optional['TypeSecureSecretSettings']=None):
+        """
+        Constructor for account.PasswordInputSettings: Instance of PasswordInputSettings.
+        """
+        self.new_algo = new_algo
+        self.new_password_hash = new_password_hash
+        self.hint = hint
+        self.email = email
+        self.new_secure_settings = new_secure_settings
+
+    def to_dict(self):
+        return {
+            '_': 'PasswordInputSettings',
+            'new_algo': self.new_algo.to_dict() if isinstance(self.new_algo, TLObject) else self.new_algo,
+            'new_password_hash': self.new_password_hash,
+            'hint': self.hint,
+            'email': self.email,
+            'new_secure_settings': self.new_secure_settings.to_dict() if isinstance(self.new_secure_settings, TLObject) else self.new_secure_settings
+        }
+
+    def _bytes(self):
+        assert ((self.new_algo or self.new_algo is not None) and (self.new_password_hash or self.new_password_hash is not None) and (self.hint or self.hint is not None)) or ((self.new_algo is None or self.new_algo is False) and (self.new_password_hash is None or self.new_password_hash is False) and (self.hint is None or self.hint is False)), 'new_algo, new_password_hash, hint parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b"\xc9'7\xc2",
+            struct.pack('<I', (0 if self.new_algo is None or self.new_algo is False else 1) | (0 if self.new_password_hash is None or self.new_password_hash is False else 1) | (0 if self.hint is None or self.hint is False else 1) | (0 if self.email is None or self.email is False else 2) | (0 if self.new_secure_settings is None or self.new_secure_settings is False else 4)),
+            b'' if self.new_algo is None or self.new_algo is False else (self.new_algo._bytes()),
+            b'' if self.new_password_hash is None or self.new_password_hash is False else (self.serialize_bytes(self.new_password_hash)),
+            b'' if self.hint is None or self.hint is False else (self.serialize_bytes(self.hint)),
+            b'' if self.email is None or self.email is False else (self.serialize_bytes(self.email)),
+            b'' if self.new_secure_settings is None or self.new_secure_settings is False else (self.new_secure_settings._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _new_algo = reader.tgread_object()
+        else:
+            _new_algo = None
+        if flags & 1:
+            _new_password_hash = reader.tgread_bytes()
+        else:
+            _new_password_hash = None
+        if flags & 1:
+            _hint = reader.tgread_string()
+        else:
+            _hint = None
+        if flags & 2:
+            _email = reader.tgread_string()
+        else:
+            _email = None
+        if flags & 4:
+            _new_secure_settings = reader.tgread_object()
+        else:
+            _new_secure_settings = None
+        return cls(new_algo=_new_algo, new_password_hash=_new_password_hash, hint=_hint, email=_email, new_secure_settings=_new_secure_settings)
+
@@ -0,0 +1,52 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSecureSecretSettings
+
+
+
+class PasswordSettings(TLObject):
+    CONSTRUCTOR_ID = 0x9a5c33e5
+    SUBCLASS_OF_ID = 0xd23fb078
+    __slots__ = ('email', 'secure_settings')
+
+    def __init__(self, email: Optional[str]=None, secure_settings: Optional['TypeSecureSecretSettings']=None):
+        """
+        Constructor for account.PasswordSettings: Instance of PasswordSettings.
+        """
+        self.email = email
+        self.secure_settings = secure_settings
+
+    def to_dict(self):
+        return {
+            '_': 'PasswordSettings',
+            'email': self.email,
+            'secure_settings': self.secure_settings.to_dict() if isinstance(self.secure_settings, TLObject) else self.secure_settings
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe53\\\x9a',
+            struct.pack('<I', (0 if self.email is None or self.email is False else 1) | (0 if self.secure_settings is None or self.secure_settings is False else 2)),
+            b'' if self.email is None or self.email is False else (self.serialize_bytes(self.email)),
+            b'' if self.secure_settings is None or self.secure_settings is False else (self.secure_settings._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _email = reader.tgread_string()
+        else:
+            _email = None
+        if flags & 2:
+            _secure_settings = reader.tgread_object()
+        else:
+            _secure_settings = None
+        return cls(email=_email, secure_settings=_secure_settings)
+
@@ -0,0 +1,85 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ResetPasswordFailedWait(TLObject):
+    CONSTRUCTOR_ID = 0xe3779861
+    SUBCLASS_OF_ID = 0x49507416
+    __slots__ = ('retry_date',)
+
+    def __init__(self, retry_date: Optional[datetime]):
+        """
+        Constructor for account.ResetPasswordResult: Instance of either ResetPasswordFailedWait, ResetPasswordRequestedWait, ResetPasswordOk.
+        """
+        self.retry_date = retry_date
+
+    def to_dict(self):
+        return {
+            '_': 'ResetPasswordFailedWait',
+            'retry_date': self.retry_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'a\x98w\xe3',
+            self.serialize_datetime(self.retry_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _retry_date = reader.tgread_date()
+        return cls(retry_date=_retry_date)
+
+
+class ResetPasswordOk(TLObject):
+    CONSTRUCTOR_ID = 0xe926d63e
+    SUBCLASS_OF_ID = 0x49507416
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ResetPasswordOk'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'>\xd6&\xe9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class ResetPasswordRequestedWait(TLObject):
+    CONSTRUCTOR_ID = 0xe9effc7d
+    SUBCLASS_OF_ID = 0x49507416
+    __slots__ = ('until_date',)
+
+    def __init__(self, until_date: Optional[datetime]):
+        """
+        Constructor for account.ResetPasswordResult: Instance of either ResetPasswordFailedWait, ResetPasswordRequestedWait, ResetPasswordOk.
+        """
+        self.until_date = until_date
+
+    def to_dict(self):
+        return {
+            '_': 'ResetPasswordRequestedWait',
+            'until_date': self.until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'}\xfc\xef\xe9',
+            self.serialize_datetime(self.until_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _until_date = reader.tgread_date()
+        return cls(until_date=_until_date)
+
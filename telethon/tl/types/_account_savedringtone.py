@@ -0,0 +1,59 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument
+
+
+
+class SavedRingtone(TLObject):
+    CONSTRUCTOR_ID = 0xb7263f6d
+    SUBCLASS_OF_ID = 0xb1e28424
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SavedRingtone'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'm?&\xb7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SavedRingtoneConverted(TLObject):
+    CONSTRUCTOR_ID = 0x1f307eb7
+    SUBCLASS_OF_ID = 0xb1e28424
+    __slots__ = ('document',)
+
+    def __init__(self, document: 'TypeDocument'):
+        """
+        Constructor for account.SavedRingtone: Instance of either SavedRingtone, SavedRingtoneConverted.
+        """
+        self.document = document
+
+    def to_dict(self):
+        return {
+            '_': 'SavedRingtoneConverted',
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb7~0\x1f',
+            self.document._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _document = reader.tgread_object()
+        return cls(document=_document)
+
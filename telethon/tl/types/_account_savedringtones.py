@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument
+
+
+
+class SavedRingtones(TLObject):
+    CONSTRUCTOR_ID = 0xc1e92cc5
+    SUBCLASS_OF_ID = 0x27bcc95e
+    __slots__ = ('hash', 'ringtones')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, ringtones: List['TypeDocument']):
+        """
+        Constructor for account.SavedRingtones: Instance of either SavedRingtonesNotModified, SavedRingtones.
+        """
+        self.hash = hash
+        self.ringtones = ringtones
+
+    def to_dict(self):
+        return {
+            '_': 'SavedRingtones',
+            'hash': self.hash,
+            'ringtones': [] if self.ringtones is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.ringtones]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc5,\xe9\xc1',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.ringtones)),b''.join(x._bytes() for x in self.ringtones),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _ringtones = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _ringtones.append(_x)
+
+        return cls(hash=_hash, ringtones=_ringtones)
+
+
+class SavedRingtonesNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xfbf6e8b1
+    SUBCLASS_OF_ID = 0x27bcc95e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SavedRingtonesNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb1\xe8\xf6\xfb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,40 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SentEmailCode(TLObject):
+    CONSTRUCTOR_ID = 0x811f854f
+    SUBCLASS_OF_ID = 0x69f3c06e
+    __slots__ = ('email_pattern', 'length')
+
+    def __init__(self, email_pattern: str, length: int):
+        """
+        Constructor for account.SentEmailCode: Instance of SentEmailCode.
+        """
+        self.email_pattern = email_pattern
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'SentEmailCode',
+            'email_pattern': self.email_pattern,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\x85\x1f\x81',
+            self.serialize_bytes(self.email_pattern),
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _email_pattern = reader.tgread_string()
+        _length = reader.read_int()
+        return cls(email_pattern=_email_pattern, length=_length)
+
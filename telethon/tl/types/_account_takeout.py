@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class Takeout(TLObject):
+    CONSTRUCTOR_ID = 0x4dba4501
+    SUBCLASS_OF_ID = 0x843ebe85
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for account.Takeout: Instance of Takeout.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'Takeout',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x01E\xbaM',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeTheme
+
+
+
+class Themes(TLObject):
+    CONSTRUCTOR_ID = 0x9a3d8c6d
+    SUBCLASS_OF_ID = 0x7fc52204
+    __slots__ = ('hash', 'themes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, themes: List['TypeTheme']):
+        """
+        Constructor for account.Themes: Instance of either ThemesNotModified, Themes.
+        """
+        self.hash = hash
+        self.themes = themes
+
+    def to_dict(self):
+        return {
+            '_': 'Themes',
+            'hash': self.hash,
+            'themes': [] if self.themes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.themes]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'm\x8c=\x9a',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.themes)),b''.join(x._bytes() for x in self.themes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _themes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _themes.append(_x)
+
+        return cls(hash=_hash, themes=_themes)
+
+
+class ThemesNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xf41eb622
+    SUBCLASS_OF_ID = 0x7fc52204
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ThemesNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'"\xb6\x1e\xf4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
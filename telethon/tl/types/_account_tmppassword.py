@@ -0,0 +1,40 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class TmpPassword(TLObject):
+    CONSTRUCTOR_ID = 0xdb64fd34
+    SUBCLASS_OF_ID = 0xb064992d
+    __slots__ = ('tmp_password', 'valid_until')
+
+    def __init__(self, tmp_password: bytes, valid_until: Optional[datetime]):
+        """
+        Constructor for account.TmpPassword: Instance of TmpPassword.
+        """
+        self.tmp_password = tmp_password
+        self.valid_until = valid_until
+
+    def to_dict(self):
+        return {
+            '_': 'TmpPassword',
+            'tmp_password': self.tmp_password,
+            'valid_until': self.valid_until
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'4\xfdd\xdb',
+            self.serialize_bytes(self.tmp_password),
+            self.serialize_datetime(self.valid_until),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _tmp_password = reader.tgread_bytes()
+        _valid_until = reader.tgread_date()
+        return cls(tmp_password=_tmp_password, valid_until=_valid_until)
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeWallPaper
+
+
+
+class WallPapers(TLObject):
+    CONSTRUCTOR_ID = 0xcdc3858c
+    SUBCLASS_OF_ID = 0xa2c548fd
+    __slots__ = ('hash', 'wallpapers')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, wallpapers: List['TypeWallPaper']):
+        """
+        Constructor for account.WallPapers: Instance of either WallPapersNotModified, WallPapers.
+        """
+        self.hash = hash
+        self.wallpapers = wallpapers
+
+    def to_dict(self):
+        return {
+            '_': 'WallPapers',
+            'hash': self.hash,
+            'wallpapers': [] if self.wallpapers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.wallpapers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8c\x85\xc3\xcd',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.wallpapers)),b''.join(x._bytes() for x in self.wallpapers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _wallpapers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _wallpapers.append(_x)
+
+        return cls(hash=_hash, wallpapers=_wallpapers)
+
+
+class WallPapersNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x1c199183
+    SUBCLASS_OF_ID = 0xa2c548fd
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'WallPapersNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x83\x91\x19\x1c',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUser, TypeWebAuthorization
+
+
+
+class WebAuthorizations(TLObject):
+    CONSTRUCTOR_ID = 0xed56c9fc
+    SUBCLASS_OF_ID = 0x9a365b32
+    __slots__ = ('authorizations', 'users')
+
+    def __init__(self, authorizations: List['TypeWebAuthorization'], users: List['TypeUser']):
+        """
+        Constructor for account.WebAuthorizations: Instance of WebAuthorizations.
+        """
+        self.authorizations = authorizations
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'WebAuthorizations',
+            'authorizations': [] if self.authorizations is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.authorizations],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfc\xc9V\xed',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.authorizations)),b''.join(x._bytes() for x in self.authorizations),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _authorizations = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _authorizations.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(authorizations=_authorizations, users=_users)
+
@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class AccountDaysTTL(TLObject):
+    CONSTRUCTOR_ID = 0xb8d0afdf
+    SUBCLASS_OF_ID = 0xbaa39d88
+    __slots__ = ('days',)
+
+    def __init__(self, days: int):
+        """
+        Constructor for AccountDaysTTL: Instance of AccountDaysTTL.
+        """
+        self.days = days
+
+    def to_dict(self):
+        return {
+            '_': 'AccountDaysTTL',
+            'days': self.days
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdf\xaf\xd0\xb8',
+            struct.pack('<i', self.days),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _days = reader.read_int()
+        return cls(days=_days)
+
+TypeAccountDaysTTL = AccountDaysTTL
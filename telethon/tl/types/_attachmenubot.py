@@ -0,0 +1,87 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeAttachMenuBotIcon, TypeAttachMenuPeerType
+
+
+
+class AttachMenuBot(TLObject):
+    CONSTRUCTOR_ID = 0xd90d8dfe
+    SUBCLASS_OF_ID = 0x9f087446
+    __slots__ = ('bot_id', 'short_name', 'icons', 'inactive', 'has_settings', 'request_write_access', 'show_in_attach_menu', 'show_in_side_menu', 'side_menu_disclaimer_needed', 'peer_types')
+
+    def __init__(self, bot_id: int, short_name: str, icons: List['TypeAttachMenuBotIcon'], inactive: Optional[bool]=None, has_settings: Optional[bool]=None, request_write_access: Optional[bool]=None, show_in_attach_menu: Optional[bool]=None, show_in_side_menu: Optional[bool]=None, side_menu_disclaimer_needed: Optional[bool]=None, peer_types: Optional[List['TypeAttachMenuPeerType']]=None):
+        """
+        Constructor for AttachMenuBot: Instance of AttachMenuBot.
+        """
+        self.bot_id = bot_id
+        self.short_name = short_name
+        self.icons = icons
+        self.inactive = inactive
+        self.has_settings = has_settings
+        self.request_write_access = request_write_access
+        self.show_in_attach_menu = show_in_attach_menu
+        self.show_in_side_menu = show_in_side_menu
+        self.side_menu_disclaimer_needed = side_menu_disclaimer_needed
+        self.peer_types = peer_types
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuBot',
+            'bot_id': self.bot_id,
+            'short_name': self.short_name,
+            'icons': [] if self.icons is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.icons],
+            'inactive': self.inactive,
+            'has_settings': self.has_settings,
+            'request_write_access': self.request_write_access,
+            'show_in_attach_menu': self.show_in_attach_menu,
+            'show_in_side_menu': self.show_in_side_menu,
+            'side_menu_disclaimer_needed': self.side_menu_disclaimer_needed,
+            'peer_types': [] if self.peer_types is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peer_types]
+        }
+
+    def _bytes(self):
+        assert ((self.show_in_attach_menu or self.show_in_attach_menu is not None) and (self.peer_types or self.peer_types is not None)) or ((self.show_in_attach_menu is None or self.show_in_attach_menu is False) and (self.peer_types is None or self.peer_types is False)), 'show_in_attach_menu, peer_types parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xfe\x8d\r\xd9',
+            _struct_Iq.pack((0 if self.inactive is None or self.inactive is False else 1) | (0 if self.has_settings is None or self.has_settings is False else 2) | (0 if self.request_write_access is None or self.request_write_access is False else 4) | (0 if self.show_in_attach_menu is None or self.show_in_attach_menu is False else 8) | (0 if self.show_in_side_menu is None or self.show_in_side_menu is False else 16) | (0 if self.side_menu_disclaimer_needed is None or self.side_menu_disclaimer_needed is False else 32) | (0 if self.peer_types is None or self.peer_types is False else 8), self.bot_id),
+            self.serialize_bytes(self.short_name),
+            b'' if self.peer_types is None or self.peer_types is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peer_types)),b''.join(x._bytes() for x in self.peer_types))),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.icons)),b''.join(x._bytes() for x in self.icons),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _bot_id = reader.read_struct(_struct_iq)
+        _inactive = bool(flags & 1)
+        _has_settings = bool(flags & 2)
+        _request_write_access = bool(flags & 4)
+        _show_in_attach_menu = bool(flags & 8)
+        _show_in_side_menu = bool(flags & 16)
+        _side_menu_disclaimer_needed = bool(flags & 32)
+        _short_name = reader.tgread_string()
+        if flags & 8:
+            reader.read_int()
+            _peer_types = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _peer_types.append(_x)
+
+        else:
+            _peer_types = None
+        reader.read_int()
+        _icons = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _icons.append(_x)
+
+        return cls(bot_id=_bot_id, short_name=_short_name, icons=_icons, inactive=_inactive, has_settings=_has_settings, request_write_access=_request_write_access, show_in_attach_menu=_show_in_attach_menu, show_in_side_menu=_show_in_side_menu, side_menu_disclaimer_needed=_side_menu_disclaimer_needed, peer_types=_peer_types)
+
+TypeAttachMenuBot = AttachMenuBot
@@ -0,0 +1,59 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAttachMenuBotIconColor, TypeDocument
+
+
+
+class AttachMenuBotIcon(TLObject):
+    CONSTRUCTOR_ID = 0xb2a7386b
+    SUBCLASS_OF_ID = 0x80484555
+    __slots__ = ('name', 'icon', 'colors')
+
+    def __init__(self, name: str, icon: 'TypeDocument', colors: Optional[List['TypeAttachMenuBotIconColor']]=None):
+        """
+        Constructor for AttachMenuBotIcon: Instance of AttachMenuBotIcon.
+        """
+        self.name = name
+        self.icon = icon
+        self.colors = colors
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuBotIcon',
+            'name': self.name,
+            'icon': self.icon.to_dict() if isinstance(self.icon, TLObject) else self.icon,
+            'colors': [] if self.colors is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.colors]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'k8\xa7\xb2',
+            struct.pack('<I', (0 if self.colors is None or self.colors is False else 1)),
+            self.serialize_bytes(self.name),
+            self.icon._bytes(),
+            b'' if self.colors is None or self.colors is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.colors)),b''.join(x._bytes() for x in self.colors))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _name = reader.tgread_string()
+        _icon = reader.tgread_object()
+        if flags & 1:
+            reader.read_int()
+            _colors = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _colors.append(_x)
+
+        else:
+            _colors = None
+        return cls(name=_name, icon=_icon, colors=_colors)
+
+TypeAttachMenuBotIcon = AttachMenuBotIcon
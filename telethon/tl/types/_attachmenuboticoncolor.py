@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class AttachMenuBotIconColor(TLObject):
+    CONSTRUCTOR_ID = 0x4576f3f0
+    SUBCLASS_OF_ID = 0xbea4cb6a
+    __slots__ = ('name', 'color')
+
+    def __init__(self, name: str, color: int):
+        """
+        Constructor for AttachMenuBotIconColor: Instance of AttachMenuBotIconColor.
+        """
+        self.name = name
+        self.color = color
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuBotIconColor',
+            'name': self.name,
+            'color': self.color
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf0\xf3vE',
+            self.serialize_bytes(self.name),
+            struct.pack('<i', self.color),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _name = reader.tgread_string()
+        _color = reader.read_int()
+        return cls(name=_name, color=_color)
+
+TypeAttachMenuBotIconColor = AttachMenuBotIconColor
@@ -0,0 +1,79 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAttachMenuBot, TypeUser
+
+
+
+class AttachMenuBots(TLObject):
+    CONSTRUCTOR_ID = 0x3c4301c0
+    SUBCLASS_OF_ID = 0x842e23da
+    __slots__ = ('hash', 'bots', 'users')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, bots: List['TypeAttachMenuBot'], users: List['TypeUser']):
+        """
+        Constructor for AttachMenuBots: Instance of either AttachMenuBotsNotModified, AttachMenuBots.
+        """
+        self.hash = hash
+        self.bots = bots
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuBots',
+            'hash': self.hash,
+            'bots': [] if self.bots is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.bots],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc0\x01C<',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.bots)),b''.join(x._bytes() for x in self.bots),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _bots = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _bots.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(hash=_hash, bots=_bots, users=_users)
+
+
+class AttachMenuBotsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xf1d88a5c
+    SUBCLASS_OF_ID = 0x842e23da
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuBotsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\\x8a\xd8\xf1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeAttachMenuBots = Union[AttachMenuBotsNotModified,AttachMenuBots]
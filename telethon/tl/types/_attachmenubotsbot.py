@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAttachMenuBot, TypeUser
+
+
+
+class AttachMenuBotsBot(TLObject):
+    CONSTRUCTOR_ID = 0x93bf667f
+    SUBCLASS_OF_ID = 0xdb33883d
+    __slots__ = ('bot', 'users')
+
+    def __init__(self, bot: 'TypeAttachMenuBot', users: List['TypeUser']):
+        """
+        Constructor for AttachMenuBotsBot: Instance of AttachMenuBotsBot.
+        """
+        self.bot = bot
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuBotsBot',
+            'bot': self.bot.to_dict() if isinstance(self.bot, TLObject) else self.bot,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7ff\xbf\x93',
+            self.bot._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _bot = reader.tgread_object()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(bot=_bot, users=_users)
+
+TypeAttachMenuBotsBot = AttachMenuBotsBot
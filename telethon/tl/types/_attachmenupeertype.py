@@ -0,0 +1,108 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class AttachMenuPeerTypeBotPM(TLObject):
+    CONSTRUCTOR_ID = 0xc32bfa1a
+    SUBCLASS_OF_ID = 0xd1d886d0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuPeerTypeBotPM'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1a\xfa+\xc3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class AttachMenuPeerTypeBroadcast(TLObject):
+    CONSTRUCTOR_ID = 0x7bfbdefc
+    SUBCLASS_OF_ID = 0xd1d886d0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuPeerTypeBroadcast'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfc\xde\xfb{',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class AttachMenuPeerTypeChat(TLObject):
+    CONSTRUCTOR_ID = 0x509113f
+    SUBCLASS_OF_ID = 0xd1d886d0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuPeerTypeChat'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?\x11\t\x05',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class AttachMenuPeerTypePM(TLObject):
+    CONSTRUCTOR_ID = 0xf146d31f
+    SUBCLASS_OF_ID = 0xd1d886d0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuPeerTypePM'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1f\xd3F\xf1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class AttachMenuPeerTypeSameBotPM(TLObject):
+    CONSTRUCTOR_ID = 0x7d6be90e
+    SUBCLASS_OF_ID = 0xd1d886d0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AttachMenuPeerTypeSameBotPM'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0e\xe9k}',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeAttachMenuPeerType = Union[AttachMenuPeerTypeSameBotPM,AttachMenuPeerTypeBotPM,AttachMenuPeerTypePM,AttachMenuPeerTypeChat,AttachMenuPeerTypeBroadcast]
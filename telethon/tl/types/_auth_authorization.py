@@ -0,0 +1,103 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUser
+    from ...tl.types.help import TypeTermsOfService
+
+
+
+class Authorization(TLObject):
+    CONSTRUCTOR_ID = 0x2ea2c0d4
+    SUBCLASS_OF_ID = 0xb9e04e39
+    __slots__ = ('user', 'setup_password_required', 'otherwise_relogin_days', 'tmp_sessions', 'future_auth_token')
+
+    def __init__(self, user: 'TypeUser', setup_password_required: Optional[bool]=None, otherwise_relogin_days: Optional[int]=None, tmp_sessions: Optional[int]=None, future_auth_token: Optional[bytes]=None):
+        """
+        Constructor for auth.Authorization: Instance of either Authorization, AuthorizationSignUpRequired.
+        """
+        self.user = user
+        self.setup_password_required = setup_password_required
+        self.otherwise_relogin_days = otherwise_relogin_days
+        self.tmp_sessions = tmp_sessions
+        self.future_auth_token = future_auth_token
+
+    def to_dict(self):
+        return {
+            '_': 'Authorization',
+            'user': self.user.to_dict() if isinstance(self.user, TLObject) else self.user,
+            'setup_password_required': self.setup_password_required,
+            'otherwise_relogin_days': self.otherwise_relogin_days,
+            'tmp_sessions': self.tmp_sessions,
+            'future_auth_token': self.future_auth_token
+        }
+
+    def _bytes(self):
+        assert ((self.setup_password_required or self.setup_password_required is not None) and (self.otherwise_relogin_days or self.otherwise_relogin_days is not None)) or ((self.setup_password_required is None or self.setup_password_required is False) and (self.otherwise_relogin_days is None or self.otherwise_relogin_days is False)), 'setup_password_required, otherwise_relogin_days parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xd4\xc0\xa2.',
+            struct.pack('<I', (0 if self.setup_password_required is None or self.setup_password_required is False else 2) | (0 if self.otherwise_relogin_days is None or self.otherwise_relogin_days is False else 2) | (0 if self.tmp_sessions is None or self.tmp_sessions is False else 1) | (0 if self.future_auth_token is None or self.future_auth_token is False else 4)),
+            b'' if self.otherwise_relogin_days is None or self.otherwise_relogin_days is False else (struct.pack('<i', self.otherwise_relogin_days)),
+            b'' if self.tmp_sessions is None or self.tmp_sessions is False else (struct.pack('<i', self.tmp_sessions)),
+            b'' if self.future_auth_token is None or self.future_auth_token is False else (self.serialize_bytes(self.future_auth_token)),
+            self.user._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _setup_password_required = bool(flags & 2)
+        if flags & 2:
+            _otherwise_relogin_days = reader.read_int()
+        else:
+            _otherwise_relogin_days = None
+        if flags & 1:
+            _tmp_sessions = reader.read_int()
+        else:
+            _tmp_sessions = None
+        if flags & 4:
+            _future_auth_token = reader.tgread_bytes()
+        else:
+            _future_auth_token = None
+        _user = reader.tgread_object()
+        return cls(user=_user, setup_password_required=_setup_password_required, otherwise_relogin_days=_otherwise_relogin_days, tmp_sessions=_tmp_sessions, future_auth_token=_future_auth_token)
+
+
+class AuthorizationSignUpRequired(TLObject):
+    CONSTRUCTOR_ID = 0x44747e9a
+    SUBCLASS_OF_ID = 0xb9e04e39
+    __slots__ = ('terms_of_service',)
+
+    def __init__(self, terms_of_service: Optional['TypeTermsOfService']=None):
+        """
+        Constructor for auth.Authorization: Instance of either Authorization, AuthorizationSignUpRequired.
+        """
+        self.terms_of_service = terms_of_service
+
+    def to_dict(self):
+        return {
+            '_': 'AuthorizationSignUpRequired',
+            'terms_of_service': self.terms_of_service.to_dict() if isinstance(self.terms_of_service, TLObject) else self.terms_of_service
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9a~tD',
+            struct.pack('<I', (0 if self.terms_of_service is None or self.terms_of_service is False else 1)),
+            b'' if self.terms_of_service is None or self.terms_of_service is False else (self.terms_of_service._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _terms_of_service = reader.tgread_object()
+        else:
+            _terms_of_service = None
+        return cls(terms_of_service=_terms_of_service)
+
@@ -0,0 +1,107 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class CodeTypeCall(TLObject):
+    CONSTRUCTOR_ID = 0x741cd3e3
+    SUBCLASS_OF_ID = 0xb3f3e401
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'CodeTypeCall'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe3\xd3\x1ct',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class CodeTypeFlashCall(TLObject):
+    CONSTRUCTOR_ID = 0x226ccefb
+    SUBCLASS_OF_ID = 0xb3f3e401
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'CodeTypeFlashCall'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfb\xcel"',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class CodeTypeFragmentSms(TLObject):
+    CONSTRUCTOR_ID = 0x6ed998c
+    SUBCLASS_OF_ID = 0xb3f3e401
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'CodeTypeFragmentSms'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8c\x99\xed\x06',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class CodeTypeMissedCall(TLObject):
+    CONSTRUCTOR_ID = 0xd61ad6ee
+    SUBCLASS_OF_ID = 0xb3f3e401
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'CodeTypeMissedCall'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xee\xd6\x1a\xd6',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class CodeTypeSms(TLObject):
+    CONSTRUCTOR_ID = 0x72a3158c
+    SUBCLASS_OF_ID = 0xb3f3e401
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'CodeTypeSms'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8c\x15\xa3r',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ExportedAuthorization(TLObject):
+    CONSTRUCTOR_ID = 0xb434e2b8
+    SUBCLASS_OF_ID = 0x5fd1ec51
+    __slots__ = ('id', 'bytes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, bytes: bytes):
+        """
+        Constructor for auth.ExportedAuthorization: Instance of ExportedAuthorization.
+        """
+        self.id = id
+        self.bytes = bytes
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedAuthorization',
+            'id': self.id,
+            'bytes': self.bytes
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb8\xe24\xb4',
+            struct.pack('<q', self.id),
+            self.serialize_bytes(self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        _bytes = reader.tgread_bytes()
+        return cls(id=_id, bytes=_bytes)
+
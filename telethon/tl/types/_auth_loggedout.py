@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class LoggedOut(TLObject):
+    CONSTRUCTOR_ID = 0xc3a2835f
+    SUBCLASS_OF_ID = 0xa804315
+    __slots__ = ('future_auth_token',)
+
+    def __init__(self, future_auth_token: Optional[bytes]=None):
+        """
+        Constructor for auth.LoggedOut: Instance of LoggedOut.
+        """
+        self.future_auth_token = future_auth_token
+
+    def to_dict(self):
+        return {
+            '_': 'LoggedOut',
+            'future_auth_token': self.future_auth_token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'_\x83\xa2\xc3',
+            struct.pack('<I', (0 if self.future_auth_token is None or self.future_auth_token is False else 1)),
+            b'' if self.future_auth_token is None or self.future_auth_token is False else (self.serialize_bytes(self.future_auth_token)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _future_auth_token = reader.tgread_bytes()
+        else:
+            _future_auth_token = None
+        return cls(future_auth_token=_future_auth_token)
+
@@ -0,0 +1,105 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.auth import TypeAuthorization
+
+
+
+class LoginToken(TLObject):
+    CONSTRUCTOR_ID = 0x629f1980
+    SUBCLASS_OF_ID = 0x6b55f636
+    __slots__ = ('expires', 'token')
+
+    def __init__(self, expires: Optional[datetime], token: bytes):
+        """
+        Constructor for auth.LoginToken: Instance of either LoginToken, LoginTokenMigrateTo, LoginTokenSuccess.
+        """
+        self.expires = expires
+        self.token = token
+
+    def to_dict(self):
+        return {
+            '_': 'LoginToken',
+            'expires': self.expires,
+            'token': self.token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x80\x19\x9fb',
+            self.serialize_datetime(self.expires),
+            self.serialize_bytes(self.token),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _expires = reader.tgread_date()
+        _token = reader.tgread_bytes()
+        return cls(expires=_expires, token=_token)
+
+
+class LoginTokenMigrateTo(TLObject):
+    CONSTRUCTOR_ID = 0x68e9916
+    SUBCLASS_OF_ID = 0x6b55f636
+    __slots__ = ('dc_id', 'token')
+
+    def __init__(self, dc_id: int, token: bytes):
+        """
+        Constructor for auth.LoginToken: Instance of either LoginToken, LoginTokenMigrateTo, LoginTokenSuccess.
+        """
+        self.dc_id = dc_id
+        self.token = token
+
+    def to_dict(self):
+        return {
+            '_': 'LoginTokenMigrateTo',
+            'dc_id': self.dc_id,
+            'token': self.token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x16\x99\x8e\x06',
+            struct.pack('<i', self.dc_id),
+            self.serialize_bytes(self.token),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _dc_id = reader.read_int()
+        _token = reader.tgread_bytes()
+        return cls(dc_id=_dc_id, token=_token)
+
+
+class LoginTokenSuccess(TLObject):
+    CONSTRUCTOR_ID = 0x390d5c5e
+    SUBCLASS_OF_ID = 0x6b55f636
+    __slots__ = ('authorization',)
+
+    def __init__(self, authorization: 'TypeAuthorization'):
+        """
+        Constructor for auth.LoginToken: Instance of either LoginToken, LoginTokenMigrateTo, LoginTokenSuccess.
+        """
+        self.authorization = authorization
+
+    def to_dict(self):
+        return {
+            '_': 'LoginTokenSuccess',
+            'authorization': self.authorization.to_dict() if isinstance(self.authorization, TLObject) else self.authorization
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'^\\\r9',
+            self.authorization._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _authorization = reader.tgread_object()
+        return cls(authorization=_authorization)
+
@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PasswordRecovery(TLObject):
+    CONSTRUCTOR_ID = 0x137948a5
+    SUBCLASS_OF_ID = 0xfa72d43a
+    __slots__ = ('email_pattern',)
+
+    def __init__(self, email_pattern: str):
+        """
+        Constructor for auth.PasswordRecovery: Instance of PasswordRecovery.
+        """
+        self.email_pattern = email_pattern
+
+    def to_dict(self):
+        return {
+            '_': 'PasswordRecovery',
+            'email_pattern': self.email_pattern
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa5Hy\x13',
+            self.serialize_bytes(self.email_pattern),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _email_pattern = reader.tgread_string()
+        return cls(email_pattern=_email_pattern)
+
@@ -0,0 +1,123 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.auth import TypeAuthorization, TypeCodeType, TypeSentCodeType
+
+
+
+class SentCode(TLObject):
+    CONSTRUCTOR_ID = 0x5e002502
+    SUBCLASS_OF_ID = 0x6ce87081
+    __slots__ = ('type', 'phone_code_hash', 'next_type', 'timeout')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSentCodeType', phone_code_hash: str, next_type: Optional['TypeCodeType']=None, timeout: Optional[int]=None):
+        """
+        Constructor for auth.SentCode: Instance of either SentCode, SentCodeSuccess, SentCodePaymentRequired.
+        """
+        self.type = type
+        self.phone_code_hash = phone_code_hash
+        self.next_type = next_type
+        self.timeout = timeout
+
+    def to_dict(self):
+        return {
+            '_': 'SentCode',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'phone_code_hash': self.phone_code_hash,
+            'next_type': self.next_type.to_dict() if isinstance(self.next_type, TLObject) else self.next_type,
+            'timeout': self.timeout
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x02%\x00^',
+            struct.pack('<I', (0 if self.next_type is None or self.next_type is False else 2) | (0 if self.timeout is None or self.timeout is False else 4)),
+            self.type._bytes(),
+            self.serialize_bytes(self.phone_code_hash),
+            b'' if self.next_type is None or self.next_type is False else (self.next_type._bytes()),
+            b'' if self.timeout is None or self.timeout is False else (struct.pack('<i', self.timeout)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _type = reader.tgread_object()
+        _phone_code_hash = reader.tgread_string()
+        if flags & 2:
+            _next_type = reader.tgread_object()
+        else:
+            _next_type = None
+        if flags & 4:
+            _timeout = reader.read_int()
+        else:
+            _timeout = None
+        return cls(type=_type, phone_code_hash=_phone_code_hash, next_type=_next_type, timeout=_timeout)
+
+
+class SentCodePaymentRequired(TLObject):
+    CONSTRUCTOR_ID = 0xd7cef980
+    SUBCLASS_OF_ID = 0x6ce87081
+    __slots__ = ('store_product', 'phone_code_hash')
+
+    def __init__(self, store_product: str, phone_code_hash: str):
+        """
+        Constructor for auth.SentCode: Instance of either SentCode, SentCodeSuccess, SentCodePaymentRequired.
+        """
+        self.store_product = store_product
+        self.phone_code_hash = phone_code_hash
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodePaymentRequired',
+            'store_product': self.store_product,
+            'phone_code_hash': self.phone_code_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x80\xf9\xce\xd7',
+            self.serialize_bytes(self.store_product),
+            self.serialize_bytes(self.phone_code_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _store_product = reader.tgread_string()
+        _phone_code_hash = reader.tgread_string()
+        return cls(store_product=_store_product, phone_code_hash=_phone_code_hash)
+
+
+class SentCodeSuccess(TLObject):
+    CONSTRUCTOR_ID = 0x2390fe44
+    SUBCLASS_OF_ID = 0x6ce87081
+    __slots__ = ('authorization',)
+
+    def __init__(self, authorization: 'TypeAuthorization'):
+        """
+        Constructor for auth.SentCode: Instance of either SentCode, SentCodeSuccess, SentCodePaymentRequired.
+        """
+        self.authorization = authorization
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeSuccess',
+            'authorization': self.authorization.to_dict() if isinstance(self.authorization, TLObject) else self.authorization
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'D\xfe\x90#',
+            self.authorization._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _authorization = reader.tgread_object()
+        return cls(authorization=_authorization)
+
@@ -0,0 +1,418 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SentCodeTypeApp(TLObject):
+    CONSTRUCTOR_ID = 0x3dbb5986
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('length',)
+
+    def __init__(self, length: int):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeApp',
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x86Y\xbb=',
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _length = reader.read_int()
+        return cls(length=_length)
+
+
+class SentCodeTypeCall(TLObject):
+    CONSTRUCTOR_ID = 0x5353e5a7
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('length',)
+
+    def __init__(self, length: int):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeCall',
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa7\xe5SS',
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _length = reader.read_int()
+        return cls(length=_length)
+
+
+class SentCodeTypeEmailCode(TLObject):
+    CONSTRUCTOR_ID = 0xf450f59b
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('email_pattern', 'length', 'apple_signin_allowed', 'google_signin_allowed', 'reset_available_period', 'reset_pending_date')
+
+    def __init__(self, email_pattern: str, length: int, apple_signin_allowed: Optional[bool]=None, google_signin_allowed: Optional[bool]=None, reset_available_period: Optional[int]=None, reset_pending_date: Optional[datetime]=None):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.email_pattern = email_pattern
+        self.length = length
+        self.apple_signin_allowed = apple_signin_allowed
+        self.google_signin_allowed = google_signin_allowed
+        self.reset_available_period = reset_available_period
+        self.reset_pending_date = reset_pending_date
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeEmailCode',
+            'email_pattern': self.email_pattern,
+            'length': self.length,
+            'apple_signin_allowed': self.apple_signin_allowed,
+            'google_signin_allowed': self.google_signin_allowed,
+            'reset_available_period': self.reset_available_period,
+            'reset_pending_date': self.reset_pending_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9b\xf5P\xf4',
+            struct.pack('<I', (0 if self.apple_signin_allowed is None or self.apple_signin_allowed is False else 1) | (0 if self.google_signin_allowed is None or self.google_signin_allowed is False else 2) | (0 if self.reset_available_period is None or self.reset_available_period is False else 8) | (0 if self.reset_pending_date is None or self.reset_pending_date is False else 16)),
+            self.serialize_bytes(self.email_pattern),
+            struct.pack('<i', self.length),
+            b'' if self.reset_available_period is None or self.reset_available_period is False else (struct.pack('<i', self.reset_available_period)),
+            b'' if self.reset_pending_date is None or self.reset_pending_date is False else (self.serialize_datetime(self.reset_pending_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _apple_signin_allowed = bool(flags & 1)
+        _google_signin_allowed = bool(flags & 2)
+        _email_pattern = reader.tgread_string()
+        _length = reader.read_int()
+        if flags & 8:
+            _reset_available_period = reader.read_int()
+        else:
+            _reset_available_period = None
+        if flags & 16:
+            _reset_pending_date = reader.tgread_date()
+        else:
+            _reset_pending_date = None
+        return cls(email_pattern=_email_pattern, length=_length, apple_signin_allowed=_apple_signin_allowed, google_signin_allowed=_google_signin_allowed, reset_available_period=_reset_available_period, reset_pending_date=_reset_pending_date)
+
+
+class SentCodeTypeFirebaseSms(TLObject):
+    CONSTRUCTOR_ID = 0x9fd736
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('length', 'nonce', 'play_integrity_project_id', 'play_integrity_nonce', 'receipt', 'push_timeout')
+
+    def __init__(self, length: int, nonce: Optional[bytes]=None, play_integrity_project_id: Optional[int]=None, play_integrity_nonce: Optional[bytes]=None, receipt: Optional[str]=None, push_timeout: Optional[int]=None):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.length = length
+        self.nonce = nonce
+        self.play_integrity_project_id = play_integrity_project_id
+        self.play_integrity_nonce = play_integrity_nonce
+        self.receipt = receipt
+        self.push_timeout = push_timeout
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeFirebaseSms',
+            'length': self.length,
+            'nonce': self.nonce,
+            'play_integrity_project_id': self.play_integrity_project_id,
+            'play_integrity_nonce': self.play_integrity_nonce,
+            'receipt': self.receipt,
+            'push_timeout': self.push_timeout
+        }
+
+    def _bytes(self):
+        assert ((self.play_integrity_project_id or self.play_integrity_project_id is not None) and (self.play_integrity_nonce or self.play_integrity_nonce is not None)) or ((self.play_integrity_project_id is None or self.play_integrity_project_id is False) and (self.play_integrity_nonce is None or self.play_integrity_nonce is False)), 'play_integrity_project_id, play_integrity_nonce parameters must all be False-y (like None) or all me True-y'
+        assert ((self.receipt or self.receipt is not None) and (self.push_timeout or self.push_timeout is not None)) or ((self.receipt is None or self.receipt is False) and (self.push_timeout is None or self.push_timeout is False)), 'receipt, push_timeout parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'6\xd7\x9f\x00',
+            struct.pack('<I', (0 if self.nonce is None or self.nonce is False else 1) | (0 if self.play_integrity_project_id is None or self.play_integrity_project_id is False else 4) | (0 if self.play_integrity_nonce is None or self.play_integrity_nonce is False else 4) | (0 if self.receipt is None or self.receipt is False else 2) | (0 if self.push_timeout is None or self.push_timeout is False else 2)),
+            b'' if self.nonce is None or self.nonce is False else (self.serialize_bytes(self.nonce)),
+            b'' if self.play_integrity_project_id is None or self.play_integrity_project_id is False else (struct.pack('<q', self.play_integrity_project_id)),
+            b'' if self.play_integrity_nonce is None or self.play_integrity_nonce is False else (self.serialize_bytes(self.play_integrity_nonce)),
+            b'' if self.receipt is None or self.receipt is False else (self.serialize_bytes(self.receipt)),
+            b'' if self.push_timeout is None or self.push_timeout is False else (struct.pack('<i', self.push_timeout)),
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _nonce = reader.tgread_bytes()
+        else:
+            _nonce = None
+        if flags & 4:
+            _play_integrity_project_id = reader.read_long()
+        else:
+            _play_integrity_project_id = None
+        if flags & 4:
+            _play_integrity_nonce = reader.tgread_bytes()
+        else:
+            _play_integrity_nonce = None
+        if flags & 2:
+            _receipt = reader.tgread_string()
+        else:
+            _receipt = None
+        if flags & 2:
+            _push_timeout = reader.read_int()
+        else:
+            _push_timeout = None
+        _length = reader.read_int()
+        return cls(length=_length, nonce=_nonce, play_integrity_project_id=_play_integrity_project_id, play_integrity_nonce=_play_integrity_nonce, receipt=_receipt, push_timeout=_push_timeout)
+
+
+class SentCodeTypeFlashCall(TLObject):
+    CONSTRUCTOR_ID = 0xab03c6d9
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('pattern',)
+
+    def __init__(self, pattern: str):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.pattern = pattern
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeFlashCall',
+            'pattern': self.pattern
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9\xc6\x03\xab',
+            self.serialize_bytes(self.pattern),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pattern = reader.tgread_string()
+        return cls(pattern=_pattern)
+
+
+class SentCodeTypeFragmentSms(TLObject):
+    CONSTRUCTOR_ID = 0xd9565c39
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('url', 'length')
+
+    def __init__(self, url: str, length: int):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.url = url
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeFragmentSms',
+            'url': self.url,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'9\\V\xd9',
+            self.serialize_bytes(self.url),
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _length = reader.read_int()
+        return cls(url=_url, length=_length)
+
+
+class SentCodeTypeMissedCall(TLObject):
+    CONSTRUCTOR_ID = 0x82006484
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('prefix', 'length')
+
+    def __init__(self, prefix: str, length: int):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.prefix = prefix
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeMissedCall',
+            'prefix': self.prefix,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x84d\x00\x82',
+            self.serialize_bytes(self.prefix),
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _prefix = reader.tgread_string()
+        _length = reader.read_int()
+        return cls(prefix=_prefix, length=_length)
+
+
+class SentCodeTypeSetUpEmailRequired(TLObject):
+    CONSTRUCTOR_ID = 0xa5491dea
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('apple_signin_allowed', 'google_signin_allowed')
+
+    def __init__(self, apple_signin_allowed: Optional[bool]=None, google_signin_allowed: Optional[bool]=None):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.apple_signin_allowed = apple_signin_allowed
+        self.google_signin_allowed = google_signin_allowed
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeSetUpEmailRequired',
+            'apple_signin_allowed': self.apple_signin_allowed,
+            'google_signin_allowed': self.google_signin_allowed
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xea\x1dI\xa5',
+            struct.pack('<I', (0 if self.apple_signin_allowed is None or self.apple_signin_allowed is False else 1) | (0 if self.google_signin_allowed is None or self.google_signin_allowed is False else 2)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _apple_signin_allowed = bool(flags & 1)
+        _google_signin_allowed = bool(flags & 2)
+        return cls(apple_signin_allowed=_apple_signin_allowed, google_signin_allowed=_google_signin_allowed)
+
+
+class SentCodeTypeSms(TLObject):
+    CONSTRUCTOR_ID = 0xc000bba2
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('length',)
+
+    def __init__(self, length: int):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeSms',
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa2\xbb\x00\xc0',
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _length = reader.read_int()
+        return cls(length=_length)
+
+
+class SentCodeTypeSmsPhrase(TLObject):
+    CONSTRUCTOR_ID = 0xb37794af
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('beginning',)
+
+    def __init__(self, beginning: Optional[str]=None):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.beginning = beginning
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeSmsPhrase',
+            'beginning': self.beginning
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xaf\x94w\xb3',
+            struct.pack('<I', (0 if self.beginning is None or self.beginning is False else 1)),
+            b'' if self.beginning is None or self.beginning is False else (self.serialize_bytes(self.beginning)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _beginning = reader.tgread_string()
+        else:
+            _beginning = None
+        return cls(beginning=_beginning)
+
+
+class SentCodeTypeSmsWord(TLObject):
+    CONSTRUCTOR_ID = 0xa416ac81
+    SUBCLASS_OF_ID = 0xff5b158e
+    __slots__ = ('beginning',)
+
+    def __init__(self, beginning: Optional[str]=None):
+        """
+        Constructor for auth.SentCodeType: Instance of either SentCodeTypeApp, SentCodeTypeSms, SentCodeTypeCall, SentCodeTypeFlashCall, SentCodeTypeMissedCall, SentCodeTypeEmailCode, SentCodeTypeSetUpEmailRequired, SentCodeTypeFragmentSms, SentCodeTypeFirebaseSms, SentCodeTypeSmsWord, SentCodeTypeSmsPhrase.
+        """
+        self.beginning = beginning
+
+    def to_dict(self):
+        return {
+            '_': 'SentCodeTypeSmsWord',
+            'beginning': self.beginning
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x81\xac\x16\xa4',
+            struct.pack('<I', (0 if self.beginning is None or self.beginning is False else 1)),
+            b'' if self.beginning is None or self.beginning is False else (self.serialize_bytes(self.beginning)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _beginning = reader.tgread_string()
+        else:
+            _beginning = None
+        return cls(beginning=_beginning)
+
@@ -0,0 +1,103 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class Authorization(TLObject):
+    CONSTRUCTOR_ID = 0xad01d61d
+    SUBCLASS_OF_ID = 0xc913c01a
+    __slots__ = ('hash', 'device_model', 'platform', 'system_version', 'api_id', 'app_name', 'app_version', 'date_created', 'date_active', 'ip', 'country', 'region', 'current', 'official_app', 'password_pending', 'encrypted_requests_disabled', 'call_requests_disabled', 'unconfirmed')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, device_model: str, platform: str, system_version: str, api_id: int, app_name: str, app_version: str, date_created: Optional[datetime], date_active: Optional[datetime], ip: str, country: str, region: str, current: Optional[bool]=None, official_app: Optional[bool]=None, password_pending: Optional[bool]=None, encrypted_requests_disabled: Optional[bool]=None, call_requests_disabled: Optional[bool]=None, unconfirmed: Optional[bool]=None):
+        """
+        Constructor for Authorization: Instance of Authorization.
+        """
+        self.hash = hash
+        self.device_model = device_model
+        self.platform = platform
+        self.system_version = system_version
+        self.api_id = api_id
+        self.app_name = app_name
+        self.app_version = app_version
+        self.date_created = date_created
+        self.date_active = date_active
+        self.ip = ip
+        self.country = country
+        self.region = region
+        self.current = current
+        self.official_app = official_app
+        self.password_pending = password_pending
+        self.encrypted_requests_disabled = encrypted_requests_disabled
+        self.call_requests_disabled = call_requests_disabled
+        self.unconfirmed = unconfirmed
+
+    def to_dict(self):
+        return {
+            '_': 'Authorization',
+            'hash': self.hash,
+            'device_model': self.device_model,
+            'platform': self.platform,
+            'system_version': self.system_version,
+            'api_id': self.api_id,
+            'app_name': self.app_name,
+            'app_version': self.app_version,
+            'date_created': self.date_created,
+            'date_active': self.date_active,
+            'ip': self.ip,
+            'country': self.country,
+            'region': self.region,
+            'current': self.current,
+            'official_app': self.official_app,
+            'password_pending': self.password_pending,
+            'encrypted_requests_disabled': self.encrypted_requests_disabled,
+            'call_requests_disabled': self.call_requests_disabled,
+            'unconfirmed': self.unconfirmed
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1d\xd6\x01\xad',
+            _struct_Iq.pack((0 if self.current is None or self.current is False else 1) | (0 if self.official_app is None or self.official_app is False else 2) | (0 if self.password_pending is None or self.password_pending is False else 4) | (0 if self.encrypted_requests_disabled is None or self.encrypted_requests_disabled is False else 8) | (0 if self.call_requests_disabled is None or self.call_requests_disabled is False else 16) | (0 if self.unconfirmed is None or self.unconfirmed is False else 32), self.hash),
+            self.serialize_bytes(self.device_model),
+            self.serialize_bytes(self.platform),
+            self.serialize_bytes(self.system_version),
+            struct.pack('<i', self.api_id),
+            self.serialize_bytes(self.app_name),
+            self.serialize_bytes(self.app_version),
+            self.serialize_datetime(self.date_created),
+            self.serialize_datetime(self.date_active),
+            self.serialize_bytes(self.ip),
+            self.serialize_bytes(self.country),
+            self.serialize_bytes(self.region),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _hash = reader.read_struct(_struct_iq)
+        _current = bool(flags & 1)
+        _official_app = bool(flags & 2)
+        _password_pending = bool(flags & 4)
+        _encrypted_requests_disabled = bool(flags & 8)
+        _call_requests_disabled = bool(flags & 16)
+        _unconfirmed = bool(flags & 32)
+        _device_model = reader.tgread_string()
+        _platform = reader.tgread_string()
+        _system_version = reader.tgread_string()
+        _api_id = reader.read_int()
+        _app_name = reader.tgread_string()
+        _app_version = reader.tgread_string()
+        _date_created = reader.tgread_date()
+        _date_active = reader.tgread_date()
+        _ip = reader.tgread_string()
+        _country = reader.tgread_string()
+        _region = reader.tgread_string()
+        return cls(hash=_hash, device_model=_device_model, platform=_platform, system_version=_system_version, api_id=_api_id, app_name=_app_name, app_version=_app_version, date_created=_date_created, date_active=_date_active, ip=_ip, country=_country, region=_region, current=_current, official_app=_official_app, password_pending=_password_pending, encrypted_requests_disabled=_encrypted_requests_disabled, call_requests_disabled=_call_requests_disabled, unconfirmed=_unconfirmed)
+
+TypeAuthorization = Authorization
@@ -0,0 +1,65 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iiqqiii = struct.Struct('<Iiqqiii')
+_struct_iiqqiii = struct.Struct('<iiqqiii')
+
+
+class AutoDownloadSettings(TLObject):
+    CONSTRUCTOR_ID = 0xbaa57628
+    SUBCLASS_OF_ID = 0x512819c7
+    __slots__ = ('photo_size_max', 'video_size_max', 'file_size_max', 'video_upload_maxbitrate', 'small_queue_active_operations_max', 'large_queue_active_operations_max', 'disabled', 'video_preload_large', 'audio_preload_next', 'phonecalls_less_data', 'stories_preload')
+
+    def __init__(self, photo_size_max: int, video_size_max: int, file_size_max: int, video_upload_maxbitrate: int, small_queue_active_operations_max: int, large_queue_active_operations_max: int, disabled: Optional[bool]=None, video_preload_large: Optional[bool]=None, audio_preload_next: Optional[bool]=None, phonecalls_less_data: Optional[bool]=None, stories_preload: Optional[bool]=None):
+        """
+        Constructor for AutoDownloadSettings: Instance of AutoDownloadSettings.
+        """
+        self.photo_size_max = photo_size_max
+        self.video_size_max = video_size_max
+        self.file_size_max = file_size_max
+        self.video_upload_maxbitrate = video_upload_maxbitrate
+        self.small_queue_active_operations_max = small_queue_active_operations_max
+        self.large_queue_active_operations_max = large_queue_active_operations_max
+        self.disabled = disabled
+        self.video_preload_large = video_preload_large
+        self.audio_preload_next = audio_preload_next
+        self.phonecalls_less_data = phonecalls_less_data
+        self.stories_preload = stories_preload
+
+    def to_dict(self):
+        return {
+            '_': 'AutoDownloadSettings',
+            'photo_size_max': self.photo_size_max,
+            'video_size_max': self.video_size_max,
+            'file_size_max': self.file_size_max,
+            'video_upload_maxbitrate': self.video_upload_maxbitrate,
+            'small_queue_active_operations_max': self.small_queue_active_operations_max,
+            'large_queue_active_operations_max': self.large_queue_active_operations_max,
+            'disabled': self.disabled,
+            'video_preload_large': self.video_preload_large,
+            'audio_preload_next': self.audio_preload_next,
+            'phonecalls_less_data': self.phonecalls_less_data,
+            'stories_preload': self.stories_preload
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'(v\xa5\xba',
+            _struct_Iiqqiii.pack((0 if self.disabled is None or self.disabled is False else 1) | (0 if self.video_preload_large is None or self.video_preload_large is False else 2) | (0 if self.audio_preload_next is None or self.audio_preload_next is False else 4) | (0 if self.phonecalls_less_data is None or self.phonecalls_less_data is False else 8) | (0 if self.stories_preload is None or self.stories_preload is False else 16), self.photo_size_max, self.video_size_max, self.file_size_max, self.video_upload_maxbitrate, self.small_queue_active_operations_max, self.large_queue_active_operations_max),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _photo_size_max, _video_size_max, _file_size_max, _video_upload_maxbitrate, _small_queue_active_operations_max, _large_queue_active_operations_max = reader.read_struct(_struct_iiqqiii)
+        _disabled = bool(flags & 1)
+        _video_preload_large = bool(flags & 2)
+        _audio_preload_next = bool(flags & 4)
+        _phonecalls_less_data = bool(flags & 8)
+        _stories_preload = bool(flags & 16)
+        return cls(photo_size_max=_photo_size_max, video_size_max=_video_size_max, file_size_max=_file_size_max, video_upload_maxbitrate=_video_upload_maxbitrate, small_queue_active_operations_max=_small_queue_active_operations_max, large_queue_active_operations_max=_large_queue_active_operations_max, disabled=_disabled, video_preload_large=_video_preload_large, audio_preload_next=_audio_preload_next, phonecalls_less_data=_phonecalls_less_data, stories_preload=_stories_preload)
+
+TypeAutoDownloadSettings = AutoDownloadSettings
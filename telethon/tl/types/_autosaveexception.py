@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAutoSaveSettings, TypePeer
+
+
+
+class AutoSaveException(TLObject):
+    CONSTRUCTOR_ID = 0x81602d47
+    SUBCLASS_OF_ID = 0xdd868129
+    __slots__ = ('peer', 'settings')
+
+    def __init__(self, peer: 'TypePeer', settings: 'TypeAutoSaveSettings'):
+        """
+        Constructor for AutoSaveException: Instance of AutoSaveException.
+        """
+        self.peer = peer
+        self.settings = settings
+
+    def to_dict(self):
+        return {
+            '_': 'AutoSaveException',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'settings': self.settings.to_dict() if isinstance(self.settings, TLObject) else self.settings
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'G-`\x81',
+            self.peer._bytes(),
+            self.settings._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _settings = reader.tgread_object()
+        return cls(peer=_peer, settings=_settings)
+
+TypeAutoSaveException = AutoSaveException
@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class AutoSaveSettings(TLObject):
+    CONSTRUCTOR_ID = 0xc84834ce
+    SUBCLASS_OF_ID = 0xcd3b96e6
+    __slots__ = ('photos', 'videos', 'video_max_size')
+
+    def __init__(self, photos: Optional[bool]=None, videos: Optional[bool]=None, video_max_size: Optional[int]=None):
+        """
+        Constructor for AutoSaveSettings: Instance of AutoSaveSettings.
+        """
+        self.photos = photos
+        self.videos = videos
+        self.video_max_size = video_max_size
+
+    def to_dict(self):
+        return {
+            '_': 'AutoSaveSettings',
+            'photos': self.photos,
+            'videos': self.videos,
+            'video_max_size': self.video_max_size
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xce4H\xc8',
+            struct.pack('<I', (0 if self.photos is None or self.photos is False else 1) | (0 if self.videos is None or self.videos is False else 2) | (0 if self.video_max_size is None or self.video_max_size is False else 4)),
+            b'' if self.video_max_size is None or self.video_max_size is False else (struct.pack('<q', self.video_max_size)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _photos = bool(flags & 1)
+        _videos = bool(flags & 2)
+        if flags & 4:
+            _video_max_size = reader.read_long()
+        else:
+            _video_max_size = None
+        return cls(photos=_photos, videos=_videos, video_max_size=_video_max_size)
+
+TypeAutoSaveSettings = AutoSaveSettings
@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class AvailableEffect(TLObject):
+    CONSTRUCTOR_ID = 0x93c3e27e
+    SUBCLASS_OF_ID = 0x985a2f81
+    __slots__ = ('id', 'emoticon', 'effect_sticker_id', 'premium_required', 'static_icon_id', 'effect_animation_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, emoticon: str, effect_sticker_id: int, premium_required: Optional[bool]=None, static_icon_id: Optional[int]=None, effect_animation_id: Optional[int]=None):
+        """
+        Constructor for AvailableEffect: Instance of AvailableEffect.
+        """
+        self.id = id
+        self.emoticon = emoticon
+        self.effect_sticker_id = effect_sticker_id
+        self.premium_required = premium_required
+        self.static_icon_id = static_icon_id
+        self.effect_animation_id = effect_animation_id
+
+    def to_dict(self):
+        return {
+            '_': 'AvailableEffect',
+            'id': self.id,
+            'emoticon': self.emoticon,
+            'effect_sticker_id': self.effect_sticker_id,
+            'premium_required': self.premium_required,
+            'static_icon_id': self.static_icon_id,
+            'effect_animation_id': self.effect_animation_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\xe2\xc3\x93',
+            _struct_Iq.pack((0 if self.premium_required is None or self.premium_required is False else 4) | (0 if self.static_icon_id is None or self.static_icon_id is False else 1) | (0 if self.effect_animation_id is None or self.effect_animation_id is False else 2), self.id),
+            self.serialize_bytes(self.emoticon),
+            b'' if self.static_icon_id is None or self.static_icon_id is False else (struct.pack('<q', self.static_icon_id)),
+            struct.pack('<q', self.effect_sticker_id),
+            b'' if self.effect_animation_id is None or self.effect_animation_id is False else (struct.pack('<q', self.effect_animation_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _premium_required = bool(flags & 4)
+        _emoticon = reader.tgread_string()
+        if flags & 1:
+            _static_icon_id = reader.read_long()
+        else:
+            _static_icon_id = None
+        _effect_sticker_id = reader.read_long()
+        if flags & 2:
+            _effect_animation_id = reader.read_long()
+        else:
+            _effect_animation_id = None
+        return cls(id=_id, emoticon=_emoticon, effect_sticker_id=_effect_sticker_id, premium_required=_premium_required, static_icon_id=_static_icon_id, effect_animation_id=_effect_animation_id)
+
+TypeAvailableEffect = AvailableEffect
@@ -0,0 +1,88 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument
+
+
+
+class AvailableReaction(TLObject):
+    CONSTRUCTOR_ID = 0xc077ec01
+    SUBCLASS_OF_ID = 0x8c1c9d73
+    __slots__ = ('reaction', 'title', 'static_icon', 'appear_animation', 'select_animation', 'activate_animation', 'effect_animation', 'inactive', 'premium', 'around_animation', 'center_icon')
+
+    def __init__(self, reaction: str, title: str, static_icon: 'TypeDocument', appear_animation: 'TypeDocument', select_animation: 'TypeDocument', activate_animation: 'TypeDocument', effect_animation: 'TypeDocument', inactive: Optional[bool]=None, premium: Optional[bool]=None, around_animation: Optional['TypeDocument']=None, center_icon: Optional['TypeDocument']=None):
+        """
+        Constructor for AvailableReaction: Instance of AvailableReaction.
+        """
+        self.reaction = reaction
+        self.title = title
+        self.static_icon = static_icon
+        self.appear_animation = appear_animation
+        self.select_animation = select_animation
+        self.activate_animation = activate_animation
+        self.effect_animation = effect_animation
+        self.inactive = inactive
+        self.premium = premium
+        self.around_animation = around_animation
+        self.center_icon = center_icon
+
+    def to_dict(self):
+        return {
+            '_': 'AvailableReaction',
+            'reaction': self.reaction,
+            'title': self.title,
+            'static_icon': self.static_icon.to_dict() if isinstance(self.static_icon, TLObject) else self.static_icon,
+            'appear_animation': self.appear_animation.to_dict() if isinstance(self.appear_animation, TLObject) else self.appear_animation,
+            'select_animation': self.select_animation.to_dict() if isinstance(self.select_animation, TLObject) else self.select_animation,
+            'activate_animation': self.activate_animation.to_dict() if isinstance(self.activate_animation, TLObject) else self.activate_animation,
+            'effect_animation': self.effect_animation.to_dict() if isinstance(self.effect_animation, TLObject) else self.effect_animation,
+            'inactive': self.inactive,
+            'premium': self.premium,
+            'around_animation': self.around_animation.to_dict() if isinstance(self.around_animation, TLObject) else self.around_animation,
+            'center_icon': self.center_icon.to_dict() if isinstance(self.center_icon, TLObject) else self.center_icon
+        }
+
+    def _bytes(self):
+        assert ((self.around_animation or self.around_animation is not None) and (self.center_icon or self.center_icon is not None)) or ((self.around_animation is None or self.around_animation is False) and (self.center_icon is None or self.center_icon is False)), 'around_animation, center_icon parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\x01\xecw\xc0',
+            struct.pack('<I', (0 if self.inactive is None or self.inactive is False else 1) | (0 if self.premium is None or self.premium is False else 4) | (0 if self.around_animation is None or self.around_animation is False else 2) | (0 if self.center_icon is None or self.center_icon is False else 2)),
+            self.serialize_bytes(self.reaction),
+            self.serialize_bytes(self.title),
+            self.static_icon._bytes(),
+            self.appear_animation._bytes(),
+            self.select_animation._bytes(),
+            self.activate_animation._bytes(),
+            self.effect_animation._bytes(),
+            b'' if self.around_animation is None or self.around_animation is False else (self.around_animation._bytes()),
+            b'' if self.center_icon is None or self.center_icon is False else (self.center_icon._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _inactive = bool(flags & 1)
+        _premium = bool(flags & 4)
+        _reaction = reader.tgread_string()
+        _title = reader.tgread_string()
+        _static_icon = reader.tgread_object()
+        _appear_animation = reader.tgread_object()
+        _select_animation = reader.tgread_object()
+        _activate_animation = reader.tgread_object()
+        _effect_animation = reader.tgread_object()
+        if flags & 2:
+            _around_animation = reader.tgread_object()
+        else:
+            _around_animation = None
+        if flags & 2:
+            _center_icon = reader.tgread_object()
+        else:
+            _center_icon = None
+        return cls(reaction=_reaction, title=_title, static_icon=_static_icon, appear_animation=_appear_animation, select_animation=_select_animation, activate_animation=_activate_animation, effect_animation=_effect_animation, inactive=_inactive, premium=_premium, around_animation=_around_animation, center_icon=_center_icon)
+
+TypeAvailableReaction = AvailableReaction
@@ -0,0 +1,79 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qii = struct.Struct('<qii')
+_struct_qiiq = struct.Struct('<qiiq')
+
+
+class BadMsgNotification(TLObject):
+    CONSTRUCTOR_ID = 0xa7eff811
+    SUBCLASS_OF_ID = 0xcebaa157
+    __slots__ = ('bad_msg_id', 'bad_msg_seqno', 'error_code')
+
+    def __init__(self, bad_msg_id: int, bad_msg_seqno: int, error_code: int):
+        """
+        Constructor for BadMsgNotification: Instance of either BadMsgNotification, BadServerSalt.
+        """
+        self.bad_msg_id = bad_msg_id
+        self.bad_msg_seqno = bad_msg_seqno
+        self.error_code = error_code
+
+    def to_dict(self):
+        return {
+            '_': 'BadMsgNotification',
+            'bad_msg_id': self.bad_msg_id,
+            'bad_msg_seqno': self.bad_msg_seqno,
+            'error_code': self.error_code
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x11\xf8\xef\xa7',
+            _struct_qii.pack(self.bad_msg_id, self.bad_msg_seqno, self.error_code),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _bad_msg_id, _bad_msg_seqno, _error_code = reader.read_struct(_struct_qii)
+        return cls(bad_msg_id=_bad_msg_id, bad_msg_seqno=_bad_msg_seqno, error_code=_error_code)
+
+
+class BadServerSalt(TLObject):
+    CONSTRUCTOR_ID = 0xedab447b
+    SUBCLASS_OF_ID = 0xcebaa157
+    __slots__ = ('bad_msg_id', 'bad_msg_seqno', 'error_code', 'new_server_salt')
+
+    def __init__(self, bad_msg_id: int, bad_msg_seqno: int, error_code: int, new_server_salt: int):
+        """
+        Constructor for BadMsgNotification: Instance of either BadMsgNotification, BadServerSalt.
+        """
+        self.bad_msg_id = bad_msg_id
+        self.bad_msg_seqno = bad_msg_seqno
+        self.error_code = error_code
+        self.new_server_salt = new_server_salt
+
+    def to_dict(self):
+        return {
+            '_': 'BadServerSalt',
+            'bad_msg_id': self.bad_msg_id,
+            'bad_msg_seqno': self.bad_msg_seqno,
+            'error_code': self.error_code,
+            'new_server_salt': self.new_server_salt
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'{D\xab\xed',
+            _struct_qiiq.pack(self.bad_msg_id, self.bad_msg_seqno, self.error_code, self.new_server_salt),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _bad_msg_id, _bad_msg_seqno, _error_code, _new_server_salt = reader.read_struct(_struct_qiiq)
+        return cls(bad_msg_id=_bad_msg_id, bad_msg_seqno=_bad_msg_seqno, error_code=_error_code, new_server_salt=_new_server_salt)
+
+TypeBadMsgNotification = Union[BadMsgNotification,BadServerSalt]
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BankCardOpenUrl(TLObject):
+    CONSTRUCTOR_ID = 0xf568028a
+    SUBCLASS_OF_ID = 0xf2e2460e
+    __slots__ = ('url', 'name')
+
+    def __init__(self, url: str, name: str):
+        """
+        Constructor for BankCardOpenUrl: Instance of BankCardOpenUrl.
+        """
+        self.url = url
+        self.name = name
+
+    def to_dict(self):
+        return {
+            '_': 'BankCardOpenUrl',
+            'url': self.url,
+            'name': self.name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8a\x02h\xf5',
+            self.serialize_bytes(self.url),
+            self.serialize_bytes(self.name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _name = reader.tgread_string()
+        return cls(url=_url, name=_name)
+
+TypeBankCardOpenUrl = BankCardOpenUrl
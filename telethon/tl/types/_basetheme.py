@@ -0,0 +1,108 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BaseThemeArctic(TLObject):
+    CONSTRUCTOR_ID = 0x5b11125a
+    SUBCLASS_OF_ID = 0x1f03f444
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BaseThemeArctic'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Z\x12\x11[',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BaseThemeClassic(TLObject):
+    CONSTRUCTOR_ID = 0xc3a12462
+    SUBCLASS_OF_ID = 0x1f03f444
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BaseThemeClassic'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'b$\xa1\xc3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BaseThemeDay(TLObject):
+    CONSTRUCTOR_ID = 0xfbd81688
+    SUBCLASS_OF_ID = 0x1f03f444
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BaseThemeDay'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x88\x16\xd8\xfb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BaseThemeNight(TLObject):
+    CONSTRUCTOR_ID = 0xb7b31ea8
+    SUBCLASS_OF_ID = 0x1f03f444
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BaseThemeNight'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa8\x1e\xb3\xb7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BaseThemeTinted(TLObject):
+    CONSTRUCTOR_ID = 0x6d5f77ee
+    SUBCLASS_OF_ID = 0x1f03f444
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BaseThemeTinted'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeew_m',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeBaseTheme = Union[BaseThemeClassic,BaseThemeDay,BaseThemeNight,BaseThemeTinted,BaseThemeArctic]
@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qqqq = struct.Struct('<qqqq')
+
+
+class BindAuthKeyInner(TLObject):
+    CONSTRUCTOR_ID = 0x75a3f765
+    SUBCLASS_OF_ID = 0x2f099171
+    __slots__ = ('nonce', 'temp_auth_key_id', 'perm_auth_key_id', 'temp_session_id', 'expires_at')
+
+    def __init__(self, nonce: int, temp_auth_key_id: int, perm_auth_key_id: int, temp_session_id: int, expires_at: Optional[datetime]):
+        """
+        Constructor for BindAuthKeyInner: Instance of BindAuthKeyInner.
+        """
+        self.nonce = nonce
+        self.temp_auth_key_id = temp_auth_key_id
+        self.perm_auth_key_id = perm_auth_key_id
+        self.temp_session_id = temp_session_id
+        self.expires_at = expires_at
+
+    def to_dict(self):
+        return {
+            '_': 'BindAuthKeyInner',
+            'nonce': self.nonce,
+            'temp_auth_key_id': self.temp_auth_key_id,
+            'perm_auth_key_id': self.perm_auth_key_id,
+            'temp_session_id': self.temp_session_id,
+            'expires_at': self.expires_at
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'e\xf7\xa3u',
+            _struct_qqqq.pack(self.nonce, self.temp_auth_key_id, self.perm_auth_key_id, self.temp_session_id),
+            self.serialize_datetime(self.expires_at),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce, _temp_auth_key_id, _perm_auth_key_id, _temp_session_id = reader.read_struct(_struct_qqqq)
+        _expires_at = reader.tgread_date()
+        return cls(nonce=_nonce, temp_auth_key_id=_temp_auth_key_id, perm_auth_key_id=_perm_auth_key_id, temp_session_id=_temp_session_id, expires_at=_expires_at)
+
+TypeBindAuthKeyInner = BindAuthKeyInner
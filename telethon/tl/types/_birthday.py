@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iii = struct.Struct('<Iii')
+_struct_iii = struct.Struct('<iii')
+
+
+class Birthday(TLObject):
+    CONSTRUCTOR_ID = 0x6c8e1e06
+    SUBCLASS_OF_ID = 0xbe7fd664
+    __slots__ = ('day', 'month', 'year')
+
+    def __init__(self, day: int, month: int, year: Optional[int]=None):
+        """
+        Constructor for Birthday: Instance of Birthday.
+        """
+        self.day = day
+        self.month = month
+        self.year = year
+
+    def to_dict(self):
+        return {
+            '_': 'Birthday',
+            'day': self.day,
+            'month': self.month,
+            'year': self.year
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x06\x1e\x8el',
+            _struct_Iii.pack((0 if self.year is None or self.year is False else 1), self.day, self.month),
+            b'' if self.year is None or self.year is False else (struct.pack('<i', self.year)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _day, _month = reader.read_struct(_struct_iii)
+        if flags & 1:
+            _year = reader.read_int()
+        else:
+            _year = None
+        return cls(day=_day, month=_month, year=_year)
+
+TypeBirthday = Birthday
@@ -0,0 +1,94 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class Boost(TLObject):
+    CONSTRUCTOR_ID = 0x4b3e14d6
+    SUBCLASS_OF_ID = 0x97a5086c
+    __slots__ = ('id', 'date', 'expires', 'gift', 'giveaway', 'unclaimed', 'user_id', 'giveaway_msg_id', 'used_gift_slug', 'multiplier', 'stars')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, date: Optional[datetime], expires: Optional[datetime], gift: Optional[bool]=None, giveaway: Optional[bool]=None, unclaimed: Optional[bool]=None, user_id: Optional[int]=None, giveaway_msg_id: Optional[int]=None, used_gift_slug: Optional[str]=None, multiplier: Optional[int]=None, stars: Optional[int]=None):
+        """
+        Constructor for Boost: Instance of Boost.
+        """
+        self.id = id
+        self.date = date
+        self.expires = expires
+        self.gift = gift
+        self.giveaway = giveaway
+        self.unclaimed = unclaimed
+        self.user_id = user_id
+        self.giveaway_msg_id = giveaway_msg_id
+        self.used_gift_slug = used_gift_slug
+        self.multiplier = multiplier
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'Boost',
+            'id': self.id,
+            'date': self.date,
+            'expires': self.expires,
+            'gift': self.gift,
+            'giveaway': self.giveaway,
+            'unclaimed': self.unclaimed,
+            'user_id': self.user_id,
+            'giveaway_msg_id': self.giveaway_msg_id,
+            'used_gift_slug': self.used_gift_slug,
+            'multiplier': self.multiplier,
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        assert ((self.giveaway or self.giveaway is not None) and (self.giveaway_msg_id or self.giveaway_msg_id is not None)) or ((self.giveaway is None or self.giveaway is False) and (self.giveaway_msg_id is None or self.giveaway_msg_id is False)), 'giveaway, giveaway_msg_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xd6\x14>K',
+            struct.pack('<I', (0 if self.gift is None or self.gift is False else 2) | (0 if self.giveaway is None or self.giveaway is False else 4) | (0 if self.unclaimed is None or self.unclaimed is False else 8) | (0 if self.user_id is None or self.user_id is False else 1) | (0 if self.giveaway_msg_id is None or self.giveaway_msg_id is False else 4) | (0 if self.used_gift_slug is None or self.used_gift_slug is False else 16) | (0 if self.multiplier is None or self.multiplier is False else 32) | (0 if self.stars is None or self.stars is False else 64)),
+            self.serialize_bytes(self.id),
+            b'' if self.user_id is None or self.user_id is False else (struct.pack('<q', self.user_id)),
+            b'' if self.giveaway_msg_id is None or self.giveaway_msg_id is False else (struct.pack('<i', self.giveaway_msg_id)),
+            self.serialize_datetime(self.date),
+            self.serialize_datetime(self.expires),
+            b'' if self.used_gift_slug is None or self.used_gift_slug is False else (self.serialize_bytes(self.used_gift_slug)),
+            b'' if self.multiplier is None or self.multiplier is False else (struct.pack('<i', self.multiplier)),
+            b'' if self.stars is None or self.stars is False else (struct.pack('<q', self.stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _gift = bool(flags & 2)
+        _giveaway = bool(flags & 4)
+        _unclaimed = bool(flags & 8)
+        _id = reader.tgread_string()
+        if flags & 1:
+            _user_id = reader.read_long()
+        else:
+            _user_id = None
+        if flags & 4:
+            _giveaway_msg_id = reader.read_int()
+        else:
+            _giveaway_msg_id = None
+        _date = reader.tgread_date()
+        _expires = reader.tgread_date()
+        if flags & 16:
+            _used_gift_slug = reader.tgread_string()
+        else:
+            _used_gift_slug = None
+        if flags & 32:
+            _multiplier = reader.read_int()
+        else:
+            _multiplier = None
+        if flags & 64:
+            _stars = reader.read_long()
+        else:
+            _stars = None
+        return cls(id=_id, date=_date, expires=_expires, gift=_gift, giveaway=_giveaway, unclaimed=_unclaimed, user_id=_user_id, giveaway_msg_id=_giveaway_msg_id, used_gift_slug=_used_gift_slug, multiplier=_multiplier, stars=_stars)
+
+TypeBoost = Boost
@@ -0,0 +1,93 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypePhoto
+
+
+
+class BotApp(TLObject):
+    CONSTRUCTOR_ID = 0x95fcd1d6
+    SUBCLASS_OF_ID = 0x20f32ae
+    __slots__ = ('id', 'access_hash', 'short_name', 'title', 'description', 'photo', 'hash', 'document')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, short_name: str, title: str, description: str, photo: 'TypePhoto', hash: int, document: Optional['TypeDocument']=None):
+        """
+        Constructor for BotApp: Instance of either BotAppNotModified, BotApp.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.short_name = short_name
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.hash = hash
+        self.document = document
+
+    def to_dict(self):
+        return {
+            '_': 'BotApp',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'short_name': self.short_name,
+            'title': self.title,
+            'description': self.description,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'hash': self.hash,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd6\xd1\xfc\x95',
+            _struct_Iqq.pack((0 if self.document is None or self.document is False else 1), self.id, self.access_hash),
+            self.serialize_bytes(self.short_name),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            self.photo._bytes(),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+            struct.pack('<q', self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _short_name = reader.tgread_string()
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        _photo = reader.tgread_object()
+        if flags & 1:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        _hash = reader.read_long()
+        return cls(id=_id, access_hash=_access_hash, short_name=_short_name, title=_title, description=_description, photo=_photo, hash=_hash, document=_document)
+
+
+class BotAppNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x5da674b7
+    SUBCLASS_OF_ID = 0x20f32ae
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BotAppNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb7t\xa6]',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeBotApp = Union[BotAppNotModified,BotApp]
@@ -0,0 +1,71 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BotAppSettings(TLObject):
+    CONSTRUCTOR_ID = 0xc99b1950
+    SUBCLASS_OF_ID = 0x179e62e3
+    __slots__ = ('placeholder_path', 'background_color', 'background_dark_color', 'header_color', 'header_dark_color')
+
+    def __init__(self, placeholder_path: Optional[bytes]=None, background_color: Optional[int]=None, background_dark_color: Optional[int]=None, header_color: Optional[int]=None, header_dark_color: Optional[int]=None):
+        """
+        Constructor for BotAppSettings: Instance of BotAppSettings.
+        """
+        self.placeholder_path = placeholder_path
+        self.background_color = background_color
+        self.background_dark_color = background_dark_color
+        self.header_color = header_color
+        self.header_dark_color = header_dark_color
+
+    def to_dict(self):
+        return {
+            '_': 'BotAppSettings',
+            'placeholder_path': self.placeholder_path,
+            'background_color': self.background_color,
+            'background_dark_color': self.background_dark_color,
+            'header_color': self.header_color,
+            'header_dark_color': self.header_dark_color
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'P\x19\x9b\xc9',
+            struct.pack('<I', (0 if self.placeholder_path is None or self.placeholder_path is False else 1) | (0 if self.background_color is None or self.background_color is False else 2) | (0 if self.background_dark_color is None or self.background_dark_color is False else 4) | (0 if self.header_color is None or self.header_color is False else 8) | (0 if self.header_dark_color is None or self.header_dark_color is False else 16)),
+            b'' if self.placeholder_path is None or self.placeholder_path is False else (self.serialize_bytes(self.placeholder_path)),
+            b'' if self.background_color is None or self.background_color is False else (struct.pack('<i', self.background_color)),
+            b'' if self.background_dark_color is None or self.background_dark_color is False else (struct.pack('<i', self.background_dark_color)),
+            b'' if self.header_color is None or self.header_color is False else (struct.pack('<i', self.header_color)),
+            b'' if self.header_dark_color is None or self.header_dark_color is False else (struct.pack('<i', self.header_dark_color)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _placeholder_path = reader.tgread_bytes()
+        else:
+            _placeholder_path = None
+        if flags & 2:
+            _background_color = reader.read_int()
+        else:
+            _background_color = None
+        if flags & 4:
+            _background_dark_color = reader.read_int()
+        else:
+            _background_dark_color = None
+        if flags & 8:
+            _header_color = reader.read_int()
+        else:
+            _header_color = None
+        if flags & 16:
+            _header_dark_color = reader.read_int()
+        else:
+            _header_dark_color = None
+        return cls(placeholder_path=_placeholder_path, background_color=_background_color, background_dark_color=_background_dark_color, header_color=_header_color, header_dark_color=_header_dark_color)
+
+TypeBotAppSettings = BotAppSettings
@@ -0,0 +1,65 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBusinessBotRights
+
+
+
+class BotBusinessConnection(TLObject):
+    CONSTRUCTOR_ID = 0x8f34b2f5
+    SUBCLASS_OF_ID = 0x9b130546
+    __slots__ = ('connection_id', 'user_id', 'dc_id', 'date', 'disabled', 'rights')
+
+    def __init__(self, connection_id: str, user_id: int, dc_id: int, date: Optional[datetime], disabled: Optional[bool]=None, rights: Optional['TypeBusinessBotRights']=None):
+        """
+        Constructor for BotBusinessConnection: Instance of BotBusinessConnection.
+        """
+        self.connection_id = connection_id
+        self.user_id = user_id
+        self.dc_id = dc_id
+        self.date = date
+        self.disabled = disabled
+        self.rights = rights
+
+    def to_dict(self):
+        return {
+            '_': 'BotBusinessConnection',
+            'connection_id': self.connection_id,
+            'user_id': self.user_id,
+            'dc_id': self.dc_id,
+            'date': self.date,
+            'disabled': self.disabled,
+            'rights': self.rights.to_dict() if isinstance(self.rights, TLObject) else self.rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf5\xb24\x8f',
+            struct.pack('<I', (0 if self.disabled is None or self.disabled is False else 2) | (0 if self.rights is None or self.rights is False else 4)),
+            self.serialize_bytes(self.connection_id),
+            _struct_qi.pack(self.user_id, self.dc_id),
+            self.serialize_datetime(self.date),
+            b'' if self.rights is None or self.rights is False else (self.rights._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _disabled = bool(flags & 2)
+        _connection_id = reader.tgread_string()
+        _user_id, _dc_id = reader.read_struct(_struct_qi)
+        _date = reader.tgread_date()
+        if flags & 4:
+            _rights = reader.tgread_object()
+        else:
+            _rights = None
+        return cls(connection_id=_connection_id, user_id=_user_id, dc_id=_dc_id, date=_date, disabled=_disabled, rights=_rights)
+
+TypeBotBusinessConnection = BotBusinessConnection
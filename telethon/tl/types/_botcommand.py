@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BotCommand(TLObject):
+    CONSTRUCTOR_ID = 0xc27ac8c7
+    SUBCLASS_OF_ID = 0xe1e62c2
+    __slots__ = ('command', 'description')
+
+    def __init__(self, command: str, description: str):
+        """
+        Constructor for BotCommand: Instance of BotCommand.
+        """
+        self.command = command
+        self.description = description
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommand',
+            'command': self.command,
+            'description': self.description
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc7\xc8z\xc2',
+            self.serialize_bytes(self.command),
+            self.serialize_bytes(self.description),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _command = reader.tgread_string()
+        _description = reader.tgread_string()
+        return cls(command=_command, description=_description)
+
+TypeBotCommand = BotCommand
@@ -0,0 +1,182 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer, TypeInputUser
+
+
+
+class BotCommandScopeChatAdmins(TLObject):
+    CONSTRUCTOR_ID = 0xb9aa606a
+    SUBCLASS_OF_ID = 0x4baf5d10
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommandScopeChatAdmins'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'j`\xaa\xb9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BotCommandScopeChats(TLObject):
+    CONSTRUCTOR_ID = 0x6fe1a881
+    SUBCLASS_OF_ID = 0x4baf5d10
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommandScopeChats'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x81\xa8\xe1o',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BotCommandScopeDefault(TLObject):
+    CONSTRUCTOR_ID = 0x2f6cb2ab
+    SUBCLASS_OF_ID = 0x4baf5d10
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommandScopeDefault'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xab\xb2l/',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BotCommandScopePeer(TLObject):
+    CONSTRUCTOR_ID = 0xdb9d897d
+    SUBCLASS_OF_ID = 0x4baf5d10
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypeInputPeer'):
+        """
+        Constructor for BotCommandScope: Instance of either BotCommandScopeDefault, BotCommandScopeUsers, BotCommandScopeChats, BotCommandScopeChatAdmins, BotCommandScopePeer, BotCommandScopePeerAdmins, BotCommandScopePeerUser.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommandScopePeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'}\x89\x9d\xdb',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class BotCommandScopePeerAdmins(TLObject):
+    CONSTRUCTOR_ID = 0x3fd863d1
+    SUBCLASS_OF_ID = 0x4baf5d10
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypeInputPeer'):
+        """
+        Constructor for BotCommandScope: Instance of either BotCommandScopeDefault, BotCommandScopeUsers, BotCommandScopeChats, BotCommandScopeChatAdmins, BotCommandScopePeer, BotCommandScopePeerAdmins, BotCommandScopePeerUser.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommandScopePeerAdmins',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1c\xd8?',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class BotCommandScopePeerUser(TLObject):
+    CONSTRUCTOR_ID = 0xa1321f3
+    SUBCLASS_OF_ID = 0x4baf5d10
+    __slots__ = ('peer', 'user_id')
+
+    def __init__(self, peer: 'TypeInputPeer', user_id: 'TypeInputUser'):
+        """
+        Constructor for BotCommandScope: Instance of either BotCommandScopeDefault, BotCommandScopeUsers, BotCommandScopeChats, BotCommandScopeChatAdmins, BotCommandScopePeer, BotCommandScopePeerAdmins, BotCommandScopePeerUser.
+        """
+        self.peer = peer
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommandScopePeerUser',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'user_id': self.user_id.to_dict() if isinstance(self.user_id, TLObject) else self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf3!\x13\n',
+            self.peer._bytes(),
+            self.user_id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _user_id = reader.tgread_object()
+        return cls(peer=_peer, user_id=_user_id)
+
+
+class BotCommandScopeUsers(TLObject):
+    CONSTRUCTOR_ID = 0x3c4f04d8
+    SUBCLASS_OF_ID = 0x4baf5d10
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BotCommandScopeUsers'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd8\x04O<',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeBotCommandScope = Union[BotCommandScopeDefault,BotCommandScopeUsers,BotCommandScopeChats,BotCommandScopeChatAdmins,BotCommandScopePeer,BotCommandScopePeerAdmins,BotCommandScopePeerUser]
@@ -0,0 +1,110 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotAppSettings, TypeBotCommand, TypeBotMenuButton, TypeBotVerifierSettings, TypeDocument, TypePhoto
+
+
+
+class BotInfo(TLObject):
+    CONSTRUCTOR_ID = 0x4d8a0299
+    SUBCLASS_OF_ID = 0xf1f701db
+    __slots__ = ('has_preview_medias', 'user_id', 'description', 'description_photo', 'description_document', 'commands', 'menu_button', 'privacy_policy_url', 'app_settings', 'verifier_settings')
+
+    def __init__(self, has_preview_medias: Optional[bool]=None, user_id: Optional[int]=None, description: Optional[str]=None, description_photo: Optional['TypePhoto']=None, description_document: Optional['TypeDocument']=None, commands: Optional[List['TypeBotCommand']]=None, menu_button: Optional['TypeBotMenuButton']=None, privacy_policy_url: Optional[str]=None, app_settings: Optional['TypeBotAppSettings']=None, verifier_settings: Optional['TypeBotVerifierSettings']=None):
+        """
+        Constructor for BotInfo: Instance of BotInfo.
+        """
+        self.has_preview_medias = has_preview_medias
+        self.user_id = user_id
+        self.description = description
+        self.description_photo = description_photo
+        self.description_document = description_document
+        self.commands = commands
+        self.menu_button = menu_button
+        self.privacy_policy_url = privacy_policy_url
+        self.app_settings = app_settings
+        self.verifier_settings = verifier_settings
+
+    def to_dict(self):
+        return {
+            '_': 'BotInfo',
+            'has_preview_medias': self.has_preview_medias,
+            'user_id': self.user_id,
+            'description': self.description,
+            'description_photo': self.description_photo.to_dict() if isinstance(self.description_photo, TLObject) else self.description_photo,
+            'description_document': self.description_document.to_dict() if isinstance(self.description_document, TLObject) else self.description_document,
+            'commands': [] if self.commands is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.commands],
+            'menu_button': self.menu_button.to_dict() if isinstance(self.menu_button, TLObject) else self.menu_button,
+            'privacy_policy_url': self.privacy_policy_url,
+            'app_settings': self.app_settings.to_dict() if isinstance(self.app_settings, TLObject) else self.app_settings,
+            'verifier_settings': self.verifier_settings.to_dict() if isinstance(self.verifier_settings, TLObject) else self.verifier_settings
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x99\x02\x8aM',
+            struct.pack('<I', (0 if self.has_preview_medias is None or self.has_preview_medias is False else 64) | (0 if self.user_id is None or self.user_id is False else 1) | (0 if self.description is None or self.description is False else 2) | (0 if self.description_photo is None or self.description_photo is False else 16) | (0 if self.description_document is None or self.description_document is False else 32) | (0 if self.commands is None or self.commands is False else 4) | (0 if self.menu_button is None or self.menu_button is False else 8) | (0 if self.privacy_policy_url is None or self.privacy_policy_url is False else 128) | (0 if self.app_settings is None or self.app_settings is False else 256) | (0 if self.verifier_settings is None or self.verifier_settings is False else 512)),
+            b'' if self.user_id is None or self.user_id is False else (struct.pack('<q', self.user_id)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            b'' if self.description_photo is None or self.description_photo is False else (self.description_photo._bytes()),
+            b'' if self.description_document is None or self.description_document is False else (self.description_document._bytes()),
+            b'' if self.commands is None or self.commands is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.commands)),b''.join(x._bytes() for x in self.commands))),
+            b'' if self.menu_button is None or self.menu_button is False else (self.menu_button._bytes()),
+            b'' if self.privacy_policy_url is None or self.privacy_policy_url is False else (self.serialize_bytes(self.privacy_policy_url)),
+            b'' if self.app_settings is None or self.app_settings is False else (self.app_settings._bytes()),
+            b'' if self.verifier_settings is None or self.verifier_settings is False else (self.verifier_settings._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _has_preview_medias = bool(flags & 64)
+        if flags & 1:
+            _user_id = reader.read_long()
+        else:
+            _user_id = None
+        if flags & 2:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        if flags & 16:
+            _description_photo = reader.tgread_object()
+        else:
+            _description_photo = None
+        if flags & 32:
+            _description_document = reader.tgread_object()
+        else:
+            _description_document = None
+        if flags & 4:
+            reader.read_int()
+            _commands = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _commands.append(_x)
+
+        else:
+            _commands = None
+        if flags & 8:
+            _menu_button = reader.tgread_object()
+        else:
+            _menu_button = None
+        if flags & 128:
+            _privacy_policy_url = reader.tgread_string()
+        else:
+            _privacy_policy_url = None
+        if flags & 256:
+            _app_settings = reader.tgread_object()
+        else:
+            _app_settings = None
+        if flags & 512:
+            _verifier_settings = reader.tgread_object()
+        else:
+            _verifier_settings = None
+        return cls(has_preview_medias=_has_preview_medias, user_id=_user_id, description=_description, description_photo=_description_photo, description_document=_description_document, commands=_commands, menu_button=_menu_button, privacy_policy_url=_privacy_policy_url, app_settings=_app_settings, verifier_settings=_verifier_settings)
+
+TypeBotInfo = BotInfo
@@ -0,0 +1,426 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeGeoPoint, TypeMessageEntity, TypeReplyMarkup, TypeWebDocument
+
+
+
+class BotInlineMessageMediaAuto(TLObject):
+    CONSTRUCTOR_ID = 0x764cf810
+    SUBCLASS_OF_ID = 0xc4910f88
+    __slots__ = ('message', 'invert_media', 'entities', 'reply_markup')
+
+    def __init__(self, message: str, invert_media: Optional[bool]=None, entities: Optional[List['TypeMessageEntity']]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for BotInlineMessage: Instance of either BotInlineMessageMediaAuto, BotInlineMessageText, BotInlineMessageMediaGeo, BotInlineMessageMediaVenue, BotInlineMessageMediaContact, BotInlineMessageMediaInvoice, BotInlineMessageMediaWebPage.
+        """
+        self.message = message
+        self.invert_media = invert_media
+        self.entities = entities
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMessageMediaAuto',
+            'message': self.message,
+            'invert_media': self.invert_media,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x10\xf8Lv',
+            struct.pack('<I', (0 if self.invert_media is None or self.invert_media is False else 8) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _invert_media = bool(flags & 8)
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(message=_message, invert_media=_invert_media, entities=_entities, reply_markup=_reply_markup)
+
+
+class BotInlineMessageMediaContact(TLObject):
+    CONSTRUCTOR_ID = 0x18d1cdc2
+    SUBCLASS_OF_ID = 0xc4910f88
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard', 'reply_markup')
+
+    def __init__(self, phone_number: str, first_name: str, last_name: str, vcard: str, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for BotInlineMessage: Instance of either BotInlineMessageMediaAuto, BotInlineMessageText, BotInlineMessageMediaGeo, BotInlineMessageMediaVenue, BotInlineMessageMediaContact, BotInlineMessageMediaInvoice, BotInlineMessageMediaWebPage.
+        """
+        self.phone_number = phone_number
+        self.first_name = first_name
+        self.last_name = last_name
+        self.vcard = vcard
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMessageMediaContact',
+            'phone_number': self.phone_number,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'vcard': self.vcard,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc2\xcd\xd1\x18',
+            struct.pack('<I', (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.first_name),
+            self.serialize_bytes(self.last_name),
+            self.serialize_bytes(self.vcard),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _phone_number = reader.tgread_string()
+        _first_name = reader.tgread_string()
+        _last_name = reader.tgread_string()
+        _vcard = reader.tgread_string()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(phone_number=_phone_number, first_name=_first_name, last_name=_last_name, vcard=_vcard, reply_markup=_reply_markup)
+
+
+class BotInlineMessageMediaGeo(TLObject):
+    CONSTRUCTOR_ID = 0x51846fd
+    SUBCLASS_OF_ID = 0xc4910f88
+    __slots__ = ('geo', 'heading', 'period', 'proximity_notification_radius', 'reply_markup')
+
+    def __init__(self, geo: 'TypeGeoPoint', heading: Optional[int]=None, period: Optional[int]=None, proximity_notification_radius: Optional[int]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for BotInlineMessage: Instance of either BotInlineMessageMediaAuto, BotInlineMessageText, BotInlineMessageMediaGeo, BotInlineMessageMediaVenue, BotInlineMessageMediaContact, BotInlineMessageMediaInvoice, BotInlineMessageMediaWebPage.
+        """
+        self.geo = geo
+        self.heading = heading
+        self.period = period
+        self.proximity_notification_radius = proximity_notification_radius
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMessageMediaGeo',
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo,
+            'heading': self.heading,
+            'period': self.period,
+            'proximity_notification_radius': self.proximity_notification_radius,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfdF\x18\x05',
+            struct.pack('<I', (0 if self.heading is None or self.heading is False else 1) | (0 if self.period is None or self.period is False else 2) | (0 if self.proximity_notification_radius is None or self.proximity_notification_radius is False else 8) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.geo._bytes(),
+            b'' if self.heading is None or self.heading is False else (struct.pack('<i', self.heading)),
+            b'' if self.period is None or self.period is False else (struct.pack('<i', self.period)),
+            b'' if self.proximity_notification_radius is None or self.proximity_notification_radius is False else (struct.pack('<i', self.proximity_notification_radius)),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _geo = reader.tgread_object()
+        if flags & 1:
+            _heading = reader.read_int()
+        else:
+            _heading = None
+        if flags & 2:
+            _period = reader.read_int()
+        else:
+            _period = None
+        if flags & 8:
+            _proximity_notification_radius = reader.read_int()
+        else:
+            _proximity_notification_radius = None
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(geo=_geo, heading=_heading, period=_period, proximity_notification_radius=_proximity_notification_radius, reply_markup=_reply_markup)
+
+
+class BotInlineMessageMediaInvoice(TLObject):
+    CONSTRUCTOR_ID = 0x354a9b09
+    SUBCLASS_OF_ID = 0xc4910f88
+    __slots__ = ('title', 'description', 'currency', 'total_amount', 'shipping_address_requested', 'test', 'photo', 'reply_markup')
+
+    def __init__(self, title: str, description: str, currency: str, total_amount: int, shipping_address_requested: Optional[bool]=None, test: Optional[bool]=None, photo: Optional['TypeWebDocument']=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for BotInlineMessage: Instance of either BotInlineMessageMediaAuto, BotInlineMessageText, BotInlineMessageMediaGeo, BotInlineMessageMediaVenue, BotInlineMessageMediaContact, BotInlineMessageMediaInvoice, BotInlineMessageMediaWebPage.
+        """
+        self.title = title
+        self.description = description
+        self.currency = currency
+        self.total_amount = total_amount
+        self.shipping_address_requested = shipping_address_requested
+        self.test = test
+        self.photo = photo
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMessageMediaInvoice',
+            'title': self.title,
+            'description': self.description,
+            'currency': self.currency,
+            'total_amount': self.total_amount,
+            'shipping_address_requested': self.shipping_address_requested,
+            'test': self.test,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\t\x9bJ5',
+            struct.pack('<I', (0 if self.shipping_address_requested is None or self.shipping_address_requested is False else 2) | (0 if self.test is None or self.test is False else 8) | (0 if self.photo is None or self.photo is False else 1) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.total_amount),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _shipping_address_requested = bool(flags & 2)
+        _test = bool(flags & 8)
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 1:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        _currency = reader.tgread_string()
+        _total_amount = reader.read_long()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(title=_title, description=_description, currency=_currency, total_amount=_total_amount, shipping_address_requested=_shipping_address_requested, test=_test, photo=_photo, reply_markup=_reply_markup)
+
+
+class BotInlineMessageMediaVenue(TLObject):
+    CONSTRUCTOR_ID = 0x8a86659c
+    SUBCLASS_OF_ID = 0xc4910f88
+    __slots__ = ('geo', 'title', 'address', 'provider', 'venue_id', 'venue_type', 'reply_markup')
+
+    def __init__(self, geo: 'TypeGeoPoint', title: str, address: str, provider: str, venue_id: str, venue_type: str, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for BotInlineMessage: Instance of either BotInlineMessageMediaAuto, BotInlineMessageText, BotInlineMessageMediaGeo, BotInlineMessageMediaVenue, BotInlineMessageMediaContact, BotInlineMessageMediaInvoice, BotInlineMessageMediaWebPage.
+        """
+        self.geo = geo
+        self.title = title
+        self.address = address
+        self.provider = provider
+        self.venue_id = venue_id
+        self.venue_type = venue_type
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMessageMediaVenue',
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo,
+            'title': self.title,
+            'address': self.address,
+            'provider': self.provider,
+            'venue_id': self.venue_id,
+            'venue_type': self.venue_type,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9ce\x86\x8a',
+            struct.pack('<I', (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.geo._bytes(),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.address),
+            self.serialize_bytes(self.provider),
+            self.serialize_bytes(self.venue_id),
+            self.serialize_bytes(self.venue_type),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _geo = reader.tgread_object()
+        _title = reader.tgread_string()
+        _address = reader.tgread_string()
+        _provider = reader.tgread_string()
+        _venue_id = reader.tgread_string()
+        _venue_type = reader.tgread_string()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(geo=_geo, title=_title, address=_address, provider=_provider, venue_id=_venue_id, venue_type=_venue_type, reply_markup=_reply_markup)
+
+
+class BotInlineMessageMediaWebPage(TLObject):
+    CONSTRUCTOR_ID = 0x809ad9a6
+    SUBCLASS_OF_ID = 0xc4910f88
+    __slots__ = ('message', 'url', 'invert_media', 'force_large_media', 'force_small_media', 'manual', 'safe', 'entities', 'reply_markup')
+
+    def __init__(self, message: str, url: str, invert_media: Optional[bool]=None, force_large_media: Optional[bool]=None, force_small_media: Optional[bool]=None, manual: Optional[bool]=None, safe: Optional[bool]=None, entities: Optional[List['TypeMessageEntity']]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for BotInlineMessage: Instance of either BotInlineMessageMediaAuto, BotInlineMessageText, BotInlineMessageMediaGeo, BotInlineMessageMediaVenue, BotInlineMessageMediaContact, BotInlineMessageMediaInvoice, BotInlineMessageMediaWebPage.
+        """
+        self.message = message
+        self.url = url
+        self.invert_media = invert_media
+        self.force_large_media = force_large_media
+        self.force_small_media = force_small_media
+        self.manual = manual
+        self.safe = safe
+        self.entities = entities
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMessageMediaWebPage',
+            'message': self.message,
+            'url': self.url,
+            'invert_media': self.invert_media,
+            'force_large_media': self.force_large_media,
+            'force_small_media': self.force_small_media,
+            'manual': self.manual,
+            'safe': self.safe,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa6\xd9\x9a\x80',
+            struct.pack('<I', (0 if self.invert_media is None or self.invert_media is False else 8) | (0 if self.force_large_media is None or self.force_large_media is False else 16) | (0 if self.force_small_media is None or self.force_small_media is False else 32) | (0 if self.manual is None or self.manual is False else 128) | (0 if self.safe is None or self.safe is False else 256) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            self.serialize_bytes(self.url),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _invert_media = bool(flags & 8)
+        _force_large_media = bool(flags & 16)
+        _force_small_media = bool(flags & 32)
+        _manual = bool(flags & 128)
+        _safe = bool(flags & 256)
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        _url = reader.tgread_string()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(message=_message, url=_url, invert_media=_invert_media, force_large_media=_force_large_media, force_small_media=_force_small_media, manual=_manual, safe=_safe, entities=_entities, reply_markup=_reply_markup)
+
+
+class BotInlineMessageText(TLObject):
+    CONSTRUCTOR_ID = 0x8c7f65e2
+    SUBCLASS_OF_ID = 0xc4910f88
+    __slots__ = ('message', 'no_webpage', 'invert_media', 'entities', 'reply_markup')
+
+    def __init__(self, message: str, no_webpage: Optional[bool]=None, invert_media: Optional[bool]=None, entities: Optional[List['TypeMessageEntity']]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for BotInlineMessage: Instance of either BotInlineMessageMediaAuto, BotInlineMessageText, BotInlineMessageMediaGeo, BotInlineMessageMediaVenue, BotInlineMessageMediaContact, BotInlineMessageMediaInvoice, BotInlineMessageMediaWebPage.
+        """
+        self.message = message
+        self.no_webpage = no_webpage
+        self.invert_media = invert_media
+        self.entities = entities
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMessageText',
+            'message': self.message,
+            'no_webpage': self.no_webpage,
+            'invert_media': self.invert_media,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe2e\x7f\x8c',
+            struct.pack('<I', (0 if self.no_webpage is None or self.no_webpage is False else 1) | (0 if self.invert_media is None or self.invert_media is False else 8) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _no_webpage = bool(flags & 1)
+        _invert_media = bool(flags & 8)
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(message=_message, no_webpage=_no_webpage, invert_media=_invert_media, entities=_entities, reply_markup=_reply_markup)
+
+TypeBotInlineMessage = Union[BotInlineMessageMediaAuto,BotInlineMessageText,BotInlineMessageMediaGeo,BotInlineMessageMediaVenue,BotInlineMessageMediaContact,BotInlineMessageMediaInvoice,BotInlineMessageMediaWebPage]
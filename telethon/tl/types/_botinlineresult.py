@@ -0,0 +1,156 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotInlineMessage, TypeDocument, TypePhoto, TypeWebDocument
+
+
+
+class BotInlineMediaResult(TLObject):
+    CONSTRUCTOR_ID = 0x17db940b
+    SUBCLASS_OF_ID = 0x3832b3d5
+    __slots__ = ('id', 'type', 'send_message', 'photo', 'document', 'title', 'description')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, type: str, send_message: 'TypeBotInlineMessage', photo: Optional['TypePhoto']=None, document: Optional['TypeDocument']=None, title: Optional[str]=None, description: Optional[str]=None):
+        """
+        Constructor for BotInlineResult: Instance of either BotInlineResult, BotInlineMediaResult.
+        """
+        self.id = id
+        self.type = type
+        self.send_message = send_message
+        self.photo = photo
+        self.document = document
+        self.title = title
+        self.description = description
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineMediaResult',
+            'id': self.id,
+            'type': self.type,
+            'send_message': self.send_message.to_dict() if isinstance(self.send_message, TLObject) else self.send_message,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'title': self.title,
+            'description': self.description
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\x94\xdb\x17',
+            struct.pack('<I', (0 if self.photo is None or self.photo is False else 1) | (0 if self.document is None or self.document is False else 2) | (0 if self.title is None or self.title is False else 4) | (0 if self.description is None or self.description is False else 8)),
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.type),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            self.send_message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _id = reader.tgread_string()
+        _type = reader.tgread_string()
+        if flags & 1:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 2:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        if flags & 4:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 8:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        _send_message = reader.tgread_object()
+        return cls(id=_id, type=_type, send_message=_send_message, photo=_photo, document=_document, title=_title, description=_description)
+
+
+class BotInlineResult(TLObject):
+    CONSTRUCTOR_ID = 0x11965f3a
+    SUBCLASS_OF_ID = 0x3832b3d5
+    __slots__ = ('id', 'type', 'send_message', 'title', 'description', 'url', 'thumb', 'content')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, type: str, send_message: 'TypeBotInlineMessage', title: Optional[str]=None, description: Optional[str]=None, url: Optional[str]=None, thumb: Optional['TypeWebDocument']=None, content: Optional['TypeWebDocument']=None):
+        """
+        Constructor for BotInlineResult: Instance of either BotInlineResult, BotInlineMediaResult.
+        """
+        self.id = id
+        self.type = type
+        self.send_message = send_message
+        self.title = title
+        self.description = description
+        self.url = url
+        self.thumb = thumb
+        self.content = content
+
+    def to_dict(self):
+        return {
+            '_': 'BotInlineResult',
+            'id': self.id,
+            'type': self.type,
+            'send_message': self.send_message.to_dict() if isinstance(self.send_message, TLObject) else self.send_message,
+            'title': self.title,
+            'description': self.description,
+            'url': self.url,
+            'thumb': self.thumb.to_dict() if isinstance(self.thumb, TLObject) else self.thumb,
+            'content': self.content.to_dict() if isinstance(self.content, TLObject) else self.content
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b':_\x96\x11',
+            struct.pack('<I', (0 if self.title is None or self.title is False else 2) | (0 if self.description is None or self.description is False else 4) | (0 if self.url is None or self.url is False else 8) | (0 if self.thumb is None or self.thumb is False else 16) | (0 if self.content is None or self.content is False else 32)),
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.type),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+            b'' if self.thumb is None or self.thumb is False else (self.thumb._bytes()),
+            b'' if self.content is None or self.content is False else (self.content._bytes()),
+            self.send_message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _id = reader.tgread_string()
+        _type = reader.tgread_string()
+        if flags & 2:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 4:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        if flags & 8:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        if flags & 16:
+            _thumb = reader.tgread_object()
+        else:
+            _thumb = None
+        if flags & 32:
+            _content = reader.tgread_object()
+        else:
+            _content = None
+        _send_message = reader.tgread_object()
+        return cls(id=_id, type=_type, send_message=_send_message, title=_title, description=_description, url=_url, thumb=_thumb, content=_content)
+
+TypeBotInlineResult = Union[BotInlineResult,BotInlineMediaResult]
@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BotMenuButton(TLObject):
+    CONSTRUCTOR_ID = 0xc7b57ce6
+    SUBCLASS_OF_ID = 0x4c71bd3c
+    __slots__ = ('text', 'url')
+
+    def __init__(self, text: str, url: str):
+        """
+        Constructor for BotMenuButton: Instance of either BotMenuButtonDefault, BotMenuButtonCommands, BotMenuButton.
+        """
+        self.text = text
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'BotMenuButton',
+            'text': self.text,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe6|\xb5\xc7',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _url = reader.tgread_string()
+        return cls(text=_text, url=_url)
+
+
+class BotMenuButtonCommands(TLObject):
+    CONSTRUCTOR_ID = 0x4258c205
+    SUBCLASS_OF_ID = 0x4c71bd3c
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BotMenuButtonCommands'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x05\xc2XB',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BotMenuButtonDefault(TLObject):
+    CONSTRUCTOR_ID = 0x7533a588
+    SUBCLASS_OF_ID = 0x4c71bd3c
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BotMenuButtonDefault'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x88\xa53u',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeBotMenuButton = Union[BotMenuButtonDefault,BotMenuButtonCommands,BotMenuButton]
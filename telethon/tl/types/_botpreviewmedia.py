@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageMedia
+
+
+
+class BotPreviewMedia(TLObject):
+    CONSTRUCTOR_ID = 0x23e91ba3
+    SUBCLASS_OF_ID = 0x562abc2d
+    __slots__ = ('date', 'media')
+
+    def __init__(self, date: Optional[datetime], media: 'TypeMessageMedia'):
+        """
+        Constructor for BotPreviewMedia: Instance of BotPreviewMedia.
+        """
+        self.date = date
+        self.media = media
+
+    def to_dict(self):
+        return {
+            '_': 'BotPreviewMedia',
+            'date': self.date,
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa3\x1b\xe9#',
+            self.serialize_datetime(self.date),
+            self.media._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _date = reader.tgread_date()
+        _media = reader.tgread_object()
+        return cls(date=_date, media=_media)
+
+TypeBotPreviewMedia = BotPreviewMedia
@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUser
+
+
+
+class PopularAppBots(TLObject):
+    CONSTRUCTOR_ID = 0x1991b13b
+    SUBCLASS_OF_ID = 0x7b64be7d
+    __slots__ = ('users', 'next_offset')
+
+    def __init__(self, users: List['TypeUser'], next_offset: Optional[str]=None):
+        """
+        Constructor for bots.PopularAppBots: Instance of PopularAppBots.
+        """
+        self.users = users
+        self.next_offset = next_offset
+
+    def to_dict(self):
+        return {
+            '_': 'PopularAppBots',
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'next_offset': self.next_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';\xb1\x91\x19',
+            struct.pack('<I', (0 if self.next_offset is None or self.next_offset is False else 1)),
+            b'' if self.next_offset is None or self.next_offset is False else (self.serialize_bytes(self.next_offset)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _next_offset = reader.tgread_string()
+        else:
+            _next_offset = None
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(users=_users, next_offset=_next_offset)
+
@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotPreviewMedia
+
+
+
+class PreviewInfo(TLObject):
+    CONSTRUCTOR_ID = 0xca71d64
+    SUBCLASS_OF_ID = 0xf0c27f35
+    __slots__ = ('media', 'lang_codes')
+
+    def __init__(self, media: List['TypeBotPreviewMedia'], lang_codes: List[str]):
+        """
+        Constructor for bots.PreviewInfo: Instance of PreviewInfo.
+        """
+        self.media = media
+        self.lang_codes = lang_codes
+
+    def to_dict(self):
+        return {
+            '_': 'PreviewInfo',
+            'media': [] if self.media is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.media],
+            'lang_codes': [] if self.lang_codes is None else self.lang_codes[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'd\x1d\xa7\x0c',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.media)),b''.join(x._bytes() for x in self.media),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.lang_codes)),b''.join(self.serialize_bytes(x) for x in self.lang_codes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _media = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _media.append(_x)
+
+        reader.read_int()
+        _lang_codes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _lang_codes.append(_x)
+
+        return cls(media=_media, lang_codes=_lang_codes)
+
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class BotVerification(TLObject):
+    CONSTRUCTOR_ID = 0xf93cd45c
+    SUBCLASS_OF_ID = 0x2cbf3c5a
+    __slots__ = ('bot_id', 'icon', 'description')
+
+    def __init__(self, bot_id: int, icon: int, description: str):
+        """
+        Constructor for BotVerification: Instance of BotVerification.
+        """
+        self.bot_id = bot_id
+        self.icon = icon
+        self.description = description
+
+    def to_dict(self):
+        return {
+            '_': 'BotVerification',
+            'bot_id': self.bot_id,
+            'icon': self.icon,
+            'description': self.description
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\\xd4<\xf9',
+            _struct_qq.pack(self.bot_id, self.icon),
+            self.serialize_bytes(self.description),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _bot_id, _icon = reader.read_struct(_struct_qq)
+        _description = reader.tgread_string()
+        return cls(bot_id=_bot_id, icon=_icon, description=_description)
+
+TypeBotVerification = BotVerification
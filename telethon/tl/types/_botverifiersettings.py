@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class BotVerifierSettings(TLObject):
+    CONSTRUCTOR_ID = 0xb0cd6617
+    SUBCLASS_OF_ID = 0xf1d6034c
+    __slots__ = ('icon', 'company', 'can_modify_custom_description', 'custom_description')
+
+    def __init__(self, icon: int, company: str, can_modify_custom_description: Optional[bool]=None, custom_description: Optional[str]=None):
+        """
+        Constructor for BotVerifierSettings: Instance of BotVerifierSettings.
+        """
+        self.icon = icon
+        self.company = company
+        self.can_modify_custom_description = can_modify_custom_description
+        self.custom_description = custom_description
+
+    def to_dict(self):
+        return {
+            '_': 'BotVerifierSettings',
+            'icon': self.icon,
+            'company': self.company,
+            'can_modify_custom_description': self.can_modify_custom_description,
+            'custom_description': self.custom_description
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x17f\xcd\xb0',
+            _struct_Iq.pack((0 if self.can_modify_custom_description is None or self.can_modify_custom_description is False else 2) | (0 if self.custom_description is None or self.custom_description is False else 1), self.icon),
+            self.serialize_bytes(self.company),
+            b'' if self.custom_description is None or self.custom_description is False else (self.serialize_bytes(self.custom_description)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _icon = reader.read_struct(_struct_iq)
+        _can_modify_custom_description = bool(flags & 2)
+        _company = reader.tgread_string()
+        if flags & 1:
+            _custom_description = reader.tgread_string()
+        else:
+            _custom_description = None
+        return cls(icon=_icon, company=_company, can_modify_custom_description=_can_modify_custom_description, custom_description=_custom_description)
+
+TypeBotVerifierSettings = BotVerifierSettings
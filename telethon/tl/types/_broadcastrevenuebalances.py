@@ -0,0 +1,47 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqqq = struct.Struct('<Iqqq')
+_struct_iqqq = struct.Struct('<iqqq')
+
+
+class BroadcastRevenueBalances(TLObject):
+    CONSTRUCTOR_ID = 0xc3ff71e7
+    SUBCLASS_OF_ID = 0x15c28ff2
+    __slots__ = ('current_balance', 'available_balance', 'overall_revenue', 'withdrawal_enabled')
+
+    def __init__(self, current_balance: int, available_balance: int, overall_revenue: int, withdrawal_enabled: Optional[bool]=None):
+        """
+        Constructor for BroadcastRevenueBalances: Instance of BroadcastRevenueBalances.
+        """
+        self.current_balance = current_balance
+        self.available_balance = available_balance
+        self.overall_revenue = overall_revenue
+        self.withdrawal_enabled = withdrawal_enabled
+
+    def to_dict(self):
+        return {
+            '_': 'BroadcastRevenueBalances',
+            'current_balance': self.current_balance,
+            'available_balance': self.available_balance,
+            'overall_revenue': self.overall_revenue,
+            'withdrawal_enabled': self.withdrawal_enabled
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe7q\xff\xc3',
+            _struct_Iqqq.pack((0 if self.withdrawal_enabled is None or self.withdrawal_enabled is False else 1), self.current_balance, self.available_balance, self.overall_revenue),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _current_balance, _available_balance, _overall_revenue = reader.read_struct(_struct_iqqq)
+        _withdrawal_enabled = bool(flags & 1)
+        return cls(current_balance=_current_balance, available_balance=_available_balance, overall_revenue=_overall_revenue, withdrawal_enabled=_withdrawal_enabled)
+
+TypeBroadcastRevenueBalances = BroadcastRevenueBalances
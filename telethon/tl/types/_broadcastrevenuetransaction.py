@@ -0,0 +1,143 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class BroadcastRevenueTransactionProceeds(TLObject):
+    CONSTRUCTOR_ID = 0x557e2cc4
+    SUBCLASS_OF_ID = 0x74fac2bd
+    __slots__ = ('amount', 'from_date', 'to_date')
+
+    def __init__(self, amount: int, from_date: Optional[datetime], to_date: Optional[datetime]):
+        """
+        Constructor for BroadcastRevenueTransaction: Instance of either BroadcastRevenueTransactionProceeds, BroadcastRevenueTransactionWithdrawal, BroadcastRevenueTransactionRefund.
+        """
+        self.amount = amount
+        self.from_date = from_date
+        self.to_date = to_date
+
+    def to_dict(self):
+        return {
+            '_': 'BroadcastRevenueTransactionProceeds',
+            'amount': self.amount,
+            'from_date': self.from_date,
+            'to_date': self.to_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4,~U',
+            struct.pack('<q', self.amount),
+            self.serialize_datetime(self.from_date),
+            self.serialize_datetime(self.to_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _amount = reader.read_long()
+        _from_date = reader.tgread_date()
+        _to_date = reader.tgread_date()
+        return cls(amount=_amount, from_date=_from_date, to_date=_to_date)
+
+
+class BroadcastRevenueTransactionRefund(TLObject):
+    CONSTRUCTOR_ID = 0x42d30d2e
+    SUBCLASS_OF_ID = 0x74fac2bd
+    __slots__ = ('amount', 'date', 'provider')
+
+    def __init__(self, amount: int, date: Optional[datetime], provider: str):
+        """
+        Constructor for BroadcastRevenueTransaction: Instance of either BroadcastRevenueTransactionProceeds, BroadcastRevenueTransactionWithdrawal, BroadcastRevenueTransactionRefund.
+        """
+        self.amount = amount
+        self.date = date
+        self.provider = provider
+
+    def to_dict(self):
+        return {
+            '_': 'BroadcastRevenueTransactionRefund',
+            'amount': self.amount,
+            'date': self.date,
+            'provider': self.provider
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'.\r\xd3B',
+            struct.pack('<q', self.amount),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.provider),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _amount = reader.read_long()
+        _date = reader.tgread_date()
+        _provider = reader.tgread_string()
+        return cls(amount=_amount, date=_date, provider=_provider)
+
+
+class BroadcastRevenueTransactionWithdrawal(TLObject):
+    CONSTRUCTOR_ID = 0x5a590978
+    SUBCLASS_OF_ID = 0x74fac2bd
+    __slots__ = ('amount', 'date', 'provider', 'pending', 'failed', 'transaction_date', 'transaction_url')
+
+    def __init__(self, amount: int, date: Optional[datetime], provider: str, pending: Optional[bool]=None, failed: Optional[bool]=None, transaction_date: Optional[datetime]=None, transaction_url: Optional[str]=None):
+        """
+        Constructor for BroadcastRevenueTransaction: Instance of either BroadcastRevenueTransactionProceeds, BroadcastRevenueTransactionWithdrawal, BroadcastRevenueTransactionRefund.
+        """
+        self.amount = amount
+        self.date = date
+        self.provider = provider
+        self.pending = pending
+        self.failed = failed
+        self.transaction_date = transaction_date
+        self.transaction_url = transaction_url
+
+    def to_dict(self):
+        return {
+            '_': 'BroadcastRevenueTransactionWithdrawal',
+            'amount': self.amount,
+            'date': self.date,
+            'provider': self.provider,
+            'pending': self.pending,
+            'failed': self.failed,
+            'transaction_date': self.transaction_date,
+            'transaction_url': self.transaction_url
+        }
+
+    def _bytes(self):
+        assert ((self.transaction_date or self.transaction_date is not None) and (self.transaction_url or self.transaction_url is not None)) or ((self.transaction_date is None or self.transaction_date is False) and (self.transaction_url is None or self.transaction_url is False)), 'transaction_date, transaction_url parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'x\tYZ',
+            _struct_Iq.pack((0 if self.pending is None or self.pending is False else 1) | (0 if self.failed is None or self.failed is False else 4) | (0 if self.transaction_date is None or self.transaction_date is False else 2) | (0 if self.transaction_url is None or self.transaction_url is False else 2), self.amount),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.provider),
+            b'' if self.transaction_date is None or self.transaction_date is False else (self.serialize_datetime(self.transaction_date)),
+            b'' if self.transaction_url is None or self.transaction_url is False else (self.serialize_bytes(self.transaction_url)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _amount = reader.read_struct(_struct_iq)
+        _pending = bool(flags & 1)
+        _failed = bool(flags & 4)
+        _date = reader.tgread_date()
+        _provider = reader.tgread_string()
+        if flags & 2:
+            _transaction_date = reader.tgread_date()
+        else:
+            _transaction_date = None
+        if flags & 2:
+            _transaction_url = reader.tgread_string()
+        else:
+            _transaction_url = None
+        return cls(amount=_amount, date=_date, provider=_provider, pending=_pending, failed=_failed, transaction_date=_transaction_date, transaction_url=_transaction_url)
+
+TypeBroadcastRevenueTransaction = Union[BroadcastRevenueTransactionProceeds,BroadcastRevenueTransactionWithdrawal,BroadcastRevenueTransactionRefund]
@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBusinessAwayMessageSchedule, TypeBusinessRecipients
+
+
+
+class BusinessAwayMessage(TLObject):
+    CONSTRUCTOR_ID = 0xef156a5c
+    SUBCLASS_OF_ID = 0xf1d3ae24
+    __slots__ = ('shortcut_id', 'schedule', 'recipients', 'offline_only')
+
+    def __init__(self, shortcut_id: int, schedule: 'TypeBusinessAwayMessageSchedule', recipients: 'TypeBusinessRecipients', offline_only: Optional[bool]=None):
+        """
+        Constructor for BusinessAwayMessage: Instance of BusinessAwayMessage.
+        """
+        self.shortcut_id = shortcut_id
+        self.schedule = schedule
+        self.recipients = recipients
+        self.offline_only = offline_only
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessAwayMessage',
+            'shortcut_id': self.shortcut_id,
+            'schedule': self.schedule.to_dict() if isinstance(self.schedule, TLObject) else self.schedule,
+            'recipients': self.recipients.to_dict() if isinstance(self.recipients, TLObject) else self.recipients,
+            'offline_only': self.offline_only
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\j\x15\xef',
+            _struct_Ii.pack((0 if self.offline_only is None or self.offline_only is False else 1), self.shortcut_id),
+            self.schedule._bytes(),
+            self.recipients._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _shortcut_id = reader.read_struct(_struct_ii)
+        _offline_only = bool(flags & 1)
+        _schedule = reader.tgread_object()
+        _recipients = reader.tgread_object()
+        return cls(shortcut_id=_shortcut_id, schedule=_schedule, recipients=_recipients, offline_only=_offline_only)
+
+TypeBusinessAwayMessage = BusinessAwayMessage
@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BusinessAwayMessageScheduleAlways(TLObject):
+    CONSTRUCTOR_ID = 0xc9b9e2b9
+    SUBCLASS_OF_ID = 0x2818a05e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessAwayMessageScheduleAlways'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb9\xe2\xb9\xc9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class BusinessAwayMessageScheduleCustom(TLObject):
+    CONSTRUCTOR_ID = 0xcc4d9ecc
+    SUBCLASS_OF_ID = 0x2818a05e
+    __slots__ = ('start_date', 'end_date')
+
+    def __init__(self, start_date: Optional[datetime], end_date: Optional[datetime]):
+        """
+        Constructor for BusinessAwayMessageSchedule: Instance of either BusinessAwayMessageScheduleAlways, BusinessAwayMessageScheduleOutsideWorkHours, BusinessAwayMessageScheduleCustom.
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessAwayMessageScheduleCustom',
+            'start_date': self.start_date,
+            'end_date': self.end_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcc\x9eM\xcc',
+            self.serialize_datetime(self.start_date),
+            self.serialize_datetime(self.end_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _start_date = reader.tgread_date()
+        _end_date = reader.tgread_date()
+        return cls(start_date=_start_date, end_date=_end_date)
+
+
+class BusinessAwayMessageScheduleOutsideWorkHours(TLObject):
+    CONSTRUCTOR_ID = 0xc3f2f501
+    SUBCLASS_OF_ID = 0x2818a05e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessAwayMessageScheduleOutsideWorkHours'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x01\xf5\xf2\xc3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeBusinessAwayMessageSchedule = Union[BusinessAwayMessageScheduleAlways,BusinessAwayMessageScheduleOutsideWorkHours,BusinessAwayMessageScheduleCustom]
@@ -0,0 +1,67 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BusinessBotRecipients(TLObject):
+    CONSTRUCTOR_ID = 0xb88cf373
+    SUBCLASS_OF_ID = 0xf09283ca
+    __slots__ = ('existing_chats', 'new_chats', 'contacts', 'non_contacts', 'exclude_selected', 'users', 'exclude_users')
+
+    def __init__(self, existing_chats: Optional[bool]=None, new_chats: Optional[bool]=None, contacts: Optional[bool]=None, non_contacts: Optional[bool]=None, exclude_selected: Optional[bool]=None, users: Optional[List[int]]=None, exclude_users: Optional[List[int]]=None):
+        """
+        Constructor for BusinessBotRecipients: Instance of BusinessBotRecipients.
+        """
+        self.existing_chats = existing_chats
+        self.new_chats = new_chats
+        self.contacts = contacts
+        self.non_contacts = non_contacts
+        self.exclude_selected = exclude_selected
+        self.users = users
+        self.exclude_users = exclude_users
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessBotRecipients',
+            'existing_chats': self.existing_chats,
+            'new_chats': self.new_chats,
+            'contacts': self.contacts,
+            'non_contacts': self.non_contacts,
+            'exclude_selected': self.exclude_selected,
+            'users': [] if self.users is None else self.users[:],
+            'exclude_users': [] if self.exclude_users is None else self.exclude_users[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b's\xf3\x8c\xb8',
+            struct.pack('<I', (0 if self.existing_chats is None or self.existing_chats is False else 1) | (0 if self.new_chats is None or self.new_chats is False else 2) | (0 if self.contacts is None or self.contacts is False else 4) | (0 if self.non_contacts is None or self.non_contacts is False else 8) | (0 if self.exclude_selected is None or self.exclude_selected is False else 32) | (0 if self.users is None or self.users is False else 16) | (0 if self.exclude_users is None or self.exclude_users is False else 64)),
+            b'' if self.users is None or self.users is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.users)), len(self.users), *self.users))),
+            b'' if self.exclude_users is None or self.exclude_users is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.exclude_users)), len(self.exclude_users), *self.exclude_users))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _existing_chats = bool(flags & 1)
+        _new_chats = bool(flags & 2)
+        _contacts = bool(flags & 4)
+        _non_contacts = bool(flags & 8)
+        _exclude_selected = bool(flags & 32)
+        if flags & 16:
+            reader.read_int()
+            _users = reader.read_array('q', reader.read_int())
+        else:
+            _users = None
+        if flags & 64:
+            reader.read_int()
+            _exclude_users = reader.read_array('q', reader.read_int())
+        else:
+            _exclude_users = None
+        return cls(existing_chats=_existing_chats, new_chats=_new_chats, contacts=_contacts, non_contacts=_non_contacts, exclude_selected=_exclude_selected, users=_users, exclude_users=_exclude_users)
+
+TypeBusinessBotRecipients = BusinessBotRecipients
@@ -0,0 +1,78 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BusinessBotRights(TLObject):
+    CONSTRUCTOR_ID = 0xa0624cf7
+    SUBCLASS_OF_ID = 0xb8dc759a
+    __slots__ = ('reply', 'read_messages', 'delete_sent_messages', 'delete_received_messages', 'edit_name', 'edit_bio', 'edit_profile_photo', 'edit_username', 'view_gifts', 'sell_gifts', 'change_gift_settings', 'transfer_and_upgrade_gifts', 'transfer_stars', 'manage_stories')
+
+    def __init__(self, reply: Optional[bool]=None, read_messages: Optional[bool]=None, delete_sent_messages: Optional[bool]=None, delete_received_messages: Optional[bool]=None, edit_name: Optional[bool]=None, edit_bio: Optional[bool]=None, edit_profile_photo: Optional[bool]=None, edit_username: Optional[bool]=None, view_gifts: Optional[bool]=None, sell_gifts: Optional[bool]=None, change_gift_settings: Optional[bool]=None, transfer_and_upgrade_gifts: Optional[bool]=None, transfer_stars: Optional[bool]=None, manage_stories: Optional[bool]=None):
+        """
+        Constructor for BusinessBotRights: Instance of BusinessBotRights.
+        """
+        self.reply = reply
+        self.read_messages = read_messages
+        self.delete_sent_messages = delete_sent_messages
+        self.delete_received_messages = delete_received_messages
+        self.edit_name = edit_name
+        self.edit_bio = edit_bio
+        self.edit_profile_photo = edit_profile_photo
+        self.edit_username = edit_username
+        self.view_gifts = view_gifts
+        self.sell_gifts = sell_gifts
+        self.change_gift_settings = change_gift_settings
+        self.transfer_and_upgrade_gifts = transfer_and_upgrade_gifts
+        self.transfer_stars = transfer_stars
+        self.manage_stories = manage_stories
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessBotRights',
+            'reply': self.reply,
+            'read_messages': self.read_messages,
+            'delete_sent_messages': self.delete_sent_messages,
+            'delete_received_messages': self.delete_received_messages,
+            'edit_name': self.edit_name,
+            'edit_bio': self.edit_bio,
+            'edit_profile_photo': self.edit_profile_photo,
+            'edit_username': self.edit_username,
+            'view_gifts': self.view_gifts,
+            'sell_gifts': self.sell_gifts,
+            'change_gift_settings': self.change_gift_settings,
+            'transfer_and_upgrade_gifts': self.transfer_and_upgrade_gifts,
+            'transfer_stars': self.transfer_stars,
+            'manage_stories': self.manage_stories
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf7Lb\xa0',
+            struct.pack('<I', (0 if self.reply is None or self.reply is False else 1) | (0 if self.read_messages is None or self.read_messages is False else 2) | (0 if self.delete_sent_messages is None or self.delete_sent_messages is False else 4) | (0 if self.delete_received_messages is None or self.delete_received_messages is False else 8) | (0 if self.edit_name is None or self.edit_name is False else 16) | (0 if self.edit_bio is None or self.edit_bio is False else 32) | (0 if self.edit_profile_photo is None or self.edit_profile_photo is False else 64) | (0 if self.edit_username is None or self.edit_username is False else 128) | (0 if self.view_gifts is None or self.view_gifts is False else 256) | (0 if self.sell_gifts is None or self.sell_gifts is False else 512) | (0 if self.change_gift_settings is None or self.change_gift_settings is False else 1024) | (0 if self.transfer_and_upgrade_gifts is None or self.transfer_and_upgrade_gifts is False else 2048) | (0 if self.transfer_stars is None or self.transfer_stars is False else 4096) | (0 if self.manage_stories is None or self.manage_stories is False else 8192)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _reply = bool(flags & 1)
+        _read_messages = bool(flags & 2)
+        _delete_sent_messages = bool(flags & 4)
+        _delete_received_messages = bool(flags & 8)
+        _edit_name = bool(flags & 16)
+        _edit_bio = bool(flags & 32)
+        _edit_profile_photo = bool(flags & 64)
+        _edit_username = bool(flags & 128)
+        _view_gifts = bool(flags & 256)
+        _sell_gifts = bool(flags & 512)
+        _change_gift_settings = bool(flags & 1024)
+        _transfer_and_upgrade_gifts = bool(flags & 2048)
+        _transfer_stars = bool(flags & 4096)
+        _manage_stories = bool(flags & 8192)
+        return cls(reply=_reply, read_messages=_read_messages, delete_sent_messages=_delete_sent_messages, delete_received_messages=_delete_received_messages, edit_name=_edit_name, edit_bio=_edit_bio, edit_profile_photo=_edit_profile_photo, edit_username=_edit_username, view_gifts=_view_gifts, sell_gifts=_sell_gifts, change_gift_settings=_change_gift_settings, transfer_and_upgrade_gifts=_transfer_and_upgrade_gifts, transfer_stars=_transfer_stars, manage_stories=_manage_stories)
+
+TypeBusinessBotRights = BusinessBotRights
@@ -0,0 +1,70 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity
+
+
+
+class BusinessChatLink(TLObject):
+    CONSTRUCTOR_ID = 0xb4ae666f
+    SUBCLASS_OF_ID = 0x3c0d4a8b
+    __slots__ = ('link', 'message', 'views', 'entities', 'title')
+
+    def __init__(self, link: str, message: str, views: int, entities: Optional[List['TypeMessageEntity']]=None, title: Optional[str]=None):
+        """
+        Constructor for BusinessChatLink: Instance of BusinessChatLink.
+        """
+        self.link = link
+        self.message = message
+        self.views = views
+        self.entities = entities
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessChatLink',
+            'link': self.link,
+            'message': self.message,
+            'views': self.views,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'of\xae\xb4',
+            struct.pack('<I', (0 if self.entities is None or self.entities is False else 1) | (0 if self.title is None or self.title is False else 2)),
+            self.serialize_bytes(self.link),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            struct.pack('<i', self.views),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _link = reader.tgread_string()
+        _message = reader.tgread_string()
+        if flags & 1:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 2:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        _views = reader.read_int()
+        return cls(link=_link, message=_message, views=_views, entities=_entities, title=_title)
+
+TypeBusinessChatLink = BusinessChatLink
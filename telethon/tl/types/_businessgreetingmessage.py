@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBusinessRecipients
+
+
+
+class BusinessGreetingMessage(TLObject):
+    CONSTRUCTOR_ID = 0xe519abab
+    SUBCLASS_OF_ID = 0xb344eace
+    __slots__ = ('shortcut_id', 'recipients', 'no_activity_days')
+
+    def __init__(self, shortcut_id: int, recipients: 'TypeBusinessRecipients', no_activity_days: int):
+        """
+        Constructor for BusinessGreetingMessage: Instance of BusinessGreetingMessage.
+        """
+        self.shortcut_id = shortcut_id
+        self.recipients = recipients
+        self.no_activity_days = no_activity_days
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessGreetingMessage',
+            'shortcut_id': self.shortcut_id,
+            'recipients': self.recipients.to_dict() if isinstance(self.recipients, TLObject) else self.recipients,
+            'no_activity_days': self.no_activity_days
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xab\xab\x19\xe5',
+            struct.pack('<i', self.shortcut_id),
+            self.recipients._bytes(),
+            struct.pack('<i', self.no_activity_days),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _shortcut_id = reader.read_int()
+        _recipients = reader.tgread_object()
+        _no_activity_days = reader.read_int()
+        return cls(shortcut_id=_shortcut_id, recipients=_recipients, no_activity_days=_no_activity_days)
+
+TypeBusinessGreetingMessage = BusinessGreetingMessage
@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeGeoPoint
+
+
+
+class BusinessLocation(TLObject):
+    CONSTRUCTOR_ID = 0xac5c1af7
+    SUBCLASS_OF_ID = 0x99accad0
+    __slots__ = ('address', 'geo_point')
+
+    def __init__(self, address: str, geo_point: Optional['TypeGeoPoint']=None):
+        """
+        Constructor for BusinessLocation: Instance of BusinessLocation.
+        """
+        self.address = address
+        self.geo_point = geo_point
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessLocation',
+            'address': self.address,
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf7\x1a\\\xac',
+            struct.pack('<I', (0 if self.geo_point is None or self.geo_point is False else 1)),
+            b'' if self.geo_point is None or self.geo_point is False else (self.geo_point._bytes()),
+            self.serialize_bytes(self.address),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _geo_point = reader.tgread_object()
+        else:
+            _geo_point = None
+        _address = reader.tgread_string()
+        return cls(address=_address, geo_point=_geo_point)
+
+TypeBusinessLocation = BusinessLocation
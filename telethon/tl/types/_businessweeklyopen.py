@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class BusinessWeeklyOpen(TLObject):
+    CONSTRUCTOR_ID = 0x120b1ab9
+    SUBCLASS_OF_ID = 0x18402627
+    __slots__ = ('start_minute', 'end_minute')
+
+    def __init__(self, start_minute: int, end_minute: int):
+        """
+        Constructor for BusinessWeeklyOpen: Instance of BusinessWeeklyOpen.
+        """
+        self.start_minute = start_minute
+        self.end_minute = end_minute
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessWeeklyOpen',
+            'start_minute': self.start_minute,
+            'end_minute': self.end_minute
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb9\x1a\x0b\x12',
+            _struct_ii.pack(self.start_minute, self.end_minute),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _start_minute, _end_minute = reader.read_struct(_struct_ii)
+        return cls(start_minute=_start_minute, end_minute=_end_minute)
+
+TypeBusinessWeeklyOpen = BusinessWeeklyOpen
@@ -0,0 +1,55 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBusinessWeeklyOpen
+
+
+
+class BusinessWorkHours(TLObject):
+    CONSTRUCTOR_ID = 0x8c92b098
+    SUBCLASS_OF_ID = 0x659fa805
+    __slots__ = ('timezone_id', 'weekly_open', 'open_now')
+
+    def __init__(self, timezone_id: str, weekly_open: List['TypeBusinessWeeklyOpen'], open_now: Optional[bool]=None):
+        """
+        Constructor for BusinessWorkHours: Instance of BusinessWorkHours.
+        """
+        self.timezone_id = timezone_id
+        self.weekly_open = weekly_open
+        self.open_now = open_now
+
+    def to_dict(self):
+        return {
+            '_': 'BusinessWorkHours',
+            'timezone_id': self.timezone_id,
+            'weekly_open': [] if self.weekly_open is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.weekly_open],
+            'open_now': self.open_now
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x98\xb0\x92\x8c',
+            struct.pack('<I', (0 if self.open_now is None or self.open_now is False else 1)),
+            self.serialize_bytes(self.timezone_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.weekly_open)),b''.join(x._bytes() for x in self.weekly_open),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _open_now = bool(flags & 1)
+        _timezone_id = reader.tgread_string()
+        reader.read_int()
+        _weekly_open = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _weekly_open.append(_x)
+
+        return cls(timezone_id=_timezone_id, weekly_open=_weekly_open, open_now=_open_now)
+
+TypeBusinessWorkHours = BusinessWorkHours
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeCdnPublicKey
+
+
+
+class CdnConfig(TLObject):
+    CONSTRUCTOR_ID = 0x5725e40a
+    SUBCLASS_OF_ID = 0xecda397c
+    __slots__ = ('public_keys',)
+
+    def __init__(self, public_keys: List['TypeCdnPublicKey']):
+        """
+        Constructor for CdnConfig: Instance of CdnConfig.
+        """
+        self.public_keys = public_keys
+
+    def to_dict(self):
+        return {
+            '_': 'CdnConfig',
+            'public_keys': [] if self.public_keys is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.public_keys]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\n\xe4%W',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.public_keys)),b''.join(x._bytes() for x in self.public_keys),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _public_keys = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _public_keys.append(_x)
+
+        return cls(public_keys=_public_keys)
+
+TypeCdnConfig = CdnConfig
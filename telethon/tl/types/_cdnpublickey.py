@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class CdnPublicKey(TLObject):
+    CONSTRUCTOR_ID = 0xc982eaba
+    SUBCLASS_OF_ID = 0x16db47f3
+    __slots__ = ('dc_id', 'public_key')
+
+    def __init__(self, dc_id: int, public_key: str):
+        """
+        Constructor for CdnPublicKey: Instance of CdnPublicKey.
+        """
+        self.dc_id = dc_id
+        self.public_key = public_key
+
+    def to_dict(self):
+        return {
+            '_': 'CdnPublicKey',
+            'dc_id': self.dc_id,
+            'public_key': self.public_key
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xba\xea\x82\xc9',
+            struct.pack('<i', self.dc_id),
+            self.serialize_bytes(self.public_key),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _dc_id = reader.read_int()
+        _public_key = reader.tgread_string()
+        return cls(dc_id=_dc_id, public_key=_public_key)
+
+TypeCdnPublicKey = CdnPublicKey
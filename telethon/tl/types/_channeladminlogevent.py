@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChannelAdminLogEventAction
+
+
+
+class ChannelAdminLogEvent(TLObject):
+    CONSTRUCTOR_ID = 0x1fad68cd
+    SUBCLASS_OF_ID = 0x408f0999
+    __slots__ = ('id', 'date', 'user_id', 'action')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, date: Optional[datetime], user_id: int, action: 'TypeChannelAdminLogEventAction'):
+        """
+        Constructor for ChannelAdminLogEvent: Instance of ChannelAdminLogEvent.
+        """
+        self.id = id
+        self.date = date
+        self.user_id = user_id
+        self.action = action
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelAdminLogEvent',
+            'id': self.id,
+            'date': self.date,
+            'user_id': self.user_id,
+            'action': self.action.to_dict() if isinstance(self.action, TLObject) else self.action
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcdh\xad\x1f',
+            struct.pack('<q', self.id),
+            self.serialize_datetime(self.date),
+            struct.pack('<q', self.user_id),
+            self.action._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        _date = reader.tgread_date()
+        _user_id = reader.read_long()
+        _action = reader.tgread_object()
+        return cls(id=_id, date=_date, user_id=_user_id, action=_action)
+
+TypeChannelAdminLogEvent = ChannelAdminLogEvent
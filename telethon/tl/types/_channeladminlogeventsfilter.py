@@ -0,0 +1,93 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ChannelAdminLogEventsFilter(TLObject):
+    CONSTRUCTOR_ID = 0xea107ae4
+    SUBCLASS_OF_ID = 0x7cbbf319
+    __slots__ = ('join', 'leave', 'invite', 'ban', 'unban', 'kick', 'unkick', 'promote', 'demote', 'info', 'settings', 'pinned', 'edit', 'delete', 'group_call', 'invites', 'send', 'forums', 'sub_extend')
+
+    def __init__(self, join: Optional[bool]=None, leave: Optional[bool]=None, invite: Optional[bool]=None, ban: Optional[bool]=None, unban: Optional[bool]=None, kick: Optional[bool]=None, unkick: Optional[bool]=None, promote: Optional[bool]=None, demote: Optional[bool]=None, info: Optional[bool]=None, settings: Optional[bool]=None, pinned: Optional[bool]=None, edit: Optional[bool]=None, delete: Optional[bool]=None, group_call: Optional[bool]=None, invites: Optional[bool]=None, send: Optional[bool]=None, forums: Optional[bool]=None, sub_extend: Optional[bool]=None):
+        """
+        Constructor for ChannelAdminLogEventsFilter: Instance of ChannelAdminLogEventsFilter.
+        """
+        self.join = join
+        self.leave = leave
+        self.invite = invite
+        self.ban = ban
+        self.unban = unban
+        self.kick = kick
+        self.unkick = unkick
+        self.promote = promote
+        self.demote = demote
+        self.info = info
+        self.settings = settings
+        self.pinned = pinned
+        self.edit = edit
+        self.delete = delete
+        self.group_call = group_call
+        self.invites = invites
+        self.send = send
+        self.forums = forums
+        self.sub_extend = sub_extend
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelAdminLogEventsFilter',
+            'join': self.join,
+            'leave': self.leave,
+            'invite': self.invite,
+            'ban': self.ban,
+            'unban': self.unban,
+            'kick': self.kick,
+            'unkick': self.unkick,
+            'promote': self.promote,
+            'demote': self.demote,
+            'info': self.info,
+            'settings': self.settings,
+            'pinned': self.pinned,
+            'edit': self.edit,
+            'delete': self.delete,
+            'group_call': self.group_call,
+            'invites': self.invites,
+            'send': self.send,
+            'forums': self.forums,
+            'sub_extend': self.sub_extend
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4z\x10\xea',
+            struct.pack('<I', (0 if self.join is None or self.join is False else 1) | (0 if self.leave is None or self.leave is False else 2) | (0 if self.invite is None or self.invite is False else 4) | (0 if self.ban is None or self.ban is False else 8) | (0 if self.unban is None or self.unban is False else 16) | (0 if self.kick is None or self.kick is False else 32) | (0 if self.unkick is None or self.unkick is False else 64) | (0 if self.promote is None or self.promote is False else 128) | (0 if self.demote is None or self.demote is False else 256) | (0 if self.info is None or self.info is False else 512) | (0 if self.settings is None or self.settings is False else 1024) | (0 if self.pinned is None or self.pinned is False else 2048) | (0 if self.edit is None or self.edit is False else 4096) | (0 if self.delete is None or self.delete is False else 8192) | (0 if self.group_call is None or self.group_call is False else 16384) | (0 if self.invites is None or self.invites is False else 32768) | (0 if self.send is None or self.send is False else 65536) | (0 if self.forums is None or self.forums is False else 131072) | (0 if self.sub_extend is None or self.sub_extend is False else 262144)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _join = bool(flags & 1)
+        _leave = bool(flags & 2)
+        _invite = bool(flags & 4)
+        _ban = bool(flags & 8)
+        _unban = bool(flags & 16)
+        _kick = bool(flags & 32)
+        _unkick = bool(flags & 64)
+        _promote = bool(flags & 128)
+        _demote = bool(flags & 256)
+        _info = bool(flags & 512)
+        _settings = bool(flags & 1024)
+        _pinned = bool(flags & 2048)
+        _edit = bool(flags & 4096)
+        _delete = bool(flags & 8192)
+        _group_call = bool(flags & 16384)
+        _invites = bool(flags & 32768)
+        _send = bool(flags & 65536)
+        _forums = bool(flags & 131072)
+        _sub_extend = bool(flags & 262144)
+        return cls(join=_join, leave=_leave, invite=_invite, ban=_ban, unban=_unban, kick=_kick, unkick=_unkick, promote=_promote, demote=_demote, info=_info, settings=_settings, pinned=_pinned, edit=_edit, delete=_delete, group_call=_group_call, invites=_invites, send=_send, forums=_forums, sub_extend=_sub_extend)
+
+TypeChannelAdminLogEventsFilter = ChannelAdminLogEventsFilter
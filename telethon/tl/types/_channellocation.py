@@ -0,0 +1,64 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeGeoPoint
+
+
+
+class ChannelLocation(TLObject):
+    CONSTRUCTOR_ID = 0x209b82db
+    SUBCLASS_OF_ID = 0xec260b7f
+    __slots__ = ('geo_point', 'address')
+
+    def __init__(self, geo_point: 'TypeGeoPoint', address: str):
+        """
+        Constructor for ChannelLocation: Instance of either ChannelLocationEmpty, ChannelLocation.
+        """
+        self.geo_point = geo_point
+        self.address = address
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelLocation',
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point,
+            'address': self.address
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdb\x82\x9b ',
+            self.geo_point._bytes(),
+            self.serialize_bytes(self.address),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _geo_point = reader.tgread_object()
+        _address = reader.tgread_string()
+        return cls(geo_point=_geo_point, address=_address)
+
+
+class ChannelLocationEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xbfb5ad8b
+    SUBCLASS_OF_ID = 0xec260b7f
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelLocationEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8b\xad\xb5\xbf',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeChannelLocation = Union[ChannelLocationEmpty,ChannelLocation]
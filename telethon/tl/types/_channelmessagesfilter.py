@@ -0,0 +1,71 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageRange
+
+
+
+class ChannelMessagesFilter(TLObject):
+    CONSTRUCTOR_ID = 0xcd77d957
+    SUBCLASS_OF_ID = 0x13336a56
+    __slots__ = ('ranges', 'exclude_new_messages')
+
+    def __init__(self, ranges: List['TypeMessageRange'], exclude_new_messages: Optional[bool]=None):
+        """
+        Constructor for ChannelMessagesFilter: Instance of either ChannelMessagesFilterEmpty, ChannelMessagesFilter.
+        """
+        self.ranges = ranges
+        self.exclude_new_messages = exclude_new_messages
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelMessagesFilter',
+            'ranges': [] if self.ranges is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.ranges],
+            'exclude_new_messages': self.exclude_new_messages
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'W\xd9w\xcd',
+            struct.pack('<I', (0 if self.exclude_new_messages is None or self.exclude_new_messages is False else 2)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.ranges)),b''.join(x._bytes() for x in self.ranges),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _exclude_new_messages = bool(flags & 2)
+        reader.read_int()
+        _ranges = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _ranges.append(_x)
+
+        return cls(ranges=_ranges, exclude_new_messages=_exclude_new_messages)
+
+
+class ChannelMessagesFilterEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x94d42ee7
+    SUBCLASS_OF_ID = 0x13336a56
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelMessagesFilterEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe7.\xd4\x94',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeChannelMessagesFilter = Union[ChannelMessagesFilterEmpty,ChannelMessagesFilter]
@@ -0,0 +1,279 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iq = struct.Struct('<iq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatAdminRights, TypeChatBannedRights, TypePeer
+
+
+
+class ChannelParticipant(TLObject):
+    CONSTRUCTOR_ID = 0xcb397619
+    SUBCLASS_OF_ID = 0xd9c7fc18
+    __slots__ = ('user_id', 'date', 'subscription_until_date')
+
+    def __init__(self, user_id: int, date: Optional[datetime], subscription_until_date: Optional[datetime]=None):
+        """
+        Constructor for ChannelParticipant: Instance of either ChannelParticipant, ChannelParticipantSelf, ChannelParticipantCreator, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantLeft.
+        """
+        self.user_id = user_id
+        self.date = date
+        self.subscription_until_date = subscription_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipant',
+            'user_id': self.user_id,
+            'date': self.date,
+            'subscription_until_date': self.subscription_until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19v9\xcb',
+            _struct_Iq.pack((0 if self.subscription_until_date is None or self.subscription_until_date is False else 1), self.user_id),
+            self.serialize_datetime(self.date),
+            b'' if self.subscription_until_date is None or self.subscription_until_date is False else (self.serialize_datetime(self.subscription_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id = reader.read_struct(_struct_iq)
+        _date = reader.tgread_date()
+        if flags & 1:
+            _subscription_until_date = reader.tgread_date()
+        else:
+            _subscription_until_date = None
+        return cls(user_id=_user_id, date=_date, subscription_until_date=_subscription_until_date)
+
+
+class ChannelParticipantAdmin(TLObject):
+    CONSTRUCTOR_ID = 0x34c3bb53
+    SUBCLASS_OF_ID = 0xd9c7fc18
+    __slots__ = ('user_id', 'promoted_by', 'date', 'admin_rights', 'can_edit', 'is_self', 'inviter_id', 'rank')
+
+    def __init__(self, user_id: int, promoted_by: int, date: Optional[datetime], admin_rights: 'TypeChatAdminRights', can_edit: Optional[bool]=None, is_self: Optional[bool]=None, inviter_id: Optional[int]=None, rank: Optional[str]=None):
+        """
+        Constructor for ChannelParticipant: Instance of either ChannelParticipant, ChannelParticipantSelf, ChannelParticipantCreator, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantLeft.
+        """
+        self.user_id = user_id
+        self.promoted_by = promoted_by
+        self.date = date
+        self.admin_rights = admin_rights
+        self.can_edit = can_edit
+        self.is_self = is_self
+        self.inviter_id = inviter_id
+        self.rank = rank
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantAdmin',
+            'user_id': self.user_id,
+            'promoted_by': self.promoted_by,
+            'date': self.date,
+            'admin_rights': self.admin_rights.to_dict() if isinstance(self.admin_rights, TLObject) else self.admin_rights,
+            'can_edit': self.can_edit,
+            'is_self': self.is_self,
+            'inviter_id': self.inviter_id,
+            'rank': self.rank
+        }
+
+    def _bytes(self):
+        assert ((self.is_self or self.is_self is not None) and (self.inviter_id or self.inviter_id is not None)) or ((self.is_self is None or self.is_self is False) and (self.inviter_id is None or self.inviter_id is False)), 'is_self, inviter_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'S\xbb\xc34',
+            _struct_Iq.pack((0 if self.can_edit is None or self.can_edit is False else 1) | (0 if self.is_self is None or self.is_self is False else 2) | (0 if self.inviter_id is None or self.inviter_id is False else 2) | (0 if self.rank is None or self.rank is False else 4), self.user_id),
+            b'' if self.inviter_id is None or self.inviter_id is False else (struct.pack('<q', self.inviter_id)),
+            struct.pack('<q', self.promoted_by),
+            self.serialize_datetime(self.date),
+            self.admin_rights._bytes(),
+            b'' if self.rank is None or self.rank is False else (self.serialize_bytes(self.rank)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id = reader.read_struct(_struct_iq)
+        _can_edit = bool(flags & 1)
+        _is_self = bool(flags & 2)
+        if flags & 2:
+            _inviter_id = reader.read_long()
+        else:
+            _inviter_id = None
+        _promoted_by = reader.read_long()
+        _date = reader.tgread_date()
+        _admin_rights = reader.tgread_object()
+        if flags & 4:
+            _rank = reader.tgread_string()
+        else:
+            _rank = None
+        return cls(user_id=_user_id, promoted_by=_promoted_by, date=_date, admin_rights=_admin_rights, can_edit=_can_edit, is_self=_is_self, inviter_id=_inviter_id, rank=_rank)
+
+
+class ChannelParticipantBanned(TLObject):
+    CONSTRUCTOR_ID = 0x6df8014e
+    SUBCLASS_OF_ID = 0xd9c7fc18
+    __slots__ = ('peer', 'kicked_by', 'date', 'banned_rights', 'left')
+
+    def __init__(self, peer: 'TypePeer', kicked_by: int, date: Optional[datetime], banned_rights: 'TypeChatBannedRights', left: Optional[bool]=None):
+        """
+        Constructor for ChannelParticipant: Instance of either ChannelParticipant, ChannelParticipantSelf, ChannelParticipantCreator, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantLeft.
+        """
+        self.peer = peer
+        self.kicked_by = kicked_by
+        self.date = date
+        self.banned_rights = banned_rights
+        self.left = left
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantBanned',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'kicked_by': self.kicked_by,
+            'date': self.date,
+            'banned_rights': self.banned_rights.to_dict() if isinstance(self.banned_rights, TLObject) else self.banned_rights,
+            'left': self.left
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'N\x01\xf8m',
+            struct.pack('<I', (0 if self.left is None or self.left is False else 1)),
+            self.peer._bytes(),
+            struct.pack('<q', self.kicked_by),
+            self.serialize_datetime(self.date),
+            self.banned_rights._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _left = bool(flags & 1)
+        _peer = reader.tgread_object()
+        _kicked_by = reader.read_long()
+        _date = reader.tgread_date()
+        _banned_rights = reader.tgread_object()
+        return cls(peer=_peer, kicked_by=_kicked_by, date=_date, banned_rights=_banned_rights, left=_left)
+
+
+class ChannelParticipantCreator(TLObject):
+    CONSTRUCTOR_ID = 0x2fe601d3
+    SUBCLASS_OF_ID = 0xd9c7fc18
+    __slots__ = ('user_id', 'admin_rights', 'rank')
+
+    def __init__(self, user_id: int, admin_rights: 'TypeChatAdminRights', rank: Optional[str]=None):
+        """
+        Constructor for ChannelParticipant: Instance of either ChannelParticipant, ChannelParticipantSelf, ChannelParticipantCreator, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantLeft.
+        """
+        self.user_id = user_id
+        self.admin_rights = admin_rights
+        self.rank = rank
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantCreator',
+            'user_id': self.user_id,
+            'admin_rights': self.admin_rights.to_dict() if isinstance(self.admin_rights, TLObject) else self.admin_rights,
+            'rank': self.rank
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3\x01\xe6/',
+            _struct_Iq.pack((0 if self.rank is None or self.rank is False else 1), self.user_id),
+            self.admin_rights._bytes(),
+            b'' if self.rank is None or self.rank is False else (self.serialize_bytes(self.rank)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id = reader.read_struct(_struct_iq)
+        _admin_rights = reader.tgread_object()
+        if flags & 1:
+            _rank = reader.tgread_string()
+        else:
+            _rank = None
+        return cls(user_id=_user_id, admin_rights=_admin_rights, rank=_rank)
+
+
+class ChannelParticipantLeft(TLObject):
+    CONSTRUCTOR_ID = 0x1b03f006
+    SUBCLASS_OF_ID = 0xd9c7fc18
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypePeer'):
+        """
+        Constructor for ChannelParticipant: Instance of either ChannelParticipant, ChannelParticipantSelf, ChannelParticipantCreator, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantLeft.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantLeft',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x06\xf0\x03\x1b',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class ChannelParticipantSelf(TLObject):
+    CONSTRUCTOR_ID = 0x4f607bef
+    SUBCLASS_OF_ID = 0xd9c7fc18
+    __slots__ = ('user_id', 'inviter_id', 'date', 'via_request', 'subscription_until_date')
+
+    def __init__(self, user_id: int, inviter_id: int, date: Optional[datetime], via_request: Optional[bool]=None, subscription_until_date: Optional[datetime]=None):
+        """
+        Constructor for ChannelParticipant: Instance of either ChannelParticipant, ChannelParticipantSelf, ChannelParticipantCreator, ChannelParticipantAdmin, ChannelParticipantBanned, ChannelParticipantLeft.
+        """
+        self.user_id = user_id
+        self.inviter_id = inviter_id
+        self.date = date
+        self.via_request = via_request
+        self.subscription_until_date = subscription_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantSelf',
+            'user_id': self.user_id,
+            'inviter_id': self.inviter_id,
+            'date': self.date,
+            'via_request': self.via_request,
+            'subscription_until_date': self.subscription_until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xef{`O',
+            _struct_Iqq.pack((0 if self.via_request is None or self.via_request is False else 1) | (0 if self.subscription_until_date is None or self.subscription_until_date is False else 2), self.user_id, self.inviter_id),
+            self.serialize_datetime(self.date),
+            b'' if self.subscription_until_date is None or self.subscription_until_date is False else (self.serialize_datetime(self.subscription_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id, _inviter_id = reader.read_struct(_struct_iqq)
+        _via_request = bool(flags & 1)
+        _date = reader.tgread_date()
+        if flags & 2:
+            _subscription_until_date = reader.tgread_date()
+        else:
+            _subscription_until_date = None
+        return cls(user_id=_user_id, inviter_id=_inviter_id, date=_date, via_request=_via_request, subscription_until_date=_subscription_until_date)
+
+TypeChannelParticipant = Union[ChannelParticipant,ChannelParticipantSelf,ChannelParticipantCreator,ChannelParticipantAdmin,ChannelParticipantBanned,ChannelParticipantLeft]
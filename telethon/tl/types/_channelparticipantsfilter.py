@@ -0,0 +1,226 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ChannelParticipantsAdmins(TLObject):
+    CONSTRUCTOR_ID = 0xb4608969
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsAdmins'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'i\x89`\xb4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class ChannelParticipantsBanned(TLObject):
+    CONSTRUCTOR_ID = 0x1427a5e1
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ('q',)
+
+    def __init__(self, q: str):
+        """
+        Constructor for ChannelParticipantsFilter: Instance of either ChannelParticipantsRecent, ChannelParticipantsAdmins, ChannelParticipantsKicked, ChannelParticipantsBots, ChannelParticipantsBanned, ChannelParticipantsSearch, ChannelParticipantsContacts, ChannelParticipantsMentions.
+        """
+        self.q = q
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsBanned',
+            'q': self.q
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"\xe1\xa5'\x14",
+            self.serialize_bytes(self.q),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _q = reader.tgread_string()
+        return cls(q=_q)
+
+
+class ChannelParticipantsBots(TLObject):
+    CONSTRUCTOR_ID = 0xb0d1865b
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsBots'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'[\x86\xd1\xb0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class ChannelParticipantsContacts(TLObject):
+    CONSTRUCTOR_ID = 0xbb6ae88d
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ('q',)
+
+    def __init__(self, q: str):
+        """
+        Constructor for ChannelParticipantsFilter: Instance of either ChannelParticipantsRecent, ChannelParticipantsAdmins, ChannelParticipantsKicked, ChannelParticipantsBots, ChannelParticipantsBanned, ChannelParticipantsSearch, ChannelParticipantsContacts, ChannelParticipantsMentions.
+        """
+        self.q = q
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsContacts',
+            'q': self.q
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8d\xe8j\xbb',
+            self.serialize_bytes(self.q),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _q = reader.tgread_string()
+        return cls(q=_q)
+
+
+class ChannelParticipantsKicked(TLObject):
+    CONSTRUCTOR_ID = 0xa3b54985
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ('q',)
+
+    def __init__(self, q: str):
+        """
+        Constructor for ChannelParticipantsFilter: Instance of either ChannelParticipantsRecent, ChannelParticipantsAdmins, ChannelParticipantsKicked, ChannelParticipantsBots, ChannelParticipantsBanned, ChannelParticipantsSearch, ChannelParticipantsContacts, ChannelParticipantsMentions.
+        """
+        self.q = q
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsKicked',
+            'q': self.q
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x85I\xb5\xa3',
+            self.serialize_bytes(self.q),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _q = reader.tgread_string()
+        return cls(q=_q)
+
+
+class ChannelParticipantsMentions(TLObject):
+    CONSTRUCTOR_ID = 0xe04b5ceb
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ('q', 'top_msg_id')
+
+    def __init__(self, q: Optional[str]=None, top_msg_id: Optional[int]=None):
+        """
+        Constructor for ChannelParticipantsFilter: Instance of either ChannelParticipantsRecent, ChannelParticipantsAdmins, ChannelParticipantsKicked, ChannelParticipantsBots, ChannelParticipantsBanned, ChannelParticipantsSearch, ChannelParticipantsContacts, ChannelParticipantsMentions.
+        """
+        self.q = q
+        self.top_msg_id = top_msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsMentions',
+            'q': self.q,
+            'top_msg_id': self.top_msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeb\\K\xe0',
+            struct.pack('<I', (0 if self.q is None or self.q is False else 1) | (0 if self.top_msg_id is None or self.top_msg_id is False else 2)),
+            b'' if self.q is None or self.q is False else (self.serialize_bytes(self.q)),
+            b'' if self.top_msg_id is None or self.top_msg_id is False else (struct.pack('<i', self.top_msg_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _q = reader.tgread_string()
+        else:
+            _q = None
+        if flags & 2:
+            _top_msg_id = reader.read_int()
+        else:
+            _top_msg_id = None
+        return cls(q=_q, top_msg_id=_top_msg_id)
+
+
+class ChannelParticipantsRecent(TLObject):
+    CONSTRUCTOR_ID = 0xde3f3c79
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsRecent'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'y<?\xde',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class ChannelParticipantsSearch(TLObject):
+    CONSTRUCTOR_ID = 0x656ac4b
+    SUBCLASS_OF_ID = 0xbf4e2753
+    __slots__ = ('q',)
+
+    def __init__(self, q: str):
+        """
+        Constructor for ChannelParticipantsFilter: Instance of either ChannelParticipantsRecent, ChannelParticipantsAdmins, ChannelParticipantsKicked, ChannelParticipantsBots, ChannelParticipantsBanned, ChannelParticipantsSearch, ChannelParticipantsContacts, ChannelParticipantsMentions.
+        """
+        self.q = q
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelParticipantsSearch',
+            'q': self.q
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'K\xacV\x06',
+            self.serialize_bytes(self.q),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _q = reader.tgread_string()
+        return cls(q=_q)
+
+TypeChannelParticipantsFilter = Union[ChannelParticipantsRecent,ChannelParticipantsAdmins,ChannelParticipantsKicked,ChannelParticipantsBots,ChannelParticipantsBanned,ChannelParticipantsSearch,ChannelParticipantsContacts,ChannelParticipantsMentions]
@@ -0,0 +1,457 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_IIq = struct.Struct('<IIq')
+_struct_Iq = struct.Struct('<Iq')
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iiq = struct.Struct('<iiq')
+_struct_iq = struct.Struct('<iq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatAdminRights, TypeChatBannedRights, TypeChatPhoto, TypeEmojiStatus, TypeInputChannel, TypePeerColor, TypeRestrictionReason, TypeUsername
+
+
+
+class Channel(TLObject):
+    CONSTRUCTOR_ID = 0x7482147e
+    SUBCLASS_OF_ID = 0xc5af5d94
+    __slots__ = ('id', 'title', 'photo', 'date', 'creator', 'left', 'broadcast', 'verified', 'megagroup', 'restricted', 'signatures', 'min', 'scam', 'has_link', 'has_geo', 'slowmode_enabled', 'call_active', 'call_not_empty', 'fake', 'gigagroup', 'noforwards', 'join_to_send', 'join_request', 'forum', 'stories_hidden', 'stories_hidden_min', 'stories_unavailable', 'signature_profiles', 'access_hash', 'username', 'restriction_reason', 'admin_rights', 'banned_rights', 'default_banned_rights', 'participants_count', 'usernames', 'stories_max_id', 'color', 'profile_color', 'emoji_status', 'level', 'subscription_until_date', 'bot_verification_icon', 'send_paid_messages_stars')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, title: str, photo: 'TypeChatPhoto', date: Optional[datetime], creator: Optional[bool]=None, left: Optional[bool]=None, broadcast: Optional[bool]=None, verified: Optional[bool]=None, megagroup: Optional[bool]=None, restricted: Optional[bool]=None, signatures: Optional[bool]=None, min: Optional[bool]=None, scam: Optional[bool]=None, has_link: Optional[bool]=None, has_geo: Optional[bool]=None, slowmode_enabled: Optional[bool]=None, call_active: Optional[bool]=None, call_not_empty: Optional[bool]=None, fake: Optional[bool]=None, gigagroup: Optional[bool]=None, noforwards: Optional[bool]=None, join_to_send: Optional[bool]=None, join_request: Optional[bool]=None, forum: Optional[bool]=None, stories_hidden: Optional[bool]=None, stories_hidden_min: Optional[bool]=None, stories_unavailable: Optional[bool]=None, signature_profiles: Optional[bool]=None, access_hash: Optional[int]=None, username: Optional[str]=None, restriction_reason: Optional[List['TypeRestrictionReason']]=None, admin_rights: Optional['TypeChatAdminRights']=None, banned_rights: Optional['TypeChatBannedRights']=None, default_banned_rights: Optional['TypeChatBannedRights']=None, participants_count: Optional[int]=None, usernames: Optional[List['TypeUsername']]=None, stories_max_id: Optional[int]=None, color: Optional['TypePeerColor']=None, profile_color: Optional['TypePeerColor']=None, emoji_status: Optional['TypeEmojiStatus']=None, level: Optional[int]=None, subscription_until_date: Optional[datetime]=None, bot_verification_icon: Optional[int]=None, send_paid_messages_stars: Optional[int]=None):
+        """
+        Constructor for Chat: Instance of either ChatEmpty, Chat, ChatForbidden, Channel, ChannelForbidden.
+        """
+        self.id = id
+        self.title = title
+        self.photo = photo
+        self.date = date
+        self.creator = creator
+        self.left = left
+        self.broadcast = broadcast
+        self.verified = verified
+        self.megagroup = megagroup
+        self.restricted = restricted
+        self.signatures = signatures
+        self.min = min
+        self.scam = scam
+        self.has_link = has_link
+        self.has_geo = has_geo
+        self.slowmode_enabled = slowmode_enabled
+        self.call_active = call_active
+        self.call_not_empty = call_not_empty
+        self.fake = fake
+        self.gigagroup = gigagroup
+        self.noforwards = noforwards
+        self.join_to_send = join_to_send
+        self.join_request = join_request
+        self.forum = forum
+        self.stories_hidden = stories_hidden
+        self.stories_hidden_min = stories_hidden_min
+        self.stories_unavailable = stories_unavailable
+        self.signature_profiles = signature_profiles
+        self.access_hash = access_hash
+        self.username = username
+        self.restriction_reason = restriction_reason
+        self.admin_rights = admin_rights
+        self.banned_rights = banned_rights
+        self.default_banned_rights = default_banned_rights
+        self.participants_count = participants_count
+        self.usernames = usernames
+        self.stories_max_id = stories_max_id
+        self.color = color
+        self.profile_color = profile_color
+        self.emoji_status = emoji_status
+        self.level = level
+        self.subscription_until_date = subscription_until_date
+        self.bot_verification_icon = bot_verification_icon
+        self.send_paid_messages_stars = send_paid_messages_stars
+
+    def to_dict(self):
+        return {
+            '_': 'Channel',
+            'id': self.id,
+            'title': self.title,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'date': self.date,
+            'creator': self.creator,
+            'left': self.left,
+            'broadcast': self.broadcast,
+            'verified': self.verified,
+            'megagroup': self.megagroup,
+            'restricted': self.restricted,
+            'signatures': self.signatures,
+            'min': self.min,
+            'scam': self.scam,
+            'has_link': self.has_link,
+            'has_geo': self.has_geo,
+            'slowmode_enabled': self.slowmode_enabled,
+            'call_active': self.call_active,
+            'call_not_empty': self.call_not_empty,
+            'fake': self.fake,
+            'gigagroup': self.gigagroup,
+            'noforwards': self.noforwards,
+            'join_to_send': self.join_to_send,
+            'join_request': self.join_request,
+            'forum': self.forum,
+            'stories_hidden': self.stories_hidden,
+            'stories_hidden_min': self.stories_hidden_min,
+            'stories_unavailable': self.stories_unavailable,
+            'signature_profiles': self.signature_profiles,
+            'access_hash': self.access_hash,
+            'username': self.username,
+            'restriction_reason': [] if self.restriction_reason is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.restriction_reason],
+            'admin_rights': self.admin_rights.to_dict() if isinstance(self.admin_rights, TLObject) else self.admin_rights,
+            'banned_rights': self.banned_rights.to_dict() if isinstance(self.banned_rights, TLObject) else self.banned_rights,
+            'default_banned_rights': self.default_banned_rights.to_dict() if isinstance(self.default_banned_rights, TLObject) else self.default_banned_rights,
+            'participants_count': self.participants_count,
+            'usernames': [] if self.usernames is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.usernames],
+            'stories_max_id': self.stories_max_id,
+            'color': self.color.to_dict() if isinstance(self.color, TLObject) else self.color,
+            'profile_color': self.profile_color.to_dict() if isinstance(self.profile_color, TLObject) else self.profile_color,
+            'emoji_status': self.emoji_status.to_dict() if isinstance(self.emoji_status, TLObject) else self.emoji_status,
+            'level': self.level,
+            'subscription_until_date': self.subscription_until_date,
+            'bot_verification_icon': self.bot_verification_icon,
+            'send_paid_messages_stars': self.send_paid_messages_stars
+        }
+
+    def _bytes(self):
+        assert ((self.restricted or self.restricted is not None) and (self.restriction_reason or self.restriction_reason is not None)) or ((self.restricted is None or self.restricted is False) and (self.restriction_reason is None or self.restriction_reason is False)), 'restricted, restriction_reason parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'~\x14\x82t',
+            _struct_IIq.pack((0 if self.creator is None or self.creator is False else 1) | (0 if self.left is None or self.left is False else 4) | (0 if self.broadcast is None or self.broadcast is False else 32) | (0 if self.verified is None or self.verified is False else 128) | (0 if self.megagroup is None or self.megagroup is False else 256) | (0 if self.restricted is None or self.restricted is False else 512) | (0 if self.signatures is None or self.signatures is False else 2048) | (0 if self.min is None or self.min is False else 4096) | (0 if self.scam is None or self.scam is False else 524288) | (0 if self.has_link is None or self.has_link is False else 1048576) | (0 if self.has_geo is None or self.has_geo is False else 2097152) | (0 if self.slowmode_enabled is None or self.slowmode_enabled is False else 4194304) | (0 if self.call_active is None or self.call_active is False else 8388608) | (0 if self.call_not_empty is None or self.call_not_empty is False else 16777216) | (0 if self.fake is None or self.fake is False else 33554432) | (0 if self.gigagroup is None or self.gigagroup is False else 67108864) | (0 if self.noforwards is None or self.noforwards is False else 134217728) | (0 if self.join_to_send is None or self.join_to_send is False else 268435456) | (0 if self.join_request is None or self.join_request is False else 536870912) | (0 if self.forum is None or self.forum is False else 1073741824) | (0 if self.access_hash is None or self.access_hash is False else 8192) | (0 if self.username is None or self.username is False else 64) | (0 if self.restriction_reason is None or self.restriction_reason is False else 512) | (0 if self.admin_rights is None or self.admin_rights is False else 16384) | (0 if self.banned_rights is None or self.banned_rights is False else 32768) | (0 if self.default_banned_rights is None or self.default_banned_rights is False else 262144) | (0 if self.participants_count is None or self.participants_count is False else 131072), (0 if self.stories_hidden is None or self.stories_hidden is False else 2) | (0 if self.stories_hidden_min is None or self.stories_hidden_min is False else 4) | (0 if self.stories_unavailable is None or self.stories_unavailable is False else 8) | (0 if self.signature_profiles is None or self.signature_profiles is False else 4096) | (0 if self.usernames is None or self.usernames is False else 1) | (0 if self.stories_max_id is None or self.stories_max_id is False else 16) | (0 if self.color is None or self.color is False else 128) | (0 if self.profile_color is None or self.profile_color is False else 256) | (0 if self.emoji_status is None or self.emoji_status is False else 512) | (0 if self.level is None or self.level is False else 1024) | (0 if self.subscription_until_date is None or self.subscription_until_date is False else 2048) | (0 if self.bot_verification_icon is None or self.bot_verification_icon is False else 8192) | (0 if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else 16384), self.id),
+            b'' if self.access_hash is None or self.access_hash is False else (struct.pack('<q', self.access_hash)),
+            self.serialize_bytes(self.title),
+            b'' if self.username is None or self.username is False else (self.serialize_bytes(self.username)),
+            self.photo._bytes(),
+            self.serialize_datetime(self.date),
+            b'' if self.restriction_reason is None or self.restriction_reason is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.restriction_reason)),b''.join(x._bytes() for x in self.restriction_reason))),
+            b'' if self.admin_rights is None or self.admin_rights is False else (self.admin_rights._bytes()),
+            b'' if self.banned_rights is None or self.banned_rights is False else (self.banned_rights._bytes()),
+            b'' if self.default_banned_rights is None or self.default_banned_rights is False else (self.default_banned_rights._bytes()),
+            b'' if self.participants_count is None or self.participants_count is False else (struct.pack('<i', self.participants_count)),
+            b'' if self.usernames is None or self.usernames is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.usernames)),b''.join(x._bytes() for x in self.usernames))),
+            b'' if self.stories_max_id is None or self.stories_max_id is False else (struct.pack('<i', self.stories_max_id)),
+            b'' if self.color is None or self.color is False else (self.color._bytes()),
+            b'' if self.profile_color is None or self.profile_color is False else (self.profile_color._bytes()),
+            b'' if self.emoji_status is None or self.emoji_status is False else (self.emoji_status._bytes()),
+            b'' if self.level is None or self.level is False else (struct.pack('<i', self.level)),
+            b'' if self.subscription_until_date is None or self.subscription_until_date is False else (self.serialize_datetime(self.subscription_until_date)),
+            b'' if self.bot_verification_icon is None or self.bot_verification_icon is False else (struct.pack('<q', self.bot_verification_icon)),
+            b'' if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else (struct.pack('<q', self.send_paid_messages_stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, flags2, _id = reader.read_struct(_struct_iiq)
+        _creator = bool(flags & 1)
+        _left = bool(flags & 4)
+        _broadcast = bool(flags & 32)
+        _verified = bool(flags & 128)
+        _megagroup = bool(flags & 256)
+        _restricted = bool(flags & 512)
+        _signatures = bool(flags & 2048)
+        _min = bool(flags & 4096)
+        _scam = bool(flags & 524288)
+        _has_link = bool(flags & 1048576)
+        _has_geo = bool(flags & 2097152)
+        _slowmode_enabled = bool(flags & 4194304)
+        _call_active = bool(flags & 8388608)
+        _call_not_empty = bool(flags & 16777216)
+        _fake = bool(flags & 33554432)
+        _gigagroup = bool(flags & 67108864)
+        _noforwards = bool(flags & 134217728)
+        _join_to_send = bool(flags & 268435456)
+        _join_request = bool(flags & 536870912)
+        _forum = bool(flags & 1073741824)
+        _stories_hidden = bool(flags2 & 2)
+        _stories_hidden_min = bool(flags2 & 4)
+        _stories_unavailable = bool(flags2 & 8)
+        _signature_profiles = bool(flags2 & 4096)
+        if flags & 8192:
+            _access_hash = reader.read_long()
+        else:
+            _access_hash = None
+        _title = reader.tgread_string()
+        if flags & 64:
+            _username = reader.tgread_string()
+        else:
+            _username = None
+        _photo = reader.tgread_object()
+        _date = reader.tgread_date()
+        if flags & 512:
+            reader.read_int()
+            _restriction_reason = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _restriction_reason.append(_x)
+
+        else:
+            _restriction_reason = None
+        if flags & 16384:
+            _admin_rights = reader.tgread_object()
+        else:
+            _admin_rights = None
+        if flags & 32768:
+            _banned_rights = reader.tgread_object()
+        else:
+            _banned_rights = None
+        if flags & 262144:
+            _default_banned_rights = reader.tgread_object()
+        else:
+            _default_banned_rights = None
+        if flags & 131072:
+            _participants_count = reader.read_int()
+        else:
+            _participants_count = None
+        if flags2 & 1:
+            reader.read_int()
+            _usernames = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _usernames.append(_x)
+
+        else:
+            _usernames = None
+        if flags2 & 16:
+            _stories_max_id = reader.read_int()
+        else:
+            _stories_max_id = None
+        if flags2 & 128:
+            _color = reader.tgread_object()
+        else:
+            _color = None
+        if flags2 & 256:
+            _profile_color = reader.tgread_object()
+        else:
+            _profile_color = None
+        if flags2 & 512:
+            _emoji_status = reader.tgread_object()
+        else:
+            _emoji_status = None
+        if flags2 & 1024:
+            _level = reader.read_int()
+        else:
+            _level = None
+        if flags2 & 2048:
+            _subscription_until_date = reader.tgread_date()
+        else:
+            _subscription_until_date = None
+        if flags2 & 8192:
+            _bot_verification_icon = reader.read_long()
+        else:
+            _bot_verification_icon = None
+        if flags2 & 16384:
+            _send_paid_messages_stars = reader.read_long()
+        else:
+            _send_paid_messages_stars = None
+        return cls(id=_id, title=_title, photo=_photo, date=_date, creator=_creator, left=_left, broadcast=_broadcast, verified=_verified, megagroup=_megagroup, restricted=_restricted, signatures=_signatures, min=_min, scam=_scam, has_link=_has_link, has_geo=_has_geo, slowmode_enabled=_slowmode_enabled, call_active=_call_active, call_not_empty=_call_not_empty, fake=_fake, gigagroup=_gigagroup, noforwards=_noforwards, join_to_send=_join_to_send, join_request=_join_request, forum=_forum, stories_hidden=_stories_hidden, stories_hidden_min=_stories_hidden_min, stories_unavailable=_stories_unavailable, signature_profiles=_signature_profiles, access_hash=_access_hash, username=_username, restriction_reason=_restriction_reason, admin_rights=_admin_rights, banned_rights=_banned_rights, default_banned_rights=_default_banned_rights, participants_count=_participants_count, usernames=_usernames, stories_max_id=_stories_max_id, color=_color, profile_color=_profile_color, emoji_status=_emoji_status, level=_level, subscription_until_date=_subscription_until_date, bot_verification_icon=_bot_verification_icon, send_paid_messages_stars=_send_paid_messages_stars)
+
+
+class ChannelForbidden(TLObject):
+    CONSTRUCTOR_ID = 0x17d493d5
+    SUBCLASS_OF_ID = 0xc5af5d94
+    __slots__ = ('id', 'access_hash', 'title', 'broadcast', 'megagroup', 'until_date')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, title: str, broadcast: Optional[bool]=None, megagroup: Optional[bool]=None, until_date: Optional[datetime]=None):
+        """
+        Constructor for Chat: Instance of either ChatEmpty, Chat, ChatForbidden, Channel, ChannelForbidden.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.title = title
+        self.broadcast = broadcast
+        self.megagroup = megagroup
+        self.until_date = until_date
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelForbidden',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'title': self.title,
+            'broadcast': self.broadcast,
+            'megagroup': self.megagroup,
+            'until_date': self.until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd5\x93\xd4\x17',
+            _struct_Iqq.pack((0 if self.broadcast is None or self.broadcast is False else 32) | (0 if self.megagroup is None or self.megagroup is False else 256) | (0 if self.until_date is None or self.until_date is False else 65536), self.id, self.access_hash),
+            self.serialize_bytes(self.title),
+            b'' if self.until_date is None or self.until_date is False else (self.serialize_datetime(self.until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _broadcast = bool(flags & 32)
+        _megagroup = bool(flags & 256)
+        _title = reader.tgread_string()
+        if flags & 65536:
+            _until_date = reader.tgread_date()
+        else:
+            _until_date = None
+        return cls(id=_id, access_hash=_access_hash, title=_title, broadcast=_broadcast, megagroup=_megagroup, until_date=_until_date)
+
+
+class Chat(TLObject):
+    CONSTRUCTOR_ID = 0x41cbf256
+    SUBCLASS_OF_ID = 0xc5af5d94
+    __slots__ = ('id', 'title', 'photo', 'participants_count', 'date', 'version', 'creator', 'left', 'deactivated', 'call_active', 'call_not_empty', 'noforwards', 'migrated_to', 'admin_rights', 'default_banned_rights')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, title: str, photo: 'TypeChatPhoto', participants_count: int, date: Optional[datetime], version: int, creator: Optional[bool]=None, left: Optional[bool]=None, deactivated: Optional[bool]=None, call_active: Optional[bool]=None, call_not_empty: Optional[bool]=None, noforwards: Optional[bool]=None, migrated_to: Optional['TypeInputChannel']=None, admin_rights: Optional['TypeChatAdminRights']=None, default_banned_rights: Optional['TypeChatBannedRights']=None):
+        """
+        Constructor for Chat: Instance of either ChatEmpty, Chat, ChatForbidden, Channel, ChannelForbidden.
+        """
+        self.id = id
+        self.title = title
+        self.photo = photo
+        self.participants_count = participants_count
+        self.date = date
+        self.version = version
+        self.creator = creator
+        self.left = left
+        self.deactivated = deactivated
+        self.call_active = call_active
+        self.call_not_empty = call_not_empty
+        self.noforwards = noforwards
+        self.migrated_to = migrated_to
+        self.admin_rights = admin_rights
+        self.default_banned_rights = default_banned_rights
+
+    def to_dict(self):
+        return {
+            '_': 'Chat',
+            'id': self.id,
+            'title': self.title,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'participants_count': self.participants_count,
+            'date': self.date,
+            'version': self.version,
+            'creator': self.creator,
+            'left': self.left,
+            'deactivated': self.deactivated,
+            'call_active': self.call_active,
+            'call_not_empty': self.call_not_empty,
+            'noforwards': self.noforwards,
+            'migrated_to': self.migrated_to.to_dict() if isinstance(self.migrated_to, TLObject) else self.migrated_to,
+            'admin_rights': self.admin_rights.to_dict() if isinstance(self.admin_rights, TLObject) else self.admin_rights,
+            'default_banned_rights': self.default_banned_rights.to_dict() if isinstance(self.default_banned_rights, TLObject) else self.default_banned_rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'V\xf2\xcbA',
+            _struct_Iq.pack((0 if self.creator is None or self.creator is False else 1) | (0 if self.left is None or self.left is False else 4) | (0 if self.deactivated is None or self.deactivated is False else 32) | (0 if self.call_active is None or self.call_active is False else 8388608) | (0 if self.call_not_empty is None or self.call_not_empty is False else 16777216) | (0 if self.noforwards is None or self.noforwards is False else 33554432) | (0 if self.migrated_to is None or self.migrated_to is False else 64) | (0 if self.admin_rights is None or self.admin_rights is False else 16384) | (0 if self.default_banned_rights is None or self.default_banned_rights is False else 262144), self.id),
+            self.serialize_bytes(self.title),
+            self.photo._bytes(),
+            struct.pack('<i', self.participants_count),
+            self.serialize_datetime(self.date),
+            struct.pack('<i', self.version),
+            b'' if self.migrated_to is None or self.migrated_to is False else (self.migrated_to._bytes()),
+            b'' if self.admin_rights is None or self.admin_rights is False else (self.admin_rights._bytes()),
+            b'' if self.default_banned_rights is None or self.default_banned_rights is False else (self.default_banned_rights._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _creator = bool(flags & 1)
+        _left = bool(flags & 4)
+        _deactivated = bool(flags & 32)
+        _call_active = bool(flags & 8388608)
+        _call_not_empty = bool(flags & 16777216)
+        _noforwards = bool(flags & 33554432)
+        _title = reader.tgread_string()
+        _photo = reader.tgread_object()
+        _participants_count = reader.read_int()
+        _date = reader.tgread_date()
+        _version = reader.read_int()
+        if flags & 64:
+            _migrated_to = reader.tgread_object()
+        else:
+            _migrated_to = None
+        if flags & 16384:
+            _admin_rights = reader.tgread_object()
+        else:
+            _admin_rights = None
+        if flags & 262144:
+            _default_banned_rights = reader.tgread_object()
+        else:
+            _default_banned_rights = None
+        return cls(id=_id, title=_title, photo=_photo, participants_count=_participants_count, date=_date, version=_version, creator=_creator, left=_left, deactivated=_deactivated, call_active=_call_active, call_not_empty=_call_not_empty, noforwards=_noforwards, migrated_to=_migrated_to, admin_rights=_admin_rights, default_banned_rights=_default_banned_rights)
+
+
+class ChatEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x29562865
+    SUBCLASS_OF_ID = 0xc5af5d94
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for Chat: Instance of either ChatEmpty, Chat, ChatForbidden, Channel, ChannelForbidden.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'ChatEmpty',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'e(V)',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
+
+class ChatForbidden(TLObject):
+    CONSTRUCTOR_ID = 0x6592a1a7
+    SUBCLASS_OF_ID = 0xc5af5d94
+    __slots__ = ('id', 'title')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, title: str):
+        """
+        Constructor for Chat: Instance of either ChatEmpty, Chat, ChatForbidden, Channel, ChannelForbidden.
+        """
+        self.id = id
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'ChatForbidden',
+            'id': self.id,
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa7\xa1\x92e',
+            struct.pack('<q', self.id),
+            self.serialize_bytes(self.title),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        _title = reader.tgread_string()
+        return cls(id=_id, title=_title)
+
+TypeChat = Union[ChatEmpty,Chat,ChatForbidden,Channel,ChannelForbidden]
@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ChatAdminRights(TLObject):
+    CONSTRUCTOR_ID = 0x5fb224d5
+    SUBCLASS_OF_ID = 0x863dc7c4
+    __slots__ = ('change_info', 'post_messages', 'edit_messages', 'delete_messages', 'ban_users', 'invite_users', 'pin_messages', 'add_admins', 'anonymous', 'manage_call', 'other', 'manage_topics', 'post_stories', 'edit_stories', 'delete_stories')
+
+    def __init__(self, change_info: Optional[bool]=None, post_messages: Optional[bool]=None, edit_messages: Optional[bool]=None, delete_messages: Optional[bool]=None, ban_users: Optional[bool]=None, invite_users: Optional[bool]=None, pin_messages: Optional[bool]=None, add_admins: Optional[bool]=None, anonymous: Optional[bool]=None, manage_call: Optional[bool]=None, other: Optional[bool]=None, manage_topics: Optional[bool]=None, post_stories: Optional[bool]=None, edit_stories: Optional[bool]=None, delete_stories: Optional[bool]=None):
+        """
+        Constructor for ChatAdminRights: Instance of ChatAdminRights.
+        """
+        self.change_info = change_info
+        self.post_messages = post_messages
+        self.edit_messages = edit_messages
+        self.delete_messages = delete_messages
+        self.ban_users = ban_users
+        self.invite_users = invite_users
+        self.pin_messages = pin_messages
+        self.add_admins = add_admins
+        self.anonymous = anonymous
+        self.manage_call = manage_call
+        self.other = other
+        self.manage_topics = manage_topics
+        self.post_stories = post_stories
+        self.edit_stories = edit_stories
+        self.delete_stories = delete_stories
+
+    def to_dict(self):
+        return {
+            '_': 'ChatAdminRights',
+            'change_info': self.change_info,
+            'post_messages': self.post_messages,
+            'edit_messages': self.edit_messages,
+            'delete_messages': self.delete_messages,
+            'ban_users': self.ban_users,
+            'invite_users': self.invite_users,
+            'pin_messages': self.pin_messages,
+            'add_admins': self.add_admins,
+            'anonymous': self.anonymous,
+            'manage_call': self.manage_call,
+            'other': self.other,
+            'manage_topics': self.manage_topics,
+            'post_stories': self.post_stories,
+            'edit_stories': self.edit_stories,
+            'delete_stories': self.delete_stories
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd5$\xb2_',
+            struct.pack('<I', (0 if self.change_info is None or self.change_info is False else 1) | (0 if self.post_messages is None or self.post_messages is False else 2) | (0 if self.edit_messages is None or self.edit_messages is False else 4) | (0 if self.delete_messages is None or self.delete_messages is False else 8) | (0 if self.ban_users is None or self.ban_users is False else 16) | (0 if self.invite_users is None or self.invite_users is False else 32) | (0 if self.pin_messages is None or self.pin_messages is False else 128) | (0 if self.add_admins is None or self.add_admins is False else 512) | (0 if self.anonymous is None or self.anonymous is False else 1024) | (0 if self.manage_call is None or self.manage_call is False else 2048) | (0 if self.other is None or self.other is False else 4096) | (0 if self.manage_topics is None or self.manage_topics is False else 8192) | (0 if self.post_stories is None or self.post_stories is False else 16384) | (0 if self.edit_stories is None or self.edit_stories is False else 32768) | (0 if self.delete_stories is None or self.delete_stories is False else 65536)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _change_info = bool(flags & 1)
+        _post_messages = bool(flags & 2)
+        _edit_messages = bool(flags & 4)
+        _delete_messages = bool(flags & 8)
+        _ban_users = bool(flags & 16)
+        _invite_users = bool(flags & 32)
+        _pin_messages = bool(flags & 128)
+        _add_admins = bool(flags & 512)
+        _anonymous = bool(flags & 1024)
+        _manage_call = bool(flags & 2048)
+        _other = bool(flags & 4096)
+        _manage_topics = bool(flags & 8192)
+        _post_stories = bool(flags & 16384)
+        _edit_stories = bool(flags & 32768)
+        _delete_stories = bool(flags & 65536)
+        return cls(change_info=_change_info, post_messages=_post_messages, edit_messages=_edit_messages, delete_messages=_delete_messages, ban_users=_ban_users, invite_users=_invite_users, pin_messages=_pin_messages, add_admins=_add_admins, anonymous=_anonymous, manage_call=_manage_call, other=_other, manage_topics=_manage_topics, post_stories=_post_stories, edit_stories=_edit_stories, delete_stories=_delete_stories)
+
+TypeChatAdminRights = ChatAdminRights
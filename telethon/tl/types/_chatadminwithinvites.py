@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qii = struct.Struct('<qii')
+
+
+class ChatAdminWithInvites(TLObject):
+    CONSTRUCTOR_ID = 0xf2ecef23
+    SUBCLASS_OF_ID = 0x5063f398
+    __slots__ = ('admin_id', 'invites_count', 'revoked_invites_count')
+
+    def __init__(self, admin_id: int, invites_count: int, revoked_invites_count: int):
+        """
+        Constructor for ChatAdminWithInvites: Instance of ChatAdminWithInvites.
+        """
+        self.admin_id = admin_id
+        self.invites_count = invites_count
+        self.revoked_invites_count = revoked_invites_count
+
+    def to_dict(self):
+        return {
+            '_': 'ChatAdminWithInvites',
+            'admin_id': self.admin_id,
+            'invites_count': self.invites_count,
+            'revoked_invites_count': self.revoked_invites_count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'#\xef\xec\xf2',
+            _struct_qii.pack(self.admin_id, self.invites_count, self.revoked_invites_count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _admin_id, _invites_count, _revoked_invites_count = reader.read_struct(_struct_qii)
+        return cls(admin_id=_admin_id, invites_count=_invites_count, revoked_invites_count=_revoked_invites_count)
+
+TypeChatAdminWithInvites = ChatAdminWithInvites
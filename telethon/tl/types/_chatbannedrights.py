@@ -0,0 +1,100 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ChatBannedRights(TLObject):
+    CONSTRUCTOR_ID = 0x9f120418
+    SUBCLASS_OF_ID = 0x4b5445a9
+    __slots__ = ('until_date', 'view_messages', 'send_messages', 'send_media', 'send_stickers', 'send_gifs', 'send_games', 'send_inline', 'embed_links', 'send_polls', 'change_info', 'invite_users', 'pin_messages', 'manage_topics', 'send_photos', 'send_videos', 'send_roundvideos', 'send_audios', 'send_voices', 'send_docs', 'send_plain')
+
+    def __init__(self, until_date: Optional[datetime], view_messages: Optional[bool]=None, send_messages: Optional[bool]=None, send_media: Optional[bool]=None, send_stickers: Optional[bool]=None, send_gifs: Optional[bool]=None, send_games: Optional[bool]=None, send_inline: Optional[bool]=None, embed_links: Optional[bool]=None, send_polls: Optional[bool]=None, change_info: Optional[bool]=None, invite_users: Optional[bool]=None, pin_messages: Optional[bool]=None, manage_topics: Optional[bool]=None, send_photos: Optional[bool]=None, send_videos: Optional[bool]=None, send_roundvideos: Optional[bool]=None, send_audios: Optional[bool]=None, send_voices: Optional[bool]=None, send_docs: Optional[bool]=None, send_plain: Optional[bool]=None):
+        """
+        Constructor for ChatBannedRights: Instance of ChatBannedRights.
+        """
+        self.until_date = until_date
+        self.view_messages = view_messages
+        self.send_messages = send_messages
+        self.send_media = send_media
+        self.send_stickers = send_stickers
+        self.send_gifs = send_gifs
+        self.send_games = send_games
+        self.send_inline = send_inline
+        self.embed_links = embed_links
+        self.send_polls = send_polls
+        self.change_info = change_info
+        self.invite_users = invite_users
+        self.pin_messages = pin_messages
+        self.manage_topics = manage_topics
+        self.send_photos = send_photos
+        self.send_videos = send_videos
+        self.send_roundvideos = send_roundvideos
+        self.send_audios = send_audios
+        self.send_voices = send_voices
+        self.send_docs = send_docs
+        self.send_plain = send_plain
+
+    def to_dict(self):
+        return {
+            '_': 'ChatBannedRights',
+            'until_date': self.until_date,
+            'view_messages': self.view_messages,
+            'send_messages': self.send_messages,
+            'send_media': self.send_media,
+            'send_stickers': self.send_stickers,
+            'send_gifs': self.send_gifs,
+            'send_games': self.send_games,
+            'send_inline': self.send_inline,
+            'embed_links': self.embed_links,
+            'send_polls': self.send_polls,
+            'change_info': self.change_info,
+            'invite_users': self.invite_users,
+            'pin_messages': self.pin_messages,
+            'manage_topics': self.manage_topics,
+            'send_photos': self.send_photos,
+            'send_videos': self.send_videos,
+            'send_roundvideos': self.send_roundvideos,
+            'send_audios': self.send_audios,
+            'send_voices': self.send_voices,
+            'send_docs': self.send_docs,
+            'send_plain': self.send_plain
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x18\x04\x12\x9f',
+            struct.pack('<I', (0 if self.view_messages is None or self.view_messages is False else 1) | (0 if self.send_messages is None or self.send_messages is False else 2) | (0 if self.send_media is None or self.send_media is False else 4) | (0 if self.send_stickers is None or self.send_stickers is False else 8) | (0 if self.send_gifs is None or self.send_gifs is False else 16) | (0 if self.send_games is None or self.send_games is False else 32) | (0 if self.send_inline is None or self.send_inline is False else 64) | (0 if self.embed_links is None or self.embed_links is False else 128) | (0 if self.send_polls is None or self.send_polls is False else 256) | (0 if self.change_info is None or self.change_info is False else 1024) | (0 if self.invite_users is None or self.invite_users is False else 32768) | (0 if self.pin_messages is None or self.pin_messages is False else 131072) | (0 if self.manage_topics is None or self.manage_topics is False else 262144) | (0 if self.send_photos is None or self.send_photos is False else 524288) | (0 if self.send_videos is None or self.send_videos is False else 1048576) | (0 if self.send_roundvideos is None or self.send_roundvideos is False else 2097152) | (0 if self.send_audios is None or self.send_audios is False else 4194304) | (0 if self.send_voices is None or self.send_voices is False else 8388608) | (0 if self.send_docs is None or self.send_docs is False else 16777216) | (0 if self.send_plain is None or self.send_plain is False else 33554432)),
+            self.serialize_datetime(self.until_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _view_messages = bool(flags & 1)
+        _send_messages = bool(flags & 2)
+        _send_media = bool(flags & 4)
+        _send_stickers = bool(flags & 8)
+        _send_gifs = bool(flags & 16)
+        _send_games = bool(flags & 32)
+        _send_inline = bool(flags & 64)
+        _embed_links = bool(flags & 128)
+        _send_polls = bool(flags & 256)
+        _change_info = bool(flags & 1024)
+        _invite_users = bool(flags & 32768)
+        _pin_messages = bool(flags & 131072)
+        _manage_topics = bool(flags & 262144)
+        _send_photos = bool(flags & 524288)
+        _send_videos = bool(flags & 1048576)
+        _send_roundvideos = bool(flags & 2097152)
+        _send_audios = bool(flags & 4194304)
+        _send_voices = bool(flags & 8388608)
+        _send_docs = bool(flags & 16777216)
+        _send_plain = bool(flags & 33554432)
+        _until_date = reader.tgread_date()
+        return cls(until_date=_until_date, view_messages=_view_messages, send_messages=_send_messages, send_media=_send_media, send_stickers=_send_stickers, send_gifs=_send_gifs, send_games=_send_games, send_inline=_send_inline, embed_links=_embed_links, send_polls=_send_polls, change_info=_change_info, invite_users=_invite_users, pin_messages=_pin_messages, manage_topics=_manage_topics, send_photos=_send_photos, send_videos=_send_videos, send_roundvideos=_send_roundvideos, send_audios=_send_audios, send_voices=_send_voices, send_docs=_send_docs, send_plain=_send_plain)
+
+TypeChatBannedRights = ChatBannedRights
@@ -0,0 +1,539 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_IIq = struct.Struct('<IIq')
+_struct_Iq = struct.Struct('<Iq')
+_struct_iii = struct.Struct('<iii')
+_struct_iiq = struct.Struct('<iiq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotInfo, TypeBotVerification, TypeChannelLocation, TypeChatParticipants, TypeChatReactions, TypeExportedChatInvite, TypeInputGroupCall, TypePeer, TypePeerNotifySettings, TypePeerStories, TypePhoto, TypeStickerSet, TypeWallPaper
+
+
+
+class ChannelFull(TLObject):
+    CONSTRUCTOR_ID = 0x52d6806b
+    SUBCLASS_OF_ID = 0xd49a2697
+    __slots__ = ('id', 'about', 'read_inbox_max_id', 'read_outbox_max_id', 'unread_count', 'chat_photo', 'notify_settings', 'bot_info', 'pts', 'can_view_participants', 'can_set_username', 'can_set_stickers', 'hidden_prehistory', 'can_set_location', 'has_scheduled', 'can_view_stats', 'blocked', 'can_delete_channel', 'antispam', 'participants_hidden', 'translations_disabled', 'stories_pinned_available', 'view_forum_as_messages', 'restricted_sponsored', 'can_view_revenue', 'paid_media_allowed', 'can_view_stars_revenue', 'paid_reactions_available', 'stargifts_available', 'paid_messages_available', 'participants_count', 'admins_count', 'kicked_count', 'banned_count', 'online_count', 'exported_invite', 'migrated_from_chat_id', 'migrated_from_max_id', 'pinned_msg_id', 'stickerset', 'available_min_id', 'folder_id', 'linked_chat_id', 'location', 'slowmode_seconds', 'slowmode_next_send_date', 'stats_dc', 'call', 'ttl_period', 'pending_suggestions', 'groupcall_default_join_as', 'theme_emoticon', 'requests_pending', 'recent_requesters', 'default_send_as', 'available_reactions', 'reactions_limit', 'stories', 'wallpaper', 'boosts_applied', 'boosts_unrestrict', 'emojiset', 'bot_verification', 'stargifts_count')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, about: str, read_inbox_max_id: int, read_outbox_max_id: int, unread_count: int, chat_photo: 'TypePhoto', notify_settings: 'TypePeerNotifySettings', bot_info: List['TypeBotInfo'], pts: int, can_view_participants: Optional[bool]=None, can_set_username: Optional[bool]=None, can_set_stickers: Optional[bool]=None, hidden_prehistory: Optional[bool]=None, can_set_location: Optional[bool]=None, has_scheduled: Optional[bool]=None, can_view_stats: Optional[bool]=None, blocked: Optional[bool]=None, can_delete_channel: Optional[bool]=None, antispam: Optional[bool]=None, participants_hidden: Optional[bool]=None, translations_disabled: Optional[bool]=None, stories_pinned_available: Optional[bool]=None, view_forum_as_messages: Optional[bool]=None, restricted_sponsored: Optional[bool]=None, can_view_revenue: Optional[bool]=None, paid_media_allowed: Optional[bool]=None, can_view_stars_revenue: Optional[bool]=None, paid_reactions_available: Optional[bool]=None, stargifts_available: Optional[bool]=None, paid_messages_available: Optional[bool]=None, participants_count: Optional[int]=None, admins_count: Optional[int]=None, kicked_count: Optional[int]=None, banned_count: Optional[int]=None, online_count: Optional[int]=None, exported_invite: Optional['TypeExportedChatInvite']=None, migrated_from_chat_id: Optional[int]=None, migrated_from_max_id: Optional[int]=None, pinned_msg_id: Optional[int]=None, stickerset: Optional['TypeStickerSet']=None, available_min_id: Optional[int]=None, folder_id: Optional[int]=None, linked_chat_id: Optional[int]=None, location: Optional['TypeChannelLocation']=None, slowmode_seconds: Optional[int]=None, slowmode_next_send_date: Optional[datetime]=None, stats_dc: Optional[int]=None, call: Optional['TypeInputGroupCall']=None, ttl_period: Optional[int]=None, pending_suggestions: Optional[List[str]]=None, groupcall_default_join_as: Optional['TypePeer']=None, theme_emoticon: Optional[str]=None, requests_pending: Optional[int]=None, recent_requesters: Optional[List[int]]=None, default_send_as: Optional['TypePeer']=None, available_reactions: Optional['TypeChatReactions']=None, reactions_limit: Optional[int]=None, stories: Optional['TypePeerStories']=None, wallpaper: Optional['TypeWallPaper']=None, boosts_applied: Optional[int]=None, boosts_unrestrict: Optional[int]=None, emojiset: Optional['TypeStickerSet']=None, bot_verification: Optional['TypeBotVerification']=None, stargifts_count: Optional[int]=None):
+        """
+        Constructor for ChatFull: Instance of either ChatFull, ChannelFull.
+        """
+        self.id = id
+        self.about = about
+        self.read_inbox_max_id = read_inbox_max_id
+        self.read_outbox_max_id = read_outbox_max_id
+        self.unread_count = unread_count
+        self.chat_photo = chat_photo
+        self.notify_settings = notify_settings
+        self.bot_info = bot_info
+        self.pts = pts
+        self.can_view_participants = can_view_participants
+        self.can_set_username = can_set_username
+        self.can_set_stickers = can_set_stickers
+        self.hidden_prehistory = hidden_prehistory
+        self.can_set_location = can_set_location
+        self.has_scheduled = has_scheduled
+        self.can_view_stats = can_view_stats
+        self.blocked = blocked
+        self.can_delete_channel = can_delete_channel
+        self.antispam = antispam
+        self.participants_hidden = participants_hidden
+        self.translations_disabled = translations_disabled
+        self.stories_pinned_available = stories_pinned_available
+        self.view_forum_as_messages = view_forum_as_messages
+        self.restricted_sponsored = restricted_sponsored
+        self.can_view_revenue = can_view_revenue
+        self.paid_media_allowed = paid_media_allowed
+        self.can_view_stars_revenue = can_view_stars_revenue
+        self.paid_reactions_available = paid_reactions_available
+        self.stargifts_available = stargifts_available
+        self.paid_messages_available = paid_messages_available
+        self.participants_count = participants_count
+        self.admins_count = admins_count
+        self.kicked_count = kicked_count
+        self.banned_count = banned_count
+        self.online_count = online_count
+        self.exported_invite = exported_invite
+        self.migrated_from_chat_id = migrated_from_chat_id
+        self.migrated_from_max_id = migrated_from_max_id
+        self.pinned_msg_id = pinned_msg_id
+        self.stickerset = stickerset
+        self.available_min_id = available_min_id
+        self.folder_id = folder_id
+        self.linked_chat_id = linked_chat_id
+        self.location = location
+        self.slowmode_seconds = slowmode_seconds
+        self.slowmode_next_send_date = slowmode_next_send_date
+        self.stats_dc = stats_dc
+        self.call = call
+        self.ttl_period = ttl_period
+        self.pending_suggestions = pending_suggestions
+        self.groupcall_default_join_as = groupcall_default_join_as
+        self.theme_emoticon = theme_emoticon
+        self.requests_pending = requests_pending
+        self.recent_requesters = recent_requesters
+        self.default_send_as = default_send_as
+        self.available_reactions = available_reactions
+        self.reactions_limit = reactions_limit
+        self.stories = stories
+        self.wallpaper = wallpaper
+        self.boosts_applied = boosts_applied
+        self.boosts_unrestrict = boosts_unrestrict
+        self.emojiset = emojiset
+        self.bot_verification = bot_verification
+        self.stargifts_count = stargifts_count
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelFull',
+            'id': self.id,
+            'about': self.about,
+            'read_inbox_max_id': self.read_inbox_max_id,
+            'read_outbox_max_id': self.read_outbox_max_id,
+            'unread_count': self.unread_count,
+            'chat_photo': self.chat_photo.to_dict() if isinstance(self.chat_photo, TLObject) else self.chat_photo,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'bot_info': [] if self.bot_info is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.bot_info],
+            'pts': self.pts,
+            'can_view_participants': self.can_view_participants,
+            'can_set_username': self.can_set_username,
+            'can_set_stickers': self.can_set_stickers,
+            'hidden_prehistory': self.hidden_prehistory,
+            'can_set_location': self.can_set_location,
+            'has_scheduled': self.has_scheduled,
+            'can_view_stats': self.can_view_stats,
+            'blocked': self.blocked,
+            'can_delete_channel': self.can_delete_channel,
+            'antispam': self.antispam,
+            'participants_hidden': self.participants_hidden,
+            'translations_disabled': self.translations_disabled,
+            'stories_pinned_available': self.stories_pinned_available,
+            'view_forum_as_messages': self.view_forum_as_messages,
+            'restricted_sponsored': self.restricted_sponsored,
+            'can_view_revenue': self.can_view_revenue,
+            'paid_media_allowed': self.paid_media_allowed,
+            'can_view_stars_revenue': self.can_view_stars_revenue,
+            'paid_reactions_available': self.paid_reactions_available,
+            'stargifts_available': self.stargifts_available,
+            'paid_messages_available': self.paid_messages_available,
+            'participants_count': self.participants_count,
+            'admins_count': self.admins_count,
+            'kicked_count': self.kicked_count,
+            'banned_count': self.banned_count,
+            'online_count': self.online_count,
+            'exported_invite': self.exported_invite.to_dict() if isinstance(self.exported_invite, TLObject) else self.exported_invite,
+            'migrated_from_chat_id': self.migrated_from_chat_id,
+            'migrated_from_max_id': self.migrated_from_max_id,
+            'pinned_msg_id': self.pinned_msg_id,
+            'stickerset': self.stickerset.to_dict() if isinstance(self.stickerset, TLObject) else self.stickerset,
+            'available_min_id': self.available_min_id,
+            'folder_id': self.folder_id,
+            'linked_chat_id': self.linked_chat_id,
+            'location': self.location.to_dict() if isinstance(self.location, TLObject) else self.location,
+            'slowmode_seconds': self.slowmode_seconds,
+            'slowmode_next_send_date': self.slowmode_next_send_date,
+            'stats_dc': self.stats_dc,
+            'call': self.call.to_dict() if isinstance(self.call, TLObject) else self.call,
+            'ttl_period': self.ttl_period,
+            'pending_suggestions': [] if self.pending_suggestions is None else self.pending_suggestions[:],
+            'groupcall_default_join_as': self.groupcall_default_join_as.to_dict() if isinstance(self.groupcall_default_join_as, TLObject) else self.groupcall_default_join_as,
+            'theme_emoticon': self.theme_emoticon,
+            'requests_pending': self.requests_pending,
+            'recent_requesters': [] if self.recent_requesters is None else self.recent_requesters[:],
+            'default_send_as': self.default_send_as.to_dict() if isinstance(self.default_send_as, TLObject) else self.default_send_as,
+            'available_reactions': self.available_reactions.to_dict() if isinstance(self.available_reactions, TLObject) else self.available_reactions,
+            'reactions_limit': self.reactions_limit,
+            'stories': self.stories.to_dict() if isinstance(self.stories, TLObject) else self.stories,
+            'wallpaper': self.wallpaper.to_dict() if isinstance(self.wallpaper, TLObject) else self.wallpaper,
+            'boosts_applied': self.boosts_applied,
+            'boosts_unrestrict': self.boosts_unrestrict,
+            'emojiset': self.emojiset.to_dict() if isinstance(self.emojiset, TLObject) else self.emojiset,
+            'bot_verification': self.bot_verification.to_dict() if isinstance(self.bot_verification, TLObject) else self.bot_verification,
+            'stargifts_count': self.stargifts_count
+        }
+
+    def _bytes(self):
+        assert ((self.kicked_count or self.kicked_count is not None) and (self.banned_count or self.banned_count is not None)) or ((self.kicked_count is None or self.kicked_count is False) and (self.banned_count is None or self.banned_count is False)), 'kicked_count, banned_count parameters must all be False-y (like None) or all me True-y'
+        assert ((self.migrated_from_chat_id or self.migrated_from_chat_id is not None) and (self.migrated_from_max_id or self.migrated_from_max_id is not None)) or ((self.migrated_from_chat_id is None or self.migrated_from_chat_id is False) and (self.migrated_from_max_id is None or self.migrated_from_max_id is False)), 'migrated_from_chat_id, migrated_from_max_id parameters must all be False-y (like None) or all me True-y'
+        assert ((self.requests_pending or self.requests_pending is not None) and (self.recent_requesters or self.recent_requesters is not None)) or ((self.requests_pending is None or self.requests_pending is False) and (self.recent_requesters is None or self.recent_requesters is False)), 'requests_pending, recent_requesters parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'k\x80\xd6R',
+            _struct_IIq.pack((0 if self.can_view_participants is None or self.can_view_participants is False else 8) | (0 if self.can_set_username is None or self.can_set_username is False else 64) | (0 if self.can_set_stickers is None or self.can_set_stickers is False else 128) | (0 if self.hidden_prehistory is None or self.hidden_prehistory is False else 1024) | (0 if self.can_set_location is None or self.can_set_location is False else 65536) | (0 if self.has_scheduled is None or self.has_scheduled is False else 524288) | (0 if self.can_view_stats is None or self.can_view_stats is False else 1048576) | (0 if self.blocked is None or self.blocked is False else 4194304) | (0 if self.participants_count is None or self.participants_count is False else 1) | (0 if self.admins_count is None or self.admins_count is False else 2) | (0 if self.kicked_count is None or self.kicked_count is False else 4) | (0 if self.banned_count is None or self.banned_count is False else 4) | (0 if self.online_count is None or self.online_count is False else 8192) | (0 if self.exported_invite is None or self.exported_invite is False else 8388608) | (0 if self.migrated_from_chat_id is None or self.migrated_from_chat_id is False else 16) | (0 if self.migrated_from_max_id is None or self.migrated_from_max_id is False else 16) | (0 if self.pinned_msg_id is None or self.pinned_msg_id is False else 32) | (0 if self.stickerset is None or self.stickerset is False else 256) | (0 if self.available_min_id is None or self.available_min_id is False else 512) | (0 if self.folder_id is None or self.folder_id is False else 2048) | (0 if self.linked_chat_id is None or self.linked_chat_id is False else 16384) | (0 if self.location is None or self.location is False else 32768) | (0 if self.slowmode_seconds is None or self.slowmode_seconds is False else 131072) | (0 if self.slowmode_next_send_date is None or self.slowmode_next_send_date is False else 262144) | (0 if self.stats_dc is None or self.stats_dc is False else 4096) | (0 if self.call is None or self.call is False else 2097152) | (0 if self.ttl_period is None or self.ttl_period is False else 16777216) | (0 if self.pending_suggestions is None or self.pending_suggestions is False else 33554432) | (0 if self.groupcall_default_join_as is None or self.groupcall_default_join_as is False else 67108864) | (0 if self.theme_emoticon is None or self.theme_emoticon is False else 134217728) | (0 if self.requests_pending is None or self.requests_pending is False else 268435456) | (0 if self.recent_requesters is None or self.recent_requesters is False else 268435456) | (0 if self.default_send_as is None or self.default_send_as is False else 536870912) | (0 if self.available_reactions is None or self.available_reactions is False else 1073741824), (0 if self.can_delete_channel is None or self.can_delete_channel is False else 1) | (0 if self.antispam is None or self.antispam is False else 2) | (0 if self.participants_hidden is None or self.participants_hidden is False else 4) | (0 if self.translations_disabled is None or self.translations_disabled is False else 8) | (0 if self.stories_pinned_available is None or self.stories_pinned_available is False else 32) | (0 if self.view_forum_as_messages is None or self.view_forum_as_messages is False else 64) | (0 if self.restricted_sponsored is None or self.restricted_sponsored is False else 2048) | (0 if self.can_view_revenue is None or self.can_view_revenue is False else 4096) | (0 if self.paid_media_allowed is None or self.paid_media_allowed is False else 16384) | (0 if self.can_view_stars_revenue is None or self.can_view_stars_revenue is False else 32768) | (0 if self.paid_reactions_available is None or self.paid_reactions_available is False else 65536) | (0 if self.stargifts_available is None or self.stargifts_available is False else 524288) | (0 if self.paid_messages_available is None or self.paid_messages_available is False else 1048576) | (0 if self.reactions_limit is None or self.reactions_limit is False else 8192) | (0 if self.stories is None or self.stories is False else 16) | (0 if self.wallpaper is None or self.wallpaper is False else 128) | (0 if self.boosts_applied is None or self.boosts_applied is False else 256) | (0 if self.boosts_unrestrict is None or self.boosts_unrestrict is False else 512) | (0 if self.emojiset is None or self.emojiset is False else 1024) | (0 if self.bot_verification is None or self.bot_verification is False else 131072) | (0 if self.stargifts_count is None or self.stargifts_count is False else 262144), self.id),
+            self.serialize_bytes(self.about),
+            b'' if self.participants_count is None or self.participants_count is False else (struct.pack('<i', self.participants_count)),
+            b'' if self.admins_count is None or self.admins_count is False else (struct.pack('<i', self.admins_count)),
+            b'' if self.kicked_count is None or self.kicked_count is False else (struct.pack('<i', self.kicked_count)),
+            b'' if self.banned_count is None or self.banned_count is False else (struct.pack('<i', self.banned_count)),
+            b'' if self.online_count is None or self.online_count is False else (struct.pack('<i', self.online_count)),
+            _struct_iii.pack(self.read_inbox_max_id, self.read_outbox_max_id, self.unread_count),
+            self.chat_photo._bytes(),
+            self.notify_settings._bytes(),
+            b'' if self.exported_invite is None or self.exported_invite is False else (self.exported_invite._bytes()),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.bot_info)),b''.join(x._bytes() for x in self.bot_info),
+            b'' if self.migrated_from_chat_id is None or self.migrated_from_chat_id is False else (struct.pack('<q', self.migrated_from_chat_id)),
+            b'' if self.migrated_from_max_id is None or self.migrated_from_max_id is False else (struct.pack('<i', self.migrated_from_max_id)),
+            b'' if self.pinned_msg_id is None or self.pinned_msg_id is False else (struct.pack('<i', self.pinned_msg_id)),
+            b'' if self.stickerset is None or self.stickerset is False else (self.stickerset._bytes()),
+            b'' if self.available_min_id is None or self.available_min_id is False else (struct.pack('<i', self.available_min_id)),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            b'' if self.linked_chat_id is None or self.linked_chat_id is False else (struct.pack('<q', self.linked_chat_id)),
+            b'' if self.location is None or self.location is False else (self.location._bytes()),
+            b'' if self.slowmode_seconds is None or self.slowmode_seconds is False else (struct.pack('<i', self.slowmode_seconds)),
+            b'' if self.slowmode_next_send_date is None or self.slowmode_next_send_date is False else (self.serialize_datetime(self.slowmode_next_send_date)),
+            b'' if self.stats_dc is None or self.stats_dc is False else (struct.pack('<i', self.stats_dc)),
+            struct.pack('<i', self.pts),
+            b'' if self.call is None or self.call is False else (self.call._bytes()),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.pending_suggestions is None or self.pending_suggestions is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.pending_suggestions)),b''.join(self.serialize_bytes(x) for x in self.pending_suggestions))),
+            b'' if self.groupcall_default_join_as is None or self.groupcall_default_join_as is False else (self.groupcall_default_join_as._bytes()),
+            b'' if self.theme_emoticon is None or self.theme_emoticon is False else (self.serialize_bytes(self.theme_emoticon)),
+            b'' if self.requests_pending is None or self.requests_pending is False else (struct.pack('<i', self.requests_pending)),
+            b'' if self.recent_requesters is None or self.recent_requesters is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.recent_requesters)), len(self.recent_requesters), *self.recent_requesters))),
+            b'' if self.default_send_as is None or self.default_send_as is False else (self.default_send_as._bytes()),
+            b'' if self.available_reactions is None or self.available_reactions is False else (self.available_reactions._bytes()),
+            b'' if self.reactions_limit is None or self.reactions_limit is False else (struct.pack('<i', self.reactions_limit)),
+            b'' if self.stories is None or self.stories is False else (self.stories._bytes()),
+            b'' if self.wallpaper is None or self.wallpaper is False else (self.wallpaper._bytes()),
+            b'' if self.boosts_applied is None or self.boosts_applied is False else (struct.pack('<i', self.boosts_applied)),
+            b'' if self.boosts_unrestrict is None or self.boosts_unrestrict is False else (struct.pack('<i', self.boosts_unrestrict)),
+            b'' if self.emojiset is None or self.emojiset is False else (self.emojiset._bytes()),
+            b'' if self.bot_verification is None or self.bot_verification is False else (self.bot_verification._bytes()),
+            b'' if self.stargifts_count is None or self.stargifts_count is False else (struct.pack('<i', self.stargifts_count)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, flags2, _id = reader.read_struct(_struct_iiq)
+        _can_view_participants = bool(flags & 8)
+        _can_set_username = bool(flags & 64)
+        _can_set_stickers = bool(flags & 128)
+        _hidden_prehistory = bool(flags & 1024)
+        _can_set_location = bool(flags & 65536)
+        _has_scheduled = bool(flags & 524288)
+        _can_view_stats = bool(flags & 1048576)
+        _blocked = bool(flags & 4194304)
+        _can_delete_channel = bool(flags2 & 1)
+        _antispam = bool(flags2 & 2)
+        _participants_hidden = bool(flags2 & 4)
+        _translations_disabled = bool(flags2 & 8)
+        _stories_pinned_available = bool(flags2 & 32)
+        _view_forum_as_messages = bool(flags2 & 64)
+        _restricted_sponsored = bool(flags2 & 2048)
+        _can_view_revenue = bool(flags2 & 4096)
+        _paid_media_allowed = bool(flags2 & 16384)
+        _can_view_stars_revenue = bool(flags2 & 32768)
+        _paid_reactions_available = bool(flags2 & 65536)
+        _stargifts_available = bool(flags2 & 524288)
+        _paid_messages_available = bool(flags2 & 1048576)
+        _about = reader.tgread_string()
+        if flags & 1:
+            _participants_count = reader.read_int()
+        else:
+            _participants_count = None
+        if flags & 2:
+            _admins_count = reader.read_int()
+        else:
+            _admins_count = None
+        if flags & 4:
+            _kicked_count = reader.read_int()
+        else:
+            _kicked_count = None
+        if flags & 4:
+            _banned_count = reader.read_int()
+        else:
+            _banned_count = None
+        if flags & 8192:
+            _online_count = reader.read_int()
+        else:
+            _online_count = None
+        _read_inbox_max_id, _read_outbox_max_id, _unread_count = reader.read_struct(_struct_iii)
+        _chat_photo = reader.tgread_object()
+        _notify_settings = reader.tgread_object()
+        if flags & 8388608:
+            _exported_invite = reader.tgread_object()
+        else:
+            _exported_invite = None
+        reader.read_int()
+        _bot_info = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _bot_info.append(_x)
+
+        if flags & 16:
+            _migrated_from_chat_id = reader.read_long()
+        else:
+            _migrated_from_chat_id = None
+        if flags & 16:
+            _migrated_from_max_id = reader.read_int()
+        else:
+            _migrated_from_max_id = None
+        if flags & 32:
+            _pinned_msg_id = reader.read_int()
+        else:
+            _pinned_msg_id = None
+        if flags & 256:
+            _stickerset = reader.tgread_object()
+        else:
+            _stickerset = None
+        if flags & 512:
+            _available_min_id = reader.read_int()
+        else:
+            _available_min_id = None
+        if flags & 2048:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        if flags & 16384:
+            _linked_chat_id = reader.read_long()
+        else:
+            _linked_chat_id = None
+        if flags & 32768:
+            _location = reader.tgread_object()
+        else:
+            _location = None
+        if flags & 131072:
+            _slowmode_seconds = reader.read_int()
+        else:
+            _slowmode_seconds = None
+        if flags & 262144:
+            _slowmode_next_send_date = reader.tgread_date()
+        else:
+            _slowmode_next_send_date = None
+        if flags & 4096:
+            _stats_dc = reader.read_int()
+        else:
+            _stats_dc = None
+        _pts = reader.read_int()
+        if flags & 2097152:
+            _call = reader.tgread_object()
+        else:
+            _call = None
+        if flags & 16777216:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 33554432:
+            reader.read_int()
+            _pending_suggestions = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_string()
+                _pending_suggestions.append(_x)
+
+        else:
+            _pending_suggestions = None
+        if flags & 67108864:
+            _groupcall_default_join_as = reader.tgread_object()
+        else:
+            _groupcall_default_join_as = None
+        if flags & 134217728:
+            _theme_emoticon = reader.tgread_string()
+        else:
+            _theme_emoticon = None
+        if flags & 268435456:
+            _requests_pending = reader.read_int()
+        else:
+            _requests_pending = None
+        if flags & 268435456:
+            reader.read_int()
+            _recent_requesters = reader.read_array('q', reader.read_int())
+        else:
+            _recent_requesters = None
+        if flags & 536870912:
+            _default_send_as = reader.tgread_object()
+        else:
+            _default_send_as = None
+        if flags & 1073741824:
+            _available_reactions = reader.tgread_object()
+        else:
+            _available_reactions = None
+        if flags2 & 8192:
+            _reactions_limit = reader.read_int()
+        else:
+            _reactions_limit = None
+        if flags2 & 16:
+            _stories = reader.tgread_object()
+        else:
+            _stories = None
+        if flags2 & 128:
+            _wallpaper = reader.tgread_object()
+        else:
+            _wallpaper = None
+        if flags2 & 256:
+            _boosts_applied = reader.read_int()
+        else:
+            _boosts_applied = None
+        if flags2 & 512:
+            _boosts_unrestrict = reader.read_int()
+        else:
+            _boosts_unrestrict = None
+        if flags2 & 1024:
+            _emojiset = reader.tgread_object()
+        else:
+            _emojiset = None
+        if flags2 & 131072:
+            _bot_verification = reader.tgread_object()
+        else:
+            _bot_verification = None
+        if flags2 & 262144:
+            _stargifts_count = reader.read_int()
+        else:
+            _stargifts_count = None
+        return cls(id=_id, about=_about, read_inbox_max_id=_read_inbox_max_id, read_outbox_max_id=_read_outbox_max_id, unread_count=_unread_count, chat_photo=_chat_photo, notify_settings=_notify_settings, bot_info=_bot_info, pts=_pts, can_view_participants=_can_view_participants, can_set_username=_can_set_username, can_set_stickers=_can_set_stickers, hidden_prehistory=_hidden_prehistory, can_set_location=_can_set_location, has_scheduled=_has_scheduled, can_view_stats=_can_view_stats, blocked=_blocked, can_delete_channel=_can_delete_channel, antispam=_antispam, participants_hidden=_participants_hidden, translations_disabled=_translations_disabled, stories_pinned_available=_stories_pinned_available, view_forum_as_messages=_view_forum_as_messages, restricted_sponsored=_restricted_sponsored, can_view_revenue=_can_view_revenue, paid_media_allowed=_paid_media_allowed, can_view_stars_revenue=_can_view_stars_revenue, paid_reactions_available=_paid_reactions_available, stargifts_available=_stargifts_available, paid_messages_available=_paid_messages_available, participants_count=_participants_count, admins_count=_admins_count, kicked_count=_kicked_count, banned_count=_banned_count, online_count=_online_count, exported_invite=_exported_invite, migrated_from_chat_id=_migrated_from_chat_id, migrated_from_max_id=_migrated_from_max_id, pinned_msg_id=_pinned_msg_id, stickerset=_stickerset, available_min_id=_available_min_id, folder_id=_folder_id, linked_chat_id=_linked_chat_id, location=_location, slowmode_seconds=_slowmode_seconds, slowmode_next_send_date=_slowmode_next_send_date, stats_dc=_stats_dc, call=_call, ttl_period=_ttl_period, pending_suggestions=_pending_suggestions, groupcall_default_join_as=_groupcall_default_join_as, theme_emoticon=_theme_emoticon, requests_pending=_requests_pending, recent_requesters=_recent_requesters, default_send_as=_default_send_as, available_reactions=_available_reactions, reactions_limit=_reactions_limit, stories=_stories, wallpaper=_wallpaper, boosts_applied=_boosts_applied, boosts_unrestrict=_boosts_unrestrict, emojiset=_emojiset, bot_verification=_bot_verification, stargifts_count=_stargifts_count)
+
+
+class ChatFull(TLObject):
+    CONSTRUCTOR_ID = 0x2633421b
+    SUBCLASS_OF_ID = 0xd49a2697
+    __slots__ = ('id', 'about', 'participants', 'notify_settings', 'can_set_username', 'has_scheduled', 'translations_disabled', 'chat_photo', 'exported_invite', 'bot_info', 'pinned_msg_id', 'folder_id', 'call', 'ttl_period', 'groupcall_default_join_as', 'theme_emoticon', 'requests_pending', 'recent_requesters', 'available_reactions', 'reactions_limit')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, about: str, participants: 'TypeChatParticipants', notify_settings: 'TypePeerNotifySettings', can_set_username: Optional[bool]=None, has_scheduled: Optional[bool]=None, translations_disabled: Optional[bool]=None, chat_photo: Optional['TypePhoto']=None, exported_invite: Optional['TypeExportedChatInvite']=None, bot_info: Optional[List['TypeBotInfo']]=None, pinned_msg_id: Optional[int]=None, folder_id: Optional[int]=None, call: Optional['TypeInputGroupCall']=None, ttl_period: Optional[int]=None, groupcall_default_join_as: Optional['TypePeer']=None, theme_emoticon: Optional[str]=None, requests_pending: Optional[int]=None, recent_requesters: Optional[List[int]]=None, available_reactions: Optional['TypeChatReactions']=None, reactions_limit: Optional[int]=None):
+        """
+        Constructor for ChatFull: Instance of either ChatFull, ChannelFull.
+        """
+        self.id = id
+        self.about = about
+        self.participants = participants
+        self.notify_settings = notify_settings
+        self.can_set_username = can_set_username
+        self.has_scheduled = has_scheduled
+        self.translations_disabled = translations_disabled
+        self.chat_photo = chat_photo
+        self.exported_invite = exported_invite
+        self.bot_info = bot_info
+        self.pinned_msg_id = pinned_msg_id
+        self.folder_id = folder_id
+        self.call = call
+        self.ttl_period = ttl_period
+        self.groupcall_default_join_as = groupcall_default_join_as
+        self.theme_emoticon = theme_emoticon
+        self.requests_pending = requests_pending
+        self.recent_requesters = recent_requesters
+        self.available_reactions = available_reactions
+        self.reactions_limit = reactions_limit
+
+    def to_dict(self):
+        return {
+            '_': 'ChatFull',
+            'id': self.id,
+            'about': self.about,
+            'participants': self.participants.to_dict() if isinstance(self.participants, TLObject) else self.participants,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'can_set_username': self.can_set_username,
+            'has_scheduled': self.has_scheduled,
+            'translations_disabled': self.translations_disabled,
+            'chat_photo': self.chat_photo.to_dict() if isinstance(self.chat_photo, TLObject) else self.chat_photo,
+            'exported_invite': self.exported_invite.to_dict() if isinstance(self.exported_invite, TLObject) else self.exported_invite,
+            'bot_info': [] if self.bot_info is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.bot_info],
+            'pinned_msg_id': self.pinned_msg_id,
+            'folder_id': self.folder_id,
+            'call': self.call.to_dict() if isinstance(self.call, TLObject) else self.call,
+            'ttl_period': self.ttl_period,
+            'groupcall_default_join_as': self.groupcall_default_join_as.to_dict() if isinstance(self.groupcall_default_join_as, TLObject) else self.groupcall_default_join_as,
+            'theme_emoticon': self.theme_emoticon,
+            'requests_pending': self.requests_pending,
+            'recent_requesters': [] if self.recent_requesters is None else self.recent_requesters[:],
+            'available_reactions': self.available_reactions.to_dict() if isinstance(self.available_reactions, TLObject) else self.available_reactions,
+            'reactions_limit': self.reactions_limit
+        }
+
+    def _bytes(self):
+        assert ((self.requests_pending or self.requests_pending is not None) and (self.recent_requesters or self.recent_requesters is not None)) or ((self.requests_pending is None or self.requests_pending is False) and (self.recent_requesters is None or self.recent_requesters is False)), 'requests_pending, recent_requesters parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\x1bB3&',
+            _struct_Iq.pack((0 if self.can_set_username is None or self.can_set_username is False else 128) | (0 if self.has_scheduled is None or self.has_scheduled is False else 256) | (0 if self.translations_disabled is None or self.translations_disabled is False else 524288) | (0 if self.chat_photo is None or self.chat_photo is False else 4) | (0 if self.exported_invite is None or self.exported_invite is False else 8192) | (0 if self.bot_info is None or self.bot_info is False else 8) | (0 if self.pinned_msg_id is None or self.pinned_msg_id is False else 64) | (0 if self.folder_id is None or self.folder_id is False else 2048) | (0 if self.call is None or self.call is False else 4096) | (0 if self.ttl_period is None or self.ttl_period is False else 16384) | (0 if self.groupcall_default_join_as is None or self.groupcall_default_join_as is False else 32768) | (0 if self.theme_emoticon is None or self.theme_emoticon is False else 65536) | (0 if self.requests_pending is None or self.requests_pending is False else 131072) | (0 if self.recent_requesters is None or self.recent_requesters is False else 131072) | (0 if self.available_reactions is None or self.available_reactions is False else 262144) | (0 if self.reactions_limit is None or self.reactions_limit is False else 1048576), self.id),
+            self.serialize_bytes(self.about),
+            self.participants._bytes(),
+            b'' if self.chat_photo is None or self.chat_photo is False else (self.chat_photo._bytes()),
+            self.notify_settings._bytes(),
+            b'' if self.exported_invite is None or self.exported_invite is False else (self.exported_invite._bytes()),
+            b'' if self.bot_info is None or self.bot_info is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.bot_info)),b''.join(x._bytes() for x in self.bot_info))),
+            b'' if self.pinned_msg_id is None or self.pinned_msg_id is False else (struct.pack('<i', self.pinned_msg_id)),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            b'' if self.call is None or self.call is False else (self.call._bytes()),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.groupcall_default_join_as is None or self.groupcall_default_join_as is False else (self.groupcall_default_join_as._bytes()),
+            b'' if self.theme_emoticon is None or self.theme_emoticon is False else (self.serialize_bytes(self.theme_emoticon)),
+            b'' if self.requests_pending is None or self.requests_pending is False else (struct.pack('<i', self.requests_pending)),
+            b'' if self.recent_requesters is None or self.recent_requesters is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.recent_requesters)), len(self.recent_requesters), *self.recent_requesters))),
+            b'' if self.available_reactions is None or self.available_reactions is False else (self.available_reactions._bytes()),
+            b'' if self.reactions_limit is None or self.reactions_limit is False else (struct.pack('<i', self.reactions_limit)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _can_set_username = bool(flags & 128)
+        _has_scheduled = bool(flags & 256)
+        _translations_disabled = bool(flags & 524288)
+        _about = reader.tgread_string()
+        _participants = reader.tgread_object()
+        if flags & 4:
+            _chat_photo = reader.tgread_object()
+        else:
+            _chat_photo = None
+        _notify_settings = reader.tgread_object()
+        if flags & 8192:
+            _exported_invite = reader.tgread_object()
+        else:
+            _exported_invite = None
+        if flags & 8:
+            reader.read_int()
+            _bot_info = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _bot_info.append(_x)
+
+        else:
+            _bot_info = None
+        if flags & 64:
+            _pinned_msg_id = reader.read_int()
+        else:
+            _pinned_msg_id = None
+        if flags & 2048:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        if flags & 4096:
+            _call = reader.tgread_object()
+        else:
+            _call = None
+        if flags & 16384:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 32768:
+            _groupcall_default_join_as = reader.tgread_object()
+        else:
+            _groupcall_default_join_as = None
+        if flags & 65536:
+            _theme_emoticon = reader.tgread_string()
+        else:
+            _theme_emoticon = None
+        if flags & 131072:
+            _requests_pending = reader.read_int()
+        else:
+            _requests_pending = None
+        if flags & 131072:
+            reader.read_int()
+            _recent_requesters = reader.read_array('q', reader.read_int())
+        else:
+            _recent_requesters = None
+        if flags & 262144:
+            _available_reactions = reader.tgread_object()
+        else:
+            _available_reactions = None
+        if flags & 1048576:
+            _reactions_limit = reader.read_int()
+        else:
+            _reactions_limit = None
+        return cls(id=_id, about=_about, participants=_participants, notify_settings=_notify_settings, can_set_username=_can_set_username, has_scheduled=_has_scheduled, translations_disabled=_translations_disabled, chat_photo=_chat_photo, exported_invite=_exported_invite, bot_info=_bot_info, pinned_msg_id=_pinned_msg_id, folder_id=_folder_id, call=_call, ttl_period=_ttl_period, groupcall_default_join_as=_groupcall_default_join_as, theme_emoticon=_theme_emoticon, requests_pending=_requests_pending, recent_requesters=_recent_requesters, available_reactions=_available_reactions, reactions_limit=_reactions_limit)
+
+TypeChatFull = Union[ChatFull,ChannelFull]
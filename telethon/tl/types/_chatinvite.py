@@ -0,0 +1,184 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotVerification, TypeChat, TypePhoto, TypeStarsSubscriptionPricing, TypeUser
+
+
+
+class ChatInvite(TLObject):
+    CONSTRUCTOR_ID = 0x5c9d3702
+    SUBCLASS_OF_ID = 0x4561736
+    __slots__ = ('title', 'photo', 'participants_count', 'color', 'channel', 'broadcast', 'public', 'megagroup', 'request_needed', 'verified', 'scam', 'fake', 'can_refulfill_subscription', 'about', 'participants', 'subscription_pricing', 'subscription_form_id', 'bot_verification')
+
+    def __init__(self, title: str, photo: 'TypePhoto', participants_count: int, color: int, channel: Optional[bool]=None, broadcast: Optional[bool]=None, public: Optional[bool]=None, megagroup: Optional[bool]=None, request_needed: Optional[bool]=None, verified: Optional[bool]=None, scam: Optional[bool]=None, fake: Optional[bool]=None, can_refulfill_subscription: Optional[bool]=None, about: Optional[str]=None, participants: Optional[List['TypeUser']]=None, subscription_pricing: Optional['TypeStarsSubscriptionPricing']=None, subscription_form_id: Optional[int]=None, bot_verification: Optional['TypeBotVerification']=None):
+        """
+        Constructor for ChatInvite: Instance of either ChatInviteAlready, ChatInvite, ChatInvitePeek.
+        """
+        self.title = title
+        self.photo = photo
+        self.participants_count = participants_count
+        self.color = color
+        self.channel = channel
+        self.broadcast = broadcast
+        self.public = public
+        self.megagroup = megagroup
+        self.request_needed = request_needed
+        self.verified = verified
+        self.scam = scam
+        self.fake = fake
+        self.can_refulfill_subscription = can_refulfill_subscription
+        self.about = about
+        self.participants = participants
+        self.subscription_pricing = subscription_pricing
+        self.subscription_form_id = subscription_form_id
+        self.bot_verification = bot_verification
+
+    def to_dict(self):
+        return {
+            '_': 'ChatInvite',
+            'title': self.title,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'participants_count': self.participants_count,
+            'color': self.color,
+            'channel': self.channel,
+            'broadcast': self.broadcast,
+            'public': self.public,
+            'megagroup': self.megagroup,
+            'request_needed': self.request_needed,
+            'verified': self.verified,
+            'scam': self.scam,
+            'fake': self.fake,
+            'can_refulfill_subscription': self.can_refulfill_subscription,
+            'about': self.about,
+            'participants': [] if self.participants is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.participants],
+            'subscription_pricing': self.subscription_pricing.to_dict() if isinstance(self.subscription_pricing, TLObject) else self.subscription_pricing,
+            'subscription_form_id': self.subscription_form_id,
+            'bot_verification': self.bot_verification.to_dict() if isinstance(self.bot_verification, TLObject) else self.bot_verification
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x027\x9d\\',
+            struct.pack('<I', (0 if self.channel is None or self.channel is False else 1) | (0 if self.broadcast is None or self.broadcast is False else 2) | (0 if self.public is None or self.public is False else 4) | (0 if self.megagroup is None or self.megagroup is False else 8) | (0 if self.request_needed is None or self.request_needed is False else 64) | (0 if self.verified is None or self.verified is False else 128) | (0 if self.scam is None or self.scam is False else 256) | (0 if self.fake is None or self.fake is False else 512) | (0 if self.can_refulfill_subscription is None or self.can_refulfill_subscription is False else 2048) | (0 if self.about is None or self.about is False else 32) | (0 if self.participants is None or self.participants is False else 16) | (0 if self.subscription_pricing is None or self.subscription_pricing is False else 1024) | (0 if self.subscription_form_id is None or self.subscription_form_id is False else 4096) | (0 if self.bot_verification is None or self.bot_verification is False else 8192)),
+            self.serialize_bytes(self.title),
+            b'' if self.about is None or self.about is False else (self.serialize_bytes(self.about)),
+            self.photo._bytes(),
+            struct.pack('<i', self.participants_count),
+            b'' if self.participants is None or self.participants is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.participants)),b''.join(x._bytes() for x in self.participants))),
+            struct.pack('<i', self.color),
+            b'' if self.subscription_pricing is None or self.subscription_pricing is False else (self.subscription_pricing._bytes()),
+            b'' if self.subscription_form_id is None or self.subscription_form_id is False else (struct.pack('<q', self.subscription_form_id)),
+            b'' if self.bot_verification is None or self.bot_verification is False else (self.bot_verification._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _channel = bool(flags & 1)
+        _broadcast = bool(flags & 2)
+        _public = bool(flags & 4)
+        _megagroup = bool(flags & 8)
+        _request_needed = bool(flags & 64)
+        _verified = bool(flags & 128)
+        _scam = bool(flags & 256)
+        _fake = bool(flags & 512)
+        _can_refulfill_subscription = bool(flags & 2048)
+        _title = reader.tgread_string()
+        if flags & 32:
+            _about = reader.tgread_string()
+        else:
+            _about = None
+        _photo = reader.tgread_object()
+        _participants_count = reader.read_int()
+        if flags & 16:
+            reader.read_int()
+            _participants = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _participants.append(_x)
+
+        else:
+            _participants = None
+        _color = reader.read_int()
+        if flags & 1024:
+            _subscription_pricing = reader.tgread_object()
+        else:
+            _subscription_pricing = None
+        if flags & 4096:
+            _subscription_form_id = reader.read_long()
+        else:
+            _subscription_form_id = None
+        if flags & 8192:
+            _bot_verification = reader.tgread_object()
+        else:
+            _bot_verification = None
+        return cls(title=_title, photo=_photo, participants_count=_participants_count, color=_color, channel=_channel, broadcast=_broadcast, public=_public, megagroup=_megagroup, request_needed=_request_needed, verified=_verified, scam=_scam, fake=_fake, can_refulfill_subscription=_can_refulfill_subscription, about=_about, participants=_participants, subscription_pricing=_subscription_pricing, subscription_form_id=_subscription_form_id, bot_verification=_bot_verification)
+
+
+class ChatInviteAlready(TLObject):
+    CONSTRUCTOR_ID = 0x5a686d7c
+    SUBCLASS_OF_ID = 0x4561736
+    __slots__ = ('chat',)
+
+    def __init__(self, chat: 'TypeChat'):
+        """
+        Constructor for ChatInvite: Instance of either ChatInviteAlready, ChatInvite, ChatInvitePeek.
+        """
+        self.chat = chat
+
+    def to_dict(self):
+        return {
+            '_': 'ChatInviteAlready',
+            'chat': self.chat.to_dict() if isinstance(self.chat, TLObject) else self.chat
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'|mhZ',
+            self.chat._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _chat = reader.tgread_object()
+        return cls(chat=_chat)
+
+
+class ChatInvitePeek(TLObject):
+    CONSTRUCTOR_ID = 0x61695cb0
+    SUBCLASS_OF_ID = 0x4561736
+    __slots__ = ('chat', 'expires')
+
+    def __init__(self, chat: 'TypeChat', expires: Optional[datetime]):
+        """
+        Constructor for ChatInvite: Instance of either ChatInviteAlready, ChatInvite, ChatInvitePeek.
+        """
+        self.chat = chat
+        self.expires = expires
+
+    def to_dict(self):
+        return {
+            '_': 'ChatInvitePeek',
+            'chat': self.chat.to_dict() if isinstance(self.chat, TLObject) else self.chat,
+            'expires': self.expires
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb0\\ia',
+            self.chat._bytes(),
+            self.serialize_datetime(self.expires),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _chat = reader.tgread_object()
+        _expires = reader.tgread_date()
+        return cls(chat=_chat, expires=_expires)
+
+TypeChatInvite = Union[ChatInviteAlready,ChatInvite,ChatInvitePeek]
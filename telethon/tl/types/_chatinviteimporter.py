@@ -0,0 +1,64 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class ChatInviteImporter(TLObject):
+    CONSTRUCTOR_ID = 0x8c5adfd9
+    SUBCLASS_OF_ID = 0x5312542e
+    __slots__ = ('user_id', 'date', 'requested', 'via_chatlist', 'about', 'approved_by')
+
+    def __init__(self, user_id: int, date: Optional[datetime], requested: Optional[bool]=None, via_chatlist: Optional[bool]=None, about: Optional[str]=None, approved_by: Optional[int]=None):
+        """
+        Constructor for ChatInviteImporter: Instance of ChatInviteImporter.
+        """
+        self.user_id = user_id
+        self.date = date
+        self.requested = requested
+        self.via_chatlist = via_chatlist
+        self.about = about
+        self.approved_by = approved_by
+
+    def to_dict(self):
+        return {
+            '_': 'ChatInviteImporter',
+            'user_id': self.user_id,
+            'date': self.date,
+            'requested': self.requested,
+            'via_chatlist': self.via_chatlist,
+            'about': self.about,
+            'approved_by': self.approved_by
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9\xdfZ\x8c',
+            _struct_Iq.pack((0 if self.requested is None or self.requested is False else 1) | (0 if self.via_chatlist is None or self.via_chatlist is False else 8) | (0 if self.about is None or self.about is False else 4) | (0 if self.approved_by is None or self.approved_by is False else 2), self.user_id),
+            self.serialize_datetime(self.date),
+            b'' if self.about is None or self.about is False else (self.serialize_bytes(self.about)),
+            b'' if self.approved_by is None or self.approved_by is False else (struct.pack('<q', self.approved_by)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id = reader.read_struct(_struct_iq)
+        _requested = bool(flags & 1)
+        _via_chatlist = bool(flags & 8)
+        _date = reader.tgread_date()
+        if flags & 4:
+            _about = reader.tgread_string()
+        else:
+            _about = None
+        if flags & 2:
+            _approved_by = reader.read_long()
+        else:
+            _approved_by = None
+        return cls(user_id=_user_id, date=_date, requested=_requested, via_chatlist=_via_chatlist, about=_about, approved_by=_approved_by)
+
+TypeChatInviteImporter = ChatInviteImporter
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDialogFilter, TypeExportedChatlistInvite
+
+
+
+class ExportedChatlistInvite(TLObject):
+    CONSTRUCTOR_ID = 0x10e6e3a6
+    SUBCLASS_OF_ID = 0xc2694ee9
+    __slots__ = ('filter', 'invite')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, filter: 'TypeDialogFilter', invite: 'TypeExportedChatlistInvite'):
+        """
+        Constructor for chatlists.ExportedChatlistInvite: Instance of ExportedChatlistInvite.
+        """
+        self.filter = filter
+        self.invite = invite
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedChatlistInvite',
+            'filter': self.filter.to_dict() if isinstance(self.filter, TLObject) else self.filter,
+            'invite': self.invite.to_dict() if isinstance(self.invite, TLObject) else self.invite
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa6\xe3\xe6\x10',
+            self.filter._bytes(),
+            self.invite._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _filter = reader.tgread_object()
+        _invite = reader.tgread_object()
+        return cls(filter=_filter, invite=_invite)
+
@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ChatOnlines(TLObject):
+    CONSTRUCTOR_ID = 0xf041e250
+    SUBCLASS_OF_ID = 0x8c81903a
+    __slots__ = ('onlines',)
+
+    def __init__(self, onlines: int):
+        """
+        Constructor for ChatOnlines: Instance of ChatOnlines.
+        """
+        self.onlines = onlines
+
+    def to_dict(self):
+        return {
+            '_': 'ChatOnlines',
+            'onlines': self.onlines
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'P\xe2A\xf0',
+            struct.pack('<i', self.onlines),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _onlines = reader.read_int()
+        return cls(onlines=_onlines)
+
+TypeChatOnlines = ChatOnlines
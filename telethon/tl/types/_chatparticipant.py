@@ -0,0 +1,109 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class ChatParticipant(TLObject):
+    CONSTRUCTOR_ID = 0xc02d4007
+    SUBCLASS_OF_ID = 0x7d7c6f86
+    __slots__ = ('user_id', 'inviter_id', 'date')
+
+    def __init__(self, user_id: int, inviter_id: int, date: Optional[datetime]):
+        """
+        Constructor for ChatParticipant: Instance of either ChatParticipant, ChatParticipantCreator, ChatParticipantAdmin.
+        """
+        self.user_id = user_id
+        self.inviter_id = inviter_id
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'ChatParticipant',
+            'user_id': self.user_id,
+            'inviter_id': self.inviter_id,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x07@-\xc0',
+            _struct_qq.pack(self.user_id, self.inviter_id),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _inviter_id = reader.read_struct(_struct_qq)
+        _date = reader.tgread_date()
+        return cls(user_id=_user_id, inviter_id=_inviter_id, date=_date)
+
+
+class ChatParticipantAdmin(TLObject):
+    CONSTRUCTOR_ID = 0xa0933f5b
+    SUBCLASS_OF_ID = 0x7d7c6f86
+    __slots__ = ('user_id', 'inviter_id', 'date')
+
+    def __init__(self, user_id: int, inviter_id: int, date: Optional[datetime]):
+        """
+        Constructor for ChatParticipant: Instance of either ChatParticipant, ChatParticipantCreator, ChatParticipantAdmin.
+        """
+        self.user_id = user_id
+        self.inviter_id = inviter_id
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'ChatParticipantAdmin',
+            'user_id': self.user_id,
+            'inviter_id': self.inviter_id,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'[?\x93\xa0',
+            _struct_qq.pack(self.user_id, self.inviter_id),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _inviter_id = reader.read_struct(_struct_qq)
+        _date = reader.tgread_date()
+        return cls(user_id=_user_id, inviter_id=_inviter_id, date=_date)
+
+
+class ChatParticipantCreator(TLObject):
+    CONSTRUCTOR_ID = 0xe46bcee4
+    SUBCLASS_OF_ID = 0x7d7c6f86
+    __slots__ = ('user_id',)
+
+    def __init__(self, user_id: int):
+        """
+        Constructor for ChatParticipant: Instance of either ChatParticipant, ChatParticipantCreator, ChatParticipantAdmin.
+        """
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'ChatParticipantCreator',
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4\xcek\xe4',
+            struct.pack('<q', self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.read_long()
+        return cls(user_id=_user_id)
+
+TypeChatParticipant = Union[ChatParticipant,ChatParticipantCreator,ChatParticipantAdmin]
@@ -0,0 +1,92 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatParticipant
+
+
+
+class ChatParticipants(TLObject):
+    CONSTRUCTOR_ID = 0x3cbc93f8
+    SUBCLASS_OF_ID = 0x1fa89571
+    __slots__ = ('chat_id', 'participants', 'version')
+
+    def __init__(self, chat_id: int, participants: List['TypeChatParticipant'], version: int):
+        """
+        Constructor for ChatParticipants: Instance of either ChatParticipantsForbidden, ChatParticipants.
+        """
+        self.chat_id = chat_id
+        self.participants = participants
+        self.version = version
+
+    def to_dict(self):
+        return {
+            '_': 'ChatParticipants',
+            'chat_id': self.chat_id,
+            'participants': [] if self.participants is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.participants],
+            'version': self.version
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf8\x93\xbc<',
+            struct.pack('<q', self.chat_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.participants)),b''.join(x._bytes() for x in self.participants),
+            struct.pack('<i', self.version),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _chat_id = reader.read_long()
+        reader.read_int()
+        _participants = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _participants.append(_x)
+
+        _version = reader.read_int()
+        return cls(chat_id=_chat_id, participants=_participants, version=_version)
+
+
+class ChatParticipantsForbidden(TLObject):
+    CONSTRUCTOR_ID = 0x8763d3e1
+    SUBCLASS_OF_ID = 0x1fa89571
+    __slots__ = ('chat_id', 'self_participant')
+
+    def __init__(self, chat_id: int, self_participant: Optional['TypeChatParticipant']=None):
+        """
+        Constructor for ChatParticipants: Instance of either ChatParticipantsForbidden, ChatParticipants.
+        """
+        self.chat_id = chat_id
+        self.self_participant = self_participant
+
+    def to_dict(self):
+        return {
+            '_': 'ChatParticipantsForbidden',
+            'chat_id': self.chat_id,
+            'self_participant': self.self_participant.to_dict() if isinstance(self.self_participant, TLObject) else self.self_participant
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe1\xd3c\x87',
+            _struct_Iq.pack((0 if self.self_participant is None or self.self_participant is False else 1), self.chat_id),
+            b'' if self.self_participant is None or self.self_participant is False else (self.self_participant._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _chat_id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _self_participant = reader.tgread_object()
+        else:
+            _self_participant = None
+        return cls(chat_id=_chat_id, self_participant=_self_participant)
+
+TypeChatParticipants = Union[ChatParticipantsForbidden,ChatParticipants]
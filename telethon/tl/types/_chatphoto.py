@@ -0,0 +1,74 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class ChatPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x1c6e1c11
+    SUBCLASS_OF_ID = 0xac3ec4e5
+    __slots__ = ('photo_id', 'dc_id', 'has_video', 'stripped_thumb')
+
+    def __init__(self, photo_id: int, dc_id: int, has_video: Optional[bool]=None, stripped_thumb: Optional[bytes]=None):
+        """
+        Constructor for ChatPhoto: Instance of either ChatPhotoEmpty, ChatPhoto.
+        """
+        self.photo_id = photo_id
+        self.dc_id = dc_id
+        self.has_video = has_video
+        self.stripped_thumb = stripped_thumb
+
+    def to_dict(self):
+        return {
+            '_': 'ChatPhoto',
+            'photo_id': self.photo_id,
+            'dc_id': self.dc_id,
+            'has_video': self.has_video,
+            'stripped_thumb': self.stripped_thumb
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x11\x1cn\x1c',
+            _struct_Iq.pack((0 if self.has_video is None or self.has_video is False else 1) | (0 if self.stripped_thumb is None or self.stripped_thumb is False else 2), self.photo_id),
+            b'' if self.stripped_thumb is None or self.stripped_thumb is False else (self.serialize_bytes(self.stripped_thumb)),
+            struct.pack('<i', self.dc_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _photo_id = reader.read_struct(_struct_iq)
+        _has_video = bool(flags & 1)
+        if flags & 2:
+            _stripped_thumb = reader.tgread_bytes()
+        else:
+            _stripped_thumb = None
+        _dc_id = reader.read_int()
+        return cls(photo_id=_photo_id, dc_id=_dc_id, has_video=_has_video, stripped_thumb=_stripped_thumb)
+
+
+class ChatPhotoEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x37c1011c
+    SUBCLASS_OF_ID = 0xac3ec4e5
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChatPhotoEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1c\x01\xc17',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeChatPhoto = Union[ChatPhotoEmpty,ChatPhoto]
@@ -0,0 +1,96 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeReaction
+
+
+
+class ChatReactionsAll(TLObject):
+    CONSTRUCTOR_ID = 0x52928bca
+    SUBCLASS_OF_ID = 0x131e24b5
+    __slots__ = ('allow_custom',)
+
+    def __init__(self, allow_custom: Optional[bool]=None):
+        """
+        Constructor for ChatReactions: Instance of either ChatReactionsNone, ChatReactionsAll, ChatReactionsSome.
+        """
+        self.allow_custom = allow_custom
+
+    def to_dict(self):
+        return {
+            '_': 'ChatReactionsAll',
+            'allow_custom': self.allow_custom
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xca\x8b\x92R',
+            struct.pack('<I', (0 if self.allow_custom is None or self.allow_custom is False else 1)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _allow_custom = bool(flags & 1)
+        return cls(allow_custom=_allow_custom)
+
+
+class ChatReactionsNone(TLObject):
+    CONSTRUCTOR_ID = 0xeafc32bc
+    SUBCLASS_OF_ID = 0x131e24b5
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChatReactionsNone'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbc2\xfc\xea',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class ChatReactionsSome(TLObject):
+    CONSTRUCTOR_ID = 0x661d4037
+    SUBCLASS_OF_ID = 0x131e24b5
+    __slots__ = ('reactions',)
+
+    def __init__(self, reactions: List['TypeReaction']):
+        """
+        Constructor for ChatReactions: Instance of either ChatReactionsNone, ChatReactionsAll, ChatReactionsSome.
+        """
+        self.reactions = reactions
+
+    def to_dict(self):
+        return {
+            '_': 'ChatReactionsSome',
+            'reactions': [] if self.reactions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.reactions]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'7@\x1df',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.reactions)),b''.join(x._bytes() for x in self.reactions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _reactions = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _reactions.append(_x)
+
+        return cls(reactions=_reactions)
+
+TypeChatReactions = Union[ChatReactionsNone,ChatReactionsAll,ChatReactionsSome]
@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ClientDHInnerData(TLObject):
+    CONSTRUCTOR_ID = 0x6643b654
+    SUBCLASS_OF_ID = 0xf8eeef6a
+    __slots__ = ('nonce', 'server_nonce', 'retry_id', 'g_b')
+
+    def __init__(self, nonce: int, server_nonce: int, retry_id: int, g_b: bytes):
+        """
+        Constructor for Client_DH_Inner_Data: Instance of ClientDHInnerData.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.retry_id = retry_id
+        self.g_b = g_b
+
+    def to_dict(self):
+        return {
+            '_': 'ClientDHInnerData',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'retry_id': self.retry_id,
+            'g_b': self.g_b
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'T\xb6Cf',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            struct.pack('<q', self.retry_id),
+            self.serialize_bytes(self.g_b),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _retry_id = reader.read_long()
+        _g_b = reader.tgread_bytes()
+        return cls(nonce=_nonce, server_nonce=_server_nonce, retry_id=_retry_id, g_b=_g_b)
+
+TypeClient_DH_Inner_Data = ClientDHInnerData
@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class CodeSettings(TLObject):
+    CONSTRUCTOR_ID = 0xad253d78
+    SUBCLASS_OF_ID = 0x48edbc8a
+    __slots__ = ('allow_flashcall', 'current_number', 'allow_app_hash', 'allow_missed_call', 'allow_firebase', 'unknown_number', 'logout_tokens', 'token', 'app_sandbox')
+
+    def __init__(self, allow_flashcall: Optional[bool]=None, current_number: Optional[bool]=None, allow_app_hash: Optional[bool]=None, allow_missed_call: Optional[bool]=None, allow_firebase: Optional[bool]=None, unknown_number: Optional[bool]=None, logout_tokens: Optional[List[bytes]]=None, token: Optional[str]=None, app_sandbox: Optional[bool]=None):
+        """
+        Constructor for CodeSettings: Instance of CodeSettings.
+        """
+        self.allow_flashcall = allow_flashcall
+        self.current_number = current_number
+        self.allow_app_hash = allow_app_hash
+        self.allow_missed_call = allow_missed_call
+        self.allow_firebase = allow_firebase
+        self.unknown_number = unknown_number
+        self.logout_tokens = logout_tokens
+        self.token = token
+        self.app_sandbox = app_sandbox
+
+    def to_dict(self):
+        return {
+            '_': 'CodeSettings',
+            'allow_flashcall': self.allow_flashcall,
+            'current_number': self.current_number,
+            'allow_app_hash': self.allow_app_hash,
+            'allow_missed_call': self.allow_missed_call,
+            'allow_firebase': self.allow_firebase,
+            'unknown_number': self.unknown_number,
+            'logout_tokens': [] if self.logout_tokens is None else self.logout_tokens[:],
+            'token': self.token,
+            'app_sandbox': self.app_sandbox
+        }
+
+    def _bytes(self):
+        assert ((self.token or self.token is not None) and (self.app_sandbox or self.app_sandbox is not None)) or ((self.token is None or self.token is False) and (self.app_sandbox is None or self.app_sandbox is False)), 'token, app_sandbox parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'x=%\xad',
+            struct.pack('<I', (0 if self.allow_flashcall is None or self.allow_flashcall is False else 1) | (0 if self.current_number is None or self.current_number is False else 2) | (0 if self.allow_app_hash is None or self.allow_app_hash is False else 16) | (0 if self.allow_missed_call is None or self.allow_missed_call is False else 32) | (0 if self.allow_firebase is None or self.allow_firebase is False else 128) | (0 if self.unknown_number is None or self.unknown_number is False else 512) | (0 if self.logout_tokens is None or self.logout_tokens is False else 64) | (0 if self.token is None or self.token is False else 256) | (0 if self.app_sandbox is None else 256)),
+            b'' if self.logout_tokens is None or self.logout_tokens is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.logout_tokens)),b''.join(self.serialize_bytes(x) for x in self.logout_tokens))),
+            b'' if self.token is None or self.token is False else (self.serialize_bytes(self.token)),
+            b'' if self.app_sandbox is None else (b'\xb5ur\x99' if self.app_sandbox else b'7\x97y\xbc'),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _allow_flashcall = bool(flags & 1)
+        _current_number = bool(flags & 2)
+        _allow_app_hash = bool(flags & 16)
+        _allow_missed_call = bool(flags & 32)
+        _allow_firebase = bool(flags & 128)
+        _unknown_number = bool(flags & 512)
+        if flags & 64:
+            reader.read_int()
+            _logout_tokens = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_bytes()
+                _logout_tokens.append(_x)
+
+        else:
+            _logout_tokens = None
+        if flags & 256:
+            _token = reader.tgread_string()
+        else:
+            _token = None
+        if flags & 256:
+            _app_sandbox = reader.tgread_bool()
+        else:
+            _app_sandbox = None
+        return cls(allow_flashcall=_allow_flashcall, current_number=_current_number, allow_app_hash=_allow_app_hash, allow_missed_call=_allow_missed_call, allow_firebase=_allow_firebase, unknown_number=_unknown_number, logout_tokens=_logout_tokens, token=_token, app_sandbox=_app_sandbox)
+
+TypeCodeSettings = CodeSettings
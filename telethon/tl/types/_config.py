@@ -0,0 +1,223 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iii = struct.Struct('<iii')
+_struct_iiii = struct.Struct('<iiii')
+_struct_iiiiiiiiiiiiiiiii = struct.Struct('<iiiiiiiiiiiiiiiii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDcOption, TypeReaction
+
+
+
+class Config(TLObject):
+    CONSTRUCTOR_ID = 0xcc1a241e
+    SUBCLASS_OF_ID = 0xd3262a4a
+    __slots__ = ('date', 'expires', 'test_mode', 'this_dc', 'dc_options', 'dc_txt_domain_name', 'chat_size_max', 'megagroup_size_max', 'forwarded_count_max', 'online_update_period_ms', 'offline_blur_timeout_ms', 'offline_idle_timeout_ms', 'online_cloud_timeout_ms', 'notify_cloud_delay_ms', 'notify_default_delay_ms', 'push_chat_period_ms', 'push_chat_limit', 'edit_time_limit', 'revoke_time_limit', 'revoke_pm_time_limit', 'rating_e_decay', 'stickers_recent_limit', 'channels_read_media_period', 'call_receive_timeout_ms', 'call_ring_timeout_ms', 'call_connect_timeout_ms', 'call_packet_timeout_ms', 'me_url_prefix', 'caption_length_max', 'message_length_max', 'webfile_dc_id', 'default_p2p_contacts', 'preload_featured_stickers', 'revoke_pm_inbox', 'blocked_mode', 'force_try_ipv6', 'tmp_sessions', 'autoupdate_url_prefix', 'gif_search_username', 'venue_search_username', 'img_search_username', 'static_maps_provider', 'suggested_lang_code', 'lang_pack_version', 'base_lang_pack_version', 'reactions_default', 'autologin_token')
+
+    def __init__(self, date: Optional[datetime], expires: Optional[datetime], test_mode: bool, this_dc: int, dc_options: List['TypeDcOption'], dc_txt_domain_name: str, chat_size_max: int, megagroup_size_max: int, forwarded_count_max: int, online_update_period_ms: int, offline_blur_timeout_ms: int, offline_idle_timeout_ms: int, online_cloud_timeout_ms: int, notify_cloud_delay_ms: int, notify_default_delay_ms: int, push_chat_period_ms: int, push_chat_limit: int, edit_time_limit: int, revoke_time_limit: int, revoke_pm_time_limit: int, rating_e_decay: int, stickers_recent_limit: int, channels_read_media_period: int, call_receive_timeout_ms: int, call_ring_timeout_ms: int, call_connect_timeout_ms: int, call_packet_timeout_ms: int, me_url_prefix: str, caption_length_max: int, message_length_max: int, webfile_dc_id: int, default_p2p_contacts: Optional[bool]=None, preload_featured_stickers: Optional[bool]=None, revoke_pm_inbox: Optional[bool]=None, blocked_mode: Optional[bool]=None, force_try_ipv6: Optional[bool]=None, tmp_sessions: Optional[int]=None, autoupdate_url_prefix: Optional[str]=None, gif_search_username: Optional[str]=None, venue_search_username: Optional[str]=None, img_search_username: Optional[str]=None, static_maps_provider: Optional[str]=None, suggested_lang_code: Optional[str]=None, lang_pack_version: Optional[int]=None, base_lang_pack_version: Optional[int]=None, reactions_default: Optional['TypeReaction']=None, autologin_token: Optional[str]=None):
+        """
+        Constructor for Config: Instance of Config.
+        """
+        self.date = date
+        self.expires = expires
+        self.test_mode = test_mode
+        self.this_dc = this_dc
+        self.dc_options = dc_options
+        self.dc_txt_domain_name = dc_txt_domain_name
+        self.chat_size_max = chat_size_max
+        self.megagroup_size_max = megagroup_size_max
+        self.forwarded_count_max = forwarded_count_max
+        self.online_update_period_ms = online_update_period_ms
+        self.offline_blur_timeout_ms = offline_blur_timeout_ms
+        self.offline_idle_timeout_ms = offline_idle_timeout_ms
+        self.online_cloud_timeout_ms = online_cloud_timeout_ms
+        self.notify_cloud_delay_ms = notify_cloud_delay_ms
+        self.notify_default_delay_ms = notify_default_delay_ms
+        self.push_chat_period_ms = push_chat_period_ms
+        self.push_chat_limit = push_chat_limit
+        self.edit_time_limit = edit_time_limit
+        self.revoke_time_limit = revoke_time_limit
+        self.revoke_pm_time_limit = revoke_pm_time_limit
+        self.rating_e_decay = rating_e_decay
+        self.stickers_recent_limit = stickers_recent_limit
+        self.channels_read_media_period = channels_read_media_period
+        self.call_receive_timeout_ms = call_receive_timeout_ms
+        self.call_ring_timeout_ms = call_ring_timeout_ms
+        self.call_connect_timeout_ms = call_connect_timeout_ms
+        self.call_packet_timeout_ms = call_packet_timeout_ms
+        self.me_url_prefix = me_url_prefix
+        self.caption_length_max = caption_length_max
+        self.message_length_max = message_length_max
+        self.webfile_dc_id = webfile_dc_id
+        self.default_p2p_contacts = default_p2p_contacts
+        self.preload_featured_stickers = preload_featured_stickers
+        self.revoke_pm_inbox = revoke_pm_inbox
+        self.blocked_mode = blocked_mode
+        self.force_try_ipv6 = force_try_ipv6
+        self.tmp_sessions = tmp_sessions
+        self.autoupdate_url_prefix = autoupdate_url_prefix
+        self.gif_search_username = gif_search_username
+        self.venue_search_username = venue_search_username
+        self.img_search_username = img_search_username
+        self.static_maps_provider = static_maps_provider
+        self.suggested_lang_code = suggested_lang_code
+        self.lang_pack_version = lang_pack_version
+        self.base_lang_pack_version = base_lang_pack_version
+        self.reactions_default = reactions_default
+        self.autologin_token = autologin_token
+
+    def to_dict(self):
+        return {
+            '_': 'Config',
+            'date': self.date,
+            'expires': self.expires,
+            'test_mode': self.test_mode,
+            'this_dc': self.this_dc,
+            'dc_options': [] if self.dc_options is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.dc_options],
+            'dc_txt_domain_name': self.dc_txt_domain_name,
+            'chat_size_max': self.chat_size_max,
+            'megagroup_size_max': self.megagroup_size_max,
+            'forwarded_count_max': self.forwarded_count_max,
+            'online_update_period_ms': self.online_update_period_ms,
+            'offline_blur_timeout_ms': self.offline_blur_timeout_ms,
+            'offline_idle_timeout_ms': self.offline_idle_timeout_ms,
+            'online_cloud_timeout_ms': self.online_cloud_timeout_ms,
+            'notify_cloud_delay_ms': self.notify_cloud_delay_ms,
+            'notify_default_delay_ms': self.notify_default_delay_ms,
+            'push_chat_period_ms': self.push_chat_period_ms,
+            'push_chat_limit': self.push_chat_limit,
+            'edit_time_limit': self.edit_time_limit,
+            'revoke_time_limit': self.revoke_time_limit,
+            'revoke_pm_time_limit': self.revoke_pm_time_limit,
+            'rating_e_decay': self.rating_e_decay,
+            'stickers_recent_limit': self.stickers_recent_limit,
+            'channels_read_media_period': self.channels_read_media_period,
+            'call_receive_timeout_ms': self.call_receive_timeout_ms,
+            'call_ring_timeout_ms': self.call_ring_timeout_ms,
+            'call_connect_timeout_ms': self.call_connect_timeout_ms,
+            'call_packet_timeout_ms': self.call_packet_timeout_ms,
+            'me_url_prefix': self.me_url_prefix,
+            'caption_length_max': self.caption_length_max,
+            'message_length_max': self.message_length_max,
+            'webfile_dc_id': self.webfile_dc_id,
+            'default_p2p_contacts': self.default_p2p_contacts,
+            'preload_featured_stickers': self.preload_featured_stickers,
+            'revoke_pm_inbox': self.revoke_pm_inbox,
+            'blocked_mode': self.blocked_mode,
+            'force_try_ipv6': self.force_try_ipv6,
+            'tmp_sessions': self.tmp_sessions,
+            'autoupdate_url_prefix': self.autoupdate_url_prefix,
+            'gif_search_username': self.gif_search_username,
+            'venue_search_username': self.venue_search_username,
+            'img_search_username': self.img_search_username,
+            'static_maps_provider': self.static_maps_provider,
+            'suggested_lang_code': self.suggested_lang_code,
+            'lang_pack_version': self.lang_pack_version,
+            'base_lang_pack_version': self.base_lang_pack_version,
+            'reactions_default': self.reactions_default.to_dict() if isinstance(self.reactions_default, TLObject) else self.reactions_default,
+            'autologin_token': self.autologin_token
+        }
+
+    def _bytes(self):
+        assert ((self.suggested_lang_code or self.suggested_lang_code is not None) and (self.lang_pack_version or self.lang_pack_version is not None) and (self.base_lang_pack_version or self.base_lang_pack_version is not None)) or ((self.suggested_lang_code is None or self.suggested_lang_code is False) and (self.lang_pack_version is None or self.lang_pack_version is False) and (self.base_lang_pack_version is None or self.base_lang_pack_version is False)), 'suggested_lang_code, lang_pack_version, base_lang_pack_version parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\x1e$\x1a\xcc',
+            struct.pack('<I', (0 if self.default_p2p_contacts is None or self.default_p2p_contacts is False else 8) | (0 if self.preload_featured_stickers is None or self.preload_featured_stickers is False else 16) | (0 if self.revoke_pm_inbox is None or self.revoke_pm_inbox is False else 64) | (0 if self.blocked_mode is None or self.blocked_mode is False else 256) | (0 if self.force_try_ipv6 is None or self.force_try_ipv6 is False else 16384) | (0 if self.tmp_sessions is None or self.tmp_sessions is False else 1) | (0 if self.autoupdate_url_prefix is None or self.autoupdate_url_prefix is False else 128) | (0 if self.gif_search_username is None or self.gif_search_username is False else 512) | (0 if self.venue_search_username is None or self.venue_search_username is False else 1024) | (0 if self.img_search_username is None or self.img_search_username is False else 2048) | (0 if self.static_maps_provider is None or self.static_maps_provider is False else 4096) | (0 if self.suggested_lang_code is None or self.suggested_lang_code is False else 4) | (0 if self.lang_pack_version is None or self.lang_pack_version is False else 4) | (0 if self.base_lang_pack_version is None or self.base_lang_pack_version is False else 4) | (0 if self.reactions_default is None or self.reactions_default is False else 32768) | (0 if self.autologin_token is None or self.autologin_token is False else 65536)),
+            self.serialize_datetime(self.date),
+            self.serialize_datetime(self.expires),
+            b'\xb5ur\x99' if self.test_mode else b'7\x97y\xbc',
+            struct.pack('<i', self.this_dc),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.dc_options)),b''.join(x._bytes() for x in self.dc_options),
+            self.serialize_bytes(self.dc_txt_domain_name),
+            _struct_iiiiiiiiiiiiiiiii.pack(self.chat_size_max, self.megagroup_size_max, self.forwarded_count_max, self.online_update_period_ms, self.offline_blur_timeout_ms, self.offline_idle_timeout_ms, self.online_cloud_timeout_ms, self.notify_cloud_delay_ms, self.notify_default_delay_ms, self.push_chat_period_ms, self.push_chat_limit, self.edit_time_limit, self.revoke_time_limit, self.revoke_pm_time_limit, self.rating_e_decay, self.stickers_recent_limit, self.channels_read_media_period),
+            b'' if self.tmp_sessions is None or self.tmp_sessions is False else (struct.pack('<i', self.tmp_sessions)),
+            _struct_iiii.pack(self.call_receive_timeout_ms, self.call_ring_timeout_ms, self.call_connect_timeout_ms, self.call_packet_timeout_ms),
+            self.serialize_bytes(self.me_url_prefix),
+            b'' if self.autoupdate_url_prefix is None or self.autoupdate_url_prefix is False else (self.serialize_bytes(self.autoupdate_url_prefix)),
+            b'' if self.gif_search_username is None or self.gif_search_username is False else (self.serialize_bytes(self.gif_search_username)),
+            b'' if self.venue_search_username is None or self.venue_search_username is False else (self.serialize_bytes(self.venue_search_username)),
+            b'' if self.img_search_username is None or self.img_search_username is False else (self.serialize_bytes(self.img_search_username)),
+            b'' if self.static_maps_provider is None or self.static_maps_provider is False else (self.serialize_bytes(self.static_maps_provider)),
+            _struct_iii.pack(self.caption_length_max, self.message_length_max, self.webfile_dc_id),
+            b'' if self.suggested_lang_code is None or self.suggested_lang_code is False else (self.serialize_bytes(self.suggested_lang_code)),
+            b'' if self.lang_pack_version is None or self.lang_pack_version is False else (struct.pack('<i', self.lang_pack_version)),
+            b'' if self.base_lang_pack_version is None or self.base_lang_pack_version is False else (struct.pack('<i', self.base_lang_pack_version)),
+            b'' if self.reactions_default is None or self.reactions_default is False else (self.reactions_default._bytes()),
+            b'' if self.autologin_token is None or self.autologin_token is False else (self.serialize_bytes(self.autologin_token)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _default_p2p_contacts = bool(flags & 8)
+        _preload_featured_stickers = bool(flags & 16)
+        _revoke_pm_inbox = bool(flags & 64)
+        _blocked_mode = bool(flags & 256)
+        _force_try_ipv6 = bool(flags & 16384)
+        _date = reader.tgread_date()
+        _expires = reader.tgread_date()
+        _test_mode = reader.tgread_bool()
+        _this_dc = reader.read_int()
+        reader.read_int()
+        _dc_options = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _dc_options.append(_x)
+
+        _dc_txt_domain_name = reader.tgread_string()
+        _chat_size_max, _megagroup_size_max, _forwarded_count_max, _online_update_period_ms, _offline_blur_timeout_ms, _offline_idle_timeout_ms, _online_cloud_timeout_ms, _notify_cloud_delay_ms, _notify_default_delay_ms, _push_chat_period_ms, _push_chat_limit, _edit_time_limit, _revoke_time_limit, _revoke_pm_time_limit, _rating_e_decay, _stickers_recent_limit, _channels_read_media_period = reader.read_struct(_struct_iiiiiiiiiiiiiiiii)
+        if flags & 1:
+            _tmp_sessions = reader.read_int()
+        else:
+            _tmp_sessions = None
+        _call_receive_timeout_ms, _call_ring_timeout_ms, _call_connect_timeout_ms, _call_packet_timeout_ms = reader.read_struct(_struct_iiii)
+        _me_url_prefix = reader.tgread_string()
+        if flags & 128:
+            _autoupdate_url_prefix = reader.tgread_string()
+        else:
+            _autoupdate_url_prefix = None
+        if flags & 512:
+            _gif_search_username = reader.tgread_string()
+        else:
+            _gif_search_username = None
+        if flags & 1024:
+            _venue_search_username = reader.tgread_string()
+        else:
+            _venue_search_username = None
+        if flags & 2048:
+            _img_search_username = reader.tgread_string()
+        else:
+            _img_search_username = None
+        if flags & 4096:
+            _static_maps_provider = reader.tgread_string()
+        else:
+            _static_maps_provider = None
+        _caption_length_max, _message_length_max, _webfile_dc_id = reader.read_struct(_struct_iii)
+        if flags & 4:
+            _suggested_lang_code = reader.tgread_string()
+        else:
+            _suggested_lang_code = None
+        if flags & 4:
+            _lang_pack_version = reader.read_int()
+        else:
+            _lang_pack_version = None
+        if flags & 4:
+            _base_lang_pack_version = reader.read_int()
+        else:
+            _base_lang_pack_version = None
+        if flags & 32768:
+            _reactions_default = reader.tgread_object()
+        else:
+            _reactions_default = None
+        if flags & 65536:
+            _autologin_token = reader.tgread_string()
+        else:
+            _autologin_token = None
+        return cls(date=_date, expires=_expires, test_mode=_test_mode, this_dc=_this_dc, dc_options=_dc_options, dc_txt_domain_name=_dc_txt_domain_name, chat_size_max=_chat_size_max, megagroup_size_max=_megagroup_size_max, forwarded_count_max=_forwarded_count_max, online_update_period_ms=_online_update_period_ms, offline_blur_timeout_ms=_offline_blur_timeout_ms, offline_idle_timeout_ms=_offline_idle_timeout_ms, online_cloud_timeout_ms=_online_cloud_timeout_ms, notify_cloud_delay_ms=_notify_cloud_delay_ms, notify_default_delay_ms=_notify_default_delay_ms, push_chat_period_ms=_push_chat_period_ms, push_chat_limit=_push_chat_limit, edit_time_limit=_edit_time_limit, revoke_time_limit=_revoke_time_limit, revoke_pm_time_limit=_revoke_pm_time_limit, rating_e_decay=_rating_e_decay, stickers_recent_limit=_stickers_recent_limit, channels_read_media_period=_channels_read_media_period, call_receive_timeout_ms=_call_receive_timeout_ms, call_ring_timeout_ms=_call_ring_timeout_ms, call_connect_timeout_ms=_call_connect_timeout_ms, call_packet_timeout_ms=_call_packet_timeout_ms, me_url_prefix=_me_url_prefix, caption_length_max=_caption_length_max, message_length_max=_message_length_max, webfile_dc_id=_webfile_dc_id, default_p2p_contacts=_default_p2p_contacts, preload_featured_stickers=_preload_featured_stickers, revoke_pm_inbox=_revoke_pm_inbox, blocked_mode=_blocked_mode, force_try_ipv6=_force_try_ipv6, tmp_sessions=_tmp_sessions, autoupdate_url_prefix=_autoupdate_url_prefix, gif_search_username=_gif_search_username, venue_search_username=_venue_search_username, img_search_username=_img_search_username, static_maps_provider=_static_maps_provider, suggested_lang_code=_suggested_lang_code, lang_pack_version=_lang_pack_version, base_lang_pack_version=_base_lang_pack_version, reactions_default=_reactions_default, autologin_token=_autologin_token)
+
+TypeConfig = Config
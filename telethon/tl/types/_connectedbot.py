@@ -0,0 +1,51 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBusinessBotRecipients, TypeBusinessBotRights
+
+
+
+class ConnectedBot(TLObject):
+    CONSTRUCTOR_ID = 0xcd64636c
+    SUBCLASS_OF_ID = 0x35e81b9e
+    __slots__ = ('bot_id', 'recipients', 'rights')
+
+    def __init__(self, bot_id: int, recipients: 'TypeBusinessBotRecipients', rights: 'TypeBusinessBotRights'):
+        """
+        Constructor for ConnectedBot: Instance of ConnectedBot.
+        """
+        self.bot_id = bot_id
+        self.recipients = recipients
+        self.rights = rights
+
+    def to_dict(self):
+        return {
+            '_': 'ConnectedBot',
+            'bot_id': self.bot_id,
+            'recipients': self.recipients.to_dict() if isinstance(self.recipients, TLObject) else self.recipients,
+            'rights': self.rights.to_dict() if isinstance(self.rights, TLObject) else self.rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'lcd\xcd',
+            _struct_Iq.pack(0, self.bot_id),
+            self.recipients._bytes(),
+            self.rights._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _bot_id = reader.read_struct(_struct_iq)
+        _recipients = reader.tgread_object()
+        _rights = reader.tgread_object()
+        return cls(bot_id=_bot_id, recipients=_recipients, rights=_rights)
+
+TypeConnectedBot = ConnectedBot
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+_struct_qq = struct.Struct('<qq')
+
+
+class ConnectedBotStarRef(TLObject):
+    CONSTRUCTOR_ID = 0x19a13f71
+    SUBCLASS_OF_ID = 0xa0528f8c
+    __slots__ = ('url', 'date', 'bot_id', 'commission_permille', 'participants', 'revenue', 'revoked', 'duration_months')
+
+    def __init__(self, url: str, date: Optional[datetime], bot_id: int, commission_permille: int, participants: int, revenue: int, revoked: Optional[bool]=None, duration_months: Optional[int]=None):
+        """
+        Constructor for ConnectedBotStarRef: Instance of ConnectedBotStarRef.
+        """
+        self.url = url
+        self.date = date
+        self.bot_id = bot_id
+        self.commission_permille = commission_permille
+        self.participants = participants
+        self.revenue = revenue
+        self.revoked = revoked
+        self.duration_months = duration_months
+
+    def to_dict(self):
+        return {
+            '_': 'ConnectedBotStarRef',
+            'url': self.url,
+            'date': self.date,
+            'bot_id': self.bot_id,
+            'commission_permille': self.commission_permille,
+            'participants': self.participants,
+            'revenue': self.revenue,
+            'revoked': self.revoked,
+            'duration_months': self.duration_months
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'q?\xa1\x19',
+            struct.pack('<I', (0 if self.revoked is None or self.revoked is False else 2) | (0 if self.duration_months is None or self.duration_months is False else 1)),
+            self.serialize_bytes(self.url),
+            self.serialize_datetime(self.date),
+            _struct_qi.pack(self.bot_id, self.commission_permille),
+            b'' if self.duration_months is None or self.duration_months is False else (struct.pack('<i', self.duration_months)),
+            _struct_qq.pack(self.participants, self.revenue),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _revoked = bool(flags & 2)
+        _url = reader.tgread_string()
+        _date = reader.tgread_date()
+        _bot_id, _commission_permille = reader.read_struct(_struct_qi)
+        if flags & 1:
+            _duration_months = reader.read_int()
+        else:
+            _duration_months = None
+        _participants, _revenue = reader.read_struct(_struct_qq)
+        return cls(url=_url, date=_date, bot_id=_bot_id, commission_permille=_commission_permille, participants=_participants, revenue=_revenue, revoked=_revoked, duration_months=_duration_months)
+
+TypeConnectedBotStarRef = ConnectedBotStarRef
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class Contact(TLObject):
+    CONSTRUCTOR_ID = 0x145ade0b
+    SUBCLASS_OF_ID = 0x83dfdfa4
+    __slots__ = ('user_id', 'mutual')
+
+    def __init__(self, user_id: int, mutual: bool):
+        """
+        Constructor for Contact: Instance of Contact.
+        """
+        self.user_id = user_id
+        self.mutual = mutual
+
+    def to_dict(self):
+        return {
+            '_': 'Contact',
+            'user_id': self.user_id,
+            'mutual': self.mutual
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\xdeZ\x14',
+            struct.pack('<q', self.user_id),
+            b'\xb5ur\x99' if self.mutual else b'7\x97y\xbc',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.read_long()
+        _mutual = reader.tgread_bool()
+        return cls(user_id=_user_id, mutual=_mutual)
+
+TypeContact = Contact
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBirthday
+
+
+
+class ContactBirthday(TLObject):
+    CONSTRUCTOR_ID = 0x1d998733
+    SUBCLASS_OF_ID = 0xd8dd2806
+    __slots__ = ('contact_id', 'birthday')
+
+    def __init__(self, contact_id: int, birthday: 'TypeBirthday'):
+        """
+        Constructor for ContactBirthday: Instance of ContactBirthday.
+        """
+        self.contact_id = contact_id
+        self.birthday = birthday
+
+    def to_dict(self):
+        return {
+            '_': 'ContactBirthday',
+            'contact_id': self.contact_id,
+            'birthday': self.birthday.to_dict() if isinstance(self.birthday, TLObject) else self.birthday
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'3\x87\x99\x1d',
+            struct.pack('<q', self.contact_id),
+            self.birthday._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _contact_id = reader.read_long()
+        _birthday = reader.tgread_object()
+        return cls(contact_id=_contact_id, birthday=_birthday)
+
+TypeContactBirthday = ContactBirthday
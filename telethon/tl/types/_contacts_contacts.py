@@ -0,0 +1,77 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeContact, TypeUser
+
+
+
+class Contacts(TLObject):
+    CONSTRUCTOR_ID = 0xeae87e42
+    SUBCLASS_OF_ID = 0x38be25f6
+    __slots__ = ('contacts', 'saved_count', 'users')
+
+    def __init__(self, contacts: List['TypeContact'], saved_count: int, users: List['TypeUser']):
+        """
+        Constructor for contacts.Contacts: Instance of either ContactsNotModified, Contacts.
+        """
+        self.contacts = contacts
+        self.saved_count = saved_count
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'Contacts',
+            'contacts': [] if self.contacts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.contacts],
+            'saved_count': self.saved_count,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'B~\xe8\xea',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.contacts)),b''.join(x._bytes() for x in self.contacts),
+            struct.pack('<i', self.saved_count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _contacts = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _contacts.append(_x)
+
+        _saved_count = reader.read_int()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(contacts=_contacts, saved_count=_saved_count, users=_users)
+
+
+class ContactsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xb74ba9d2
+    SUBCLASS_OF_ID = 0x38be25f6
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ContactsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd2\xa9K\xb7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
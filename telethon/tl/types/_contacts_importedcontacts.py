@@ -0,0 +1,67 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeImportedContact, TypePopularContact, TypeUser
+
+
+
+class ImportedContacts(TLObject):
+    CONSTRUCTOR_ID = 0x77d01c3b
+    SUBCLASS_OF_ID = 0x8172ad93
+    __slots__ = ('imported', 'popular_invites', 'retry_contacts', 'users')
+
+    def __init__(self, imported: List['TypeImportedContact'], popular_invites: List['TypePopularContact'], retry_contacts: List[int], users: List['TypeUser']):
+        """
+        Constructor for contacts.ImportedContacts: Instance of ImportedContacts.
+        """
+        self.imported = imported
+        self.popular_invites = popular_invites
+        self.retry_contacts = retry_contacts
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ImportedContacts',
+            'imported': [] if self.imported is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.imported],
+            'popular_invites': [] if self.popular_invites is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.popular_invites],
+            'retry_contacts': [] if self.retry_contacts is None else self.retry_contacts[:],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';\x1c\xd0w',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.imported)),b''.join(x._bytes() for x in self.imported),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.popular_invites)),b''.join(x._bytes() for x in self.popular_invites),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.retry_contacts)), len(self.retry_contacts), *self.retry_contacts),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _imported = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _imported.append(_x)
+
+        reader.read_int()
+        _popular_invites = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _popular_invites.append(_x)
+
+        reader.read_int()
+        _retry_contacts = reader.read_array('q', reader.read_int())
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(imported=_imported, popular_invites=_popular_invites, retry_contacts=_retry_contacts, users=_users)
+
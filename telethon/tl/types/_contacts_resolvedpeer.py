@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypePeer, TypeUser
+
+
+
+class ResolvedPeer(TLObject):
+    CONSTRUCTOR_ID = 0x7f077ad9
+    SUBCLASS_OF_ID = 0xf065b3a8
+    __slots__ = ('peer', 'chats', 'users')
+
+    def __init__(self, peer: 'TypePeer', chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for contacts.ResolvedPeer: Instance of ResolvedPeer.
+        """
+        self.peer = peer
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ResolvedPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9z\x07\x7f',
+            self.peer._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(peer=_peer, chats=_chats, users=_users)
+
@@ -0,0 +1,82 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeSponsoredPeer, TypeUser
+
+
+
+class SponsoredPeers(TLObject):
+    CONSTRUCTOR_ID = 0xeb032884
+    SUBCLASS_OF_ID = 0xb45d5ccc
+    __slots__ = ('peers', 'chats', 'users')
+
+    def __init__(self, peers: List['TypeSponsoredPeer'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for contacts.SponsoredPeers: Instance of either SponsoredPeersEmpty, SponsoredPeers.
+        """
+        self.peers = peers
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredPeers',
+            'peers': [] if self.peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peers],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x84(\x03\xeb',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peers)),b''.join(x._bytes() for x in self.peers),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _peers.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(peers=_peers, chats=_chats, users=_users)
+
+
+class SponsoredPeersEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xea32b4b1
+    SUBCLASS_OF_ID = 0xb45d5ccc
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredPeersEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb1\xb42\xea',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,102 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeTopPeerCategoryPeers, TypeUser
+
+
+
+class TopPeers(TLObject):
+    CONSTRUCTOR_ID = 0x70b772a8
+    SUBCLASS_OF_ID = 0x9ee8bb88
+    __slots__ = ('categories', 'chats', 'users')
+
+    def __init__(self, categories: List['TypeTopPeerCategoryPeers'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for contacts.TopPeers: Instance of either TopPeersNotModified, TopPeers, TopPeersDisabled.
+        """
+        self.categories = categories
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeers',
+            'categories': [] if self.categories is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.categories],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa8r\xb7p',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.categories)),b''.join(x._bytes() for x in self.categories),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _categories = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _categories.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(categories=_categories, chats=_chats, users=_users)
+
+
+class TopPeersDisabled(TLObject):
+    CONSTRUCTOR_ID = 0xb52c939d
+    SUBCLASS_OF_ID = 0x9ee8bb88
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeersDisabled'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9d\x93,\xb5',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeersNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xde266ef5
+    SUBCLASS_OF_ID = 0x9ee8bb88
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeersNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf5n&\xde',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUserStatus
+
+
+
+class ContactStatus(TLObject):
+    CONSTRUCTOR_ID = 0x16d9703b
+    SUBCLASS_OF_ID = 0x68c0d74c
+    __slots__ = ('user_id', 'status')
+
+    def __init__(self, user_id: int, status: 'TypeUserStatus'):
+        """
+        Constructor for ContactStatus: Instance of ContactStatus.
+        """
+        self.user_id = user_id
+        self.status = status
+
+    def to_dict(self):
+        return {
+            '_': 'ContactStatus',
+            'user_id': self.user_id,
+            'status': self.status.to_dict() if isinstance(self.status, TLObject) else self.status
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';p\xd9\x16',
+            struct.pack('<q', self.user_id),
+            self.status._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.read_long()
+        _status = reader.tgread_object()
+        return cls(user_id=_user_id, status=_status)
+
+TypeContactStatus = ContactStatus
@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class DataJSON(TLObject):
+    CONSTRUCTOR_ID = 0x7d748d04
+    SUBCLASS_OF_ID = 0xad0352e8
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        Constructor for DataJSON: Instance of DataJSON.
+        """
+        self.data = data
+
+    def to_dict(self):
+        return {
+            '_': 'DataJSON',
+            'data': self.data
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x04\x8dt}',
+            self.serialize_bytes(self.data),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _data = reader.tgread_string()
+        return cls(data=_data)
+
+TypeDataJSON = DataJSON
@@ -0,0 +1,74 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+
+
+class DcOption(TLObject):
+    CONSTRUCTOR_ID = 0x18b7a10d
+    SUBCLASS_OF_ID = 0x9e43e123
+    __slots__ = ('id', 'ip_address', 'port', 'ipv6', 'media_only', 'tcpo_only', 'cdn', 'static', 'this_port_only', 'secret')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, ip_address: str, port: int, ipv6: Optional[bool]=None, media_only: Optional[bool]=None, tcpo_only: Optional[bool]=None, cdn: Optional[bool]=None, static: Optional[bool]=None, this_port_only: Optional[bool]=None, secret: Optional[bytes]=None):
+        """
+        Constructor for DcOption: Instance of DcOption.
+        """
+        self.id = id
+        self.ip_address = ip_address
+        self.port = port
+        self.ipv6 = ipv6
+        self.media_only = media_only
+        self.tcpo_only = tcpo_only
+        self.cdn = cdn
+        self.static = static
+        self.this_port_only = this_port_only
+        self.secret = secret
+
+    def to_dict(self):
+        return {
+            '_': 'DcOption',
+            'id': self.id,
+            'ip_address': self.ip_address,
+            'port': self.port,
+            'ipv6': self.ipv6,
+            'media_only': self.media_only,
+            'tcpo_only': self.tcpo_only,
+            'cdn': self.cdn,
+            'static': self.static,
+            'this_port_only': self.this_port_only,
+            'secret': self.secret
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r\xa1\xb7\x18',
+            _struct_Ii.pack((0 if self.ipv6 is None or self.ipv6 is False else 1) | (0 if self.media_only is None or self.media_only is False else 2) | (0 if self.tcpo_only is None or self.tcpo_only is False else 4) | (0 if self.cdn is None or self.cdn is False else 8) | (0 if self.static is None or self.static is False else 16) | (0 if self.this_port_only is None or self.this_port_only is False else 32) | (0 if self.secret is None or self.secret is False else 1024), self.id),
+            self.serialize_bytes(self.ip_address),
+            struct.pack('<i', self.port),
+            b'' if self.secret is None or self.secret is False else (self.serialize_bytes(self.secret)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _ipv6 = bool(flags & 1)
+        _media_only = bool(flags & 2)
+        _tcpo_only = bool(flags & 4)
+        _cdn = bool(flags & 8)
+        _static = bool(flags & 16)
+        _this_port_only = bool(flags & 32)
+        _ip_address = reader.tgread_string()
+        _port = reader.read_int()
+        if flags & 1024:
+            _secret = reader.tgread_bytes()
+        else:
+            _secret = None
+        return cls(id=_id, ip_address=_ip_address, port=_port, ipv6=_ipv6, media_only=_media_only, tcpo_only=_tcpo_only, cdn=_cdn, static=_static, this_port_only=_this_port_only, secret=_secret)
+
+TypeDcOption = DcOption
@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class DefaultHistoryTTL(TLObject):
+    CONSTRUCTOR_ID = 0x43b46b20
+    SUBCLASS_OF_ID = 0xf00d3367
+    __slots__ = ('period',)
+
+    def __init__(self, period: int):
+        """
+        Constructor for DefaultHistoryTTL: Instance of DefaultHistoryTTL.
+        """
+        self.period = period
+
+    def to_dict(self):
+        return {
+            '_': 'DefaultHistoryTTL',
+            'period': self.period
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b' k\xb4C',
+            struct.pack('<i', self.period),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _period = reader.read_int()
+        return cls(period=_period)
+
+TypeDefaultHistoryTTL = DefaultHistoryTTL
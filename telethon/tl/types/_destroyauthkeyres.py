@@ -0,0 +1,68 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class DestroyAuthKeyFail(TLObject):
+    CONSTRUCTOR_ID = 0xea109b13
+    SUBCLASS_OF_ID = 0x8291e68e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'DestroyAuthKeyFail'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x13\x9b\x10\xea',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class DestroyAuthKeyNone(TLObject):
+    CONSTRUCTOR_ID = 0xa9f2259
+    SUBCLASS_OF_ID = 0x8291e68e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'DestroyAuthKeyNone'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Y"\x9f\n',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class DestroyAuthKeyOk(TLObject):
+    CONSTRUCTOR_ID = 0xf660e1d4
+    SUBCLASS_OF_ID = 0x8291e68e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'DestroyAuthKeyOk'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd4\xe1`\xf6',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeDestroyAuthKeyRes = Union[DestroyAuthKeyOk,DestroyAuthKeyNone,DestroyAuthKeyFail]
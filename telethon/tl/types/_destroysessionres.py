@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class DestroySessionNone(TLObject):
+    CONSTRUCTOR_ID = 0x62d350c9
+    SUBCLASS_OF_ID = 0xaf0ce7bd
+    __slots__ = ('session_id',)
+
+    def __init__(self, session_id: int):
+        """
+        Constructor for DestroySessionRes: Instance of either DestroySessionOk, DestroySessionNone.
+        """
+        self.session_id = session_id
+
+    def to_dict(self):
+        return {
+            '_': 'DestroySessionNone',
+            'session_id': self.session_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9P\xd3b',
+            struct.pack('<q', self.session_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _session_id = reader.read_long()
+        return cls(session_id=_session_id)
+
+
+class DestroySessionOk(TLObject):
+    CONSTRUCTOR_ID = 0xe22045fc
+    SUBCLASS_OF_ID = 0xaf0ce7bd
+    __slots__ = ('session_id',)
+
+    def __init__(self, session_id: int):
+        """
+        Constructor for DestroySessionRes: Instance of either DestroySessionOk, DestroySessionNone.
+        """
+        self.session_id = session_id
+
+    def to_dict(self):
+        return {
+            '_': 'DestroySessionOk',
+            'session_id': self.session_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfcE \xe2',
+            struct.pack('<q', self.session_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _session_id = reader.read_long()
+        return cls(session_id=_session_id)
+
+TypeDestroySessionRes = Union[DestroySessionOk,DestroySessionNone]
@@ -0,0 +1,152 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iiiii = struct.Struct('<iiiii')
+_struct_iiiiii = struct.Struct('<iiiiii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDraftMessage, TypeFolder, TypePeer, TypePeerNotifySettings
+
+
+
+class Dialog(TLObject):
+    CONSTRUCTOR_ID = 0xd58a08c6
+    SUBCLASS_OF_ID = 0x42cddd54
+    __slots__ = ('peer', 'top_message', 'read_inbox_max_id', 'read_outbox_max_id', 'unread_count', 'unread_mentions_count', 'unread_reactions_count', 'notify_settings', 'pinned', 'unread_mark', 'view_forum_as_messages', 'pts', 'draft', 'folder_id', 'ttl_period')
+
+    def __init__(self, peer: 'TypePeer', top_message: int, read_inbox_max_id: int, read_outbox_max_id: int, unread_count: int, unread_mentions_count: int, unread_reactions_count: int, notify_settings: 'TypePeerNotifySettings', pinned: Optional[bool]=None, unread_mark: Optional[bool]=None, view_forum_as_messages: Optional[bool]=None, pts: Optional[int]=None, draft: Optional['TypeDraftMessage']=None, folder_id: Optional[int]=None, ttl_period: Optional[int]=None):
+        """
+        Constructor for Dialog: Instance of either Dialog, DialogFolder.
+        """
+        self.peer = peer
+        self.top_message = top_message
+        self.read_inbox_max_id = read_inbox_max_id
+        self.read_outbox_max_id = read_outbox_max_id
+        self.unread_count = unread_count
+        self.unread_mentions_count = unread_mentions_count
+        self.unread_reactions_count = unread_reactions_count
+        self.notify_settings = notify_settings
+        self.pinned = pinned
+        self.unread_mark = unread_mark
+        self.view_forum_as_messages = view_forum_as_messages
+        self.pts = pts
+        self.draft = draft
+        self.folder_id = folder_id
+        self.ttl_period = ttl_period
+
+    def to_dict(self):
+        return {
+            '_': 'Dialog',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'top_message': self.top_message,
+            'read_inbox_max_id': self.read_inbox_max_id,
+            'read_outbox_max_id': self.read_outbox_max_id,
+            'unread_count': self.unread_count,
+            'unread_mentions_count': self.unread_mentions_count,
+            'unread_reactions_count': self.unread_reactions_count,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'pinned': self.pinned,
+            'unread_mark': self.unread_mark,
+            'view_forum_as_messages': self.view_forum_as_messages,
+            'pts': self.pts,
+            'draft': self.draft.to_dict() if isinstance(self.draft, TLObject) else self.draft,
+            'folder_id': self.folder_id,
+            'ttl_period': self.ttl_period
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc6\x08\x8a\xd5',
+            struct.pack('<I', (0 if self.pinned is None or self.pinned is False else 4) | (0 if self.unread_mark is None or self.unread_mark is False else 8) | (0 if self.view_forum_as_messages is None or self.view_forum_as_messages is False else 64) | (0 if self.pts is None or self.pts is False else 1) | (0 if self.draft is None or self.draft is False else 2) | (0 if self.folder_id is None or self.folder_id is False else 16) | (0 if self.ttl_period is None or self.ttl_period is False else 32)),
+            self.peer._bytes(),
+            _struct_iiiiii.pack(self.top_message, self.read_inbox_max_id, self.read_outbox_max_id, self.unread_count, self.unread_mentions_count, self.unread_reactions_count),
+            self.notify_settings._bytes(),
+            b'' if self.pts is None or self.pts is False else (struct.pack('<i', self.pts)),
+            b'' if self.draft is None or self.draft is False else (self.draft._bytes()),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _pinned = bool(flags & 4)
+        _unread_mark = bool(flags & 8)
+        _view_forum_as_messages = bool(flags & 64)
+        _peer = reader.tgread_object()
+        _top_message, _read_inbox_max_id, _read_outbox_max_id, _unread_count, _unread_mentions_count, _unread_reactions_count = reader.read_struct(_struct_iiiiii)
+        _notify_settings = reader.tgread_object()
+        if flags & 1:
+            _pts = reader.read_int()
+        else:
+            _pts = None
+        if flags & 2:
+            _draft = reader.tgread_object()
+        else:
+            _draft = None
+        if flags & 16:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        if flags & 32:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        return cls(peer=_peer, top_message=_top_message, read_inbox_max_id=_read_inbox_max_id, read_outbox_max_id=_read_outbox_max_id, unread_count=_unread_count, unread_mentions_count=_unread_mentions_count, unread_reactions_count=_unread_reactions_count, notify_settings=_notify_settings, pinned=_pinned, unread_mark=_unread_mark, view_forum_as_messages=_view_forum_as_messages, pts=_pts, draft=_draft, folder_id=_folder_id, ttl_period=_ttl_period)
+
+
+class DialogFolder(TLObject):
+    CONSTRUCTOR_ID = 0x71bd134c
+    SUBCLASS_OF_ID = 0x42cddd54
+    __slots__ = ('folder', 'peer', 'top_message', 'unread_muted_peers_count', 'unread_unmuted_peers_count', 'unread_muted_messages_count', 'unread_unmuted_messages_count', 'pinned')
+
+    def __init__(self, folder: 'TypeFolder', peer: 'TypePeer', top_message: int, unread_muted_peers_count: int, unread_unmuted_peers_count: int, unread_muted_messages_count: int, unread_unmuted_messages_count: int, pinned: Optional[bool]=None):
+        """
+        Constructor for Dialog: Instance of either Dialog, DialogFolder.
+        """
+        self.folder = folder
+        self.peer = peer
+        self.top_message = top_message
+        self.unread_muted_peers_count = unread_muted_peers_count
+        self.unread_unmuted_peers_count = unread_unmuted_peers_count
+        self.unread_muted_messages_count = unread_muted_messages_count
+        self.unread_unmuted_messages_count = unread_unmuted_messages_count
+        self.pinned = pinned
+
+    def to_dict(self):
+        return {
+            '_': 'DialogFolder',
+            'folder': self.folder.to_dict() if isinstance(self.folder, TLObject) else self.folder,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'top_message': self.top_message,
+            'unread_muted_peers_count': self.unread_muted_peers_count,
+            'unread_unmuted_peers_count': self.unread_unmuted_peers_count,
+            'unread_muted_messages_count': self.unread_muted_messages_count,
+            'unread_unmuted_messages_count': self.unread_unmuted_messages_count,
+            'pinned': self.pinned
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'L\x13\xbdq',
+            struct.pack('<I', (0 if self.pinned is None or self.pinned is False else 4)),
+            self.folder._bytes(),
+            self.peer._bytes(),
+            _struct_iiiii.pack(self.top_message, self.unread_muted_peers_count, self.unread_unmuted_peers_count, self.unread_muted_messages_count, self.unread_unmuted_messages_count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _pinned = bool(flags & 4)
+        _folder = reader.tgread_object()
+        _peer = reader.tgread_object()
+        _top_message, _unread_muted_peers_count, _unread_unmuted_peers_count, _unread_muted_messages_count, _unread_unmuted_messages_count = reader.read_struct(_struct_iiiii)
+        return cls(folder=_folder, peer=_peer, top_message=_top_message, unread_muted_peers_count=_unread_muted_peers_count, unread_unmuted_peers_count=_unread_unmuted_peers_count, unread_muted_messages_count=_unread_muted_messages_count, unread_unmuted_messages_count=_unread_unmuted_messages_count, pinned=_pinned)
+
+TypeDialog = Union[Dialog,DialogFolder]
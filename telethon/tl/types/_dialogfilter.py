@@ -0,0 +1,208 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer, TypeTextWithEntities
+
+
+
+class DialogFilter(TLObject):
+    CONSTRUCTOR_ID = 0xaa472651
+    SUBCLASS_OF_ID = 0x692bc457
+    __slots__ = ('id', 'title', 'pinned_peers', 'include_peers', 'exclude_peers', 'contacts', 'non_contacts', 'groups', 'broadcasts', 'bots', 'exclude_muted', 'exclude_read', 'exclude_archived', 'title_noanimate', 'emoticon', 'color')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, title: 'TypeTextWithEntities', pinned_peers: List['TypeInputPeer'], include_peers: List['TypeInputPeer'], exclude_peers: List['TypeInputPeer'], contacts: Optional[bool]=None, non_contacts: Optional[bool]=None, groups: Optional[bool]=None, broadcasts: Optional[bool]=None, bots: Optional[bool]=None, exclude_muted: Optional[bool]=None, exclude_read: Optional[bool]=None, exclude_archived: Optional[bool]=None, title_noanimate: Optional[bool]=None, emoticon: Optional[str]=None, color: Optional[int]=None):
+        """
+        Constructor for DialogFilter: Instance of either DialogFilter, DialogFilterDefault, DialogFilterChatlist.
+        """
+        self.id = id
+        self.title = title
+        self.pinned_peers = pinned_peers
+        self.include_peers = include_peers
+        self.exclude_peers = exclude_peers
+        self.contacts = contacts
+        self.non_contacts = non_contacts
+        self.groups = groups
+        self.broadcasts = broadcasts
+        self.bots = bots
+        self.exclude_muted = exclude_muted
+        self.exclude_read = exclude_read
+        self.exclude_archived = exclude_archived
+        self.title_noanimate = title_noanimate
+        self.emoticon = emoticon
+        self.color = color
+
+    def to_dict(self):
+        return {
+            '_': 'DialogFilter',
+            'id': self.id,
+            'title': self.title.to_dict() if isinstance(self.title, TLObject) else self.title,
+            'pinned_peers': [] if self.pinned_peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.pinned_peers],
+            'include_peers': [] if self.include_peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.include_peers],
+            'exclude_peers': [] if self.exclude_peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.exclude_peers],
+            'contacts': self.contacts,
+            'non_contacts': self.non_contacts,
+            'groups': self.groups,
+            'broadcasts': self.broadcasts,
+            'bots': self.bots,
+            'exclude_muted': self.exclude_muted,
+            'exclude_read': self.exclude_read,
+            'exclude_archived': self.exclude_archived,
+            'title_noanimate': self.title_noanimate,
+            'emoticon': self.emoticon,
+            'color': self.color
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Q&G\xaa',
+            _struct_Ii.pack((0 if self.contacts is None or self.contacts is False else 1) | (0 if self.non_contacts is None or self.non_contacts is False else 2) | (0 if self.groups is None or self.groups is False else 4) | (0 if self.broadcasts is None or self.broadcasts is False else 8) | (0 if self.bots is None or self.bots is False else 16) | (0 if self.exclude_muted is None or self.exclude_muted is False else 2048) | (0 if self.exclude_read is None or self.exclude_read is False else 4096) | (0 if self.exclude_archived is None or self.exclude_archived is False else 8192) | (0 if self.title_noanimate is None or self.title_noanimate is False else 268435456) | (0 if self.emoticon is None or self.emoticon is False else 33554432) | (0 if self.color is None or self.color is False else 134217728), self.id),
+            self.title._bytes(),
+            b'' if self.emoticon is None or self.emoticon is False else (self.serialize_bytes(self.emoticon)),
+            b'' if self.color is None or self.color is False else (struct.pack('<i', self.color)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.pinned_peers)),b''.join(x._bytes() for x in self.pinned_peers),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.include_peers)),b''.join(x._bytes() for x in self.include_peers),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.exclude_peers)),b''.join(x._bytes() for x in self.exclude_peers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _contacts = bool(flags & 1)
+        _non_contacts = bool(flags & 2)
+        _groups = bool(flags & 4)
+        _broadcasts = bool(flags & 8)
+        _bots = bool(flags & 16)
+        _exclude_muted = bool(flags & 2048)
+        _exclude_read = bool(flags & 4096)
+        _exclude_archived = bool(flags & 8192)
+        _title_noanimate = bool(flags & 268435456)
+        _title = reader.tgread_object()
+        if flags & 33554432:
+            _emoticon = reader.tgread_string()
+        else:
+            _emoticon = None
+        if flags & 134217728:
+            _color = reader.read_int()
+        else:
+            _color = None
+        reader.read_int()
+        _pinned_peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _pinned_peers.append(_x)
+
+        reader.read_int()
+        _include_peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _include_peers.append(_x)
+
+        reader.read_int()
+        _exclude_peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _exclude_peers.append(_x)
+
+        return cls(id=_id, title=_title, pinned_peers=_pinned_peers, include_peers=_include_peers, exclude_peers=_exclude_peers, contacts=_contacts, non_contacts=_non_contacts, groups=_groups, broadcasts=_broadcasts, bots=_bots, exclude_muted=_exclude_muted, exclude_read=_exclude_read, exclude_archived=_exclude_archived, title_noanimate=_title_noanimate, emoticon=_emoticon, color=_color)
+
+
+class DialogFilterChatlist(TLObject):
+    CONSTRUCTOR_ID = 0x96537bd7
+    SUBCLASS_OF_ID = 0x692bc457
+    __slots__ = ('id', 'title', 'pinned_peers', 'include_peers', 'has_my_invites', 'title_noanimate', 'emoticon', 'color')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, title: 'TypeTextWithEntities', pinned_peers: List['TypeInputPeer'], include_peers: List['TypeInputPeer'], has_my_invites: Optional[bool]=None, title_noanimate: Optional[bool]=None, emoticon: Optional[str]=None, color: Optional[int]=None):
+        """
+        Constructor for DialogFilter: Instance of either DialogFilter, DialogFilterDefault, DialogFilterChatlist.
+        """
+        self.id = id
+        self.title = title
+        self.pinned_peers = pinned_peers
+        self.include_peers = include_peers
+        self.has_my_invites = has_my_invites
+        self.title_noanimate = title_noanimate
+        self.emoticon = emoticon
+        self.color = color
+
+    def to_dict(self):
+        return {
+            '_': 'DialogFilterChatlist',
+            'id': self.id,
+            'title': self.title.to_dict() if isinstance(self.title, TLObject) else self.title,
+            'pinned_peers': [] if self.pinned_peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.pinned_peers],
+            'include_peers': [] if self.include_peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.include_peers],
+            'has_my_invites': self.has_my_invites,
+            'title_noanimate': self.title_noanimate,
+            'emoticon': self.emoticon,
+            'color': self.color
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd7{S\x96',
+            _struct_Ii.pack((0 if self.has_my_invites is None or self.has_my_invites is False else 67108864) | (0 if self.title_noanimate is None or self.title_noanimate is False else 268435456) | (0 if self.emoticon is None or self.emoticon is False else 33554432) | (0 if self.color is None or self.color is False else 134217728), self.id),
+            self.title._bytes(),
+            b'' if self.emoticon is None or self.emoticon is False else (self.serialize_bytes(self.emoticon)),
+            b'' if self.color is None or self.color is False else (struct.pack('<i', self.color)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.pinned_peers)),b''.join(x._bytes() for x in self.pinned_peers),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.include_peers)),b''.join(x._bytes() for x in self.include_peers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _has_my_invites = bool(flags & 67108864)
+        _title_noanimate = bool(flags & 268435456)
+        _title = reader.tgread_object()
+        if flags & 33554432:
+            _emoticon = reader.tgread_string()
+        else:
+            _emoticon = None
+        if flags & 134217728:
+            _color = reader.read_int()
+        else:
+            _color = None
+        reader.read_int()
+        _pinned_peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _pinned_peers.append(_x)
+
+        reader.read_int()
+        _include_peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _include_peers.append(_x)
+
+        return cls(id=_id, title=_title, pinned_peers=_pinned_peers, include_peers=_include_peers, has_my_invites=_has_my_invites, title_noanimate=_title_noanimate, emoticon=_emoticon, color=_color)
+
+
+class DialogFilterDefault(TLObject):
+    CONSTRUCTOR_ID = 0x363293ae
+    SUBCLASS_OF_ID = 0x692bc457
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'DialogFilterDefault'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xae\x9326',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeDialogFilter = Union[DialogFilter,DialogFilterDefault,DialogFilterChatlist]
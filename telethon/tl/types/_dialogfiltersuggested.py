@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDialogFilter
+
+
+
+class DialogFilterSuggested(TLObject):
+    CONSTRUCTOR_ID = 0x77744d4a
+    SUBCLASS_OF_ID = 0x31ede086
+    __slots__ = ('filter', 'description')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, filter: 'TypeDialogFilter', description: str):
+        """
+        Constructor for DialogFilterSuggested: Instance of DialogFilterSuggested.
+        """
+        self.filter = filter
+        self.description = description
+
+    def to_dict(self):
+        return {
+            '_': 'DialogFilterSuggested',
+            'filter': self.filter.to_dict() if isinstance(self.filter, TLObject) else self.filter,
+            'description': self.description
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'JMtw',
+            self.filter._bytes(),
+            self.serialize_bytes(self.description),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _filter = reader.tgread_object()
+        _description = reader.tgread_string()
+        return cls(filter=_filter, description=_description)
+
+TypeDialogFilterSuggested = DialogFilterSuggested
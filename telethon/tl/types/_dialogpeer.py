@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class DialogPeer(TLObject):
+    CONSTRUCTOR_ID = 0xe56dbf05
+    SUBCLASS_OF_ID = 0x256ce1ae
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypePeer'):
+        """
+        Constructor for DialogPeer: Instance of either DialogPeer, DialogPeerFolder.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'DialogPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x05\xbfm\xe5',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class DialogPeerFolder(TLObject):
+    CONSTRUCTOR_ID = 0x514519e2
+    SUBCLASS_OF_ID = 0x256ce1ae
+    __slots__ = ('folder_id',)
+
+    def __init__(self, folder_id: int):
+        """
+        Constructor for DialogPeer: Instance of either DialogPeer, DialogPeerFolder.
+        """
+        self.folder_id = folder_id
+
+    def to_dict(self):
+        return {
+            '_': 'DialogPeerFolder',
+            'folder_id': self.folder_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe2\x19EQ',
+            struct.pack('<i', self.folder_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _folder_id = reader.read_int()
+        return cls(folder_id=_folder_id)
+
+TypeDialogPeer = Union[DialogPeer,DialogPeerFolder]
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class DisallowedGiftsSettings(TLObject):
+    CONSTRUCTOR_ID = 0x71f276c4
+    SUBCLASS_OF_ID = 0x382e9ab
+    __slots__ = ('disallow_unlimited_stargifts', 'disallow_limited_stargifts', 'disallow_unique_stargifts', 'disallow_premium_gifts')
+
+    def __init__(self, disallow_unlimited_stargifts: Optional[bool]=None, disallow_limited_stargifts: Optional[bool]=None, disallow_unique_stargifts: Optional[bool]=None, disallow_premium_gifts: Optional[bool]=None):
+        """
+        Constructor for DisallowedGiftsSettings: Instance of DisallowedGiftsSettings.
+        """
+        self.disallow_unlimited_stargifts = disallow_unlimited_stargifts
+        self.disallow_limited_stargifts = disallow_limited_stargifts
+        self.disallow_unique_stargifts = disallow_unique_stargifts
+        self.disallow_premium_gifts = disallow_premium_gifts
+
+    def to_dict(self):
+        return {
+            '_': 'DisallowedGiftsSettings',
+            'disallow_unlimited_stargifts': self.disallow_unlimited_stargifts,
+            'disallow_limited_stargifts': self.disallow_limited_stargifts,
+            'disallow_unique_stargifts': self.disallow_unique_stargifts,
+            'disallow_premium_gifts': self.disallow_premium_gifts
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4v\xf2q',
+            struct.pack('<I', (0 if self.disallow_unlimited_stargifts is None or self.disallow_unlimited_stargifts is False else 1) | (0 if self.disallow_limited_stargifts is None or self.disallow_limited_stargifts is False else 2) | (0 if self.disallow_unique_stargifts is None or self.disallow_unique_stargifts is False else 4) | (0 if self.disallow_premium_gifts is None or self.disallow_premium_gifts is False else 8)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _disallow_unlimited_stargifts = bool(flags & 1)
+        _disallow_limited_stargifts = bool(flags & 2)
+        _disallow_unique_stargifts = bool(flags & 4)
+        _disallow_premium_gifts = bool(flags & 8)
+        return cls(disallow_unlimited_stargifts=_disallow_unlimited_stargifts, disallow_limited_stargifts=_disallow_limited_stargifts, disallow_unique_stargifts=_disallow_unique_stargifts, disallow_premium_gifts=_disallow_premium_gifts)
+
+TypeDisallowedGiftsSettings = DisallowedGiftsSettings
@@ -0,0 +1,129 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocumentAttribute, TypePhotoSize, TypeVideoSize
+
+
+
+class Document(TLObject):
+    CONSTRUCTOR_ID = 0x8fd4c4d8
+    SUBCLASS_OF_ID = 0x211fe820
+    __slots__ = ('id', 'access_hash', 'file_reference', 'date', 'mime_type', 'size', 'dc_id', 'attributes', 'thumbs', 'video_thumbs')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, file_reference: bytes, date: Optional[datetime], mime_type: str, size: int, dc_id: int, attributes: List['TypeDocumentAttribute'], thumbs: Optional[List['TypePhotoSize']]=None, video_thumbs: Optional[List['TypeVideoSize']]=None):
+        """
+        Constructor for Document: Instance of either DocumentEmpty, Document.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.file_reference = file_reference
+        self.date = date
+        self.mime_type = mime_type
+        self.size = size
+        self.dc_id = dc_id
+        self.attributes = attributes
+        self.thumbs = thumbs
+        self.video_thumbs = video_thumbs
+
+    def to_dict(self):
+        return {
+            '_': 'Document',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'file_reference': self.file_reference,
+            'date': self.date,
+            'mime_type': self.mime_type,
+            'size': self.size,
+            'dc_id': self.dc_id,
+            'attributes': [] if self.attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.attributes],
+            'thumbs': [] if self.thumbs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.thumbs],
+            'video_thumbs': [] if self.video_thumbs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.video_thumbs]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd8\xc4\xd4\x8f',
+            _struct_Iqq.pack((0 if self.thumbs is None or self.thumbs is False else 1) | (0 if self.video_thumbs is None or self.video_thumbs is False else 2), self.id, self.access_hash),
+            self.serialize_bytes(self.file_reference),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.mime_type),
+            struct.pack('<q', self.size),
+            b'' if self.thumbs is None or self.thumbs is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.thumbs)),b''.join(x._bytes() for x in self.thumbs))),
+            b'' if self.video_thumbs is None or self.video_thumbs is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.video_thumbs)),b''.join(x._bytes() for x in self.video_thumbs))),
+            struct.pack('<i', self.dc_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.attributes)),b''.join(x._bytes() for x in self.attributes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _file_reference = reader.tgread_bytes()
+        _date = reader.tgread_date()
+        _mime_type = reader.tgread_string()
+        _size = reader.read_long()
+        if flags & 1:
+            reader.read_int()
+            _thumbs = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _thumbs.append(_x)
+
+        else:
+            _thumbs = None
+        if flags & 2:
+            reader.read_int()
+            _video_thumbs = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _video_thumbs.append(_x)
+
+        else:
+            _video_thumbs = None
+        _dc_id = reader.read_int()
+        reader.read_int()
+        _attributes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _attributes.append(_x)
+
+        return cls(id=_id, access_hash=_access_hash, file_reference=_file_reference, date=_date, mime_type=_mime_type, size=_size, dc_id=_dc_id, attributes=_attributes, thumbs=_thumbs, video_thumbs=_video_thumbs)
+
+
+class DocumentEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x36f8c871
+    SUBCLASS_OF_ID = 0x211fe820
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for Document: Instance of either DocumentEmpty, Document.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentEmpty',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'q\xc8\xf86',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
+TypeDocument = Union[DocumentEmpty,Document]
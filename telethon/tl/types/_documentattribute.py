@@ -0,0 +1,320 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Idii = struct.Struct('<Idii')
+_struct_Ii = struct.Struct('<Ii')
+_struct_idii = struct.Struct('<idii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputStickerSet, TypeMaskCoords
+
+
+
+class DocumentAttributeAnimated(TLObject):
+    CONSTRUCTOR_ID = 0x11b58939
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeAnimated'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'9\x89\xb5\x11',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class DocumentAttributeAudio(TLObject):
+    CONSTRUCTOR_ID = 0x9852f9c6
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ('duration', 'voice', 'title', 'performer', 'waveform')
+
+    def __init__(self, duration: int, voice: Optional[bool]=None, title: Optional[str]=None, performer: Optional[str]=None, waveform: Optional[bytes]=None):
+        """
+        Constructor for DocumentAttribute: Instance of either DocumentAttributeImageSize, DocumentAttributeAnimated, DocumentAttributeSticker, DocumentAttributeVideo, DocumentAttributeAudio, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeCustomEmoji.
+        """
+        self.duration = duration
+        self.voice = voice
+        self.title = title
+        self.performer = performer
+        self.waveform = waveform
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeAudio',
+            'duration': self.duration,
+            'voice': self.voice,
+            'title': self.title,
+            'performer': self.performer,
+            'waveform': self.waveform
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc6\xf9R\x98',
+            _struct_Ii.pack((0 if self.voice is None or self.voice is False else 1024) | (0 if self.title is None or self.title is False else 1) | (0 if self.performer is None or self.performer is False else 2) | (0 if self.waveform is None or self.waveform is False else 4), self.duration),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.performer is None or self.performer is False else (self.serialize_bytes(self.performer)),
+            b'' if self.waveform is None or self.waveform is False else (self.serialize_bytes(self.waveform)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _duration = reader.read_struct(_struct_ii)
+        _voice = bool(flags & 1024)
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 2:
+            _performer = reader.tgread_string()
+        else:
+            _performer = None
+        if flags & 4:
+            _waveform = reader.tgread_bytes()
+        else:
+            _waveform = None
+        return cls(duration=_duration, voice=_voice, title=_title, performer=_performer, waveform=_waveform)
+
+
+class DocumentAttributeCustomEmoji(TLObject):
+    CONSTRUCTOR_ID = 0xfd149899
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ('alt', 'stickerset', 'free', 'text_color')
+
+    def __init__(self, alt: str, stickerset: 'TypeInputStickerSet', free: Optional[bool]=None, text_color: Optional[bool]=None):
+        """
+        Constructor for DocumentAttribute: Instance of either DocumentAttributeImageSize, DocumentAttributeAnimated, DocumentAttributeSticker, DocumentAttributeVideo, DocumentAttributeAudio, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeCustomEmoji.
+        """
+        self.alt = alt
+        self.stickerset = stickerset
+        self.free = free
+        self.text_color = text_color
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeCustomEmoji',
+            'alt': self.alt,
+            'stickerset': self.stickerset.to_dict() if isinstance(self.stickerset, TLObject) else self.stickerset,
+            'free': self.free,
+            'text_color': self.text_color
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x99\x98\x14\xfd',
+            struct.pack('<I', (0 if self.free is None or self.free is False else 1) | (0 if self.text_color is None or self.text_color is False else 2)),
+            self.serialize_bytes(self.alt),
+            self.stickerset._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _free = bool(flags & 1)
+        _text_color = bool(flags & 2)
+        _alt = reader.tgread_string()
+        _stickerset = reader.tgread_object()
+        return cls(alt=_alt, stickerset=_stickerset, free=_free, text_color=_text_color)
+
+
+class DocumentAttributeFilename(TLObject):
+    CONSTRUCTOR_ID = 0x15590068
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ('file_name',)
+
+    def __init__(self, file_name: str):
+        """
+        Constructor for DocumentAttribute: Instance of either DocumentAttributeImageSize, DocumentAttributeAnimated, DocumentAttributeSticker, DocumentAttributeVideo, DocumentAttributeAudio, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeCustomEmoji.
+        """
+        self.file_name = file_name
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeFilename',
+            'file_name': self.file_name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'h\x00Y\x15',
+            self.serialize_bytes(self.file_name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _file_name = reader.tgread_string()
+        return cls(file_name=_file_name)
+
+
+class DocumentAttributeHasStickers(TLObject):
+    CONSTRUCTOR_ID = 0x9801d2f7
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeHasStickers'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf7\xd2\x01\x98',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class DocumentAttributeImageSize(TLObject):
+    CONSTRUCTOR_ID = 0x6c37c15c
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ('w', 'h')
+
+    def __init__(self, w: int, h: int):
+        """
+        Constructor for DocumentAttribute: Instance of either DocumentAttributeImageSize, DocumentAttributeAnimated, DocumentAttributeSticker, DocumentAttributeVideo, DocumentAttributeAudio, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeCustomEmoji.
+        """
+        self.w = w
+        self.h = h
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeImageSize',
+            'w': self.w,
+            'h': self.h
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\\xc17l',
+            _struct_ii.pack(self.w, self.h),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _w, _h = reader.read_struct(_struct_ii)
+        return cls(w=_w, h=_h)
+
+
+class DocumentAttributeSticker(TLObject):
+    CONSTRUCTOR_ID = 0x6319d612
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ('alt', 'stickerset', 'mask', 'mask_coords')
+
+    def __init__(self, alt: str, stickerset: 'TypeInputStickerSet', mask: Optional[bool]=None, mask_coords: Optional['TypeMaskCoords']=None):
+        """
+        Constructor for DocumentAttribute: Instance of either DocumentAttributeImageSize, DocumentAttributeAnimated, DocumentAttributeSticker, DocumentAttributeVideo, DocumentAttributeAudio, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeCustomEmoji.
+        """
+        self.alt = alt
+        self.stickerset = stickerset
+        self.mask = mask
+        self.mask_coords = mask_coords
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeSticker',
+            'alt': self.alt,
+            'stickerset': self.stickerset.to_dict() if isinstance(self.stickerset, TLObject) else self.stickerset,
+            'mask': self.mask,
+            'mask_coords': self.mask_coords.to_dict() if isinstance(self.mask_coords, TLObject) else self.mask_coords
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x12\xd6\x19c',
+            struct.pack('<I', (0 if self.mask is None or self.mask is False else 2) | (0 if self.mask_coords is None or self.mask_coords is False else 1)),
+            self.serialize_bytes(self.alt),
+            self.stickerset._bytes(),
+            b'' if self.mask_coords is None or self.mask_coords is False else (self.mask_coords._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _mask = bool(flags & 2)
+        _alt = reader.tgread_string()
+        _stickerset = reader.tgread_object()
+        if flags & 1:
+            _mask_coords = reader.tgread_object()
+        else:
+            _mask_coords = None
+        return cls(alt=_alt, stickerset=_stickerset, mask=_mask, mask_coords=_mask_coords)
+
+
+class DocumentAttributeVideo(TLObject):
+    CONSTRUCTOR_ID = 0x43c57c48
+    SUBCLASS_OF_ID = 0xf729eb9b
+    __slots__ = ('duration', 'w', 'h', 'round_message', 'supports_streaming', 'nosound', 'preload_prefix_size', 'video_start_ts', 'video_codec')
+
+    def __init__(self, duration: float, w: int, h: int, round_message: Optional[bool]=None, supports_streaming: Optional[bool]=None, nosound: Optional[bool]=None, preload_prefix_size: Optional[int]=None, video_start_ts: Optional[float]=None, video_codec: Optional[str]=None):
+        """
+        Constructor for DocumentAttribute: Instance of either DocumentAttributeImageSize, DocumentAttributeAnimated, DocumentAttributeSticker, DocumentAttributeVideo, DocumentAttributeAudio, DocumentAttributeFilename, DocumentAttributeHasStickers, DocumentAttributeCustomEmoji.
+        """
+        self.duration = duration
+        self.w = w
+        self.h = h
+        self.round_message = round_message
+        self.supports_streaming = supports_streaming
+        self.nosound = nosound
+        self.preload_prefix_size = preload_prefix_size
+        self.video_start_ts = video_start_ts
+        self.video_codec = video_codec
+
+    def to_dict(self):
+        return {
+            '_': 'DocumentAttributeVideo',
+            'duration': self.duration,
+            'w': self.w,
+            'h': self.h,
+            'round_message': self.round_message,
+            'supports_streaming': self.supports_streaming,
+            'nosound': self.nosound,
+            'preload_prefix_size': self.preload_prefix_size,
+            'video_start_ts': self.video_start_ts,
+            'video_codec': self.video_codec
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'H|\xc5C',
+            _struct_Idii.pack((0 if self.round_message is None or self.round_message is False else 1) | (0 if self.supports_streaming is None or self.supports_streaming is False else 2) | (0 if self.nosound is None or self.nosound is False else 8) | (0 if self.preload_prefix_size is None or self.preload_prefix_size is False else 4) | (0 if self.video_start_ts is None or self.video_start_ts is False else 16) | (0 if self.video_codec is None or self.video_codec is False else 32), self.duration, self.w, self.h),
+            b'' if self.preload_prefix_size is None or self.preload_prefix_size is False else (struct.pack('<i', self.preload_prefix_size)),
+            b'' if self.video_start_ts is None or self.video_start_ts is False else (struct.pack('<d', self.video_start_ts)),
+            b'' if self.video_codec is None or self.video_codec is False else (self.serialize_bytes(self.video_codec)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _duration, _w, _h = reader.read_struct(_struct_idii)
+        _round_message = bool(flags & 1)
+        _supports_streaming = bool(flags & 2)
+        _nosound = bool(flags & 8)
+        if flags & 4:
+            _preload_prefix_size = reader.read_int()
+        else:
+            _preload_prefix_size = None
+        if flags & 16:
+            _video_start_ts = reader.read_double()
+        else:
+            _video_start_ts = None
+        if flags & 32:
+            _video_codec = reader.tgread_string()
+        else:
+            _video_codec = None
+        return cls(duration=_duration, w=_w, h=_h, round_message=_round_message, supports_streaming=_supports_streaming, nosound=_nosound, preload_prefix_size=_preload_prefix_size, video_start_ts=_video_start_ts, video_codec=_video_codec)
+
+TypeDocumentAttribute = Union[DocumentAttributeImageSize,DocumentAttributeAnimated,DocumentAttributeSticker,DocumentAttributeVideo,DocumentAttributeAudio,DocumentAttributeFilename,DocumentAttributeHasStickers,DocumentAttributeCustomEmoji]
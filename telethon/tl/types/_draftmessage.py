@@ -0,0 +1,121 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputMedia, TypeInputReplyTo, TypeMessageEntity
+
+
+
+class DraftMessage(TLObject):
+    CONSTRUCTOR_ID = 0x2d65321f
+    SUBCLASS_OF_ID = 0x33d47f45
+    __slots__ = ('message', 'date', 'no_webpage', 'invert_media', 'reply_to', 'entities', 'media', 'effect')
+
+    def __init__(self, message: str, date: Optional[datetime], no_webpage: Optional[bool]=None, invert_media: Optional[bool]=None, reply_to: Optional['TypeInputReplyTo']=None, entities: Optional[List['TypeMessageEntity']]=None, media: Optional['TypeInputMedia']=None, effect: Optional[int]=None):
+        """
+        Constructor for DraftMessage: Instance of either DraftMessageEmpty, DraftMessage.
+        """
+        self.message = message
+        self.date = date
+        self.no_webpage = no_webpage
+        self.invert_media = invert_media
+        self.reply_to = reply_to
+        self.entities = entities
+        self.media = media
+        self.effect = effect
+
+    def to_dict(self):
+        return {
+            '_': 'DraftMessage',
+            'message': self.message,
+            'date': self.date,
+            'no_webpage': self.no_webpage,
+            'invert_media': self.invert_media,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'effect': self.effect
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1f2e-',
+            struct.pack('<I', (0 if self.no_webpage is None or self.no_webpage is False else 2) | (0 if self.invert_media is None or self.invert_media is False else 64) | (0 if self.reply_to is None or self.reply_to is False else 16) | (0 if self.entities is None or self.entities is False else 8) | (0 if self.media is None or self.media is False else 32) | (0 if self.effect is None or self.effect is False else 128)),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.media is None or self.media is False else (self.media._bytes()),
+            self.serialize_datetime(self.date),
+            b'' if self.effect is None or self.effect is False else (struct.pack('<q', self.effect)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _no_webpage = bool(flags & 2)
+        _invert_media = bool(flags & 64)
+        if flags & 16:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        _message = reader.tgread_string()
+        if flags & 8:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 32:
+            _media = reader.tgread_object()
+        else:
+            _media = None
+        _date = reader.tgread_date()
+        if flags & 128:
+            _effect = reader.read_long()
+        else:
+            _effect = None
+        return cls(message=_message, date=_date, no_webpage=_no_webpage, invert_media=_invert_media, reply_to=_reply_to, entities=_entities, media=_media, effect=_effect)
+
+
+class DraftMessageEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x1b0c841a
+    SUBCLASS_OF_ID = 0x33d47f45
+    __slots__ = ('date',)
+
+    def __init__(self, date: Optional[datetime]=None):
+        """
+        Constructor for DraftMessage: Instance of either DraftMessageEmpty, DraftMessage.
+        """
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'DraftMessageEmpty',
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1a\x84\x0c\x1b',
+            struct.pack('<I', (0 if self.date is None or self.date is False else 1)),
+            b'' if self.date is None or self.date is False else (self.serialize_datetime(self.date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _date = reader.tgread_date()
+        else:
+            _date = None
+        return cls(date=_date)
+
+TypeDraftMessage = Union[DraftMessageEmpty,DraftMessage]
@@ -0,0 +1,95 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EmailVerificationApple(TLObject):
+    CONSTRUCTOR_ID = 0x96d074fd
+    SUBCLASS_OF_ID = 0x241ee240
+    __slots__ = ('token',)
+
+    def __init__(self, token: str):
+        """
+        Constructor for EmailVerification: Instance of either EmailVerificationCode, EmailVerificationGoogle, EmailVerificationApple.
+        """
+        self.token = token
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerificationApple',
+            'token': self.token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfdt\xd0\x96',
+            self.serialize_bytes(self.token),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _token = reader.tgread_string()
+        return cls(token=_token)
+
+
+class EmailVerificationCode(TLObject):
+    CONSTRUCTOR_ID = 0x922e55a9
+    SUBCLASS_OF_ID = 0x241ee240
+    __slots__ = ('code',)
+
+    def __init__(self, code: str):
+        """
+        Constructor for EmailVerification: Instance of either EmailVerificationCode, EmailVerificationGoogle, EmailVerificationApple.
+        """
+        self.code = code
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerificationCode',
+            'code': self.code
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa9U.\x92',
+            self.serialize_bytes(self.code),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _code = reader.tgread_string()
+        return cls(code=_code)
+
+
+class EmailVerificationGoogle(TLObject):
+    CONSTRUCTOR_ID = 0xdb909ec2
+    SUBCLASS_OF_ID = 0x241ee240
+    __slots__ = ('token',)
+
+    def __init__(self, token: str):
+        """
+        Constructor for EmailVerification: Instance of either EmailVerificationCode, EmailVerificationGoogle, EmailVerificationApple.
+        """
+        self.token = token
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerificationGoogle',
+            'token': self.token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc2\x9e\x90\xdb',
+            self.serialize_bytes(self.token),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _token = reader.tgread_string()
+        return cls(token=_token)
+
+TypeEmailVerification = Union[EmailVerificationCode,EmailVerificationGoogle,EmailVerificationApple]
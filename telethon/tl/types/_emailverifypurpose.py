@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EmailVerifyPurposeLoginChange(TLObject):
+    CONSTRUCTOR_ID = 0x527d22eb
+    SUBCLASS_OF_ID = 0xb9686ae8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerifyPurposeLoginChange'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeb"}R',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class EmailVerifyPurposeLoginSetup(TLObject):
+    CONSTRUCTOR_ID = 0x4345be73
+    SUBCLASS_OF_ID = 0xb9686ae8
+    __slots__ = ('phone_number', 'phone_code_hash')
+
+    def __init__(self, phone_number: str, phone_code_hash: str):
+        """
+        Constructor for EmailVerifyPurpose: Instance of either EmailVerifyPurposeLoginSetup, EmailVerifyPurposeLoginChange, EmailVerifyPurposePassport.
+        """
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerifyPurposeLoginSetup',
+            'phone_number': self.phone_number,
+            'phone_code_hash': self.phone_code_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b's\xbeEC',
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.phone_code_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone_number = reader.tgread_string()
+        _phone_code_hash = reader.tgread_string()
+        return cls(phone_number=_phone_number, phone_code_hash=_phone_code_hash)
+
+
+class EmailVerifyPurposePassport(TLObject):
+    CONSTRUCTOR_ID = 0xbbf51685
+    SUBCLASS_OF_ID = 0xb9686ae8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'EmailVerifyPurposePassport'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x85\x16\xf5\xbb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeEmailVerifyPurpose = Union[EmailVerifyPurposeLoginSetup,EmailVerifyPurposeLoginChange,EmailVerifyPurposePassport]
@@ -0,0 +1,125 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EmojiGroup(TLObject):
+    CONSTRUCTOR_ID = 0x7a9abda9
+    SUBCLASS_OF_ID = 0x55e0a193
+    __slots__ = ('title', 'icon_emoji_id', 'emoticons')
+
+    def __init__(self, title: str, icon_emoji_id: int, emoticons: List[str]):
+        """
+        Constructor for EmojiGroup: Instance of either EmojiGroup, EmojiGroupGreeting, EmojiGroupPremium.
+        """
+        self.title = title
+        self.icon_emoji_id = icon_emoji_id
+        self.emoticons = emoticons
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiGroup',
+            'title': self.title,
+            'icon_emoji_id': self.icon_emoji_id,
+            'emoticons': [] if self.emoticons is None else self.emoticons[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa9\xbd\x9az',
+            self.serialize_bytes(self.title),
+            struct.pack('<q', self.icon_emoji_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.emoticons)),b''.join(self.serialize_bytes(x) for x in self.emoticons),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        _icon_emoji_id = reader.read_long()
+        reader.read_int()
+        _emoticons = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _emoticons.append(_x)
+
+        return cls(title=_title, icon_emoji_id=_icon_emoji_id, emoticons=_emoticons)
+
+
+class EmojiGroupGreeting(TLObject):
+    CONSTRUCTOR_ID = 0x80d26cc7
+    SUBCLASS_OF_ID = 0x55e0a193
+    __slots__ = ('title', 'icon_emoji_id', 'emoticons')
+
+    def __init__(self, title: str, icon_emoji_id: int, emoticons: List[str]):
+        """
+        Constructor for EmojiGroup: Instance of either EmojiGroup, EmojiGroupGreeting, EmojiGroupPremium.
+        """
+        self.title = title
+        self.icon_emoji_id = icon_emoji_id
+        self.emoticons = emoticons
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiGroupGreeting',
+            'title': self.title,
+            'icon_emoji_id': self.icon_emoji_id,
+            'emoticons': [] if self.emoticons is None else self.emoticons[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc7l\xd2\x80',
+            self.serialize_bytes(self.title),
+            struct.pack('<q', self.icon_emoji_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.emoticons)),b''.join(self.serialize_bytes(x) for x in self.emoticons),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        _icon_emoji_id = reader.read_long()
+        reader.read_int()
+        _emoticons = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _emoticons.append(_x)
+
+        return cls(title=_title, icon_emoji_id=_icon_emoji_id, emoticons=_emoticons)
+
+
+class EmojiGroupPremium(TLObject):
+    CONSTRUCTOR_ID = 0x93bcf34
+    SUBCLASS_OF_ID = 0x55e0a193
+    __slots__ = ('title', 'icon_emoji_id')
+
+    def __init__(self, title: str, icon_emoji_id: int):
+        """
+        Constructor for EmojiGroup: Instance of either EmojiGroup, EmojiGroupGreeting, EmojiGroupPremium.
+        """
+        self.title = title
+        self.icon_emoji_id = icon_emoji_id
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiGroupPremium',
+            'title': self.title,
+            'icon_emoji_id': self.icon_emoji_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'4\xcf;\t',
+            self.serialize_bytes(self.title),
+            struct.pack('<q', self.icon_emoji_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        _icon_emoji_id = reader.read_long()
+        return cls(title=_title, icon_emoji_id=_icon_emoji_id)
+
+TypeEmojiGroup = Union[EmojiGroup,EmojiGroupGreeting,EmojiGroupPremium]
@@ -0,0 +1,84 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EmojiKeyword(TLObject):
+    CONSTRUCTOR_ID = 0xd5b3b9f9
+    SUBCLASS_OF_ID = 0x6612a53e
+    __slots__ = ('keyword', 'emoticons')
+
+    def __init__(self, keyword: str, emoticons: List[str]):
+        """
+        Constructor for EmojiKeyword: Instance of either EmojiKeyword, EmojiKeywordDeleted.
+        """
+        self.keyword = keyword
+        self.emoticons = emoticons
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiKeyword',
+            'keyword': self.keyword,
+            'emoticons': [] if self.emoticons is None else self.emoticons[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf9\xb9\xb3\xd5',
+            self.serialize_bytes(self.keyword),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.emoticons)),b''.join(self.serialize_bytes(x) for x in self.emoticons),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _keyword = reader.tgread_string()
+        reader.read_int()
+        _emoticons = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _emoticons.append(_x)
+
+        return cls(keyword=_keyword, emoticons=_emoticons)
+
+
+class EmojiKeywordDeleted(TLObject):
+    CONSTRUCTOR_ID = 0x236df622
+    SUBCLASS_OF_ID = 0x6612a53e
+    __slots__ = ('keyword', 'emoticons')
+
+    def __init__(self, keyword: str, emoticons: List[str]):
+        """
+        Constructor for EmojiKeyword: Instance of either EmojiKeyword, EmojiKeywordDeleted.
+        """
+        self.keyword = keyword
+        self.emoticons = emoticons
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiKeywordDeleted',
+            'keyword': self.keyword,
+            'emoticons': [] if self.emoticons is None else self.emoticons[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'"\xf6m#',
+            self.serialize_bytes(self.keyword),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.emoticons)),b''.join(self.serialize_bytes(x) for x in self.emoticons),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _keyword = reader.tgread_string()
+        reader.read_int()
+        _emoticons = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _emoticons.append(_x)
+
+        return cls(keyword=_keyword, emoticons=_emoticons)
+
+TypeEmojiKeyword = Union[EmojiKeyword,EmojiKeywordDeleted]
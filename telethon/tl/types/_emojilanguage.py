@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EmojiLanguage(TLObject):
+    CONSTRUCTOR_ID = 0xb3fb5361
+    SUBCLASS_OF_ID = 0xa48d04ee
+    __slots__ = ('lang_code',)
+
+    def __init__(self, lang_code: str):
+        """
+        Constructor for EmojiLanguage: Instance of EmojiLanguage.
+        """
+        self.lang_code = lang_code
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiLanguage',
+            'lang_code': self.lang_code
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'aS\xfb\xb3',
+            self.serialize_bytes(self.lang_code),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _lang_code = reader.tgread_string()
+        return cls(lang_code=_lang_code)
+
+TypeEmojiLanguage = EmojiLanguage
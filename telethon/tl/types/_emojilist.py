@@ -0,0 +1,63 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EmojiList(TLObject):
+    CONSTRUCTOR_ID = 0x7a1e11d1
+    SUBCLASS_OF_ID = 0xbcef6aba
+    __slots__ = ('hash', 'document_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, document_id: List[int]):
+        """
+        Constructor for EmojiList: Instance of either EmojiListNotModified, EmojiList.
+        """
+        self.hash = hash
+        self.document_id = document_id
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiList',
+            'hash': self.hash,
+            'document_id': [] if self.document_id is None else self.document_id[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1\x11\x1ez',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.document_id)), len(self.document_id), *self.document_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _document_id = reader.read_array('q', reader.read_int())
+        return cls(hash=_hash, document_id=_document_id)
+
+
+class EmojiListNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x481eadfa
+    SUBCLASS_OF_ID = 0xbcef6aba
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiListNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfa\xad\x1eH',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeEmojiList = Union[EmojiListNotModified,EmojiList]
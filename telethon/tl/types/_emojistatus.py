@@ -0,0 +1,164 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iq = struct.Struct('<iq')
+_struct_iqq = struct.Struct('<iqq')
+_struct_qiiii = struct.Struct('<qiiii')
+
+
+class EmojiStatus(TLObject):
+    CONSTRUCTOR_ID = 0xe7ff068a
+    SUBCLASS_OF_ID = 0xf930b138
+    __slots__ = ('document_id', 'until')
+
+    def __init__(self, document_id: int, until: Optional[datetime]=None):
+        """
+        Constructor for EmojiStatus: Instance of either EmojiStatusEmpty, EmojiStatus, EmojiStatusCollectible, InputEmojiStatusCollectible.
+        """
+        self.document_id = document_id
+        self.until = until
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiStatus',
+            'document_id': self.document_id,
+            'until': self.until
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8a\x06\xff\xe7',
+            _struct_Iq.pack((0 if self.until is None or self.until is False else 1), self.document_id),
+            b'' if self.until is None or self.until is False else (self.serialize_datetime(self.until)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _document_id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _until = reader.tgread_date()
+        else:
+            _until = None
+        return cls(document_id=_document_id, until=_until)
+
+
+class EmojiStatusCollectible(TLObject):
+    CONSTRUCTOR_ID = 0x7184603b
+    SUBCLASS_OF_ID = 0xf930b138
+    __slots__ = ('collectible_id', 'document_id', 'title', 'slug', 'pattern_document_id', 'center_color', 'edge_color', 'pattern_color', 'text_color', 'until')
+
+    def __init__(self, collectible_id: int, document_id: int, title: str, slug: str, pattern_document_id: int, center_color: int, edge_color: int, pattern_color: int, text_color: int, until: Optional[datetime]=None):
+        """
+        Constructor for EmojiStatus: Instance of either EmojiStatusEmpty, EmojiStatus, EmojiStatusCollectible, InputEmojiStatusCollectible.
+        """
+        self.collectible_id = collectible_id
+        self.document_id = document_id
+        self.title = title
+        self.slug = slug
+        self.pattern_document_id = pattern_document_id
+        self.center_color = center_color
+        self.edge_color = edge_color
+        self.pattern_color = pattern_color
+        self.text_color = text_color
+        self.until = until
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiStatusCollectible',
+            'collectible_id': self.collectible_id,
+            'document_id': self.document_id,
+            'title': self.title,
+            'slug': self.slug,
+            'pattern_document_id': self.pattern_document_id,
+            'center_color': self.center_color,
+            'edge_color': self.edge_color,
+            'pattern_color': self.pattern_color,
+            'text_color': self.text_color,
+            'until': self.until
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';`\x84q',
+            _struct_Iqq.pack((0 if self.until is None or self.until is False else 1), self.collectible_id, self.document_id),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.slug),
+            _struct_qiiii.pack(self.pattern_document_id, self.center_color, self.edge_color, self.pattern_color, self.text_color),
+            b'' if self.until is None or self.until is False else (self.serialize_datetime(self.until)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _collectible_id, _document_id = reader.read_struct(_struct_iqq)
+        _title = reader.tgread_string()
+        _slug = reader.tgread_string()
+        _pattern_document_id, _center_color, _edge_color, _pattern_color, _text_color = reader.read_struct(_struct_qiiii)
+        if flags & 1:
+            _until = reader.tgread_date()
+        else:
+            _until = None
+        return cls(collectible_id=_collectible_id, document_id=_document_id, title=_title, slug=_slug, pattern_document_id=_pattern_document_id, center_color=_center_color, edge_color=_edge_color, pattern_color=_pattern_color, text_color=_text_color, until=_until)
+
+
+class EmojiStatusEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x2de11aae
+    SUBCLASS_OF_ID = 0xf930b138
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiStatusEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xae\x1a\xe1-',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputEmojiStatusCollectible(TLObject):
+    CONSTRUCTOR_ID = 0x7141dbf
+    SUBCLASS_OF_ID = 0xf930b138
+    __slots__ = ('collectible_id', 'until')
+
+    def __init__(self, collectible_id: int, until: Optional[datetime]=None):
+        """
+        Constructor for EmojiStatus: Instance of either EmojiStatusEmpty, EmojiStatus, EmojiStatusCollectible, InputEmojiStatusCollectible.
+        """
+        self.collectible_id = collectible_id
+        self.until = until
+
+    def to_dict(self):
+        return {
+            '_': 'InputEmojiStatusCollectible',
+            'collectible_id': self.collectible_id,
+            'until': self.until
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbf\x1d\x14\x07',
+            _struct_Iq.pack((0 if self.until is None or self.until is False else 1), self.collectible_id),
+            b'' if self.until is None or self.until is False else (self.serialize_datetime(self.until)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _collectible_id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _until = reader.tgread_date()
+        else:
+            _until = None
+        return cls(collectible_id=_collectible_id, until=_until)
+
+TypeEmojiStatus = Union[EmojiStatusEmpty,EmojiStatus,EmojiStatusCollectible,InputEmojiStatusCollectible]
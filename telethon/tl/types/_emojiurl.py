@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EmojiURL(TLObject):
+    CONSTRUCTOR_ID = 0xa575739d
+    SUBCLASS_OF_ID = 0x1fa08a19
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for EmojiURL: Instance of EmojiURL.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiURL',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9dsu\xa5',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
+TypeEmojiURL = EmojiURL
@@ -0,0 +1,224 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+_struct_iq = struct.Struct('<iq')
+_struct_qq = struct.Struct('<qq')
+
+
+class EncryptedChat(TLObject):
+    CONSTRUCTOR_ID = 0x61f0d4c7
+    SUBCLASS_OF_ID = 0x6d28a37a
+    __slots__ = ('id', 'access_hash', 'date', 'admin_id', 'participant_id', 'g_a_or_b', 'key_fingerprint')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, date: Optional[datetime], admin_id: int, participant_id: int, g_a_or_b: bytes, key_fingerprint: int):
+        """
+        Constructor for EncryptedChat: Instance of either EncryptedChatEmpty, EncryptedChatWaiting, EncryptedChatRequested, EncryptedChat, EncryptedChatDiscarded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.date = date
+        self.admin_id = admin_id
+        self.participant_id = participant_id
+        self.g_a_or_b = g_a_or_b
+        self.key_fingerprint = key_fingerprint
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedChat',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'date': self.date,
+            'admin_id': self.admin_id,
+            'participant_id': self.participant_id,
+            'g_a_or_b': self.g_a_or_b,
+            'key_fingerprint': self.key_fingerprint
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc7\xd4\xf0a',
+            _struct_iq.pack(self.id, self.access_hash),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.admin_id, self.participant_id),
+            self.serialize_bytes(self.g_a_or_b),
+            struct.pack('<q', self.key_fingerprint),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_iq)
+        _date = reader.tgread_date()
+        _admin_id, _participant_id = reader.read_struct(_struct_qq)
+        _g_a_or_b = reader.tgread_bytes()
+        _key_fingerprint = reader.read_long()
+        return cls(id=_id, access_hash=_access_hash, date=_date, admin_id=_admin_id, participant_id=_participant_id, g_a_or_b=_g_a_or_b, key_fingerprint=_key_fingerprint)
+
+
+class EncryptedChatDiscarded(TLObject):
+    CONSTRUCTOR_ID = 0x1e1c7c45
+    SUBCLASS_OF_ID = 0x6d28a37a
+    __slots__ = ('id', 'history_deleted')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, history_deleted: Optional[bool]=None):
+        """
+        Constructor for EncryptedChat: Instance of either EncryptedChatEmpty, EncryptedChatWaiting, EncryptedChatRequested, EncryptedChat, EncryptedChatDiscarded.
+        """
+        self.id = id
+        self.history_deleted = history_deleted
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedChatDiscarded',
+            'id': self.id,
+            'history_deleted': self.history_deleted
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'E|\x1c\x1e',
+            _struct_Ii.pack((0 if self.history_deleted is None or self.history_deleted is False else 1), self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _history_deleted = bool(flags & 1)
+        return cls(id=_id, history_deleted=_history_deleted)
+
+
+class EncryptedChatEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xab7ec0a0
+    SUBCLASS_OF_ID = 0x6d28a37a
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for EncryptedChat: Instance of either EncryptedChatEmpty, EncryptedChatWaiting, EncryptedChatRequested, EncryptedChat, EncryptedChatDiscarded.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedChatEmpty',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0\xc0~\xab',
+            struct.pack('<i', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_int()
+        return cls(id=_id)
+
+
+class EncryptedChatRequested(TLObject):
+    CONSTRUCTOR_ID = 0x48f1d94c
+    SUBCLASS_OF_ID = 0x6d28a37a
+    __slots__ = ('id', 'access_hash', 'date', 'admin_id', 'participant_id', 'g_a', 'folder_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, date: Optional[datetime], admin_id: int, participant_id: int, g_a: bytes, folder_id: Optional[int]=None):
+        """
+        Constructor for EncryptedChat: Instance of either EncryptedChatEmpty, EncryptedChatWaiting, EncryptedChatRequested, EncryptedChat, EncryptedChatDiscarded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.date = date
+        self.admin_id = admin_id
+        self.participant_id = participant_id
+        self.g_a = g_a
+        self.folder_id = folder_id
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedChatRequested',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'date': self.date,
+            'admin_id': self.admin_id,
+            'participant_id': self.participant_id,
+            'g_a': self.g_a,
+            'folder_id': self.folder_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'L\xd9\xf1H',
+            struct.pack('<I', (0 if self.folder_id is None or self.folder_id is False else 1)),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            _struct_iq.pack(self.id, self.access_hash),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.admin_id, self.participant_id),
+            self.serialize_bytes(self.g_a),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        _id, _access_hash = reader.read_struct(_struct_iq)
+        _date = reader.tgread_date()
+        _admin_id, _participant_id = reader.read_struct(_struct_qq)
+        _g_a = reader.tgread_bytes()
+        return cls(id=_id, access_hash=_access_hash, date=_date, admin_id=_admin_id, participant_id=_participant_id, g_a=_g_a, folder_id=_folder_id)
+
+
+class EncryptedChatWaiting(TLObject):
+    CONSTRUCTOR_ID = 0x66b25953
+    SUBCLASS_OF_ID = 0x6d28a37a
+    __slots__ = ('id', 'access_hash', 'date', 'admin_id', 'participant_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, date: Optional[datetime], admin_id: int, participant_id: int):
+        """
+        Constructor for EncryptedChat: Instance of either EncryptedChatEmpty, EncryptedChatWaiting, EncryptedChatRequested, EncryptedChat, EncryptedChatDiscarded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.date = date
+        self.admin_id = admin_id
+        self.participant_id = participant_id
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedChatWaiting',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'date': self.date,
+            'admin_id': self.admin_id,
+            'participant_id': self.participant_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'SY\xb2f',
+            _struct_iq.pack(self.id, self.access_hash),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.admin_id, self.participant_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_iq)
+        _date = reader.tgread_date()
+        _admin_id, _participant_id = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash, date=_date, admin_id=_admin_id, participant_id=_participant_id)
+
+TypeEncryptedChat = Union[EncryptedChatEmpty,EncryptedChatWaiting,EncryptedChatRequested,EncryptedChat,EncryptedChatDiscarded]
@@ -0,0 +1,68 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qqqii = struct.Struct('<qqqii')
+
+
+class EncryptedFile(TLObject):
+    CONSTRUCTOR_ID = 0xa8008cd8
+    SUBCLASS_OF_ID = 0x842a67c0
+    __slots__ = ('id', 'access_hash', 'size', 'dc_id', 'key_fingerprint')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, size: int, dc_id: int, key_fingerprint: int):
+        """
+        Constructor for EncryptedFile: Instance of either EncryptedFileEmpty, EncryptedFile.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.size = size
+        self.dc_id = dc_id
+        self.key_fingerprint = key_fingerprint
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedFile',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'size': self.size,
+            'dc_id': self.dc_id,
+            'key_fingerprint': self.key_fingerprint
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd8\x8c\x00\xa8',
+            _struct_qqqii.pack(self.id, self.access_hash, self.size, self.dc_id, self.key_fingerprint),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash, _size, _dc_id, _key_fingerprint = reader.read_struct(_struct_qqqii)
+        return cls(id=_id, access_hash=_access_hash, size=_size, dc_id=_dc_id, key_fingerprint=_key_fingerprint)
+
+
+class EncryptedFileEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xc21f497e
+    SUBCLASS_OF_ID = 0x842a67c0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedFileEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~I\x1f\xc2',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeEncryptedFile = Union[EncryptedFileEmpty,EncryptedFile]
@@ -0,0 +1,97 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeEncryptedFile
+
+
+
+class EncryptedMessage(TLObject):
+    CONSTRUCTOR_ID = 0xed18c118
+    SUBCLASS_OF_ID = 0x239f2e51
+    __slots__ = ('chat_id', 'date', 'bytes', 'file', 'random_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, chat_id: int, date: Optional[datetime], bytes: bytes, file: 'TypeEncryptedFile', random_id: int=None):
+        """
+        Constructor for EncryptedMessage: Instance of either EncryptedMessage, EncryptedMessageService.
+        """
+        self.chat_id = chat_id
+        self.date = date
+        self.bytes = bytes
+        self.file = file
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedMessage',
+            'chat_id': self.chat_id,
+            'date': self.date,
+            'bytes': self.bytes,
+            'file': self.file.to_dict() if isinstance(self.file, TLObject) else self.file,
+            'random_id': self.random_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x18\xc1\x18\xed',
+            _struct_qi.pack(self.random_id, self.chat_id),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.bytes),
+            self.file._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _random_id, _chat_id = reader.read_struct(_struct_qi)
+        _date = reader.tgread_date()
+        _bytes = reader.tgread_bytes()
+        _file = reader.tgread_object()
+        return cls(chat_id=_chat_id, date=_date, bytes=_bytes, file=_file, random_id=_random_id)
+
+
+class EncryptedMessageService(TLObject):
+    CONSTRUCTOR_ID = 0x23734b06
+    SUBCLASS_OF_ID = 0x239f2e51
+    __slots__ = ('chat_id', 'date', 'bytes', 'random_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, chat_id: int, date: Optional[datetime], bytes: bytes, random_id: int=None):
+        """
+        Constructor for EncryptedMessage: Instance of either EncryptedMessage, EncryptedMessageService.
+        """
+        self.chat_id = chat_id
+        self.date = date
+        self.bytes = bytes
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+
+    def to_dict(self):
+        return {
+            '_': 'EncryptedMessageService',
+            'chat_id': self.chat_id,
+            'date': self.date,
+            'bytes': self.bytes,
+            'random_id': self.random_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x06Ks#',
+            _struct_qi.pack(self.random_id, self.chat_id),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _random_id, _chat_id = reader.read_struct(_struct_qi)
+        _date = reader.tgread_date()
+        _bytes = reader.tgread_bytes()
+        return cls(chat_id=_chat_id, date=_date, bytes=_bytes, random_id=_random_id)
+
+TypeEncryptedMessage = Union[EncryptedMessage,EncryptedMessageService]
@@ -0,0 +1,136 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarsSubscriptionPricing
+
+
+
+class ChatInviteExported(TLObject):
+    CONSTRUCTOR_ID = 0xa22cbd96
+    SUBCLASS_OF_ID = 0xb4748a58
+    __slots__ = ('link', 'admin_id', 'date', 'revoked', 'permanent', 'request_needed', 'start_date', 'expire_date', 'usage_limit', 'usage', 'requested', 'subscription_expired', 'title', 'subscription_pricing')
+
+    def __init__(self, link: str, admin_id: int, date: Optional[datetime], revoked: Optional[bool]=None, permanent: Optional[bool]=None, request_needed: Optional[bool]=None, start_date: Optional[datetime]=None, expire_date: Optional[datetime]=None, usage_limit: Optional[int]=None, usage: Optional[int]=None, requested: Optional[int]=None, subscription_expired: Optional[int]=None, title: Optional[str]=None, subscription_pricing: Optional['TypeStarsSubscriptionPricing']=None):
+        """
+        Constructor for ExportedChatInvite: Instance of either ChatInviteExported, ChatInvitePublicJoinRequests.
+        """
+        self.link = link
+        self.admin_id = admin_id
+        self.date = date
+        self.revoked = revoked
+        self.permanent = permanent
+        self.request_needed = request_needed
+        self.start_date = start_date
+        self.expire_date = expire_date
+        self.usage_limit = usage_limit
+        self.usage = usage
+        self.requested = requested
+        self.subscription_expired = subscription_expired
+        self.title = title
+        self.subscription_pricing = subscription_pricing
+
+    def to_dict(self):
+        return {
+            '_': 'ChatInviteExported',
+            'link': self.link,
+            'admin_id': self.admin_id,
+            'date': self.date,
+            'revoked': self.revoked,
+            'permanent': self.permanent,
+            'request_needed': self.request_needed,
+            'start_date': self.start_date,
+            'expire_date': self.expire_date,
+            'usage_limit': self.usage_limit,
+            'usage': self.usage,
+            'requested': self.requested,
+            'subscription_expired': self.subscription_expired,
+            'title': self.title,
+            'subscription_pricing': self.subscription_pricing.to_dict() if isinstance(self.subscription_pricing, TLObject) else self.subscription_pricing
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x96\xbd,\xa2',
+            struct.pack('<I', (0 if self.revoked is None or self.revoked is False else 1) | (0 if self.permanent is None or self.permanent is False else 32) | (0 if self.request_needed is None or self.request_needed is False else 64) | (0 if self.start_date is None or self.start_date is False else 16) | (0 if self.expire_date is None or self.expire_date is False else 2) | (0 if self.usage_limit is None or self.usage_limit is False else 4) | (0 if self.usage is None or self.usage is False else 8) | (0 if self.requested is None or self.requested is False else 128) | (0 if self.subscription_expired is None or self.subscription_expired is False else 1024) | (0 if self.title is None or self.title is False else 256) | (0 if self.subscription_pricing is None or self.subscription_pricing is False else 512)),
+            self.serialize_bytes(self.link),
+            struct.pack('<q', self.admin_id),
+            self.serialize_datetime(self.date),
+            b'' if self.start_date is None or self.start_date is False else (self.serialize_datetime(self.start_date)),
+            b'' if self.expire_date is None or self.expire_date is False else (self.serialize_datetime(self.expire_date)),
+            b'' if self.usage_limit is None or self.usage_limit is False else (struct.pack('<i', self.usage_limit)),
+            b'' if self.usage is None or self.usage is False else (struct.pack('<i', self.usage)),
+            b'' if self.requested is None or self.requested is False else (struct.pack('<i', self.requested)),
+            b'' if self.subscription_expired is None or self.subscription_expired is False else (struct.pack('<i', self.subscription_expired)),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.subscription_pricing is None or self.subscription_pricing is False else (self.subscription_pricing._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _revoked = bool(flags & 1)
+        _permanent = bool(flags & 32)
+        _request_needed = bool(flags & 64)
+        _link = reader.tgread_string()
+        _admin_id = reader.read_long()
+        _date = reader.tgread_date()
+        if flags & 16:
+            _start_date = reader.tgread_date()
+        else:
+            _start_date = None
+        if flags & 2:
+            _expire_date = reader.tgread_date()
+        else:
+            _expire_date = None
+        if flags & 4:
+            _usage_limit = reader.read_int()
+        else:
+            _usage_limit = None
+        if flags & 8:
+            _usage = reader.read_int()
+        else:
+            _usage = None
+        if flags & 128:
+            _requested = reader.read_int()
+        else:
+            _requested = None
+        if flags & 1024:
+            _subscription_expired = reader.read_int()
+        else:
+            _subscription_expired = None
+        if flags & 256:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 512:
+            _subscription_pricing = reader.tgread_object()
+        else:
+            _subscription_pricing = None
+        return cls(link=_link, admin_id=_admin_id, date=_date, revoked=_revoked, permanent=_permanent, request_needed=_request_needed, start_date=_start_date, expire_date=_expire_date, usage_limit=_usage_limit, usage=_usage, requested=_requested, subscription_expired=_subscription_expired, title=_title, subscription_pricing=_subscription_pricing)
+
+
+class ChatInvitePublicJoinRequests(TLObject):
+    CONSTRUCTOR_ID = 0xed107ab7
+    SUBCLASS_OF_ID = 0xb4748a58
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ChatInvitePublicJoinRequests'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb7z\x10\xed',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeExportedChatInvite = Union[ChatInviteExported,ChatInvitePublicJoinRequests]
@@ -0,0 +1,56 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class ExportedChatlistInvite(TLObject):
+    CONSTRUCTOR_ID = 0xc5181ac
+    SUBCLASS_OF_ID = 0x7711f8ff
+    __slots__ = ('title', 'url', 'peers')
+
+    def __init__(self, title: str, url: str, peers: List['TypePeer']):
+        """
+        Constructor for ExportedChatlistInvite: Instance of ExportedChatlistInvite.
+        """
+        self.title = title
+        self.url = url
+        self.peers = peers
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedChatlistInvite',
+            'title': self.title,
+            'url': self.url,
+            'peers': [] if self.peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xac\x81Q\x0c',
+            b'\0\0\0\0',
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.url),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peers)),b''.join(x._bytes() for x in self.peers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _title = reader.tgread_string()
+        _url = reader.tgread_string()
+        reader.read_int()
+        _peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _peers.append(_x)
+
+        return cls(title=_title, url=_url, peers=_peers)
+
+TypeExportedChatlistInvite = ExportedChatlistInvite
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ExportedContactToken(TLObject):
+    CONSTRUCTOR_ID = 0x41bf109b
+    SUBCLASS_OF_ID = 0x86ddbed1
+    __slots__ = ('url', 'expires')
+
+    def __init__(self, url: str, expires: Optional[datetime]):
+        """
+        Constructor for ExportedContactToken: Instance of ExportedContactToken.
+        """
+        self.url = url
+        self.expires = expires
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedContactToken',
+            'url': self.url,
+            'expires': self.expires
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9b\x10\xbfA',
+            self.serialize_bytes(self.url),
+            self.serialize_datetime(self.expires),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _expires = reader.tgread_date()
+        return cls(url=_url, expires=_expires)
+
+TypeExportedContactToken = ExportedContactToken
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ExportedMessageLink(TLObject):
+    CONSTRUCTOR_ID = 0x5dab1af4
+    SUBCLASS_OF_ID = 0xdee644cc
+    __slots__ = ('link', 'html')
+
+    def __init__(self, link: str, html: str):
+        """
+        Constructor for ExportedMessageLink: Instance of ExportedMessageLink.
+        """
+        self.link = link
+        self.html = html
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedMessageLink',
+            'link': self.link,
+            'html': self.html
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf4\x1a\xab]',
+            self.serialize_bytes(self.link),
+            self.serialize_bytes(self.html),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _link = reader.tgread_string()
+        _html = reader.tgread_string()
+        return cls(link=_link, html=_html)
+
+TypeExportedMessageLink = ExportedMessageLink
@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ExportedStoryLink(TLObject):
+    CONSTRUCTOR_ID = 0x3fc9053b
+    SUBCLASS_OF_ID = 0xfc541a6
+    __slots__ = ('link',)
+
+    def __init__(self, link: str):
+        """
+        Constructor for ExportedStoryLink: Instance of ExportedStoryLink.
+        """
+        self.link = link
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedStoryLink',
+            'link': self.link
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';\x05\xc9?',
+            self.serialize_bytes(self.link),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _link = reader.tgread_string()
+        return cls(link=_link)
+
+TypeExportedStoryLink = ExportedStoryLink
@@ -0,0 +1,62 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeTextWithEntities
+
+
+
+class FactCheck(TLObject):
+    CONSTRUCTOR_ID = 0xb89bfccf
+    SUBCLASS_OF_ID = 0x4640a3a3
+    __slots__ = ('hash', 'need_check', 'country', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, need_check: Optional[bool]=None, country: Optional[str]=None, text: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for FactCheck: Instance of FactCheck.
+        """
+        self.hash = hash
+        self.need_check = need_check
+        self.country = country
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'FactCheck',
+            'hash': self.hash,
+            'need_check': self.need_check,
+            'country': self.country,
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        assert ((self.country or self.country is not None) and (self.text or self.text is not None)) or ((self.country is None or self.country is False) and (self.text is None or self.text is False)), 'country, text parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xcf\xfc\x9b\xb8',
+            struct.pack('<I', (0 if self.need_check is None or self.need_check is False else 1) | (0 if self.country is None or self.country is False else 2) | (0 if self.text is None or self.text is False else 2)),
+            b'' if self.country is None or self.country is False else (self.serialize_bytes(self.country)),
+            b'' if self.text is None or self.text is False else (self.text._bytes()),
+            struct.pack('<q', self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _need_check = bool(flags & 1)
+        if flags & 2:
+            _country = reader.tgread_string()
+        else:
+            _country = None
+        if flags & 2:
+            _text = reader.tgread_object()
+        else:
+            _text = None
+        _hash = reader.read_long()
+        return cls(hash=_hash, need_check=_need_check, country=_country, text=_text)
+
+TypeFactCheck = FactCheck
@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+
+
+class FileHash(TLObject):
+    CONSTRUCTOR_ID = 0xf39b035c
+    SUBCLASS_OF_ID = 0xead438b3
+    __slots__ = ('offset', 'limit', 'hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, offset: int, limit: int, hash: bytes):
+        """
+        Constructor for FileHash: Instance of FileHash.
+        """
+        self.offset = offset
+        self.limit = limit
+        self.hash = hash
+
+    def to_dict(self):
+        return {
+            '_': 'FileHash',
+            'offset': self.offset,
+            'limit': self.limit,
+            'hash': self.hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\\x03\x9b\xf3',
+            _struct_qi.pack(self.offset, self.limit),
+            self.serialize_bytes(self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _limit = reader.read_struct(_struct_qi)
+        _hash = reader.tgread_bytes()
+        return cls(offset=_offset, limit=_limit, hash=_hash)
+
+TypeFileHash = FileHash
@@ -0,0 +1,64 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatPhoto
+
+
+
+class Folder(TLObject):
+    CONSTRUCTOR_ID = 0xff544e65
+    SUBCLASS_OF_ID = 0xeb0e0cfb
+    __slots__ = ('id', 'title', 'autofill_new_broadcasts', 'autofill_public_groups', 'autofill_new_correspondents', 'photo')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, title: str, autofill_new_broadcasts: Optional[bool]=None, autofill_public_groups: Optional[bool]=None, autofill_new_correspondents: Optional[bool]=None, photo: Optional['TypeChatPhoto']=None):
+        """
+        Constructor for Folder: Instance of Folder.
+        """
+        self.id = id
+        self.title = title
+        self.autofill_new_broadcasts = autofill_new_broadcasts
+        self.autofill_public_groups = autofill_public_groups
+        self.autofill_new_correspondents = autofill_new_correspondents
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'Folder',
+            'id': self.id,
+            'title': self.title,
+            'autofill_new_broadcasts': self.autofill_new_broadcasts,
+            'autofill_public_groups': self.autofill_public_groups,
+            'autofill_new_correspondents': self.autofill_new_correspondents,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'eNT\xff',
+            _struct_Ii.pack((0 if self.autofill_new_broadcasts is None or self.autofill_new_broadcasts is False else 1) | (0 if self.autofill_public_groups is None or self.autofill_public_groups is False else 2) | (0 if self.autofill_new_correspondents is None or self.autofill_new_correspondents is False else 4) | (0 if self.photo is None or self.photo is False else 8), self.id),
+            self.serialize_bytes(self.title),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _autofill_new_broadcasts = bool(flags & 1)
+        _autofill_public_groups = bool(flags & 2)
+        _autofill_new_correspondents = bool(flags & 4)
+        _title = reader.tgread_string()
+        if flags & 8:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        return cls(id=_id, title=_title, autofill_new_broadcasts=_autofill_new_broadcasts, autofill_public_groups=_autofill_public_groups, autofill_new_correspondents=_autofill_new_correspondents, photo=_photo)
+
+TypeFolder = Folder
@@ -0,0 +1,138 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+_struct_iiiiii = struct.Struct('<iiiiii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDraftMessage, TypePeer, TypePeerNotifySettings
+
+
+
+class ForumTopic(TLObject):
+    CONSTRUCTOR_ID = 0x71701da9
+    SUBCLASS_OF_ID = 0x8d182203
+    __slots__ = ('id', 'date', 'title', 'icon_color', 'top_message', 'read_inbox_max_id', 'read_outbox_max_id', 'unread_count', 'unread_mentions_count', 'unread_reactions_count', 'from_id', 'notify_settings', 'my', 'closed', 'pinned', 'short', 'hidden', 'icon_emoji_id', 'draft')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, date: Optional[datetime], title: str, icon_color: int, top_message: int, read_inbox_max_id: int, read_outbox_max_id: int, unread_count: int, unread_mentions_count: int, unread_reactions_count: int, from_id: 'TypePeer', notify_settings: 'TypePeerNotifySettings', my: Optional[bool]=None, closed: Optional[bool]=None, pinned: Optional[bool]=None, short: Optional[bool]=None, hidden: Optional[bool]=None, icon_emoji_id: Optional[int]=None, draft: Optional['TypeDraftMessage']=None):
+        """
+        Constructor for ForumTopic: Instance of either ForumTopicDeleted, ForumTopic.
+        """
+        self.id = id
+        self.date = date
+        self.title = title
+        self.icon_color = icon_color
+        self.top_message = top_message
+        self.read_inbox_max_id = read_inbox_max_id
+        self.read_outbox_max_id = read_outbox_max_id
+        self.unread_count = unread_count
+        self.unread_mentions_count = unread_mentions_count
+        self.unread_reactions_count = unread_reactions_count
+        self.from_id = from_id
+        self.notify_settings = notify_settings
+        self.my = my
+        self.closed = closed
+        self.pinned = pinned
+        self.short = short
+        self.hidden = hidden
+        self.icon_emoji_id = icon_emoji_id
+        self.draft = draft
+
+    def to_dict(self):
+        return {
+            '_': 'ForumTopic',
+            'id': self.id,
+            'date': self.date,
+            'title': self.title,
+            'icon_color': self.icon_color,
+            'top_message': self.top_message,
+            'read_inbox_max_id': self.read_inbox_max_id,
+            'read_outbox_max_id': self.read_outbox_max_id,
+            'unread_count': self.unread_count,
+            'unread_mentions_count': self.unread_mentions_count,
+            'unread_reactions_count': self.unread_reactions_count,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'my': self.my,
+            'closed': self.closed,
+            'pinned': self.pinned,
+            'short': self.short,
+            'hidden': self.hidden,
+            'icon_emoji_id': self.icon_emoji_id,
+            'draft': self.draft.to_dict() if isinstance(self.draft, TLObject) else self.draft
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa9\x1dpq',
+            _struct_Ii.pack((0 if self.my is None or self.my is False else 2) | (0 if self.closed is None or self.closed is False else 4) | (0 if self.pinned is None or self.pinned is False else 8) | (0 if self.short is None or self.short is False else 32) | (0 if self.hidden is None or self.hidden is False else 64) | (0 if self.icon_emoji_id is None or self.icon_emoji_id is False else 1) | (0 if self.draft is None or self.draft is False else 16), self.id),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.title),
+            struct.pack('<i', self.icon_color),
+            b'' if self.icon_emoji_id is None or self.icon_emoji_id is False else (struct.pack('<q', self.icon_emoji_id)),
+            _struct_iiiiii.pack(self.top_message, self.read_inbox_max_id, self.read_outbox_max_id, self.unread_count, self.unread_mentions_count, self.unread_reactions_count),
+            self.from_id._bytes(),
+            self.notify_settings._bytes(),
+            b'' if self.draft is None or self.draft is False else (self.draft._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _my = bool(flags & 2)
+        _closed = bool(flags & 4)
+        _pinned = bool(flags & 8)
+        _short = bool(flags & 32)
+        _hidden = bool(flags & 64)
+        _date = reader.tgread_date()
+        _title = reader.tgread_string()
+        _icon_color = reader.read_int()
+        if flags & 1:
+            _icon_emoji_id = reader.read_long()
+        else:
+            _icon_emoji_id = None
+        _top_message, _read_inbox_max_id, _read_outbox_max_id, _unread_count, _unread_mentions_count, _unread_reactions_count = reader.read_struct(_struct_iiiiii)
+        _from_id = reader.tgread_object()
+        _notify_settings = reader.tgread_object()
+        if flags & 16:
+            _draft = reader.tgread_object()
+        else:
+            _draft = None
+        return cls(id=_id, date=_date, title=_title, icon_color=_icon_color, top_message=_top_message, read_inbox_max_id=_read_inbox_max_id, read_outbox_max_id=_read_outbox_max_id, unread_count=_unread_count, unread_mentions_count=_unread_mentions_count, unread_reactions_count=_unread_reactions_count, from_id=_from_id, notify_settings=_notify_settings, my=_my, closed=_closed, pinned=_pinned, short=_short, hidden=_hidden, icon_emoji_id=_icon_emoji_id, draft=_draft)
+
+
+class ForumTopicDeleted(TLObject):
+    CONSTRUCTOR_ID = 0x23f109b
+    SUBCLASS_OF_ID = 0x8d182203
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for ForumTopic: Instance of either ForumTopicDeleted, ForumTopic.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'ForumTopicDeleted',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9b\x10?\x02',
+            struct.pack('<i', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_int()
+        return cls(id=_id)
+
+TypeForumTopic = Union[ForumTopicDeleted,ForumTopic]
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer, TypeStoryItem
+
+
+
+class FoundStory(TLObject):
+    CONSTRUCTOR_ID = 0xe87acbc0
+    SUBCLASS_OF_ID = 0xb31d68c5
+    __slots__ = ('peer', 'story')
+
+    def __init__(self, peer: 'TypePeer', story: 'TypeStoryItem'):
+        """
+        Constructor for FoundStory: Instance of FoundStory.
+        """
+        self.peer = peer
+        self.story = story
+
+    def to_dict(self):
+        return {
+            '_': 'FoundStory',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'story': self.story.to_dict() if isinstance(self.story, TLObject) else self.story
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc0\xcbz\xe8',
+            self.peer._bytes(),
+            self.story._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _story = reader.tgread_object()
+        return cls(peer=_peer, story=_story)
+
+TypeFoundStory = FoundStory
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class FutureSalt(TLObject):
+    CONSTRUCTOR_ID = 0x949d9dc
+    SUBCLASS_OF_ID = 0x45e53dcf
+    __slots__ = ('valid_since', 'valid_until', 'salt')
+
+    def __init__(self, valid_since: Optional[datetime], valid_until: Optional[datetime], salt: int):
+        """
+        Constructor for FutureSalt: Instance of FutureSalt.
+        """
+        self.valid_since = valid_since
+        self.valid_until = valid_until
+        self.salt = salt
+
+    def to_dict(self):
+        return {
+            '_': 'FutureSalt',
+            'valid_since': self.valid_since,
+            'valid_until': self.valid_until,
+            'salt': self.salt
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdc\xd9I\t',
+            self.serialize_datetime(self.valid_since),
+            self.serialize_datetime(self.valid_until),
+            struct.pack('<q', self.salt),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _valid_since = reader.tgread_date()
+        _valid_until = reader.tgread_date()
+        _salt = reader.read_long()
+        return cls(valid_since=_valid_since, valid_until=_valid_until, salt=_salt)
+
+TypeFutureSalt = FutureSalt
@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import Typefuture_salt
+
+
+
+class FutureSalts(TLObject):
+    CONSTRUCTOR_ID = 0xae500895
+    SUBCLASS_OF_ID = 0x1090f517
+    __slots__ = ('req_msg_id', 'now', 'salts')
+
+    def __init__(self, req_msg_id: int, now: int, salts: List['Typefuture_salt']):
+        """
+        Constructor for FutureSalts: Instance of FutureSalts.
+        """
+        self.req_msg_id = req_msg_id
+        self.now = now
+        self.salts = salts
+
+    def to_dict(self):
+        return {
+            '_': 'FutureSalts',
+            'req_msg_id': self.req_msg_id,
+            'now': self.now,
+            'salts': [] if self.salts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.salts]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95\x08P\xae',
+            _struct_qi.pack(self.req_msg_id, self.now),
+            struct.pack('<i', len(self.salts)),b''.join(x._bytes()[4:] for x in self.salts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _req_msg_id, _now = reader.read_struct(_struct_qi)
+        _salts = []
+        for _ in range(reader.read_int()):
+            from . import FutureSalt
+            _x = FutureSalt.from_reader(reader)
+            _salts.append(_x)
+
+        return cls(req_msg_id=_req_msg_id, now=_now, salts=_salts)
+
+TypeFutureSalts = FutureSalts
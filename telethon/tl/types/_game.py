@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypePhoto
+
+
+
+class Game(TLObject):
+    CONSTRUCTOR_ID = 0xbdf9653b
+    SUBCLASS_OF_ID = 0x83199eb2
+    __slots__ = ('id', 'access_hash', 'short_name', 'title', 'description', 'photo', 'document')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, short_name: str, title: str, description: str, photo: 'TypePhoto', document: Optional['TypeDocument']=None):
+        """
+        Constructor for Game: Instance of Game.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.short_name = short_name
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.document = document
+
+    def to_dict(self):
+        return {
+            '_': 'Game',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'short_name': self.short_name,
+            'title': self.title,
+            'description': self.description,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';e\xf9\xbd',
+            _struct_Iqq.pack((0 if self.document is None or self.document is False else 1), self.id, self.access_hash),
+            self.serialize_bytes(self.short_name),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            self.photo._bytes(),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _short_name = reader.tgread_string()
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        _photo = reader.tgread_object()
+        if flags & 1:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        return cls(id=_id, access_hash=_access_hash, short_name=_short_name, title=_title, description=_description, photo=_photo, document=_document)
+
+TypeGame = Game
@@ -0,0 +1,71 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iddq = struct.Struct('<Iddq')
+_struct_iddq = struct.Struct('<iddq')
+
+
+class GeoPoint(TLObject):
+    CONSTRUCTOR_ID = 0xb2a2f663
+    SUBCLASS_OF_ID = 0xd610e16d
+    __slots__ = ('long', 'lat', 'access_hash', 'accuracy_radius')
+
+    def __init__(self, long: float, lat: float, access_hash: int, accuracy_radius: Optional[int]=None):
+        """
+        Constructor for GeoPoint: Instance of either GeoPointEmpty, GeoPoint.
+        """
+        self.long = long
+        self.lat = lat
+        self.access_hash = access_hash
+        self.accuracy_radius = accuracy_radius
+
+    def to_dict(self):
+        return {
+            '_': 'GeoPoint',
+            'long': self.long,
+            'lat': self.lat,
+            'access_hash': self.access_hash,
+            'accuracy_radius': self.accuracy_radius
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'c\xf6\xa2\xb2',
+            _struct_Iddq.pack((0 if self.accuracy_radius is None or self.accuracy_radius is False else 1), self.long, self.lat, self.access_hash),
+            b'' if self.accuracy_radius is None or self.accuracy_radius is False else (struct.pack('<i', self.accuracy_radius)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _long, _lat, _access_hash = reader.read_struct(_struct_iddq)
+        if flags & 1:
+            _accuracy_radius = reader.read_int()
+        else:
+            _accuracy_radius = None
+        return cls(long=_long, lat=_lat, access_hash=_access_hash, accuracy_radius=_accuracy_radius)
+
+
+class GeoPointEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x1117dd5f
+    SUBCLASS_OF_ID = 0xd610e16d
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'GeoPointEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'_\xdd\x17\x11',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeGeoPoint = Union[GeoPointEmpty,GeoPoint]
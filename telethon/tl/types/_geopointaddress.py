@@ -0,0 +1,61 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class GeoPointAddress(TLObject):
+    CONSTRUCTOR_ID = 0xde4c5d93
+    SUBCLASS_OF_ID = 0x9655c2d8
+    __slots__ = ('country_iso2', 'state', 'city', 'street')
+
+    def __init__(self, country_iso2: str, state: Optional[str]=None, city: Optional[str]=None, street: Optional[str]=None):
+        """
+        Constructor for GeoPointAddress: Instance of GeoPointAddress.
+        """
+        self.country_iso2 = country_iso2
+        self.state = state
+        self.city = city
+        self.street = street
+
+    def to_dict(self):
+        return {
+            '_': 'GeoPointAddress',
+            'country_iso2': self.country_iso2,
+            'state': self.state,
+            'city': self.city,
+            'street': self.street
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x93]L\xde',
+            struct.pack('<I', (0 if self.state is None or self.state is False else 1) | (0 if self.city is None or self.city is False else 2) | (0 if self.street is None or self.street is False else 4)),
+            self.serialize_bytes(self.country_iso2),
+            b'' if self.state is None or self.state is False else (self.serialize_bytes(self.state)),
+            b'' if self.city is None or self.city is False else (self.serialize_bytes(self.city)),
+            b'' if self.street is None or self.street is False else (self.serialize_bytes(self.street)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _country_iso2 = reader.tgread_string()
+        if flags & 1:
+            _state = reader.tgread_string()
+        else:
+            _state = None
+        if flags & 2:
+            _city = reader.tgread_string()
+        else:
+            _city = None
+        if flags & 4:
+            _street = reader.tgread_string()
+        else:
+            _street = None
+        return cls(country_iso2=_country_iso2, state=_state, city=_city, street=_street)
+
+TypeGeoPointAddress = GeoPointAddress
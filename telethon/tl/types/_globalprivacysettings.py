@@ -0,0 +1,71 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDisallowedGiftsSettings
+
+
+
+class GlobalPrivacySettings(TLObject):
+    CONSTRUCTOR_ID = 0xfe41b34f
+    SUBCLASS_OF_ID = 0xc90e5770
+    __slots__ = ('archive_and_mute_new_noncontact_peers', 'keep_archived_unmuted', 'keep_archived_folders', 'hide_read_marks', 'new_noncontact_peers_require_premium', 'display_gifts_button', 'noncontact_peers_paid_stars', 'disallowed_gifts')
+
+    def __init__(self, archive_and_mute_new_noncontact_peers: Optional[bool]=None, keep_archived_unmuted: Optional[bool]=None, keep_archived_folders: Optional[bool]=None, hide_read_marks: Optional[bool]=None, new_noncontact_peers_require_premium: Optional[bool]=None, display_gifts_button: Optional[bool]=None, noncontact_peers_paid_stars: Optional[int]=None, disallowed_gifts: Optional['TypeDisallowedGiftsSettings']=None):
+        """
+        Constructor for GlobalPrivacySettings: Instance of GlobalPrivacySettings.
+        """
+        self.archive_and_mute_new_noncontact_peers = archive_and_mute_new_noncontact_peers
+        self.keep_archived_unmuted = keep_archived_unmuted
+        self.keep_archived_folders = keep_archived_folders
+        self.hide_read_marks = hide_read_marks
+        self.new_noncontact_peers_require_premium = new_noncontact_peers_require_premium
+        self.display_gifts_button = display_gifts_button
+        self.noncontact_peers_paid_stars = noncontact_peers_paid_stars
+        self.disallowed_gifts = disallowed_gifts
+
+    def to_dict(self):
+        return {
+            '_': 'GlobalPrivacySettings',
+            'archive_and_mute_new_noncontact_peers': self.archive_and_mute_new_noncontact_peers,
+            'keep_archived_unmuted': self.keep_archived_unmuted,
+            'keep_archived_folders': self.keep_archived_folders,
+            'hide_read_marks': self.hide_read_marks,
+            'new_noncontact_peers_require_premium': self.new_noncontact_peers_require_premium,
+            'display_gifts_button': self.display_gifts_button,
+            'noncontact_peers_paid_stars': self.noncontact_peers_paid_stars,
+            'disallowed_gifts': self.disallowed_gifts.to_dict() if isinstance(self.disallowed_gifts, TLObject) else self.disallowed_gifts
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\xb3A\xfe',
+            struct.pack('<I', (0 if self.archive_and_mute_new_noncontact_peers is None or self.archive_and_mute_new_noncontact_peers is False else 1) | (0 if self.keep_archived_unmuted is None or self.keep_archived_unmuted is False else 2) | (0 if self.keep_archived_folders is None or self.keep_archived_folders is False else 4) | (0 if self.hide_read_marks is None or self.hide_read_marks is False else 8) | (0 if self.new_noncontact_peers_require_premium is None or self.new_noncontact_peers_require_premium is False else 16) | (0 if self.display_gifts_button is None or self.display_gifts_button is False else 128) | (0 if self.noncontact_peers_paid_stars is None or self.noncontact_peers_paid_stars is False else 32) | (0 if self.disallowed_gifts is None or self.disallowed_gifts is False else 64)),
+            b'' if self.noncontact_peers_paid_stars is None or self.noncontact_peers_paid_stars is False else (struct.pack('<q', self.noncontact_peers_paid_stars)),
+            b'' if self.disallowed_gifts is None or self.disallowed_gifts is False else (self.disallowed_gifts._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _archive_and_mute_new_noncontact_peers = bool(flags & 1)
+        _keep_archived_unmuted = bool(flags & 2)
+        _keep_archived_folders = bool(flags & 4)
+        _hide_read_marks = bool(flags & 8)
+        _new_noncontact_peers_require_premium = bool(flags & 16)
+        _display_gifts_button = bool(flags & 128)
+        if flags & 32:
+            _noncontact_peers_paid_stars = reader.read_long()
+        else:
+            _noncontact_peers_paid_stars = None
+        if flags & 64:
+            _disallowed_gifts = reader.tgread_object()
+        else:
+            _disallowed_gifts = None
+        return cls(archive_and_mute_new_noncontact_peers=_archive_and_mute_new_noncontact_peers, keep_archived_unmuted=_keep_archived_unmuted, keep_archived_folders=_keep_archived_folders, hide_read_marks=_hide_read_marks, new_noncontact_peers_require_premium=_new_noncontact_peers_require_premium, display_gifts_button=_display_gifts_button, noncontact_peers_paid_stars=_noncontact_peers_paid_stars, disallowed_gifts=_disallowed_gifts)
+
+TypeGlobalPrivacySettings = GlobalPrivacySettings
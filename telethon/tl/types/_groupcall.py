@@ -0,0 +1,153 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqqi = struct.Struct('<Iqqi')
+_struct_ii = struct.Struct('<ii')
+_struct_iqqi = struct.Struct('<iqqi')
+_struct_qqi = struct.Struct('<qqi')
+
+
+class GroupCall(TLObject):
+    CONSTRUCTOR_ID = 0xcdf8d3e3
+    SUBCLASS_OF_ID = 0x20b4f320
+    __slots__ = ('id', 'access_hash', 'participants_count', 'unmuted_video_limit', 'version', 'join_muted', 'can_change_join_muted', 'join_date_asc', 'schedule_start_subscribed', 'can_start_video', 'record_video_active', 'rtmp_stream', 'listeners_hidden', 'title', 'stream_dc_id', 'record_start_date', 'schedule_date', 'unmuted_video_count', 'conference_from_call')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, participants_count: int, unmuted_video_limit: int, version: int, join_muted: Optional[bool]=None, can_change_join_muted: Optional[bool]=None, join_date_asc: Optional[bool]=None, schedule_start_subscribed: Optional[bool]=None, can_start_video: Optional[bool]=None, record_video_active: Optional[bool]=None, rtmp_stream: Optional[bool]=None, listeners_hidden: Optional[bool]=None, title: Optional[str]=None, stream_dc_id: Optional[int]=None, record_start_date: Optional[datetime]=None, schedule_date: Optional[datetime]=None, unmuted_video_count: Optional[int]=None, conference_from_call: Optional[int]=None):
+        """
+        Constructor for GroupCall: Instance of either GroupCallDiscarded, GroupCall.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.participants_count = participants_count
+        self.unmuted_video_limit = unmuted_video_limit
+        self.version = version
+        self.join_muted = join_muted
+        self.can_change_join_muted = can_change_join_muted
+        self.join_date_asc = join_date_asc
+        self.schedule_start_subscribed = schedule_start_subscribed
+        self.can_start_video = can_start_video
+        self.record_video_active = record_video_active
+        self.rtmp_stream = rtmp_stream
+        self.listeners_hidden = listeners_hidden
+        self.title = title
+        self.stream_dc_id = stream_dc_id
+        self.record_start_date = record_start_date
+        self.schedule_date = schedule_date
+        self.unmuted_video_count = unmuted_video_count
+        self.conference_from_call = conference_from_call
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCall',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'participants_count': self.participants_count,
+            'unmuted_video_limit': self.unmuted_video_limit,
+            'version': self.version,
+            'join_muted': self.join_muted,
+            'can_change_join_muted': self.can_change_join_muted,
+            'join_date_asc': self.join_date_asc,
+            'schedule_start_subscribed': self.schedule_start_subscribed,
+            'can_start_video': self.can_start_video,
+            'record_video_active': self.record_video_active,
+            'rtmp_stream': self.rtmp_stream,
+            'listeners_hidden': self.listeners_hidden,
+            'title': self.title,
+            'stream_dc_id': self.stream_dc_id,
+            'record_start_date': self.record_start_date,
+            'schedule_date': self.schedule_date,
+            'unmuted_video_count': self.unmuted_video_count,
+            'conference_from_call': self.conference_from_call
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe3\xd3\xf8\xcd',
+            _struct_Iqqi.pack((0 if self.join_muted is None or self.join_muted is False else 2) | (0 if self.can_change_join_muted is None or self.can_change_join_muted is False else 4) | (0 if self.join_date_asc is None or self.join_date_asc is False else 64) | (0 if self.schedule_start_subscribed is None or self.schedule_start_subscribed is False else 256) | (0 if self.can_start_video is None or self.can_start_video is False else 512) | (0 if self.record_video_active is None or self.record_video_active is False else 2048) | (0 if self.rtmp_stream is None or self.rtmp_stream is False else 4096) | (0 if self.listeners_hidden is None or self.listeners_hidden is False else 8192) | (0 if self.title is None or self.title is False else 8) | (0 if self.stream_dc_id is None or self.stream_dc_id is False else 16) | (0 if self.record_start_date is None or self.record_start_date is False else 32) | (0 if self.schedule_date is None or self.schedule_date is False else 128) | (0 if self.unmuted_video_count is None or self.unmuted_video_count is False else 1024) | (0 if self.conference_from_call is None or self.conference_from_call is False else 16384), self.id, self.access_hash, self.participants_count),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.stream_dc_id is None or self.stream_dc_id is False else (struct.pack('<i', self.stream_dc_id)),
+            b'' if self.record_start_date is None or self.record_start_date is False else (self.serialize_datetime(self.record_start_date)),
+            b'' if self.schedule_date is None or self.schedule_date is False else (self.serialize_datetime(self.schedule_date)),
+            b'' if self.unmuted_video_count is None or self.unmuted_video_count is False else (struct.pack('<i', self.unmuted_video_count)),
+            _struct_ii.pack(self.unmuted_video_limit, self.version),
+            b'' if self.conference_from_call is None or self.conference_from_call is False else (struct.pack('<q', self.conference_from_call)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash, _participants_count = reader.read_struct(_struct_iqqi)
+        _join_muted = bool(flags & 2)
+        _can_change_join_muted = bool(flags & 4)
+        _join_date_asc = bool(flags & 64)
+        _schedule_start_subscribed = bool(flags & 256)
+        _can_start_video = bool(flags & 512)
+        _record_video_active = bool(flags & 2048)
+        _rtmp_stream = bool(flags & 4096)
+        _listeners_hidden = bool(flags & 8192)
+        if flags & 8:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 16:
+            _stream_dc_id = reader.read_int()
+        else:
+            _stream_dc_id = None
+        if flags & 32:
+            _record_start_date = reader.tgread_date()
+        else:
+            _record_start_date = None
+        if flags & 128:
+            _schedule_date = reader.tgread_date()
+        else:
+            _schedule_date = None
+        if flags & 1024:
+            _unmuted_video_count = reader.read_int()
+        else:
+            _unmuted_video_count = None
+        _unmuted_video_limit, _version = reader.read_struct(_struct_ii)
+        if flags & 16384:
+            _conference_from_call = reader.read_long()
+        else:
+            _conference_from_call = None
+        return cls(id=_id, access_hash=_access_hash, participants_count=_participants_count, unmuted_video_limit=_unmuted_video_limit, version=_version, join_muted=_join_muted, can_change_join_muted=_can_change_join_muted, join_date_asc=_join_date_asc, schedule_start_subscribed=_schedule_start_subscribed, can_start_video=_can_start_video, record_video_active=_record_video_active, rtmp_stream=_rtmp_stream, listeners_hidden=_listeners_hidden, title=_title, stream_dc_id=_stream_dc_id, record_start_date=_record_start_date, schedule_date=_schedule_date, unmuted_video_count=_unmuted_video_count, conference_from_call=_conference_from_call)
+
+
+class GroupCallDiscarded(TLObject):
+    CONSTRUCTOR_ID = 0x7780bcb4
+    SUBCLASS_OF_ID = 0x20b4f320
+    __slots__ = ('id', 'access_hash', 'duration')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, duration: int):
+        """
+        Constructor for GroupCall: Instance of either GroupCallDiscarded, GroupCall.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.duration = duration
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCallDiscarded',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'duration': self.duration
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb4\xbc\x80w',
+            _struct_qqi.pack(self.id, self.access_hash, self.duration),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash, _duration = reader.read_struct(_struct_qqi)
+        return cls(id=_id, access_hash=_access_hash, duration=_duration)
+
+TypeGroupCall = Union[GroupCallDiscarded,GroupCall]
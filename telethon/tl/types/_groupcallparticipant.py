@@ -0,0 +1,124 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeGroupCallParticipantVideo, TypePeer
+
+
+
+class GroupCallParticipant(TLObject):
+    CONSTRUCTOR_ID = 0xeba636fe
+    SUBCLASS_OF_ID = 0xc01aaf4c
+    __slots__ = ('peer', 'date', 'source', 'muted', 'left', 'can_self_unmute', 'just_joined', 'versioned', 'min', 'muted_by_you', 'volume_by_admin', 'is_self', 'video_joined', 'active_date', 'volume', 'about', 'raise_hand_rating', 'video', 'presentation')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, peer: 'TypePeer', date: Optional[datetime], source: int, muted: Optional[bool]=None, left: Optional[bool]=None, can_self_unmute: Optional[bool]=None, just_joined: Optional[bool]=None, versioned: Optional[bool]=None, min: Optional[bool]=None, muted_by_you: Optional[bool]=None, volume_by_admin: Optional[bool]=None, is_self: Optional[bool]=None, video_joined: Optional[bool]=None, active_date: Optional[datetime]=None, volume: Optional[int]=None, about: Optional[str]=None, raise_hand_rating: Optional[int]=None, video: Optional['TypeGroupCallParticipantVideo']=None, presentation: Optional['TypeGroupCallParticipantVideo']=None):
+        """
+        Constructor for GroupCallParticipant: Instance of GroupCallParticipant.
+        """
+        self.peer = peer
+        self.date = date
+        self.source = source
+        self.muted = muted
+        self.left = left
+        self.can_self_unmute = can_self_unmute
+        self.just_joined = just_joined
+        self.versioned = versioned
+        self.min = min
+        self.muted_by_you = muted_by_you
+        self.volume_by_admin = volume_by_admin
+        self.is_self = is_self
+        self.video_joined = video_joined
+        self.active_date = active_date
+        self.volume = volume
+        self.about = about
+        self.raise_hand_rating = raise_hand_rating
+        self.video = video
+        self.presentation = presentation
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCallParticipant',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'date': self.date,
+            'source': self.source,
+            'muted': self.muted,
+            'left': self.left,
+            'can_self_unmute': self.can_self_unmute,
+            'just_joined': self.just_joined,
+            'versioned': self.versioned,
+            'min': self.min,
+            'muted_by_you': self.muted_by_you,
+            'volume_by_admin': self.volume_by_admin,
+            'is_self': self.is_self,
+            'video_joined': self.video_joined,
+            'active_date': self.active_date,
+            'volume': self.volume,
+            'about': self.about,
+            'raise_hand_rating': self.raise_hand_rating,
+            'video': self.video.to_dict() if isinstance(self.video, TLObject) else self.video,
+            'presentation': self.presentation.to_dict() if isinstance(self.presentation, TLObject) else self.presentation
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfe6\xa6\xeb',
+            struct.pack('<I', (0 if self.muted is None or self.muted is False else 1) | (0 if self.left is None or self.left is False else 2) | (0 if self.can_self_unmute is None or self.can_self_unmute is False else 4) | (0 if self.just_joined is None or self.just_joined is False else 16) | (0 if self.versioned is None or self.versioned is False else 32) | (0 if self.min is None or self.min is False else 256) | (0 if self.muted_by_you is None or self.muted_by_you is False else 512) | (0 if self.volume_by_admin is None or self.volume_by_admin is False else 1024) | (0 if self.is_self is None or self.is_self is False else 4096) | (0 if self.video_joined is None or self.video_joined is False else 32768) | (0 if self.active_date is None or self.active_date is False else 8) | (0 if self.volume is None or self.volume is False else 128) | (0 if self.about is None or self.about is False else 2048) | (0 if self.raise_hand_rating is None or self.raise_hand_rating is False else 8192) | (0 if self.video is None or self.video is False else 64) | (0 if self.presentation is None or self.presentation is False else 16384)),
+            self.peer._bytes(),
+            self.serialize_datetime(self.date),
+            b'' if self.active_date is None or self.active_date is False else (self.serialize_datetime(self.active_date)),
+            struct.pack('<i', self.source),
+            b'' if self.volume is None or self.volume is False else (struct.pack('<i', self.volume)),
+            b'' if self.about is None or self.about is False else (self.serialize_bytes(self.about)),
+            b'' if self.raise_hand_rating is None or self.raise_hand_rating is False else (struct.pack('<q', self.raise_hand_rating)),
+            b'' if self.video is None or self.video is False else (self.video._bytes()),
+            b'' if self.presentation is None or self.presentation is False else (self.presentation._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _muted = bool(flags & 1)
+        _left = bool(flags & 2)
+        _can_self_unmute = bool(flags & 4)
+        _just_joined = bool(flags & 16)
+        _versioned = bool(flags & 32)
+        _min = bool(flags & 256)
+        _muted_by_you = bool(flags & 512)
+        _volume_by_admin = bool(flags & 1024)
+        _is_self = bool(flags & 4096)
+        _video_joined = bool(flags & 32768)
+        _peer = reader.tgread_object()
+        _date = reader.tgread_date()
+        if flags & 8:
+            _active_date = reader.tgread_date()
+        else:
+            _active_date = None
+        _source = reader.read_int()
+        if flags & 128:
+            _volume = reader.read_int()
+        else:
+            _volume = None
+        if flags & 2048:
+            _about = reader.tgread_string()
+        else:
+            _about = None
+        if flags & 8192:
+            _raise_hand_rating = reader.read_long()
+        else:
+            _raise_hand_rating = None
+        if flags & 64:
+            _video = reader.tgread_object()
+        else:
+            _video = None
+        if flags & 16384:
+            _presentation = reader.tgread_object()
+        else:
+            _presentation = None
+        return cls(peer=_peer, date=_date, source=_source, muted=_muted, left=_left, can_self_unmute=_can_self_unmute, just_joined=_just_joined, versioned=_versioned, min=_min, muted_by_you=_muted_by_you, volume_by_admin=_volume_by_admin, is_self=_is_self, video_joined=_video_joined, active_date=_active_date, volume=_volume, about=_about, raise_hand_rating=_raise_hand_rating, video=_video, presentation=_presentation)
+
+TypeGroupCallParticipant = GroupCallParticipant
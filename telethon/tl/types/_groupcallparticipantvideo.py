@@ -0,0 +1,62 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeGroupCallParticipantVideoSourceGroup
+
+
+
+class GroupCallParticipantVideo(TLObject):
+    CONSTRUCTOR_ID = 0x67753ac8
+    SUBCLASS_OF_ID = 0xef46b8db
+    __slots__ = ('endpoint', 'source_groups', 'paused', 'audio_source')
+
+    def __init__(self, endpoint: str, source_groups: List['TypeGroupCallParticipantVideoSourceGroup'], paused: Optional[bool]=None, audio_source: Optional[int]=None):
+        """
+        Constructor for GroupCallParticipantVideo: Instance of GroupCallParticipantVideo.
+        """
+        self.endpoint = endpoint
+        self.source_groups = source_groups
+        self.paused = paused
+        self.audio_source = audio_source
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCallParticipantVideo',
+            'endpoint': self.endpoint,
+            'source_groups': [] if self.source_groups is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.source_groups],
+            'paused': self.paused,
+            'audio_source': self.audio_source
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc8:ug',
+            struct.pack('<I', (0 if self.paused is None or self.paused is False else 1) | (0 if self.audio_source is None or self.audio_source is False else 2)),
+            self.serialize_bytes(self.endpoint),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.source_groups)),b''.join(x._bytes() for x in self.source_groups),
+            b'' if self.audio_source is None or self.audio_source is False else (struct.pack('<i', self.audio_source)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _paused = bool(flags & 1)
+        _endpoint = reader.tgread_string()
+        reader.read_int()
+        _source_groups = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _source_groups.append(_x)
+
+        if flags & 2:
+            _audio_source = reader.read_int()
+        else:
+            _audio_source = None
+        return cls(endpoint=_endpoint, source_groups=_source_groups, paused=_paused, audio_source=_audio_source)
+
+TypeGroupCallParticipantVideo = GroupCallParticipantVideo
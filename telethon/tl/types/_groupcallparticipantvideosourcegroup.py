@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class GroupCallParticipantVideoSourceGroup(TLObject):
+    CONSTRUCTOR_ID = 0xdcb118b7
+    SUBCLASS_OF_ID = 0x3015f87c
+    __slots__ = ('semantics', 'sources')
+
+    def __init__(self, semantics: str, sources: List[int]):
+        """
+        Constructor for GroupCallParticipantVideoSourceGroup: Instance of GroupCallParticipantVideoSourceGroup.
+        """
+        self.semantics = semantics
+        self.sources = sources
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCallParticipantVideoSourceGroup',
+            'semantics': self.semantics,
+            'sources': [] if self.sources is None else self.sources[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb7\x18\xb1\xdc',
+            self.serialize_bytes(self.semantics),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.sources)), len(self.sources), *self.sources),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _semantics = reader.tgread_string()
+        reader.read_int()
+        _sources = reader.read_array('i', reader.read_int())
+        return cls(semantics=_semantics, sources=_sources)
+
+TypeGroupCallParticipantVideoSourceGroup = GroupCallParticipantVideoSourceGroup
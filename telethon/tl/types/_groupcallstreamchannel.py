@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iiq = struct.Struct('<iiq')
+
+
+class GroupCallStreamChannel(TLObject):
+    CONSTRUCTOR_ID = 0x80eb48af
+    SUBCLASS_OF_ID = 0xdd44b258
+    __slots__ = ('channel', 'scale', 'last_timestamp_ms')
+
+    def __init__(self, channel: int, scale: int, last_timestamp_ms: int):
+        """
+        Constructor for GroupCallStreamChannel: Instance of GroupCallStreamChannel.
+        """
+        self.channel = channel
+        self.scale = scale
+        self.last_timestamp_ms = last_timestamp_ms
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCallStreamChannel',
+            'channel': self.channel,
+            'scale': self.scale,
+            'last_timestamp_ms': self.last_timestamp_ms
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xafH\xeb\x80',
+            _struct_iiq.pack(self.channel, self.scale, self.last_timestamp_ms),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _channel, _scale, _last_timestamp_ms = reader.read_struct(_struct_iiq)
+        return cls(channel=_channel, scale=_scale, last_timestamp_ms=_last_timestamp_ms)
+
+TypeGroupCallStreamChannel = GroupCallStreamChannel
@@ -0,0 +1,64 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeJSONValue
+
+
+
+class AppConfig(TLObject):
+    CONSTRUCTOR_ID = 0xdd18782e
+    SUBCLASS_OF_ID = 0x14381c9a
+    __slots__ = ('hash', 'config')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, config: 'TypeJSONValue'):
+        """
+        Constructor for help.AppConfig: Instance of either AppConfigNotModified, AppConfig.
+        """
+        self.hash = hash
+        self.config = config
+
+    def to_dict(self):
+        return {
+            '_': 'AppConfig',
+            'hash': self.hash,
+            'config': self.config.to_dict() if isinstance(self.config, TLObject) else self.config
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'.x\x18\xdd',
+            struct.pack('<i', self.hash),
+            self.config._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_int()
+        _config = reader.tgread_object()
+        return cls(hash=_hash, config=_config)
+
+
+class AppConfigNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x7cde641d
+    SUBCLASS_OF_ID = 0x14381c9a
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AppConfigNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1dd\xde|',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,104 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeMessageEntity
+
+
+
+class AppUpdate(TLObject):
+    CONSTRUCTOR_ID = 0xccbbce30
+    SUBCLASS_OF_ID = 0x5897069e
+    __slots__ = ('id', 'version', 'text', 'entities', 'can_not_skip', 'document', 'url', 'sticker')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, version: str, text: str, entities: List['TypeMessageEntity'], can_not_skip: Optional[bool]=None, document: Optional['TypeDocument']=None, url: Optional[str]=None, sticker: Optional['TypeDocument']=None):
+        """
+        Constructor for help.AppUpdate: Instance of either AppUpdate, NoAppUpdate.
+        """
+        self.id = id
+        self.version = version
+        self.text = text
+        self.entities = entities
+        self.can_not_skip = can_not_skip
+        self.document = document
+        self.url = url
+        self.sticker = sticker
+
+    def to_dict(self):
+        return {
+            '_': 'AppUpdate',
+            'id': self.id,
+            'version': self.version,
+            'text': self.text,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'can_not_skip': self.can_not_skip,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'url': self.url,
+            'sticker': self.sticker.to_dict() if isinstance(self.sticker, TLObject) else self.sticker
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'0\xce\xbb\xcc',
+            _struct_Ii.pack((0 if self.can_not_skip is None or self.can_not_skip is False else 1) | (0 if self.document is None or self.document is False else 2) | (0 if self.url is None or self.url is False else 4) | (0 if self.sticker is None or self.sticker is False else 8), self.id),
+            self.serialize_bytes(self.version),
+            self.serialize_bytes(self.text),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+            b'' if self.sticker is None or self.sticker is False else (self.sticker._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _can_not_skip = bool(flags & 1)
+        _version = reader.tgread_string()
+        _text = reader.tgread_string()
+        reader.read_int()
+        _entities = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _entities.append(_x)
+
+        if flags & 2:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        if flags & 4:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        if flags & 8:
+            _sticker = reader.tgread_object()
+        else:
+            _sticker = None
+        return cls(id=_id, version=_version, text=_text, entities=_entities, can_not_skip=_can_not_skip, document=_document, url=_url, sticker=_sticker)
+
+
+class NoAppUpdate(TLObject):
+    CONSTRUCTOR_ID = 0xc45a6536
+    SUBCLASS_OF_ID = 0x5897069e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'NoAppUpdate'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'6eZ\xc4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
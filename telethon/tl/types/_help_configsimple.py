@@ -0,0 +1,51 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAccessPointRule
+
+
+
+class ConfigSimple(TLObject):
+    CONSTRUCTOR_ID = 0x5a592a6c
+    SUBCLASS_OF_ID = 0x29183ac4
+    __slots__ = ('date', 'expires', 'rules')
+
+    def __init__(self, date: Optional[datetime], expires: Optional[datetime], rules: List['TypeAccessPointRule']):
+        """
+        Constructor for help.ConfigSimple: Instance of ConfigSimple.
+        """
+        self.date = date
+        self.expires = expires
+        self.rules = rules
+
+    def to_dict(self):
+        return {
+            '_': 'ConfigSimple',
+            'date': self.date,
+            'expires': self.expires,
+            'rules': [] if self.rules is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.rules]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'l*YZ',
+            self.serialize_datetime(self.date),
+            self.serialize_datetime(self.expires),
+            struct.pack('<i', len(self.rules)),b''.join(x._bytes() for x in self.rules),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _date = reader.tgread_date()
+        _expires = reader.tgread_date()
+        _rules = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _rules.append(_x)
+
+        return cls(date=_date, expires=_expires, rules=_rules)
+
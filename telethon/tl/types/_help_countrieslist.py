@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.help import TypeCountry
+
+
+
+class CountriesList(TLObject):
+    CONSTRUCTOR_ID = 0x87d0759e
+    SUBCLASS_OF_ID = 0xea31fe88
+    __slots__ = ('countries', 'hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, countries: List['TypeCountry'], hash: int):
+        """
+        Constructor for help.CountriesList: Instance of either CountriesListNotModified, CountriesList.
+        """
+        self.countries = countries
+        self.hash = hash
+
+    def to_dict(self):
+        return {
+            '_': 'CountriesList',
+            'countries': [] if self.countries is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.countries],
+            'hash': self.hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9eu\xd0\x87',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.countries)),b''.join(x._bytes() for x in self.countries),
+            struct.pack('<i', self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _countries = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _countries.append(_x)
+
+        _hash = reader.read_int()
+        return cls(countries=_countries, hash=_hash)
+
+
+class CountriesListNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x93cc1f32
+    SUBCLASS_OF_ID = 0xea31fe88
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'CountriesListNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'2\x1f\xcc\x93',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,65 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.help import TypeCountryCode
+
+
+
+class Country(TLObject):
+    CONSTRUCTOR_ID = 0xc3878e23
+    SUBCLASS_OF_ID = 0xa22e9e28
+    __slots__ = ('iso2', 'default_name', 'country_codes', 'hidden', 'name')
+
+    def __init__(self, iso2: str, default_name: str, country_codes: List['TypeCountryCode'], hidden: Optional[bool]=None, name: Optional[str]=None):
+        """
+        Constructor for help.Country: Instance of Country.
+        """
+        self.iso2 = iso2
+        self.default_name = default_name
+        self.country_codes = country_codes
+        self.hidden = hidden
+        self.name = name
+
+    def to_dict(self):
+        return {
+            '_': 'Country',
+            'iso2': self.iso2,
+            'default_name': self.default_name,
+            'country_codes': [] if self.country_codes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.country_codes],
+            'hidden': self.hidden,
+            'name': self.name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'#\x8e\x87\xc3',
+            struct.pack('<I', (0 if self.hidden is None or self.hidden is False else 1) | (0 if self.name is None or self.name is False else 2)),
+            self.serialize_bytes(self.iso2),
+            self.serialize_bytes(self.default_name),
+            b'' if self.name is None or self.name is False else (self.serialize_bytes(self.name)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.country_codes)),b''.join(x._bytes() for x in self.country_codes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _hidden = bool(flags & 1)
+        _iso2 = reader.tgread_string()
+        _default_name = reader.tgread_string()
+        if flags & 2:
+            _name = reader.tgread_string()
+        else:
+            _name = None
+        reader.read_int()
+        _country_codes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _country_codes.append(_x)
+
+        return cls(iso2=_iso2, default_name=_default_name, country_codes=_country_codes, hidden=_hidden, name=_name)
+
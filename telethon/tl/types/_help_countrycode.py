@@ -0,0 +1,63 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class CountryCode(TLObject):
+    CONSTRUCTOR_ID = 0x4203c5ef
+    SUBCLASS_OF_ID = 0x76f34665
+    __slots__ = ('country_code', 'prefixes', 'patterns')
+
+    def __init__(self, country_code: str, prefixes: Optional[List[str]]=None, patterns: Optional[List[str]]=None):
+        """
+        Constructor for help.CountryCode: Instance of CountryCode.
+        """
+        self.country_code = country_code
+        self.prefixes = prefixes
+        self.patterns = patterns
+
+    def to_dict(self):
+        return {
+            '_': 'CountryCode',
+            'country_code': self.country_code,
+            'prefixes': [] if self.prefixes is None else self.prefixes[:],
+            'patterns': [] if self.patterns is None else self.patterns[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xef\xc5\x03B',
+            struct.pack('<I', (0 if self.prefixes is None or self.prefixes is False else 1) | (0 if self.patterns is None or self.patterns is False else 2)),
+            self.serialize_bytes(self.country_code),
+            b'' if self.prefixes is None or self.prefixes is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.prefixes)),b''.join(self.serialize_bytes(x) for x in self.prefixes))),
+            b'' if self.patterns is None or self.patterns is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.patterns)),b''.join(self.serialize_bytes(x) for x in self.patterns))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _country_code = reader.tgread_string()
+        if flags & 1:
+            reader.read_int()
+            _prefixes = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_string()
+                _prefixes.append(_x)
+
+        else:
+            _prefixes = None
+        if flags & 2:
+            reader.read_int()
+            _patterns = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_string()
+                _patterns.append(_x)
+
+        else:
+            _patterns = None
+        return cls(country_code=_country_code, prefixes=_prefixes, patterns=_patterns)
+
@@ -0,0 +1,77 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity
+
+
+
+class DeepLinkInfo(TLObject):
+    CONSTRUCTOR_ID = 0x6a4ee832
+    SUBCLASS_OF_ID = 0x984aac38
+    __slots__ = ('message', 'update_app', 'entities')
+
+    def __init__(self, message: str, update_app: Optional[bool]=None, entities: Optional[List['TypeMessageEntity']]=None):
+        """
+        Constructor for help.DeepLinkInfo: Instance of either DeepLinkInfoEmpty, DeepLinkInfo.
+        """
+        self.message = message
+        self.update_app = update_app
+        self.entities = entities
+
+    def to_dict(self):
+        return {
+            '_': 'DeepLinkInfo',
+            'message': self.message,
+            'update_app': self.update_app,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'2\xe8Nj',
+            struct.pack('<I', (0 if self.update_app is None or self.update_app is False else 1) | (0 if self.entities is None or self.entities is False else 2)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _update_app = bool(flags & 1)
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        return cls(message=_message, update_app=_update_app, entities=_entities)
+
+
+class DeepLinkInfoEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x66afa166
+    SUBCLASS_OF_ID = 0x984aac38
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'DeepLinkInfoEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'f\xa1\xaff',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
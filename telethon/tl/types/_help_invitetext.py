@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InviteText(TLObject):
+    CONSTRUCTOR_ID = 0x18cb9f78
+    SUBCLASS_OF_ID = 0xcf70aa35
+    __slots__ = ('message',)
+
+    def __init__(self, message: str):
+        """
+        Constructor for help.InviteText: Instance of InviteText.
+        """
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'InviteText',
+            'message': self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'x\x9f\xcb\x18',
+            self.serialize_bytes(self.message),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _message = reader.tgread_string()
+        return cls(message=_message)
+
@@ -0,0 +1,64 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON
+
+
+
+class PassportConfig(TLObject):
+    CONSTRUCTOR_ID = 0xa098d6af
+    SUBCLASS_OF_ID = 0xc666c0ad
+    __slots__ = ('hash', 'countries_langs')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, countries_langs: 'TypeDataJSON'):
+        """
+        Constructor for help.PassportConfig: Instance of either PassportConfigNotModified, PassportConfig.
+        """
+        self.hash = hash
+        self.countries_langs = countries_langs
+
+    def to_dict(self):
+        return {
+            '_': 'PassportConfig',
+            'hash': self.hash,
+            'countries_langs': self.countries_langs.to_dict() if isinstance(self.countries_langs, TLObject) else self.countries_langs
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xaf\xd6\x98\xa0',
+            struct.pack('<i', self.hash),
+            self.countries_langs._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_int()
+        _countries_langs = reader.tgread_object()
+        return cls(hash=_hash, countries_langs=_countries_langs)
+
+
+class PassportConfigNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xbfb9f457
+    SUBCLASS_OF_ID = 0xc666c0ad
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PassportConfigNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'W\xf4\xb9\xbf',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
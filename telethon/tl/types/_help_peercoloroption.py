@@ -0,0 +1,73 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types.help import TypePeerColorSet
+
+
+
+class PeerColorOption(TLObject):
+    CONSTRUCTOR_ID = 0xadec6ebe
+    SUBCLASS_OF_ID = 0x56b8ae98
+    __slots__ = ('color_id', 'hidden', 'colors', 'dark_colors', 'channel_min_level', 'group_min_level')
+
+    def __init__(self, color_id: int, hidden: Optional[bool]=None, colors: Optional['TypePeerColorSet']=None, dark_colors: Optional['TypePeerColorSet']=None, channel_min_level: Optional[int]=None, group_min_level: Optional[int]=None):
+        """
+        Constructor for help.PeerColorOption: Instance of PeerColorOption.
+        """
+        self.color_id = color_id
+        self.hidden = hidden
+        self.colors = colors
+        self.dark_colors = dark_colors
+        self.channel_min_level = channel_min_level
+        self.group_min_level = group_min_level
+
+    def to_dict(self):
+        return {
+            '_': 'PeerColorOption',
+            'color_id': self.color_id,
+            'hidden': self.hidden,
+            'colors': self.colors.to_dict() if isinstance(self.colors, TLObject) else self.colors,
+            'dark_colors': self.dark_colors.to_dict() if isinstance(self.dark_colors, TLObject) else self.dark_colors,
+            'channel_min_level': self.channel_min_level,
+            'group_min_level': self.group_min_level
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xben\xec\xad',
+            _struct_Ii.pack((0 if self.hidden is None or self.hidden is False else 1) | (0 if self.colors is None or self.colors is False else 2) | (0 if self.dark_colors is None or self.dark_colors is False else 4) | (0 if self.channel_min_level is None or self.channel_min_level is False else 8) | (0 if self.group_min_level is None or self.group_min_level is False else 16), self.color_id),
+            b'' if self.colors is None or self.colors is False else (self.colors._bytes()),
+            b'' if self.dark_colors is None or self.dark_colors is False else (self.dark_colors._bytes()),
+            b'' if self.channel_min_level is None or self.channel_min_level is False else (struct.pack('<i', self.channel_min_level)),
+            b'' if self.group_min_level is None or self.group_min_level is False else (struct.pack('<i', self.group_min_level)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _color_id = reader.read_struct(_struct_ii)
+        _hidden = bool(flags & 1)
+        if flags & 2:
+            _colors = reader.tgread_object()
+        else:
+            _colors = None
+        if flags & 4:
+            _dark_colors = reader.tgread_object()
+        else:
+            _dark_colors = None
+        if flags & 8:
+            _channel_min_level = reader.read_int()
+        else:
+            _channel_min_level = None
+        if flags & 16:
+            _group_min_level = reader.read_int()
+        else:
+            _group_min_level = None
+        return cls(color_id=_color_id, hidden=_hidden, colors=_colors, dark_colors=_dark_colors, channel_min_level=_channel_min_level, group_min_level=_group_min_level)
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.help import TypePeerColorOption
+
+
+
+class PeerColors(TLObject):
+    CONSTRUCTOR_ID = 0xf8ed08
+    SUBCLASS_OF_ID = 0xe3f6733
+    __slots__ = ('hash', 'colors')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, colors: List['TypePeerColorOption']):
+        """
+        Constructor for help.PeerColors: Instance of either PeerColorsNotModified, PeerColors.
+        """
+        self.hash = hash
+        self.colors = colors
+
+    def to_dict(self):
+        return {
+            '_': 'PeerColors',
+            'hash': self.hash,
+            'colors': [] if self.colors is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.colors]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08\xed\xf8\x00',
+            struct.pack('<i', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.colors)),b''.join(x._bytes() for x in self.colors),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_int()
+        reader.read_int()
+        _colors = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _colors.append(_x)
+
+        return cls(hash=_hash, colors=_colors)
+
+
+class PeerColorsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x2ba1f5ce
+    SUBCLASS_OF_ID = 0xe3f6733
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PeerColorsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xce\xf5\xa1+',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,77 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PeerColorProfileSet(TLObject):
+    CONSTRUCTOR_ID = 0x767d61eb
+    SUBCLASS_OF_ID = 0x11cbe12c
+    __slots__ = ('palette_colors', 'bg_colors', 'story_colors')
+
+    def __init__(self, palette_colors: List[int], bg_colors: List[int], story_colors: List[int]):
+        """
+        Constructor for help.PeerColorSet: Instance of either PeerColorSet, PeerColorProfileSet.
+        """
+        self.palette_colors = palette_colors
+        self.bg_colors = bg_colors
+        self.story_colors = story_colors
+
+    def to_dict(self):
+        return {
+            '_': 'PeerColorProfileSet',
+            'palette_colors': [] if self.palette_colors is None else self.palette_colors[:],
+            'bg_colors': [] if self.bg_colors is None else self.bg_colors[:],
+            'story_colors': [] if self.story_colors is None else self.story_colors[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeba}v',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.palette_colors)), len(self.palette_colors), *self.palette_colors),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.bg_colors)), len(self.bg_colors), *self.bg_colors),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.story_colors)), len(self.story_colors), *self.story_colors),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _palette_colors = reader.read_array('i', reader.read_int())
+        reader.read_int()
+        _bg_colors = reader.read_array('i', reader.read_int())
+        reader.read_int()
+        _story_colors = reader.read_array('i', reader.read_int())
+        return cls(palette_colors=_palette_colors, bg_colors=_bg_colors, story_colors=_story_colors)
+
+
+class PeerColorSet(TLObject):
+    CONSTRUCTOR_ID = 0x26219a58
+    SUBCLASS_OF_ID = 0x11cbe12c
+    __slots__ = ('colors',)
+
+    def __init__(self, colors: List[int]):
+        """
+        Constructor for help.PeerColorSet: Instance of either PeerColorSet, PeerColorProfileSet.
+        """
+        self.colors = colors
+
+    def to_dict(self):
+        return {
+            '_': 'PeerColorSet',
+            'colors': [] if self.colors is None else self.colors[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'X\x9a!&',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.colors)), len(self.colors), *self.colors),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _colors = reader.read_array('i', reader.read_int())
+        return cls(colors=_colors)
+
@@ -0,0 +1,84 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeMessageEntity, TypePremiumSubscriptionOption, TypeUser
+
+
+
+class PremiumPromo(TLObject):
+    CONSTRUCTOR_ID = 0x5334759c
+    SUBCLASS_OF_ID = 0xc987a338
+    __slots__ = ('status_text', 'status_entities', 'video_sections', 'videos', 'period_options', 'users')
+
+    def __init__(self, status_text: str, status_entities: List['TypeMessageEntity'], video_sections: List[str], videos: List['TypeDocument'], period_options: List['TypePremiumSubscriptionOption'], users: List['TypeUser']):
+        """
+        Constructor for help.PremiumPromo: Instance of PremiumPromo.
+        """
+        self.status_text = status_text
+        self.status_entities = status_entities
+        self.video_sections = video_sections
+        self.videos = videos
+        self.period_options = period_options
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'PremiumPromo',
+            'status_text': self.status_text,
+            'status_entities': [] if self.status_entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.status_entities],
+            'video_sections': [] if self.video_sections is None else self.video_sections[:],
+            'videos': [] if self.videos is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.videos],
+            'period_options': [] if self.period_options is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.period_options],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9cu4S',
+            self.serialize_bytes(self.status_text),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.status_entities)),b''.join(x._bytes() for x in self.status_entities),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.video_sections)),b''.join(self.serialize_bytes(x) for x in self.video_sections),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.videos)),b''.join(x._bytes() for x in self.videos),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.period_options)),b''.join(x._bytes() for x in self.period_options),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _status_text = reader.tgread_string()
+        reader.read_int()
+        _status_entities = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _status_entities.append(_x)
+
+        reader.read_int()
+        _video_sections = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _video_sections.append(_x)
+
+        reader.read_int()
+        _videos = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _videos.append(_x)
+
+        reader.read_int()
+        _period_options = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _period_options.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(status_text=_status_text, status_entities=_status_entities, video_sections=_video_sections, videos=_videos, period_options=_period_options, users=_users)
+
@@ -0,0 +1,110 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypePeer, TypeUser
+
+
+
+class PromoData(TLObject):
+    CONSTRUCTOR_ID = 0x8c39793f
+    SUBCLASS_OF_ID = 0x9d595542
+    __slots__ = ('expires', 'peer', 'chats', 'users', 'proxy', 'psa_type', 'psa_message')
+
+    def __init__(self, expires: Optional[datetime], peer: 'TypePeer', chats: List['TypeChat'], users: List['TypeUser'], proxy: Optional[bool]=None, psa_type: Optional[str]=None, psa_message: Optional[str]=None):
+        """
+        Constructor for help.PromoData: Instance of either PromoDataEmpty, PromoData.
+        """
+        self.expires = expires
+        self.peer = peer
+        self.chats = chats
+        self.users = users
+        self.proxy = proxy
+        self.psa_type = psa_type
+        self.psa_message = psa_message
+
+    def to_dict(self):
+        return {
+            '_': 'PromoData',
+            'expires': self.expires,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'proxy': self.proxy,
+            'psa_type': self.psa_type,
+            'psa_message': self.psa_message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?y9\x8c',
+            struct.pack('<I', (0 if self.proxy is None or self.proxy is False else 1) | (0 if self.psa_type is None or self.psa_type is False else 2) | (0 if self.psa_message is None or self.psa_message is False else 4)),
+            self.serialize_datetime(self.expires),
+            self.peer._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            b'' if self.psa_type is None or self.psa_type is False else (self.serialize_bytes(self.psa_type)),
+            b'' if self.psa_message is None or self.psa_message is False else (self.serialize_bytes(self.psa_message)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _proxy = bool(flags & 1)
+        _expires = reader.tgread_date()
+        _peer = reader.tgread_object()
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        if flags & 2:
+            _psa_type = reader.tgread_string()
+        else:
+            _psa_type = None
+        if flags & 4:
+            _psa_message = reader.tgread_string()
+        else:
+            _psa_message = None
+        return cls(expires=_expires, peer=_peer, chats=_chats, users=_users, proxy=_proxy, psa_type=_psa_type, psa_message=_psa_message)
+
+
+class PromoDataEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x98f6ac75
+    SUBCLASS_OF_ID = 0x9d595542
+    __slots__ = ('expires',)
+
+    def __init__(self, expires: Optional[datetime]):
+        """
+        Constructor for help.PromoData: Instance of either PromoDataEmpty, PromoData.
+        """
+        self.expires = expires
+
+    def to_dict(self):
+        return {
+            '_': 'PromoDataEmpty',
+            'expires': self.expires
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'u\xac\xf6\x98',
+            self.serialize_datetime(self.expires),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _expires = reader.tgread_date()
+        return cls(expires=_expires)
+
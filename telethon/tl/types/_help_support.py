@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUser
+
+
+
+class Support(TLObject):
+    CONSTRUCTOR_ID = 0x17c6b5f6
+    SUBCLASS_OF_ID = 0x7159bceb
+    __slots__ = ('phone_number', 'user')
+
+    def __init__(self, phone_number: str, user: 'TypeUser'):
+        """
+        Constructor for help.Support: Instance of Support.
+        """
+        self.phone_number = phone_number
+        self.user = user
+
+    def to_dict(self):
+        return {
+            '_': 'Support',
+            'phone_number': self.phone_number,
+            'user': self.user.to_dict() if isinstance(self.user, TLObject) else self.user
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf6\xb5\xc6\x17',
+            self.serialize_bytes(self.phone_number),
+            self.user._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone_number = reader.tgread_string()
+        _user = reader.tgread_object()
+        return cls(phone_number=_phone_number, user=_user)
+
@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SupportName(TLObject):
+    CONSTRUCTOR_ID = 0x8c05f1c9
+    SUBCLASS_OF_ID = 0x7f50b7c2
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        """
+        Constructor for help.SupportName: Instance of SupportName.
+        """
+        self.name = name
+
+    def to_dict(self):
+        return {
+            '_': 'SupportName',
+            'name': self.name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9\xf1\x05\x8c',
+            self.serialize_bytes(self.name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _name = reader.tgread_string()
+        return cls(name=_name)
+
@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeMessageEntity
+
+
+
+class TermsOfService(TLObject):
+    CONSTRUCTOR_ID = 0x780a0310
+    SUBCLASS_OF_ID = 0x20ee8312
+    __slots__ = ('id', 'text', 'entities', 'popup', 'min_age_confirm')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeDataJSON', text: str, entities: List['TypeMessageEntity'], popup: Optional[bool]=None, min_age_confirm: Optional[int]=None):
+        """
+        Constructor for help.TermsOfService: Instance of TermsOfService.
+        """
+        self.id = id
+        self.text = text
+        self.entities = entities
+        self.popup = popup
+        self.min_age_confirm = min_age_confirm
+
+    def to_dict(self):
+        return {
+            '_': 'TermsOfService',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id,
+            'text': self.text,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'popup': self.popup,
+            'min_age_confirm': self.min_age_confirm
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x10\x03\nx',
+            struct.pack('<I', (0 if self.popup is None or self.popup is False else 1) | (0 if self.min_age_confirm is None or self.min_age_confirm is False else 2)),
+            self.id._bytes(),
+            self.serialize_bytes(self.text),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities),
+            b'' if self.min_age_confirm is None or self.min_age_confirm is False else (struct.pack('<i', self.min_age_confirm)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _popup = bool(flags & 1)
+        _id = reader.tgread_object()
+        _text = reader.tgread_string()
+        reader.read_int()
+        _entities = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _entities.append(_x)
+
+        if flags & 2:
+            _min_age_confirm = reader.read_int()
+        else:
+            _min_age_confirm = None
+        return cls(id=_id, text=_text, entities=_entities, popup=_popup, min_age_confirm=_min_age_confirm)
+
@@ -0,0 +1,72 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.help import TypeTermsOfService
+
+
+
+class TermsOfServiceUpdate(TLObject):
+    CONSTRUCTOR_ID = 0x28ecf961
+    SUBCLASS_OF_ID = 0x293c2977
+    __slots__ = ('expires', 'terms_of_service')
+
+    def __init__(self, expires: Optional[datetime], terms_of_service: 'TypeTermsOfService'):
+        """
+        Constructor for help.TermsOfServiceUpdate: Instance of either TermsOfServiceUpdateEmpty, TermsOfServiceUpdate.
+        """
+        self.expires = expires
+        self.terms_of_service = terms_of_service
+
+    def to_dict(self):
+        return {
+            '_': 'TermsOfServiceUpdate',
+            'expires': self.expires,
+            'terms_of_service': self.terms_of_service.to_dict() if isinstance(self.terms_of_service, TLObject) else self.terms_of_service
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'a\xf9\xec(',
+            self.serialize_datetime(self.expires),
+            self.terms_of_service._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _expires = reader.tgread_date()
+        _terms_of_service = reader.tgread_object()
+        return cls(expires=_expires, terms_of_service=_terms_of_service)
+
+
+class TermsOfServiceUpdateEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xe3309f7f
+    SUBCLASS_OF_ID = 0x293c2977
+    __slots__ = ('expires',)
+
+    def __init__(self, expires: Optional[datetime]):
+        """
+        Constructor for help.TermsOfServiceUpdate: Instance of either TermsOfServiceUpdateEmpty, TermsOfServiceUpdate.
+        """
+        self.expires = expires
+
+    def to_dict(self):
+        return {
+            '_': 'TermsOfServiceUpdateEmpty',
+            'expires': self.expires
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f\x9f0\xe3',
+            self.serialize_datetime(self.expires),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _expires = reader.tgread_date()
+        return cls(expires=_expires)
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeTimezone
+
+
+
+class TimezonesList(TLObject):
+    CONSTRUCTOR_ID = 0x7b74ed71
+    SUBCLASS_OF_ID = 0xca76e475
+    __slots__ = ('timezones', 'hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, timezones: List['TypeTimezone'], hash: int):
+        """
+        Constructor for help.TimezonesList: Instance of either TimezonesListNotModified, TimezonesList.
+        """
+        self.timezones = timezones
+        self.hash = hash
+
+    def to_dict(self):
+        return {
+            '_': 'TimezonesList',
+            'timezones': [] if self.timezones is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.timezones],
+            'hash': self.hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'q\xedt{',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.timezones)),b''.join(x._bytes() for x in self.timezones),
+            struct.pack('<i', self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _timezones = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _timezones.append(_x)
+
+        _hash = reader.read_int()
+        return cls(timezones=_timezones, hash=_hash)
+
+
+class TimezonesListNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x970708cc
+    SUBCLASS_OF_ID = 0xca76e475
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TimezonesListNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcc\x08\x07\x97',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
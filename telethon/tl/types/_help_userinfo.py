@@ -0,0 +1,76 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity
+
+
+
+class UserInfo(TLObject):
+    CONSTRUCTOR_ID = 0x1eb3758
+    SUBCLASS_OF_ID = 0x5c53d7d8
+    __slots__ = ('message', 'entities', 'author', 'date')
+
+    def __init__(self, message: str, entities: List['TypeMessageEntity'], author: str, date: Optional[datetime]):
+        """
+        Constructor for help.UserInfo: Instance of either UserInfoEmpty, UserInfo.
+        """
+        self.message = message
+        self.entities = entities
+        self.author = author
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'UserInfo',
+            'message': self.message,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'author': self.author,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'X7\xeb\x01',
+            self.serialize_bytes(self.message),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities),
+            self.serialize_bytes(self.author),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _message = reader.tgread_string()
+        reader.read_int()
+        _entities = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _entities.append(_x)
+
+        _author = reader.tgread_string()
+        _date = reader.tgread_date()
+        return cls(message=_message, entities=_entities, author=_author, date=_date)
+
+
+class UserInfoEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xf3ae2eed
+    SUBCLASS_OF_ID = 0x5c53d7d8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'UserInfoEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed.\xae\xf3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
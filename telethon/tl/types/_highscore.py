@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iqi = struct.Struct('<iqi')
+
+
+class HighScore(TLObject):
+    CONSTRUCTOR_ID = 0x73a379eb
+    SUBCLASS_OF_ID = 0xd32b1e35
+    __slots__ = ('pos', 'user_id', 'score')
+
+    def __init__(self, pos: int, user_id: int, score: int):
+        """
+        Constructor for HighScore: Instance of HighScore.
+        """
+        self.pos = pos
+        self.user_id = user_id
+        self.score = score
+
+    def to_dict(self):
+        return {
+            '_': 'HighScore',
+            'pos': self.pos,
+            'user_id': self.user_id,
+            'score': self.score
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeby\xa3s',
+            _struct_iqi.pack(self.pos, self.user_id, self.score),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pos, _user_id, _score = reader.read_struct(_struct_iqi)
+        return cls(pos=_pos, user_id=_user_id, score=_score)
+
+TypeHighScore = HighScore
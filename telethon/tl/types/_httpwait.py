@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iii = struct.Struct('<iii')
+
+
+class HttpWait(TLObject):
+    CONSTRUCTOR_ID = 0x9299359f
+    SUBCLASS_OF_ID = 0x1284aed6
+    __slots__ = ('max_delay', 'wait_after', 'max_wait')
+
+    def __init__(self, max_delay: int, wait_after: int, max_wait: int):
+        """
+        Constructor for HttpWait: Instance of HttpWait.
+        """
+        self.max_delay = max_delay
+        self.wait_after = wait_after
+        self.max_wait = max_wait
+
+    def to_dict(self):
+        return {
+            '_': 'HttpWait',
+            'max_delay': self.max_delay,
+            'wait_after': self.wait_after,
+            'max_wait': self.max_wait
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9f5\x99\x92',
+            _struct_iii.pack(self.max_delay, self.wait_after, self.max_wait),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _max_delay, _wait_after, _max_wait = reader.read_struct(_struct_iii)
+        return cls(max_delay=_max_delay, wait_after=_wait_after, max_wait=_max_wait)
+
+TypeHttpWait = HttpWait
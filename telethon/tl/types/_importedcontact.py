@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class ImportedContact(TLObject):
+    CONSTRUCTOR_ID = 0xc13e3c50
+    SUBCLASS_OF_ID = 0xb545bbda
+    __slots__ = ('user_id', 'client_id')
+
+    def __init__(self, user_id: int, client_id: int):
+        """
+        Constructor for ImportedContact: Instance of ImportedContact.
+        """
+        self.user_id = user_id
+        self.client_id = client_id
+
+    def to_dict(self):
+        return {
+            '_': 'ImportedContact',
+            'user_id': self.user_id,
+            'client_id': self.client_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'P<>\xc1',
+            _struct_qq.pack(self.user_id, self.client_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _client_id = reader.read_struct(_struct_qq)
+        return cls(user_id=_user_id, client_id=_client_id)
+
+TypeImportedContact = ImportedContact
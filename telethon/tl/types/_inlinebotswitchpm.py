@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InlineBotSwitchPM(TLObject):
+    CONSTRUCTOR_ID = 0x3c20629f
+    SUBCLASS_OF_ID = 0x82b1f73b
+    __slots__ = ('text', 'start_param')
+
+    def __init__(self, text: str, start_param: str):
+        """
+        Constructor for InlineBotSwitchPM: Instance of InlineBotSwitchPM.
+        """
+        self.text = text
+        self.start_param = start_param
+
+    def to_dict(self):
+        return {
+            '_': 'InlineBotSwitchPM',
+            'text': self.text,
+            'start_param': self.start_param
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9fb <',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.start_param),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _start_param = reader.tgread_string()
+        return cls(text=_text, start_param=_start_param)
+
+TypeInlineBotSwitchPM = InlineBotSwitchPM
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InlineBotWebView(TLObject):
+    CONSTRUCTOR_ID = 0xb57295d5
+    SUBCLASS_OF_ID = 0x6ce015ea
+    __slots__ = ('text', 'url')
+
+    def __init__(self, text: str, url: str):
+        """
+        Constructor for InlineBotWebView: Instance of InlineBotWebView.
+        """
+        self.text = text
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'InlineBotWebView',
+            'text': self.text,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd5\x95r\xb5',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _url = reader.tgread_string()
+        return cls(text=_text, url=_url)
+
+TypeInlineBotWebView = InlineBotWebView
@@ -0,0 +1,128 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InlineQueryPeerTypeBotPM(TLObject):
+    CONSTRUCTOR_ID = 0xe3b2d0c
+    SUBCLASS_OF_ID = 0xafb0fa1f
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InlineQueryPeerTypeBotPM'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0c-;\x0e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InlineQueryPeerTypeBroadcast(TLObject):
+    CONSTRUCTOR_ID = 0x6334ee9a
+    SUBCLASS_OF_ID = 0xafb0fa1f
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InlineQueryPeerTypeBroadcast'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9a\xee4c',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InlineQueryPeerTypeChat(TLObject):
+    CONSTRUCTOR_ID = 0xd766c50a
+    SUBCLASS_OF_ID = 0xafb0fa1f
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InlineQueryPeerTypeChat'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\n\xc5f\xd7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InlineQueryPeerTypeMegagroup(TLObject):
+    CONSTRUCTOR_ID = 0x5ec4be43
+    SUBCLASS_OF_ID = 0xafb0fa1f
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InlineQueryPeerTypeMegagroup'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'C\xbe\xc4^',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InlineQueryPeerTypePM(TLObject):
+    CONSTRUCTOR_ID = 0x833c0fac
+    SUBCLASS_OF_ID = 0xafb0fa1f
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InlineQueryPeerTypePM'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xac\x0f<\x83',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InlineQueryPeerTypeSameBotPM(TLObject):
+    CONSTRUCTOR_ID = 0x3081ed9d
+    SUBCLASS_OF_ID = 0xafb0fa1f
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InlineQueryPeerTypeSameBotPM'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9d\xed\x810',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInlineQueryPeerType = Union[InlineQueryPeerTypeSameBotPM,InlineQueryPeerTypePM,InlineQueryPeerTypeChat,InlineQueryPeerTypeMegagroup,InlineQueryPeerTypeBroadcast,InlineQueryPeerTypeBotPM]
@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeJSONValue
+
+
+
+class InputAppEvent(TLObject):
+    CONSTRUCTOR_ID = 0x1d1b1245
+    SUBCLASS_OF_ID = 0x89322106
+    __slots__ = ('time', 'type', 'peer', 'data')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, time: float, type: str, peer: int, data: 'TypeJSONValue'):
+        """
+        Constructor for InputAppEvent: Instance of InputAppEvent.
+        """
+        self.time = time
+        self.type = type
+        self.peer = peer
+        self.data = data
+
+    def to_dict(self):
+        return {
+            '_': 'InputAppEvent',
+            'time': self.time,
+            'type': self.type,
+            'peer': self.peer,
+            'data': self.data.to_dict() if isinstance(self.data, TLObject) else self.data
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'E\x12\x1b\x1d',
+            struct.pack('<d', self.time),
+            self.serialize_bytes(self.type),
+            struct.pack('<q', self.peer),
+            self.data._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _time = reader.read_double()
+        _type = reader.tgread_string()
+        _peer = reader.read_long()
+        _data = reader.tgread_object()
+        return cls(time=_time, type=_type, peer=_peer, data=_data)
+
+TypeInputAppEvent = InputAppEvent
@@ -0,0 +1,78 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputUser
+
+
+
+class InputBotAppID(TLObject):
+    CONSTRUCTOR_ID = 0xa920bd7a
+    SUBCLASS_OF_ID = 0xb6559951
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputBotApp: Instance of either InputBotAppID, InputBotAppShortName.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotAppID',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'z\xbd \xa9',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputBotAppShortName(TLObject):
+    CONSTRUCTOR_ID = 0x908c0407
+    SUBCLASS_OF_ID = 0xb6559951
+    __slots__ = ('bot_id', 'short_name')
+
+    def __init__(self, bot_id: 'TypeInputUser', short_name: str):
+        """
+        Constructor for InputBotApp: Instance of either InputBotAppID, InputBotAppShortName.
+        """
+        self.bot_id = bot_id
+        self.short_name = short_name
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotAppShortName',
+            'bot_id': self.bot_id.to_dict() if isinstance(self.bot_id, TLObject) else self.bot_id,
+            'short_name': self.short_name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x07\x04\x8c\x90',
+            self.bot_id._bytes(),
+            self.serialize_bytes(self.short_name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _bot_id = reader.tgread_object()
+        _short_name = reader.tgread_string()
+        return cls(bot_id=_bot_id, short_name=_short_name)
+
+TypeInputBotApp = Union[InputBotAppID,InputBotAppShortName]
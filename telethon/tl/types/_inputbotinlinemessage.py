@@ -0,0 +1,460 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeInputGeoPoint, TypeInputWebDocument, TypeInvoice, TypeMessageEntity, TypeReplyMarkup
+
+
+
+class InputBotInlineMessageGame(TLObject):
+    CONSTRUCTOR_ID = 0x4b425864
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('reply_markup',)
+
+    def __init__(self, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageGame',
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'dXBK',
+            struct.pack('<I', (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(reply_markup=_reply_markup)
+
+
+class InputBotInlineMessageMediaAuto(TLObject):
+    CONSTRUCTOR_ID = 0x3380c786
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('message', 'invert_media', 'entities', 'reply_markup')
+
+    def __init__(self, message: str, invert_media: Optional[bool]=None, entities: Optional[List['TypeMessageEntity']]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.message = message
+        self.invert_media = invert_media
+        self.entities = entities
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageMediaAuto',
+            'message': self.message,
+            'invert_media': self.invert_media,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x86\xc7\x803',
+            struct.pack('<I', (0 if self.invert_media is None or self.invert_media is False else 8) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _invert_media = bool(flags & 8)
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(message=_message, invert_media=_invert_media, entities=_entities, reply_markup=_reply_markup)
+
+
+class InputBotInlineMessageMediaContact(TLObject):
+    CONSTRUCTOR_ID = 0xa6edbffd
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard', 'reply_markup')
+
+    def __init__(self, phone_number: str, first_name: str, last_name: str, vcard: str, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.phone_number = phone_number
+        self.first_name = first_name
+        self.last_name = last_name
+        self.vcard = vcard
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageMediaContact',
+            'phone_number': self.phone_number,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'vcard': self.vcard,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfd\xbf\xed\xa6',
+            struct.pack('<I', (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.first_name),
+            self.serialize_bytes(self.last_name),
+            self.serialize_bytes(self.vcard),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _phone_number = reader.tgread_string()
+        _first_name = reader.tgread_string()
+        _last_name = reader.tgread_string()
+        _vcard = reader.tgread_string()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(phone_number=_phone_number, first_name=_first_name, last_name=_last_name, vcard=_vcard, reply_markup=_reply_markup)
+
+
+class InputBotInlineMessageMediaGeo(TLObject):
+    CONSTRUCTOR_ID = 0x96929a85
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('geo_point', 'heading', 'period', 'proximity_notification_radius', 'reply_markup')
+
+    def __init__(self, geo_point: 'TypeInputGeoPoint', heading: Optional[int]=None, period: Optional[int]=None, proximity_notification_radius: Optional[int]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.geo_point = geo_point
+        self.heading = heading
+        self.period = period
+        self.proximity_notification_radius = proximity_notification_radius
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageMediaGeo',
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point,
+            'heading': self.heading,
+            'period': self.period,
+            'proximity_notification_radius': self.proximity_notification_radius,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x85\x9a\x92\x96',
+            struct.pack('<I', (0 if self.heading is None or self.heading is False else 1) | (0 if self.period is None or self.period is False else 2) | (0 if self.proximity_notification_radius is None or self.proximity_notification_radius is False else 8) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.geo_point._bytes(),
+            b'' if self.heading is None or self.heading is False else (struct.pack('<i', self.heading)),
+            b'' if self.period is None or self.period is False else (struct.pack('<i', self.period)),
+            b'' if self.proximity_notification_radius is None or self.proximity_notification_radius is False else (struct.pack('<i', self.proximity_notification_radius)),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _geo_point = reader.tgread_object()
+        if flags & 1:
+            _heading = reader.read_int()
+        else:
+            _heading = None
+        if flags & 2:
+            _period = reader.read_int()
+        else:
+            _period = None
+        if flags & 8:
+            _proximity_notification_radius = reader.read_int()
+        else:
+            _proximity_notification_radius = None
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(geo_point=_geo_point, heading=_heading, period=_period, proximity_notification_radius=_proximity_notification_radius, reply_markup=_reply_markup)
+
+
+class InputBotInlineMessageMediaInvoice(TLObject):
+    CONSTRUCTOR_ID = 0xd7e78225
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('title', 'description', 'invoice', 'payload', 'provider', 'provider_data', 'photo', 'reply_markup')
+
+    def __init__(self, title: str, description: str, invoice: 'TypeInvoice', payload: bytes, provider: str, provider_data: 'TypeDataJSON', photo: Optional['TypeInputWebDocument']=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.title = title
+        self.description = description
+        self.invoice = invoice
+        self.payload = payload
+        self.provider = provider
+        self.provider_data = provider_data
+        self.photo = photo
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageMediaInvoice',
+            'title': self.title,
+            'description': self.description,
+            'invoice': self.invoice.to_dict() if isinstance(self.invoice, TLObject) else self.invoice,
+            'payload': self.payload,
+            'provider': self.provider,
+            'provider_data': self.provider_data.to_dict() if isinstance(self.provider_data, TLObject) else self.provider_data,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'%\x82\xe7\xd7',
+            struct.pack('<I', (0 if self.photo is None or self.photo is False else 1) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            self.invoice._bytes(),
+            self.serialize_bytes(self.payload),
+            self.serialize_bytes(self.provider),
+            self.provider_data._bytes(),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 1:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        _invoice = reader.tgread_object()
+        _payload = reader.tgread_bytes()
+        _provider = reader.tgread_string()
+        _provider_data = reader.tgread_object()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(title=_title, description=_description, invoice=_invoice, payload=_payload, provider=_provider, provider_data=_provider_data, photo=_photo, reply_markup=_reply_markup)
+
+
+class InputBotInlineMessageMediaVenue(TLObject):
+    CONSTRUCTOR_ID = 0x417bbf11
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('geo_point', 'title', 'address', 'provider', 'venue_id', 'venue_type', 'reply_markup')
+
+    def __init__(self, geo_point: 'TypeInputGeoPoint', title: str, address: str, provider: str, venue_id: str, venue_type: str, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.geo_point = geo_point
+        self.title = title
+        self.address = address
+        self.provider = provider
+        self.venue_id = venue_id
+        self.venue_type = venue_type
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageMediaVenue',
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point,
+            'title': self.title,
+            'address': self.address,
+            'provider': self.provider,
+            'venue_id': self.venue_id,
+            'venue_type': self.venue_type,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x11\xbf{A',
+            struct.pack('<I', (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.geo_point._bytes(),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.address),
+            self.serialize_bytes(self.provider),
+            self.serialize_bytes(self.venue_id),
+            self.serialize_bytes(self.venue_type),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _geo_point = reader.tgread_object()
+        _title = reader.tgread_string()
+        _address = reader.tgread_string()
+        _provider = reader.tgread_string()
+        _venue_id = reader.tgread_string()
+        _venue_type = reader.tgread_string()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(geo_point=_geo_point, title=_title, address=_address, provider=_provider, venue_id=_venue_id, venue_type=_venue_type, reply_markup=_reply_markup)
+
+
+class InputBotInlineMessageMediaWebPage(TLObject):
+    CONSTRUCTOR_ID = 0xbddcc510
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('message', 'url', 'invert_media', 'force_large_media', 'force_small_media', 'optional', 'entities', 'reply_markup')
+
+    def __init__(self, message: str, url: str, invert_media: Optional[bool]=None, force_large_media: Optional[bool]=None, force_small_media: Optional[bool]=None, optional: Optional[bool]=None, entities: Optional[List['TypeMessageEntity']]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.message = message
+        self.url = url
+        self.invert_media = invert_media
+        self.force_large_media = force_large_media
+        self.force_small_media = force_small_media
+        self.optional = optional
+        self.entities = entities
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageMediaWebPage',
+            'message': self.message,
+            'url': self.url,
+            'invert_media': self.invert_media,
+            'force_large_media': self.force_large_media,
+            'force_small_media': self.force_small_media,
+            'optional': self.optional,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x10\xc5\xdc\xbd',
+            struct.pack('<I', (0 if self.invert_media is None or self.invert_media is False else 8) | (0 if self.force_large_media is None or self.force_large_media is False else 16) | (0 if self.force_small_media is None or self.force_small_media is False else 32) | (0 if self.optional is None or self.optional is False else 64) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            self.serialize_bytes(self.url),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _invert_media = bool(flags & 8)
+        _force_large_media = bool(flags & 16)
+        _force_small_media = bool(flags & 32)
+        _optional = bool(flags & 64)
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        _url = reader.tgread_string()
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(message=_message, url=_url, invert_media=_invert_media, force_large_media=_force_large_media, force_small_media=_force_small_media, optional=_optional, entities=_entities, reply_markup=_reply_markup)
+
+
+class InputBotInlineMessageText(TLObject):
+    CONSTRUCTOR_ID = 0x3dcd7a87
+    SUBCLASS_OF_ID = 0x53fb4010
+    __slots__ = ('message', 'no_webpage', 'invert_media', 'entities', 'reply_markup')
+
+    def __init__(self, message: str, no_webpage: Optional[bool]=None, invert_media: Optional[bool]=None, entities: Optional[List['TypeMessageEntity']]=None, reply_markup: Optional['TypeReplyMarkup']=None):
+        """
+        Constructor for InputBotInlineMessage: Instance of either InputBotInlineMessageMediaAuto, InputBotInlineMessageText, InputBotInlineMessageMediaGeo, InputBotInlineMessageMediaVenue, InputBotInlineMessageMediaContact, InputBotInlineMessageGame, InputBotInlineMessageMediaInvoice, InputBotInlineMessageMediaWebPage.
+        """
+        self.message = message
+        self.no_webpage = no_webpage
+        self.invert_media = invert_media
+        self.entities = entities
+        self.reply_markup = reply_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageText',
+            'message': self.message,
+            'no_webpage': self.no_webpage,
+            'invert_media': self.invert_media,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x87z\xcd=',
+            struct.pack('<I', (0 if self.no_webpage is None or self.no_webpage is False else 1) | (0 if self.invert_media is None or self.invert_media is False else 8) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.reply_markup is None or self.reply_markup is False else 4)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _no_webpage = bool(flags & 1)
+        _invert_media = bool(flags & 8)
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 4:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        return cls(message=_message, no_webpage=_no_webpage, invert_media=_invert_media, entities=_entities, reply_markup=_reply_markup)
+
+TypeInputBotInlineMessage = Union[InputBotInlineMessageMediaAuto,InputBotInlineMessageText,InputBotInlineMessageMediaGeo,InputBotInlineMessageMediaVenue,InputBotInlineMessageMediaContact,InputBotInlineMessageGame,InputBotInlineMessageMediaInvoice,InputBotInlineMessageMediaWebPage]
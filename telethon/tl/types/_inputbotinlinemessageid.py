@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iqiq = struct.Struct('<iqiq')
+_struct_iqq = struct.Struct('<iqq')
+
+
+class InputBotInlineMessageID(TLObject):
+    CONSTRUCTOR_ID = 0x890c3d89
+    SUBCLASS_OF_ID = 0x2dcd6300
+    __slots__ = ('dc_id', 'id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, dc_id: int, id: int, access_hash: int):
+        """
+        Constructor for InputBotInlineMessageID: Instance of either InputBotInlineMessageID, InputBotInlineMessageID64.
+        """
+        self.dc_id = dc_id
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageID',
+            'dc_id': self.dc_id,
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x89=\x0c\x89',
+            _struct_iqq.pack(self.dc_id, self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _dc_id, _id, _access_hash = reader.read_struct(_struct_iqq)
+        return cls(dc_id=_dc_id, id=_id, access_hash=_access_hash)
+
+
+class InputBotInlineMessageID64(TLObject):
+    CONSTRUCTOR_ID = 0xb6d915d7
+    SUBCLASS_OF_ID = 0x2dcd6300
+    __slots__ = ('dc_id', 'owner_id', 'id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, dc_id: int, owner_id: int, id: int, access_hash: int):
+        """
+        Constructor for InputBotInlineMessageID: Instance of either InputBotInlineMessageID, InputBotInlineMessageID64.
+        """
+        self.dc_id = dc_id
+        self.owner_id = owner_id
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineMessageID64',
+            'dc_id': self.dc_id,
+            'owner_id': self.owner_id,
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd7\x15\xd9\xb6',
+            _struct_iqiq.pack(self.dc_id, self.owner_id, self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _dc_id, _owner_id, _id, _access_hash = reader.read_struct(_struct_iqiq)
+        return cls(dc_id=_dc_id, owner_id=_owner_id, id=_id, access_hash=_access_hash)
+
+TypeInputBotInlineMessageID = Union[InputBotInlineMessageID,InputBotInlineMessageID64]
@@ -0,0 +1,226 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputBotInlineMessage, TypeInputDocument, TypeInputPhoto, TypeInputWebDocument
+
+
+
+class InputBotInlineResult(TLObject):
+    CONSTRUCTOR_ID = 0x88bf9319
+    SUBCLASS_OF_ID = 0x80a4a3de
+    __slots__ = ('id', 'type', 'send_message', 'title', 'description', 'url', 'thumb', 'content')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, type: str, send_message: 'TypeInputBotInlineMessage', title: Optional[str]=None, description: Optional[str]=None, url: Optional[str]=None, thumb: Optional['TypeInputWebDocument']=None, content: Optional['TypeInputWebDocument']=None):
+        """
+        Constructor for InputBotInlineResult: Instance of either InputBotInlineResult, InputBotInlineResultPhoto, InputBotInlineResultDocument, InputBotInlineResultGame.
+        """
+        self.id = id
+        self.type = type
+        self.send_message = send_message
+        self.title = title
+        self.description = description
+        self.url = url
+        self.thumb = thumb
+        self.content = content
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineResult',
+            'id': self.id,
+            'type': self.type,
+            'send_message': self.send_message.to_dict() if isinstance(self.send_message, TLObject) else self.send_message,
+            'title': self.title,
+            'description': self.description,
+            'url': self.url,
+            'thumb': self.thumb.to_dict() if isinstance(self.thumb, TLObject) else self.thumb,
+            'content': self.content.to_dict() if isinstance(self.content, TLObject) else self.content
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19\x93\xbf\x88',
+            struct.pack('<I', (0 if self.title is None or self.title is False else 2) | (0 if self.description is None or self.description is False else 4) | (0 if self.url is None or self.url is False else 8) | (0 if self.thumb is None or self.thumb is False else 16) | (0 if self.content is None or self.content is False else 32)),
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.type),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+            b'' if self.thumb is None or self.thumb is False else (self.thumb._bytes()),
+            b'' if self.content is None or self.content is False else (self.content._bytes()),
+            self.send_message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _id = reader.tgread_string()
+        _type = reader.tgread_string()
+        if flags & 2:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 4:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        if flags & 8:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        if flags & 16:
+            _thumb = reader.tgread_object()
+        else:
+            _thumb = None
+        if flags & 32:
+            _content = reader.tgread_object()
+        else:
+            _content = None
+        _send_message = reader.tgread_object()
+        return cls(id=_id, type=_type, send_message=_send_message, title=_title, description=_description, url=_url, thumb=_thumb, content=_content)
+
+
+class InputBotInlineResultDocument(TLObject):
+    CONSTRUCTOR_ID = 0xfff8fdc4
+    SUBCLASS_OF_ID = 0x80a4a3de
+    __slots__ = ('id', 'type', 'document', 'send_message', 'title', 'description')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, type: str, document: 'TypeInputDocument', send_message: 'TypeInputBotInlineMessage', title: Optional[str]=None, description: Optional[str]=None):
+        """
+        Constructor for InputBotInlineResult: Instance of either InputBotInlineResult, InputBotInlineResultPhoto, InputBotInlineResultDocument, InputBotInlineResultGame.
+        """
+        self.id = id
+        self.type = type
+        self.document = document
+        self.send_message = send_message
+        self.title = title
+        self.description = description
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineResultDocument',
+            'id': self.id,
+            'type': self.type,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'send_message': self.send_message.to_dict() if isinstance(self.send_message, TLObject) else self.send_message,
+            'title': self.title,
+            'description': self.description
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4\xfd\xf8\xff',
+            struct.pack('<I', (0 if self.title is None or self.title is False else 2) | (0 if self.description is None or self.description is False else 4)),
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.type),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            self.document._bytes(),
+            self.send_message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _id = reader.tgread_string()
+        _type = reader.tgread_string()
+        if flags & 2:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 4:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        _document = reader.tgread_object()
+        _send_message = reader.tgread_object()
+        return cls(id=_id, type=_type, document=_document, send_message=_send_message, title=_title, description=_description)
+
+
+class InputBotInlineResultGame(TLObject):
+    CONSTRUCTOR_ID = 0x4fa417f2
+    SUBCLASS_OF_ID = 0x80a4a3de
+    __slots__ = ('id', 'short_name', 'send_message')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, short_name: str, send_message: 'TypeInputBotInlineMessage'):
+        """
+        Constructor for InputBotInlineResult: Instance of either InputBotInlineResult, InputBotInlineResultPhoto, InputBotInlineResultDocument, InputBotInlineResultGame.
+        """
+        self.id = id
+        self.short_name = short_name
+        self.send_message = send_message
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineResultGame',
+            'id': self.id,
+            'short_name': self.short_name,
+            'send_message': self.send_message.to_dict() if isinstance(self.send_message, TLObject) else self.send_message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf2\x17\xa4O',
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.short_name),
+            self.send_message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _short_name = reader.tgread_string()
+        _send_message = reader.tgread_object()
+        return cls(id=_id, short_name=_short_name, send_message=_send_message)
+
+
+class InputBotInlineResultPhoto(TLObject):
+    CONSTRUCTOR_ID = 0xa8d864a7
+    SUBCLASS_OF_ID = 0x80a4a3de
+    __slots__ = ('id', 'type', 'photo', 'send_message')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, type: str, photo: 'TypeInputPhoto', send_message: 'TypeInputBotInlineMessage'):
+        """
+        Constructor for InputBotInlineResult: Instance of either InputBotInlineResult, InputBotInlineResultPhoto, InputBotInlineResultDocument, InputBotInlineResultGame.
+        """
+        self.id = id
+        self.type = type
+        self.photo = photo
+        self.send_message = send_message
+
+    def to_dict(self):
+        return {
+            '_': 'InputBotInlineResultPhoto',
+            'id': self.id,
+            'type': self.type,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'send_message': self.send_message.to_dict() if isinstance(self.send_message, TLObject) else self.send_message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa7d\xd8\xa8',
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.type),
+            self.photo._bytes(),
+            self.send_message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _type = reader.tgread_string()
+        _photo = reader.tgread_object()
+        _send_message = reader.tgread_object()
+        return cls(id=_id, type=_type, photo=_photo, send_message=_send_message)
+
+TypeInputBotInlineResult = Union[InputBotInlineResult,InputBotInlineResultPhoto,InputBotInlineResultDocument,InputBotInlineResultGame]
@@ -0,0 +1,78 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputUser
+
+
+
+class InputBusinessBotRecipients(TLObject):
+    CONSTRUCTOR_ID = 0xc4e5921e
+    SUBCLASS_OF_ID = 0xa9d3f55b
+    __slots__ = ('existing_chats', 'new_chats', 'contacts', 'non_contacts', 'exclude_selected', 'users', 'exclude_users')
+
+    def __init__(self, existing_chats: Optional[bool]=None, new_chats: Optional[bool]=None, contacts: Optional[bool]=None, non_contacts: Optional[bool]=None, exclude_selected: Optional[bool]=None, users: Optional[List['TypeInputUser']]=None, exclude_users: Optional[List['TypeInputUser']]=None):
+        """
+        Constructor for InputBusinessBotRecipients: Instance of InputBusinessBotRecipients.
+        """
+        self.existing_chats = existing_chats
+        self.new_chats = new_chats
+        self.contacts = contacts
+        self.non_contacts = non_contacts
+        self.exclude_selected = exclude_selected
+        self.users = users
+        self.exclude_users = exclude_users
+
+    def to_dict(self):
+        return {
+            '_': 'InputBusinessBotRecipients',
+            'existing_chats': self.existing_chats,
+            'new_chats': self.new_chats,
+            'contacts': self.contacts,
+            'non_contacts': self.non_contacts,
+            'exclude_selected': self.exclude_selected,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'exclude_users': [] if self.exclude_users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.exclude_users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1e\x92\xe5\xc4',
+            struct.pack('<I', (0 if self.existing_chats is None or self.existing_chats is False else 1) | (0 if self.new_chats is None or self.new_chats is False else 2) | (0 if self.contacts is None or self.contacts is False else 4) | (0 if self.non_contacts is None or self.non_contacts is False else 8) | (0 if self.exclude_selected is None or self.exclude_selected is False else 32) | (0 if self.users is None or self.users is False else 16) | (0 if self.exclude_users is None or self.exclude_users is False else 64)),
+            b'' if self.users is None or self.users is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users))),
+            b'' if self.exclude_users is None or self.exclude_users is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.exclude_users)),b''.join(x._bytes() for x in self.exclude_users))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _existing_chats = bool(flags & 1)
+        _new_chats = bool(flags & 2)
+        _contacts = bool(flags & 4)
+        _non_contacts = bool(flags & 8)
+        _exclude_selected = bool(flags & 32)
+        if flags & 16:
+            reader.read_int()
+            _users = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _users.append(_x)
+
+        else:
+            _users = None
+        if flags & 64:
+            reader.read_int()
+            _exclude_users = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _exclude_users.append(_x)
+
+        else:
+            _exclude_users = None
+        return cls(existing_chats=_existing_chats, new_chats=_new_chats, contacts=_contacts, non_contacts=_non_contacts, exclude_selected=_exclude_selected, users=_users, exclude_users=_exclude_users)
+
+TypeInputBusinessBotRecipients = InputBusinessBotRecipients
@@ -0,0 +1,62 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity
+
+
+
+class InputBusinessChatLink(TLObject):
+    CONSTRUCTOR_ID = 0x11679fa7
+    SUBCLASS_OF_ID = 0xab670513
+    __slots__ = ('message', 'entities', 'title')
+
+    def __init__(self, message: str, entities: Optional[List['TypeMessageEntity']]=None, title: Optional[str]=None):
+        """
+        Constructor for InputBusinessChatLink: Instance of InputBusinessChatLink.
+        """
+        self.message = message
+        self.entities = entities
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'InputBusinessChatLink',
+            'message': self.message,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa7\x9fg\x11',
+            struct.pack('<I', (0 if self.entities is None or self.entities is False else 1) | (0 if self.title is None or self.title is False else 2)),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _message = reader.tgread_string()
+        if flags & 1:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 2:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        return cls(message=_message, entities=_entities, title=_title)
+
+TypeInputBusinessChatLink = InputBusinessChatLink
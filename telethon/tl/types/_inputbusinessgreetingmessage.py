@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputBusinessRecipients
+
+
+
+class InputBusinessGreetingMessage(TLObject):
+    CONSTRUCTOR_ID = 0x194cb3b
+    SUBCLASS_OF_ID = 0x6278dcdd
+    __slots__ = ('shortcut_id', 'recipients', 'no_activity_days')
+
+    def __init__(self, shortcut_id: int, recipients: 'TypeInputBusinessRecipients', no_activity_days: int):
+        """
+        Constructor for InputBusinessGreetingMessage: Instance of InputBusinessGreetingMessage.
+        """
+        self.shortcut_id = shortcut_id
+        self.recipients = recipients
+        self.no_activity_days = no_activity_days
+
+    def to_dict(self):
+        return {
+            '_': 'InputBusinessGreetingMessage',
+            'shortcut_id': self.shortcut_id,
+            'recipients': self.recipients.to_dict() if isinstance(self.recipients, TLObject) else self.recipients,
+            'no_activity_days': self.no_activity_days
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';\xcb\x94\x01',
+            struct.pack('<i', self.shortcut_id),
+            self.recipients._bytes(),
+            struct.pack('<i', self.no_activity_days),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _shortcut_id = reader.read_int()
+        _recipients = reader.tgread_object()
+        _no_activity_days = reader.read_int()
+        return cls(shortcut_id=_shortcut_id, recipients=_recipients, no_activity_days=_no_activity_days)
+
+TypeInputBusinessGreetingMessage = InputBusinessGreetingMessage
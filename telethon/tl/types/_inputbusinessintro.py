@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputDocument
+
+
+
+class InputBusinessIntro(TLObject):
+    CONSTRUCTOR_ID = 0x9c469cd
+    SUBCLASS_OF_ID = 0x645a767d
+    __slots__ = ('title', 'description', 'sticker')
+
+    def __init__(self, title: str, description: str, sticker: Optional['TypeInputDocument']=None):
+        """
+        Constructor for InputBusinessIntro: Instance of InputBusinessIntro.
+        """
+        self.title = title
+        self.description = description
+        self.sticker = sticker
+
+    def to_dict(self):
+        return {
+            '_': 'InputBusinessIntro',
+            'title': self.title,
+            'description': self.description,
+            'sticker': self.sticker.to_dict() if isinstance(self.sticker, TLObject) else self.sticker
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcdi\xc4\t',
+            struct.pack('<I', (0 if self.sticker is None or self.sticker is False else 1)),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.sticker is None or self.sticker is False else (self.sticker._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 1:
+            _sticker = reader.tgread_object()
+        else:
+            _sticker = None
+        return cls(title=_title, description=_description, sticker=_sticker)
+
+TypeInputBusinessIntro = InputBusinessIntro
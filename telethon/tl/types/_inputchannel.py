@@ -0,0 +1,100 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iq = struct.Struct('<iq')
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer
+
+
+
+class InputChannel(TLObject):
+    CONSTRUCTOR_ID = 0xf35aec28
+    SUBCLASS_OF_ID = 0x40f202fd
+    __slots__ = ('channel_id', 'access_hash')
+
+    def __init__(self, channel_id: int, access_hash: int):
+        """
+        Constructor for InputChannel: Instance of either InputChannelEmpty, InputChannel, InputChannelFromMessage.
+        """
+        self.channel_id = channel_id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputChannel',
+            'channel_id': self.channel_id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'(\xecZ\xf3',
+            _struct_qq.pack(self.channel_id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _channel_id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(channel_id=_channel_id, access_hash=_access_hash)
+
+
+class InputChannelEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xee8c1e86
+    SUBCLASS_OF_ID = 0x40f202fd
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputChannelEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x86\x1e\x8c\xee',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputChannelFromMessage(TLObject):
+    CONSTRUCTOR_ID = 0x5b934f9d
+    SUBCLASS_OF_ID = 0x40f202fd
+    __slots__ = ('peer', 'msg_id', 'channel_id')
+
+    def __init__(self, peer: 'TypeInputPeer', msg_id: int, channel_id: int):
+        """
+        Constructor for InputChannel: Instance of either InputChannelEmpty, InputChannel, InputChannelFromMessage.
+        """
+        self.peer = peer
+        self.msg_id = msg_id
+        self.channel_id = channel_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputChannelFromMessage',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'msg_id': self.msg_id,
+            'channel_id': self.channel_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9dO\x93[',
+            self.peer._bytes(),
+            _struct_iq.pack(self.msg_id, self.channel_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _msg_id, _channel_id = reader.read_struct(_struct_iq)
+        return cls(peer=_peer, msg_id=_msg_id, channel_id=_channel_id)
+
+TypeInputChannel = Union[InputChannelEmpty,InputChannel,InputChannelFromMessage]
@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputChatlistDialogFilter(TLObject):
+    CONSTRUCTOR_ID = 0xf3e0da33
+    SUBCLASS_OF_ID = 0x23f9659
+    __slots__ = ('filter_id',)
+
+    def __init__(self, filter_id: int):
+        """
+        Constructor for InputChatlist: Instance of InputChatlistDialogFilter.
+        """
+        self.filter_id = filter_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputChatlistDialogFilter',
+            'filter_id': self.filter_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'3\xda\xe0\xf3',
+            struct.pack('<i', self.filter_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _filter_id = reader.read_int()
+        return cls(filter_id=_filter_id)
+
+TypeInputChatlist = InputChatlistDialogFilter
@@ -0,0 +1,117 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputFile, TypeInputPhoto, TypeVideoSize
+
+
+
+class InputChatPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x8953ad37
+    SUBCLASS_OF_ID = 0xd4eb2d74
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeInputPhoto'):
+        """
+        Constructor for InputChatPhoto: Instance of either InputChatPhotoEmpty, InputChatUploadedPhoto, InputChatPhoto.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputChatPhoto',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'7\xadS\x89',
+            self.id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_object()
+        return cls(id=_id)
+
+
+class InputChatPhotoEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x1ca48f57
+    SUBCLASS_OF_ID = 0xd4eb2d74
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputChatPhotoEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'W\x8f\xa4\x1c',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputChatUploadedPhoto(TLObject):
+    CONSTRUCTOR_ID = 0xbdcdaec0
+    SUBCLASS_OF_ID = 0xd4eb2d74
+    __slots__ = ('file', 'video', 'video_start_ts', 'video_emoji_markup')
+
+    def __init__(self, file: Optional['TypeInputFile']=None, video: Optional['TypeInputFile']=None, video_start_ts: Optional[float]=None, video_emoji_markup: Optional['TypeVideoSize']=None):
+        """
+        Constructor for InputChatPhoto: Instance of either InputChatPhotoEmpty, InputChatUploadedPhoto, InputChatPhoto.
+        """
+        self.file = file
+        self.video = video
+        self.video_start_ts = video_start_ts
+        self.video_emoji_markup = video_emoji_markup
+
+    def to_dict(self):
+        return {
+            '_': 'InputChatUploadedPhoto',
+            'file': self.file.to_dict() if isinstance(self.file, TLObject) else self.file,
+            'video': self.video.to_dict() if isinstance(self.video, TLObject) else self.video,
+            'video_start_ts': self.video_start_ts,
+            'video_emoji_markup': self.video_emoji_markup.to_dict() if isinstance(self.video_emoji_markup, TLObject) else self.video_emoji_markup
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc0\xae\xcd\xbd',
+            struct.pack('<I', (0 if self.file is None or self.file is False else 1) | (0 if self.video is None or self.video is False else 2) | (0 if self.video_start_ts is None or self.video_start_ts is False else 4) | (0 if self.video_emoji_markup is None or self.video_emoji_markup is False else 8)),
+            b'' if self.file is None or self.file is False else (self.file._bytes()),
+            b'' if self.video is None or self.video is False else (self.video._bytes()),
+            b'' if self.video_start_ts is None or self.video_start_ts is False else (struct.pack('<d', self.video_start_ts)),
+            b'' if self.video_emoji_markup is None or self.video_emoji_markup is False else (self.video_emoji_markup._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _file = reader.tgread_object()
+        else:
+            _file = None
+        if flags & 2:
+            _video = reader.tgread_object()
+        else:
+            _video = None
+        if flags & 4:
+            _video_start_ts = reader.read_double()
+        else:
+            _video_start_ts = None
+        if flags & 8:
+            _video_emoji_markup = reader.tgread_object()
+        else:
+            _video_emoji_markup = None
+        return cls(file=_file, video=_video, video_start_ts=_video_start_ts, video_emoji_markup=_video_emoji_markup)
+
+TypeInputChatPhoto = Union[InputChatPhotoEmpty,InputChatUploadedPhoto,InputChatPhoto]
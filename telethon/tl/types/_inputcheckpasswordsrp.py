@@ -0,0 +1,65 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputCheckPasswordEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x9880f658
+    SUBCLASS_OF_ID = 0xd41af560
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputCheckPasswordEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'X\xf6\x80\x98',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputCheckPasswordSRP(TLObject):
+    CONSTRUCTOR_ID = 0xd27ff082
+    SUBCLASS_OF_ID = 0xd41af560
+    __slots__ = ('srp_id', 'A', 'M1')
+
+    def __init__(self, srp_id: int, A: bytes, M1: bytes):
+        """
+        Constructor for InputCheckPasswordSRP: Instance of either InputCheckPasswordEmpty, InputCheckPasswordSRP.
+        """
+        self.srp_id = srp_id
+        self.A = A
+        self.M1 = M1
+
+    def to_dict(self):
+        return {
+            '_': 'InputCheckPasswordSRP',
+            'srp_id': self.srp_id,
+            'A': self.A,
+            'M1': self.M1
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x82\xf0\x7f\xd2',
+            struct.pack('<q', self.srp_id),
+            self.serialize_bytes(self.A),
+            self.serialize_bytes(self.M1),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _srp_id = reader.read_long()
+        _A = reader.tgread_bytes()
+        _M1 = reader.tgread_bytes()
+        return cls(srp_id=_srp_id, A=_A, M1=_M1)
+
+TypeInputCheckPasswordSRP = Union[InputCheckPasswordEmpty,InputCheckPasswordSRP]
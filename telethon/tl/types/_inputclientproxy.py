@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputClientProxy(TLObject):
+    CONSTRUCTOR_ID = 0x75588b3f
+    SUBCLASS_OF_ID = 0x91a4346
+    __slots__ = ('address', 'port')
+
+    def __init__(self, address: str, port: int):
+        """
+        Constructor for InputClientProxy: Instance of InputClientProxy.
+        """
+        self.address = address
+        self.port = port
+
+    def to_dict(self):
+        return {
+            '_': 'InputClientProxy',
+            'address': self.address,
+            'port': self.port
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?\x8bXu',
+            self.serialize_bytes(self.address),
+            struct.pack('<i', self.port),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _address = reader.tgread_string()
+        _port = reader.read_int()
+        return cls(address=_address, port=_port)
+
+TypeInputClientProxy = InputClientProxy
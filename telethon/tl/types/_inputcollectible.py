@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputCollectiblePhone(TLObject):
+    CONSTRUCTOR_ID = 0xa2e214a4
+    SUBCLASS_OF_ID = 0x2a0f81eb
+    __slots__ = ('phone',)
+
+    def __init__(self, phone: str):
+        """
+        Constructor for InputCollectible: Instance of either InputCollectibleUsername, InputCollectiblePhone.
+        """
+        self.phone = phone
+
+    def to_dict(self):
+        return {
+            '_': 'InputCollectiblePhone',
+            'phone': self.phone
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa4\x14\xe2\xa2',
+            self.serialize_bytes(self.phone),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone = reader.tgread_string()
+        return cls(phone=_phone)
+
+
+class InputCollectibleUsername(TLObject):
+    CONSTRUCTOR_ID = 0xe39460a9
+    SUBCLASS_OF_ID = 0x2a0f81eb
+    __slots__ = ('username',)
+
+    def __init__(self, username: str):
+        """
+        Constructor for InputCollectible: Instance of either InputCollectibleUsername, InputCollectiblePhone.
+        """
+        self.username = username
+
+    def to_dict(self):
+        return {
+            '_': 'InputCollectibleUsername',
+            'username': self.username
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa9`\x94\xe3',
+            self.serialize_bytes(self.username),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _username = reader.tgread_string()
+        return cls(username=_username)
+
+TypeInputCollectible = Union[InputCollectibleUsername,InputCollectiblePhone]
@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputPhoneContact(TLObject):
+    CONSTRUCTOR_ID = 0xf392b7f4
+    SUBCLASS_OF_ID = 0xae696a82
+    __slots__ = ('client_id', 'phone', 'first_name', 'last_name')
+
+    def __init__(self, client_id: int, phone: str, first_name: str, last_name: str):
+        """
+        Constructor for InputContact: Instance of InputPhoneContact.
+        """
+        self.client_id = client_id
+        self.phone = phone
+        self.first_name = first_name
+        self.last_name = last_name
+
+    def to_dict(self):
+        return {
+            '_': 'InputPhoneContact',
+            'client_id': self.client_id,
+            'phone': self.phone,
+            'first_name': self.first_name,
+            'last_name': self.last_name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf4\xb7\x92\xf3',
+            struct.pack('<q', self.client_id),
+            self.serialize_bytes(self.phone),
+            self.serialize_bytes(self.first_name),
+            self.serialize_bytes(self.last_name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _client_id = reader.read_long()
+        _phone = reader.tgread_string()
+        _first_name = reader.tgread_string()
+        _last_name = reader.tgread_string()
+        return cls(client_id=_client_id, phone=_phone, first_name=_first_name, last_name=_last_name)
+
+TypeInputContact = InputPhoneContact
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer
+
+
+
+class InputDialogPeer(TLObject):
+    CONSTRUCTOR_ID = 0xfcaafeb7
+    SUBCLASS_OF_ID = 0xa21c9795
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypeInputPeer'):
+        """
+        Constructor for InputDialogPeer: Instance of either InputDialogPeer, InputDialogPeerFolder.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'InputDialogPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb7\xfe\xaa\xfc',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class InputDialogPeerFolder(TLObject):
+    CONSTRUCTOR_ID = 0x64600527
+    SUBCLASS_OF_ID = 0xa21c9795
+    __slots__ = ('folder_id',)
+
+    def __init__(self, folder_id: int):
+        """
+        Constructor for InputDialogPeer: Instance of either InputDialogPeer, InputDialogPeerFolder.
+        """
+        self.folder_id = folder_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputDialogPeerFolder',
+            'folder_id': self.folder_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"'\x05`d",
+            struct.pack('<i', self.folder_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _folder_id = reader.read_int()
+        return cls(folder_id=_folder_id)
+
+TypeInputDialogPeer = Union[InputDialogPeer,InputDialogPeerFolder]
@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class InputDocument(TLObject):
+    CONSTRUCTOR_ID = 0x1abfb575
+    SUBCLASS_OF_ID = 0xf33fdb68
+    __slots__ = ('id', 'access_hash', 'file_reference')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, file_reference: bytes):
+        """
+        Constructor for InputDocument: Instance of either InputDocumentEmpty, InputDocument.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.file_reference = file_reference
+
+    def to_dict(self):
+        return {
+            '_': 'InputDocument',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'file_reference': self.file_reference
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'u\xb5\xbf\x1a',
+            _struct_qq.pack(self.id, self.access_hash),
+            self.serialize_bytes(self.file_reference),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        _file_reference = reader.tgread_bytes()
+        return cls(id=_id, access_hash=_access_hash, file_reference=_file_reference)
+
+
+class InputDocumentEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x72f0eaae
+    SUBCLASS_OF_ID = 0xf33fdb68
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputDocumentEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xae\xea\xf0r',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInputDocument = Union[InputDocumentEmpty,InputDocument]
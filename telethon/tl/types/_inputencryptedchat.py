@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iq = struct.Struct('<iq')
+
+
+class InputEncryptedChat(TLObject):
+    CONSTRUCTOR_ID = 0xf141b5e1
+    SUBCLASS_OF_ID = 0x6c7606c0
+    __slots__ = ('chat_id', 'access_hash')
+
+    def __init__(self, chat_id: int, access_hash: int):
+        """
+        Constructor for InputEncryptedChat: Instance of InputEncryptedChat.
+        """
+        self.chat_id = chat_id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputEncryptedChat',
+            'chat_id': self.chat_id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe1\xb5A\xf1',
+            _struct_iq.pack(self.chat_id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _chat_id, _access_hash = reader.read_struct(_struct_iq)
+        return cls(chat_id=_chat_id, access_hash=_access_hash)
+
+TypeInputEncryptedChat = InputEncryptedChat
@@ -0,0 +1,138 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+_struct_qii = struct.Struct('<qii')
+_struct_qq = struct.Struct('<qq')
+
+
+class InputEncryptedFile(TLObject):
+    CONSTRUCTOR_ID = 0x5a17b5e5
+    SUBCLASS_OF_ID = 0x8574c27a
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputEncryptedFile: Instance of either InputEncryptedFileEmpty, InputEncryptedFileUploaded, InputEncryptedFile, InputEncryptedFileBigUploaded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputEncryptedFile',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe5\xb5\x17Z',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputEncryptedFileBigUploaded(TLObject):
+    CONSTRUCTOR_ID = 0x2dc173c8
+    SUBCLASS_OF_ID = 0x8574c27a
+    __slots__ = ('id', 'parts', 'key_fingerprint')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, parts: int, key_fingerprint: int):
+        """
+        Constructor for InputEncryptedFile: Instance of either InputEncryptedFileEmpty, InputEncryptedFileUploaded, InputEncryptedFile, InputEncryptedFileBigUploaded.
+        """
+        self.id = id
+        self.parts = parts
+        self.key_fingerprint = key_fingerprint
+
+    def to_dict(self):
+        return {
+            '_': 'InputEncryptedFileBigUploaded',
+            'id': self.id,
+            'parts': self.parts,
+            'key_fingerprint': self.key_fingerprint
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc8s\xc1-',
+            _struct_qii.pack(self.id, self.parts, self.key_fingerprint),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _parts, _key_fingerprint = reader.read_struct(_struct_qii)
+        return cls(id=_id, parts=_parts, key_fingerprint=_key_fingerprint)
+
+
+class InputEncryptedFileEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x1837c364
+    SUBCLASS_OF_ID = 0x8574c27a
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputEncryptedFileEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'd\xc37\x18',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputEncryptedFileUploaded(TLObject):
+    CONSTRUCTOR_ID = 0x64bd0306
+    SUBCLASS_OF_ID = 0x8574c27a
+    __slots__ = ('id', 'parts', 'md5_checksum', 'key_fingerprint')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, parts: int, md5_checksum: str, key_fingerprint: int):
+        """
+        Constructor for InputEncryptedFile: Instance of either InputEncryptedFileEmpty, InputEncryptedFileUploaded, InputEncryptedFile, InputEncryptedFileBigUploaded.
+        """
+        self.id = id
+        self.parts = parts
+        self.md5_checksum = md5_checksum
+        self.key_fingerprint = key_fingerprint
+
+    def to_dict(self):
+        return {
+            '_': 'InputEncryptedFileUploaded',
+            'id': self.id,
+            'parts': self.parts,
+            'md5_checksum': self.md5_checksum,
+            'key_fingerprint': self.key_fingerprint
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x06\x03\xbdd',
+            _struct_qi.pack(self.id, self.parts),
+            self.serialize_bytes(self.md5_checksum),
+            struct.pack('<i', self.key_fingerprint),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _parts = reader.read_struct(_struct_qi)
+        _md5_checksum = reader.tgread_string()
+        _key_fingerprint = reader.read_int()
+        return cls(id=_id, parts=_parts, md5_checksum=_md5_checksum, key_fingerprint=_key_fingerprint)
+
+TypeInputEncryptedFile = Union[InputEncryptedFileEmpty,InputEncryptedFileUploaded,InputEncryptedFile,InputEncryptedFileBigUploaded]
@@ -0,0 +1,119 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputDocument
+
+
+
+class InputFile(TLObject):
+    CONSTRUCTOR_ID = 0xf52ff27f
+    SUBCLASS_OF_ID = 0xe7655f1f
+    __slots__ = ('id', 'parts', 'name', 'md5_checksum')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, parts: int, name: str, md5_checksum: str):
+        """
+        Constructor for InputFile: Instance of either InputFile, InputFileBig, InputFileStoryDocument.
+        """
+        self.id = id
+        self.parts = parts
+        self.name = name
+        self.md5_checksum = md5_checksum
+
+    def to_dict(self):
+        return {
+            '_': 'InputFile',
+            'id': self.id,
+            'parts': self.parts,
+            'name': self.name,
+            'md5_checksum': self.md5_checksum
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f\xf2/\xf5',
+            _struct_qi.pack(self.id, self.parts),
+            self.serialize_bytes(self.name),
+            self.serialize_bytes(self.md5_checksum),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _parts = reader.read_struct(_struct_qi)
+        _name = reader.tgread_string()
+        _md5_checksum = reader.tgread_string()
+        return cls(id=_id, parts=_parts, name=_name, md5_checksum=_md5_checksum)
+
+
+class InputFileBig(TLObject):
+    CONSTRUCTOR_ID = 0xfa4f0bb5
+    SUBCLASS_OF_ID = 0xe7655f1f
+    __slots__ = ('id', 'parts', 'name')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, parts: int, name: str):
+        """
+        Constructor for InputFile: Instance of either InputFile, InputFileBig, InputFileStoryDocument.
+        """
+        self.id = id
+        self.parts = parts
+        self.name = name
+
+    def to_dict(self):
+        return {
+            '_': 'InputFileBig',
+            'id': self.id,
+            'parts': self.parts,
+            'name': self.name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb5\x0bO\xfa',
+            _struct_qi.pack(self.id, self.parts),
+            self.serialize_bytes(self.name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _parts = reader.read_struct(_struct_qi)
+        _name = reader.tgread_string()
+        return cls(id=_id, parts=_parts, name=_name)
+
+
+class InputFileStoryDocument(TLObject):
+    CONSTRUCTOR_ID = 0x62dc8b48
+    SUBCLASS_OF_ID = 0xe7655f1f
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeInputDocument'):
+        """
+        Constructor for InputFile: Instance of either InputFile, InputFileBig, InputFileStoryDocument.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputFileStoryDocument',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'H\x8b\xdcb',
+            self.id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_object()
+        return cls(id=_id)
+
+TypeInputFile = Union[InputFile,InputFileBig,InputFileStoryDocument]
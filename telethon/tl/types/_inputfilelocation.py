@@ -0,0 +1,385 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+_struct_qiq = struct.Struct('<qiq')
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputGroupCall, TypeInputPeer, TypeInputStickerSet
+
+
+
+class InputDocumentFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0xbad07584
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('id', 'access_hash', 'file_reference', 'thumb_size')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, file_reference: bytes, thumb_size: str):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.file_reference = file_reference
+        self.thumb_size = thumb_size
+
+    def to_dict(self):
+        return {
+            '_': 'InputDocumentFileLocation',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'file_reference': self.file_reference,
+            'thumb_size': self.thumb_size
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x84u\xd0\xba',
+            _struct_qq.pack(self.id, self.access_hash),
+            self.serialize_bytes(self.file_reference),
+            self.serialize_bytes(self.thumb_size),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        _file_reference = reader.tgread_bytes()
+        _thumb_size = reader.tgread_string()
+        return cls(id=_id, access_hash=_access_hash, file_reference=_file_reference, thumb_size=_thumb_size)
+
+
+class InputEncryptedFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0xf5235d55
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputEncryptedFileLocation',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'U]#\xf5',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0xdfdaabe1
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('volume_id', 'local_id', 'secret', 'file_reference')
+
+    def __init__(self, volume_id: int, local_id: int, secret: int, file_reference: bytes):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.volume_id = volume_id
+        self.local_id = local_id
+        self.secret = secret
+        self.file_reference = file_reference
+
+    def to_dict(self):
+        return {
+            '_': 'InputFileLocation',
+            'volume_id': self.volume_id,
+            'local_id': self.local_id,
+            'secret': self.secret,
+            'file_reference': self.file_reference
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe1\xab\xda\xdf',
+            _struct_qiq.pack(self.volume_id, self.local_id, self.secret),
+            self.serialize_bytes(self.file_reference),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _volume_id, _local_id, _secret = reader.read_struct(_struct_qiq)
+        _file_reference = reader.tgread_bytes()
+        return cls(volume_id=_volume_id, local_id=_local_id, secret=_secret, file_reference=_file_reference)
+
+
+class InputGroupCallStream(TLObject):
+    CONSTRUCTOR_ID = 0x598a92a
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('call', 'time_ms', 'scale', 'video_channel', 'video_quality')
+
+    def __init__(self, call: 'TypeInputGroupCall', time_ms: int, scale: int, video_channel: Optional[int]=None, video_quality: Optional[int]=None):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.call = call
+        self.time_ms = time_ms
+        self.scale = scale
+        self.video_channel = video_channel
+        self.video_quality = video_quality
+
+    def to_dict(self):
+        return {
+            '_': 'InputGroupCallStream',
+            'call': self.call.to_dict() if isinstance(self.call, TLObject) else self.call,
+            'time_ms': self.time_ms,
+            'scale': self.scale,
+            'video_channel': self.video_channel,
+            'video_quality': self.video_quality
+        }
+
+    def _bytes(self):
+        assert ((self.video_channel or self.video_channel is not None) and (self.video_quality or self.video_quality is not None)) or ((self.video_channel is None or self.video_channel is False) and (self.video_quality is None or self.video_quality is False)), 'video_channel, video_quality parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'*\xa9\x98\x05',
+            struct.pack('<I', (0 if self.video_channel is None or self.video_channel is False else 1) | (0 if self.video_quality is None or self.video_quality is False else 1)),
+            self.call._bytes(),
+            _struct_qi.pack(self.time_ms, self.scale),
+            b'' if self.video_channel is None or self.video_channel is False else (struct.pack('<i', self.video_channel)),
+            b'' if self.video_quality is None or self.video_quality is False else (struct.pack('<i', self.video_quality)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _call = reader.tgread_object()
+        _time_ms, _scale = reader.read_struct(_struct_qi)
+        if flags & 1:
+            _video_channel = reader.read_int()
+        else:
+            _video_channel = None
+        if flags & 1:
+            _video_quality = reader.read_int()
+        else:
+            _video_quality = None
+        return cls(call=_call, time_ms=_time_ms, scale=_scale, video_channel=_video_channel, video_quality=_video_quality)
+
+
+class InputPeerPhotoFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0x37257e99
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('peer', 'photo_id', 'big')
+
+    def __init__(self, peer: 'TypeInputPeer', photo_id: int, big: Optional[bool]=None):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.peer = peer
+        self.photo_id = photo_id
+        self.big = big
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerPhotoFileLocation',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'photo_id': self.photo_id,
+            'big': self.big
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x99~%7',
+            struct.pack('<I', (0 if self.big is None or self.big is False else 1)),
+            self.peer._bytes(),
+            struct.pack('<q', self.photo_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _big = bool(flags & 1)
+        _peer = reader.tgread_object()
+        _photo_id = reader.read_long()
+        return cls(peer=_peer, photo_id=_photo_id, big=_big)
+
+
+class InputPhotoFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0x40181ffe
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('id', 'access_hash', 'file_reference', 'thumb_size')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, file_reference: bytes, thumb_size: str):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.file_reference = file_reference
+        self.thumb_size = thumb_size
+
+    def to_dict(self):
+        return {
+            '_': 'InputPhotoFileLocation',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'file_reference': self.file_reference,
+            'thumb_size': self.thumb_size
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfe\x1f\x18@',
+            _struct_qq.pack(self.id, self.access_hash),
+            self.serialize_bytes(self.file_reference),
+            self.serialize_bytes(self.thumb_size),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        _file_reference = reader.tgread_bytes()
+        _thumb_size = reader.tgread_string()
+        return cls(id=_id, access_hash=_access_hash, file_reference=_file_reference, thumb_size=_thumb_size)
+
+
+class InputPhotoLegacyFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0xd83466f3
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('id', 'access_hash', 'file_reference', 'volume_id', 'local_id', 'secret')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, file_reference: bytes, volume_id: int, local_id: int, secret: int):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.file_reference = file_reference
+        self.volume_id = volume_id
+        self.local_id = local_id
+        self.secret = secret
+
+    def to_dict(self):
+        return {
+            '_': 'InputPhotoLegacyFileLocation',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'file_reference': self.file_reference,
+            'volume_id': self.volume_id,
+            'local_id': self.local_id,
+            'secret': self.secret
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf3f4\xd8',
+            _struct_qq.pack(self.id, self.access_hash),
+            self.serialize_bytes(self.file_reference),
+            _struct_qiq.pack(self.volume_id, self.local_id, self.secret),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        _file_reference = reader.tgread_bytes()
+        _volume_id, _local_id, _secret = reader.read_struct(_struct_qiq)
+        return cls(id=_id, access_hash=_access_hash, file_reference=_file_reference, volume_id=_volume_id, local_id=_local_id, secret=_secret)
+
+
+class InputSecureFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0xcbc7ee28
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputSecureFileLocation',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'(\xee\xc7\xcb',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputStickerSetThumb(TLObject):
+    CONSTRUCTOR_ID = 0x9d84f3db
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ('stickerset', 'thumb_version')
+
+    def __init__(self, stickerset: 'TypeInputStickerSet', thumb_version: int):
+        """
+        Constructor for InputFileLocation: Instance of either InputFileLocation, InputEncryptedFileLocation, InputDocumentFileLocation, InputSecureFileLocation, InputTakeoutFileLocation, InputPhotoFileLocation, InputPhotoLegacyFileLocation, InputPeerPhotoFileLocation, InputStickerSetThumb, InputGroupCallStream.
+        """
+        self.stickerset = stickerset
+        self.thumb_version = thumb_version
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetThumb',
+            'stickerset': self.stickerset.to_dict() if isinstance(self.stickerset, TLObject) else self.stickerset,
+            'thumb_version': self.thumb_version
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdb\xf3\x84\x9d',
+            self.stickerset._bytes(),
+            struct.pack('<i', self.thumb_version),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stickerset = reader.tgread_object()
+        _thumb_version = reader.read_int()
+        return cls(stickerset=_stickerset, thumb_version=_thumb_version)
+
+
+class InputTakeoutFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0x29be5899
+    SUBCLASS_OF_ID = 0x1523d462
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputTakeoutFileLocation'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x99X\xbe)',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInputFileLocation = Union[InputFileLocation,InputEncryptedFileLocation,InputDocumentFileLocation,InputSecureFileLocation,InputTakeoutFileLocation,InputPhotoFileLocation,InputPhotoLegacyFileLocation,InputPeerPhotoFileLocation,InputStickerSetThumb,InputGroupCallStream]
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer
+
+
+
+class InputFolderPeer(TLObject):
+    CONSTRUCTOR_ID = 0xfbd2c296
+    SUBCLASS_OF_ID = 0x74825e00
+    __slots__ = ('peer', 'folder_id')
+
+    def __init__(self, peer: 'TypeInputPeer', folder_id: int):
+        """
+        Constructor for InputFolderPeer: Instance of InputFolderPeer.
+        """
+        self.peer = peer
+        self.folder_id = folder_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputFolderPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'folder_id': self.folder_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x96\xc2\xd2\xfb',
+            self.peer._bytes(),
+            struct.pack('<i', self.folder_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _folder_id = reader.read_int()
+        return cls(peer=_peer, folder_id=_folder_id)
+
+TypeInputFolderPeer = InputFolderPeer
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Idd = struct.Struct('<Idd')
+_struct_idd = struct.Struct('<idd')
+
+
+class InputGeoPoint(TLObject):
+    CONSTRUCTOR_ID = 0x48222faf
+    SUBCLASS_OF_ID = 0x430d225
+    __slots__ = ('lat', 'long', 'accuracy_radius')
+
+    def __init__(self, lat: float, long: float, accuracy_radius: Optional[int]=None):
+        """
+        Constructor for InputGeoPoint: Instance of either InputGeoPointEmpty, InputGeoPoint.
+        """
+        self.lat = lat
+        self.long = long
+        self.accuracy_radius = accuracy_radius
+
+    def to_dict(self):
+        return {
+            '_': 'InputGeoPoint',
+            'lat': self.lat,
+            'long': self.long,
+            'accuracy_radius': self.accuracy_radius
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xaf/"H',
+            _struct_Idd.pack((0 if self.accuracy_radius is None or self.accuracy_radius is False else 1), self.lat, self.long),
+            b'' if self.accuracy_radius is None or self.accuracy_radius is False else (struct.pack('<i', self.accuracy_radius)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _lat, _long = reader.read_struct(_struct_idd)
+        if flags & 1:
+            _accuracy_radius = reader.read_int()
+        else:
+            _accuracy_radius = None
+        return cls(lat=_lat, long=_long, accuracy_radius=_accuracy_radius)
+
+
+class InputGeoPointEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xe4c123d6
+    SUBCLASS_OF_ID = 0x430d225
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputGeoPointEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd6#\xc1\xe4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInputGeoPoint = Union[InputGeoPointEmpty,InputGeoPoint]
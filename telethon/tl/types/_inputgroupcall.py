@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class InputGroupCall(TLObject):
+    CONSTRUCTOR_ID = 0xd8aa840f
+    SUBCLASS_OF_ID = 0x58611ab1
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputGroupCall: Instance of InputGroupCall.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputGroupCall',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0f\x84\xaa\xd8',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+TypeInputGroupCall = InputGroupCall
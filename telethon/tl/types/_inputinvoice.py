@@ -0,0 +1,325 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer, TypeInputSavedStarGift, TypeInputStorePaymentPurpose, TypeInputUser, TypePremiumGiftCodeOption, TypeTextWithEntities
+
+
+
+class InputInvoiceChatInviteSubscription(TLObject):
+    CONSTRUCTOR_ID = 0x34e793f1
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('hash',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: str):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.hash = hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoiceChatInviteSubscription',
+            'hash': self.hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf1\x93\xe74',
+            self.serialize_bytes(self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.tgread_string()
+        return cls(hash=_hash)
+
+
+class InputInvoiceMessage(TLObject):
+    CONSTRUCTOR_ID = 0xc5b56859
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('peer', 'msg_id')
+
+    def __init__(self, peer: 'TypeInputPeer', msg_id: int):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.peer = peer
+        self.msg_id = msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoiceMessage',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'msg_id': self.msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Yh\xb5\xc5',
+            self.peer._bytes(),
+            struct.pack('<i', self.msg_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _msg_id = reader.read_int()
+        return cls(peer=_peer, msg_id=_msg_id)
+
+
+class InputInvoicePremiumGiftCode(TLObject):
+    CONSTRUCTOR_ID = 0x98986c0d
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('purpose', 'option')
+
+    def __init__(self, purpose: 'TypeInputStorePaymentPurpose', option: 'TypePremiumGiftCodeOption'):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.purpose = purpose
+        self.option = option
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoicePremiumGiftCode',
+            'purpose': self.purpose.to_dict() if isinstance(self.purpose, TLObject) else self.purpose,
+            'option': self.option.to_dict() if isinstance(self.option, TLObject) else self.option
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\rl\x98\x98',
+            self.purpose._bytes(),
+            self.option._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _purpose = reader.tgread_object()
+        _option = reader.tgread_object()
+        return cls(purpose=_purpose, option=_option)
+
+
+class InputInvoicePremiumGiftStars(TLObject):
+    CONSTRUCTOR_ID = 0xdabab2ef
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('user_id', 'months', 'message')
+
+    def __init__(self, user_id: 'TypeInputUser', months: int, message: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.user_id = user_id
+        self.months = months
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoicePremiumGiftStars',
+            'user_id': self.user_id.to_dict() if isinstance(self.user_id, TLObject) else self.user_id,
+            'months': self.months,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xef\xb2\xba\xda',
+            struct.pack('<I', (0 if self.message is None or self.message is False else 1)),
+            self.user_id._bytes(),
+            struct.pack('<i', self.months),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _user_id = reader.tgread_object()
+        _months = reader.read_int()
+        if flags & 1:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        return cls(user_id=_user_id, months=_months, message=_message)
+
+
+class InputInvoiceSlug(TLObject):
+    CONSTRUCTOR_ID = 0xc326caef
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('slug',)
+
+    def __init__(self, slug: str):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.slug = slug
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoiceSlug',
+            'slug': self.slug
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xef\xca&\xc3',
+            self.serialize_bytes(self.slug),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _slug = reader.tgread_string()
+        return cls(slug=_slug)
+
+
+class InputInvoiceStarGift(TLObject):
+    CONSTRUCTOR_ID = 0xe8625e92
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('peer', 'gift_id', 'hide_name', 'include_upgrade', 'message')
+
+    def __init__(self, peer: 'TypeInputPeer', gift_id: int, hide_name: Optional[bool]=None, include_upgrade: Optional[bool]=None, message: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.peer = peer
+        self.gift_id = gift_id
+        self.hide_name = hide_name
+        self.include_upgrade = include_upgrade
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoiceStarGift',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'gift_id': self.gift_id,
+            'hide_name': self.hide_name,
+            'include_upgrade': self.include_upgrade,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x92^b\xe8',
+            struct.pack('<I', (0 if self.hide_name is None or self.hide_name is False else 1) | (0 if self.include_upgrade is None or self.include_upgrade is False else 4) | (0 if self.message is None or self.message is False else 2)),
+            self.peer._bytes(),
+            struct.pack('<q', self.gift_id),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _hide_name = bool(flags & 1)
+        _include_upgrade = bool(flags & 4)
+        _peer = reader.tgread_object()
+        _gift_id = reader.read_long()
+        if flags & 2:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        return cls(peer=_peer, gift_id=_gift_id, hide_name=_hide_name, include_upgrade=_include_upgrade, message=_message)
+
+
+class InputInvoiceStarGiftTransfer(TLObject):
+    CONSTRUCTOR_ID = 0x4a5f5bd9
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('stargift', 'to_id')
+
+    def __init__(self, stargift: 'TypeInputSavedStarGift', to_id: 'TypeInputPeer'):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.stargift = stargift
+        self.to_id = to_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoiceStarGiftTransfer',
+            'stargift': self.stargift.to_dict() if isinstance(self.stargift, TLObject) else self.stargift,
+            'to_id': self.to_id.to_dict() if isinstance(self.to_id, TLObject) else self.to_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9[_J',
+            self.stargift._bytes(),
+            self.to_id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stargift = reader.tgread_object()
+        _to_id = reader.tgread_object()
+        return cls(stargift=_stargift, to_id=_to_id)
+
+
+class InputInvoiceStarGiftUpgrade(TLObject):
+    CONSTRUCTOR_ID = 0x4d818d5d
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('stargift', 'keep_original_details')
+
+    def __init__(self, stargift: 'TypeInputSavedStarGift', keep_original_details: Optional[bool]=None):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.stargift = stargift
+        self.keep_original_details = keep_original_details
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoiceStarGiftUpgrade',
+            'stargift': self.stargift.to_dict() if isinstance(self.stargift, TLObject) else self.stargift,
+            'keep_original_details': self.keep_original_details
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b']\x8d\x81M',
+            struct.pack('<I', (0 if self.keep_original_details is None or self.keep_original_details is False else 1)),
+            self.stargift._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _keep_original_details = bool(flags & 1)
+        _stargift = reader.tgread_object()
+        return cls(stargift=_stargift, keep_original_details=_keep_original_details)
+
+
+class InputInvoiceStars(TLObject):
+    CONSTRUCTOR_ID = 0x65f00ce3
+    SUBCLASS_OF_ID = 0x726e9bfe
+    __slots__ = ('purpose',)
+
+    def __init__(self, purpose: 'TypeInputStorePaymentPurpose'):
+        """
+        Constructor for InputInvoice: Instance of either InputInvoiceMessage, InputInvoiceSlug, InputInvoicePremiumGiftCode, InputInvoiceStars, InputInvoiceChatInviteSubscription, InputInvoiceStarGift, InputInvoiceStarGiftUpgrade, InputInvoiceStarGiftTransfer, InputInvoicePremiumGiftStars.
+        """
+        self.purpose = purpose
+
+    def to_dict(self):
+        return {
+            '_': 'InputInvoiceStars',
+            'purpose': self.purpose.to_dict() if isinstance(self.purpose, TLObject) else self.purpose
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe3\x0c\xf0e',
+            self.purpose._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _purpose = reader.tgread_object()
+        return cls(purpose=_purpose)
+
+TypeInputInvoice = Union[InputInvoiceMessage,InputInvoiceSlug,InputInvoicePremiumGiftCode,InputInvoiceStars,InputInvoiceChatInviteSubscription,InputInvoiceStarGift,InputInvoiceStarGiftUpgrade,InputInvoiceStarGiftTransfer,InputInvoicePremiumGiftStars]
@@ -0,0 +1,881 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeDocumentAttribute, TypeInputDocument, TypeInputFile, TypeInputGame, TypeInputGeoPoint, TypeInputPeer, TypeInputPhoto, TypeInputWebDocument, TypeInvoice, TypeMessageEntity, TypePoll
+
+
+
+class InputMediaContact(TLObject):
+    CONSTRUCTOR_ID = 0xf8ab7dfb
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard')
+
+    def __init__(self, phone_number: str, first_name: str, last_name: str, vcard: str):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.phone_number = phone_number
+        self.first_name = first_name
+        self.last_name = last_name
+        self.vcard = vcard
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaContact',
+            'phone_number': self.phone_number,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'vcard': self.vcard
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfb}\xab\xf8',
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.first_name),
+            self.serialize_bytes(self.last_name),
+            self.serialize_bytes(self.vcard),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone_number = reader.tgread_string()
+        _first_name = reader.tgread_string()
+        _last_name = reader.tgread_string()
+        _vcard = reader.tgread_string()
+        return cls(phone_number=_phone_number, first_name=_first_name, last_name=_last_name, vcard=_vcard)
+
+
+class InputMediaDice(TLObject):
+    CONSTRUCTOR_ID = 0xe66fbf7b
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('emoticon',)
+
+    def __init__(self, emoticon: str):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.emoticon = emoticon
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaDice',
+            'emoticon': self.emoticon
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'{\xbfo\xe6',
+            self.serialize_bytes(self.emoticon),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoticon = reader.tgread_string()
+        return cls(emoticon=_emoticon)
+
+
+class InputMediaDocument(TLObject):
+    CONSTRUCTOR_ID = 0xa8763ab5
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('id', 'spoiler', 'video_cover', 'video_timestamp', 'ttl_seconds', 'query')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeInputDocument', spoiler: Optional[bool]=None, video_cover: Optional['TypeInputPhoto']=None, video_timestamp: Optional[int]=None, ttl_seconds: Optional[int]=None, query: Optional[str]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.id = id
+        self.spoiler = spoiler
+        self.video_cover = video_cover
+        self.video_timestamp = video_timestamp
+        self.ttl_seconds = ttl_seconds
+        self.query = query
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaDocument',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id,
+            'spoiler': self.spoiler,
+            'video_cover': self.video_cover.to_dict() if isinstance(self.video_cover, TLObject) else self.video_cover,
+            'video_timestamp': self.video_timestamp,
+            'ttl_seconds': self.ttl_seconds,
+            'query': self.query
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb5:v\xa8',
+            struct.pack('<I', (0 if self.spoiler is None or self.spoiler is False else 4) | (0 if self.video_cover is None or self.video_cover is False else 8) | (0 if self.video_timestamp is None or self.video_timestamp is False else 16) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 1) | (0 if self.query is None or self.query is False else 2)),
+            self.id._bytes(),
+            b'' if self.video_cover is None or self.video_cover is False else (self.video_cover._bytes()),
+            b'' if self.video_timestamp is None or self.video_timestamp is False else (struct.pack('<i', self.video_timestamp)),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+            b'' if self.query is None or self.query is False else (self.serialize_bytes(self.query)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _spoiler = bool(flags & 4)
+        _id = reader.tgread_object()
+        if flags & 8:
+            _video_cover = reader.tgread_object()
+        else:
+            _video_cover = None
+        if flags & 16:
+            _video_timestamp = reader.read_int()
+        else:
+            _video_timestamp = None
+        if flags & 1:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        if flags & 2:
+            _query = reader.tgread_string()
+        else:
+            _query = None
+        return cls(id=_id, spoiler=_spoiler, video_cover=_video_cover, video_timestamp=_video_timestamp, ttl_seconds=_ttl_seconds, query=_query)
+
+
+class InputMediaDocumentExternal(TLObject):
+    CONSTRUCTOR_ID = 0x779600f9
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('url', 'spoiler', 'ttl_seconds', 'video_cover', 'video_timestamp')
+
+    def __init__(self, url: str, spoiler: Optional[bool]=None, ttl_seconds: Optional[int]=None, video_cover: Optional['TypeInputPhoto']=None, video_timestamp: Optional[int]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.url = url
+        self.spoiler = spoiler
+        self.ttl_seconds = ttl_seconds
+        self.video_cover = video_cover
+        self.video_timestamp = video_timestamp
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaDocumentExternal',
+            'url': self.url,
+            'spoiler': self.spoiler,
+            'ttl_seconds': self.ttl_seconds,
+            'video_cover': self.video_cover.to_dict() if isinstance(self.video_cover, TLObject) else self.video_cover,
+            'video_timestamp': self.video_timestamp
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf9\x00\x96w',
+            struct.pack('<I', (0 if self.spoiler is None or self.spoiler is False else 2) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 1) | (0 if self.video_cover is None or self.video_cover is False else 4) | (0 if self.video_timestamp is None or self.video_timestamp is False else 8)),
+            self.serialize_bytes(self.url),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+            b'' if self.video_cover is None or self.video_cover is False else (self.video_cover._bytes()),
+            b'' if self.video_timestamp is None or self.video_timestamp is False else (struct.pack('<i', self.video_timestamp)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _spoiler = bool(flags & 2)
+        _url = reader.tgread_string()
+        if flags & 1:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        if flags & 4:
+            _video_cover = reader.tgread_object()
+        else:
+            _video_cover = None
+        if flags & 8:
+            _video_timestamp = reader.read_int()
+        else:
+            _video_timestamp = None
+        return cls(url=_url, spoiler=_spoiler, ttl_seconds=_ttl_seconds, video_cover=_video_cover, video_timestamp=_video_timestamp)
+
+
+class InputMediaEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x9664f57f
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f\xf5d\x96',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMediaGame(TLObject):
+    CONSTRUCTOR_ID = 0xd33f43f3
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeInputGame'):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaGame',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf3C?\xd3',
+            self.id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_object()
+        return cls(id=_id)
+
+
+class InputMediaGeoLive(TLObject):
+    CONSTRUCTOR_ID = 0x971fa843
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('geo_point', 'stopped', 'heading', 'period', 'proximity_notification_radius')
+
+    def __init__(self, geo_point: 'TypeInputGeoPoint', stopped: Optional[bool]=None, heading: Optional[int]=None, period: Optional[int]=None, proximity_notification_radius: Optional[int]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.geo_point = geo_point
+        self.stopped = stopped
+        self.heading = heading
+        self.period = period
+        self.proximity_notification_radius = proximity_notification_radius
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaGeoLive',
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point,
+            'stopped': self.stopped,
+            'heading': self.heading,
+            'period': self.period,
+            'proximity_notification_radius': self.proximity_notification_radius
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'C\xa8\x1f\x97',
+            struct.pack('<I', (0 if self.stopped is None or self.stopped is False else 1) | (0 if self.heading is None or self.heading is False else 4) | (0 if self.period is None or self.period is False else 2) | (0 if self.proximity_notification_radius is None or self.proximity_notification_radius is False else 8)),
+            self.geo_point._bytes(),
+            b'' if self.heading is None or self.heading is False else (struct.pack('<i', self.heading)),
+            b'' if self.period is None or self.period is False else (struct.pack('<i', self.period)),
+            b'' if self.proximity_notification_radius is None or self.proximity_notification_radius is False else (struct.pack('<i', self.proximity_notification_radius)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _stopped = bool(flags & 1)
+        _geo_point = reader.tgread_object()
+        if flags & 4:
+            _heading = reader.read_int()
+        else:
+            _heading = None
+        if flags & 2:
+            _period = reader.read_int()
+        else:
+            _period = None
+        if flags & 8:
+            _proximity_notification_radius = reader.read_int()
+        else:
+            _proximity_notification_radius = None
+        return cls(geo_point=_geo_point, stopped=_stopped, heading=_heading, period=_period, proximity_notification_radius=_proximity_notification_radius)
+
+
+class InputMediaGeoPoint(TLObject):
+    CONSTRUCTOR_ID = 0xf9c44144
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('geo_point',)
+
+    def __init__(self, geo_point: 'TypeInputGeoPoint'):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.geo_point = geo_point
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaGeoPoint',
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'DA\xc4\xf9',
+            self.geo_point._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _geo_point = reader.tgread_object()
+        return cls(geo_point=_geo_point)
+
+
+class InputMediaInvoice(TLObject):
+    CONSTRUCTOR_ID = 0x405fef0d
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('title', 'description', 'invoice', 'payload', 'provider_data', 'photo', 'provider', 'start_param', 'extended_media')
+
+    def __init__(self, title: str, description: str, invoice: 'TypeInvoice', payload: bytes, provider_data: 'TypeDataJSON', photo: Optional['TypeInputWebDocument']=None, provider: Optional[str]=None, start_param: Optional[str]=None, extended_media: Optional['TypeInputMedia']=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.title = title
+        self.description = description
+        self.invoice = invoice
+        self.payload = payload
+        self.provider_data = provider_data
+        self.photo = photo
+        self.provider = provider
+        self.start_param = start_param
+        self.extended_media = extended_media
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaInvoice',
+            'title': self.title,
+            'description': self.description,
+            'invoice': self.invoice.to_dict() if isinstance(self.invoice, TLObject) else self.invoice,
+            'payload': self.payload,
+            'provider_data': self.provider_data.to_dict() if isinstance(self.provider_data, TLObject) else self.provider_data,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'provider': self.provider,
+            'start_param': self.start_param,
+            'extended_media': self.extended_media.to_dict() if isinstance(self.extended_media, TLObject) else self.extended_media
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r\xef_@',
+            struct.pack('<I', (0 if self.photo is None or self.photo is False else 1) | (0 if self.provider is None or self.provider is False else 8) | (0 if self.start_param is None or self.start_param is False else 2) | (0 if self.extended_media is None or self.extended_media is False else 4)),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            self.invoice._bytes(),
+            self.serialize_bytes(self.payload),
+            b'' if self.provider is None or self.provider is False else (self.serialize_bytes(self.provider)),
+            self.provider_data._bytes(),
+            b'' if self.start_param is None or self.start_param is False else (self.serialize_bytes(self.start_param)),
+            b'' if self.extended_media is None or self.extended_media is False else (self.extended_media._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 1:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        _invoice = reader.tgread_object()
+        _payload = reader.tgread_bytes()
+        if flags & 8:
+            _provider = reader.tgread_string()
+        else:
+            _provider = None
+        _provider_data = reader.tgread_object()
+        if flags & 2:
+            _start_param = reader.tgread_string()
+        else:
+            _start_param = None
+        if flags & 4:
+            _extended_media = reader.tgread_object()
+        else:
+            _extended_media = None
+        return cls(title=_title, description=_description, invoice=_invoice, payload=_payload, provider_data=_provider_data, photo=_photo, provider=_provider, start_param=_start_param, extended_media=_extended_media)
+
+
+class InputMediaPaidMedia(TLObject):
+    CONSTRUCTOR_ID = 0xc4103386
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('stars_amount', 'extended_media', 'payload')
+
+    def __init__(self, stars_amount: int, extended_media: List['TypeInputMedia'], payload: Optional[str]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.stars_amount = stars_amount
+        self.extended_media = extended_media
+        self.payload = payload
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaPaidMedia',
+            'stars_amount': self.stars_amount,
+            'extended_media': [] if self.extended_media is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.extended_media],
+            'payload': self.payload
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x863\x10\xc4',
+            _struct_Iq.pack((0 if self.payload is None or self.payload is False else 1), self.stars_amount),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.extended_media)),b''.join(x._bytes() for x in self.extended_media),
+            b'' if self.payload is None or self.payload is False else (self.serialize_bytes(self.payload)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _stars_amount = reader.read_struct(_struct_iq)
+        reader.read_int()
+        _extended_media = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _extended_media.append(_x)
+
+        if flags & 1:
+            _payload = reader.tgread_string()
+        else:
+            _payload = None
+        return cls(stars_amount=_stars_amount, extended_media=_extended_media, payload=_payload)
+
+
+class InputMediaPhoto(TLObject):
+    CONSTRUCTOR_ID = 0xb3ba0635
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('id', 'spoiler', 'ttl_seconds')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeInputPhoto', spoiler: Optional[bool]=None, ttl_seconds: Optional[int]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.id = id
+        self.spoiler = spoiler
+        self.ttl_seconds = ttl_seconds
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaPhoto',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id,
+            'spoiler': self.spoiler,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'5\x06\xba\xb3',
+            struct.pack('<I', (0 if self.spoiler is None or self.spoiler is False else 2) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 1)),
+            self.id._bytes(),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _spoiler = bool(flags & 2)
+        _id = reader.tgread_object()
+        if flags & 1:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        return cls(id=_id, spoiler=_spoiler, ttl_seconds=_ttl_seconds)
+
+
+class InputMediaPhotoExternal(TLObject):
+    CONSTRUCTOR_ID = 0xe5bbfe1a
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('url', 'spoiler', 'ttl_seconds')
+
+    def __init__(self, url: str, spoiler: Optional[bool]=None, ttl_seconds: Optional[int]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.url = url
+        self.spoiler = spoiler
+        self.ttl_seconds = ttl_seconds
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaPhotoExternal',
+            'url': self.url,
+            'spoiler': self.spoiler,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1a\xfe\xbb\xe5',
+            struct.pack('<I', (0 if self.spoiler is None or self.spoiler is False else 2) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 1)),
+            self.serialize_bytes(self.url),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _spoiler = bool(flags & 2)
+        _url = reader.tgread_string()
+        if flags & 1:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        return cls(url=_url, spoiler=_spoiler, ttl_seconds=_ttl_seconds)
+
+
+class InputMediaPoll(TLObject):
+    CONSTRUCTOR_ID = 0xf94e5f1
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('poll', 'correct_answers', 'solution', 'solution_entities')
+
+    def __init__(self, poll: 'TypePoll', correct_answers: Optional[List[bytes]]=None, solution: Optional[str]=None, solution_entities: Optional[List['TypeMessageEntity']]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.poll = poll
+        self.correct_answers = correct_answers
+        self.solution = solution
+        self.solution_entities = solution_entities
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaPoll',
+            'poll': self.poll.to_dict() if isinstance(self.poll, TLObject) else self.poll,
+            'correct_answers': [] if self.correct_answers is None else self.correct_answers[:],
+            'solution': self.solution,
+            'solution_entities': [] if self.solution_entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.solution_entities]
+        }
+
+    def _bytes(self):
+        assert ((self.solution or self.solution is not None) and (self.solution_entities or self.solution_entities is not None)) or ((self.solution is None or self.solution is False) and (self.solution_entities is None or self.solution_entities is False)), 'solution, solution_entities parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xf1\xe5\x94\x0f',
+            struct.pack('<I', (0 if self.correct_answers is None or self.correct_answers is False else 1) | (0 if self.solution is None or self.solution is False else 2) | (0 if self.solution_entities is None or self.solution_entities is False else 2)),
+            self.poll._bytes(),
+            b'' if self.correct_answers is None or self.correct_answers is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.correct_answers)),b''.join(self.serialize_bytes(x) for x in self.correct_answers))),
+            b'' if self.solution is None or self.solution is False else (self.serialize_bytes(self.solution)),
+            b'' if self.solution_entities is None or self.solution_entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.solution_entities)),b''.join(x._bytes() for x in self.solution_entities))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _poll = reader.tgread_object()
+        if flags & 1:
+            reader.read_int()
+            _correct_answers = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_bytes()
+                _correct_answers.append(_x)
+
+        else:
+            _correct_answers = None
+        if flags & 2:
+            _solution = reader.tgread_string()
+        else:
+            _solution = None
+        if flags & 2:
+            reader.read_int()
+            _solution_entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _solution_entities.append(_x)
+
+        else:
+            _solution_entities = None
+        return cls(poll=_poll, correct_answers=_correct_answers, solution=_solution, solution_entities=_solution_entities)
+
+
+class InputMediaStory(TLObject):
+    CONSTRUCTOR_ID = 0x89fdd778
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('peer', 'id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, peer: 'TypeInputPeer', id: int):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.peer = peer
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaStory',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'x\xd7\xfd\x89',
+            self.peer._bytes(),
+            struct.pack('<i', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _id = reader.read_int()
+        return cls(peer=_peer, id=_id)
+
+
+class InputMediaUploadedDocument(TLObject):
+    CONSTRUCTOR_ID = 0x37c9330
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('file', 'mime_type', 'attributes', 'nosound_video', 'force_file', 'spoiler', 'thumb', 'stickers', 'video_cover', 'video_timestamp', 'ttl_seconds')
+
+    def __init__(self, file: 'TypeInputFile', mime_type: str, attributes: List['TypeDocumentAttribute'], nosound_video: Optional[bool]=None, force_file: Optional[bool]=None, spoiler: Optional[bool]=None, thumb: Optional['TypeInputFile']=None, stickers: Optional[List['TypeInputDocument']]=None, video_cover: Optional['TypeInputPhoto']=None, video_timestamp: Optional[int]=None, ttl_seconds: Optional[int]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.file = file
+        self.mime_type = mime_type
+        self.attributes = attributes
+        self.nosound_video = nosound_video
+        self.force_file = force_file
+        self.spoiler = spoiler
+        self.thumb = thumb
+        self.stickers = stickers
+        self.video_cover = video_cover
+        self.video_timestamp = video_timestamp
+        self.ttl_seconds = ttl_seconds
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaUploadedDocument',
+            'file': self.file.to_dict() if isinstance(self.file, TLObject) else self.file,
+            'mime_type': self.mime_type,
+            'attributes': [] if self.attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.attributes],
+            'nosound_video': self.nosound_video,
+            'force_file': self.force_file,
+            'spoiler': self.spoiler,
+            'thumb': self.thumb.to_dict() if isinstance(self.thumb, TLObject) else self.thumb,
+            'stickers': [] if self.stickers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stickers],
+            'video_cover': self.video_cover.to_dict() if isinstance(self.video_cover, TLObject) else self.video_cover,
+            'video_timestamp': self.video_timestamp,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'0\x93|\x03',
+            struct.pack('<I', (0 if self.nosound_video is None or self.nosound_video is False else 8) | (0 if self.force_file is None or self.force_file is False else 16) | (0 if self.spoiler is None or self.spoiler is False else 32) | (0 if self.thumb is None or self.thumb is False else 4) | (0 if self.stickers is None or self.stickers is False else 1) | (0 if self.video_cover is None or self.video_cover is False else 64) | (0 if self.video_timestamp is None or self.video_timestamp is False else 128) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 2)),
+            self.file._bytes(),
+            b'' if self.thumb is None or self.thumb is False else (self.thumb._bytes()),
+            self.serialize_bytes(self.mime_type),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.attributes)),b''.join(x._bytes() for x in self.attributes),
+            b'' if self.stickers is None or self.stickers is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stickers)),b''.join(x._bytes() for x in self.stickers))),
+            b'' if self.video_cover is None or self.video_cover is False else (self.video_cover._bytes()),
+            b'' if self.video_timestamp is None or self.video_timestamp is False else (struct.pack('<i', self.video_timestamp)),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _nosound_video = bool(flags & 8)
+        _force_file = bool(flags & 16)
+        _spoiler = bool(flags & 32)
+        _file = reader.tgread_object()
+        if flags & 4:
+            _thumb = reader.tgread_object()
+        else:
+            _thumb = None
+        _mime_type = reader.tgread_string()
+        reader.read_int()
+        _attributes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _attributes.append(_x)
+
+        if flags & 1:
+            reader.read_int()
+            _stickers = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _stickers.append(_x)
+
+        else:
+            _stickers = None
+        if flags & 64:
+            _video_cover = reader.tgread_object()
+        else:
+            _video_cover = None
+        if flags & 128:
+            _video_timestamp = reader.read_int()
+        else:
+            _video_timestamp = None
+        if flags & 2:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        return cls(file=_file, mime_type=_mime_type, attributes=_attributes, nosound_video=_nosound_video, force_file=_force_file, spoiler=_spoiler, thumb=_thumb, stickers=_stickers, video_cover=_video_cover, video_timestamp=_video_timestamp, ttl_seconds=_ttl_seconds)
+
+
+class InputMediaUploadedPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x1e287d04
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('file', 'spoiler', 'stickers', 'ttl_seconds')
+
+    def __init__(self, file: 'TypeInputFile', spoiler: Optional[bool]=None, stickers: Optional[List['TypeInputDocument']]=None, ttl_seconds: Optional[int]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.file = file
+        self.spoiler = spoiler
+        self.stickers = stickers
+        self.ttl_seconds = ttl_seconds
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaUploadedPhoto',
+            'file': self.file.to_dict() if isinstance(self.file, TLObject) else self.file,
+            'spoiler': self.spoiler,
+            'stickers': [] if self.stickers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stickers],
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x04}(\x1e',
+            struct.pack('<I', (0 if self.spoiler is None or self.spoiler is False else 4) | (0 if self.stickers is None or self.stickers is False else 1) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 2)),
+            self.file._bytes(),
+            b'' if self.stickers is None or self.stickers is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stickers)),b''.join(x._bytes() for x in self.stickers))),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _spoiler = bool(flags & 4)
+        _file = reader.tgread_object()
+        if flags & 1:
+            reader.read_int()
+            _stickers = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _stickers.append(_x)
+
+        else:
+            _stickers = None
+        if flags & 2:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        return cls(file=_file, spoiler=_spoiler, stickers=_stickers, ttl_seconds=_ttl_seconds)
+
+
+class InputMediaVenue(TLObject):
+    CONSTRUCTOR_ID = 0xc13d1c11
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('geo_point', 'title', 'address', 'provider', 'venue_id', 'venue_type')
+
+    def __init__(self, geo_point: 'TypeInputGeoPoint', title: str, address: str, provider: str, venue_id: str, venue_type: str):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.geo_point = geo_point
+        self.title = title
+        self.address = address
+        self.provider = provider
+        self.venue_id = venue_id
+        self.venue_type = venue_type
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaVenue',
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point,
+            'title': self.title,
+            'address': self.address,
+            'provider': self.provider,
+            'venue_id': self.venue_id,
+            'venue_type': self.venue_type
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x11\x1c=\xc1',
+            self.geo_point._bytes(),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.address),
+            self.serialize_bytes(self.provider),
+            self.serialize_bytes(self.venue_id),
+            self.serialize_bytes(self.venue_type),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _geo_point = reader.tgread_object()
+        _title = reader.tgread_string()
+        _address = reader.tgread_string()
+        _provider = reader.tgread_string()
+        _venue_id = reader.tgread_string()
+        _venue_type = reader.tgread_string()
+        return cls(geo_point=_geo_point, title=_title, address=_address, provider=_provider, venue_id=_venue_id, venue_type=_venue_type)
+
+
+class InputMediaWebPage(TLObject):
+    CONSTRUCTOR_ID = 0xc21b8849
+    SUBCLASS_OF_ID = 0xfaf846f4
+    __slots__ = ('url', 'force_large_media', 'force_small_media', 'optional')
+
+    def __init__(self, url: str, force_large_media: Optional[bool]=None, force_small_media: Optional[bool]=None, optional: Optional[bool]=None):
+        """
+        Constructor for InputMedia: Instance of either InputMediaEmpty, InputMediaUploadedPhoto, InputMediaPhoto, InputMediaGeoPoint, InputMediaContact, InputMediaUploadedDocument, InputMediaDocument, InputMediaVenue, InputMediaPhotoExternal, InputMediaDocumentExternal, InputMediaGame, InputMediaInvoice, InputMediaGeoLive, InputMediaPoll, InputMediaDice, InputMediaStory, InputMediaWebPage, InputMediaPaidMedia.
+        """
+        self.url = url
+        self.force_large_media = force_large_media
+        self.force_small_media = force_small_media
+        self.optional = optional
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaWebPage',
+            'url': self.url,
+            'force_large_media': self.force_large_media,
+            'force_small_media': self.force_small_media,
+            'optional': self.optional
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'I\x88\x1b\xc2',
+            struct.pack('<I', (0 if self.force_large_media is None or self.force_large_media is False else 1) | (0 if self.force_small_media is None or self.force_small_media is False else 2) | (0 if self.optional is None or self.optional is False else 4)),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _force_large_media = bool(flags & 1)
+        _force_small_media = bool(flags & 2)
+        _optional = bool(flags & 4)
+        _url = reader.tgread_string()
+        return cls(url=_url, force_large_media=_force_large_media, force_small_media=_force_small_media, optional=_optional)
+
+TypeInputMedia = Union[InputMediaEmpty,InputMediaUploadedPhoto,InputMediaPhoto,InputMediaGeoPoint,InputMediaContact,InputMediaUploadedDocument,InputMediaDocument,InputMediaVenue,InputMediaPhotoExternal,InputMediaDocumentExternal,InputMediaGame,InputMediaInvoice,InputMediaGeoLive,InputMediaPoll,InputMediaDice,InputMediaStory,InputMediaWebPage,InputMediaPaidMedia]
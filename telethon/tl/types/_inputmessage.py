@@ -0,0 +1,122 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iq = struct.Struct('<iq')
+
+
+class InputMessageCallbackQuery(TLObject):
+    CONSTRUCTOR_ID = 0xacfa1a7e
+    SUBCLASS_OF_ID = 0x54b6bcc5
+    __slots__ = ('id', 'query_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, query_id: int):
+        """
+        Constructor for InputMessage: Instance of either InputMessageID, InputMessageReplyTo, InputMessagePinned, InputMessageCallbackQuery.
+        """
+        self.id = id
+        self.query_id = query_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessageCallbackQuery',
+            'id': self.id,
+            'query_id': self.query_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\x1a\xfa\xac',
+            _struct_iq.pack(self.id, self.query_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _query_id = reader.read_struct(_struct_iq)
+        return cls(id=_id, query_id=_query_id)
+
+
+class InputMessageID(TLObject):
+    CONSTRUCTOR_ID = 0xa676a322
+    SUBCLASS_OF_ID = 0x54b6bcc5
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for InputMessage: Instance of either InputMessageID, InputMessageReplyTo, InputMessagePinned, InputMessageCallbackQuery.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessageID',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'"\xa3v\xa6',
+            struct.pack('<i', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_int()
+        return cls(id=_id)
+
+
+class InputMessagePinned(TLObject):
+    CONSTRUCTOR_ID = 0x86872538
+    SUBCLASS_OF_ID = 0x54b6bcc5
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagePinned'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'8%\x87\x86',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessageReplyTo(TLObject):
+    CONSTRUCTOR_ID = 0xbad88395
+    SUBCLASS_OF_ID = 0x54b6bcc5
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for InputMessage: Instance of either InputMessageID, InputMessageReplyTo, InputMessagePinned, InputMessageCallbackQuery.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessageReplyTo',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95\x83\xd8\xba',
+            struct.pack('<i', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_int()
+        return cls(id=_id)
+
+TypeInputMessage = Union[InputMessageID,InputMessageReplyTo,InputMessagePinned,InputMessageCallbackQuery]
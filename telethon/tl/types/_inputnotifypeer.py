@@ -0,0 +1,133 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer
+
+
+
+class InputNotifyBroadcasts(TLObject):
+    CONSTRUCTOR_ID = 0xb1db7c7e
+    SUBCLASS_OF_ID = 0x58981615
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputNotifyBroadcasts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~|\xdb\xb1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputNotifyChats(TLObject):
+    CONSTRUCTOR_ID = 0x4a95e84e
+    SUBCLASS_OF_ID = 0x58981615
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputNotifyChats'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'N\xe8\x95J',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputNotifyForumTopic(TLObject):
+    CONSTRUCTOR_ID = 0x5c467992
+    SUBCLASS_OF_ID = 0x58981615
+    __slots__ = ('peer', 'top_msg_id')
+
+    def __init__(self, peer: 'TypeInputPeer', top_msg_id: int):
+        """
+        Constructor for InputNotifyPeer: Instance of either InputNotifyPeer, InputNotifyUsers, InputNotifyChats, InputNotifyBroadcasts, InputNotifyForumTopic.
+        """
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputNotifyForumTopic',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'top_msg_id': self.top_msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x92yF\\',
+            self.peer._bytes(),
+            struct.pack('<i', self.top_msg_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _top_msg_id = reader.read_int()
+        return cls(peer=_peer, top_msg_id=_top_msg_id)
+
+
+class InputNotifyPeer(TLObject):
+    CONSTRUCTOR_ID = 0xb8bc5b0c
+    SUBCLASS_OF_ID = 0x58981615
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypeInputPeer'):
+        """
+        Constructor for InputNotifyPeer: Instance of either InputNotifyPeer, InputNotifyUsers, InputNotifyChats, InputNotifyBroadcasts, InputNotifyForumTopic.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'InputNotifyPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0c[\xbc\xb8',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class InputNotifyUsers(TLObject):
+    CONSTRUCTOR_ID = 0x193b4417
+    SUBCLASS_OF_ID = 0x58981615
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputNotifyUsers'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x17D;\x19',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInputNotifyPeer = Union[InputNotifyPeer,InputNotifyUsers,InputNotifyChats,InputNotifyBroadcasts,InputNotifyForumTopic]
@@ -0,0 +1,138 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON
+
+
+
+class InputPaymentCredentials(TLObject):
+    CONSTRUCTOR_ID = 0x3417d728
+    SUBCLASS_OF_ID = 0x2899a53d
+    __slots__ = ('data', 'save')
+
+    def __init__(self, data: 'TypeDataJSON', save: Optional[bool]=None):
+        """
+        Constructor for InputPaymentCredentials: Instance of either InputPaymentCredentialsSaved, InputPaymentCredentials, InputPaymentCredentialsApplePay, InputPaymentCredentialsGooglePay.
+        """
+        self.data = data
+        self.save = save
+
+    def to_dict(self):
+        return {
+            '_': 'InputPaymentCredentials',
+            'data': self.data.to_dict() if isinstance(self.data, TLObject) else self.data,
+            'save': self.save
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'(\xd7\x174',
+            struct.pack('<I', (0 if self.save is None or self.save is False else 1)),
+            self.data._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _save = bool(flags & 1)
+        _data = reader.tgread_object()
+        return cls(data=_data, save=_save)
+
+
+class InputPaymentCredentialsApplePay(TLObject):
+    CONSTRUCTOR_ID = 0xaa1c39f
+    SUBCLASS_OF_ID = 0x2899a53d
+    __slots__ = ('payment_data',)
+
+    def __init__(self, payment_data: 'TypeDataJSON'):
+        """
+        Constructor for InputPaymentCredentials: Instance of either InputPaymentCredentialsSaved, InputPaymentCredentials, InputPaymentCredentialsApplePay, InputPaymentCredentialsGooglePay.
+        """
+        self.payment_data = payment_data
+
+    def to_dict(self):
+        return {
+            '_': 'InputPaymentCredentialsApplePay',
+            'payment_data': self.payment_data.to_dict() if isinstance(self.payment_data, TLObject) else self.payment_data
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9f\xc3\xa1\n',
+            self.payment_data._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _payment_data = reader.tgread_object()
+        return cls(payment_data=_payment_data)
+
+
+class InputPaymentCredentialsGooglePay(TLObject):
+    CONSTRUCTOR_ID = 0x8ac32801
+    SUBCLASS_OF_ID = 0x2899a53d
+    __slots__ = ('payment_token',)
+
+    def __init__(self, payment_token: 'TypeDataJSON'):
+        """
+        Constructor for InputPaymentCredentials: Instance of either InputPaymentCredentialsSaved, InputPaymentCredentials, InputPaymentCredentialsApplePay, InputPaymentCredentialsGooglePay.
+        """
+        self.payment_token = payment_token
+
+    def to_dict(self):
+        return {
+            '_': 'InputPaymentCredentialsGooglePay',
+            'payment_token': self.payment_token.to_dict() if isinstance(self.payment_token, TLObject) else self.payment_token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x01(\xc3\x8a',
+            self.payment_token._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _payment_token = reader.tgread_object()
+        return cls(payment_token=_payment_token)
+
+
+class InputPaymentCredentialsSaved(TLObject):
+    CONSTRUCTOR_ID = 0xc10eb2cf
+    SUBCLASS_OF_ID = 0x2899a53d
+    __slots__ = ('id', 'tmp_password')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, tmp_password: bytes):
+        """
+        Constructor for InputPaymentCredentials: Instance of either InputPaymentCredentialsSaved, InputPaymentCredentials, InputPaymentCredentialsApplePay, InputPaymentCredentialsGooglePay.
+        """
+        self.id = id
+        self.tmp_password = tmp_password
+
+    def to_dict(self):
+        return {
+            '_': 'InputPaymentCredentialsSaved',
+            'id': self.id,
+            'tmp_password': self.tmp_password
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcf\xb2\x0e\xc1',
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.tmp_password),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _tmp_password = reader.tgread_bytes()
+        return cls(id=_id, tmp_password=_tmp_password)
+
+TypeInputPaymentCredentials = Union[InputPaymentCredentialsSaved,InputPaymentCredentials,InputPaymentCredentialsApplePay,InputPaymentCredentialsGooglePay]
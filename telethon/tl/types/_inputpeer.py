@@ -0,0 +1,212 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iq = struct.Struct('<iq')
+_struct_qq = struct.Struct('<qq')
+
+
+class InputPeerChannel(TLObject):
+    CONSTRUCTOR_ID = 0x27bcbbfc
+    SUBCLASS_OF_ID = 0xc91c90b6
+    __slots__ = ('channel_id', 'access_hash')
+
+    def __init__(self, channel_id: int, access_hash: int):
+        """
+        Constructor for InputPeer: Instance of either InputPeerEmpty, InputPeerSelf, InputPeerChat, InputPeerUser, InputPeerChannel, InputPeerUserFromMessage, InputPeerChannelFromMessage.
+        """
+        self.channel_id = channel_id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerChannel',
+            'channel_id': self.channel_id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"\xfc\xbb\xbc'",
+            _struct_qq.pack(self.channel_id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _channel_id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(channel_id=_channel_id, access_hash=_access_hash)
+
+
+class InputPeerChannelFromMessage(TLObject):
+    CONSTRUCTOR_ID = 0xbd2a0840
+    SUBCLASS_OF_ID = 0xc91c90b6
+    __slots__ = ('peer', 'msg_id', 'channel_id')
+
+    def __init__(self, peer: 'TypeInputPeer', msg_id: int, channel_id: int):
+        """
+        Constructor for InputPeer: Instance of either InputPeerEmpty, InputPeerSelf, InputPeerChat, InputPeerUser, InputPeerChannel, InputPeerUserFromMessage, InputPeerChannelFromMessage.
+        """
+        self.peer = peer
+        self.msg_id = msg_id
+        self.channel_id = channel_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerChannelFromMessage',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'msg_id': self.msg_id,
+            'channel_id': self.channel_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'@\x08*\xbd',
+            self.peer._bytes(),
+            _struct_iq.pack(self.msg_id, self.channel_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _msg_id, _channel_id = reader.read_struct(_struct_iq)
+        return cls(peer=_peer, msg_id=_msg_id, channel_id=_channel_id)
+
+
+class InputPeerChat(TLObject):
+    CONSTRUCTOR_ID = 0x35a95cb9
+    SUBCLASS_OF_ID = 0xc91c90b6
+    __slots__ = ('chat_id',)
+
+    def __init__(self, chat_id: int):
+        """
+        Constructor for InputPeer: Instance of either InputPeerEmpty, InputPeerSelf, InputPeerChat, InputPeerUser, InputPeerChannel, InputPeerUserFromMessage, InputPeerChannelFromMessage.
+        """
+        self.chat_id = chat_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerChat',
+            'chat_id': self.chat_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb9\\\xa95',
+            struct.pack('<q', self.chat_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _chat_id = reader.read_long()
+        return cls(chat_id=_chat_id)
+
+
+class InputPeerEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x7f3b18ea
+    SUBCLASS_OF_ID = 0xc91c90b6
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xea\x18;\x7f',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPeerSelf(TLObject):
+    CONSTRUCTOR_ID = 0x7da07ec9
+    SUBCLASS_OF_ID = 0xc91c90b6
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerSelf'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9~\xa0}',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPeerUser(TLObject):
+    CONSTRUCTOR_ID = 0xdde8a54c
+    SUBCLASS_OF_ID = 0xc91c90b6
+    __slots__ = ('user_id', 'access_hash')
+
+    def __init__(self, user_id: int, access_hash: int):
+        """
+        Constructor for InputPeer: Instance of either InputPeerEmpty, InputPeerSelf, InputPeerChat, InputPeerUser, InputPeerChannel, InputPeerUserFromMessage, InputPeerChannelFromMessage.
+        """
+        self.user_id = user_id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerUser',
+            'user_id': self.user_id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'L\xa5\xe8\xdd',
+            _struct_qq.pack(self.user_id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(user_id=_user_id, access_hash=_access_hash)
+
+
+class InputPeerUserFromMessage(TLObject):
+    CONSTRUCTOR_ID = 0xa87b0a1c
+    SUBCLASS_OF_ID = 0xc91c90b6
+    __slots__ = ('peer', 'msg_id', 'user_id')
+
+    def __init__(self, peer: 'TypeInputPeer', msg_id: int, user_id: int):
+        """
+        Constructor for InputPeer: Instance of either InputPeerEmpty, InputPeerSelf, InputPeerChat, InputPeerUser, InputPeerChannel, InputPeerUserFromMessage, InputPeerChannelFromMessage.
+        """
+        self.peer = peer
+        self.msg_id = msg_id
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerUserFromMessage',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'msg_id': self.msg_id,
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1c\n{\xa8',
+            self.peer._bytes(),
+            _struct_iq.pack(self.msg_id, self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _msg_id, _user_id = reader.read_struct(_struct_iq)
+        return cls(peer=_peer, msg_id=_msg_id, user_id=_user_id)
+
+TypeInputPeer = Union[InputPeerEmpty,InputPeerSelf,InputPeerChat,InputPeerUser,InputPeerChannel,InputPeerUserFromMessage,InputPeerChannelFromMessage]
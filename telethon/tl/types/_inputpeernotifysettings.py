@@ -0,0 +1,88 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeNotificationSound
+
+
+
+class InputPeerNotifySettings(TLObject):
+    CONSTRUCTOR_ID = 0xcacb6ae2
+    SUBCLASS_OF_ID = 0x90db0b0d
+    __slots__ = ('show_previews', 'silent', 'mute_until', 'sound', 'stories_muted', 'stories_hide_sender', 'stories_sound')
+
+    def __init__(self, show_previews: Optional[bool]=None, silent: Optional[bool]=None, mute_until: Optional[datetime]=None, sound: Optional['TypeNotificationSound']=None, stories_muted: Optional[bool]=None, stories_hide_sender: Optional[bool]=None, stories_sound: Optional['TypeNotificationSound']=None):
+        """
+        Constructor for InputPeerNotifySettings: Instance of InputPeerNotifySettings.
+        """
+        self.show_previews = show_previews
+        self.silent = silent
+        self.mute_until = mute_until
+        self.sound = sound
+        self.stories_muted = stories_muted
+        self.stories_hide_sender = stories_hide_sender
+        self.stories_sound = stories_sound
+
+    def to_dict(self):
+        return {
+            '_': 'InputPeerNotifySettings',
+            'show_previews': self.show_previews,
+            'silent': self.silent,
+            'mute_until': self.mute_until,
+            'sound': self.sound.to_dict() if isinstance(self.sound, TLObject) else self.sound,
+            'stories_muted': self.stories_muted,
+            'stories_hide_sender': self.stories_hide_sender,
+            'stories_sound': self.stories_sound.to_dict() if isinstance(self.stories_sound, TLObject) else self.stories_sound
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe2j\xcb\xca',
+            struct.pack('<I', (0 if self.show_previews is None else 1) | (0 if self.silent is None else 2) | (0 if self.mute_until is None or self.mute_until is False else 4) | (0 if self.sound is None or self.sound is False else 8) | (0 if self.stories_muted is None else 64) | (0 if self.stories_hide_sender is None else 128) | (0 if self.stories_sound is None or self.stories_sound is False else 256)),
+            b'' if self.show_previews is None else (b'\xb5ur\x99' if self.show_previews else b'7\x97y\xbc'),
+            b'' if self.silent is None else (b'\xb5ur\x99' if self.silent else b'7\x97y\xbc'),
+            b'' if self.mute_until is None or self.mute_until is False else (self.serialize_datetime(self.mute_until)),
+            b'' if self.sound is None or self.sound is False else (self.sound._bytes()),
+            b'' if self.stories_muted is None else (b'\xb5ur\x99' if self.stories_muted else b'7\x97y\xbc'),
+            b'' if self.stories_hide_sender is None else (b'\xb5ur\x99' if self.stories_hide_sender else b'7\x97y\xbc'),
+            b'' if self.stories_sound is None or self.stories_sound is False else (self.stories_sound._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _show_previews = reader.tgread_bool()
+        else:
+            _show_previews = None
+        if flags & 2:
+            _silent = reader.tgread_bool()
+        else:
+            _silent = None
+        if flags & 4:
+            _mute_until = reader.tgread_date()
+        else:
+            _mute_until = None
+        if flags & 8:
+            _sound = reader.tgread_object()
+        else:
+            _sound = None
+        if flags & 64:
+            _stories_muted = reader.tgread_bool()
+        else:
+            _stories_muted = None
+        if flags & 128:
+            _stories_hide_sender = reader.tgread_bool()
+        else:
+            _stories_hide_sender = None
+        if flags & 256:
+            _stories_sound = reader.tgread_object()
+        else:
+            _stories_sound = None
+        return cls(show_previews=_show_previews, silent=_silent, mute_until=_mute_until, sound=_sound, stories_muted=_stories_muted, stories_hide_sender=_stories_hide_sender, stories_sound=_stories_sound)
+
+TypeInputPeerNotifySettings = InputPeerNotifySettings
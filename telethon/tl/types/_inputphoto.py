@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class InputPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x3bb3b94a
+    SUBCLASS_OF_ID = 0x846363e0
+    __slots__ = ('id', 'access_hash', 'file_reference')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, file_reference: bytes):
+        """
+        Constructor for InputPhoto: Instance of either InputPhotoEmpty, InputPhoto.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.file_reference = file_reference
+
+    def to_dict(self):
+        return {
+            '_': 'InputPhoto',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'file_reference': self.file_reference
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'J\xb9\xb3;',
+            _struct_qq.pack(self.id, self.access_hash),
+            self.serialize_bytes(self.file_reference),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        _file_reference = reader.tgread_bytes()
+        return cls(id=_id, access_hash=_access_hash, file_reference=_file_reference)
+
+
+class InputPhotoEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x1cd7bf0d
+    SUBCLASS_OF_ID = 0x846363e0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPhotoEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r\xbf\xd7\x1c',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInputPhoto = Union[InputPhotoEmpty,InputPhoto]
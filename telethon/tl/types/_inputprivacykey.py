@@ -0,0 +1,268 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputPrivacyKeyAbout(TLObject):
+    CONSTRUCTOR_ID = 0x3823cc40
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyAbout'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'@\xcc#8',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyAddedByPhone(TLObject):
+    CONSTRUCTOR_ID = 0xd1219bdd
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyAddedByPhone'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdd\x9b!\xd1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyBirthday(TLObject):
+    CONSTRUCTOR_ID = 0xd65a11cc
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyBirthday'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcc\x11Z\xd6',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyChatInvite(TLObject):
+    CONSTRUCTOR_ID = 0xbdfb0426
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyChatInvite'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'&\x04\xfb\xbd',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyForwards(TLObject):
+    CONSTRUCTOR_ID = 0xa4dd4c08
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyForwards'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08L\xdd\xa4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyNoPaidMessages(TLObject):
+    CONSTRUCTOR_ID = 0xbdc597b4
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyNoPaidMessages'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb4\x97\xc5\xbd',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyPhoneCall(TLObject):
+    CONSTRUCTOR_ID = 0xfabadc5f
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyPhoneCall'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'_\xdc\xba\xfa',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyPhoneNumber(TLObject):
+    CONSTRUCTOR_ID = 0x352dafa
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyPhoneNumber'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfa\xdaR\x03',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyPhoneP2P(TLObject):
+    CONSTRUCTOR_ID = 0xdb9e70d2
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyPhoneP2P'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd2p\x9e\xdb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyProfilePhoto(TLObject):
+    CONSTRUCTOR_ID = 0x5719bacc
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyProfilePhoto'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcc\xba\x19W',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyStarGiftsAutoSave(TLObject):
+    CONSTRUCTOR_ID = 0xe1732341
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyStarGiftsAutoSave'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'A#s\xe1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyStatusTimestamp(TLObject):
+    CONSTRUCTOR_ID = 0x4f96cb18
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyStatusTimestamp'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x18\xcb\x96O',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyKeyVoiceMessages(TLObject):
+    CONSTRUCTOR_ID = 0xaee69d68
+    SUBCLASS_OF_ID = 0x53627f8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyKeyVoiceMessages'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'h\x9d\xe6\xae',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInputPrivacyKey = Union[InputPrivacyKeyStatusTimestamp,InputPrivacyKeyChatInvite,InputPrivacyKeyPhoneCall,InputPrivacyKeyPhoneP2P,InputPrivacyKeyForwards,InputPrivacyKeyProfilePhoto,InputPrivacyKeyPhoneNumber,InputPrivacyKeyAddedByPhone,InputPrivacyKeyVoiceMessages,InputPrivacyKeyAbout,InputPrivacyKeyBirthday,InputPrivacyKeyStarGiftsAutoSave,InputPrivacyKeyNoPaidMessages]
@@ -0,0 +1,299 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputUser
+
+
+
+class InputPrivacyValueAllowAll(TLObject):
+    CONSTRUCTOR_ID = 0x184b35ce
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueAllowAll'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xce5K\x18',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueAllowBots(TLObject):
+    CONSTRUCTOR_ID = 0x5a4fcce5
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueAllowBots'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe5\xccOZ',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueAllowChatParticipants(TLObject):
+    CONSTRUCTOR_ID = 0x840649cf
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ('chats',)
+
+    def __init__(self, chats: List[int]):
+        """
+        Constructor for InputPrivacyRule: Instance of either InputPrivacyValueAllowContacts, InputPrivacyValueAllowAll, InputPrivacyValueAllowUsers, InputPrivacyValueDisallowContacts, InputPrivacyValueDisallowAll, InputPrivacyValueDisallowUsers, InputPrivacyValueAllowChatParticipants, InputPrivacyValueDisallowChatParticipants, InputPrivacyValueAllowCloseFriends, InputPrivacyValueAllowPremium, InputPrivacyValueAllowBots, InputPrivacyValueDisallowBots.
+        """
+        self.chats = chats
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueAllowChatParticipants',
+            'chats': [] if self.chats is None else self.chats[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcfI\x06\x84',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.chats)), len(self.chats), *self.chats),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _chats = reader.read_array('q', reader.read_int())
+        return cls(chats=_chats)
+
+
+class InputPrivacyValueAllowCloseFriends(TLObject):
+    CONSTRUCTOR_ID = 0x2f453e49
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueAllowCloseFriends'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'I>E/',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueAllowContacts(TLObject):
+    CONSTRUCTOR_ID = 0xd09e07b
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueAllowContacts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'{\xe0\t\r',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueAllowPremium(TLObject):
+    CONSTRUCTOR_ID = 0x77cdc9f1
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueAllowPremium'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf1\xc9\xcdw',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueAllowUsers(TLObject):
+    CONSTRUCTOR_ID = 0x131cc67f
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ('users',)
+
+    def __init__(self, users: List['TypeInputUser']):
+        """
+        Constructor for InputPrivacyRule: Instance of either InputPrivacyValueAllowContacts, InputPrivacyValueAllowAll, InputPrivacyValueAllowUsers, InputPrivacyValueDisallowContacts, InputPrivacyValueDisallowAll, InputPrivacyValueDisallowUsers, InputPrivacyValueAllowChatParticipants, InputPrivacyValueDisallowChatParticipants, InputPrivacyValueAllowCloseFriends, InputPrivacyValueAllowPremium, InputPrivacyValueAllowBots, InputPrivacyValueDisallowBots.
+        """
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueAllowUsers',
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f\xc6\x1c\x13',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(users=_users)
+
+
+class InputPrivacyValueDisallowAll(TLObject):
+    CONSTRUCTOR_ID = 0xd66b66c9
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueDisallowAll'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9fk\xd6',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueDisallowBots(TLObject):
+    CONSTRUCTOR_ID = 0xc4e57915
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueDisallowBots'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x15y\xe5\xc4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueDisallowChatParticipants(TLObject):
+    CONSTRUCTOR_ID = 0xe94f0f86
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ('chats',)
+
+    def __init__(self, chats: List[int]):
+        """
+        Constructor for InputPrivacyRule: Instance of either InputPrivacyValueAllowContacts, InputPrivacyValueAllowAll, InputPrivacyValueAllowUsers, InputPrivacyValueDisallowContacts, InputPrivacyValueDisallowAll, InputPrivacyValueDisallowUsers, InputPrivacyValueAllowChatParticipants, InputPrivacyValueDisallowChatParticipants, InputPrivacyValueAllowCloseFriends, InputPrivacyValueAllowPremium, InputPrivacyValueAllowBots, InputPrivacyValueDisallowBots.
+        """
+        self.chats = chats
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueDisallowChatParticipants',
+            'chats': [] if self.chats is None else self.chats[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x86\x0fO\xe9',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.chats)), len(self.chats), *self.chats),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _chats = reader.read_array('q', reader.read_int())
+        return cls(chats=_chats)
+
+
+class InputPrivacyValueDisallowContacts(TLObject):
+    CONSTRUCTOR_ID = 0xba52007
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueDisallowContacts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x07 \xa5\x0b',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputPrivacyValueDisallowUsers(TLObject):
+    CONSTRUCTOR_ID = 0x90110467
+    SUBCLASS_OF_ID = 0x5a3b6b22
+    __slots__ = ('users',)
+
+    def __init__(self, users: List['TypeInputUser']):
+        """
+        Constructor for InputPrivacyRule: Instance of either InputPrivacyValueAllowContacts, InputPrivacyValueAllowAll, InputPrivacyValueAllowUsers, InputPrivacyValueDisallowContacts, InputPrivacyValueDisallowAll, InputPrivacyValueDisallowUsers, InputPrivacyValueAllowChatParticipants, InputPrivacyValueDisallowChatParticipants, InputPrivacyValueAllowCloseFriends, InputPrivacyValueAllowPremium, InputPrivacyValueAllowBots, InputPrivacyValueDisallowBots.
+        """
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'InputPrivacyValueDisallowUsers',
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'g\x04\x11\x90',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(users=_users)
+
+TypeInputPrivacyRule = Union[InputPrivacyValueAllowContacts,InputPrivacyValueAllowAll,InputPrivacyValueAllowUsers,InputPrivacyValueDisallowContacts,InputPrivacyValueDisallowAll,InputPrivacyValueDisallowUsers,InputPrivacyValueAllowChatParticipants,InputPrivacyValueDisallowChatParticipants,InputPrivacyValueAllowCloseFriends,InputPrivacyValueAllowPremium,InputPrivacyValueAllowBots,InputPrivacyValueDisallowBots]
@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputQuickReplyShortcut(TLObject):
+    CONSTRUCTOR_ID = 0x24596d41
+    SUBCLASS_OF_ID = 0xa5687c57
+    __slots__ = ('shortcut',)
+
+    def __init__(self, shortcut: str):
+        """
+        Constructor for InputQuickReplyShortcut: Instance of either InputQuickReplyShortcut, InputQuickReplyShortcutId.
+        """
+        self.shortcut = shortcut
+
+    def to_dict(self):
+        return {
+            '_': 'InputQuickReplyShortcut',
+            'shortcut': self.shortcut
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'AmY$',
+            self.serialize_bytes(self.shortcut),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _shortcut = reader.tgread_string()
+        return cls(shortcut=_shortcut)
+
+
+class InputQuickReplyShortcutId(TLObject):
+    CONSTRUCTOR_ID = 0x1190cf1
+    SUBCLASS_OF_ID = 0xa5687c57
+    __slots__ = ('shortcut_id',)
+
+    def __init__(self, shortcut_id: int):
+        """
+        Constructor for InputQuickReplyShortcut: Instance of either InputQuickReplyShortcut, InputQuickReplyShortcutId.
+        """
+        self.shortcut_id = shortcut_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputQuickReplyShortcutId',
+            'shortcut_id': self.shortcut_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf1\x0c\x19\x01',
+            struct.pack('<i', self.shortcut_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _shortcut_id = reader.read_int()
+        return cls(shortcut_id=_shortcut_id)
+
+TypeInputQuickReplyShortcut = Union[InputQuickReplyShortcut,InputQuickReplyShortcutId]
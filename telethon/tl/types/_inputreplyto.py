@@ -0,0 +1,116 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer, TypeMessageEntity
+
+
+
+class InputReplyToMessage(TLObject):
+    CONSTRUCTOR_ID = 0x22c0f6d5
+    SUBCLASS_OF_ID = 0x8c71131d
+    __slots__ = ('reply_to_msg_id', 'top_msg_id', 'reply_to_peer_id', 'quote_text', 'quote_entities', 'quote_offset')
+
+    def __init__(self, reply_to_msg_id: int, top_msg_id: Optional[int]=None, reply_to_peer_id: Optional['TypeInputPeer']=None, quote_text: Optional[str]=None, quote_entities: Optional[List['TypeMessageEntity']]=None, quote_offset: Optional[int]=None):
+        """
+        Constructor for InputReplyTo: Instance of either InputReplyToMessage, InputReplyToStory.
+        """
+        self.reply_to_msg_id = reply_to_msg_id
+        self.top_msg_id = top_msg_id
+        self.reply_to_peer_id = reply_to_peer_id
+        self.quote_text = quote_text
+        self.quote_entities = quote_entities
+        self.quote_offset = quote_offset
+
+    def to_dict(self):
+        return {
+            '_': 'InputReplyToMessage',
+            'reply_to_msg_id': self.reply_to_msg_id,
+            'top_msg_id': self.top_msg_id,
+            'reply_to_peer_id': self.reply_to_peer_id.to_dict() if isinstance(self.reply_to_peer_id, TLObject) else self.reply_to_peer_id,
+            'quote_text': self.quote_text,
+            'quote_entities': [] if self.quote_entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.quote_entities],
+            'quote_offset': self.quote_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd5\xf6\xc0"',
+            _struct_Ii.pack((0 if self.top_msg_id is None or self.top_msg_id is False else 1) | (0 if self.reply_to_peer_id is None or self.reply_to_peer_id is False else 2) | (0 if self.quote_text is None or self.quote_text is False else 4) | (0 if self.quote_entities is None or self.quote_entities is False else 8) | (0 if self.quote_offset is None or self.quote_offset is False else 16), self.reply_to_msg_id),
+            b'' if self.top_msg_id is None or self.top_msg_id is False else (struct.pack('<i', self.top_msg_id)),
+            b'' if self.reply_to_peer_id is None or self.reply_to_peer_id is False else (self.reply_to_peer_id._bytes()),
+            b'' if self.quote_text is None or self.quote_text is False else (self.serialize_bytes(self.quote_text)),
+            b'' if self.quote_entities is None or self.quote_entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.quote_entities)),b''.join(x._bytes() for x in self.quote_entities))),
+            b'' if self.quote_offset is None or self.quote_offset is False else (struct.pack('<i', self.quote_offset)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _reply_to_msg_id = reader.read_struct(_struct_ii)
+        if flags & 1:
+            _top_msg_id = reader.read_int()
+        else:
+            _top_msg_id = None
+        if flags & 2:
+            _reply_to_peer_id = reader.tgread_object()
+        else:
+            _reply_to_peer_id = None
+        if flags & 4:
+            _quote_text = reader.tgread_string()
+        else:
+            _quote_text = None
+        if flags & 8:
+            reader.read_int()
+            _quote_entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _quote_entities.append(_x)
+
+        else:
+            _quote_entities = None
+        if flags & 16:
+            _quote_offset = reader.read_int()
+        else:
+            _quote_offset = None
+        return cls(reply_to_msg_id=_reply_to_msg_id, top_msg_id=_top_msg_id, reply_to_peer_id=_reply_to_peer_id, quote_text=_quote_text, quote_entities=_quote_entities, quote_offset=_quote_offset)
+
+
+class InputReplyToStory(TLObject):
+    CONSTRUCTOR_ID = 0x5881323a
+    SUBCLASS_OF_ID = 0x8c71131d
+    __slots__ = ('peer', 'story_id')
+
+    def __init__(self, peer: 'TypeInputPeer', story_id: int):
+        """
+        Constructor for InputReplyTo: Instance of either InputReplyToMessage, InputReplyToStory.
+        """
+        self.peer = peer
+        self.story_id = story_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputReplyToStory',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'story_id': self.story_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b':2\x81X',
+            self.peer._bytes(),
+            struct.pack('<i', self.story_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _story_id = reader.read_int()
+        return cls(peer=_peer, story_id=_story_id)
+
+TypeInputReplyTo = Union[InputReplyToMessage,InputReplyToStory]
@@ -0,0 +1,73 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer
+
+
+
+class InputSavedStarGiftChat(TLObject):
+    CONSTRUCTOR_ID = 0xf101aa7f
+    SUBCLASS_OF_ID = 0x8f7599ae
+    __slots__ = ('peer', 'saved_id')
+
+    def __init__(self, peer: 'TypeInputPeer', saved_id: int):
+        """
+        Constructor for InputSavedStarGift: Instance of either InputSavedStarGiftUser, InputSavedStarGiftChat.
+        """
+        self.peer = peer
+        self.saved_id = saved_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputSavedStarGiftChat',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'saved_id': self.saved_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f\xaa\x01\xf1',
+            self.peer._bytes(),
+            struct.pack('<q', self.saved_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _saved_id = reader.read_long()
+        return cls(peer=_peer, saved_id=_saved_id)
+
+
+class InputSavedStarGiftUser(TLObject):
+    CONSTRUCTOR_ID = 0x69279795
+    SUBCLASS_OF_ID = 0x8f7599ae
+    __slots__ = ('msg_id',)
+
+    def __init__(self, msg_id: int):
+        """
+        Constructor for InputSavedStarGift: Instance of either InputSavedStarGiftUser, InputSavedStarGiftChat.
+        """
+        self.msg_id = msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputSavedStarGiftUser',
+            'msg_id': self.msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"\x95\x97'i",
+            struct.pack('<i', self.msg_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _msg_id = reader.read_int()
+        return cls(msg_id=_msg_id)
+
+TypeInputSavedStarGift = Union[InputSavedStarGiftUser,InputSavedStarGiftChat]
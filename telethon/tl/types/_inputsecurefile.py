@@ -0,0 +1,87 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+_struct_qq = struct.Struct('<qq')
+
+
+class InputSecureFile(TLObject):
+    CONSTRUCTOR_ID = 0x5367e5be
+    SUBCLASS_OF_ID = 0xdac8adfc
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputSecureFile: Instance of either InputSecureFileUploaded, InputSecureFile.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputSecureFile',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbe\xe5gS',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputSecureFileUploaded(TLObject):
+    CONSTRUCTOR_ID = 0x3334b0f0
+    SUBCLASS_OF_ID = 0xdac8adfc
+    __slots__ = ('id', 'parts', 'md5_checksum', 'file_hash', 'secret')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, parts: int, md5_checksum: str, file_hash: bytes, secret: bytes):
+        """
+        Constructor for InputSecureFile: Instance of either InputSecureFileUploaded, InputSecureFile.
+        """
+        self.id = id
+        self.parts = parts
+        self.md5_checksum = md5_checksum
+        self.file_hash = file_hash
+        self.secret = secret
+
+    def to_dict(self):
+        return {
+            '_': 'InputSecureFileUploaded',
+            'id': self.id,
+            'parts': self.parts,
+            'md5_checksum': self.md5_checksum,
+            'file_hash': self.file_hash,
+            'secret': self.secret
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf0\xb043',
+            _struct_qi.pack(self.id, self.parts),
+            self.serialize_bytes(self.md5_checksum),
+            self.serialize_bytes(self.file_hash),
+            self.serialize_bytes(self.secret),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _parts = reader.read_struct(_struct_qi)
+        _md5_checksum = reader.tgread_string()
+        _file_hash = reader.tgread_bytes()
+        _secret = reader.tgread_bytes()
+        return cls(id=_id, parts=_parts, md5_checksum=_md5_checksum, file_hash=_file_hash, secret=_secret)
+
+TypeInputSecureFile = Union[InputSecureFileUploaded,InputSecureFile]
@@ -0,0 +1,103 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputSecureFile, TypeSecureData, TypeSecurePlainData, TypeSecureValueType
+
+
+
+class InputSecureValue(TLObject):
+    CONSTRUCTOR_ID = 0xdb21d0a7
+    SUBCLASS_OF_ID = 0xb49da1fc
+    __slots__ = ('type', 'data', 'front_side', 'reverse_side', 'selfie', 'translation', 'files', 'plain_data')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', data: Optional['TypeSecureData']=None, front_side: Optional['TypeInputSecureFile']=None, reverse_side: Optional['TypeInputSecureFile']=None, selfie: Optional['TypeInputSecureFile']=None, translation: Optional[List['TypeInputSecureFile']]=None, files: Optional[List['TypeInputSecureFile']]=None, plain_data: Optional['TypeSecurePlainData']=None):
+        """
+        Constructor for InputSecureValue: Instance of InputSecureValue.
+        """
+        self.type = type
+        self.data = data
+        self.front_side = front_side
+        self.reverse_side = reverse_side
+        self.selfie = selfie
+        self.translation = translation
+        self.files = files
+        self.plain_data = plain_data
+
+    def to_dict(self):
+        return {
+            '_': 'InputSecureValue',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'data': self.data.to_dict() if isinstance(self.data, TLObject) else self.data,
+            'front_side': self.front_side.to_dict() if isinstance(self.front_side, TLObject) else self.front_side,
+            'reverse_side': self.reverse_side.to_dict() if isinstance(self.reverse_side, TLObject) else self.reverse_side,
+            'selfie': self.selfie.to_dict() if isinstance(self.selfie, TLObject) else self.selfie,
+            'translation': [] if self.translation is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.translation],
+            'files': [] if self.files is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.files],
+            'plain_data': self.plain_data.to_dict() if isinstance(self.plain_data, TLObject) else self.plain_data
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa7\xd0!\xdb',
+            struct.pack('<I', (0 if self.data is None or self.data is False else 1) | (0 if self.front_side is None or self.front_side is False else 2) | (0 if self.reverse_side is None or self.reverse_side is False else 4) | (0 if self.selfie is None or self.selfie is False else 8) | (0 if self.translation is None or self.translation is False else 64) | (0 if self.files is None or self.files is False else 16) | (0 if self.plain_data is None or self.plain_data is False else 32)),
+            self.type._bytes(),
+            b'' if self.data is None or self.data is False else (self.data._bytes()),
+            b'' if self.front_side is None or self.front_side is False else (self.front_side._bytes()),
+            b'' if self.reverse_side is None or self.reverse_side is False else (self.reverse_side._bytes()),
+            b'' if self.selfie is None or self.selfie is False else (self.selfie._bytes()),
+            b'' if self.translation is None or self.translation is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.translation)),b''.join(x._bytes() for x in self.translation))),
+            b'' if self.files is None or self.files is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.files)),b''.join(x._bytes() for x in self.files))),
+            b'' if self.plain_data is None or self.plain_data is False else (self.plain_data._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _type = reader.tgread_object()
+        if flags & 1:
+            _data = reader.tgread_object()
+        else:
+            _data = None
+        if flags & 2:
+            _front_side = reader.tgread_object()
+        else:
+            _front_side = None
+        if flags & 4:
+            _reverse_side = reader.tgread_object()
+        else:
+            _reverse_side = None
+        if flags & 8:
+            _selfie = reader.tgread_object()
+        else:
+            _selfie = None
+        if flags & 64:
+            reader.read_int()
+            _translation = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _translation.append(_x)
+
+        else:
+            _translation = None
+        if flags & 16:
+            reader.read_int()
+            _files = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _files.append(_x)
+
+        else:
+            _files = None
+        if flags & 32:
+            _plain_data = reader.tgread_object()
+        else:
+            _plain_data = None
+        return cls(type=_type, data=_data, front_side=_front_side, reverse_side=_reverse_side, selfie=_selfie, translation=_translation, files=_files, plain_data=_plain_data)
+
+TypeInputSecureValue = InputSecureValue
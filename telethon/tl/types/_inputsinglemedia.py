@@ -0,0 +1,63 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputMedia, TypeMessageEntity
+
+
+
+class InputSingleMedia(TLObject):
+    CONSTRUCTOR_ID = 0x1cc6e91f
+    SUBCLASS_OF_ID = 0x21ca8ed8
+    __slots__ = ('media', 'message', 'random_id', 'entities')
+
+    def __init__(self, media: 'TypeInputMedia', message: str, random_id: int=None, entities: Optional[List['TypeMessageEntity']]=None):
+        """
+        Constructor for InputSingleMedia: Instance of InputSingleMedia.
+        """
+        self.media = media
+        self.message = message
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+        self.entities = entities
+
+    def to_dict(self):
+        return {
+            '_': 'InputSingleMedia',
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'message': self.message,
+            'random_id': self.random_id,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1f\xe9\xc6\x1c',
+            struct.pack('<I', (0 if self.entities is None or self.entities is False else 1)),
+            self.media._bytes(),
+            struct.pack('<q', self.random_id),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _media = reader.tgread_object()
+        _random_id = reader.read_long()
+        _message = reader.tgread_string()
+        if flags & 1:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        return cls(media=_media, message=_message, random_id=_random_id, entities=_entities)
+
+TypeInputSingleMedia = InputSingleMedia
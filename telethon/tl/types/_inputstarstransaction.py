@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputStarsTransaction(TLObject):
+    CONSTRUCTOR_ID = 0x206ae6d1
+    SUBCLASS_OF_ID = 0x11e208ea
+    __slots__ = ('id', 'refund')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, refund: Optional[bool]=None):
+        """
+        Constructor for InputStarsTransaction: Instance of InputStarsTransaction.
+        """
+        self.id = id
+        self.refund = refund
+
+    def to_dict(self):
+        return {
+            '_': 'InputStarsTransaction',
+            'id': self.id,
+            'refund': self.refund
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1\xe6j ',
+            struct.pack('<I', (0 if self.refund is None or self.refund is False else 1)),
+            self.serialize_bytes(self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _refund = bool(flags & 1)
+        _id = reader.tgread_string()
+        return cls(id=_id, refund=_refund)
+
+TypeInputStarsTransaction = InputStarsTransaction
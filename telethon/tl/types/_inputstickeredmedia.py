@@ -0,0 +1,71 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputDocument, TypeInputPhoto
+
+
+
+class InputStickeredMediaDocument(TLObject):
+    CONSTRUCTOR_ID = 0x438865b
+    SUBCLASS_OF_ID = 0x5146d99e
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeInputDocument'):
+        """
+        Constructor for InputStickeredMedia: Instance of either InputStickeredMediaPhoto, InputStickeredMediaDocument.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickeredMediaDocument',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'[\x868\x04',
+            self.id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_object()
+        return cls(id=_id)
+
+
+class InputStickeredMediaPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x4a992157
+    SUBCLASS_OF_ID = 0x5146d99e
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: 'TypeInputPhoto'):
+        """
+        Constructor for InputStickeredMedia: Instance of either InputStickeredMediaPhoto, InputStickeredMediaDocument.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickeredMediaPhoto',
+            'id': self.id.to_dict() if isinstance(self.id, TLObject) else self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'W!\x99J',
+            self.id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_object()
+        return cls(id=_id)
+
+TypeInputStickeredMedia = Union[InputStickeredMediaPhoto,InputStickeredMediaDocument]
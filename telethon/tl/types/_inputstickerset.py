@@ -0,0 +1,260 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class InputStickerSetAnimatedEmoji(TLObject):
+    CONSTRUCTOR_ID = 0x28703c8
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetAnimatedEmoji'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc8\x03\x87\x02',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetAnimatedEmojiAnimations(TLObject):
+    CONSTRUCTOR_ID = 0xcde3739
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetAnimatedEmojiAnimations'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'97\xde\x0c',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetDice(TLObject):
+    CONSTRUCTOR_ID = 0xe67f520e
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ('emoticon',)
+
+    def __init__(self, emoticon: str):
+        """
+        Constructor for InputStickerSet: Instance of either InputStickerSetEmpty, InputStickerSetID, InputStickerSetShortName, InputStickerSetAnimatedEmoji, InputStickerSetDice, InputStickerSetAnimatedEmojiAnimations, InputStickerSetPremiumGifts, InputStickerSetEmojiGenericAnimations, InputStickerSetEmojiDefaultStatuses, InputStickerSetEmojiDefaultTopicIcons, InputStickerSetEmojiChannelDefaultStatuses.
+        """
+        self.emoticon = emoticon
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetDice',
+            'emoticon': self.emoticon
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0eR\x7f\xe6',
+            self.serialize_bytes(self.emoticon),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoticon = reader.tgread_string()
+        return cls(emoticon=_emoticon)
+
+
+class InputStickerSetEmojiChannelDefaultStatuses(TLObject):
+    CONSTRUCTOR_ID = 0x49748553
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetEmojiChannelDefaultStatuses'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'S\x85tI',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetEmojiDefaultStatuses(TLObject):
+    CONSTRUCTOR_ID = 0x29d0f5ee
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetEmojiDefaultStatuses'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xee\xf5\xd0)',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetEmojiDefaultTopicIcons(TLObject):
+    CONSTRUCTOR_ID = 0x44c1f8e9
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetEmojiDefaultTopicIcons'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe9\xf8\xc1D',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetEmojiGenericAnimations(TLObject):
+    CONSTRUCTOR_ID = 0x4c4d4ce
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetEmojiGenericAnimations'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xce\xd4\xc4\x04',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xffb62b95
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95+\xb6\xff',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetID(TLObject):
+    CONSTRUCTOR_ID = 0x9de7a269
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputStickerSet: Instance of either InputStickerSetEmpty, InputStickerSetID, InputStickerSetShortName, InputStickerSetAnimatedEmoji, InputStickerSetDice, InputStickerSetAnimatedEmojiAnimations, InputStickerSetPremiumGifts, InputStickerSetEmojiGenericAnimations, InputStickerSetEmojiDefaultStatuses, InputStickerSetEmojiDefaultTopicIcons, InputStickerSetEmojiChannelDefaultStatuses.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetID',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'i\xa2\xe7\x9d',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputStickerSetPremiumGifts(TLObject):
+    CONSTRUCTOR_ID = 0xc88b3b02
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetPremiumGifts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x02;\x8b\xc8',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputStickerSetShortName(TLObject):
+    CONSTRUCTOR_ID = 0x861cc8a0
+    SUBCLASS_OF_ID = 0x3da389aa
+    __slots__ = ('short_name',)
+
+    def __init__(self, short_name: str):
+        """
+        Constructor for InputStickerSet: Instance of either InputStickerSetEmpty, InputStickerSetID, InputStickerSetShortName, InputStickerSetAnimatedEmoji, InputStickerSetDice, InputStickerSetAnimatedEmojiAnimations, InputStickerSetPremiumGifts, InputStickerSetEmojiGenericAnimations, InputStickerSetEmojiDefaultStatuses, InputStickerSetEmojiDefaultTopicIcons, InputStickerSetEmojiChannelDefaultStatuses.
+        """
+        self.short_name = short_name
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetShortName',
+            'short_name': self.short_name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0\xc8\x1c\x86',
+            self.serialize_bytes(self.short_name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _short_name = reader.tgread_string()
+        return cls(short_name=_short_name)
+
+TypeInputStickerSet = Union[InputStickerSetEmpty,InputStickerSetID,InputStickerSetShortName,InputStickerSetAnimatedEmoji,InputStickerSetDice,InputStickerSetAnimatedEmojiAnimations,InputStickerSetPremiumGifts,InputStickerSetEmojiGenericAnimations,InputStickerSetEmojiDefaultStatuses,InputStickerSetEmojiDefaultTopicIcons,InputStickerSetEmojiChannelDefaultStatuses]
@@ -0,0 +1,61 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputDocument, TypeMaskCoords
+
+
+
+class InputStickerSetItem(TLObject):
+    CONSTRUCTOR_ID = 0x32da9e9c
+    SUBCLASS_OF_ID = 0xae59f075
+    __slots__ = ('document', 'emoji', 'mask_coords', 'keywords')
+
+    def __init__(self, document: 'TypeInputDocument', emoji: str, mask_coords: Optional['TypeMaskCoords']=None, keywords: Optional[str]=None):
+        """
+        Constructor for InputStickerSetItem: Instance of InputStickerSetItem.
+        """
+        self.document = document
+        self.emoji = emoji
+        self.mask_coords = mask_coords
+        self.keywords = keywords
+
+    def to_dict(self):
+        return {
+            '_': 'InputStickerSetItem',
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'emoji': self.emoji,
+            'mask_coords': self.mask_coords.to_dict() if isinstance(self.mask_coords, TLObject) else self.mask_coords,
+            'keywords': self.keywords
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9c\x9e\xda2',
+            struct.pack('<I', (0 if self.mask_coords is None or self.mask_coords is False else 1) | (0 if self.keywords is None or self.keywords is False else 2)),
+            self.document._bytes(),
+            self.serialize_bytes(self.emoji),
+            b'' if self.mask_coords is None or self.mask_coords is False else (self.mask_coords._bytes()),
+            b'' if self.keywords is None or self.keywords is False else (self.serialize_bytes(self.keywords)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _document = reader.tgread_object()
+        _emoji = reader.tgread_string()
+        if flags & 1:
+            _mask_coords = reader.tgread_object()
+        else:
+            _mask_coords = None
+        if flags & 2:
+            _keywords = reader.tgread_string()
+        else:
+            _keywords = None
+        return cls(document=_document, emoji=_emoji, mask_coords=_mask_coords, keywords=_keywords)
+
+TypeInputStickerSetItem = InputStickerSetItem
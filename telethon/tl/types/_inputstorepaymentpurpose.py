@@ -0,0 +1,443 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer, TypeInputUser, TypeTextWithEntities
+
+
+
+class InputStorePaymentAuthCode(TLObject):
+    CONSTRUCTOR_ID = 0x9bb2636d
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('phone_number', 'phone_code_hash', 'currency', 'amount', 'restore')
+
+    def __init__(self, phone_number: str, phone_code_hash: str, currency: str, amount: int, restore: Optional[bool]=None):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.phone_number = phone_number
+        self.phone_code_hash = phone_code_hash
+        self.currency = currency
+        self.amount = amount
+        self.restore = restore
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentAuthCode',
+            'phone_number': self.phone_number,
+            'phone_code_hash': self.phone_code_hash,
+            'currency': self.currency,
+            'amount': self.amount,
+            'restore': self.restore
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'mc\xb2\x9b',
+            struct.pack('<I', (0 if self.restore is None or self.restore is False else 1)),
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.phone_code_hash),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _restore = bool(flags & 1)
+        _phone_number = reader.tgread_string()
+        _phone_code_hash = reader.tgread_string()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(phone_number=_phone_number, phone_code_hash=_phone_code_hash, currency=_currency, amount=_amount, restore=_restore)
+
+
+class InputStorePaymentGiftPremium(TLObject):
+    CONSTRUCTOR_ID = 0x616f7fe8
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('user_id', 'currency', 'amount')
+
+    def __init__(self, user_id: 'TypeInputUser', currency: str, amount: int):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.user_id = user_id
+        self.currency = currency
+        self.amount = amount
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentGiftPremium',
+            'user_id': self.user_id.to_dict() if isinstance(self.user_id, TLObject) else self.user_id,
+            'currency': self.currency,
+            'amount': self.amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe8\x7foa',
+            self.user_id._bytes(),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.tgread_object()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(user_id=_user_id, currency=_currency, amount=_amount)
+
+
+class InputStorePaymentPremiumGiftCode(TLObject):
+    CONSTRUCTOR_ID = 0xfb790393
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('users', 'currency', 'amount', 'boost_peer', 'message')
+
+    def __init__(self, users: List['TypeInputUser'], currency: str, amount: int, boost_peer: Optional['TypeInputPeer']=None, message: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.users = users
+        self.currency = currency
+        self.amount = amount
+        self.boost_peer = boost_peer
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentPremiumGiftCode',
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'currency': self.currency,
+            'amount': self.amount,
+            'boost_peer': self.boost_peer.to_dict() if isinstance(self.boost_peer, TLObject) else self.boost_peer,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x93\x03y\xfb',
+            struct.pack('<I', (0 if self.boost_peer is None or self.boost_peer is False else 1) | (0 if self.message is None or self.message is False else 2)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            b'' if self.boost_peer is None or self.boost_peer is False else (self.boost_peer._bytes()),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        if flags & 1:
+            _boost_peer = reader.tgread_object()
+        else:
+            _boost_peer = None
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        if flags & 2:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        return cls(users=_users, currency=_currency, amount=_amount, boost_peer=_boost_peer, message=_message)
+
+
+class InputStorePaymentPremiumGiveaway(TLObject):
+    CONSTRUCTOR_ID = 0x160544ca
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('boost_peer', 'until_date', 'currency', 'amount', 'only_new_subscribers', 'winners_are_visible', 'additional_peers', 'countries_iso2', 'prize_description', 'random_id')
+
+    def __init__(self, boost_peer: 'TypeInputPeer', until_date: Optional[datetime], currency: str, amount: int, only_new_subscribers: Optional[bool]=None, winners_are_visible: Optional[bool]=None, additional_peers: Optional[List['TypeInputPeer']]=None, countries_iso2: Optional[List[str]]=None, prize_description: Optional[str]=None, random_id: int=None):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.boost_peer = boost_peer
+        self.until_date = until_date
+        self.currency = currency
+        self.amount = amount
+        self.only_new_subscribers = only_new_subscribers
+        self.winners_are_visible = winners_are_visible
+        self.additional_peers = additional_peers
+        self.countries_iso2 = countries_iso2
+        self.prize_description = prize_description
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentPremiumGiveaway',
+            'boost_peer': self.boost_peer.to_dict() if isinstance(self.boost_peer, TLObject) else self.boost_peer,
+            'until_date': self.until_date,
+            'currency': self.currency,
+            'amount': self.amount,
+            'only_new_subscribers': self.only_new_subscribers,
+            'winners_are_visible': self.winners_are_visible,
+            'additional_peers': [] if self.additional_peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.additional_peers],
+            'countries_iso2': [] if self.countries_iso2 is None else self.countries_iso2[:],
+            'prize_description': self.prize_description,
+            'random_id': self.random_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcaD\x05\x16',
+            struct.pack('<I', (0 if self.only_new_subscribers is None or self.only_new_subscribers is False else 1) | (0 if self.winners_are_visible is None or self.winners_are_visible is False else 8) | (0 if self.additional_peers is None or self.additional_peers is False else 2) | (0 if self.countries_iso2 is None or self.countries_iso2 is False else 4) | (0 if self.prize_description is None or self.prize_description is False else 16)),
+            self.boost_peer._bytes(),
+            b'' if self.additional_peers is None or self.additional_peers is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.additional_peers)),b''.join(x._bytes() for x in self.additional_peers))),
+            b'' if self.countries_iso2 is None or self.countries_iso2 is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.countries_iso2)),b''.join(self.serialize_bytes(x) for x in self.countries_iso2))),
+            b'' if self.prize_description is None or self.prize_description is False else (self.serialize_bytes(self.prize_description)),
+            struct.pack('<q', self.random_id),
+            self.serialize_datetime(self.until_date),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _only_new_subscribers = bool(flags & 1)
+        _winners_are_visible = bool(flags & 8)
+        _boost_peer = reader.tgread_object()
+        if flags & 2:
+            reader.read_int()
+            _additional_peers = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _additional_peers.append(_x)
+
+        else:
+            _additional_peers = None
+        if flags & 4:
+            reader.read_int()
+            _countries_iso2 = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_string()
+                _countries_iso2.append(_x)
+
+        else:
+            _countries_iso2 = None
+        if flags & 16:
+            _prize_description = reader.tgread_string()
+        else:
+            _prize_description = None
+        _random_id = reader.read_long()
+        _until_date = reader.tgread_date()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(boost_peer=_boost_peer, until_date=_until_date, currency=_currency, amount=_amount, only_new_subscribers=_only_new_subscribers, winners_are_visible=_winners_are_visible, additional_peers=_additional_peers, countries_iso2=_countries_iso2, prize_description=_prize_description, random_id=_random_id)
+
+
+class InputStorePaymentPremiumSubscription(TLObject):
+    CONSTRUCTOR_ID = 0xa6751e66
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('restore', 'upgrade')
+
+    def __init__(self, restore: Optional[bool]=None, upgrade: Optional[bool]=None):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.restore = restore
+        self.upgrade = upgrade
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentPremiumSubscription',
+            'restore': self.restore,
+            'upgrade': self.upgrade
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'f\x1eu\xa6',
+            struct.pack('<I', (0 if self.restore is None or self.restore is False else 1) | (0 if self.upgrade is None or self.upgrade is False else 2)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _restore = bool(flags & 1)
+        _upgrade = bool(flags & 2)
+        return cls(restore=_restore, upgrade=_upgrade)
+
+
+class InputStorePaymentStarsGift(TLObject):
+    CONSTRUCTOR_ID = 0x1d741ef7
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('user_id', 'stars', 'currency', 'amount')
+
+    def __init__(self, user_id: 'TypeInputUser', stars: int, currency: str, amount: int):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.user_id = user_id
+        self.stars = stars
+        self.currency = currency
+        self.amount = amount
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentStarsGift',
+            'user_id': self.user_id.to_dict() if isinstance(self.user_id, TLObject) else self.user_id,
+            'stars': self.stars,
+            'currency': self.currency,
+            'amount': self.amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf7\x1et\x1d',
+            self.user_id._bytes(),
+            struct.pack('<q', self.stars),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.tgread_object()
+        _stars = reader.read_long()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(user_id=_user_id, stars=_stars, currency=_currency, amount=_amount)
+
+
+class InputStorePaymentStarsGiveaway(TLObject):
+    CONSTRUCTOR_ID = 0x751f08fa
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('stars', 'boost_peer', 'until_date', 'currency', 'amount', 'users', 'only_new_subscribers', 'winners_are_visible', 'additional_peers', 'countries_iso2', 'prize_description', 'random_id')
+
+    def __init__(self, stars: int, boost_peer: 'TypeInputPeer', until_date: Optional[datetime], currency: str, amount: int, users: int, only_new_subscribers: Optional[bool]=None, winners_are_visible: Optional[bool]=None, additional_peers: Optional[List['TypeInputPeer']]=None, countries_iso2: Optional[List[str]]=None, prize_description: Optional[str]=None, random_id: int=None):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.stars = stars
+        self.boost_peer = boost_peer
+        self.until_date = until_date
+        self.currency = currency
+        self.amount = amount
+        self.users = users
+        self.only_new_subscribers = only_new_subscribers
+        self.winners_are_visible = winners_are_visible
+        self.additional_peers = additional_peers
+        self.countries_iso2 = countries_iso2
+        self.prize_description = prize_description
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(8), 'big', signed=True)
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentStarsGiveaway',
+            'stars': self.stars,
+            'boost_peer': self.boost_peer.to_dict() if isinstance(self.boost_peer, TLObject) else self.boost_peer,
+            'until_date': self.until_date,
+            'currency': self.currency,
+            'amount': self.amount,
+            'users': self.users,
+            'only_new_subscribers': self.only_new_subscribers,
+            'winners_are_visible': self.winners_are_visible,
+            'additional_peers': [] if self.additional_peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.additional_peers],
+            'countries_iso2': [] if self.countries_iso2 is None else self.countries_iso2[:],
+            'prize_description': self.prize_description,
+            'random_id': self.random_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfa\x08\x1fu',
+            _struct_Iq.pack((0 if self.only_new_subscribers is None or self.only_new_subscribers is False else 1) | (0 if self.winners_are_visible is None or self.winners_are_visible is False else 8) | (0 if self.additional_peers is None or self.additional_peers is False else 2) | (0 if self.countries_iso2 is None or self.countries_iso2 is False else 4) | (0 if self.prize_description is None or self.prize_description is False else 16), self.stars),
+            self.boost_peer._bytes(),
+            b'' if self.additional_peers is None or self.additional_peers is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.additional_peers)),b''.join(x._bytes() for x in self.additional_peers))),
+            b'' if self.countries_iso2 is None or self.countries_iso2 is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.countries_iso2)),b''.join(self.serialize_bytes(x) for x in self.countries_iso2))),
+            b'' if self.prize_description is None or self.prize_description is False else (self.serialize_bytes(self.prize_description)),
+            struct.pack('<q', self.random_id),
+            self.serialize_datetime(self.until_date),
+            self.serialize_bytes(self.currency),
+            _struct_qi.pack(self.amount, self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _stars = reader.read_struct(_struct_iq)
+        _only_new_subscribers = bool(flags & 1)
+        _winners_are_visible = bool(flags & 8)
+        _boost_peer = reader.tgread_object()
+        if flags & 2:
+            reader.read_int()
+            _additional_peers = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _additional_peers.append(_x)
+
+        else:
+            _additional_peers = None
+        if flags & 4:
+            reader.read_int()
+            _countries_iso2 = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_string()
+                _countries_iso2.append(_x)
+
+        else:
+            _countries_iso2 = None
+        if flags & 16:
+            _prize_description = reader.tgread_string()
+        else:
+            _prize_description = None
+        _random_id = reader.read_long()
+        _until_date = reader.tgread_date()
+        _currency = reader.tgread_string()
+        _amount, _users = reader.read_struct(_struct_qi)
+        return cls(stars=_stars, boost_peer=_boost_peer, until_date=_until_date, currency=_currency, amount=_amount, users=_users, only_new_subscribers=_only_new_subscribers, winners_are_visible=_winners_are_visible, additional_peers=_additional_peers, countries_iso2=_countries_iso2, prize_description=_prize_description, random_id=_random_id)
+
+
+class InputStorePaymentStarsTopup(TLObject):
+    CONSTRUCTOR_ID = 0xdddd0f56
+    SUBCLASS_OF_ID = 0xe7a4174d
+    __slots__ = ('stars', 'currency', 'amount')
+
+    def __init__(self, stars: int, currency: str, amount: int):
+        """
+        Constructor for InputStorePaymentPurpose: Instance of either InputStorePaymentPremiumSubscription, InputStorePaymentGiftPremium, InputStorePaymentPremiumGiftCode, InputStorePaymentPremiumGiveaway, InputStorePaymentStarsTopup, InputStorePaymentStarsGift, InputStorePaymentStarsGiveaway, InputStorePaymentAuthCode.
+        """
+        self.stars = stars
+        self.currency = currency
+        self.amount = amount
+
+    def to_dict(self):
+        return {
+            '_': 'InputStorePaymentStarsTopup',
+            'stars': self.stars,
+            'currency': self.currency,
+            'amount': self.amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'V\x0f\xdd\xdd',
+            struct.pack('<q', self.stars),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stars = reader.read_long()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(stars=_stars, currency=_currency, amount=_amount)
+
+TypeInputStorePaymentPurpose = Union[InputStorePaymentPremiumSubscription,InputStorePaymentGiftPremium,InputStorePaymentPremiumGiftCode,InputStorePaymentPremiumGiveaway,InputStorePaymentStarsTopup,InputStorePaymentStarsGift,InputStorePaymentStarsGiveaway,InputStorePaymentAuthCode]
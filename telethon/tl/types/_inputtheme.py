@@ -0,0 +1,71 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class InputTheme(TLObject):
+    CONSTRUCTOR_ID = 0x3c5693e9
+    SUBCLASS_OF_ID = 0x7a100f0
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputTheme: Instance of either InputTheme, InputThemeSlug.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputTheme',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe9\x93V<',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputThemeSlug(TLObject):
+    CONSTRUCTOR_ID = 0xf5890df1
+    SUBCLASS_OF_ID = 0x7a100f0
+    __slots__ = ('slug',)
+
+    def __init__(self, slug: str):
+        """
+        Constructor for InputTheme: Instance of either InputTheme, InputThemeSlug.
+        """
+        self.slug = slug
+
+    def to_dict(self):
+        return {
+            '_': 'InputThemeSlug',
+            'slug': self.slug
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf1\r\x89\xf5',
+            self.serialize_bytes(self.slug),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _slug = reader.tgread_string()
+        return cls(slug=_slug)
+
+TypeInputTheme = Union[InputTheme,InputThemeSlug]
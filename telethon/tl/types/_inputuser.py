@@ -0,0 +1,120 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iq = struct.Struct('<iq')
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer
+
+
+
+class InputUser(TLObject):
+    CONSTRUCTOR_ID = 0xf21158c6
+    SUBCLASS_OF_ID = 0xe669bf46
+    __slots__ = ('user_id', 'access_hash')
+
+    def __init__(self, user_id: int, access_hash: int):
+        """
+        Constructor for InputUser: Instance of either InputUserEmpty, InputUserSelf, InputUser, InputUserFromMessage.
+        """
+        self.user_id = user_id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputUser',
+            'user_id': self.user_id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc6X\x11\xf2',
+            _struct_qq.pack(self.user_id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(user_id=_user_id, access_hash=_access_hash)
+
+
+class InputUserEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xb98886cf
+    SUBCLASS_OF_ID = 0xe669bf46
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputUserEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcf\x86\x88\xb9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputUserFromMessage(TLObject):
+    CONSTRUCTOR_ID = 0x1da448e2
+    SUBCLASS_OF_ID = 0xe669bf46
+    __slots__ = ('peer', 'msg_id', 'user_id')
+
+    def __init__(self, peer: 'TypeInputPeer', msg_id: int, user_id: int):
+        """
+        Constructor for InputUser: Instance of either InputUserEmpty, InputUserSelf, InputUser, InputUserFromMessage.
+        """
+        self.peer = peer
+        self.msg_id = msg_id
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputUserFromMessage',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'msg_id': self.msg_id,
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe2H\xa4\x1d',
+            self.peer._bytes(),
+            _struct_iq.pack(self.msg_id, self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _msg_id, _user_id = reader.read_struct(_struct_iq)
+        return cls(peer=_peer, msg_id=_msg_id, user_id=_user_id)
+
+
+class InputUserSelf(TLObject):
+    CONSTRUCTOR_ID = 0xf7c1b13f
+    SUBCLASS_OF_ID = 0xe669bf46
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputUserSelf'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?\xb1\xc1\xf7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeInputUser = Union[InputUserEmpty,InputUserSelf,InputUser,InputUserFromMessage]
@@ -0,0 +1,101 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class InputWallPaper(TLObject):
+    CONSTRUCTOR_ID = 0xe630b979
+    SUBCLASS_OF_ID = 0xee77201a
+    __slots__ = ('id', 'access_hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int):
+        """
+        Constructor for InputWallPaper: Instance of either InputWallPaper, InputWallPaperSlug, InputWallPaperNoFile.
+        """
+        self.id = id
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputWallPaper',
+            'id': self.id,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'y\xb90\xe6',
+            _struct_qq.pack(self.id, self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        return cls(id=_id, access_hash=_access_hash)
+
+
+class InputWallPaperNoFile(TLObject):
+    CONSTRUCTOR_ID = 0x967a462e
+    SUBCLASS_OF_ID = 0xee77201a
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for InputWallPaper: Instance of either InputWallPaper, InputWallPaperSlug, InputWallPaperNoFile.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'InputWallPaperNoFile',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'.Fz\x96',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
+
+class InputWallPaperSlug(TLObject):
+    CONSTRUCTOR_ID = 0x72091c80
+    SUBCLASS_OF_ID = 0xee77201a
+    __slots__ = ('slug',)
+
+    def __init__(self, slug: str):
+        """
+        Constructor for InputWallPaper: Instance of either InputWallPaper, InputWallPaperSlug, InputWallPaperNoFile.
+        """
+        self.slug = slug
+
+    def to_dict(self):
+        return {
+            '_': 'InputWallPaperSlug',
+            'slug': self.slug
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x80\x1c\tr',
+            self.serialize_bytes(self.slug),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _slug = reader.tgread_string()
+        return cls(slug=_slug)
+
+TypeInputWallPaper = Union[InputWallPaper,InputWallPaperSlug,InputWallPaperNoFile]
@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocumentAttribute
+
+
+
+class InputWebDocument(TLObject):
+    CONSTRUCTOR_ID = 0x9bed434d
+    SUBCLASS_OF_ID = 0x8ae8b146
+    __slots__ = ('url', 'size', 'mime_type', 'attributes')
+
+    def __init__(self, url: str, size: int, mime_type: str, attributes: List['TypeDocumentAttribute']):
+        """
+        Constructor for InputWebDocument: Instance of InputWebDocument.
+        """
+        self.url = url
+        self.size = size
+        self.mime_type = mime_type
+        self.attributes = attributes
+
+    def to_dict(self):
+        return {
+            '_': 'InputWebDocument',
+            'url': self.url,
+            'size': self.size,
+            'mime_type': self.mime_type,
+            'attributes': [] if self.attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.attributes]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'MC\xed\x9b',
+            self.serialize_bytes(self.url),
+            struct.pack('<i', self.size),
+            self.serialize_bytes(self.mime_type),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.attributes)),b''.join(x._bytes() for x in self.attributes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _size = reader.read_int()
+        _mime_type = reader.tgread_string()
+        reader.read_int()
+        _attributes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _attributes.append(_x)
+
+        return cls(url=_url, size=_size, mime_type=_mime_type, attributes=_attributes)
+
+TypeInputWebDocument = InputWebDocument
@@ -0,0 +1,140 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qiiii = struct.Struct('<qiiii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputDocument, TypeInputGeoPoint
+
+
+
+class InputWebFileAudioAlbumThumbLocation(TLObject):
+    CONSTRUCTOR_ID = 0xf46fe924
+    SUBCLASS_OF_ID = 0xf72ed8d9
+    __slots__ = ('small', 'document', 'title', 'performer')
+
+    def __init__(self, small: Optional[bool]=None, document: Optional['TypeInputDocument']=None, title: Optional[str]=None, performer: Optional[str]=None):
+        """
+        Constructor for InputWebFileLocation: Instance of either InputWebFileLocation, InputWebFileGeoPointLocation, InputWebFileAudioAlbumThumbLocation.
+        """
+        self.small = small
+        self.document = document
+        self.title = title
+        self.performer = performer
+
+    def to_dict(self):
+        return {
+            '_': 'InputWebFileAudioAlbumThumbLocation',
+            'small': self.small,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'title': self.title,
+            'performer': self.performer
+        }
+
+    def _bytes(self):
+        assert ((self.title or self.title is not None) and (self.performer or self.performer is not None)) or ((self.title is None or self.title is False) and (self.performer is None or self.performer is False)), 'title, performer parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'$\xe9o\xf4',
+            struct.pack('<I', (0 if self.small is None or self.small is False else 4) | (0 if self.document is None or self.document is False else 1) | (0 if self.title is None or self.title is False else 2) | (0 if self.performer is None or self.performer is False else 2)),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.performer is None or self.performer is False else (self.serialize_bytes(self.performer)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _small = bool(flags & 4)
+        if flags & 1:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        if flags & 2:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 2:
+            _performer = reader.tgread_string()
+        else:
+            _performer = None
+        return cls(small=_small, document=_document, title=_title, performer=_performer)
+
+
+class InputWebFileGeoPointLocation(TLObject):
+    CONSTRUCTOR_ID = 0x9f2221c9
+    SUBCLASS_OF_ID = 0xf72ed8d9
+    __slots__ = ('geo_point', 'access_hash', 'w', 'h', 'zoom', 'scale')
+
+    def __init__(self, geo_point: 'TypeInputGeoPoint', access_hash: int, w: int, h: int, zoom: int, scale: int):
+        """
+        Constructor for InputWebFileLocation: Instance of either InputWebFileLocation, InputWebFileGeoPointLocation, InputWebFileAudioAlbumThumbLocation.
+        """
+        self.geo_point = geo_point
+        self.access_hash = access_hash
+        self.w = w
+        self.h = h
+        self.zoom = zoom
+        self.scale = scale
+
+    def to_dict(self):
+        return {
+            '_': 'InputWebFileGeoPointLocation',
+            'geo_point': self.geo_point.to_dict() if isinstance(self.geo_point, TLObject) else self.geo_point,
+            'access_hash': self.access_hash,
+            'w': self.w,
+            'h': self.h,
+            'zoom': self.zoom,
+            'scale': self.scale
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9!"\x9f',
+            self.geo_point._bytes(),
+            _struct_qiiii.pack(self.access_hash, self.w, self.h, self.zoom, self.scale),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _geo_point = reader.tgread_object()
+        _access_hash, _w, _h, _zoom, _scale = reader.read_struct(_struct_qiiii)
+        return cls(geo_point=_geo_point, access_hash=_access_hash, w=_w, h=_h, zoom=_zoom, scale=_scale)
+
+
+class InputWebFileLocation(TLObject):
+    CONSTRUCTOR_ID = 0xc239d686
+    SUBCLASS_OF_ID = 0xf72ed8d9
+    __slots__ = ('url', 'access_hash')
+
+    def __init__(self, url: str, access_hash: int):
+        """
+        Constructor for InputWebFileLocation: Instance of either InputWebFileLocation, InputWebFileGeoPointLocation, InputWebFileAudioAlbumThumbLocation.
+        """
+        self.url = url
+        self.access_hash = access_hash
+
+    def to_dict(self):
+        return {
+            '_': 'InputWebFileLocation',
+            'url': self.url,
+            'access_hash': self.access_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x86\xd69\xc2',
+            self.serialize_bytes(self.url),
+            struct.pack('<q', self.access_hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _access_hash = reader.read_long()
+        return cls(url=_url, access_hash=_access_hash)
+
+TypeInputWebFileLocation = Union[InputWebFileLocation,InputWebFileGeoPointLocation,InputWebFileAudioAlbumThumbLocation]
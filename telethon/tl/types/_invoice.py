@@ -0,0 +1,109 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeLabeledPrice
+
+
+
+class Invoice(TLObject):
+    CONSTRUCTOR_ID = 0x49ee584
+    SUBCLASS_OF_ID = 0x5fd82ed8
+    __slots__ = ('currency', 'prices', 'test', 'name_requested', 'phone_requested', 'email_requested', 'shipping_address_requested', 'flexible', 'phone_to_provider', 'email_to_provider', 'recurring', 'max_tip_amount', 'suggested_tip_amounts', 'terms_url', 'subscription_period')
+
+    def __init__(self, currency: str, prices: List['TypeLabeledPrice'], test: Optional[bool]=None, name_requested: Optional[bool]=None, phone_requested: Optional[bool]=None, email_requested: Optional[bool]=None, shipping_address_requested: Optional[bool]=None, flexible: Optional[bool]=None, phone_to_provider: Optional[bool]=None, email_to_provider: Optional[bool]=None, recurring: Optional[bool]=None, max_tip_amount: Optional[int]=None, suggested_tip_amounts: Optional[List[int]]=None, terms_url: Optional[str]=None, subscription_period: Optional[int]=None):
+        """
+        Constructor for Invoice: Instance of Invoice.
+        """
+        self.currency = currency
+        self.prices = prices
+        self.test = test
+        self.name_requested = name_requested
+        self.phone_requested = phone_requested
+        self.email_requested = email_requested
+        self.shipping_address_requested = shipping_address_requested
+        self.flexible = flexible
+        self.phone_to_provider = phone_to_provider
+        self.email_to_provider = email_to_provider
+        self.recurring = recurring
+        self.max_tip_amount = max_tip_amount
+        self.suggested_tip_amounts = suggested_tip_amounts
+        self.terms_url = terms_url
+        self.subscription_period = subscription_period
+
+    def to_dict(self):
+        return {
+            '_': 'Invoice',
+            'currency': self.currency,
+            'prices': [] if self.prices is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.prices],
+            'test': self.test,
+            'name_requested': self.name_requested,
+            'phone_requested': self.phone_requested,
+            'email_requested': self.email_requested,
+            'shipping_address_requested': self.shipping_address_requested,
+            'flexible': self.flexible,
+            'phone_to_provider': self.phone_to_provider,
+            'email_to_provider': self.email_to_provider,
+            'recurring': self.recurring,
+            'max_tip_amount': self.max_tip_amount,
+            'suggested_tip_amounts': [] if self.suggested_tip_amounts is None else self.suggested_tip_amounts[:],
+            'terms_url': self.terms_url,
+            'subscription_period': self.subscription_period
+        }
+
+    def _bytes(self):
+        assert ((self.max_tip_amount or self.max_tip_amount is not None) and (self.suggested_tip_amounts or self.suggested_tip_amounts is not None)) or ((self.max_tip_amount is None or self.max_tip_amount is False) and (self.suggested_tip_amounts is None or self.suggested_tip_amounts is False)), 'max_tip_amount, suggested_tip_amounts parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\x84\xe5\x9e\x04',
+            struct.pack('<I', (0 if self.test is None or self.test is False else 1) | (0 if self.name_requested is None or self.name_requested is False else 2) | (0 if self.phone_requested is None or self.phone_requested is False else 4) | (0 if self.email_requested is None or self.email_requested is False else 8) | (0 if self.shipping_address_requested is None or self.shipping_address_requested is False else 16) | (0 if self.flexible is None or self.flexible is False else 32) | (0 if self.phone_to_provider is None or self.phone_to_provider is False else 64) | (0 if self.email_to_provider is None or self.email_to_provider is False else 128) | (0 if self.recurring is None or self.recurring is False else 512) | (0 if self.max_tip_amount is None or self.max_tip_amount is False else 256) | (0 if self.suggested_tip_amounts is None or self.suggested_tip_amounts is False else 256) | (0 if self.terms_url is None or self.terms_url is False else 1024) | (0 if self.subscription_period is None or self.subscription_period is False else 2048)),
+            self.serialize_bytes(self.currency),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.prices)),b''.join(x._bytes() for x in self.prices),
+            b'' if self.max_tip_amount is None or self.max_tip_amount is False else (struct.pack('<q', self.max_tip_amount)),
+            b'' if self.suggested_tip_amounts is None or self.suggested_tip_amounts is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.suggested_tip_amounts)), len(self.suggested_tip_amounts), *self.suggested_tip_amounts))),
+            b'' if self.terms_url is None or self.terms_url is False else (self.serialize_bytes(self.terms_url)),
+            b'' if self.subscription_period is None or self.subscription_period is False else (struct.pack('<i', self.subscription_period)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _test = bool(flags & 1)
+        _name_requested = bool(flags & 2)
+        _phone_requested = bool(flags & 4)
+        _email_requested = bool(flags & 8)
+        _shipping_address_requested = bool(flags & 16)
+        _flexible = bool(flags & 32)
+        _phone_to_provider = bool(flags & 64)
+        _email_to_provider = bool(flags & 128)
+        _recurring = bool(flags & 512)
+        _currency = reader.tgread_string()
+        reader.read_int()
+        _prices = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _prices.append(_x)
+
+        if flags & 256:
+            _max_tip_amount = reader.read_long()
+        else:
+            _max_tip_amount = None
+        if flags & 256:
+            reader.read_int()
+            _suggested_tip_amounts = reader.read_array('q', reader.read_int())
+        else:
+            _suggested_tip_amounts = None
+        if flags & 1024:
+            _terms_url = reader.tgread_string()
+        else:
+            _terms_url = None
+        if flags & 2048:
+            _subscription_period = reader.read_int()
+        else:
+            _subscription_period = None
+        return cls(currency=_currency, prices=_prices, test=_test, name_requested=_name_requested, phone_requested=_phone_requested, email_requested=_email_requested, shipping_address_requested=_shipping_address_requested, flexible=_flexible, phone_to_provider=_phone_to_provider, email_to_provider=_email_to_provider, recurring=_recurring, max_tip_amount=_max_tip_amount, suggested_tip_amounts=_suggested_tip_amounts, terms_url=_terms_url, subscription_period=_subscription_period)
+
+TypeInvoice = Invoice
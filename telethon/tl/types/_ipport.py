@@ -0,0 +1,76 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class IpPort(TLObject):
+    CONSTRUCTOR_ID = 0xd433ad73
+    SUBCLASS_OF_ID = 0xa2a03726
+    __slots__ = ('ipv4', 'port')
+
+    def __init__(self, ipv4: int, port: int):
+        """
+        Constructor for IpPort: Instance of either IpPort, IpPortSecret.
+        """
+        self.ipv4 = ipv4
+        self.port = port
+
+    def to_dict(self):
+        return {
+            '_': 'IpPort',
+            'ipv4': self.ipv4,
+            'port': self.port
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b's\xad3\xd4',
+            _struct_ii.pack(self.ipv4, self.port),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _ipv4, _port = reader.read_struct(_struct_ii)
+        return cls(ipv4=_ipv4, port=_port)
+
+
+class IpPortSecret(TLObject):
+    CONSTRUCTOR_ID = 0x37982646
+    SUBCLASS_OF_ID = 0xa2a03726
+    __slots__ = ('ipv4', 'port', 'secret')
+
+    def __init__(self, ipv4: int, port: int, secret: bytes):
+        """
+        Constructor for IpPort: Instance of either IpPort, IpPortSecret.
+        """
+        self.ipv4 = ipv4
+        self.port = port
+        self.secret = secret
+
+    def to_dict(self):
+        return {
+            '_': 'IpPortSecret',
+            'ipv4': self.ipv4,
+            'port': self.port,
+            'secret': self.secret
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'F&\x987',
+            _struct_ii.pack(self.ipv4, self.port),
+            self.serialize_bytes(self.secret),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _ipv4, _port = reader.read_struct(_struct_ii)
+        _secret = reader.tgread_bytes()
+        return cls(ipv4=_ipv4, port=_port, secret=_secret)
+
+TypeIpPort = Union[IpPort,IpPortSecret]
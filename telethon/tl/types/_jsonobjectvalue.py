@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeJSONValue
+
+
+
+class JsonObjectValue(TLObject):
+    CONSTRUCTOR_ID = 0xc0de1bd9
+    SUBCLASS_OF_ID = 0x937fceb9
+    __slots__ = ('key', 'value')
+
+    def __init__(self, key: str, value: 'TypeJSONValue'):
+        """
+        Constructor for JSONObjectValue: Instance of JsonObjectValue.
+        """
+        self.key = key
+        self.value = value
+
+    def to_dict(self):
+        return {
+            '_': 'JsonObjectValue',
+            'key': self.key,
+            'value': self.value.to_dict() if isinstance(self.value, TLObject) else self.value
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9\x1b\xde\xc0',
+            self.serialize_bytes(self.key),
+            self.value._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _key = reader.tgread_string()
+        _value = reader.tgread_object()
+        return cls(key=_key, value=_value)
+
+TypeJSONObjectValue = JsonObjectValue
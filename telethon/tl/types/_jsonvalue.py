@@ -0,0 +1,186 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeJSONObjectValue
+
+
+
+class JsonArray(TLObject):
+    CONSTRUCTOR_ID = 0xf7444763
+    SUBCLASS_OF_ID = 0xeb9987b3
+    __slots__ = ('value',)
+
+    def __init__(self, value: List['TypeJSONValue']):
+        """
+        Constructor for JSONValue: Instance of either JsonNull, JsonBool, JsonNumber, JsonString, JsonArray, JsonObject.
+        """
+        self.value = value
+
+    def to_dict(self):
+        return {
+            '_': 'JsonArray',
+            'value': [] if self.value is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.value]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'cGD\xf7',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.value)),b''.join(x._bytes() for x in self.value),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _value = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _value.append(_x)
+
+        return cls(value=_value)
+
+
+class JsonBool(TLObject):
+    CONSTRUCTOR_ID = 0xc7345e6a
+    SUBCLASS_OF_ID = 0xeb9987b3
+    __slots__ = ('value',)
+
+    def __init__(self, value: bool):
+        """
+        Constructor for JSONValue: Instance of either JsonNull, JsonBool, JsonNumber, JsonString, JsonArray, JsonObject.
+        """
+        self.value = value
+
+    def to_dict(self):
+        return {
+            '_': 'JsonBool',
+            'value': self.value
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'j^4\xc7',
+            b'\xb5ur\x99' if self.value else b'7\x97y\xbc',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _value = reader.tgread_bool()
+        return cls(value=_value)
+
+
+class JsonNull(TLObject):
+    CONSTRUCTOR_ID = 0x3f6d7b68
+    SUBCLASS_OF_ID = 0xeb9987b3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'JsonNull'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'h{m?',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class JsonNumber(TLObject):
+    CONSTRUCTOR_ID = 0x2be0dfa4
+    SUBCLASS_OF_ID = 0xeb9987b3
+    __slots__ = ('value',)
+
+    def __init__(self, value: float):
+        """
+        Constructor for JSONValue: Instance of either JsonNull, JsonBool, JsonNumber, JsonString, JsonArray, JsonObject.
+        """
+        self.value = value
+
+    def to_dict(self):
+        return {
+            '_': 'JsonNumber',
+            'value': self.value
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa4\xdf\xe0+',
+            struct.pack('<d', self.value),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _value = reader.read_double()
+        return cls(value=_value)
+
+
+class JsonObject(TLObject):
+    CONSTRUCTOR_ID = 0x99c1d49d
+    SUBCLASS_OF_ID = 0xeb9987b3
+    __slots__ = ('value',)
+
+    def __init__(self, value: List['TypeJSONObjectValue']):
+        """
+        Constructor for JSONValue: Instance of either JsonNull, JsonBool, JsonNumber, JsonString, JsonArray, JsonObject.
+        """
+        self.value = value
+
+    def to_dict(self):
+        return {
+            '_': 'JsonObject',
+            'value': [] if self.value is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.value]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9d\xd4\xc1\x99',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.value)),b''.join(x._bytes() for x in self.value),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _value = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _value.append(_x)
+
+        return cls(value=_value)
+
+
+class JsonString(TLObject):
+    CONSTRUCTOR_ID = 0xb71e767a
+    SUBCLASS_OF_ID = 0xeb9987b3
+    __slots__ = ('value',)
+
+    def __init__(self, value: str):
+        """
+        Constructor for JSONValue: Instance of either JsonNull, JsonBool, JsonNumber, JsonString, JsonArray, JsonObject.
+        """
+        self.value = value
+
+    def to_dict(self):
+        return {
+            '_': 'JsonString',
+            'value': self.value
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'zv\x1e\xb7',
+            self.serialize_bytes(self.value),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _value = reader.tgread_string()
+        return cls(value=_value)
+
+TypeJSONValue = Union[JsonNull,JsonBool,JsonNumber,JsonString,JsonArray,JsonObject]
@@ -0,0 +1,674 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInlineQueryPeerType, TypeInputUser, TypeRequestPeerType
+
+
+
+class InputKeyboardButtonRequestPeer(TLObject):
+    CONSTRUCTOR_ID = 0xc9662d05
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'button_id', 'peer_type', 'max_quantity', 'name_requested', 'username_requested', 'photo_requested')
+
+    def __init__(self, text: str, button_id: int, peer_type: 'TypeRequestPeerType', max_quantity: int, name_requested: Optional[bool]=None, username_requested: Optional[bool]=None, photo_requested: Optional[bool]=None):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.button_id = button_id
+        self.peer_type = peer_type
+        self.max_quantity = max_quantity
+        self.name_requested = name_requested
+        self.username_requested = username_requested
+        self.photo_requested = photo_requested
+
+    def to_dict(self):
+        return {
+            '_': 'InputKeyboardButtonRequestPeer',
+            'text': self.text,
+            'button_id': self.button_id,
+            'peer_type': self.peer_type.to_dict() if isinstance(self.peer_type, TLObject) else self.peer_type,
+            'max_quantity': self.max_quantity,
+            'name_requested': self.name_requested,
+            'username_requested': self.username_requested,
+            'photo_requested': self.photo_requested
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x05-f\xc9',
+            struct.pack('<I', (0 if self.name_requested is None or self.name_requested is False else 1) | (0 if self.username_requested is None or self.username_requested is False else 2) | (0 if self.photo_requested is None or self.photo_requested is False else 4)),
+            self.serialize_bytes(self.text),
+            struct.pack('<i', self.button_id),
+            self.peer_type._bytes(),
+            struct.pack('<i', self.max_quantity),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _name_requested = bool(flags & 1)
+        _username_requested = bool(flags & 2)
+        _photo_requested = bool(flags & 4)
+        _text = reader.tgread_string()
+        _button_id = reader.read_int()
+        _peer_type = reader.tgread_object()
+        _max_quantity = reader.read_int()
+        return cls(text=_text, button_id=_button_id, peer_type=_peer_type, max_quantity=_max_quantity, name_requested=_name_requested, username_requested=_username_requested, photo_requested=_photo_requested)
+
+
+class InputKeyboardButtonUrlAuth(TLObject):
+    CONSTRUCTOR_ID = 0xd02e7fd4
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'url', 'bot', 'request_write_access', 'fwd_text')
+
+    def __init__(self, text: str, url: str, bot: 'TypeInputUser', request_write_access: Optional[bool]=None, fwd_text: Optional[str]=None):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.url = url
+        self.bot = bot
+        self.request_write_access = request_write_access
+        self.fwd_text = fwd_text
+
+    def to_dict(self):
+        return {
+            '_': 'InputKeyboardButtonUrlAuth',
+            'text': self.text,
+            'url': self.url,
+            'bot': self.bot.to_dict() if isinstance(self.bot, TLObject) else self.bot,
+            'request_write_access': self.request_write_access,
+            'fwd_text': self.fwd_text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd4\x7f.\xd0',
+            struct.pack('<I', (0 if self.request_write_access is None or self.request_write_access is False else 1) | (0 if self.fwd_text is None or self.fwd_text is False else 2)),
+            self.serialize_bytes(self.text),
+            b'' if self.fwd_text is None or self.fwd_text is False else (self.serialize_bytes(self.fwd_text)),
+            self.serialize_bytes(self.url),
+            self.bot._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _request_write_access = bool(flags & 1)
+        _text = reader.tgread_string()
+        if flags & 2:
+            _fwd_text = reader.tgread_string()
+        else:
+            _fwd_text = None
+        _url = reader.tgread_string()
+        _bot = reader.tgread_object()
+        return cls(text=_text, url=_url, bot=_bot, request_write_access=_request_write_access, fwd_text=_fwd_text)
+
+
+class InputKeyboardButtonUserProfile(TLObject):
+    CONSTRUCTOR_ID = 0xe988037b
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'user_id')
+
+    def __init__(self, text: str, user_id: 'TypeInputUser'):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputKeyboardButtonUserProfile',
+            'text': self.text,
+            'user_id': self.user_id.to_dict() if isinstance(self.user_id, TLObject) else self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'{\x03\x88\xe9',
+            self.serialize_bytes(self.text),
+            self.user_id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _user_id = reader.tgread_object()
+        return cls(text=_text, user_id=_user_id)
+
+
+class KeyboardButton(TLObject):
+    CONSTRUCTOR_ID = 0xa2fa4880
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButton',
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x80H\xfa\xa2',
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        return cls(text=_text)
+
+
+class KeyboardButtonBuy(TLObject):
+    CONSTRUCTOR_ID = 0xafd93fbb
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonBuy',
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbb?\xd9\xaf',
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        return cls(text=_text)
+
+
+class KeyboardButtonCallback(TLObject):
+    CONSTRUCTOR_ID = 0x35bbdb6b
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'data', 'requires_password')
+
+    def __init__(self, text: str, data: bytes, requires_password: Optional[bool]=None):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.data = data
+        self.requires_password = requires_password
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonCallback',
+            'text': self.text,
+            'data': self.data,
+            'requires_password': self.requires_password
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'k\xdb\xbb5',
+            struct.pack('<I', (0 if self.requires_password is None or self.requires_password is False else 1)),
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.data),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _requires_password = bool(flags & 1)
+        _text = reader.tgread_string()
+        _data = reader.tgread_bytes()
+        return cls(text=_text, data=_data, requires_password=_requires_password)
+
+
+class KeyboardButtonCopy(TLObject):
+    CONSTRUCTOR_ID = 0x75d2698e
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'copy_text')
+
+    def __init__(self, text: str, copy_text: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.copy_text = copy_text
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonCopy',
+            'text': self.text,
+            'copy_text': self.copy_text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8ei\xd2u',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.copy_text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _copy_text = reader.tgread_string()
+        return cls(text=_text, copy_text=_copy_text)
+
+
+class KeyboardButtonGame(TLObject):
+    CONSTRUCTOR_ID = 0x50f41ccf
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonGame',
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcf\x1c\xf4P',
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        return cls(text=_text)
+
+
+class KeyboardButtonRequestGeoLocation(TLObject):
+    CONSTRUCTOR_ID = 0xfc796b3f
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonRequestGeoLocation',
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?ky\xfc',
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        return cls(text=_text)
+
+
+class KeyboardButtonRequestPeer(TLObject):
+    CONSTRUCTOR_ID = 0x53d7bfd8
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'button_id', 'peer_type', 'max_quantity')
+
+    def __init__(self, text: str, button_id: int, peer_type: 'TypeRequestPeerType', max_quantity: int):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.button_id = button_id
+        self.peer_type = peer_type
+        self.max_quantity = max_quantity
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonRequestPeer',
+            'text': self.text,
+            'button_id': self.button_id,
+            'peer_type': self.peer_type.to_dict() if isinstance(self.peer_type, TLObject) else self.peer_type,
+            'max_quantity': self.max_quantity
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd8\xbf\xd7S',
+            self.serialize_bytes(self.text),
+            struct.pack('<i', self.button_id),
+            self.peer_type._bytes(),
+            struct.pack('<i', self.max_quantity),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _button_id = reader.read_int()
+        _peer_type = reader.tgread_object()
+        _max_quantity = reader.read_int()
+        return cls(text=_text, button_id=_button_id, peer_type=_peer_type, max_quantity=_max_quantity)
+
+
+class KeyboardButtonRequestPhone(TLObject):
+    CONSTRUCTOR_ID = 0xb16a6c29
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonRequestPhone',
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b')lj\xb1',
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        return cls(text=_text)
+
+
+class KeyboardButtonRequestPoll(TLObject):
+    CONSTRUCTOR_ID = 0xbbc7515d
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'quiz')
+
+    def __init__(self, text: str, quiz: Optional[bool]=None):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.quiz = quiz
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonRequestPoll',
+            'text': self.text,
+            'quiz': self.quiz
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b']Q\xc7\xbb',
+            struct.pack('<I', (0 if self.quiz is None else 1)),
+            b'' if self.quiz is None else (b'\xb5ur\x99' if self.quiz else b'7\x97y\xbc'),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _quiz = reader.tgread_bool()
+        else:
+            _quiz = None
+        _text = reader.tgread_string()
+        return cls(text=_text, quiz=_quiz)
+
+
+class KeyboardButtonSimpleWebView(TLObject):
+    CONSTRUCTOR_ID = 0xa0c0505c
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'url')
+
+    def __init__(self, text: str, url: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonSimpleWebView',
+            'text': self.text,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\P\xc0\xa0',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _url = reader.tgread_string()
+        return cls(text=_text, url=_url)
+
+
+class KeyboardButtonSwitchInline(TLObject):
+    CONSTRUCTOR_ID = 0x93b9fbb5
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'query', 'same_peer', 'peer_types')
+
+    def __init__(self, text: str, query: str, same_peer: Optional[bool]=None, peer_types: Optional[List['TypeInlineQueryPeerType']]=None):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.query = query
+        self.same_peer = same_peer
+        self.peer_types = peer_types
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonSwitchInline',
+            'text': self.text,
+            'query': self.query,
+            'same_peer': self.same_peer,
+            'peer_types': [] if self.peer_types is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peer_types]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb5\xfb\xb9\x93',
+            struct.pack('<I', (0 if self.same_peer is None or self.same_peer is False else 1) | (0 if self.peer_types is None or self.peer_types is False else 2)),
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.query),
+            b'' if self.peer_types is None or self.peer_types is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peer_types)),b''.join(x._bytes() for x in self.peer_types))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _same_peer = bool(flags & 1)
+        _text = reader.tgread_string()
+        _query = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _peer_types = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _peer_types.append(_x)
+
+        else:
+            _peer_types = None
+        return cls(text=_text, query=_query, same_peer=_same_peer, peer_types=_peer_types)
+
+
+class KeyboardButtonUrl(TLObject):
+    CONSTRUCTOR_ID = 0x258aff05
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'url')
+
+    def __init__(self, text: str, url: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonUrl',
+            'text': self.text,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x05\xff\x8a%',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _url = reader.tgread_string()
+        return cls(text=_text, url=_url)
+
+
+class KeyboardButtonUrlAuth(TLObject):
+    CONSTRUCTOR_ID = 0x10b78d29
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'url', 'button_id', 'fwd_text')
+
+    def __init__(self, text: str, url: str, button_id: int, fwd_text: Optional[str]=None):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.url = url
+        self.button_id = button_id
+        self.fwd_text = fwd_text
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonUrlAuth',
+            'text': self.text,
+            'url': self.url,
+            'button_id': self.button_id,
+            'fwd_text': self.fwd_text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b')\x8d\xb7\x10',
+            struct.pack('<I', (0 if self.fwd_text is None or self.fwd_text is False else 1)),
+            self.serialize_bytes(self.text),
+            b'' if self.fwd_text is None or self.fwd_text is False else (self.serialize_bytes(self.fwd_text)),
+            self.serialize_bytes(self.url),
+            struct.pack('<i', self.button_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _text = reader.tgread_string()
+        if flags & 1:
+            _fwd_text = reader.tgread_string()
+        else:
+            _fwd_text = None
+        _url = reader.tgread_string()
+        _button_id = reader.read_int()
+        return cls(text=_text, url=_url, button_id=_button_id, fwd_text=_fwd_text)
+
+
+class KeyboardButtonUserProfile(TLObject):
+    CONSTRUCTOR_ID = 0x308660c1
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'user_id')
+
+    def __init__(self, text: str, user_id: int):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonUserProfile',
+            'text': self.text,
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc1`\x860',
+            self.serialize_bytes(self.text),
+            struct.pack('<q', self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _user_id = reader.read_long()
+        return cls(text=_text, user_id=_user_id)
+
+
+class KeyboardButtonWebView(TLObject):
+    CONSTRUCTOR_ID = 0x13767230
+    SUBCLASS_OF_ID = 0xbad74a3
+    __slots__ = ('text', 'url')
+
+    def __init__(self, text: str, url: str):
+        """
+        Constructor for KeyboardButton: Instance of either KeyboardButton, KeyboardButtonUrl, KeyboardButtonCallback, KeyboardButtonRequestPhone, KeyboardButtonRequestGeoLocation, KeyboardButtonSwitchInline, KeyboardButtonGame, KeyboardButtonBuy, KeyboardButtonUrlAuth, InputKeyboardButtonUrlAuth, KeyboardButtonRequestPoll, InputKeyboardButtonUserProfile, KeyboardButtonUserProfile, KeyboardButtonWebView, KeyboardButtonSimpleWebView, KeyboardButtonRequestPeer, InputKeyboardButtonRequestPeer, KeyboardButtonCopy.
+        """
+        self.text = text
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonWebView',
+            'text': self.text,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'0rv\x13',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _url = reader.tgread_string()
+        return cls(text=_text, url=_url)
+
+TypeKeyboardButton = Union[KeyboardButton,KeyboardButtonUrl,KeyboardButtonCallback,KeyboardButtonRequestPhone,KeyboardButtonRequestGeoLocation,KeyboardButtonSwitchInline,KeyboardButtonGame,KeyboardButtonBuy,KeyboardButtonUrlAuth,InputKeyboardButtonUrlAuth,KeyboardButtonRequestPoll,InputKeyboardButtonUserProfile,KeyboardButtonUserProfile,KeyboardButtonWebView,KeyboardButtonSimpleWebView,KeyboardButtonRequestPeer,InputKeyboardButtonRequestPeer,KeyboardButtonCopy]
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeKeyboardButton
+
+
+
+class KeyboardButtonRow(TLObject):
+    CONSTRUCTOR_ID = 0x77608b83
+    SUBCLASS_OF_ID = 0x847730ae
+    __slots__ = ('buttons',)
+
+    def __init__(self, buttons: List['TypeKeyboardButton']):
+        """
+        Constructor for KeyboardButtonRow: Instance of KeyboardButtonRow.
+        """
+        self.buttons = buttons
+
+    def to_dict(self):
+        return {
+            '_': 'KeyboardButtonRow',
+            'buttons': [] if self.buttons is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.buttons]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x83\x8b`w',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.buttons)),b''.join(x._bytes() for x in self.buttons),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _buttons = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _buttons.append(_x)
+
+        return cls(buttons=_buttons)
+
+TypeKeyboardButtonRow = KeyboardButtonRow
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class LabeledPrice(TLObject):
+    CONSTRUCTOR_ID = 0xcb296bf8
+    SUBCLASS_OF_ID = 0x1c84047a
+    __slots__ = ('label', 'amount')
+
+    def __init__(self, label: str, amount: int):
+        """
+        Constructor for LabeledPrice: Instance of LabeledPrice.
+        """
+        self.label = label
+        self.amount = amount
+
+    def to_dict(self):
+        return {
+            '_': 'LabeledPrice',
+            'label': self.label,
+            'amount': self.amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf8k)\xcb',
+            self.serialize_bytes(self.label),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _label = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(label=_label, amount=_amount)
+
+TypeLabeledPrice = LabeledPrice
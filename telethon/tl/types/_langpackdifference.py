@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeLangPackString
+
+
+
+class LangPackDifference(TLObject):
+    CONSTRUCTOR_ID = 0xf385c1f6
+    SUBCLASS_OF_ID = 0x52662d55
+    __slots__ = ('lang_code', 'from_version', 'version', 'strings')
+
+    def __init__(self, lang_code: str, from_version: int, version: int, strings: List['TypeLangPackString']):
+        """
+        Constructor for LangPackDifference: Instance of LangPackDifference.
+        """
+        self.lang_code = lang_code
+        self.from_version = from_version
+        self.version = version
+        self.strings = strings
+
+    def to_dict(self):
+        return {
+            '_': 'LangPackDifference',
+            'lang_code': self.lang_code,
+            'from_version': self.from_version,
+            'version': self.version,
+            'strings': [] if self.strings is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.strings]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf6\xc1\x85\xf3',
+            self.serialize_bytes(self.lang_code),
+            _struct_ii.pack(self.from_version, self.version),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.strings)),b''.join(x._bytes() for x in self.strings),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _lang_code = reader.tgread_string()
+        _from_version, _version = reader.read_struct(_struct_ii)
+        reader.read_int()
+        _strings = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _strings.append(_x)
+
+        return cls(lang_code=_lang_code, from_version=_from_version, version=_version, strings=_strings)
+
+TypeLangPackDifference = LangPackDifference
@@ -0,0 +1,80 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class LangPackLanguage(TLObject):
+    CONSTRUCTOR_ID = 0xeeca5ce3
+    SUBCLASS_OF_ID = 0xabac89b7
+    __slots__ = ('name', 'native_name', 'lang_code', 'plural_code', 'strings_count', 'translated_count', 'translations_url', 'official', 'rtl', 'beta', 'base_lang_code')
+
+    def __init__(self, name: str, native_name: str, lang_code: str, plural_code: str, strings_count: int, translated_count: int, translations_url: str, official: Optional[bool]=None, rtl: Optional[bool]=None, beta: Optional[bool]=None, base_lang_code: Optional[str]=None):
+        """
+        Constructor for LangPackLanguage: Instance of LangPackLanguage.
+        """
+        self.name = name
+        self.native_name = native_name
+        self.lang_code = lang_code
+        self.plural_code = plural_code
+        self.strings_count = strings_count
+        self.translated_count = translated_count
+        self.translations_url = translations_url
+        self.official = official
+        self.rtl = rtl
+        self.beta = beta
+        self.base_lang_code = base_lang_code
+
+    def to_dict(self):
+        return {
+            '_': 'LangPackLanguage',
+            'name': self.name,
+            'native_name': self.native_name,
+            'lang_code': self.lang_code,
+            'plural_code': self.plural_code,
+            'strings_count': self.strings_count,
+            'translated_count': self.translated_count,
+            'translations_url': self.translations_url,
+            'official': self.official,
+            'rtl': self.rtl,
+            'beta': self.beta,
+            'base_lang_code': self.base_lang_code
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe3\\\xca\xee',
+            struct.pack('<I', (0 if self.official is None or self.official is False else 1) | (0 if self.rtl is None or self.rtl is False else 4) | (0 if self.beta is None or self.beta is False else 8) | (0 if self.base_lang_code is None or self.base_lang_code is False else 2)),
+            self.serialize_bytes(self.name),
+            self.serialize_bytes(self.native_name),
+            self.serialize_bytes(self.lang_code),
+            b'' if self.base_lang_code is None or self.base_lang_code is False else (self.serialize_bytes(self.base_lang_code)),
+            self.serialize_bytes(self.plural_code),
+            _struct_ii.pack(self.strings_count, self.translated_count),
+            self.serialize_bytes(self.translations_url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _official = bool(flags & 1)
+        _rtl = bool(flags & 4)
+        _beta = bool(flags & 8)
+        _name = reader.tgread_string()
+        _native_name = reader.tgread_string()
+        _lang_code = reader.tgread_string()
+        if flags & 2:
+            _base_lang_code = reader.tgread_string()
+        else:
+            _base_lang_code = None
+        _plural_code = reader.tgread_string()
+        _strings_count, _translated_count = reader.read_struct(_struct_ii)
+        _translations_url = reader.tgread_string()
+        return cls(name=_name, native_name=_native_name, lang_code=_lang_code, plural_code=_plural_code, strings_count=_strings_count, translated_count=_translated_count, translations_url=_translations_url, official=_official, rtl=_rtl, beta=_beta, base_lang_code=_base_lang_code)
+
+TypeLangPackLanguage = LangPackLanguage
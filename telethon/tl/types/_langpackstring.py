@@ -0,0 +1,141 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class LangPackString(TLObject):
+    CONSTRUCTOR_ID = 0xcad181f6
+    SUBCLASS_OF_ID = 0xdc179ab9
+    __slots__ = ('key', 'value')
+
+    def __init__(self, key: str, value: str):
+        """
+        Constructor for LangPackString: Instance of either LangPackString, LangPackStringPluralized, LangPackStringDeleted.
+        """
+        self.key = key
+        self.value = value
+
+    def to_dict(self):
+        return {
+            '_': 'LangPackString',
+            'key': self.key,
+            'value': self.value
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf6\x81\xd1\xca',
+            self.serialize_bytes(self.key),
+            self.serialize_bytes(self.value),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _key = reader.tgread_string()
+        _value = reader.tgread_string()
+        return cls(key=_key, value=_value)
+
+
+class LangPackStringDeleted(TLObject):
+    CONSTRUCTOR_ID = 0x2979eeb2
+    SUBCLASS_OF_ID = 0xdc179ab9
+    __slots__ = ('key',)
+
+    def __init__(self, key: str):
+        """
+        Constructor for LangPackString: Instance of either LangPackString, LangPackStringPluralized, LangPackStringDeleted.
+        """
+        self.key = key
+
+    def to_dict(self):
+        return {
+            '_': 'LangPackStringDeleted',
+            'key': self.key
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb2\xeey)',
+            self.serialize_bytes(self.key),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _key = reader.tgread_string()
+        return cls(key=_key)
+
+
+class LangPackStringPluralized(TLObject):
+    CONSTRUCTOR_ID = 0x6c47ac9f
+    SUBCLASS_OF_ID = 0xdc179ab9
+    __slots__ = ('key', 'other_value', 'zero_value', 'one_value', 'two_value', 'few_value', 'many_value')
+
+    def __init__(self, key: str, other_value: str, zero_value: Optional[str]=None, one_value: Optional[str]=None, two_value: Optional[str]=None, few_value: Optional[str]=None, many_value: Optional[str]=None):
+        """
+        Constructor for LangPackString: Instance of either LangPackString, LangPackStringPluralized, LangPackStringDeleted.
+        """
+        self.key = key
+        self.other_value = other_value
+        self.zero_value = zero_value
+        self.one_value = one_value
+        self.two_value = two_value
+        self.few_value = few_value
+        self.many_value = many_value
+
+    def to_dict(self):
+        return {
+            '_': 'LangPackStringPluralized',
+            'key': self.key,
+            'other_value': self.other_value,
+            'zero_value': self.zero_value,
+            'one_value': self.one_value,
+            'two_value': self.two_value,
+            'few_value': self.few_value,
+            'many_value': self.many_value
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9f\xacGl',
+            struct.pack('<I', (0 if self.zero_value is None or self.zero_value is False else 1) | (0 if self.one_value is None or self.one_value is False else 2) | (0 if self.two_value is None or self.two_value is False else 4) | (0 if self.few_value is None or self.few_value is False else 8) | (0 if self.many_value is None or self.many_value is False else 16)),
+            self.serialize_bytes(self.key),
+            b'' if self.zero_value is None or self.zero_value is False else (self.serialize_bytes(self.zero_value)),
+            b'' if self.one_value is None or self.one_value is False else (self.serialize_bytes(self.one_value)),
+            b'' if self.two_value is None or self.two_value is False else (self.serialize_bytes(self.two_value)),
+            b'' if self.few_value is None or self.few_value is False else (self.serialize_bytes(self.few_value)),
+            b'' if self.many_value is None or self.many_value is False else (self.serialize_bytes(self.many_value)),
+            self.serialize_bytes(self.other_value),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _key = reader.tgread_string()
+        if flags & 1:
+            _zero_value = reader.tgread_string()
+        else:
+            _zero_value = None
+        if flags & 2:
+            _one_value = reader.tgread_string()
+        else:
+            _one_value = None
+        if flags & 4:
+            _two_value = reader.tgread_string()
+        else:
+            _two_value = None
+        if flags & 8:
+            _few_value = reader.tgread_string()
+        else:
+            _few_value = None
+        if flags & 16:
+            _many_value = reader.tgread_string()
+        else:
+            _many_value = None
+        _other_value = reader.tgread_string()
+        return cls(key=_key, other_value=_other_value, zero_value=_zero_value, one_value=_one_value, two_value=_two_value, few_value=_few_value, many_value=_many_value)
+
+TypeLangPackString = Union[LangPackString,LangPackStringPluralized,LangPackStringDeleted]
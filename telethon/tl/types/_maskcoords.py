@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iddd = struct.Struct('<iddd')
+
+
+class MaskCoords(TLObject):
+    CONSTRUCTOR_ID = 0xaed6dbb2
+    SUBCLASS_OF_ID = 0x6bbb2fd
+    __slots__ = ('n', 'x', 'y', 'zoom')
+
+    def __init__(self, n: int, x: float, y: float, zoom: float):
+        """
+        Constructor for MaskCoords: Instance of MaskCoords.
+        """
+        self.n = n
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+
+    def to_dict(self):
+        return {
+            '_': 'MaskCoords',
+            'n': self.n,
+            'x': self.x,
+            'y': self.y,
+            'zoom': self.zoom
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb2\xdb\xd6\xae',
+            _struct_iddd.pack(self.n, self.x, self.y, self.zoom),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _n, _x, _y, _zoom = reader.read_struct(_struct_iddd)
+        return cls(n=_n, x=_x, y=_y, zoom=_zoom)
+
+TypeMaskCoords = MaskCoords
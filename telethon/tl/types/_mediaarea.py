@@ -0,0 +1,366 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_di = struct.Struct('<di')
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeGeoPoint, TypeGeoPointAddress, TypeInputChannel, TypeMediaAreaCoordinates, TypeReaction
+
+
+
+class InputMediaAreaChannelPost(TLObject):
+    CONSTRUCTOR_ID = 0x2271f2bf
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'channel', 'msg_id')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', channel: 'TypeInputChannel', msg_id: int):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.channel = channel
+        self.msg_id = msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaAreaChannelPost',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'channel': self.channel.to_dict() if isinstance(self.channel, TLObject) else self.channel,
+            'msg_id': self.msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbf\xf2q"',
+            self.coordinates._bytes(),
+            self.channel._bytes(),
+            struct.pack('<i', self.msg_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _coordinates = reader.tgread_object()
+        _channel = reader.tgread_object()
+        _msg_id = reader.read_int()
+        return cls(coordinates=_coordinates, channel=_channel, msg_id=_msg_id)
+
+
+class InputMediaAreaVenue(TLObject):
+    CONSTRUCTOR_ID = 0xb282217f
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'query_id', 'result_id')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', query_id: int, result_id: str):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.query_id = query_id
+        self.result_id = result_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMediaAreaVenue',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'query_id': self.query_id,
+            'result_id': self.result_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f!\x82\xb2',
+            self.coordinates._bytes(),
+            struct.pack('<q', self.query_id),
+            self.serialize_bytes(self.result_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _coordinates = reader.tgread_object()
+        _query_id = reader.read_long()
+        _result_id = reader.tgread_string()
+        return cls(coordinates=_coordinates, query_id=_query_id, result_id=_result_id)
+
+
+class MediaAreaChannelPost(TLObject):
+    CONSTRUCTOR_ID = 0x770416af
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'channel_id', 'msg_id')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', channel_id: int, msg_id: int):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.channel_id = channel_id
+        self.msg_id = msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaChannelPost',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'channel_id': self.channel_id,
+            'msg_id': self.msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xaf\x16\x04w',
+            self.coordinates._bytes(),
+            _struct_qi.pack(self.channel_id, self.msg_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _coordinates = reader.tgread_object()
+        _channel_id, _msg_id = reader.read_struct(_struct_qi)
+        return cls(coordinates=_coordinates, channel_id=_channel_id, msg_id=_msg_id)
+
+
+class MediaAreaGeoPoint(TLObject):
+    CONSTRUCTOR_ID = 0xcad5452d
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'geo', 'address')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', geo: 'TypeGeoPoint', address: Optional['TypeGeoPointAddress']=None):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.geo = geo
+        self.address = address
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaGeoPoint',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo,
+            'address': self.address.to_dict() if isinstance(self.address, TLObject) else self.address
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'-E\xd5\xca',
+            struct.pack('<I', (0 if self.address is None or self.address is False else 1)),
+            self.coordinates._bytes(),
+            self.geo._bytes(),
+            b'' if self.address is None or self.address is False else (self.address._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _coordinates = reader.tgread_object()
+        _geo = reader.tgread_object()
+        if flags & 1:
+            _address = reader.tgread_object()
+        else:
+            _address = None
+        return cls(coordinates=_coordinates, geo=_geo, address=_address)
+
+
+class MediaAreaStarGift(TLObject):
+    CONSTRUCTOR_ID = 0x5787686d
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'slug')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', slug: str):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.slug = slug
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaStarGift',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'slug': self.slug
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'mh\x87W',
+            self.coordinates._bytes(),
+            self.serialize_bytes(self.slug),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _coordinates = reader.tgread_object()
+        _slug = reader.tgread_string()
+        return cls(coordinates=_coordinates, slug=_slug)
+
+
+class MediaAreaSuggestedReaction(TLObject):
+    CONSTRUCTOR_ID = 0x14455871
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'reaction', 'dark', 'flipped')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', reaction: 'TypeReaction', dark: Optional[bool]=None, flipped: Optional[bool]=None):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.reaction = reaction
+        self.dark = dark
+        self.flipped = flipped
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaSuggestedReaction',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'reaction': self.reaction.to_dict() if isinstance(self.reaction, TLObject) else self.reaction,
+            'dark': self.dark,
+            'flipped': self.flipped
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'qXE\x14',
+            struct.pack('<I', (0 if self.dark is None or self.dark is False else 1) | (0 if self.flipped is None or self.flipped is False else 2)),
+            self.coordinates._bytes(),
+            self.reaction._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _dark = bool(flags & 1)
+        _flipped = bool(flags & 2)
+        _coordinates = reader.tgread_object()
+        _reaction = reader.tgread_object()
+        return cls(coordinates=_coordinates, reaction=_reaction, dark=_dark, flipped=_flipped)
+
+
+class MediaAreaUrl(TLObject):
+    CONSTRUCTOR_ID = 0x37381085
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'url')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', url: str):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaUrl',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x85\x1087',
+            self.coordinates._bytes(),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _coordinates = reader.tgread_object()
+        _url = reader.tgread_string()
+        return cls(coordinates=_coordinates, url=_url)
+
+
+class MediaAreaVenue(TLObject):
+    CONSTRUCTOR_ID = 0xbe82db9c
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'geo', 'title', 'address', 'provider', 'venue_id', 'venue_type')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', geo: 'TypeGeoPoint', title: str, address: str, provider: str, venue_id: str, venue_type: str):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.geo = geo
+        self.title = title
+        self.address = address
+        self.provider = provider
+        self.venue_id = venue_id
+        self.venue_type = venue_type
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaVenue',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo,
+            'title': self.title,
+            'address': self.address,
+            'provider': self.provider,
+            'venue_id': self.venue_id,
+            'venue_type': self.venue_type
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9c\xdb\x82\xbe',
+            self.coordinates._bytes(),
+            self.geo._bytes(),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.address),
+            self.serialize_bytes(self.provider),
+            self.serialize_bytes(self.venue_id),
+            self.serialize_bytes(self.venue_type),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _coordinates = reader.tgread_object()
+        _geo = reader.tgread_object()
+        _title = reader.tgread_string()
+        _address = reader.tgread_string()
+        _provider = reader.tgread_string()
+        _venue_id = reader.tgread_string()
+        _venue_type = reader.tgread_string()
+        return cls(coordinates=_coordinates, geo=_geo, title=_title, address=_address, provider=_provider, venue_id=_venue_id, venue_type=_venue_type)
+
+
+class MediaAreaWeather(TLObject):
+    CONSTRUCTOR_ID = 0x49a6549c
+    SUBCLASS_OF_ID = 0xf36d7bf2
+    __slots__ = ('coordinates', 'emoji', 'temperature_c', 'color')
+
+    def __init__(self, coordinates: 'TypeMediaAreaCoordinates', emoji: str, temperature_c: float, color: int):
+        """
+        Constructor for MediaArea: Instance of either MediaAreaVenue, InputMediaAreaVenue, MediaAreaGeoPoint, MediaAreaSuggestedReaction, MediaAreaChannelPost, InputMediaAreaChannelPost, MediaAreaUrl, MediaAreaWeather, MediaAreaStarGift.
+        """
+        self.coordinates = coordinates
+        self.emoji = emoji
+        self.temperature_c = temperature_c
+        self.color = color
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaWeather',
+            'coordinates': self.coordinates.to_dict() if isinstance(self.coordinates, TLObject) else self.coordinates,
+            'emoji': self.emoji,
+            'temperature_c': self.temperature_c,
+            'color': self.color
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9cT\xa6I',
+            self.coordinates._bytes(),
+            self.serialize_bytes(self.emoji),
+            _struct_di.pack(self.temperature_c, self.color),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _coordinates = reader.tgread_object()
+        _emoji = reader.tgread_string()
+        _temperature_c, _color = reader.read_struct(_struct_di)
+        return cls(coordinates=_coordinates, emoji=_emoji, temperature_c=_temperature_c, color=_color)
+
+TypeMediaArea = Union[MediaAreaVenue,InputMediaAreaVenue,MediaAreaGeoPoint,MediaAreaSuggestedReaction,MediaAreaChannelPost,InputMediaAreaChannelPost,MediaAreaUrl,MediaAreaWeather,MediaAreaStarGift]
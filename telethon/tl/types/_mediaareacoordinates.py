@@ -0,0 +1,55 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iddddd = struct.Struct('<Iddddd')
+_struct_iddddd = struct.Struct('<iddddd')
+
+
+class MediaAreaCoordinates(TLObject):
+    CONSTRUCTOR_ID = 0xcfc9e002
+    SUBCLASS_OF_ID = 0x1d448c39
+    __slots__ = ('x', 'y', 'w', 'h', 'rotation', 'radius')
+
+    def __init__(self, x: float, y: float, w: float, h: float, rotation: float, radius: Optional[float]=None):
+        """
+        Constructor for MediaAreaCoordinates: Instance of MediaAreaCoordinates.
+        """
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.rotation = rotation
+        self.radius = radius
+
+    def to_dict(self):
+        return {
+            '_': 'MediaAreaCoordinates',
+            'x': self.x,
+            'y': self.y,
+            'w': self.w,
+            'h': self.h,
+            'rotation': self.rotation,
+            'radius': self.radius
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x02\xe0\xc9\xcf',
+            _struct_Iddddd.pack((0 if self.radius is None or self.radius is False else 1), self.x, self.y, self.w, self.h, self.rotation),
+            b'' if self.radius is None or self.radius is False else (struct.pack('<d', self.radius)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _x, _y, _w, _h, _rotation = reader.read_struct(_struct_iddddd)
+        if flags & 1:
+            _radius = reader.read_double()
+        else:
+            _radius = None
+        return cls(x=_x, y=_y, w=_w, h=_h, rotation=_rotation, radius=_radius)
+
+TypeMediaAreaCoordinates = MediaAreaCoordinates
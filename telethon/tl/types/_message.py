@@ -0,0 +1,404 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_IIi = struct.Struct('<IIi')
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+_struct_iii = struct.Struct('<iii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeFactCheck, TypeMessageAction, TypeMessageEntity, TypeMessageFwdHeader, TypeMessageMedia, TypeMessageReactions, TypeMessageReplies, TypeMessageReplyHeader, TypePeer, TypeReplyMarkup, TypeRestrictionReason
+
+
+
+class Message(TLObject):
+    CONSTRUCTOR_ID = 0xeabcdd4d
+    SUBCLASS_OF_ID = 0x790009e3
+    __slots__ = ('id', 'peer_id', 'date', 'message', 'out', 'mentioned', 'media_unread', 'silent', 'post', 'from_scheduled', 'legacy', 'edit_hide', 'pinned', 'noforwards', 'invert_media', 'offline', 'video_processing_pending', 'from_id', 'from_boosts_applied', 'saved_peer_id', 'fwd_from', 'via_bot_id', 'via_business_bot_id', 'reply_to', 'media', 'reply_markup', 'entities', 'views', 'forwards', 'replies', 'edit_date', 'post_author', 'grouped_id', 'reactions', 'restriction_reason', 'ttl_period', 'quick_reply_shortcut_id', 'effect', 'factcheck', 'report_delivery_until_date', 'paid_message_stars')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, peer_id: 'TypePeer', date: Optional[datetime], message: str, out: Optional[bool]=None, mentioned: Optional[bool]=None, media_unread: Optional[bool]=None, silent: Optional[bool]=None, post: Optional[bool]=None, from_scheduled: Optional[bool]=None, legacy: Optional[bool]=None, edit_hide: Optional[bool]=None, pinned: Optional[bool]=None, noforwards: Optional[bool]=None, invert_media: Optional[bool]=None, offline: Optional[bool]=None, video_processing_pending: Optional[bool]=None, from_id: Optional['TypePeer']=None, from_boosts_applied: Optional[int]=None, saved_peer_id: Optional['TypePeer']=None, fwd_from: Optional['TypeMessageFwdHeader']=None, via_bot_id: Optional[int]=None, via_business_bot_id: Optional[int]=None, reply_to: Optional['TypeMessageReplyHeader']=None, media: Optional['TypeMessageMedia']=None, reply_markup: Optional['TypeReplyMarkup']=None, entities: Optional[List['TypeMessageEntity']]=None, views: Optional[int]=None, forwards: Optional[int]=None, replies: Optional['TypeMessageReplies']=None, edit_date: Optional[datetime]=None, post_author: Optional[str]=None, grouped_id: Optional[int]=None, reactions: Optional['TypeMessageReactions']=None, restriction_reason: Optional[List['TypeRestrictionReason']]=None, ttl_period: Optional[int]=None, quick_reply_shortcut_id: Optional[int]=None, effect: Optional[int]=None, factcheck: Optional['TypeFactCheck']=None, report_delivery_until_date: Optional[datetime]=None, paid_message_stars: Optional[int]=None):
+        """
+        Constructor for Message: Instance of either MessageEmpty, Message, MessageService.
+        """
+        self.id = id
+        self.peer_id = peer_id
+        self.date = date
+        self.message = message
+        self.out = out
+        self.mentioned = mentioned
+        self.media_unread = media_unread
+        self.silent = silent
+        self.post = post
+        self.from_scheduled = from_scheduled
+        self.legacy = legacy
+        self.edit_hide = edit_hide
+        self.pinned = pinned
+        self.noforwards = noforwards
+        self.invert_media = invert_media
+        self.offline = offline
+        self.video_processing_pending = video_processing_pending
+        self.from_id = from_id
+        self.from_boosts_applied = from_boosts_applied
+        self.saved_peer_id = saved_peer_id
+        self.fwd_from = fwd_from
+        self.via_bot_id = via_bot_id
+        self.via_business_bot_id = via_business_bot_id
+        self.reply_to = reply_to
+        self.media = media
+        self.reply_markup = reply_markup
+        self.entities = entities
+        self.views = views
+        self.forwards = forwards
+        self.replies = replies
+        self.edit_date = edit_date
+        self.post_author = post_author
+        self.grouped_id = grouped_id
+        self.reactions = reactions
+        self.restriction_reason = restriction_reason
+        self.ttl_period = ttl_period
+        self.quick_reply_shortcut_id = quick_reply_shortcut_id
+        self.effect = effect
+        self.factcheck = factcheck
+        self.report_delivery_until_date = report_delivery_until_date
+        self.paid_message_stars = paid_message_stars
+
+    def to_dict(self):
+        return {
+            '_': 'Message',
+            'id': self.id,
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'date': self.date,
+            'message': self.message,
+            'out': self.out,
+            'mentioned': self.mentioned,
+            'media_unread': self.media_unread,
+            'silent': self.silent,
+            'post': self.post,
+            'from_scheduled': self.from_scheduled,
+            'legacy': self.legacy,
+            'edit_hide': self.edit_hide,
+            'pinned': self.pinned,
+            'noforwards': self.noforwards,
+            'invert_media': self.invert_media,
+            'offline': self.offline,
+            'video_processing_pending': self.video_processing_pending,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'from_boosts_applied': self.from_boosts_applied,
+            'saved_peer_id': self.saved_peer_id.to_dict() if isinstance(self.saved_peer_id, TLObject) else self.saved_peer_id,
+            'fwd_from': self.fwd_from.to_dict() if isinstance(self.fwd_from, TLObject) else self.fwd_from,
+            'via_bot_id': self.via_bot_id,
+            'via_business_bot_id': self.via_business_bot_id,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'reply_markup': self.reply_markup.to_dict() if isinstance(self.reply_markup, TLObject) else self.reply_markup,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'views': self.views,
+            'forwards': self.forwards,
+            'replies': self.replies.to_dict() if isinstance(self.replies, TLObject) else self.replies,
+            'edit_date': self.edit_date,
+            'post_author': self.post_author,
+            'grouped_id': self.grouped_id,
+            'reactions': self.reactions.to_dict() if isinstance(self.reactions, TLObject) else self.reactions,
+            'restriction_reason': [] if self.restriction_reason is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.restriction_reason],
+            'ttl_period': self.ttl_period,
+            'quick_reply_shortcut_id': self.quick_reply_shortcut_id,
+            'effect': self.effect,
+            'factcheck': self.factcheck.to_dict() if isinstance(self.factcheck, TLObject) else self.factcheck,
+            'report_delivery_until_date': self.report_delivery_until_date,
+            'paid_message_stars': self.paid_message_stars
+        }
+
+    def _bytes(self):
+        assert ((self.views or self.views is not None) and (self.forwards or self.forwards is not None)) or ((self.views is None or self.views is False) and (self.forwards is None or self.forwards is False)), 'views, forwards parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'M\xdd\xbc\xea',
+            _struct_IIi.pack((0 if self.out is None or self.out is False else 2) | (0 if self.mentioned is None or self.mentioned is False else 16) | (0 if self.media_unread is None or self.media_unread is False else 32) | (0 if self.silent is None or self.silent is False else 8192) | (0 if self.post is None or self.post is False else 16384) | (0 if self.from_scheduled is None or self.from_scheduled is False else 262144) | (0 if self.legacy is None or self.legacy is False else 524288) | (0 if self.edit_hide is None or self.edit_hide is False else 2097152) | (0 if self.pinned is None or self.pinned is False else 16777216) | (0 if self.noforwards is None or self.noforwards is False else 67108864) | (0 if self.invert_media is None or self.invert_media is False else 134217728) | (0 if self.from_id is None or self.from_id is False else 256) | (0 if self.from_boosts_applied is None or self.from_boosts_applied is False else 536870912) | (0 if self.saved_peer_id is None or self.saved_peer_id is False else 268435456) | (0 if self.fwd_from is None or self.fwd_from is False else 4) | (0 if self.via_bot_id is None or self.via_bot_id is False else 2048) | (0 if self.reply_to is None or self.reply_to is False else 8) | (0 if self.media is None or self.media is False else 512) | (0 if self.reply_markup is None or self.reply_markup is False else 64) | (0 if self.entities is None or self.entities is False else 128) | (0 if self.views is None or self.views is False else 1024) | (0 if self.forwards is None or self.forwards is False else 1024) | (0 if self.replies is None or self.replies is False else 8388608) | (0 if self.edit_date is None or self.edit_date is False else 32768) | (0 if self.post_author is None or self.post_author is False else 65536) | (0 if self.grouped_id is None or self.grouped_id is False else 131072) | (0 if self.reactions is None or self.reactions is False else 1048576) | (0 if self.restriction_reason is None or self.restriction_reason is False else 4194304) | (0 if self.ttl_period is None or self.ttl_period is False else 33554432) | (0 if self.quick_reply_shortcut_id is None or self.quick_reply_shortcut_id is False else 1073741824), (0 if self.offline is None or self.offline is False else 2) | (0 if self.video_processing_pending is None or self.video_processing_pending is False else 16) | (0 if self.via_business_bot_id is None or self.via_business_bot_id is False else 1) | (0 if self.effect is None or self.effect is False else 4) | (0 if self.factcheck is None or self.factcheck is False else 8) | (0 if self.report_delivery_until_date is None or self.report_delivery_until_date is False else 32) | (0 if self.paid_message_stars is None or self.paid_message_stars is False else 64), self.id),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            b'' if self.from_boosts_applied is None or self.from_boosts_applied is False else (struct.pack('<i', self.from_boosts_applied)),
+            self.peer_id._bytes(),
+            b'' if self.saved_peer_id is None or self.saved_peer_id is False else (self.saved_peer_id._bytes()),
+            b'' if self.fwd_from is None or self.fwd_from is False else (self.fwd_from._bytes()),
+            b'' if self.via_bot_id is None or self.via_bot_id is False else (struct.pack('<q', self.via_bot_id)),
+            b'' if self.via_business_bot_id is None or self.via_business_bot_id is False else (struct.pack('<q', self.via_business_bot_id)),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.message),
+            b'' if self.media is None or self.media is False else (self.media._bytes()),
+            b'' if self.reply_markup is None or self.reply_markup is False else (self.reply_markup._bytes()),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.views is None or self.views is False else (struct.pack('<i', self.views)),
+            b'' if self.forwards is None or self.forwards is False else (struct.pack('<i', self.forwards)),
+            b'' if self.replies is None or self.replies is False else (self.replies._bytes()),
+            b'' if self.edit_date is None or self.edit_date is False else (self.serialize_datetime(self.edit_date)),
+            b'' if self.post_author is None or self.post_author is False else (self.serialize_bytes(self.post_author)),
+            b'' if self.grouped_id is None or self.grouped_id is False else (struct.pack('<q', self.grouped_id)),
+            b'' if self.reactions is None or self.reactions is False else (self.reactions._bytes()),
+            b'' if self.restriction_reason is None or self.restriction_reason is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.restriction_reason)),b''.join(x._bytes() for x in self.restriction_reason))),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.quick_reply_shortcut_id is None or self.quick_reply_shortcut_id is False else (struct.pack('<i', self.quick_reply_shortcut_id)),
+            b'' if self.effect is None or self.effect is False else (struct.pack('<q', self.effect)),
+            b'' if self.factcheck is None or self.factcheck is False else (self.factcheck._bytes()),
+            b'' if self.report_delivery_until_date is None or self.report_delivery_until_date is False else (self.serialize_datetime(self.report_delivery_until_date)),
+            b'' if self.paid_message_stars is None or self.paid_message_stars is False else (struct.pack('<q', self.paid_message_stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, flags2, _id = reader.read_struct(_struct_iii)
+        _out = bool(flags & 2)
+        _mentioned = bool(flags & 16)
+        _media_unread = bool(flags & 32)
+        _silent = bool(flags & 8192)
+        _post = bool(flags & 16384)
+        _from_scheduled = bool(flags & 262144)
+        _legacy = bool(flags & 524288)
+        _edit_hide = bool(flags & 2097152)
+        _pinned = bool(flags & 16777216)
+        _noforwards = bool(flags & 67108864)
+        _invert_media = bool(flags & 134217728)
+        _offline = bool(flags2 & 2)
+        _video_processing_pending = bool(flags2 & 16)
+        if flags & 256:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        if flags & 536870912:
+            _from_boosts_applied = reader.read_int()
+        else:
+            _from_boosts_applied = None
+        _peer_id = reader.tgread_object()
+        if flags & 268435456:
+            _saved_peer_id = reader.tgread_object()
+        else:
+            _saved_peer_id = None
+        if flags & 4:
+            _fwd_from = reader.tgread_object()
+        else:
+            _fwd_from = None
+        if flags & 2048:
+            _via_bot_id = reader.read_long()
+        else:
+            _via_bot_id = None
+        if flags2 & 1:
+            _via_business_bot_id = reader.read_long()
+        else:
+            _via_business_bot_id = None
+        if flags & 8:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        _date = reader.tgread_date()
+        _message = reader.tgread_string()
+        if flags & 512:
+            _media = reader.tgread_object()
+        else:
+            _media = None
+        if flags & 64:
+            _reply_markup = reader.tgread_object()
+        else:
+            _reply_markup = None
+        if flags & 128:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 1024:
+            _views = reader.read_int()
+        else:
+            _views = None
+        if flags & 1024:
+            _forwards = reader.read_int()
+        else:
+            _forwards = None
+        if flags & 8388608:
+            _replies = reader.tgread_object()
+        else:
+            _replies = None
+        if flags & 32768:
+            _edit_date = reader.tgread_date()
+        else:
+            _edit_date = None
+        if flags & 65536:
+            _post_author = reader.tgread_string()
+        else:
+            _post_author = None
+        if flags & 131072:
+            _grouped_id = reader.read_long()
+        else:
+            _grouped_id = None
+        if flags & 1048576:
+            _reactions = reader.tgread_object()
+        else:
+            _reactions = None
+        if flags & 4194304:
+            reader.read_int()
+            _restriction_reason = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _restriction_reason.append(_x)
+
+        else:
+            _restriction_reason = None
+        if flags & 33554432:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 1073741824:
+            _quick_reply_shortcut_id = reader.read_int()
+        else:
+            _quick_reply_shortcut_id = None
+        if flags2 & 4:
+            _effect = reader.read_long()
+        else:
+            _effect = None
+        if flags2 & 8:
+            _factcheck = reader.tgread_object()
+        else:
+            _factcheck = None
+        if flags2 & 32:
+            _report_delivery_until_date = reader.tgread_date()
+        else:
+            _report_delivery_until_date = None
+        if flags2 & 64:
+            _paid_message_stars = reader.read_long()
+        else:
+            _paid_message_stars = None
+        return cls(id=_id, peer_id=_peer_id, date=_date, message=_message, out=_out, mentioned=_mentioned, media_unread=_media_unread, silent=_silent, post=_post, from_scheduled=_from_scheduled, legacy=_legacy, edit_hide=_edit_hide, pinned=_pinned, noforwards=_noforwards, invert_media=_invert_media, offline=_offline, video_processing_pending=_video_processing_pending, from_id=_from_id, from_boosts_applied=_from_boosts_applied, saved_peer_id=_saved_peer_id, fwd_from=_fwd_from, via_bot_id=_via_bot_id, via_business_bot_id=_via_business_bot_id, reply_to=_reply_to, media=_media, reply_markup=_reply_markup, entities=_entities, views=_views, forwards=_forwards, replies=_replies, edit_date=_edit_date, post_author=_post_author, grouped_id=_grouped_id, reactions=_reactions, restriction_reason=_restriction_reason, ttl_period=_ttl_period, quick_reply_shortcut_id=_quick_reply_shortcut_id, effect=_effect, factcheck=_factcheck, report_delivery_until_date=_report_delivery_until_date, paid_message_stars=_paid_message_stars)
+
+
+class MessageEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x90a6ca84
+    SUBCLASS_OF_ID = 0x790009e3
+    __slots__ = ('id', 'peer_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, peer_id: Optional['TypePeer']=None):
+        """
+        Constructor for Message: Instance of either MessageEmpty, Message, MessageService.
+        """
+        self.id = id
+        self.peer_id = peer_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEmpty',
+            'id': self.id,
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x84\xca\xa6\x90',
+            _struct_Ii.pack((0 if self.peer_id is None or self.peer_id is False else 1), self.id),
+            b'' if self.peer_id is None or self.peer_id is False else (self.peer_id._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        if flags & 1:
+            _peer_id = reader.tgread_object()
+        else:
+            _peer_id = None
+        return cls(id=_id, peer_id=_peer_id)
+
+
+class MessageService(TLObject):
+    CONSTRUCTOR_ID = 0xd3d28540
+    SUBCLASS_OF_ID = 0x790009e3
+    __slots__ = ('id', 'peer_id', 'date', 'action', 'out', 'mentioned', 'media_unread', 'reactions_are_possible', 'silent', 'post', 'legacy', 'from_id', 'reply_to', 'reactions', 'ttl_period')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, peer_id: 'TypePeer', date: Optional[datetime], action: 'TypeMessageAction', out: Optional[bool]=None, mentioned: Optional[bool]=None, media_unread: Optional[bool]=None, reactions_are_possible: Optional[bool]=None, silent: Optional[bool]=None, post: Optional[bool]=None, legacy: Optional[bool]=None, from_id: Optional['TypePeer']=None, reply_to: Optional['TypeMessageReplyHeader']=None, reactions: Optional['TypeMessageReactions']=None, ttl_period: Optional[int]=None):
+        """
+        Constructor for Message: Instance of either MessageEmpty, Message, MessageService.
+        """
+        self.id = id
+        self.peer_id = peer_id
+        self.date = date
+        self.action = action
+        self.out = out
+        self.mentioned = mentioned
+        self.media_unread = media_unread
+        self.reactions_are_possible = reactions_are_possible
+        self.silent = silent
+        self.post = post
+        self.legacy = legacy
+        self.from_id = from_id
+        self.reply_to = reply_to
+        self.reactions = reactions
+        self.ttl_period = ttl_period
+
+    def to_dict(self):
+        return {
+            '_': 'MessageService',
+            'id': self.id,
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'date': self.date,
+            'action': self.action.to_dict() if isinstance(self.action, TLObject) else self.action,
+            'out': self.out,
+            'mentioned': self.mentioned,
+            'media_unread': self.media_unread,
+            'reactions_are_possible': self.reactions_are_possible,
+            'silent': self.silent,
+            'post': self.post,
+            'legacy': self.legacy,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'reactions': self.reactions.to_dict() if isinstance(self.reactions, TLObject) else self.reactions,
+            'ttl_period': self.ttl_period
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'@\x85\xd2\xd3',
+            _struct_Ii.pack((0 if self.out is None or self.out is False else 2) | (0 if self.mentioned is None or self.mentioned is False else 16) | (0 if self.media_unread is None or self.media_unread is False else 32) | (0 if self.reactions_are_possible is None or self.reactions_are_possible is False else 512) | (0 if self.silent is None or self.silent is False else 8192) | (0 if self.post is None or self.post is False else 16384) | (0 if self.legacy is None or self.legacy is False else 524288) | (0 if self.from_id is None or self.from_id is False else 256) | (0 if self.reply_to is None or self.reply_to is False else 8) | (0 if self.reactions is None or self.reactions is False else 1048576) | (0 if self.ttl_period is None or self.ttl_period is False else 33554432), self.id),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            self.peer_id._bytes(),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            self.serialize_datetime(self.date),
+            self.action._bytes(),
+            b'' if self.reactions is None or self.reactions is False else (self.reactions._bytes()),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _out = bool(flags & 2)
+        _mentioned = bool(flags & 16)
+        _media_unread = bool(flags & 32)
+        _reactions_are_possible = bool(flags & 512)
+        _silent = bool(flags & 8192)
+        _post = bool(flags & 16384)
+        _legacy = bool(flags & 524288)
+        if flags & 256:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        _peer_id = reader.tgread_object()
+        if flags & 8:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        _date = reader.tgread_date()
+        _action = reader.tgread_object()
+        if flags & 1048576:
+            _reactions = reader.tgread_object()
+        else:
+            _reactions = None
+        if flags & 33554432:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        return cls(id=_id, peer_id=_peer_id, date=_date, action=_action, out=_out, mentioned=_mentioned, media_unread=_media_unread, reactions_are_possible=_reactions_are_possible, silent=_silent, post=_post, legacy=_legacy, from_id=_from_id, reply_to=_reply_to, reactions=_reactions, ttl_period=_ttl_period)
+
+TypeMessage = Union[MessageEmpty,Message,MessageService]
@@ -0,0 +1,1936 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_Iii = struct.Struct('<Iii')
+_struct_Iq = struct.Struct('<Iq')
+_struct_ii = struct.Struct('<ii')
+_struct_iii = struct.Struct('<iii')
+_struct_iq = struct.Struct('<iq')
+_struct_qi = struct.Struct('<qi')
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotApp, TypeInputGroupCall, TypePaymentCharge, TypePaymentRequestedInfo, TypePeer, TypePhoneCallDiscardReason, TypePhoto, TypeRequestedPeer, TypeSecureCredentialsEncrypted, TypeSecureValue, TypeSecureValueType, TypeStarGift, TypeTextWithEntities, TypeWallPaper
+
+
+
+class MessageActionBoostApply(TLObject):
+    CONSTRUCTOR_ID = 0xcc02aa6d
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('boosts',)
+
+    def __init__(self, boosts: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.boosts = boosts
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionBoostApply',
+            'boosts': self.boosts
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'm\xaa\x02\xcc',
+            struct.pack('<i', self.boosts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _boosts = reader.read_int()
+        return cls(boosts=_boosts)
+
+
+class MessageActionBotAllowed(TLObject):
+    CONSTRUCTOR_ID = 0xc516d679
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('attach_menu', 'from_request', 'domain', 'app')
+
+    def __init__(self, attach_menu: Optional[bool]=None, from_request: Optional[bool]=None, domain: Optional[str]=None, app: Optional['TypeBotApp']=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.attach_menu = attach_menu
+        self.from_request = from_request
+        self.domain = domain
+        self.app = app
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionBotAllowed',
+            'attach_menu': self.attach_menu,
+            'from_request': self.from_request,
+            'domain': self.domain,
+            'app': self.app.to_dict() if isinstance(self.app, TLObject) else self.app
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'y\xd6\x16\xc5',
+            struct.pack('<I', (0 if self.attach_menu is None or self.attach_menu is False else 2) | (0 if self.from_request is None or self.from_request is False else 8) | (0 if self.domain is None or self.domain is False else 1) | (0 if self.app is None or self.app is False else 4)),
+            b'' if self.domain is None or self.domain is False else (self.serialize_bytes(self.domain)),
+            b'' if self.app is None or self.app is False else (self.app._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _attach_menu = bool(flags & 2)
+        _from_request = bool(flags & 8)
+        if flags & 1:
+            _domain = reader.tgread_string()
+        else:
+            _domain = None
+        if flags & 4:
+            _app = reader.tgread_object()
+        else:
+            _app = None
+        return cls(attach_menu=_attach_menu, from_request=_from_request, domain=_domain, app=_app)
+
+
+class MessageActionChannelCreate(TLObject):
+    CONSTRUCTOR_ID = 0x95d2ac92
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('title',)
+
+    def __init__(self, title: str):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChannelCreate',
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x92\xac\xd2\x95',
+            self.serialize_bytes(self.title),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        return cls(title=_title)
+
+
+class MessageActionChannelMigrateFrom(TLObject):
+    CONSTRUCTOR_ID = 0xea3948e9
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('title', 'chat_id')
+
+    def __init__(self, title: str, chat_id: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.title = title
+        self.chat_id = chat_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChannelMigrateFrom',
+            'title': self.title,
+            'chat_id': self.chat_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe9H9\xea',
+            self.serialize_bytes(self.title),
+            struct.pack('<q', self.chat_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        _chat_id = reader.read_long()
+        return cls(title=_title, chat_id=_chat_id)
+
+
+class MessageActionChatAddUser(TLObject):
+    CONSTRUCTOR_ID = 0x15cefd00
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('users',)
+
+    def __init__(self, users: List[int]):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatAddUser',
+            'users': [] if self.users is None else self.users[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x00\xfd\xce\x15',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.users)), len(self.users), *self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _users = reader.read_array('q', reader.read_int())
+        return cls(users=_users)
+
+
+class MessageActionChatCreate(TLObject):
+    CONSTRUCTOR_ID = 0xbd47cbad
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('title', 'users')
+
+    def __init__(self, title: str, users: List[int]):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.title = title
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatCreate',
+            'title': self.title,
+            'users': [] if self.users is None else self.users[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xad\xcbG\xbd',
+            self.serialize_bytes(self.title),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.users)), len(self.users), *self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        reader.read_int()
+        _users = reader.read_array('q', reader.read_int())
+        return cls(title=_title, users=_users)
+
+
+class MessageActionChatDeletePhoto(TLObject):
+    CONSTRUCTOR_ID = 0x95e3fbef
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatDeletePhoto'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xef\xfb\xe3\x95',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageActionChatDeleteUser(TLObject):
+    CONSTRUCTOR_ID = 0xa43f30cc
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('user_id',)
+
+    def __init__(self, user_id: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatDeleteUser',
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcc0?\xa4',
+            struct.pack('<q', self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.read_long()
+        return cls(user_id=_user_id)
+
+
+class MessageActionChatEditPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x7fcb13a8
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('photo',)
+
+    def __init__(self, photo: 'TypePhoto'):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatEditPhoto',
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa8\x13\xcb\x7f',
+            self.photo._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _photo = reader.tgread_object()
+        return cls(photo=_photo)
+
+
+class MessageActionChatEditTitle(TLObject):
+    CONSTRUCTOR_ID = 0xb5a1ce5a
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('title',)
+
+    def __init__(self, title: str):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatEditTitle',
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Z\xce\xa1\xb5',
+            self.serialize_bytes(self.title),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        return cls(title=_title)
+
+
+class MessageActionChatJoinedByLink(TLObject):
+    CONSTRUCTOR_ID = 0x31224c3
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('inviter_id',)
+
+    def __init__(self, inviter_id: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.inviter_id = inviter_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatJoinedByLink',
+            'inviter_id': self.inviter_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc3$\x12\x03',
+            struct.pack('<q', self.inviter_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _inviter_id = reader.read_long()
+        return cls(inviter_id=_inviter_id)
+
+
+class MessageActionChatJoinedByRequest(TLObject):
+    CONSTRUCTOR_ID = 0xebbca3cb
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatJoinedByRequest'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcb\xa3\xbc\xeb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageActionChatMigrateTo(TLObject):
+    CONSTRUCTOR_ID = 0xe1037f92
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('channel_id',)
+
+    def __init__(self, channel_id: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.channel_id = channel_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionChatMigrateTo',
+            'channel_id': self.channel_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x92\x7f\x03\xe1',
+            struct.pack('<q', self.channel_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _channel_id = reader.read_long()
+        return cls(channel_id=_channel_id)
+
+
+class MessageActionContactSignUp(TLObject):
+    CONSTRUCTOR_ID = 0xf3f25f76
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionContactSignUp'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'v_\xf2\xf3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageActionCustomAction(TLObject):
+    CONSTRUCTOR_ID = 0xfae69f56
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('message',)
+
+    def __init__(self, message: str):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionCustomAction',
+            'message': self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'V\x9f\xe6\xfa',
+            self.serialize_bytes(self.message),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _message = reader.tgread_string()
+        return cls(message=_message)
+
+
+class MessageActionEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xb6aef7b0
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb0\xf7\xae\xb6',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageActionGameScore(TLObject):
+    CONSTRUCTOR_ID = 0x92a72876
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('game_id', 'score')
+
+    def __init__(self, game_id: int, score: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.game_id = game_id
+        self.score = score
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGameScore',
+            'game_id': self.game_id,
+            'score': self.score
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'v(\xa7\x92',
+            _struct_qi.pack(self.game_id, self.score),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _game_id, _score = reader.read_struct(_struct_qi)
+        return cls(game_id=_game_id, score=_score)
+
+
+class MessageActionGeoProximityReached(TLObject):
+    CONSTRUCTOR_ID = 0x98e0d697
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('from_id', 'to_id', 'distance')
+
+    def __init__(self, from_id: 'TypePeer', to_id: 'TypePeer', distance: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.from_id = from_id
+        self.to_id = to_id
+        self.distance = distance
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGeoProximityReached',
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'to_id': self.to_id.to_dict() if isinstance(self.to_id, TLObject) else self.to_id,
+            'distance': self.distance
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x97\xd6\xe0\x98',
+            self.from_id._bytes(),
+            self.to_id._bytes(),
+            struct.pack('<i', self.distance),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _from_id = reader.tgread_object()
+        _to_id = reader.tgread_object()
+        _distance = reader.read_int()
+        return cls(from_id=_from_id, to_id=_to_id, distance=_distance)
+
+
+class MessageActionGiftCode(TLObject):
+    CONSTRUCTOR_ID = 0x56d03994
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('months', 'slug', 'via_giveaway', 'unclaimed', 'boost_peer', 'currency', 'amount', 'crypto_currency', 'crypto_amount', 'message')
+
+    def __init__(self, months: int, slug: str, via_giveaway: Optional[bool]=None, unclaimed: Optional[bool]=None, boost_peer: Optional['TypePeer']=None, currency: Optional[str]=None, amount: Optional[int]=None, crypto_currency: Optional[str]=None, crypto_amount: Optional[int]=None, message: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.months = months
+        self.slug = slug
+        self.via_giveaway = via_giveaway
+        self.unclaimed = unclaimed
+        self.boost_peer = boost_peer
+        self.currency = currency
+        self.amount = amount
+        self.crypto_currency = crypto_currency
+        self.crypto_amount = crypto_amount
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGiftCode',
+            'months': self.months,
+            'slug': self.slug,
+            'via_giveaway': self.via_giveaway,
+            'unclaimed': self.unclaimed,
+            'boost_peer': self.boost_peer.to_dict() if isinstance(self.boost_peer, TLObject) else self.boost_peer,
+            'currency': self.currency,
+            'amount': self.amount,
+            'crypto_currency': self.crypto_currency,
+            'crypto_amount': self.crypto_amount,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        assert ((self.currency or self.currency is not None) and (self.amount or self.amount is not None)) or ((self.currency is None or self.currency is False) and (self.amount is None or self.amount is False)), 'currency, amount parameters must all be False-y (like None) or all me True-y'
+        assert ((self.crypto_currency or self.crypto_currency is not None) and (self.crypto_amount or self.crypto_amount is not None)) or ((self.crypto_currency is None or self.crypto_currency is False) and (self.crypto_amount is None or self.crypto_amount is False)), 'crypto_currency, crypto_amount parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\x949\xd0V',
+            struct.pack('<I', (0 if self.via_giveaway is None or self.via_giveaway is False else 1) | (0 if self.unclaimed is None or self.unclaimed is False else 32) | (0 if self.boost_peer is None or self.boost_peer is False else 2) | (0 if self.currency is None or self.currency is False else 4) | (0 if self.amount is None or self.amount is False else 4) | (0 if self.crypto_currency is None or self.crypto_currency is False else 8) | (0 if self.crypto_amount is None or self.crypto_amount is False else 8) | (0 if self.message is None or self.message is False else 16)),
+            b'' if self.boost_peer is None or self.boost_peer is False else (self.boost_peer._bytes()),
+            struct.pack('<i', self.months),
+            self.serialize_bytes(self.slug),
+            b'' if self.currency is None or self.currency is False else (self.serialize_bytes(self.currency)),
+            b'' if self.amount is None or self.amount is False else (struct.pack('<q', self.amount)),
+            b'' if self.crypto_currency is None or self.crypto_currency is False else (self.serialize_bytes(self.crypto_currency)),
+            b'' if self.crypto_amount is None or self.crypto_amount is False else (struct.pack('<q', self.crypto_amount)),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _via_giveaway = bool(flags & 1)
+        _unclaimed = bool(flags & 32)
+        if flags & 2:
+            _boost_peer = reader.tgread_object()
+        else:
+            _boost_peer = None
+        _months = reader.read_int()
+        _slug = reader.tgread_string()
+        if flags & 4:
+            _currency = reader.tgread_string()
+        else:
+            _currency = None
+        if flags & 4:
+            _amount = reader.read_long()
+        else:
+            _amount = None
+        if flags & 8:
+            _crypto_currency = reader.tgread_string()
+        else:
+            _crypto_currency = None
+        if flags & 8:
+            _crypto_amount = reader.read_long()
+        else:
+            _crypto_amount = None
+        if flags & 16:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        return cls(months=_months, slug=_slug, via_giveaway=_via_giveaway, unclaimed=_unclaimed, boost_peer=_boost_peer, currency=_currency, amount=_amount, crypto_currency=_crypto_currency, crypto_amount=_crypto_amount, message=_message)
+
+
+class MessageActionGiftPremium(TLObject):
+    CONSTRUCTOR_ID = 0x6c6274fa
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('currency', 'amount', 'months', 'crypto_currency', 'crypto_amount', 'message')
+
+    def __init__(self, currency: str, amount: int, months: int, crypto_currency: Optional[str]=None, crypto_amount: Optional[int]=None, message: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.currency = currency
+        self.amount = amount
+        self.months = months
+        self.crypto_currency = crypto_currency
+        self.crypto_amount = crypto_amount
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGiftPremium',
+            'currency': self.currency,
+            'amount': self.amount,
+            'months': self.months,
+            'crypto_currency': self.crypto_currency,
+            'crypto_amount': self.crypto_amount,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        assert ((self.crypto_currency or self.crypto_currency is not None) and (self.crypto_amount or self.crypto_amount is not None)) or ((self.crypto_currency is None or self.crypto_currency is False) and (self.crypto_amount is None or self.crypto_amount is False)), 'crypto_currency, crypto_amount parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xfatbl',
+            struct.pack('<I', (0 if self.crypto_currency is None or self.crypto_currency is False else 1) | (0 if self.crypto_amount is None or self.crypto_amount is False else 1) | (0 if self.message is None or self.message is False else 2)),
+            self.serialize_bytes(self.currency),
+            _struct_qi.pack(self.amount, self.months),
+            b'' if self.crypto_currency is None or self.crypto_currency is False else (self.serialize_bytes(self.crypto_currency)),
+            b'' if self.crypto_amount is None or self.crypto_amount is False else (struct.pack('<q', self.crypto_amount)),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _currency = reader.tgread_string()
+        _amount, _months = reader.read_struct(_struct_qi)
+        if flags & 1:
+            _crypto_currency = reader.tgread_string()
+        else:
+            _crypto_currency = None
+        if flags & 1:
+            _crypto_amount = reader.read_long()
+        else:
+            _crypto_amount = None
+        if flags & 2:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        return cls(currency=_currency, amount=_amount, months=_months, crypto_currency=_crypto_currency, crypto_amount=_crypto_amount, message=_message)
+
+
+class MessageActionGiftStars(TLObject):
+    CONSTRUCTOR_ID = 0x45d5b021
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('currency', 'amount', 'stars', 'crypto_currency', 'crypto_amount', 'transaction_id')
+
+    def __init__(self, currency: str, amount: int, stars: int, crypto_currency: Optional[str]=None, crypto_amount: Optional[int]=None, transaction_id: Optional[str]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.currency = currency
+        self.amount = amount
+        self.stars = stars
+        self.crypto_currency = crypto_currency
+        self.crypto_amount = crypto_amount
+        self.transaction_id = transaction_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGiftStars',
+            'currency': self.currency,
+            'amount': self.amount,
+            'stars': self.stars,
+            'crypto_currency': self.crypto_currency,
+            'crypto_amount': self.crypto_amount,
+            'transaction_id': self.transaction_id
+        }
+
+    def _bytes(self):
+        assert ((self.crypto_currency or self.crypto_currency is not None) and (self.crypto_amount or self.crypto_amount is not None)) or ((self.crypto_currency is None or self.crypto_currency is False) and (self.crypto_amount is None or self.crypto_amount is False)), 'crypto_currency, crypto_amount parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'!\xb0\xd5E',
+            struct.pack('<I', (0 if self.crypto_currency is None or self.crypto_currency is False else 1) | (0 if self.crypto_amount is None or self.crypto_amount is False else 1) | (0 if self.transaction_id is None or self.transaction_id is False else 2)),
+            self.serialize_bytes(self.currency),
+            _struct_qq.pack(self.amount, self.stars),
+            b'' if self.crypto_currency is None or self.crypto_currency is False else (self.serialize_bytes(self.crypto_currency)),
+            b'' if self.crypto_amount is None or self.crypto_amount is False else (struct.pack('<q', self.crypto_amount)),
+            b'' if self.transaction_id is None or self.transaction_id is False else (self.serialize_bytes(self.transaction_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _currency = reader.tgread_string()
+        _amount, _stars = reader.read_struct(_struct_qq)
+        if flags & 1:
+            _crypto_currency = reader.tgread_string()
+        else:
+            _crypto_currency = None
+        if flags & 1:
+            _crypto_amount = reader.read_long()
+        else:
+            _crypto_amount = None
+        if flags & 2:
+            _transaction_id = reader.tgread_string()
+        else:
+            _transaction_id = None
+        return cls(currency=_currency, amount=_amount, stars=_stars, crypto_currency=_crypto_currency, crypto_amount=_crypto_amount, transaction_id=_transaction_id)
+
+
+class MessageActionGiveawayLaunch(TLObject):
+    CONSTRUCTOR_ID = 0xa80f51e4
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('stars',)
+
+    def __init__(self, stars: Optional[int]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGiveawayLaunch',
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4Q\x0f\xa8',
+            struct.pack('<I', (0 if self.stars is None or self.stars is False else 1)),
+            b'' if self.stars is None or self.stars is False else (struct.pack('<q', self.stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _stars = reader.read_long()
+        else:
+            _stars = None
+        return cls(stars=_stars)
+
+
+class MessageActionGiveawayResults(TLObject):
+    CONSTRUCTOR_ID = 0x87e2f155
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('winners_count', 'unclaimed_count', 'stars')
+
+    def __init__(self, winners_count: int, unclaimed_count: int, stars: Optional[bool]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.winners_count = winners_count
+        self.unclaimed_count = unclaimed_count
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGiveawayResults',
+            'winners_count': self.winners_count,
+            'unclaimed_count': self.unclaimed_count,
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'U\xf1\xe2\x87',
+            _struct_Iii.pack((0 if self.stars is None or self.stars is False else 1), self.winners_count, self.unclaimed_count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _winners_count, _unclaimed_count = reader.read_struct(_struct_iii)
+        _stars = bool(flags & 1)
+        return cls(winners_count=_winners_count, unclaimed_count=_unclaimed_count, stars=_stars)
+
+
+class MessageActionGroupCall(TLObject):
+    CONSTRUCTOR_ID = 0x7a0d7f42
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('call', 'duration')
+
+    def __init__(self, call: 'TypeInputGroupCall', duration: Optional[int]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.call = call
+        self.duration = duration
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGroupCall',
+            'call': self.call.to_dict() if isinstance(self.call, TLObject) else self.call,
+            'duration': self.duration
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'B\x7f\rz',
+            struct.pack('<I', (0 if self.duration is None or self.duration is False else 1)),
+            self.call._bytes(),
+            b'' if self.duration is None or self.duration is False else (struct.pack('<i', self.duration)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _call = reader.tgread_object()
+        if flags & 1:
+            _duration = reader.read_int()
+        else:
+            _duration = None
+        return cls(call=_call, duration=_duration)
+
+
+class MessageActionGroupCallScheduled(TLObject):
+    CONSTRUCTOR_ID = 0xb3a07661
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('call', 'schedule_date')
+
+    def __init__(self, call: 'TypeInputGroupCall', schedule_date: Optional[datetime]):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.call = call
+        self.schedule_date = schedule_date
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionGroupCallScheduled',
+            'call': self.call.to_dict() if isinstance(self.call, TLObject) else self.call,
+            'schedule_date': self.schedule_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'av\xa0\xb3',
+            self.call._bytes(),
+            self.serialize_datetime(self.schedule_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _call = reader.tgread_object()
+        _schedule_date = reader.tgread_date()
+        return cls(call=_call, schedule_date=_schedule_date)
+
+
+class MessageActionHistoryClear(TLObject):
+    CONSTRUCTOR_ID = 0x9fbab604
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionHistoryClear'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x04\xb6\xba\x9f',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageActionInviteToGroupCall(TLObject):
+    CONSTRUCTOR_ID = 0x502f92f7
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('call', 'users')
+
+    def __init__(self, call: 'TypeInputGroupCall', users: List[int]):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.call = call
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionInviteToGroupCall',
+            'call': self.call.to_dict() if isinstance(self.call, TLObject) else self.call,
+            'users': [] if self.users is None else self.users[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf7\x92/P',
+            self.call._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.users)), len(self.users), *self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _call = reader.tgread_object()
+        reader.read_int()
+        _users = reader.read_array('q', reader.read_int())
+        return cls(call=_call, users=_users)
+
+
+class MessageActionPaidMessagesPrice(TLObject):
+    CONSTRUCTOR_ID = 0xbcd71419
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('stars',)
+
+    def __init__(self, stars: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPaidMessagesPrice',
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19\x14\xd7\xbc',
+            struct.pack('<q', self.stars),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stars = reader.read_long()
+        return cls(stars=_stars)
+
+
+class MessageActionPaidMessagesRefunded(TLObject):
+    CONSTRUCTOR_ID = 0xac1f1fcd
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('count', 'stars')
+
+    def __init__(self, count: int, stars: int):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.count = count
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPaidMessagesRefunded',
+            'count': self.count,
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcd\x1f\x1f\xac',
+            _struct_iq.pack(self.count, self.stars),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count, _stars = reader.read_struct(_struct_iq)
+        return cls(count=_count, stars=_stars)
+
+
+class MessageActionPaymentRefunded(TLObject):
+    CONSTRUCTOR_ID = 0x41b3e202
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('peer', 'currency', 'total_amount', 'charge', 'payload')
+
+    def __init__(self, peer: 'TypePeer', currency: str, total_amount: int, charge: 'TypePaymentCharge', payload: Optional[bytes]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.peer = peer
+        self.currency = currency
+        self.total_amount = total_amount
+        self.charge = charge
+        self.payload = payload
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPaymentRefunded',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'currency': self.currency,
+            'total_amount': self.total_amount,
+            'charge': self.charge.to_dict() if isinstance(self.charge, TLObject) else self.charge,
+            'payload': self.payload
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x02\xe2\xb3A',
+            struct.pack('<I', (0 if self.payload is None or self.payload is False else 1)),
+            self.peer._bytes(),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.total_amount),
+            b'' if self.payload is None or self.payload is False else (self.serialize_bytes(self.payload)),
+            self.charge._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _peer = reader.tgread_object()
+        _currency = reader.tgread_string()
+        _total_amount = reader.read_long()
+        if flags & 1:
+            _payload = reader.tgread_bytes()
+        else:
+            _payload = None
+        _charge = reader.tgread_object()
+        return cls(peer=_peer, currency=_currency, total_amount=_total_amount, charge=_charge, payload=_payload)
+
+
+class MessageActionPaymentSent(TLObject):
+    CONSTRUCTOR_ID = 0xc624b16e
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('currency', 'total_amount', 'recurring_init', 'recurring_used', 'invoice_slug', 'subscription_until_date')
+
+    def __init__(self, currency: str, total_amount: int, recurring_init: Optional[bool]=None, recurring_used: Optional[bool]=None, invoice_slug: Optional[str]=None, subscription_until_date: Optional[datetime]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.currency = currency
+        self.total_amount = total_amount
+        self.recurring_init = recurring_init
+        self.recurring_used = recurring_used
+        self.invoice_slug = invoice_slug
+        self.subscription_until_date = subscription_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPaymentSent',
+            'currency': self.currency,
+            'total_amount': self.total_amount,
+            'recurring_init': self.recurring_init,
+            'recurring_used': self.recurring_used,
+            'invoice_slug': self.invoice_slug,
+            'subscription_until_date': self.subscription_until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'n\xb1$\xc6',
+            struct.pack('<I', (0 if self.recurring_init is None or self.recurring_init is False else 4) | (0 if self.recurring_used is None or self.recurring_used is False else 8) | (0 if self.invoice_slug is None or self.invoice_slug is False else 1) | (0 if self.subscription_until_date is None or self.subscription_until_date is False else 16)),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.total_amount),
+            b'' if self.invoice_slug is None or self.invoice_slug is False else (self.serialize_bytes(self.invoice_slug)),
+            b'' if self.subscription_until_date is None or self.subscription_until_date is False else (self.serialize_datetime(self.subscription_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _recurring_init = bool(flags & 4)
+        _recurring_used = bool(flags & 8)
+        _currency = reader.tgread_string()
+        _total_amount = reader.read_long()
+        if flags & 1:
+            _invoice_slug = reader.tgread_string()
+        else:
+            _invoice_slug = None
+        if flags & 16:
+            _subscription_until_date = reader.tgread_date()
+        else:
+            _subscription_until_date = None
+        return cls(currency=_currency, total_amount=_total_amount, recurring_init=_recurring_init, recurring_used=_recurring_used, invoice_slug=_invoice_slug, subscription_until_date=_subscription_until_date)
+
+
+class MessageActionPaymentSentMe(TLObject):
+    CONSTRUCTOR_ID = 0xffa00ccc
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('currency', 'total_amount', 'payload', 'charge', 'recurring_init', 'recurring_used', 'info', 'shipping_option_id', 'subscription_until_date')
+
+    def __init__(self, currency: str, total_amount: int, payload: bytes, charge: 'TypePaymentCharge', recurring_init: Optional[bool]=None, recurring_used: Optional[bool]=None, info: Optional['TypePaymentRequestedInfo']=None, shipping_option_id: Optional[str]=None, subscription_until_date: Optional[datetime]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.currency = currency
+        self.total_amount = total_amount
+        self.payload = payload
+        self.charge = charge
+        self.recurring_init = recurring_init
+        self.recurring_used = recurring_used
+        self.info = info
+        self.shipping_option_id = shipping_option_id
+        self.subscription_until_date = subscription_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPaymentSentMe',
+            'currency': self.currency,
+            'total_amount': self.total_amount,
+            'payload': self.payload,
+            'charge': self.charge.to_dict() if isinstance(self.charge, TLObject) else self.charge,
+            'recurring_init': self.recurring_init,
+            'recurring_used': self.recurring_used,
+            'info': self.info.to_dict() if isinstance(self.info, TLObject) else self.info,
+            'shipping_option_id': self.shipping_option_id,
+            'subscription_until_date': self.subscription_until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcc\x0c\xa0\xff',
+            struct.pack('<I', (0 if self.recurring_init is None or self.recurring_init is False else 4) | (0 if self.recurring_used is None or self.recurring_used is False else 8) | (0 if self.info is None or self.info is False else 1) | (0 if self.shipping_option_id is None or self.shipping_option_id is False else 2) | (0 if self.subscription_until_date is None or self.subscription_until_date is False else 16)),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.total_amount),
+            self.serialize_bytes(self.payload),
+            b'' if self.info is None or self.info is False else (self.info._bytes()),
+            b'' if self.shipping_option_id is None or self.shipping_option_id is False else (self.serialize_bytes(self.shipping_option_id)),
+            self.charge._bytes(),
+            b'' if self.subscription_until_date is None or self.subscription_until_date is False else (self.serialize_datetime(self.subscription_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _recurring_init = bool(flags & 4)
+        _recurring_used = bool(flags & 8)
+        _currency = reader.tgread_string()
+        _total_amount = reader.read_long()
+        _payload = reader.tgread_bytes()
+        if flags & 1:
+            _info = reader.tgread_object()
+        else:
+            _info = None
+        if flags & 2:
+            _shipping_option_id = reader.tgread_string()
+        else:
+            _shipping_option_id = None
+        _charge = reader.tgread_object()
+        if flags & 16:
+            _subscription_until_date = reader.tgread_date()
+        else:
+            _subscription_until_date = None
+        return cls(currency=_currency, total_amount=_total_amount, payload=_payload, charge=_charge, recurring_init=_recurring_init, recurring_used=_recurring_used, info=_info, shipping_option_id=_shipping_option_id, subscription_until_date=_subscription_until_date)
+
+
+class MessageActionPhoneCall(TLObject):
+    CONSTRUCTOR_ID = 0x80e11a7f
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('call_id', 'video', 'reason', 'duration')
+
+    def __init__(self, call_id: int, video: Optional[bool]=None, reason: Optional['TypePhoneCallDiscardReason']=None, duration: Optional[int]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.call_id = call_id
+        self.video = video
+        self.reason = reason
+        self.duration = duration
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPhoneCall',
+            'call_id': self.call_id,
+            'video': self.video,
+            'reason': self.reason.to_dict() if isinstance(self.reason, TLObject) else self.reason,
+            'duration': self.duration
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f\x1a\xe1\x80',
+            _struct_Iq.pack((0 if self.video is None or self.video is False else 4) | (0 if self.reason is None or self.reason is False else 1) | (0 if self.duration is None or self.duration is False else 2), self.call_id),
+            b'' if self.reason is None or self.reason is False else (self.reason._bytes()),
+            b'' if self.duration is None or self.duration is False else (struct.pack('<i', self.duration)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _call_id = reader.read_struct(_struct_iq)
+        _video = bool(flags & 4)
+        if flags & 1:
+            _reason = reader.tgread_object()
+        else:
+            _reason = None
+        if flags & 2:
+            _duration = reader.read_int()
+        else:
+            _duration = None
+        return cls(call_id=_call_id, video=_video, reason=_reason, duration=_duration)
+
+
+class MessageActionPinMessage(TLObject):
+    CONSTRUCTOR_ID = 0x94bd38ed
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPinMessage'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed8\xbd\x94',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageActionPrizeStars(TLObject):
+    CONSTRUCTOR_ID = 0xb00c47a2
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('stars', 'transaction_id', 'boost_peer', 'giveaway_msg_id', 'unclaimed')
+
+    def __init__(self, stars: int, transaction_id: str, boost_peer: 'TypePeer', giveaway_msg_id: int, unclaimed: Optional[bool]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.stars = stars
+        self.transaction_id = transaction_id
+        self.boost_peer = boost_peer
+        self.giveaway_msg_id = giveaway_msg_id
+        self.unclaimed = unclaimed
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionPrizeStars',
+            'stars': self.stars,
+            'transaction_id': self.transaction_id,
+            'boost_peer': self.boost_peer.to_dict() if isinstance(self.boost_peer, TLObject) else self.boost_peer,
+            'giveaway_msg_id': self.giveaway_msg_id,
+            'unclaimed': self.unclaimed
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa2G\x0c\xb0',
+            _struct_Iq.pack((0 if self.unclaimed is None or self.unclaimed is False else 1), self.stars),
+            self.serialize_bytes(self.transaction_id),
+            self.boost_peer._bytes(),
+            struct.pack('<i', self.giveaway_msg_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _stars = reader.read_struct(_struct_iq)
+        _unclaimed = bool(flags & 1)
+        _transaction_id = reader.tgread_string()
+        _boost_peer = reader.tgread_object()
+        _giveaway_msg_id = reader.read_int()
+        return cls(stars=_stars, transaction_id=_transaction_id, boost_peer=_boost_peer, giveaway_msg_id=_giveaway_msg_id, unclaimed=_unclaimed)
+
+
+class MessageActionRequestedPeer(TLObject):
+    CONSTRUCTOR_ID = 0x31518e9b
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('button_id', 'peers')
+
+    def __init__(self, button_id: int, peers: List['TypePeer']):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.button_id = button_id
+        self.peers = peers
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionRequestedPeer',
+            'button_id': self.button_id,
+            'peers': [] if self.peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9b\x8eQ1',
+            struct.pack('<i', self.button_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peers)),b''.join(x._bytes() for x in self.peers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _button_id = reader.read_int()
+        reader.read_int()
+        _peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _peers.append(_x)
+
+        return cls(button_id=_button_id, peers=_peers)
+
+
+class MessageActionRequestedPeerSentMe(TLObject):
+    CONSTRUCTOR_ID = 0x93b31848
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('button_id', 'peers')
+
+    def __init__(self, button_id: int, peers: List['TypeRequestedPeer']):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.button_id = button_id
+        self.peers = peers
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionRequestedPeerSentMe',
+            'button_id': self.button_id,
+            'peers': [] if self.peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'H\x18\xb3\x93',
+            struct.pack('<i', self.button_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peers)),b''.join(x._bytes() for x in self.peers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _button_id = reader.read_int()
+        reader.read_int()
+        _peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _peers.append(_x)
+
+        return cls(button_id=_button_id, peers=_peers)
+
+
+class MessageActionScreenshotTaken(TLObject):
+    CONSTRUCTOR_ID = 0x4792929b
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionScreenshotTaken'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9b\x92\x92G',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageActionSecureValuesSent(TLObject):
+    CONSTRUCTOR_ID = 0xd95c6154
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('types',)
+
+    def __init__(self, types: List['TypeSecureValueType']):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.types = types
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionSecureValuesSent',
+            'types': [] if self.types is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.types]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Ta\\\xd9',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.types)),b''.join(x._bytes() for x in self.types),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _types = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _types.append(_x)
+
+        return cls(types=_types)
+
+
+class MessageActionSecureValuesSentMe(TLObject):
+    CONSTRUCTOR_ID = 0x1b287353
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('values', 'credentials')
+
+    def __init__(self, values: List['TypeSecureValue'], credentials: 'TypeSecureCredentialsEncrypted'):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.values = values
+        self.credentials = credentials
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionSecureValuesSentMe',
+            'values': [] if self.values is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.values],
+            'credentials': self.credentials.to_dict() if isinstance(self.credentials, TLObject) else self.credentials
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Ss(\x1b',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.values)),b''.join(x._bytes() for x in self.values),
+            self.credentials._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _values = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _values.append(_x)
+
+        _credentials = reader.tgread_object()
+        return cls(values=_values, credentials=_credentials)
+
+
+class MessageActionSetChatTheme(TLObject):
+    CONSTRUCTOR_ID = 0xaa786345
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('emoticon',)
+
+    def __init__(self, emoticon: str):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.emoticon = emoticon
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionSetChatTheme',
+            'emoticon': self.emoticon
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Ecx\xaa',
+            self.serialize_bytes(self.emoticon),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoticon = reader.tgread_string()
+        return cls(emoticon=_emoticon)
+
+
+class MessageActionSetChatWallPaper(TLObject):
+    CONSTRUCTOR_ID = 0x5060a3f4
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('wallpaper', 'same', 'for_both')
+
+    def __init__(self, wallpaper: 'TypeWallPaper', same: Optional[bool]=None, for_both: Optional[bool]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.wallpaper = wallpaper
+        self.same = same
+        self.for_both = for_both
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionSetChatWallPaper',
+            'wallpaper': self.wallpaper.to_dict() if isinstance(self.wallpaper, TLObject) else self.wallpaper,
+            'same': self.same,
+            'for_both': self.for_both
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf4\xa3`P',
+            struct.pack('<I', (0 if self.same is None or self.same is False else 1) | (0 if self.for_both is None or self.for_both is False else 2)),
+            self.wallpaper._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _same = bool(flags & 1)
+        _for_both = bool(flags & 2)
+        _wallpaper = reader.tgread_object()
+        return cls(wallpaper=_wallpaper, same=_same, for_both=_for_both)
+
+
+class MessageActionSetMessagesTTL(TLObject):
+    CONSTRUCTOR_ID = 0x3c134d7b
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('period', 'auto_setting_from')
+
+    def __init__(self, period: int, auto_setting_from: Optional[int]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.period = period
+        self.auto_setting_from = auto_setting_from
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionSetMessagesTTL',
+            'period': self.period,
+            'auto_setting_from': self.auto_setting_from
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'{M\x13<',
+            _struct_Ii.pack((0 if self.auto_setting_from is None or self.auto_setting_from is False else 1), self.period),
+            b'' if self.auto_setting_from is None or self.auto_setting_from is False else (struct.pack('<q', self.auto_setting_from)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _period = reader.read_struct(_struct_ii)
+        if flags & 1:
+            _auto_setting_from = reader.read_long()
+        else:
+            _auto_setting_from = None
+        return cls(period=_period, auto_setting_from=_auto_setting_from)
+
+
+class MessageActionStarGift(TLObject):
+    CONSTRUCTOR_ID = 0x4717e8a4
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('gift', 'name_hidden', 'saved', 'converted', 'upgraded', 'refunded', 'can_upgrade', 'message', 'convert_stars', 'upgrade_msg_id', 'upgrade_stars', 'from_id', 'peer', 'saved_id')
+
+    def __init__(self, gift: 'TypeStarGift', name_hidden: Optional[bool]=None, saved: Optional[bool]=None, converted: Optional[bool]=None, upgraded: Optional[bool]=None, refunded: Optional[bool]=None, can_upgrade: Optional[bool]=None, message: Optional['TypeTextWithEntities']=None, convert_stars: Optional[int]=None, upgrade_msg_id: Optional[int]=None, upgrade_stars: Optional[int]=None, from_id: Optional['TypePeer']=None, peer: Optional['TypePeer']=None, saved_id: Optional[int]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.gift = gift
+        self.name_hidden = name_hidden
+        self.saved = saved
+        self.converted = converted
+        self.upgraded = upgraded
+        self.refunded = refunded
+        self.can_upgrade = can_upgrade
+        self.message = message
+        self.convert_stars = convert_stars
+        self.upgrade_msg_id = upgrade_msg_id
+        self.upgrade_stars = upgrade_stars
+        self.from_id = from_id
+        self.peer = peer
+        self.saved_id = saved_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionStarGift',
+            'gift': self.gift.to_dict() if isinstance(self.gift, TLObject) else self.gift,
+            'name_hidden': self.name_hidden,
+            'saved': self.saved,
+            'converted': self.converted,
+            'upgraded': self.upgraded,
+            'refunded': self.refunded,
+            'can_upgrade': self.can_upgrade,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message,
+            'convert_stars': self.convert_stars,
+            'upgrade_msg_id': self.upgrade_msg_id,
+            'upgrade_stars': self.upgrade_stars,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'saved_id': self.saved_id
+        }
+
+    def _bytes(self):
+        assert ((self.upgraded or self.upgraded is not None) and (self.upgrade_msg_id or self.upgrade_msg_id is not None)) or ((self.upgraded is None or self.upgraded is False) and (self.upgrade_msg_id is None or self.upgrade_msg_id is False)), 'upgraded, upgrade_msg_id parameters must all be False-y (like None) or all me True-y'
+        assert ((self.peer or self.peer is not None) and (self.saved_id or self.saved_id is not None)) or ((self.peer is None or self.peer is False) and (self.saved_id is None or self.saved_id is False)), 'peer, saved_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xa4\xe8\x17G',
+            struct.pack('<I', (0 if self.name_hidden is None or self.name_hidden is False else 1) | (0 if self.saved is None or self.saved is False else 4) | (0 if self.converted is None or self.converted is False else 8) | (0 if self.upgraded is None or self.upgraded is False else 32) | (0 if self.refunded is None or self.refunded is False else 512) | (0 if self.can_upgrade is None or self.can_upgrade is False else 1024) | (0 if self.message is None or self.message is False else 2) | (0 if self.convert_stars is None or self.convert_stars is False else 16) | (0 if self.upgrade_msg_id is None or self.upgrade_msg_id is False else 32) | (0 if self.upgrade_stars is None or self.upgrade_stars is False else 256) | (0 if self.from_id is None or self.from_id is False else 2048) | (0 if self.peer is None or self.peer is False else 4096) | (0 if self.saved_id is None or self.saved_id is False else 4096)),
+            self.gift._bytes(),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+            b'' if self.convert_stars is None or self.convert_stars is False else (struct.pack('<q', self.convert_stars)),
+            b'' if self.upgrade_msg_id is None or self.upgrade_msg_id is False else (struct.pack('<i', self.upgrade_msg_id)),
+            b'' if self.upgrade_stars is None or self.upgrade_stars is False else (struct.pack('<q', self.upgrade_stars)),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            b'' if self.peer is None or self.peer is False else (self.peer._bytes()),
+            b'' if self.saved_id is None or self.saved_id is False else (struct.pack('<q', self.saved_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _name_hidden = bool(flags & 1)
+        _saved = bool(flags & 4)
+        _converted = bool(flags & 8)
+        _upgraded = bool(flags & 32)
+        _refunded = bool(flags & 512)
+        _can_upgrade = bool(flags & 1024)
+        _gift = reader.tgread_object()
+        if flags & 2:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        if flags & 16:
+            _convert_stars = reader.read_long()
+        else:
+            _convert_stars = None
+        if flags & 32:
+            _upgrade_msg_id = reader.read_int()
+        else:
+            _upgrade_msg_id = None
+        if flags & 256:
+            _upgrade_stars = reader.read_long()
+        else:
+            _upgrade_stars = None
+        if flags & 2048:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        if flags & 4096:
+            _peer = reader.tgread_object()
+        else:
+            _peer = None
+        if flags & 4096:
+            _saved_id = reader.read_long()
+        else:
+            _saved_id = None
+        return cls(gift=_gift, name_hidden=_name_hidden, saved=_saved, converted=_converted, upgraded=_upgraded, refunded=_refunded, can_upgrade=_can_upgrade, message=_message, convert_stars=_convert_stars, upgrade_msg_id=_upgrade_msg_id, upgrade_stars=_upgrade_stars, from_id=_from_id, peer=_peer, saved_id=_saved_id)
+
+
+class MessageActionStarGiftUnique(TLObject):
+    CONSTRUCTOR_ID = 0xacdfcb81
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('gift', 'upgrade', 'transferred', 'saved', 'refunded', 'can_export_at', 'transfer_stars', 'from_id', 'peer', 'saved_id')
+
+    def __init__(self, gift: 'TypeStarGift', upgrade: Optional[bool]=None, transferred: Optional[bool]=None, saved: Optional[bool]=None, refunded: Optional[bool]=None, can_export_at: Optional[int]=None, transfer_stars: Optional[int]=None, from_id: Optional['TypePeer']=None, peer: Optional['TypePeer']=None, saved_id: Optional[int]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.gift = gift
+        self.upgrade = upgrade
+        self.transferred = transferred
+        self.saved = saved
+        self.refunded = refunded
+        self.can_export_at = can_export_at
+        self.transfer_stars = transfer_stars
+        self.from_id = from_id
+        self.peer = peer
+        self.saved_id = saved_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionStarGiftUnique',
+            'gift': self.gift.to_dict() if isinstance(self.gift, TLObject) else self.gift,
+            'upgrade': self.upgrade,
+            'transferred': self.transferred,
+            'saved': self.saved,
+            'refunded': self.refunded,
+            'can_export_at': self.can_export_at,
+            'transfer_stars': self.transfer_stars,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'saved_id': self.saved_id
+        }
+
+    def _bytes(self):
+        assert ((self.peer or self.peer is not None) and (self.saved_id or self.saved_id is not None)) or ((self.peer is None or self.peer is False) and (self.saved_id is None or self.saved_id is False)), 'peer, saved_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\x81\xcb\xdf\xac',
+            struct.pack('<I', (0 if self.upgrade is None or self.upgrade is False else 1) | (0 if self.transferred is None or self.transferred is False else 2) | (0 if self.saved is None or self.saved is False else 4) | (0 if self.refunded is None or self.refunded is False else 32) | (0 if self.can_export_at is None or self.can_export_at is False else 8) | (0 if self.transfer_stars is None or self.transfer_stars is False else 16) | (0 if self.from_id is None or self.from_id is False else 64) | (0 if self.peer is None or self.peer is False else 128) | (0 if self.saved_id is None or self.saved_id is False else 128)),
+            self.gift._bytes(),
+            b'' if self.can_export_at is None or self.can_export_at is False else (struct.pack('<i', self.can_export_at)),
+            b'' if self.transfer_stars is None or self.transfer_stars is False else (struct.pack('<q', self.transfer_stars)),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            b'' if self.peer is None or self.peer is False else (self.peer._bytes()),
+            b'' if self.saved_id is None or self.saved_id is False else (struct.pack('<q', self.saved_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _upgrade = bool(flags & 1)
+        _transferred = bool(flags & 2)
+        _saved = bool(flags & 4)
+        _refunded = bool(flags & 32)
+        _gift = reader.tgread_object()
+        if flags & 8:
+            _can_export_at = reader.read_int()
+        else:
+            _can_export_at = None
+        if flags & 16:
+            _transfer_stars = reader.read_long()
+        else:
+            _transfer_stars = None
+        if flags & 64:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        if flags & 128:
+            _peer = reader.tgread_object()
+        else:
+            _peer = None
+        if flags & 128:
+            _saved_id = reader.read_long()
+        else:
+            _saved_id = None
+        return cls(gift=_gift, upgrade=_upgrade, transferred=_transferred, saved=_saved, refunded=_refunded, can_export_at=_can_export_at, transfer_stars=_transfer_stars, from_id=_from_id, peer=_peer, saved_id=_saved_id)
+
+
+class MessageActionSuggestProfilePhoto(TLObject):
+    CONSTRUCTOR_ID = 0x57de635e
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('photo',)
+
+    def __init__(self, photo: 'TypePhoto'):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionSuggestProfilePhoto',
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'^c\xdeW',
+            self.photo._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _photo = reader.tgread_object()
+        return cls(photo=_photo)
+
+
+class MessageActionTopicCreate(TLObject):
+    CONSTRUCTOR_ID = 0xd999256
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('title', 'icon_color', 'icon_emoji_id')
+
+    def __init__(self, title: str, icon_color: int, icon_emoji_id: Optional[int]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.title = title
+        self.icon_color = icon_color
+        self.icon_emoji_id = icon_emoji_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionTopicCreate',
+            'title': self.title,
+            'icon_color': self.icon_color,
+            'icon_emoji_id': self.icon_emoji_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'V\x92\x99\r',
+            struct.pack('<I', (0 if self.icon_emoji_id is None or self.icon_emoji_id is False else 1)),
+            self.serialize_bytes(self.title),
+            struct.pack('<i', self.icon_color),
+            b'' if self.icon_emoji_id is None or self.icon_emoji_id is False else (struct.pack('<q', self.icon_emoji_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _title = reader.tgread_string()
+        _icon_color = reader.read_int()
+        if flags & 1:
+            _icon_emoji_id = reader.read_long()
+        else:
+            _icon_emoji_id = None
+        return cls(title=_title, icon_color=_icon_color, icon_emoji_id=_icon_emoji_id)
+
+
+class MessageActionTopicEdit(TLObject):
+    CONSTRUCTOR_ID = 0xc0944820
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('title', 'icon_emoji_id', 'closed', 'hidden')
+
+    def __init__(self, title: Optional[str]=None, icon_emoji_id: Optional[int]=None, closed: Optional[bool]=None, hidden: Optional[bool]=None):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.title = title
+        self.icon_emoji_id = icon_emoji_id
+        self.closed = closed
+        self.hidden = hidden
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionTopicEdit',
+            'title': self.title,
+            'icon_emoji_id': self.icon_emoji_id,
+            'closed': self.closed,
+            'hidden': self.hidden
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b' H\x94\xc0',
+            struct.pack('<I', (0 if self.title is None or self.title is False else 1) | (0 if self.icon_emoji_id is None or self.icon_emoji_id is False else 2) | (0 if self.closed is None else 4) | (0 if self.hidden is None else 8)),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.icon_emoji_id is None or self.icon_emoji_id is False else (struct.pack('<q', self.icon_emoji_id)),
+            b'' if self.closed is None else (b'\xb5ur\x99' if self.closed else b'7\x97y\xbc'),
+            b'' if self.hidden is None else (b'\xb5ur\x99' if self.hidden else b'7\x97y\xbc'),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 2:
+            _icon_emoji_id = reader.read_long()
+        else:
+            _icon_emoji_id = None
+        if flags & 4:
+            _closed = reader.tgread_bool()
+        else:
+            _closed = None
+        if flags & 8:
+            _hidden = reader.tgread_bool()
+        else:
+            _hidden = None
+        return cls(title=_title, icon_emoji_id=_icon_emoji_id, closed=_closed, hidden=_hidden)
+
+
+class MessageActionWebViewDataSent(TLObject):
+    CONSTRUCTOR_ID = 0xb4c38cb5
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionWebViewDataSent',
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb5\x8c\xc3\xb4',
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        return cls(text=_text)
+
+
+class MessageActionWebViewDataSentMe(TLObject):
+    CONSTRUCTOR_ID = 0x47dd8079
+    SUBCLASS_OF_ID = 0x8680d126
+    __slots__ = ('text', 'data')
+
+    def __init__(self, text: str, data: str):
+        """
+        Constructor for MessageAction: Instance of either MessageActionEmpty, MessageActionChatCreate, MessageActionChatEditTitle, MessageActionChatEditPhoto, MessageActionChatDeletePhoto, MessageActionChatAddUser, MessageActionChatDeleteUser, MessageActionChatJoinedByLink, MessageActionChannelCreate, MessageActionChatMigrateTo, MessageActionChannelMigrateFrom, MessageActionPinMessage, MessageActionHistoryClear, MessageActionGameScore, MessageActionPaymentSentMe, MessageActionPaymentSent, MessageActionPhoneCall, MessageActionScreenshotTaken, MessageActionCustomAction, MessageActionBotAllowed, MessageActionSecureValuesSentMe, MessageActionSecureValuesSent, MessageActionContactSignUp, MessageActionGeoProximityReached, MessageActionGroupCall, MessageActionInviteToGroupCall, MessageActionSetMessagesTTL, MessageActionGroupCallScheduled, MessageActionSetChatTheme, MessageActionChatJoinedByRequest, MessageActionWebViewDataSentMe, MessageActionWebViewDataSent, MessageActionGiftPremium, MessageActionTopicCreate, MessageActionTopicEdit, MessageActionSuggestProfilePhoto, MessageActionRequestedPeer, MessageActionSetChatWallPaper, MessageActionGiftCode, MessageActionGiveawayLaunch, MessageActionGiveawayResults, MessageActionBoostApply, MessageActionRequestedPeerSentMe, MessageActionPaymentRefunded, MessageActionGiftStars, MessageActionPrizeStars, MessageActionStarGift, MessageActionStarGiftUnique, MessageActionPaidMessagesRefunded, MessageActionPaidMessagesPrice.
+        """
+        self.text = text
+        self.data = data
+
+    def to_dict(self):
+        return {
+            '_': 'MessageActionWebViewDataSentMe',
+            'text': self.text,
+            'data': self.data
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'y\x80\xddG',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.data),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _data = reader.tgread_string()
+        return cls(text=_text, data=_data)
+
+TypeMessageAction = Union[MessageActionEmpty,MessageActionChatCreate,MessageActionChatEditTitle,MessageActionChatEditPhoto,MessageActionChatDeletePhoto,MessageActionChatAddUser,MessageActionChatDeleteUser,MessageActionChatJoinedByLink,MessageActionChannelCreate,MessageActionChatMigrateTo,MessageActionChannelMigrateFrom,MessageActionPinMessage,MessageActionHistoryClear,MessageActionGameScore,MessageActionPaymentSentMe,MessageActionPaymentSent,MessageActionPhoneCall,MessageActionScreenshotTaken,MessageActionCustomAction,MessageActionBotAllowed,MessageActionSecureValuesSentMe,MessageActionSecureValuesSent,MessageActionContactSignUp,MessageActionGeoProximityReached,MessageActionGroupCall,MessageActionInviteToGroupCall,MessageActionSetMessagesTTL,MessageActionGroupCallScheduled,MessageActionSetChatTheme,MessageActionChatJoinedByRequest,MessageActionWebViewDataSentMe,MessageActionWebViewDataSent,MessageActionGiftPremium,MessageActionTopicCreate,MessageActionTopicEdit,MessageActionSuggestProfilePhoto,MessageActionRequestedPeer,MessageActionSetChatWallPaper,MessageActionGiftCode,MessageActionGiveawayLaunch,MessageActionGiveawayResults,MessageActionBoostApply,MessageActionRequestedPeerSentMe,MessageActionPaymentRefunded,MessageActionGiftStars,MessageActionPrizeStars,MessageActionStarGift,MessageActionStarGiftUnique,MessageActionPaidMessagesRefunded,MessageActionPaidMessagesPrice]
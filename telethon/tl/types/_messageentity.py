@@ -0,0 +1,686 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iii = struct.Struct('<Iii')
+_struct_ii = struct.Struct('<ii')
+_struct_iii = struct.Struct('<iii')
+_struct_iiq = struct.Struct('<iiq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputUser
+
+
+
+class InputMessageEntityMentionName(TLObject):
+    CONSTRUCTOR_ID = 0x208e68c9
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length', 'user_id')
+
+    def __init__(self, offset: int, length: int, user_id: 'TypeInputUser'):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessageEntityMentionName',
+            'offset': self.offset,
+            'length': self.length,
+            'user_id': self.user_id.to_dict() if isinstance(self.user_id, TLObject) else self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9h\x8e ',
+            _struct_ii.pack(self.offset, self.length),
+            self.user_id._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        _user_id = reader.tgread_object()
+        return cls(offset=_offset, length=_length, user_id=_user_id)
+
+
+class MessageEntityBankCard(TLObject):
+    CONSTRUCTOR_ID = 0x761e6af4
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityBankCard',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf4j\x1ev',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityBlockquote(TLObject):
+    CONSTRUCTOR_ID = 0xf1ccaaac
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length', 'collapsed')
+
+    def __init__(self, offset: int, length: int, collapsed: Optional[bool]=None):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+        self.collapsed = collapsed
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityBlockquote',
+            'offset': self.offset,
+            'length': self.length,
+            'collapsed': self.collapsed
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xac\xaa\xcc\xf1',
+            _struct_Iii.pack((0 if self.collapsed is None or self.collapsed is False else 1), self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _offset, _length = reader.read_struct(_struct_iii)
+        _collapsed = bool(flags & 1)
+        return cls(offset=_offset, length=_length, collapsed=_collapsed)
+
+
+class MessageEntityBold(TLObject):
+    CONSTRUCTOR_ID = 0xbd610bc9
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityBold',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9\x0ba\xbd',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityBotCommand(TLObject):
+    CONSTRUCTOR_ID = 0x6cef8ac7
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityBotCommand',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc7\x8a\xefl',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityCashtag(TLObject):
+    CONSTRUCTOR_ID = 0x4c4e743f
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityCashtag',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?tNL',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityCode(TLObject):
+    CONSTRUCTOR_ID = 0x28a20571
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityCode',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'q\x05\xa2(',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityCustomEmoji(TLObject):
+    CONSTRUCTOR_ID = 0xc8cf05f8
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length', 'document_id')
+
+    def __init__(self, offset: int, length: int, document_id: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+        self.document_id = document_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityCustomEmoji',
+            'offset': self.offset,
+            'length': self.length,
+            'document_id': self.document_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf8\x05\xcf\xc8',
+            _struct_iiq.pack(self.offset, self.length, self.document_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length, _document_id = reader.read_struct(_struct_iiq)
+        return cls(offset=_offset, length=_length, document_id=_document_id)
+
+
+class MessageEntityEmail(TLObject):
+    CONSTRUCTOR_ID = 0x64e475c2
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityEmail',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc2u\xe4d',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityHashtag(TLObject):
+    CONSTRUCTOR_ID = 0x6f635b0d
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityHashtag',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r[co',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityItalic(TLObject):
+    CONSTRUCTOR_ID = 0x826f8b60
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityItalic',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'`\x8bo\x82',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityMention(TLObject):
+    CONSTRUCTOR_ID = 0xfa04579d
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityMention',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9dW\x04\xfa',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityMentionName(TLObject):
+    CONSTRUCTOR_ID = 0xdc7b1140
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length', 'user_id')
+
+    def __init__(self, offset: int, length: int, user_id: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityMentionName',
+            'offset': self.offset,
+            'length': self.length,
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'@\x11{\xdc',
+            _struct_iiq.pack(self.offset, self.length, self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length, _user_id = reader.read_struct(_struct_iiq)
+        return cls(offset=_offset, length=_length, user_id=_user_id)
+
+
+class MessageEntityPhone(TLObject):
+    CONSTRUCTOR_ID = 0x9b69e34b
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityPhone',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'K\xe3i\x9b',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityPre(TLObject):
+    CONSTRUCTOR_ID = 0x73924be0
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length', 'language')
+
+    def __init__(self, offset: int, length: int, language: str):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+        self.language = language
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityPre',
+            'offset': self.offset,
+            'length': self.length,
+            'language': self.language
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe0K\x92s',
+            _struct_ii.pack(self.offset, self.length),
+            self.serialize_bytes(self.language),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        _language = reader.tgread_string()
+        return cls(offset=_offset, length=_length, language=_language)
+
+
+class MessageEntitySpoiler(TLObject):
+    CONSTRUCTOR_ID = 0x32ca960f
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntitySpoiler',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0f\x96\xca2',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityStrike(TLObject):
+    CONSTRUCTOR_ID = 0xbf0693d4
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityStrike',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd4\x93\x06\xbf',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityTextUrl(TLObject):
+    CONSTRUCTOR_ID = 0x76a6d327
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length', 'url')
+
+    def __init__(self, offset: int, length: int, url: str):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityTextUrl',
+            'offset': self.offset,
+            'length': self.length,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"'\xd3\xa6v",
+            _struct_ii.pack(self.offset, self.length),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        _url = reader.tgread_string()
+        return cls(offset=_offset, length=_length, url=_url)
+
+
+class MessageEntityUnderline(TLObject):
+    CONSTRUCTOR_ID = 0x9c4e7e8b
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityUnderline',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8b~N\x9c',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityUnknown(TLObject):
+    CONSTRUCTOR_ID = 0xbb92ba95
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityUnknown',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95\xba\x92\xbb',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+
+class MessageEntityUrl(TLObject):
+    CONSTRUCTOR_ID = 0x6ed02538
+    SUBCLASS_OF_ID = 0xcf6419dc
+    __slots__ = ('offset', 'length')
+
+    def __init__(self, offset: int, length: int):
+        """
+        Constructor for MessageEntity: Instance of either MessageEntityUnknown, MessageEntityMention, MessageEntityHashtag, MessageEntityBotCommand, MessageEntityUrl, MessageEntityEmail, MessageEntityBold, MessageEntityItalic, MessageEntityCode, MessageEntityPre, MessageEntityTextUrl, MessageEntityMentionName, InputMessageEntityMentionName, MessageEntityPhone, MessageEntityCashtag, MessageEntityUnderline, MessageEntityStrike, MessageEntityBankCard, MessageEntitySpoiler, MessageEntityCustomEmoji, MessageEntityBlockquote.
+        """
+        self.offset = offset
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEntityUrl',
+            'offset': self.offset,
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'8%\xd0n',
+            _struct_ii.pack(self.offset, self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _offset, _length = reader.read_struct(_struct_ii)
+        return cls(offset=_offset, length=_length)
+
+TypeMessageEntity = Union[MessageEntityUnknown,MessageEntityMention,MessageEntityHashtag,MessageEntityBotCommand,MessageEntityUrl,MessageEntityEmail,MessageEntityBold,MessageEntityItalic,MessageEntityCode,MessageEntityPre,MessageEntityTextUrl,MessageEntityMentionName,InputMessageEntityMentionName,MessageEntityPhone,MessageEntityCashtag,MessageEntityUnderline,MessageEntityStrike,MessageEntityBankCard,MessageEntitySpoiler,MessageEntityCustomEmoji,MessageEntityBlockquote]
@@ -0,0 +1,97 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageMedia, TypePhotoSize
+
+
+
+class MessageExtendedMedia(TLObject):
+    CONSTRUCTOR_ID = 0xee479c64
+    SUBCLASS_OF_ID = 0x9727d95d
+    __slots__ = ('media',)
+
+    def __init__(self, media: 'TypeMessageMedia'):
+        """
+        Constructor for MessageExtendedMedia: Instance of either MessageExtendedMediaPreview, MessageExtendedMedia.
+        """
+        self.media = media
+
+    def to_dict(self):
+        return {
+            '_': 'MessageExtendedMedia',
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'd\x9cG\xee',
+            self.media._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _media = reader.tgread_object()
+        return cls(media=_media)
+
+
+class MessageExtendedMediaPreview(TLObject):
+    CONSTRUCTOR_ID = 0xad628cc8
+    SUBCLASS_OF_ID = 0x9727d95d
+    __slots__ = ('w', 'h', 'thumb', 'video_duration')
+
+    def __init__(self, w: Optional[int]=None, h: Optional[int]=None, thumb: Optional['TypePhotoSize']=None, video_duration: Optional[int]=None):
+        """
+        Constructor for MessageExtendedMedia: Instance of either MessageExtendedMediaPreview, MessageExtendedMedia.
+        """
+        self.w = w
+        self.h = h
+        self.thumb = thumb
+        self.video_duration = video_duration
+
+    def to_dict(self):
+        return {
+            '_': 'MessageExtendedMediaPreview',
+            'w': self.w,
+            'h': self.h,
+            'thumb': self.thumb.to_dict() if isinstance(self.thumb, TLObject) else self.thumb,
+            'video_duration': self.video_duration
+        }
+
+    def _bytes(self):
+        assert ((self.w or self.w is not None) and (self.h or self.h is not None)) or ((self.w is None or self.w is False) and (self.h is None or self.h is False)), 'w, h parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xc8\x8cb\xad',
+            struct.pack('<I', (0 if self.w is None or self.w is False else 1) | (0 if self.h is None or self.h is False else 1) | (0 if self.thumb is None or self.thumb is False else 2) | (0 if self.video_duration is None or self.video_duration is False else 4)),
+            b'' if self.w is None or self.w is False else (struct.pack('<i', self.w)),
+            b'' if self.h is None or self.h is False else (struct.pack('<i', self.h)),
+            b'' if self.thumb is None or self.thumb is False else (self.thumb._bytes()),
+            b'' if self.video_duration is None or self.video_duration is False else (struct.pack('<i', self.video_duration)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _w = reader.read_int()
+        else:
+            _w = None
+        if flags & 1:
+            _h = reader.read_int()
+        else:
+            _h = None
+        if flags & 2:
+            _thumb = reader.tgread_object()
+        else:
+            _thumb = None
+        if flags & 4:
+            _video_duration = reader.read_int()
+        else:
+            _video_duration = None
+        return cls(w=_w, h=_h, thumb=_thumb, video_duration=_video_duration)
+
+TypeMessageExtendedMedia = Union[MessageExtendedMediaPreview,MessageExtendedMedia]
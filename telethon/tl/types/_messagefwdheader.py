@@ -0,0 +1,120 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class MessageFwdHeader(TLObject):
+    CONSTRUCTOR_ID = 0x4e4df4bb
+    SUBCLASS_OF_ID = 0x7a286804
+    __slots__ = ('date', 'imported', 'saved_out', 'from_id', 'from_name', 'channel_post', 'post_author', 'saved_from_peer', 'saved_from_msg_id', 'saved_from_id', 'saved_from_name', 'saved_date', 'psa_type')
+
+    def __init__(self, date: Optional[datetime], imported: Optional[bool]=None, saved_out: Optional[bool]=None, from_id: Optional['TypePeer']=None, from_name: Optional[str]=None, channel_post: Optional[int]=None, post_author: Optional[str]=None, saved_from_peer: Optional['TypePeer']=None, saved_from_msg_id: Optional[int]=None, saved_from_id: Optional['TypePeer']=None, saved_from_name: Optional[str]=None, saved_date: Optional[datetime]=None, psa_type: Optional[str]=None):
+        """
+        Constructor for MessageFwdHeader: Instance of MessageFwdHeader.
+        """
+        self.date = date
+        self.imported = imported
+        self.saved_out = saved_out
+        self.from_id = from_id
+        self.from_name = from_name
+        self.channel_post = channel_post
+        self.post_author = post_author
+        self.saved_from_peer = saved_from_peer
+        self.saved_from_msg_id = saved_from_msg_id
+        self.saved_from_id = saved_from_id
+        self.saved_from_name = saved_from_name
+        self.saved_date = saved_date
+        self.psa_type = psa_type
+
+    def to_dict(self):
+        return {
+            '_': 'MessageFwdHeader',
+            'date': self.date,
+            'imported': self.imported,
+            'saved_out': self.saved_out,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'from_name': self.from_name,
+            'channel_post': self.channel_post,
+            'post_author': self.post_author,
+            'saved_from_peer': self.saved_from_peer.to_dict() if isinstance(self.saved_from_peer, TLObject) else self.saved_from_peer,
+            'saved_from_msg_id': self.saved_from_msg_id,
+            'saved_from_id': self.saved_from_id.to_dict() if isinstance(self.saved_from_id, TLObject) else self.saved_from_id,
+            'saved_from_name': self.saved_from_name,
+            'saved_date': self.saved_date,
+            'psa_type': self.psa_type
+        }
+
+    def _bytes(self):
+        assert ((self.saved_from_peer or self.saved_from_peer is not None) and (self.saved_from_msg_id or self.saved_from_msg_id is not None)) or ((self.saved_from_peer is None or self.saved_from_peer is False) and (self.saved_from_msg_id is None or self.saved_from_msg_id is False)), 'saved_from_peer, saved_from_msg_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xbb\xf4MN',
+            struct.pack('<I', (0 if self.imported is None or self.imported is False else 128) | (0 if self.saved_out is None or self.saved_out is False else 2048) | (0 if self.from_id is None or self.from_id is False else 1) | (0 if self.from_name is None or self.from_name is False else 32) | (0 if self.channel_post is None or self.channel_post is False else 4) | (0 if self.post_author is None or self.post_author is False else 8) | (0 if self.saved_from_peer is None or self.saved_from_peer is False else 16) | (0 if self.saved_from_msg_id is None or self.saved_from_msg_id is False else 16) | (0 if self.saved_from_id is None or self.saved_from_id is False else 256) | (0 if self.saved_from_name is None or self.saved_from_name is False else 512) | (0 if self.saved_date is None or self.saved_date is False else 1024) | (0 if self.psa_type is None or self.psa_type is False else 64)),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            b'' if self.from_name is None or self.from_name is False else (self.serialize_bytes(self.from_name)),
+            self.serialize_datetime(self.date),
+            b'' if self.channel_post is None or self.channel_post is False else (struct.pack('<i', self.channel_post)),
+            b'' if self.post_author is None or self.post_author is False else (self.serialize_bytes(self.post_author)),
+            b'' if self.saved_from_peer is None or self.saved_from_peer is False else (self.saved_from_peer._bytes()),
+            b'' if self.saved_from_msg_id is None or self.saved_from_msg_id is False else (struct.pack('<i', self.saved_from_msg_id)),
+            b'' if self.saved_from_id is None or self.saved_from_id is False else (self.saved_from_id._bytes()),
+            b'' if self.saved_from_name is None or self.saved_from_name is False else (self.serialize_bytes(self.saved_from_name)),
+            b'' if self.saved_date is None or self.saved_date is False else (self.serialize_datetime(self.saved_date)),
+            b'' if self.psa_type is None or self.psa_type is False else (self.serialize_bytes(self.psa_type)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _imported = bool(flags & 128)
+        _saved_out = bool(flags & 2048)
+        if flags & 1:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        if flags & 32:
+            _from_name = reader.tgread_string()
+        else:
+            _from_name = None
+        _date = reader.tgread_date()
+        if flags & 4:
+            _channel_post = reader.read_int()
+        else:
+            _channel_post = None
+        if flags & 8:
+            _post_author = reader.tgread_string()
+        else:
+            _post_author = None
+        if flags & 16:
+            _saved_from_peer = reader.tgread_object()
+        else:
+            _saved_from_peer = None
+        if flags & 16:
+            _saved_from_msg_id = reader.read_int()
+        else:
+            _saved_from_msg_id = None
+        if flags & 256:
+            _saved_from_id = reader.tgread_object()
+        else:
+            _saved_from_id = None
+        if flags & 512:
+            _saved_from_name = reader.tgread_string()
+        else:
+            _saved_from_name = None
+        if flags & 1024:
+            _saved_date = reader.tgread_date()
+        else:
+            _saved_date = None
+        if flags & 64:
+            _psa_type = reader.tgread_string()
+        else:
+            _psa_type = None
+        return cls(date=_date, imported=_imported, saved_out=_saved_out, from_id=_from_id, from_name=_from_name, channel_post=_channel_post, post_author=_post_author, saved_from_peer=_saved_from_peer, saved_from_msg_id=_saved_from_msg_id, saved_from_id=_saved_from_id, saved_from_name=_saved_from_name, saved_date=_saved_date, psa_type=_psa_type)
+
+TypeMessageFwdHeader = MessageFwdHeader
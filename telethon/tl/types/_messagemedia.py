@@ -0,0 +1,816 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iii = struct.Struct('<iii')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeGame, TypeGeoPoint, TypeMessageExtendedMedia, TypePeer, TypePhoto, TypePoll, TypePollResults, TypeStoryItem, TypeWebDocument, TypeWebPage
+
+
+
+class MessageMediaContact(TLObject):
+    CONSTRUCTOR_ID = 0x70322949
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('phone_number', 'first_name', 'last_name', 'vcard', 'user_id')
+
+    def __init__(self, phone_number: str, first_name: str, last_name: str, vcard: str, user_id: int):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.phone_number = phone_number
+        self.first_name = first_name
+        self.last_name = last_name
+        self.vcard = vcard
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaContact',
+            'phone_number': self.phone_number,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'vcard': self.vcard,
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'I)2p',
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.first_name),
+            self.serialize_bytes(self.last_name),
+            self.serialize_bytes(self.vcard),
+            struct.pack('<q', self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone_number = reader.tgread_string()
+        _first_name = reader.tgread_string()
+        _last_name = reader.tgread_string()
+        _vcard = reader.tgread_string()
+        _user_id = reader.read_long()
+        return cls(phone_number=_phone_number, first_name=_first_name, last_name=_last_name, vcard=_vcard, user_id=_user_id)
+
+
+class MessageMediaDice(TLObject):
+    CONSTRUCTOR_ID = 0x3f7ee58b
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('value', 'emoticon')
+
+    def __init__(self, value: int, emoticon: str):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.value = value
+        self.emoticon = emoticon
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaDice',
+            'value': self.value,
+            'emoticon': self.emoticon
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8b\xe5~?',
+            struct.pack('<i', self.value),
+            self.serialize_bytes(self.emoticon),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _value = reader.read_int()
+        _emoticon = reader.tgread_string()
+        return cls(value=_value, emoticon=_emoticon)
+
+
+class MessageMediaDocument(TLObject):
+    CONSTRUCTOR_ID = 0x52d8ccd9
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('nopremium', 'spoiler', 'video', 'round', 'voice', 'document', 'alt_documents', 'video_cover', 'video_timestamp', 'ttl_seconds')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, nopremium: Optional[bool]=None, spoiler: Optional[bool]=None, video: Optional[bool]=None, round: Optional[bool]=None, voice: Optional[bool]=None, document: Optional['TypeDocument']=None, alt_documents: Optional[List['TypeDocument']]=None, video_cover: Optional['TypePhoto']=None, video_timestamp: Optional[int]=None, ttl_seconds: Optional[int]=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.nopremium = nopremium
+        self.spoiler = spoiler
+        self.video = video
+        self.round = round
+        self.voice = voice
+        self.document = document
+        self.alt_documents = alt_documents
+        self.video_cover = video_cover
+        self.video_timestamp = video_timestamp
+        self.ttl_seconds = ttl_seconds
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaDocument',
+            'nopremium': self.nopremium,
+            'spoiler': self.spoiler,
+            'video': self.video,
+            'round': self.round,
+            'voice': self.voice,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'alt_documents': [] if self.alt_documents is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.alt_documents],
+            'video_cover': self.video_cover.to_dict() if isinstance(self.video_cover, TLObject) else self.video_cover,
+            'video_timestamp': self.video_timestamp,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9\xcc\xd8R',
+            struct.pack('<I', (0 if self.nopremium is None or self.nopremium is False else 8) | (0 if self.spoiler is None or self.spoiler is False else 16) | (0 if self.video is None or self.video is False else 64) | (0 if self.round is None or self.round is False else 128) | (0 if self.voice is None or self.voice is False else 256) | (0 if self.document is None or self.document is False else 1) | (0 if self.alt_documents is None or self.alt_documents is False else 32) | (0 if self.video_cover is None or self.video_cover is False else 512) | (0 if self.video_timestamp is None or self.video_timestamp is False else 1024) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 4)),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+            b'' if self.alt_documents is None or self.alt_documents is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.alt_documents)),b''.join(x._bytes() for x in self.alt_documents))),
+            b'' if self.video_cover is None or self.video_cover is False else (self.video_cover._bytes()),
+            b'' if self.video_timestamp is None or self.video_timestamp is False else (struct.pack('<i', self.video_timestamp)),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _nopremium = bool(flags & 8)
+        _spoiler = bool(flags & 16)
+        _video = bool(flags & 64)
+        _round = bool(flags & 128)
+        _voice = bool(flags & 256)
+        if flags & 1:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        if flags & 32:
+            reader.read_int()
+            _alt_documents = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _alt_documents.append(_x)
+
+        else:
+            _alt_documents = None
+        if flags & 512:
+            _video_cover = reader.tgread_object()
+        else:
+            _video_cover = None
+        if flags & 1024:
+            _video_timestamp = reader.read_int()
+        else:
+            _video_timestamp = None
+        if flags & 4:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        return cls(nopremium=_nopremium, spoiler=_spoiler, video=_video, round=_round, voice=_voice, document=_document, alt_documents=_alt_documents, video_cover=_video_cover, video_timestamp=_video_timestamp, ttl_seconds=_ttl_seconds)
+
+
+class MessageMediaEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x3ded6320
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b' c\xed=',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageMediaGame(TLObject):
+    CONSTRUCTOR_ID = 0xfdb19008
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('game',)
+
+    def __init__(self, game: 'TypeGame'):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.game = game
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaGame',
+            'game': self.game.to_dict() if isinstance(self.game, TLObject) else self.game
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08\x90\xb1\xfd',
+            self.game._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _game = reader.tgread_object()
+        return cls(game=_game)
+
+
+class MessageMediaGeo(TLObject):
+    CONSTRUCTOR_ID = 0x56e0d474
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('geo',)
+
+    def __init__(self, geo: 'TypeGeoPoint'):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.geo = geo
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaGeo',
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b't\xd4\xe0V',
+            self.geo._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _geo = reader.tgread_object()
+        return cls(geo=_geo)
+
+
+class MessageMediaGeoLive(TLObject):
+    CONSTRUCTOR_ID = 0xb940c666
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('geo', 'period', 'heading', 'proximity_notification_radius')
+
+    def __init__(self, geo: 'TypeGeoPoint', period: int, heading: Optional[int]=None, proximity_notification_radius: Optional[int]=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.geo = geo
+        self.period = period
+        self.heading = heading
+        self.proximity_notification_radius = proximity_notification_radius
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaGeoLive',
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo,
+            'period': self.period,
+            'heading': self.heading,
+            'proximity_notification_radius': self.proximity_notification_radius
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'f\xc6@\xb9',
+            struct.pack('<I', (0 if self.heading is None or self.heading is False else 1) | (0 if self.proximity_notification_radius is None or self.proximity_notification_radius is False else 2)),
+            self.geo._bytes(),
+            b'' if self.heading is None or self.heading is False else (struct.pack('<i', self.heading)),
+            struct.pack('<i', self.period),
+            b'' if self.proximity_notification_radius is None or self.proximity_notification_radius is False else (struct.pack('<i', self.proximity_notification_radius)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _geo = reader.tgread_object()
+        if flags & 1:
+            _heading = reader.read_int()
+        else:
+            _heading = None
+        _period = reader.read_int()
+        if flags & 2:
+            _proximity_notification_radius = reader.read_int()
+        else:
+            _proximity_notification_radius = None
+        return cls(geo=_geo, period=_period, heading=_heading, proximity_notification_radius=_proximity_notification_radius)
+
+
+class MessageMediaGiveaway(TLObject):
+    CONSTRUCTOR_ID = 0xaa073beb
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('channels', 'quantity', 'until_date', 'only_new_subscribers', 'winners_are_visible', 'countries_iso2', 'prize_description', 'months', 'stars')
+
+    def __init__(self, channels: List[int], quantity: int, until_date: Optional[datetime], only_new_subscribers: Optional[bool]=None, winners_are_visible: Optional[bool]=None, countries_iso2: Optional[List[str]]=None, prize_description: Optional[str]=None, months: Optional[int]=None, stars: Optional[int]=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.channels = channels
+        self.quantity = quantity
+        self.until_date = until_date
+        self.only_new_subscribers = only_new_subscribers
+        self.winners_are_visible = winners_are_visible
+        self.countries_iso2 = countries_iso2
+        self.prize_description = prize_description
+        self.months = months
+        self.stars = stars
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaGiveaway',
+            'channels': [] if self.channels is None else self.channels[:],
+            'quantity': self.quantity,
+            'until_date': self.until_date,
+            'only_new_subscribers': self.only_new_subscribers,
+            'winners_are_visible': self.winners_are_visible,
+            'countries_iso2': [] if self.countries_iso2 is None else self.countries_iso2[:],
+            'prize_description': self.prize_description,
+            'months': self.months,
+            'stars': self.stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeb;\x07\xaa',
+            struct.pack('<I', (0 if self.only_new_subscribers is None or self.only_new_subscribers is False else 1) | (0 if self.winners_are_visible is None or self.winners_are_visible is False else 4) | (0 if self.countries_iso2 is None or self.countries_iso2 is False else 2) | (0 if self.prize_description is None or self.prize_description is False else 8) | (0 if self.months is None or self.months is False else 16) | (0 if self.stars is None or self.stars is False else 32)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.channels)), len(self.channels), *self.channels),
+            b'' if self.countries_iso2 is None or self.countries_iso2 is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.countries_iso2)),b''.join(self.serialize_bytes(x) for x in self.countries_iso2))),
+            b'' if self.prize_description is None or self.prize_description is False else (self.serialize_bytes(self.prize_description)),
+            struct.pack('<i', self.quantity),
+            b'' if self.months is None or self.months is False else (struct.pack('<i', self.months)),
+            b'' if self.stars is None or self.stars is False else (struct.pack('<q', self.stars)),
+            self.serialize_datetime(self.until_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _only_new_subscribers = bool(flags & 1)
+        _winners_are_visible = bool(flags & 4)
+        reader.read_int()
+        _channels = reader.read_array('q', reader.read_int())
+        if flags & 2:
+            reader.read_int()
+            _countries_iso2 = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_string()
+                _countries_iso2.append(_x)
+
+        else:
+            _countries_iso2 = None
+        if flags & 8:
+            _prize_description = reader.tgread_string()
+        else:
+            _prize_description = None
+        _quantity = reader.read_int()
+        if flags & 16:
+            _months = reader.read_int()
+        else:
+            _months = None
+        if flags & 32:
+            _stars = reader.read_long()
+        else:
+            _stars = None
+        _until_date = reader.tgread_date()
+        return cls(channels=_channels, quantity=_quantity, until_date=_until_date, only_new_subscribers=_only_new_subscribers, winners_are_visible=_winners_are_visible, countries_iso2=_countries_iso2, prize_description=_prize_description, months=_months, stars=_stars)
+
+
+class MessageMediaGiveawayResults(TLObject):
+    CONSTRUCTOR_ID = 0xceaa3ea1
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('channel_id', 'launch_msg_id', 'winners_count', 'unclaimed_count', 'winners', 'until_date', 'only_new_subscribers', 'refunded', 'additional_peers_count', 'months', 'stars', 'prize_description')
+
+    def __init__(self, channel_id: int, launch_msg_id: int, winners_count: int, unclaimed_count: int, winners: List[int], until_date: Optional[datetime], only_new_subscribers: Optional[bool]=None, refunded: Optional[bool]=None, additional_peers_count: Optional[int]=None, months: Optional[int]=None, stars: Optional[int]=None, prize_description: Optional[str]=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.channel_id = channel_id
+        self.launch_msg_id = launch_msg_id
+        self.winners_count = winners_count
+        self.unclaimed_count = unclaimed_count
+        self.winners = winners
+        self.until_date = until_date
+        self.only_new_subscribers = only_new_subscribers
+        self.refunded = refunded
+        self.additional_peers_count = additional_peers_count
+        self.months = months
+        self.stars = stars
+        self.prize_description = prize_description
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaGiveawayResults',
+            'channel_id': self.channel_id,
+            'launch_msg_id': self.launch_msg_id,
+            'winners_count': self.winners_count,
+            'unclaimed_count': self.unclaimed_count,
+            'winners': [] if self.winners is None else self.winners[:],
+            'until_date': self.until_date,
+            'only_new_subscribers': self.only_new_subscribers,
+            'refunded': self.refunded,
+            'additional_peers_count': self.additional_peers_count,
+            'months': self.months,
+            'stars': self.stars,
+            'prize_description': self.prize_description
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa1>\xaa\xce',
+            _struct_Iq.pack((0 if self.only_new_subscribers is None or self.only_new_subscribers is False else 1) | (0 if self.refunded is None or self.refunded is False else 4) | (0 if self.additional_peers_count is None or self.additional_peers_count is False else 8) | (0 if self.months is None or self.months is False else 16) | (0 if self.stars is None or self.stars is False else 32) | (0 if self.prize_description is None or self.prize_description is False else 2), self.channel_id),
+            b'' if self.additional_peers_count is None or self.additional_peers_count is False else (struct.pack('<i', self.additional_peers_count)),
+            _struct_iii.pack(self.launch_msg_id, self.winners_count, self.unclaimed_count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.winners)), len(self.winners), *self.winners),
+            b'' if self.months is None or self.months is False else (struct.pack('<i', self.months)),
+            b'' if self.stars is None or self.stars is False else (struct.pack('<q', self.stars)),
+            b'' if self.prize_description is None or self.prize_description is False else (self.serialize_bytes(self.prize_description)),
+            self.serialize_datetime(self.until_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _channel_id = reader.read_struct(_struct_iq)
+        _only_new_subscribers = bool(flags & 1)
+        _refunded = bool(flags & 4)
+        if flags & 8:
+            _additional_peers_count = reader.read_int()
+        else:
+            _additional_peers_count = None
+        _launch_msg_id, _winners_count, _unclaimed_count = reader.read_struct(_struct_iii)
+        reader.read_int()
+        _winners = reader.read_array('q', reader.read_int())
+        if flags & 16:
+            _months = reader.read_int()
+        else:
+            _months = None
+        if flags & 32:
+            _stars = reader.read_long()
+        else:
+            _stars = None
+        if flags & 2:
+            _prize_description = reader.tgread_string()
+        else:
+            _prize_description = None
+        _until_date = reader.tgread_date()
+        return cls(channel_id=_channel_id, launch_msg_id=_launch_msg_id, winners_count=_winners_count, unclaimed_count=_unclaimed_count, winners=_winners, until_date=_until_date, only_new_subscribers=_only_new_subscribers, refunded=_refunded, additional_peers_count=_additional_peers_count, months=_months, stars=_stars, prize_description=_prize_description)
+
+
+class MessageMediaInvoice(TLObject):
+    CONSTRUCTOR_ID = 0xf6a548d3
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('title', 'description', 'currency', 'total_amount', 'start_param', 'shipping_address_requested', 'test', 'photo', 'receipt_msg_id', 'extended_media')
+
+    def __init__(self, title: str, description: str, currency: str, total_amount: int, start_param: str, shipping_address_requested: Optional[bool]=None, test: Optional[bool]=None, photo: Optional['TypeWebDocument']=None, receipt_msg_id: Optional[int]=None, extended_media: Optional['TypeMessageExtendedMedia']=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.title = title
+        self.description = description
+        self.currency = currency
+        self.total_amount = total_amount
+        self.start_param = start_param
+        self.shipping_address_requested = shipping_address_requested
+        self.test = test
+        self.photo = photo
+        self.receipt_msg_id = receipt_msg_id
+        self.extended_media = extended_media
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaInvoice',
+            'title': self.title,
+            'description': self.description,
+            'currency': self.currency,
+            'total_amount': self.total_amount,
+            'start_param': self.start_param,
+            'shipping_address_requested': self.shipping_address_requested,
+            'test': self.test,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'receipt_msg_id': self.receipt_msg_id,
+            'extended_media': self.extended_media.to_dict() if isinstance(self.extended_media, TLObject) else self.extended_media
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3H\xa5\xf6',
+            struct.pack('<I', (0 if self.shipping_address_requested is None or self.shipping_address_requested is False else 2) | (0 if self.test is None or self.test is False else 8) | (0 if self.photo is None or self.photo is False else 1) | (0 if self.receipt_msg_id is None or self.receipt_msg_id is False else 4) | (0 if self.extended_media is None or self.extended_media is False else 16)),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.receipt_msg_id is None or self.receipt_msg_id is False else (struct.pack('<i', self.receipt_msg_id)),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.total_amount),
+            self.serialize_bytes(self.start_param),
+            b'' if self.extended_media is None or self.extended_media is False else (self.extended_media._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _shipping_address_requested = bool(flags & 2)
+        _test = bool(flags & 8)
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 1:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 4:
+            _receipt_msg_id = reader.read_int()
+        else:
+            _receipt_msg_id = None
+        _currency = reader.tgread_string()
+        _total_amount = reader.read_long()
+        _start_param = reader.tgread_string()
+        if flags & 16:
+            _extended_media = reader.tgread_object()
+        else:
+            _extended_media = None
+        return cls(title=_title, description=_description, currency=_currency, total_amount=_total_amount, start_param=_start_param, shipping_address_requested=_shipping_address_requested, test=_test, photo=_photo, receipt_msg_id=_receipt_msg_id, extended_media=_extended_media)
+
+
+class MessageMediaPaidMedia(TLObject):
+    CONSTRUCTOR_ID = 0xa8852491
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('stars_amount', 'extended_media')
+
+    def __init__(self, stars_amount: int, extended_media: List['TypeMessageExtendedMedia']):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.stars_amount = stars_amount
+        self.extended_media = extended_media
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaPaidMedia',
+            'stars_amount': self.stars_amount,
+            'extended_media': [] if self.extended_media is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.extended_media]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x91$\x85\xa8',
+            struct.pack('<q', self.stars_amount),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.extended_media)),b''.join(x._bytes() for x in self.extended_media),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stars_amount = reader.read_long()
+        reader.read_int()
+        _extended_media = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _extended_media.append(_x)
+
+        return cls(stars_amount=_stars_amount, extended_media=_extended_media)
+
+
+class MessageMediaPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x695150d7
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('spoiler', 'photo', 'ttl_seconds')
+
+    def __init__(self, spoiler: Optional[bool]=None, photo: Optional['TypePhoto']=None, ttl_seconds: Optional[int]=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.spoiler = spoiler
+        self.photo = photo
+        self.ttl_seconds = ttl_seconds
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaPhoto',
+            'spoiler': self.spoiler,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd7PQi',
+            struct.pack('<I', (0 if self.spoiler is None or self.spoiler is False else 8) | (0 if self.photo is None or self.photo is False else 1) | (0 if self.ttl_seconds is None or self.ttl_seconds is False else 4)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.ttl_seconds is None or self.ttl_seconds is False else (struct.pack('<i', self.ttl_seconds)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _spoiler = bool(flags & 8)
+        if flags & 1:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 4:
+            _ttl_seconds = reader.read_int()
+        else:
+            _ttl_seconds = None
+        return cls(spoiler=_spoiler, photo=_photo, ttl_seconds=_ttl_seconds)
+
+
+class MessageMediaPoll(TLObject):
+    CONSTRUCTOR_ID = 0x4bd6e798
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('poll', 'results')
+
+    def __init__(self, poll: 'TypePoll', results: 'TypePollResults'):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.poll = poll
+        self.results = results
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaPoll',
+            'poll': self.poll.to_dict() if isinstance(self.poll, TLObject) else self.poll,
+            'results': self.results.to_dict() if isinstance(self.results, TLObject) else self.results
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x98\xe7\xd6K',
+            self.poll._bytes(),
+            self.results._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _poll = reader.tgread_object()
+        _results = reader.tgread_object()
+        return cls(poll=_poll, results=_results)
+
+
+class MessageMediaStory(TLObject):
+    CONSTRUCTOR_ID = 0x68cb6283
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('peer', 'id', 'via_mention', 'story')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, peer: 'TypePeer', id: int, via_mention: Optional[bool]=None, story: Optional['TypeStoryItem']=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.peer = peer
+        self.id = id
+        self.via_mention = via_mention
+        self.story = story
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaStory',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'id': self.id,
+            'via_mention': self.via_mention,
+            'story': self.story.to_dict() if isinstance(self.story, TLObject) else self.story
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x83b\xcbh',
+            struct.pack('<I', (0 if self.via_mention is None or self.via_mention is False else 2) | (0 if self.story is None or self.story is False else 1)),
+            self.peer._bytes(),
+            struct.pack('<i', self.id),
+            b'' if self.story is None or self.story is False else (self.story._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _via_mention = bool(flags & 2)
+        _peer = reader.tgread_object()
+        _id = reader.read_int()
+        if flags & 1:
+            _story = reader.tgread_object()
+        else:
+            _story = None
+        return cls(peer=_peer, id=_id, via_mention=_via_mention, story=_story)
+
+
+class MessageMediaUnsupported(TLObject):
+    CONSTRUCTOR_ID = 0x9f84f49e
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaUnsupported'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9e\xf4\x84\x9f',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class MessageMediaVenue(TLObject):
+    CONSTRUCTOR_ID = 0x2ec0533f
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('geo', 'title', 'address', 'provider', 'venue_id', 'venue_type')
+
+    def __init__(self, geo: 'TypeGeoPoint', title: str, address: str, provider: str, venue_id: str, venue_type: str):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.geo = geo
+        self.title = title
+        self.address = address
+        self.provider = provider
+        self.venue_id = venue_id
+        self.venue_type = venue_type
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaVenue',
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo,
+            'title': self.title,
+            'address': self.address,
+            'provider': self.provider,
+            'venue_id': self.venue_id,
+            'venue_type': self.venue_type
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?S\xc0.',
+            self.geo._bytes(),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.address),
+            self.serialize_bytes(self.provider),
+            self.serialize_bytes(self.venue_id),
+            self.serialize_bytes(self.venue_type),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _geo = reader.tgread_object()
+        _title = reader.tgread_string()
+        _address = reader.tgread_string()
+        _provider = reader.tgread_string()
+        _venue_id = reader.tgread_string()
+        _venue_type = reader.tgread_string()
+        return cls(geo=_geo, title=_title, address=_address, provider=_provider, venue_id=_venue_id, venue_type=_venue_type)
+
+
+class MessageMediaWebPage(TLObject):
+    CONSTRUCTOR_ID = 0xddf10c3b
+    SUBCLASS_OF_ID = 0x476cbe32
+    __slots__ = ('webpage', 'force_large_media', 'force_small_media', 'manual', 'safe')
+
+    def __init__(self, webpage: 'TypeWebPage', force_large_media: Optional[bool]=None, force_small_media: Optional[bool]=None, manual: Optional[bool]=None, safe: Optional[bool]=None):
+        """
+        Constructor for MessageMedia: Instance of either MessageMediaEmpty, MessageMediaPhoto, MessageMediaGeo, MessageMediaContact, MessageMediaUnsupported, MessageMediaDocument, MessageMediaWebPage, MessageMediaVenue, MessageMediaGame, MessageMediaInvoice, MessageMediaGeoLive, MessageMediaPoll, MessageMediaDice, MessageMediaStory, MessageMediaGiveaway, MessageMediaGiveawayResults, MessageMediaPaidMedia.
+        """
+        self.webpage = webpage
+        self.force_large_media = force_large_media
+        self.force_small_media = force_small_media
+        self.manual = manual
+        self.safe = safe
+
+    def to_dict(self):
+        return {
+            '_': 'MessageMediaWebPage',
+            'webpage': self.webpage.to_dict() if isinstance(self.webpage, TLObject) else self.webpage,
+            'force_large_media': self.force_large_media,
+            'force_small_media': self.force_small_media,
+            'manual': self.manual,
+            'safe': self.safe
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';\x0c\xf1\xdd',
+            struct.pack('<I', (0 if self.force_large_media is None or self.force_large_media is False else 1) | (0 if self.force_small_media is None or self.force_small_media is False else 2) | (0 if self.manual is None or self.manual is False else 8) | (0 if self.safe is None or self.safe is False else 16)),
+            self.webpage._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _force_large_media = bool(flags & 1)
+        _force_small_media = bool(flags & 2)
+        _manual = bool(flags & 8)
+        _safe = bool(flags & 16)
+        _webpage = reader.tgread_object()
+        return cls(webpage=_webpage, force_large_media=_force_large_media, force_small_media=_force_small_media, manual=_manual, safe=_safe)
+
+TypeMessageMedia = Union[MessageMediaEmpty,MessageMediaPhoto,MessageMediaGeo,MessageMediaContact,MessageMediaUnsupported,MessageMediaDocument,MessageMediaWebPage,MessageMediaVenue,MessageMediaGame,MessageMediaInvoice,MessageMediaGeoLive,MessageMediaPoll,MessageMediaDice,MessageMediaStory,MessageMediaGiveaway,MessageMediaGiveawayResults,MessageMediaPaidMedia]
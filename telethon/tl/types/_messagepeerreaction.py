@@ -0,0 +1,60 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer, TypeReaction
+
+
+
+class MessagePeerReaction(TLObject):
+    CONSTRUCTOR_ID = 0x8c79b63c
+    SUBCLASS_OF_ID = 0xaf73a2a5
+    __slots__ = ('peer_id', 'date', 'reaction', 'big', 'unread', 'my')
+
+    def __init__(self, peer_id: 'TypePeer', date: Optional[datetime], reaction: 'TypeReaction', big: Optional[bool]=None, unread: Optional[bool]=None, my: Optional[bool]=None):
+        """
+        Constructor for MessagePeerReaction: Instance of MessagePeerReaction.
+        """
+        self.peer_id = peer_id
+        self.date = date
+        self.reaction = reaction
+        self.big = big
+        self.unread = unread
+        self.my = my
+
+    def to_dict(self):
+        return {
+            '_': 'MessagePeerReaction',
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'date': self.date,
+            'reaction': self.reaction.to_dict() if isinstance(self.reaction, TLObject) else self.reaction,
+            'big': self.big,
+            'unread': self.unread,
+            'my': self.my
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'<\xb6y\x8c',
+            struct.pack('<I', (0 if self.big is None or self.big is False else 1) | (0 if self.unread is None or self.unread is False else 2) | (0 if self.my is None or self.my is False else 4)),
+            self.peer_id._bytes(),
+            self.serialize_datetime(self.date),
+            self.reaction._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _big = bool(flags & 1)
+        _unread = bool(flags & 2)
+        _my = bool(flags & 4)
+        _peer_id = reader.tgread_object()
+        _date = reader.tgread_date()
+        _reaction = reader.tgread_object()
+        return cls(peer_id=_peer_id, date=_date, reaction=_reaction, big=_big, unread=_unread, my=_my)
+
+TypeMessagePeerReaction = MessagePeerReaction
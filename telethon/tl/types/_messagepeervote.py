@@ -0,0 +1,123 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class MessagePeerVote(TLObject):
+    CONSTRUCTOR_ID = 0xb6cc2d5c
+    SUBCLASS_OF_ID = 0x85c27202
+    __slots__ = ('peer', 'option', 'date')
+
+    def __init__(self, peer: 'TypePeer', option: bytes, date: Optional[datetime]):
+        """
+        Constructor for MessagePeerVote: Instance of either MessagePeerVote, MessagePeerVoteInputOption, MessagePeerVoteMultiple.
+        """
+        self.peer = peer
+        self.option = option
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'MessagePeerVote',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'option': self.option,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\-\xcc\xb6',
+            self.peer._bytes(),
+            self.serialize_bytes(self.option),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _option = reader.tgread_bytes()
+        _date = reader.tgread_date()
+        return cls(peer=_peer, option=_option, date=_date)
+
+
+class MessagePeerVoteInputOption(TLObject):
+    CONSTRUCTOR_ID = 0x74cda504
+    SUBCLASS_OF_ID = 0x85c27202
+    __slots__ = ('peer', 'date')
+
+    def __init__(self, peer: 'TypePeer', date: Optional[datetime]):
+        """
+        Constructor for MessagePeerVote: Instance of either MessagePeerVote, MessagePeerVoteInputOption, MessagePeerVoteMultiple.
+        """
+        self.peer = peer
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'MessagePeerVoteInputOption',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x04\xa5\xcdt',
+            self.peer._bytes(),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _date = reader.tgread_date()
+        return cls(peer=_peer, date=_date)
+
+
+class MessagePeerVoteMultiple(TLObject):
+    CONSTRUCTOR_ID = 0x4628f6e6
+    SUBCLASS_OF_ID = 0x85c27202
+    __slots__ = ('peer', 'options', 'date')
+
+    def __init__(self, peer: 'TypePeer', options: List[bytes], date: Optional[datetime]):
+        """
+        Constructor for MessagePeerVote: Instance of either MessagePeerVote, MessagePeerVoteInputOption, MessagePeerVoteMultiple.
+        """
+        self.peer = peer
+        self.options = options
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'MessagePeerVoteMultiple',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'options': [] if self.options is None else self.options[:],
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe6\xf6(F',
+            self.peer._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.options)),b''.join(self.serialize_bytes(x) for x in self.options),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        reader.read_int()
+        _options = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_bytes()
+            _options.append(_x)
+
+        _date = reader.tgread_date()
+        return cls(peer=_peer, options=_options, date=_date)
+
+TypeMessagePeerVote = Union[MessagePeerVote,MessagePeerVoteInputOption,MessagePeerVoteMultiple]
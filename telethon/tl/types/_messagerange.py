@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class MessageRange(TLObject):
+    CONSTRUCTOR_ID = 0xae30253
+    SUBCLASS_OF_ID = 0xbec74577
+    __slots__ = ('min_id', 'max_id')
+
+    def __init__(self, min_id: int, max_id: int):
+        """
+        Constructor for MessageRange: Instance of MessageRange.
+        """
+        self.min_id = min_id
+        self.max_id = max_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageRange',
+            'min_id': self.min_id,
+            'max_id': self.max_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'S\x02\xe3\n',
+            _struct_ii.pack(self.min_id, self.max_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _min_id, _max_id = reader.read_struct(_struct_ii)
+        return cls(min_id=_min_id, max_id=_max_id)
+
+TypeMessageRange = MessageRange
@@ -0,0 +1,82 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessagePeerReaction, TypeMessageReactor, TypeReactionCount
+
+
+
+class MessageReactions(TLObject):
+    CONSTRUCTOR_ID = 0xa339f0b
+    SUBCLASS_OF_ID = 0x8a5b071c
+    __slots__ = ('results', 'min', 'can_see_list', 'reactions_as_tags', 'recent_reactions', 'top_reactors')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, results: List['TypeReactionCount'], min: Optional[bool]=None, can_see_list: Optional[bool]=None, reactions_as_tags: Optional[bool]=None, recent_reactions: Optional[List['TypeMessagePeerReaction']]=None, top_reactors: Optional[List['TypeMessageReactor']]=None):
+        """
+        Constructor for MessageReactions: Instance of MessageReactions.
+        """
+        self.results = results
+        self.min = min
+        self.can_see_list = can_see_list
+        self.reactions_as_tags = reactions_as_tags
+        self.recent_reactions = recent_reactions
+        self.top_reactors = top_reactors
+
+    def to_dict(self):
+        return {
+            '_': 'MessageReactions',
+            'results': [] if self.results is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.results],
+            'min': self.min,
+            'can_see_list': self.can_see_list,
+            'reactions_as_tags': self.reactions_as_tags,
+            'recent_reactions': [] if self.recent_reactions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.recent_reactions],
+            'top_reactors': [] if self.top_reactors is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.top_reactors]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\x9f3\n',
+            struct.pack('<I', (0 if self.min is None or self.min is False else 1) | (0 if self.can_see_list is None or self.can_see_list is False else 4) | (0 if self.reactions_as_tags is None or self.reactions_as_tags is False else 8) | (0 if self.recent_reactions is None or self.recent_reactions is False else 2) | (0 if self.top_reactors is None or self.top_reactors is False else 16)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.results)),b''.join(x._bytes() for x in self.results),
+            b'' if self.recent_reactions is None or self.recent_reactions is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.recent_reactions)),b''.join(x._bytes() for x in self.recent_reactions))),
+            b'' if self.top_reactors is None or self.top_reactors is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.top_reactors)),b''.join(x._bytes() for x in self.top_reactors))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _min = bool(flags & 1)
+        _can_see_list = bool(flags & 4)
+        _reactions_as_tags = bool(flags & 8)
+        reader.read_int()
+        _results = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _results.append(_x)
+
+        if flags & 2:
+            reader.read_int()
+            _recent_reactions = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _recent_reactions.append(_x)
+
+        else:
+            _recent_reactions = None
+        if flags & 16:
+            reader.read_int()
+            _top_reactors = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _top_reactors.append(_x)
+
+        else:
+            _top_reactors = None
+        return cls(results=_results, min=_min, can_see_list=_can_see_list, reactions_as_tags=_reactions_as_tags, recent_reactions=_recent_reactions, top_reactors=_top_reactors)
+
+TypeMessageReactions = MessageReactions
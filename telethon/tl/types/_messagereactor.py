@@ -0,0 +1,59 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class MessageReactor(TLObject):
+    CONSTRUCTOR_ID = 0x4ba3a95a
+    SUBCLASS_OF_ID = 0xf0381ab9
+    __slots__ = ('count', 'top', 'my', 'anonymous', 'peer_id')
+
+    def __init__(self, count: int, top: Optional[bool]=None, my: Optional[bool]=None, anonymous: Optional[bool]=None, peer_id: Optional['TypePeer']=None):
+        """
+        Constructor for MessageReactor: Instance of MessageReactor.
+        """
+        self.count = count
+        self.top = top
+        self.my = my
+        self.anonymous = anonymous
+        self.peer_id = peer_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageReactor',
+            'count': self.count,
+            'top': self.top,
+            'my': self.my,
+            'anonymous': self.anonymous,
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Z\xa9\xa3K',
+            struct.pack('<I', (0 if self.top is None or self.top is False else 1) | (0 if self.my is None or self.my is False else 2) | (0 if self.anonymous is None or self.anonymous is False else 4) | (0 if self.peer_id is None or self.peer_id is False else 8)),
+            b'' if self.peer_id is None or self.peer_id is False else (self.peer_id._bytes()),
+            struct.pack('<i', self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _top = bool(flags & 1)
+        _my = bool(flags & 2)
+        _anonymous = bool(flags & 4)
+        if flags & 8:
+            _peer_id = reader.tgread_object()
+        else:
+            _peer_id = None
+        _count = reader.read_int()
+        return cls(count=_count, top=_top, my=_my, anonymous=_anonymous, peer_id=_peer_id)
+
+TypeMessageReactor = MessageReactor
@@ -0,0 +1,82 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iii = struct.Struct('<Iii')
+_struct_iii = struct.Struct('<iii')
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class MessageReplies(TLObject):
+    CONSTRUCTOR_ID = 0x83d60fc2
+    SUBCLASS_OF_ID = 0x6ccd5ce2
+    __slots__ = ('replies', 'replies_pts', 'comments', 'recent_repliers', 'channel_id', 'max_id', 'read_max_id')
+
+    def __init__(self, replies: int, replies_pts: int, comments: Optional[bool]=None, recent_repliers: Optional[List['TypePeer']]=None, channel_id: Optional[int]=None, max_id: Optional[int]=None, read_max_id: Optional[int]=None):
+        """
+        Constructor for MessageReplies: Instance of MessageReplies.
+        """
+        self.replies = replies
+        self.replies_pts = replies_pts
+        self.comments = comments
+        self.recent_repliers = recent_repliers
+        self.channel_id = channel_id
+        self.max_id = max_id
+        self.read_max_id = read_max_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageReplies',
+            'replies': self.replies,
+            'replies_pts': self.replies_pts,
+            'comments': self.comments,
+            'recent_repliers': [] if self.recent_repliers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.recent_repliers],
+            'channel_id': self.channel_id,
+            'max_id': self.max_id,
+            'read_max_id': self.read_max_id
+        }
+
+    def _bytes(self):
+        assert ((self.comments or self.comments is not None) and (self.channel_id or self.channel_id is not None)) or ((self.comments is None or self.comments is False) and (self.channel_id is None or self.channel_id is False)), 'comments, channel_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xc2\x0f\xd6\x83',
+            _struct_Iii.pack((0 if self.comments is None or self.comments is False else 1) | (0 if self.recent_repliers is None or self.recent_repliers is False else 2) | (0 if self.channel_id is None or self.channel_id is False else 1) | (0 if self.max_id is None or self.max_id is False else 4) | (0 if self.read_max_id is None or self.read_max_id is False else 8), self.replies, self.replies_pts),
+            b'' if self.recent_repliers is None or self.recent_repliers is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.recent_repliers)),b''.join(x._bytes() for x in self.recent_repliers))),
+            b'' if self.channel_id is None or self.channel_id is False else (struct.pack('<q', self.channel_id)),
+            b'' if self.max_id is None or self.max_id is False else (struct.pack('<i', self.max_id)),
+            b'' if self.read_max_id is None or self.read_max_id is False else (struct.pack('<i', self.read_max_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _replies, _replies_pts = reader.read_struct(_struct_iii)
+        _comments = bool(flags & 1)
+        if flags & 2:
+            reader.read_int()
+            _recent_repliers = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _recent_repliers.append(_x)
+
+        else:
+            _recent_repliers = None
+        if flags & 1:
+            _channel_id = reader.read_long()
+        else:
+            _channel_id = None
+        if flags & 4:
+            _max_id = reader.read_int()
+        else:
+            _max_id = None
+        if flags & 8:
+            _read_max_id = reader.read_int()
+        else:
+            _read_max_id = None
+        return cls(replies=_replies, replies_pts=_replies_pts, comments=_comments, recent_repliers=_recent_repliers, channel_id=_channel_id, max_id=_max_id, read_max_id=_read_max_id)
+
+TypeMessageReplies = MessageReplies
@@ -0,0 +1,142 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity, TypeMessageFwdHeader, TypeMessageMedia, TypePeer
+
+
+
+class MessageReplyHeader(TLObject):
+    CONSTRUCTOR_ID = 0xafbc09db
+    SUBCLASS_OF_ID = 0x5b4d9167
+    __slots__ = ('reply_to_scheduled', 'forum_topic', 'quote', 'reply_to_msg_id', 'reply_to_peer_id', 'reply_from', 'reply_media', 'reply_to_top_id', 'quote_text', 'quote_entities', 'quote_offset')
+
+    def __init__(self, reply_to_scheduled: Optional[bool]=None, forum_topic: Optional[bool]=None, quote: Optional[bool]=None, reply_to_msg_id: Optional[int]=None, reply_to_peer_id: Optional['TypePeer']=None, reply_from: Optional['TypeMessageFwdHeader']=None, reply_media: Optional['TypeMessageMedia']=None, reply_to_top_id: Optional[int]=None, quote_text: Optional[str]=None, quote_entities: Optional[List['TypeMessageEntity']]=None, quote_offset: Optional[int]=None):
+        """
+        Constructor for MessageReplyHeader: Instance of either MessageReplyHeader, MessageReplyStoryHeader.
+        """
+        self.reply_to_scheduled = reply_to_scheduled
+        self.forum_topic = forum_topic
+        self.quote = quote
+        self.reply_to_msg_id = reply_to_msg_id
+        self.reply_to_peer_id = reply_to_peer_id
+        self.reply_from = reply_from
+        self.reply_media = reply_media
+        self.reply_to_top_id = reply_to_top_id
+        self.quote_text = quote_text
+        self.quote_entities = quote_entities
+        self.quote_offset = quote_offset
+
+    def to_dict(self):
+        return {
+            '_': 'MessageReplyHeader',
+            'reply_to_scheduled': self.reply_to_scheduled,
+            'forum_topic': self.forum_topic,
+            'quote': self.quote,
+            'reply_to_msg_id': self.reply_to_msg_id,
+            'reply_to_peer_id': self.reply_to_peer_id.to_dict() if isinstance(self.reply_to_peer_id, TLObject) else self.reply_to_peer_id,
+            'reply_from': self.reply_from.to_dict() if isinstance(self.reply_from, TLObject) else self.reply_from,
+            'reply_media': self.reply_media.to_dict() if isinstance(self.reply_media, TLObject) else self.reply_media,
+            'reply_to_top_id': self.reply_to_top_id,
+            'quote_text': self.quote_text,
+            'quote_entities': [] if self.quote_entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.quote_entities],
+            'quote_offset': self.quote_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdb\t\xbc\xaf',
+            struct.pack('<I', (0 if self.reply_to_scheduled is None or self.reply_to_scheduled is False else 4) | (0 if self.forum_topic is None or self.forum_topic is False else 8) | (0 if self.quote is None or self.quote is False else 512) | (0 if self.reply_to_msg_id is None or self.reply_to_msg_id is False else 16) | (0 if self.reply_to_peer_id is None or self.reply_to_peer_id is False else 1) | (0 if self.reply_from is None or self.reply_from is False else 32) | (0 if self.reply_media is None or self.reply_media is False else 256) | (0 if self.reply_to_top_id is None or self.reply_to_top_id is False else 2) | (0 if self.quote_text is None or self.quote_text is False else 64) | (0 if self.quote_entities is None or self.quote_entities is False else 128) | (0 if self.quote_offset is None or self.quote_offset is False else 1024)),
+            b'' if self.reply_to_msg_id is None or self.reply_to_msg_id is False else (struct.pack('<i', self.reply_to_msg_id)),
+            b'' if self.reply_to_peer_id is None or self.reply_to_peer_id is False else (self.reply_to_peer_id._bytes()),
+            b'' if self.reply_from is None or self.reply_from is False else (self.reply_from._bytes()),
+            b'' if self.reply_media is None or self.reply_media is False else (self.reply_media._bytes()),
+            b'' if self.reply_to_top_id is None or self.reply_to_top_id is False else (struct.pack('<i', self.reply_to_top_id)),
+            b'' if self.quote_text is None or self.quote_text is False else (self.serialize_bytes(self.quote_text)),
+            b'' if self.quote_entities is None or self.quote_entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.quote_entities)),b''.join(x._bytes() for x in self.quote_entities))),
+            b'' if self.quote_offset is None or self.quote_offset is False else (struct.pack('<i', self.quote_offset)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _reply_to_scheduled = bool(flags & 4)
+        _forum_topic = bool(flags & 8)
+        _quote = bool(flags & 512)
+        if flags & 16:
+            _reply_to_msg_id = reader.read_int()
+        else:
+            _reply_to_msg_id = None
+        if flags & 1:
+            _reply_to_peer_id = reader.tgread_object()
+        else:
+            _reply_to_peer_id = None
+        if flags & 32:
+            _reply_from = reader.tgread_object()
+        else:
+            _reply_from = None
+        if flags & 256:
+            _reply_media = reader.tgread_object()
+        else:
+            _reply_media = None
+        if flags & 2:
+            _reply_to_top_id = reader.read_int()
+        else:
+            _reply_to_top_id = None
+        if flags & 64:
+            _quote_text = reader.tgread_string()
+        else:
+            _quote_text = None
+        if flags & 128:
+            reader.read_int()
+            _quote_entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _quote_entities.append(_x)
+
+        else:
+            _quote_entities = None
+        if flags & 1024:
+            _quote_offset = reader.read_int()
+        else:
+            _quote_offset = None
+        return cls(reply_to_scheduled=_reply_to_scheduled, forum_topic=_forum_topic, quote=_quote, reply_to_msg_id=_reply_to_msg_id, reply_to_peer_id=_reply_to_peer_id, reply_from=_reply_from, reply_media=_reply_media, reply_to_top_id=_reply_to_top_id, quote_text=_quote_text, quote_entities=_quote_entities, quote_offset=_quote_offset)
+
+
+class MessageReplyStoryHeader(TLObject):
+    CONSTRUCTOR_ID = 0xe5af939
+    SUBCLASS_OF_ID = 0x5b4d9167
+    __slots__ = ('peer', 'story_id')
+
+    def __init__(self, peer: 'TypePeer', story_id: int):
+        """
+        Constructor for MessageReplyHeader: Instance of either MessageReplyHeader, MessageReplyStoryHeader.
+        """
+        self.peer = peer
+        self.story_id = story_id
+
+    def to_dict(self):
+        return {
+            '_': 'MessageReplyStoryHeader',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'story_id': self.story_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'9\xf9Z\x0e',
+            self.peer._bytes(),
+            struct.pack('<i', self.story_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _story_id = reader.read_int()
+        return cls(peer=_peer, story_id=_story_id)
+
+TypeMessageReplyHeader = Union[MessageReplyHeader,MessageReplyStoryHeader]
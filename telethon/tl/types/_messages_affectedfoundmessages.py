@@ -0,0 +1,47 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iii = struct.Struct('<iii')
+
+
+class AffectedFoundMessages(TLObject):
+    CONSTRUCTOR_ID = 0xef8d3e6c
+    SUBCLASS_OF_ID = 0xf817652e
+    __slots__ = ('pts', 'pts_count', 'offset', 'messages')
+
+    def __init__(self, pts: int, pts_count: int, offset: int, messages: List[int]):
+        """
+        Constructor for messages.AffectedFoundMessages: Instance of AffectedFoundMessages.
+        """
+        self.pts = pts
+        self.pts_count = pts_count
+        self.offset = offset
+        self.messages = messages
+
+    def to_dict(self):
+        return {
+            '_': 'AffectedFoundMessages',
+            'pts': self.pts,
+            'pts_count': self.pts_count,
+            'offset': self.offset,
+            'messages': [] if self.messages is None else self.messages[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'l>\x8d\xef',
+            _struct_iii.pack(self.pts, self.pts_count, self.offset),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.messages)), len(self.messages), *self.messages),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pts, _pts_count, _offset = reader.read_struct(_struct_iii)
+        reader.read_int()
+        _messages = reader.read_array('i', reader.read_int())
+        return cls(pts=_pts, pts_count=_pts_count, offset=_offset, messages=_messages)
+
@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iii = struct.Struct('<iii')
+
+
+class AffectedHistory(TLObject):
+    CONSTRUCTOR_ID = 0xb45c69d1
+    SUBCLASS_OF_ID = 0x2c49c116
+    __slots__ = ('pts', 'pts_count', 'offset')
+
+    def __init__(self, pts: int, pts_count: int, offset: int):
+        """
+        Constructor for messages.AffectedHistory: Instance of AffectedHistory.
+        """
+        self.pts = pts
+        self.pts_count = pts_count
+        self.offset = offset
+
+    def to_dict(self):
+        return {
+            '_': 'AffectedHistory',
+            'pts': self.pts,
+            'pts_count': self.pts_count,
+            'offset': self.offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1i\\\xb4',
+            _struct_iii.pack(self.pts, self.pts_count, self.offset),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pts, _pts_count, _offset = reader.read_struct(_struct_iii)
+        return cls(pts=_pts, pts_count=_pts_count, offset=_offset)
+
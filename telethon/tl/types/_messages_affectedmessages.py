@@ -0,0 +1,40 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class AffectedMessages(TLObject):
+    CONSTRUCTOR_ID = 0x84d19185
+    SUBCLASS_OF_ID = 0xced3c06e
+    __slots__ = ('pts', 'pts_count')
+
+    def __init__(self, pts: int, pts_count: int):
+        """
+        Constructor for messages.AffectedMessages: Instance of AffectedMessages.
+        """
+        self.pts = pts
+        self.pts_count = pts_count
+
+    def to_dict(self):
+        return {
+            '_': 'AffectedMessages',
+            'pts': self.pts,
+            'pts_count': self.pts_count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x85\x91\xd1\x84',
+            _struct_ii.pack(self.pts, self.pts_count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pts, _pts_count = reader.read_struct(_struct_ii)
+        return cls(pts=_pts, pts_count=_pts_count)
+
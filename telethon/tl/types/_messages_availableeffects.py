@@ -0,0 +1,78 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAvailableEffect, TypeDocument
+
+
+
+class AvailableEffects(TLObject):
+    CONSTRUCTOR_ID = 0xbddb616e
+    SUBCLASS_OF_ID = 0x4470d5bd
+    __slots__ = ('hash', 'effects', 'documents')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, effects: List['TypeAvailableEffect'], documents: List['TypeDocument']):
+        """
+        Constructor for messages.AvailableEffects: Instance of either AvailableEffectsNotModified, AvailableEffects.
+        """
+        self.hash = hash
+        self.effects = effects
+        self.documents = documents
+
+    def to_dict(self):
+        return {
+            '_': 'AvailableEffects',
+            'hash': self.hash,
+            'effects': [] if self.effects is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.effects],
+            'documents': [] if self.documents is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.documents]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'na\xdb\xbd',
+            struct.pack('<i', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.effects)),b''.join(x._bytes() for x in self.effects),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.documents)),b''.join(x._bytes() for x in self.documents),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_int()
+        reader.read_int()
+        _effects = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _effects.append(_x)
+
+        reader.read_int()
+        _documents = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _documents.append(_x)
+
+        return cls(hash=_hash, effects=_effects, documents=_documents)
+
+
+class AvailableEffectsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xd1ed9a5b
+    SUBCLASS_OF_ID = 0x4470d5bd
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AvailableEffectsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'[\x9a\xed\xd1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
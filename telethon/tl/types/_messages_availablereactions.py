@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeAvailableReaction
+
+
+
+class AvailableReactions(TLObject):
+    CONSTRUCTOR_ID = 0x768e3aad
+    SUBCLASS_OF_ID = 0xe426ad82
+    __slots__ = ('hash', 'reactions')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, reactions: List['TypeAvailableReaction']):
+        """
+        Constructor for messages.AvailableReactions: Instance of either AvailableReactionsNotModified, AvailableReactions.
+        """
+        self.hash = hash
+        self.reactions = reactions
+
+    def to_dict(self):
+        return {
+            '_': 'AvailableReactions',
+            'hash': self.hash,
+            'reactions': [] if self.reactions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.reactions]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xad:\x8ev',
+            struct.pack('<i', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.reactions)),b''.join(x._bytes() for x in self.reactions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_int()
+        reader.read_int()
+        _reactions = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _reactions.append(_x)
+
+        return cls(hash=_hash, reactions=_reactions)
+
+
+class AvailableReactionsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x9f071957
+    SUBCLASS_OF_ID = 0xe426ad82
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'AvailableReactionsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'W\x19\x07\x9f',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
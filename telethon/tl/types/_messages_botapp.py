@@ -0,0 +1,51 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotApp
+
+
+
+class BotApp(TLObject):
+    CONSTRUCTOR_ID = 0xeb50adf5
+    SUBCLASS_OF_ID = 0x8f7243a7
+    __slots__ = ('app', 'inactive', 'request_write_access', 'has_settings')
+
+    def __init__(self, app: 'TypeBotApp', inactive: Optional[bool]=None, request_write_access: Optional[bool]=None, has_settings: Optional[bool]=None):
+        """
+        Constructor for messages.BotApp: Instance of BotApp.
+        """
+        self.app = app
+        self.inactive = inactive
+        self.request_write_access = request_write_access
+        self.has_settings = has_settings
+
+    def to_dict(self):
+        return {
+            '_': 'BotApp',
+            'app': self.app.to_dict() if isinstance(self.app, TLObject) else self.app,
+            'inactive': self.inactive,
+            'request_write_access': self.request_write_access,
+            'has_settings': self.has_settings
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf5\xadP\xeb',
+            struct.pack('<I', (0 if self.inactive is None or self.inactive is False else 1) | (0 if self.request_write_access is None or self.request_write_access is False else 2) | (0 if self.has_settings is None or self.has_settings is False else 4)),
+            self.app._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _inactive = bool(flags & 1)
+        _request_write_access = bool(flags & 2)
+        _has_settings = bool(flags & 4)
+        _app = reader.tgread_object()
+        return cls(app=_app, inactive=_inactive, request_write_access=_request_write_access, has_settings=_has_settings)
+
@@ -0,0 +1,62 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BotCallbackAnswer(TLObject):
+    CONSTRUCTOR_ID = 0x36585ea4
+    SUBCLASS_OF_ID = 0x6c4dd18c
+    __slots__ = ('cache_time', 'alert', 'has_url', 'native_ui', 'message', 'url')
+
+    def __init__(self, cache_time: int, alert: Optional[bool]=None, has_url: Optional[bool]=None, native_ui: Optional[bool]=None, message: Optional[str]=None, url: Optional[str]=None):
+        """
+        Constructor for messages.BotCallbackAnswer: Instance of BotCallbackAnswer.
+        """
+        self.cache_time = cache_time
+        self.alert = alert
+        self.has_url = has_url
+        self.native_ui = native_ui
+        self.message = message
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'BotCallbackAnswer',
+            'cache_time': self.cache_time,
+            'alert': self.alert,
+            'has_url': self.has_url,
+            'native_ui': self.native_ui,
+            'message': self.message,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa4^X6',
+            struct.pack('<I', (0 if self.alert is None or self.alert is False else 2) | (0 if self.has_url is None or self.has_url is False else 8) | (0 if self.native_ui is None or self.native_ui is False else 16) | (0 if self.message is None or self.message is False else 1) | (0 if self.url is None or self.url is False else 4)),
+            b'' if self.message is None or self.message is False else (self.serialize_bytes(self.message)),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+            struct.pack('<i', self.cache_time),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _alert = bool(flags & 2)
+        _has_url = bool(flags & 8)
+        _native_ui = bool(flags & 16)
+        if flags & 1:
+            _message = reader.tgread_string()
+        else:
+            _message = None
+        if flags & 4:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        _cache_time = reader.read_int()
+        return cls(cache_time=_cache_time, alert=_alert, has_url=_has_url, native_ui=_native_ui, message=_message, url=_url)
+
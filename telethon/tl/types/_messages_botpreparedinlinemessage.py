@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class BotPreparedInlineMessage(TLObject):
+    CONSTRUCTOR_ID = 0x8ecf0511
+    SUBCLASS_OF_ID = 0xef9119bb
+    __slots__ = ('id', 'expire_date')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, expire_date: Optional[datetime]):
+        """
+        Constructor for messages.BotPreparedInlineMessage: Instance of BotPreparedInlineMessage.
+        """
+        self.id = id
+        self.expire_date = expire_date
+
+    def to_dict(self):
+        return {
+            '_': 'BotPreparedInlineMessage',
+            'id': self.id,
+            'expire_date': self.expire_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x11\x05\xcf\x8e',
+            self.serialize_bytes(self.id),
+            self.serialize_datetime(self.expire_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _expire_date = reader.tgread_date()
+        return cls(id=_id, expire_date=_expire_date)
+
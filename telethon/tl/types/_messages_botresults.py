@@ -0,0 +1,88 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotInlineResult, TypeInlineBotSwitchPM, TypeInlineBotWebView, TypeUser
+
+
+
+class BotResults(TLObject):
+    CONSTRUCTOR_ID = 0xe021f2f6
+    SUBCLASS_OF_ID = 0x3ed4d9c9
+    __slots__ = ('query_id', 'results', 'cache_time', 'users', 'gallery', 'next_offset', 'switch_pm', 'switch_webview')
+
+    def __init__(self, query_id: int, results: List['TypeBotInlineResult'], cache_time: int, users: List['TypeUser'], gallery: Optional[bool]=None, next_offset: Optional[str]=None, switch_pm: Optional['TypeInlineBotSwitchPM']=None, switch_webview: Optional['TypeInlineBotWebView']=None):
+        """
+        Constructor for messages.BotResults: Instance of BotResults.
+        """
+        self.query_id = query_id
+        self.results = results
+        self.cache_time = cache_time
+        self.users = users
+        self.gallery = gallery
+        self.next_offset = next_offset
+        self.switch_pm = switch_pm
+        self.switch_webview = switch_webview
+
+    def to_dict(self):
+        return {
+            '_': 'BotResults',
+            'query_id': self.query_id,
+            'results': [] if self.results is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.results],
+            'cache_time': self.cache_time,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'gallery': self.gallery,
+            'next_offset': self.next_offset,
+            'switch_pm': self.switch_pm.to_dict() if isinstance(self.switch_pm, TLObject) else self.switch_pm,
+            'switch_webview': self.switch_webview.to_dict() if isinstance(self.switch_webview, TLObject) else self.switch_webview
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf6\xf2!\xe0',
+            _struct_Iq.pack((0 if self.gallery is None or self.gallery is False else 1) | (0 if self.next_offset is None or self.next_offset is False else 2) | (0 if self.switch_pm is None or self.switch_pm is False else 4) | (0 if self.switch_webview is None or self.switch_webview is False else 8), self.query_id),
+            b'' if self.next_offset is None or self.next_offset is False else (self.serialize_bytes(self.next_offset)),
+            b'' if self.switch_pm is None or self.switch_pm is False else (self.switch_pm._bytes()),
+            b'' if self.switch_webview is None or self.switch_webview is False else (self.switch_webview._bytes()),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.results)),b''.join(x._bytes() for x in self.results),
+            struct.pack('<i', self.cache_time),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _query_id = reader.read_struct(_struct_iq)
+        _gallery = bool(flags & 1)
+        if flags & 2:
+            _next_offset = reader.tgread_string()
+        else:
+            _next_offset = None
+        if flags & 4:
+            _switch_pm = reader.tgread_object()
+        else:
+            _switch_pm = None
+        if flags & 8:
+            _switch_webview = reader.tgread_object()
+        else:
+            _switch_webview = None
+        reader.read_int()
+        _results = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _results.append(_x)
+
+        _cache_time = reader.read_int()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(query_id=_query_id, results=_results, cache_time=_cache_time, users=_users, gallery=_gallery, next_offset=_next_offset, switch_pm=_switch_pm, switch_webview=_switch_webview)
+
@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatAdminWithInvites, TypeUser
+
+
+
+class ChatAdminsWithInvites(TLObject):
+    CONSTRUCTOR_ID = 0xb69b72d7
+    SUBCLASS_OF_ID = 0x8f5bad2b
+    __slots__ = ('admins', 'users')
+
+    def __init__(self, admins: List['TypeChatAdminWithInvites'], users: List['TypeUser']):
+        """
+        Constructor for messages.ChatAdminsWithInvites: Instance of ChatAdminsWithInvites.
+        """
+        self.admins = admins
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ChatAdminsWithInvites',
+            'admins': [] if self.admins is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.admins],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd7r\x9b\xb6',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.admins)),b''.join(x._bytes() for x in self.admins),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _admins = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _admins.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(admins=_admins, users=_users)
+
@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatInviteImporter, TypeUser
+
+
+
+class ChatInviteImporters(TLObject):
+    CONSTRUCTOR_ID = 0x81b6b00a
+    SUBCLASS_OF_ID = 0xd9bc8aa6
+    __slots__ = ('count', 'importers', 'users')
+
+    def __init__(self, count: int, importers: List['TypeChatInviteImporter'], users: List['TypeUser']):
+        """
+        Constructor for messages.ChatInviteImporters: Instance of ChatInviteImporters.
+        """
+        self.count = count
+        self.importers = importers
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ChatInviteImporters',
+            'count': self.count,
+            'importers': [] if self.importers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.importers],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\n\xb0\xb6\x81',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.importers)),b''.join(x._bytes() for x in self.importers),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _importers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _importers.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, importers=_importers, users=_users)
+
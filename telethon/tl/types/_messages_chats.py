@@ -0,0 +1,82 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat
+
+
+
+class Chats(TLObject):
+    CONSTRUCTOR_ID = 0x64ff9fd5
+    SUBCLASS_OF_ID = 0x99d5cb14
+    __slots__ = ('chats',)
+
+    def __init__(self, chats: List['TypeChat']):
+        """
+        Constructor for messages.Chats: Instance of either Chats, ChatsSlice.
+        """
+        self.chats = chats
+
+    def to_dict(self):
+        return {
+            '_': 'Chats',
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd5\x9f\xffd',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        return cls(chats=_chats)
+
+
+class ChatsSlice(TLObject):
+    CONSTRUCTOR_ID = 0x9cd81144
+    SUBCLASS_OF_ID = 0x99d5cb14
+    __slots__ = ('count', 'chats')
+
+    def __init__(self, count: int, chats: List['TypeChat']):
+        """
+        Constructor for messages.Chats: Instance of either Chats, ChatsSlice.
+        """
+        self.count = count
+        self.chats = chats
+
+    def to_dict(self):
+        return {
+            '_': 'ChatsSlice',
+            'count': self.count,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'D\x11\xd8\x9c',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        return cls(count=_count, chats=_chats)
+
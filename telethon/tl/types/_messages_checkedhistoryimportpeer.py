@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class CheckedHistoryImportPeer(TLObject):
+    CONSTRUCTOR_ID = 0xa24de717
+    SUBCLASS_OF_ID = 0xb84bb337
+    __slots__ = ('confirm_text',)
+
+    def __init__(self, confirm_text: str):
+        """
+        Constructor for messages.CheckedHistoryImportPeer: Instance of CheckedHistoryImportPeer.
+        """
+        self.confirm_text = confirm_text
+
+    def to_dict(self):
+        return {
+            '_': 'CheckedHistoryImportPeer',
+            'confirm_text': self.confirm_text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x17\xe7M\xa2',
+            self.serialize_bytes(self.confirm_text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _confirm_text = reader.tgread_string()
+        return cls(confirm_text=_confirm_text)
+
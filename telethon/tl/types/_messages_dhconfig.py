@@ -0,0 +1,77 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class DhConfig(TLObject):
+    CONSTRUCTOR_ID = 0x2c221edd
+    SUBCLASS_OF_ID = 0xe488ed8b
+    __slots__ = ('g', 'p', 'version', 'random')
+
+    def __init__(self, g: int, p: bytes, version: int, random: bytes):
+        """
+        Constructor for messages.DhConfig: Instance of either DhConfigNotModified, DhConfig.
+        """
+        self.g = g
+        self.p = p
+        self.version = version
+        self.random = random
+
+    def to_dict(self):
+        return {
+            '_': 'DhConfig',
+            'g': self.g,
+            'p': self.p,
+            'version': self.version,
+            'random': self.random
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdd\x1e",',
+            struct.pack('<i', self.g),
+            self.serialize_bytes(self.p),
+            struct.pack('<i', self.version),
+            self.serialize_bytes(self.random),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _g = reader.read_int()
+        _p = reader.tgread_bytes()
+        _version = reader.read_int()
+        _random = reader.tgread_bytes()
+        return cls(g=_g, p=_p, version=_version, random=_random)
+
+
+class DhConfigNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xc0e24635
+    SUBCLASS_OF_ID = 0xe488ed8b
+    __slots__ = ('random',)
+
+    def __init__(self, random: bytes):
+        """
+        Constructor for messages.DhConfig: Instance of either DhConfigNotModified, DhConfig.
+        """
+        self.random = random
+
+    def to_dict(self):
+        return {
+            '_': 'DhConfigNotModified',
+            'random': self.random
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'5F\xe2\xc0',
+            self.serialize_bytes(self.random),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _random = reader.tgread_bytes()
+        return cls(random=_random)
+
@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDialogFilter
+
+
+
+class DialogFilters(TLObject):
+    CONSTRUCTOR_ID = 0x2ad93719
+    SUBCLASS_OF_ID = 0xa5fff1b7
+    __slots__ = ('filters', 'tags_enabled')
+
+    def __init__(self, filters: List['TypeDialogFilter'], tags_enabled: Optional[bool]=None):
+        """
+        Constructor for messages.DialogFilters: Instance of DialogFilters.
+        """
+        self.filters = filters
+        self.tags_enabled = tags_enabled
+
+    def to_dict(self):
+        return {
+            '_': 'DialogFilters',
+            'filters': [] if self.filters is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.filters],
+            'tags_enabled': self.tags_enabled
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x197\xd9*',
+            struct.pack('<I', (0 if self.tags_enabled is None or self.tags_enabled is False else 1)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.filters)),b''.join(x._bytes() for x in self.filters),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _tags_enabled = bool(flags & 1)
+        reader.read_int()
+        _filters = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _filters.append(_x)
+
+        return cls(filters=_filters, tags_enabled=_tags_enabled)
+
@@ -0,0 +1,165 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeDialog, TypeMessage, TypeUser
+
+
+
+class Dialogs(TLObject):
+    CONSTRUCTOR_ID = 0x15ba6c40
+    SUBCLASS_OF_ID = 0xe1b52ee
+    __slots__ = ('dialogs', 'messages', 'chats', 'users')
+
+    def __init__(self, dialogs: List['TypeDialog'], messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for messages.Dialogs: Instance of either Dialogs, DialogsSlice, DialogsNotModified.
+        """
+        self.dialogs = dialogs
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'Dialogs',
+            'dialogs': [] if self.dialogs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.dialogs],
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'@l\xba\x15',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.dialogs)),b''.join(x._bytes() for x in self.dialogs),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _dialogs = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _dialogs.append(_x)
+
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(dialogs=_dialogs, messages=_messages, chats=_chats, users=_users)
+
+
+class DialogsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xf0e3e596
+    SUBCLASS_OF_ID = 0xe1b52ee
+    __slots__ = ('count',)
+
+    def __init__(self, count: int):
+        """
+        Constructor for messages.Dialogs: Instance of either Dialogs, DialogsSlice, DialogsNotModified.
+        """
+        self.count = count
+
+    def to_dict(self):
+        return {
+            '_': 'DialogsNotModified',
+            'count': self.count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x96\xe5\xe3\xf0',
+            struct.pack('<i', self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        return cls(count=_count)
+
+
+class DialogsSlice(TLObject):
+    CONSTRUCTOR_ID = 0x71e094f3
+    SUBCLASS_OF_ID = 0xe1b52ee
+    __slots__ = ('count', 'dialogs', 'messages', 'chats', 'users')
+
+    def __init__(self, count: int, dialogs: List['TypeDialog'], messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for messages.Dialogs: Instance of either Dialogs, DialogsSlice, DialogsNotModified.
+        """
+        self.count = count
+        self.dialogs = dialogs
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'DialogsSlice',
+            'count': self.count,
+            'dialogs': [] if self.dialogs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.dialogs],
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf3\x94\xe0q',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.dialogs)),b''.join(x._bytes() for x in self.dialogs),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _dialogs = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _dialogs.append(_x)
+
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, dialogs=_dialogs, messages=_messages, chats=_chats, users=_users)
+
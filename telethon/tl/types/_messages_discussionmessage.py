@@ -0,0 +1,90 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeMessage, TypeUser
+
+
+
+class DiscussionMessage(TLObject):
+    CONSTRUCTOR_ID = 0xa6341782
+    SUBCLASS_OF_ID = 0x53f8e3e8
+    __slots__ = ('messages', 'unread_count', 'chats', 'users', 'max_id', 'read_inbox_max_id', 'read_outbox_max_id')
+
+    def __init__(self, messages: List['TypeMessage'], unread_count: int, chats: List['TypeChat'], users: List['TypeUser'], max_id: Optional[int]=None, read_inbox_max_id: Optional[int]=None, read_outbox_max_id: Optional[int]=None):
+        """
+        Constructor for messages.DiscussionMessage: Instance of DiscussionMessage.
+        """
+        self.messages = messages
+        self.unread_count = unread_count
+        self.chats = chats
+        self.users = users
+        self.max_id = max_id
+        self.read_inbox_max_id = read_inbox_max_id
+        self.read_outbox_max_id = read_outbox_max_id
+
+    def to_dict(self):
+        return {
+            '_': 'DiscussionMessage',
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'unread_count': self.unread_count,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'max_id': self.max_id,
+            'read_inbox_max_id': self.read_inbox_max_id,
+            'read_outbox_max_id': self.read_outbox_max_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x82\x174\xa6',
+            struct.pack('<I', (0 if self.max_id is None or self.max_id is False else 1) | (0 if self.read_inbox_max_id is None or self.read_inbox_max_id is False else 2) | (0 if self.read_outbox_max_id is None or self.read_outbox_max_id is False else 4)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'' if self.max_id is None or self.max_id is False else (struct.pack('<i', self.max_id)),
+            b'' if self.read_inbox_max_id is None or self.read_inbox_max_id is False else (struct.pack('<i', self.read_inbox_max_id)),
+            b'' if self.read_outbox_max_id is None or self.read_outbox_max_id is False else (struct.pack('<i', self.read_outbox_max_id)),
+            struct.pack('<i', self.unread_count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        if flags & 1:
+            _max_id = reader.read_int()
+        else:
+            _max_id = None
+        if flags & 2:
+            _read_inbox_max_id = reader.read_int()
+        else:
+            _read_inbox_max_id = None
+        if flags & 4:
+            _read_outbox_max_id = reader.read_int()
+        else:
+            _read_outbox_max_id = None
+        _unread_count = reader.read_int()
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(messages=_messages, unread_count=_unread_count, chats=_chats, users=_users, max_id=_max_id, read_inbox_max_id=_read_inbox_max_id, read_outbox_max_id=_read_outbox_max_id)
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeEmojiGroup
+
+
+
+class EmojiGroups(TLObject):
+    CONSTRUCTOR_ID = 0x881fb94b
+    SUBCLASS_OF_ID = 0x7eca55d9
+    __slots__ = ('hash', 'groups')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, groups: List['TypeEmojiGroup']):
+        """
+        Constructor for messages.EmojiGroups: Instance of either EmojiGroupsNotModified, EmojiGroups.
+        """
+        self.hash = hash
+        self.groups = groups
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiGroups',
+            'hash': self.hash,
+            'groups': [] if self.groups is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.groups]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'K\xb9\x1f\x88',
+            struct.pack('<i', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.groups)),b''.join(x._bytes() for x in self.groups),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_int()
+        reader.read_int()
+        _groups = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _groups.append(_x)
+
+        return cls(hash=_hash, groups=_groups)
+
+
+class EmojiGroupsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x6fb4ad87
+    SUBCLASS_OF_ID = 0x7eca55d9
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'EmojiGroupsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x87\xad\xb4o',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
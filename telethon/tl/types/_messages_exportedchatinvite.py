@@ -0,0 +1,90 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeExportedChatInvite, TypeUser
+
+
+
+class ExportedChatInvite(TLObject):
+    CONSTRUCTOR_ID = 0x1871be50
+    SUBCLASS_OF_ID = 0x82dcd4ca
+    __slots__ = ('invite', 'users')
+
+    def __init__(self, invite: 'TypeExportedChatInvite', users: List['TypeUser']):
+        """
+        Constructor for messages.ExportedChatInvite: Instance of either ExportedChatInvite, ExportedChatInviteReplaced.
+        """
+        self.invite = invite
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedChatInvite',
+            'invite': self.invite.to_dict() if isinstance(self.invite, TLObject) else self.invite,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'P\xbeq\x18',
+            self.invite._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _invite = reader.tgread_object()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(invite=_invite, users=_users)
+
+
+class ExportedChatInviteReplaced(TLObject):
+    CONSTRUCTOR_ID = 0x222600ef
+    SUBCLASS_OF_ID = 0x82dcd4ca
+    __slots__ = ('invite', 'new_invite', 'users')
+
+    def __init__(self, invite: 'TypeExportedChatInvite', new_invite: 'TypeExportedChatInvite', users: List['TypeUser']):
+        """
+        Constructor for messages.ExportedChatInvite: Instance of either ExportedChatInvite, ExportedChatInviteReplaced.
+        """
+        self.invite = invite
+        self.new_invite = new_invite
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedChatInviteReplaced',
+            'invite': self.invite.to_dict() if isinstance(self.invite, TLObject) else self.invite,
+            'new_invite': self.new_invite.to_dict() if isinstance(self.new_invite, TLObject) else self.new_invite,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xef\x00&"',
+            self.invite._bytes(),
+            self.new_invite._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _invite = reader.tgread_object()
+        _new_invite = reader.tgread_object()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(invite=_invite, new_invite=_new_invite, users=_users)
+
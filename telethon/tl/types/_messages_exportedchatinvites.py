@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeExportedChatInvite, TypeUser
+
+
+
+class ExportedChatInvites(TLObject):
+    CONSTRUCTOR_ID = 0xbdc62dcc
+    SUBCLASS_OF_ID = 0x603d3871
+    __slots__ = ('count', 'invites', 'users')
+
+    def __init__(self, count: int, invites: List['TypeExportedChatInvite'], users: List['TypeUser']):
+        """
+        Constructor for messages.ExportedChatInvites: Instance of ExportedChatInvites.
+        """
+        self.count = count
+        self.invites = invites
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedChatInvites',
+            'count': self.count,
+            'invites': [] if self.invites is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.invites],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcc-\xc6\xbd',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.invites)),b''.join(x._bytes() for x in self.invites),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _invites = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _invites.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, invites=_invites, users=_users)
+
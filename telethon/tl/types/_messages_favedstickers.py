@@ -0,0 +1,78 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeStickerPack
+
+
+
+class FavedStickers(TLObject):
+    CONSTRUCTOR_ID = 0x2cb51097
+    SUBCLASS_OF_ID = 0x8e736fb9
+    __slots__ = ('hash', 'packs', 'stickers')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, packs: List['TypeStickerPack'], stickers: List['TypeDocument']):
+        """
+        Constructor for messages.FavedStickers: Instance of either FavedStickersNotModified, FavedStickers.
+        """
+        self.hash = hash
+        self.packs = packs
+        self.stickers = stickers
+
+    def to_dict(self):
+        return {
+            '_': 'FavedStickers',
+            'hash': self.hash,
+            'packs': [] if self.packs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.packs],
+            'stickers': [] if self.stickers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stickers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x97\x10\xb5,',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.packs)),b''.join(x._bytes() for x in self.packs),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stickers)),b''.join(x._bytes() for x in self.stickers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _packs = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _packs.append(_x)
+
+        reader.read_int()
+        _stickers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _stickers.append(_x)
+
+        return cls(hash=_hash, packs=_packs, stickers=_stickers)
+
+
+class FavedStickersNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x9e8fa6d3
+    SUBCLASS_OF_ID = 0x8e736fb9
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'FavedStickersNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3\xa6\x8f\x9e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,91 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqi = struct.Struct('<Iqi')
+_struct_iqi = struct.Struct('<iqi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeStickerSetCovered
+
+
+
+class FeaturedStickers(TLObject):
+    CONSTRUCTOR_ID = 0xbe382906
+    SUBCLASS_OF_ID = 0x2614b722
+    __slots__ = ('hash', 'count', 'sets', 'unread', 'premium')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, count: int, sets: List['TypeStickerSetCovered'], unread: List[int], premium: Optional[bool]=None):
+        """
+        Constructor for messages.FeaturedStickers: Instance of either FeaturedStickersNotModified, FeaturedStickers.
+        """
+        self.hash = hash
+        self.count = count
+        self.sets = sets
+        self.unread = unread
+        self.premium = premium
+
+    def to_dict(self):
+        return {
+            '_': 'FeaturedStickers',
+            'hash': self.hash,
+            'count': self.count,
+            'sets': [] if self.sets is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.sets],
+            'unread': [] if self.unread is None else self.unread[:],
+            'premium': self.premium
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x06)8\xbe',
+            _struct_Iqi.pack((0 if self.premium is None or self.premium is False else 1), self.hash, self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.sets)),b''.join(x._bytes() for x in self.sets),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.unread)), len(self.unread), *self.unread),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _hash, _count = reader.read_struct(_struct_iqi)
+        _premium = bool(flags & 1)
+        reader.read_int()
+        _sets = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _sets.append(_x)
+
+        reader.read_int()
+        _unread = reader.read_array('q', reader.read_int())
+        return cls(hash=_hash, count=_count, sets=_sets, unread=_unread, premium=_premium)
+
+
+class FeaturedStickersNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xc6dc0c66
+    SUBCLASS_OF_ID = 0x2614b722
+    __slots__ = ('count',)
+
+    def __init__(self, count: int):
+        """
+        Constructor for messages.FeaturedStickers: Instance of either FeaturedStickersNotModified, FeaturedStickers.
+        """
+        self.count = count
+
+    def to_dict(self):
+        return {
+            '_': 'FeaturedStickersNotModified',
+            'count': self.count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'f\x0c\xdc\xc6',
+            struct.pack('<i', self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        return cls(count=_count)
+
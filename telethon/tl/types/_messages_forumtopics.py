@@ -0,0 +1,85 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeForumTopic, TypeMessage, TypeUser
+
+
+
+class ForumTopics(TLObject):
+    CONSTRUCTOR_ID = 0x367617d3
+    SUBCLASS_OF_ID = 0x8e1d3e1e
+    __slots__ = ('count', 'topics', 'messages', 'chats', 'users', 'pts', 'order_by_create_date')
+
+    def __init__(self, count: int, topics: List['TypeForumTopic'], messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser'], pts: int, order_by_create_date: Optional[bool]=None):
+        """
+        Constructor for messages.ForumTopics: Instance of ForumTopics.
+        """
+        self.count = count
+        self.topics = topics
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+        self.pts = pts
+        self.order_by_create_date = order_by_create_date
+
+    def to_dict(self):
+        return {
+            '_': 'ForumTopics',
+            'count': self.count,
+            'topics': [] if self.topics is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.topics],
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'pts': self.pts,
+            'order_by_create_date': self.order_by_create_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3\x17v6',
+            _struct_Ii.pack((0 if self.order_by_create_date is None or self.order_by_create_date is False else 1), self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.topics)),b''.join(x._bytes() for x in self.topics),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            struct.pack('<i', self.pts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count = reader.read_struct(_struct_ii)
+        _order_by_create_date = bool(flags & 1)
+        reader.read_int()
+        _topics = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _topics.append(_x)
+
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        _pts = reader.read_int()
+        return cls(count=_count, topics=_topics, messages=_messages, chats=_chats, users=_users, pts=_pts, order_by_create_date=_order_by_create_date)
+
@@ -0,0 +1,94 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument
+
+
+
+class FoundStickers(TLObject):
+    CONSTRUCTOR_ID = 0x82c9e290
+    SUBCLASS_OF_ID = 0x6402151
+    __slots__ = ('hash', 'stickers', 'next_offset')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, stickers: List['TypeDocument'], next_offset: Optional[int]=None):
+        """
+        Constructor for messages.FoundStickers: Instance of either FoundStickersNotModified, FoundStickers.
+        """
+        self.hash = hash
+        self.stickers = stickers
+        self.next_offset = next_offset
+
+    def to_dict(self):
+        return {
+            '_': 'FoundStickers',
+            'hash': self.hash,
+            'stickers': [] if self.stickers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stickers],
+            'next_offset': self.next_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x90\xe2\xc9\x82',
+            struct.pack('<I', (0 if self.next_offset is None or self.next_offset is False else 1)),
+            b'' if self.next_offset is None or self.next_offset is False else (struct.pack('<i', self.next_offset)),
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stickers)),b''.join(x._bytes() for x in self.stickers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _next_offset = reader.read_int()
+        else:
+            _next_offset = None
+        _hash = reader.read_long()
+        reader.read_int()
+        _stickers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _stickers.append(_x)
+
+        return cls(hash=_hash, stickers=_stickers, next_offset=_next_offset)
+
+
+class FoundStickersNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x6010c534
+    SUBCLASS_OF_ID = 0x6402151
+    __slots__ = ('next_offset',)
+
+    def __init__(self, next_offset: Optional[int]=None):
+        """
+        Constructor for messages.FoundStickers: Instance of either FoundStickersNotModified, FoundStickers.
+        """
+        self.next_offset = next_offset
+
+    def to_dict(self):
+        return {
+            '_': 'FoundStickersNotModified',
+            'next_offset': self.next_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'4\xc5\x10`',
+            struct.pack('<I', (0 if self.next_offset is None or self.next_offset is False else 1)),
+            b'' if self.next_offset is None or self.next_offset is False else (struct.pack('<i', self.next_offset)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _next_offset = reader.read_int()
+        else:
+            _next_offset = None
+        return cls(next_offset=_next_offset)
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStickerSetCovered
+
+
+
+class FoundStickerSets(TLObject):
+    CONSTRUCTOR_ID = 0x8af09dd2
+    SUBCLASS_OF_ID = 0x40df361
+    __slots__ = ('hash', 'sets')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, sets: List['TypeStickerSetCovered']):
+        """
+        Constructor for messages.FoundStickerSets: Instance of either FoundStickerSetsNotModified, FoundStickerSets.
+        """
+        self.hash = hash
+        self.sets = sets
+
+    def to_dict(self):
+        return {
+            '_': 'FoundStickerSets',
+            'hash': self.hash,
+            'sets': [] if self.sets is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.sets]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd2\x9d\xf0\x8a',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.sets)),b''.join(x._bytes() for x in self.sets),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _sets = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _sets.append(_x)
+
+        return cls(hash=_hash, sets=_sets)
+
+
+class FoundStickerSetsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xd54b65d
+    SUBCLASS_OF_ID = 0x40df361
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'FoundStickerSetsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b']\xb6T\r',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeHighScore, TypeUser
+
+
+
+class HighScores(TLObject):
+    CONSTRUCTOR_ID = 0x9a3bfd99
+    SUBCLASS_OF_ID = 0x6ccd95fd
+    __slots__ = ('scores', 'users')
+
+    def __init__(self, scores: List['TypeHighScore'], users: List['TypeUser']):
+        """
+        Constructor for messages.HighScores: Instance of HighScores.
+        """
+        self.scores = scores
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'HighScores',
+            'scores': [] if self.scores is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.scores],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x99\xfd;\x9a',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.scores)),b''.join(x._bytes() for x in self.scores),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _scores = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _scores.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(scores=_scores, users=_users)
+
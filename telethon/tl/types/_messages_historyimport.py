@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class HistoryImport(TLObject):
+    CONSTRUCTOR_ID = 0x1662af0b
+    SUBCLASS_OF_ID = 0xb18bb50a
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for messages.HistoryImport: Instance of HistoryImport.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'HistoryImport',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\xafb\x16',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class HistoryImportParsed(TLObject):
+    CONSTRUCTOR_ID = 0x5e0fb7b9
+    SUBCLASS_OF_ID = 0x5bb2720b
+    __slots__ = ('pm', 'group', 'title')
+
+    def __init__(self, pm: Optional[bool]=None, group: Optional[bool]=None, title: Optional[str]=None):
+        """
+        Constructor for messages.HistoryImportParsed: Instance of HistoryImportParsed.
+        """
+        self.pm = pm
+        self.group = group
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'HistoryImportParsed',
+            'pm': self.pm,
+            'group': self.group,
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb9\xb7\x0f^',
+            struct.pack('<I', (0 if self.pm is None or self.pm is False else 1) | (0 if self.group is None or self.group is False else 2) | (0 if self.title is None or self.title is False else 4)),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _pm = bool(flags & 1)
+        _group = bool(flags & 2)
+        if flags & 4:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        return cls(pm=_pm, group=_group, title=_title)
+
@@ -0,0 +1,58 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeUser
+
+
+
+class InactiveChats(TLObject):
+    CONSTRUCTOR_ID = 0xa927fec5
+    SUBCLASS_OF_ID = 0x8bf3d7d4
+    __slots__ = ('dates', 'chats', 'users')
+
+    def __init__(self, dates: List[int], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for messages.InactiveChats: Instance of InactiveChats.
+        """
+        self.dates = dates
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'InactiveChats',
+            'dates': [] if self.dates is None else self.dates[:],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"\xc5\xfe'\xa9",
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.dates)), len(self.dates), *self.dates),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _dates = reader.read_array('i', reader.read_int())
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(dates=_dates, chats=_chats, users=_users)
+
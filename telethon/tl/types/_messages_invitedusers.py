@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMissingInvitee, TypeUpdates
+
+
+
+class InvitedUsers(TLObject):
+    CONSTRUCTOR_ID = 0x7f5defa6
+    SUBCLASS_OF_ID = 0x3dbe90a1
+    __slots__ = ('updates', 'missing_invitees')
+
+    def __init__(self, updates: 'TypeUpdates', missing_invitees: List['TypeMissingInvitee']):
+        """
+        Constructor for messages.InvitedUsers: Instance of InvitedUsers.
+        """
+        self.updates = updates
+        self.missing_invitees = missing_invitees
+
+    def to_dict(self):
+        return {
+            '_': 'InvitedUsers',
+            'updates': self.updates.to_dict() if isinstance(self.updates, TLObject) else self.updates,
+            'missing_invitees': [] if self.missing_invitees is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.missing_invitees]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa6\xef]\x7f',
+            self.updates._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.missing_invitees)),b''.join(x._bytes() for x in self.missing_invitees),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _updates = reader.tgread_object()
+        reader.read_int()
+        _missing_invitees = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _missing_invitees.append(_x)
+
+        return cls(updates=_updates, missing_invitees=_missing_invitees)
+
@@ -0,0 +1,38 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class MessageEditData(TLObject):
+    CONSTRUCTOR_ID = 0x26b5dde6
+    SUBCLASS_OF_ID = 0xfb47949d
+    __slots__ = ('caption',)
+
+    def __init__(self, caption: Optional[bool]=None):
+        """
+        Constructor for messages.MessageEditData: Instance of MessageEditData.
+        """
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'MessageEditData',
+            'caption': self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe6\xdd\xb5&',
+            struct.pack('<I', (0 if self.caption is None or self.caption is False else 1)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _caption = bool(flags & 1)
+        return cls(caption=_caption)
+
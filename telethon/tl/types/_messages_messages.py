@@ -0,0 +1,246 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_Iii = struct.Struct('<Iii')
+_struct_ii = struct.Struct('<ii')
+_struct_iii = struct.Struct('<iii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeForumTopic, TypeMessage, TypeUser
+
+
+
+class ChannelMessages(TLObject):
+    CONSTRUCTOR_ID = 0xc776ba4e
+    SUBCLASS_OF_ID = 0xd4b40b5e
+    __slots__ = ('pts', 'count', 'messages', 'topics', 'chats', 'users', 'inexact', 'offset_id_offset')
+
+    def __init__(self, pts: int, count: int, messages: List['TypeMessage'], topics: List['TypeForumTopic'], chats: List['TypeChat'], users: List['TypeUser'], inexact: Optional[bool]=None, offset_id_offset: Optional[int]=None):
+        """
+        Constructor for messages.Messages: Instance of either Messages, MessagesSlice, ChannelMessages, MessagesNotModified.
+        """
+        self.pts = pts
+        self.count = count
+        self.messages = messages
+        self.topics = topics
+        self.chats = chats
+        self.users = users
+        self.inexact = inexact
+        self.offset_id_offset = offset_id_offset
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelMessages',
+            'pts': self.pts,
+            'count': self.count,
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'topics': [] if self.topics is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.topics],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'inexact': self.inexact,
+            'offset_id_offset': self.offset_id_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'N\xbav\xc7',
+            _struct_Iii.pack((0 if self.inexact is None or self.inexact is False else 2) | (0 if self.offset_id_offset is None or self.offset_id_offset is False else 4), self.pts, self.count),
+            b'' if self.offset_id_offset is None or self.offset_id_offset is False else (struct.pack('<i', self.offset_id_offset)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.topics)),b''.join(x._bytes() for x in self.topics),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _pts, _count = reader.read_struct(_struct_iii)
+        _inexact = bool(flags & 2)
+        if flags & 4:
+            _offset_id_offset = reader.read_int()
+        else:
+            _offset_id_offset = None
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _topics = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _topics.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(pts=_pts, count=_count, messages=_messages, topics=_topics, chats=_chats, users=_users, inexact=_inexact, offset_id_offset=_offset_id_offset)
+
+
+class Messages(TLObject):
+    CONSTRUCTOR_ID = 0x8c718e87
+    SUBCLASS_OF_ID = 0xd4b40b5e
+    __slots__ = ('messages', 'chats', 'users')
+
+    def __init__(self, messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for messages.Messages: Instance of either Messages, MessagesSlice, ChannelMessages, MessagesNotModified.
+        """
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'Messages',
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x87\x8eq\x8c',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(messages=_messages, chats=_chats, users=_users)
+
+
+class MessagesNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x74535f21
+    SUBCLASS_OF_ID = 0xd4b40b5e
+    __slots__ = ('count',)
+
+    def __init__(self, count: int):
+        """
+        Constructor for messages.Messages: Instance of either Messages, MessagesSlice, ChannelMessages, MessagesNotModified.
+        """
+        self.count = count
+
+    def to_dict(self):
+        return {
+            '_': 'MessagesNotModified',
+            'count': self.count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'!_St',
+            struct.pack('<i', self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        return cls(count=_count)
+
+
+class MessagesSlice(TLObject):
+    CONSTRUCTOR_ID = 0x3a54685e
+    SUBCLASS_OF_ID = 0xd4b40b5e
+    __slots__ = ('count', 'messages', 'chats', 'users', 'inexact', 'next_rate', 'offset_id_offset')
+
+    def __init__(self, count: int, messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser'], inexact: Optional[bool]=None, next_rate: Optional[int]=None, offset_id_offset: Optional[int]=None):
+        """
+        Constructor for messages.Messages: Instance of either Messages, MessagesSlice, ChannelMessages, MessagesNotModified.
+        """
+        self.count = count
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+        self.inexact = inexact
+        self.next_rate = next_rate
+        self.offset_id_offset = offset_id_offset
+
+    def to_dict(self):
+        return {
+            '_': 'MessagesSlice',
+            'count': self.count,
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'inexact': self.inexact,
+            'next_rate': self.next_rate,
+            'offset_id_offset': self.offset_id_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'^hT:',
+            _struct_Ii.pack((0 if self.inexact is None or self.inexact is False else 2) | (0 if self.next_rate is None or self.next_rate is False else 1) | (0 if self.offset_id_offset is None or self.offset_id_offset is False else 4), self.count),
+            b'' if self.next_rate is None or self.next_rate is False else (struct.pack('<i', self.next_rate)),
+            b'' if self.offset_id_offset is None or self.offset_id_offset is False else (struct.pack('<i', self.offset_id_offset)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count = reader.read_struct(_struct_ii)
+        _inexact = bool(flags & 2)
+        if flags & 1:
+            _next_rate = reader.read_int()
+        else:
+            _next_rate = None
+        if flags & 4:
+            _offset_id_offset = reader.read_int()
+        else:
+            _offset_id_offset = None
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, messages=_messages, chats=_chats, users=_users, inexact=_inexact, next_rate=_next_rate, offset_id_offset=_offset_id_offset)
+
@@ -0,0 +1,62 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeMessageViews, TypeUser
+
+
+
+class MessageViews(TLObject):
+    CONSTRUCTOR_ID = 0xb6c4f543
+    SUBCLASS_OF_ID = 0xafb5eb9c
+    __slots__ = ('views', 'chats', 'users')
+
+    def __init__(self, views: List['TypeMessageViews'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for messages.MessageViews: Instance of MessageViews.
+        """
+        self.views = views
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'MessageViews',
+            'views': [] if self.views is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.views],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'C\xf5\xc4\xb6',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.views)),b''.join(x._bytes() for x in self.views),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _views = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _views.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(views=_views, chats=_chats, users=_users)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStickerSetCovered
+
+
+
+class MyStickers(TLObject):
+    CONSTRUCTOR_ID = 0xfaff629d
+    SUBCLASS_OF_ID = 0xb1b4350a
+    __slots__ = ('count', 'sets')
+
+    def __init__(self, count: int, sets: List['TypeStickerSetCovered']):
+        """
+        Constructor for messages.MyStickers: Instance of MyStickers.
+        """
+        self.count = count
+        self.sets = sets
+
+    def to_dict(self):
+        return {
+            '_': 'MyStickers',
+            'count': self.count,
+            'sets': [] if self.sets is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.sets]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9db\xff\xfa',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.sets)),b''.join(x._bytes() for x in self.sets),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _sets = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _sets.append(_x)
+
+        return cls(count=_count, sets=_sets)
+
@@ -0,0 +1,65 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBotInlineResult, TypeInlineQueryPeerType, TypeUser
+
+
+
+class PreparedInlineMessage(TLObject):
+    CONSTRUCTOR_ID = 0xff57708d
+    SUBCLASS_OF_ID = 0x490ddf4d
+    __slots__ = ('query_id', 'result', 'peer_types', 'cache_time', 'users')
+
+    def __init__(self, query_id: int, result: 'TypeBotInlineResult', peer_types: List['TypeInlineQueryPeerType'], cache_time: int, users: List['TypeUser']):
+        """
+        Constructor for messages.PreparedInlineMessage: Instance of PreparedInlineMessage.
+        """
+        self.query_id = query_id
+        self.result = result
+        self.peer_types = peer_types
+        self.cache_time = cache_time
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'PreparedInlineMessage',
+            'query_id': self.query_id,
+            'result': self.result.to_dict() if isinstance(self.result, TLObject) else self.result,
+            'peer_types': [] if self.peer_types is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peer_types],
+            'cache_time': self.cache_time,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8dpW\xff',
+            struct.pack('<q', self.query_id),
+            self.result._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peer_types)),b''.join(x._bytes() for x in self.peer_types),
+            struct.pack('<i', self.cache_time),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _query_id = reader.read_long()
+        _result = reader.tgread_object()
+        reader.read_int()
+        _peer_types = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _peer_types.append(_x)
+
+        _cache_time = reader.read_int()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(query_id=_query_id, result=_result, peer_types=_peer_types, cache_time=_cache_time, users=_users)
+
@@ -0,0 +1,91 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeMessage, TypeQuickReply, TypeUser
+
+
+
+class QuickReplies(TLObject):
+    CONSTRUCTOR_ID = 0xc68d6695
+    SUBCLASS_OF_ID = 0xf737e966
+    __slots__ = ('quick_replies', 'messages', 'chats', 'users')
+
+    def __init__(self, quick_replies: List['TypeQuickReply'], messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for messages.QuickReplies: Instance of either QuickReplies, QuickRepliesNotModified.
+        """
+        self.quick_replies = quick_replies
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'QuickReplies',
+            'quick_replies': [] if self.quick_replies is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.quick_replies],
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95f\x8d\xc6',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.quick_replies)),b''.join(x._bytes() for x in self.quick_replies),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _quick_replies = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _quick_replies.append(_x)
+
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(quick_replies=_quick_replies, messages=_messages, chats=_chats, users=_users)
+
+
+class QuickRepliesNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x5f91eb5b
+    SUBCLASS_OF_ID = 0xf737e966
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'QuickRepliesNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'[\xeb\x91_',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
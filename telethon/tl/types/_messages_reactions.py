@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeReaction
+
+
+
+class Reactions(TLObject):
+    CONSTRUCTOR_ID = 0xeafdf716
+    SUBCLASS_OF_ID = 0xadc38324
+    __slots__ = ('hash', 'reactions')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, reactions: List['TypeReaction']):
+        """
+        Constructor for messages.Reactions: Instance of either ReactionsNotModified, Reactions.
+        """
+        self.hash = hash
+        self.reactions = reactions
+
+    def to_dict(self):
+        return {
+            '_': 'Reactions',
+            'hash': self.hash,
+            'reactions': [] if self.reactions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.reactions]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x16\xf7\xfd\xea',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.reactions)),b''.join(x._bytes() for x in self.reactions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _reactions = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _reactions.append(_x)
+
+        return cls(hash=_hash, reactions=_reactions)
+
+
+class ReactionsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xb06fdbdf
+    SUBCLASS_OF_ID = 0xadc38324
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdf\xdbo\xb0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,83 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeStickerPack
+
+
+
+class RecentStickers(TLObject):
+    CONSTRUCTOR_ID = 0x88d37c56
+    SUBCLASS_OF_ID = 0xf76f8683
+    __slots__ = ('hash', 'packs', 'stickers', 'dates')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, packs: List['TypeStickerPack'], stickers: List['TypeDocument'], dates: List[int]):
+        """
+        Constructor for messages.RecentStickers: Instance of either RecentStickersNotModified, RecentStickers.
+        """
+        self.hash = hash
+        self.packs = packs
+        self.stickers = stickers
+        self.dates = dates
+
+    def to_dict(self):
+        return {
+            '_': 'RecentStickers',
+            'hash': self.hash,
+            'packs': [] if self.packs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.packs],
+            'stickers': [] if self.stickers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stickers],
+            'dates': [] if self.dates is None else self.dates[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'V|\xd3\x88',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.packs)),b''.join(x._bytes() for x in self.packs),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stickers)),b''.join(x._bytes() for x in self.stickers),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.dates)), len(self.dates), *self.dates),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _packs = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _packs.append(_x)
+
+        reader.read_int()
+        _stickers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _stickers.append(_x)
+
+        reader.read_int()
+        _dates = reader.read_array('i', reader.read_int())
+        return cls(hash=_hash, packs=_packs, stickers=_stickers, dates=_dates)
+
+
+class RecentStickersNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xb17f890
+    SUBCLASS_OF_ID = 0xf76f8683
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'RecentStickersNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x90\xf8\x17\x0b',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument
+
+
+
+class SavedGifs(TLObject):
+    CONSTRUCTOR_ID = 0x84a02a0d
+    SUBCLASS_OF_ID = 0xa68b61f5
+    __slots__ = ('hash', 'gifs')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, gifs: List['TypeDocument']):
+        """
+        Constructor for messages.SavedGifs: Instance of either SavedGifsNotModified, SavedGifs.
+        """
+        self.hash = hash
+        self.gifs = gifs
+
+    def to_dict(self):
+        return {
+            '_': 'SavedGifs',
+            'hash': self.hash,
+            'gifs': [] if self.gifs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.gifs]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r*\xa0\x84',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.gifs)),b''.join(x._bytes() for x in self.gifs),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _gifs = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _gifs.append(_x)
+
+        return cls(hash=_hash, gifs=_gifs)
+
+
+class SavedGifsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xe8025ca2
+    SUBCLASS_OF_ID = 0xa68b61f5
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SavedGifsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa2\\\x02\xe8',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
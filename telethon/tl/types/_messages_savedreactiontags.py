@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSavedReactionTag
+
+
+
+class SavedReactionTags(TLObject):
+    CONSTRUCTOR_ID = 0x3259950a
+    SUBCLASS_OF_ID = 0xa39b5be3
+    __slots__ = ('tags', 'hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, tags: List['TypeSavedReactionTag'], hash: int):
+        """
+        Constructor for messages.SavedReactionTags: Instance of either SavedReactionTagsNotModified, SavedReactionTags.
+        """
+        self.tags = tags
+        self.hash = hash
+
+    def to_dict(self):
+        return {
+            '_': 'SavedReactionTags',
+            'tags': [] if self.tags is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.tags],
+            'hash': self.hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\n\x95Y2',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.tags)),b''.join(x._bytes() for x in self.tags),
+            struct.pack('<q', self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _tags = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _tags.append(_x)
+
+        _hash = reader.read_long()
+        return cls(tags=_tags, hash=_hash)
+
+
+class SavedReactionTagsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x889b59ef
+    SUBCLASS_OF_ID = 0xa39b5be3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SavedReactionTagsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xefY\x9b\x88',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessagesFilter
+
+
+
+class SearchCounter(TLObject):
+    CONSTRUCTOR_ID = 0xe844ebff
+    SUBCLASS_OF_ID = 0xd6a7bfa2
+    __slots__ = ('filter', 'count', 'inexact')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, filter: 'TypeMessagesFilter', count: int, inexact: Optional[bool]=None):
+        """
+        Constructor for messages.SearchCounter: Instance of SearchCounter.
+        """
+        self.filter = filter
+        self.count = count
+        self.inexact = inexact
+
+    def to_dict(self):
+        return {
+            '_': 'SearchCounter',
+            'filter': self.filter.to_dict() if isinstance(self.filter, TLObject) else self.filter,
+            'count': self.count,
+            'inexact': self.inexact
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xff\xebD\xe8',
+            struct.pack('<I', (0 if self.inexact is None or self.inexact is False else 2)),
+            self.filter._bytes(),
+            struct.pack('<i', self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _inexact = bool(flags & 2)
+        _filter = reader.tgread_object()
+        _count = reader.read_int()
+        return cls(filter=_filter, count=_count, inexact=_inexact)
+
@@ -0,0 +1,96 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeMessage, TypeSearchResultsCalendarPeriod, TypeUser
+
+
+
+class SearchResultsCalendar(TLObject):
+    CONSTRUCTOR_ID = 0x147ee23c
+    SUBCLASS_OF_ID = 0x92c5640f
+    __slots__ = ('count', 'min_date', 'min_msg_id', 'periods', 'messages', 'chats', 'users', 'inexact', 'offset_id_offset')
+
+    def __init__(self, count: int, min_date: Optional[datetime], min_msg_id: int, periods: List['TypeSearchResultsCalendarPeriod'], messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser'], inexact: Optional[bool]=None, offset_id_offset: Optional[int]=None):
+        """
+        Constructor for messages.SearchResultsCalendar: Instance of SearchResultsCalendar.
+        """
+        self.count = count
+        self.min_date = min_date
+        self.min_msg_id = min_msg_id
+        self.periods = periods
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+        self.inexact = inexact
+        self.offset_id_offset = offset_id_offset
+
+    def to_dict(self):
+        return {
+            '_': 'SearchResultsCalendar',
+            'count': self.count,
+            'min_date': self.min_date,
+            'min_msg_id': self.min_msg_id,
+            'periods': [] if self.periods is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.periods],
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'inexact': self.inexact,
+            'offset_id_offset': self.offset_id_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'<\xe2~\x14',
+            _struct_Ii.pack((0 if self.inexact is None or self.inexact is False else 1) | (0 if self.offset_id_offset is None or self.offset_id_offset is False else 2), self.count),
+            self.serialize_datetime(self.min_date),
+            struct.pack('<i', self.min_msg_id),
+            b'' if self.offset_id_offset is None or self.offset_id_offset is False else (struct.pack('<i', self.offset_id_offset)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.periods)),b''.join(x._bytes() for x in self.periods),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count = reader.read_struct(_struct_ii)
+        _inexact = bool(flags & 1)
+        _min_date = reader.tgread_date()
+        _min_msg_id = reader.read_int()
+        if flags & 2:
+            _offset_id_offset = reader.read_int()
+        else:
+            _offset_id_offset = None
+        reader.read_int()
+        _periods = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _periods.append(_x)
+
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, min_date=_min_date, min_msg_id=_min_msg_id, periods=_periods, messages=_messages, chats=_chats, users=_users, inexact=_inexact, offset_id_offset=_offset_id_offset)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSearchResultsPosition
+
+
+
+class SearchResultsPositions(TLObject):
+    CONSTRUCTOR_ID = 0x53b22baf
+    SUBCLASS_OF_ID = 0xd963708d
+    __slots__ = ('count', 'positions')
+
+    def __init__(self, count: int, positions: List['TypeSearchResultsPosition']):
+        """
+        Constructor for messages.SearchResultsPositions: Instance of SearchResultsPositions.
+        """
+        self.count = count
+        self.positions = positions
+
+    def to_dict(self):
+        return {
+            '_': 'SearchResultsPositions',
+            'count': self.count,
+            'positions': [] if self.positions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.positions]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xaf+\xb2S',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.positions)),b''.join(x._bytes() for x in self.positions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _positions = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _positions.append(_x)
+
+        return cls(count=_count, positions=_positions)
+
@@ -0,0 +1,72 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeEncryptedFile
+
+
+
+class SentEncryptedFile(TLObject):
+    CONSTRUCTOR_ID = 0x9493ff32
+    SUBCLASS_OF_ID = 0xc99e3e50
+    __slots__ = ('date', 'file')
+
+    def __init__(self, date: Optional[datetime], file: 'TypeEncryptedFile'):
+        """
+        Constructor for messages.SentEncryptedMessage: Instance of either SentEncryptedMessage, SentEncryptedFile.
+        """
+        self.date = date
+        self.file = file
+
+    def to_dict(self):
+        return {
+            '_': 'SentEncryptedFile',
+            'date': self.date,
+            'file': self.file.to_dict() if isinstance(self.file, TLObject) else self.file
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'2\xff\x93\x94',
+            self.serialize_datetime(self.date),
+            self.file._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _date = reader.tgread_date()
+        _file = reader.tgread_object()
+        return cls(date=_date, file=_file)
+
+
+class SentEncryptedMessage(TLObject):
+    CONSTRUCTOR_ID = 0x560f8935
+    SUBCLASS_OF_ID = 0xc99e3e50
+    __slots__ = ('date',)
+
+    def __init__(self, date: Optional[datetime]):
+        """
+        Constructor for messages.SentEncryptedMessage: Instance of either SentEncryptedMessage, SentEncryptedFile.
+        """
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'SentEncryptedMessage',
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'5\x89\x0fV',
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _date = reader.tgread_date()
+        return cls(date=_date)
+
@@ -0,0 +1,92 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeSponsoredMessage, TypeUser
+
+
+
+class SponsoredMessages(TLObject):
+    CONSTRUCTOR_ID = 0xc9ee1d87
+    SUBCLASS_OF_ID = 0x7f4169e0
+    __slots__ = ('messages', 'chats', 'users', 'posts_between')
+
+    def __init__(self, messages: List['TypeSponsoredMessage'], chats: List['TypeChat'], users: List['TypeUser'], posts_between: Optional[int]=None):
+        """
+        Constructor for messages.SponsoredMessages: Instance of either SponsoredMessages, SponsoredMessagesEmpty.
+        """
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+        self.posts_between = posts_between
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredMessages',
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'posts_between': self.posts_between
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x87\x1d\xee\xc9',
+            struct.pack('<I', (0 if self.posts_between is None or self.posts_between is False else 1)),
+            b'' if self.posts_between is None or self.posts_between is False else (struct.pack('<i', self.posts_between)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _posts_between = reader.read_int()
+        else:
+            _posts_between = None
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(messages=_messages, chats=_chats, users=_users, posts_between=_posts_between)
+
+
+class SponsoredMessagesEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x1839490f
+    SUBCLASS_OF_ID = 0x7f4169e0
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredMessagesEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0fI9\x18',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument
+
+
+
+class Stickers(TLObject):
+    CONSTRUCTOR_ID = 0x30a6ec7e
+    SUBCLASS_OF_ID = 0xd73bb9de
+    __slots__ = ('hash', 'stickers')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, stickers: List['TypeDocument']):
+        """
+        Constructor for messages.Stickers: Instance of either StickersNotModified, Stickers.
+        """
+        self.hash = hash
+        self.stickers = stickers
+
+    def to_dict(self):
+        return {
+            '_': 'Stickers',
+            'hash': self.hash,
+            'stickers': [] if self.stickers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stickers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\xec\xa60',
+            struct.pack('<q', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stickers)),b''.join(x._bytes() for x in self.stickers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_long()
+        reader.read_int()
+        _stickers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _stickers.append(_x)
+
+        return cls(hash=_hash, stickers=_stickers)
+
+
+class StickersNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xf1749a22
+    SUBCLASS_OF_ID = 0xd73bb9de
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StickersNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'"\x9at\xf1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
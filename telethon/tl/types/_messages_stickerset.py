@@ -0,0 +1,87 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeStickerKeyword, TypeStickerPack, TypeStickerSet
+
+
+
+class StickerSet(TLObject):
+    CONSTRUCTOR_ID = 0x6e153f16
+    SUBCLASS_OF_ID = 0x9b704a5a
+    __slots__ = ('set', 'packs', 'keywords', 'documents')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, set: 'TypeStickerSet', packs: List['TypeStickerPack'], keywords: List['TypeStickerKeyword'], documents: List['TypeDocument']):
+        """
+        Constructor for messages.StickerSet: Instance of either StickerSet, StickerSetNotModified.
+        """
+        self.set = set
+        self.packs = packs
+        self.keywords = keywords
+        self.documents = documents
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSet',
+            'set': self.set.to_dict() if isinstance(self.set, TLObject) else self.set,
+            'packs': [] if self.packs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.packs],
+            'keywords': [] if self.keywords is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.keywords],
+            'documents': [] if self.documents is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.documents]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x16?\x15n',
+            self.set._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.packs)),b''.join(x._bytes() for x in self.packs),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.keywords)),b''.join(x._bytes() for x in self.keywords),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.documents)),b''.join(x._bytes() for x in self.documents),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _set = reader.tgread_object()
+        reader.read_int()
+        _packs = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _packs.append(_x)
+
+        reader.read_int()
+        _keywords = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _keywords.append(_x)
+
+        reader.read_int()
+        _documents = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _documents.append(_x)
+
+        return cls(set=_set, packs=_packs, keywords=_keywords, documents=_documents)
+
+
+class StickerSetNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xd3f924eb
+    SUBCLASS_OF_ID = 0x9b704a5a
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSetNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeb$\xf9\xd3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,64 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStickerSetCovered
+
+
+
+class StickerSetInstallResultArchive(TLObject):
+    CONSTRUCTOR_ID = 0x35e410a8
+    SUBCLASS_OF_ID = 0x67cb3fe8
+    __slots__ = ('sets',)
+
+    def __init__(self, sets: List['TypeStickerSetCovered']):
+        """
+        Constructor for messages.StickerSetInstallResult: Instance of either StickerSetInstallResultSuccess, StickerSetInstallResultArchive.
+        """
+        self.sets = sets
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSetInstallResultArchive',
+            'sets': [] if self.sets is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.sets]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa8\x10\xe45',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.sets)),b''.join(x._bytes() for x in self.sets),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _sets = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _sets.append(_x)
+
+        return cls(sets=_sets)
+
+
+class StickerSetInstallResultSuccess(TLObject):
+    CONSTRUCTOR_ID = 0x38641628
+    SUBCLASS_OF_ID = 0x67cb3fe8
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSetInstallResultSuccess'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'(\x16d8',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
@@ -0,0 +1,61 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class TranscribedAudio(TLObject):
+    CONSTRUCTOR_ID = 0xcfb9d957
+    SUBCLASS_OF_ID = 0x21b24936
+    __slots__ = ('transcription_id', 'text', 'pending', 'trial_remains_num', 'trial_remains_until_date')
+
+    def __init__(self, transcription_id: int, text: str, pending: Optional[bool]=None, trial_remains_num: Optional[int]=None, trial_remains_until_date: Optional[datetime]=None):
+        """
+        Constructor for messages.TranscribedAudio: Instance of TranscribedAudio.
+        """
+        self.transcription_id = transcription_id
+        self.text = text
+        self.pending = pending
+        self.trial_remains_num = trial_remains_num
+        self.trial_remains_until_date = trial_remains_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'TranscribedAudio',
+            'transcription_id': self.transcription_id,
+            'text': self.text,
+            'pending': self.pending,
+            'trial_remains_num': self.trial_remains_num,
+            'trial_remains_until_date': self.trial_remains_until_date
+        }
+
+    def _bytes(self):
+        assert ((self.trial_remains_num or self.trial_remains_num is not None) and (self.trial_remains_until_date or self.trial_remains_until_date is not None)) or ((self.trial_remains_num is None or self.trial_remains_num is False) and (self.trial_remains_until_date is None or self.trial_remains_until_date is False)), 'trial_remains_num, trial_remains_until_date parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'W\xd9\xb9\xcf',
+            _struct_Iq.pack((0 if self.pending is None or self.pending is False else 1) | (0 if self.trial_remains_num is None or self.trial_remains_num is False else 2) | (0 if self.trial_remains_until_date is None or self.trial_remains_until_date is False else 2), self.transcription_id),
+            self.serialize_bytes(self.text),
+            b'' if self.trial_remains_num is None or self.trial_remains_num is False else (struct.pack('<i', self.trial_remains_num)),
+            b'' if self.trial_remains_until_date is None or self.trial_remains_until_date is False else (self.serialize_datetime(self.trial_remains_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _transcription_id = reader.read_struct(_struct_iq)
+        _pending = bool(flags & 1)
+        _text = reader.tgread_string()
+        if flags & 2:
+            _trial_remains_num = reader.read_int()
+        else:
+            _trial_remains_num = None
+        if flags & 2:
+            _trial_remains_until_date = reader.tgread_date()
+        else:
+            _trial_remains_until_date = None
+        return cls(transcription_id=_transcription_id, text=_text, pending=_pending, trial_remains_num=_trial_remains_num, trial_remains_until_date=_trial_remains_until_date)
+
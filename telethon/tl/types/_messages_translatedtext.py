@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeTextWithEntities
+
+
+
+class TranslateResult(TLObject):
+    CONSTRUCTOR_ID = 0x33db32f8
+    SUBCLASS_OF_ID = 0x24243e8
+    __slots__ = ('result',)
+
+    def __init__(self, result: List['TypeTextWithEntities']):
+        """
+        Constructor for messages.TranslatedText: Instance of TranslateResult.
+        """
+        self.result = result
+
+    def to_dict(self):
+        return {
+            '_': 'TranslateResult',
+            'result': [] if self.result is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.result]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf82\xdb3',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.result)),b''.join(x._bytes() for x in self.result),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _result = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _result.append(_x)
+
+        return cls(result=_result)
+
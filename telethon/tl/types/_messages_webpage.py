@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeUser, TypeWebPage
+
+
+
+class WebPage(TLObject):
+    CONSTRUCTOR_ID = 0xfd5e12bd
+    SUBCLASS_OF_ID = 0x2cf8b154
+    __slots__ = ('webpage', 'chats', 'users')
+
+    def __init__(self, webpage: 'TypeWebPage', chats: List['TypeChat'], users: List['TypeUser']):
+        """
+        Constructor for messages.WebPage: Instance of WebPage.
+        """
+        self.webpage = webpage
+        self.chats = chats
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'WebPage',
+            'webpage': self.webpage.to_dict() if isinstance(self.webpage, TLObject) else self.webpage,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbd\x12^\xfd',
+            self.webpage._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _webpage = reader.tgread_object()
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(webpage=_webpage, chats=_chats, users=_users)
+
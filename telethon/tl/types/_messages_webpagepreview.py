@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageMedia, TypeUser
+
+
+
+class WebPagePreview(TLObject):
+    CONSTRUCTOR_ID = 0xb53e8b21
+    SUBCLASS_OF_ID = 0xe29410c2
+    __slots__ = ('media', 'users')
+
+    def __init__(self, media: 'TypeMessageMedia', users: List['TypeUser']):
+        """
+        Constructor for messages.WebPagePreview: Instance of WebPagePreview.
+        """
+        self.media = media
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'WebPagePreview',
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'!\x8b>\xb5',
+            self.media._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _media = reader.tgread_object()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(media=_media, users=_users)
+
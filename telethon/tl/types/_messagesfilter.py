@@ -0,0 +1,359 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputMessagesFilterChatPhotos(TLObject):
+    CONSTRUCTOR_ID = 0x3a20ecb8
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterChatPhotos'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb8\xec :',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterContacts(TLObject):
+    CONSTRUCTOR_ID = 0xe062db83
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterContacts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x83\xdbb\xe0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterDocument(TLObject):
+    CONSTRUCTOR_ID = 0x9eddf188
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterDocument'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x88\xf1\xdd\x9e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x57e2f66c
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'l\xf6\xe2W',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterGeo(TLObject):
+    CONSTRUCTOR_ID = 0xe7026d0d
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterGeo'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\rm\x02\xe7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterGif(TLObject):
+    CONSTRUCTOR_ID = 0xffc86587
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterGif'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x87e\xc8\xff',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterMusic(TLObject):
+    CONSTRUCTOR_ID = 0x3751b49e
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterMusic'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9e\xb4Q7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterMyMentions(TLObject):
+    CONSTRUCTOR_ID = 0xc1f8e69a
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterMyMentions'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9a\xe6\xf8\xc1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterPhoneCalls(TLObject):
+    CONSTRUCTOR_ID = 0x80c99768
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ('missed',)
+
+    def __init__(self, missed: Optional[bool]=None):
+        """
+        Constructor for MessagesFilter: Instance of either InputMessagesFilterEmpty, InputMessagesFilterPhotos, InputMessagesFilterVideo, InputMessagesFilterPhotoVideo, InputMessagesFilterDocument, InputMessagesFilterUrl, InputMessagesFilterGif, InputMessagesFilterVoice, InputMessagesFilterMusic, InputMessagesFilterChatPhotos, InputMessagesFilterPhoneCalls, InputMessagesFilterRoundVoice, InputMessagesFilterRoundVideo, InputMessagesFilterMyMentions, InputMessagesFilterGeo, InputMessagesFilterContacts, InputMessagesFilterPinned.
+        """
+        self.missed = missed
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterPhoneCalls',
+            'missed': self.missed
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'h\x97\xc9\x80',
+            struct.pack('<I', (0 if self.missed is None or self.missed is False else 1)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _missed = bool(flags & 1)
+        return cls(missed=_missed)
+
+
+class InputMessagesFilterPhotoVideo(TLObject):
+    CONSTRUCTOR_ID = 0x56e9f0e4
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterPhotoVideo'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4\xf0\xe9V',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterPhotos(TLObject):
+    CONSTRUCTOR_ID = 0x9609a51c
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterPhotos'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1c\xa5\t\x96',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterPinned(TLObject):
+    CONSTRUCTOR_ID = 0x1bb00451
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterPinned'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Q\x04\xb0\x1b',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterRoundVideo(TLObject):
+    CONSTRUCTOR_ID = 0xb549da53
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterRoundVideo'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'S\xdaI\xb5',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterRoundVoice(TLObject):
+    CONSTRUCTOR_ID = 0x7a7c17a4
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterRoundVoice'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa4\x17|z',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterUrl(TLObject):
+    CONSTRUCTOR_ID = 0x7ef0dd87
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterUrl'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x87\xdd\xf0~',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterVideo(TLObject):
+    CONSTRUCTOR_ID = 0x9fc00e65
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterVideo'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'e\x0e\xc0\x9f',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputMessagesFilterVoice(TLObject):
+    CONSTRUCTOR_ID = 0x50f5c392
+    SUBCLASS_OF_ID = 0x8a36ec14
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputMessagesFilterVoice'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x92\xc3\xf5P',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeMessagesFilter = Union[InputMessagesFilterEmpty,InputMessagesFilterPhotos,InputMessagesFilterVideo,InputMessagesFilterPhotoVideo,InputMessagesFilterDocument,InputMessagesFilterUrl,InputMessagesFilterGif,InputMessagesFilterVoice,InputMessagesFilterMusic,InputMessagesFilterChatPhotos,InputMessagesFilterPhoneCalls,InputMessagesFilterRoundVoice,InputMessagesFilterRoundVideo,InputMessagesFilterMyMentions,InputMessagesFilterGeo,InputMessagesFilterContacts,InputMessagesFilterPinned]
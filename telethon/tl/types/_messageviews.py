@@ -0,0 +1,60 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageReplies
+
+
+
+class MessageViews(TLObject):
+    CONSTRUCTOR_ID = 0x455b853d
+    SUBCLASS_OF_ID = 0x3cb083b9
+    __slots__ = ('views', 'forwards', 'replies')
+
+    def __init__(self, views: Optional[int]=None, forwards: Optional[int]=None, replies: Optional['TypeMessageReplies']=None):
+        """
+        Constructor for MessageViews: Instance of MessageViews.
+        """
+        self.views = views
+        self.forwards = forwards
+        self.replies = replies
+
+    def to_dict(self):
+        return {
+            '_': 'MessageViews',
+            'views': self.views,
+            'forwards': self.forwards,
+            'replies': self.replies.to_dict() if isinstance(self.replies, TLObject) else self.replies
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'=\x85[E',
+            struct.pack('<I', (0 if self.views is None or self.views is False else 1) | (0 if self.forwards is None or self.forwards is False else 2) | (0 if self.replies is None or self.replies is False else 4)),
+            b'' if self.views is None or self.views is False else (struct.pack('<i', self.views)),
+            b'' if self.forwards is None or self.forwards is False else (struct.pack('<i', self.forwards)),
+            b'' if self.replies is None or self.replies is False else (self.replies._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _views = reader.read_int()
+        else:
+            _views = None
+        if flags & 2:
+            _forwards = reader.read_int()
+        else:
+            _forwards = None
+        if flags & 4:
+            _replies = reader.tgread_object()
+        else:
+            _replies = None
+        return cls(views=_views, forwards=_forwards, replies=_replies)
+
+TypeMessageViews = MessageViews
@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class MissingInvitee(TLObject):
+    CONSTRUCTOR_ID = 0x628c9224
+    SUBCLASS_OF_ID = 0x5c8cacdc
+    __slots__ = ('user_id', 'premium_would_allow_invite', 'premium_required_for_pm')
+
+    def __init__(self, user_id: int, premium_would_allow_invite: Optional[bool]=None, premium_required_for_pm: Optional[bool]=None):
+        """
+        Constructor for MissingInvitee: Instance of MissingInvitee.
+        """
+        self.user_id = user_id
+        self.premium_would_allow_invite = premium_would_allow_invite
+        self.premium_required_for_pm = premium_required_for_pm
+
+    def to_dict(self):
+        return {
+            '_': 'MissingInvitee',
+            'user_id': self.user_id,
+            'premium_would_allow_invite': self.premium_would_allow_invite,
+            'premium_required_for_pm': self.premium_required_for_pm
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'$\x92\x8cb',
+            _struct_Iq.pack((0 if self.premium_would_allow_invite is None or self.premium_would_allow_invite is False else 1) | (0 if self.premium_required_for_pm is None or self.premium_required_for_pm is False else 2), self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id = reader.read_struct(_struct_iq)
+        _premium_would_allow_invite = bool(flags & 1)
+        _premium_required_for_pm = bool(flags & 2)
+        return cls(user_id=_user_id, premium_would_allow_invite=_premium_would_allow_invite, premium_required_for_pm=_premium_required_for_pm)
+
+TypeMissingInvitee = MissingInvitee
@@ -0,0 +1,81 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qii = struct.Struct('<qii')
+_struct_qqii = struct.Struct('<qqii')
+
+
+class MsgDetailedInfo(TLObject):
+    CONSTRUCTOR_ID = 0x276d3ec6
+    SUBCLASS_OF_ID = 0x5f32d5ee
+    __slots__ = ('msg_id', 'answer_msg_id', 'bytes', 'status')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, msg_id: int, answer_msg_id: int, bytes: int, status: int):
+        """
+        Constructor for MsgDetailedInfo: Instance of either MsgDetailedInfo, MsgNewDetailedInfo.
+        """
+        self.msg_id = msg_id
+        self.answer_msg_id = answer_msg_id
+        self.bytes = bytes
+        self.status = status
+
+    def to_dict(self):
+        return {
+            '_': 'MsgDetailedInfo',
+            'msg_id': self.msg_id,
+            'answer_msg_id': self.answer_msg_id,
+            'bytes': self.bytes,
+            'status': self.status
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"\xc6>m'",
+            _struct_qqii.pack(self.msg_id, self.answer_msg_id, self.bytes, self.status),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _msg_id, _answer_msg_id, _bytes, _status = reader.read_struct(_struct_qqii)
+        return cls(msg_id=_msg_id, answer_msg_id=_answer_msg_id, bytes=_bytes, status=_status)
+
+
+class MsgNewDetailedInfo(TLObject):
+    CONSTRUCTOR_ID = 0x809db6df
+    SUBCLASS_OF_ID = 0x5f32d5ee
+    __slots__ = ('answer_msg_id', 'bytes', 'status')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, answer_msg_id: int, bytes: int, status: int):
+        """
+        Constructor for MsgDetailedInfo: Instance of either MsgDetailedInfo, MsgNewDetailedInfo.
+        """
+        self.answer_msg_id = answer_msg_id
+        self.bytes = bytes
+        self.status = status
+
+    def to_dict(self):
+        return {
+            '_': 'MsgNewDetailedInfo',
+            'answer_msg_id': self.answer_msg_id,
+            'bytes': self.bytes,
+            'status': self.status
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdf\xb6\x9d\x80',
+            _struct_qii.pack(self.answer_msg_id, self.bytes, self.status),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _answer_msg_id, _bytes, _status = reader.read_struct(_struct_qii)
+        return cls(answer_msg_id=_answer_msg_id, bytes=_bytes, status=_status)
+
+TypeMsgDetailedInfo = Union[MsgDetailedInfo,MsgNewDetailedInfo]
@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class MsgsAllInfo(TLObject):
+    CONSTRUCTOR_ID = 0x8cc0d131
+    SUBCLASS_OF_ID = 0xfa8fcb54
+    __slots__ = ('msg_ids', 'info')
+
+    def __init__(self, msg_ids: List[int], info: str):
+        """
+        Constructor for MsgsAllInfo: Instance of MsgsAllInfo.
+        """
+        self.msg_ids = msg_ids
+        self.info = info
+
+    def to_dict(self):
+        return {
+            '_': 'MsgsAllInfo',
+            'msg_ids': [] if self.msg_ids is None else self.msg_ids[:],
+            'info': self.info
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'1\xd1\xc0\x8c',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.msg_ids)), len(self.msg_ids), *self.msg_ids),
+            self.serialize_bytes(self.info),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _msg_ids = reader.read_array('q', reader.read_int())
+        _info = reader.tgread_string()
+        return cls(msg_ids=_msg_ids, info=_info)
+
+TypeMsgsAllInfo = MsgsAllInfo
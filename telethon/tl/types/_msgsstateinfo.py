@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class MsgsStateInfo(TLObject):
+    CONSTRUCTOR_ID = 0x4deb57d
+    SUBCLASS_OF_ID = 0x70a0a64
+    __slots__ = ('req_msg_id', 'info')
+
+    def __init__(self, req_msg_id: int, info: str):
+        """
+        Constructor for MsgsStateInfo: Instance of MsgsStateInfo.
+        """
+        self.req_msg_id = req_msg_id
+        self.info = info
+
+    def to_dict(self):
+        return {
+            '_': 'MsgsStateInfo',
+            'req_msg_id': self.req_msg_id,
+            'info': self.info
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'}\xb5\xde\x04',
+            struct.pack('<q', self.req_msg_id),
+            self.serialize_bytes(self.info),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _req_msg_id = reader.read_long()
+        _info = reader.tgread_string()
+        return cls(req_msg_id=_req_msg_id, info=_info)
+
+TypeMsgsStateInfo = MsgsStateInfo
@@ -0,0 +1,38 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class MsgsStateReq(TLObject):
+    CONSTRUCTOR_ID = 0xda69fb52
+    SUBCLASS_OF_ID = 0x18f01dd0
+    __slots__ = ('msg_ids',)
+
+    def __init__(self, msg_ids: List[int]):
+        """
+        Constructor for MsgsStateReq: Instance of MsgsStateReq.
+        """
+        self.msg_ids = msg_ids
+
+    def to_dict(self):
+        return {
+            '_': 'MsgsStateReq',
+            'msg_ids': [] if self.msg_ids is None else self.msg_ids[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'R\xfbi\xda',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.msg_ids)), len(self.msg_ids), *self.msg_ids),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _msg_ids = reader.read_array('q', reader.read_int())
+        return cls(msg_ids=_msg_ids)
+
+TypeMsgsStateReq = MsgsStateReq
@@ -0,0 +1,65 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class MyBoost(TLObject):
+    CONSTRUCTOR_ID = 0xc448415c
+    SUBCLASS_OF_ID = 0xc51a68bf
+    __slots__ = ('slot', 'date', 'expires', 'peer', 'cooldown_until_date')
+
+    def __init__(self, slot: int, date: Optional[datetime], expires: Optional[datetime], peer: Optional['TypePeer']=None, cooldown_until_date: Optional[datetime]=None):
+        """
+        Constructor for MyBoost: Instance of MyBoost.
+        """
+        self.slot = slot
+        self.date = date
+        self.expires = expires
+        self.peer = peer
+        self.cooldown_until_date = cooldown_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'MyBoost',
+            'slot': self.slot,
+            'date': self.date,
+            'expires': self.expires,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'cooldown_until_date': self.cooldown_until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\AH\xc4',
+            _struct_Ii.pack((0 if self.peer is None or self.peer is False else 1) | (0 if self.cooldown_until_date is None or self.cooldown_until_date is False else 2), self.slot),
+            b'' if self.peer is None or self.peer is False else (self.peer._bytes()),
+            self.serialize_datetime(self.date),
+            self.serialize_datetime(self.expires),
+            b'' if self.cooldown_until_date is None or self.cooldown_until_date is False else (self.serialize_datetime(self.cooldown_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _slot = reader.read_struct(_struct_ii)
+        if flags & 1:
+            _peer = reader.tgread_object()
+        else:
+            _peer = None
+        _date = reader.tgread_date()
+        _expires = reader.tgread_date()
+        if flags & 2:
+            _cooldown_until_date = reader.tgread_date()
+        else:
+            _cooldown_until_date = None
+        return cls(slot=_slot, date=_date, expires=_expires, peer=_peer, cooldown_until_date=_cooldown_until_date)
+
+TypeMyBoost = MyBoost
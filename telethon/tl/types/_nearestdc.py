@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class NearestDc(TLObject):
+    CONSTRUCTOR_ID = 0x8e1a1775
+    SUBCLASS_OF_ID = 0x3877045f
+    __slots__ = ('country', 'this_dc', 'nearest_dc')
+
+    def __init__(self, country: str, this_dc: int, nearest_dc: int):
+        """
+        Constructor for NearestDc: Instance of NearestDc.
+        """
+        self.country = country
+        self.this_dc = this_dc
+        self.nearest_dc = nearest_dc
+
+    def to_dict(self):
+        return {
+            '_': 'NearestDc',
+            'country': self.country,
+            'this_dc': self.this_dc,
+            'nearest_dc': self.nearest_dc
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'u\x17\x1a\x8e',
+            self.serialize_bytes(self.country),
+            _struct_ii.pack(self.this_dc, self.nearest_dc),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _country = reader.tgread_string()
+        _this_dc, _nearest_dc = reader.read_struct(_struct_ii)
+        return cls(country=_country, this_dc=_this_dc, nearest_dc=_nearest_dc)
+
+TypeNearestDc = NearestDc
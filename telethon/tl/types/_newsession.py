@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qqq = struct.Struct('<qqq')
+
+
+class NewSessionCreated(TLObject):
+    CONSTRUCTOR_ID = 0x9ec20908
+    SUBCLASS_OF_ID = 0x510d3031
+    __slots__ = ('first_msg_id', 'unique_id', 'server_salt')
+
+    def __init__(self, first_msg_id: int, unique_id: int, server_salt: int):
+        """
+        Constructor for NewSession: Instance of NewSessionCreated.
+        """
+        self.first_msg_id = first_msg_id
+        self.unique_id = unique_id
+        self.server_salt = server_salt
+
+    def to_dict(self):
+        return {
+            '_': 'NewSessionCreated',
+            'first_msg_id': self.first_msg_id,
+            'unique_id': self.unique_id,
+            'server_salt': self.server_salt
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08\t\xc2\x9e',
+            _struct_qqq.pack(self.first_msg_id, self.unique_id, self.server_salt),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _first_msg_id, _unique_id, _server_salt = reader.read_struct(_struct_qqq)
+        return cls(first_msg_id=_first_msg_id, unique_id=_unique_id, server_salt=_server_salt)
+
+TypeNewSession = NewSessionCreated
@@ -0,0 +1,111 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class NotificationSoundDefault(TLObject):
+    CONSTRUCTOR_ID = 0x97e8bebe
+    SUBCLASS_OF_ID = 0xf2f5e55b
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'NotificationSoundDefault'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbe\xbe\xe8\x97',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class NotificationSoundLocal(TLObject):
+    CONSTRUCTOR_ID = 0x830b9ae4
+    SUBCLASS_OF_ID = 0xf2f5e55b
+    __slots__ = ('title', 'data')
+
+    def __init__(self, title: str, data: str):
+        """
+        Constructor for NotificationSound: Instance of either NotificationSoundDefault, NotificationSoundNone, NotificationSoundLocal, NotificationSoundRingtone.
+        """
+        self.title = title
+        self.data = data
+
+    def to_dict(self):
+        return {
+            '_': 'NotificationSoundLocal',
+            'title': self.title,
+            'data': self.data
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4\x9a\x0b\x83',
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.data),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        _data = reader.tgread_string()
+        return cls(title=_title, data=_data)
+
+
+class NotificationSoundNone(TLObject):
+    CONSTRUCTOR_ID = 0x6f0c34df
+    SUBCLASS_OF_ID = 0xf2f5e55b
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'NotificationSoundNone'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdf4\x0co',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class NotificationSoundRingtone(TLObject):
+    CONSTRUCTOR_ID = 0xff6c8049
+    SUBCLASS_OF_ID = 0xf2f5e55b
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for NotificationSound: Instance of either NotificationSoundDefault, NotificationSoundNone, NotificationSoundLocal, NotificationSoundRingtone.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'NotificationSoundRingtone',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'I\x80l\xff',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
+TypeNotificationSound = Union[NotificationSoundDefault,NotificationSoundNone,NotificationSoundLocal,NotificationSoundRingtone]
@@ -0,0 +1,133 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class NotifyBroadcasts(TLObject):
+    CONSTRUCTOR_ID = 0xd612e8ef
+    SUBCLASS_OF_ID = 0xdfe8602e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'NotifyBroadcasts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xef\xe8\x12\xd6',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class NotifyChats(TLObject):
+    CONSTRUCTOR_ID = 0xc007cec3
+    SUBCLASS_OF_ID = 0xdfe8602e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'NotifyChats'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc3\xce\x07\xc0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class NotifyForumTopic(TLObject):
+    CONSTRUCTOR_ID = 0x226e6308
+    SUBCLASS_OF_ID = 0xdfe8602e
+    __slots__ = ('peer', 'top_msg_id')
+
+    def __init__(self, peer: 'TypePeer', top_msg_id: int):
+        """
+        Constructor for NotifyPeer: Instance of either NotifyPeer, NotifyUsers, NotifyChats, NotifyBroadcasts, NotifyForumTopic.
+        """
+        self.peer = peer
+        self.top_msg_id = top_msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'NotifyForumTopic',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'top_msg_id': self.top_msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08cn"',
+            self.peer._bytes(),
+            struct.pack('<i', self.top_msg_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _top_msg_id = reader.read_int()
+        return cls(peer=_peer, top_msg_id=_top_msg_id)
+
+
+class NotifyPeer(TLObject):
+    CONSTRUCTOR_ID = 0x9fd40bd8
+    SUBCLASS_OF_ID = 0xdfe8602e
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypePeer'):
+        """
+        Constructor for NotifyPeer: Instance of either NotifyPeer, NotifyUsers, NotifyChats, NotifyBroadcasts, NotifyForumTopic.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'NotifyPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd8\x0b\xd4\x9f',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class NotifyUsers(TLObject):
+    CONSTRUCTOR_ID = 0xb4c83b4c
+    SUBCLASS_OF_ID = 0xdfe8602e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'NotifyUsers'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'L;\xc8\xb4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeNotifyPeer = Union[NotifyPeer,NotifyUsers,NotifyChats,NotifyBroadcasts,NotifyForumTopic]
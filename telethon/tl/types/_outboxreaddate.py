@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class OutboxReadDate(TLObject):
+    CONSTRUCTOR_ID = 0x3bb842ac
+    SUBCLASS_OF_ID = 0x6f5183c6
+    __slots__ = ('date',)
+
+    def __init__(self, date: Optional[datetime]):
+        """
+        Constructor for OutboxReadDate: Instance of OutboxReadDate.
+        """
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'OutboxReadDate',
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xacB\xb8;',
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _date = reader.tgread_date()
+        return cls(date=_date)
+
+TypeOutboxReadDate = OutboxReadDate
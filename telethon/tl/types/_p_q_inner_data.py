@@ -0,0 +1,220 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class PQInnerData(TLObject):
+    CONSTRUCTOR_ID = 0x83c95aec
+    SUBCLASS_OF_ID = 0x41701377
+    __slots__ = ('pq', 'p', 'q', 'nonce', 'server_nonce', 'new_nonce')
+
+    def __init__(self, pq: bytes, p: bytes, q: bytes, nonce: int, server_nonce: int, new_nonce: int):
+        """
+        Constructor for P_Q_inner_data: Instance of either PQInnerData, PQInnerDataDc, PQInnerDataTemp, PQInnerDataTempDc.
+        """
+        self.pq = pq
+        self.p = p
+        self.q = q
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce = new_nonce
+
+    def to_dict(self):
+        return {
+            '_': 'PQInnerData',
+            'pq': self.pq,
+            'p': self.p,
+            'q': self.q,
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce': self.new_nonce
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xecZ\xc9\x83',
+            self.serialize_bytes(self.pq),
+            self.serialize_bytes(self.p),
+            self.serialize_bytes(self.q),
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce.to_bytes(32, 'little', signed=True),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pq = reader.tgread_bytes()
+        _p = reader.tgread_bytes()
+        _q = reader.tgread_bytes()
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce = reader.read_large_int(bits=256)
+        return cls(pq=_pq, p=_p, q=_q, nonce=_nonce, server_nonce=_server_nonce, new_nonce=_new_nonce)
+
+
+class PQInnerDataDc(TLObject):
+    CONSTRUCTOR_ID = 0xa9f55f95
+    SUBCLASS_OF_ID = 0x41701377
+    __slots__ = ('pq', 'p', 'q', 'nonce', 'server_nonce', 'new_nonce', 'dc')
+
+    def __init__(self, pq: bytes, p: bytes, q: bytes, nonce: int, server_nonce: int, new_nonce: int, dc: int):
+        """
+        Constructor for P_Q_inner_data: Instance of either PQInnerData, PQInnerDataDc, PQInnerDataTemp, PQInnerDataTempDc.
+        """
+        self.pq = pq
+        self.p = p
+        self.q = q
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce = new_nonce
+        self.dc = dc
+
+    def to_dict(self):
+        return {
+            '_': 'PQInnerDataDc',
+            'pq': self.pq,
+            'p': self.p,
+            'q': self.q,
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce': self.new_nonce,
+            'dc': self.dc
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95_\xf5\xa9',
+            self.serialize_bytes(self.pq),
+            self.serialize_bytes(self.p),
+            self.serialize_bytes(self.q),
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce.to_bytes(32, 'little', signed=True),
+            struct.pack('<i', self.dc),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pq = reader.tgread_bytes()
+        _p = reader.tgread_bytes()
+        _q = reader.tgread_bytes()
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce = reader.read_large_int(bits=256)
+        _dc = reader.read_int()
+        return cls(pq=_pq, p=_p, q=_q, nonce=_nonce, server_nonce=_server_nonce, new_nonce=_new_nonce, dc=_dc)
+
+
+class PQInnerDataTemp(TLObject):
+    CONSTRUCTOR_ID = 0x3c6a84d4
+    SUBCLASS_OF_ID = 0x41701377
+    __slots__ = ('pq', 'p', 'q', 'nonce', 'server_nonce', 'new_nonce', 'expires_in')
+
+    def __init__(self, pq: bytes, p: bytes, q: bytes, nonce: int, server_nonce: int, new_nonce: int, expires_in: int):
+        """
+        Constructor for P_Q_inner_data: Instance of either PQInnerData, PQInnerDataDc, PQInnerDataTemp, PQInnerDataTempDc.
+        """
+        self.pq = pq
+        self.p = p
+        self.q = q
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce = new_nonce
+        self.expires_in = expires_in
+
+    def to_dict(self):
+        return {
+            '_': 'PQInnerDataTemp',
+            'pq': self.pq,
+            'p': self.p,
+            'q': self.q,
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce': self.new_nonce,
+            'expires_in': self.expires_in
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd4\x84j<',
+            self.serialize_bytes(self.pq),
+            self.serialize_bytes(self.p),
+            self.serialize_bytes(self.q),
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce.to_bytes(32, 'little', signed=True),
+            struct.pack('<i', self.expires_in),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pq = reader.tgread_bytes()
+        _p = reader.tgread_bytes()
+        _q = reader.tgread_bytes()
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce = reader.read_large_int(bits=256)
+        _expires_in = reader.read_int()
+        return cls(pq=_pq, p=_p, q=_q, nonce=_nonce, server_nonce=_server_nonce, new_nonce=_new_nonce, expires_in=_expires_in)
+
+
+class PQInnerDataTempDc(TLObject):
+    CONSTRUCTOR_ID = 0x56fddf88
+    SUBCLASS_OF_ID = 0x41701377
+    __slots__ = ('pq', 'p', 'q', 'nonce', 'server_nonce', 'new_nonce', 'dc', 'expires_in')
+
+    def __init__(self, pq: bytes, p: bytes, q: bytes, nonce: int, server_nonce: int, new_nonce: int, dc: int, expires_in: int):
+        """
+        Constructor for P_Q_inner_data: Instance of either PQInnerData, PQInnerDataDc, PQInnerDataTemp, PQInnerDataTempDc.
+        """
+        self.pq = pq
+        self.p = p
+        self.q = q
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce = new_nonce
+        self.dc = dc
+        self.expires_in = expires_in
+
+    def to_dict(self):
+        return {
+            '_': 'PQInnerDataTempDc',
+            'pq': self.pq,
+            'p': self.p,
+            'q': self.q,
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce': self.new_nonce,
+            'dc': self.dc,
+            'expires_in': self.expires_in
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x88\xdf\xfdV',
+            self.serialize_bytes(self.pq),
+            self.serialize_bytes(self.p),
+            self.serialize_bytes(self.q),
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce.to_bytes(32, 'little', signed=True),
+            _struct_ii.pack(self.dc, self.expires_in),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pq = reader.tgread_bytes()
+        _p = reader.tgread_bytes()
+        _q = reader.tgread_bytes()
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce = reader.read_large_int(bits=256)
+        _dc, _expires_in = reader.read_struct(_struct_ii)
+        return cls(pq=_pq, p=_p, q=_q, nonce=_nonce, server_nonce=_server_nonce, new_nonce=_new_nonce, dc=_dc, expires_in=_expires_in)
+
+TypeP_Q_inner_data = Union[PQInnerData,PQInnerDataDc,PQInnerDataTemp,PQInnerDataTempDc]
@@ -0,0 +1,86 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypePageBlock, TypePhoto
+
+
+
+class Page(TLObject):
+    CONSTRUCTOR_ID = 0x98657f0d
+    SUBCLASS_OF_ID = 0xb438191e
+    __slots__ = ('url', 'blocks', 'photos', 'documents', 'part', 'rtl', 'v2', 'views')
+
+    def __init__(self, url: str, blocks: List['TypePageBlock'], photos: List['TypePhoto'], documents: List['TypeDocument'], part: Optional[bool]=None, rtl: Optional[bool]=None, v2: Optional[bool]=None, views: Optional[int]=None):
+        """
+        Constructor for Page: Instance of Page.
+        """
+        self.url = url
+        self.blocks = blocks
+        self.photos = photos
+        self.documents = documents
+        self.part = part
+        self.rtl = rtl
+        self.v2 = v2
+        self.views = views
+
+    def to_dict(self):
+        return {
+            '_': 'Page',
+            'url': self.url,
+            'blocks': [] if self.blocks is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.blocks],
+            'photos': [] if self.photos is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.photos],
+            'documents': [] if self.documents is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.documents],
+            'part': self.part,
+            'rtl': self.rtl,
+            'v2': self.v2,
+            'views': self.views
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r\x7fe\x98',
+            struct.pack('<I', (0 if self.part is None or self.part is False else 1) | (0 if self.rtl is None or self.rtl is False else 2) | (0 if self.v2 is None or self.v2 is False else 4) | (0 if self.views is None or self.views is False else 8)),
+            self.serialize_bytes(self.url),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.blocks)),b''.join(x._bytes() for x in self.blocks),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.photos)),b''.join(x._bytes() for x in self.photos),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.documents)),b''.join(x._bytes() for x in self.documents),
+            b'' if self.views is None or self.views is False else (struct.pack('<i', self.views)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _part = bool(flags & 1)
+        _rtl = bool(flags & 2)
+        _v2 = bool(flags & 4)
+        _url = reader.tgread_string()
+        reader.read_int()
+        _blocks = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _blocks.append(_x)
+
+        reader.read_int()
+        _photos = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _photos.append(_x)
+
+        reader.read_int()
+        _documents = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _documents.append(_x)
+
+        if flags & 8:
+            _views = reader.read_int()
+        else:
+            _views = None
+        return cls(url=_url, blocks=_blocks, photos=_photos, documents=_documents, part=_part, rtl=_rtl, v2=_v2, views=_views)
+
+TypePage = Page
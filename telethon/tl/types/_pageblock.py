@@ -0,0 +1,1043 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iii = struct.Struct('<iii')
+_struct_iq = struct.Struct('<iq')
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeGeoPoint, TypePageCaption, TypePageListItem, TypePageListOrderedItem, TypePageRelatedArticle, TypePageTableRow, TypeRichText
+
+
+
+class PageBlockAnchor(TLObject):
+    CONSTRUCTOR_ID = 0xce0d37b0
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('name',)
+
+    def __init__(self, name: str):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.name = name
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockAnchor',
+            'name': self.name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb07\r\xce',
+            self.serialize_bytes(self.name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _name = reader.tgread_string()
+        return cls(name=_name)
+
+
+class PageBlockAudio(TLObject):
+    CONSTRUCTOR_ID = 0x804361ea
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('audio_id', 'caption')
+
+    def __init__(self, audio_id: int, caption: 'TypePageCaption'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.audio_id = audio_id
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockAudio',
+            'audio_id': self.audio_id,
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeaaC\x80',
+            struct.pack('<q', self.audio_id),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _audio_id = reader.read_long()
+        _caption = reader.tgread_object()
+        return cls(audio_id=_audio_id, caption=_caption)
+
+
+class PageBlockAuthorDate(TLObject):
+    CONSTRUCTOR_ID = 0xbaafe5e0
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('author', 'published_date')
+
+    def __init__(self, author: 'TypeRichText', published_date: Optional[datetime]):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.author = author
+        self.published_date = published_date
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockAuthorDate',
+            'author': self.author.to_dict() if isinstance(self.author, TLObject) else self.author,
+            'published_date': self.published_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe0\xe5\xaf\xba',
+            self.author._bytes(),
+            self.serialize_datetime(self.published_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _author = reader.tgread_object()
+        _published_date = reader.tgread_date()
+        return cls(author=_author, published_date=_published_date)
+
+
+class PageBlockBlockquote(TLObject):
+    CONSTRUCTOR_ID = 0x263d7c26
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text', 'caption')
+
+    def __init__(self, text: 'TypeRichText', caption: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockBlockquote',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'&|=&',
+            self.text._bytes(),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _caption = reader.tgread_object()
+        return cls(text=_text, caption=_caption)
+
+
+class PageBlockChannel(TLObject):
+    CONSTRUCTOR_ID = 0xef1751b5
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('channel',)
+
+    def __init__(self, channel: 'TypeChat'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.channel = channel
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockChannel',
+            'channel': self.channel.to_dict() if isinstance(self.channel, TLObject) else self.channel
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb5Q\x17\xef',
+            self.channel._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _channel = reader.tgread_object()
+        return cls(channel=_channel)
+
+
+class PageBlockCollage(TLObject):
+    CONSTRUCTOR_ID = 0x65a0fa4d
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('items', 'caption')
+
+    def __init__(self, items: List['TypePageBlock'], caption: 'TypePageCaption'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.items = items
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockCollage',
+            'items': [] if self.items is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.items],
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'M\xfa\xa0e',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.items)),b''.join(x._bytes() for x in self.items),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _items = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _items.append(_x)
+
+        _caption = reader.tgread_object()
+        return cls(items=_items, caption=_caption)
+
+
+class PageBlockCover(TLObject):
+    CONSTRUCTOR_ID = 0x39f23300
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('cover',)
+
+    def __init__(self, cover: 'TypePageBlock'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.cover = cover
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockCover',
+            'cover': self.cover.to_dict() if isinstance(self.cover, TLObject) else self.cover
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x003\xf29',
+            self.cover._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _cover = reader.tgread_object()
+        return cls(cover=_cover)
+
+
+class PageBlockDetails(TLObject):
+    CONSTRUCTOR_ID = 0x76768bed
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('blocks', 'title', 'open')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, blocks: List['TypePageBlock'], title: 'TypeRichText', open: Optional[bool]=None):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.blocks = blocks
+        self.title = title
+        self.open = open
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockDetails',
+            'blocks': [] if self.blocks is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.blocks],
+            'title': self.title.to_dict() if isinstance(self.title, TLObject) else self.title,
+            'open': self.open
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed\x8bvv',
+            struct.pack('<I', (0 if self.open is None or self.open is False else 1)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.blocks)),b''.join(x._bytes() for x in self.blocks),
+            self.title._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _open = bool(flags & 1)
+        reader.read_int()
+        _blocks = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _blocks.append(_x)
+
+        _title = reader.tgread_object()
+        return cls(blocks=_blocks, title=_title, open=_open)
+
+
+class PageBlockDivider(TLObject):
+    CONSTRUCTOR_ID = 0xdb20b188
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockDivider'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x88\xb1 \xdb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PageBlockEmbed(TLObject):
+    CONSTRUCTOR_ID = 0xa8718dc5
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('caption', 'full_width', 'allow_scrolling', 'url', 'html', 'poster_photo_id', 'w', 'h')
+
+    def __init__(self, caption: 'TypePageCaption', full_width: Optional[bool]=None, allow_scrolling: Optional[bool]=None, url: Optional[str]=None, html: Optional[str]=None, poster_photo_id: Optional[int]=None, w: Optional[int]=None, h: Optional[int]=None):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.caption = caption
+        self.full_width = full_width
+        self.allow_scrolling = allow_scrolling
+        self.url = url
+        self.html = html
+        self.poster_photo_id = poster_photo_id
+        self.w = w
+        self.h = h
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockEmbed',
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption,
+            'full_width': self.full_width,
+            'allow_scrolling': self.allow_scrolling,
+            'url': self.url,
+            'html': self.html,
+            'poster_photo_id': self.poster_photo_id,
+            'w': self.w,
+            'h': self.h
+        }
+
+    def _bytes(self):
+        assert ((self.w or self.w is not None) and (self.h or self.h is not None)) or ((self.w is None or self.w is False) and (self.h is None or self.h is False)), 'w, h parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xc5\x8dq\xa8',
+            struct.pack('<I', (0 if self.full_width is None or self.full_width is False else 1) | (0 if self.allow_scrolling is None or self.allow_scrolling is False else 8) | (0 if self.url is None or self.url is False else 2) | (0 if self.html is None or self.html is False else 4) | (0 if self.poster_photo_id is None or self.poster_photo_id is False else 16) | (0 if self.w is None or self.w is False else 32) | (0 if self.h is None or self.h is False else 32)),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+            b'' if self.html is None or self.html is False else (self.serialize_bytes(self.html)),
+            b'' if self.poster_photo_id is None or self.poster_photo_id is False else (struct.pack('<q', self.poster_photo_id)),
+            b'' if self.w is None or self.w is False else (struct.pack('<i', self.w)),
+            b'' if self.h is None or self.h is False else (struct.pack('<i', self.h)),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _full_width = bool(flags & 1)
+        _allow_scrolling = bool(flags & 8)
+        if flags & 2:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        if flags & 4:
+            _html = reader.tgread_string()
+        else:
+            _html = None
+        if flags & 16:
+            _poster_photo_id = reader.read_long()
+        else:
+            _poster_photo_id = None
+        if flags & 32:
+            _w = reader.read_int()
+        else:
+            _w = None
+        if flags & 32:
+            _h = reader.read_int()
+        else:
+            _h = None
+        _caption = reader.tgread_object()
+        return cls(caption=_caption, full_width=_full_width, allow_scrolling=_allow_scrolling, url=_url, html=_html, poster_photo_id=_poster_photo_id, w=_w, h=_h)
+
+
+class PageBlockEmbedPost(TLObject):
+    CONSTRUCTOR_ID = 0xf259a80b
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('url', 'webpage_id', 'author_photo_id', 'author', 'date', 'blocks', 'caption')
+
+    def __init__(self, url: str, webpage_id: int, author_photo_id: int, author: str, date: Optional[datetime], blocks: List['TypePageBlock'], caption: 'TypePageCaption'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.url = url
+        self.webpage_id = webpage_id
+        self.author_photo_id = author_photo_id
+        self.author = author
+        self.date = date
+        self.blocks = blocks
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockEmbedPost',
+            'url': self.url,
+            'webpage_id': self.webpage_id,
+            'author_photo_id': self.author_photo_id,
+            'author': self.author,
+            'date': self.date,
+            'blocks': [] if self.blocks is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.blocks],
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\xa8Y\xf2',
+            self.serialize_bytes(self.url),
+            _struct_qq.pack(self.webpage_id, self.author_photo_id),
+            self.serialize_bytes(self.author),
+            self.serialize_datetime(self.date),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.blocks)),b''.join(x._bytes() for x in self.blocks),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _webpage_id, _author_photo_id = reader.read_struct(_struct_qq)
+        _author = reader.tgread_string()
+        _date = reader.tgread_date()
+        reader.read_int()
+        _blocks = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _blocks.append(_x)
+
+        _caption = reader.tgread_object()
+        return cls(url=_url, webpage_id=_webpage_id, author_photo_id=_author_photo_id, author=_author, date=_date, blocks=_blocks, caption=_caption)
+
+
+class PageBlockFooter(TLObject):
+    CONSTRUCTOR_ID = 0x48870999
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockFooter',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x99\t\x87H',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class PageBlockHeader(TLObject):
+    CONSTRUCTOR_ID = 0xbfd064ec
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockHeader',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xecd\xd0\xbf',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class PageBlockKicker(TLObject):
+    CONSTRUCTOR_ID = 0x1e148390
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockKicker',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x90\x83\x14\x1e',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class PageBlockList(TLObject):
+    CONSTRUCTOR_ID = 0xe4e88011
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('items',)
+
+    def __init__(self, items: List['TypePageListItem']):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.items = items
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockList',
+            'items': [] if self.items is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.items]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x11\x80\xe8\xe4',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.items)),b''.join(x._bytes() for x in self.items),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _items = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _items.append(_x)
+
+        return cls(items=_items)
+
+
+class PageBlockMap(TLObject):
+    CONSTRUCTOR_ID = 0xa44f3ef6
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('geo', 'zoom', 'w', 'h', 'caption')
+
+    def __init__(self, geo: 'TypeGeoPoint', zoom: int, w: int, h: int, caption: 'TypePageCaption'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.geo = geo
+        self.zoom = zoom
+        self.w = w
+        self.h = h
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockMap',
+            'geo': self.geo.to_dict() if isinstance(self.geo, TLObject) else self.geo,
+            'zoom': self.zoom,
+            'w': self.w,
+            'h': self.h,
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf6>O\xa4',
+            self.geo._bytes(),
+            _struct_iii.pack(self.zoom, self.w, self.h),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _geo = reader.tgread_object()
+        _zoom, _w, _h = reader.read_struct(_struct_iii)
+        _caption = reader.tgread_object()
+        return cls(geo=_geo, zoom=_zoom, w=_w, h=_h, caption=_caption)
+
+
+class PageBlockOrderedList(TLObject):
+    CONSTRUCTOR_ID = 0x9a8ae1e1
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('items',)
+
+    def __init__(self, items: List['TypePageListOrderedItem']):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.items = items
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockOrderedList',
+            'items': [] if self.items is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.items]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe1\xe1\x8a\x9a',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.items)),b''.join(x._bytes() for x in self.items),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _items = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _items.append(_x)
+
+        return cls(items=_items)
+
+
+class PageBlockParagraph(TLObject):
+    CONSTRUCTOR_ID = 0x467a0766
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockParagraph',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'f\x07zF',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class PageBlockPhoto(TLObject):
+    CONSTRUCTOR_ID = 0x1759c560
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('photo_id', 'caption', 'url', 'webpage_id')
+
+    def __init__(self, photo_id: int, caption: 'TypePageCaption', url: Optional[str]=None, webpage_id: Optional[int]=None):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.photo_id = photo_id
+        self.caption = caption
+        self.url = url
+        self.webpage_id = webpage_id
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockPhoto',
+            'photo_id': self.photo_id,
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption,
+            'url': self.url,
+            'webpage_id': self.webpage_id
+        }
+
+    def _bytes(self):
+        assert ((self.url or self.url is not None) and (self.webpage_id or self.webpage_id is not None)) or ((self.url is None or self.url is False) and (self.webpage_id is None or self.webpage_id is False)), 'url, webpage_id parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'`\xc5Y\x17',
+            _struct_Iq.pack((0 if self.url is None or self.url is False else 1) | (0 if self.webpage_id is None or self.webpage_id is False else 1), self.photo_id),
+            self.caption._bytes(),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+            b'' if self.webpage_id is None or self.webpage_id is False else (struct.pack('<q', self.webpage_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _photo_id = reader.read_struct(_struct_iq)
+        _caption = reader.tgread_object()
+        if flags & 1:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        if flags & 1:
+            _webpage_id = reader.read_long()
+        else:
+            _webpage_id = None
+        return cls(photo_id=_photo_id, caption=_caption, url=_url, webpage_id=_webpage_id)
+
+
+class PageBlockPreformatted(TLObject):
+    CONSTRUCTOR_ID = 0xc070d93e
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text', 'language')
+
+    def __init__(self, text: 'TypeRichText', language: str):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+        self.language = language
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockPreformatted',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'language': self.language
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'>\xd9p\xc0',
+            self.text._bytes(),
+            self.serialize_bytes(self.language),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _language = reader.tgread_string()
+        return cls(text=_text, language=_language)
+
+
+class PageBlockPullquote(TLObject):
+    CONSTRUCTOR_ID = 0x4f4456d3
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text', 'caption')
+
+    def __init__(self, text: 'TypeRichText', caption: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockPullquote',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3VDO',
+            self.text._bytes(),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _caption = reader.tgread_object()
+        return cls(text=_text, caption=_caption)
+
+
+class PageBlockRelatedArticles(TLObject):
+    CONSTRUCTOR_ID = 0x16115a96
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('title', 'articles')
+
+    def __init__(self, title: 'TypeRichText', articles: List['TypePageRelatedArticle']):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.title = title
+        self.articles = articles
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockRelatedArticles',
+            'title': self.title.to_dict() if isinstance(self.title, TLObject) else self.title,
+            'articles': [] if self.articles is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.articles]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x96Z\x11\x16',
+            self.title._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.articles)),b''.join(x._bytes() for x in self.articles),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_object()
+        reader.read_int()
+        _articles = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _articles.append(_x)
+
+        return cls(title=_title, articles=_articles)
+
+
+class PageBlockSlideshow(TLObject):
+    CONSTRUCTOR_ID = 0x31f9590
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('items', 'caption')
+
+    def __init__(self, items: List['TypePageBlock'], caption: 'TypePageCaption'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.items = items
+        self.caption = caption
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockSlideshow',
+            'items': [] if self.items is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.items],
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x90\x95\x1f\x03',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.items)),b''.join(x._bytes() for x in self.items),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _items = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _items.append(_x)
+
+        _caption = reader.tgread_object()
+        return cls(items=_items, caption=_caption)
+
+
+class PageBlockSubheader(TLObject):
+    CONSTRUCTOR_ID = 0xf12bb6e1
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockSubheader',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe1\xb6+\xf1',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class PageBlockSubtitle(TLObject):
+    CONSTRUCTOR_ID = 0x8ffa9a1f
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockSubtitle',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1f\x9a\xfa\x8f',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class PageBlockTable(TLObject):
+    CONSTRUCTOR_ID = 0xbf4dea82
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('title', 'rows', 'bordered', 'striped')
+
+    def __init__(self, title: 'TypeRichText', rows: List['TypePageTableRow'], bordered: Optional[bool]=None, striped: Optional[bool]=None):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.title = title
+        self.rows = rows
+        self.bordered = bordered
+        self.striped = striped
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockTable',
+            'title': self.title.to_dict() if isinstance(self.title, TLObject) else self.title,
+            'rows': [] if self.rows is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.rows],
+            'bordered': self.bordered,
+            'striped': self.striped
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x82\xeaM\xbf',
+            struct.pack('<I', (0 if self.bordered is None or self.bordered is False else 1) | (0 if self.striped is None or self.striped is False else 2)),
+            self.title._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.rows)),b''.join(x._bytes() for x in self.rows),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _bordered = bool(flags & 1)
+        _striped = bool(flags & 2)
+        _title = reader.tgread_object()
+        reader.read_int()
+        _rows = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _rows.append(_x)
+
+        return cls(title=_title, rows=_rows, bordered=_bordered, striped=_striped)
+
+
+class PageBlockTitle(TLObject):
+    CONSTRUCTOR_ID = 0x70abc3fd
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockTitle',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfd\xc3\xabp',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class PageBlockUnsupported(TLObject):
+    CONSTRUCTOR_ID = 0x13567e8a
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockUnsupported'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8a~V\x13',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PageBlockVideo(TLObject):
+    CONSTRUCTOR_ID = 0x7c8fe7b6
+    SUBCLASS_OF_ID = 0x1aca5644
+    __slots__ = ('video_id', 'caption', 'autoplay', 'loop')
+
+    def __init__(self, video_id: int, caption: 'TypePageCaption', autoplay: Optional[bool]=None, loop: Optional[bool]=None):
+        """
+        Constructor for PageBlock: Instance of either PageBlockUnsupported, PageBlockTitle, PageBlockSubtitle, PageBlockAuthorDate, PageBlockHeader, PageBlockSubheader, PageBlockParagraph, PageBlockPreformatted, PageBlockFooter, PageBlockDivider, PageBlockAnchor, PageBlockList, PageBlockBlockquote, PageBlockPullquote, PageBlockPhoto, PageBlockVideo, PageBlockCover, PageBlockEmbed, PageBlockEmbedPost, PageBlockCollage, PageBlockSlideshow, PageBlockChannel, PageBlockAudio, PageBlockKicker, PageBlockTable, PageBlockOrderedList, PageBlockDetails, PageBlockRelatedArticles, PageBlockMap.
+        """
+        self.video_id = video_id
+        self.caption = caption
+        self.autoplay = autoplay
+        self.loop = loop
+
+    def to_dict(self):
+        return {
+            '_': 'PageBlockVideo',
+            'video_id': self.video_id,
+            'caption': self.caption.to_dict() if isinstance(self.caption, TLObject) else self.caption,
+            'autoplay': self.autoplay,
+            'loop': self.loop
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb6\xe7\x8f|',
+            _struct_Iq.pack((0 if self.autoplay is None or self.autoplay is False else 1) | (0 if self.loop is None or self.loop is False else 2), self.video_id),
+            self.caption._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _video_id = reader.read_struct(_struct_iq)
+        _autoplay = bool(flags & 1)
+        _loop = bool(flags & 2)
+        _caption = reader.tgread_object()
+        return cls(video_id=_video_id, caption=_caption, autoplay=_autoplay, loop=_loop)
+
+TypePageBlock = Union[PageBlockUnsupported,PageBlockTitle,PageBlockSubtitle,PageBlockAuthorDate,PageBlockHeader,PageBlockSubheader,PageBlockParagraph,PageBlockPreformatted,PageBlockFooter,PageBlockDivider,PageBlockAnchor,PageBlockList,PageBlockBlockquote,PageBlockPullquote,PageBlockPhoto,PageBlockVideo,PageBlockCover,PageBlockEmbed,PageBlockEmbedPost,PageBlockCollage,PageBlockSlideshow,PageBlockChannel,PageBlockAudio,PageBlockKicker,PageBlockTable,PageBlockOrderedList,PageBlockDetails,PageBlockRelatedArticles,PageBlockMap]
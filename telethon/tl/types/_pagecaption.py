@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeRichText
+
+
+
+class PageCaption(TLObject):
+    CONSTRUCTOR_ID = 0x6f747657
+    SUBCLASS_OF_ID = 0x29b8eeb3
+    __slots__ = ('text', 'credit')
+
+    def __init__(self, text: 'TypeRichText', credit: 'TypeRichText'):
+        """
+        Constructor for PageCaption: Instance of PageCaption.
+        """
+        self.text = text
+        self.credit = credit
+
+    def to_dict(self):
+        return {
+            '_': 'PageCaption',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'credit': self.credit.to_dict() if isinstance(self.credit, TLObject) else self.credit
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Wvto',
+            self.text._bytes(),
+            self.credit._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _credit = reader.tgread_object()
+        return cls(text=_text, credit=_credit)
+
+TypePageCaption = PageCaption
@@ -0,0 +1,74 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePageBlock, TypeRichText
+
+
+
+class PageListItemBlocks(TLObject):
+    CONSTRUCTOR_ID = 0x25e073fc
+    SUBCLASS_OF_ID = 0x8caebcb1
+    __slots__ = ('blocks',)
+
+    def __init__(self, blocks: List['TypePageBlock']):
+        """
+        Constructor for PageListItem: Instance of either PageListItemText, PageListItemBlocks.
+        """
+        self.blocks = blocks
+
+    def to_dict(self):
+        return {
+            '_': 'PageListItemBlocks',
+            'blocks': [] if self.blocks is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.blocks]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfcs\xe0%',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.blocks)),b''.join(x._bytes() for x in self.blocks),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _blocks = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _blocks.append(_x)
+
+        return cls(blocks=_blocks)
+
+
+class PageListItemText(TLObject):
+    CONSTRUCTOR_ID = 0xb92fb6cd
+    SUBCLASS_OF_ID = 0x8caebcb1
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for PageListItem: Instance of either PageListItemText, PageListItemBlocks.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageListItemText',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcd\xb6/\xb9',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+TypePageListItem = Union[PageListItemText,PageListItemBlocks]
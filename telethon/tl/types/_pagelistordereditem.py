@@ -0,0 +1,82 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePageBlock, TypeRichText
+
+
+
+class PageListOrderedItemBlocks(TLObject):
+    CONSTRUCTOR_ID = 0x98dd8936
+    SUBCLASS_OF_ID = 0xeeda0eb8
+    __slots__ = ('num', 'blocks')
+
+    def __init__(self, num: str, blocks: List['TypePageBlock']):
+        """
+        Constructor for PageListOrderedItem: Instance of either PageListOrderedItemText, PageListOrderedItemBlocks.
+        """
+        self.num = num
+        self.blocks = blocks
+
+    def to_dict(self):
+        return {
+            '_': 'PageListOrderedItemBlocks',
+            'num': self.num,
+            'blocks': [] if self.blocks is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.blocks]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'6\x89\xdd\x98',
+            self.serialize_bytes(self.num),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.blocks)),b''.join(x._bytes() for x in self.blocks),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _num = reader.tgread_string()
+        reader.read_int()
+        _blocks = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _blocks.append(_x)
+
+        return cls(num=_num, blocks=_blocks)
+
+
+class PageListOrderedItemText(TLObject):
+    CONSTRUCTOR_ID = 0x5e068047
+    SUBCLASS_OF_ID = 0xeeda0eb8
+    __slots__ = ('num', 'text')
+
+    def __init__(self, num: str, text: 'TypeRichText'):
+        """
+        Constructor for PageListOrderedItem: Instance of either PageListOrderedItemText, PageListOrderedItemBlocks.
+        """
+        self.num = num
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'PageListOrderedItemText',
+            'num': self.num,
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'G\x80\x06^',
+            self.serialize_bytes(self.num),
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _num = reader.tgread_string()
+        _text = reader.tgread_object()
+        return cls(num=_num, text=_text)
+
+TypePageListOrderedItem = Union[PageListOrderedItemText,PageListOrderedItemBlocks]
@@ -0,0 +1,79 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PageRelatedArticle(TLObject):
+    CONSTRUCTOR_ID = 0xb390dc08
+    SUBCLASS_OF_ID = 0x36d05822
+    __slots__ = ('url', 'webpage_id', 'title', 'description', 'photo_id', 'author', 'published_date')
+
+    def __init__(self, url: str, webpage_id: int, title: Optional[str]=None, description: Optional[str]=None, photo_id: Optional[int]=None, author: Optional[str]=None, published_date: Optional[datetime]=None):
+        """
+        Constructor for PageRelatedArticle: Instance of PageRelatedArticle.
+        """
+        self.url = url
+        self.webpage_id = webpage_id
+        self.title = title
+        self.description = description
+        self.photo_id = photo_id
+        self.author = author
+        self.published_date = published_date
+
+    def to_dict(self):
+        return {
+            '_': 'PageRelatedArticle',
+            'url': self.url,
+            'webpage_id': self.webpage_id,
+            'title': self.title,
+            'description': self.description,
+            'photo_id': self.photo_id,
+            'author': self.author,
+            'published_date': self.published_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08\xdc\x90\xb3',
+            struct.pack('<I', (0 if self.title is None or self.title is False else 1) | (0 if self.description is None or self.description is False else 2) | (0 if self.photo_id is None or self.photo_id is False else 4) | (0 if self.author is None or self.author is False else 8) | (0 if self.published_date is None or self.published_date is False else 16)),
+            self.serialize_bytes(self.url),
+            struct.pack('<q', self.webpage_id),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            b'' if self.photo_id is None or self.photo_id is False else (struct.pack('<q', self.photo_id)),
+            b'' if self.author is None or self.author is False else (self.serialize_bytes(self.author)),
+            b'' if self.published_date is None or self.published_date is False else (self.serialize_datetime(self.published_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _url = reader.tgread_string()
+        _webpage_id = reader.read_long()
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 2:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        if flags & 4:
+            _photo_id = reader.read_long()
+        else:
+            _photo_id = None
+        if flags & 8:
+            _author = reader.tgread_string()
+        else:
+            _author = None
+        if flags & 16:
+            _published_date = reader.tgread_date()
+        else:
+            _published_date = None
+        return cls(url=_url, webpage_id=_webpage_id, title=_title, description=_description, photo_id=_photo_id, author=_author, published_date=_published_date)
+
+TypePageRelatedArticle = PageRelatedArticle
@@ -0,0 +1,75 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeRichText
+
+
+
+class PageTableCell(TLObject):
+    CONSTRUCTOR_ID = 0x34566b6a
+    SUBCLASS_OF_ID = 0xb0eb3054
+    __slots__ = ('header', 'align_center', 'align_right', 'valign_middle', 'valign_bottom', 'text', 'colspan', 'rowspan')
+
+    def __init__(self, header: Optional[bool]=None, align_center: Optional[bool]=None, align_right: Optional[bool]=None, valign_middle: Optional[bool]=None, valign_bottom: Optional[bool]=None, text: Optional['TypeRichText']=None, colspan: Optional[int]=None, rowspan: Optional[int]=None):
+        """
+        Constructor for PageTableCell: Instance of PageTableCell.
+        """
+        self.header = header
+        self.align_center = align_center
+        self.align_right = align_right
+        self.valign_middle = valign_middle
+        self.valign_bottom = valign_bottom
+        self.text = text
+        self.colspan = colspan
+        self.rowspan = rowspan
+
+    def to_dict(self):
+        return {
+            '_': 'PageTableCell',
+            'header': self.header,
+            'align_center': self.align_center,
+            'align_right': self.align_right,
+            'valign_middle': self.valign_middle,
+            'valign_bottom': self.valign_bottom,
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'colspan': self.colspan,
+            'rowspan': self.rowspan
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'jkV4',
+            struct.pack('<I', (0 if self.header is None or self.header is False else 1) | (0 if self.align_center is None or self.align_center is False else 8) | (0 if self.align_right is None or self.align_right is False else 16) | (0 if self.valign_middle is None or self.valign_middle is False else 32) | (0 if self.valign_bottom is None or self.valign_bottom is False else 64) | (0 if self.text is None or self.text is False else 128) | (0 if self.colspan is None or self.colspan is False else 2) | (0 if self.rowspan is None or self.rowspan is False else 4)),
+            b'' if self.text is None or self.text is False else (self.text._bytes()),
+            b'' if self.colspan is None or self.colspan is False else (struct.pack('<i', self.colspan)),
+            b'' if self.rowspan is None or self.rowspan is False else (struct.pack('<i', self.rowspan)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _header = bool(flags & 1)
+        _align_center = bool(flags & 8)
+        _align_right = bool(flags & 16)
+        _valign_middle = bool(flags & 32)
+        _valign_bottom = bool(flags & 64)
+        if flags & 128:
+            _text = reader.tgread_object()
+        else:
+            _text = None
+        if flags & 2:
+            _colspan = reader.read_int()
+        else:
+            _colspan = None
+        if flags & 4:
+            _rowspan = reader.read_int()
+        else:
+            _rowspan = None
+        return cls(header=_header, align_center=_align_center, align_right=_align_right, valign_middle=_valign_middle, valign_bottom=_valign_bottom, text=_text, colspan=_colspan, rowspan=_rowspan)
+
+TypePageTableCell = PageTableCell
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePageTableCell
+
+
+
+class PageTableRow(TLObject):
+    CONSTRUCTOR_ID = 0xe0c0c5e5
+    SUBCLASS_OF_ID = 0x59acee11
+    __slots__ = ('cells',)
+
+    def __init__(self, cells: List['TypePageTableCell']):
+        """
+        Constructor for PageTableRow: Instance of PageTableRow.
+        """
+        self.cells = cells
+
+    def to_dict(self):
+        return {
+            '_': 'PageTableRow',
+            'cells': [] if self.cells is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.cells]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe5\xc5\xc0\xe0',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.cells)),b''.join(x._bytes() for x in self.cells),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _cells = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _cells.append(_x)
+
+        return cls(cells=_cells)
+
+TypePageTableRow = PageTableRow
@@ -0,0 +1,80 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputPeer
+
+
+
+class PaidReactionPrivacyAnonymous(TLObject):
+    CONSTRUCTOR_ID = 0x1f0c1ad9
+    SUBCLASS_OF_ID = 0x65d77636
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PaidReactionPrivacyAnonymous'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9\x1a\x0c\x1f',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PaidReactionPrivacyDefault(TLObject):
+    CONSTRUCTOR_ID = 0x206ad49e
+    SUBCLASS_OF_ID = 0x65d77636
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PaidReactionPrivacyDefault'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9e\xd4j ',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PaidReactionPrivacyPeer(TLObject):
+    CONSTRUCTOR_ID = 0xdc6cfcf0
+    SUBCLASS_OF_ID = 0x65d77636
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypeInputPeer'):
+        """
+        Constructor for PaidReactionPrivacy: Instance of either PaidReactionPrivacyDefault, PaidReactionPrivacyAnonymous, PaidReactionPrivacyPeer.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'PaidReactionPrivacyPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf0\xfcl\xdc',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+TypePaidReactionPrivacy = Union[PaidReactionPrivacyDefault,PaidReactionPrivacyAnonymous,PaidReactionPrivacyPeer]
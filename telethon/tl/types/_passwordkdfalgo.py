@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow(TLObject):
+    CONSTRUCTOR_ID = 0x3a912d4a
+    SUBCLASS_OF_ID = 0x37bcf5cc
+    __slots__ = ('salt1', 'salt2', 'g', 'p')
+
+    def __init__(self, salt1: bytes, salt2: bytes, g: int, p: bytes):
+        """
+        Constructor for PasswordKdfAlgo: Instance of either PasswordKdfAlgoUnknown, PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow.
+        """
+        self.salt1 = salt1
+        self.salt2 = salt2
+        self.g = g
+        self.p = p
+
+    def to_dict(self):
+        return {
+            '_': 'PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow',
+            'salt1': self.salt1,
+            'salt2': self.salt2,
+            'g': self.g,
+            'p': self.p
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'J-\x91:',
+            self.serialize_bytes(self.salt1),
+            self.serialize_bytes(self.salt2),
+            struct.pack('<i', self.g),
+            self.serialize_bytes(self.p),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _salt1 = reader.tgread_bytes()
+        _salt2 = reader.tgread_bytes()
+        _g = reader.read_int()
+        _p = reader.tgread_bytes()
+        return cls(salt1=_salt1, salt2=_salt2, g=_g, p=_p)
+
+
+class PasswordKdfAlgoUnknown(TLObject):
+    CONSTRUCTOR_ID = 0xd45ab096
+    SUBCLASS_OF_ID = 0x37bcf5cc
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PasswordKdfAlgoUnknown'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x96\xb0Z\xd4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypePasswordKdfAlgo = Union[PasswordKdfAlgoUnknown,PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow]
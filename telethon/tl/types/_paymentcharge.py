@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PaymentCharge(TLObject):
+    CONSTRUCTOR_ID = 0xea02c27e
+    SUBCLASS_OF_ID = 0x3cc830d9
+    __slots__ = ('id', 'provider_charge_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, provider_charge_id: str):
+        """
+        Constructor for PaymentCharge: Instance of PaymentCharge.
+        """
+        self.id = id
+        self.provider_charge_id = provider_charge_id
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentCharge',
+            'id': self.id,
+            'provider_charge_id': self.provider_charge_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\xc2\x02\xea',
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.provider_charge_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _provider_charge_id = reader.tgread_string()
+        return cls(id=_id, provider_charge_id=_provider_charge_id)
+
+TypePaymentCharge = PaymentCharge
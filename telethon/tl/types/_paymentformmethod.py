@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PaymentFormMethod(TLObject):
+    CONSTRUCTOR_ID = 0x88f8f21b
+    SUBCLASS_OF_ID = 0x3fc1c816
+    __slots__ = ('url', 'title')
+
+    def __init__(self, url: str, title: str):
+        """
+        Constructor for PaymentFormMethod: Instance of PaymentFormMethod.
+        """
+        self.url = url
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentFormMethod',
+            'url': self.url,
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1b\xf2\xf8\x88',
+            self.serialize_bytes(self.url),
+            self.serialize_bytes(self.title),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _title = reader.tgread_string()
+        return cls(url=_url, title=_title)
+
+TypePaymentFormMethod = PaymentFormMethod
@@ -0,0 +1,67 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePostAddress
+
+
+
+class PaymentRequestedInfo(TLObject):
+    CONSTRUCTOR_ID = 0x909c3f94
+    SUBCLASS_OF_ID = 0x8db03146
+    __slots__ = ('name', 'phone', 'email', 'shipping_address')
+
+    def __init__(self, name: Optional[str]=None, phone: Optional[str]=None, email: Optional[str]=None, shipping_address: Optional['TypePostAddress']=None):
+        """
+        Constructor for PaymentRequestedInfo: Instance of PaymentRequestedInfo.
+        """
+        self.name = name
+        self.phone = phone
+        self.email = email
+        self.shipping_address = shipping_address
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentRequestedInfo',
+            'name': self.name,
+            'phone': self.phone,
+            'email': self.email,
+            'shipping_address': self.shipping_address.to_dict() if isinstance(self.shipping_address, TLObject) else self.shipping_address
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x94?\x9c\x90',
+            struct.pack('<I', (0 if self.name is None or self.name is False else 1) | (0 if self.phone is None or self.phone is False else 2) | (0 if self.email is None or self.email is False else 4) | (0 if self.shipping_address is None or self.shipping_address is False else 8)),
+            b'' if self.name is None or self.name is False else (self.serialize_bytes(self.name)),
+            b'' if self.phone is None or self.phone is False else (self.serialize_bytes(self.phone)),
+            b'' if self.email is None or self.email is False else (self.serialize_bytes(self.email)),
+            b'' if self.shipping_address is None or self.shipping_address is False else (self.shipping_address._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _name = reader.tgread_string()
+        else:
+            _name = None
+        if flags & 2:
+            _phone = reader.tgread_string()
+        else:
+            _phone = None
+        if flags & 4:
+            _email = reader.tgread_string()
+        else:
+            _email = None
+        if flags & 8:
+            _shipping_address = reader.tgread_object()
+        else:
+            _shipping_address = None
+        return cls(name=_name, phone=_phone, email=_email, shipping_address=_shipping_address)
+
+TypePaymentRequestedInfo = PaymentRequestedInfo
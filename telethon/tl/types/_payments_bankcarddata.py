@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBankCardOpenUrl
+
+
+
+class BankCardData(TLObject):
+    CONSTRUCTOR_ID = 0x3e24e573
+    SUBCLASS_OF_ID = 0x8c6dd68b
+    __slots__ = ('title', 'open_urls')
+
+    def __init__(self, title: str, open_urls: List['TypeBankCardOpenUrl']):
+        """
+        Constructor for payments.BankCardData: Instance of BankCardData.
+        """
+        self.title = title
+        self.open_urls = open_urls
+
+    def to_dict(self):
+        return {
+            '_': 'BankCardData',
+            'title': self.title,
+            'open_urls': [] if self.open_urls is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.open_urls]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b's\xe5$>',
+            self.serialize_bytes(self.title),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.open_urls)),b''.join(x._bytes() for x in self.open_urls),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        reader.read_int()
+        _open_urls = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _open_urls.append(_x)
+
+        return cls(title=_title, open_urls=_open_urls)
+
@@ -0,0 +1,95 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypePeer, TypeUser
+
+
+
+class CheckedGiftCode(TLObject):
+    CONSTRUCTOR_ID = 0x284a1096
+    SUBCLASS_OF_ID = 0x5b2997e8
+    __slots__ = ('date', 'months', 'chats', 'users', 'via_giveaway', 'from_id', 'giveaway_msg_id', 'to_id', 'used_date')
+
+    def __init__(self, date: Optional[datetime], months: int, chats: List['TypeChat'], users: List['TypeUser'], via_giveaway: Optional[bool]=None, from_id: Optional['TypePeer']=None, giveaway_msg_id: Optional[int]=None, to_id: Optional[int]=None, used_date: Optional[datetime]=None):
+        """
+        Constructor for payments.CheckedGiftCode: Instance of CheckedGiftCode.
+        """
+        self.date = date
+        self.months = months
+        self.chats = chats
+        self.users = users
+        self.via_giveaway = via_giveaway
+        self.from_id = from_id
+        self.giveaway_msg_id = giveaway_msg_id
+        self.to_id = to_id
+        self.used_date = used_date
+
+    def to_dict(self):
+        return {
+            '_': 'CheckedGiftCode',
+            'date': self.date,
+            'months': self.months,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'via_giveaway': self.via_giveaway,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'giveaway_msg_id': self.giveaway_msg_id,
+            'to_id': self.to_id,
+            'used_date': self.used_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x96\x10J(',
+            struct.pack('<I', (0 if self.via_giveaway is None or self.via_giveaway is False else 4) | (0 if self.from_id is None or self.from_id is False else 16) | (0 if self.giveaway_msg_id is None or self.giveaway_msg_id is False else 8) | (0 if self.to_id is None or self.to_id is False else 1) | (0 if self.used_date is None or self.used_date is False else 2)),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            b'' if self.giveaway_msg_id is None or self.giveaway_msg_id is False else (struct.pack('<i', self.giveaway_msg_id)),
+            b'' if self.to_id is None or self.to_id is False else (struct.pack('<q', self.to_id)),
+            self.serialize_datetime(self.date),
+            struct.pack('<i', self.months),
+            b'' if self.used_date is None or self.used_date is False else (self.serialize_datetime(self.used_date)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _via_giveaway = bool(flags & 4)
+        if flags & 16:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        if flags & 8:
+            _giveaway_msg_id = reader.read_int()
+        else:
+            _giveaway_msg_id = None
+        if flags & 1:
+            _to_id = reader.read_long()
+        else:
+            _to_id = None
+        _date = reader.tgread_date()
+        _months = reader.read_int()
+        if flags & 2:
+            _used_date = reader.tgread_date()
+        else:
+            _used_date = None
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(date=_date, months=_months, chats=_chats, users=_users, via_giveaway=_via_giveaway, from_id=_from_id, giveaway_msg_id=_giveaway_msg_id, to_id=_to_id, used_date=_used_date)
+
@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeConnectedBotStarRef, TypeUser
+
+
+
+class ConnectedStarRefBots(TLObject):
+    CONSTRUCTOR_ID = 0x98d5ea1d
+    SUBCLASS_OF_ID = 0x235e1a67
+    __slots__ = ('count', 'connected_bots', 'users')
+
+    def __init__(self, count: int, connected_bots: List['TypeConnectedBotStarRef'], users: List['TypeUser']):
+        """
+        Constructor for payments.ConnectedStarRefBots: Instance of ConnectedStarRefBots.
+        """
+        self.count = count
+        self.connected_bots = connected_bots
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'ConnectedStarRefBots',
+            'count': self.count,
+            'connected_bots': [] if self.connected_bots is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.connected_bots],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1d\xea\xd5\x98',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.connected_bots)),b''.join(x._bytes() for x in self.connected_bots),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _connected_bots = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _connected_bots.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, connected_bots=_connected_bots, users=_users)
+
@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ExportedInvoice(TLObject):
+    CONSTRUCTOR_ID = 0xaed0cbd9
+    SUBCLASS_OF_ID = 0x36105432
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for payments.ExportedInvoice: Instance of ExportedInvoice.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedInvoice',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9\xcb\xd0\xae',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
@@ -0,0 +1,133 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class GiveawayInfo(TLObject):
+    CONSTRUCTOR_ID = 0x4367daa0
+    SUBCLASS_OF_ID = 0x96a377bd
+    __slots__ = ('start_date', 'participating', 'preparing_results', 'joined_too_early_date', 'admin_disallowed_chat_id', 'disallowed_country')
+
+    def __init__(self, start_date: Optional[datetime], participating: Optional[bool]=None, preparing_results: Optional[bool]=None, joined_too_early_date: Optional[datetime]=None, admin_disallowed_chat_id: Optional[int]=None, disallowed_country: Optional[str]=None):
+        """
+        Constructor for payments.GiveawayInfo: Instance of either GiveawayInfo, GiveawayInfoResults.
+        """
+        self.start_date = start_date
+        self.participating = participating
+        self.preparing_results = preparing_results
+        self.joined_too_early_date = joined_too_early_date
+        self.admin_disallowed_chat_id = admin_disallowed_chat_id
+        self.disallowed_country = disallowed_country
+
+    def to_dict(self):
+        return {
+            '_': 'GiveawayInfo',
+            'start_date': self.start_date,
+            'participating': self.participating,
+            'preparing_results': self.preparing_results,
+            'joined_too_early_date': self.joined_too_early_date,
+            'admin_disallowed_chat_id': self.admin_disallowed_chat_id,
+            'disallowed_country': self.disallowed_country
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0\xdagC',
+            struct.pack('<I', (0 if self.participating is None or self.participating is False else 1) | (0 if self.preparing_results is None or self.preparing_results is False else 8) | (0 if self.joined_too_early_date is None or self.joined_too_early_date is False else 2) | (0 if self.admin_disallowed_chat_id is None or self.admin_disallowed_chat_id is False else 4) | (0 if self.disallowed_country is None or self.disallowed_country is False else 16)),
+            self.serialize_datetime(self.start_date),
+            b'' if self.joined_too_early_date is None or self.joined_too_early_date is False else (self.serialize_datetime(self.joined_too_early_date)),
+            b'' if self.admin_disallowed_chat_id is None or self.admin_disallowed_chat_id is False else (struct.pack('<q', self.admin_disallowed_chat_id)),
+            b'' if self.disallowed_country is None or self.disallowed_country is False else (self.serialize_bytes(self.disallowed_country)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _participating = bool(flags & 1)
+        _preparing_results = bool(flags & 8)
+        _start_date = reader.tgread_date()
+        if flags & 2:
+            _joined_too_early_date = reader.tgread_date()
+        else:
+            _joined_too_early_date = None
+        if flags & 4:
+            _admin_disallowed_chat_id = reader.read_long()
+        else:
+            _admin_disallowed_chat_id = None
+        if flags & 16:
+            _disallowed_country = reader.tgread_string()
+        else:
+            _disallowed_country = None
+        return cls(start_date=_start_date, participating=_participating, preparing_results=_preparing_results, joined_too_early_date=_joined_too_early_date, admin_disallowed_chat_id=_admin_disallowed_chat_id, disallowed_country=_disallowed_country)
+
+
+class GiveawayInfoResults(TLObject):
+    CONSTRUCTOR_ID = 0xe175e66f
+    SUBCLASS_OF_ID = 0x96a377bd
+    __slots__ = ('start_date', 'finish_date', 'winners_count', 'winner', 'refunded', 'gift_code_slug', 'stars_prize', 'activated_count')
+
+    def __init__(self, start_date: Optional[datetime], finish_date: Optional[datetime], winners_count: int, winner: Optional[bool]=None, refunded: Optional[bool]=None, gift_code_slug: Optional[str]=None, stars_prize: Optional[int]=None, activated_count: Optional[int]=None):
+        """
+        Constructor for payments.GiveawayInfo: Instance of either GiveawayInfo, GiveawayInfoResults.
+        """
+        self.start_date = start_date
+        self.finish_date = finish_date
+        self.winners_count = winners_count
+        self.winner = winner
+        self.refunded = refunded
+        self.gift_code_slug = gift_code_slug
+        self.stars_prize = stars_prize
+        self.activated_count = activated_count
+
+    def to_dict(self):
+        return {
+            '_': 'GiveawayInfoResults',
+            'start_date': self.start_date,
+            'finish_date': self.finish_date,
+            'winners_count': self.winners_count,
+            'winner': self.winner,
+            'refunded': self.refunded,
+            'gift_code_slug': self.gift_code_slug,
+            'stars_prize': self.stars_prize,
+            'activated_count': self.activated_count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'o\xe6u\xe1',
+            struct.pack('<I', (0 if self.winner is None or self.winner is False else 1) | (0 if self.refunded is None or self.refunded is False else 2) | (0 if self.gift_code_slug is None or self.gift_code_slug is False else 8) | (0 if self.stars_prize is None or self.stars_prize is False else 16) | (0 if self.activated_count is None or self.activated_count is False else 4)),
+            self.serialize_datetime(self.start_date),
+            b'' if self.gift_code_slug is None or self.gift_code_slug is False else (self.serialize_bytes(self.gift_code_slug)),
+            b'' if self.stars_prize is None or self.stars_prize is False else (struct.pack('<q', self.stars_prize)),
+            self.serialize_datetime(self.finish_date),
+            struct.pack('<i', self.winners_count),
+            b'' if self.activated_count is None or self.activated_count is False else (struct.pack('<i', self.activated_count)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _winner = bool(flags & 1)
+        _refunded = bool(flags & 2)
+        _start_date = reader.tgread_date()
+        if flags & 8:
+            _gift_code_slug = reader.tgread_string()
+        else:
+            _gift_code_slug = None
+        if flags & 16:
+            _stars_prize = reader.read_long()
+        else:
+            _stars_prize = None
+        _finish_date = reader.tgread_date()
+        _winners_count = reader.read_int()
+        if flags & 4:
+            _activated_count = reader.read_int()
+        else:
+            _activated_count = None
+        return cls(start_date=_start_date, finish_date=_finish_date, winners_count=_winners_count, winner=_winner, refunded=_refunded, gift_code_slug=_gift_code_slug, stars_prize=_stars_prize, activated_count=_activated_count)
+
@@ -0,0 +1,224 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeInvoice, TypePaymentFormMethod, TypePaymentRequestedInfo, TypePaymentSavedCredentials, TypeUser, TypeWebDocument
+
+
+
+class PaymentForm(TLObject):
+    CONSTRUCTOR_ID = 0xa0058751
+    SUBCLASS_OF_ID = 0xa0483f19
+    __slots__ = ('form_id', 'bot_id', 'title', 'description', 'invoice', 'provider_id', 'url', 'users', 'can_save_credentials', 'password_missing', 'photo', 'native_provider', 'native_params', 'additional_methods', 'saved_info', 'saved_credentials')
+
+    def __init__(self, form_id: int, bot_id: int, title: str, description: str, invoice: 'TypeInvoice', provider_id: int, url: str, users: List['TypeUser'], can_save_credentials: Optional[bool]=None, password_missing: Optional[bool]=None, photo: Optional['TypeWebDocument']=None, native_provider: Optional[str]=None, native_params: Optional['TypeDataJSON']=None, additional_methods: Optional[List['TypePaymentFormMethod']]=None, saved_info: Optional['TypePaymentRequestedInfo']=None, saved_credentials: Optional[List['TypePaymentSavedCredentials']]=None):
+        """
+        Constructor for payments.PaymentForm: Instance of either PaymentForm, PaymentFormStars, PaymentFormStarGift.
+        """
+        self.form_id = form_id
+        self.bot_id = bot_id
+        self.title = title
+        self.description = description
+        self.invoice = invoice
+        self.provider_id = provider_id
+        self.url = url
+        self.users = users
+        self.can_save_credentials = can_save_credentials
+        self.password_missing = password_missing
+        self.photo = photo
+        self.native_provider = native_provider
+        self.native_params = native_params
+        self.additional_methods = additional_methods
+        self.saved_info = saved_info
+        self.saved_credentials = saved_credentials
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentForm',
+            'form_id': self.form_id,
+            'bot_id': self.bot_id,
+            'title': self.title,
+            'description': self.description,
+            'invoice': self.invoice.to_dict() if isinstance(self.invoice, TLObject) else self.invoice,
+            'provider_id': self.provider_id,
+            'url': self.url,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'can_save_credentials': self.can_save_credentials,
+            'password_missing': self.password_missing,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'native_provider': self.native_provider,
+            'native_params': self.native_params.to_dict() if isinstance(self.native_params, TLObject) else self.native_params,
+            'additional_methods': [] if self.additional_methods is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.additional_methods],
+            'saved_info': self.saved_info.to_dict() if isinstance(self.saved_info, TLObject) else self.saved_info,
+            'saved_credentials': [] if self.saved_credentials is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.saved_credentials]
+        }
+
+    def _bytes(self):
+        assert ((self.native_provider or self.native_provider is not None) and (self.native_params or self.native_params is not None)) or ((self.native_provider is None or self.native_provider is False) and (self.native_params is None or self.native_params is False)), 'native_provider, native_params parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'Q\x87\x05\xa0',
+            _struct_Iqq.pack((0 if self.can_save_credentials is None or self.can_save_credentials is False else 4) | (0 if self.password_missing is None or self.password_missing is False else 8) | (0 if self.photo is None or self.photo is False else 32) | (0 if self.native_provider is None or self.native_provider is False else 16) | (0 if self.native_params is None or self.native_params is False else 16) | (0 if self.additional_methods is None or self.additional_methods is False else 64) | (0 if self.saved_info is None or self.saved_info is False else 1) | (0 if self.saved_credentials is None or self.saved_credentials is False else 2), self.form_id, self.bot_id),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            self.invoice._bytes(),
+            struct.pack('<q', self.provider_id),
+            self.serialize_bytes(self.url),
+            b'' if self.native_provider is None or self.native_provider is False else (self.serialize_bytes(self.native_provider)),
+            b'' if self.native_params is None or self.native_params is False else (self.native_params._bytes()),
+            b'' if self.additional_methods is None or self.additional_methods is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.additional_methods)),b''.join(x._bytes() for x in self.additional_methods))),
+            b'' if self.saved_info is None or self.saved_info is False else (self.saved_info._bytes()),
+            b'' if self.saved_credentials is None or self.saved_credentials is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.saved_credentials)),b''.join(x._bytes() for x in self.saved_credentials))),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _form_id, _bot_id = reader.read_struct(_struct_iqq)
+        _can_save_credentials = bool(flags & 4)
+        _password_missing = bool(flags & 8)
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 32:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        _invoice = reader.tgread_object()
+        _provider_id = reader.read_long()
+        _url = reader.tgread_string()
+        if flags & 16:
+            _native_provider = reader.tgread_string()
+        else:
+            _native_provider = None
+        if flags & 16:
+            _native_params = reader.tgread_object()
+        else:
+            _native_params = None
+        if flags & 64:
+            reader.read_int()
+            _additional_methods = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _additional_methods.append(_x)
+
+        else:
+            _additional_methods = None
+        if flags & 1:
+            _saved_info = reader.tgread_object()
+        else:
+            _saved_info = None
+        if flags & 2:
+            reader.read_int()
+            _saved_credentials = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _saved_credentials.append(_x)
+
+        else:
+            _saved_credentials = None
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(form_id=_form_id, bot_id=_bot_id, title=_title, description=_description, invoice=_invoice, provider_id=_provider_id, url=_url, users=_users, can_save_credentials=_can_save_credentials, password_missing=_password_missing, photo=_photo, native_provider=_native_provider, native_params=_native_params, additional_methods=_additional_methods, saved_info=_saved_info, saved_credentials=_saved_credentials)
+
+
+class PaymentFormStarGift(TLObject):
+    CONSTRUCTOR_ID = 0xb425cfe1
+    SUBCLASS_OF_ID = 0xa0483f19
+    __slots__ = ('form_id', 'invoice')
+
+    def __init__(self, form_id: int, invoice: 'TypeInvoice'):
+        """
+        Constructor for payments.PaymentForm: Instance of either PaymentForm, PaymentFormStars, PaymentFormStarGift.
+        """
+        self.form_id = form_id
+        self.invoice = invoice
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentFormStarGift',
+            'form_id': self.form_id,
+            'invoice': self.invoice.to_dict() if isinstance(self.invoice, TLObject) else self.invoice
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe1\xcf%\xb4',
+            struct.pack('<q', self.form_id),
+            self.invoice._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _form_id = reader.read_long()
+        _invoice = reader.tgread_object()
+        return cls(form_id=_form_id, invoice=_invoice)
+
+
+class PaymentFormStars(TLObject):
+    CONSTRUCTOR_ID = 0x7bf6b15c
+    SUBCLASS_OF_ID = 0xa0483f19
+    __slots__ = ('form_id', 'bot_id', 'title', 'description', 'invoice', 'users', 'photo')
+
+    def __init__(self, form_id: int, bot_id: int, title: str, description: str, invoice: 'TypeInvoice', users: List['TypeUser'], photo: Optional['TypeWebDocument']=None):
+        """
+        Constructor for payments.PaymentForm: Instance of either PaymentForm, PaymentFormStars, PaymentFormStarGift.
+        """
+        self.form_id = form_id
+        self.bot_id = bot_id
+        self.title = title
+        self.description = description
+        self.invoice = invoice
+        self.users = users
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentFormStars',
+            'form_id': self.form_id,
+            'bot_id': self.bot_id,
+            'title': self.title,
+            'description': self.description,
+            'invoice': self.invoice.to_dict() if isinstance(self.invoice, TLObject) else self.invoice,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\\xb1\xf6{',
+            _struct_Iqq.pack((0 if self.photo is None or self.photo is False else 32), self.form_id, self.bot_id),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            self.invoice._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _form_id, _bot_id = reader.read_struct(_struct_iqq)
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 32:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        _invoice = reader.tgread_object()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(form_id=_form_id, bot_id=_bot_id, title=_title, description=_description, invoice=_invoice, users=_users, photo=_photo)
+
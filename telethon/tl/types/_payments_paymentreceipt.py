@@ -0,0 +1,187 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInvoice, TypePaymentRequestedInfo, TypeShippingOption, TypeUser, TypeWebDocument
+
+
+
+class PaymentReceipt(TLObject):
+    CONSTRUCTOR_ID = 0x70c4fe03
+    SUBCLASS_OF_ID = 0x590093c9
+    __slots__ = ('date', 'bot_id', 'provider_id', 'title', 'description', 'invoice', 'currency', 'total_amount', 'credentials_title', 'users', 'photo', 'info', 'shipping', 'tip_amount')
+
+    def __init__(self, date: Optional[datetime], bot_id: int, provider_id: int, title: str, description: str, invoice: 'TypeInvoice', currency: str, total_amount: int, credentials_title: str, users: List['TypeUser'], photo: Optional['TypeWebDocument']=None, info: Optional['TypePaymentRequestedInfo']=None, shipping: Optional['TypeShippingOption']=None, tip_amount: Optional[int]=None):
+        """
+        Constructor for payments.PaymentReceipt: Instance of either PaymentReceipt, PaymentReceiptStars.
+        """
+        self.date = date
+        self.bot_id = bot_id
+        self.provider_id = provider_id
+        self.title = title
+        self.description = description
+        self.invoice = invoice
+        self.currency = currency
+        self.total_amount = total_amount
+        self.credentials_title = credentials_title
+        self.users = users
+        self.photo = photo
+        self.info = info
+        self.shipping = shipping
+        self.tip_amount = tip_amount
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentReceipt',
+            'date': self.date,
+            'bot_id': self.bot_id,
+            'provider_id': self.provider_id,
+            'title': self.title,
+            'description': self.description,
+            'invoice': self.invoice.to_dict() if isinstance(self.invoice, TLObject) else self.invoice,
+            'currency': self.currency,
+            'total_amount': self.total_amount,
+            'credentials_title': self.credentials_title,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'info': self.info.to_dict() if isinstance(self.info, TLObject) else self.info,
+            'shipping': self.shipping.to_dict() if isinstance(self.shipping, TLObject) else self.shipping,
+            'tip_amount': self.tip_amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x03\xfe\xc4p',
+            struct.pack('<I', (0 if self.photo is None or self.photo is False else 4) | (0 if self.info is None or self.info is False else 1) | (0 if self.shipping is None or self.shipping is False else 2) | (0 if self.tip_amount is None or self.tip_amount is False else 8)),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.bot_id, self.provider_id),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            self.invoice._bytes(),
+            b'' if self.info is None or self.info is False else (self.info._bytes()),
+            b'' if self.shipping is None or self.shipping is False else (self.shipping._bytes()),
+            b'' if self.tip_amount is None or self.tip_amount is False else (struct.pack('<q', self.tip_amount)),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.total_amount),
+            self.serialize_bytes(self.credentials_title),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _date = reader.tgread_date()
+        _bot_id, _provider_id = reader.read_struct(_struct_qq)
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 4:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        _invoice = reader.tgread_object()
+        if flags & 1:
+            _info = reader.tgread_object()
+        else:
+            _info = None
+        if flags & 2:
+            _shipping = reader.tgread_object()
+        else:
+            _shipping = None
+        if flags & 8:
+            _tip_amount = reader.read_long()
+        else:
+            _tip_amount = None
+        _currency = reader.tgread_string()
+        _total_amount = reader.read_long()
+        _credentials_title = reader.tgread_string()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(date=_date, bot_id=_bot_id, provider_id=_provider_id, title=_title, description=_description, invoice=_invoice, currency=_currency, total_amount=_total_amount, credentials_title=_credentials_title, users=_users, photo=_photo, info=_info, shipping=_shipping, tip_amount=_tip_amount)
+
+
+class PaymentReceiptStars(TLObject):
+    CONSTRUCTOR_ID = 0xdabbf83a
+    SUBCLASS_OF_ID = 0x590093c9
+    __slots__ = ('date', 'bot_id', 'title', 'description', 'invoice', 'currency', 'total_amount', 'transaction_id', 'users', 'photo')
+
+    def __init__(self, date: Optional[datetime], bot_id: int, title: str, description: str, invoice: 'TypeInvoice', currency: str, total_amount: int, transaction_id: str, users: List['TypeUser'], photo: Optional['TypeWebDocument']=None):
+        """
+        Constructor for payments.PaymentReceipt: Instance of either PaymentReceipt, PaymentReceiptStars.
+        """
+        self.date = date
+        self.bot_id = bot_id
+        self.title = title
+        self.description = description
+        self.invoice = invoice
+        self.currency = currency
+        self.total_amount = total_amount
+        self.transaction_id = transaction_id
+        self.users = users
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentReceiptStars',
+            'date': self.date,
+            'bot_id': self.bot_id,
+            'title': self.title,
+            'description': self.description,
+            'invoice': self.invoice.to_dict() if isinstance(self.invoice, TLObject) else self.invoice,
+            'currency': self.currency,
+            'total_amount': self.total_amount,
+            'transaction_id': self.transaction_id,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b':\xf8\xbb\xda',
+            struct.pack('<I', (0 if self.photo is None or self.photo is False else 4)),
+            self.serialize_datetime(self.date),
+            struct.pack('<q', self.bot_id),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.description),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            self.invoice._bytes(),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.total_amount),
+            self.serialize_bytes(self.transaction_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _date = reader.tgread_date()
+        _bot_id = reader.read_long()
+        _title = reader.tgread_string()
+        _description = reader.tgread_string()
+        if flags & 4:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        _invoice = reader.tgread_object()
+        _currency = reader.tgread_string()
+        _total_amount = reader.read_long()
+        _transaction_id = reader.tgread_string()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(date=_date, bot_id=_bot_id, title=_title, description=_description, invoice=_invoice, currency=_currency, total_amount=_total_amount, transaction_id=_transaction_id, users=_users, photo=_photo)
+
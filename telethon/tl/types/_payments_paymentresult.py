@@ -0,0 +1,68 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUpdates
+
+
+
+class PaymentResult(TLObject):
+    CONSTRUCTOR_ID = 0x4e5f810d
+    SUBCLASS_OF_ID = 0x8ae16a9d
+    __slots__ = ('updates',)
+
+    def __init__(self, updates: 'TypeUpdates'):
+        """
+        Constructor for payments.PaymentResult: Instance of either PaymentResult, PaymentVerificationNeeded.
+        """
+        self.updates = updates
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentResult',
+            'updates': self.updates.to_dict() if isinstance(self.updates, TLObject) else self.updates
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r\x81_N',
+            self.updates._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _updates = reader.tgread_object()
+        return cls(updates=_updates)
+
+
+class PaymentVerificationNeeded(TLObject):
+    CONSTRUCTOR_ID = 0xd8411139
+    SUBCLASS_OF_ID = 0x8ae16a9d
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for payments.PaymentResult: Instance of either PaymentResult, PaymentVerificationNeeded.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentVerificationNeeded',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'9\x11A\xd8',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePaymentRequestedInfo
+
+
+
+class SavedInfo(TLObject):
+    CONSTRUCTOR_ID = 0xfb8fe43c
+    SUBCLASS_OF_ID = 0xad3cf146
+    __slots__ = ('has_saved_credentials', 'saved_info')
+
+    def __init__(self, has_saved_credentials: Optional[bool]=None, saved_info: Optional['TypePaymentRequestedInfo']=None):
+        """
+        Constructor for payments.SavedInfo: Instance of SavedInfo.
+        """
+        self.has_saved_credentials = has_saved_credentials
+        self.saved_info = saved_info
+
+    def to_dict(self):
+        return {
+            '_': 'SavedInfo',
+            'has_saved_credentials': self.has_saved_credentials,
+            'saved_info': self.saved_info.to_dict() if isinstance(self.saved_info, TLObject) else self.saved_info
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'<\xe4\x8f\xfb',
+            struct.pack('<I', (0 if self.has_saved_credentials is None or self.has_saved_credentials is False else 2) | (0 if self.saved_info is None or self.saved_info is False else 1)),
+            b'' if self.saved_info is None or self.saved_info is False else (self.saved_info._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _has_saved_credentials = bool(flags & 2)
+        if flags & 1:
+            _saved_info = reader.tgread_object()
+        else:
+            _saved_info = None
+        return cls(has_saved_credentials=_has_saved_credentials, saved_info=_saved_info)
+
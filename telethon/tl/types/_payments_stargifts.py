@@ -0,0 +1,69 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarGift
+
+
+
+class StarGifts(TLObject):
+    CONSTRUCTOR_ID = 0x901689ea
+    SUBCLASS_OF_ID = 0x6178d9a4
+    __slots__ = ('hash', 'gifts')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, gifts: List['TypeStarGift']):
+        """
+        Constructor for payments.StarGifts: Instance of either StarGiftsNotModified, StarGifts.
+        """
+        self.hash = hash
+        self.gifts = gifts
+
+    def to_dict(self):
+        return {
+            '_': 'StarGifts',
+            'hash': self.hash,
+            'gifts': [] if self.gifts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.gifts]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xea\x89\x16\x90',
+            struct.pack('<i', self.hash),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.gifts)),b''.join(x._bytes() for x in self.gifts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash = reader.read_int()
+        reader.read_int()
+        _gifts = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _gifts.append(_x)
+
+        return cls(hash=_hash, gifts=_gifts)
+
+
+class StarGiftsNotModified(TLObject):
+    CONSTRUCTOR_ID = 0xa388a368
+    SUBCLASS_OF_ID = 0x6178d9a4
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftsNotModified'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'h\xa3\x88\xa3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
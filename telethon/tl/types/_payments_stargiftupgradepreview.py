@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarGiftAttribute
+
+
+
+class StarGiftUpgradePreview(TLObject):
+    CONSTRUCTOR_ID = 0x167bd90b
+    SUBCLASS_OF_ID = 0x5e2b68c7
+    __slots__ = ('sample_attributes',)
+
+    def __init__(self, sample_attributes: List['TypeStarGiftAttribute']):
+        """
+        Constructor for payments.StarGiftUpgradePreview: Instance of StarGiftUpgradePreview.
+        """
+        self.sample_attributes = sample_attributes
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftUpgradePreview',
+            'sample_attributes': [] if self.sample_attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.sample_attributes]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\xd9{\x16',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.sample_attributes)),b''.join(x._bytes() for x in self.sample_attributes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _sample_attributes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _sample_attributes.append(_x)
+
+        return cls(sample_attributes=_sample_attributes)
+
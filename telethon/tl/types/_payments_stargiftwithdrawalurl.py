@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class StarGiftWithdrawalUrl(TLObject):
+    CONSTRUCTOR_ID = 0x84aa3a9c
+    SUBCLASS_OF_ID = 0xa2822dc5
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for payments.StarGiftWithdrawalUrl: Instance of StarGiftWithdrawalUrl.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftWithdrawalUrl',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9c:\xaa\x84',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
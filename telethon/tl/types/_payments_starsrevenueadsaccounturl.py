@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class StarsRevenueAdsAccountUrl(TLObject):
+    CONSTRUCTOR_ID = 0x394e7f21
+    SUBCLASS_OF_ID = 0x4a228b15
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for payments.StarsRevenueAdsAccountUrl: Instance of StarsRevenueAdsAccountUrl.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'StarsRevenueAdsAccountUrl',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'!\x7fN9',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
@@ -0,0 +1,47 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarsRevenueStatus, TypeStatsGraph
+
+
+
+class StarsRevenueStats(TLObject):
+    CONSTRUCTOR_ID = 0xc92bb73b
+    SUBCLASS_OF_ID = 0xa54755f3
+    __slots__ = ('revenue_graph', 'status', 'usd_rate')
+
+    def __init__(self, revenue_graph: 'TypeStatsGraph', status: 'TypeStarsRevenueStatus', usd_rate: float):
+        """
+        Constructor for payments.StarsRevenueStats: Instance of StarsRevenueStats.
+        """
+        self.revenue_graph = revenue_graph
+        self.status = status
+        self.usd_rate = usd_rate
+
+    def to_dict(self):
+        return {
+            '_': 'StarsRevenueStats',
+            'revenue_graph': self.revenue_graph.to_dict() if isinstance(self.revenue_graph, TLObject) else self.revenue_graph,
+            'status': self.status.to_dict() if isinstance(self.status, TLObject) else self.status,
+            'usd_rate': self.usd_rate
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b';\xb7+\xc9',
+            self.revenue_graph._bytes(),
+            self.status._bytes(),
+            struct.pack('<d', self.usd_rate),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _revenue_graph = reader.tgread_object()
+        _status = reader.tgread_object()
+        _usd_rate = reader.read_double()
+        return cls(revenue_graph=_revenue_graph, status=_status, usd_rate=_usd_rate)
+
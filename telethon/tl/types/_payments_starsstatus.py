@@ -0,0 +1,105 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeStarsAmount, TypeStarsSubscription, TypeStarsTransaction, TypeUser
+
+
+
+class StarsStatus(TLObject):
+    CONSTRUCTOR_ID = 0x6c9ce8ed
+    SUBCLASS_OF_ID = 0x6e9c1d6f
+    __slots__ = ('balance', 'chats', 'users', 'subscriptions', 'subscriptions_next_offset', 'subscriptions_missing_balance', 'history', 'next_offset')
+
+    def __init__(self, balance: 'TypeStarsAmount', chats: List['TypeChat'], users: List['TypeUser'], subscriptions: Optional[List['TypeStarsSubscription']]=None, subscriptions_next_offset: Optional[str]=None, subscriptions_missing_balance: Optional[int]=None, history: Optional[List['TypeStarsTransaction']]=None, next_offset: Optional[str]=None):
+        """
+        Constructor for payments.StarsStatus: Instance of StarsStatus.
+        """
+        self.balance = balance
+        self.chats = chats
+        self.users = users
+        self.subscriptions = subscriptions
+        self.subscriptions_next_offset = subscriptions_next_offset
+        self.subscriptions_missing_balance = subscriptions_missing_balance
+        self.history = history
+        self.next_offset = next_offset
+
+    def to_dict(self):
+        return {
+            '_': 'StarsStatus',
+            'balance': self.balance.to_dict() if isinstance(self.balance, TLObject) else self.balance,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'subscriptions': [] if self.subscriptions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.subscriptions],
+            'subscriptions_next_offset': self.subscriptions_next_offset,
+            'subscriptions_missing_balance': self.subscriptions_missing_balance,
+            'history': [] if self.history is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.history],
+            'next_offset': self.next_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed\xe8\x9cl',
+            struct.pack('<I', (0 if self.subscriptions is None or self.subscriptions is False else 2) | (0 if self.subscriptions_next_offset is None or self.subscriptions_next_offset is False else 4) | (0 if self.subscriptions_missing_balance is None or self.subscriptions_missing_balance is False else 16) | (0 if self.history is None or self.history is False else 8) | (0 if self.next_offset is None or self.next_offset is False else 1)),
+            self.balance._bytes(),
+            b'' if self.subscriptions is None or self.subscriptions is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.subscriptions)),b''.join(x._bytes() for x in self.subscriptions))),
+            b'' if self.subscriptions_next_offset is None or self.subscriptions_next_offset is False else (self.serialize_bytes(self.subscriptions_next_offset)),
+            b'' if self.subscriptions_missing_balance is None or self.subscriptions_missing_balance is False else (struct.pack('<q', self.subscriptions_missing_balance)),
+            b'' if self.history is None or self.history is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.history)),b''.join(x._bytes() for x in self.history))),
+            b'' if self.next_offset is None or self.next_offset is False else (self.serialize_bytes(self.next_offset)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _balance = reader.tgread_object()
+        if flags & 2:
+            reader.read_int()
+            _subscriptions = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _subscriptions.append(_x)
+
+        else:
+            _subscriptions = None
+        if flags & 4:
+            _subscriptions_next_offset = reader.tgread_string()
+        else:
+            _subscriptions_next_offset = None
+        if flags & 16:
+            _subscriptions_missing_balance = reader.read_long()
+        else:
+            _subscriptions_missing_balance = None
+        if flags & 8:
+            reader.read_int()
+            _history = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _history.append(_x)
+
+        else:
+            _history = None
+        if flags & 1:
+            _next_offset = reader.tgread_string()
+        else:
+            _next_offset = None
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(balance=_balance, chats=_chats, users=_users, subscriptions=_subscriptions, subscriptions_next_offset=_subscriptions_next_offset, subscriptions_missing_balance=_subscriptions_missing_balance, history=_history, next_offset=_next_offset)
+
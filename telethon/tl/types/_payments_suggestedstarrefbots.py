@@ -0,0 +1,67 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarRefProgram, TypeUser
+
+
+
+class SuggestedStarRefBots(TLObject):
+    CONSTRUCTOR_ID = 0xb4d5d859
+    SUBCLASS_OF_ID = 0x70189243
+    __slots__ = ('count', 'suggested_bots', 'users', 'next_offset')
+
+    def __init__(self, count: int, suggested_bots: List['TypeStarRefProgram'], users: List['TypeUser'], next_offset: Optional[str]=None):
+        """
+        Constructor for payments.SuggestedStarRefBots: Instance of SuggestedStarRefBots.
+        """
+        self.count = count
+        self.suggested_bots = suggested_bots
+        self.users = users
+        self.next_offset = next_offset
+
+    def to_dict(self):
+        return {
+            '_': 'SuggestedStarRefBots',
+            'count': self.count,
+            'suggested_bots': [] if self.suggested_bots is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.suggested_bots],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'next_offset': self.next_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Y\xd8\xd5\xb4',
+            _struct_Ii.pack((0 if self.next_offset is None or self.next_offset is False else 1), self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.suggested_bots)),b''.join(x._bytes() for x in self.suggested_bots),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            b'' if self.next_offset is None or self.next_offset is False else (self.serialize_bytes(self.next_offset)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count = reader.read_struct(_struct_ii)
+        reader.read_int()
+        _suggested_bots = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _suggested_bots.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        if flags & 1:
+            _next_offset = reader.tgread_string()
+        else:
+            _next_offset = None
+        return cls(count=_count, suggested_bots=_suggested_bots, users=_users, next_offset=_next_offset)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarGift, TypeUser
+
+
+
+class UniqueStarGift(TLObject):
+    CONSTRUCTOR_ID = 0xcaa2f60b
+    SUBCLASS_OF_ID = 0x78b0c5fb
+    __slots__ = ('gift', 'users')
+
+    def __init__(self, gift: 'TypeStarGift', users: List['TypeUser']):
+        """
+        Constructor for payments.UniqueStarGift: Instance of UniqueStarGift.
+        """
+        self.gift = gift
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'UniqueStarGift',
+            'gift': self.gift.to_dict() if isinstance(self.gift, TLObject) else self.gift,
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\xf6\xa2\xca',
+            self.gift._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _gift = reader.tgread_object()
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(gift=_gift, users=_users)
+
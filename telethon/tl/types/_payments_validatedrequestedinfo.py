@@ -0,0 +1,58 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeShippingOption
+
+
+
+class ValidatedRequestedInfo(TLObject):
+    CONSTRUCTOR_ID = 0xd1451883
+    SUBCLASS_OF_ID = 0x8f8044b7
+    __slots__ = ('id', 'shipping_options')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: Optional[str]=None, shipping_options: Optional[List['TypeShippingOption']]=None):
+        """
+        Constructor for payments.ValidatedRequestedInfo: Instance of ValidatedRequestedInfo.
+        """
+        self.id = id
+        self.shipping_options = shipping_options
+
+    def to_dict(self):
+        return {
+            '_': 'ValidatedRequestedInfo',
+            'id': self.id,
+            'shipping_options': [] if self.shipping_options is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.shipping_options]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x83\x18E\xd1',
+            struct.pack('<I', (0 if self.id is None or self.id is False else 1) | (0 if self.shipping_options is None or self.shipping_options is False else 2)),
+            b'' if self.id is None or self.id is False else (self.serialize_bytes(self.id)),
+            b'' if self.shipping_options is None or self.shipping_options is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.shipping_options)),b''.join(x._bytes() for x in self.shipping_options))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _id = reader.tgread_string()
+        else:
+            _id = None
+        if flags & 2:
+            reader.read_int()
+            _shipping_options = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _shipping_options.append(_x)
+
+        else:
+            _shipping_options = None
+        return cls(id=_id, shipping_options=_shipping_options)
+
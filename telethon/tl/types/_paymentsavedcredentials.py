@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PaymentSavedCredentialsCard(TLObject):
+    CONSTRUCTOR_ID = 0xcdc27a1f
+    SUBCLASS_OF_ID = 0xb3627ee3
+    __slots__ = ('id', 'title')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, title: str):
+        """
+        Constructor for PaymentSavedCredentials: Instance of PaymentSavedCredentialsCard.
+        """
+        self.id = id
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'PaymentSavedCredentialsCard',
+            'id': self.id,
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1fz\xc2\xcd',
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.title),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _title = reader.tgread_string()
+        return cls(id=_id, title=_title)
+
+TypePaymentSavedCredentials = PaymentSavedCredentialsCard
@@ -0,0 +1,95 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PeerChannel(TLObject):
+    CONSTRUCTOR_ID = 0xa2a5371e
+    SUBCLASS_OF_ID = 0x2d45687
+    __slots__ = ('channel_id',)
+
+    def __init__(self, channel_id: int):
+        """
+        Constructor for Peer: Instance of either PeerUser, PeerChat, PeerChannel.
+        """
+        self.channel_id = channel_id
+
+    def to_dict(self):
+        return {
+            '_': 'PeerChannel',
+            'channel_id': self.channel_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1e7\xa5\xa2',
+            struct.pack('<q', self.channel_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _channel_id = reader.read_long()
+        return cls(channel_id=_channel_id)
+
+
+class PeerChat(TLObject):
+    CONSTRUCTOR_ID = 0x36c6019a
+    SUBCLASS_OF_ID = 0x2d45687
+    __slots__ = ('chat_id',)
+
+    def __init__(self, chat_id: int):
+        """
+        Constructor for Peer: Instance of either PeerUser, PeerChat, PeerChannel.
+        """
+        self.chat_id = chat_id
+
+    def to_dict(self):
+        return {
+            '_': 'PeerChat',
+            'chat_id': self.chat_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9a\x01\xc66',
+            struct.pack('<q', self.chat_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _chat_id = reader.read_long()
+        return cls(chat_id=_chat_id)
+
+
+class PeerUser(TLObject):
+    CONSTRUCTOR_ID = 0x59511722
+    SUBCLASS_OF_ID = 0x2d45687
+    __slots__ = ('user_id',)
+
+    def __init__(self, user_id: int):
+        """
+        Constructor for Peer: Instance of either PeerUser, PeerChat, PeerChannel.
+        """
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'PeerUser',
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'"\x17QY',
+            struct.pack('<q', self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.read_long()
+        return cls(user_id=_user_id)
+
+TypePeer = Union[PeerUser,PeerChat,PeerChannel]
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class PeerBlocked(TLObject):
+    CONSTRUCTOR_ID = 0xe8fd8014
+    SUBCLASS_OF_ID = 0x54f2fc98
+    __slots__ = ('peer_id', 'date')
+
+    def __init__(self, peer_id: 'TypePeer', date: Optional[datetime]):
+        """
+        Constructor for PeerBlocked: Instance of PeerBlocked.
+        """
+        self.peer_id = peer_id
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'PeerBlocked',
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x14\x80\xfd\xe8',
+            self.peer_id._bytes(),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer_id = reader.tgread_object()
+        _date = reader.tgread_date()
+        return cls(peer_id=_peer_id, date=_date)
+
+TypePeerBlocked = PeerBlocked
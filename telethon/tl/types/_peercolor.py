@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PeerColor(TLObject):
+    CONSTRUCTOR_ID = 0xb54b5acf
+    SUBCLASS_OF_ID = 0xf281a47f
+    __slots__ = ('color', 'background_emoji_id')
+
+    def __init__(self, color: Optional[int]=None, background_emoji_id: Optional[int]=None):
+        """
+        Constructor for PeerColor: Instance of PeerColor.
+        """
+        self.color = color
+        self.background_emoji_id = background_emoji_id
+
+    def to_dict(self):
+        return {
+            '_': 'PeerColor',
+            'color': self.color,
+            'background_emoji_id': self.background_emoji_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcfZK\xb5',
+            struct.pack('<I', (0 if self.color is None or self.color is False else 1) | (0 if self.background_emoji_id is None or self.background_emoji_id is False else 2)),
+            b'' if self.color is None or self.color is False else (struct.pack('<i', self.color)),
+            b'' if self.background_emoji_id is None or self.background_emoji_id is False else (struct.pack('<q', self.background_emoji_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _color = reader.read_int()
+        else:
+            _color = None
+        if flags & 2:
+            _background_emoji_id = reader.read_long()
+        else:
+            _background_emoji_id = None
+        return cls(color=_color, background_emoji_id=_background_emoji_id)
+
+TypePeerColor = PeerColor
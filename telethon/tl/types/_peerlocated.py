@@ -0,0 +1,77 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class PeerLocated(TLObject):
+    CONSTRUCTOR_ID = 0xca461b5d
+    SUBCLASS_OF_ID = 0xfada34ac
+    __slots__ = ('peer', 'expires', 'distance')
+
+    def __init__(self, peer: 'TypePeer', expires: Optional[datetime], distance: int):
+        """
+        Constructor for PeerLocated: Instance of either PeerLocated, PeerSelfLocated.
+        """
+        self.peer = peer
+        self.expires = expires
+        self.distance = distance
+
+    def to_dict(self):
+        return {
+            '_': 'PeerLocated',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'expires': self.expires,
+            'distance': self.distance
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b']\x1bF\xca',
+            self.peer._bytes(),
+            self.serialize_datetime(self.expires),
+            struct.pack('<i', self.distance),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _expires = reader.tgread_date()
+        _distance = reader.read_int()
+        return cls(peer=_peer, expires=_expires, distance=_distance)
+
+
+class PeerSelfLocated(TLObject):
+    CONSTRUCTOR_ID = 0xf8ec284b
+    SUBCLASS_OF_ID = 0xfada34ac
+    __slots__ = ('expires',)
+
+    def __init__(self, expires: Optional[datetime]):
+        """
+        Constructor for PeerLocated: Instance of either PeerLocated, PeerSelfLocated.
+        """
+        self.expires = expires
+
+    def to_dict(self):
+        return {
+            '_': 'PeerSelfLocated',
+            'expires': self.expires
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'K(\xec\xf8',
+            self.serialize_datetime(self.expires),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _expires = reader.tgread_date()
+        return cls(expires=_expires)
+
+TypePeerLocated = Union[PeerLocated,PeerSelfLocated]
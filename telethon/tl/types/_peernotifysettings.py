@@ -0,0 +1,116 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeNotificationSound
+
+
+
+class PeerNotifySettings(TLObject):
+    CONSTRUCTOR_ID = 0x99622c0c
+    SUBCLASS_OF_ID = 0xcf20c074
+    __slots__ = ('show_previews', 'silent', 'mute_until', 'ios_sound', 'android_sound', 'other_sound', 'stories_muted', 'stories_hide_sender', 'stories_ios_sound', 'stories_android_sound', 'stories_other_sound')
+
+    def __init__(self, show_previews: Optional[bool]=None, silent: Optional[bool]=None, mute_until: Optional[datetime]=None, ios_sound: Optional['TypeNotificationSound']=None, android_sound: Optional['TypeNotificationSound']=None, other_sound: Optional['TypeNotificationSound']=None, stories_muted: Optional[bool]=None, stories_hide_sender: Optional[bool]=None, stories_ios_sound: Optional['TypeNotificationSound']=None, stories_android_sound: Optional['TypeNotificationSound']=None, stories_other_sound: Optional['TypeNotificationSound']=None):
+        """
+        Constructor for PeerNotifySettings: Instance of PeerNotifySettings.
+        """
+        self.show_previews = show_previews
+        self.silent = silent
+        self.mute_until = mute_until
+        self.ios_sound = ios_sound
+        self.android_sound = android_sound
+        self.other_sound = other_sound
+        self.stories_muted = stories_muted
+        self.stories_hide_sender = stories_hide_sender
+        self.stories_ios_sound = stories_ios_sound
+        self.stories_android_sound = stories_android_sound
+        self.stories_other_sound = stories_other_sound
+
+    def to_dict(self):
+        return {
+            '_': 'PeerNotifySettings',
+            'show_previews': self.show_previews,
+            'silent': self.silent,
+            'mute_until': self.mute_until,
+            'ios_sound': self.ios_sound.to_dict() if isinstance(self.ios_sound, TLObject) else self.ios_sound,
+            'android_sound': self.android_sound.to_dict() if isinstance(self.android_sound, TLObject) else self.android_sound,
+            'other_sound': self.other_sound.to_dict() if isinstance(self.other_sound, TLObject) else self.other_sound,
+            'stories_muted': self.stories_muted,
+            'stories_hide_sender': self.stories_hide_sender,
+            'stories_ios_sound': self.stories_ios_sound.to_dict() if isinstance(self.stories_ios_sound, TLObject) else self.stories_ios_sound,
+            'stories_android_sound': self.stories_android_sound.to_dict() if isinstance(self.stories_android_sound, TLObject) else self.stories_android_sound,
+            'stories_other_sound': self.stories_other_sound.to_dict() if isinstance(self.stories_other_sound, TLObject) else self.stories_other_sound
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0c,b\x99',
+            struct.pack('<I', (0 if self.show_previews is None else 1) | (0 if self.silent is None else 2) | (0 if self.mute_until is None or self.mute_until is False else 4) | (0 if self.ios_sound is None or self.ios_sound is False else 8) | (0 if self.android_sound is None or self.android_sound is False else 16) | (0 if self.other_sound is None or self.other_sound is False else 32) | (0 if self.stories_muted is None else 64) | (0 if self.stories_hide_sender is None else 128) | (0 if self.stories_ios_sound is None or self.stories_ios_sound is False else 256) | (0 if self.stories_android_sound is None or self.stories_android_sound is False else 512) | (0 if self.stories_other_sound is None or self.stories_other_sound is False else 1024)),
+            b'' if self.show_previews is None else (b'\xb5ur\x99' if self.show_previews else b'7\x97y\xbc'),
+            b'' if self.silent is None else (b'\xb5ur\x99' if self.silent else b'7\x97y\xbc'),
+            b'' if self.mute_until is None or self.mute_until is False else (self.serialize_datetime(self.mute_until)),
+            b'' if self.ios_sound is None or self.ios_sound is False else (self.ios_sound._bytes()),
+            b'' if self.android_sound is None or self.android_sound is False else (self.android_sound._bytes()),
+            b'' if self.other_sound is None or self.other_sound is False else (self.other_sound._bytes()),
+            b'' if self.stories_muted is None else (b'\xb5ur\x99' if self.stories_muted else b'7\x97y\xbc'),
+            b'' if self.stories_hide_sender is None else (b'\xb5ur\x99' if self.stories_hide_sender else b'7\x97y\xbc'),
+            b'' if self.stories_ios_sound is None or self.stories_ios_sound is False else (self.stories_ios_sound._bytes()),
+            b'' if self.stories_android_sound is None or self.stories_android_sound is False else (self.stories_android_sound._bytes()),
+            b'' if self.stories_other_sound is None or self.stories_other_sound is False else (self.stories_other_sound._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _show_previews = reader.tgread_bool()
+        else:
+            _show_previews = None
+        if flags & 2:
+            _silent = reader.tgread_bool()
+        else:
+            _silent = None
+        if flags & 4:
+            _mute_until = reader.tgread_date()
+        else:
+            _mute_until = None
+        if flags & 8:
+            _ios_sound = reader.tgread_object()
+        else:
+            _ios_sound = None
+        if flags & 16:
+            _android_sound = reader.tgread_object()
+        else:
+            _android_sound = None
+        if flags & 32:
+            _other_sound = reader.tgread_object()
+        else:
+            _other_sound = None
+        if flags & 64:
+            _stories_muted = reader.tgread_bool()
+        else:
+            _stories_muted = None
+        if flags & 128:
+            _stories_hide_sender = reader.tgread_bool()
+        else:
+            _stories_hide_sender = None
+        if flags & 256:
+            _stories_ios_sound = reader.tgread_object()
+        else:
+            _stories_ios_sound = None
+        if flags & 512:
+            _stories_android_sound = reader.tgread_object()
+        else:
+            _stories_android_sound = None
+        if flags & 1024:
+            _stories_other_sound = reader.tgread_object()
+        else:
+            _stories_other_sound = None
+        return cls(show_previews=_show_previews, silent=_silent, mute_until=_mute_until, ios_sound=_ios_sound, android_sound=_android_sound, other_sound=_other_sound, stories_muted=_stories_muted, stories_hide_sender=_stories_hide_sender, stories_ios_sound=_stories_ios_sound, stories_android_sound=_stories_android_sound, stories_other_sound=_stories_other_sound)
+
+TypePeerNotifySettings = PeerNotifySettings
@@ -0,0 +1,141 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PeerSettings(TLObject):
+    CONSTRUCTOR_ID = 0xf47741f7
+    SUBCLASS_OF_ID = 0xf6a79f84
+    __slots__ = ('report_spam', 'add_contact', 'block_contact', 'share_contact', 'need_contacts_exception', 'report_geo', 'autoarchived', 'invite_members', 'request_chat_broadcast', 'business_bot_paused', 'business_bot_can_reply', 'geo_distance', 'request_chat_title', 'request_chat_date', 'business_bot_id', 'business_bot_manage_url', 'charge_paid_message_stars', 'registration_month', 'phone_country', 'name_change_date', 'photo_change_date')
+
+    def __init__(self, report_spam: Optional[bool]=None, add_contact: Optional[bool]=None, block_contact: Optional[bool]=None, share_contact: Optional[bool]=None, need_contacts_exception: Optional[bool]=None, report_geo: Optional[bool]=None, autoarchived: Optional[bool]=None, invite_members: Optional[bool]=None, request_chat_broadcast: Optional[bool]=None, business_bot_paused: Optional[bool]=None, business_bot_can_reply: Optional[bool]=None, geo_distance: Optional[int]=None, request_chat_title: Optional[str]=None, request_chat_date: Optional[datetime]=None, business_bot_id: Optional[int]=None, business_bot_manage_url: Optional[str]=None, charge_paid_message_stars: Optional[int]=None, registration_month: Optional[str]=None, phone_country: Optional[str]=None, name_change_date: Optional[datetime]=None, photo_change_date: Optional[datetime]=None):
+        """
+        Constructor for PeerSettings: Instance of PeerSettings.
+        """
+        self.report_spam = report_spam
+        self.add_contact = add_contact
+        self.block_contact = block_contact
+        self.share_contact = share_contact
+        self.need_contacts_exception = need_contacts_exception
+        self.report_geo = report_geo
+        self.autoarchived = autoarchived
+        self.invite_members = invite_members
+        self.request_chat_broadcast = request_chat_broadcast
+        self.business_bot_paused = business_bot_paused
+        self.business_bot_can_reply = business_bot_can_reply
+        self.geo_distance = geo_distance
+        self.request_chat_title = request_chat_title
+        self.request_chat_date = request_chat_date
+        self.business_bot_id = business_bot_id
+        self.business_bot_manage_url = business_bot_manage_url
+        self.charge_paid_message_stars = charge_paid_message_stars
+        self.registration_month = registration_month
+        self.phone_country = phone_country
+        self.name_change_date = name_change_date
+        self.photo_change_date = photo_change_date
+
+    def to_dict(self):
+        return {
+            '_': 'PeerSettings',
+            'report_spam': self.report_spam,
+            'add_contact': self.add_contact,
+            'block_contact': self.block_contact,
+            'share_contact': self.share_contact,
+            'need_contacts_exception': self.need_contacts_exception,
+            'report_geo': self.report_geo,
+            'autoarchived': self.autoarchived,
+            'invite_members': self.invite_members,
+            'request_chat_broadcast': self.request_chat_broadcast,
+            'business_bot_paused': self.business_bot_paused,
+            'business_bot_can_reply': self.business_bot_can_reply,
+            'geo_distance': self.geo_distance,
+            'request_chat_title': self.request_chat_title,
+            'request_chat_date': self.request_chat_date,
+            'business_bot_id': self.business_bot_id,
+            'business_bot_manage_url': self.business_bot_manage_url,
+            'charge_paid_message_stars': self.charge_paid_message_stars,
+            'registration_month': self.registration_month,
+            'phone_country': self.phone_country,
+            'name_change_date': self.name_change_date,
+            'photo_change_date': self.photo_change_date
+        }
+
+    def _bytes(self):
+        assert ((self.request_chat_title or self.request_chat_title is not None) and (self.request_chat_date or self.request_chat_date is not None)) or ((self.request_chat_title is None or self.request_chat_title is False) and (self.request_chat_date is None or self.request_chat_date is False)), 'request_chat_title, request_chat_date parameters must all be False-y (like None) or all me True-y'
+        assert ((self.business_bot_id or self.business_bot_id is not None) and (self.business_bot_manage_url or self.business_bot_manage_url is not None)) or ((self.business_bot_id is None or self.business_bot_id is False) and (self.business_bot_manage_url is None or self.business_bot_manage_url is False)), 'business_bot_id, business_bot_manage_url parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xf7Aw\xf4',
+            struct.pack('<I', (0 if self.report_spam is None or self.report_spam is False else 1) | (0 if self.add_contact is None or self.add_contact is False else 2) | (0 if self.block_contact is None or self.block_contact is False else 4) | (0 if self.share_contact is None or self.share_contact is False else 8) | (0 if self.need_contacts_exception is None or self.need_contacts_exception is False else 16) | (0 if self.report_geo is None or self.report_geo is False else 32) | (0 if self.autoarchived is None or self.autoarchived is False else 128) | (0 if self.invite_members is None or self.invite_members is False else 256) | (0 if self.request_chat_broadcast is None or self.request_chat_broadcast is False else 1024) | (0 if self.business_bot_paused is None or self.business_bot_paused is False else 2048) | (0 if self.business_bot_can_reply is None or self.business_bot_can_reply is False else 4096) | (0 if self.geo_distance is None or self.geo_distance is False else 64) | (0 if self.request_chat_title is None or self.request_chat_title is False else 512) | (0 if self.request_chat_date is None or self.request_chat_date is False else 512) | (0 if self.business_bot_id is None or self.business_bot_id is False else 8192) | (0 if self.business_bot_manage_url is None or self.business_bot_manage_url is False else 8192) | (0 if self.charge_paid_message_stars is None or self.charge_paid_message_stars is False else 16384) | (0 if self.registration_month is None or self.registration_month is False else 32768) | (0 if self.phone_country is None or self.phone_country is False else 65536) | (0 if self.name_change_date is None or self.name_change_date is False else 131072) | (0 if self.photo_change_date is None or self.photo_change_date is False else 262144)),
+            b'' if self.geo_distance is None or self.geo_distance is False else (struct.pack('<i', self.geo_distance)),
+            b'' if self.request_chat_title is None or self.request_chat_title is False else (self.serialize_bytes(self.request_chat_title)),
+            b'' if self.request_chat_date is None or self.request_chat_date is False else (self.serialize_datetime(self.request_chat_date)),
+            b'' if self.business_bot_id is None or self.business_bot_id is False else (struct.pack('<q', self.business_bot_id)),
+            b'' if self.business_bot_manage_url is None or self.business_bot_manage_url is False else (self.serialize_bytes(self.business_bot_manage_url)),
+            b'' if self.charge_paid_message_stars is None or self.charge_paid_message_stars is False else (struct.pack('<q', self.charge_paid_message_stars)),
+            b'' if self.registration_month is None or self.registration_month is False else (self.serialize_bytes(self.registration_month)),
+            b'' if self.phone_country is None or self.phone_country is False else (self.serialize_bytes(self.phone_country)),
+            b'' if self.name_change_date is None or self.name_change_date is False else (self.serialize_datetime(self.name_change_date)),
+            b'' if self.photo_change_date is None or self.photo_change_date is False else (self.serialize_datetime(self.photo_change_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _report_spam = bool(flags & 1)
+        _add_contact = bool(flags & 2)
+        _block_contact = bool(flags & 4)
+        _share_contact = bool(flags & 8)
+        _need_contacts_exception = bool(flags & 16)
+        _report_geo = bool(flags & 32)
+        _autoarchived = bool(flags & 128)
+        _invite_members = bool(flags & 256)
+        _request_chat_broadcast = bool(flags & 1024)
+        _business_bot_paused = bool(flags & 2048)
+        _business_bot_can_reply = bool(flags & 4096)
+        if flags & 64:
+            _geo_distance = reader.read_int()
+        else:
+            _geo_distance = None
+        if flags & 512:
+            _request_chat_title = reader.tgread_string()
+        else:
+            _request_chat_title = None
+        if flags & 512:
+            _request_chat_date = reader.tgread_date()
+        else:
+            _request_chat_date = None
+        if flags & 8192:
+            _business_bot_id = reader.read_long()
+        else:
+            _business_bot_id = None
+        if flags & 8192:
+            _business_bot_manage_url = reader.tgread_string()
+        else:
+            _business_bot_manage_url = None
+        if flags & 16384:
+            _charge_paid_message_stars = reader.read_long()
+        else:
+            _charge_paid_message_stars = None
+        if flags & 32768:
+            _registration_month = reader.tgread_string()
+        else:
+            _registration_month = None
+        if flags & 65536:
+            _phone_country = reader.tgread_string()
+        else:
+            _phone_country = None
+        if flags & 131072:
+            _name_change_date = reader.tgread_date()
+        else:
+            _name_change_date = None
+        if flags & 262144:
+            _photo_change_date = reader.tgread_date()
+        else:
+            _photo_change_date = None
+        return cls(report_spam=_report_spam, add_contact=_add_contact, block_contact=_block_contact, share_contact=_share_contact, need_contacts_exception=_need_contacts_exception, report_geo=_report_geo, autoarchived=_autoarchived, invite_members=_invite_members, request_chat_broadcast=_request_chat_broadcast, business_bot_paused=_business_bot_paused, business_bot_can_reply=_business_bot_can_reply, geo_distance=_geo_distance, request_chat_title=_request_chat_title, request_chat_date=_request_chat_date, business_bot_id=_business_bot_id, business_bot_manage_url=_business_bot_manage_url, charge_paid_message_stars=_charge_paid_message_stars, registration_month=_registration_month, phone_country=_phone_country, name_change_date=_name_change_date, photo_change_date=_photo_change_date)
+
+TypePeerSettings = PeerSettings
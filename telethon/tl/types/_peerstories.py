@@ -0,0 +1,59 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer, TypeStoryItem
+
+
+
+class PeerStories(TLObject):
+    CONSTRUCTOR_ID = 0x9a35e999
+    SUBCLASS_OF_ID = 0x122c8a47
+    __slots__ = ('peer', 'stories', 'max_read_id')
+
+    def __init__(self, peer: 'TypePeer', stories: List['TypeStoryItem'], max_read_id: Optional[int]=None):
+        """
+        Constructor for PeerStories: Instance of PeerStories.
+        """
+        self.peer = peer
+        self.stories = stories
+        self.max_read_id = max_read_id
+
+    def to_dict(self):
+        return {
+            '_': 'PeerStories',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'stories': [] if self.stories is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stories],
+            'max_read_id': self.max_read_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x99\xe95\x9a',
+            struct.pack('<I', (0 if self.max_read_id is None or self.max_read_id is False else 1)),
+            self.peer._bytes(),
+            b'' if self.max_read_id is None or self.max_read_id is False else (struct.pack('<i', self.max_read_id)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stories)),b''.join(x._bytes() for x in self.stories),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _max_read_id = reader.read_int()
+        else:
+            _max_read_id = None
+        reader.read_int()
+        _stories = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _stories.append(_x)
+
+        return cls(peer=_peer, stories=_stories, max_read_id=_max_read_id)
+
+TypePeerStories = PeerStories
@@ -0,0 +1,36 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ExportedGroupCallInvite(TLObject):
+    CONSTRUCTOR_ID = 0x204bd158
+    SUBCLASS_OF_ID = 0x3b3bfe8f
+    __slots__ = ('link',)
+
+    def __init__(self, link: str):
+        """
+        Constructor for phone.ExportedGroupCallInvite: Instance of ExportedGroupCallInvite.
+        """
+        self.link = link
+
+    def to_dict(self):
+        return {
+            '_': 'ExportedGroupCallInvite',
+            'link': self.link
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'X\xd1K ',
+            self.serialize_bytes(self.link),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _link = reader.tgread_string()
+        return cls(link=_link)
+
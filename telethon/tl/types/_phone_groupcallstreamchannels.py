@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeGroupCallStreamChannel
+
+
+
+class GroupCallStreamChannels(TLObject):
+    CONSTRUCTOR_ID = 0xd0e482b2
+    SUBCLASS_OF_ID = 0x9157c5e4
+    __slots__ = ('channels',)
+
+    def __init__(self, channels: List['TypeGroupCallStreamChannel']):
+        """
+        Constructor for phone.GroupCallStreamChannels: Instance of GroupCallStreamChannels.
+        """
+        self.channels = channels
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCallStreamChannels',
+            'channels': [] if self.channels is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.channels]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb2\x82\xe4\xd0',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.channels)),b''.join(x._bytes() for x in self.channels),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _channels = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _channels.append(_x)
+
+        return cls(channels=_channels)
+
@@ -0,0 +1,40 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class GroupCallStreamRtmpUrl(TLObject):
+    CONSTRUCTOR_ID = 0x2dbf3432
+    SUBCLASS_OF_ID = 0xd1f515cb
+    __slots__ = ('url', 'key')
+
+    def __init__(self, url: str, key: str):
+        """
+        Constructor for phone.GroupCallStreamRtmpUrl: Instance of GroupCallStreamRtmpUrl.
+        """
+        self.url = url
+        self.key = key
+
+    def to_dict(self):
+        return {
+            '_': 'GroupCallStreamRtmpUrl',
+            'url': self.url,
+            'key': self.key
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'24\xbf-',
+            self.serialize_bytes(self.url),
+            self.serialize_bytes(self.key),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _key = reader.tgread_string()
+        return cls(url=_url, key=_key)
+
@@ -0,0 +1,74 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeGroupCallParticipant, TypeUser
+
+
+
+class GroupParticipants(TLObject):
+    CONSTRUCTOR_ID = 0xf47751b6
+    SUBCLASS_OF_ID = 0x72d304f4
+    __slots__ = ('count', 'participants', 'next_offset', 'chats', 'users', 'version')
+
+    def __init__(self, count: int, participants: List['TypeGroupCallParticipant'], next_offset: str, chats: List['TypeChat'], users: List['TypeUser'], version: int):
+        """
+        Constructor for phone.GroupParticipants: Instance of GroupParticipants.
+        """
+        self.count = count
+        self.participants = participants
+        self.next_offset = next_offset
+        self.chats = chats
+        self.users = users
+        self.version = version
+
+    def to_dict(self):
+        return {
+            '_': 'GroupParticipants',
+            'count': self.count,
+            'participants': [] if self.participants is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.participants],
+            'next_offset': self.next_offset,
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'version': self.version
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb6Qw\xf4',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.participants)),b''.join(x._bytes() for x in self.participants),
+            self.serialize_bytes(self.next_offset),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            struct.pack('<i', self.version),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _participants = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _participants.append(_x)
+
+        _next_offset = reader.tgread_string()
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        _version = reader.read_int()
+        return cls(count=_count, participants=_participants, next_offset=_next_offset, chats=_chats, users=_users, version=_version)
+
@@ -0,0 +1,377 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iq = struct.Struct('<iq')
+_struct_iqq = struct.Struct('<iqq')
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON, TypeInputGroupCall, TypePhoneCallDiscardReason, TypePhoneCallProtocol, TypePhoneConnection
+
+
+
+class PhoneCall(TLObject):
+    CONSTRUCTOR_ID = 0x3ba5940c
+    SUBCLASS_OF_ID = 0xc47f1bd1
+    __slots__ = ('id', 'access_hash', 'date', 'admin_id', 'participant_id', 'g_a_or_b', 'key_fingerprint', 'protocol', 'connections', 'start_date', 'p2p_allowed', 'video', 'custom_parameters', 'conference_call')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, date: Optional[datetime], admin_id: int, participant_id: int, g_a_or_b: bytes, key_fingerprint: int, protocol: 'TypePhoneCallProtocol', connections: List['TypePhoneConnection'], start_date: Optional[datetime], p2p_allowed: Optional[bool]=None, video: Optional[bool]=None, custom_parameters: Optional['TypeDataJSON']=None, conference_call: Optional['TypeInputGroupCall']=None):
+        """
+        Constructor for PhoneCall: Instance of either PhoneCallEmpty, PhoneCallWaiting, PhoneCallRequested, PhoneCallAccepted, PhoneCall, PhoneCallDiscarded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.date = date
+        self.admin_id = admin_id
+        self.participant_id = participant_id
+        self.g_a_or_b = g_a_or_b
+        self.key_fingerprint = key_fingerprint
+        self.protocol = protocol
+        self.connections = connections
+        self.start_date = start_date
+        self.p2p_allowed = p2p_allowed
+        self.video = video
+        self.custom_parameters = custom_parameters
+        self.conference_call = conference_call
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCall',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'date': self.date,
+            'admin_id': self.admin_id,
+            'participant_id': self.participant_id,
+            'g_a_or_b': self.g_a_or_b,
+            'key_fingerprint': self.key_fingerprint,
+            'protocol': self.protocol.to_dict() if isinstance(self.protocol, TLObject) else self.protocol,
+            'connections': [] if self.connections is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.connections],
+            'start_date': self.start_date,
+            'p2p_allowed': self.p2p_allowed,
+            'video': self.video,
+            'custom_parameters': self.custom_parameters.to_dict() if isinstance(self.custom_parameters, TLObject) else self.custom_parameters,
+            'conference_call': self.conference_call.to_dict() if isinstance(self.conference_call, TLObject) else self.conference_call
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0c\x94\xa5;',
+            _struct_Iqq.pack((0 if self.p2p_allowed is None or self.p2p_allowed is False else 32) | (0 if self.video is None or self.video is False else 64) | (0 if self.custom_parameters is None or self.custom_parameters is False else 128) | (0 if self.conference_call is None or self.conference_call is False else 256), self.id, self.access_hash),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.admin_id, self.participant_id),
+            self.serialize_bytes(self.g_a_or_b),
+            struct.pack('<q', self.key_fingerprint),
+            self.protocol._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.connections)),b''.join(x._bytes() for x in self.connections),
+            self.serialize_datetime(self.start_date),
+            b'' if self.custom_parameters is None or self.custom_parameters is False else (self.custom_parameters._bytes()),
+            b'' if self.conference_call is None or self.conference_call is False else (self.conference_call._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _p2p_allowed = bool(flags & 32)
+        _video = bool(flags & 64)
+        _date = reader.tgread_date()
+        _admin_id, _participant_id = reader.read_struct(_struct_qq)
+        _g_a_or_b = reader.tgread_bytes()
+        _key_fingerprint = reader.read_long()
+        _protocol = reader.tgread_object()
+        reader.read_int()
+        _connections = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _connections.append(_x)
+
+        _start_date = reader.tgread_date()
+        if flags & 128:
+            _custom_parameters = reader.tgread_object()
+        else:
+            _custom_parameters = None
+        if flags & 256:
+            _conference_call = reader.tgread_object()
+        else:
+            _conference_call = None
+        return cls(id=_id, access_hash=_access_hash, date=_date, admin_id=_admin_id, participant_id=_participant_id, g_a_or_b=_g_a_or_b, key_fingerprint=_key_fingerprint, protocol=_protocol, connections=_connections, start_date=_start_date, p2p_allowed=_p2p_allowed, video=_video, custom_parameters=_custom_parameters, conference_call=_conference_call)
+
+
+class PhoneCallAccepted(TLObject):
+    CONSTRUCTOR_ID = 0x22fd7181
+    SUBCLASS_OF_ID = 0xc47f1bd1
+    __slots__ = ('id', 'access_hash', 'date', 'admin_id', 'participant_id', 'g_b', 'protocol', 'video', 'conference_call')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, date: Optional[datetime], admin_id: int, participant_id: int, g_b: bytes, protocol: 'TypePhoneCallProtocol', video: Optional[bool]=None, conference_call: Optional['TypeInputGroupCall']=None):
+        """
+        Constructor for PhoneCall: Instance of either PhoneCallEmpty, PhoneCallWaiting, PhoneCallRequested, PhoneCallAccepted, PhoneCall, PhoneCallDiscarded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.date = date
+        self.admin_id = admin_id
+        self.participant_id = participant_id
+        self.g_b = g_b
+        self.protocol = protocol
+        self.video = video
+        self.conference_call = conference_call
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallAccepted',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'date': self.date,
+            'admin_id': self.admin_id,
+            'participant_id': self.participant_id,
+            'g_b': self.g_b,
+            'protocol': self.protocol.to_dict() if isinstance(self.protocol, TLObject) else self.protocol,
+            'video': self.video,
+            'conference_call': self.conference_call.to_dict() if isinstance(self.conference_call, TLObject) else self.conference_call
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x81q\xfd"',
+            _struct_Iqq.pack((0 if self.video is None or self.video is False else 64) | (0 if self.conference_call is None or self.conference_call is False else 256), self.id, self.access_hash),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.admin_id, self.participant_id),
+            self.serialize_bytes(self.g_b),
+            self.protocol._bytes(),
+            b'' if self.conference_call is None or self.conference_call is False else (self.conference_call._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _video = bool(flags & 64)
+        _date = reader.tgread_date()
+        _admin_id, _participant_id = reader.read_struct(_struct_qq)
+        _g_b = reader.tgread_bytes()
+        _protocol = reader.tgread_object()
+        if flags & 256:
+            _conference_call = reader.tgread_object()
+        else:
+            _conference_call = None
+        return cls(id=_id, access_hash=_access_hash, date=_date, admin_id=_admin_id, participant_id=_participant_id, g_b=_g_b, protocol=_protocol, video=_video, conference_call=_conference_call)
+
+
+class PhoneCallDiscarded(TLObject):
+    CONSTRUCTOR_ID = 0xf9d25503
+    SUBCLASS_OF_ID = 0xc47f1bd1
+    __slots__ = ('id', 'need_rating', 'need_debug', 'video', 'reason', 'duration', 'conference_call')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, need_rating: Optional[bool]=None, need_debug: Optional[bool]=None, video: Optional[bool]=None, reason: Optional['TypePhoneCallDiscardReason']=None, duration: Optional[int]=None, conference_call: Optional['TypeInputGroupCall']=None):
+        """
+        Constructor for PhoneCall: Instance of either PhoneCallEmpty, PhoneCallWaiting, PhoneCallRequested, PhoneCallAccepted, PhoneCall, PhoneCallDiscarded.
+        """
+        self.id = id
+        self.need_rating = need_rating
+        self.need_debug = need_debug
+        self.video = video
+        self.reason = reason
+        self.duration = duration
+        self.conference_call = conference_call
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallDiscarded',
+            'id': self.id,
+            'need_rating': self.need_rating,
+            'need_debug': self.need_debug,
+            'video': self.video,
+            'reason': self.reason.to_dict() if isinstance(self.reason, TLObject) else self.reason,
+            'duration': self.duration,
+            'conference_call': self.conference_call.to_dict() if isinstance(self.conference_call, TLObject) else self.conference_call
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x03U\xd2\xf9',
+            _struct_Iq.pack((0 if self.need_rating is None or self.need_rating is False else 4) | (0 if self.need_debug is None or self.need_debug is False else 8) | (0 if self.video is None or self.video is False else 64) | (0 if self.reason is None or self.reason is False else 1) | (0 if self.duration is None or self.duration is False else 2) | (0 if self.conference_call is None or self.conference_call is False else 256), self.id),
+            b'' if self.reason is None or self.reason is False else (self.reason._bytes()),
+            b'' if self.duration is None or self.duration is False else (struct.pack('<i', self.duration)),
+            b'' if self.conference_call is None or self.conference_call is False else (self.conference_call._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _need_rating = bool(flags & 4)
+        _need_debug = bool(flags & 8)
+        _video = bool(flags & 64)
+        if flags & 1:
+            _reason = reader.tgread_object()
+        else:
+            _reason = None
+        if flags & 2:
+            _duration = reader.read_int()
+        else:
+            _duration = None
+        if flags & 256:
+            _conference_call = reader.tgread_object()
+        else:
+            _conference_call = None
+        return cls(id=_id, need_rating=_need_rating, need_debug=_need_debug, video=_video, reason=_reason, duration=_duration, conference_call=_conference_call)
+
+
+class PhoneCallEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x5366c915
+    SUBCLASS_OF_ID = 0xc47f1bd1
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for PhoneCall: Instance of either PhoneCallEmpty, PhoneCallWaiting, PhoneCallRequested, PhoneCallAccepted, PhoneCall, PhoneCallDiscarded.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallEmpty',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x15\xc9fS',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
+
+class PhoneCallRequested(TLObject):
+    CONSTRUCTOR_ID = 0x45361c63
+    SUBCLASS_OF_ID = 0xc47f1bd1
+    __slots__ = ('id', 'access_hash', 'date', 'admin_id', 'participant_id', 'g_a_hash', 'protocol', 'video', 'conference_call')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, date: Optional[datetime], admin_id: int, participant_id: int, g_a_hash: bytes, protocol: 'TypePhoneCallProtocol', video: Optional[bool]=None, conference_call: Optional['TypeInputGroupCall']=None):
+        """
+        Constructor for PhoneCall: Instance of either PhoneCallEmpty, PhoneCallWaiting, PhoneCallRequested, PhoneCallAccepted, PhoneCall, PhoneCallDiscarded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.date = date
+        self.admin_id = admin_id
+        self.participant_id = participant_id
+        self.g_a_hash = g_a_hash
+        self.protocol = protocol
+        self.video = video
+        self.conference_call = conference_call
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallRequested',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'date': self.date,
+            'admin_id': self.admin_id,
+            'participant_id': self.participant_id,
+            'g_a_hash': self.g_a_hash,
+            'protocol': self.protocol.to_dict() if isinstance(self.protocol, TLObject) else self.protocol,
+            'video': self.video,
+            'conference_call': self.conference_call.to_dict() if isinstance(self.conference_call, TLObject) else self.conference_call
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'c\x1c6E',
+            _struct_Iqq.pack((0 if self.video is None or self.video is False else 64) | (0 if self.conference_call is None or self.conference_call is False else 256), self.id, self.access_hash),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.admin_id, self.participant_id),
+            self.serialize_bytes(self.g_a_hash),
+            self.protocol._bytes(),
+            b'' if self.conference_call is None or self.conference_call is False else (self.conference_call._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _video = bool(flags & 64)
+        _date = reader.tgread_date()
+        _admin_id, _participant_id = reader.read_struct(_struct_qq)
+        _g_a_hash = reader.tgread_bytes()
+        _protocol = reader.tgread_object()
+        if flags & 256:
+            _conference_call = reader.tgread_object()
+        else:
+            _conference_call = None
+        return cls(id=_id, access_hash=_access_hash, date=_date, admin_id=_admin_id, participant_id=_participant_id, g_a_hash=_g_a_hash, protocol=_protocol, video=_video, conference_call=_conference_call)
+
+
+class PhoneCallWaiting(TLObject):
+    CONSTRUCTOR_ID = 0xeed42858
+    SUBCLASS_OF_ID = 0xc47f1bd1
+    __slots__ = ('id', 'access_hash', 'date', 'admin_id', 'participant_id', 'protocol', 'video', 'receive_date', 'conference_call')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, date: Optional[datetime], admin_id: int, participant_id: int, protocol: 'TypePhoneCallProtocol', video: Optional[bool]=None, receive_date: Optional[datetime]=None, conference_call: Optional['TypeInputGroupCall']=None):
+        """
+        Constructor for PhoneCall: Instance of either PhoneCallEmpty, PhoneCallWaiting, PhoneCallRequested, PhoneCallAccepted, PhoneCall, PhoneCallDiscarded.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.date = date
+        self.admin_id = admin_id
+        self.participant_id = participant_id
+        self.protocol = protocol
+        self.video = video
+        self.receive_date = receive_date
+        self.conference_call = conference_call
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallWaiting',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'date': self.date,
+            'admin_id': self.admin_id,
+            'participant_id': self.participant_id,
+            'protocol': self.protocol.to_dict() if isinstance(self.protocol, TLObject) else self.protocol,
+            'video': self.video,
+            'receive_date': self.receive_date,
+            'conference_call': self.conference_call.to_dict() if isinstance(self.conference_call, TLObject) else self.conference_call
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'X(\xd4\xee',
+            _struct_Iqq.pack((0 if self.video is None or self.video is False else 64) | (0 if self.receive_date is None or self.receive_date is False else 1) | (0 if self.conference_call is None or self.conference_call is False else 256), self.id, self.access_hash),
+            self.serialize_datetime(self.date),
+            _struct_qq.pack(self.admin_id, self.participant_id),
+            self.protocol._bytes(),
+            b'' if self.receive_date is None or self.receive_date is False else (self.serialize_datetime(self.receive_date)),
+            b'' if self.conference_call is None or self.conference_call is False else (self.conference_call._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _video = bool(flags & 64)
+        _date = reader.tgread_date()
+        _admin_id, _participant_id = reader.read_struct(_struct_qq)
+        _protocol = reader.tgread_object()
+        if flags & 1:
+            _receive_date = reader.tgread_date()
+        else:
+            _receive_date = None
+        if flags & 256:
+            _conference_call = reader.tgread_object()
+        else:
+            _conference_call = None
+        return cls(id=_id, access_hash=_access_hash, date=_date, admin_id=_admin_id, participant_id=_participant_id, protocol=_protocol, video=_video, receive_date=_receive_date, conference_call=_conference_call)
+
+TypePhoneCall = Union[PhoneCallEmpty,PhoneCallWaiting,PhoneCallRequested,PhoneCallAccepted,PhoneCall,PhoneCallDiscarded]
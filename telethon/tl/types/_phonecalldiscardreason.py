@@ -0,0 +1,117 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PhoneCallDiscardReasonAllowGroupCall(TLObject):
+    CONSTRUCTOR_ID = 0xafe2b839
+    SUBCLASS_OF_ID = 0xd89bad3d
+    __slots__ = ('encrypted_key',)
+
+    def __init__(self, encrypted_key: bytes):
+        """
+        Constructor for PhoneCallDiscardReason: Instance of either PhoneCallDiscardReasonMissed, PhoneCallDiscardReasonDisconnect, PhoneCallDiscardReasonHangup, PhoneCallDiscardReasonBusy, PhoneCallDiscardReasonAllowGroupCall.
+        """
+        self.encrypted_key = encrypted_key
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallDiscardReasonAllowGroupCall',
+            'encrypted_key': self.encrypted_key
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'9\xb8\xe2\xaf',
+            self.serialize_bytes(self.encrypted_key),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _encrypted_key = reader.tgread_bytes()
+        return cls(encrypted_key=_encrypted_key)
+
+
+class PhoneCallDiscardReasonBusy(TLObject):
+    CONSTRUCTOR_ID = 0xfaf7e8c9
+    SUBCLASS_OF_ID = 0xd89bad3d
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallDiscardReasonBusy'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc9\xe8\xf7\xfa',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PhoneCallDiscardReasonDisconnect(TLObject):
+    CONSTRUCTOR_ID = 0xe095c1a0
+    SUBCLASS_OF_ID = 0xd89bad3d
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallDiscardReasonDisconnect'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0\xc1\x95\xe0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PhoneCallDiscardReasonHangup(TLObject):
+    CONSTRUCTOR_ID = 0x57adc690
+    SUBCLASS_OF_ID = 0xd89bad3d
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallDiscardReasonHangup'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x90\xc6\xadW',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PhoneCallDiscardReasonMissed(TLObject):
+    CONSTRUCTOR_ID = 0x85e42301
+    SUBCLASS_OF_ID = 0xd89bad3d
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallDiscardReasonMissed'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x01#\xe4\x85',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypePhoneCallDiscardReason = Union[PhoneCallDiscardReasonMissed,PhoneCallDiscardReasonDisconnect,PhoneCallDiscardReasonHangup,PhoneCallDiscardReasonBusy,PhoneCallDiscardReasonAllowGroupCall]
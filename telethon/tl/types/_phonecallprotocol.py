@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iii = struct.Struct('<Iii')
+_struct_iii = struct.Struct('<iii')
+
+
+class PhoneCallProtocol(TLObject):
+    CONSTRUCTOR_ID = 0xfc878fc8
+    SUBCLASS_OF_ID = 0x783991a3
+    __slots__ = ('min_layer', 'max_layer', 'library_versions', 'udp_p2p', 'udp_reflector')
+
+    def __init__(self, min_layer: int, max_layer: int, library_versions: List[str], udp_p2p: Optional[bool]=None, udp_reflector: Optional[bool]=None):
+        """
+        Constructor for PhoneCallProtocol: Instance of PhoneCallProtocol.
+        """
+        self.min_layer = min_layer
+        self.max_layer = max_layer
+        self.library_versions = library_versions
+        self.udp_p2p = udp_p2p
+        self.udp_reflector = udp_reflector
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneCallProtocol',
+            'min_layer': self.min_layer,
+            'max_layer': self.max_layer,
+            'library_versions': [] if self.library_versions is None else self.library_versions[:],
+            'udp_p2p': self.udp_p2p,
+            'udp_reflector': self.udp_reflector
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc8\x8f\x87\xfc',
+            _struct_Iii.pack((0 if self.udp_p2p is None or self.udp_p2p is False else 1) | (0 if self.udp_reflector is None or self.udp_reflector is False else 2), self.min_layer, self.max_layer),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.library_versions)),b''.join(self.serialize_bytes(x) for x in self.library_versions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _min_layer, _max_layer = reader.read_struct(_struct_iii)
+        _udp_p2p = bool(flags & 1)
+        _udp_reflector = bool(flags & 2)
+        reader.read_int()
+        _library_versions = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _library_versions.append(_x)
+
+        return cls(min_layer=_min_layer, max_layer=_max_layer, library_versions=_library_versions, udp_p2p=_udp_p2p, udp_reflector=_udp_reflector)
+
+TypePhoneCallProtocol = PhoneCallProtocol
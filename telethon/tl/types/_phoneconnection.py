@@ -0,0 +1,116 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class PhoneConnection(TLObject):
+    CONSTRUCTOR_ID = 0x9cc123c7
+    SUBCLASS_OF_ID = 0xaa8de40d
+    __slots__ = ('id', 'ip', 'ipv6', 'port', 'peer_tag', 'tcp')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, ip: str, ipv6: str, port: int, peer_tag: bytes, tcp: Optional[bool]=None):
+        """
+        Constructor for PhoneConnection: Instance of either PhoneConnection, PhoneConnectionWebrtc.
+        """
+        self.id = id
+        self.ip = ip
+        self.ipv6 = ipv6
+        self.port = port
+        self.peer_tag = peer_tag
+        self.tcp = tcp
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneConnection',
+            'id': self.id,
+            'ip': self.ip,
+            'ipv6': self.ipv6,
+            'port': self.port,
+            'peer_tag': self.peer_tag,
+            'tcp': self.tcp
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc7#\xc1\x9c',
+            _struct_Iq.pack((0 if self.tcp is None or self.tcp is False else 1), self.id),
+            self.serialize_bytes(self.ip),
+            self.serialize_bytes(self.ipv6),
+            struct.pack('<i', self.port),
+            self.serialize_bytes(self.peer_tag),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _tcp = bool(flags & 1)
+        _ip = reader.tgread_string()
+        _ipv6 = reader.tgread_string()
+        _port = reader.read_int()
+        _peer_tag = reader.tgread_bytes()
+        return cls(id=_id, ip=_ip, ipv6=_ipv6, port=_port, peer_tag=_peer_tag, tcp=_tcp)
+
+
+class PhoneConnectionWebrtc(TLObject):
+    CONSTRUCTOR_ID = 0x635fe375
+    SUBCLASS_OF_ID = 0xaa8de40d
+    __slots__ = ('id', 'ip', 'ipv6', 'port', 'username', 'password', 'turn', 'stun')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, ip: str, ipv6: str, port: int, username: str, password: str, turn: Optional[bool]=None, stun: Optional[bool]=None):
+        """
+        Constructor for PhoneConnection: Instance of either PhoneConnection, PhoneConnectionWebrtc.
+        """
+        self.id = id
+        self.ip = ip
+        self.ipv6 = ipv6
+        self.port = port
+        self.username = username
+        self.password = password
+        self.turn = turn
+        self.stun = stun
+
+    def to_dict(self):
+        return {
+            '_': 'PhoneConnectionWebrtc',
+            'id': self.id,
+            'ip': self.ip,
+            'ipv6': self.ipv6,
+            'port': self.port,
+            'username': self.username,
+            'password': self.password,
+            'turn': self.turn,
+            'stun': self.stun
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'u\xe3_c',
+            _struct_Iq.pack((0 if self.turn is None or self.turn is False else 1) | (0 if self.stun is None or self.stun is False else 2), self.id),
+            self.serialize_bytes(self.ip),
+            self.serialize_bytes(self.ipv6),
+            struct.pack('<i', self.port),
+            self.serialize_bytes(self.username),
+            self.serialize_bytes(self.password),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _turn = bool(flags & 1)
+        _stun = bool(flags & 2)
+        _ip = reader.tgread_string()
+        _ipv6 = reader.tgread_string()
+        _port = reader.read_int()
+        _username = reader.tgread_string()
+        _password = reader.tgread_string()
+        return cls(id=_id, ip=_ip, ipv6=_ipv6, port=_port, username=_username, password=_password, turn=_turn, stun=_stun)
+
+TypePhoneConnection = Union[PhoneConnection,PhoneConnectionWebrtc]
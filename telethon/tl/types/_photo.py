@@ -0,0 +1,112 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypePhotoSize, TypeVideoSize
+
+
+
+class Photo(TLObject):
+    CONSTRUCTOR_ID = 0xfb197a65
+    SUBCLASS_OF_ID = 0xd576ab1c
+    __slots__ = ('id', 'access_hash', 'file_reference', 'date', 'sizes', 'dc_id', 'has_stickers', 'video_sizes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, file_reference: bytes, date: Optional[datetime], sizes: List['TypePhotoSize'], dc_id: int, has_stickers: Optional[bool]=None, video_sizes: Optional[List['TypeVideoSize']]=None):
+        """
+        Constructor for Photo: Instance of either PhotoEmpty, Photo.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.file_reference = file_reference
+        self.date = date
+        self.sizes = sizes
+        self.dc_id = dc_id
+        self.has_stickers = has_stickers
+        self.video_sizes = video_sizes
+
+    def to_dict(self):
+        return {
+            '_': 'Photo',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'file_reference': self.file_reference,
+            'date': self.date,
+            'sizes': [] if self.sizes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.sizes],
+            'dc_id': self.dc_id,
+            'has_stickers': self.has_stickers,
+            'video_sizes': [] if self.video_sizes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.video_sizes]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'ez\x19\xfb',
+            _struct_Iqq.pack((0 if self.has_stickers is None or self.has_stickers is False else 1) | (0 if self.video_sizes is None or self.video_sizes is False else 2), self.id, self.access_hash),
+            self.serialize_bytes(self.file_reference),
+            self.serialize_datetime(self.date),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.sizes)),b''.join(x._bytes() for x in self.sizes),
+            b'' if self.video_sizes is None or self.video_sizes is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.video_sizes)),b''.join(x._bytes() for x in self.video_sizes))),
+            struct.pack('<i', self.dc_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _has_stickers = bool(flags & 1)
+        _file_reference = reader.tgread_bytes()
+        _date = reader.tgread_date()
+        reader.read_int()
+        _sizes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _sizes.append(_x)
+
+        if flags & 2:
+            reader.read_int()
+            _video_sizes = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _video_sizes.append(_x)
+
+        else:
+            _video_sizes = None
+        _dc_id = reader.read_int()
+        return cls(id=_id, access_hash=_access_hash, file_reference=_file_reference, date=_date, sizes=_sizes, dc_id=_dc_id, has_stickers=_has_stickers, video_sizes=_video_sizes)
+
+
+class PhotoEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x2331b22d
+    SUBCLASS_OF_ID = 0xd576ab1c
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for Photo: Instance of either PhotoEmpty, Photo.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'PhotoEmpty',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'-\xb21#',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
+TypePhoto = Union[PhotoEmpty,Photo]
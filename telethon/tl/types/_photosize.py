@@ -0,0 +1,228 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+_struct_iii = struct.Struct('<iii')
+
+
+class PhotoCachedSize(TLObject):
+    CONSTRUCTOR_ID = 0x21e1ad6
+    SUBCLASS_OF_ID = 0x17cc29d9
+    __slots__ = ('type', 'w', 'h', 'bytes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str, w: int, h: int, bytes: bytes):
+        """
+        Constructor for PhotoSize: Instance of either PhotoSizeEmpty, PhotoSize, PhotoCachedSize, PhotoStrippedSize, PhotoSizeProgressive, PhotoPathSize.
+        """
+        self.type = type
+        self.w = w
+        self.h = h
+        self.bytes = bytes
+
+    def to_dict(self):
+        return {
+            '_': 'PhotoCachedSize',
+            'type': self.type,
+            'w': self.w,
+            'h': self.h,
+            'bytes': self.bytes
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd6\x1a\x1e\x02',
+            self.serialize_bytes(self.type),
+            _struct_ii.pack(self.w, self.h),
+            self.serialize_bytes(self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_string()
+        _w, _h = reader.read_struct(_struct_ii)
+        _bytes = reader.tgread_bytes()
+        return cls(type=_type, w=_w, h=_h, bytes=_bytes)
+
+
+class PhotoPathSize(TLObject):
+    CONSTRUCTOR_ID = 0xd8214d41
+    SUBCLASS_OF_ID = 0x17cc29d9
+    __slots__ = ('type', 'bytes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str, bytes: bytes):
+        """
+        Constructor for PhotoSize: Instance of either PhotoSizeEmpty, PhotoSize, PhotoCachedSize, PhotoStrippedSize, PhotoSizeProgressive, PhotoPathSize.
+        """
+        self.type = type
+        self.bytes = bytes
+
+    def to_dict(self):
+        return {
+            '_': 'PhotoPathSize',
+            'type': self.type,
+            'bytes': self.bytes
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'AM!\xd8',
+            self.serialize_bytes(self.type),
+            self.serialize_bytes(self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_string()
+        _bytes = reader.tgread_bytes()
+        return cls(type=_type, bytes=_bytes)
+
+
+class PhotoSize(TLObject):
+    CONSTRUCTOR_ID = 0x75c78e60
+    SUBCLASS_OF_ID = 0x17cc29d9
+    __slots__ = ('type', 'w', 'h', 'size')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str, w: int, h: int, size: int):
+        """
+        Constructor for PhotoSize: Instance of either PhotoSizeEmpty, PhotoSize, PhotoCachedSize, PhotoStrippedSize, PhotoSizeProgressive, PhotoPathSize.
+        """
+        self.type = type
+        self.w = w
+        self.h = h
+        self.size = size
+
+    def to_dict(self):
+        return {
+            '_': 'PhotoSize',
+            'type': self.type,
+            'w': self.w,
+            'h': self.h,
+            'size': self.size
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'`\x8e\xc7u',
+            self.serialize_bytes(self.type),
+            _struct_iii.pack(self.w, self.h, self.size),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_string()
+        _w, _h, _size = reader.read_struct(_struct_iii)
+        return cls(type=_type, w=_w, h=_h, size=_size)
+
+
+class PhotoSizeEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xe17e23c
+    SUBCLASS_OF_ID = 0x17cc29d9
+    __slots__ = ('type',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str):
+        """
+        Constructor for PhotoSize: Instance of either PhotoSizeEmpty, PhotoSize, PhotoCachedSize, PhotoStrippedSize, PhotoSizeProgressive, PhotoPathSize.
+        """
+        self.type = type
+
+    def to_dict(self):
+        return {
+            '_': 'PhotoSizeEmpty',
+            'type': self.type
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'<\xe2\x17\x0e',
+            self.serialize_bytes(self.type),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_string()
+        return cls(type=_type)
+
+
+class PhotoSizeProgressive(TLObject):
+    CONSTRUCTOR_ID = 0xfa3efb95
+    SUBCLASS_OF_ID = 0x17cc29d9
+    __slots__ = ('type', 'w', 'h', 'sizes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str, w: int, h: int, sizes: List[int]):
+        """
+        Constructor for PhotoSize: Instance of either PhotoSizeEmpty, PhotoSize, PhotoCachedSize, PhotoStrippedSize, PhotoSizeProgressive, PhotoPathSize.
+        """
+        self.type = type
+        self.w = w
+        self.h = h
+        self.sizes = sizes
+
+    def to_dict(self):
+        return {
+            '_': 'PhotoSizeProgressive',
+            'type': self.type,
+            'w': self.w,
+            'h': self.h,
+            'sizes': [] if self.sizes is None else self.sizes[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95\xfb>\xfa',
+            self.serialize_bytes(self.type),
+            _struct_ii.pack(self.w, self.h),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.sizes)), len(self.sizes), *self.sizes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_string()
+        _w, _h = reader.read_struct(_struct_ii)
+        reader.read_int()
+        _sizes = reader.read_array('i', reader.read_int())
+        return cls(type=_type, w=_w, h=_h, sizes=_sizes)
+
+
+class PhotoStrippedSize(TLObject):
+    CONSTRUCTOR_ID = 0xe0b0bc2e
+    SUBCLASS_OF_ID = 0x17cc29d9
+    __slots__ = ('type', 'bytes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str, bytes: bytes):
+        """
+        Constructor for PhotoSize: Instance of either PhotoSizeEmpty, PhotoSize, PhotoCachedSize, PhotoStrippedSize, PhotoSizeProgressive, PhotoPathSize.
+        """
+        self.type = type
+        self.bytes = bytes
+
+    def to_dict(self):
+        return {
+            '_': 'PhotoStrippedSize',
+            'type': self.type,
+            'bytes': self.bytes
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'.\xbc\xb0\xe0',
+            self.serialize_bytes(self.type),
+            self.serialize_bytes(self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_string()
+        _bytes = reader.tgread_bytes()
+        return cls(type=_type, bytes=_bytes)
+
+TypePhotoSize = Union[PhotoSizeEmpty,PhotoSize,PhotoCachedSize,PhotoStrippedSize,PhotoSizeProgressive,PhotoPathSize]
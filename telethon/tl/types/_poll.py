@@ -0,0 +1,83 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qI = struct.Struct('<qI')
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import TypePollAnswer, TypeTextWithEntities
+
+
+
+class Poll(TLObject):
+    CONSTRUCTOR_ID = 0x58747131
+    SUBCLASS_OF_ID = 0x248e557b
+    __slots__ = ('id', 'question', 'answers', 'closed', 'public_voters', 'multiple_choice', 'quiz', 'close_period', 'close_date')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, question: 'TypeTextWithEntities', answers: List['TypePollAnswer'], closed: Optional[bool]=None, public_voters: Optional[bool]=None, multiple_choice: Optional[bool]=None, quiz: Optional[bool]=None, close_period: Optional[int]=None, close_date: Optional[datetime]=None):
+        """
+        Constructor for Poll: Instance of Poll.
+        """
+        self.id = id
+        self.question = question
+        self.answers = answers
+        self.closed = closed
+        self.public_voters = public_voters
+        self.multiple_choice = multiple_choice
+        self.quiz = quiz
+        self.close_period = close_period
+        self.close_date = close_date
+
+    def to_dict(self):
+        return {
+            '_': 'Poll',
+            'id': self.id,
+            'question': self.question.to_dict() if isinstance(self.question, TLObject) else self.question,
+            'answers': [] if self.answers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.answers],
+            'closed': self.closed,
+            'public_voters': self.public_voters,
+            'multiple_choice': self.multiple_choice,
+            'quiz': self.quiz,
+            'close_period': self.close_period,
+            'close_date': self.close_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'1qtX',
+            _struct_qI.pack(self.id, (0 if self.closed is None or self.closed is False else 1) | (0 if self.public_voters is None or self.public_voters is False else 2) | (0 if self.multiple_choice is None or self.multiple_choice is False else 4) | (0 if self.quiz is None or self.quiz is False else 8) | (0 if self.close_period is None or self.close_period is False else 16) | (0 if self.close_date is None or self.close_date is False else 32)),
+            self.question._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.answers)),b''.join(x._bytes() for x in self.answers),
+            b'' if self.close_period is None or self.close_period is False else (struct.pack('<i', self.close_period)),
+            b'' if self.close_date is None or self.close_date is False else (self.serialize_datetime(self.close_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, flags = reader.read_struct(_struct_qi)
+        _closed = bool(flags & 1)
+        _public_voters = bool(flags & 2)
+        _multiple_choice = bool(flags & 4)
+        _quiz = bool(flags & 8)
+        _question = reader.tgread_object()
+        reader.read_int()
+        _answers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _answers.append(_x)
+
+        if flags & 16:
+            _close_period = reader.read_int()
+        else:
+            _close_period = None
+        if flags & 32:
+            _close_date = reader.tgread_date()
+        else:
+            _close_date = None
+        return cls(id=_id, question=_question, answers=_answers, closed=_closed, public_voters=_public_voters, multiple_choice=_multiple_choice, quiz=_quiz, close_period=_close_period, close_date=_close_date)
+
+TypePoll = Poll
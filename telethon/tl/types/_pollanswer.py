@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeTextWithEntities
+
+
+
+class PollAnswer(TLObject):
+    CONSTRUCTOR_ID = 0xff16e2ca
+    SUBCLASS_OF_ID = 0x7ea5dd9e
+    __slots__ = ('text', 'option')
+
+    def __init__(self, text: 'TypeTextWithEntities', option: bytes):
+        """
+        Constructor for PollAnswer: Instance of PollAnswer.
+        """
+        self.text = text
+        self.option = option
+
+    def to_dict(self):
+        return {
+            '_': 'PollAnswer',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'option': self.option
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xca\xe2\x16\xff',
+            self.text._bytes(),
+            self.serialize_bytes(self.option),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _option = reader.tgread_bytes()
+        return cls(text=_text, option=_option)
+
+TypePollAnswer = PollAnswer
@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PollAnswerVoters(TLObject):
+    CONSTRUCTOR_ID = 0x3b6ddad2
+    SUBCLASS_OF_ID = 0x7ce0cf91
+    __slots__ = ('option', 'voters', 'chosen', 'correct')
+
+    def __init__(self, option: bytes, voters: int, chosen: Optional[bool]=None, correct: Optional[bool]=None):
+        """
+        Constructor for PollAnswerVoters: Instance of PollAnswerVoters.
+        """
+        self.option = option
+        self.voters = voters
+        self.chosen = chosen
+        self.correct = correct
+
+    def to_dict(self):
+        return {
+            '_': 'PollAnswerVoters',
+            'option': self.option,
+            'voters': self.voters,
+            'chosen': self.chosen,
+            'correct': self.correct
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd2\xdam;',
+            struct.pack('<I', (0 if self.chosen is None or self.chosen is False else 1) | (0 if self.correct is None or self.correct is False else 2)),
+            self.serialize_bytes(self.option),
+            struct.pack('<i', self.voters),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _chosen = bool(flags & 1)
+        _correct = bool(flags & 2)
+        _option = reader.tgread_bytes()
+        _voters = reader.read_int()
+        return cls(option=_option, voters=_voters, chosen=_chosen, correct=_correct)
+
+TypePollAnswerVoters = PollAnswerVoters
@@ -0,0 +1,94 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity, TypePeer, TypePollAnswerVoters
+
+
+
+class PollResults(TLObject):
+    CONSTRUCTOR_ID = 0x7adf2420
+    SUBCLASS_OF_ID = 0xc3b4f687
+    __slots__ = ('min', 'results', 'total_voters', 'recent_voters', 'solution', 'solution_entities')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, min: Optional[bool]=None, results: Optional[List['TypePollAnswerVoters']]=None, total_voters: Optional[int]=None, recent_voters: Optional[List['TypePeer']]=None, solution: Optional[str]=None, solution_entities: Optional[List['TypeMessageEntity']]=None):
+        """
+        Constructor for PollResults: Instance of PollResults.
+        """
+        self.min = min
+        self.results = results
+        self.total_voters = total_voters
+        self.recent_voters = recent_voters
+        self.solution = solution
+        self.solution_entities = solution_entities
+
+    def to_dict(self):
+        return {
+            '_': 'PollResults',
+            'min': self.min,
+            'results': [] if self.results is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.results],
+            'total_voters': self.total_voters,
+            'recent_voters': [] if self.recent_voters is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.recent_voters],
+            'solution': self.solution,
+            'solution_entities': [] if self.solution_entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.solution_entities]
+        }
+
+    def _bytes(self):
+        assert ((self.solution or self.solution is not None) and (self.solution_entities or self.solution_entities is not None)) or ((self.solution is None or self.solution is False) and (self.solution_entities is None or self.solution_entities is False)), 'solution, solution_entities parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b' $\xdfz',
+            struct.pack('<I', (0 if self.min is None or self.min is False else 1) | (0 if self.results is None or self.results is False else 2) | (0 if self.total_voters is None or self.total_voters is False else 4) | (0 if self.recent_voters is None or self.recent_voters is False else 8) | (0 if self.solution is None or self.solution is False else 16) | (0 if self.solution_entities is None or self.solution_entities is False else 16)),
+            b'' if self.results is None or self.results is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.results)),b''.join(x._bytes() for x in self.results))),
+            b'' if self.total_voters is None or self.total_voters is False else (struct.pack('<i', self.total_voters)),
+            b'' if self.recent_voters is None or self.recent_voters is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.recent_voters)),b''.join(x._bytes() for x in self.recent_voters))),
+            b'' if self.solution is None or self.solution is False else (self.serialize_bytes(self.solution)),
+            b'' if self.solution_entities is None or self.solution_entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.solution_entities)),b''.join(x._bytes() for x in self.solution_entities))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _min = bool(flags & 1)
+        if flags & 2:
+            reader.read_int()
+            _results = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _results.append(_x)
+
+        else:
+            _results = None
+        if flags & 4:
+            _total_voters = reader.read_int()
+        else:
+            _total_voters = None
+        if flags & 8:
+            reader.read_int()
+            _recent_voters = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _recent_voters.append(_x)
+
+        else:
+            _recent_voters = None
+        if flags & 16:
+            _solution = reader.tgread_string()
+        else:
+            _solution = None
+        if flags & 16:
+            reader.read_int()
+            _solution_entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _solution_entities.append(_x)
+
+        else:
+            _solution_entities = None
+        return cls(min=_min, results=_results, total_voters=_total_voters, recent_voters=_recent_voters, solution=_solution, solution_entities=_solution_entities)
+
+TypePollResults = PollResults
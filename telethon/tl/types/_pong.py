@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class Pong(TLObject):
+    CONSTRUCTOR_ID = 0x347773c5
+    SUBCLASS_OF_ID = 0x816aee71
+    __slots__ = ('msg_id', 'ping_id')
+
+    def __init__(self, msg_id: int, ping_id: int):
+        """
+        Constructor for Pong: Instance of Pong.
+        """
+        self.msg_id = msg_id
+        self.ping_id = ping_id
+
+    def to_dict(self):
+        return {
+            '_': 'Pong',
+            'msg_id': self.msg_id,
+            'ping_id': self.ping_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc5sw4',
+            _struct_qq.pack(self.msg_id, self.ping_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _msg_id, _ping_id = reader.read_struct(_struct_qq)
+        return cls(msg_id=_msg_id, ping_id=_ping_id)
+
+TypePong = Pong
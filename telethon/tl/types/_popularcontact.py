@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+
+
+class PopularContact(TLObject):
+    CONSTRUCTOR_ID = 0x5ce14175
+    SUBCLASS_OF_ID = 0x409255a
+    __slots__ = ('client_id', 'importers')
+
+    def __init__(self, client_id: int, importers: int):
+        """
+        Constructor for PopularContact: Instance of PopularContact.
+        """
+        self.client_id = client_id
+        self.importers = importers
+
+    def to_dict(self):
+        return {
+            '_': 'PopularContact',
+            'client_id': self.client_id,
+            'importers': self.importers
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'uA\xe1\\',
+            _struct_qi.pack(self.client_id, self.importers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _client_id, _importers = reader.read_struct(_struct_qi)
+        return cls(client_id=_client_id, importers=_importers)
+
+TypePopularContact = PopularContact
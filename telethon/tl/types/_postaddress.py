@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PostAddress(TLObject):
+    CONSTRUCTOR_ID = 0x1e8caaeb
+    SUBCLASS_OF_ID = 0x8d7eda2c
+    __slots__ = ('street_line1', 'street_line2', 'city', 'state', 'country_iso2', 'post_code')
+
+    def __init__(self, street_line1: str, street_line2: str, city: str, state: str, country_iso2: str, post_code: str):
+        """
+        Constructor for PostAddress: Instance of PostAddress.
+        """
+        self.street_line1 = street_line1
+        self.street_line2 = street_line2
+        self.city = city
+        self.state = state
+        self.country_iso2 = country_iso2
+        self.post_code = post_code
+
+    def to_dict(self):
+        return {
+            '_': 'PostAddress',
+            'street_line1': self.street_line1,
+            'street_line2': self.street_line2,
+            'city': self.city,
+            'state': self.state,
+            'country_iso2': self.country_iso2,
+            'post_code': self.post_code
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeb\xaa\x8c\x1e',
+            self.serialize_bytes(self.street_line1),
+            self.serialize_bytes(self.street_line2),
+            self.serialize_bytes(self.city),
+            self.serialize_bytes(self.state),
+            self.serialize_bytes(self.country_iso2),
+            self.serialize_bytes(self.post_code),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _street_line1 = reader.tgread_string()
+        _street_line2 = reader.tgread_string()
+        _city = reader.tgread_string()
+        _state = reader.tgread_string()
+        _country_iso2 = reader.tgread_string()
+        _post_code = reader.tgread_string()
+        return cls(street_line1=_street_line1, street_line2=_street_line2, city=_city, state=_state, country_iso2=_country_iso2, post_code=_post_code)
+
+TypePostAddress = PostAddress
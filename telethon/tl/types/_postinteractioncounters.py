@@ -0,0 +1,80 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iiii = struct.Struct('<iiii')
+
+
+class PostInteractionCountersMessage(TLObject):
+    CONSTRUCTOR_ID = 0xe7058e7f
+    SUBCLASS_OF_ID = 0x6e4a459b
+    __slots__ = ('msg_id', 'views', 'forwards', 'reactions')
+
+    def __init__(self, msg_id: int, views: int, forwards: int, reactions: int):
+        """
+        Constructor for PostInteractionCounters: Instance of either PostInteractionCountersMessage, PostInteractionCountersStory.
+        """
+        self.msg_id = msg_id
+        self.views = views
+        self.forwards = forwards
+        self.reactions = reactions
+
+    def to_dict(self):
+        return {
+            '_': 'PostInteractionCountersMessage',
+            'msg_id': self.msg_id,
+            'views': self.views,
+            'forwards': self.forwards,
+            'reactions': self.reactions
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x7f\x8e\x05\xe7',
+            _struct_iiii.pack(self.msg_id, self.views, self.forwards, self.reactions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _msg_id, _views, _forwards, _reactions = reader.read_struct(_struct_iiii)
+        return cls(msg_id=_msg_id, views=_views, forwards=_forwards, reactions=_reactions)
+
+
+class PostInteractionCountersStory(TLObject):
+    CONSTRUCTOR_ID = 0x8a480e27
+    SUBCLASS_OF_ID = 0x6e4a459b
+    __slots__ = ('story_id', 'views', 'forwards', 'reactions')
+
+    def __init__(self, story_id: int, views: int, forwards: int, reactions: int):
+        """
+        Constructor for PostInteractionCounters: Instance of either PostInteractionCountersMessage, PostInteractionCountersStory.
+        """
+        self.story_id = story_id
+        self.views = views
+        self.forwards = forwards
+        self.reactions = reactions
+
+    def to_dict(self):
+        return {
+            '_': 'PostInteractionCountersStory',
+            'story_id': self.story_id,
+            'views': self.views,
+            'forwards': self.forwards,
+            'reactions': self.reactions
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"'\x0eH\x8a",
+            _struct_iiii.pack(self.story_id, self.views, self.forwards, self.reactions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _story_id, _views, _forwards, _reactions = reader.read_struct(_struct_iiii)
+        return cls(story_id=_story_id, views=_views, forwards=_forwards, reactions=_reactions)
+
+TypePostInteractionCounters = Union[PostInteractionCountersMessage,PostInteractionCountersStory]
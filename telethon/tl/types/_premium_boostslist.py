@@ -0,0 +1,67 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBoost, TypeUser
+
+
+
+class BoostsList(TLObject):
+    CONSTRUCTOR_ID = 0x86f8613c
+    SUBCLASS_OF_ID = 0x2235a8bd
+    __slots__ = ('count', 'boosts', 'users', 'next_offset')
+
+    def __init__(self, count: int, boosts: List['TypeBoost'], users: List['TypeUser'], next_offset: Optional[str]=None):
+        """
+        Constructor for premium.BoostsList: Instance of BoostsList.
+        """
+        self.count = count
+        self.boosts = boosts
+        self.users = users
+        self.next_offset = next_offset
+
+    def to_dict(self):
+        return {
+            '_': 'BoostsList',
+            'count': self.count,
+            'boosts': [] if self.boosts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.boosts],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'next_offset': self.next_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'<a\xf8\x86',
+            _struct_Ii.pack((0 if self.next_offset is None or self.next_offset is False else 1), self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.boosts)),b''.join(x._bytes() for x in self.boosts),
+            b'' if self.next_offset is None or self.next_offset is False else (self.serialize_bytes(self.next_offset)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count = reader.read_struct(_struct_ii)
+        reader.read_int()
+        _boosts = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _boosts.append(_x)
+
+        if flags & 1:
+            _next_offset = reader.tgread_string()
+        else:
+            _next_offset = None
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, boosts=_boosts, users=_users, next_offset=_next_offset)
+
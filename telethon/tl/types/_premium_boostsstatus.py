@@ -0,0 +1,95 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iiii = struct.Struct('<Iiii')
+_struct_iiii = struct.Struct('<iiii')
+if TYPE_CHECKING:
+    from ...tl.types import TypePrepaidGiveaway, TypeStatsPercentValue
+
+
+
+class BoostsStatus(TLObject):
+    CONSTRUCTOR_ID = 0x4959427a
+    SUBCLASS_OF_ID = 0xc31b1ab9
+    __slots__ = ('level', 'current_level_boosts', 'boosts', 'boost_url', 'my_boost', 'gift_boosts', 'next_level_boosts', 'premium_audience', 'prepaid_giveaways', 'my_boost_slots')
+
+    def __init__(self, level: int, current_level_boosts: int, boosts: int, boost_url: str, my_boost: Optional[bool]=None, gift_boosts: Optional[int]=None, next_level_boosts: Optional[int]=None, premium_audience: Optional['TypeStatsPercentValue']=None, prepaid_giveaways: Optional[List['TypePrepaidGiveaway']]=None, my_boost_slots: Optional[List[int]]=None):
+        """
+        Constructor for premium.BoostsStatus: Instance of BoostsStatus.
+        """
+        self.level = level
+        self.current_level_boosts = current_level_boosts
+        self.boosts = boosts
+        self.boost_url = boost_url
+        self.my_boost = my_boost
+        self.gift_boosts = gift_boosts
+        self.next_level_boosts = next_level_boosts
+        self.premium_audience = premium_audience
+        self.prepaid_giveaways = prepaid_giveaways
+        self.my_boost_slots = my_boost_slots
+
+    def to_dict(self):
+        return {
+            '_': 'BoostsStatus',
+            'level': self.level,
+            'current_level_boosts': self.current_level_boosts,
+            'boosts': self.boosts,
+            'boost_url': self.boost_url,
+            'my_boost': self.my_boost,
+            'gift_boosts': self.gift_boosts,
+            'next_level_boosts': self.next_level_boosts,
+            'premium_audience': self.premium_audience.to_dict() if isinstance(self.premium_audience, TLObject) else self.premium_audience,
+            'prepaid_giveaways': [] if self.prepaid_giveaways is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.prepaid_giveaways],
+            'my_boost_slots': [] if self.my_boost_slots is None else self.my_boost_slots[:]
+        }
+
+    def _bytes(self):
+        assert ((self.my_boost or self.my_boost is not None) and (self.my_boost_slots or self.my_boost_slots is not None)) or ((self.my_boost is None or self.my_boost is False) and (self.my_boost_slots is None or self.my_boost_slots is False)), 'my_boost, my_boost_slots parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'zBYI',
+            _struct_Iiii.pack((0 if self.my_boost is None or self.my_boost is False else 4) | (0 if self.gift_boosts is None or self.gift_boosts is False else 16) | (0 if self.next_level_boosts is None or self.next_level_boosts is False else 1) | (0 if self.premium_audience is None or self.premium_audience is False else 2) | (0 if self.prepaid_giveaways is None or self.prepaid_giveaways is False else 8) | (0 if self.my_boost_slots is None or self.my_boost_slots is False else 4), self.level, self.current_level_boosts, self.boosts),
+            b'' if self.gift_boosts is None or self.gift_boosts is False else (struct.pack('<i', self.gift_boosts)),
+            b'' if self.next_level_boosts is None or self.next_level_boosts is False else (struct.pack('<i', self.next_level_boosts)),
+            b'' if self.premium_audience is None or self.premium_audience is False else (self.premium_audience._bytes()),
+            self.serialize_bytes(self.boost_url),
+            b'' if self.prepaid_giveaways is None or self.prepaid_giveaways is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.prepaid_giveaways)),b''.join(x._bytes() for x in self.prepaid_giveaways))),
+            b'' if self.my_boost_slots is None or self.my_boost_slots is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.my_boost_slots)), len(self.my_boost_slots), *self.my_boost_slots))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _level, _current_level_boosts, _boosts = reader.read_struct(_struct_iiii)
+        _my_boost = bool(flags & 4)
+        if flags & 16:
+            _gift_boosts = reader.read_int()
+        else:
+            _gift_boosts = None
+        if flags & 1:
+            _next_level_boosts = reader.read_int()
+        else:
+            _next_level_boosts = None
+        if flags & 2:
+            _premium_audience = reader.tgread_object()
+        else:
+            _premium_audience = None
+        _boost_url = reader.tgread_string()
+        if flags & 8:
+            reader.read_int()
+            _prepaid_giveaways = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _prepaid_giveaways.append(_x)
+
+        else:
+            _prepaid_giveaways = None
+        if flags & 4:
+            reader.read_int()
+            _my_boost_slots = reader.read_array('i', reader.read_int())
+        else:
+            _my_boost_slots = None
+        return cls(level=_level, current_level_boosts=_current_level_boosts, boosts=_boosts, boost_url=_boost_url, my_boost=_my_boost, gift_boosts=_gift_boosts, next_level_boosts=_next_level_boosts, premium_audience=_premium_audience, prepaid_giveaways=_prepaid_giveaways, my_boost_slots=_my_boost_slots)
+
@@ -0,0 +1,64 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iii = struct.Struct('<Iii')
+_struct_iii = struct.Struct('<iii')
+
+
+class PremiumGiftCodeOption(TLObject):
+    CONSTRUCTOR_ID = 0x257e962b
+    SUBCLASS_OF_ID = 0x21d3c2
+    __slots__ = ('users', 'months', 'currency', 'amount', 'store_product', 'store_quantity')
+
+    def __init__(self, users: int, months: int, currency: str, amount: int, store_product: Optional[str]=None, store_quantity: Optional[int]=None):
+        """
+        Constructor for PremiumGiftCodeOption: Instance of PremiumGiftCodeOption.
+        """
+        self.users = users
+        self.months = months
+        self.currency = currency
+        self.amount = amount
+        self.store_product = store_product
+        self.store_quantity = store_quantity
+
+    def to_dict(self):
+        return {
+            '_': 'PremiumGiftCodeOption',
+            'users': self.users,
+            'months': self.months,
+            'currency': self.currency,
+            'amount': self.amount,
+            'store_product': self.store_product,
+            'store_quantity': self.store_quantity
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'+\x96~%',
+            _struct_Iii.pack((0 if self.store_product is None or self.store_product is False else 1) | (0 if self.store_quantity is None or self.store_quantity is False else 2), self.users, self.months),
+            b'' if self.store_product is None or self.store_product is False else (self.serialize_bytes(self.store_product)),
+            b'' if self.store_quantity is None or self.store_quantity is False else (struct.pack('<i', self.store_quantity)),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _users, _months = reader.read_struct(_struct_iii)
+        if flags & 1:
+            _store_product = reader.tgread_string()
+        else:
+            _store_product = None
+        if flags & 2:
+            _store_quantity = reader.read_int()
+        else:
+            _store_quantity = None
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(users=_users, months=_months, currency=_currency, amount=_amount, store_product=_store_product, store_quantity=_store_quantity)
+
+TypePremiumGiftCodeOption = PremiumGiftCodeOption
@@ -0,0 +1,72 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PremiumSubscriptionOption(TLObject):
+    CONSTRUCTOR_ID = 0x5f2d1df2
+    SUBCLASS_OF_ID = 0x2e2dc73f
+    __slots__ = ('months', 'currency', 'amount', 'bot_url', 'current', 'can_purchase_upgrade', 'transaction', 'store_product')
+
+    def __init__(self, months: int, currency: str, amount: int, bot_url: str, current: Optional[bool]=None, can_purchase_upgrade: Optional[bool]=None, transaction: Optional[str]=None, store_product: Optional[str]=None):
+        """
+        Constructor for PremiumSubscriptionOption: Instance of PremiumSubscriptionOption.
+        """
+        self.months = months
+        self.currency = currency
+        self.amount = amount
+        self.bot_url = bot_url
+        self.current = current
+        self.can_purchase_upgrade = can_purchase_upgrade
+        self.transaction = transaction
+        self.store_product = store_product
+
+    def to_dict(self):
+        return {
+            '_': 'PremiumSubscriptionOption',
+            'months': self.months,
+            'currency': self.currency,
+            'amount': self.amount,
+            'bot_url': self.bot_url,
+            'current': self.current,
+            'can_purchase_upgrade': self.can_purchase_upgrade,
+            'transaction': self.transaction,
+            'store_product': self.store_product
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf2\x1d-_',
+            struct.pack('<I', (0 if self.current is None or self.current is False else 2) | (0 if self.can_purchase_upgrade is None or self.can_purchase_upgrade is False else 4) | (0 if self.transaction is None or self.transaction is False else 8) | (0 if self.store_product is None or self.store_product is False else 1)),
+            b'' if self.transaction is None or self.transaction is False else (self.serialize_bytes(self.transaction)),
+            struct.pack('<i', self.months),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+            self.serialize_bytes(self.bot_url),
+            b'' if self.store_product is None or self.store_product is False else (self.serialize_bytes(self.store_product)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _current = bool(flags & 2)
+        _can_purchase_upgrade = bool(flags & 4)
+        if flags & 8:
+            _transaction = reader.tgread_string()
+        else:
+            _transaction = None
+        _months = reader.read_int()
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        _bot_url = reader.tgread_string()
+        if flags & 1:
+            _store_product = reader.tgread_string()
+        else:
+            _store_product = None
+        return cls(months=_months, currency=_currency, amount=_amount, bot_url=_bot_url, current=_current, can_purchase_upgrade=_can_purchase_upgrade, transaction=_transaction, store_product=_store_product)
+
+TypePremiumSubscriptionOption = PremiumSubscriptionOption
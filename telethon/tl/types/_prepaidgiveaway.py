@@ -0,0 +1,89 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qii = struct.Struct('<qii')
+_struct_qqii = struct.Struct('<qqii')
+
+
+class PrepaidGiveaway(TLObject):
+    CONSTRUCTOR_ID = 0xb2539d54
+    SUBCLASS_OF_ID = 0xee3e6780
+    __slots__ = ('id', 'months', 'quantity', 'date')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, months: int, quantity: int, date: Optional[datetime]):
+        """
+        Constructor for PrepaidGiveaway: Instance of either PrepaidGiveaway, PrepaidStarsGiveaway.
+        """
+        self.id = id
+        self.months = months
+        self.quantity = quantity
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'PrepaidGiveaway',
+            'id': self.id,
+            'months': self.months,
+            'quantity': self.quantity,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'T\x9dS\xb2',
+            _struct_qii.pack(self.id, self.months, self.quantity),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _months, _quantity = reader.read_struct(_struct_qii)
+        _date = reader.tgread_date()
+        return cls(id=_id, months=_months, quantity=_quantity, date=_date)
+
+
+class PrepaidStarsGiveaway(TLObject):
+    CONSTRUCTOR_ID = 0x9a9d77e0
+    SUBCLASS_OF_ID = 0xee3e6780
+    __slots__ = ('id', 'stars', 'quantity', 'boosts', 'date')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, stars: int, quantity: int, boosts: int, date: Optional[datetime]):
+        """
+        Constructor for PrepaidGiveaway: Instance of either PrepaidGiveaway, PrepaidStarsGiveaway.
+        """
+        self.id = id
+        self.stars = stars
+        self.quantity = quantity
+        self.boosts = boosts
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'PrepaidStarsGiveaway',
+            'id': self.id,
+            'stars': self.stars,
+            'quantity': self.quantity,
+            'boosts': self.boosts,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe0w\x9d\x9a',
+            _struct_qqii.pack(self.id, self.stars, self.quantity, self.boosts),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _stars, _quantity, _boosts = reader.read_struct(_struct_qqii)
+        _date = reader.tgread_date()
+        return cls(id=_id, stars=_stars, quantity=_quantity, boosts=_boosts, date=_date)
+
+TypePrepaidGiveaway = Union[PrepaidGiveaway,PrepaidStarsGiveaway]
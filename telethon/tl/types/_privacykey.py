@@ -0,0 +1,268 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PrivacyKeyAbout(TLObject):
+    CONSTRUCTOR_ID = 0xa486b761
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyAbout'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'a\xb7\x86\xa4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyAddedByPhone(TLObject):
+    CONSTRUCTOR_ID = 0x42ffd42b
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyAddedByPhone'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'+\xd4\xffB',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyBirthday(TLObject):
+    CONSTRUCTOR_ID = 0x2000a518
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyBirthday'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x18\xa5\x00 ',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyChatInvite(TLObject):
+    CONSTRUCTOR_ID = 0x500e6dfa
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyChatInvite'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfam\x0eP',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyForwards(TLObject):
+    CONSTRUCTOR_ID = 0x69ec56a3
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyForwards'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa3V\xeci',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyNoPaidMessages(TLObject):
+    CONSTRUCTOR_ID = 0x17d348d2
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyNoPaidMessages'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd2H\xd3\x17',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyPhoneCall(TLObject):
+    CONSTRUCTOR_ID = 0x3d662b7b
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyPhoneCall'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'{+f=',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyPhoneNumber(TLObject):
+    CONSTRUCTOR_ID = 0xd19ae46d
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyPhoneNumber'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'm\xe4\x9a\xd1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyPhoneP2P(TLObject):
+    CONSTRUCTOR_ID = 0x39491cc8
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyPhoneP2P'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc8\x1cI9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyProfilePhoto(TLObject):
+    CONSTRUCTOR_ID = 0x96151fed
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyProfilePhoto'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed\x1f\x15\x96',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyStarGiftsAutoSave(TLObject):
+    CONSTRUCTOR_ID = 0x2ca4fdf8
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyStarGiftsAutoSave'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf8\xfd\xa4,',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyStatusTimestamp(TLObject):
+    CONSTRUCTOR_ID = 0xbc2eab30
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyStatusTimestamp'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'0\xab.\xbc',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyKeyVoiceMessages(TLObject):
+    CONSTRUCTOR_ID = 0x697f414
+    SUBCLASS_OF_ID = 0x824651c3
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyKeyVoiceMessages'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x14\xf4\x97\x06',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypePrivacyKey = Union[PrivacyKeyStatusTimestamp,PrivacyKeyChatInvite,PrivacyKeyPhoneCall,PrivacyKeyPhoneP2P,PrivacyKeyForwards,PrivacyKeyProfilePhoto,PrivacyKeyPhoneNumber,PrivacyKeyAddedByPhone,PrivacyKeyVoiceMessages,PrivacyKeyAbout,PrivacyKeyBirthday,PrivacyKeyStarGiftsAutoSave,PrivacyKeyNoPaidMessages]
@@ -0,0 +1,288 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class PrivacyValueAllowAll(TLObject):
+    CONSTRUCTOR_ID = 0x65427b82
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueAllowAll'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x82{Be',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueAllowBots(TLObject):
+    CONSTRUCTOR_ID = 0x21461b5d
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueAllowBots'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b']\x1bF!',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueAllowChatParticipants(TLObject):
+    CONSTRUCTOR_ID = 0x6b134e8e
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ('chats',)
+
+    def __init__(self, chats: List[int]):
+        """
+        Constructor for PrivacyRule: Instance of either PrivacyValueAllowContacts, PrivacyValueAllowAll, PrivacyValueAllowUsers, PrivacyValueDisallowContacts, PrivacyValueDisallowAll, PrivacyValueDisallowUsers, PrivacyValueAllowChatParticipants, PrivacyValueDisallowChatParticipants, PrivacyValueAllowCloseFriends, PrivacyValueAllowPremium, PrivacyValueAllowBots, PrivacyValueDisallowBots.
+        """
+        self.chats = chats
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueAllowChatParticipants',
+            'chats': [] if self.chats is None else self.chats[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8eN\x13k',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.chats)), len(self.chats), *self.chats),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _chats = reader.read_array('q', reader.read_int())
+        return cls(chats=_chats)
+
+
+class PrivacyValueAllowCloseFriends(TLObject):
+    CONSTRUCTOR_ID = 0xf7e8d89b
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueAllowCloseFriends'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9b\xd8\xe8\xf7',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueAllowContacts(TLObject):
+    CONSTRUCTOR_ID = 0xfffe1bac
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueAllowContacts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xac\x1b\xfe\xff',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueAllowPremium(TLObject):
+    CONSTRUCTOR_ID = 0xece9814b
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueAllowPremium'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'K\x81\xe9\xec',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueAllowUsers(TLObject):
+    CONSTRUCTOR_ID = 0xb8905fb2
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ('users',)
+
+    def __init__(self, users: List[int]):
+        """
+        Constructor for PrivacyRule: Instance of either PrivacyValueAllowContacts, PrivacyValueAllowAll, PrivacyValueAllowUsers, PrivacyValueDisallowContacts, PrivacyValueDisallowAll, PrivacyValueDisallowUsers, PrivacyValueAllowChatParticipants, PrivacyValueDisallowChatParticipants, PrivacyValueAllowCloseFriends, PrivacyValueAllowPremium, PrivacyValueAllowBots, PrivacyValueDisallowBots.
+        """
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueAllowUsers',
+            'users': [] if self.users is None else self.users[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb2_\x90\xb8',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.users)), len(self.users), *self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _users = reader.read_array('q', reader.read_int())
+        return cls(users=_users)
+
+
+class PrivacyValueDisallowAll(TLObject):
+    CONSTRUCTOR_ID = 0x8b73e763
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueDisallowAll'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'c\xe7s\x8b',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueDisallowBots(TLObject):
+    CONSTRUCTOR_ID = 0xf6a5f82f
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueDisallowBots'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'/\xf8\xa5\xf6',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueDisallowChatParticipants(TLObject):
+    CONSTRUCTOR_ID = 0x41c87565
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ('chats',)
+
+    def __init__(self, chats: List[int]):
+        """
+        Constructor for PrivacyRule: Instance of either PrivacyValueAllowContacts, PrivacyValueAllowAll, PrivacyValueAllowUsers, PrivacyValueDisallowContacts, PrivacyValueDisallowAll, PrivacyValueDisallowUsers, PrivacyValueAllowChatParticipants, PrivacyValueDisallowChatParticipants, PrivacyValueAllowCloseFriends, PrivacyValueAllowPremium, PrivacyValueAllowBots, PrivacyValueDisallowBots.
+        """
+        self.chats = chats
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueDisallowChatParticipants',
+            'chats': [] if self.chats is None else self.chats[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'eu\xc8A',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.chats)), len(self.chats), *self.chats),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _chats = reader.read_array('q', reader.read_int())
+        return cls(chats=_chats)
+
+
+class PrivacyValueDisallowContacts(TLObject):
+    CONSTRUCTOR_ID = 0xf888fa1a
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueDisallowContacts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1a\xfa\x88\xf8',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class PrivacyValueDisallowUsers(TLObject):
+    CONSTRUCTOR_ID = 0xe4621141
+    SUBCLASS_OF_ID = 0xebb7f270
+    __slots__ = ('users',)
+
+    def __init__(self, users: List[int]):
+        """
+        Constructor for PrivacyRule: Instance of either PrivacyValueAllowContacts, PrivacyValueAllowAll, PrivacyValueAllowUsers, PrivacyValueDisallowContacts, PrivacyValueDisallowAll, PrivacyValueDisallowUsers, PrivacyValueAllowChatParticipants, PrivacyValueDisallowChatParticipants, PrivacyValueAllowCloseFriends, PrivacyValueAllowPremium, PrivacyValueAllowBots, PrivacyValueDisallowBots.
+        """
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'PrivacyValueDisallowUsers',
+            'users': [] if self.users is None else self.users[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'A\x11b\xe4',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.users)), len(self.users), *self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _users = reader.read_array('q', reader.read_int())
+        return cls(users=_users)
+
+TypePrivacyRule = Union[PrivacyValueAllowContacts,PrivacyValueAllowAll,PrivacyValueAllowUsers,PrivacyValueDisallowContacts,PrivacyValueDisallowAll,PrivacyValueDisallowUsers,PrivacyValueAllowChatParticipants,PrivacyValueDisallowChatParticipants,PrivacyValueAllowCloseFriends,PrivacyValueAllowPremium,PrivacyValueAllowBots,PrivacyValueDisallowBots]
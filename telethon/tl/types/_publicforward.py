@@ -0,0 +1,73 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessage, TypePeer, TypeStoryItem
+
+
+
+class PublicForwardMessage(TLObject):
+    CONSTRUCTOR_ID = 0x1f2bf4a
+    SUBCLASS_OF_ID = 0x629015d3
+    __slots__ = ('message',)
+
+    def __init__(self, message: 'TypeMessage'):
+        """
+        Constructor for PublicForward: Instance of either PublicForwardMessage, PublicForwardStory.
+        """
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'PublicForwardMessage',
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'J\xbf\xf2\x01',
+            self.message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _message = reader.tgread_object()
+        return cls(message=_message)
+
+
+class PublicForwardStory(TLObject):
+    CONSTRUCTOR_ID = 0xedf3add0
+    SUBCLASS_OF_ID = 0x629015d3
+    __slots__ = ('peer', 'story')
+
+    def __init__(self, peer: 'TypePeer', story: 'TypeStoryItem'):
+        """
+        Constructor for PublicForward: Instance of either PublicForwardMessage, PublicForwardStory.
+        """
+        self.peer = peer
+        self.story = story
+
+    def to_dict(self):
+        return {
+            '_': 'PublicForwardStory',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'story': self.story.to_dict() if isinstance(self.story, TLObject) else self.story
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd0\xad\xf3\xed',
+            self.peer._bytes(),
+            self.story._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _story = reader.tgread_object()
+        return cls(peer=_peer, story=_story)
+
+TypePublicForward = Union[PublicForwardMessage,PublicForwardStory]
@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class QuickReply(TLObject):
+    CONSTRUCTOR_ID = 0x697102b
+    SUBCLASS_OF_ID = 0xe2ea0f12
+    __slots__ = ('shortcut_id', 'shortcut', 'top_message', 'count')
+
+    def __init__(self, shortcut_id: int, shortcut: str, top_message: int, count: int):
+        """
+        Constructor for QuickReply: Instance of QuickReply.
+        """
+        self.shortcut_id = shortcut_id
+        self.shortcut = shortcut
+        self.top_message = top_message
+        self.count = count
+
+    def to_dict(self):
+        return {
+            '_': 'QuickReply',
+            'shortcut_id': self.shortcut_id,
+            'shortcut': self.shortcut,
+            'top_message': self.top_message,
+            'count': self.count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'+\x10\x97\x06',
+            struct.pack('<i', self.shortcut_id),
+            self.serialize_bytes(self.shortcut),
+            _struct_ii.pack(self.top_message, self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _shortcut_id = reader.read_int()
+        _shortcut = reader.tgread_string()
+        _top_message, _count = reader.read_struct(_struct_ii)
+        return cls(shortcut_id=_shortcut_id, shortcut=_shortcut, top_message=_top_message, count=_count)
+
+TypeQuickReply = QuickReply
@@ -0,0 +1,106 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ReactionCustomEmoji(TLObject):
+    CONSTRUCTOR_ID = 0x8935fc73
+    SUBCLASS_OF_ID = 0x5da165a1
+    __slots__ = ('document_id',)
+
+    def __init__(self, document_id: int):
+        """
+        Constructor for Reaction: Instance of either ReactionEmpty, ReactionEmoji, ReactionCustomEmoji, ReactionPaid.
+        """
+        self.document_id = document_id
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionCustomEmoji',
+            'document_id': self.document_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b's\xfc5\x89',
+            struct.pack('<q', self.document_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _document_id = reader.read_long()
+        return cls(document_id=_document_id)
+
+
+class ReactionEmoji(TLObject):
+    CONSTRUCTOR_ID = 0x1b2286b8
+    SUBCLASS_OF_ID = 0x5da165a1
+    __slots__ = ('emoticon',)
+
+    def __init__(self, emoticon: str):
+        """
+        Constructor for Reaction: Instance of either ReactionEmpty, ReactionEmoji, ReactionCustomEmoji, ReactionPaid.
+        """
+        self.emoticon = emoticon
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionEmoji',
+            'emoticon': self.emoticon
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb8\x86"\x1b',
+            self.serialize_bytes(self.emoticon),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoticon = reader.tgread_string()
+        return cls(emoticon=_emoticon)
+
+
+class ReactionEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x79f5d419
+    SUBCLASS_OF_ID = 0x5da165a1
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19\xd4\xf5y',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class ReactionPaid(TLObject):
+    CONSTRUCTOR_ID = 0x523da4eb
+    SUBCLASS_OF_ID = 0x5da165a1
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionPaid'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xeb\xa4=R',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeReaction = Union[ReactionEmpty,ReactionEmoji,ReactionCustomEmoji,ReactionPaid]
@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeReaction
+
+
+
+class ReactionCount(TLObject):
+    CONSTRUCTOR_ID = 0xa3d1cb80
+    SUBCLASS_OF_ID = 0xd208ce3f
+    __slots__ = ('reaction', 'count', 'chosen_order')
+
+    def __init__(self, reaction: 'TypeReaction', count: int, chosen_order: Optional[int]=None):
+        """
+        Constructor for ReactionCount: Instance of ReactionCount.
+        """
+        self.reaction = reaction
+        self.count = count
+        self.chosen_order = chosen_order
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionCount',
+            'reaction': self.reaction.to_dict() if isinstance(self.reaction, TLObject) else self.reaction,
+            'count': self.count,
+            'chosen_order': self.chosen_order
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x80\xcb\xd1\xa3',
+            struct.pack('<I', (0 if self.chosen_order is None or self.chosen_order is False else 1)),
+            b'' if self.chosen_order is None or self.chosen_order is False else (struct.pack('<i', self.chosen_order)),
+            self.reaction._bytes(),
+            struct.pack('<i', self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _chosen_order = reader.read_int()
+        else:
+            _chosen_order = None
+        _reaction = reader.tgread_object()
+        _count = reader.read_int()
+        return cls(reaction=_reaction, count=_count, chosen_order=_chosen_order)
+
+TypeReactionCount = ReactionCount
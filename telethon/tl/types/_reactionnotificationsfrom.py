@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ReactionNotificationsFromAll(TLObject):
+    CONSTRUCTOR_ID = 0x4b9e22a0
+    SUBCLASS_OF_ID = 0x345f7940
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionNotificationsFromAll'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0"\x9eK',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class ReactionNotificationsFromContacts(TLObject):
+    CONSTRUCTOR_ID = 0xbac3a61a
+    SUBCLASS_OF_ID = 0x345f7940
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionNotificationsFromContacts'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1a\xa6\xc3\xba',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeReactionNotificationsFrom = Union[ReactionNotificationsFromContacts,ReactionNotificationsFromAll]
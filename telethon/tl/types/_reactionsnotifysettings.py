@@ -0,0 +1,61 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeNotificationSound, TypeReactionNotificationsFrom
+
+
+
+class ReactionsNotifySettings(TLObject):
+    CONSTRUCTOR_ID = 0x56e34970
+    SUBCLASS_OF_ID = 0x8dff0851
+    __slots__ = ('sound', 'show_previews', 'messages_notify_from', 'stories_notify_from')
+
+    def __init__(self, sound: 'TypeNotificationSound', show_previews: bool, messages_notify_from: Optional['TypeReactionNotificationsFrom']=None, stories_notify_from: Optional['TypeReactionNotificationsFrom']=None):
+        """
+        Constructor for ReactionsNotifySettings: Instance of ReactionsNotifySettings.
+        """
+        self.sound = sound
+        self.show_previews = show_previews
+        self.messages_notify_from = messages_notify_from
+        self.stories_notify_from = stories_notify_from
+
+    def to_dict(self):
+        return {
+            '_': 'ReactionsNotifySettings',
+            'sound': self.sound.to_dict() if isinstance(self.sound, TLObject) else self.sound,
+            'show_previews': self.show_previews,
+            'messages_notify_from': self.messages_notify_from.to_dict() if isinstance(self.messages_notify_from, TLObject) else self.messages_notify_from,
+            'stories_notify_from': self.stories_notify_from.to_dict() if isinstance(self.stories_notify_from, TLObject) else self.stories_notify_from
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'pI\xe3V',
+            struct.pack('<I', (0 if self.messages_notify_from is None or self.messages_notify_from is False else 1) | (0 if self.stories_notify_from is None or self.stories_notify_from is False else 2)),
+            b'' if self.messages_notify_from is None or self.messages_notify_from is False else (self.messages_notify_from._bytes()),
+            b'' if self.stories_notify_from is None or self.stories_notify_from is False else (self.stories_notify_from._bytes()),
+            self.sound._bytes(),
+            b'\xb5ur\x99' if self.show_previews else b'7\x97y\xbc',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _messages_notify_from = reader.tgread_object()
+        else:
+            _messages_notify_from = None
+        if flags & 2:
+            _stories_notify_from = reader.tgread_object()
+        else:
+            _stories_notify_from = None
+        _sound = reader.tgread_object()
+        _show_previews = reader.tgread_bool()
+        return cls(sound=_sound, show_previews=_show_previews, messages_notify_from=_messages_notify_from, stories_notify_from=_stories_notify_from)
+
+TypeReactionsNotifySettings = ReactionsNotifySettings
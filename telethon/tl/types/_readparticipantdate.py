@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ReadParticipantDate(TLObject):
+    CONSTRUCTOR_ID = 0x4a4ff172
+    SUBCLASS_OF_ID = 0xfd078ce2
+    __slots__ = ('user_id', 'date')
+
+    def __init__(self, user_id: int, date: Optional[datetime]):
+        """
+        Constructor for ReadParticipantDate: Instance of ReadParticipantDate.
+        """
+        self.user_id = user_id
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'ReadParticipantDate',
+            'user_id': self.user_id,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'r\xf1OJ',
+            struct.pack('<q', self.user_id),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id = reader.read_long()
+        _date = reader.tgread_date()
+        return cls(user_id=_user_id, date=_date)
+
+TypeReadParticipantDate = ReadParticipantDate
@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class ReceivedNotifyMessage(TLObject):
+    CONSTRUCTOR_ID = 0xa384b779
+    SUBCLASS_OF_ID = 0xa962381e
+    __slots__ = ('id', 'flags')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, flags: int):
+        """
+        Constructor for ReceivedNotifyMessage: Instance of ReceivedNotifyMessage.
+        """
+        self.id = id
+        self.flags = flags
+
+    def to_dict(self):
+        return {
+            '_': 'ReceivedNotifyMessage',
+            'id': self.id,
+            'flags': self.flags
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'y\xb7\x84\xa3',
+            _struct_ii.pack(self.id, self.flags),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _flags = reader.read_struct(_struct_ii)
+        return cls(id=_id, flags=_flags)
+
+TypeReceivedNotifyMessage = ReceivedNotifyMessage
@@ -0,0 +1,173 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatInvite, TypeStickerSetCovered
+
+
+
+class RecentMeUrlChat(TLObject):
+    CONSTRUCTOR_ID = 0xb2da71d2
+    SUBCLASS_OF_ID = 0x55a53079
+    __slots__ = ('url', 'chat_id')
+
+    def __init__(self, url: str, chat_id: int):
+        """
+        Constructor for RecentMeUrl: Instance of either RecentMeUrlUnknown, RecentMeUrlUser, RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet.
+        """
+        self.url = url
+        self.chat_id = chat_id
+
+    def to_dict(self):
+        return {
+            '_': 'RecentMeUrlChat',
+            'url': self.url,
+            'chat_id': self.chat_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd2q\xda\xb2',
+            self.serialize_bytes(self.url),
+            struct.pack('<q', self.chat_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _chat_id = reader.read_long()
+        return cls(url=_url, chat_id=_chat_id)
+
+
+class RecentMeUrlChatInvite(TLObject):
+    CONSTRUCTOR_ID = 0xeb49081d
+    SUBCLASS_OF_ID = 0x55a53079
+    __slots__ = ('url', 'chat_invite')
+
+    def __init__(self, url: str, chat_invite: 'TypeChatInvite'):
+        """
+        Constructor for RecentMeUrl: Instance of either RecentMeUrlUnknown, RecentMeUrlUser, RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet.
+        """
+        self.url = url
+        self.chat_invite = chat_invite
+
+    def to_dict(self):
+        return {
+            '_': 'RecentMeUrlChatInvite',
+            'url': self.url,
+            'chat_invite': self.chat_invite.to_dict() if isinstance(self.chat_invite, TLObject) else self.chat_invite
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1d\x08I\xeb',
+            self.serialize_bytes(self.url),
+            self.chat_invite._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _chat_invite = reader.tgread_object()
+        return cls(url=_url, chat_invite=_chat_invite)
+
+
+class RecentMeUrlStickerSet(TLObject):
+    CONSTRUCTOR_ID = 0xbc0a57dc
+    SUBCLASS_OF_ID = 0x55a53079
+    __slots__ = ('url', 'set')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, url: str, set: 'TypeStickerSetCovered'):
+        """
+        Constructor for RecentMeUrl: Instance of either RecentMeUrlUnknown, RecentMeUrlUser, RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet.
+        """
+        self.url = url
+        self.set = set
+
+    def to_dict(self):
+        return {
+            '_': 'RecentMeUrlStickerSet',
+            'url': self.url,
+            'set': self.set.to_dict() if isinstance(self.set, TLObject) else self.set
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdcW\n\xbc',
+            self.serialize_bytes(self.url),
+            self.set._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _set = reader.tgread_object()
+        return cls(url=_url, set=_set)
+
+
+class RecentMeUrlUnknown(TLObject):
+    CONSTRUCTOR_ID = 0x46e1d13d
+    SUBCLASS_OF_ID = 0x55a53079
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for RecentMeUrl: Instance of either RecentMeUrlUnknown, RecentMeUrlUser, RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'RecentMeUrlUnknown',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'=\xd1\xe1F',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
+
+class RecentMeUrlUser(TLObject):
+    CONSTRUCTOR_ID = 0xb92c09e2
+    SUBCLASS_OF_ID = 0x55a53079
+    __slots__ = ('url', 'user_id')
+
+    def __init__(self, url: str, user_id: int):
+        """
+        Constructor for RecentMeUrl: Instance of either RecentMeUrlUnknown, RecentMeUrlUser, RecentMeUrlChat, RecentMeUrlChatInvite, RecentMeUrlStickerSet.
+        """
+        self.url = url
+        self.user_id = user_id
+
+    def to_dict(self):
+        return {
+            '_': 'RecentMeUrlUser',
+            'url': self.url,
+            'user_id': self.user_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe2\t,\xb9',
+            self.serialize_bytes(self.url),
+            struct.pack('<q', self.user_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _user_id = reader.read_long()
+        return cls(url=_url, user_id=_user_id)
+
+TypeRecentMeUrl = Union[RecentMeUrlUnknown,RecentMeUrlUser,RecentMeUrlChat,RecentMeUrlChatInvite,RecentMeUrlStickerSet]
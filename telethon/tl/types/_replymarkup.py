@@ -0,0 +1,173 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeKeyboardButtonRow
+
+
+
+class ReplyInlineMarkup(TLObject):
+    CONSTRUCTOR_ID = 0x48a30254
+    SUBCLASS_OF_ID = 0xe2e10ef2
+    __slots__ = ('rows',)
+
+    def __init__(self, rows: List['TypeKeyboardButtonRow']):
+        """
+        Constructor for ReplyMarkup: Instance of either ReplyKeyboardHide, ReplyKeyboardForceReply, ReplyKeyboardMarkup, ReplyInlineMarkup.
+        """
+        self.rows = rows
+
+    def to_dict(self):
+        return {
+            '_': 'ReplyInlineMarkup',
+            'rows': [] if self.rows is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.rows]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'T\x02\xa3H',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.rows)),b''.join(x._bytes() for x in self.rows),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _rows = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _rows.append(_x)
+
+        return cls(rows=_rows)
+
+
+class ReplyKeyboardForceReply(TLObject):
+    CONSTRUCTOR_ID = 0x86b40b08
+    SUBCLASS_OF_ID = 0xe2e10ef2
+    __slots__ = ('single_use', 'selective', 'placeholder')
+
+    def __init__(self, single_use: Optional[bool]=None, selective: Optional[bool]=None, placeholder: Optional[str]=None):
+        """
+        Constructor for ReplyMarkup: Instance of either ReplyKeyboardHide, ReplyKeyboardForceReply, ReplyKeyboardMarkup, ReplyInlineMarkup.
+        """
+        self.single_use = single_use
+        self.selective = selective
+        self.placeholder = placeholder
+
+    def to_dict(self):
+        return {
+            '_': 'ReplyKeyboardForceReply',
+            'single_use': self.single_use,
+            'selective': self.selective,
+            'placeholder': self.placeholder
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x08\x0b\xb4\x86',
+            struct.pack('<I', (0 if self.single_use is None or self.single_use is False else 2) | (0 if self.selective is None or self.selective is False else 4) | (0 if self.placeholder is None or self.placeholder is False else 8)),
+            b'' if self.placeholder is None or self.placeholder is False else (self.serialize_bytes(self.placeholder)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _single_use = bool(flags & 2)
+        _selective = bool(flags & 4)
+        if flags & 8:
+            _placeholder = reader.tgread_string()
+        else:
+            _placeholder = None
+        return cls(single_use=_single_use, selective=_selective, placeholder=_placeholder)
+
+
+class ReplyKeyboardHide(TLObject):
+    CONSTRUCTOR_ID = 0xa03e5b85
+    SUBCLASS_OF_ID = 0xe2e10ef2
+    __slots__ = ('selective',)
+
+    def __init__(self, selective: Optional[bool]=None):
+        """
+        Constructor for ReplyMarkup: Instance of either ReplyKeyboardHide, ReplyKeyboardForceReply, ReplyKeyboardMarkup, ReplyInlineMarkup.
+        """
+        self.selective = selective
+
+    def to_dict(self):
+        return {
+            '_': 'ReplyKeyboardHide',
+            'selective': self.selective
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x85[>\xa0',
+            struct.pack('<I', (0 if self.selective is None or self.selective is False else 4)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _selective = bool(flags & 4)
+        return cls(selective=_selective)
+
+
+class ReplyKeyboardMarkup(TLObject):
+    CONSTRUCTOR_ID = 0x85dd99d1
+    SUBCLASS_OF_ID = 0xe2e10ef2
+    __slots__ = ('rows', 'resize', 'single_use', 'selective', 'persistent', 'placeholder')
+
+    def __init__(self, rows: List['TypeKeyboardButtonRow'], resize: Optional[bool]=None, single_use: Optional[bool]=None, selective: Optional[bool]=None, persistent: Optional[bool]=None, placeholder: Optional[str]=None):
+        """
+        Constructor for ReplyMarkup: Instance of either ReplyKeyboardHide, ReplyKeyboardForceReply, ReplyKeyboardMarkup, ReplyInlineMarkup.
+        """
+        self.rows = rows
+        self.resize = resize
+        self.single_use = single_use
+        self.selective = selective
+        self.persistent = persistent
+        self.placeholder = placeholder
+
+    def to_dict(self):
+        return {
+            '_': 'ReplyKeyboardMarkup',
+            'rows': [] if self.rows is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.rows],
+            'resize': self.resize,
+            'single_use': self.single_use,
+            'selective': self.selective,
+            'persistent': self.persistent,
+            'placeholder': self.placeholder
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1\x99\xdd\x85',
+            struct.pack('<I', (0 if self.resize is None or self.resize is False else 1) | (0 if self.single_use is None or self.single_use is False else 2) | (0 if self.selective is None or self.selective is False else 4) | (0 if self.persistent is None or self.persistent is False else 16) | (0 if self.placeholder is None or self.placeholder is False else 8)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.rows)),b''.join(x._bytes() for x in self.rows),
+            b'' if self.placeholder is None or self.placeholder is False else (self.serialize_bytes(self.placeholder)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _resize = bool(flags & 1)
+        _single_use = bool(flags & 2)
+        _selective = bool(flags & 4)
+        _persistent = bool(flags & 16)
+        reader.read_int()
+        _rows = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _rows.append(_x)
+
+        if flags & 8:
+            _placeholder = reader.tgread_string()
+        else:
+            _placeholder = None
+        return cls(rows=_rows, resize=_resize, single_use=_single_use, selective=_selective, persistent=_persistent, placeholder=_placeholder)
+
+TypeReplyMarkup = Union[ReplyKeyboardHide,ReplyKeyboardForceReply,ReplyKeyboardMarkup,ReplyInlineMarkup]
@@ -0,0 +1,208 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class InputReportReasonChildAbuse(TLObject):
+    CONSTRUCTOR_ID = 0xadf44ee3
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonChildAbuse'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe3N\xf4\xad',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonCopyright(TLObject):
+    CONSTRUCTOR_ID = 0x9b89f93a
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonCopyright'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b':\xf9\x89\x9b',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonFake(TLObject):
+    CONSTRUCTOR_ID = 0xf5ddd6e7
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonFake'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe7\xd6\xdd\xf5',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonGeoIrrelevant(TLObject):
+    CONSTRUCTOR_ID = 0xdbd4feed
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonGeoIrrelevant'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed\xfe\xd4\xdb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonIllegalDrugs(TLObject):
+    CONSTRUCTOR_ID = 0xa8eb2be
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonIllegalDrugs'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbe\xb2\x8e\n',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonOther(TLObject):
+    CONSTRUCTOR_ID = 0xc1e4a2b1
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonOther'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb1\xa2\xe4\xc1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonPersonalDetails(TLObject):
+    CONSTRUCTOR_ID = 0x9ec7863d
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonPersonalDetails'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'=\x86\xc7\x9e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonPornography(TLObject):
+    CONSTRUCTOR_ID = 0x2e59d922
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonPornography'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'"\xd9Y.',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonSpam(TLObject):
+    CONSTRUCTOR_ID = 0x58dbcab8
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonSpam'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb8\xca\xdbX',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class InputReportReasonViolence(TLObject):
+    CONSTRUCTOR_ID = 0x1e22c78d
+    SUBCLASS_OF_ID = 0x8401bd27
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'InputReportReasonViolence'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8d\xc7"\x1e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeReportReason = Union[InputReportReasonSpam,InputReportReasonViolence,InputReportReasonPornography,InputReportReasonChildAbuse,InputReportReasonOther,InputReportReasonCopyright,InputReportReasonGeoIrrelevant,InputReportReasonFake,InputReportReasonIllegalDrugs,InputReportReasonPersonalDetails]
@@ -0,0 +1,104 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageReportOption
+
+
+
+class ReportResultAddComment(TLObject):
+    CONSTRUCTOR_ID = 0x6f09ac31
+    SUBCLASS_OF_ID = 0xacd3f438
+    __slots__ = ('option', 'optional')
+
+    def __init__(self, option: bytes, optional: Optional[bool]=None):
+        """
+        Constructor for ReportResult: Instance of either ReportResultChooseOption, ReportResultAddComment, ReportResultReported.
+        """
+        self.option = option
+        self.optional = optional
+
+    def to_dict(self):
+        return {
+            '_': 'ReportResultAddComment',
+            'option': self.option,
+            'optional': self.optional
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'1\xac\to',
+            struct.pack('<I', (0 if self.optional is None or self.optional is False else 1)),
+            self.serialize_bytes(self.option),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _optional = bool(flags & 1)
+        _option = reader.tgread_bytes()
+        return cls(option=_option, optional=_optional)
+
+
+class ReportResultChooseOption(TLObject):
+    CONSTRUCTOR_ID = 0xf0e4e0b6
+    SUBCLASS_OF_ID = 0xacd3f438
+    __slots__ = ('title', 'options')
+
+    def __init__(self, title: str, options: List['TypeMessageReportOption']):
+        """
+        Constructor for ReportResult: Instance of either ReportResultChooseOption, ReportResultAddComment, ReportResultReported.
+        """
+        self.title = title
+        self.options = options
+
+    def to_dict(self):
+        return {
+            '_': 'ReportResultChooseOption',
+            'title': self.title,
+            'options': [] if self.options is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.options]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb6\xe0\xe4\xf0',
+            self.serialize_bytes(self.title),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.options)),b''.join(x._bytes() for x in self.options),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _title = reader.tgread_string()
+        reader.read_int()
+        _options = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _options.append(_x)
+
+        return cls(title=_title, options=_options)
+
+
+class ReportResultReported(TLObject):
+    CONSTRUCTOR_ID = 0x8db33c4b
+    SUBCLASS_OF_ID = 0xacd3f438
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'ReportResultReported'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'K<\xb3\x8d',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeReportResult = Union[ReportResultChooseOption,ReportResultAddComment,ReportResultReported]
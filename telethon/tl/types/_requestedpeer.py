@@ -0,0 +1,165 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypePhoto
+
+
+
+class RequestedPeerChannel(TLObject):
+    CONSTRUCTOR_ID = 0x8ba403e4
+    SUBCLASS_OF_ID = 0xc2887c10
+    __slots__ = ('channel_id', 'title', 'username', 'photo')
+
+    def __init__(self, channel_id: int, title: Optional[str]=None, username: Optional[str]=None, photo: Optional['TypePhoto']=None):
+        """
+        Constructor for RequestedPeer: Instance of either RequestedPeerUser, RequestedPeerChat, RequestedPeerChannel.
+        """
+        self.channel_id = channel_id
+        self.title = title
+        self.username = username
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'RequestedPeerChannel',
+            'channel_id': self.channel_id,
+            'title': self.title,
+            'username': self.username,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4\x03\xa4\x8b',
+            _struct_Iq.pack((0 if self.title is None or self.title is False else 1) | (0 if self.username is None or self.username is False else 2) | (0 if self.photo is None or self.photo is False else 4), self.channel_id),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.username is None or self.username is False else (self.serialize_bytes(self.username)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _channel_id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 2:
+            _username = reader.tgread_string()
+        else:
+            _username = None
+        if flags & 4:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        return cls(channel_id=_channel_id, title=_title, username=_username, photo=_photo)
+
+
+class RequestedPeerChat(TLObject):
+    CONSTRUCTOR_ID = 0x7307544f
+    SUBCLASS_OF_ID = 0xc2887c10
+    __slots__ = ('chat_id', 'title', 'photo')
+
+    def __init__(self, chat_id: int, title: Optional[str]=None, photo: Optional['TypePhoto']=None):
+        """
+        Constructor for RequestedPeer: Instance of either RequestedPeerUser, RequestedPeerChat, RequestedPeerChannel.
+        """
+        self.chat_id = chat_id
+        self.title = title
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'RequestedPeerChat',
+            'chat_id': self.chat_id,
+            'title': self.title,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'OT\x07s',
+            _struct_Iq.pack((0 if self.title is None or self.title is False else 1) | (0 if self.photo is None or self.photo is False else 4), self.chat_id),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _chat_id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 4:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        return cls(chat_id=_chat_id, title=_title, photo=_photo)
+
+
+class RequestedPeerUser(TLObject):
+    CONSTRUCTOR_ID = 0xd62ff46a
+    SUBCLASS_OF_ID = 0xc2887c10
+    __slots__ = ('user_id', 'first_name', 'last_name', 'username', 'photo')
+
+    def __init__(self, user_id: int, first_name: Optional[str]=None, last_name: Optional[str]=None, username: Optional[str]=None, photo: Optional['TypePhoto']=None):
+        """
+        Constructor for RequestedPeer: Instance of either RequestedPeerUser, RequestedPeerChat, RequestedPeerChannel.
+        """
+        self.user_id = user_id
+        self.first_name = first_name
+        self.last_name = last_name
+        self.username = username
+        self.photo = photo
+
+    def to_dict(self):
+        return {
+            '_': 'RequestedPeerUser',
+            'user_id': self.user_id,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'username': self.username,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo
+        }
+
+    def _bytes(self):
+        assert ((self.first_name or self.first_name is not None) and (self.last_name or self.last_name is not None)) or ((self.first_name is None or self.first_name is False) and (self.last_name is None or self.last_name is False)), 'first_name, last_name parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'j\xf4/\xd6',
+            _struct_Iq.pack((0 if self.first_name is None or self.first_name is False else 1) | (0 if self.last_name is None or self.last_name is False else 1) | (0 if self.username is None or self.username is False else 2) | (0 if self.photo is None or self.photo is False else 4), self.user_id),
+            b'' if self.first_name is None or self.first_name is False else (self.serialize_bytes(self.first_name)),
+            b'' if self.last_name is None or self.last_name is False else (self.serialize_bytes(self.last_name)),
+            b'' if self.username is None or self.username is False else (self.serialize_bytes(self.username)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _first_name = reader.tgread_string()
+        else:
+            _first_name = None
+        if flags & 1:
+            _last_name = reader.tgread_string()
+        else:
+            _last_name = None
+        if flags & 2:
+            _username = reader.tgread_string()
+        else:
+            _username = None
+        if flags & 4:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        return cls(user_id=_user_id, first_name=_first_name, last_name=_last_name, username=_username, photo=_photo)
+
+TypeRequestedPeer = Union[RequestedPeerUser,RequestedPeerChat,RequestedPeerChannel]
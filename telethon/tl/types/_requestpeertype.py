@@ -0,0 +1,167 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChatAdminRights
+
+
+
+class RequestPeerTypeBroadcast(TLObject):
+    CONSTRUCTOR_ID = 0x339bef6c
+    SUBCLASS_OF_ID = 0xe9a0e814
+    __slots__ = ('creator', 'has_username', 'user_admin_rights', 'bot_admin_rights')
+
+    def __init__(self, creator: Optional[bool]=None, has_username: Optional[bool]=None, user_admin_rights: Optional['TypeChatAdminRights']=None, bot_admin_rights: Optional['TypeChatAdminRights']=None):
+        """
+        Constructor for RequestPeerType: Instance of either RequestPeerTypeUser, RequestPeerTypeChat, RequestPeerTypeBroadcast.
+        """
+        self.creator = creator
+        self.has_username = has_username
+        self.user_admin_rights = user_admin_rights
+        self.bot_admin_rights = bot_admin_rights
+
+    def to_dict(self):
+        return {
+            '_': 'RequestPeerTypeBroadcast',
+            'creator': self.creator,
+            'has_username': self.has_username,
+            'user_admin_rights': self.user_admin_rights.to_dict() if isinstance(self.user_admin_rights, TLObject) else self.user_admin_rights,
+            'bot_admin_rights': self.bot_admin_rights.to_dict() if isinstance(self.bot_admin_rights, TLObject) else self.bot_admin_rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'l\xef\x9b3',
+            struct.pack('<I', (0 if self.creator is None or self.creator is False else 1) | (0 if self.has_username is None else 8) | (0 if self.user_admin_rights is None or self.user_admin_rights is False else 2) | (0 if self.bot_admin_rights is None or self.bot_admin_rights is False else 4)),
+            b'' if self.has_username is None else (b'\xb5ur\x99' if self.has_username else b'7\x97y\xbc'),
+            b'' if self.user_admin_rights is None or self.user_admin_rights is False else (self.user_admin_rights._bytes()),
+            b'' if self.bot_admin_rights is None or self.bot_admin_rights is False else (self.bot_admin_rights._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _creator = bool(flags & 1)
+        if flags & 8:
+            _has_username = reader.tgread_bool()
+        else:
+            _has_username = None
+        if flags & 2:
+            _user_admin_rights = reader.tgread_object()
+        else:
+            _user_admin_rights = None
+        if flags & 4:
+            _bot_admin_rights = reader.tgread_object()
+        else:
+            _bot_admin_rights = None
+        return cls(creator=_creator, has_username=_has_username, user_admin_rights=_user_admin_rights, bot_admin_rights=_bot_admin_rights)
+
+
+class RequestPeerTypeChat(TLObject):
+    CONSTRUCTOR_ID = 0xc9f06e1b
+    SUBCLASS_OF_ID = 0xe9a0e814
+    __slots__ = ('creator', 'bot_participant', 'has_username', 'forum', 'user_admin_rights', 'bot_admin_rights')
+
+    def __init__(self, creator: Optional[bool]=None, bot_participant: Optional[bool]=None, has_username: Optional[bool]=None, forum: Optional[bool]=None, user_admin_rights: Optional['TypeChatAdminRights']=None, bot_admin_rights: Optional['TypeChatAdminRights']=None):
+        """
+        Constructor for RequestPeerType: Instance of either RequestPeerTypeUser, RequestPeerTypeChat, RequestPeerTypeBroadcast.
+        """
+        self.creator = creator
+        self.bot_participant = bot_participant
+        self.has_username = has_username
+        self.forum = forum
+        self.user_admin_rights = user_admin_rights
+        self.bot_admin_rights = bot_admin_rights
+
+    def to_dict(self):
+        return {
+            '_': 'RequestPeerTypeChat',
+            'creator': self.creator,
+            'bot_participant': self.bot_participant,
+            'has_username': self.has_username,
+            'forum': self.forum,
+            'user_admin_rights': self.user_admin_rights.to_dict() if isinstance(self.user_admin_rights, TLObject) else self.user_admin_rights,
+            'bot_admin_rights': self.bot_admin_rights.to_dict() if isinstance(self.bot_admin_rights, TLObject) else self.bot_admin_rights
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1bn\xf0\xc9',
+            struct.pack('<I', (0 if self.creator is None or self.creator is False else 1) | (0 if self.bot_participant is None or self.bot_participant is False else 32) | (0 if self.has_username is None else 8) | (0 if self.forum is None else 16) | (0 if self.user_admin_rights is None or self.user_admin_rights is False else 2) | (0 if self.bot_admin_rights is None or self.bot_admin_rights is False else 4)),
+            b'' if self.has_username is None else (b'\xb5ur\x99' if self.has_username else b'7\x97y\xbc'),
+            b'' if self.forum is None else (b'\xb5ur\x99' if self.forum else b'7\x97y\xbc'),
+            b'' if self.user_admin_rights is None or self.user_admin_rights is False else (self.user_admin_rights._bytes()),
+            b'' if self.bot_admin_rights is None or self.bot_admin_rights is False else (self.bot_admin_rights._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _creator = bool(flags & 1)
+        _bot_participant = bool(flags & 32)
+        if flags & 8:
+            _has_username = reader.tgread_bool()
+        else:
+            _has_username = None
+        if flags & 16:
+            _forum = reader.tgread_bool()
+        else:
+            _forum = None
+        if flags & 2:
+            _user_admin_rights = reader.tgread_object()
+        else:
+            _user_admin_rights = None
+        if flags & 4:
+            _bot_admin_rights = reader.tgread_object()
+        else:
+            _bot_admin_rights = None
+        return cls(creator=_creator, bot_participant=_bot_participant, has_username=_has_username, forum=_forum, user_admin_rights=_user_admin_rights, bot_admin_rights=_bot_admin_rights)
+
+
+class RequestPeerTypeUser(TLObject):
+    CONSTRUCTOR_ID = 0x5f3b8a00
+    SUBCLASS_OF_ID = 0xe9a0e814
+    __slots__ = ('bot', 'premium')
+
+    def __init__(self, bot: Optional[bool]=None, premium: Optional[bool]=None):
+        """
+        Constructor for RequestPeerType: Instance of either RequestPeerTypeUser, RequestPeerTypeChat, RequestPeerTypeBroadcast.
+        """
+        self.bot = bot
+        self.premium = premium
+
+    def to_dict(self):
+        return {
+            '_': 'RequestPeerTypeUser',
+            'bot': self.bot,
+            'premium': self.premium
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x00\x8a;_',
+            struct.pack('<I', (0 if self.bot is None else 1) | (0 if self.premium is None else 2)),
+            b'' if self.bot is None else (b'\xb5ur\x99' if self.bot else b'7\x97y\xbc'),
+            b'' if self.premium is None else (b'\xb5ur\x99' if self.premium else b'7\x97y\xbc'),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _bot = reader.tgread_bool()
+        else:
+            _bot = None
+        if flags & 2:
+            _premium = reader.tgread_bool()
+        else:
+            _premium = None
+        return cls(bot=_bot, premium=_premium)
+
+TypeRequestPeerType = Union[RequestPeerTypeUser,RequestPeerTypeChat,RequestPeerTypeBroadcast]
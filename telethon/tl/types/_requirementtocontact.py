@@ -0,0 +1,77 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class RequirementToContactEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x50a9839
+    SUBCLASS_OF_ID = 0x8d756391
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'RequirementToContactEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'9\x98\n\x05',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class RequirementToContactPaidMessages(TLObject):
+    CONSTRUCTOR_ID = 0xb4f67e93
+    SUBCLASS_OF_ID = 0x8d756391
+    __slots__ = ('stars_amount',)
+
+    def __init__(self, stars_amount: int):
+        """
+        Constructor for RequirementToContact: Instance of either RequirementToContactEmpty, RequirementToContactPremium, RequirementToContactPaidMessages.
+        """
+        self.stars_amount = stars_amount
+
+    def to_dict(self):
+        return {
+            '_': 'RequirementToContactPaidMessages',
+            'stars_amount': self.stars_amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x93~\xf6\xb4',
+            struct.pack('<q', self.stars_amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stars_amount = reader.read_long()
+        return cls(stars_amount=_stars_amount)
+
+
+class RequirementToContactPremium(TLObject):
+    CONSTRUCTOR_ID = 0xe581e4e9
+    SUBCLASS_OF_ID = 0x8d756391
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'RequirementToContactPremium'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe9\xe4\x81\xe5',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeRequirementToContact = Union[RequirementToContactEmpty,RequirementToContactPremium,RequirementToContactPaidMessages]
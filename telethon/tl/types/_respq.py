@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ResPQ(TLObject):
+    CONSTRUCTOR_ID = 0x5162463
+    SUBCLASS_OF_ID = 0x786986b8
+    __slots__ = ('nonce', 'server_nonce', 'pq', 'server_public_key_fingerprints')
+
+    def __init__(self, nonce: int, server_nonce: int, pq: bytes, server_public_key_fingerprints: List[int]):
+        """
+        Constructor for ResPQ: Instance of ResPQ.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.pq = pq
+        self.server_public_key_fingerprints = server_public_key_fingerprints
+
+    def to_dict(self):
+        return {
+            '_': 'ResPQ',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'pq': self.pq,
+            'server_public_key_fingerprints': [] if self.server_public_key_fingerprints is None else self.server_public_key_fingerprints[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'c$\x16\x05',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.serialize_bytes(self.pq),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.server_public_key_fingerprints)), len(self.server_public_key_fingerprints), *self.server_public_key_fingerprints),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _pq = reader.tgread_bytes()
+        reader.read_int()
+        _server_public_key_fingerprints = reader.read_array('q', reader.read_int())
+        return cls(nonce=_nonce, server_nonce=_server_nonce, pq=_pq, server_public_key_fingerprints=_server_public_key_fingerprints)
+
+TypeResPQ = ResPQ
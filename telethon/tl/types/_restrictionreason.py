@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class RestrictionReason(TLObject):
+    CONSTRUCTOR_ID = 0xd072acb4
+    SUBCLASS_OF_ID = 0x6ad95ad
+    __slots__ = ('platform', 'reason', 'text')
+
+    def __init__(self, platform: str, reason: str, text: str):
+        """
+        Constructor for RestrictionReason: Instance of RestrictionReason.
+        """
+        self.platform = platform
+        self.reason = reason
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'RestrictionReason',
+            'platform': self.platform,
+            'reason': self.reason,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb4\xacr\xd0',
+            self.serialize_bytes(self.platform),
+            self.serialize_bytes(self.reason),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _platform = reader.tgread_string()
+        _reason = reader.tgread_string()
+        _text = reader.tgread_string()
+        return cls(platform=_platform, reason=_reason, text=_text)
+
+TypeRestrictionReason = RestrictionReason
@@ -0,0 +1,494 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qii = struct.Struct('<qii')
+
+
+class TextAnchor(TLObject):
+    CONSTRUCTOR_ID = 0x35553762
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text', 'name')
+
+    def __init__(self, text: 'TypeRichText', name: str):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+        self.name = name
+
+    def to_dict(self):
+        return {
+            '_': 'TextAnchor',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'name': self.name
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'b7U5',
+            self.text._bytes(),
+            self.serialize_bytes(self.name),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _name = reader.tgread_string()
+        return cls(text=_text, name=_name)
+
+
+class TextBold(TLObject):
+    CONSTRUCTOR_ID = 0x6724abc4
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextBold',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4\xab$g',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextConcat(TLObject):
+    CONSTRUCTOR_ID = 0x7e6260d7
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('texts',)
+
+    def __init__(self, texts: List['TypeRichText']):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.texts = texts
+
+    def to_dict(self):
+        return {
+            '_': 'TextConcat',
+            'texts': [] if self.texts is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.texts]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd7`b~',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.texts)),b''.join(x._bytes() for x in self.texts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _texts = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _texts.append(_x)
+
+        return cls(texts=_texts)
+
+
+class TextEmail(TLObject):
+    CONSTRUCTOR_ID = 0xde5a0dd6
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text', 'email')
+
+    def __init__(self, text: 'TypeRichText', email: str):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+        self.email = email
+
+    def to_dict(self):
+        return {
+            '_': 'TextEmail',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'email': self.email
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd6\rZ\xde',
+            self.text._bytes(),
+            self.serialize_bytes(self.email),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _email = reader.tgread_string()
+        return cls(text=_text, email=_email)
+
+
+class TextEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xdc3d824f
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TextEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\x82=\xdc',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TextFixed(TLObject):
+    CONSTRUCTOR_ID = 0x6c3f19b9
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextFixed',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb9\x19?l',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextImage(TLObject):
+    CONSTRUCTOR_ID = 0x81ccf4f
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('document_id', 'w', 'h')
+
+    def __init__(self, document_id: int, w: int, h: int):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.document_id = document_id
+        self.w = w
+        self.h = h
+
+    def to_dict(self):
+        return {
+            '_': 'TextImage',
+            'document_id': self.document_id,
+            'w': self.w,
+            'h': self.h
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\xcf\x1c\x08',
+            _struct_qii.pack(self.document_id, self.w, self.h),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _document_id, _w, _h = reader.read_struct(_struct_qii)
+        return cls(document_id=_document_id, w=_w, h=_h)
+
+
+class TextItalic(TLObject):
+    CONSTRUCTOR_ID = 0xd912a59c
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextItalic',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9c\xa5\x12\xd9',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextMarked(TLObject):
+    CONSTRUCTOR_ID = 0x34b8621
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextMarked',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'!\x86K\x03',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextPhone(TLObject):
+    CONSTRUCTOR_ID = 0x1ccb966a
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text', 'phone')
+
+    def __init__(self, text: 'TypeRichText', phone: str):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+        self.phone = phone
+
+    def to_dict(self):
+        return {
+            '_': 'TextPhone',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'phone': self.phone
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'j\x96\xcb\x1c',
+            self.text._bytes(),
+            self.serialize_bytes(self.phone),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _phone = reader.tgread_string()
+        return cls(text=_text, phone=_phone)
+
+
+class TextPlain(TLObject):
+    CONSTRUCTOR_ID = 0x744694e0
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: str):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextPlain',
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe0\x94Ft',
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        return cls(text=_text)
+
+
+class TextStrike(TLObject):
+    CONSTRUCTOR_ID = 0x9bf8bb95
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextStrike',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x95\xbb\xf8\x9b',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextSubscript(TLObject):
+    CONSTRUCTOR_ID = 0xed6a8504
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextSubscript',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x04\x85j\xed',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextSuperscript(TLObject):
+    CONSTRUCTOR_ID = 0xc7fb5e01
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextSuperscript',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x01^\xfb\xc7',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextUnderline(TLObject):
+    CONSTRUCTOR_ID = 0xc12622c4
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text',)
+
+    def __init__(self, text: 'TypeRichText'):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'TextUnderline',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4"&\xc1',
+            self.text._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        return cls(text=_text)
+
+
+class TextUrl(TLObject):
+    CONSTRUCTOR_ID = 0x3c2884c1
+    SUBCLASS_OF_ID = 0xf1d0b479
+    __slots__ = ('text', 'url', 'webpage_id')
+
+    def __init__(self, text: 'TypeRichText', url: str, webpage_id: int):
+        """
+        Constructor for RichText: Instance of either TextEmpty, TextPlain, TextBold, TextItalic, TextUnderline, TextStrike, TextFixed, TextUrl, TextEmail, TextConcat, TextSubscript, TextSuperscript, TextMarked, TextPhone, TextImage, TextAnchor.
+        """
+        self.text = text
+        self.url = url
+        self.webpage_id = webpage_id
+
+    def to_dict(self):
+        return {
+            '_': 'TextUrl',
+            'text': self.text.to_dict() if isinstance(self.text, TLObject) else self.text,
+            'url': self.url,
+            'webpage_id': self.webpage_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc1\x84(<',
+            self.text._bytes(),
+            self.serialize_bytes(self.url),
+            struct.pack('<q', self.webpage_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_object()
+        _url = reader.tgread_string()
+        _webpage_id = reader.read_long()
+        return cls(text=_text, url=_url, webpage_id=_webpage_id)
+
+TypeRichText = Union[TextEmpty,TextPlain,TextBold,TextItalic,TextUnderline,TextStrike,TextFixed,TextUrl,TextEmail,TextConcat,TextSubscript,TextSuperscript,TextMarked,TextPhone,TextImage,TextAnchor]
@@ -0,0 +1,84 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qii = struct.Struct('<qii')
+
+
+class RpcAnswerDropped(TLObject):
+    CONSTRUCTOR_ID = 0xa43ad8b7
+    SUBCLASS_OF_ID = 0x4bca7570
+    __slots__ = ('msg_id', 'seq_no', 'bytes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, msg_id: int, seq_no: int, bytes: int):
+        """
+        Constructor for RpcDropAnswer: Instance of either RpcAnswerUnknown, RpcAnswerDroppedRunning, RpcAnswerDropped.
+        """
+        self.msg_id = msg_id
+        self.seq_no = seq_no
+        self.bytes = bytes
+
+    def to_dict(self):
+        return {
+            '_': 'RpcAnswerDropped',
+            'msg_id': self.msg_id,
+            'seq_no': self.seq_no,
+            'bytes': self.bytes
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb7\xd8:\xa4',
+            _struct_qii.pack(self.msg_id, self.seq_no, self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _msg_id, _seq_no, _bytes = reader.read_struct(_struct_qii)
+        return cls(msg_id=_msg_id, seq_no=_seq_no, bytes=_bytes)
+
+
+class RpcAnswerDroppedRunning(TLObject):
+    CONSTRUCTOR_ID = 0xcd78e586
+    SUBCLASS_OF_ID = 0x4bca7570
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'RpcAnswerDroppedRunning'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x86\xe5x\xcd',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class RpcAnswerUnknown(TLObject):
+    CONSTRUCTOR_ID = 0x5e2ad36e
+    SUBCLASS_OF_ID = 0x4bca7570
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'RpcAnswerUnknown'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'n\xd3*^',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeRpcDropAnswer = Union[RpcAnswerUnknown,RpcAnswerDroppedRunning,RpcAnswerDropped]
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class RpcError(TLObject):
+    CONSTRUCTOR_ID = 0x2144ca19
+    SUBCLASS_OF_ID = 0x4a17e265
+    __slots__ = ('error_code', 'error_message')
+
+    def __init__(self, error_code: int, error_message: str):
+        """
+        Constructor for RpcError: Instance of RpcError.
+        """
+        self.error_code = error_code
+        self.error_message = error_message
+
+    def to_dict(self):
+        return {
+            '_': 'RpcError',
+            'error_code': self.error_code,
+            'error_message': self.error_message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19\xcaD!',
+            struct.pack('<i', self.error_code),
+            self.serialize_bytes(self.error_message),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _error_code = reader.read_int()
+        _error_message = reader.tgread_string()
+        return cls(error_code=_error_code, error_message=_error_message)
+
+TypeRpcError = RpcError
@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SavedPhoneContact(TLObject):
+    CONSTRUCTOR_ID = 0x1142bd56
+    SUBCLASS_OF_ID = 0x6db98c4
+    __slots__ = ('phone', 'first_name', 'last_name', 'date')
+
+    def __init__(self, phone: str, first_name: str, last_name: str, date: Optional[datetime]):
+        """
+        Constructor for SavedContact: Instance of SavedPhoneContact.
+        """
+        self.phone = phone
+        self.first_name = first_name
+        self.last_name = last_name
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'SavedPhoneContact',
+            'phone': self.phone,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'V\xbdB\x11',
+            self.serialize_bytes(self.phone),
+            self.serialize_bytes(self.first_name),
+            self.serialize_bytes(self.last_name),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone = reader.tgread_string()
+        _first_name = reader.tgread_string()
+        _last_name = reader.tgread_string()
+        _date = reader.tgread_date()
+        return cls(phone=_phone, first_name=_first_name, last_name=_last_name, date=_date)
+
+TypeSavedContact = SavedPhoneContact
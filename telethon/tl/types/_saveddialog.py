@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class SavedDialog(TLObject):
+    CONSTRUCTOR_ID = 0xbd87cb6c
+    SUBCLASS_OF_ID = 0x23ba6506
+    __slots__ = ('peer', 'top_message', 'pinned')
+
+    def __init__(self, peer: 'TypePeer', top_message: int, pinned: Optional[bool]=None):
+        """
+        Constructor for SavedDialog: Instance of SavedDialog.
+        """
+        self.peer = peer
+        self.top_message = top_message
+        self.pinned = pinned
+
+    def to_dict(self):
+        return {
+            '_': 'SavedDialog',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'top_message': self.top_message,
+            'pinned': self.pinned
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'l\xcb\x87\xbd',
+            struct.pack('<I', (0 if self.pinned is None or self.pinned is False else 4)),
+            self.peer._bytes(),
+            struct.pack('<i', self.top_message),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _pinned = bool(flags & 4)
+        _peer = reader.tgread_object()
+        _top_message = reader.read_int()
+        return cls(peer=_peer, top_message=_top_message, pinned=_pinned)
+
+TypeSavedDialog = SavedDialog
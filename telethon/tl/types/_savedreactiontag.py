@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeReaction
+
+
+
+class SavedReactionTag(TLObject):
+    CONSTRUCTOR_ID = 0xcb6ff828
+    SUBCLASS_OF_ID = 0xed681418
+    __slots__ = ('reaction', 'count', 'title')
+
+    def __init__(self, reaction: 'TypeReaction', count: int, title: Optional[str]=None):
+        """
+        Constructor for SavedReactionTag: Instance of SavedReactionTag.
+        """
+        self.reaction = reaction
+        self.count = count
+        self.title = title
+
+    def to_dict(self):
+        return {
+            '_': 'SavedReactionTag',
+            'reaction': self.reaction.to_dict() if isinstance(self.reaction, TLObject) else self.reaction,
+            'count': self.count,
+            'title': self.title
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'(\xf8o\xcb',
+            struct.pack('<I', (0 if self.title is None or self.title is False else 1)),
+            self.reaction._bytes(),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            struct.pack('<i', self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _reaction = reader.tgread_object()
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        _count = reader.read_int()
+        return cls(reaction=_reaction, count=_count, title=_title)
+
+TypeSavedReactionTag = SavedReactionTag
@@ -0,0 +1,118 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer, TypeStarGift, TypeTextWithEntities
+
+
+
+class SavedStarGift(TLObject):
+    CONSTRUCTOR_ID = 0x6056dba5
+    SUBCLASS_OF_ID = 0x8e2b3c14
+    __slots__ = ('date', 'gift', 'name_hidden', 'unsaved', 'refunded', 'can_upgrade', 'pinned_to_top', 'from_id', 'message', 'msg_id', 'saved_id', 'convert_stars', 'upgrade_stars', 'can_export_at', 'transfer_stars')
+
+    def __init__(self, date: Optional[datetime], gift: 'TypeStarGift', name_hidden: Optional[bool]=None, unsaved: Optional[bool]=None, refunded: Optional[bool]=None, can_upgrade: Optional[bool]=None, pinned_to_top: Optional[bool]=None, from_id: Optional['TypePeer']=None, message: Optional['TypeTextWithEntities']=None, msg_id: Optional[int]=None, saved_id: Optional[int]=None, convert_stars: Optional[int]=None, upgrade_stars: Optional[int]=None, can_export_at: Optional[int]=None, transfer_stars: Optional[int]=None):
+        """
+        Constructor for SavedStarGift: Instance of SavedStarGift.
+        """
+        self.date = date
+        self.gift = gift
+        self.name_hidden = name_hidden
+        self.unsaved = unsaved
+        self.refunded = refunded
+        self.can_upgrade = can_upgrade
+        self.pinned_to_top = pinned_to_top
+        self.from_id = from_id
+        self.message = message
+        self.msg_id = msg_id
+        self.saved_id = saved_id
+        self.convert_stars = convert_stars
+        self.upgrade_stars = upgrade_stars
+        self.can_export_at = can_export_at
+        self.transfer_stars = transfer_stars
+
+    def to_dict(self):
+        return {
+            '_': 'SavedStarGift',
+            'date': self.date,
+            'gift': self.gift.to_dict() if isinstance(self.gift, TLObject) else self.gift,
+            'name_hidden': self.name_hidden,
+            'unsaved': self.unsaved,
+            'refunded': self.refunded,
+            'can_upgrade': self.can_upgrade,
+            'pinned_to_top': self.pinned_to_top,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message,
+            'msg_id': self.msg_id,
+            'saved_id': self.saved_id,
+            'convert_stars': self.convert_stars,
+            'upgrade_stars': self.upgrade_stars,
+            'can_export_at': self.can_export_at,
+            'transfer_stars': self.transfer_stars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa5\xdbV`',
+            struct.pack('<I', (0 if self.name_hidden is None or self.name_hidden is False else 1) | (0 if self.unsaved is None or self.unsaved is False else 32) | (0 if self.refunded is None or self.refunded is False else 512) | (0 if self.can_upgrade is None or self.can_upgrade is False else 1024) | (0 if self.pinned_to_top is None or self.pinned_to_top is False else 4096) | (0 if self.from_id is None or self.from_id is False else 2) | (0 if self.message is None or self.message is False else 4) | (0 if self.msg_id is None or self.msg_id is False else 8) | (0 if self.saved_id is None or self.saved_id is False else 2048) | (0 if self.convert_stars is None or self.convert_stars is False else 16) | (0 if self.upgrade_stars is None or self.upgrade_stars is False else 64) | (0 if self.can_export_at is None or self.can_export_at is False else 128) | (0 if self.transfer_stars is None or self.transfer_stars is False else 256)),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            self.serialize_datetime(self.date),
+            self.gift._bytes(),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+            b'' if self.msg_id is None or self.msg_id is False else (struct.pack('<i', self.msg_id)),
+            b'' if self.saved_id is None or self.saved_id is False else (struct.pack('<q', self.saved_id)),
+            b'' if self.convert_stars is None or self.convert_stars is False else (struct.pack('<q', self.convert_stars)),
+            b'' if self.upgrade_stars is None or self.upgrade_stars is False else (struct.pack('<q', self.upgrade_stars)),
+            b'' if self.can_export_at is None or self.can_export_at is False else (struct.pack('<i', self.can_export_at)),
+            b'' if self.transfer_stars is None or self.transfer_stars is False else (struct.pack('<q', self.transfer_stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _name_hidden = bool(flags & 1)
+        _unsaved = bool(flags & 32)
+        _refunded = bool(flags & 512)
+        _can_upgrade = bool(flags & 1024)
+        _pinned_to_top = bool(flags & 4096)
+        if flags & 2:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        _date = reader.tgread_date()
+        _gift = reader.tgread_object()
+        if flags & 4:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        if flags & 8:
+            _msg_id = reader.read_int()
+        else:
+            _msg_id = None
+        if flags & 2048:
+            _saved_id = reader.read_long()
+        else:
+            _saved_id = None
+        if flags & 16:
+            _convert_stars = reader.read_long()
+        else:
+            _convert_stars = None
+        if flags & 64:
+            _upgrade_stars = reader.read_long()
+        else:
+            _upgrade_stars = None
+        if flags & 128:
+            _can_export_at = reader.read_int()
+        else:
+            _can_export_at = None
+        if flags & 256:
+            _transfer_stars = reader.read_long()
+        else:
+            _transfer_stars = None
+        return cls(date=_date, gift=_gift, name_hidden=_name_hidden, unsaved=_unsaved, refunded=_refunded, can_upgrade=_can_upgrade, pinned_to_top=_pinned_to_top, from_id=_from_id, message=_message, msg_id=_msg_id, saved_id=_saved_id, convert_stars=_convert_stars, upgrade_stars=_upgrade_stars, can_export_at=_can_export_at, transfer_stars=_transfer_stars)
+
+TypeSavedStarGift = SavedStarGift
@@ -0,0 +1,47 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iii = struct.Struct('<iii')
+
+
+class SearchResultsCalendarPeriod(TLObject):
+    CONSTRUCTOR_ID = 0xc9b0539f
+    SUBCLASS_OF_ID = 0xe25cf8ff
+    __slots__ = ('date', 'min_msg_id', 'max_msg_id', 'count')
+
+    def __init__(self, date: Optional[datetime], min_msg_id: int, max_msg_id: int, count: int):
+        """
+        Constructor for SearchResultsCalendarPeriod: Instance of SearchResultsCalendarPeriod.
+        """
+        self.date = date
+        self.min_msg_id = min_msg_id
+        self.max_msg_id = max_msg_id
+        self.count = count
+
+    def to_dict(self):
+        return {
+            '_': 'SearchResultsCalendarPeriod',
+            'date': self.date,
+            'min_msg_id': self.min_msg_id,
+            'max_msg_id': self.max_msg_id,
+            'count': self.count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9fS\xb0\xc9',
+            self.serialize_datetime(self.date),
+            _struct_iii.pack(self.min_msg_id, self.max_msg_id, self.count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _date = reader.tgread_date()
+        _min_msg_id, _max_msg_id, _count = reader.read_struct(_struct_iii)
+        return cls(date=_date, min_msg_id=_min_msg_id, max_msg_id=_max_msg_id, count=_count)
+
+TypeSearchResultsCalendarPeriod = SearchResultsCalendarPeriod
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SearchResultPosition(TLObject):
+    CONSTRUCTOR_ID = 0x7f648b67
+    SUBCLASS_OF_ID = 0xb8e21614
+    __slots__ = ('msg_id', 'date', 'offset')
+
+    def __init__(self, msg_id: int, date: Optional[datetime], offset: int):
+        """
+        Constructor for SearchResultsPosition: Instance of SearchResultPosition.
+        """
+        self.msg_id = msg_id
+        self.date = date
+        self.offset = offset
+
+    def to_dict(self):
+        return {
+            '_': 'SearchResultPosition',
+            'msg_id': self.msg_id,
+            'date': self.date,
+            'offset': self.offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'g\x8bd\x7f',
+            struct.pack('<i', self.msg_id),
+            self.serialize_datetime(self.date),
+            struct.pack('<i', self.offset),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _msg_id = reader.read_int()
+        _date = reader.tgread_date()
+        _offset = reader.read_int()
+        return cls(msg_id=_msg_id, date=_date, offset=_offset)
+
+TypeSearchResultsPosition = SearchResultPosition
@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SecureCredentialsEncrypted(TLObject):
+    CONSTRUCTOR_ID = 0x33f0ea47
+    SUBCLASS_OF_ID = 0x94dc7633
+    __slots__ = ('data', 'hash', 'secret')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, data: bytes, hash: bytes, secret: bytes):
+        """
+        Constructor for SecureCredentialsEncrypted: Instance of SecureCredentialsEncrypted.
+        """
+        self.data = data
+        self.hash = hash
+        self.secret = secret
+
+    def to_dict(self):
+        return {
+            '_': 'SecureCredentialsEncrypted',
+            'data': self.data,
+            'hash': self.hash,
+            'secret': self.secret
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'G\xea\xf03',
+            self.serialize_bytes(self.data),
+            self.serialize_bytes(self.hash),
+            self.serialize_bytes(self.secret),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _data = reader.tgread_bytes()
+        _hash = reader.tgread_bytes()
+        _secret = reader.tgread_bytes()
+        return cls(data=_data, hash=_hash, secret=_secret)
+
+TypeSecureCredentialsEncrypted = SecureCredentialsEncrypted
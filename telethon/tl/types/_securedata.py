@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SecureData(TLObject):
+    CONSTRUCTOR_ID = 0x8aeabec3
+    SUBCLASS_OF_ID = 0x7cd41eb4
+    __slots__ = ('data', 'data_hash', 'secret')
+
+    def __init__(self, data: bytes, data_hash: bytes, secret: bytes):
+        """
+        Constructor for SecureData: Instance of SecureData.
+        """
+        self.data = data
+        self.data_hash = data_hash
+        self.secret = secret
+
+    def to_dict(self):
+        return {
+            '_': 'SecureData',
+            'data': self.data,
+            'data_hash': self.data_hash,
+            'secret': self.secret
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc3\xbe\xea\x8a',
+            self.serialize_bytes(self.data),
+            self.serialize_bytes(self.data_hash),
+            self.serialize_bytes(self.secret),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _data = reader.tgread_bytes()
+        _data_hash = reader.tgread_bytes()
+        _secret = reader.tgread_bytes()
+        return cls(data=_data, data_hash=_data_hash, secret=_secret)
+
+TypeSecureData = SecureData
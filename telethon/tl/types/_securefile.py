@@ -0,0 +1,78 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qqqi = struct.Struct('<qqqi')
+
+
+class SecureFile(TLObject):
+    CONSTRUCTOR_ID = 0x7d09c27e
+    SUBCLASS_OF_ID = 0x5db8dbc7
+    __slots__ = ('id', 'access_hash', 'size', 'dc_id', 'date', 'file_hash', 'secret')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, size: int, dc_id: int, date: Optional[datetime], file_hash: bytes, secret: bytes):
+        """
+        Constructor for SecureFile: Instance of either SecureFileEmpty, SecureFile.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.size = size
+        self.dc_id = dc_id
+        self.date = date
+        self.file_hash = file_hash
+        self.secret = secret
+
+    def to_dict(self):
+        return {
+            '_': 'SecureFile',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'size': self.size,
+            'dc_id': self.dc_id,
+            'date': self.date,
+            'file_hash': self.file_hash,
+            'secret': self.secret
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\xc2\t}',
+            _struct_qqqi.pack(self.id, self.access_hash, self.size, self.dc_id),
+            self.serialize_datetime(self.date),
+            self.serialize_bytes(self.file_hash),
+            self.serialize_bytes(self.secret),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, _access_hash, _size, _dc_id = reader.read_struct(_struct_qqqi)
+        _date = reader.tgread_date()
+        _file_hash = reader.tgread_bytes()
+        _secret = reader.tgread_bytes()
+        return cls(id=_id, access_hash=_access_hash, size=_size, dc_id=_dc_id, date=_date, file_hash=_file_hash, secret=_secret)
+
+
+class SecureFileEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x64199744
+    SUBCLASS_OF_ID = 0x5db8dbc7
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureFileEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'D\x97\x19d',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeSecureFile = Union[SecureFileEmpty,SecureFile]
@@ -0,0 +1,86 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000(TLObject):
+    CONSTRUCTOR_ID = 0xbbf2dda0
+    SUBCLASS_OF_ID = 0x77262943
+    __slots__ = ('salt',)
+
+    def __init__(self, salt: bytes):
+        """
+        Constructor for SecurePasswordKdfAlgo: Instance of either SecurePasswordKdfAlgoUnknown, SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000, SecurePasswordKdfAlgoSHA512.
+        """
+        self.salt = salt
+
+    def to_dict(self):
+        return {
+            '_': 'SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000',
+            'salt': self.salt
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0\xdd\xf2\xbb',
+            self.serialize_bytes(self.salt),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _salt = reader.tgread_bytes()
+        return cls(salt=_salt)
+
+
+class SecurePasswordKdfAlgoSHA512(TLObject):
+    CONSTRUCTOR_ID = 0x86471d92
+    SUBCLASS_OF_ID = 0x77262943
+    __slots__ = ('salt',)
+
+    def __init__(self, salt: bytes):
+        """
+        Constructor for SecurePasswordKdfAlgo: Instance of either SecurePasswordKdfAlgoUnknown, SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000, SecurePasswordKdfAlgoSHA512.
+        """
+        self.salt = salt
+
+    def to_dict(self):
+        return {
+            '_': 'SecurePasswordKdfAlgoSHA512',
+            'salt': self.salt
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x92\x1dG\x86',
+            self.serialize_bytes(self.salt),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _salt = reader.tgread_bytes()
+        return cls(salt=_salt)
+
+
+class SecurePasswordKdfAlgoUnknown(TLObject):
+    CONSTRUCTOR_ID = 0x4a8537
+    SUBCLASS_OF_ID = 0x77262943
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecurePasswordKdfAlgoUnknown'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'7\x85J\x00',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeSecurePasswordKdfAlgo = Union[SecurePasswordKdfAlgoUnknown,SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000,SecurePasswordKdfAlgoSHA512]
@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SecurePlainEmail(TLObject):
+    CONSTRUCTOR_ID = 0x21ec5a5f
+    SUBCLASS_OF_ID = 0x23b2afb6
+    __slots__ = ('email',)
+
+    def __init__(self, email: str):
+        """
+        Constructor for SecurePlainData: Instance of either SecurePlainPhone, SecurePlainEmail.
+        """
+        self.email = email
+
+    def to_dict(self):
+        return {
+            '_': 'SecurePlainEmail',
+            'email': self.email
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'_Z\xec!',
+            self.serialize_bytes(self.email),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _email = reader.tgread_string()
+        return cls(email=_email)
+
+
+class SecurePlainPhone(TLObject):
+    CONSTRUCTOR_ID = 0x7d6099dd
+    SUBCLASS_OF_ID = 0x23b2afb6
+    __slots__ = ('phone',)
+
+    def __init__(self, phone: str):
+        """
+        Constructor for SecurePlainData: Instance of either SecurePlainPhone, SecurePlainEmail.
+        """
+        self.phone = phone
+
+    def to_dict(self):
+        return {
+            '_': 'SecurePlainPhone',
+            'phone': self.phone
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdd\x99`}',
+            self.serialize_bytes(self.phone),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _phone = reader.tgread_string()
+        return cls(phone=_phone)
+
+TypeSecurePlainData = Union[SecurePlainPhone,SecurePlainEmail]
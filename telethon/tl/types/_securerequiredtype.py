@@ -0,0 +1,87 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSecureValueType
+
+
+
+class SecureRequiredType(TLObject):
+    CONSTRUCTOR_ID = 0x829d99da
+    SUBCLASS_OF_ID = 0x7c7b420a
+    __slots__ = ('type', 'native_names', 'selfie_required', 'translation_required')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', native_names: Optional[bool]=None, selfie_required: Optional[bool]=None, translation_required: Optional[bool]=None):
+        """
+        Constructor for SecureRequiredType: Instance of either SecureRequiredType, SecureRequiredTypeOneOf.
+        """
+        self.type = type
+        self.native_names = native_names
+        self.selfie_required = selfie_required
+        self.translation_required = translation_required
+
+    def to_dict(self):
+        return {
+            '_': 'SecureRequiredType',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'native_names': self.native_names,
+            'selfie_required': self.selfie_required,
+            'translation_required': self.translation_required
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xda\x99\x9d\x82',
+            struct.pack('<I', (0 if self.native_names is None or self.native_names is False else 1) | (0 if self.selfie_required is None or self.selfie_required is False else 2) | (0 if self.translation_required is None or self.translation_required is False else 4)),
+            self.type._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _native_names = bool(flags & 1)
+        _selfie_required = bool(flags & 2)
+        _translation_required = bool(flags & 4)
+        _type = reader.tgread_object()
+        return cls(type=_type, native_names=_native_names, selfie_required=_selfie_required, translation_required=_translation_required)
+
+
+class SecureRequiredTypeOneOf(TLObject):
+    CONSTRUCTOR_ID = 0x27477b4
+    SUBCLASS_OF_ID = 0x7c7b420a
+    __slots__ = ('types',)
+
+    def __init__(self, types: List['TypeSecureRequiredType']):
+        """
+        Constructor for SecureRequiredType: Instance of either SecureRequiredType, SecureRequiredTypeOneOf.
+        """
+        self.types = types
+
+    def to_dict(self):
+        return {
+            '_': 'SecureRequiredTypeOneOf',
+            'types': [] if self.types is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.types]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb4wt\x02',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.types)),b''.join(x._bytes() for x in self.types),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _types = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _types.append(_x)
+
+        return cls(types=_types)
+
+TypeSecureRequiredType = Union[SecureRequiredType,SecureRequiredTypeOneOf]
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSecurePasswordKdfAlgo
+
+
+
+class SecureSecretSettings(TLObject):
+    CONSTRUCTOR_ID = 0x1527bcac
+    SUBCLASS_OF_ID = 0xc6c802fb
+    __slots__ = ('secure_algo', 'secure_secret', 'secure_secret_id')
+
+    def __init__(self, secure_algo: 'TypeSecurePasswordKdfAlgo', secure_secret: bytes, secure_secret_id: int):
+        """
+        Constructor for SecureSecretSettings: Instance of SecureSecretSettings.
+        """
+        self.secure_algo = secure_algo
+        self.secure_secret = secure_secret
+        self.secure_secret_id = secure_secret_id
+
+    def to_dict(self):
+        return {
+            '_': 'SecureSecretSettings',
+            'secure_algo': self.secure_algo.to_dict() if isinstance(self.secure_algo, TLObject) else self.secure_algo,
+            'secure_secret': self.secure_secret,
+            'secure_secret_id': self.secure_secret_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"\xac\xbc'\x15",
+            self.secure_algo._bytes(),
+            self.serialize_bytes(self.secure_secret),
+            struct.pack('<q', self.secure_secret_id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _secure_algo = reader.tgread_object()
+        _secure_secret = reader.tgread_bytes()
+        _secure_secret_id = reader.read_long()
+        return cls(secure_algo=_secure_algo, secure_secret=_secure_secret, secure_secret_id=_secure_secret_id)
+
+TypeSecureSecretSettings = SecureSecretSettings
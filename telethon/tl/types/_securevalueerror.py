@@ -0,0 +1,367 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSecureValueType
+
+
+
+class SecureValueError(TLObject):
+    CONSTRUCTOR_ID = 0x869d758f
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', hash: bytes, text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.hash = hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueError',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'hash': self.hash,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8fu\x9d\x86',
+            self.type._bytes(),
+            self.serialize_bytes(self.hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _hash = reader.tgread_bytes()
+        _text = reader.tgread_string()
+        return cls(type=_type, hash=_hash, text=_text)
+
+
+class SecureValueErrorData(TLObject):
+    CONSTRUCTOR_ID = 0xe8a40bd9
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'data_hash', 'field', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', data_hash: bytes, field: str, text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.data_hash = data_hash
+        self.field = field
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorData',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'data_hash': self.data_hash,
+            'field': self.field,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd9\x0b\xa4\xe8',
+            self.type._bytes(),
+            self.serialize_bytes(self.data_hash),
+            self.serialize_bytes(self.field),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _data_hash = reader.tgread_bytes()
+        _field = reader.tgread_string()
+        _text = reader.tgread_string()
+        return cls(type=_type, data_hash=_data_hash, field=_field, text=_text)
+
+
+class SecureValueErrorFile(TLObject):
+    CONSTRUCTOR_ID = 0x7a700873
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'file_hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', file_hash: bytes, text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.file_hash = file_hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorFile',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'file_hash': self.file_hash,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b's\x08pz',
+            self.type._bytes(),
+            self.serialize_bytes(self.file_hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _file_hash = reader.tgread_bytes()
+        _text = reader.tgread_string()
+        return cls(type=_type, file_hash=_file_hash, text=_text)
+
+
+class SecureValueErrorFiles(TLObject):
+    CONSTRUCTOR_ID = 0x666220e9
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'file_hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', file_hash: List[bytes], text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.file_hash = file_hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorFiles',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'file_hash': [] if self.file_hash is None else self.file_hash[:],
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe9 bf',
+            self.type._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.file_hash)),b''.join(self.serialize_bytes(x) for x in self.file_hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        reader.read_int()
+        _file_hash = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_bytes()
+            _file_hash.append(_x)
+
+        _text = reader.tgread_string()
+        return cls(type=_type, file_hash=_file_hash, text=_text)
+
+
+class SecureValueErrorFrontSide(TLObject):
+    CONSTRUCTOR_ID = 0xbe3dfa
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'file_hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', file_hash: bytes, text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.file_hash = file_hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorFrontSide',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'file_hash': self.file_hash,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfa=\xbe\x00',
+            self.type._bytes(),
+            self.serialize_bytes(self.file_hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _file_hash = reader.tgread_bytes()
+        _text = reader.tgread_string()
+        return cls(type=_type, file_hash=_file_hash, text=_text)
+
+
+class SecureValueErrorReverseSide(TLObject):
+    CONSTRUCTOR_ID = 0x868a2aa5
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'file_hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', file_hash: bytes, text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.file_hash = file_hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorReverseSide',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'file_hash': self.file_hash,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa5*\x8a\x86',
+            self.type._bytes(),
+            self.serialize_bytes(self.file_hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _file_hash = reader.tgread_bytes()
+        _text = reader.tgread_string()
+        return cls(type=_type, file_hash=_file_hash, text=_text)
+
+
+class SecureValueErrorSelfie(TLObject):
+    CONSTRUCTOR_ID = 0xe537ced6
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'file_hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', file_hash: bytes, text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.file_hash = file_hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorSelfie',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'file_hash': self.file_hash,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd6\xce7\xe5',
+            self.type._bytes(),
+            self.serialize_bytes(self.file_hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _file_hash = reader.tgread_bytes()
+        _text = reader.tgread_string()
+        return cls(type=_type, file_hash=_file_hash, text=_text)
+
+
+class SecureValueErrorTranslationFile(TLObject):
+    CONSTRUCTOR_ID = 0xa1144770
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'file_hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', file_hash: bytes, text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.file_hash = file_hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorTranslationFile',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'file_hash': self.file_hash,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'pG\x14\xa1',
+            self.type._bytes(),
+            self.serialize_bytes(self.file_hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _file_hash = reader.tgread_bytes()
+        _text = reader.tgread_string()
+        return cls(type=_type, file_hash=_file_hash, text=_text)
+
+
+class SecureValueErrorTranslationFiles(TLObject):
+    CONSTRUCTOR_ID = 0x34636dd8
+    SUBCLASS_OF_ID = 0x6075fce
+    __slots__ = ('type', 'file_hash', 'text')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', file_hash: List[bytes], text: str):
+        """
+        Constructor for SecureValueError: Instance of either SecureValueErrorData, SecureValueErrorFrontSide, SecureValueErrorReverseSide, SecureValueErrorSelfie, SecureValueErrorFile, SecureValueErrorFiles, SecureValueError, SecureValueErrorTranslationFile, SecureValueErrorTranslationFiles.
+        """
+        self.type = type
+        self.file_hash = file_hash
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueErrorTranslationFiles',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'file_hash': [] if self.file_hash is None else self.file_hash[:],
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd8mc4',
+            self.type._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.file_hash)),b''.join(self.serialize_bytes(x) for x in self.file_hash),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        reader.read_int()
+        _file_hash = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_bytes()
+            _file_hash.append(_x)
+
+        _text = reader.tgread_string()
+        return cls(type=_type, file_hash=_file_hash, text=_text)
+
+TypeSecureValueError = Union[SecureValueErrorData,SecureValueErrorFrontSide,SecureValueErrorReverseSide,SecureValueErrorSelfie,SecureValueErrorFile,SecureValueErrorFiles,SecureValueError,SecureValueErrorTranslationFile,SecureValueErrorTranslationFiles]
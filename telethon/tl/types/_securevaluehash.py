@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeSecureValueType
+
+
+
+class SecureValueHash(TLObject):
+    CONSTRUCTOR_ID = 0xed1ecdb0
+    SUBCLASS_OF_ID = 0xd5f5c007
+    __slots__ = ('type', 'hash')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: 'TypeSecureValueType', hash: bytes):
+        """
+        Constructor for SecureValueHash: Instance of SecureValueHash.
+        """
+        self.type = type
+        self.hash = hash
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueHash',
+            'type': self.type.to_dict() if isinstance(self.type, TLObject) else self.type,
+            'hash': self.hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb0\xcd\x1e\xed',
+            self.type._bytes(),
+            self.serialize_bytes(self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _type = reader.tgread_object()
+        _hash = reader.tgread_bytes()
+        return cls(type=_type, hash=_hash)
+
+TypeSecureValueHash = SecureValueHash
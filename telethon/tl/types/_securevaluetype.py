@@ -0,0 +1,268 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SecureValueTypeAddress(TLObject):
+    CONSTRUCTOR_ID = 0xcbe31e26
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeAddress'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'&\x1e\xe3\xcb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeBankStatement(TLObject):
+    CONSTRUCTOR_ID = 0x89137c0d
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeBankStatement'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\r|\x13\x89',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeDriverLicense(TLObject):
+    CONSTRUCTOR_ID = 0x6e425c4
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeDriverLicense'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc4%\xe4\x06',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeEmail(TLObject):
+    CONSTRUCTOR_ID = 0x8e3ca7ee
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeEmail'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xee\xa7<\x8e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeIdentityCard(TLObject):
+    CONSTRUCTOR_ID = 0xa0d0744b
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeIdentityCard'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Kt\xd0\xa0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeInternalPassport(TLObject):
+    CONSTRUCTOR_ID = 0x99a48f23
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeInternalPassport'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'#\x8f\xa4\x99',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypePassport(TLObject):
+    CONSTRUCTOR_ID = 0x3dac6a00
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypePassport'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x00j\xac=',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypePassportRegistration(TLObject):
+    CONSTRUCTOR_ID = 0x99e3806a
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypePassportRegistration'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'j\x80\xe3\x99',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypePersonalDetails(TLObject):
+    CONSTRUCTOR_ID = 0x9d2a81e3
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypePersonalDetails'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe3\x81*\x9d',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypePhone(TLObject):
+    CONSTRUCTOR_ID = 0xb320aadb
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypePhone'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdb\xaa \xb3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeRentalAgreement(TLObject):
+    CONSTRUCTOR_ID = 0x8b883488
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeRentalAgreement'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x884\x88\x8b',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeTemporaryRegistration(TLObject):
+    CONSTRUCTOR_ID = 0xea02ec33
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeTemporaryRegistration'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'3\xec\x02\xea',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SecureValueTypeUtilityBill(TLObject):
+    CONSTRUCTOR_ID = 0xfc36954e
+    SUBCLASS_OF_ID = 0x8893f596
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SecureValueTypeUtilityBill'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'N\x956\xfc',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeSecureValueType = Union[SecureValueTypePersonalDetails,SecureValueTypePassport,SecureValueTypeDriverLicense,SecureValueTypeIdentityCard,SecureValueTypeInternalPassport,SecureValueTypeAddress,SecureValueTypeUtilityBill,SecureValueTypeBankStatement,SecureValueTypeRentalAgreement,SecureValueTypePassportRegistration,SecureValueTypeTemporaryRegistration,SecureValueTypePhone,SecureValueTypeEmail]
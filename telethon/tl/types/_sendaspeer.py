@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class SendAsPeer(TLObject):
+    CONSTRUCTOR_ID = 0xb81c7034
+    SUBCLASS_OF_ID = 0x442381e4
+    __slots__ = ('peer', 'premium_required')
+
+    def __init__(self, peer: 'TypePeer', premium_required: Optional[bool]=None):
+        """
+        Constructor for SendAsPeer: Instance of SendAsPeer.
+        """
+        self.peer = peer
+        self.premium_required = premium_required
+
+    def to_dict(self):
+        return {
+            '_': 'SendAsPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'premium_required': self.premium_required
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'4p\x1c\xb8',
+            struct.pack('<I', (0 if self.premium_required is None or self.premium_required is False else 1)),
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _premium_required = bool(flags & 1)
+        _peer = reader.tgread_object()
+        return cls(peer=_peer, premium_required=_premium_required)
+
+TypeSendAsPeer = SendAsPeer
@@ -0,0 +1,451 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON
+
+
+
+class SendMessageCancelAction(TLObject):
+    CONSTRUCTOR_ID = 0xfd5ec8f5
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageCancelAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf5\xc8^\xfd',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageChooseContactAction(TLObject):
+    CONSTRUCTOR_ID = 0x628cbc6f
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageChooseContactAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'o\xbc\x8cb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageChooseStickerAction(TLObject):
+    CONSTRUCTOR_ID = 0xb05ac6b1
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageChooseStickerAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb1\xc6Z\xb0',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageEmojiInteraction(TLObject):
+    CONSTRUCTOR_ID = 0x25972bcb
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('emoticon', 'msg_id', 'interaction')
+
+    def __init__(self, emoticon: str, msg_id: int, interaction: 'TypeDataJSON'):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.emoticon = emoticon
+        self.msg_id = msg_id
+        self.interaction = interaction
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageEmojiInteraction',
+            'emoticon': self.emoticon,
+            'msg_id': self.msg_id,
+            'interaction': self.interaction.to_dict() if isinstance(self.interaction, TLObject) else self.interaction
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcb+\x97%',
+            self.serialize_bytes(self.emoticon),
+            struct.pack('<i', self.msg_id),
+            self.interaction._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoticon = reader.tgread_string()
+        _msg_id = reader.read_int()
+        _interaction = reader.tgread_object()
+        return cls(emoticon=_emoticon, msg_id=_msg_id, interaction=_interaction)
+
+
+class SendMessageEmojiInteractionSeen(TLObject):
+    CONSTRUCTOR_ID = 0xb665902e
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('emoticon',)
+
+    def __init__(self, emoticon: str):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.emoticon = emoticon
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageEmojiInteractionSeen',
+            'emoticon': self.emoticon
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'.\x90e\xb6',
+            self.serialize_bytes(self.emoticon),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoticon = reader.tgread_string()
+        return cls(emoticon=_emoticon)
+
+
+class SendMessageGamePlayAction(TLObject):
+    CONSTRUCTOR_ID = 0xdd6a8f48
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageGamePlayAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'H\x8fj\xdd',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageGeoLocationAction(TLObject):
+    CONSTRUCTOR_ID = 0x176f8ba1
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageGeoLocationAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa1\x8bo\x17',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageHistoryImportAction(TLObject):
+    CONSTRUCTOR_ID = 0xdbda9246
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('progress',)
+
+    def __init__(self, progress: int):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.progress = progress
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageHistoryImportAction',
+            'progress': self.progress
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'F\x92\xda\xdb',
+            struct.pack('<i', self.progress),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _progress = reader.read_int()
+        return cls(progress=_progress)
+
+
+class SendMessageRecordAudioAction(TLObject):
+    CONSTRUCTOR_ID = 0xd52f73f7
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageRecordAudioAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf7s/\xd5',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageRecordRoundAction(TLObject):
+    CONSTRUCTOR_ID = 0x88f27fbc
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageRecordRoundAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbc\x7f\xf2\x88',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageRecordVideoAction(TLObject):
+    CONSTRUCTOR_ID = 0xa187d66f
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageRecordVideoAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'o\xd6\x87\xa1',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageTypingAction(TLObject):
+    CONSTRUCTOR_ID = 0x16bf744e
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageTypingAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Nt\xbf\x16',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class SendMessageUploadAudioAction(TLObject):
+    CONSTRUCTOR_ID = 0xf351d7ab
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('progress',)
+
+    def __init__(self, progress: int):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.progress = progress
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageUploadAudioAction',
+            'progress': self.progress
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xab\xd7Q\xf3',
+            struct.pack('<i', self.progress),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _progress = reader.read_int()
+        return cls(progress=_progress)
+
+
+class SendMessageUploadDocumentAction(TLObject):
+    CONSTRUCTOR_ID = 0xaa0cd9e4
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('progress',)
+
+    def __init__(self, progress: int):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.progress = progress
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageUploadDocumentAction',
+            'progress': self.progress
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4\xd9\x0c\xaa',
+            struct.pack('<i', self.progress),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _progress = reader.read_int()
+        return cls(progress=_progress)
+
+
+class SendMessageUploadPhotoAction(TLObject):
+    CONSTRUCTOR_ID = 0xd1d34a26
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('progress',)
+
+    def __init__(self, progress: int):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.progress = progress
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageUploadPhotoAction',
+            'progress': self.progress
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'&J\xd3\xd1',
+            struct.pack('<i', self.progress),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _progress = reader.read_int()
+        return cls(progress=_progress)
+
+
+class SendMessageUploadRoundAction(TLObject):
+    CONSTRUCTOR_ID = 0x243e1c66
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('progress',)
+
+    def __init__(self, progress: int):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.progress = progress
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageUploadRoundAction',
+            'progress': self.progress
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'f\x1c>$',
+            struct.pack('<i', self.progress),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _progress = reader.read_int()
+        return cls(progress=_progress)
+
+
+class SendMessageUploadVideoAction(TLObject):
+    CONSTRUCTOR_ID = 0xe9763aec
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ('progress',)
+
+    def __init__(self, progress: int):
+        """
+        Constructor for SendMessageAction: Instance of either SendMessageTypingAction, SendMessageCancelAction, SendMessageRecordVideoAction, SendMessageUploadVideoAction, SendMessageRecordAudioAction, SendMessageUploadAudioAction, SendMessageUploadPhotoAction, SendMessageUploadDocumentAction, SendMessageGeoLocationAction, SendMessageChooseContactAction, SendMessageGamePlayAction, SendMessageRecordRoundAction, SendMessageUploadRoundAction, SpeakingInGroupCallAction, SendMessageHistoryImportAction, SendMessageChooseStickerAction, SendMessageEmojiInteraction, SendMessageEmojiInteractionSeen.
+        """
+        self.progress = progress
+
+    def to_dict(self):
+        return {
+            '_': 'SendMessageUploadVideoAction',
+            'progress': self.progress
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xec:v\xe9',
+            struct.pack('<i', self.progress),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _progress = reader.read_int()
+        return cls(progress=_progress)
+
+
+class SpeakingInGroupCallAction(TLObject):
+    CONSTRUCTOR_ID = 0xd92c2285
+    SUBCLASS_OF_ID = 0x20b2cc21
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'SpeakingInGroupCallAction'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x85",\xd9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeSendMessageAction = Union[SendMessageTypingAction,SendMessageCancelAction,SendMessageRecordVideoAction,SendMessageUploadVideoAction,SendMessageRecordAudioAction,SendMessageUploadAudioAction,SendMessageUploadPhotoAction,SendMessageUploadDocumentAction,SendMessageGeoLocationAction,SendMessageChooseContactAction,SendMessageGamePlayAction,SendMessageRecordRoundAction,SendMessageUploadRoundAction,SpeakingInGroupCallAction,SendMessageHistoryImportAction,SendMessageChooseStickerAction,SendMessageEmojiInteraction,SendMessageEmojiInteractionSeen]
@@ -0,0 +1,57 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ServerDHInnerData(TLObject):
+    CONSTRUCTOR_ID = 0xb5890dba
+    SUBCLASS_OF_ID = 0xc69a67bc
+    __slots__ = ('nonce', 'server_nonce', 'g', 'dh_prime', 'g_a', 'server_time')
+
+    def __init__(self, nonce: int, server_nonce: int, g: int, dh_prime: bytes, g_a: bytes, server_time: int):
+        """
+        Constructor for Server_DH_inner_data: Instance of ServerDHInnerData.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.g = g
+        self.dh_prime = dh_prime
+        self.g_a = g_a
+        self.server_time = server_time
+
+    def to_dict(self):
+        return {
+            '_': 'ServerDHInnerData',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'g': self.g,
+            'dh_prime': self.dh_prime,
+            'g_a': self.g_a,
+            'server_time': self.server_time
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xba\r\x89\xb5',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            struct.pack('<i', self.g),
+            self.serialize_bytes(self.dh_prime),
+            self.serialize_bytes(self.g_a),
+            struct.pack('<i', self.server_time),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _g = reader.read_int()
+        _dh_prime = reader.tgread_bytes()
+        _g_a = reader.tgread_bytes()
+        _server_time = reader.read_int()
+        return cls(nonce=_nonce, server_nonce=_server_nonce, g=_g, dh_prime=_dh_prime, g_a=_g_a, server_time=_server_time)
+
+TypeServer_DH_inner_data = ServerDHInnerData
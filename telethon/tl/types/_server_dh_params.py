@@ -0,0 +1,82 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class ServerDHParamsFail(TLObject):
+    CONSTRUCTOR_ID = 0x79cb045d
+    SUBCLASS_OF_ID = 0xa6188d9e
+    __slots__ = ('nonce', 'server_nonce', 'new_nonce_hash')
+
+    def __init__(self, nonce: int, server_nonce: int, new_nonce_hash: int):
+        """
+        Constructor for Server_DH_Params: Instance of either ServerDHParamsFail, ServerDHParamsOk.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce_hash = new_nonce_hash
+
+    def to_dict(self):
+        return {
+            '_': 'ServerDHParamsFail',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce_hash': self.new_nonce_hash
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b']\x04\xcby',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce_hash.to_bytes(16, 'little', signed=True),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce_hash = reader.read_large_int(bits=128)
+        return cls(nonce=_nonce, server_nonce=_server_nonce, new_nonce_hash=_new_nonce_hash)
+
+
+class ServerDHParamsOk(TLObject):
+    CONSTRUCTOR_ID = 0xd0e8075c
+    SUBCLASS_OF_ID = 0xa6188d9e
+    __slots__ = ('nonce', 'server_nonce', 'encrypted_answer')
+
+    def __init__(self, nonce: int, server_nonce: int, encrypted_answer: bytes):
+        """
+        Constructor for Server_DH_Params: Instance of either ServerDHParamsFail, ServerDHParamsOk.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.encrypted_answer = encrypted_answer
+
+    def to_dict(self):
+        return {
+            '_': 'ServerDHParamsOk',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'encrypted_answer': self.encrypted_answer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\\x07\xe8\xd0',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.serialize_bytes(self.encrypted_answer),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _encrypted_answer = reader.tgread_bytes()
+        return cls(nonce=_nonce, server_nonce=_server_nonce, encrypted_answer=_encrypted_answer)
+
+TypeServer_DH_Params = Union[ServerDHParamsFail,ServerDHParamsOk]
@@ -0,0 +1,119 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class DhGenFail(TLObject):
+    CONSTRUCTOR_ID = 0xa69dae02
+    SUBCLASS_OF_ID = 0x55dd6cdb
+    __slots__ = ('nonce', 'server_nonce', 'new_nonce_hash3')
+
+    def __init__(self, nonce: int, server_nonce: int, new_nonce_hash3: int):
+        """
+        Constructor for Set_client_DH_params_answer: Instance of either DhGenOk, DhGenRetry, DhGenFail.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce_hash3 = new_nonce_hash3
+
+    def to_dict(self):
+        return {
+            '_': 'DhGenFail',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce_hash3': self.new_nonce_hash3
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x02\xae\x9d\xa6',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce_hash3.to_bytes(16, 'little', signed=True),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce_hash3 = reader.read_large_int(bits=128)
+        return cls(nonce=_nonce, server_nonce=_server_nonce, new_nonce_hash3=_new_nonce_hash3)
+
+
+class DhGenOk(TLObject):
+    CONSTRUCTOR_ID = 0x3bcbf734
+    SUBCLASS_OF_ID = 0x55dd6cdb
+    __slots__ = ('nonce', 'server_nonce', 'new_nonce_hash1')
+
+    def __init__(self, nonce: int, server_nonce: int, new_nonce_hash1: int):
+        """
+        Constructor for Set_client_DH_params_answer: Instance of either DhGenOk, DhGenRetry, DhGenFail.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce_hash1 = new_nonce_hash1
+
+    def to_dict(self):
+        return {
+            '_': 'DhGenOk',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce_hash1': self.new_nonce_hash1
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'4\xf7\xcb;',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce_hash1.to_bytes(16, 'little', signed=True),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce_hash1 = reader.read_large_int(bits=128)
+        return cls(nonce=_nonce, server_nonce=_server_nonce, new_nonce_hash1=_new_nonce_hash1)
+
+
+class DhGenRetry(TLObject):
+    CONSTRUCTOR_ID = 0x46dc1fb9
+    SUBCLASS_OF_ID = 0x55dd6cdb
+    __slots__ = ('nonce', 'server_nonce', 'new_nonce_hash2')
+
+    def __init__(self, nonce: int, server_nonce: int, new_nonce_hash2: int):
+        """
+        Constructor for Set_client_DH_params_answer: Instance of either DhGenOk, DhGenRetry, DhGenFail.
+        """
+        self.nonce = nonce
+        self.server_nonce = server_nonce
+        self.new_nonce_hash2 = new_nonce_hash2
+
+    def to_dict(self):
+        return {
+            '_': 'DhGenRetry',
+            'nonce': self.nonce,
+            'server_nonce': self.server_nonce,
+            'new_nonce_hash2': self.new_nonce_hash2
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb9\x1f\xdcF',
+            self.nonce.to_bytes(16, 'little', signed=True),
+            self.server_nonce.to_bytes(16, 'little', signed=True),
+            self.new_nonce_hash2.to_bytes(16, 'little', signed=True),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _nonce = reader.read_large_int(bits=128)
+        _server_nonce = reader.read_large_int(bits=128)
+        _new_nonce_hash2 = reader.read_large_int(bits=128)
+        return cls(nonce=_nonce, server_nonce=_server_nonce, new_nonce_hash2=_new_nonce_hash2)
+
+TypeSet_client_DH_params_answer = Union[DhGenOk,DhGenRetry,DhGenFail]
@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeLabeledPrice
+
+
+
+class ShippingOption(TLObject):
+    CONSTRUCTOR_ID = 0xb6213cdf
+    SUBCLASS_OF_ID = 0xf4e94c78
+    __slots__ = ('id', 'title', 'prices')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, title: str, prices: List['TypeLabeledPrice']):
+        """
+        Constructor for ShippingOption: Instance of ShippingOption.
+        """
+        self.id = id
+        self.title = title
+        self.prices = prices
+
+    def to_dict(self):
+        return {
+            '_': 'ShippingOption',
+            'id': self.id,
+            'title': self.title,
+            'prices': [] if self.prices is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.prices]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xdf<!\xb6',
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.title),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.prices)),b''.join(x._bytes() for x in self.prices),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _title = reader.tgread_string()
+        reader.read_int()
+        _prices = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _prices.append(_x)
+
+        return cls(id=_id, title=_title, prices=_prices)
+
+TypeShippingOption = ShippingOption
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SmsJob(TLObject):
+    CONSTRUCTOR_ID = 0xe6a1eeb8
+    SUBCLASS_OF_ID = 0x1f24187e
+    __slots__ = ('job_id', 'phone_number', 'text')
+
+    def __init__(self, job_id: str, phone_number: str, text: str):
+        """
+        Constructor for SmsJob: Instance of SmsJob.
+        """
+        self.job_id = job_id
+        self.phone_number = phone_number
+        self.text = text
+
+    def to_dict(self):
+        return {
+            '_': 'SmsJob',
+            'job_id': self.job_id,
+            'phone_number': self.phone_number,
+            'text': self.text
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb8\xee\xa1\xe6',
+            self.serialize_bytes(self.job_id),
+            self.serialize_bytes(self.phone_number),
+            self.serialize_bytes(self.text),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _job_id = reader.tgread_string()
+        _phone_number = reader.tgread_string()
+        _text = reader.tgread_string()
+        return cls(job_id=_job_id, phone_number=_phone_number, text=_text)
+
+TypeSmsJob = SmsJob
@@ -0,0 +1,40 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class EligibleToJoin(TLObject):
+    CONSTRUCTOR_ID = 0xdc8b44cf
+    SUBCLASS_OF_ID = 0x5eb760a6
+    __slots__ = ('terms_url', 'monthly_sent_sms')
+
+    def __init__(self, terms_url: str, monthly_sent_sms: int):
+        """
+        Constructor for smsjobs.EligibilityToJoin: Instance of EligibleToJoin.
+        """
+        self.terms_url = terms_url
+        self.monthly_sent_sms = monthly_sent_sms
+
+    def to_dict(self):
+        return {
+            '_': 'EligibleToJoin',
+            'terms_url': self.terms_url,
+            'monthly_sent_sms': self.monthly_sent_sms
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xcfD\x8b\xdc',
+            self.serialize_bytes(self.terms_url),
+            struct.pack('<i', self.monthly_sent_sms),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _terms_url = reader.tgread_string()
+        _monthly_sent_sms = reader.read_int()
+        return cls(terms_url=_terms_url, monthly_sent_sms=_monthly_sent_sms)
+
@@ -0,0 +1,112 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity, TypeMessageMedia, TypePeerColor, TypePhoto
+
+
+
+class SponsoredMessage(TLObject):
+    CONSTRUCTOR_ID = 0x4d93a990
+    SUBCLASS_OF_ID = 0xe157d836
+    __slots__ = ('url', 'title', 'message', 'button_text', 'recommended', 'can_report', 'random_id', 'entities', 'photo', 'media', 'color', 'sponsor_info', 'additional_info')
+
+    def __init__(self, url: str, title: str, message: str, button_text: str, recommended: Optional[bool]=None, can_report: Optional[bool]=None, random_id: bytes=None, entities: Optional[List['TypeMessageEntity']]=None, photo: Optional['TypePhoto']=None, media: Optional['TypeMessageMedia']=None, color: Optional['TypePeerColor']=None, sponsor_info: Optional[str]=None, additional_info: Optional[str]=None):
+        """
+        Constructor for SponsoredMessage: Instance of SponsoredMessage.
+        """
+        self.url = url
+        self.title = title
+        self.message = message
+        self.button_text = button_text
+        self.recommended = recommended
+        self.can_report = can_report
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(4), 'big', signed=True)
+        self.entities = entities
+        self.photo = photo
+        self.media = media
+        self.color = color
+        self.sponsor_info = sponsor_info
+        self.additional_info = additional_info
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredMessage',
+            'url': self.url,
+            'title': self.title,
+            'message': self.message,
+            'button_text': self.button_text,
+            'recommended': self.recommended,
+            'can_report': self.can_report,
+            'random_id': self.random_id,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'color': self.color.to_dict() if isinstance(self.color, TLObject) else self.color,
+            'sponsor_info': self.sponsor_info,
+            'additional_info': self.additional_info
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x90\xa9\x93M',
+            struct.pack('<I', (0 if self.recommended is None or self.recommended is False else 32) | (0 if self.can_report is None or self.can_report is False else 4096) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.photo is None or self.photo is False else 64) | (0 if self.media is None or self.media is False else 16384) | (0 if self.color is None or self.color is False else 8192) | (0 if self.sponsor_info is None or self.sponsor_info is False else 128) | (0 if self.additional_info is None or self.additional_info is False else 256)),
+            self.serialize_bytes(self.random_id),
+            self.serialize_bytes(self.url),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.message),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.media is None or self.media is False else (self.media._bytes()),
+            b'' if self.color is None or self.color is False else (self.color._bytes()),
+            self.serialize_bytes(self.button_text),
+            b'' if self.sponsor_info is None or self.sponsor_info is False else (self.serialize_bytes(self.sponsor_info)),
+            b'' if self.additional_info is None or self.additional_info is False else (self.serialize_bytes(self.additional_info)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _recommended = bool(flags & 32)
+        _can_report = bool(flags & 4096)
+        _random_id = reader.tgread_bytes()
+        _url = reader.tgread_string()
+        _title = reader.tgread_string()
+        _message = reader.tgread_string()
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 64:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 16384:
+            _media = reader.tgread_object()
+        else:
+            _media = None
+        if flags & 8192:
+            _color = reader.tgread_object()
+        else:
+            _color = None
+        _button_text = reader.tgread_string()
+        if flags & 128:
+            _sponsor_info = reader.tgread_string()
+        else:
+            _sponsor_info = None
+        if flags & 256:
+            _additional_info = reader.tgread_string()
+        else:
+            _additional_info = None
+        return cls(url=_url, title=_title, message=_message, button_text=_button_text, recommended=_recommended, can_report=_can_report, random_id=_random_id, entities=_entities, photo=_photo, media=_media, color=_color, sponsor_info=_sponsor_info, additional_info=_additional_info)
+
+TypeSponsoredMessage = SponsoredMessage
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class SponsoredMessageReportOption(TLObject):
+    CONSTRUCTOR_ID = 0x430d3150
+    SUBCLASS_OF_ID = 0xdd32a718
+    __slots__ = ('text', 'option')
+
+    def __init__(self, text: str, option: bytes):
+        """
+        Constructor for SponsoredMessageReportOption: Instance of SponsoredMessageReportOption.
+        """
+        self.text = text
+        self.option = option
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredMessageReportOption',
+            'text': self.text,
+            'option': self.option
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'P1\rC',
+            self.serialize_bytes(self.text),
+            self.serialize_bytes(self.option),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        _option = reader.tgread_bytes()
+        return cls(text=_text, option=_option)
+
+TypeSponsoredMessageReportOption = SponsoredMessageReportOption
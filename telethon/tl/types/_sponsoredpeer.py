@@ -0,0 +1,61 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class SponsoredPeer(TLObject):
+    CONSTRUCTOR_ID = 0xc69708d3
+    SUBCLASS_OF_ID = 0x3f75800e
+    __slots__ = ('peer', 'random_id', 'sponsor_info', 'additional_info')
+
+    def __init__(self, peer: 'TypePeer', random_id: bytes=None, sponsor_info: Optional[str]=None, additional_info: Optional[str]=None):
+        """
+        Constructor for SponsoredPeer: Instance of SponsoredPeer.
+        """
+        self.peer = peer
+        self.random_id = random_id if random_id is not None else int.from_bytes(os.urandom(4), 'big', signed=True)
+        self.sponsor_info = sponsor_info
+        self.additional_info = additional_info
+
+    def to_dict(self):
+        return {
+            '_': 'SponsoredPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'random_id': self.random_id,
+            'sponsor_info': self.sponsor_info,
+            'additional_info': self.additional_info
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3\x08\x97\xc6',
+            struct.pack('<I', (0 if self.sponsor_info is None or self.sponsor_info is False else 1) | (0 if self.additional_info is None or self.additional_info is False else 2)),
+            self.serialize_bytes(self.random_id),
+            self.peer._bytes(),
+            b'' if self.sponsor_info is None or self.sponsor_info is False else (self.serialize_bytes(self.sponsor_info)),
+            b'' if self.additional_info is None or self.additional_info is False else (self.serialize_bytes(self.additional_info)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _random_id = reader.tgread_bytes()
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _sponsor_info = reader.tgread_string()
+        else:
+            _sponsor_info = None
+        if flags & 2:
+            _additional_info = reader.tgread_string()
+        else:
+            _additional_info = None
+        return cls(peer=_peer, random_id=_random_id, sponsor_info=_sponsor_info, additional_info=_additional_info)
+
+TypeSponsoredPeer = SponsoredPeer
@@ -0,0 +1,188 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_ii = struct.Struct('<ii')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypePeer, TypeStarGiftAttribute
+
+
+
+class StarGift(TLObject):
+    CONSTRUCTOR_ID = 0x2cc73c8
+    SUBCLASS_OF_ID = 0xc31c590b
+    __slots__ = ('id', 'sticker', 'stars', 'convert_stars', 'limited', 'sold_out', 'birthday', 'availability_remains', 'availability_total', 'first_sale_date', 'last_sale_date', 'upgrade_stars')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, sticker: 'TypeDocument', stars: int, convert_stars: int, limited: Optional[bool]=None, sold_out: Optional[bool]=None, birthday: Optional[bool]=None, availability_remains: Optional[int]=None, availability_total: Optional[int]=None, first_sale_date: Optional[datetime]=None, last_sale_date: Optional[datetime]=None, upgrade_stars: Optional[int]=None):
+        """
+        Constructor for StarGift: Instance of either StarGift, StarGiftUnique.
+        """
+        self.id = id
+        self.sticker = sticker
+        self.stars = stars
+        self.convert_stars = convert_stars
+        self.limited = limited
+        self.sold_out = sold_out
+        self.birthday = birthday
+        self.availability_remains = availability_remains
+        self.availability_total = availability_total
+        self.first_sale_date = first_sale_date
+        self.last_sale_date = last_sale_date
+        self.upgrade_stars = upgrade_stars
+
+    def to_dict(self):
+        return {
+            '_': 'StarGift',
+            'id': self.id,
+            'sticker': self.sticker.to_dict() if isinstance(self.sticker, TLObject) else self.sticker,
+            'stars': self.stars,
+            'convert_stars': self.convert_stars,
+            'limited': self.limited,
+            'sold_out': self.sold_out,
+            'birthday': self.birthday,
+            'availability_remains': self.availability_remains,
+            'availability_total': self.availability_total,
+            'first_sale_date': self.first_sale_date,
+            'last_sale_date': self.last_sale_date,
+            'upgrade_stars': self.upgrade_stars
+        }
+
+    def _bytes(self):
+        assert ((self.limited or self.limited is not None) and (self.availability_remains or self.availability_remains is not None) and (self.availability_total or self.availability_total is not None)) or ((self.limited is None or self.limited is False) and (self.availability_remains is None or self.availability_remains is False) and (self.availability_total is None or self.availability_total is False)), 'limited, availability_remains, availability_total parameters must all be False-y (like None) or all me True-y'
+        assert ((self.sold_out or self.sold_out is not None) and (self.first_sale_date or self.first_sale_date is not None) and (self.last_sale_date or self.last_sale_date is not None)) or ((self.sold_out is None or self.sold_out is False) and (self.first_sale_date is None or self.first_sale_date is False) and (self.last_sale_date is None or self.last_sale_date is False)), 'sold_out, first_sale_date, last_sale_date parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xc8s\xcc\x02',
+            _struct_Iq.pack((0 if self.limited is None or self.limited is False else 1) | (0 if self.sold_out is None or self.sold_out is False else 2) | (0 if self.birthday is None or self.birthday is False else 4) | (0 if self.availability_remains is None or self.availability_remains is False else 1) | (0 if self.availability_total is None or self.availability_total is False else 1) | (0 if self.first_sale_date is None or self.first_sale_date is False else 2) | (0 if self.last_sale_date is None or self.last_sale_date is False else 2) | (0 if self.upgrade_stars is None or self.upgrade_stars is False else 8), self.id),
+            self.sticker._bytes(),
+            struct.pack('<q', self.stars),
+            b'' if self.availability_remains is None or self.availability_remains is False else (struct.pack('<i', self.availability_remains)),
+            b'' if self.availability_total is None or self.availability_total is False else (struct.pack('<i', self.availability_total)),
+            struct.pack('<q', self.convert_stars),
+            b'' if self.first_sale_date is None or self.first_sale_date is False else (self.serialize_datetime(self.first_sale_date)),
+            b'' if self.last_sale_date is None or self.last_sale_date is False else (self.serialize_datetime(self.last_sale_date)),
+            b'' if self.upgrade_stars is None or self.upgrade_stars is False else (struct.pack('<q', self.upgrade_stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _limited = bool(flags & 1)
+        _sold_out = bool(flags & 2)
+        _birthday = bool(flags & 4)
+        _sticker = reader.tgread_object()
+        _stars = reader.read_long()
+        if flags & 1:
+            _availability_remains = reader.read_int()
+        else:
+            _availability_remains = None
+        if flags & 1:
+            _availability_total = reader.read_int()
+        else:
+            _availability_total = None
+        _convert_stars = reader.read_long()
+        if flags & 2:
+            _first_sale_date = reader.tgread_date()
+        else:
+            _first_sale_date = None
+        if flags & 2:
+            _last_sale_date = reader.tgread_date()
+        else:
+            _last_sale_date = None
+        if flags & 8:
+            _upgrade_stars = reader.read_long()
+        else:
+            _upgrade_stars = None
+        return cls(id=_id, sticker=_sticker, stars=_stars, convert_stars=_convert_stars, limited=_limited, sold_out=_sold_out, birthday=_birthday, availability_remains=_availability_remains, availability_total=_availability_total, first_sale_date=_first_sale_date, last_sale_date=_last_sale_date, upgrade_stars=_upgrade_stars)
+
+
+class StarGiftUnique(TLObject):
+    CONSTRUCTOR_ID = 0x5c62d151
+    SUBCLASS_OF_ID = 0xc31c590b
+    __slots__ = ('id', 'title', 'slug', 'num', 'attributes', 'availability_issued', 'availability_total', 'owner_id', 'owner_name', 'owner_address', 'gift_address')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, title: str, slug: str, num: int, attributes: List['TypeStarGiftAttribute'], availability_issued: int, availability_total: int, owner_id: Optional['TypePeer']=None, owner_name: Optional[str]=None, owner_address: Optional[str]=None, gift_address: Optional[str]=None):
+        """
+        Constructor for StarGift: Instance of either StarGift, StarGiftUnique.
+        """
+        self.id = id
+        self.title = title
+        self.slug = slug
+        self.num = num
+        self.attributes = attributes
+        self.availability_issued = availability_issued
+        self.availability_total = availability_total
+        self.owner_id = owner_id
+        self.owner_name = owner_name
+        self.owner_address = owner_address
+        self.gift_address = gift_address
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftUnique',
+            'id': self.id,
+            'title': self.title,
+            'slug': self.slug,
+            'num': self.num,
+            'attributes': [] if self.attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.attributes],
+            'availability_issued': self.availability_issued,
+            'availability_total': self.availability_total,
+            'owner_id': self.owner_id.to_dict() if isinstance(self.owner_id, TLObject) else self.owner_id,
+            'owner_name': self.owner_name,
+            'owner_address': self.owner_address,
+            'gift_address': self.gift_address
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Q\xd1b\\',
+            _struct_Iq.pack((0 if self.owner_id is None or self.owner_id is False else 1) | (0 if self.owner_name is None or self.owner_name is False else 2) | (0 if self.owner_address is None or self.owner_address is False else 4) | (0 if self.gift_address is None or self.gift_address is False else 8), self.id),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.slug),
+            struct.pack('<i', self.num),
+            b'' if self.owner_id is None or self.owner_id is False else (self.owner_id._bytes()),
+            b'' if self.owner_name is None or self.owner_name is False else (self.serialize_bytes(self.owner_name)),
+            b'' if self.owner_address is None or self.owner_address is False else (self.serialize_bytes(self.owner_address)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.attributes)),b''.join(x._bytes() for x in self.attributes),
+            _struct_ii.pack(self.availability_issued, self.availability_total),
+            b'' if self.gift_address is None or self.gift_address is False else (self.serialize_bytes(self.gift_address)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _title = reader.tgread_string()
+        _slug = reader.tgread_string()
+        _num = reader.read_int()
+        if flags & 1:
+            _owner_id = reader.tgread_object()
+        else:
+            _owner_id = None
+        if flags & 2:
+            _owner_name = reader.tgread_string()
+        else:
+            _owner_name = None
+        if flags & 4:
+            _owner_address = reader.tgread_string()
+        else:
+            _owner_address = None
+        reader.read_int()
+        _attributes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _attributes.append(_x)
+
+        _availability_issued, _availability_total = reader.read_struct(_struct_ii)
+        if flags & 8:
+            _gift_address = reader.tgread_string()
+        else:
+            _gift_address = None
+        return cls(id=_id, title=_title, slug=_slug, num=_num, attributes=_attributes, availability_issued=_availability_issued, availability_total=_availability_total, owner_id=_owner_id, owner_name=_owner_name, owner_address=_owner_address, gift_address=_gift_address)
+
+TypeStarGift = Union[StarGift,StarGiftUnique]
@@ -0,0 +1,178 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iiiii = struct.Struct('<iiiii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypePeer, TypeTextWithEntities
+
+
+
+class StarGiftAttributeBackdrop(TLObject):
+    CONSTRUCTOR_ID = 0x94271762
+    SUBCLASS_OF_ID = 0x87b581c8
+    __slots__ = ('name', 'center_color', 'edge_color', 'pattern_color', 'text_color', 'rarity_permille')
+
+    def __init__(self, name: str, center_color: int, edge_color: int, pattern_color: int, text_color: int, rarity_permille: int):
+        """
+        Constructor for StarGiftAttribute: Instance of either StarGiftAttributeModel, StarGiftAttributePattern, StarGiftAttributeBackdrop, StarGiftAttributeOriginalDetails.
+        """
+        self.name = name
+        self.center_color = center_color
+        self.edge_color = edge_color
+        self.pattern_color = pattern_color
+        self.text_color = text_color
+        self.rarity_permille = rarity_permille
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftAttributeBackdrop',
+            'name': self.name,
+            'center_color': self.center_color,
+            'edge_color': self.edge_color,
+            'pattern_color': self.pattern_color,
+            'text_color': self.text_color,
+            'rarity_permille': self.rarity_permille
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"b\x17'\x94",
+            self.serialize_bytes(self.name),
+            _struct_iiiii.pack(self.center_color, self.edge_color, self.pattern_color, self.text_color, self.rarity_permille),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _name = reader.tgread_string()
+        _center_color, _edge_color, _pattern_color, _text_color, _rarity_permille = reader.read_struct(_struct_iiiii)
+        return cls(name=_name, center_color=_center_color, edge_color=_edge_color, pattern_color=_pattern_color, text_color=_text_color, rarity_permille=_rarity_permille)
+
+
+class StarGiftAttributeModel(TLObject):
+    CONSTRUCTOR_ID = 0x39d99013
+    SUBCLASS_OF_ID = 0x87b581c8
+    __slots__ = ('name', 'document', 'rarity_permille')
+
+    def __init__(self, name: str, document: 'TypeDocument', rarity_permille: int):
+        """
+        Constructor for StarGiftAttribute: Instance of either StarGiftAttributeModel, StarGiftAttributePattern, StarGiftAttributeBackdrop, StarGiftAttributeOriginalDetails.
+        """
+        self.name = name
+        self.document = document
+        self.rarity_permille = rarity_permille
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftAttributeModel',
+            'name': self.name,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'rarity_permille': self.rarity_permille
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x13\x90\xd99',
+            self.serialize_bytes(self.name),
+            self.document._bytes(),
+            struct.pack('<i', self.rarity_permille),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _name = reader.tgread_string()
+        _document = reader.tgread_object()
+        _rarity_permille = reader.read_int()
+        return cls(name=_name, document=_document, rarity_permille=_rarity_permille)
+
+
+class StarGiftAttributeOriginalDetails(TLObject):
+    CONSTRUCTOR_ID = 0xe0bff26c
+    SUBCLASS_OF_ID = 0x87b581c8
+    __slots__ = ('recipient_id', 'date', 'sender_id', 'message')
+
+    def __init__(self, recipient_id: 'TypePeer', date: Optional[datetime], sender_id: Optional['TypePeer']=None, message: Optional['TypeTextWithEntities']=None):
+        """
+        Constructor for StarGiftAttribute: Instance of either StarGiftAttributeModel, StarGiftAttributePattern, StarGiftAttributeBackdrop, StarGiftAttributeOriginalDetails.
+        """
+        self.recipient_id = recipient_id
+        self.date = date
+        self.sender_id = sender_id
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftAttributeOriginalDetails',
+            'recipient_id': self.recipient_id.to_dict() if isinstance(self.recipient_id, TLObject) else self.recipient_id,
+            'date': self.date,
+            'sender_id': self.sender_id.to_dict() if isinstance(self.sender_id, TLObject) else self.sender_id,
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'l\xf2\xbf\xe0',
+            struct.pack('<I', (0 if self.sender_id is None or self.sender_id is False else 1) | (0 if self.message is None or self.message is False else 2)),
+            b'' if self.sender_id is None or self.sender_id is False else (self.sender_id._bytes()),
+            self.recipient_id._bytes(),
+            self.serialize_datetime(self.date),
+            b'' if self.message is None or self.message is False else (self.message._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _sender_id = reader.tgread_object()
+        else:
+            _sender_id = None
+        _recipient_id = reader.tgread_object()
+        _date = reader.tgread_date()
+        if flags & 2:
+            _message = reader.tgread_object()
+        else:
+            _message = None
+        return cls(recipient_id=_recipient_id, date=_date, sender_id=_sender_id, message=_message)
+
+
+class StarGiftAttributePattern(TLObject):
+    CONSTRUCTOR_ID = 0x13acff19
+    SUBCLASS_OF_ID = 0x87b581c8
+    __slots__ = ('name', 'document', 'rarity_permille')
+
+    def __init__(self, name: str, document: 'TypeDocument', rarity_permille: int):
+        """
+        Constructor for StarGiftAttribute: Instance of either StarGiftAttributeModel, StarGiftAttributePattern, StarGiftAttributeBackdrop, StarGiftAttributeOriginalDetails.
+        """
+        self.name = name
+        self.document = document
+        self.rarity_permille = rarity_permille
+
+    def to_dict(self):
+        return {
+            '_': 'StarGiftAttributePattern',
+            'name': self.name,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'rarity_permille': self.rarity_permille
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x19\xff\xac\x13',
+            self.serialize_bytes(self.name),
+            self.document._bytes(),
+            struct.pack('<i', self.rarity_permille),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _name = reader.tgread_string()
+        _document = reader.tgread_object()
+        _rarity_permille = reader.read_int()
+        return cls(name=_name, document=_document, rarity_permille=_rarity_permille)
+
+TypeStarGiftAttribute = Union[StarGiftAttributeModel,StarGiftAttributePattern,StarGiftAttributeBackdrop,StarGiftAttributeOriginalDetails]
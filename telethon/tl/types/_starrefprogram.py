@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqi = struct.Struct('<Iqi')
+_struct_iqi = struct.Struct('<iqi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarsAmount
+
+
+
+class StarRefProgram(TLObject):
+    CONSTRUCTOR_ID = 0xdd0c66f2
+    SUBCLASS_OF_ID = 0x9888e002
+    __slots__ = ('bot_id', 'commission_permille', 'duration_months', 'end_date', 'daily_revenue_per_user')
+
+    def __init__(self, bot_id: int, commission_permille: int, duration_months: Optional[int]=None, end_date: Optional[datetime]=None, daily_revenue_per_user: Optional['TypeStarsAmount']=None):
+        """
+        Constructor for StarRefProgram: Instance of StarRefProgram.
+        """
+        self.bot_id = bot_id
+        self.commission_permille = commission_permille
+        self.duration_months = duration_months
+        self.end_date = end_date
+        self.daily_revenue_per_user = daily_revenue_per_user
+
+    def to_dict(self):
+        return {
+            '_': 'StarRefProgram',
+            'bot_id': self.bot_id,
+            'commission_permille': self.commission_permille,
+            'duration_months': self.duration_months,
+            'end_date': self.end_date,
+            'daily_revenue_per_user': self.daily_revenue_per_user.to_dict() if isinstance(self.daily_revenue_per_user, TLObject) else self.daily_revenue_per_user
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf2f\x0c\xdd',
+            _struct_Iqi.pack((0 if self.duration_months is None or self.duration_months is False else 1) | (0 if self.end_date is None or self.end_date is False else 2) | (0 if self.daily_revenue_per_user is None or self.daily_revenue_per_user is False else 4), self.bot_id, self.commission_permille),
+            b'' if self.duration_months is None or self.duration_months is False else (struct.pack('<i', self.duration_months)),
+            b'' if self.end_date is None or self.end_date is False else (self.serialize_datetime(self.end_date)),
+            b'' if self.daily_revenue_per_user is None or self.daily_revenue_per_user is False else (self.daily_revenue_per_user._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _bot_id, _commission_permille = reader.read_struct(_struct_iqi)
+        if flags & 1:
+            _duration_months = reader.read_int()
+        else:
+            _duration_months = None
+        if flags & 2:
+            _end_date = reader.tgread_date()
+        else:
+            _end_date = None
+        if flags & 4:
+            _daily_revenue_per_user = reader.tgread_object()
+        else:
+            _daily_revenue_per_user = None
+        return cls(bot_id=_bot_id, commission_permille=_commission_permille, duration_months=_duration_months, end_date=_end_date, daily_revenue_per_user=_daily_revenue_per_user)
+
+TypeStarRefProgram = StarRefProgram
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+
+
+class StarsAmount(TLObject):
+    CONSTRUCTOR_ID = 0xbbb6b4a3
+    SUBCLASS_OF_ID = 0x355b3240
+    __slots__ = ('amount', 'nanos')
+
+    def __init__(self, amount: int, nanos: int):
+        """
+        Constructor for StarsAmount: Instance of StarsAmount.
+        """
+        self.amount = amount
+        self.nanos = nanos
+
+    def to_dict(self):
+        return {
+            '_': 'StarsAmount',
+            'amount': self.amount,
+            'nanos': self.nanos
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa3\xb4\xb6\xbb',
+            _struct_qi.pack(self.amount, self.nanos),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _amount, _nanos = reader.read_struct(_struct_qi)
+        return cls(amount=_amount, nanos=_nanos)
+
+TypeStarsAmount = StarsAmount
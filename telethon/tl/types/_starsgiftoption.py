@@ -0,0 +1,58 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+
+
+class StarsGiftOption(TLObject):
+    CONSTRUCTOR_ID = 0x5e0589f1
+    SUBCLASS_OF_ID = 0xa9cd4bb7
+    __slots__ = ('stars', 'currency', 'amount', 'extended', 'store_product')
+
+    def __init__(self, stars: int, currency: str, amount: int, extended: Optional[bool]=None, store_product: Optional[str]=None):
+        """
+        Constructor for StarsGiftOption: Instance of StarsGiftOption.
+        """
+        self.stars = stars
+        self.currency = currency
+        self.amount = amount
+        self.extended = extended
+        self.store_product = store_product
+
+    def to_dict(self):
+        return {
+            '_': 'StarsGiftOption',
+            'stars': self.stars,
+            'currency': self.currency,
+            'amount': self.amount,
+            'extended': self.extended,
+            'store_product': self.store_product
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf1\x89\x05^',
+            _struct_Iq.pack((0 if self.extended is None or self.extended is False else 2) | (0 if self.store_product is None or self.store_product is False else 1), self.stars),
+            b'' if self.store_product is None or self.store_product is False else (self.serialize_bytes(self.store_product)),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _stars = reader.read_struct(_struct_iq)
+        _extended = bool(flags & 2)
+        if flags & 1:
+            _store_product = reader.tgread_string()
+        else:
+            _store_product = None
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        return cls(stars=_stars, currency=_currency, amount=_amount, extended=_extended, store_product=_store_product)
+
+TypeStarsGiftOption = StarsGiftOption
@@ -0,0 +1,75 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqi = struct.Struct('<Iqi')
+_struct_iqi = struct.Struct('<iqi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarsGiveawayWinnersOption
+
+
+
+class StarsGiveawayOption(TLObject):
+    CONSTRUCTOR_ID = 0x94ce852a
+    SUBCLASS_OF_ID = 0x3a28a20b
+    __slots__ = ('stars', 'yearly_boosts', 'currency', 'amount', 'winners', 'extended', 'default', 'store_product')
+
+    def __init__(self, stars: int, yearly_boosts: int, currency: str, amount: int, winners: List['TypeStarsGiveawayWinnersOption'], extended: Optional[bool]=None, default: Optional[bool]=None, store_product: Optional[str]=None):
+        """
+        Constructor for StarsGiveawayOption: Instance of StarsGiveawayOption.
+        """
+        self.stars = stars
+        self.yearly_boosts = yearly_boosts
+        self.currency = currency
+        self.amount = amount
+        self.winners = winners
+        self.extended = extended
+        self.default = default
+        self.store_product = store_product
+
+    def to_dict(self):
+        return {
+            '_': 'StarsGiveawayOption',
+            'stars': self.stars,
+            'yearly_boosts': self.yearly_boosts,
+            'currency': self.currency,
+            'amount': self.amount,
+            'winners': [] if self.winners is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.winners],
+            'extended': self.extended,
+            'default': self.default,
+            'store_product': self.store_product
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'*\x85\xce\x94',
+            _struct_Iqi.pack((0 if self.extended is None or self.extended is False else 1) | (0 if self.default is None or self.default is False else 2) | (0 if self.store_product is None or self.store_product is False else 4), self.stars, self.yearly_boosts),
+            b'' if self.store_product is None or self.store_product is False else (self.serialize_bytes(self.store_product)),
+            self.serialize_bytes(self.currency),
+            struct.pack('<q', self.amount),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.winners)),b''.join(x._bytes() for x in self.winners),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _stars, _yearly_boosts = reader.read_struct(_struct_iqi)
+        _extended = bool(flags & 1)
+        _default = bool(flags & 2)
+        if flags & 4:
+            _store_product = reader.tgread_string()
+        else:
+            _store_product = None
+        _currency = reader.tgread_string()
+        _amount = reader.read_long()
+        reader.read_int()
+        _winners = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _winners.append(_x)
+
+        return cls(stars=_stars, yearly_boosts=_yearly_boosts, currency=_currency, amount=_amount, winners=_winners, extended=_extended, default=_default, store_product=_store_product)
+
+TypeStarsGiveawayOption = StarsGiveawayOption
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iiq = struct.Struct('<Iiq')
+_struct_iiq = struct.Struct('<iiq')
+
+
+class StarsGiveawayWinnersOption(TLObject):
+    CONSTRUCTOR_ID = 0x54236209
+    SUBCLASS_OF_ID = 0xfbfaa2e4
+    __slots__ = ('users', 'per_user_stars', 'default')
+
+    def __init__(self, users: int, per_user_stars: int, default: Optional[bool]=None):
+        """
+        Constructor for StarsGiveawayWinnersOption: Instance of StarsGiveawayWinnersOption.
+        """
+        self.users = users
+        self.per_user_stars = per_user_stars
+        self.default = default
+
+    def to_dict(self):
+        return {
+            '_': 'StarsGiveawayWinnersOption',
+            'users': self.users,
+            'per_user_stars': self.per_user_stars,
+            'default': self.default
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\tb#T',
+            _struct_Iiq.pack((0 if self.default is None or self.default is False else 1), self.users, self.per_user_stars),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _users, _per_user_stars = reader.read_struct(_struct_iiq)
+        _default = bool(flags & 1)
+        return cls(users=_users, per_user_stars=_per_user_stars, default=_default)
+
+TypeStarsGiveawayWinnersOption = StarsGiveawayWinnersOption
@@ -0,0 +1,61 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStarsAmount
+
+
+
+class StarsRevenueStatus(TLObject):
+    CONSTRUCTOR_ID = 0xfebe5491
+    SUBCLASS_OF_ID = 0x3d7d9ff1
+    __slots__ = ('current_balance', 'available_balance', 'overall_revenue', 'withdrawal_enabled', 'next_withdrawal_at')
+
+    def __init__(self, current_balance: 'TypeStarsAmount', available_balance: 'TypeStarsAmount', overall_revenue: 'TypeStarsAmount', withdrawal_enabled: Optional[bool]=None, next_withdrawal_at: Optional[int]=None):
+        """
+        Constructor for StarsRevenueStatus: Instance of StarsRevenueStatus.
+        """
+        self.current_balance = current_balance
+        self.available_balance = available_balance
+        self.overall_revenue = overall_revenue
+        self.withdrawal_enabled = withdrawal_enabled
+        self.next_withdrawal_at = next_withdrawal_at
+
+    def to_dict(self):
+        return {
+            '_': 'StarsRevenueStatus',
+            'current_balance': self.current_balance.to_dict() if isinstance(self.current_balance, TLObject) else self.current_balance,
+            'available_balance': self.available_balance.to_dict() if isinstance(self.available_balance, TLObject) else self.available_balance,
+            'overall_revenue': self.overall_revenue.to_dict() if isinstance(self.overall_revenue, TLObject) else self.overall_revenue,
+            'withdrawal_enabled': self.withdrawal_enabled,
+            'next_withdrawal_at': self.next_withdrawal_at
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x91T\xbe\xfe',
+            struct.pack('<I', (0 if self.withdrawal_enabled is None or self.withdrawal_enabled is False else 1) | (0 if self.next_withdrawal_at is None or self.next_withdrawal_at is False else 2)),
+            self.current_balance._bytes(),
+            self.available_balance._bytes(),
+            self.overall_revenue._bytes(),
+            b'' if self.next_withdrawal_at is None or self.next_withdrawal_at is False else (struct.pack('<i', self.next_withdrawal_at)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _withdrawal_enabled = bool(flags & 1)
+        _current_balance = reader.tgread_object()
+        _available_balance = reader.tgread_object()
+        _overall_revenue = reader.tgread_object()
+        if flags & 2:
+            _next_withdrawal_at = reader.read_int()
+        else:
+            _next_withdrawal_at = None
+        return cls(current_balance=_current_balance, available_balance=_available_balance, overall_revenue=_overall_revenue, withdrawal_enabled=_withdrawal_enabled, next_withdrawal_at=_next_withdrawal_at)
+
+TypeStarsRevenueStatus = StarsRevenueStatus
@@ -0,0 +1,96 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer, TypeStarsSubscriptionPricing, TypeWebDocument
+
+
+
+class StarsSubscription(TLObject):
+    CONSTRUCTOR_ID = 0x2e6eab1a
+    SUBCLASS_OF_ID = 0xeced29c3
+    __slots__ = ('id', 'peer', 'until_date', 'pricing', 'canceled', 'can_refulfill', 'missing_balance', 'bot_canceled', 'chat_invite_hash', 'title', 'photo', 'invoice_slug')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, peer: 'TypePeer', until_date: Optional[datetime], pricing: 'TypeStarsSubscriptionPricing', canceled: Optional[bool]=None, can_refulfill: Optional[bool]=None, missing_balance: Optional[bool]=None, bot_canceled: Optional[bool]=None, chat_invite_hash: Optional[str]=None, title: Optional[str]=None, photo: Optional['TypeWebDocument']=None, invoice_slug: Optional[str]=None):
+        """
+        Constructor for StarsSubscription: Instance of StarsSubscription.
+        """
+        self.id = id
+        self.peer = peer
+        self.until_date = until_date
+        self.pricing = pricing
+        self.canceled = canceled
+        self.can_refulfill = can_refulfill
+        self.missing_balance = missing_balance
+        self.bot_canceled = bot_canceled
+        self.chat_invite_hash = chat_invite_hash
+        self.title = title
+        self.photo = photo
+        self.invoice_slug = invoice_slug
+
+    def to_dict(self):
+        return {
+            '_': 'StarsSubscription',
+            'id': self.id,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'until_date': self.until_date,
+            'pricing': self.pricing.to_dict() if isinstance(self.pricing, TLObject) else self.pricing,
+            'canceled': self.canceled,
+            'can_refulfill': self.can_refulfill,
+            'missing_balance': self.missing_balance,
+            'bot_canceled': self.bot_canceled,
+            'chat_invite_hash': self.chat_invite_hash,
+            'title': self.title,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'invoice_slug': self.invoice_slug
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1a\xabn.',
+            struct.pack('<I', (0 if self.canceled is None or self.canceled is False else 1) | (0 if self.can_refulfill is None or self.can_refulfill is False else 2) | (0 if self.missing_balance is None or self.missing_balance is False else 4) | (0 if self.bot_canceled is None or self.bot_canceled is False else 128) | (0 if self.chat_invite_hash is None or self.chat_invite_hash is False else 8) | (0 if self.title is None or self.title is False else 16) | (0 if self.photo is None or self.photo is False else 32) | (0 if self.invoice_slug is None or self.invoice_slug is False else 64)),
+            self.serialize_bytes(self.id),
+            self.peer._bytes(),
+            self.serialize_datetime(self.until_date),
+            self.pricing._bytes(),
+            b'' if self.chat_invite_hash is None or self.chat_invite_hash is False else (self.serialize_bytes(self.chat_invite_hash)),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.invoice_slug is None or self.invoice_slug is False else (self.serialize_bytes(self.invoice_slug)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _canceled = bool(flags & 1)
+        _can_refulfill = bool(flags & 2)
+        _missing_balance = bool(flags & 4)
+        _bot_canceled = bool(flags & 128)
+        _id = reader.tgread_string()
+        _peer = reader.tgread_object()
+        _until_date = reader.tgread_date()
+        _pricing = reader.tgread_object()
+        if flags & 8:
+            _chat_invite_hash = reader.tgread_string()
+        else:
+            _chat_invite_hash = None
+        if flags & 16:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 32:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 64:
+            _invoice_slug = reader.tgread_string()
+        else:
+            _invoice_slug = None
+        return cls(id=_id, peer=_peer, until_date=_until_date, pricing=_pricing, canceled=_canceled, can_refulfill=_can_refulfill, missing_balance=_missing_balance, bot_canceled=_bot_canceled, chat_invite_hash=_chat_invite_hash, title=_title, photo=_photo, invoice_slug=_invoice_slug)
+
+TypeStarsSubscription = StarsSubscription
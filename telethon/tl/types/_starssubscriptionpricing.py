@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iq = struct.Struct('<iq')
+
+
+class StarsSubscriptionPricing(TLObject):
+    CONSTRUCTOR_ID = 0x5416d58
+    SUBCLASS_OF_ID = 0xbbf7b9a9
+    __slots__ = ('period', 'amount')
+
+    def __init__(self, period: int, amount: int):
+        """
+        Constructor for StarsSubscriptionPricing: Instance of StarsSubscriptionPricing.
+        """
+        self.period = period
+        self.amount = amount
+
+    def to_dict(self):
+        return {
+            '_': 'StarsSubscriptionPricing',
+            'period': self.period,
+            'amount': self.amount
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'XmA\x05',
+            _struct_iq.pack(self.period, self.amount),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _period, _amount = reader.read_struct(_struct_iq)
+        return cls(period=_period, amount=_amount)
+
+TypeStarsSubscriptionPricing = StarsSubscriptionPricing
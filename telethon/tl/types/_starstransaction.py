@@ -0,0 +1,200 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageMedia, TypePeer, TypeStarGift, TypeStarsAmount, TypeStarsTransactionPeer, TypeWebDocument
+
+
+
+class StarsTransaction(TLObject):
+    CONSTRUCTOR_ID = 0xa39fd94a
+    SUBCLASS_OF_ID = 0x86884772
+    __slots__ = ('id', 'stars', 'date', 'peer', 'refund', 'pending', 'failed', 'gift', 'reaction', 'stargift_upgrade', 'title', 'description', 'photo', 'transaction_date', 'transaction_url', 'bot_payload', 'msg_id', 'extended_media', 'subscription_period', 'giveaway_post_id', 'stargift', 'floodskip_number', 'starref_commission_permille', 'starref_peer', 'starref_amount', 'paid_messages', 'premium_gift_months')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, stars: 'TypeStarsAmount', date: Optional[datetime], peer: 'TypeStarsTransactionPeer', refund: Optional[bool]=None, pending: Optional[bool]=None, failed: Optional[bool]=None, gift: Optional[bool]=None, reaction: Optional[bool]=None, stargift_upgrade: Optional[bool]=None, title: Optional[str]=None, description: Optional[str]=None, photo: Optional['TypeWebDocument']=None, transaction_date: Optional[datetime]=None, transaction_url: Optional[str]=None, bot_payload: Optional[bytes]=None, msg_id: Optional[int]=None, extended_media: Optional[List['TypeMessageMedia']]=None, subscription_period: Optional[int]=None, giveaway_post_id: Optional[int]=None, stargift: Optional['TypeStarGift']=None, floodskip_number: Optional[int]=None, starref_commission_permille: Optional[int]=None, starref_peer: Optional['TypePeer']=None, starref_amount: Optional['TypeStarsAmount']=None, paid_messages: Optional[int]=None, premium_gift_months: Optional[int]=None):
+        """
+        Constructor for StarsTransaction: Instance of StarsTransaction.
+        """
+        self.id = id
+        self.stars = stars
+        self.date = date
+        self.peer = peer
+        self.refund = refund
+        self.pending = pending
+        self.failed = failed
+        self.gift = gift
+        self.reaction = reaction
+        self.stargift_upgrade = stargift_upgrade
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.transaction_date = transaction_date
+        self.transaction_url = transaction_url
+        self.bot_payload = bot_payload
+        self.msg_id = msg_id
+        self.extended_media = extended_media
+        self.subscription_period = subscription_period
+        self.giveaway_post_id = giveaway_post_id
+        self.stargift = stargift
+        self.floodskip_number = floodskip_number
+        self.starref_commission_permille = starref_commission_permille
+        self.starref_peer = starref_peer
+        self.starref_amount = starref_amount
+        self.paid_messages = paid_messages
+        self.premium_gift_months = premium_gift_months
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransaction',
+            'id': self.id,
+            'stars': self.stars.to_dict() if isinstance(self.stars, TLObject) else self.stars,
+            'date': self.date,
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'refund': self.refund,
+            'pending': self.pending,
+            'failed': self.failed,
+            'gift': self.gift,
+            'reaction': self.reaction,
+            'stargift_upgrade': self.stargift_upgrade,
+            'title': self.title,
+            'description': self.description,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'transaction_date': self.transaction_date,
+            'transaction_url': self.transaction_url,
+            'bot_payload': self.bot_payload,
+            'msg_id': self.msg_id,
+            'extended_media': [] if self.extended_media is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.extended_media],
+            'subscription_period': self.subscription_period,
+            'giveaway_post_id': self.giveaway_post_id,
+            'stargift': self.stargift.to_dict() if isinstance(self.stargift, TLObject) else self.stargift,
+            'floodskip_number': self.floodskip_number,
+            'starref_commission_permille': self.starref_commission_permille,
+            'starref_peer': self.starref_peer.to_dict() if isinstance(self.starref_peer, TLObject) else self.starref_peer,
+            'starref_amount': self.starref_amount.to_dict() if isinstance(self.starref_amount, TLObject) else self.starref_amount,
+            'paid_messages': self.paid_messages,
+            'premium_gift_months': self.premium_gift_months
+        }
+
+    def _bytes(self):
+        assert ((self.transaction_date or self.transaction_date is not None) and (self.transaction_url or self.transaction_url is not None)) or ((self.transaction_date is None or self.transaction_date is False) and (self.transaction_url is None or self.transaction_url is False)), 'transaction_date, transaction_url parameters must all be False-y (like None) or all me True-y'
+        assert ((self.starref_peer or self.starref_peer is not None) and (self.starref_amount or self.starref_amount is not None)) or ((self.starref_peer is None or self.starref_peer is False) and (self.starref_amount is None or self.starref_amount is False)), 'starref_peer, starref_amount parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'J\xd9\x9f\xa3',
+            struct.pack('<I', (0 if self.refund is None or self.refund is False else 8) | (0 if self.pending is None or self.pending is False else 16) | (0 if self.failed is None or self.failed is False else 64) | (0 if self.gift is None or self.gift is False else 1024) | (0 if self.reaction is None or self.reaction is False else 2048) | (0 if self.stargift_upgrade is None or self.stargift_upgrade is False else 262144) | (0 if self.title is None or self.title is False else 1) | (0 if self.description is None or self.description is False else 2) | (0 if self.photo is None or self.photo is False else 4) | (0 if self.transaction_date is None or self.transaction_date is False else 32) | (0 if self.transaction_url is None or self.transaction_url is False else 32) | (0 if self.bot_payload is None or self.bot_payload is False else 128) | (0 if self.msg_id is None or self.msg_id is False else 256) | (0 if self.extended_media is None or self.extended_media is False else 512) | (0 if self.subscription_period is None or self.subscription_period is False else 4096) | (0 if self.giveaway_post_id is None or self.giveaway_post_id is False else 8192) | (0 if self.stargift is None or self.stargift is False else 16384) | (0 if self.floodskip_number is None or self.floodskip_number is False else 32768) | (0 if self.starref_commission_permille is None or self.starref_commission_permille is False else 65536) | (0 if self.starref_peer is None or self.starref_peer is False else 131072) | (0 if self.starref_amount is None or self.starref_amount is False else 131072) | (0 if self.paid_messages is None or self.paid_messages is False else 524288) | (0 if self.premium_gift_months is None or self.premium_gift_months is False else 1048576)),
+            self.serialize_bytes(self.id),
+            self.stars._bytes(),
+            self.serialize_datetime(self.date),
+            self.peer._bytes(),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.transaction_date is None or self.transaction_date is False else (self.serialize_datetime(self.transaction_date)),
+            b'' if self.transaction_url is None or self.transaction_url is False else (self.serialize_bytes(self.transaction_url)),
+            b'' if self.bot_payload is None or self.bot_payload is False else (self.serialize_bytes(self.bot_payload)),
+            b'' if self.msg_id is None or self.msg_id is False else (struct.pack('<i', self.msg_id)),
+            b'' if self.extended_media is None or self.extended_media is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.extended_media)),b''.join(x._bytes() for x in self.extended_media))),
+            b'' if self.subscription_period is None or self.subscription_period is False else (struct.pack('<i', self.subscription_period)),
+            b'' if self.giveaway_post_id is None or self.giveaway_post_id is False else (struct.pack('<i', self.giveaway_post_id)),
+            b'' if self.stargift is None or self.stargift is False else (self.stargift._bytes()),
+            b'' if self.floodskip_number is None or self.floodskip_number is False else (struct.pack('<i', self.floodskip_number)),
+            b'' if self.starref_commission_permille is None or self.starref_commission_permille is False else (struct.pack('<i', self.starref_commission_permille)),
+            b'' if self.starref_peer is None or self.starref_peer is False else (self.starref_peer._bytes()),
+            b'' if self.starref_amount is None or self.starref_amount is False else (self.starref_amount._bytes()),
+            b'' if self.paid_messages is None or self.paid_messages is False else (struct.pack('<i', self.paid_messages)),
+            b'' if self.premium_gift_months is None or self.premium_gift_months is False else (struct.pack('<i', self.premium_gift_months)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _refund = bool(flags & 8)
+        _pending = bool(flags & 16)
+        _failed = bool(flags & 64)
+        _gift = bool(flags & 1024)
+        _reaction = bool(flags & 2048)
+        _stargift_upgrade = bool(flags & 262144)
+        _id = reader.tgread_string()
+        _stars = reader.tgread_object()
+        _date = reader.tgread_date()
+        _peer = reader.tgread_object()
+        if flags & 1:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 2:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        if flags & 4:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 32:
+            _transaction_date = reader.tgread_date()
+        else:
+            _transaction_date = None
+        if flags & 32:
+            _transaction_url = reader.tgread_string()
+        else:
+            _transaction_url = None
+        if flags & 128:
+            _bot_payload = reader.tgread_bytes()
+        else:
+            _bot_payload = None
+        if flags & 256:
+            _msg_id = reader.read_int()
+        else:
+            _msg_id = None
+        if flags & 512:
+            reader.read_int()
+            _extended_media = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _extended_media.append(_x)
+
+        else:
+            _extended_media = None
+        if flags & 4096:
+            _subscription_period = reader.read_int()
+        else:
+            _subscription_period = None
+        if flags & 8192:
+            _giveaway_post_id = reader.read_int()
+        else:
+            _giveaway_post_id = None
+        if flags & 16384:
+            _stargift = reader.tgread_object()
+        else:
+            _stargift = None
+        if flags & 32768:
+            _floodskip_number = reader.read_int()
+        else:
+            _floodskip_number = None
+        if flags & 65536:
+            _starref_commission_permille = reader.read_int()
+        else:
+            _starref_commission_permille = None
+        if flags & 131072:
+            _starref_peer = reader.tgread_object()
+        else:
+            _starref_peer = None
+        if flags & 131072:
+            _starref_amount = reader.tgread_object()
+        else:
+            _starref_amount = None
+        if flags & 524288:
+            _paid_messages = reader.read_int()
+        else:
+            _paid_messages = None
+        if flags & 1048576:
+            _premium_gift_months = reader.read_int()
+        else:
+            _premium_gift_months = None
+        return cls(id=_id, stars=_stars, date=_date, peer=_peer, refund=_refund, pending=_pending, failed=_failed, gift=_gift, reaction=_reaction, stargift_upgrade=_stargift_upgrade, title=_title, description=_description, photo=_photo, transaction_date=_transaction_date, transaction_url=_transaction_url, bot_payload=_bot_payload, msg_id=_msg_id, extended_media=_extended_media, subscription_period=_subscription_period, giveaway_post_id=_giveaway_post_id, stargift=_stargift, floodskip_number=_floodskip_number, starref_commission_permille=_starref_commission_permille, starref_peer=_starref_peer, starref_amount=_starref_amount, paid_messages=_paid_messages, premium_gift_months=_premium_gift_months)
+
+TypeStarsTransaction = StarsTransaction
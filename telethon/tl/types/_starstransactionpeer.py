@@ -0,0 +1,180 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class StarsTransactionPeer(TLObject):
+    CONSTRUCTOR_ID = 0xd80da15d
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ('peer',)
+
+    def __init__(self, peer: 'TypePeer'):
+        """
+        Constructor for StarsTransactionPeer: Instance of either StarsTransactionPeerUnsupported, StarsTransactionPeerAppStore, StarsTransactionPeerPlayMarket, StarsTransactionPeerPremiumBot, StarsTransactionPeerFragment, StarsTransactionPeer, StarsTransactionPeerAds, StarsTransactionPeerAPI.
+        """
+        self.peer = peer
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b']\xa1\r\xd8',
+            self.peer._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        return cls(peer=_peer)
+
+
+class StarsTransactionPeerAPI(TLObject):
+    CONSTRUCTOR_ID = 0xf9677aad
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeerAPI'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xadzg\xf9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class StarsTransactionPeerAds(TLObject):
+    CONSTRUCTOR_ID = 0x60682812
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeerAds'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x12(h`',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class StarsTransactionPeerAppStore(TLObject):
+    CONSTRUCTOR_ID = 0xb457b375
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeerAppStore'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'u\xb3W\xb4',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class StarsTransactionPeerFragment(TLObject):
+    CONSTRUCTOR_ID = 0xe92fd902
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeerFragment'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x02\xd9/\xe9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class StarsTransactionPeerPlayMarket(TLObject):
+    CONSTRUCTOR_ID = 0x7b560a0b
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeerPlayMarket'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0b\nV{',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class StarsTransactionPeerPremiumBot(TLObject):
+    CONSTRUCTOR_ID = 0x250dbaf8
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeerPremiumBot'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf8\xba\r%',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class StarsTransactionPeerUnsupported(TLObject):
+    CONSTRUCTOR_ID = 0x95f2bfe4
+    SUBCLASS_OF_ID = 0x41b69183
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'StarsTransactionPeerUnsupported'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe4\xbf\xf2\x95',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeStarsTransactionPeer = Union[StarsTransactionPeerUnsupported,StarsTransactionPeerAppStore,StarsTransactionPeerPlayMarket,StarsTransactionPeerPremiumBot,StarsTransactionPeerFragment,StarsTransactionPeer,StarsTransactionPeerAds,StarsTransactionPeerAPI]
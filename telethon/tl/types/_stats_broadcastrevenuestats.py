@@ -0,0 +1,51 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBroadcastRevenueBalances, TypeStatsGraph
+
+
+
+class BroadcastRevenueStats(TLObject):
+    CONSTRUCTOR_ID = 0x5407e297
+    SUBCLASS_OF_ID = 0x2cee3078
+    __slots__ = ('top_hours_graph', 'revenue_graph', 'balances', 'usd_rate')
+
+    def __init__(self, top_hours_graph: 'TypeStatsGraph', revenue_graph: 'TypeStatsGraph', balances: 'TypeBroadcastRevenueBalances', usd_rate: float):
+        """
+        Constructor for stats.BroadcastRevenueStats: Instance of BroadcastRevenueStats.
+        """
+        self.top_hours_graph = top_hours_graph
+        self.revenue_graph = revenue_graph
+        self.balances = balances
+        self.usd_rate = usd_rate
+
+    def to_dict(self):
+        return {
+            '_': 'BroadcastRevenueStats',
+            'top_hours_graph': self.top_hours_graph.to_dict() if isinstance(self.top_hours_graph, TLObject) else self.top_hours_graph,
+            'revenue_graph': self.revenue_graph.to_dict() if isinstance(self.revenue_graph, TLObject) else self.revenue_graph,
+            'balances': self.balances.to_dict() if isinstance(self.balances, TLObject) else self.balances,
+            'usd_rate': self.usd_rate
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x97\xe2\x07T',
+            self.top_hours_graph._bytes(),
+            self.revenue_graph._bytes(),
+            self.balances._bytes(),
+            struct.pack('<d', self.usd_rate),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _top_hours_graph = reader.tgread_object()
+        _revenue_graph = reader.tgread_object()
+        _balances = reader.tgread_object()
+        _usd_rate = reader.read_double()
+        return cls(top_hours_graph=_top_hours_graph, revenue_graph=_revenue_graph, balances=_balances, usd_rate=_usd_rate)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBroadcastRevenueTransaction
+
+
+
+class BroadcastRevenueTransactions(TLObject):
+    CONSTRUCTOR_ID = 0x87158466
+    SUBCLASS_OF_ID = 0x676ea15
+    __slots__ = ('count', 'transactions')
+
+    def __init__(self, count: int, transactions: List['TypeBroadcastRevenueTransaction']):
+        """
+        Constructor for stats.BroadcastRevenueTransactions: Instance of BroadcastRevenueTransactions.
+        """
+        self.count = count
+        self.transactions = transactions
+
+    def to_dict(self):
+        return {
+            '_': 'BroadcastRevenueTransactions',
+            'count': self.count,
+            'transactions': [] if self.transactions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.transactions]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'f\x84\x15\x87',
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.transactions)),b''.join(x._bytes() for x in self.transactions),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _count = reader.read_int()
+        reader.read_int()
+        _transactions = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _transactions.append(_x)
+
+        return cls(count=_count, transactions=_transactions)
+
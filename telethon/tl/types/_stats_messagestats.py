@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStatsGraph
+
+
+
+class MessageStats(TLObject):
+    CONSTRUCTOR_ID = 0x7fe91c14
+    SUBCLASS_OF_ID = 0x9604a322
+    __slots__ = ('views_graph', 'reactions_by_emotion_graph')
+
+    def __init__(self, views_graph: 'TypeStatsGraph', reactions_by_emotion_graph: 'TypeStatsGraph'):
+        """
+        Constructor for stats.MessageStats: Instance of MessageStats.
+        """
+        self.views_graph = views_graph
+        self.reactions_by_emotion_graph = reactions_by_emotion_graph
+
+    def to_dict(self):
+        return {
+            '_': 'MessageStats',
+            'views_graph': self.views_graph.to_dict() if isinstance(self.views_graph, TLObject) else self.views_graph,
+            'reactions_by_emotion_graph': self.reactions_by_emotion_graph.to_dict() if isinstance(self.reactions_by_emotion_graph, TLObject) else self.reactions_by_emotion_graph
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x14\x1c\xe9\x7f',
+            self.views_graph._bytes(),
+            self.reactions_by_emotion_graph._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _views_graph = reader.tgread_object()
+        _reactions_by_emotion_graph = reader.tgread_object()
+        return cls(views_graph=_views_graph, reactions_by_emotion_graph=_reactions_by_emotion_graph)
+
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_dd = struct.Struct('<dd')
+
+
+class StatsAbsValueAndPrev(TLObject):
+    CONSTRUCTOR_ID = 0xcb43acde
+    SUBCLASS_OF_ID = 0x3ebe59af
+    __slots__ = ('current', 'previous')
+
+    def __init__(self, current: float, previous: float):
+        """
+        Constructor for StatsAbsValueAndPrev: Instance of StatsAbsValueAndPrev.
+        """
+        self.current = current
+        self.previous = previous
+
+    def to_dict(self):
+        return {
+            '_': 'StatsAbsValueAndPrev',
+            'current': self.current,
+            'previous': self.previous
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xde\xacC\xcb',
+            _struct_dd.pack(self.current, self.previous),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _current, _previous = reader.read_struct(_struct_dd)
+        return cls(current=_current, previous=_previous)
+
+TypeStatsAbsValueAndPrev = StatsAbsValueAndPrev
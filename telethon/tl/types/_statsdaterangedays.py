@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class StatsDateRangeDays(TLObject):
+    CONSTRUCTOR_ID = 0xb637edaf
+    SUBCLASS_OF_ID = 0x81236245
+    __slots__ = ('min_date', 'max_date')
+
+    def __init__(self, min_date: Optional[datetime], max_date: Optional[datetime]):
+        """
+        Constructor for StatsDateRangeDays: Instance of StatsDateRangeDays.
+        """
+        self.min_date = min_date
+        self.max_date = max_date
+
+    def to_dict(self):
+        return {
+            '_': 'StatsDateRangeDays',
+            'min_date': self.min_date,
+            'max_date': self.max_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xaf\xed7\xb6',
+            self.serialize_datetime(self.min_date),
+            self.serialize_datetime(self.max_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _min_date = reader.tgread_date()
+        _max_date = reader.tgread_date()
+        return cls(min_date=_min_date, max_date=_max_date)
+
+TypeStatsDateRangeDays = StatsDateRangeDays
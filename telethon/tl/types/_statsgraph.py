@@ -0,0 +1,108 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDataJSON
+
+
+
+class StatsGraph(TLObject):
+    CONSTRUCTOR_ID = 0x8ea464b6
+    SUBCLASS_OF_ID = 0x9b903153
+    __slots__ = ('json', 'zoom_token')
+
+    def __init__(self, json: 'TypeDataJSON', zoom_token: Optional[str]=None):
+        """
+        Constructor for StatsGraph: Instance of either StatsGraphAsync, StatsGraphError, StatsGraph.
+        """
+        self.json = json
+        self.zoom_token = zoom_token
+
+    def to_dict(self):
+        return {
+            '_': 'StatsGraph',
+            'json': self.json.to_dict() if isinstance(self.json, TLObject) else self.json,
+            'zoom_token': self.zoom_token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb6d\xa4\x8e',
+            struct.pack('<I', (0 if self.zoom_token is None or self.zoom_token is False else 1)),
+            self.json._bytes(),
+            b'' if self.zoom_token is None or self.zoom_token is False else (self.serialize_bytes(self.zoom_token)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _json = reader.tgread_object()
+        if flags & 1:
+            _zoom_token = reader.tgread_string()
+        else:
+            _zoom_token = None
+        return cls(json=_json, zoom_token=_zoom_token)
+
+
+class StatsGraphAsync(TLObject):
+    CONSTRUCTOR_ID = 0x4a27eb2d
+    SUBCLASS_OF_ID = 0x9b903153
+    __slots__ = ('token',)
+
+    def __init__(self, token: str):
+        """
+        Constructor for StatsGraph: Instance of either StatsGraphAsync, StatsGraphError, StatsGraph.
+        """
+        self.token = token
+
+    def to_dict(self):
+        return {
+            '_': 'StatsGraphAsync',
+            'token': self.token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"-\xeb'J",
+            self.serialize_bytes(self.token),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _token = reader.tgread_string()
+        return cls(token=_token)
+
+
+class StatsGraphError(TLObject):
+    CONSTRUCTOR_ID = 0xbedc9822
+    SUBCLASS_OF_ID = 0x9b903153
+    __slots__ = ('error',)
+
+    def __init__(self, error: str):
+        """
+        Constructor for StatsGraph: Instance of either StatsGraphAsync, StatsGraphError, StatsGraph.
+        """
+        self.error = error
+
+    def to_dict(self):
+        return {
+            '_': 'StatsGraphError',
+            'error': self.error
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'"\x98\xdc\xbe',
+            self.serialize_bytes(self.error),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _error = reader.tgread_string()
+        return cls(error=_error)
+
+TypeStatsGraph = Union[StatsGraphAsync,StatsGraphError,StatsGraph]
@@ -0,0 +1,45 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qiii = struct.Struct('<qiii')
+
+
+class StatsGroupTopAdmin(TLObject):
+    CONSTRUCTOR_ID = 0xd7584c87
+    SUBCLASS_OF_ID = 0x80359c5d
+    __slots__ = ('user_id', 'deleted', 'kicked', 'banned')
+
+    def __init__(self, user_id: int, deleted: int, kicked: int, banned: int):
+        """
+        Constructor for StatsGroupTopAdmin: Instance of StatsGroupTopAdmin.
+        """
+        self.user_id = user_id
+        self.deleted = deleted
+        self.kicked = kicked
+        self.banned = banned
+
+    def to_dict(self):
+        return {
+            '_': 'StatsGroupTopAdmin',
+            'user_id': self.user_id,
+            'deleted': self.deleted,
+            'kicked': self.kicked,
+            'banned': self.banned
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x87LX\xd7',
+            _struct_qiii.pack(self.user_id, self.deleted, self.kicked, self.banned),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _deleted, _kicked, _banned = reader.read_struct(_struct_qiii)
+        return cls(user_id=_user_id, deleted=_deleted, kicked=_kicked, banned=_banned)
+
+TypeStatsGroupTopAdmin = StatsGroupTopAdmin
@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+
+
+class StatsGroupTopInviter(TLObject):
+    CONSTRUCTOR_ID = 0x535f779d
+    SUBCLASS_OF_ID = 0x85010c7a
+    __slots__ = ('user_id', 'invitations')
+
+    def __init__(self, user_id: int, invitations: int):
+        """
+        Constructor for StatsGroupTopInviter: Instance of StatsGroupTopInviter.
+        """
+        self.user_id = user_id
+        self.invitations = invitations
+
+    def to_dict(self):
+        return {
+            '_': 'StatsGroupTopInviter',
+            'user_id': self.user_id,
+            'invitations': self.invitations
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9dw_S',
+            _struct_qi.pack(self.user_id, self.invitations),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _invitations = reader.read_struct(_struct_qi)
+        return cls(user_id=_user_id, invitations=_invitations)
+
+TypeStatsGroupTopInviter = StatsGroupTopInviter
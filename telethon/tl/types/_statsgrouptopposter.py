@@ -0,0 +1,43 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qii = struct.Struct('<qii')
+
+
+class StatsGroupTopPoster(TLObject):
+    CONSTRUCTOR_ID = 0x9d04af9b
+    SUBCLASS_OF_ID = 0x81c5ce23
+    __slots__ = ('user_id', 'messages', 'avg_chars')
+
+    def __init__(self, user_id: int, messages: int, avg_chars: int):
+        """
+        Constructor for StatsGroupTopPoster: Instance of StatsGroupTopPoster.
+        """
+        self.user_id = user_id
+        self.messages = messages
+        self.avg_chars = avg_chars
+
+    def to_dict(self):
+        return {
+            '_': 'StatsGroupTopPoster',
+            'user_id': self.user_id,
+            'messages': self.messages,
+            'avg_chars': self.avg_chars
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9b\xaf\x04\x9d',
+            _struct_qii.pack(self.user_id, self.messages, self.avg_chars),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _user_id, _messages, _avg_chars = reader.read_struct(_struct_qii)
+        return cls(user_id=_user_id, messages=_messages, avg_chars=_avg_chars)
+
+TypeStatsGroupTopPoster = StatsGroupTopPoster
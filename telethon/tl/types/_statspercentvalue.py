@@ -0,0 +1,41 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_dd = struct.Struct('<dd')
+
+
+class StatsPercentValue(TLObject):
+    CONSTRUCTOR_ID = 0xcbce2fe0
+    SUBCLASS_OF_ID = 0x9702c51e
+    __slots__ = ('part', 'total')
+
+    def __init__(self, part: float, total: float):
+        """
+        Constructor for StatsPercentValue: Instance of StatsPercentValue.
+        """
+        self.part = part
+        self.total = total
+
+    def to_dict(self):
+        return {
+            '_': 'StatsPercentValue',
+            'part': self.part,
+            'total': self.total
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe0/\xce\xcb',
+            _struct_dd.pack(self.part, self.total),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _part, _total = reader.read_struct(_struct_dd)
+        return cls(part=_part, total=_total)
+
+TypeStatsPercentValue = StatsPercentValue
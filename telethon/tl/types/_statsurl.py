@@ -0,0 +1,37 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class StatsURL(TLObject):
+    CONSTRUCTOR_ID = 0x47a971e0
+    SUBCLASS_OF_ID = 0x8d4c94c0
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for StatsURL: Instance of StatsURL.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'StatsURL',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe0q\xa9G',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
+TypeStatsURL = StatsURL
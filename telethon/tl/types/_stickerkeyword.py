@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class StickerKeyword(TLObject):
+    CONSTRUCTOR_ID = 0xfcfeb29c
+    SUBCLASS_OF_ID = 0x55951d6b
+    __slots__ = ('document_id', 'keyword')
+
+    def __init__(self, document_id: int, keyword: List[str]):
+        """
+        Constructor for StickerKeyword: Instance of StickerKeyword.
+        """
+        self.document_id = document_id
+        self.keyword = keyword
+
+    def to_dict(self):
+        return {
+            '_': 'StickerKeyword',
+            'document_id': self.document_id,
+            'keyword': [] if self.keyword is None else self.keyword[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x9c\xb2\xfe\xfc',
+            struct.pack('<q', self.document_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.keyword)),b''.join(self.serialize_bytes(x) for x in self.keyword),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _document_id = reader.read_long()
+        reader.read_int()
+        _keyword = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_string()
+            _keyword.append(_x)
+
+        return cls(document_id=_document_id, keyword=_keyword)
+
+TypeStickerKeyword = StickerKeyword
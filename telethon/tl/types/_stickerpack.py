@@ -0,0 +1,42 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class StickerPack(TLObject):
+    CONSTRUCTOR_ID = 0x12b299d4
+    SUBCLASS_OF_ID = 0x9fefa4d4
+    __slots__ = ('emoticon', 'documents')
+
+    def __init__(self, emoticon: str, documents: List[int]):
+        """
+        Constructor for StickerPack: Instance of StickerPack.
+        """
+        self.emoticon = emoticon
+        self.documents = documents
+
+    def to_dict(self):
+        return {
+            '_': 'StickerPack',
+            'emoticon': self.emoticon,
+            'documents': [] if self.documents is None else self.documents[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd4\x99\xb2\x12',
+            self.serialize_bytes(self.emoticon),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.documents)), len(self.documents), *self.documents),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoticon = reader.tgread_string()
+        reader.read_int()
+        _documents = reader.read_array('q', reader.read_int())
+        return cls(emoticon=_emoticon, documents=_documents)
+
+TypeStickerPack = StickerPack
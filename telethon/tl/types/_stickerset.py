@@ -0,0 +1,125 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+_struct_qq = struct.Struct('<qq')
+if TYPE_CHECKING:
+    from ...tl.types import TypePhotoSize
+
+
+
+class StickerSet(TLObject):
+    CONSTRUCTOR_ID = 0x2dd14edc
+    SUBCLASS_OF_ID = 0xbad3ff91
+    __slots__ = ('id', 'access_hash', 'title', 'short_name', 'count', 'hash', 'archived', 'official', 'masks', 'emojis', 'text_color', 'channel_emoji_status', 'creator', 'installed_date', 'thumbs', 'thumb_dc_id', 'thumb_version', 'thumb_document_id')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, title: str, short_name: str, count: int, hash: int, archived: Optional[bool]=None, official: Optional[bool]=None, masks: Optional[bool]=None, emojis: Optional[bool]=None, text_color: Optional[bool]=None, channel_emoji_status: Optional[bool]=None, creator: Optional[bool]=None, installed_date: Optional[datetime]=None, thumbs: Optional[List['TypePhotoSize']]=None, thumb_dc_id: Optional[int]=None, thumb_version: Optional[int]=None, thumb_document_id: Optional[int]=None):
+        """
+        Constructor for StickerSet: Instance of StickerSet.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.title = title
+        self.short_name = short_name
+        self.count = count
+        self.hash = hash
+        self.archived = archived
+        self.official = official
+        self.masks = masks
+        self.emojis = emojis
+        self.text_color = text_color
+        self.channel_emoji_status = channel_emoji_status
+        self.creator = creator
+        self.installed_date = installed_date
+        self.thumbs = thumbs
+        self.thumb_dc_id = thumb_dc_id
+        self.thumb_version = thumb_version
+        self.thumb_document_id = thumb_document_id
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSet',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'title': self.title,
+            'short_name': self.short_name,
+            'count': self.count,
+            'hash': self.hash,
+            'archived': self.archived,
+            'official': self.official,
+            'masks': self.masks,
+            'emojis': self.emojis,
+            'text_color': self.text_color,
+            'channel_emoji_status': self.channel_emoji_status,
+            'creator': self.creator,
+            'installed_date': self.installed_date,
+            'thumbs': [] if self.thumbs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.thumbs],
+            'thumb_dc_id': self.thumb_dc_id,
+            'thumb_version': self.thumb_version,
+            'thumb_document_id': self.thumb_document_id
+        }
+
+    def _bytes(self):
+        assert ((self.thumbs or self.thumbs is not None) and (self.thumb_dc_id or self.thumb_dc_id is not None) and (self.thumb_version or self.thumb_version is not None)) or ((self.thumbs is None or self.thumbs is False) and (self.thumb_dc_id is None or self.thumb_dc_id is False) and (self.thumb_version is None or self.thumb_version is False)), 'thumbs, thumb_dc_id, thumb_version parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xdcN\xd1-',
+            struct.pack('<I', (0 if self.archived is None or self.archived is False else 2) | (0 if self.official is None or self.official is False else 4) | (0 if self.masks is None or self.masks is False else 8) | (0 if self.emojis is None or self.emojis is False else 128) | (0 if self.text_color is None or self.text_color is False else 512) | (0 if self.channel_emoji_status is None or self.channel_emoji_status is False else 1024) | (0 if self.creator is None or self.creator is False else 2048) | (0 if self.installed_date is None or self.installed_date is False else 1) | (0 if self.thumbs is None or self.thumbs is False else 16) | (0 if self.thumb_dc_id is None or self.thumb_dc_id is False else 16) | (0 if self.thumb_version is None or self.thumb_version is False else 16) | (0 if self.thumb_document_id is None or self.thumb_document_id is False else 256)),
+            b'' if self.installed_date is None or self.installed_date is False else (self.serialize_datetime(self.installed_date)),
+            _struct_qq.pack(self.id, self.access_hash),
+            self.serialize_bytes(self.title),
+            self.serialize_bytes(self.short_name),
+            b'' if self.thumbs is None or self.thumbs is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.thumbs)),b''.join(x._bytes() for x in self.thumbs))),
+            b'' if self.thumb_dc_id is None or self.thumb_dc_id is False else (struct.pack('<i', self.thumb_dc_id)),
+            b'' if self.thumb_version is None or self.thumb_version is False else (struct.pack('<i', self.thumb_version)),
+            b'' if self.thumb_document_id is None or self.thumb_document_id is False else (struct.pack('<q', self.thumb_document_id)),
+            _struct_ii.pack(self.count, self.hash),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _archived = bool(flags & 2)
+        _official = bool(flags & 4)
+        _masks = bool(flags & 8)
+        _emojis = bool(flags & 128)
+        _text_color = bool(flags & 512)
+        _channel_emoji_status = bool(flags & 1024)
+        _creator = bool(flags & 2048)
+        if flags & 1:
+            _installed_date = reader.tgread_date()
+        else:
+            _installed_date = None
+        _id, _access_hash = reader.read_struct(_struct_qq)
+        _title = reader.tgread_string()
+        _short_name = reader.tgread_string()
+        if flags & 16:
+            reader.read_int()
+            _thumbs = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _thumbs.append(_x)
+
+        else:
+            _thumbs = None
+        if flags & 16:
+            _thumb_dc_id = reader.read_int()
+        else:
+            _thumb_dc_id = None
+        if flags & 16:
+            _thumb_version = reader.read_int()
+        else:
+            _thumb_version = None
+        if flags & 256:
+            _thumb_document_id = reader.read_long()
+        else:
+            _thumb_document_id = None
+        _count, _hash = reader.read_struct(_struct_ii)
+        return cls(id=_id, access_hash=_access_hash, title=_title, short_name=_short_name, count=_count, hash=_hash, archived=_archived, official=_official, masks=_masks, emojis=_emojis, text_color=_text_color, channel_emoji_status=_channel_emoji_status, creator=_creator, installed_date=_installed_date, thumbs=_thumbs, thumb_dc_id=_thumb_dc_id, thumb_version=_thumb_version, thumb_document_id=_thumb_document_id)
+
+TypeStickerSet = StickerSet
@@ -0,0 +1,171 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeStickerKeyword, TypeStickerPack, TypeStickerSet
+
+
+
+class StickerSetCovered(TLObject):
+    CONSTRUCTOR_ID = 0x6410a5d2
+    SUBCLASS_OF_ID = 0x7f86e4e5
+    __slots__ = ('set', 'cover')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, set: 'TypeStickerSet', cover: 'TypeDocument'):
+        """
+        Constructor for StickerSetCovered: Instance of either StickerSetCovered, StickerSetMultiCovered, StickerSetFullCovered, StickerSetNoCovered.
+        """
+        self.set = set
+        self.cover = cover
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSetCovered',
+            'set': self.set.to_dict() if isinstance(self.set, TLObject) else self.set,
+            'cover': self.cover.to_dict() if isinstance(self.cover, TLObject) else self.cover
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd2\xa5\x10d',
+            self.set._bytes(),
+            self.cover._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _set = reader.tgread_object()
+        _cover = reader.tgread_object()
+        return cls(set=_set, cover=_cover)
+
+
+class StickerSetFullCovered(TLObject):
+    CONSTRUCTOR_ID = 0x40d13c0e
+    SUBCLASS_OF_ID = 0x7f86e4e5
+    __slots__ = ('set', 'packs', 'keywords', 'documents')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, set: 'TypeStickerSet', packs: List['TypeStickerPack'], keywords: List['TypeStickerKeyword'], documents: List['TypeDocument']):
+        """
+        Constructor for StickerSetCovered: Instance of either StickerSetCovered, StickerSetMultiCovered, StickerSetFullCovered, StickerSetNoCovered.
+        """
+        self.set = set
+        self.packs = packs
+        self.keywords = keywords
+        self.documents = documents
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSetFullCovered',
+            'set': self.set.to_dict() if isinstance(self.set, TLObject) else self.set,
+            'packs': [] if self.packs is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.packs],
+            'keywords': [] if self.keywords is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.keywords],
+            'documents': [] if self.documents is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.documents]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0e<\xd1@',
+            self.set._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.packs)),b''.join(x._bytes() for x in self.packs),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.keywords)),b''.join(x._bytes() for x in self.keywords),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.documents)),b''.join(x._bytes() for x in self.documents),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _set = reader.tgread_object()
+        reader.read_int()
+        _packs = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _packs.append(_x)
+
+        reader.read_int()
+        _keywords = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _keywords.append(_x)
+
+        reader.read_int()
+        _documents = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _documents.append(_x)
+
+        return cls(set=_set, packs=_packs, keywords=_keywords, documents=_documents)
+
+
+class StickerSetMultiCovered(TLObject):
+    CONSTRUCTOR_ID = 0x3407e51b
+    SUBCLASS_OF_ID = 0x7f86e4e5
+    __slots__ = ('set', 'covers')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, set: 'TypeStickerSet', covers: List['TypeDocument']):
+        """
+        Constructor for StickerSetCovered: Instance of either StickerSetCovered, StickerSetMultiCovered, StickerSetFullCovered, StickerSetNoCovered.
+        """
+        self.set = set
+        self.covers = covers
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSetMultiCovered',
+            'set': self.set.to_dict() if isinstance(self.set, TLObject) else self.set,
+            'covers': [] if self.covers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.covers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1b\xe5\x074',
+            self.set._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.covers)),b''.join(x._bytes() for x in self.covers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _set = reader.tgread_object()
+        reader.read_int()
+        _covers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _covers.append(_x)
+
+        return cls(set=_set, covers=_covers)
+
+
+class StickerSetNoCovered(TLObject):
+    CONSTRUCTOR_ID = 0x77b15d1c
+    SUBCLASS_OF_ID = 0x7f86e4e5
+    __slots__ = ('set',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, set: 'TypeStickerSet'):
+        """
+        Constructor for StickerSetCovered: Instance of either StickerSetCovered, StickerSetMultiCovered, StickerSetFullCovered, StickerSetNoCovered.
+        """
+        self.set = set
+
+    def to_dict(self):
+        return {
+            '_': 'StickerSetNoCovered',
+            'set': self.set.to_dict() if isinstance(self.set, TLObject) else self.set
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1c]\xb1w',
+            self.set._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _set = reader.tgread_object()
+        return cls(set=_set)
+
+TypeStickerSetCovered = Union[StickerSetCovered,StickerSetMultiCovered,StickerSetFullCovered,StickerSetNoCovered]
@@ -0,0 +1,116 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypePeerStories, TypeStoriesStealthMode, TypeUser
+
+
+
+class AllStories(TLObject):
+    CONSTRUCTOR_ID = 0x6efc5e81
+    SUBCLASS_OF_ID = 0x7e60d0cd
+    __slots__ = ('count', 'state', 'peer_stories', 'chats', 'users', 'stealth_mode', 'has_more')
+
+    def __init__(self, count: int, state: str, peer_stories: List['TypePeerStories'], chats: List['TypeChat'], users: List['TypeUser'], stealth_mode: 'TypeStoriesStealthMode', has_more: Optional[bool]=None):
+        """
+        Constructor for stories.AllStories: Instance of either AllStoriesNotModified, AllStories.
+        """
+        self.count = count
+        self.state = state
+        self.peer_stories = peer_stories
+        self.chats = chats
+        self.users = users
+        self.stealth_mode = stealth_mode
+        self.has_more = has_more
+
+    def to_dict(self):
+        return {
+            '_': 'AllStories',
+            'count': self.count,
+            'state': self.state,
+            'peer_stories': [] if self.peer_stories is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peer_stories],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'stealth_mode': self.stealth_mode.to_dict() if isinstance(self.stealth_mode, TLObject) else self.stealth_mode,
+            'has_more': self.has_more
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x81^\xfcn',
+            _struct_Ii.pack((0 if self.has_more is None or self.has_more is False else 1), self.count),
+            self.serialize_bytes(self.state),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peer_stories)),b''.join(x._bytes() for x in self.peer_stories),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            self.stealth_mode._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count = reader.read_struct(_struct_ii)
+        _has_more = bool(flags & 1)
+        _state = reader.tgread_string()
+        reader.read_int()
+        _peer_stories = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _peer_stories.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        _stealth_mode = reader.tgread_object()
+        return cls(count=_count, state=_state, peer_stories=_peer_stories, chats=_chats, users=_users, stealth_mode=_stealth_mode, has_more=_has_more)
+
+
+class AllStoriesNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x1158fe3e
+    SUBCLASS_OF_ID = 0x7e60d0cd
+    __slots__ = ('state', 'stealth_mode')
+
+    def __init__(self, state: str, stealth_mode: 'TypeStoriesStealthMode'):
+        """
+        Constructor for stories.AllStories: Instance of either AllStoriesNotModified, AllStories.
+        """
+        self.state = state
+        self.stealth_mode = stealth_mode
+
+    def to_dict(self):
+        return {
+            '_': 'AllStoriesNotModified',
+            'state': self.state,
+            'stealth_mode': self.stealth_mode.to_dict() if isinstance(self.stealth_mode, TLObject) else self.stealth_mode
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'>\xfeX\x11',
+            b'\0\0\0\0',
+            self.serialize_bytes(self.state),
+            self.stealth_mode._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _state = reader.tgread_string()
+        _stealth_mode = reader.tgread_object()
+        return cls(state=_state, stealth_mode=_stealth_mode)
+
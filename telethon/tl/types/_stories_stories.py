@@ -0,0 +1,77 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeStoryItem, TypeUser
+
+
+
+class Stories(TLObject):
+    CONSTRUCTOR_ID = 0x63c3dd0a
+    SUBCLASS_OF_ID = 0x251c0c2c
+    __slots__ = ('count', 'stories', 'chats', 'users', 'pinned_to_top')
+
+    def __init__(self, count: int, stories: List['TypeStoryItem'], chats: List['TypeChat'], users: List['TypeUser'], pinned_to_top: Optional[List[int]]=None):
+        """
+        Constructor for stories.Stories: Instance of Stories.
+        """
+        self.count = count
+        self.stories = stories
+        self.chats = chats
+        self.users = users
+        self.pinned_to_top = pinned_to_top
+
+    def to_dict(self):
+        return {
+            '_': 'Stories',
+            'count': self.count,
+            'stories': [] if self.stories is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stories],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'pinned_to_top': [] if self.pinned_to_top is None else self.pinned_to_top[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\n\xdd\xc3c',
+            _struct_Ii.pack((0 if self.pinned_to_top is None or self.pinned_to_top is False else 1), self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stories)),b''.join(x._bytes() for x in self.stories),
+            b'' if self.pinned_to_top is None or self.pinned_to_top is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.pinned_to_top)), len(self.pinned_to_top), *self.pinned_to_top))),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count = reader.read_struct(_struct_ii)
+        reader.read_int()
+        _stories = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _stories.append(_x)
+
+        if flags & 1:
+            reader.read_int()
+            _pinned_to_top = reader.read_array('i', reader.read_int())
+        else:
+            _pinned_to_top = None
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(count=_count, stories=_stories, chats=_chats, users=_users, pinned_to_top=_pinned_to_top)
+
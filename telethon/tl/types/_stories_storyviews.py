@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeStoryViews, TypeUser
+
+
+
+class StoryViews(TLObject):
+    CONSTRUCTOR_ID = 0xde9eed1d
+    SUBCLASS_OF_ID = 0x4b3fc4ba
+    __slots__ = ('views', 'users')
+
+    def __init__(self, views: List['TypeStoryViews'], users: List['TypeUser']):
+        """
+        Constructor for stories.StoryViews: Instance of StoryViews.
+        """
+        self.views = views
+        self.users = users
+
+    def to_dict(self):
+        return {
+            '_': 'StoryViews',
+            'views': [] if self.views is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.views],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1d\xed\x9e\xde',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.views)),b''.join(x._bytes() for x in self.views),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _views = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _views.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(views=_views, users=_users)
+
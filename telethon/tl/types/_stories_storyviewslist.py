@@ -0,0 +1,82 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iiiii = struct.Struct('<Iiiii')
+_struct_iiiii = struct.Struct('<iiiii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeStoryView, TypeUser
+
+
+
+class StoryViewsList(TLObject):
+    CONSTRUCTOR_ID = 0x59d78fc5
+    SUBCLASS_OF_ID = 0xb9437560
+    __slots__ = ('count', 'views_count', 'forwards_count', 'reactions_count', 'views', 'chats', 'users', 'next_offset')
+
+    def __init__(self, count: int, views_count: int, forwards_count: int, reactions_count: int, views: List['TypeStoryView'], chats: List['TypeChat'], users: List['TypeUser'], next_offset: Optional[str]=None):
+        """
+        Constructor for stories.StoryViewsList: Instance of StoryViewsList.
+        """
+        self.count = count
+        self.views_count = views_count
+        self.forwards_count = forwards_count
+        self.reactions_count = reactions_count
+        self.views = views
+        self.chats = chats
+        self.users = users
+        self.next_offset = next_offset
+
+    def to_dict(self):
+        return {
+            '_': 'StoryViewsList',
+            'count': self.count,
+            'views_count': self.views_count,
+            'forwards_count': self.forwards_count,
+            'reactions_count': self.reactions_count,
+            'views': [] if self.views is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.views],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'next_offset': self.next_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc5\x8f\xd7Y',
+            _struct_Iiiii.pack((0 if self.next_offset is None or self.next_offset is False else 1), self.count, self.views_count, self.forwards_count, self.reactions_count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.views)),b''.join(x._bytes() for x in self.views),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            b'' if self.next_offset is None or self.next_offset is False else (self.serialize_bytes(self.next_offset)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _count, _views_count, _forwards_count, _reactions_count = reader.read_struct(_struct_iiiii)
+        reader.read_int()
+        _views = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _views.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        if flags & 1:
+            _next_offset = reader.tgread_string()
+        else:
+            _next_offset = None
+        return cls(count=_count, views_count=_views_count, forwards_count=_forwards_count, reactions_count=_reactions_count, views=_views, chats=_chats, users=_users, next_offset=_next_offset)
+
@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class StoriesStealthMode(TLObject):
+    CONSTRUCTOR_ID = 0x712e27fd
+    SUBCLASS_OF_ID = 0x2ed8401
+    __slots__ = ('active_until_date', 'cooldown_until_date')
+
+    def __init__(self, active_until_date: Optional[datetime]=None, cooldown_until_date: Optional[datetime]=None):
+        """
+        Constructor for StoriesStealthMode: Instance of StoriesStealthMode.
+        """
+        self.active_until_date = active_until_date
+        self.cooldown_until_date = cooldown_until_date
+
+    def to_dict(self):
+        return {
+            '_': 'StoriesStealthMode',
+            'active_until_date': self.active_until_date,
+            'cooldown_until_date': self.cooldown_until_date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b"\xfd'.q",
+            struct.pack('<I', (0 if self.active_until_date is None or self.active_until_date is False else 1) | (0 if self.cooldown_until_date is None or self.cooldown_until_date is False else 2)),
+            b'' if self.active_until_date is None or self.active_until_date is False else (self.serialize_datetime(self.active_until_date)),
+            b'' if self.cooldown_until_date is None or self.cooldown_until_date is False else (self.serialize_datetime(self.cooldown_until_date)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _active_until_date = reader.tgread_date()
+        else:
+            _active_until_date = None
+        if flags & 2:
+            _cooldown_until_date = reader.tgread_date()
+        else:
+            _cooldown_until_date = None
+        return cls(active_until_date=_active_until_date, cooldown_until_date=_cooldown_until_date)
+
+TypeStoriesStealthMode = StoriesStealthMode
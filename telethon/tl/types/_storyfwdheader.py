@@ -0,0 +1,63 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class StoryFwdHeader(TLObject):
+    CONSTRUCTOR_ID = 0xb826e150
+    SUBCLASS_OF_ID = 0xaab0b12c
+    __slots__ = ('modified', 'from_', 'from_name', 'story_id')
+
+    def __init__(self, modified: Optional[bool]=None, from_: Optional['TypePeer']=None, from_name: Optional[str]=None, story_id: Optional[int]=None):
+        """
+        Constructor for StoryFwdHeader: Instance of StoryFwdHeader.
+        """
+        self.modified = modified
+        self.from_ = from_
+        self.from_name = from_name
+        self.story_id = story_id
+
+    def to_dict(self):
+        return {
+            '_': 'StoryFwdHeader',
+            'modified': self.modified,
+            'from_': self.from_.to_dict() if isinstance(self.from_, TLObject) else self.from_,
+            'from_name': self.from_name,
+            'story_id': self.story_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'P\xe1&\xb8',
+            struct.pack('<I', (0 if self.modified is None or self.modified is False else 8) | (0 if self.from_ is None or self.from_ is False else 1) | (0 if self.from_name is None or self.from_name is False else 2) | (0 if self.story_id is None or self.story_id is False else 4)),
+            b'' if self.from_ is None or self.from_ is False else (self.from_._bytes()),
+            b'' if self.from_name is None or self.from_name is False else (self.serialize_bytes(self.from_name)),
+            b'' if self.story_id is None or self.story_id is False else (struct.pack('<i', self.story_id)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _modified = bool(flags & 8)
+        if flags & 1:
+            _from_ = reader.tgread_object()
+        else:
+            _from_ = None
+        if flags & 2:
+            _from_name = reader.tgread_string()
+        else:
+            _from_name = None
+        if flags & 4:
+            _story_id = reader.read_int()
+        else:
+            _story_id = None
+        return cls(modified=_modified, from_=_from_, from_name=_from_name, story_id=_story_id)
+
+TypeStoryFwdHeader = StoryFwdHeader
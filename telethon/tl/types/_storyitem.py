@@ -0,0 +1,225 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeMediaArea, TypeMessageEntity, TypeMessageMedia, TypePeer, TypePrivacyRule, TypeReaction, TypeStoryFwdHeader, TypeStoryViews
+
+
+
+class StoryItem(TLObject):
+    CONSTRUCTOR_ID = 0x79b26a24
+    SUBCLASS_OF_ID = 0xd477b133
+    __slots__ = ('id', 'date', 'expire_date', 'media', 'pinned', 'public', 'close_friends', 'min', 'noforwards', 'edited', 'contacts', 'selected_contacts', 'out', 'from_id', 'fwd_from', 'caption', 'entities', 'media_areas', 'privacy', 'views', 'sent_reaction')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, date: Optional[datetime], expire_date: Optional[datetime], media: 'TypeMessageMedia', pinned: Optional[bool]=None, public: Optional[bool]=None, close_friends: Optional[bool]=None, min: Optional[bool]=None, noforwards: Optional[bool]=None, edited: Optional[bool]=None, contacts: Optional[bool]=None, selected_contacts: Optional[bool]=None, out: Optional[bool]=None, from_id: Optional['TypePeer']=None, fwd_from: Optional['TypeStoryFwdHeader']=None, caption: Optional[str]=None, entities: Optional[List['TypeMessageEntity']]=None, media_areas: Optional[List['TypeMediaArea']]=None, privacy: Optional[List['TypePrivacyRule']]=None, views: Optional['TypeStoryViews']=None, sent_reaction: Optional['TypeReaction']=None):
+        """
+        Constructor for StoryItem: Instance of either StoryItemDeleted, StoryItemSkipped, StoryItem.
+        """
+        self.id = id
+        self.date = date
+        self.expire_date = expire_date
+        self.media = media
+        self.pinned = pinned
+        self.public = public
+        self.close_friends = close_friends
+        self.min = min
+        self.noforwards = noforwards
+        self.edited = edited
+        self.contacts = contacts
+        self.selected_contacts = selected_contacts
+        self.out = out
+        self.from_id = from_id
+        self.fwd_from = fwd_from
+        self.caption = caption
+        self.entities = entities
+        self.media_areas = media_areas
+        self.privacy = privacy
+        self.views = views
+        self.sent_reaction = sent_reaction
+
+    def to_dict(self):
+        return {
+            '_': 'StoryItem',
+            'id': self.id,
+            'date': self.date,
+            'expire_date': self.expire_date,
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'pinned': self.pinned,
+            'public': self.public,
+            'close_friends': self.close_friends,
+            'min': self.min,
+            'noforwards': self.noforwards,
+            'edited': self.edited,
+            'contacts': self.contacts,
+            'selected_contacts': self.selected_contacts,
+            'out': self.out,
+            'from_id': self.from_id.to_dict() if isinstance(self.from_id, TLObject) else self.from_id,
+            'fwd_from': self.fwd_from.to_dict() if isinstance(self.fwd_from, TLObject) else self.fwd_from,
+            'caption': self.caption,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'media_areas': [] if self.media_areas is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.media_areas],
+            'privacy': [] if self.privacy is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.privacy],
+            'views': self.views.to_dict() if isinstance(self.views, TLObject) else self.views,
+            'sent_reaction': self.sent_reaction.to_dict() if isinstance(self.sent_reaction, TLObject) else self.sent_reaction
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'$j\xb2y',
+            _struct_Ii.pack((0 if self.pinned is None or self.pinned is False else 32) | (0 if self.public is None or self.public is False else 128) | (0 if self.close_friends is None or self.close_friends is False else 256) | (0 if self.min is None or self.min is False else 512) | (0 if self.noforwards is None or self.noforwards is False else 1024) | (0 if self.edited is None or self.edited is False else 2048) | (0 if self.contacts is None or self.contacts is False else 4096) | (0 if self.selected_contacts is None or self.selected_contacts is False else 8192) | (0 if self.out is None or self.out is False else 65536) | (0 if self.from_id is None or self.from_id is False else 262144) | (0 if self.fwd_from is None or self.fwd_from is False else 131072) | (0 if self.caption is None or self.caption is False else 1) | (0 if self.entities is None or self.entities is False else 2) | (0 if self.media_areas is None or self.media_areas is False else 16384) | (0 if self.privacy is None or self.privacy is False else 4) | (0 if self.views is None or self.views is False else 8) | (0 if self.sent_reaction is None or self.sent_reaction is False else 32768), self.id),
+            self.serialize_datetime(self.date),
+            b'' if self.from_id is None or self.from_id is False else (self.from_id._bytes()),
+            b'' if self.fwd_from is None or self.fwd_from is False else (self.fwd_from._bytes()),
+            self.serialize_datetime(self.expire_date),
+            b'' if self.caption is None or self.caption is False else (self.serialize_bytes(self.caption)),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            self.media._bytes(),
+            b'' if self.media_areas is None or self.media_areas is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.media_areas)),b''.join(x._bytes() for x in self.media_areas))),
+            b'' if self.privacy is None or self.privacy is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.privacy)),b''.join(x._bytes() for x in self.privacy))),
+            b'' if self.views is None or self.views is False else (self.views._bytes()),
+            b'' if self.sent_reaction is None or self.sent_reaction is False else (self.sent_reaction._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _pinned = bool(flags & 32)
+        _public = bool(flags & 128)
+        _close_friends = bool(flags & 256)
+        _min = bool(flags & 512)
+        _noforwards = bool(flags & 1024)
+        _edited = bool(flags & 2048)
+        _contacts = bool(flags & 4096)
+        _selected_contacts = bool(flags & 8192)
+        _out = bool(flags & 65536)
+        _date = reader.tgread_date()
+        if flags & 262144:
+            _from_id = reader.tgread_object()
+        else:
+            _from_id = None
+        if flags & 131072:
+            _fwd_from = reader.tgread_object()
+        else:
+            _fwd_from = None
+        _expire_date = reader.tgread_date()
+        if flags & 1:
+            _caption = reader.tgread_string()
+        else:
+            _caption = None
+        if flags & 2:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        _media = reader.tgread_object()
+        if flags & 16384:
+            reader.read_int()
+            _media_areas = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _media_areas.append(_x)
+
+        else:
+            _media_areas = None
+        if flags & 4:
+            reader.read_int()
+            _privacy = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _privacy.append(_x)
+
+        else:
+            _privacy = None
+        if flags & 8:
+            _views = reader.tgread_object()
+        else:
+            _views = None
+        if flags & 32768:
+            _sent_reaction = reader.tgread_object()
+        else:
+            _sent_reaction = None
+        return cls(id=_id, date=_date, expire_date=_expire_date, media=_media, pinned=_pinned, public=_public, close_friends=_close_friends, min=_min, noforwards=_noforwards, edited=_edited, contacts=_contacts, selected_contacts=_selected_contacts, out=_out, from_id=_from_id, fwd_from=_fwd_from, caption=_caption, entities=_entities, media_areas=_media_areas, privacy=_privacy, views=_views, sent_reaction=_sent_reaction)
+
+
+class StoryItemDeleted(TLObject):
+    CONSTRUCTOR_ID = 0x51e6ee4f
+    SUBCLASS_OF_ID = 0xd477b133
+    __slots__ = ('id',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for StoryItem: Instance of either StoryItemDeleted, StoryItemSkipped, StoryItem.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'StoryItemDeleted',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\xee\xe6Q',
+            struct.pack('<i', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_int()
+        return cls(id=_id)
+
+
+class StoryItemSkipped(TLObject):
+    CONSTRUCTOR_ID = 0xffadc913
+    SUBCLASS_OF_ID = 0xd477b133
+    __slots__ = ('id', 'date', 'expire_date', 'close_friends')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, date: Optional[datetime], expire_date: Optional[datetime], close_friends: Optional[bool]=None):
+        """
+        Constructor for StoryItem: Instance of either StoryItemDeleted, StoryItemSkipped, StoryItem.
+        """
+        self.id = id
+        self.date = date
+        self.expire_date = expire_date
+        self.close_friends = close_friends
+
+    def to_dict(self):
+        return {
+            '_': 'StoryItemSkipped',
+            'id': self.id,
+            'date': self.date,
+            'expire_date': self.expire_date,
+            'close_friends': self.close_friends
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x13\xc9\xad\xff',
+            _struct_Ii.pack((0 if self.close_friends is None or self.close_friends is False else 256), self.id),
+            self.serialize_datetime(self.date),
+            self.serialize_datetime(self.expire_date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_ii)
+        _close_friends = bool(flags & 256)
+        _date = reader.tgread_date()
+        _expire_date = reader.tgread_date()
+        return cls(id=_id, date=_date, expire_date=_expire_date, close_friends=_close_friends)
+
+TypeStoryItem = Union[StoryItemDeleted,StoryItemSkipped,StoryItem]
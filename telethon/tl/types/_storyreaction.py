@@ -0,0 +1,110 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessage, TypePeer, TypeReaction, TypeStoryItem
+
+
+
+class StoryReaction(TLObject):
+    CONSTRUCTOR_ID = 0x6090d6d5
+    SUBCLASS_OF_ID = 0xc96b5fab
+    __slots__ = ('peer_id', 'date', 'reaction')
+
+    def __init__(self, peer_id: 'TypePeer', date: Optional[datetime], reaction: 'TypeReaction'):
+        """
+        Constructor for StoryReaction: Instance of either StoryReaction, StoryReactionPublicForward, StoryReactionPublicRepost.
+        """
+        self.peer_id = peer_id
+        self.date = date
+        self.reaction = reaction
+
+    def to_dict(self):
+        return {
+            '_': 'StoryReaction',
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'date': self.date,
+            'reaction': self.reaction.to_dict() if isinstance(self.reaction, TLObject) else self.reaction
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd5\xd6\x90`',
+            self.peer_id._bytes(),
+            self.serialize_datetime(self.date),
+            self.reaction._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer_id = reader.tgread_object()
+        _date = reader.tgread_date()
+        _reaction = reader.tgread_object()
+        return cls(peer_id=_peer_id, date=_date, reaction=_reaction)
+
+
+class StoryReactionPublicForward(TLObject):
+    CONSTRUCTOR_ID = 0xbbab2643
+    SUBCLASS_OF_ID = 0xc96b5fab
+    __slots__ = ('message',)
+
+    def __init__(self, message: 'TypeMessage'):
+        """
+        Constructor for StoryReaction: Instance of either StoryReaction, StoryReactionPublicForward, StoryReactionPublicRepost.
+        """
+        self.message = message
+
+    def to_dict(self):
+        return {
+            '_': 'StoryReactionPublicForward',
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'C&\xab\xbb',
+            self.message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _message = reader.tgread_object()
+        return cls(message=_message)
+
+
+class StoryReactionPublicRepost(TLObject):
+    CONSTRUCTOR_ID = 0xcfcd0f13
+    SUBCLASS_OF_ID = 0xc96b5fab
+    __slots__ = ('peer_id', 'story')
+
+    def __init__(self, peer_id: 'TypePeer', story: 'TypeStoryItem'):
+        """
+        Constructor for StoryReaction: Instance of either StoryReaction, StoryReactionPublicForward, StoryReactionPublicRepost.
+        """
+        self.peer_id = peer_id
+        self.story = story
+
+    def to_dict(self):
+        return {
+            '_': 'StoryReactionPublicRepost',
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'story': self.story.to_dict() if isinstance(self.story, TLObject) else self.story
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x13\x0f\xcd\xcf',
+            self.peer_id._bytes(),
+            self.story._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer_id = reader.tgread_object()
+        _story = reader.tgread_object()
+        return cls(peer_id=_peer_id, story=_story)
+
+TypeStoryReaction = Union[StoryReaction,StoryReactionPublicForward,StoryReactionPublicRepost]
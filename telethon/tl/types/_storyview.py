@@ -0,0 +1,140 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessage, TypePeer, TypeReaction, TypeStoryItem
+
+
+
+class StoryView(TLObject):
+    CONSTRUCTOR_ID = 0xb0bdeac5
+    SUBCLASS_OF_ID = 0x35913fa3
+    __slots__ = ('user_id', 'date', 'blocked', 'blocked_my_stories_from', 'reaction')
+
+    def __init__(self, user_id: int, date: Optional[datetime], blocked: Optional[bool]=None, blocked_my_stories_from: Optional[bool]=None, reaction: Optional['TypeReaction']=None):
+        """
+        Constructor for StoryView: Instance of either StoryView, StoryViewPublicForward, StoryViewPublicRepost.
+        """
+        self.user_id = user_id
+        self.date = date
+        self.blocked = blocked
+        self.blocked_my_stories_from = blocked_my_stories_from
+        self.reaction = reaction
+
+    def to_dict(self):
+        return {
+            '_': 'StoryView',
+            'user_id': self.user_id,
+            'date': self.date,
+            'blocked': self.blocked,
+            'blocked_my_stories_from': self.blocked_my_stories_from,
+            'reaction': self.reaction.to_dict() if isinstance(self.reaction, TLObject) else self.reaction
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc5\xea\xbd\xb0',
+            _struct_Iq.pack((0 if self.blocked is None or self.blocked is False else 1) | (0 if self.blocked_my_stories_from is None or self.blocked_my_stories_from is False else 2) | (0 if self.reaction is None or self.reaction is False else 4), self.user_id),
+            self.serialize_datetime(self.date),
+            b'' if self.reaction is None or self.reaction is False else (self.reaction._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _user_id = reader.read_struct(_struct_iq)
+        _blocked = bool(flags & 1)
+        _blocked_my_stories_from = bool(flags & 2)
+        _date = reader.tgread_date()
+        if flags & 4:
+            _reaction = reader.tgread_object()
+        else:
+            _reaction = None
+        return cls(user_id=_user_id, date=_date, blocked=_blocked, blocked_my_stories_from=_blocked_my_stories_from, reaction=_reaction)
+
+
+class StoryViewPublicForward(TLObject):
+    CONSTRUCTOR_ID = 0x9083670b
+    SUBCLASS_OF_ID = 0x35913fa3
+    __slots__ = ('message', 'blocked', 'blocked_my_stories_from')
+
+    def __init__(self, message: 'TypeMessage', blocked: Optional[bool]=None, blocked_my_stories_from: Optional[bool]=None):
+        """
+        Constructor for StoryView: Instance of either StoryView, StoryViewPublicForward, StoryViewPublicRepost.
+        """
+        self.message = message
+        self.blocked = blocked
+        self.blocked_my_stories_from = blocked_my_stories_from
+
+    def to_dict(self):
+        return {
+            '_': 'StoryViewPublicForward',
+            'message': self.message.to_dict() if isinstance(self.message, TLObject) else self.message,
+            'blocked': self.blocked,
+            'blocked_my_stories_from': self.blocked_my_stories_from
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0bg\x83\x90',
+            struct.pack('<I', (0 if self.blocked is None or self.blocked is False else 1) | (0 if self.blocked_my_stories_from is None or self.blocked_my_stories_from is False else 2)),
+            self.message._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _blocked = bool(flags & 1)
+        _blocked_my_stories_from = bool(flags & 2)
+        _message = reader.tgread_object()
+        return cls(message=_message, blocked=_blocked, blocked_my_stories_from=_blocked_my_stories_from)
+
+
+class StoryViewPublicRepost(TLObject):
+    CONSTRUCTOR_ID = 0xbd74cf49
+    SUBCLASS_OF_ID = 0x35913fa3
+    __slots__ = ('peer_id', 'story', 'blocked', 'blocked_my_stories_from')
+
+    def __init__(self, peer_id: 'TypePeer', story: 'TypeStoryItem', blocked: Optional[bool]=None, blocked_my_stories_from: Optional[bool]=None):
+        """
+        Constructor for StoryView: Instance of either StoryView, StoryViewPublicForward, StoryViewPublicRepost.
+        """
+        self.peer_id = peer_id
+        self.story = story
+        self.blocked = blocked
+        self.blocked_my_stories_from = blocked_my_stories_from
+
+    def to_dict(self):
+        return {
+            '_': 'StoryViewPublicRepost',
+            'peer_id': self.peer_id.to_dict() if isinstance(self.peer_id, TLObject) else self.peer_id,
+            'story': self.story.to_dict() if isinstance(self.story, TLObject) else self.story,
+            'blocked': self.blocked,
+            'blocked_my_stories_from': self.blocked_my_stories_from
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'I\xcft\xbd',
+            struct.pack('<I', (0 if self.blocked is None or self.blocked is False else 1) | (0 if self.blocked_my_stories_from is None or self.blocked_my_stories_from is False else 2)),
+            self.peer_id._bytes(),
+            self.story._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _blocked = bool(flags & 1)
+        _blocked_my_stories_from = bool(flags & 2)
+        _peer_id = reader.tgread_object()
+        _story = reader.tgread_object()
+        return cls(peer_id=_peer_id, story=_story, blocked=_blocked, blocked_my_stories_from=_blocked_my_stories_from)
+
+TypeStoryView = Union[StoryView,StoryViewPublicForward,StoryViewPublicRepost]
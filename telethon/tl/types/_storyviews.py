@@ -0,0 +1,80 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeReactionCount
+
+
+
+class StoryViews(TLObject):
+    CONSTRUCTOR_ID = 0x8d595cd6
+    SUBCLASS_OF_ID = 0x54e4ac66
+    __slots__ = ('views_count', 'has_viewers', 'forwards_count', 'reactions', 'reactions_count', 'recent_viewers')
+
+    def __init__(self, views_count: int, has_viewers: Optional[bool]=None, forwards_count: Optional[int]=None, reactions: Optional[List['TypeReactionCount']]=None, reactions_count: Optional[int]=None, recent_viewers: Optional[List[int]]=None):
+        """
+        Constructor for StoryViews: Instance of StoryViews.
+        """
+        self.views_count = views_count
+        self.has_viewers = has_viewers
+        self.forwards_count = forwards_count
+        self.reactions = reactions
+        self.reactions_count = reactions_count
+        self.recent_viewers = recent_viewers
+
+    def to_dict(self):
+        return {
+            '_': 'StoryViews',
+            'views_count': self.views_count,
+            'has_viewers': self.has_viewers,
+            'forwards_count': self.forwards_count,
+            'reactions': [] if self.reactions is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.reactions],
+            'reactions_count': self.reactions_count,
+            'recent_viewers': [] if self.recent_viewers is None else self.recent_viewers[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd6\\Y\x8d',
+            _struct_Ii.pack((0 if self.has_viewers is None or self.has_viewers is False else 2) | (0 if self.forwards_count is None or self.forwards_count is False else 4) | (0 if self.reactions is None or self.reactions is False else 8) | (0 if self.reactions_count is None or self.reactions_count is False else 16) | (0 if self.recent_viewers is None or self.recent_viewers is False else 1), self.views_count),
+            b'' if self.forwards_count is None or self.forwards_count is False else (struct.pack('<i', self.forwards_count)),
+            b'' if self.reactions is None or self.reactions is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.reactions)),b''.join(x._bytes() for x in self.reactions))),
+            b'' if self.reactions_count is None or self.reactions_count is False else (struct.pack('<i', self.reactions_count)),
+            b'' if self.recent_viewers is None or self.recent_viewers is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}q'.format(len(self.recent_viewers)), len(self.recent_viewers), *self.recent_viewers))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _views_count = reader.read_struct(_struct_ii)
+        _has_viewers = bool(flags & 2)
+        if flags & 4:
+            _forwards_count = reader.read_int()
+        else:
+            _forwards_count = None
+        if flags & 8:
+            reader.read_int()
+            _reactions = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _reactions.append(_x)
+
+        else:
+            _reactions = None
+        if flags & 16:
+            _reactions_count = reader.read_int()
+        else:
+            _reactions_count = None
+        if flags & 1:
+            reader.read_int()
+            _recent_viewers = reader.read_array('q', reader.read_int())
+        else:
+            _recent_viewers = None
+        return cls(views_count=_views_count, has_viewers=_has_viewers, forwards_count=_forwards_count, reactions=_reactions, reactions_count=_reactions_count, recent_viewers=_recent_viewers)
+
+TypeStoryViews = StoryViews
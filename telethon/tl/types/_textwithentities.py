@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeMessageEntity
+
+
+
+class TextWithEntities(TLObject):
+    CONSTRUCTOR_ID = 0x751f3146
+    SUBCLASS_OF_ID = 0x95ca4b05
+    __slots__ = ('text', 'entities')
+
+    def __init__(self, text: str, entities: List['TypeMessageEntity']):
+        """
+        Constructor for TextWithEntities: Instance of TextWithEntities.
+        """
+        self.text = text
+        self.entities = entities
+
+    def to_dict(self):
+        return {
+            '_': 'TextWithEntities',
+            'text': self.text,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'F1\x1fu',
+            self.serialize_bytes(self.text),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _text = reader.tgread_string()
+        reader.read_int()
+        _entities = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _entities.append(_x)
+
+        return cls(text=_text, entities=_entities)
+
+TypeTextWithEntities = TextWithEntities
@@ -0,0 +1,96 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iqq = struct.Struct('<Iqq')
+_struct_iqq = struct.Struct('<iqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeThemeSettings
+
+
+
+class Theme(TLObject):
+    CONSTRUCTOR_ID = 0xa00e67d6
+    SUBCLASS_OF_ID = 0x56b4c80c
+    __slots__ = ('id', 'access_hash', 'slug', 'title', 'creator', 'default', 'for_chat', 'document', 'settings', 'emoticon', 'installs_count')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, slug: str, title: str, creator: Optional[bool]=None, default: Optional[bool]=None, for_chat: Optional[bool]=None, document: Optional['TypeDocument']=None, settings: Optional[List['TypeThemeSettings']]=None, emoticon: Optional[str]=None, installs_count: Optional[int]=None):
+        """
+        Constructor for Theme: Instance of Theme.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.slug = slug
+        self.title = title
+        self.creator = creator
+        self.default = default
+        self.for_chat = for_chat
+        self.document = document
+        self.settings = settings
+        self.emoticon = emoticon
+        self.installs_count = installs_count
+
+    def to_dict(self):
+        return {
+            '_': 'Theme',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'slug': self.slug,
+            'title': self.title,
+            'creator': self.creator,
+            'default': self.default,
+            'for_chat': self.for_chat,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'settings': [] if self.settings is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.settings],
+            'emoticon': self.emoticon,
+            'installs_count': self.installs_count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd6g\x0e\xa0',
+            _struct_Iqq.pack((0 if self.creator is None or self.creator is False else 1) | (0 if self.default is None or self.default is False else 2) | (0 if self.for_chat is None or self.for_chat is False else 32) | (0 if self.document is None or self.document is False else 4) | (0 if self.settings is None or self.settings is False else 8) | (0 if self.emoticon is None or self.emoticon is False else 64) | (0 if self.installs_count is None or self.installs_count is False else 16), self.id, self.access_hash),
+            self.serialize_bytes(self.slug),
+            self.serialize_bytes(self.title),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+            b'' if self.settings is None or self.settings is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.settings)),b''.join(x._bytes() for x in self.settings))),
+            b'' if self.emoticon is None or self.emoticon is False else (self.serialize_bytes(self.emoticon)),
+            b'' if self.installs_count is None or self.installs_count is False else (struct.pack('<i', self.installs_count)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _access_hash = reader.read_struct(_struct_iqq)
+        _creator = bool(flags & 1)
+        _default = bool(flags & 2)
+        _for_chat = bool(flags & 32)
+        _slug = reader.tgread_string()
+        _title = reader.tgread_string()
+        if flags & 4:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        if flags & 8:
+            reader.read_int()
+            _settings = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _settings.append(_x)
+
+        else:
+            _settings = None
+        if flags & 64:
+            _emoticon = reader.tgread_string()
+        else:
+            _emoticon = None
+        if flags & 16:
+            _installs_count = reader.read_int()
+        else:
+            _installs_count = None
+        return cls(id=_id, access_hash=_access_hash, slug=_slug, title=_title, creator=_creator, default=_default, for_chat=_for_chat, document=_document, settings=_settings, emoticon=_emoticon, installs_count=_installs_count)
+
+TypeTheme = Theme
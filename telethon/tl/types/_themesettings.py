@@ -0,0 +1,72 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeBaseTheme, TypeWallPaper
+
+
+
+class ThemeSettings(TLObject):
+    CONSTRUCTOR_ID = 0xfa58b6d4
+    SUBCLASS_OF_ID = 0x82666d38
+    __slots__ = ('base_theme', 'accent_color', 'message_colors_animated', 'outbox_accent_color', 'message_colors', 'wallpaper')
+
+    def __init__(self, base_theme: 'TypeBaseTheme', accent_color: int, message_colors_animated: Optional[bool]=None, outbox_accent_color: Optional[int]=None, message_colors: Optional[List[int]]=None, wallpaper: Optional['TypeWallPaper']=None):
+        """
+        Constructor for ThemeSettings: Instance of ThemeSettings.
+        """
+        self.base_theme = base_theme
+        self.accent_color = accent_color
+        self.message_colors_animated = message_colors_animated
+        self.outbox_accent_color = outbox_accent_color
+        self.message_colors = message_colors
+        self.wallpaper = wallpaper
+
+    def to_dict(self):
+        return {
+            '_': 'ThemeSettings',
+            'base_theme': self.base_theme.to_dict() if isinstance(self.base_theme, TLObject) else self.base_theme,
+            'accent_color': self.accent_color,
+            'message_colors_animated': self.message_colors_animated,
+            'outbox_accent_color': self.outbox_accent_color,
+            'message_colors': [] if self.message_colors is None else self.message_colors[:],
+            'wallpaper': self.wallpaper.to_dict() if isinstance(self.wallpaper, TLObject) else self.wallpaper
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd4\xb6X\xfa',
+            struct.pack('<I', (0 if self.message_colors_animated is None or self.message_colors_animated is False else 4) | (0 if self.outbox_accent_color is None or self.outbox_accent_color is False else 8) | (0 if self.message_colors is None or self.message_colors is False else 1) | (0 if self.wallpaper is None or self.wallpaper is False else 2)),
+            self.base_theme._bytes(),
+            struct.pack('<i', self.accent_color),
+            b'' if self.outbox_accent_color is None or self.outbox_accent_color is False else (struct.pack('<i', self.outbox_accent_color)),
+            b'' if self.message_colors is None or self.message_colors is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.message_colors)), len(self.message_colors), *self.message_colors))),
+            b'' if self.wallpaper is None or self.wallpaper is False else (self.wallpaper._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _message_colors_animated = bool(flags & 4)
+        _base_theme = reader.tgread_object()
+        _accent_color = reader.read_int()
+        if flags & 8:
+            _outbox_accent_color = reader.read_int()
+        else:
+            _outbox_accent_color = None
+        if flags & 1:
+            reader.read_int()
+            _message_colors = reader.read_array('i', reader.read_int())
+        else:
+            _message_colors = None
+        if flags & 2:
+            _wallpaper = reader.tgread_object()
+        else:
+            _wallpaper = None
+        return cls(base_theme=_base_theme, accent_color=_accent_color, message_colors_animated=_message_colors_animated, outbox_accent_color=_outbox_accent_color, message_colors=_message_colors, wallpaper=_wallpaper)
+
+TypeThemeSettings = ThemeSettings
@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class Timezone(TLObject):
+    CONSTRUCTOR_ID = 0xff9289f5
+    SUBCLASS_OF_ID = 0xce77d0c1
+    __slots__ = ('id', 'name', 'utc_offset')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: str, name: str, utc_offset: int):
+        """
+        Constructor for Timezone: Instance of Timezone.
+        """
+        self.id = id
+        self.name = name
+        self.utc_offset = utc_offset
+
+    def to_dict(self):
+        return {
+            '_': 'Timezone',
+            'id': self.id,
+            'name': self.name,
+            'utc_offset': self.utc_offset
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf5\x89\x92\xff',
+            self.serialize_bytes(self.id),
+            self.serialize_bytes(self.name),
+            struct.pack('<i', self.utc_offset),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.tgread_string()
+        _name = reader.tgread_string()
+        _utc_offset = reader.read_int()
+        return cls(id=_id, name=_name, utc_offset=_utc_offset)
+
+TypeTimezone = Timezone
@@ -0,0 +1,198 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class TlsBlockDomain(TLObject):
+    CONSTRUCTOR_ID = 0x10e8636f
+    SUBCLASS_OF_ID = 0xf1163490
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TlsBlockDomain'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'oc\xe8\x10',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TlsBlockGrease(TLObject):
+    CONSTRUCTOR_ID = 0xe675a1c1
+    SUBCLASS_OF_ID = 0xf1163490
+    __slots__ = ('seed',)
+
+    def __init__(self, seed: int):
+        """
+        Constructor for TlsBlock: Instance of either TlsBlockString, TlsBlockRandom, TlsBlockZero, TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockScope.
+        """
+        self.seed = seed
+
+    def to_dict(self):
+        return {
+            '_': 'TlsBlockGrease',
+            'seed': self.seed
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc1\xa1u\xe6',
+            struct.pack('<i', self.seed),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _seed = reader.read_int()
+        return cls(seed=_seed)
+
+
+class TlsBlockPublicKey(TLObject):
+    CONSTRUCTOR_ID = 0x9eb95b5c
+    SUBCLASS_OF_ID = 0xf1163490
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TlsBlockPublicKey'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\\[\xb9\x9e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TlsBlockRandom(TLObject):
+    CONSTRUCTOR_ID = 0x4d4dc41e
+    SUBCLASS_OF_ID = 0xf1163490
+    __slots__ = ('length',)
+
+    def __init__(self, length: int):
+        """
+        Constructor for TlsBlock: Instance of either TlsBlockString, TlsBlockRandom, TlsBlockZero, TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockScope.
+        """
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'TlsBlockRandom',
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1e\xc4MM',
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _length = reader.read_int()
+        return cls(length=_length)
+
+
+class TlsBlockScope(TLObject):
+    CONSTRUCTOR_ID = 0xe725d44f
+    SUBCLASS_OF_ID = 0xf1163490
+    __slots__ = ('entries',)
+
+    def __init__(self, entries: List['TypeTlsBlock']):
+        """
+        Constructor for TlsBlock: Instance of either TlsBlockString, TlsBlockRandom, TlsBlockZero, TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockScope.
+        """
+        self.entries = entries
+
+    def to_dict(self):
+        return {
+            '_': 'TlsBlockScope',
+            'entries': [] if self.entries is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entries]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\xd4%\xe7',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entries)),b''.join(x._bytes() for x in self.entries),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _entries = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _entries.append(_x)
+
+        return cls(entries=_entries)
+
+
+class TlsBlockString(TLObject):
+    CONSTRUCTOR_ID = 0x4218a164
+    SUBCLASS_OF_ID = 0xf1163490
+    __slots__ = ('data',)
+
+    def __init__(self, data: str):
+        """
+        Constructor for TlsBlock: Instance of either TlsBlockString, TlsBlockRandom, TlsBlockZero, TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockScope.
+        """
+        self.data = data
+
+    def to_dict(self):
+        return {
+            '_': 'TlsBlockString',
+            'data': self.data
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'd\xa1\x18B',
+            self.serialize_bytes(self.data),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _data = reader.tgread_string()
+        return cls(data=_data)
+
+
+class TlsBlockZero(TLObject):
+    CONSTRUCTOR_ID = 0x9333afb
+    SUBCLASS_OF_ID = 0xf1163490
+    __slots__ = ('length',)
+
+    def __init__(self, length: int):
+        """
+        Constructor for TlsBlock: Instance of either TlsBlockString, TlsBlockRandom, TlsBlockZero, TlsBlockDomain, TlsBlockGrease, TlsBlockPublicKey, TlsBlockScope.
+        """
+        self.length = length
+
+    def to_dict(self):
+        return {
+            '_': 'TlsBlockZero',
+            'length': self.length
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfb:3\t',
+            struct.pack('<i', self.length),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _length = reader.read_int()
+        return cls(length=_length)
+
+TypeTlsBlock = Union[TlsBlockString,TlsBlockRandom,TlsBlockZero,TlsBlockDomain,TlsBlockGrease,TlsBlockPublicKey,TlsBlockScope]
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeTlsBlock
+
+
+
+class TlsClientHello(TLObject):
+    CONSTRUCTOR_ID = 0x6c52c484
+    SUBCLASS_OF_ID = 0xbef20920
+    __slots__ = ('blocks',)
+
+    def __init__(self, blocks: List['TypeTlsBlock']):
+        """
+        Constructor for TlsClientHello: Instance of TlsClientHello.
+        """
+        self.blocks = blocks
+
+    def to_dict(self):
+        return {
+            '_': 'TlsClientHello',
+            'blocks': [] if self.blocks is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.blocks]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x84\xc4Rl',
+            struct.pack('<i', len(self.blocks)),b''.join(x._bytes() for x in self.blocks),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _blocks = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _blocks.append(_x)
+
+        return cls(blocks=_blocks)
+
+TypeTlsClientHello = TlsClientHello
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypePeer
+
+
+
+class TopPeer(TLObject):
+    CONSTRUCTOR_ID = 0xedcdc05b
+    SUBCLASS_OF_ID = 0x6916c601
+    __slots__ = ('peer', 'rating')
+
+    def __init__(self, peer: 'TypePeer', rating: float):
+        """
+        Constructor for TopPeer: Instance of TopPeer.
+        """
+        self.peer = peer
+        self.rating = rating
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeer',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'rating': self.rating
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'[\xc0\xcd\xed',
+            self.peer._bytes(),
+            struct.pack('<d', self.rating),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _peer = reader.tgread_object()
+        _rating = reader.read_double()
+        return cls(peer=_peer, rating=_rating)
+
+TypeTopPeer = TopPeer
@@ -0,0 +1,188 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class TopPeerCategoryBotsApp(TLObject):
+    CONSTRUCTOR_ID = 0xfd9e7bec
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryBotsApp'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xec{\x9e\xfd',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryBotsInline(TLObject):
+    CONSTRUCTOR_ID = 0x148677e2
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryBotsInline'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe2w\x86\x14',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryBotsPM(TLObject):
+    CONSTRUCTOR_ID = 0xab661b5b
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryBotsPM'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'[\x1bf\xab',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryChannels(TLObject):
+    CONSTRUCTOR_ID = 0x161d9628
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryChannels'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'(\x96\x1d\x16',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryCorrespondents(TLObject):
+    CONSTRUCTOR_ID = 0x637b7ed
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryCorrespondents'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed\xb77\x06',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryForwardChats(TLObject):
+    CONSTRUCTOR_ID = 0xfbeec0f0
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryForwardChats'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf0\xc0\xee\xfb',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryForwardUsers(TLObject):
+    CONSTRUCTOR_ID = 0xa8406ca9
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryForwardUsers'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa9l@\xa8',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryGroups(TLObject):
+    CONSTRUCTOR_ID = 0xbd17a14a
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryGroups'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'J\xa1\x17\xbd',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class TopPeerCategoryPhoneCalls(TLObject):
+    CONSTRUCTOR_ID = 0x1e76a78c
+    SUBCLASS_OF_ID = 0xddf02502
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryPhoneCalls'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x8c\xa7v\x1e',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeTopPeerCategory = Union[TopPeerCategoryBotsPM,TopPeerCategoryBotsInline,TopPeerCategoryCorrespondents,TopPeerCategoryGroups,TopPeerCategoryChannels,TopPeerCategoryPhoneCalls,TopPeerCategoryForwardUsers,TopPeerCategoryForwardChats,TopPeerCategoryBotsApp]
@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeTopPeer, TypeTopPeerCategory
+
+
+
+class TopPeerCategoryPeers(TLObject):
+    CONSTRUCTOR_ID = 0xfb834291
+    SUBCLASS_OF_ID = 0x4aec930
+    __slots__ = ('category', 'count', 'peers')
+
+    def __init__(self, category: 'TypeTopPeerCategory', count: int, peers: List['TypeTopPeer']):
+        """
+        Constructor for TopPeerCategoryPeers: Instance of TopPeerCategoryPeers.
+        """
+        self.category = category
+        self.count = count
+        self.peers = peers
+
+    def to_dict(self):
+        return {
+            '_': 'TopPeerCategoryPeers',
+            'category': self.category.to_dict() if isinstance(self.category, TLObject) else self.category,
+            'count': self.count,
+            'peers': [] if self.peers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.peers]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x91B\x83\xfb',
+            self.category._bytes(),
+            struct.pack('<i', self.count),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.peers)),b''.join(x._bytes() for x in self.peers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _category = reader.tgread_object()
+        _count = reader.read_int()
+        reader.read_int()
+        _peers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _peers.append(_x)
+
+        return cls(category=_category, count=_count, peers=_peers)
+
+TypeTopPeerCategoryPeers = TopPeerCategoryPeers
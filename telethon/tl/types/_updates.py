@@ -0,0 +1,459 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iiii = struct.Struct('<Iiii')
+_struct_Iiq = struct.Struct('<Iiq')
+_struct_Iiqq = struct.Struct('<Iiqq')
+_struct_ii = struct.Struct('<ii')
+_struct_iiii = struct.Struct('<iiii')
+_struct_iiq = struct.Struct('<iiq')
+_struct_iiqq = struct.Struct('<iiqq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeMessageEntity, TypeMessageFwdHeader, TypeMessageMedia, TypeMessageReplyHeader, TypeUpdate, TypeUser
+
+
+
+class UpdateShort(TLObject):
+    CONSTRUCTOR_ID = 0x78d4dec1
+    SUBCLASS_OF_ID = 0x8af52aac
+    __slots__ = ('update', 'date', '_entities')
+
+    def __init__(self, update: 'TypeUpdate', date: Optional[datetime]):
+        """
+        Constructor for Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.update = update
+        self.date = date
+
+    def to_dict(self):
+        return {
+            '_': 'UpdateShort',
+            'update': self.update.to_dict() if isinstance(self.update, TLObject) else self.update,
+            'date': self.date
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc1\xde\xd4x',
+            self.update._bytes(),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _update = reader.tgread_object()
+        _date = reader.tgread_date()
+        return cls(update=_update, date=_date)
+
+
+class UpdateShortChatMessage(TLObject):
+    CONSTRUCTOR_ID = 0x4d6deea5
+    SUBCLASS_OF_ID = 0x8af52aac
+    __slots__ = ('id', 'from_id', 'chat_id', 'message', 'pts', 'pts_count', 'date', 'out', 'mentioned', 'media_unread', 'silent', 'fwd_from', 'via_bot_id', 'reply_to', 'entities', 'ttl_period', '_entities')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, from_id: int, chat_id: int, message: str, pts: int, pts_count: int, date: Optional[datetime], out: Optional[bool]=None, mentioned: Optional[bool]=None, media_unread: Optional[bool]=None, silent: Optional[bool]=None, fwd_from: Optional['TypeMessageFwdHeader']=None, via_bot_id: Optional[int]=None, reply_to: Optional['TypeMessageReplyHeader']=None, entities: Optional[List['TypeMessageEntity']]=None, ttl_period: Optional[int]=None):
+        """
+        Constructor for Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.id = id
+        self.from_id = from_id
+        self.chat_id = chat_id
+        self.message = message
+        self.pts = pts
+        self.pts_count = pts_count
+        self.date = date
+        self.out = out
+        self.mentioned = mentioned
+        self.media_unread = media_unread
+        self.silent = silent
+        self.fwd_from = fwd_from
+        self.via_bot_id = via_bot_id
+        self.reply_to = reply_to
+        self.entities = entities
+        self.ttl_period = ttl_period
+
+    def to_dict(self):
+        return {
+            '_': 'UpdateShortChatMessage',
+            'id': self.id,
+            'from_id': self.from_id,
+            'chat_id': self.chat_id,
+            'message': self.message,
+            'pts': self.pts,
+            'pts_count': self.pts_count,
+            'date': self.date,
+            'out': self.out,
+            'mentioned': self.mentioned,
+            'media_unread': self.media_unread,
+            'silent': self.silent,
+            'fwd_from': self.fwd_from.to_dict() if isinstance(self.fwd_from, TLObject) else self.fwd_from,
+            'via_bot_id': self.via_bot_id,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'ttl_period': self.ttl_period
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa5\xeemM',
+            _struct_Iiqq.pack((0 if self.out is None or self.out is False else 2) | (0 if self.mentioned is None or self.mentioned is False else 16) | (0 if self.media_unread is None or self.media_unread is False else 32) | (0 if self.silent is None or self.silent is False else 8192) | (0 if self.fwd_from is None or self.fwd_from is False else 4) | (0 if self.via_bot_id is None or self.via_bot_id is False else 2048) | (0 if self.reply_to is None or self.reply_to is False else 8) | (0 if self.entities is None or self.entities is False else 128) | (0 if self.ttl_period is None or self.ttl_period is False else 33554432), self.id, self.from_id, self.chat_id),
+            self.serialize_bytes(self.message),
+            _struct_ii.pack(self.pts, self.pts_count),
+            self.serialize_datetime(self.date),
+            b'' if self.fwd_from is None or self.fwd_from is False else (self.fwd_from._bytes()),
+            b'' if self.via_bot_id is None or self.via_bot_id is False else (struct.pack('<q', self.via_bot_id)),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _from_id, _chat_id = reader.read_struct(_struct_iiqq)
+        _out = bool(flags & 2)
+        _mentioned = bool(flags & 16)
+        _media_unread = bool(flags & 32)
+        _silent = bool(flags & 8192)
+        _message = reader.tgread_string()
+        _pts, _pts_count = reader.read_struct(_struct_ii)
+        _date = reader.tgread_date()
+        if flags & 4:
+            _fwd_from = reader.tgread_object()
+        else:
+            _fwd_from = None
+        if flags & 2048:
+            _via_bot_id = reader.read_long()
+        else:
+            _via_bot_id = None
+        if flags & 8:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        if flags & 128:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 33554432:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        return cls(id=_id, from_id=_from_id, chat_id=_chat_id, message=_message, pts=_pts, pts_count=_pts_count, date=_date, out=_out, mentioned=_mentioned, media_unread=_media_unread, silent=_silent, fwd_from=_fwd_from, via_bot_id=_via_bot_id, reply_to=_reply_to, entities=_entities, ttl_period=_ttl_period)
+
+
+class UpdateShortMessage(TLObject):
+    CONSTRUCTOR_ID = 0x313bc7f8
+    SUBCLASS_OF_ID = 0x8af52aac
+    __slots__ = ('id', 'user_id', 'message', 'pts', 'pts_count', 'date', 'out', 'mentioned', 'media_unread', 'silent', 'fwd_from', 'via_bot_id', 'reply_to', 'entities', 'ttl_period', '_entities')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, user_id: int, message: str, pts: int, pts_count: int, date: Optional[datetime], out: Optional[bool]=None, mentioned: Optional[bool]=None, media_unread: Optional[bool]=None, silent: Optional[bool]=None, fwd_from: Optional['TypeMessageFwdHeader']=None, via_bot_id: Optional[int]=None, reply_to: Optional['TypeMessageReplyHeader']=None, entities: Optional[List['TypeMessageEntity']]=None, ttl_period: Optional[int]=None):
+        """
+        Constructor for Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.id = id
+        self.user_id = user_id
+        self.message = message
+        self.pts = pts
+        self.pts_count = pts_count
+        self.date = date
+        self.out = out
+        self.mentioned = mentioned
+        self.media_unread = media_unread
+        self.silent = silent
+        self.fwd_from = fwd_from
+        self.via_bot_id = via_bot_id
+        self.reply_to = reply_to
+        self.entities = entities
+        self.ttl_period = ttl_period
+
+    def to_dict(self):
+        return {
+            '_': 'UpdateShortMessage',
+            'id': self.id,
+            'user_id': self.user_id,
+            'message': self.message,
+            'pts': self.pts,
+            'pts_count': self.pts_count,
+            'date': self.date,
+            'out': self.out,
+            'mentioned': self.mentioned,
+            'media_unread': self.media_unread,
+            'silent': self.silent,
+            'fwd_from': self.fwd_from.to_dict() if isinstance(self.fwd_from, TLObject) else self.fwd_from,
+            'via_bot_id': self.via_bot_id,
+            'reply_to': self.reply_to.to_dict() if isinstance(self.reply_to, TLObject) else self.reply_to,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'ttl_period': self.ttl_period
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xf8\xc7;1',
+            _struct_Iiq.pack((0 if self.out is None or self.out is False else 2) | (0 if self.mentioned is None or self.mentioned is False else 16) | (0 if self.media_unread is None or self.media_unread is False else 32) | (0 if self.silent is None or self.silent is False else 8192) | (0 if self.fwd_from is None or self.fwd_from is False else 4) | (0 if self.via_bot_id is None or self.via_bot_id is False else 2048) | (0 if self.reply_to is None or self.reply_to is False else 8) | (0 if self.entities is None or self.entities is False else 128) | (0 if self.ttl_period is None or self.ttl_period is False else 33554432), self.id, self.user_id),
+            self.serialize_bytes(self.message),
+            _struct_ii.pack(self.pts, self.pts_count),
+            self.serialize_datetime(self.date),
+            b'' if self.fwd_from is None or self.fwd_from is False else (self.fwd_from._bytes()),
+            b'' if self.via_bot_id is None or self.via_bot_id is False else (struct.pack('<q', self.via_bot_id)),
+            b'' if self.reply_to is None or self.reply_to is False else (self.reply_to._bytes()),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _user_id = reader.read_struct(_struct_iiq)
+        _out = bool(flags & 2)
+        _mentioned = bool(flags & 16)
+        _media_unread = bool(flags & 32)
+        _silent = bool(flags & 8192)
+        _message = reader.tgread_string()
+        _pts, _pts_count = reader.read_struct(_struct_ii)
+        _date = reader.tgread_date()
+        if flags & 4:
+            _fwd_from = reader.tgread_object()
+        else:
+            _fwd_from = None
+        if flags & 2048:
+            _via_bot_id = reader.read_long()
+        else:
+            _via_bot_id = None
+        if flags & 8:
+            _reply_to = reader.tgread_object()
+        else:
+            _reply_to = None
+        if flags & 128:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 33554432:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        return cls(id=_id, user_id=_user_id, message=_message, pts=_pts, pts_count=_pts_count, date=_date, out=_out, mentioned=_mentioned, media_unread=_media_unread, silent=_silent, fwd_from=_fwd_from, via_bot_id=_via_bot_id, reply_to=_reply_to, entities=_entities, ttl_period=_ttl_period)
+
+
+class UpdateShortSentMessage(TLObject):
+    CONSTRUCTOR_ID = 0x9015e101
+    SUBCLASS_OF_ID = 0x8af52aac
+    __slots__ = ('id', 'pts', 'pts_count', 'date', 'out', 'media', 'entities', 'ttl_period', '_entities')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, pts: int, pts_count: int, date: Optional[datetime], out: Optional[bool]=None, media: Optional['TypeMessageMedia']=None, entities: Optional[List['TypeMessageEntity']]=None, ttl_period: Optional[int]=None):
+        """
+        Constructor for Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.id = id
+        self.pts = pts
+        self.pts_count = pts_count
+        self.date = date
+        self.out = out
+        self.media = media
+        self.entities = entities
+        self.ttl_period = ttl_period
+
+    def to_dict(self):
+        return {
+            '_': 'UpdateShortSentMessage',
+            'id': self.id,
+            'pts': self.pts,
+            'pts_count': self.pts_count,
+            'date': self.date,
+            'out': self.out,
+            'media': self.media.to_dict() if isinstance(self.media, TLObject) else self.media,
+            'entities': [] if self.entities is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.entities],
+            'ttl_period': self.ttl_period
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x01\xe1\x15\x90',
+            _struct_Iiii.pack((0 if self.out is None or self.out is False else 2) | (0 if self.media is None or self.media is False else 512) | (0 if self.entities is None or self.entities is False else 128) | (0 if self.ttl_period is None or self.ttl_period is False else 33554432), self.id, self.pts, self.pts_count),
+            self.serialize_datetime(self.date),
+            b'' if self.media is None or self.media is False else (self.media._bytes()),
+            b'' if self.entities is None or self.entities is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.entities)),b''.join(x._bytes() for x in self.entities))),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id, _pts, _pts_count = reader.read_struct(_struct_iiii)
+        _out = bool(flags & 2)
+        _date = reader.tgread_date()
+        if flags & 512:
+            _media = reader.tgread_object()
+        else:
+            _media = None
+        if flags & 128:
+            reader.read_int()
+            _entities = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _entities.append(_x)
+
+        else:
+            _entities = None
+        if flags & 33554432:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        return cls(id=_id, pts=_pts, pts_count=_pts_count, date=_date, out=_out, media=_media, entities=_entities, ttl_period=_ttl_period)
+
+
+class Updates(TLObject):
+    CONSTRUCTOR_ID = 0x74ae4240
+    SUBCLASS_OF_ID = 0x8af52aac
+    __slots__ = ('updates', 'users', 'chats', 'date', 'seq', '_entities')
+
+    def __init__(self, updates: List['TypeUpdate'], users: List['TypeUser'], chats: List['TypeChat'], date: Optional[datetime], seq: int):
+        """
+        Constructor for Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.updates = updates
+        self.users = users
+        self.chats = chats
+        self.date = date
+        self.seq = seq
+
+    def to_dict(self):
+        return {
+            '_': 'Updates',
+            'updates': [] if self.updates is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.updates],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'date': self.date,
+            'seq': self.seq
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'@B\xaet',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.updates)),b''.join(x._bytes() for x in self.updates),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            self.serialize_datetime(self.date),
+            struct.pack('<i', self.seq),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _updates = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _updates.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        _date = reader.tgread_date()
+        _seq = reader.read_int()
+        return cls(updates=_updates, users=_users, chats=_chats, date=_date, seq=_seq)
+
+
+class UpdatesCombined(TLObject):
+    CONSTRUCTOR_ID = 0x725b04c3
+    SUBCLASS_OF_ID = 0x8af52aac
+    __slots__ = ('updates', 'users', 'chats', 'date', 'seq_start', 'seq', '_entities')
+
+    def __init__(self, updates: List['TypeUpdate'], users: List['TypeUser'], chats: List['TypeChat'], date: Optional[datetime], seq_start: int, seq: int):
+        """
+        Constructor for Updates: Instance of either UpdatesTooLong, UpdateShortMessage, UpdateShortChatMessage, UpdateShort, UpdatesCombined, Updates, UpdateShortSentMessage.
+        """
+        self.updates = updates
+        self.users = users
+        self.chats = chats
+        self.date = date
+        self.seq_start = seq_start
+        self.seq = seq
+
+    def to_dict(self):
+        return {
+            '_': 'UpdatesCombined',
+            'updates': [] if self.updates is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.updates],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'date': self.date,
+            'seq_start': self.seq_start,
+            'seq': self.seq
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc3\x04[r',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.updates)),b''.join(x._bytes() for x in self.updates),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            self.serialize_datetime(self.date),
+            _struct_ii.pack(self.seq_start, self.seq),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _updates = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _updates.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        _date = reader.tgread_date()
+        _seq_start, _seq = reader.read_struct(_struct_ii)
+        return cls(updates=_updates, users=_users, chats=_chats, date=_date, seq_start=_seq_start, seq=_seq)
+
+
+class UpdatesTooLong(TLObject):
+    CONSTRUCTOR_ID = 0xe317af7e
+    SUBCLASS_OF_ID = 0x8af52aac
+    __slots__ = ('_entities',)
+
+    def to_dict(self):
+        return {
+            '_': 'UpdatesTooLong'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'~\xaf\x17\xe3',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+TypeUpdates = Union[UpdatesTooLong,UpdateShortMessage,UpdateShortChatMessage,UpdateShort,UpdatesCombined,Updates,UpdateShortSentMessage]
@@ -0,0 +1,196 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Ii = struct.Struct('<Ii')
+_struct_ii = struct.Struct('<ii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeDialog, TypeMessage, TypeUpdate, TypeUser
+
+
+
+class ChannelDifference(TLObject):
+    CONSTRUCTOR_ID = 0x2064674e
+    SUBCLASS_OF_ID = 0x29896f5d
+    __slots__ = ('pts', 'new_messages', 'other_updates', 'chats', 'users', 'final', 'timeout')
+
+    def __init__(self, pts: int, new_messages: List['TypeMessage'], other_updates: List['TypeUpdate'], chats: List['TypeChat'], users: List['TypeUser'], final: Optional[bool]=None, timeout: Optional[int]=None):
+        """
+        Constructor for updates.ChannelDifference: Instance of either ChannelDifferenceEmpty, ChannelDifferenceTooLong, ChannelDifference.
+        """
+        self.pts = pts
+        self.new_messages = new_messages
+        self.other_updates = other_updates
+        self.chats = chats
+        self.users = users
+        self.final = final
+        self.timeout = timeout
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelDifference',
+            'pts': self.pts,
+            'new_messages': [] if self.new_messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.new_messages],
+            'other_updates': [] if self.other_updates is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.other_updates],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'final': self.final,
+            'timeout': self.timeout
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'Ngd ',
+            _struct_Ii.pack((0 if self.final is None or self.final is False else 1) | (0 if self.timeout is None or self.timeout is False else 2), self.pts),
+            b'' if self.timeout is None or self.timeout is False else (struct.pack('<i', self.timeout)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.new_messages)),b''.join(x._bytes() for x in self.new_messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.other_updates)),b''.join(x._bytes() for x in self.other_updates),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _pts = reader.read_struct(_struct_ii)
+        _final = bool(flags & 1)
+        if flags & 2:
+            _timeout = reader.read_int()
+        else:
+            _timeout = None
+        reader.read_int()
+        _new_messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _new_messages.append(_x)
+
+        reader.read_int()
+        _other_updates = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _other_updates.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(pts=_pts, new_messages=_new_messages, other_updates=_other_updates, chats=_chats, users=_users, final=_final, timeout=_timeout)
+
+
+class ChannelDifferenceEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x3e11affb
+    SUBCLASS_OF_ID = 0x29896f5d
+    __slots__ = ('pts', 'final', 'timeout')
+
+    def __init__(self, pts: int, final: Optional[bool]=None, timeout: Optional[int]=None):
+        """
+        Constructor for updates.ChannelDifference: Instance of either ChannelDifferenceEmpty, ChannelDifferenceTooLong, ChannelDifference.
+        """
+        self.pts = pts
+        self.final = final
+        self.timeout = timeout
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelDifferenceEmpty',
+            'pts': self.pts,
+            'final': self.final,
+            'timeout': self.timeout
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfb\xaf\x11>',
+            _struct_Ii.pack((0 if self.final is None or self.final is False else 1) | (0 if self.timeout is None or self.timeout is False else 2), self.pts),
+            b'' if self.timeout is None or self.timeout is False else (struct.pack('<i', self.timeout)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _pts = reader.read_struct(_struct_ii)
+        _final = bool(flags & 1)
+        if flags & 2:
+            _timeout = reader.read_int()
+        else:
+            _timeout = None
+        return cls(pts=_pts, final=_final, timeout=_timeout)
+
+
+class ChannelDifferenceTooLong(TLObject):
+    CONSTRUCTOR_ID = 0xa4bcc6fe
+    SUBCLASS_OF_ID = 0x29896f5d
+    __slots__ = ('dialog', 'messages', 'chats', 'users', 'final', 'timeout')
+
+    def __init__(self, dialog: 'TypeDialog', messages: List['TypeMessage'], chats: List['TypeChat'], users: List['TypeUser'], final: Optional[bool]=None, timeout: Optional[int]=None):
+        """
+        Constructor for updates.ChannelDifference: Instance of either ChannelDifferenceEmpty, ChannelDifferenceTooLong, ChannelDifference.
+        """
+        self.dialog = dialog
+        self.messages = messages
+        self.chats = chats
+        self.users = users
+        self.final = final
+        self.timeout = timeout
+
+    def to_dict(self):
+        return {
+            '_': 'ChannelDifferenceTooLong',
+            'dialog': self.dialog.to_dict() if isinstance(self.dialog, TLObject) else self.dialog,
+            'messages': [] if self.messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.messages],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'final': self.final,
+            'timeout': self.timeout
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfe\xc6\xbc\xa4',
+            struct.pack('<I', (0 if self.final is None or self.final is False else 1) | (0 if self.timeout is None or self.timeout is False else 2)),
+            b'' if self.timeout is None or self.timeout is False else (struct.pack('<i', self.timeout)),
+            self.dialog._bytes(),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.messages)),b''.join(x._bytes() for x in self.messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _final = bool(flags & 1)
+        if flags & 2:
+            _timeout = reader.read_int()
+        else:
+            _timeout = None
+        _dialog = reader.tgread_object()
+        reader.read_int()
+        _messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _messages.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        return cls(dialog=_dialog, messages=_messages, chats=_chats, users=_users, final=_final, timeout=_timeout)
+
@@ -0,0 +1,221 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeChat, TypeEncryptedMessage, TypeMessage, TypeUpdate, TypeUser
+    from ...tl.types.updates import TypeState
+
+
+
+class Difference(TLObject):
+    CONSTRUCTOR_ID = 0xf49ca0
+    SUBCLASS_OF_ID = 0x20482874
+    __slots__ = ('new_messages', 'new_encrypted_messages', 'other_updates', 'chats', 'users', 'state')
+
+    def __init__(self, new_messages: List['TypeMessage'], new_encrypted_messages: List['TypeEncryptedMessage'], other_updates: List['TypeUpdate'], chats: List['TypeChat'], users: List['TypeUser'], state: 'TypeState'):
+        """
+        Constructor for updates.Difference: Instance of either DifferenceEmpty, Difference, DifferenceSlice, DifferenceTooLong.
+        """
+        self.new_messages = new_messages
+        self.new_encrypted_messages = new_encrypted_messages
+        self.other_updates = other_updates
+        self.chats = chats
+        self.users = users
+        self.state = state
+
+    def to_dict(self):
+        return {
+            '_': 'Difference',
+            'new_messages': [] if self.new_messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.new_messages],
+            'new_encrypted_messages': [] if self.new_encrypted_messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.new_encrypted_messages],
+            'other_updates': [] if self.other_updates is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.other_updates],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'state': self.state.to_dict() if isinstance(self.state, TLObject) else self.state
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xa0\x9c\xf4\x00',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.new_messages)),b''.join(x._bytes() for x in self.new_messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.new_encrypted_messages)),b''.join(x._bytes() for x in self.new_encrypted_messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.other_updates)),b''.join(x._bytes() for x in self.other_updates),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            self.state._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _new_messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _new_messages.append(_x)
+
+        reader.read_int()
+        _new_encrypted_messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _new_encrypted_messages.append(_x)
+
+        reader.read_int()
+        _other_updates = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _other_updates.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        _state = reader.tgread_object()
+        return cls(new_messages=_new_messages, new_encrypted_messages=_new_encrypted_messages, other_updates=_other_updates, chats=_chats, users=_users, state=_state)
+
+
+class DifferenceEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x5d75a138
+    SUBCLASS_OF_ID = 0x20482874
+    __slots__ = ('date', 'seq')
+
+    def __init__(self, date: Optional[datetime], seq: int):
+        """
+        Constructor for updates.Difference: Instance of either DifferenceEmpty, Difference, DifferenceSlice, DifferenceTooLong.
+        """
+        self.date = date
+        self.seq = seq
+
+    def to_dict(self):
+        return {
+            '_': 'DifferenceEmpty',
+            'date': self.date,
+            'seq': self.seq
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'8\xa1u]',
+            self.serialize_datetime(self.date),
+            struct.pack('<i', self.seq),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _date = reader.tgread_date()
+        _seq = reader.read_int()
+        return cls(date=_date, seq=_seq)
+
+
+class DifferenceSlice(TLObject):
+    CONSTRUCTOR_ID = 0xa8fb1981
+    SUBCLASS_OF_ID = 0x20482874
+    __slots__ = ('new_messages', 'new_encrypted_messages', 'other_updates', 'chats', 'users', 'intermediate_state')
+
+    def __init__(self, new_messages: List['TypeMessage'], new_encrypted_messages: List['TypeEncryptedMessage'], other_updates: List['TypeUpdate'], chats: List['TypeChat'], users: List['TypeUser'], intermediate_state: 'TypeState'):
+        """
+        Constructor for updates.Difference: Instance of either DifferenceEmpty, Difference, DifferenceSlice, DifferenceTooLong.
+        """
+        self.new_messages = new_messages
+        self.new_encrypted_messages = new_encrypted_messages
+        self.other_updates = other_updates
+        self.chats = chats
+        self.users = users
+        self.intermediate_state = intermediate_state
+
+    def to_dict(self):
+        return {
+            '_': 'DifferenceSlice',
+            'new_messages': [] if self.new_messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.new_messages],
+            'new_encrypted_messages': [] if self.new_encrypted_messages is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.new_encrypted_messages],
+            'other_updates': [] if self.other_updates is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.other_updates],
+            'chats': [] if self.chats is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.chats],
+            'users': [] if self.users is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.users],
+            'intermediate_state': self.intermediate_state.to_dict() if isinstance(self.intermediate_state, TLObject) else self.intermediate_state
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x81\x19\xfb\xa8',
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.new_messages)),b''.join(x._bytes() for x in self.new_messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.new_encrypted_messages)),b''.join(x._bytes() for x in self.new_encrypted_messages),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.other_updates)),b''.join(x._bytes() for x in self.other_updates),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.chats)),b''.join(x._bytes() for x in self.chats),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.users)),b''.join(x._bytes() for x in self.users),
+            self.intermediate_state._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        reader.read_int()
+        _new_messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _new_messages.append(_x)
+
+        reader.read_int()
+        _new_encrypted_messages = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _new_encrypted_messages.append(_x)
+
+        reader.read_int()
+        _other_updates = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _other_updates.append(_x)
+
+        reader.read_int()
+        _chats = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _chats.append(_x)
+
+        reader.read_int()
+        _users = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _users.append(_x)
+
+        _intermediate_state = reader.tgread_object()
+        return cls(new_messages=_new_messages, new_encrypted_messages=_new_encrypted_messages, other_updates=_other_updates, chats=_chats, users=_users, intermediate_state=_intermediate_state)
+
+
+class DifferenceTooLong(TLObject):
+    CONSTRUCTOR_ID = 0x4afe8f6d
+    SUBCLASS_OF_ID = 0x20482874
+    __slots__ = ('pts',)
+
+    def __init__(self, pts: int):
+        """
+        Constructor for updates.Difference: Instance of either DifferenceEmpty, Difference, DifferenceSlice, DifferenceTooLong.
+        """
+        self.pts = pts
+
+    def to_dict(self):
+        return {
+            '_': 'DifferenceTooLong',
+            'pts': self.pts
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'm\x8f\xfeJ',
+            struct.pack('<i', self.pts),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pts = reader.read_int()
+        return cls(pts=_pts)
+
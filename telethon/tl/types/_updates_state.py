@@ -0,0 +1,50 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_ii = struct.Struct('<ii')
+
+
+class State(TLObject):
+    CONSTRUCTOR_ID = 0xa56c2a3e
+    SUBCLASS_OF_ID = 0x23df1a01
+    __slots__ = ('pts', 'qts', 'date', 'seq', 'unread_count')
+
+    def __init__(self, pts: int, qts: int, date: Optional[datetime], seq: int, unread_count: int):
+        """
+        Constructor for updates.State: Instance of State.
+        """
+        self.pts = pts
+        self.qts = qts
+        self.date = date
+        self.seq = seq
+        self.unread_count = unread_count
+
+    def to_dict(self):
+        return {
+            '_': 'State',
+            'pts': self.pts,
+            'qts': self.qts,
+            'date': self.date,
+            'seq': self.seq,
+            'unread_count': self.unread_count
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'>*l\xa5',
+            _struct_ii.pack(self.pts, self.qts),
+            self.serialize_datetime(self.date),
+            _struct_ii.pack(self.seq, self.unread_count),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _pts, _qts = reader.read_struct(_struct_ii)
+        _date = reader.tgread_date()
+        _seq, _unread_count = reader.read_struct(_struct_ii)
+        return cls(pts=_pts, qts=_qts, date=_date, seq=_seq, unread_count=_unread_count)
+
@@ -0,0 +1,66 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class CdnFile(TLObject):
+    CONSTRUCTOR_ID = 0xa99fca4f
+    SUBCLASS_OF_ID = 0xf5ccf928
+    __slots__ = ('bytes',)
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, bytes: bytes):
+        """
+        Constructor for upload.CdnFile: Instance of either CdnFileReuploadNeeded, CdnFile.
+        """
+        self.bytes = bytes
+
+    def to_dict(self):
+        return {
+            '_': 'CdnFile',
+            'bytes': self.bytes
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'O\xca\x9f\xa9',
+            self.serialize_bytes(self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _bytes = reader.tgread_bytes()
+        return cls(bytes=_bytes)
+
+
+class CdnFileReuploadNeeded(TLObject):
+    CONSTRUCTOR_ID = 0xeea8e46e
+    SUBCLASS_OF_ID = 0xf5ccf928
+    __slots__ = ('request_token',)
+
+    def __init__(self, request_token: bytes):
+        """
+        Constructor for upload.CdnFile: Instance of either CdnFileReuploadNeeded, CdnFile.
+        """
+        self.request_token = request_token
+
+    def to_dict(self):
+        return {
+            '_': 'CdnFileReuploadNeeded',
+            'request_token': self.request_token
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'n\xe4\xa8\xee',
+            self.serialize_bytes(self.request_token),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _request_token = reader.tgread_bytes()
+        return cls(request_token=_request_token)
+
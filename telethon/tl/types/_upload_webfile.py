@@ -0,0 +1,56 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types.storage import TypeFileType
+
+
+
+class WebFile(TLObject):
+    CONSTRUCTOR_ID = 0x21e753bc
+    SUBCLASS_OF_ID = 0x68f17f51
+    __slots__ = ('size', 'mime_type', 'file_type', 'mtime', 'bytes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, size: int, mime_type: str, file_type: 'TypeFileType', mtime: int, bytes: bytes):
+        """
+        Constructor for upload.WebFile: Instance of WebFile.
+        """
+        self.size = size
+        self.mime_type = mime_type
+        self.file_type = file_type
+        self.mtime = mtime
+        self.bytes = bytes
+
+    def to_dict(self):
+        return {
+            '_': 'WebFile',
+            'size': self.size,
+            'mime_type': self.mime_type,
+            'file_type': self.file_type.to_dict() if isinstance(self.file_type, TLObject) else self.file_type,
+            'mtime': self.mtime,
+            'bytes': self.bytes
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xbcS\xe7!',
+            struct.pack('<i', self.size),
+            self.serialize_bytes(self.mime_type),
+            self.file_type._bytes(),
+            struct.pack('<i', self.mtime),
+            self.serialize_bytes(self.bytes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _size = reader.read_int()
+        _mime_type = reader.tgread_string()
+        _file_type = reader.tgread_object()
+        _mtime = reader.read_int()
+        _bytes = reader.tgread_bytes()
+        return cls(size=_size, mime_type=_mime_type, file_type=_file_type, mtime=_mtime, bytes=_bytes)
+
@@ -0,0 +1,99 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeUser
+
+
+
+class UrlAuthResultAccepted(TLObject):
+    CONSTRUCTOR_ID = 0x8f8c0e4e
+    SUBCLASS_OF_ID = 0x7765cb1e
+    __slots__ = ('url',)
+
+    def __init__(self, url: str):
+        """
+        Constructor for UrlAuthResult: Instance of either UrlAuthResultRequest, UrlAuthResultAccepted, UrlAuthResultDefault.
+        """
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'UrlAuthResultAccepted',
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'N\x0e\x8c\x8f',
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        return cls(url=_url)
+
+
+class UrlAuthResultDefault(TLObject):
+    CONSTRUCTOR_ID = 0xa9d6db1f
+    SUBCLASS_OF_ID = 0x7765cb1e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'UrlAuthResultDefault'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1f\xdb\xd6\xa9',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class UrlAuthResultRequest(TLObject):
+    CONSTRUCTOR_ID = 0x92d33a0e
+    SUBCLASS_OF_ID = 0x7765cb1e
+    __slots__ = ('bot', 'domain', 'request_write_access')
+
+    def __init__(self, bot: 'TypeUser', domain: str, request_write_access: Optional[bool]=None):
+        """
+        Constructor for UrlAuthResult: Instance of either UrlAuthResultRequest, UrlAuthResultAccepted, UrlAuthResultDefault.
+        """
+        self.bot = bot
+        self.domain = domain
+        self.request_write_access = request_write_access
+
+    def to_dict(self):
+        return {
+            '_': 'UrlAuthResultRequest',
+            'bot': self.bot.to_dict() if isinstance(self.bot, TLObject) else self.bot,
+            'domain': self.domain,
+            'request_write_access': self.request_write_access
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x0e:\xd3\x92',
+            struct.pack('<I', (0 if self.request_write_access is None or self.request_write_access is False else 1)),
+            self.bot._bytes(),
+            self.serialize_bytes(self.domain),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _request_write_access = bool(flags & 1)
+        _bot = reader.tgread_object()
+        _domain = reader.tgread_string()
+        return cls(bot=_bot, domain=_domain, request_write_access=_request_write_access)
+
+TypeUrlAuthResult = Union[UrlAuthResultRequest,UrlAuthResultAccepted,UrlAuthResultDefault]
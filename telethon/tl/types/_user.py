@@ -0,0 +1,294 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_IIq = struct.Struct('<IIq')
+_struct_iiq = struct.Struct('<iiq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeEmojiStatus, TypePeerColor, TypeRestrictionReason, TypeUserProfilePhoto, TypeUserStatus, TypeUsername
+
+
+
+class User(TLObject):
+    CONSTRUCTOR_ID = 0x20b1422
+    SUBCLASS_OF_ID = 0x2da17977
+    __slots__ = ('id', 'is_self', 'contact', 'mutual_contact', 'deleted', 'bot', 'bot_chat_history', 'bot_nochats', 'verified', 'restricted', 'min', 'bot_inline_geo', 'support', 'scam', 'apply_min_photo', 'fake', 'bot_attach_menu', 'premium', 'attach_menu_enabled', 'bot_can_edit', 'close_friend', 'stories_hidden', 'stories_unavailable', 'contact_require_premium', 'bot_business', 'bot_has_main_app', 'access_hash', 'first_name', 'last_name', 'username', 'phone', 'photo', 'status', 'bot_info_version', 'restriction_reason', 'bot_inline_placeholder', 'lang_code', 'emoji_status', 'usernames', 'stories_max_id', 'color', 'profile_color', 'bot_active_users', 'bot_verification_icon', 'send_paid_messages_stars', 'participant')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, is_self: Optional[bool]=None, contact: Optional[bool]=None, mutual_contact: Optional[bool]=None, deleted: Optional[bool]=None, bot: Optional[bool]=None, bot_chat_history: Optional[bool]=None, bot_nochats: Optional[bool]=None, verified: Optional[bool]=None, restricted: Optional[bool]=None, min: Optional[bool]=None, bot_inline_geo: Optional[bool]=None, support: Optional[bool]=None, scam: Optional[bool]=None, apply_min_photo: Optional[bool]=None, fake: Optional[bool]=None, bot_attach_menu: Optional[bool]=None, premium: Optional[bool]=None, attach_menu_enabled: Optional[bool]=None, bot_can_edit: Optional[bool]=None, close_friend: Optional[bool]=None, stories_hidden: Optional[bool]=None, stories_unavailable: Optional[bool]=None, contact_require_premium: Optional[bool]=None, bot_business: Optional[bool]=None, bot_has_main_app: Optional[bool]=None, access_hash: Optional[int]=None, first_name: Optional[str]=None, last_name: Optional[str]=None, username: Optional[str]=None, phone: Optional[str]=None, photo: Optional['TypeUserProfilePhoto']=None, status: Optional['TypeUserStatus']=None, bot_info_version: Optional[int]=None, restriction_reason: Optional[List['TypeRestrictionReason']]=None, bot_inline_placeholder: Optional[str]=None, lang_code: Optional[str]=None, emoji_status: Optional['TypeEmojiStatus']=None, usernames: Optional[List['TypeUsername']]=None, stories_max_id: Optional[int]=None, color: Optional['TypePeerColor']=None, profile_color: Optional['TypePeerColor']=None, bot_active_users: Optional[int]=None, bot_verification_icon: Optional[int]=None, send_paid_messages_stars: Optional[int]=None):
+        """
+        Constructor for User: Instance of either UserEmpty, User.
+        """
+        self.id = id
+        self.is_self = is_self
+        self.contact = contact
+        self.mutual_contact = mutual_contact
+        self.deleted = deleted
+        self.bot = bot
+        self.bot_chat_history = bot_chat_history
+        self.bot_nochats = bot_nochats
+        self.verified = verified
+        self.restricted = restricted
+        self.min = min
+        self.bot_inline_geo = bot_inline_geo
+        self.support = support
+        self.scam = scam
+        self.apply_min_photo = apply_min_photo
+        self.fake = fake
+        self.bot_attach_menu = bot_attach_menu
+        self.premium = premium
+        self.attach_menu_enabled = attach_menu_enabled
+        self.bot_can_edit = bot_can_edit
+        self.close_friend = close_friend
+        self.stories_hidden = stories_hidden
+        self.stories_unavailable = stories_unavailable
+        self.contact_require_premium = contact_require_premium
+        self.bot_business = bot_business
+        self.bot_has_main_app = bot_has_main_app
+        self.access_hash = access_hash
+        self.first_name = first_name
+        self.last_name = last_name
+        self.username = username
+        self.phone = phone
+        self.photo = photo
+        self.status = status
+        self.bot_info_version = bot_info_version
+        self.restriction_reason = restriction_reason
+        self.bot_inline_placeholder = bot_inline_placeholder
+        self.lang_code = lang_code
+        self.emoji_status = emoji_status
+        self.usernames = usernames
+        self.stories_max_id = stories_max_id
+        self.color = color
+        self.profile_color = profile_color
+        self.bot_active_users = bot_active_users
+        self.bot_verification_icon = bot_verification_icon
+        self.send_paid_messages_stars = send_paid_messages_stars
+
+    def to_dict(self):
+        return {
+            '_': 'User',
+            'id': self.id,
+            'is_self': self.is_self,
+            'contact': self.contact,
+            'mutual_contact': self.mutual_contact,
+            'deleted': self.deleted,
+            'bot': self.bot,
+            'bot_chat_history': self.bot_chat_history,
+            'bot_nochats': self.bot_nochats,
+            'verified': self.verified,
+            'restricted': self.restricted,
+            'min': self.min,
+            'bot_inline_geo': self.bot_inline_geo,
+            'support': self.support,
+            'scam': self.scam,
+            'apply_min_photo': self.apply_min_photo,
+            'fake': self.fake,
+            'bot_attach_menu': self.bot_attach_menu,
+            'premium': self.premium,
+            'attach_menu_enabled': self.attach_menu_enabled,
+            'bot_can_edit': self.bot_can_edit,
+            'close_friend': self.close_friend,
+            'stories_hidden': self.stories_hidden,
+            'stories_unavailable': self.stories_unavailable,
+            'contact_require_premium': self.contact_require_premium,
+            'bot_business': self.bot_business,
+            'bot_has_main_app': self.bot_has_main_app,
+            'access_hash': self.access_hash,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'username': self.username,
+            'phone': self.phone,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'status': self.status.to_dict() if isinstance(self.status, TLObject) else self.status,
+            'bot_info_version': self.bot_info_version,
+            'restriction_reason': [] if self.restriction_reason is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.restriction_reason],
+            'bot_inline_placeholder': self.bot_inline_placeholder,
+            'lang_code': self.lang_code,
+            'emoji_status': self.emoji_status.to_dict() if isinstance(self.emoji_status, TLObject) else self.emoji_status,
+            'usernames': [] if self.usernames is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.usernames],
+            'stories_max_id': self.stories_max_id,
+            'color': self.color.to_dict() if isinstance(self.color, TLObject) else self.color,
+            'profile_color': self.profile_color.to_dict() if isinstance(self.profile_color, TLObject) else self.profile_color,
+            'bot_active_users': self.bot_active_users,
+            'bot_verification_icon': self.bot_verification_icon,
+            'send_paid_messages_stars': self.send_paid_messages_stars
+        }
+
+    def _bytes(self):
+        assert ((self.bot or self.bot is not None) and (self.bot_info_version or self.bot_info_version is not None)) or ((self.bot is None or self.bot is False) and (self.bot_info_version is None or self.bot_info_version is False)), 'bot, bot_info_version parameters must all be False-y (like None) or all me True-y'
+        assert ((self.restricted or self.restricted is not None) and (self.restriction_reason or self.restriction_reason is not None)) or ((self.restricted is None or self.restricted is False) and (self.restriction_reason is None or self.restriction_reason is False)), 'restricted, restriction_reason parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'"\x14\x0b\x02',
+            _struct_IIq.pack((0 if self.is_self is None or self.is_self is False else 1024) | (0 if self.contact is None or self.contact is False else 2048) | (0 if self.mutual_contact is None or self.mutual_contact is False else 4096) | (0 if self.deleted is None or self.deleted is False else 8192) | (0 if self.bot is None or self.bot is False else 16384) | (0 if self.bot_chat_history is None or self.bot_chat_history is False else 32768) | (0 if self.bot_nochats is None or self.bot_nochats is False else 65536) | (0 if self.verified is None or self.verified is False else 131072) | (0 if self.restricted is None or self.restricted is False else 262144) | (0 if self.min is None or self.min is False else 1048576) | (0 if self.bot_inline_geo is None or self.bot_inline_geo is False else 2097152) | (0 if self.support is None or self.support is False else 8388608) | (0 if self.scam is None or self.scam is False else 16777216) | (0 if self.apply_min_photo is None or self.apply_min_photo is False else 33554432) | (0 if self.fake is None or self.fake is False else 67108864) | (0 if self.bot_attach_menu is None or self.bot_attach_menu is False else 134217728) | (0 if self.premium is None or self.premium is False else 268435456) | (0 if self.attach_menu_enabled is None or self.attach_menu_enabled is False else 536870912) | (0 if self.access_hash is None or self.access_hash is False else 1) | (0 if self.first_name is None or self.first_name is False else 2) | (0 if self.last_name is None or self.last_name is False else 4) | (0 if self.username is None or self.username is False else 8) | (0 if self.phone is None or self.phone is False else 16) | (0 if self.photo is None or self.photo is False else 32) | (0 if self.status is None or self.status is False else 64) | (0 if self.bot_info_version is None or self.bot_info_version is False else 16384) | (0 if self.restriction_reason is None or self.restriction_reason is False else 262144) | (0 if self.bot_inline_placeholder is None or self.bot_inline_placeholder is False else 524288) | (0 if self.lang_code is None or self.lang_code is False else 4194304) | (0 if self.emoji_status is None or self.emoji_status is False else 1073741824), (0 if self.bot_can_edit is None or self.bot_can_edit is False else 2) | (0 if self.close_friend is None or self.close_friend is False else 4) | (0 if self.stories_hidden is None or self.stories_hidden is False else 8) | (0 if self.stories_unavailable is None or self.stories_unavailable is False else 16) | (0 if self.contact_require_premium is None or self.contact_require_premium is False else 1024) | (0 if self.bot_business is None or self.bot_business is False else 2048) | (0 if self.bot_has_main_app is None or self.bot_has_main_app is False else 8192) | (0 if self.usernames is None or self.usernames is False else 1) | (0 if self.stories_max_id is None or self.stories_max_id is False else 32) | (0 if self.color is None or self.color is False else 256) | (0 if self.profile_color is None or self.profile_color is False else 512) | (0 if self.bot_active_users is None or self.bot_active_users is False else 4096) | (0 if self.bot_verification_icon is None or self.bot_verification_icon is False else 16384) | (0 if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else 32768), self.id),
+            b'' if self.access_hash is None or self.access_hash is False else (struct.pack('<q', self.access_hash)),
+            b'' if self.first_name is None or self.first_name is False else (self.serialize_bytes(self.first_name)),
+            b'' if self.last_name is None or self.last_name is False else (self.serialize_bytes(self.last_name)),
+            b'' if self.username is None or self.username is False else (self.serialize_bytes(self.username)),
+            b'' if self.phone is None or self.phone is False else (self.serialize_bytes(self.phone)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.status is None or self.status is False else (self.status._bytes()),
+            b'' if self.bot_info_version is None or self.bot_info_version is False else (struct.pack('<i', self.bot_info_version)),
+            b'' if self.restriction_reason is None or self.restriction_reason is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.restriction_reason)),b''.join(x._bytes() for x in self.restriction_reason))),
+            b'' if self.bot_inline_placeholder is None or self.bot_inline_placeholder is False else (self.serialize_bytes(self.bot_inline_placeholder)),
+            b'' if self.lang_code is None or self.lang_code is False else (self.serialize_bytes(self.lang_code)),
+            b'' if self.emoji_status is None or self.emoji_status is False else (self.emoji_status._bytes()),
+            b'' if self.usernames is None or self.usernames is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.usernames)),b''.join(x._bytes() for x in self.usernames))),
+            b'' if self.stories_max_id is None or self.stories_max_id is False else (struct.pack('<i', self.stories_max_id)),
+            b'' if self.color is None or self.color is False else (self.color._bytes()),
+            b'' if self.profile_color is None or self.profile_color is False else (self.profile_color._bytes()),
+            b'' if self.bot_active_users is None or self.bot_active_users is False else (struct.pack('<i', self.bot_active_users)),
+            b'' if self.bot_verification_icon is None or self.bot_verification_icon is False else (struct.pack('<q', self.bot_verification_icon)),
+            b'' if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else (struct.pack('<q', self.send_paid_messages_stars)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, flags2, _id = reader.read_struct(_struct_iiq)
+        _is_self = bool(flags & 1024)
+        _contact = bool(flags & 2048)
+        _mutual_contact = bool(flags & 4096)
+        _deleted = bool(flags & 8192)
+        _bot = bool(flags & 16384)
+        _bot_chat_history = bool(flags & 32768)
+        _bot_nochats = bool(flags & 65536)
+        _verified = bool(flags & 131072)
+        _restricted = bool(flags & 262144)
+        _min = bool(flags & 1048576)
+        _bot_inline_geo = bool(flags & 2097152)
+        _support = bool(flags & 8388608)
+        _scam = bool(flags & 16777216)
+        _apply_min_photo = bool(flags & 33554432)
+        _fake = bool(flags & 67108864)
+        _bot_attach_menu = bool(flags & 134217728)
+        _premium = bool(flags & 268435456)
+        _attach_menu_enabled = bool(flags & 536870912)
+        _bot_can_edit = bool(flags2 & 2)
+        _close_friend = bool(flags2 & 4)
+        _stories_hidden = bool(flags2 & 8)
+        _stories_unavailable = bool(flags2 & 16)
+        _contact_require_premium = bool(flags2 & 1024)
+        _bot_business = bool(flags2 & 2048)
+        _bot_has_main_app = bool(flags2 & 8192)
+        if flags & 1:
+            _access_hash = reader.read_long()
+        else:
+            _access_hash = None
+        if flags & 2:
+            _first_name = reader.tgread_string()
+        else:
+            _first_name = None
+        if flags & 4:
+            _last_name = reader.tgread_string()
+        else:
+            _last_name = None
+        if flags & 8:
+            _username = reader.tgread_string()
+        else:
+            _username = None
+        if flags & 16:
+            _phone = reader.tgread_string()
+        else:
+            _phone = None
+        if flags & 32:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 64:
+            _status = reader.tgread_object()
+        else:
+            _status = None
+        if flags & 16384:
+            _bot_info_version = reader.read_int()
+        else:
+            _bot_info_version = None
+        if flags & 262144:
+            reader.read_int()
+            _restriction_reason = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _restriction_reason.append(_x)
+
+        else:
+            _restriction_reason = None
+        if flags & 524288:
+            _bot_inline_placeholder = reader.tgread_string()
+        else:
+            _bot_inline_placeholder = None
+        if flags & 4194304:
+            _lang_code = reader.tgread_string()
+        else:
+            _lang_code = None
+        if flags & 1073741824:
+            _emoji_status = reader.tgread_object()
+        else:
+            _emoji_status = None
+        if flags2 & 1:
+            reader.read_int()
+            _usernames = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _usernames.append(_x)
+
+        else:
+            _usernames = None
+        if flags2 & 32:
+            _stories_max_id = reader.read_int()
+        else:
+            _stories_max_id = None
+        if flags2 & 256:
+            _color = reader.tgread_object()
+        else:
+            _color = None
+        if flags2 & 512:
+            _profile_color = reader.tgread_object()
+        else:
+            _profile_color = None
+        if flags2 & 4096:
+            _bot_active_users = reader.read_int()
+        else:
+            _bot_active_users = None
+        if flags2 & 16384:
+            _bot_verification_icon = reader.read_long()
+        else:
+            _bot_verification_icon = None
+        if flags2 & 32768:
+            _send_paid_messages_stars = reader.read_long()
+        else:
+            _send_paid_messages_stars = None
+        return cls(id=_id, is_self=_is_self, contact=_contact, mutual_contact=_mutual_contact, deleted=_deleted, bot=_bot, bot_chat_history=_bot_chat_history, bot_nochats=_bot_nochats, verified=_verified, restricted=_restricted, min=_min, bot_inline_geo=_bot_inline_geo, support=_support, scam=_scam, apply_min_photo=_apply_min_photo, fake=_fake, bot_attach_menu=_bot_attach_menu, premium=_premium, attach_menu_enabled=_attach_menu_enabled, bot_can_edit=_bot_can_edit, close_friend=_close_friend, stories_hidden=_stories_hidden, stories_unavailable=_stories_unavailable, contact_require_premium=_contact_require_premium, bot_business=_bot_business, bot_has_main_app=_bot_has_main_app, access_hash=_access_hash, first_name=_first_name, last_name=_last_name, username=_username, phone=_phone, photo=_photo, status=_status, bot_info_version=_bot_info_version, restriction_reason=_restriction_reason, bot_inline_placeholder=_bot_inline_placeholder, lang_code=_lang_code, emoji_status=_emoji_status, usernames=_usernames, stories_max_id=_stories_max_id, color=_color, profile_color=_profile_color, bot_active_users=_bot_active_users, bot_verification_icon=_bot_verification_icon, send_paid_messages_stars=_send_paid_messages_stars)
+
+
+class UserEmpty(TLObject):
+    CONSTRUCTOR_ID = 0xd3bc4b7a
+    SUBCLASS_OF_ID = 0x2da17977
+    __slots__ = ('id', 'participant')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int):
+        """
+        Constructor for User: Instance of either UserEmpty, User.
+        """
+        self.id = id
+
+    def to_dict(self):
+        return {
+            '_': 'UserEmpty',
+            'id': self.id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'zK\xbc\xd3',
+            struct.pack('<q', self.id),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id = reader.read_long()
+        return cls(id=_id)
+
+TypeUser = Union[UserEmpty,User]
@@ -0,0 +1,297 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_IIq = struct.Struct('<IIq')
+_struct_iiq = struct.Struct('<iiq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeBirthday, TypeBotInfo, TypeBotVerification, TypeBusinessAwayMessage, TypeBusinessGreetingMessage, TypeBusinessIntro, TypeBusinessLocation, TypeBusinessWorkHours, TypeChatAdminRights, TypeDisallowedGiftsSettings, TypePeerNotifySettings, TypePeerSettings, TypePeerStories, TypePhoto, TypeStarRefProgram, TypeWallPaper
+
+
+
+class UserFull(TLObject):
+    CONSTRUCTOR_ID = 0x99e78045
+    SUBCLASS_OF_ID = 0x1f4661b9
+    __slots__ = ('id', 'settings', 'notify_settings', 'common_chats_count', 'blocked', 'phone_calls_available', 'phone_calls_private', 'can_pin_message', 'has_scheduled', 'video_calls_available', 'voice_messages_forbidden', 'translations_disabled', 'stories_pinned_available', 'blocked_my_stories_from', 'wallpaper_overridden', 'contact_require_premium', 'read_dates_private', 'sponsored_enabled', 'can_view_revenue', 'bot_can_manage_emoji_status', 'display_gifts_button', 'about', 'personal_photo', 'profile_photo', 'fallback_photo', 'bot_info', 'pinned_msg_id', 'folder_id', 'ttl_period', 'theme_emoticon', 'private_forward_name', 'bot_group_admin_rights', 'bot_broadcast_admin_rights', 'wallpaper', 'stories', 'business_work_hours', 'business_location', 'business_greeting_message', 'business_away_message', 'business_intro', 'birthday', 'personal_channel_id', 'personal_channel_message', 'stargifts_count', 'starref_program', 'bot_verification', 'send_paid_messages_stars', 'disallowed_gifts')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, settings: 'TypePeerSettings', notify_settings: 'TypePeerNotifySettings', common_chats_count: int, blocked: Optional[bool]=None, phone_calls_available: Optional[bool]=None, phone_calls_private: Optional[bool]=None, can_pin_message: Optional[bool]=None, has_scheduled: Optional[bool]=None, video_calls_available: Optional[bool]=None, voice_messages_forbidden: Optional[bool]=None, translations_disabled: Optional[bool]=None, stories_pinned_available: Optional[bool]=None, blocked_my_stories_from: Optional[bool]=None, wallpaper_overridden: Optional[bool]=None, contact_require_premium: Optional[bool]=None, read_dates_private: Optional[bool]=None, sponsored_enabled: Optional[bool]=None, can_view_revenue: Optional[bool]=None, bot_can_manage_emoji_status: Optional[bool]=None, display_gifts_button: Optional[bool]=None, about: Optional[str]=None, personal_photo: Optional['TypePhoto']=None, profile_photo: Optional['TypePhoto']=None, fallback_photo: Optional['TypePhoto']=None, bot_info: Optional['TypeBotInfo']=None, pinned_msg_id: Optional[int]=None, folder_id: Optional[int]=None, ttl_period: Optional[int]=None, theme_emoticon: Optional[str]=None, private_forward_name: Optional[str]=None, bot_group_admin_rights: Optional['TypeChatAdminRights']=None, bot_broadcast_admin_rights: Optional['TypeChatAdminRights']=None, wallpaper: Optional['TypeWallPaper']=None, stories: Optional['TypePeerStories']=None, business_work_hours: Optional['TypeBusinessWorkHours']=None, business_location: Optional['TypeBusinessLocation']=None, business_greeting_message: Optional['TypeBusinessGreetingMessage']=None, business_away_message: Optional['TypeBusinessAwayMessage']=None, business_intro: Optional['TypeBusinessIntro']=None, birthday: Optional['TypeBirthday']=None, personal_channel_id: Optional[int]=None, personal_channel_message: Optional[int]=None, stargifts_count: Optional[int]=None, starref_program: Optional['TypeStarRefProgram']=None, bot_verification: Optional['TypeBotVerification']=None, send_paid_messages_stars: Optional[int]=None, disallowed_gifts: Optional['TypeDisallowedGiftsSettings']=None):
+        """
+        Constructor for UserFull: Instance of UserFull.
+        """
+        self.id = id
+        self.settings = settings
+        self.notify_settings = notify_settings
+        self.common_chats_count = common_chats_count
+        self.blocked = blocked
+        self.phone_calls_available = phone_calls_available
+        self.phone_calls_private = phone_calls_private
+        self.can_pin_message = can_pin_message
+        self.has_scheduled = has_scheduled
+        self.video_calls_available = video_calls_available
+        self.voice_messages_forbidden = voice_messages_forbidden
+        self.translations_disabled = translations_disabled
+        self.stories_pinned_available = stories_pinned_available
+        self.blocked_my_stories_from = blocked_my_stories_from
+        self.wallpaper_overridden = wallpaper_overridden
+        self.contact_require_premium = contact_require_premium
+        self.read_dates_private = read_dates_private
+        self.sponsored_enabled = sponsored_enabled
+        self.can_view_revenue = can_view_revenue
+        self.bot_can_manage_emoji_status = bot_can_manage_emoji_status
+        self.display_gifts_button = display_gifts_button
+        self.about = about
+        self.personal_photo = personal_photo
+        self.profile_photo = profile_photo
+        self.fallback_photo = fallback_photo
+        self.bot_info = bot_info
+        self.pinned_msg_id = pinned_msg_id
+        self.folder_id = folder_id
+        self.ttl_period = ttl_period
+        self.theme_emoticon = theme_emoticon
+        self.private_forward_name = private_forward_name
+        self.bot_group_admin_rights = bot_group_admin_rights
+        self.bot_broadcast_admin_rights = bot_broadcast_admin_rights
+        self.wallpaper = wallpaper
+        self.stories = stories
+        self.business_work_hours = business_work_hours
+        self.business_location = business_location
+        self.business_greeting_message = business_greeting_message
+        self.business_away_message = business_away_message
+        self.business_intro = business_intro
+        self.birthday = birthday
+        self.personal_channel_id = personal_channel_id
+        self.personal_channel_message = personal_channel_message
+        self.stargifts_count = stargifts_count
+        self.starref_program = starref_program
+        self.bot_verification = bot_verification
+        self.send_paid_messages_stars = send_paid_messages_stars
+        self.disallowed_gifts = disallowed_gifts
+
+    def to_dict(self):
+        return {
+            '_': 'UserFull',
+            'id': self.id,
+            'settings': self.settings.to_dict() if isinstance(self.settings, TLObject) else self.settings,
+            'notify_settings': self.notify_settings.to_dict() if isinstance(self.notify_settings, TLObject) else self.notify_settings,
+            'common_chats_count': self.common_chats_count,
+            'blocked': self.blocked,
+            'phone_calls_available': self.phone_calls_available,
+            'phone_calls_private': self.phone_calls_private,
+            'can_pin_message': self.can_pin_message,
+            'has_scheduled': self.has_scheduled,
+            'video_calls_available': self.video_calls_available,
+            'voice_messages_forbidden': self.voice_messages_forbidden,
+            'translations_disabled': self.translations_disabled,
+            'stories_pinned_available': self.stories_pinned_available,
+            'blocked_my_stories_from': self.blocked_my_stories_from,
+            'wallpaper_overridden': self.wallpaper_overridden,
+            'contact_require_premium': self.contact_require_premium,
+            'read_dates_private': self.read_dates_private,
+            'sponsored_enabled': self.sponsored_enabled,
+            'can_view_revenue': self.can_view_revenue,
+            'bot_can_manage_emoji_status': self.bot_can_manage_emoji_status,
+            'display_gifts_button': self.display_gifts_button,
+            'about': self.about,
+            'personal_photo': self.personal_photo.to_dict() if isinstance(self.personal_photo, TLObject) else self.personal_photo,
+            'profile_photo': self.profile_photo.to_dict() if isinstance(self.profile_photo, TLObject) else self.profile_photo,
+            'fallback_photo': self.fallback_photo.to_dict() if isinstance(self.fallback_photo, TLObject) else self.fallback_photo,
+            'bot_info': self.bot_info.to_dict() if isinstance(self.bot_info, TLObject) else self.bot_info,
+            'pinned_msg_id': self.pinned_msg_id,
+            'folder_id': self.folder_id,
+            'ttl_period': self.ttl_period,
+            'theme_emoticon': self.theme_emoticon,
+            'private_forward_name': self.private_forward_name,
+            'bot_group_admin_rights': self.bot_group_admin_rights.to_dict() if isinstance(self.bot_group_admin_rights, TLObject) else self.bot_group_admin_rights,
+            'bot_broadcast_admin_rights': self.bot_broadcast_admin_rights.to_dict() if isinstance(self.bot_broadcast_admin_rights, TLObject) else self.bot_broadcast_admin_rights,
+            'wallpaper': self.wallpaper.to_dict() if isinstance(self.wallpaper, TLObject) else self.wallpaper,
+            'stories': self.stories.to_dict() if isinstance(self.stories, TLObject) else self.stories,
+            'business_work_hours': self.business_work_hours.to_dict() if isinstance(self.business_work_hours, TLObject) else self.business_work_hours,
+            'business_location': self.business_location.to_dict() if isinstance(self.business_location, TLObject) else self.business_location,
+            'business_greeting_message': self.business_greeting_message.to_dict() if isinstance(self.business_greeting_message, TLObject) else self.business_greeting_message,
+            'business_away_message': self.business_away_message.to_dict() if isinstance(self.business_away_message, TLObject) else self.business_away_message,
+            'business_intro': self.business_intro.to_dict() if isinstance(self.business_intro, TLObject) else self.business_intro,
+            'birthday': self.birthday.to_dict() if isinstance(self.birthday, TLObject) else self.birthday,
+            'personal_channel_id': self.personal_channel_id,
+            'personal_channel_message': self.personal_channel_message,
+            'stargifts_count': self.stargifts_count,
+            'starref_program': self.starref_program.to_dict() if isinstance(self.starref_program, TLObject) else self.starref_program,
+            'bot_verification': self.bot_verification.to_dict() if isinstance(self.bot_verification, TLObject) else self.bot_verification,
+            'send_paid_messages_stars': self.send_paid_messages_stars,
+            'disallowed_gifts': self.disallowed_gifts.to_dict() if isinstance(self.disallowed_gifts, TLObject) else self.disallowed_gifts
+        }
+
+    def _bytes(self):
+        assert ((self.personal_channel_id or self.personal_channel_id is not None) and (self.personal_channel_message or self.personal_channel_message is not None)) or ((self.personal_channel_id is None or self.personal_channel_id is False) and (self.personal_channel_message is None or self.personal_channel_message is False)), 'personal_channel_id, personal_channel_message parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'E\x80\xe7\x99',
+            _struct_IIq.pack((0 if self.blocked is None or self.blocked is False else 1) | (0 if self.phone_calls_available is None or self.phone_calls_available is False else 16) | (0 if self.phone_calls_private is None or self.phone_calls_private is False else 32) | (0 if self.can_pin_message is None or self.can_pin_message is False else 128) | (0 if self.has_scheduled is None or self.has_scheduled is False else 4096) | (0 if self.video_calls_available is None or self.video_calls_available is False else 8192) | (0 if self.voice_messages_forbidden is None or self.voice_messages_forbidden is False else 1048576) | (0 if self.translations_disabled is None or self.translations_disabled is False else 8388608) | (0 if self.stories_pinned_available is None or self.stories_pinned_available is False else 67108864) | (0 if self.blocked_my_stories_from is None or self.blocked_my_stories_from is False else 134217728) | (0 if self.wallpaper_overridden is None or self.wallpaper_overridden is False else 268435456) | (0 if self.contact_require_premium is None or self.contact_require_premium is False else 536870912) | (0 if self.read_dates_private is None or self.read_dates_private is False else 1073741824) | (0 if self.about is None or self.about is False else 2) | (0 if self.personal_photo is None or self.personal_photo is False else 2097152) | (0 if self.profile_photo is None or self.profile_photo is False else 4) | (0 if self.fallback_photo is None or self.fallback_photo is False else 4194304) | (0 if self.bot_info is None or self.bot_info is False else 8) | (0 if self.pinned_msg_id is None or self.pinned_msg_id is False else 64) | (0 if self.folder_id is None or self.folder_id is False else 2048) | (0 if self.ttl_period is None or self.ttl_period is False else 16384) | (0 if self.theme_emoticon is None or self.theme_emoticon is False else 32768) | (0 if self.private_forward_name is None or self.private_forward_name is False else 65536) | (0 if self.bot_group_admin_rights is None or self.bot_group_admin_rights is False else 131072) | (0 if self.bot_broadcast_admin_rights is None or self.bot_broadcast_admin_rights is False else 262144) | (0 if self.wallpaper is None or self.wallpaper is False else 16777216) | (0 if self.stories is None or self.stories is False else 33554432), (0 if self.sponsored_enabled is None or self.sponsored_enabled is False else 128) | (0 if self.can_view_revenue is None or self.can_view_revenue is False else 512) | (0 if self.bot_can_manage_emoji_status is None or self.bot_can_manage_emoji_status is False else 1024) | (0 if self.display_gifts_button is None or self.display_gifts_button is False else 65536) | (0 if self.business_work_hours is None or self.business_work_hours is False else 1) | (0 if self.business_location is None or self.business_location is False else 2) | (0 if self.business_greeting_message is None or self.business_greeting_message is False else 4) | (0 if self.business_away_message is None or self.business_away_message is False else 8) | (0 if self.business_intro is None or self.business_intro is False else 16) | (0 if self.birthday is None or self.birthday is False else 32) | (0 if self.personal_channel_id is None or self.personal_channel_id is False else 64) | (0 if self.personal_channel_message is None or self.personal_channel_message is False else 64) | (0 if self.stargifts_count is None or self.stargifts_count is False else 256) | (0 if self.starref_program is None or self.starref_program is False else 2048) | (0 if self.bot_verification is None or self.bot_verification is False else 4096) | (0 if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else 16384) | (0 if self.disallowed_gifts is None or self.disallowed_gifts is False else 32768), self.id),
+            b'' if self.about is None or self.about is False else (self.serialize_bytes(self.about)),
+            self.settings._bytes(),
+            b'' if self.personal_photo is None or self.personal_photo is False else (self.personal_photo._bytes()),
+            b'' if self.profile_photo is None or self.profile_photo is False else (self.profile_photo._bytes()),
+            b'' if self.fallback_photo is None or self.fallback_photo is False else (self.fallback_photo._bytes()),
+            self.notify_settings._bytes(),
+            b'' if self.bot_info is None or self.bot_info is False else (self.bot_info._bytes()),
+            b'' if self.pinned_msg_id is None or self.pinned_msg_id is False else (struct.pack('<i', self.pinned_msg_id)),
+            struct.pack('<i', self.common_chats_count),
+            b'' if self.folder_id is None or self.folder_id is False else (struct.pack('<i', self.folder_id)),
+            b'' if self.ttl_period is None or self.ttl_period is False else (struct.pack('<i', self.ttl_period)),
+            b'' if self.theme_emoticon is None or self.theme_emoticon is False else (self.serialize_bytes(self.theme_emoticon)),
+            b'' if self.private_forward_name is None or self.private_forward_name is False else (self.serialize_bytes(self.private_forward_name)),
+            b'' if self.bot_group_admin_rights is None or self.bot_group_admin_rights is False else (self.bot_group_admin_rights._bytes()),
+            b'' if self.bot_broadcast_admin_rights is None or self.bot_broadcast_admin_rights is False else (self.bot_broadcast_admin_rights._bytes()),
+            b'' if self.wallpaper is None or self.wallpaper is False else (self.wallpaper._bytes()),
+            b'' if self.stories is None or self.stories is False else (self.stories._bytes()),
+            b'' if self.business_work_hours is None or self.business_work_hours is False else (self.business_work_hours._bytes()),
+            b'' if self.business_location is None or self.business_location is False else (self.business_location._bytes()),
+            b'' if self.business_greeting_message is None or self.business_greeting_message is False else (self.business_greeting_message._bytes()),
+            b'' if self.business_away_message is None or self.business_away_message is False else (self.business_away_message._bytes()),
+            b'' if self.business_intro is None or self.business_intro is False else (self.business_intro._bytes()),
+            b'' if self.birthday is None or self.birthday is False else (self.birthday._bytes()),
+            b'' if self.personal_channel_id is None or self.personal_channel_id is False else (struct.pack('<q', self.personal_channel_id)),
+            b'' if self.personal_channel_message is None or self.personal_channel_message is False else (struct.pack('<i', self.personal_channel_message)),
+            b'' if self.stargifts_count is None or self.stargifts_count is False else (struct.pack('<i', self.stargifts_count)),
+            b'' if self.starref_program is None or self.starref_program is False else (self.starref_program._bytes()),
+            b'' if self.bot_verification is None or self.bot_verification is False else (self.bot_verification._bytes()),
+            b'' if self.send_paid_messages_stars is None or self.send_paid_messages_stars is False else (struct.pack('<q', self.send_paid_messages_stars)),
+            b'' if self.disallowed_gifts is None or self.disallowed_gifts is False else (self.disallowed_gifts._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, flags2, _id = reader.read_struct(_struct_iiq)
+        _blocked = bool(flags & 1)
+        _phone_calls_available = bool(flags & 16)
+        _phone_calls_private = bool(flags & 32)
+        _can_pin_message = bool(flags & 128)
+        _has_scheduled = bool(flags & 4096)
+        _video_calls_available = bool(flags & 8192)
+        _voice_messages_forbidden = bool(flags & 1048576)
+        _translations_disabled = bool(flags & 8388608)
+        _stories_pinned_available = bool(flags & 67108864)
+        _blocked_my_stories_from = bool(flags & 134217728)
+        _wallpaper_overridden = bool(flags & 268435456)
+        _contact_require_premium = bool(flags & 536870912)
+        _read_dates_private = bool(flags & 1073741824)
+        _sponsored_enabled = bool(flags2 & 128)
+        _can_view_revenue = bool(flags2 & 512)
+        _bot_can_manage_emoji_status = bool(flags2 & 1024)
+        _display_gifts_button = bool(flags2 & 65536)
+        if flags & 2:
+            _about = reader.tgread_string()
+        else:
+            _about = None
+        _settings = reader.tgread_object()
+        if flags & 2097152:
+            _personal_photo = reader.tgread_object()
+        else:
+            _personal_photo = None
+        if flags & 4:
+            _profile_photo = reader.tgread_object()
+        else:
+            _profile_photo = None
+        if flags & 4194304:
+            _fallback_photo = reader.tgread_object()
+        else:
+            _fallback_photo = None
+        _notify_settings = reader.tgread_object()
+        if flags & 8:
+            _bot_info = reader.tgread_object()
+        else:
+            _bot_info = None
+        if flags & 64:
+            _pinned_msg_id = reader.read_int()
+        else:
+            _pinned_msg_id = None
+        _common_chats_count = reader.read_int()
+        if flags & 2048:
+            _folder_id = reader.read_int()
+        else:
+            _folder_id = None
+        if flags & 16384:
+            _ttl_period = reader.read_int()
+        else:
+            _ttl_period = None
+        if flags & 32768:
+            _theme_emoticon = reader.tgread_string()
+        else:
+            _theme_emoticon = None
+        if flags & 65536:
+            _private_forward_name = reader.tgread_string()
+        else:
+            _private_forward_name = None
+        if flags & 131072:
+            _bot_group_admin_rights = reader.tgread_object()
+        else:
+            _bot_group_admin_rights = None
+        if flags & 262144:
+            _bot_broadcast_admin_rights = reader.tgread_object()
+        else:
+            _bot_broadcast_admin_rights = None
+        if flags & 16777216:
+            _wallpaper = reader.tgread_object()
+        else:
+            _wallpaper = None
+        if flags & 33554432:
+            _stories = reader.tgread_object()
+        else:
+            _stories = None
+        if flags2 & 1:
+            _business_work_hours = reader.tgread_object()
+        else:
+            _business_work_hours = None
+        if flags2 & 2:
+            _business_location = reader.tgread_object()
+        else:
+            _business_location = None
+        if flags2 & 4:
+            _business_greeting_message = reader.tgread_object()
+        else:
+            _business_greeting_message = None
+        if flags2 & 8:
+            _business_away_message = reader.tgread_object()
+        else:
+            _business_away_message = None
+        if flags2 & 16:
+            _business_intro = reader.tgread_object()
+        else:
+            _business_intro = None
+        if flags2 & 32:
+            _birthday = reader.tgread_object()
+        else:
+            _birthday = None
+        if flags2 & 64:
+            _personal_channel_id = reader.read_long()
+        else:
+            _personal_channel_id = None
+        if flags2 & 64:
+            _personal_channel_message = reader.read_int()
+        else:
+            _personal_channel_message = None
+        if flags2 & 256:
+            _stargifts_count = reader.read_int()
+        else:
+            _stargifts_count = None
+        if flags2 & 2048:
+            _starref_program = reader.tgread_object()
+        else:
+            _starref_program = None
+        if flags2 & 4096:
+            _bot_verification = reader.tgread_object()
+        else:
+            _bot_verification = None
+        if flags2 & 16384:
+            _send_paid_messages_stars = reader.read_long()
+        else:
+            _send_paid_messages_stars = None
+        if flags2 & 32768:
+            _disallowed_gifts = reader.tgread_object()
+        else:
+            _disallowed_gifts = None
+        return cls(id=_id, settings=_settings, notify_settings=_notify_settings, common_chats_count=_common_chats_count, blocked=_blocked, phone_calls_available=_phone_calls_available, phone_calls_private=_phone_calls_private, can_pin_message=_can_pin_message, has_scheduled=_has_scheduled, video_calls_available=_video_calls_available, voice_messages_forbidden=_voice_messages_forbidden, translations_disabled=_translations_disabled, stories_pinned_available=_stories_pinned_available, blocked_my_stories_from=_blocked_my_stories_from, wallpaper_overridden=_wallpaper_overridden, contact_require_premium=_contact_require_premium, read_dates_private=_read_dates_private, sponsored_enabled=_sponsored_enabled, can_view_revenue=_can_view_revenue, bot_can_manage_emoji_status=_bot_can_manage_emoji_status, display_gifts_button=_display_gifts_button, about=_about, personal_photo=_personal_photo, profile_photo=_profile_photo, fallback_photo=_fallback_photo, bot_info=_bot_info, pinned_msg_id=_pinned_msg_id, folder_id=_folder_id, ttl_period=_ttl_period, theme_emoticon=_theme_emoticon, private_forward_name=_private_forward_name, bot_group_admin_rights=_bot_group_admin_rights, bot_broadcast_admin_rights=_bot_broadcast_admin_rights, wallpaper=_wallpaper, stories=_stories, business_work_hours=_business_work_hours, business_location=_business_location, business_greeting_message=_business_greeting_message, business_away_message=_business_away_message, business_intro=_business_intro, birthday=_birthday, personal_channel_id=_personal_channel_id, personal_channel_message=_personal_channel_message, stargifts_count=_stargifts_count, starref_program=_starref_program, bot_verification=_bot_verification, send_paid_messages_stars=_send_paid_messages_stars, disallowed_gifts=_disallowed_gifts)
+
+TypeUserFull = UserFull
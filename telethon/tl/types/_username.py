@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class Username(TLObject):
+    CONSTRUCTOR_ID = 0xb4073647
+    SUBCLASS_OF_ID = 0x1286421
+    __slots__ = ('username', 'editable', 'active')
+
+    def __init__(self, username: str, editable: Optional[bool]=None, active: Optional[bool]=None):
+        """
+        Constructor for Username: Instance of Username.
+        """
+        self.username = username
+        self.editable = editable
+        self.active = active
+
+    def to_dict(self):
+        return {
+            '_': 'Username',
+            'username': self.username,
+            'editable': self.editable,
+            'active': self.active
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'G6\x07\xb4',
+            struct.pack('<I', (0 if self.editable is None or self.editable is False else 1) | (0 if self.active is None or self.active is False else 2)),
+            self.serialize_bytes(self.username),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _editable = bool(flags & 1)
+        _active = bool(flags & 2)
+        _username = reader.tgread_string()
+        return cls(username=_username, editable=_editable, active=_active)
+
+TypeUsername = Username
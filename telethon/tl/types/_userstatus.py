@@ -0,0 +1,179 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class UserStatusEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x9d05049
+    SUBCLASS_OF_ID = 0x5b0b743e
+    __slots__ = ()
+
+    def to_dict(self):
+        return {
+            '_': 'UserStatusEmpty'
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'IP\xd0\t',
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        return cls()
+
+
+class UserStatusLastMonth(TLObject):
+    CONSTRUCTOR_ID = 0x65899777
+    SUBCLASS_OF_ID = 0x5b0b743e
+    __slots__ = ('by_me',)
+
+    def __init__(self, by_me: Optional[bool]=None):
+        """
+        Constructor for UserStatus: Instance of either UserStatusEmpty, UserStatusOnline, UserStatusOffline, UserStatusRecently, UserStatusLastWeek, UserStatusLastMonth.
+        """
+        self.by_me = by_me
+
+    def to_dict(self):
+        return {
+            '_': 'UserStatusLastMonth',
+            'by_me': self.by_me
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'w\x97\x89e',
+            struct.pack('<I', (0 if self.by_me is None or self.by_me is False else 1)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _by_me = bool(flags & 1)
+        return cls(by_me=_by_me)
+
+
+class UserStatusLastWeek(TLObject):
+    CONSTRUCTOR_ID = 0x541a1d1a
+    SUBCLASS_OF_ID = 0x5b0b743e
+    __slots__ = ('by_me',)
+
+    def __init__(self, by_me: Optional[bool]=None):
+        """
+        Constructor for UserStatus: Instance of either UserStatusEmpty, UserStatusOnline, UserStatusOffline, UserStatusRecently, UserStatusLastWeek, UserStatusLastMonth.
+        """
+        self.by_me = by_me
+
+    def to_dict(self):
+        return {
+            '_': 'UserStatusLastWeek',
+            'by_me': self.by_me
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1a\x1d\x1aT',
+            struct.pack('<I', (0 if self.by_me is None or self.by_me is False else 1)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _by_me = bool(flags & 1)
+        return cls(by_me=_by_me)
+
+
+class UserStatusOffline(TLObject):
+    CONSTRUCTOR_ID = 0x8c703f
+    SUBCLASS_OF_ID = 0x5b0b743e
+    __slots__ = ('was_online',)
+
+    def __init__(self, was_online: Optional[datetime]):
+        """
+        Constructor for UserStatus: Instance of either UserStatusEmpty, UserStatusOnline, UserStatusOffline, UserStatusRecently, UserStatusLastWeek, UserStatusLastMonth.
+        """
+        self.was_online = was_online
+
+    def to_dict(self):
+        return {
+            '_': 'UserStatusOffline',
+            'was_online': self.was_online
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'?p\x8c\x00',
+            self.serialize_datetime(self.was_online),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _was_online = reader.tgread_date()
+        return cls(was_online=_was_online)
+
+
+class UserStatusOnline(TLObject):
+    CONSTRUCTOR_ID = 0xedb93949
+    SUBCLASS_OF_ID = 0x5b0b743e
+    __slots__ = ('expires',)
+
+    def __init__(self, expires: Optional[datetime]):
+        """
+        Constructor for UserStatus: Instance of either UserStatusEmpty, UserStatusOnline, UserStatusOffline, UserStatusRecently, UserStatusLastWeek, UserStatusLastMonth.
+        """
+        self.expires = expires
+
+    def to_dict(self):
+        return {
+            '_': 'UserStatusOnline',
+            'expires': self.expires
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'I9\xb9\xed',
+            self.serialize_datetime(self.expires),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _expires = reader.tgread_date()
+        return cls(expires=_expires)
+
+
+class UserStatusRecently(TLObject):
+    CONSTRUCTOR_ID = 0x7b197dc8
+    SUBCLASS_OF_ID = 0x5b0b743e
+    __slots__ = ('by_me',)
+
+    def __init__(self, by_me: Optional[bool]=None):
+        """
+        Constructor for UserStatus: Instance of either UserStatusEmpty, UserStatusOnline, UserStatusOffline, UserStatusRecently, UserStatusLastWeek, UserStatusLastMonth.
+        """
+        self.by_me = by_me
+
+    def to_dict(self):
+        return {
+            '_': 'UserStatusRecently',
+            'by_me': self.by_me
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc8}\x19{',
+            struct.pack('<I', (0 if self.by_me is None or self.by_me is False else 1)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _by_me = bool(flags & 1)
+        return cls(by_me=_by_me)
+
+TypeUserStatus = Union[UserStatusEmpty,UserStatusOnline,UserStatusOffline,UserStatusRecently,UserStatusLastWeek,UserStatusLastMonth]
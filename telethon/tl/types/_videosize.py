@@ -0,0 +1,133 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_iii = struct.Struct('<iii')
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputStickerSet
+
+
+
+class VideoSize(TLObject):
+    CONSTRUCTOR_ID = 0xde33b094
+    SUBCLASS_OF_ID = 0x62f1d509
+    __slots__ = ('type', 'w', 'h', 'size', 'video_start_ts')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str, w: int, h: int, size: int, video_start_ts: Optional[float]=None):
+        """
+        Constructor for VideoSize: Instance of either VideoSize, VideoSizeEmojiMarkup, VideoSizeStickerMarkup.
+        """
+        self.type = type
+        self.w = w
+        self.h = h
+        self.size = size
+        self.video_start_ts = video_start_ts
+
+    def to_dict(self):
+        return {
+            '_': 'VideoSize',
+            'type': self.type,
+            'w': self.w,
+            'h': self.h,
+            'size': self.size,
+            'video_start_ts': self.video_start_ts
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x94\xb03\xde',
+            struct.pack('<I', (0 if self.video_start_ts is None or self.video_start_ts is False else 1)),
+            self.serialize_bytes(self.type),
+            _struct_iii.pack(self.w, self.h, self.size),
+            b'' if self.video_start_ts is None or self.video_start_ts is False else (struct.pack('<d', self.video_start_ts)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _type = reader.tgread_string()
+        _w, _h, _size = reader.read_struct(_struct_iii)
+        if flags & 1:
+            _video_start_ts = reader.read_double()
+        else:
+            _video_start_ts = None
+        return cls(type=_type, w=_w, h=_h, size=_size, video_start_ts=_video_start_ts)
+
+
+class VideoSizeEmojiMarkup(TLObject):
+    CONSTRUCTOR_ID = 0xf85c413c
+    SUBCLASS_OF_ID = 0x62f1d509
+    __slots__ = ('emoji_id', 'background_colors')
+
+    def __init__(self, emoji_id: int, background_colors: List[int]):
+        """
+        Constructor for VideoSize: Instance of either VideoSize, VideoSizeEmojiMarkup, VideoSizeStickerMarkup.
+        """
+        self.emoji_id = emoji_id
+        self.background_colors = background_colors
+
+    def to_dict(self):
+        return {
+            '_': 'VideoSizeEmojiMarkup',
+            'emoji_id': self.emoji_id,
+            'background_colors': [] if self.background_colors is None else self.background_colors[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'<A\\\xf8',
+            struct.pack('<q', self.emoji_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.background_colors)), len(self.background_colors), *self.background_colors),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _emoji_id = reader.read_long()
+        reader.read_int()
+        _background_colors = reader.read_array('i', reader.read_int())
+        return cls(emoji_id=_emoji_id, background_colors=_background_colors)
+
+
+class VideoSizeStickerMarkup(TLObject):
+    CONSTRUCTOR_ID = 0xda082fe
+    SUBCLASS_OF_ID = 0x62f1d509
+    __slots__ = ('stickerset', 'sticker_id', 'background_colors')
+
+    def __init__(self, stickerset: 'TypeInputStickerSet', sticker_id: int, background_colors: List[int]):
+        """
+        Constructor for VideoSize: Instance of either VideoSize, VideoSizeEmojiMarkup, VideoSizeStickerMarkup.
+        """
+        self.stickerset = stickerset
+        self.sticker_id = sticker_id
+        self.background_colors = background_colors
+
+    def to_dict(self):
+        return {
+            '_': 'VideoSizeStickerMarkup',
+            'stickerset': self.stickerset.to_dict() if isinstance(self.stickerset, TLObject) else self.stickerset,
+            'sticker_id': self.sticker_id,
+            'background_colors': [] if self.background_colors is None else self.background_colors[:]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xfe\x82\xa0\r',
+            self.stickerset._bytes(),
+            struct.pack('<q', self.sticker_id),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i{}i'.format(len(self.background_colors)), len(self.background_colors), *self.background_colors),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _stickerset = reader.tgread_object()
+        _sticker_id = reader.read_long()
+        reader.read_int()
+        _background_colors = reader.read_array('i', reader.read_int())
+        return cls(stickerset=_stickerset, sticker_id=_sticker_id, background_colors=_background_colors)
+
+TypeVideoSize = Union[VideoSize,VideoSizeEmojiMarkup,VideoSizeStickerMarkup]
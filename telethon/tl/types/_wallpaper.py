@@ -0,0 +1,118 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qI = struct.Struct('<qI')
+_struct_qIq = struct.Struct('<qIq')
+_struct_qi = struct.Struct('<qi')
+_struct_qiq = struct.Struct('<qiq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypeWallPaperSettings
+
+
+
+class WallPaper(TLObject):
+    CONSTRUCTOR_ID = 0xa437c3ed
+    SUBCLASS_OF_ID = 0x96a2c98b
+    __slots__ = ('id', 'access_hash', 'slug', 'document', 'creator', 'default', 'pattern', 'dark', 'settings')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, access_hash: int, slug: str, document: 'TypeDocument', creator: Optional[bool]=None, default: Optional[bool]=None, pattern: Optional[bool]=None, dark: Optional[bool]=None, settings: Optional['TypeWallPaperSettings']=None):
+        """
+        Constructor for WallPaper: Instance of either WallPaper, WallPaperNoFile.
+        """
+        self.id = id
+        self.access_hash = access_hash
+        self.slug = slug
+        self.document = document
+        self.creator = creator
+        self.default = default
+        self.pattern = pattern
+        self.dark = dark
+        self.settings = settings
+
+    def to_dict(self):
+        return {
+            '_': 'WallPaper',
+            'id': self.id,
+            'access_hash': self.access_hash,
+            'slug': self.slug,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'creator': self.creator,
+            'default': self.default,
+            'pattern': self.pattern,
+            'dark': self.dark,
+            'settings': self.settings.to_dict() if isinstance(self.settings, TLObject) else self.settings
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xed\xc37\xa4',
+            _struct_qIq.pack(self.id, (0 if self.creator is None or self.creator is False else 1) | (0 if self.default is None or self.default is False else 2) | (0 if self.pattern is None or self.pattern is False else 8) | (0 if self.dark is None or self.dark is False else 16) | (0 if self.settings is None or self.settings is False else 4), self.access_hash),
+            self.serialize_bytes(self.slug),
+            self.document._bytes(),
+            b'' if self.settings is None or self.settings is False else (self.settings._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, flags, _access_hash = reader.read_struct(_struct_qiq)
+        _creator = bool(flags & 1)
+        _default = bool(flags & 2)
+        _pattern = bool(flags & 8)
+        _dark = bool(flags & 16)
+        _slug = reader.tgread_string()
+        _document = reader.tgread_object()
+        if flags & 4:
+            _settings = reader.tgread_object()
+        else:
+            _settings = None
+        return cls(id=_id, access_hash=_access_hash, slug=_slug, document=_document, creator=_creator, default=_default, pattern=_pattern, dark=_dark, settings=_settings)
+
+
+class WallPaperNoFile(TLObject):
+    CONSTRUCTOR_ID = 0xe0804116
+    SUBCLASS_OF_ID = 0x96a2c98b
+    __slots__ = ('id', 'default', 'dark', 'settings')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, default: Optional[bool]=None, dark: Optional[bool]=None, settings: Optional['TypeWallPaperSettings']=None):
+        """
+        Constructor for WallPaper: Instance of either WallPaper, WallPaperNoFile.
+        """
+        self.id = id
+        self.default = default
+        self.dark = dark
+        self.settings = settings
+
+    def to_dict(self):
+        return {
+            '_': 'WallPaperNoFile',
+            'id': self.id,
+            'default': self.default,
+            'dark': self.dark,
+            'settings': self.settings.to_dict() if isinstance(self.settings, TLObject) else self.settings
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x16A\x80\xe0',
+            _struct_qI.pack(self.id, (0 if self.default is None or self.default is False else 2) | (0 if self.dark is None or self.dark is False else 16) | (0 if self.settings is None or self.settings is False else 4)),
+            b'' if self.settings is None or self.settings is False else (self.settings._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _id, flags = reader.read_struct(_struct_qi)
+        _default = bool(flags & 2)
+        _dark = bool(flags & 16)
+        if flags & 4:
+            _settings = reader.tgread_object()
+        else:
+            _settings = None
+        return cls(id=_id, default=_default, dark=_dark, settings=_settings)
+
+TypeWallPaper = Union[WallPaper,WallPaperNoFile]
@@ -0,0 +1,92 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class WallPaperSettings(TLObject):
+    CONSTRUCTOR_ID = 0x372efcd0
+    SUBCLASS_OF_ID = 0x4175e312
+    __slots__ = ('blur', 'motion', 'background_color', 'second_background_color', 'third_background_color', 'fourth_background_color', 'intensity', 'rotation', 'emoticon')
+
+    def __init__(self, blur: Optional[bool]=None, motion: Optional[bool]=None, background_color: Optional[int]=None, second_background_color: Optional[int]=None, third_background_color: Optional[int]=None, fourth_background_color: Optional[int]=None, intensity: Optional[int]=None, rotation: Optional[int]=None, emoticon: Optional[str]=None):
+        """
+        Constructor for WallPaperSettings: Instance of WallPaperSettings.
+        """
+        self.blur = blur
+        self.motion = motion
+        self.background_color = background_color
+        self.second_background_color = second_background_color
+        self.third_background_color = third_background_color
+        self.fourth_background_color = fourth_background_color
+        self.intensity = intensity
+        self.rotation = rotation
+        self.emoticon = emoticon
+
+    def to_dict(self):
+        return {
+            '_': 'WallPaperSettings',
+            'blur': self.blur,
+            'motion': self.motion,
+            'background_color': self.background_color,
+            'second_background_color': self.second_background_color,
+            'third_background_color': self.third_background_color,
+            'fourth_background_color': self.fourth_background_color,
+            'intensity': self.intensity,
+            'rotation': self.rotation,
+            'emoticon': self.emoticon
+        }
+
+    def _bytes(self):
+        assert ((self.second_background_color or self.second_background_color is not None) and (self.rotation or self.rotation is not None)) or ((self.second_background_color is None or self.second_background_color is False) and (self.rotation is None or self.rotation is False)), 'second_background_color, rotation parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xd0\xfc.7',
+            struct.pack('<I', (0 if self.blur is None or self.blur is False else 2) | (0 if self.motion is None or self.motion is False else 4) | (0 if self.background_color is None or self.background_color is False else 1) | (0 if self.second_background_color is None or self.second_background_color is False else 16) | (0 if self.third_background_color is None or self.third_background_color is False else 32) | (0 if self.fourth_background_color is None or self.fourth_background_color is False else 64) | (0 if self.intensity is None or self.intensity is False else 8) | (0 if self.rotation is None or self.rotation is False else 16) | (0 if self.emoticon is None or self.emoticon is False else 128)),
+            b'' if self.background_color is None or self.background_color is False else (struct.pack('<i', self.background_color)),
+            b'' if self.second_background_color is None or self.second_background_color is False else (struct.pack('<i', self.second_background_color)),
+            b'' if self.third_background_color is None or self.third_background_color is False else (struct.pack('<i', self.third_background_color)),
+            b'' if self.fourth_background_color is None or self.fourth_background_color is False else (struct.pack('<i', self.fourth_background_color)),
+            b'' if self.intensity is None or self.intensity is False else (struct.pack('<i', self.intensity)),
+            b'' if self.rotation is None or self.rotation is False else (struct.pack('<i', self.rotation)),
+            b'' if self.emoticon is None or self.emoticon is False else (self.serialize_bytes(self.emoticon)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _blur = bool(flags & 2)
+        _motion = bool(flags & 4)
+        if flags & 1:
+            _background_color = reader.read_int()
+        else:
+            _background_color = None
+        if flags & 16:
+            _second_background_color = reader.read_int()
+        else:
+            _second_background_color = None
+        if flags & 32:
+            _third_background_color = reader.read_int()
+        else:
+            _third_background_color = None
+        if flags & 64:
+            _fourth_background_color = reader.read_int()
+        else:
+            _fourth_background_color = None
+        if flags & 8:
+            _intensity = reader.read_int()
+        else:
+            _intensity = None
+        if flags & 16:
+            _rotation = reader.read_int()
+        else:
+            _rotation = None
+        if flags & 128:
+            _emoticon = reader.tgread_string()
+        else:
+            _emoticon = None
+        return cls(blur=_blur, motion=_motion, background_color=_background_color, second_background_color=_second_background_color, third_background_color=_third_background_color, fourth_background_color=_fourth_background_color, intensity=_intensity, rotation=_rotation, emoticon=_emoticon)
+
+TypeWallPaperSettings = WallPaperSettings
@@ -0,0 +1,70 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qq = struct.Struct('<qq')
+
+
+class WebAuthorization(TLObject):
+    CONSTRUCTOR_ID = 0xa6f8f452
+    SUBCLASS_OF_ID = 0x3764d30
+    __slots__ = ('hash', 'bot_id', 'domain', 'browser', 'platform', 'date_created', 'date_active', 'ip', 'region')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, hash: int, bot_id: int, domain: str, browser: str, platform: str, date_created: Optional[datetime], date_active: Optional[datetime], ip: str, region: str):
+        """
+        Constructor for WebAuthorization: Instance of WebAuthorization.
+        """
+        self.hash = hash
+        self.bot_id = bot_id
+        self.domain = domain
+        self.browser = browser
+        self.platform = platform
+        self.date_created = date_created
+        self.date_active = date_active
+        self.ip = ip
+        self.region = region
+
+    def to_dict(self):
+        return {
+            '_': 'WebAuthorization',
+            'hash': self.hash,
+            'bot_id': self.bot_id,
+            'domain': self.domain,
+            'browser': self.browser,
+            'platform': self.platform,
+            'date_created': self.date_created,
+            'date_active': self.date_active,
+            'ip': self.ip,
+            'region': self.region
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'R\xf4\xf8\xa6',
+            _struct_qq.pack(self.hash, self.bot_id),
+            self.serialize_bytes(self.domain),
+            self.serialize_bytes(self.browser),
+            self.serialize_bytes(self.platform),
+            self.serialize_datetime(self.date_created),
+            self.serialize_datetime(self.date_active),
+            self.serialize_bytes(self.ip),
+            self.serialize_bytes(self.region),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _hash, _bot_id = reader.read_struct(_struct_qq)
+        _domain = reader.tgread_string()
+        _browser = reader.tgread_string()
+        _platform = reader.tgread_string()
+        _date_created = reader.tgread_date()
+        _date_active = reader.tgread_date()
+        _ip = reader.tgread_string()
+        _region = reader.tgread_string()
+        return cls(hash=_hash, bot_id=_bot_id, domain=_domain, browser=_browser, platform=_platform, date_created=_date_created, date_active=_date_active, ip=_ip, region=_region)
+
+TypeWebAuthorization = WebAuthorization
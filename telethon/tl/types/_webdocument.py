@@ -0,0 +1,107 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_qi = struct.Struct('<qi')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocumentAttribute
+
+
+
+class WebDocument(TLObject):
+    CONSTRUCTOR_ID = 0x1c570ed1
+    SUBCLASS_OF_ID = 0x3b642814
+    __slots__ = ('url', 'access_hash', 'size', 'mime_type', 'attributes')
+
+    def __init__(self, url: str, access_hash: int, size: int, mime_type: str, attributes: List['TypeDocumentAttribute']):
+        """
+        Constructor for WebDocument: Instance of either WebDocument, WebDocumentNoProxy.
+        """
+        self.url = url
+        self.access_hash = access_hash
+        self.size = size
+        self.mime_type = mime_type
+        self.attributes = attributes
+
+    def to_dict(self):
+        return {
+            '_': 'WebDocument',
+            'url': self.url,
+            'access_hash': self.access_hash,
+            'size': self.size,
+            'mime_type': self.mime_type,
+            'attributes': [] if self.attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.attributes]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd1\x0eW\x1c',
+            self.serialize_bytes(self.url),
+            _struct_qi.pack(self.access_hash, self.size),
+            self.serialize_bytes(self.mime_type),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.attributes)),b''.join(x._bytes() for x in self.attributes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _access_hash, _size = reader.read_struct(_struct_qi)
+        _mime_type = reader.tgread_string()
+        reader.read_int()
+        _attributes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _attributes.append(_x)
+
+        return cls(url=_url, access_hash=_access_hash, size=_size, mime_type=_mime_type, attributes=_attributes)
+
+
+class WebDocumentNoProxy(TLObject):
+    CONSTRUCTOR_ID = 0xf9c8bcc6
+    SUBCLASS_OF_ID = 0x3b642814
+    __slots__ = ('url', 'size', 'mime_type', 'attributes')
+
+    def __init__(self, url: str, size: int, mime_type: str, attributes: List['TypeDocumentAttribute']):
+        """
+        Constructor for WebDocument: Instance of either WebDocument, WebDocumentNoProxy.
+        """
+        self.url = url
+        self.size = size
+        self.mime_type = mime_type
+        self.attributes = attributes
+
+    def to_dict(self):
+        return {
+            '_': 'WebDocumentNoProxy',
+            'url': self.url,
+            'size': self.size,
+            'mime_type': self.mime_type,
+            'attributes': [] if self.attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.attributes]
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xc6\xbc\xc8\xf9',
+            self.serialize_bytes(self.url),
+            struct.pack('<i', self.size),
+            self.serialize_bytes(self.mime_type),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.attributes)),b''.join(x._bytes() for x in self.attributes),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _url = reader.tgread_string()
+        _size = reader.read_int()
+        _mime_type = reader.tgread_string()
+        reader.read_int()
+        _attributes = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _attributes.append(_x)
+
+        return cls(url=_url, size=_size, mime_type=_mime_type, attributes=_attributes)
+
+TypeWebDocument = Union[WebDocument,WebDocumentNoProxy]
@@ -0,0 +1,280 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+_struct_Iq = struct.Struct('<Iq')
+_struct_iq = struct.Struct('<iq')
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypePage, TypePhoto, TypeWebPageAttribute
+
+
+
+class WebPage(TLObject):
+    CONSTRUCTOR_ID = 0xe89c45b2
+    SUBCLASS_OF_ID = 0x55a97481
+    __slots__ = ('id', 'url', 'display_url', 'hash', 'has_large_media', 'video_cover_photo', 'type', 'site_name', 'title', 'description', 'photo', 'embed_url', 'embed_type', 'embed_width', 'embed_height', 'duration', 'author', 'document', 'cached_page', 'attributes')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, url: str, display_url: str, hash: int, has_large_media: Optional[bool]=None, video_cover_photo: Optional[bool]=None, type: Optional[str]=None, site_name: Optional[str]=None, title: Optional[str]=None, description: Optional[str]=None, photo: Optional['TypePhoto']=None, embed_url: Optional[str]=None, embed_type: Optional[str]=None, embed_width: Optional[int]=None, embed_height: Optional[int]=None, duration: Optional[int]=None, author: Optional[str]=None, document: Optional['TypeDocument']=None, cached_page: Optional['TypePage']=None, attributes: Optional[List['TypeWebPageAttribute']]=None):
+        """
+        Constructor for WebPage: Instance of either WebPageEmpty, WebPagePending, WebPage, WebPageNotModified.
+        """
+        self.id = id
+        self.url = url
+        self.display_url = display_url
+        self.hash = hash
+        self.has_large_media = has_large_media
+        self.video_cover_photo = video_cover_photo
+        self.type = type
+        self.site_name = site_name
+        self.title = title
+        self.description = description
+        self.photo = photo
+        self.embed_url = embed_url
+        self.embed_type = embed_type
+        self.embed_width = embed_width
+        self.embed_height = embed_height
+        self.duration = duration
+        self.author = author
+        self.document = document
+        self.cached_page = cached_page
+        self.attributes = attributes
+
+    def to_dict(self):
+        return {
+            '_': 'WebPage',
+            'id': self.id,
+            'url': self.url,
+            'display_url': self.display_url,
+            'hash': self.hash,
+            'has_large_media': self.has_large_media,
+            'video_cover_photo': self.video_cover_photo,
+            'type': self.type,
+            'site_name': self.site_name,
+            'title': self.title,
+            'description': self.description,
+            'photo': self.photo.to_dict() if isinstance(self.photo, TLObject) else self.photo,
+            'embed_url': self.embed_url,
+            'embed_type': self.embed_type,
+            'embed_width': self.embed_width,
+            'embed_height': self.embed_height,
+            'duration': self.duration,
+            'author': self.author,
+            'document': self.document.to_dict() if isinstance(self.document, TLObject) else self.document,
+            'cached_page': self.cached_page.to_dict() if isinstance(self.cached_page, TLObject) else self.cached_page,
+            'attributes': [] if self.attributes is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.attributes]
+        }
+
+    def _bytes(self):
+        assert ((self.embed_url or self.embed_url is not None) and (self.embed_type or self.embed_type is not None)) or ((self.embed_url is None or self.embed_url is False) and (self.embed_type is None or self.embed_type is False)), 'embed_url, embed_type parameters must all be False-y (like None) or all me True-y'
+        assert ((self.embed_width or self.embed_width is not None) and (self.embed_height or self.embed_height is not None)) or ((self.embed_width is None or self.embed_width is False) and (self.embed_height is None or self.embed_height is False)), 'embed_width, embed_height parameters must all be False-y (like None) or all me True-y'
+        return b''.join((
+            b'\xb2E\x9c\xe8',
+            _struct_Iq.pack((0 if self.has_large_media is None or self.has_large_media is False else 8192) | (0 if self.video_cover_photo is None or self.video_cover_photo is False else 16384) | (0 if self.type is None or self.type is False else 1) | (0 if self.site_name is None or self.site_name is False else 2) | (0 if self.title is None or self.title is False else 4) | (0 if self.description is None or self.description is False else 8) | (0 if self.photo is None or self.photo is False else 16) | (0 if self.embed_url is None or self.embed_url is False else 32) | (0 if self.embed_type is None or self.embed_type is False else 32) | (0 if self.embed_width is None or self.embed_width is False else 64) | (0 if self.embed_height is None or self.embed_height is False else 64) | (0 if self.duration is None or self.duration is False else 128) | (0 if self.author is None or self.author is False else 256) | (0 if self.document is None or self.document is False else 512) | (0 if self.cached_page is None or self.cached_page is False else 1024) | (0 if self.attributes is None or self.attributes is False else 4096), self.id),
+            self.serialize_bytes(self.url),
+            self.serialize_bytes(self.display_url),
+            struct.pack('<i', self.hash),
+            b'' if self.type is None or self.type is False else (self.serialize_bytes(self.type)),
+            b'' if self.site_name is None or self.site_name is False else (self.serialize_bytes(self.site_name)),
+            b'' if self.title is None or self.title is False else (self.serialize_bytes(self.title)),
+            b'' if self.description is None or self.description is False else (self.serialize_bytes(self.description)),
+            b'' if self.photo is None or self.photo is False else (self.photo._bytes()),
+            b'' if self.embed_url is None or self.embed_url is False else (self.serialize_bytes(self.embed_url)),
+            b'' if self.embed_type is None or self.embed_type is False else (self.serialize_bytes(self.embed_type)),
+            b'' if self.embed_width is None or self.embed_width is False else (struct.pack('<i', self.embed_width)),
+            b'' if self.embed_height is None or self.embed_height is False else (struct.pack('<i', self.embed_height)),
+            b'' if self.duration is None or self.duration is False else (struct.pack('<i', self.duration)),
+            b'' if self.author is None or self.author is False else (self.serialize_bytes(self.author)),
+            b'' if self.document is None or self.document is False else (self.document._bytes()),
+            b'' if self.cached_page is None or self.cached_page is False else (self.cached_page._bytes()),
+            b'' if self.attributes is None or self.attributes is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.attributes)),b''.join(x._bytes() for x in self.attributes))),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        _has_large_media = bool(flags & 8192)
+        _video_cover_photo = bool(flags & 16384)
+        _url = reader.tgread_string()
+        _display_url = reader.tgread_string()
+        _hash = reader.read_int()
+        if flags & 1:
+            _type = reader.tgread_string()
+        else:
+            _type = None
+        if flags & 2:
+            _site_name = reader.tgread_string()
+        else:
+            _site_name = None
+        if flags & 4:
+            _title = reader.tgread_string()
+        else:
+            _title = None
+        if flags & 8:
+            _description = reader.tgread_string()
+        else:
+            _description = None
+        if flags & 16:
+            _photo = reader.tgread_object()
+        else:
+            _photo = None
+        if flags & 32:
+            _embed_url = reader.tgread_string()
+        else:
+            _embed_url = None
+        if flags & 32:
+            _embed_type = reader.tgread_string()
+        else:
+            _embed_type = None
+        if flags & 64:
+            _embed_width = reader.read_int()
+        else:
+            _embed_width = None
+        if flags & 64:
+            _embed_height = reader.read_int()
+        else:
+            _embed_height = None
+        if flags & 128:
+            _duration = reader.read_int()
+        else:
+            _duration = None
+        if flags & 256:
+            _author = reader.tgread_string()
+        else:
+            _author = None
+        if flags & 512:
+            _document = reader.tgread_object()
+        else:
+            _document = None
+        if flags & 1024:
+            _cached_page = reader.tgread_object()
+        else:
+            _cached_page = None
+        if flags & 4096:
+            reader.read_int()
+            _attributes = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _attributes.append(_x)
+
+        else:
+            _attributes = None
+        return cls(id=_id, url=_url, display_url=_display_url, hash=_hash, has_large_media=_has_large_media, video_cover_photo=_video_cover_photo, type=_type, site_name=_site_name, title=_title, description=_description, photo=_photo, embed_url=_embed_url, embed_type=_embed_type, embed_width=_embed_width, embed_height=_embed_height, duration=_duration, author=_author, document=_document, cached_page=_cached_page, attributes=_attributes)
+
+
+class WebPageEmpty(TLObject):
+    CONSTRUCTOR_ID = 0x211a1788
+    SUBCLASS_OF_ID = 0x55a97481
+    __slots__ = ('id', 'url')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, url: Optional[str]=None):
+        """
+        Constructor for WebPage: Instance of either WebPageEmpty, WebPagePending, WebPage, WebPageNotModified.
+        """
+        self.id = id
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'WebPageEmpty',
+            'id': self.id,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x88\x17\x1a!',
+            _struct_Iq.pack((0 if self.url is None or self.url is False else 1), self.id),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        return cls(id=_id, url=_url)
+
+
+class WebPageNotModified(TLObject):
+    CONSTRUCTOR_ID = 0x7311ca11
+    SUBCLASS_OF_ID = 0x55a97481
+    __slots__ = ('cached_page_views',)
+
+    def __init__(self, cached_page_views: Optional[int]=None):
+        """
+        Constructor for WebPage: Instance of either WebPageEmpty, WebPagePending, WebPage, WebPageNotModified.
+        """
+        self.cached_page_views = cached_page_views
+
+    def to_dict(self):
+        return {
+            '_': 'WebPageNotModified',
+            'cached_page_views': self.cached_page_views
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x11\xca\x11s',
+            struct.pack('<I', (0 if self.cached_page_views is None or self.cached_page_views is False else 1)),
+            b'' if self.cached_page_views is None or self.cached_page_views is False else (struct.pack('<i', self.cached_page_views)),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _cached_page_views = reader.read_int()
+        else:
+            _cached_page_views = None
+        return cls(cached_page_views=_cached_page_views)
+
+
+class WebPagePending(TLObject):
+    CONSTRUCTOR_ID = 0xb0d13e47
+    SUBCLASS_OF_ID = 0x55a97481
+    __slots__ = ('id', 'date', 'url')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, id: int, date: Optional[datetime], url: Optional[str]=None):
+        """
+        Constructor for WebPage: Instance of either WebPageEmpty, WebPagePending, WebPage, WebPageNotModified.
+        """
+        self.id = id
+        self.date = date
+        self.url = url
+
+    def to_dict(self):
+        return {
+            '_': 'WebPagePending',
+            'id': self.id,
+            'date': self.date,
+            'url': self.url
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'G>\xd1\xb0',
+            _struct_Iq.pack((0 if self.url is None or self.url is False else 1), self.id),
+            b'' if self.url is None or self.url is False else (self.serialize_bytes(self.url)),
+            self.serialize_datetime(self.date),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags, _id = reader.read_struct(_struct_iq)
+        if flags & 1:
+            _url = reader.tgread_string()
+        else:
+            _url = None
+        _date = reader.tgread_date()
+        return cls(id=_id, date=_date, url=_url)
+
+TypeWebPage = Union[WebPageEmpty,WebPagePending,WebPage,WebPageNotModified]
@@ -0,0 +1,174 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeDocument, TypePeer, TypeStarGift, TypeStoryItem, TypeThemeSettings
+
+
+
+class WebPageAttributeStickerSet(TLObject):
+    CONSTRUCTOR_ID = 0x50cc03d3
+    SUBCLASS_OF_ID = 0xafcfe9c7
+    __slots__ = ('stickers', 'emojis', 'text_color')
+
+    def __init__(self, stickers: List['TypeDocument'], emojis: Optional[bool]=None, text_color: Optional[bool]=None):
+        """
+        Constructor for WebPageAttribute: Instance of either WebPageAttributeTheme, WebPageAttributeStory, WebPageAttributeStickerSet, WebPageAttributeUniqueStarGift.
+        """
+        self.stickers = stickers
+        self.emojis = emojis
+        self.text_color = text_color
+
+    def to_dict(self):
+        return {
+            '_': 'WebPageAttributeStickerSet',
+            'stickers': [] if self.stickers is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.stickers],
+            'emojis': self.emojis,
+            'text_color': self.text_color
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xd3\x03\xccP',
+            struct.pack('<I', (0 if self.emojis is None or self.emojis is False else 1) | (0 if self.text_color is None or self.text_color is False else 2)),
+            b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.stickers)),b''.join(x._bytes() for x in self.stickers),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _emojis = bool(flags & 1)
+        _text_color = bool(flags & 2)
+        reader.read_int()
+        _stickers = []
+        for _ in range(reader.read_int()):
+            _x = reader.tgread_object()
+            _stickers.append(_x)
+
+        return cls(stickers=_stickers, emojis=_emojis, text_color=_text_color)
+
+
+class WebPageAttributeStory(TLObject):
+    CONSTRUCTOR_ID = 0x2e94c3e7
+    SUBCLASS_OF_ID = 0xafcfe9c7
+    __slots__ = ('peer', 'id', 'story')
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, peer: 'TypePeer', id: int, story: Optional['TypeStoryItem']=None):
+        """
+        Constructor for WebPageAttribute: Instance of either WebPageAttributeTheme, WebPageAttributeStory, WebPageAttributeStickerSet, WebPageAttributeUniqueStarGift.
+        """
+        self.peer = peer
+        self.id = id
+        self.story = story
+
+    def to_dict(self):
+        return {
+            '_': 'WebPageAttributeStory',
+            'peer': self.peer.to_dict() if isinstance(self.peer, TLObject) else self.peer,
+            'id': self.id,
+            'story': self.story.to_dict() if isinstance(self.story, TLObject) else self.story
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xe7\xc3\x94.',
+            struct.pack('<I', (0 if self.story is None or self.story is False else 1)),
+            self.peer._bytes(),
+            struct.pack('<i', self.id),
+            b'' if self.story is None or self.story is False else (self.story._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _peer = reader.tgread_object()
+        _id = reader.read_int()
+        if flags & 1:
+            _story = reader.tgread_object()
+        else:
+            _story = None
+        return cls(peer=_peer, id=_id, story=_story)
+
+
+class WebPageAttributeTheme(TLObject):
+    CONSTRUCTOR_ID = 0x54b56617
+    SUBCLASS_OF_ID = 0xafcfe9c7
+    __slots__ = ('documents', 'settings')
+
+    def __init__(self, documents: Optional[List['TypeDocument']]=None, settings: Optional['TypeThemeSettings']=None):
+        """
+        Constructor for WebPageAttribute: Instance of either WebPageAttributeTheme, WebPageAttributeStory, WebPageAttributeStickerSet, WebPageAttributeUniqueStarGift.
+        """
+        self.documents = documents
+        self.settings = settings
+
+    def to_dict(self):
+        return {
+            '_': 'WebPageAttributeTheme',
+            'documents': [] if self.documents is None else [x.to_dict() if isinstance(x, TLObject) else x for x in self.documents],
+            'settings': self.settings.to_dict() if isinstance(self.settings, TLObject) else self.settings
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x17f\xb5T',
+            struct.pack('<I', (0 if self.documents is None or self.documents is False else 1) | (0 if self.settings is None or self.settings is False else 2)),
+            b'' if self.documents is None or self.documents is False else b''.join((b'\x15\xc4\xb5\x1c',struct.pack('<i', len(self.documents)),b''.join(x._bytes() for x in self.documents))),
+            b'' if self.settings is None or self.settings is False else (self.settings._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            reader.read_int()
+            _documents = []
+            for _ in range(reader.read_int()):
+                _x = reader.tgread_object()
+                _documents.append(_x)
+
+        else:
+            _documents = None
+        if flags & 2:
+            _settings = reader.tgread_object()
+        else:
+            _settings = None
+        return cls(documents=_documents, settings=_settings)
+
+
+class WebPageAttributeUniqueStarGift(TLObject):
+    CONSTRUCTOR_ID = 0xcf6f6db8
+    SUBCLASS_OF_ID = 0xafcfe9c7
+    __slots__ = ('gift',)
+
+    def __init__(self, gift: 'TypeStarGift'):
+        """
+        Constructor for WebPageAttribute: Instance of either WebPageAttributeTheme, WebPageAttributeStory, WebPageAttributeStickerSet, WebPageAttributeUniqueStarGift.
+        """
+        self.gift = gift
+
+    def to_dict(self):
+        return {
+            '_': 'WebPageAttributeUniqueStarGift',
+            'gift': self.gift.to_dict() if isinstance(self.gift, TLObject) else self.gift
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\xb8mo\xcf',
+            self.gift._bytes(),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        _gift = reader.tgread_object()
+        return cls(gift=_gift)
+
+TypeWebPageAttribute = Union[WebPageAttributeTheme,WebPageAttributeStory,WebPageAttributeStickerSet,WebPageAttributeUniqueStarGift]
@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+if TYPE_CHECKING:
+    from ...tl.types import TypeInputBotInlineMessageID
+
+
+
+class WebViewMessageSent(TLObject):
+    CONSTRUCTOR_ID = 0xc94511c
+    SUBCLASS_OF_ID = 0x75e49312
+    __slots__ = ('msg_id',)
+
+    def __init__(self, msg_id: Optional['TypeInputBotInlineMessageID']=None):
+        """
+        Constructor for WebViewMessageSent: Instance of WebViewMessageSent.
+        """
+        self.msg_id = msg_id
+
+    def to_dict(self):
+        return {
+            '_': 'WebViewMessageSent',
+            'msg_id': self.msg_id.to_dict() if isinstance(self.msg_id, TLObject) else self.msg_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x1cQ\x94\x0c',
+            struct.pack('<I', (0 if self.msg_id is None or self.msg_id is False else 1)),
+            b'' if self.msg_id is None or self.msg_id is False else (self.msg_id._bytes()),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        if flags & 1:
+            _msg_id = reader.tgread_object()
+        else:
+            _msg_id = None
+        return cls(msg_id=_msg_id)
+
+TypeWebViewMessageSent = WebViewMessageSent
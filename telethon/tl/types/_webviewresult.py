@@ -0,0 +1,53 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+from ...tl.tlobject import TLObject
+from typing import Optional, List, Union, TYPE_CHECKING
+import os
+import struct
+from datetime import datetime
+
+
+class WebViewResultUrl(TLObject):
+    CONSTRUCTOR_ID = 0x4d22ff98
+    SUBCLASS_OF_ID = 0x93cea746
+    __slots__ = ('url', 'fullsize', 'fullscreen', 'query_id')
+
+    def __init__(self, url: str, fullsize: Optional[bool]=None, fullscreen: Optional[bool]=None, query_id: Optional[int]=None):
+        """
+        Constructor for WebViewResult: Instance of WebViewResultUrl.
+        """
+        self.url = url
+        self.fullsize = fullsize
+        self.fullscreen = fullscreen
+        self.query_id = query_id
+
+    def to_dict(self):
+        return {
+            '_': 'WebViewResultUrl',
+            'url': self.url,
+            'fullsize': self.fullsize,
+            'fullscreen': self.fullscreen,
+            'query_id': self.query_id
+        }
+
+    def _bytes(self):
+        return b''.join((
+            b'\x98\xff"M',
+            struct.pack('<I', (0 if self.fullsize is None or self.fullsize is False else 2) | (0 if self.fullscreen is None or self.fullscreen is False else 4) | (0 if self.query_id is None or self.query_id is False else 1)),
+            b'' if self.query_id is None or self.query_id is False else (struct.pack('<q', self.query_id)),
+            self.serialize_bytes(self.url),
+        ))
+
+    @classmethod
+    def from_reader(cls, reader):
+        flags = reader.read_int()
+
+        _fullsize = bool(flags & 2)
+        _fullscreen = bool(flags & 4)
+        if flags & 1:
+            _query_id = reader.read_long()
+        else:
+            _query_id = None
+        _url = reader.tgread_string()
+        return cls(url=_url, fullsize=_fullsize, fullscreen=_fullscreen, query_id=_query_id)
+
+TypeWebViewResult = WebViewResultUrl
@@ -0,0 +1,89 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._account_authorizationform import AuthorizationForm
+    from ._account_authorizations import Authorizations
+    from ._account_autodownloadsettings import AutoDownloadSettings
+    from ._account_autosavesettings import AutoSaveSettings
+    from ._account_businesschatlinks import BusinessChatLinks
+    from ._account_connectedbots import ConnectedBots
+    from ._account_contentsettings import ContentSettings
+    from ._account_emailverified import EmailVerified, EmailVerifiedLogin
+    from ._account_emojistatuses import EmojiStatuses, EmojiStatusesNotModified
+    from ._account_paidmessagesrevenue import PaidMessagesRevenue
+    from ._account_password import Password
+    from ._account_passwordinputsettings import PasswordInputSettings
+    from ._account_passwordsettings import PasswordSettings
+    from ._account_privacyrules import PrivacyRules
+    from ._account_resetpasswordresult import ResetPasswordFailedWait, ResetPasswordOk, ResetPasswordRequestedWait
+    from ._account_resolvedbusinesschatlinks import ResolvedBusinessChatLinks
+    from ._account_savedringtone import SavedRingtone, SavedRingtoneConverted
+    from ._account_savedringtones import SavedRingtones, SavedRingtonesNotModified
+    from ._account_sentemailcode import SentEmailCode
+    from ._account_takeout import Takeout
+    from ._account_themes import Themes, ThemesNotModified
+    from ._account_tmppassword import TmpPassword
+    from ._account_wallpapers import WallPapers, WallPapersNotModified
+    from ._account_webauthorizations import WebAuthorizations
+
+_namespaces = ()
+_modules = {
+    'AuthorizationForm': '._account_authorizationform',
+    'Authorizations': '._account_authorizations',
+    'AutoDownloadSettings': '._account_autodownloadsettings',
+    'AutoSaveSettings': '._account_autosavesettings',
+    'BusinessChatLinks': '._account_businesschatlinks',
+    'ConnectedBots': '._account_connectedbots',
+    'ContentSettings': '._account_contentsettings',
+    'EmailVerified': '._account_emailverified',
+    'EmailVerifiedLogin': '._account_emailverified',
+    'EmojiStatuses': '._account_emojistatuses',
+    'EmojiStatusesNotModified': '._account_emojistatuses',
+    'PaidMessagesRevenue': '._account_paidmessagesrevenue',
+    'Password': '._account_password',
+    'PasswordInputSettings': '._account_passwordinputsettings',
+    'PasswordSettings': '._account_passwordsettings',
+    'PrivacyRules': '._account_privacyrules',
+    'ResetPasswordFailedWait': '._account_resetpasswordresult',
+    'ResetPasswordOk': '._account_resetpasswordresult',
+    'ResetPasswordRequestedWait': '._account_resetpasswordresult',
+    'ResolvedBusinessChatLinks': '._account_resolvedbusinesschatlinks',
+    'SavedRingtone': '._account_savedringtone',
+    'SavedRingtoneConverted': '._account_savedringtone',
+    'SavedRingtones': '._account_savedringtones',
+    'SavedRingtonesNotModified': '._account_savedringtones',
+    'SentEmailCode': '._account_sentemailcode',
+    'Takeout': '._account_takeout',
+    'Themes': '._account_themes',
+    'ThemesNotModified': '._account_themes',
+    'TmpPassword': '._account_tmppassword',
+    'WallPapers': '._account_wallpapers',
+    'WallPapersNotModified': '._account_wallpapers',
+    'WebAuthorizations': '._account_webauthorizations',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
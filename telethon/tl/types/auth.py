@@ -0,0 +1,68 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._auth_authorization import Authorization, AuthorizationSignUpRequired
+    from ._auth_codetype import CodeTypeCall, CodeTypeFlashCall, CodeTypeFragmentSms, CodeTypeMissedCall, CodeTypeSms
+    from ._auth_exportedauthorization import ExportedAuthorization
+    from ._auth_loggedout import LoggedOut
+    from ._auth_logintoken import LoginToken, LoginTokenMigrateTo, LoginTokenSuccess
+    from ._auth_passwordrecovery import PasswordRecovery
+    from ._auth_sentcode import SentCode, SentCodePaymentRequired, SentCodeSuccess
+    from ._auth_sentcodetype import SentCodeTypeApp, SentCodeTypeCall, SentCodeTypeEmailCode, SentCodeTypeFirebaseSms, SentCodeTypeFlashCall, SentCodeTypeFragmentSms, SentCodeTypeMissedCall, SentCodeTypeSetUpEmailRequired, SentCodeTypeSms, SentCodeTypeSmsPhrase, SentCodeTypeSmsWord
+
+_namespaces = ()
+_modules = {
+    'Authorization': '._auth_authorization',
+    'AuthorizationSignUpRequired': '._auth_authorization',
+    'CodeTypeCall': '._auth_codetype',
+    'CodeTypeFlashCall': '._auth_codetype',
+    'CodeTypeFragmentSms': '._auth_codetype',
+    'CodeTypeMissedCall': '._auth_codetype',
+    'CodeTypeSms': '._auth_codetype',
+    'ExportedAuthorization': '._auth_exportedauthorization',
+    'LoggedOut': '._auth_loggedout',
+    'LoginToken': '._auth_logintoken',
+    'LoginTokenMigrateTo': '._auth_logintoken',
+    'LoginTokenSuccess': '._auth_logintoken',
+    'PasswordRecovery': '._auth_passwordrecovery',
+    'SentCode': '._auth_sentcode',
+    'SentCodePaymentRequired': '._auth_sentcode',
+    'SentCodeSuccess': '._auth_sentcode',
+    'SentCodeTypeApp': '._auth_sentcodetype',
+    'SentCodeTypeCall': '._auth_sentcodetype',
+    'SentCodeTypeEmailCode': '._auth_sentcodetype',
+    'SentCodeTypeFirebaseSms': '._auth_sentcodetype',
+    'SentCodeTypeFlashCall': '._auth_sentcodetype',
+    'SentCodeTypeFragmentSms': '._auth_sentcodetype',
+    'SentCodeTypeMissedCall': '._auth_sentcodetype',
+    'SentCodeTypeSetUpEmailRequired': '._auth_sentcodetype',
+    'SentCodeTypeSms': '._auth_sentcodetype',
+    'SentCodeTypeSmsPhrase': '._auth_sentcodetype',
+    'SentCodeTypeSmsWord': '._auth_sentcodetype',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
@@ -0,0 +1,39 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._bots_botinfo import BotInfo
+    from ._bots_popularappbots import PopularAppBots
+    from ._bots_previewinfo import PreviewInfo
+
+_namespaces = ()
+_modules = {
+    'BotInfo': '._bots_botinfo',
+    'PopularAppBots': '._bots_popularappbots',
+    'PreviewInfo': '._bots_previewinfo',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
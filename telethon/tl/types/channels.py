@@ -0,0 +1,46 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._channels_adminlogresults import AdminLogResults
+    from ._channels_channelparticipant import ChannelParticipant
+    from ._channels_channelparticipants import ChannelParticipants, ChannelParticipantsNotModified
+    from ._channels_sendaspeers import SendAsPeers
+    from ._channels_sponsoredmessagereportresult import SponsoredMessageReportResultAdsHidden, SponsoredMessageReportResultChooseOption, SponsoredMessageReportResultReported
+
+_namespaces = ()
+_modules = {
+    'AdminLogResults': '._channels_adminlogresults',
+    'ChannelParticipant': '._channels_channelparticipant',
+    'ChannelParticipants': '._channels_channelparticipants',
+    'ChannelParticipantsNotModified': '._channels_channelparticipants',
+    'SendAsPeers': '._channels_sendaspeers',
+    'SponsoredMessageReportResultAdsHidden': '._channels_sponsoredmessagereportresult',
+    'SponsoredMessageReportResultChooseOption': '._channels_sponsoredmessagereportresult',
+    'SponsoredMessageReportResultReported': '._channels_sponsoredmessagereportresult',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
@@ -0,0 +1,54 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._contacts_blocked import Blocked, BlockedSlice
+    from ._contacts_contactbirthdays import ContactBirthdays
+    from ._contacts_contacts import Contacts, ContactsNotModified
+    from ._contacts_found import Found
+    from ._contacts_importedcontacts import ImportedContacts
+    from ._contacts_resolvedpeer import ResolvedPeer
+    from ._contacts_sponsoredpeers import SponsoredPeers, SponsoredPeersEmpty
+    from ._contacts_toppeers import TopPeers, TopPeersDisabled, TopPeersNotModified
+
+_namespaces = ()
+_modules = {
+    'Blocked': '._contacts_blocked',
+    'BlockedSlice': '._contacts_blocked',
+    'ContactBirthdays': '._contacts_contactbirthdays',
+    'Contacts': '._contacts_contacts',
+    'ContactsNotModified': '._contacts_contacts',
+    'Found': '._contacts_found',
+    'ImportedContacts': '._contacts_importedcontacts',
+    'ResolvedPeer': '._contacts_resolvedpeer',
+    'SponsoredPeers': '._contacts_sponsoredpeers',
+    'SponsoredPeersEmpty': '._contacts_sponsoredpeers',
+    'TopPeers': '._contacts_toppeers',
+    'TopPeersDisabled': '._contacts_toppeers',
+    'TopPeersNotModified': '._contacts_toppeers',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
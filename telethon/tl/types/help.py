@@ -0,0 +1,86 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._help_appconfig import AppConfig, AppConfigNotModified
+    from ._help_appupdate import AppUpdate, NoAppUpdate
+    from ._help_configsimple import ConfigSimple
+    from ._help_countrieslist import CountriesList, CountriesListNotModified
+    from ._help_country import Country
+    from ._help_countrycode import CountryCode
+    from ._help_deeplinkinfo import DeepLinkInfo, DeepLinkInfoEmpty
+    from ._help_invitetext import InviteText
+    from ._help_passportconfig import PassportConfig, PassportConfigNotModified
+    from ._help_peercoloroption import PeerColorOption
+    from ._help_peercolors import PeerColors, PeerColorsNotModified
+    from ._help_peercolorset import PeerColorProfileSet, PeerColorSet
+    from ._help_premiumpromo import PremiumPromo
+    from ._help_promodata import PromoData, PromoDataEmpty
+    from ._help_recentmeurls import RecentMeUrls
+    from ._help_support import Support
+    from ._help_supportname import SupportName
+    from ._help_termsofservice import TermsOfService
+    from ._help_termsofserviceupdate import TermsOfServiceUpdate, TermsOfServiceUpdateEmpty
+    from ._help_timezoneslist import TimezonesList, TimezonesListNotModified
+    from ._help_userinfo import UserInfo, UserInfoEmpty
+
+_namespaces = ()
+_modules = {
+    'AppConfig': '._help_appconfig',
+    'AppConfigNotModified': '._help_appconfig',
+    'AppUpdate': '._help_appupdate',
+    'ConfigSimple': '._help_configsimple',
+    'CountriesList': '._help_countrieslist',
+    'CountriesListNotModified': '._help_countrieslist',
+    'Country': '._help_country',
+    'CountryCode': '._help_countrycode',
+    'DeepLinkInfo': '._help_deeplinkinfo',
+    'DeepLinkInfoEmpty': '._help_deeplinkinfo',
+    'InviteText': '._help_invitetext',
+    'NoAppUpdate': '._help_appupdate',
+    'PassportConfig': '._help_passportconfig',
+    'PassportConfigNotModified': '._help_passportconfig',
+    'PeerColorOption': '._help_peercoloroption',
+    'PeerColorProfileSet': '._help_peercolorset',
+    'PeerColorSet': '._help_peercolorset',
+    'PeerColors': '._help_peercolors',
+    'PeerColorsNotModified': '._help_peercolors',
+    'PremiumPromo': '._help_premiumpromo',
+    'PromoData': '._help_promodata',
+    'PromoDataEmpty': '._help_promodata',
+    'RecentMeUrls': '._help_recentmeurls',
+    'Support': '._help_support',
+    'SupportName': '._help_supportname',
+    'TermsOfService': '._help_termsofservice',
+    'TermsOfServiceUpdate': '._help_termsofserviceupdate',
+    'TermsOfServiceUpdateEmpty': '._help_termsofserviceupdate',
+    'TimezonesList': '._help_timezoneslist',
+    'TimezonesListNotModified': '._help_timezoneslist',
+    'UserInfo': '._help_userinfo',
+    'UserInfoEmpty': '._help_userinfo',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
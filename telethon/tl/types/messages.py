@@ -0,0 +1,181 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._messages_affectedfoundmessages import AffectedFoundMessages
+    from ._messages_affectedhistory import AffectedHistory
+    from ._messages_affectedmessages import AffectedMessages
+    from ._messages_allstickers import AllStickers, AllStickersNotModified
+    from ._messages_archivedstickers import ArchivedStickers
+    from ._messages_availableeffects import AvailableEffects, AvailableEffectsNotModified
+    from ._messages_availablereactions import AvailableReactions, AvailableReactionsNotModified
+    from ._messages_botapp import BotApp
+    from ._messages_botcallbackanswer import BotCallbackAnswer
+    from ._messages_botpreparedinlinemessage import BotPreparedInlineMessage
+    from ._messages_botresults import BotResults
+    from ._messages_chatadminswithinvites import ChatAdminsWithInvites
+    from ._messages_chatfull import ChatFull
+    from ._messages_chatinviteimporters import ChatInviteImporters
+    from ._messages_chats import Chats, ChatsSlice
+    from ._messages_checkedhistoryimportpeer import CheckedHistoryImportPeer
+    from ._messages_dhconfig import DhConfig, DhConfigNotModified
+    from ._messages_dialogfilters import DialogFilters
+    from ._messages_dialogs import Dialogs, DialogsNotModified, DialogsSlice
+    from ._messages_discussionmessage import DiscussionMessage
+    from ._messages_emojigroups import EmojiGroups, EmojiGroupsNotModified
+    from ._messages_exportedchatinvite import ExportedChatInvite, ExportedChatInviteReplaced
+    from ._messages_exportedchatinvites import ExportedChatInvites
+    from ._messages_favedstickers import FavedStickers, FavedStickersNotModified
+    from ._messages_featuredstickers import FeaturedStickers, FeaturedStickersNotModified
+    from ._messages_forumtopics import ForumTopics
+    from ._messages_foundstickers import FoundStickers, FoundStickersNotModified
+    from ._messages_foundstickersets import FoundStickerSets, FoundStickerSetsNotModified
+    from ._messages_highscores import HighScores
+    from ._messages_historyimport import HistoryImport
+    from ._messages_historyimportparsed import HistoryImportParsed
+    from ._messages_inactivechats import InactiveChats
+    from ._messages_invitedusers import InvitedUsers
+    from ._messages_messageeditdata import MessageEditData
+    from ._messages_messagereactionslist import MessageReactionsList
+    from ._messages_messages import ChannelMessages, Messages, MessagesNotModified, MessagesSlice
+    from ._messages_messageviews import MessageViews
+    from ._messages_mystickers import MyStickers
+    from ._messages_peerdialogs import PeerDialogs
+    from ._messages_peersettings import PeerSettings
+    from ._messages_preparedinlinemessage import PreparedInlineMessage
+    from ._messages_quickreplies import QuickReplies, QuickRepliesNotModified
+    from ._messages_reactions import Reactions, ReactionsNotModified
+    from ._messages_recentstickers import RecentStickers, RecentStickersNotModified
+    from ._messages_saveddialogs import SavedDialogs, SavedDialogsNotModified, SavedDialogsSlice
+    from ._messages_savedgifs import SavedGifs, SavedGifsNotModified
+    from ._messages_savedreactiontags import SavedReactionTags, SavedReactionTagsNotModified
+    from ._messages_searchcounter import SearchCounter
+    from ._messages_searchresultscalendar import SearchResultsCalendar
+    from ._messages_searchresultspositions import SearchResultsPositions
+    from ._messages_sentencryptedmessage import SentEncryptedFile, SentEncryptedMessage
+    from ._messages_sponsoredmessages import SponsoredMessages, SponsoredMessagesEmpty
+    from ._messages_stickers import Stickers, StickersNotModified
+    from ._messages_stickerset import StickerSet, StickerSetNotModified
+    from ._messages_stickersetinstallresult import StickerSetInstallResultArchive, StickerSetInstallResultSuccess
+    from ._messages_transcribedaudio import TranscribedAudio
+    from ._messages_translatedtext import TranslateResult
+    from ._messages_voteslist import VotesList
+    from ._messages_webpage import WebPage
+    from ._messages_webpagepreview import WebPagePreview
+
+_namespaces = ()
+_modules = {
+    'AffectedFoundMessages': '._messages_affectedfoundmessages',
+    'AffectedHistory': '._messages_affectedhistory',
+    'AffectedMessages': '._messages_affectedmessages',
+    'AllStickers': '._messages_allstickers',
+    'AllStickersNotModified': '._messages_allstickers',
+    'ArchivedStickers': '._messages_archivedstickers',
+    'AvailableEffects': '._messages_availableeffects',
+    'AvailableEffectsNotModified': '._messages_availableeffects',
+    'AvailableReactions': '._messages_availablereactions',
+    'AvailableReactionsNotModified': '._messages_availablereactions',
+    'BotApp': '._messages_botapp',
+    'BotCallbackAnswer': '._messages_botcallbackanswer',
+    'BotPreparedInlineMessage': '._messages_botpreparedinlinemessage',
+    'BotResults': '._messages_botresults',
+    'ChannelMessages': '._messages_messages',
+    'ChatAdminsWithInvites': '._messages_chatadminswithinvites',
+    'ChatFull': '._messages_chatfull',
+    'ChatInviteImporters': '._messages_chatinviteimporters',
+    'Chats': '._messages_chats',
+    'ChatsSlice': '._messages_chats',
+    'CheckedHistoryImportPeer': '._messages_checkedhistoryimportpeer',
+    'DhConfig': '._messages_dhconfig',
+    'DhConfigNotModified': '._messages_dhconfig',
+    'DialogFilters': '._messages_dialogfilters',
+    'Dialogs': '._messages_dialogs',
+    'DialogsNotModified': '._messages_dialogs',
+    'DialogsSlice': '._messages_dialogs',
+    'DiscussionMessage': '._messages_discussionmessage',
+    'EmojiGroups': '._messages_emojigroups',
+    'EmojiGroupsNotModified': '._messages_emojigroups',
+    'ExportedChatInvite': '._messages_exportedchatinvite',
+    'ExportedChatInviteReplaced': '._messages_exportedchatinvite',
+    'ExportedChatInvites': '._messages_exportedchatinvites',
+    'FavedStickers': '._messages_favedstickers',
+    'FavedStickersNotModified': '._messages_favedstickers',
+    'FeaturedStickers': '._messages_featuredstickers',
+    'FeaturedStickersNotModified': '._messages_featuredstickers',
+    'ForumTopics': '._messages_forumtopics',
+    'FoundStickerSets': '._messages_foundstickersets',
+    'FoundStickerSetsNotModified': '._messages_foundstickersets',
+    'FoundStickers': '._messages_foundstickers',
+    'FoundStickersNotModified': '._messages_foundstickers',
+    'HighScores': '._messages_highscores',
+    'HistoryImport': '._messages_historyimport',
+    'HistoryImportParsed': '._messages_historyimportparsed',
+    'InactiveChats': '._messages_inactivechats',
+    'InvitedUsers': '._messages_invitedusers',
+    'MessageEditData': '._messages_messageeditdata',
+    'MessageReactionsList': '._messages_messagereactionslist',
+    'MessageViews': '._messages_messageviews',
+    'Messages': '._messages_messages',
+    'MessagesNotModified': '._messages_messages',
+    'MessagesSlice': '._messages_messages',
+    'MyStickers': '._messages_mystickers',
+    'PeerDialogs': '._messages_peerdialogs',
+    'PeerSettings': '._messages_peersettings',
+    'PreparedInlineMessage': '._messages_preparedinlinemessage',
+    'QuickReplies': '._messages_quickreplies',
+    'QuickRepliesNotModified': '._messages_quickreplies',
+    'Reactions': '._messages_reactions',
+    'ReactionsNotModified': '._messages_reactions',
+    'RecentStickers': '._messages_recentstickers',
+    'RecentStickersNotModified': '._messages_recentstickers',
+    'SavedDialogs': '._messages_saveddialogs',
+    'SavedDialogsNotModified': '._messages_saveddialogs',
+    'SavedDialogsSlice': '._messages_saveddialogs',
+    'SavedGifs': '._messages_savedgifs',
+    'SavedGifsNotModified': '._messages_savedgifs',
+    'SavedReactionTags': '._messages_savedreactiontags',
+    'SavedReactionTagsNotModified': '._messages_savedreactiontags',
+    'SearchCounter': '._messages_searchcounter',
+    'SearchResultsCalendar': '._messages_searchresultscalendar',
+    'SearchResultsPositions': '._messages_searchresultspositions',
+    'SentEncryptedFile': '._messages_sentencryptedmessage',
+    'SentEncryptedMessage': '._messages_sentencryptedmessage',
+    'SponsoredMessages': '._messages_sponsoredmessages',
+    'SponsoredMessagesEmpty': '._messages_sponsoredmessages',
+    'StickerSet': '._messages_stickerset',
+    'StickerSetInstallResultArchive': '._messages_stickersetinstallresult',
+    'StickerSetInstallResultSuccess': '._messages_stickersetinstallresult',
+    'StickerSetNotModified': '._messages_stickerset',
+    'Stickers': '._messages_stickers',
+    'StickersNotModified': '._messages_stickers',
+    'TranscribedAudio': '._messages_transcribedaudio',
+    'TranslateResult': '._messages_translatedtext',
+    'VotesList': '._messages_voteslist',
+    'WebPage': '._messages_webpage',
+    'WebPagePreview': '._messages_webpagepreview',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
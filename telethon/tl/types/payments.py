@@ -0,0 +1,79 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._payments_bankcarddata import BankCardData
+    from ._payments_checkedgiftcode import CheckedGiftCode
+    from ._payments_connectedstarrefbots import ConnectedStarRefBots
+    from ._payments_exportedinvoice import ExportedInvoice
+    from ._payments_giveawayinfo import GiveawayInfo, GiveawayInfoResults
+    from ._payments_paymentform import PaymentForm, PaymentFormStarGift, PaymentFormStars
+    from ._payments_paymentreceipt import PaymentReceipt, PaymentReceiptStars
+    from ._payments_paymentresult import PaymentResult, PaymentVerificationNeeded
+    from ._payments_savedinfo import SavedInfo
+    from ._payments_savedstargifts import SavedStarGifts
+    from ._payments_stargifts import StarGifts, StarGiftsNotModified
+    from ._payments_stargiftupgradepreview import StarGiftUpgradePreview
+    from ._payments_stargiftwithdrawalurl import StarGiftWithdrawalUrl
+    from ._payments_starsrevenueadsaccounturl import StarsRevenueAdsAccountUrl
+    from ._payments_starsrevenuestats import StarsRevenueStats
+    from ._payments_starsrevenuewithdrawalurl import StarsRevenueWithdrawalUrl
+    from ._payments_starsstatus import StarsStatus
+    from ._payments_suggestedstarrefbots import SuggestedStarRefBots
+    from ._payments_uniquestargift import UniqueStarGift
+    from ._payments_validatedrequestedinfo import ValidatedRequestedInfo
+
+_namespaces = ()
+_modules = {
+    'BankCardData': '._payments_bankcarddata',
+    'CheckedGiftCode': '._payments_checkedgiftcode',
+    'ConnectedStarRefBots': '._payments_connectedstarrefbots',
+    'ExportedInvoice': '._payments_exportedinvoice',
+    'GiveawayInfo': '._payments_giveawayinfo',
+    'GiveawayInfoResults': '._payments_giveawayinfo',
+    'PaymentForm': '._payments_paymentform',
+    'PaymentFormStarGift': '._payments_paymentform',
+    'PaymentFormStars': '._payments_paymentform',
+    'PaymentReceipt': '._payments_paymentreceipt',
+    'PaymentReceiptStars': '._payments_paymentreceipt',
+    'PaymentResult': '._payments_paymentresult',
+    'PaymentVerificationNeeded': '._payments_paymentresult',
+    'SavedInfo': '._payments_savedinfo',
+    'SavedStarGifts': '._payments_savedstargifts',
+    'StarGiftUpgradePreview': '._payments_stargiftupgradepreview',
+    'StarGiftWithdrawalUrl': '._payments_stargiftwithdrawalurl',
+    'StarGifts': '._payments_stargifts',
+    'StarGiftsNotModified': '._payments_stargifts',
+    'StarsRevenueAdsAccountUrl': '._payments_starsrevenueadsaccounturl',
+    'StarsRevenueStats': '._payments_starsrevenuestats',
+    'StarsRevenueWithdrawalUrl': '._payments_starsrevenuewithdrawalurl',
+    'StarsStatus': '._payments_starsstatus',
+    'SuggestedStarRefBots': '._payments_suggestedstarrefbots',
+    'UniqueStarGift': '._payments_uniquestargift',
+    'ValidatedRequestedInfo': '._payments_validatedrequestedinfo',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
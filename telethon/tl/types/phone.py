@@ -0,0 +1,47 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._phone_exportedgroupcallinvite import ExportedGroupCallInvite
+    from ._phone_groupcall import GroupCall
+    from ._phone_groupcallstreamchannels import GroupCallStreamChannels
+    from ._phone_groupcallstreamrtmpurl import GroupCallStreamRtmpUrl
+    from ._phone_groupparticipants import GroupParticipants
+    from ._phone_joinaspeers import JoinAsPeers
+    from ._phone_phonecall import PhoneCall
+
+_namespaces = ()
+_modules = {
+    'ExportedGroupCallInvite': '._phone_exportedgroupcallinvite',
+    'GroupCall': '._phone_groupcall',
+    'GroupCallStreamChannels': '._phone_groupcallstreamchannels',
+    'GroupCallStreamRtmpUrl': '._phone_groupcallstreamrtmpurl',
+    'GroupParticipants': '._phone_groupparticipants',
+    'JoinAsPeers': '._phone_joinaspeers',
+    'PhoneCall': '._phone_phonecall',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
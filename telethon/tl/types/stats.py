@@ -0,0 +1,49 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._stats_broadcastrevenuestats import BroadcastRevenueStats
+    from ._stats_broadcastrevenuetransactions import BroadcastRevenueTransactions
+    from ._stats_broadcastrevenuewithdrawalurl import BroadcastRevenueWithdrawalUrl
+    from ._stats_broadcaststats import BroadcastStats
+    from ._stats_megagroupstats import MegagroupStats
+    from ._stats_messagestats import MessageStats
+    from ._stats_publicforwards import PublicForwards
+    from ._stats_storystats import StoryStats
+
+_namespaces = ()
+_modules = {
+    'BroadcastRevenueStats': '._stats_broadcastrevenuestats',
+    'BroadcastRevenueTransactions': '._stats_broadcastrevenuetransactions',
+    'BroadcastRevenueWithdrawalUrl': '._stats_broadcastrevenuewithdrawalurl',
+    'BroadcastStats': '._stats_broadcaststats',
+    'MegagroupStats': '._stats_megagroupstats',
+    'MessageStats': '._stats_messagestats',
+    'PublicForwards': '._stats_publicforwards',
+    'StoryStats': '._stats_storystats',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
@@ -0,0 +1,48 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._stories_allstories import AllStories, AllStoriesNotModified
+    from ._stories_foundstories import FoundStories
+    from ._stories_peerstories import PeerStories
+    from ._stories_stories import Stories
+    from ._stories_storyreactionslist import StoryReactionsList
+    from ._stories_storyviews import StoryViews
+    from ._stories_storyviewslist import StoryViewsList
+
+_namespaces = ()
+_modules = {
+    'AllStories': '._stories_allstories',
+    'AllStoriesNotModified': '._stories_allstories',
+    'FoundStories': '._stories_foundstories',
+    'PeerStories': '._stories_peerstories',
+    'Stories': '._stories_stories',
+    'StoryReactionsList': '._stories_storyreactionslist',
+    'StoryViews': '._stories_storyviews',
+    'StoryViewsList': '._stories_storyviewslist',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
@@ -0,0 +1,44 @@
+"""File generated by TLObjects' generator. All changes will be ERASED"""
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._updates_channeldifference import ChannelDifference, ChannelDifferenceEmpty, ChannelDifferenceTooLong
+    from ._updates_difference import Difference, DifferenceEmpty, DifferenceSlice, DifferenceTooLong
+    from ._updates_state import State
+
+_namespaces = ()
+_modules = {
+    'ChannelDifference': '._updates_channeldifference',
+    'ChannelDifferenceEmpty': '._updates_channeldifference',
+    'ChannelDifferenceTooLong': '._updates_channeldifference',
+    'Difference': '._updates_difference',
+    'DifferenceEmpty': '._updates_difference',
+    'DifferenceSlice': '._updates_difference',
+    'DifferenceTooLong': '._updates_difference',
+    'State': '._updates_state',
+}
+__all__ = [*_namespaces, *_modules]
+
+
+def __getattr__(name):
+    if name in _namespaces:
+        return importlib.import_module('.' + name, __package__)
+    if name not in _modules:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+    module = importlib.import_module(_modules[name], __package__)
+    value = globals()[name] = getattr(module, name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_namespaces, *_modules})
+
+
+if sys.version_info < (3, 7):
+    # There is no module __getattr__, so everything is imported now
+    for _name in (*_namespaces, *_modules):
+        globals()[_name] = __getattr__(_name)
+
@@ -47,116 +47,308 @@ NAMED_BLACKLIST = {
     'messages.discardEncryption'
 }
 
+# The classes have ``__slots__`` instead of a ``__dict__`` to save memory,
+# so the attributes which the library sets on instances of some types on
+# top of their arguments (by result type) need to have a slot too.
+EXTRA_SLOTS = {
+    'Update': ('_entities',),
+    'Updates': ('_entities',),
+    'User': ('participant',),
+}
+
+# Struct formats of the types which always have the same width
+FIXED_FORMATS = {
+    'int': 'i',
+    'long': 'q',
+    'double': 'd',
+}
+
 BASE_TYPES = ('string', 'bytes', 'int', 'long', 'int128',
               'int256', 'double', 'Bool', 'true', 'date')
 
 
+def _fixed_formats(arg, tlobject):
+    """
+    The struct formats to read and write the argument with, or `None`
+    if it isn't always present with a fixed width.
+    """
+    if arg.flag or arg.is_vector or arg.generic_definition:
+        return None
+    if arg.flag_indicator:
+        # Flags are read signed, but written unsigned
+        return 'i', 'I'
+    fmt = _number_format(arg, tlobject)
+    return (fmt, fmt) if fmt else None
+
+
+def _number_format(arg, tlobject):
+    """
+    The struct format of a single value of the argument (or of each of its
+    items if it's a vector), or `None` if it's not a fixed-width number.
+    """
+    # See the comment about unsigned user IDs in `_write_arg_read_code`
+    if arg.type == 'int' and (arg.name == 'user_id' or (
+            arg.name == 'id' and tlobject.result == 'User')):
+        return 'I'
+    return FIXED_FORMATS.get(arg.type)
+
+
+def _fixed_runs(tlobject):
+    """
+    Finds the runs of consecutive fixed-width arguments which can be read
+    and written with a single `struct.Struct` call, as a dictionary of
+    ``{first argument name: (arguments, read format, write format)}``.
+
+    'true' flags take no space, so they don't break runs.
+    """
+    runs = []
+    current = []
+    for arg in tlobject.args:
+        if arg.flag and arg.type == 'true':
+            continue
+        if _fixed_formats(arg, tlobject):
+            current.append(arg)
+        else:
+            runs.append(current)
+            current = []
+    runs.append(current)
+
+    return {
+        run[0].name: (
+            run,
+            ''.join(_fixed_formats(a, tlobject)[0] for a in run),
+            ''.join(_fixed_formats(a, tlobject)[1] for a in run),
+        )
+        for run in runs if len(run) > 1
+    }
+
+
+def _struct_name(fmt):
+    return '_struct_{}'.format(fmt)
+
+
 def _write_modules(
         out_dir, depth, kind, namespace_tlobjects, type_constructors):
     # namespace_tlobjects: {'namespace', [TLObject]}
     out_dir.mkdir(parents=True, exist_ok=True)
+    namespaces = sorted(x for x in namespace_tlobjects.keys() if x)
     for ns, tlobjects in namespace_tlobjects.items():
         file = out_dir / '{}.py'.format(ns or '__init__')
+        # Only the root module loads the namespaces (lazily)
+        lazy_namespaces = () if ns else namespaces
+        if kind == 'TLRequest':
+            # Requests are only imported when they're used, so each
+            # namespace can be a single module.
+            _write_module(file, depth, kind, tlobjects, type_constructors,
+                          lazy_namespaces)
+            continue
+
+        # There are way too many types to import them all up-front. Each
+        # type (with all its constructors) goes into its own module
+        # instead, which the namespace imports the first time it's used.
+        results = defaultdict(list)
+        for t in tlobjects:
+            results[t.result].append(t)
+
+        modules = {}
+        for result, constructors in sorted(results.items()):
+            module = '_' + result.lower().replace('.', '_')
+            while module in modules.values():
+                module += '_'
+
+            _write_module(out_dir / '{}.py'.format(module), depth, kind,
+                          constructors, type_constructors)
+            for t in constructors:
+                modules[t.class_name] = module
+            if '.' not in result and type_constructors[result]:
+                modules['Type' + result] = module
+
         with file.open('w') as f, SourceBuilder(f) as builder:
             builder.writeln(AUTO_GEN_NOTICE)
+            builder.writeln('import importlib')
+            builder.writeln('import sys')
+            builder.writeln('from typing import TYPE_CHECKING')
+            builder.writeln()
+            _write_lazy_loading(builder, modules, lazy_namespaces)
 
-            builder.writeln('from {}.tl.tlobject import TLObject', '.' * depth)
-            if kind != 'TLObject':
-                builder.writeln(
-                    'from {}.tl.tlobject import {}', '.' * depth, kind)
-
-            builder.writeln('from typing import Optional, List, '
-                            'Union, TYPE_CHECKING')
-
-            # Add the relative imports to the namespaces,
-            # unless we already are in a namespace.
-            if not ns:
-                builder.writeln('from . import {}', ', '.join(sorted(
-                    x for x in namespace_tlobjects.keys() if x
-                )))
-
-            # Import 'os' for those needing access to 'os.urandom()'
-            # Currently only 'random_id' needs 'os' to be imported,
-            # for all those TLObjects with arg.can_be_inferred.
-            builder.writeln('import os')
-
-            # Import struct for the .__bytes__(self) serialization
-            builder.writeln('import struct')
-
-            # Import datetime for type hinting
-            builder.writeln('from datetime import datetime')
-
-            tlobjects.sort(key=lambda x: x.name)
-
-            type_names = set()
-            type_defs = []
-
-            # Find all the types in this file and generate type definitions
-            # based on the types. The type definitions are written to the
-            # file at the end.
-            for t in tlobjects:
-                if not t.is_function:
-                    type_name = t.result
-                    if '.' in type_name:
-                        type_name = type_name[type_name.rindex('.'):]
-                    if type_name in type_names:
-                        continue
-                    type_names.add(type_name)
-                    constructors = type_constructors[type_name]
-                    if not constructors:
-                        pass
-                    elif len(constructors) == 1:
-                        type_defs.append('Type{} = {}'.format(
-                            type_name, constructors[0].class_name))
-                    else:
-                        type_defs.append('Type{} = Union[{}]'.format(
-                            type_name, ','.join(c.class_name
-                                                for c in constructors)))
-
-            imports = {}
-            primitives = {'int', 'long', 'int128', 'int256', 'double',
-                          'string', 'date', 'bytes', 'Bool', 'true'}
-            # Find all the types in other files that are used in this file
-            # and generate the information required to import those types.
-            for t in tlobjects:
-                for arg in t.args:
-                    name = arg.type
-                    if not name or name in primitives:
-                        continue
 
-                    import_space = '{}.tl.types'.format('.' * depth)
-                    if '.' in name:
-                        namespace = name.split('.')[0]
-                        name = name.split('.')[1]
-                        import_space += '.{}'.format(namespace)
-
-                    if name not in type_names:
-                        type_names.add(name)
-                        if name == 'date':
-                            imports['datetime'] = ['datetime']
-                            continue
-                        elif import_space not in imports:
-                            imports[import_space] = set()
-                        imports[import_space].add('Type{}'.format(name))
-
-            # Add imports required for type checking
-            if imports:
-                builder.writeln('if TYPE_CHECKING:')
-                for namespace, names in imports.items():
-                    builder.writeln('from {} import {}',
-                                    namespace, ', '.join(sorted(names)))
+def _write_lazy_loading(builder, modules, namespaces, defined=()):
+    """
+    Writes the module-level ``__getattr__`` (PEP 562) which imports the
+    namespaces and the ``{name: module}`` the first time they're used.
 
-                builder.end_block()
+    The names ``defined`` in the module itself are exported along with
+    those in ``__all__``.
+    """
+    # Type checkers can't know about any of the names otherwise
+    builder.writeln('if TYPE_CHECKING:')
+    if namespaces:
+        builder.writeln('from . import {}', ', '.join(namespaces))
+    by_module = defaultdict(list)
+    for name, module in modules.items():
+        by_module[module].append(name)
+    for module, names in sorted(by_module.items()):
+        builder.writeln('from .{} import {}', module, ', '.join(sorted(names)))
+    builder.end_block()
 
-            # Generate the class for every TLObject
-            for t in tlobjects:
-                _write_source_code(t, kind, builder, type_constructors)
-                builder.current_indent = 0
+    builder.writeln('_namespaces = {!r}', tuple(namespaces))
+    if modules:
+        builder.writeln('_modules = {')
+        builder.current_indent += 1
+        for name, module in sorted(modules.items()):
+            builder.writeln('{!r}: {!r},', name, '.' + module)
+        builder.current_indent -= 1
+        builder.writeln('}')
+    else:
+        builder.writeln('_modules = {}')
 
-            # Write the type definitions generated earlier.
+    # Star imports go through `__getattr__` for the names listed here
+    builder.writeln('__all__ = [*_namespaces, *_modules{}]', ''.join(
+        ', {!r}'.format(name) for name in sorted(defined)))
+    builder.writeln()
+    builder.writeln()
+
+    builder.writeln('def __getattr__(name):')
+    builder.writeln('if name in _namespaces:')
+    builder.writeln("return importlib.import_module('.' + name, __package__)")
+    builder.current_indent -= 1
+    builder.writeln('if name not in _modules:')
+    builder.writeln("raise AttributeError('module {!r} has no attribute {!r}'"
+                    ".format(__name__, name))")
+    builder.current_indent -= 1
+    builder.writeln()
+    builder.writeln('module = importlib.import_module(_modules[name], __package__)')
+    builder.writeln('value = globals()[name] = getattr(module, name)')
+    builder.writeln('return value')
+    builder.end_block()
+    builder.writeln()
+
+    builder.writeln('def __dir__():')
+    builder.writeln('return sorted({*globals(), *_namespaces, *_modules})')
+    builder.end_block()
+    builder.writeln()
+
+    builder.writeln('if sys.version_info < (3, 7):')
+    builder.writeln('# There is no module __getattr__, so everything is imported now')
+    builder.writeln('for _name in (*_namespaces, *_modules):')
+    builder.writeln('globals()[_name] = __getattr__(_name)')
+    builder.current_indent -= 1
+    builder.end_block()
+
+
+def _write_module(file, depth, kind, tlobjects, type_constructors,
+                  namespaces=()):
+    with file.open('w') as f, SourceBuilder(f) as builder:
+        builder.writeln(AUTO_GEN_NOTICE)
+
+        builder.writeln('from {}.tl.tlobject import TLObject', '.' * depth)
+        if kind != 'TLObject':
+            builder.writeln(
+                'from {}.tl.tlobject import {}', '.' * depth, kind)
+
+        builder.writeln('from typing import Optional, List, '
+                        'Union, TYPE_CHECKING')
+
+        # Import 'os' for those needing access to 'os.urandom()'
+        # Currently only 'random_id' needs 'os' to be imported,
+        # for all those TLObjects with arg.can_be_inferred.
+        builder.writeln('import os')
+
+        # Import struct for the .__bytes__(self) serialization
+        builder.writeln('import struct')
+
+        # Import datetime for type hinting
+        builder.writeln('from datetime import datetime')
+
+        if namespaces:
+            builder.writeln('import importlib')
+            builder.writeln('import sys')
             builder.writeln()
-            for line in type_defs:
-                builder.writeln(line)
+            _write_lazy_loading(builder, {}, namespaces,
+                                [t.class_name for t in tlobjects])
+
+        # Precompile the formats of the runs of fixed-width arguments
+        formats = set()
+        for t in tlobjects:
+            for _, read_fmt, write_fmt in _fixed_runs(t).values():
+                formats.update((read_fmt, write_fmt))
+
+        if formats:
+            builder.writeln()
+            for fmt in sorted(formats):
+                builder.writeln("{} = struct.Struct('<{}')", _struct_name(fmt), fmt)
+
+        tlobjects.sort(key=lambda x: x.name)
+
+        type_names = set()
+        type_defs = []
+
+        # Find all the types in this file and generate type definitions
+        # based on the types. The type definitions are written to the
+        # file at the end.
+        for t in tlobjects:
+            if not t.is_function:
+                type_name = t.result
+                if '.' in type_name:
+                    type_name = type_name[type_name.rindex('.'):]
+                if type_name in type_names:
+                    continue
+                type_names.add(type_name)
+                constructors = type_constructors[type_name]
+                if not constructors:
+                    pass
+                elif len(constructors) == 1:
+                    type_defs.append('Type{} = {}'.format(
+                        type_name, constructors[0].class_name))
+                else:
+                    type_defs.append('Type{} = Union[{}]'.format(
+                        type_name, ','.join(c.class_name
+                                            for c in constructors)))
+
+        imports = {}
+        primitives = {'int', 'long', 'int128', 'int256', 'double',
+                      'string', 'date', 'bytes', 'Bool', 'true'}
+        # Find all the types in other files that are used in this file
+        # and generate the information required to import those types.
+        for t in tlobjects:
+            for arg in t.args:
+                name = arg.type
+                if not name or name in primitives:
+                    continue
+
+                import_space = '{}.tl.types'.format('.' * depth)
+                if '.' in name:
+                    namespace = name.split('.')[0]
+                    name = name.split('.')[1]
+                    import_space += '.{}'.format(namespace)
+
+                if name not in type_names:
+                    type_names.add(name)
+                    if name == 'date':
+                        imports['datetime'] = ['datetime']
+                        continue
+                    elif import_space not in imports:
+                        imports[import_space] = set()
+                    imports[import_space].add('Type{}'.format(name))
+
+        # Add imports required for type checking
+        if imports:
+            builder.writeln('if TYPE_CHECKING:')
+            for namespace, names in imports.items():
+                builder.writeln('from {} import {}',
+                                namespace, ', '.join(sorted(names)))
+
+            builder.end_block()
+
+        # Generate the class for every TLObject
+        for t in tlobjects:
+            _write_source_code(t, kind, builder, type_constructors)
+            builder.current_indent = 0
+
+        # Write the type definitions generated earlier.
+        builder.writeln()
+        for line in type_defs:
+            builder.writeln(line)
 
 
 def _write_source_code(tlobject, kind, builder, type_constructors):
@@ -185,6 +377,13 @@ def _write_class_init(tlobject, kind, type_constructors, builder):
     builder.writeln('CONSTRUCTOR_ID = {:#x}', tlobject.id)
     builder.writeln('SUBCLASS_OF_ID = {:#x}',
                     crc32(tlobject.result.encode('ascii')))
+
+    # Subclasses (like the custom ones) still get a __dict__ unless
+    # they define their own __slots__, so they can have any attribute.
+    slots = [a.name for a in tlobject.real_args]
+    if not tlobject.is_function:
+        slots.extend(EXTRA_SLOTS.get(tlobject.result, ()))
+    builder.writeln('__slots__ = {!r}', tuple(slots))
     builder.writeln()
 
     # Convert the args to string parameters, those with flag having =None
@@ -349,9 +548,18 @@ def _write_to_bytes(tlobject, builder):
     # First constructor code, we already know its bytes
     builder.writeln('{},', repr(struct.pack('<I', tlobject.id)))
 
+    runs = _fixed_runs(tlobject)
+    in_runs = {a.name for args, _, _ in runs.values() for a in args}
     for arg in tlobject.args:
-        if _write_arg_to_bytes(builder, arg, tlobject):
-            builder.writeln(',')
+        if arg.name in runs:
+            args, _, write_fmt = runs[arg.name]
+            builder.writeln('{}.pack({}),', _struct_name(write_fmt), ', '.join(
+                _flags_value(a, tlobject) if a.flag_indicator
+                else 'self.{}'.format(a.name) for a in args
+            ))
+        elif arg.name not in in_runs:
+            if _write_arg_to_bytes(builder, arg, tlobject):
+                builder.writeln(',')
 
     builder.current_indent -= 1
     builder.writeln('))')
@@ -361,8 +569,17 @@ def _write_to_bytes(tlobject, builder):
 def _write_from_reader(tlobject, builder):
     builder.writeln('@classmethod')
     builder.writeln('def from_reader(cls, reader):')
+    runs = _fixed_runs(tlobject)
+    in_runs = {a.name for args, _, _ in runs.values() for a in args}
     for arg in tlobject.args:
-        _write_arg_read_code(builder, arg, tlobject, name='_' + arg.name)
+        if arg.name in runs:
+            args, read_fmt, _ = runs[arg.name]
+            # Flags keep their name for the code reading the flag arguments
+            builder.writeln('{} = reader.read_struct({})', ', '.join(
+                a.name if a.flag_indicator else '_' + a.name for a in args
+            ), _struct_name(read_fmt))
+        elif arg.name not in in_runs:
+            _write_arg_read_code(builder, arg, tlobject, name='_' + arg.name)
 
     builder.writeln('return cls({})', ', '.join(
         '{0}=_{0}'.format(a.name) for a in tlobject.real_args))
@@ -392,8 +609,8 @@ def _write_read_result(tlobject, builder):
     builder.writeln('@staticmethod')
     builder.writeln('def read_result(reader):')
     builder.writeln('reader.read_int()  # Vector ID')
-    builder.writeln('return [reader.read_{}() '
-                    'for _ in range(reader.read_int())]', m.group(1))
+    builder.writeln("return reader.read_array('{}', reader.read_int())",
+                    FIXED_FORMATS[m.group(1)])
 
 
 def _write_arg_to_bytes(builder, arg, tlobject, name=None):
@@ -437,21 +654,27 @@ def _write_arg_to_bytes(builder, arg, tlobject, name=None):
             # vector code, unsigned 0x1cb5c415 as little endian
             builder.write(r"b'\x15\xc4\xb5\x1c',")
 
-        builder.write("struct.pack('<i', len({})),", name)
+        fmt = _number_format(arg, tlobject)
+        if fmt:
+            # Pack the length and all the numbers at once
+            builder.write("struct.pack('<i{{}}{}'.format(len({})), len({}), *{})",
+                          fmt, name, name, name)
+        else:
+            builder.write("struct.pack('<i', len({})),", name)
 
-        # Cannot unpack the values for the outer tuple through *[(
-        # since that's a Python >3.5 feature, so add another join.
-        builder.write("b''.join(")
+            # Cannot unpack the values for the outer tuple through *[(
+            # since that's a Python >3.5 feature, so add another join.
+            builder.write("b''.join(")
 
-        # Temporary disable .is_vector, not to enter this if again
-        # Also disable .flag since it's not needed per element
-        old_flag, arg.flag = arg.flag, None
-        arg.is_vector = False
-        _write_arg_to_bytes(builder, arg, tlobject, name='x')
-        arg.is_vector = True
-        arg.flag = old_flag
+            # Temporary disable .is_vector, not to enter this if again
+            # Also disable .flag since it's not needed per element
+            old_flag, arg.flag = arg.flag, None
+            arg.is_vector = False
+            _write_arg_to_bytes(builder, arg, tlobject, name='x')
+            arg.is_vector = True
+            arg.flag = old_flag
 
-        builder.write(' for x in {})', name)
+            builder.write(' for x in {})', name)
 
     elif arg.flag_indicator:
         # Calculate the flags with those items which are not None
@@ -459,18 +682,7 @@ def _write_arg_to_bytes(builder, arg, tlobject, name=None):
             # There's a flag indicator, but no flag arguments so it's 0
             builder.write(r"b'\0\0\0\0'")
         else:
-            def fmt_flag_arg(a):
-                if a.type == 'Bool':
-                    fmt = '(0 if {0} is None else {1})'
-                else:
-                    fmt = '(0 if {0} is None or {0} is False else {1})'
-                return fmt.format('self.{}'.format(a.name), 1 << a.flag_index)
-
-            builder.write("struct.pack('<I', ")
-            builder.write(
-                ' | '.join(fmt_flag_arg(a) for a in tlobject.args if a.flag == arg.name)
-            )
-            builder.write(')')
+            builder.write("struct.pack('<I', {})", _flags_value(arg, tlobject))
 
     elif 'int' == arg.type:
         # User IDs are becoming larger than 2³¹ - 1, which would translate
@@ -528,6 +740,22 @@ def _write_arg_to_bytes(builder, arg, tlobject, name=None):
     return True  # Something was written
 
 
+def _flags_value(arg, tlobject):
+    """
+    The expression with the value of the flags indicator argument,
+    calculated from the flag arguments which are not `None`.
+    """
+    def fmt_flag_arg(a):
+        if a.type == 'Bool':
+            fmt = '(0 if {0} is None else {1})'
+        else:
+            fmt = '(0 if {0} is None or {0} is False else {1})'
+        return fmt.format('self.{}'.format(a.name), 1 << a.flag_index)
+
+    return ' | '.join(
+        fmt_flag_arg(a) for a in tlobject.args if a.flag == arg.name) or '0'
+
+
 def _write_arg_read_code(builder, arg, tlobject, name):
     """
     Writes the read code for the given argument, setting the
@@ -564,13 +792,18 @@ def _write_arg_read_code(builder, arg, tlobject, name):
             # We have to read the vector's constructor ID
             builder.writeln("reader.read_int()")
 
-        builder.writeln('{} = []', name)
-        builder.writeln('for _ in range(reader.read_int()):')
-        # Temporary disable .is_vector, not to enter this if again
-        arg.is_vector = False
-        _write_arg_read_code(builder, arg, tlobject, name='_x')
-        builder.writeln('{}.append(_x)', name)
-        arg.is_vector = True
+        if _number_format(arg, tlobject):
+            # Unpack all the numbers at once
+            builder.writeln("{} = reader.read_array('{}', reader.read_int())",
+                            name, _number_format(arg, tlobject))
+        else:
+            builder.writeln('{} = []', name)
+            builder.writeln('for _ in range(reader.read_int()):')
+            # Temporary disable .is_vector, not to enter this if again
+            arg.is_vector = False
+            _write_arg_read_code(builder, arg, tlobject, name='_x')
+            builder.writeln('{}.append(_x)', name)
+            arg.is_vector = True
 
     elif arg.flag_indicator:
         # Read the flags, which will indicate what items we should read next
@@ -639,7 +872,7 @@ def _write_arg_read_code(builder, arg, tlobject, name):
                             name, class_name)
 
     # End vector and flag blocks if required (if we opened them before)
-    if arg.is_vector:
+    if arg.is_vector and not _number_format(arg, tlobject):
         builder.end_block()
 
     if old_flag:
@@ -655,29 +888,30 @@ def _write_all_tlobjects(tlobjects, layer, builder):
     builder.writeln(AUTO_GEN_NOTICE)
     builder.writeln()
 
-    builder.writeln('from . import types, functions')
+    builder.writeln('from ..helpers import _LazyDict')
     builder.writeln()
 
     # Create a constant variable to indicate which layer this is
     builder.writeln('LAYER = {}', layer)
     builder.writeln()
 
-    # Then create the dictionary containing constructor_id: class
-    builder.writeln('tlobjects = {')
+    # Then create the dictionary containing constructor_id: class,
+    # which only imports each class the first time it's needed
+    builder.writeln('tlobjects = _LazyDict(__package__, {')
     builder.current_indent += 1
 
-    # Fill the dictionary (0x1a2b3c4f: tl.full.type.path.Class)
+    # Fill the dictionary (0x1a2b3c4f: '.full.type.path.Class')
     for tlobject in tlobjects:
-        builder.write('{:#010x}: ', tlobject.id)
+        builder.write('{:#010x}: \'.', tlobject.id)
         builder.write('functions' if tlobject.is_function else 'types')
 
         if tlobject.namespace:
             builder.write('.{}', tlobject.namespace)
 
-        builder.writeln('.{},', tlobject.class_name)
+        builder.writeln(".{}',", tlobject.class_name)
 
     builder.current_indent -= 1
-    builder.writeln('}')
+    builder.writeln('})')
 
 
 def generate_tlobjects(tlobjects, layer, import_depth, output_dir):
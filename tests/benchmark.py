@@ -0,0 +1,142 @@
+"""
+End-to-end benchmark of the network layer against `tests.fakeserver`,
+for every connection mode. Run it from the root of the repository::
+
+    python -m tests.benchmark --help
+
+For each mode, it reports how many requests per second an `MTProtoSender`
+completes with a given concurrency, their median and 99th percentile
+latency, how many updates per second were received meanwhile, and the
+peak memory allocated while sending requests (measured on a separate,
+shorter run, since tracing allocations is slow).
+
+Both the client and the server run in the same process and event loop,
+so the absolute numbers include the work of the server. They're meant to
+be compared between changes on the same machine.
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from telethon.network import (
+    ConnectionTcpFull, ConnectionTcpIntermediate, ConnectionTcpAbridged,
+    ConnectionTcpObfuscated, ConnectionHttp
+)
+from telethon.tl import functions
+
+from .fakeserver import FakeServer, connect_sender
+
+MODES = {
+    'full': (ConnectionTcpFull, False),
+    'intermediate': (ConnectionTcpIntermediate, False),
+    'abridged': (ConnectionTcpAbridged, False),
+    'obfuscated': (ConnectionTcpObfuscated, False),
+    'full-buffered': (ConnectionTcpFull, True),
+    'abridged-buffered': (ConnectionTcpAbridged, True),
+    'obfuscated-buffered': (ConnectionTcpObfuscated, True),
+    'http': (ConnectionHttp, False),
+}
+
+
+async def _send_requests(sender, count, concurrency):
+    """
+    Sends ``count`` requests keeping ``concurrency`` of them in flight,
+    and returns the latency of each.
+    """
+    latencies = []
+    remaining = count
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            await sender.send(functions.help.GetNearestDcRequest())
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def _percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+async def run_mode(name, args):
+    """
+    Benchmarks a single connection mode, returning its results as a dict.
+    """
+    connection, buffered = MODES[name]
+    updates = 0
+
+    async def on_update(_):
+        nonlocal updates
+        updates += 1
+
+    async with FakeServer(updates_per_second=args.updates) as server:
+        sender = await connect_sender(
+            server, connection, buffered, update_callback=on_update)
+        try:
+            # Warm up, also getting past the new session and salt
+            await _send_requests(sender, args.concurrency, args.concurrency)
+
+            updates = 0
+            start = time.perf_counter()
+            latencies = await _send_requests(sender, args.requests, args.concurrency)
+            elapsed = time.perf_counter() - start
+            received = updates
+
+            tracemalloc.start()
+            try:
+                await _send_requests(
+                    sender, max(args.requests // 10, args.concurrency), args.concurrency)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        finally:
+            await sender.disconnect()
+
+    return {
+        'mode': name,
+        'requests/s': args.requests / elapsed,
+        'updates/s': received / elapsed,
+        'p50 ms': _percentile(latencies, 50) * 1000,
+        'p99 ms': _percentile(latencies, 99) * 1000,
+        'peak KiB': peak / 1024,
+    }
+
+
+def _print_table(results):
+    columns = list(results[0])
+    print(''.join('{:>20}'.format(c) for c in columns))
+    for result in results:
+        print(''.join(
+            '{:>20.1f}'.format(v) if isinstance(v, float) else '{:>20}'.format(v)
+            for v in result.values()
+        ))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--requests', type=int, default=5000,
+                        help='requests to send in each mode')
+    parser.add_argument('--concurrency', type=int, default=100,
+                        help='requests in flight at the same time')
+    parser.add_argument('--updates', type=float, default=1000,
+                        help='updates per second pushed by the server')
+    parser.add_argument('--modes', default=','.join(MODES),
+                        help='comma-separated modes to run, out of: '
+                             + ', '.join(MODES))
+    args = parser.parse_args()
+
+    results = []
+    for name in args.modes.split(','):
+        results.append(await run_mode(name.strip(), args))
+
+    _print_table(results)
+
+
+if __name__ == '__main__':
+    asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,102 @@
+"""
+Benchmark of how many times the payload of a request is copied on its way
+from the `MessagePacker` to the encrypted bytes written to the connection.
+Run it from the root of the repository::
+
+    python -m tests.copy_benchmark --help
+
+For each payload size, it packs and encrypts a single request many times,
+and reports the peak memory allocated per request by each of both steps,
+in bytes and in copies of the payload (only meaningful for the bigger
+payloads, where the copies dominate), and how long both steps take.
+
+The payloads are copied into new objects, and every copy is alive until
+the encrypted data is returned, so the peak allocated memory counts them.
+The numbers are meant to be compared with those of another revision.
+"""
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+
+from telethon.network.requeststate import RequestState
+from telethon.tl.functions.upload import SaveFilePartRequest
+
+from .fakeserver import make_packer
+
+SIZES = (16, 1024, 64 * 1024, 512 * 1024)
+
+
+def _states(size, count):
+    request = SaveFilePartRequest(file_id=1, file_part=0, bytes=os.urandom(size))
+    return [RequestState(request) for _ in range(count)]
+
+
+async def _send(packer, state, trace):
+    """
+    Packs and encrypts one request, returning the peak memory allocated
+    by packing it and by encrypting it (only if ``trace``).
+    """
+    if trace:
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+
+    packer.append(state)
+    _, data = await packer.get()
+    if trace:
+        _, packed = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start_encrypting, _ = tracemalloc.get_traced_memory()
+
+    packer._state.encrypt_message_data(data)
+    if trace:
+        _, encrypted = tracemalloc.get_traced_memory()
+        return packed - start, encrypted - start_encrypting
+    return 0, 0
+
+
+async def measure(size, number):
+    """
+    Returns ``(packed bytes, encrypted bytes, microseconds)`` per request
+    of the given payload size, as the average of ``number`` requests.
+    """
+    packer = make_packer()
+
+    # The first batch allocates the buffer that's reused afterwards
+    await _send(packer, _states(size, 1)[0], False)
+
+    start = time.perf_counter()
+    for s in _states(size, number):
+        await _send(packer, s, False)
+    elapsed = time.perf_counter() - start
+
+    packed = encrypted = 0
+    tracemalloc.start()
+    try:
+        for s in _states(size, number):
+            p, e = await _send(packer, s, True)
+            packed += p
+            encrypted += e
+    finally:
+        tracemalloc.stop()
+
+    return packed / number, encrypted / number, elapsed / number * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=200,
+                        help='requests to send for every size')
+    args = parser.parse_args()
+
+    print('{:>10}{:>12}{:>10}{:>12}{:>10}{:>12}'.format(
+        'size', 'packed B', 'copies', 'encrypted B', 'copies', 'us'))
+    for size in SIZES:
+        packed, encrypted, us = await measure(size, args.number)
+        print('{:>10}{:>12.0f}{:>10.2f}{:>12.0f}{:>10.2f}{:>12.2f}'.format(
+            size, packed, packed / size, encrypted, encrypted / size, us))
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
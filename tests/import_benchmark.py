@@ -0,0 +1,62 @@
+"""
+Benchmark of how long importing the library takes, and how much memory it
+allocates. Run it from the root of the repository::
+
+    python -m tests.import_benchmark --help
+
+Every import runs in a new interpreter, so that nothing is cached. It also
+reports how many of the generated modules under `telethon.tl` were loaded
+in the process, which should be a small fraction of them.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+_SCRIPT = '''
+import json, sys, time, tracemalloc
+if {trace}:
+    tracemalloc.start()
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    'ms': elapsed * 1000,
+    'kib': tracemalloc.get_traced_memory()[0] / 1024,
+    'modules': sum(1 for m in sys.modules if m.startswith((
+        'telethon.tl.types.', 'telethon.tl.functions.'))),
+}}))
+'''
+
+
+def measure(module='telethon', trace=False):
+    """
+    Imports ``module`` in a new interpreter, returning how long it took (in
+    milliseconds), the memory held afterwards (in KiB, only if ``trace``,
+    since tracing the allocations makes importing a lot slower) and how
+    many of the generated modules were loaded, as a dict.
+    """
+    output = subprocess.check_output(
+        [sys.executable, '-c', _SCRIPT.format(module=module, trace=trace)])
+    return json.loads(output.decode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--module', default='telethon',
+                        help='module to import')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='imports to take the median of')
+    args = parser.parse_args()
+
+    traced = measure(args.module, trace=True)  # also compiles the bytecode
+    elapsed = statistics.median(
+        measure(args.module)['ms'] for _ in range(args.repeat))
+    print('import time:   {:>10.1f} ms'.format(elapsed))
+    print('memory:        {:>10.1f} KiB'.format(traced['kib']))
+    print('tl modules:    {:>10}'.format(traced['modules']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Memory benchmark of the deserialized objects. Run it from the root of the
+repository::
+
+    python -m tests.memory_benchmark --help
+
+It builds a realistic page of message history (as returned by
+:tl:`GetHistoryRequest`: messages with entities, replies, forwards and
+media, plus their users and chats), serializes it, and then measures how
+much memory is held by reading the same page many times, and how long
+reading it takes.
+"""
+import argparse
+import datetime
+import gc
+import time
+import tracemalloc
+
+from telethon.extensions import BinaryReader
+from telethon.tl import types
+
+
+def _message(i, date):
+    text = 'Message number {} with a link, a mention and some code'.format(i)
+    return types.Message(
+        id=1000 + i,
+        peer_id=types.PeerChannel(1234),
+        date=date,
+        message=text,
+        out=i % 5 == 0,
+        from_id=types.PeerUser(100 + i % 20),
+        reply_to=types.MessageReplyHeader(reply_to_msg_id=999 + i) if i % 3 == 0 else None,
+        fwd_from=types.MessageFwdHeader(
+            date=date, from_id=types.PeerUser(200 + i)) if i % 10 == 0 else None,
+        media=types.MessageMediaPhoto(photo=types.Photo(
+            id=i, access_hash=i, file_reference=b'\0' * 16, date=date,
+            sizes=[
+                types.PhotoSize('m', 320, 240, 20000),
+                types.PhotoSize('x', 800, 600, 80000),
+            ],
+            dc_id=2
+        )) if i % 7 == 0 else None,
+        entities=[
+            types.MessageEntityUrl(offset=30, length=4),
+            types.MessageEntityMention(offset=39, length=7),
+            types.MessageEntityCode(offset=56, length=4),
+        ],
+        views=i * 10,
+        forwards=i,
+        edit_date=date if i % 4 == 0 else None,
+    )
+
+
+def _user(i):
+    return types.User(
+        id=100 + i,
+        access_hash=i * 7919,
+        first_name='First {}'.format(i),
+        last_name='Last {}'.format(i),
+        username='user{}'.format(i),
+        status=types.UserStatusRecently(),
+        photo=types.UserProfilePhoto(photo_id=i, dc_id=2),
+    )
+
+
+def build_page(count):
+    """
+    Returns the bytes of a :tl:`messages.ChannelMessages` with ``count``
+    messages and the users and chat they mention.
+    """
+    date = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    return bytes(types.messages.ChannelMessages(
+        pts=1,
+        count=count * 100,
+        messages=[_message(i, date) for i in range(count)],
+        topics=[],
+        chats=[types.Channel(
+            id=1234, title='Some channel', photo=types.ChatPhotoEmpty(),
+            date=date, access_hash=1, username='somechannel', megagroup=True
+        )],
+        users=[_user(i) for i in range(20)],
+    ))
+
+
+def _read(data):
+    with BinaryReader(data) as reader:
+        return reader.tgread_object()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--messages', type=int, default=100,
+                        help='messages in each page')
+    parser.add_argument('--pages', type=int, default=200,
+                        help='pages kept in memory at once')
+    args = parser.parse_args()
+
+    data = build_page(args.messages)
+    _read(data)  # warm up any lazy import or cache
+
+    gc.collect()
+    tracemalloc.start()
+    pages = [_read(data) for _ in range(args.pages)]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(args.pages):
+        _read(data)
+    elapsed = time.perf_counter() - start
+
+    print('page size:        {:>10.1f} KiB serialized'.format(len(data) / 1024))
+    print('memory per page:  {:>10.1f} KiB'.format(held / len(pages) / 1024))
+    print('memory per msg:   {:>10.0f} B'.format(held / len(pages) / args.messages))
+    print('read time/page:   {:>10.3f} ms'.format(elapsed / args.pages * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from telethon import TelegramClient, errors
+from telethon.tl import functions
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_coalesced():
+    client = TelegramClient(None, 1, '1', coalesce_requests=True)
+    sent = []
+
+    async def invoke(sender, request, requests, ordered, pooled, flood_sleep_threshold):
+        sent.append(request)
+        await asyncio.sleep(0.01)
+        return object()
+
+    client._invoke = invoke
+
+    results = await asyncio.gather(
+        *(client._call(client._sender, functions.help.GetConfigRequest())
+          for _ in range(3)),
+        *(client._call(client._sender, functions.updates.GetStateRequest())
+          for _ in range(2))
+    )
+
+    assert len(sent) == 3
+    assert results[0] is results[1] is results[2]
+    assert results[3] is not results[4]
+    assert not client._coalesced_requests
+
+
+@pytest.mark.asyncio
+async def test_gather_requests_keeps_order_and_concurrency():
+    client = TelegramClient(None, 1, '1')
+    in_flight = 0
+    most_in_flight = 0
+
+    async def call(sender, request, ordered=False, flood_sleep_threshold=None):
+        nonlocal in_flight, most_in_flight
+        in_flight += 1
+        most_in_flight = max(most_in_flight, in_flight)
+        # Later requests finish first, to check that the order is kept
+        await asyncio.sleep(0.01 * (10 - request.id[0]))
+        in_flight -= 1
+        if request.id[0] == 5:
+            raise ValueError(request.id[0])
+        return request.id[0]
+
+    client._call = call
+    requests = [functions.messages.GetMessagesRequest([i]) for i in range(10)]
+
+    results = await client.gather_requests(
+        requests, concurrency=3, return_exceptions=True)
+
+    assert results[:5] == [0, 1, 2, 3, 4]
+    assert isinstance(results[5], ValueError)
+    assert results[6:] == [6, 7, 8, 9]
+    assert results.total == 10
+    assert most_in_flight == 3
+
+    with pytest.raises(ValueError):
+        await client.gather_requests(requests, concurrency=3)
+
+
+class _PoolSender:
+    def __init__(self, in_flight, connected=True):
+        self.in_flight = in_flight
+        self.connected = connected
+        self.sent = []
+
+    @property
+    def queue_depth(self):
+        return self.in_flight
+
+    def _transport_connected(self):
+        return self.connected
+
+    def send(self, request, ordered=False):
+        self.sent.append(request)
+        future = asyncio.get_event_loop().create_future()
+        future.set_exception(errors.FloodWaitError(request=request, capture=1000))
+        return future
+
+
+def _pooled_client(*in_flight):
+    client = TelegramClient(None, 1, '1')
+    client._sender = _PoolSender(in_flight[0])
+    client._sender_pool = [client._sender] + [
+        _PoolSender(n) for n in in_flight[1:]]
+    return client
+
+
+@pytest.mark.asyncio
+async def test_pick_pool_sender():
+    client = _pooled_client(3, 1, 0)
+    assert client._pick_pool_sender() is client._sender_pool[2]
+
+    client._sender_pool[2].connected = False
+    assert client._pick_pool_sender() is client._sender_pool[1]
+
+    # The main sender wins ties
+    client = _pooled_client(1, 1, 1)
+    assert client._pick_pool_sender() is client._sender
+
+
+@pytest.mark.asyncio
+async def test_pooled_requests_are_routed_and_flood_waits_recorded():
+    client = _pooled_client(5, 0)
+    request = functions.help.GetConfigRequest()
+
+    with pytest.raises(errors.FloodWaitError):
+        await client._call(client._sender, request)
+
+    sent, = client._sender_pool[1].sent
+    assert isinstance(sent, functions.InvokeWithoutUpdatesRequest)
+    assert sent.query is request
+    # Under the request's own ID, so the next call fails early
+    assert request.CONSTRUCTOR_ID in client._flood_waited_requests
+    with pytest.raises(errors.FloodWaitError):
+        await client._call(client._sender, request)
+    assert len(client._sender_pool[1].sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_ordered_requests_use_the_main_sender():
+    client = _pooled_client(5, 0)
+    request = functions.help.GetConfigRequest()
+
+    with pytest.raises(errors.FloodWaitError):
+        await client._call(client._sender, request, ordered=True)
+
+    assert client._sender.sent == [request]
+    assert not client._sender_pool[1].sent
+
+
+@pytest.mark.asyncio
+async def test_disconnected_pool_senders_are_dropped():
+    client = _pooled_client(0, 0, 0)
+    dropped = client._sender_pool[1]
+    disconnected = asyncio.get_event_loop().create_future()
+    disconnected.set_exception(ConnectionError('broken'))
+
+    client._drop_pool_sender(dropped, disconnected)
+    assert dropped not in client._sender_pool
+    assert len(client._sender_pool) == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_and_cancelled_pacing_keeps_the_schedule():
+    client = TelegramClient(None, 1, '1', flood_limiter=True)
+    request = functions.help.GetConfigRequest()
+    client._flood_limiter.flood_wait(request, 2)
+
+    for _ in range(100):
+        with pytest.raises(errors.FloodWaitError) as e:
+            await client._pace([request], flood_sleep_threshold=1)
+        assert e.value.seconds == 2
+
+    task = asyncio.ensure_future(client._pace([request], flood_sleep_threshold=60))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert client._flood_limiter.reserve(request) <= 2
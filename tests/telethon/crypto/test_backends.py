@@ -0,0 +1,50 @@
+"""
+tests for telethon.crypto.backends
+"""
+import os
+
+import pytest
+
+from telethon.crypto import backends, AES, AESModeCTR
+
+
+def _backend(name):
+    return next(b for b in backends._backends if b.name == name)
+
+
+@pytest.mark.parametrize('name', backends.get_backends('ige'))
+def test_ige_matches_pyaes(name):
+    backend, reference = _backend(name), _backend('pyaes')
+    key, iv, data = os.urandom(32), os.urandom(32), os.urandom(1024)
+
+    encrypted = backend.encrypt_ige(data, key, iv)
+    assert encrypted == reference.encrypt_ige(data, key, iv)
+    assert backend.decrypt_ige(encrypted, key, iv) == data
+
+
+@pytest.mark.parametrize('name', backends.get_backends('ctr'))
+def test_ctr_matches_pyaes(name):
+    key, iv, data = os.urandom(32), os.urandom(16), os.urandom(1000)
+    ctr = _backend(name).new_ctr(key, iv)
+
+    # The stream must continue between calls of any length
+    encrypted = ctr.encrypt(data[:333]) + ctr.encrypt(data[333:])
+    assert encrypted == _backend('pyaes').new_ctr(key, iv).encrypt(data)
+
+
+def test_set_backend():
+    previous = backends.get_backend('ige'), backends.get_backend('ctr')
+    try:
+        backends.set_backend('pyaes')
+        assert backends.get_backend('ige') == backends.get_backend('ctr') == 'pyaes'
+
+        key, iv = os.urandom(32), os.urandom(32)
+        assert AES.decrypt_ige(AES.encrypt_ige(b'x' * 16, key, iv), key, iv) == b'x' * 16
+        ctr = AESModeCTR(key, iv[:16])
+        assert ctr.decrypt(AESModeCTR(key, iv[:16]).encrypt(b'abc')) == b'abc'
+
+        with pytest.raises(ValueError):
+            backends.set_backend('missing')
+    finally:
+        backends.set_backend(previous[0], 'ige')
+        backends.set_backend(previous[1], 'ctr')
@@ -0,0 +1,104 @@
+"""
+tests for telethon.extensions.binaryreader
+"""
+import struct
+
+import pytest
+
+from telethon.extensions import BinaryReader
+from telethon.tl import TLObject, types
+
+
+@pytest.mark.parametrize('wrap', [bytes, bytearray, memoryview])
+def test_read_values(wrap):
+    data = (struct.pack('<iIqQd', -1, 2 ** 32 - 1, -2, 2 ** 64 - 1, 0.5)
+            + TLObject.serialize_bytes(b'short')
+            + TLObject.serialize_bytes(b'x' * 300)
+            + bytes(16))
+
+    with BinaryReader(wrap(data)) as reader:
+        assert reader.read_int() == -1
+        assert reader.read_int(signed=False) == 2 ** 32 - 1
+        assert reader.read_long() == -2
+        assert reader.read_long(signed=False) == 2 ** 64 - 1
+        assert reader.read_double() == 0.5
+
+        short = reader.tgread_bytes()
+        assert short == b'short' and type(short) is bytes
+        assert reader.tell_position() % 4 == 0
+        assert reader.tgread_bytes() == b'x' * 300
+        assert reader.read_large_int(128) == 0
+
+        reader.seek(-4)
+        assert reader.read() == bytes(4)
+        with pytest.raises(BufferError):
+            reader.read_int()
+
+
+def test_truncated_data():
+    data = TLObject.serialize_bytes(b'x' * 10)
+    with BinaryReader(data[:-3]) as reader:
+        with pytest.raises(BufferError):
+            reader.tgread_bytes()
+        assert reader.tell_position() == 0
+
+
+@pytest.mark.parametrize('wrap', [bytes, memoryview])
+def test_stream_has_the_data_left(wrap):
+    with BinaryReader(wrap(struct.pack('<ii', 1, 2))) as reader:
+        reader.read_int()
+        assert reader.stream.read() == struct.pack('<i', 2)
+        assert reader.read_int() == 2
+
+
+def test_read_object_from_memoryview():
+    peer = types.PeerUser(user_id=123)
+    with BinaryReader(memoryview(bytes(peer) + bytes(peer))) as reader:
+        assert reader.tgread_object() == peer
+        assert reader.tgread_object() == peer
+
+
+def test_read_struct():
+    fmt = struct.Struct('<iq')
+    with BinaryReader(fmt.pack(-1, 2) + bytes(4)) as reader:
+        assert reader.read_struct(fmt) == (-1, 2)
+        with pytest.raises(BufferError):
+            reader.read_struct(fmt)
+        assert reader.tell_position() == fmt.size
+
+
+def test_read_object_with_fixed_fields():
+    # The flags and the ID are read at once, followed by the flag arguments
+    media = types.MessageMediaDocument(
+        document=types.DocumentEmpty(id=-5), spoiler=True, ttl_seconds=7)
+    message = types.Message(
+        id=2 ** 31 - 1, peer_id=types.PeerChannel(1), date=None,
+        message='text', out=True, media=media, views=1, forwards=2)
+    with BinaryReader(bytes(message)) as reader:
+        read = reader.tgread_object()
+    assert bytes(read) == bytes(message)
+    assert (read.id, read.out, read.views) == (2 ** 31 - 1, True, 1)
+    assert read.media.spoiler and read.media.ttl_seconds == 7
+
+
+def test_read_array():
+    ids = list(range(-5, 5))
+    with BinaryReader(struct.pack('<10q', *ids)) as reader:
+        assert reader.read_array('q', 10) == ids
+        with pytest.raises(BufferError):
+            reader.read_array('i', 1)
+
+
+def test_number_vectors_round_trip():
+    from telethon.tl.functions.contacts import GetContactIDsRequest
+    from telethon.tl.functions.messages import GetMessagesViewsRequest
+
+    request = GetMessagesViewsRequest(
+        types.InputPeerSelf(), id=list(range(20000)), increment=False)
+    with BinaryReader(bytes(request)) as reader:
+        assert reader.tgread_object().id == request.id
+
+    ids = [2 ** 31 - 1, -1, 0]
+    data = b'\x15\xc4\xb5\x1c' + struct.pack('<i3i', 3, *ids)
+    with BinaryReader(data) as reader:
+        assert GetContactIDsRequest.read_result(reader) == ids
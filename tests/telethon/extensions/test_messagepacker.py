@@ -0,0 +1,157 @@
+"""
+tests for telethon.extensions.messagepacker
+"""
+import asyncio
+import os
+
+import pytest
+
+from telethon.extensions import BinaryReader
+from telethon.extensions.messagepacker import _BULK_WEIGHT, _BUFFER_SIZE, _SendBuffer
+from telethon.network.requeststate import (
+    RequestState, PRIORITY_BULK, PRIORITY_INTERACTIVE
+)
+from telethon.tl.core import MessageContainer, GzipPacked
+from telethon.tl.functions import PingRequest
+from telethon.tl.functions.messages import SendMessageRequest
+from telethon.tl.functions.upload import SaveFilePartRequest
+from telethon.tl.types import InputPeerSelf, MsgsAck
+
+from ...fakeserver import make_packer
+
+
+@pytest.mark.asyncio
+async def test_single_message():
+    packer = make_packer()
+    packer.append(RequestState(PingRequest(1)))
+    batch, data = await packer.get()
+
+    reader = BinaryReader(bytes(data))
+    assert reader.read_long() == batch[0].msg_id
+    reader.read_int()  # seq_no
+    assert reader.read_int() == len(batch[0].data)
+    assert reader.tgread_object() == PingRequest(1)
+    assert batch[0].container_id is None
+
+
+@pytest.mark.asyncio
+async def test_container_header_in_place():
+    packer = make_packer()
+    packer.extend([RequestState(PingRequest(i)) for i in range(3)])
+    batch, data = await packer.get()
+
+    reader = BinaryReader(bytes(data))
+    container_id = reader.read_long()
+    reader.read_int()  # seq_no
+    assert reader.read_int() == len(data) - 16
+    assert reader.read_int(signed=False) == MessageContainer.CONSTRUCTOR_ID
+    container = MessageContainer.from_reader(reader)
+
+    assert [m.obj for m in container.messages] == [PingRequest(i) for i in range(3)]
+    assert all(s.container_id == container_id for s in batch)
+    assert packer.batch_count == 1 and packer.message_count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_delay_only_when_busy():
+    packer = make_packer(batch_delay=0.05)
+
+    # Idle queue: the first request is packed right away
+    async def append_later():
+        await asyncio.sleep(0.01)
+        packer.append(RequestState(PingRequest(0)))
+
+    asyncio.get_event_loop().create_task(append_later())
+    batch, _ = await packer.get()
+    assert len(batch) == 1
+
+    # Busy queue: requests arriving within the delay join the batch
+    packer.append(RequestState(PingRequest(1)))
+    asyncio.get_event_loop().call_later(
+        0.01, packer.append, RequestState(PingRequest(2)))
+    batch, _ = await packer.get()
+    assert len(batch) == 2
+
+
+@pytest.mark.asyncio
+async def test_pending_ack_does_not_delay_a_lone_request():
+    packer = make_packer(batch_delay=1)
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+
+    # The sender queues acknowledgements before getting every batch,
+    # which must not make the queue look busy to the next request.
+    packer.append(RequestState(MsgsAck([1])))
+    loop.call_later(0.01, packer.append, RequestState(PingRequest(0)))
+    batch, _ = await asyncio.wait_for(packer.get(), 0.5)
+    assert [s.request for s in batch] == [MsgsAck([1])]
+    batch, _ = await asyncio.wait_for(packer.get(), 0.5)
+    assert [s.request for s in batch] == [PingRequest(0)]
+    assert loop.time() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_bulk_requests_go_last_but_are_not_starved():
+    packer = make_packer()
+    part = RequestState(SaveFilePartRequest(0, 0, b'x' * 1024))
+    assert part.priority == PRIORITY_BULK
+
+    # Enough interactive requests to fill every batch on their own
+    per_batch = MessageContainer.MAXIMUM_LENGTH + 1
+    packer.append(part)
+    packer.extend(RequestState(PingRequest(i), priority=PRIORITY_INTERACTIVE)
+                  for i in range(per_batch * 10))
+
+    for i in range(10):
+        batch, _ = await packer.get()
+        assert len(batch) == per_batch
+        if part in batch:
+            break
+
+    # Skipped as many times as its weight allows, then it goes first
+    assert i == _BULK_WEIGHT
+    assert batch[0] is part
+
+
+@pytest.mark.asyncio
+async def test_file_parts_are_not_compressed():
+    packer = make_packer()
+    message = SendMessageRequest(InputPeerSelf(), 'x' * 4096)
+    part = SaveFilePartRequest(0, 0, bytes(4096))
+    for request, compressed in ((message, True), (part, False)):
+        packer.append(RequestState(request))
+        _, data = await packer.get()
+        reader = BinaryReader(bytes(data[16:]))
+        is_gzip = reader.read_int(signed=False) == GzipPacked.CONSTRUCTOR_ID
+        assert is_gzip == compressed
+
+
+class _CountingBuffer(_SendBuffer):
+    __slots__ = ('written',)
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.written = 0
+
+    def write(self, data):
+        self.written += len(data)
+        super().write(data)
+
+
+@pytest.mark.asyncio
+async def test_buffer_is_reused_and_payloads_copied_once():
+    packer = make_packer()
+    packer._buffer = buffer = _CountingBuffer(_BUFFER_SIZE)
+    views = []
+    for count in (3, 1):
+        # File parts are not compressed, so they're written as they are
+        packer.extend(RequestState(SaveFilePartRequest(0, i, os.urandom(1024)))
+                      for i in range(count))
+        buffer.written = 0
+        batch, data = await packer.get()
+        views.append(data)
+
+        # Only the message headers are written besides each payload
+        assert buffer.written == sum(len(s.data) + 16 for s in batch)
+
+    assert all(v.obj is buffer.data for v in views)
@@ -0,0 +1,130 @@
+"""
+tests for telethon.network.connection
+"""
+import asyncio
+import logging
+import math
+import os
+import socket
+
+import pytest
+
+from telethon.network.connection import (
+    Connection, ConnectionTcpFull, ConnectionTcpIntermediate, ConnectionTcpAbridged
+)
+from telethon.network.connection.protocol import PacketProtocol
+from telethon.network.connection.tcpintermediate import IntermediatePacketCodec
+
+from ...fakeserver import Loggers
+
+
+async def _echo_server(tag_len):
+    # Echoes everything after the tag back, a few bytes at a time
+    # so that packets arrive split across several reads.
+    async def handle(reader, writer):
+        await reader.readexactly(tag_len)
+        while True:
+            data = await reader.read(4096)
+            if not data:
+                break
+            for i in range(0, len(data), 7):
+                writer.write(data[i:i + 7])
+                await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, '127.0.0.1', 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('buffered', [False, True])
+@pytest.mark.parametrize('cls', [
+    ConnectionTcpFull, ConnectionTcpIntermediate, ConnectionTcpAbridged
+])
+async def test_roundtrip(cls, buffered):
+    tag = cls.packet_codec.tag or b''
+    server = await _echo_server(len(tag))
+    port = server.sockets[0].getsockname()[1]
+
+    conn = cls('127.0.0.1', port, 2, loggers=Loggers(), buffered=buffered)
+    await conn.connect()
+    assert (conn._protocol is not None) == buffered
+
+    # Abridged needs lengths multiple of 4, and one packet uses the long form
+    packets = [os.urandom(n) for n in (4, 16, 508, 1024, 40000)]
+    for packet in packets:
+        await conn.send(packet)
+
+    for packet in packets:
+        assert await conn.recv() == packet
+
+    await conn.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('buffered', [False, True])
+async def test_addresses_are_raced(buffered):
+    # A port where nothing listens, to make its attempt fail
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        dead = sock.getsockname()[:2]
+
+    server = await _echo_server(len(ConnectionTcpFull.packet_codec.tag or b''))
+    alive = server.sockets[0].getsockname()[:2]
+
+    rtts = {}
+    conn = ConnectionTcpFull(*dead, 2, loggers=Loggers(), buffered=buffered,
+                             addresses=[alive], happy_eyeballs_delay=0.05,
+                             rtts=rtts)
+    await conn.connect()
+    assert (conn._ip, conn._port) == alive
+    assert rtts[dead] == math.inf
+    assert rtts[alive] < 1
+
+    await conn.send(b'ping')
+    assert await conn.recv() == b'ping'
+
+    # The next time, the address which worked is tried first
+    assert sorted(conn._addresses, key=lambda a: Connection._rtt_key(rtts, a))[0] == alive
+
+    await conn.disconnect()
+    server.close()
+    await server.wait_closed()
+
+
+class _PausableTransport:
+    def __init__(self):
+        self.paused = False
+
+    def is_closing(self):
+        return False
+
+    def pause_reading(self):
+        self.paused = True
+
+    def resume_reading(self):
+        self.paused = False
+
+
+@pytest.mark.asyncio
+async def test_reading_pauses_while_packets_pile_up():
+    protocol = PacketProtocol(logging.getLogger(__name__))
+    protocol.codec = IntermediatePacketCodec(None)
+    transport = _PausableTransport()
+    protocol.connection_made(transport)
+
+    packet = IntermediatePacketCodec(None).encode_packet(b'\0' * 16)
+    count = 0
+    while not transport.paused:
+        protocol.get_buffer(-1)[:len(packet)] = packet
+        protocol.buffer_updated(len(packet))
+        count += 1
+        assert count <= 1000
+
+    # Reading resumes once most of them are read, not after the first one
+    await protocol.read_packet()
+    assert transport.paused
+    for _ in range(count - 1):
+        await protocol.read_packet()
+    assert not transport.paused
@@ -0,0 +1,134 @@
+"""
+tests for the network layer against tests.fakeserver
+"""
+import asyncio
+import threading
+
+import pytest
+
+from telethon.network import (
+    ConnectionTcpFull, ConnectionTcpIntermediate,
+    ConnectionTcpAbridged, ConnectionTcpObfuscated, ConnectionHttp
+)
+from telethon.network.connection.tcpintermediate import RandomizedIntermediatePacketCodec
+from telethon.network.connection.tcpobfuscated import ObfuscatedIO
+from telethon.network.connection.connection import ObfuscatedConnection
+from telethon.tl import functions, types
+
+from ...fakeserver import FakeServer, connect_sender
+
+
+class _ConnectionTcpObfuscatedPadded(ObfuscatedConnection):
+    obfuscated_io = ObfuscatedIO
+    packet_codec = RandomizedIntermediatePacketCodec
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('connection,buffered', [
+    (ConnectionTcpFull, False),
+    (ConnectionTcpFull, True),
+    (ConnectionTcpIntermediate, False),
+    (ConnectionTcpAbridged, False),
+    (ConnectionTcpObfuscated, False),
+    (ConnectionTcpObfuscated, True),
+    (_ConnectionTcpObfuscatedPadded, False),
+    (ConnectionHttp, False),
+])
+async def test_auth_key_and_requests(connection, buffered):
+    async with FakeServer() as server:
+        sender = await connect_sender(server, connection, buffered, retries=1)
+        try:
+            assert sender.auth_key.key_id in server.auth_keys
+            result = await asyncio.wait_for(
+                sender.send(functions.help.GetNearestDcRequest()), 5)
+            assert isinstance(result, types.NearestDc)
+
+            file = await asyncio.wait_for(sender.send(functions.upload.GetFileRequest(
+                types.InputPeerPhotoFileLocation(types.InputPeerSelf(), 0),
+                offset=0, limit=512 * 1024
+            )), 5)
+            assert len(file.bytes) == 512 * 1024
+        finally:
+            await sender.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_updates_are_pushed():
+    received = []
+
+    async def on_update(update):
+        received.append(update)
+
+    async with FakeServer(updates_per_second=2000) as server:
+        sender = await connect_sender(
+            server, ConnectionTcpAbridged, retries=1, update_callback=on_update)
+        try:
+            await asyncio.wait_for(sender.send(functions.PingRequest(1)), 5)
+            await asyncio.sleep(0.1)
+        finally:
+            await sender.disconnect()
+
+    assert len(received) > 50
+    assert isinstance(received[0].update, types.UpdateUserStatus)
+
+
+@pytest.mark.asyncio
+async def test_http_long_polls_receive_results_and_updates():
+    received = []
+
+    async def on_update(update):
+        received.append(update)
+
+    async with FakeServer(updates_per_second=500) as server:
+        sender = await connect_sender(
+            server, ConnectionHttp, retries=1, update_callback=on_update)
+        try:
+            results = await asyncio.wait_for(asyncio.gather(
+                *(sender.send(functions.help.GetNearestDcRequest()) for _ in range(50))
+            ), 5)
+            assert all(isinstance(r, types.NearestDc) for r in results)
+
+            # Nothing else is sent, so updates can only arrive as responses
+            count = len(received)
+            await asyncio.sleep(0.2)
+            assert len(received) > count
+            assert sender._connection._waiting_requests >= ConnectionHttp.long_polls - 1
+        finally:
+            await sender.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_encrypted_in_the_executor():
+    threads = []
+
+    def record(method):
+        def wrapper(data):
+            threads.append((len(data), threading.current_thread()))
+            return method(data)
+        return wrapper
+
+    async with FakeServer() as server:
+        sender = await connect_sender(
+            server, ConnectionTcpAbridged, retries=1,
+            crypto_offload_threshold=64 * 1024)
+        state = sender._state
+        state.encrypt_message_data = record(state.encrypt_message_data)
+        state.decrypt_message_body = record(state.decrypt_message_body)
+        state.decrypt_message_data = record(state.decrypt_message_data)
+        try:
+            assert await asyncio.wait_for(sender.send(
+                functions.upload.SaveFilePartRequest(0, 0, bytes(128 * 1024))), 5)
+            file = await asyncio.wait_for(sender.send(functions.upload.GetFileRequest(
+                types.InputPeerPhotoFileLocation(types.InputPeerSelf(), 0),
+                offset=0, limit=256 * 1024
+            )), 5)
+            assert len(file.bytes) == 256 * 1024
+            await asyncio.wait_for(sender.send(functions.PingRequest(1)), 5)
+        finally:
+            await sender.disconnect()
+
+    main = threading.current_thread()
+    assert any(size >= 64 * 1024 for size, _ in threads)
+    assert any(size < 64 * 1024 for size, _ in threads)
+    for size, thread in threads:
+        assert (thread is main) == (size < 64 * 1024)
@@ -0,0 +1,188 @@
+"""
+tests for telethon.network.mtprotosender
+"""
+import asyncio
+import os
+import struct
+
+import pytest
+
+from telethon import metrics
+from telethon.crypto import AuthKey
+from telethon.errors import InvalidBufferError, RPCError
+from telethon.network.mtprotosender import MTProtoSender
+from telethon.network.requeststate import RequestState
+from telethon.tl.core import RpcResult, TLMessage
+from telethon.tl.functions import PingRequest
+from telethon.tl.types import MsgsAck, RpcError
+
+from ...fakeserver import Loggers
+
+
+def _make_sender(**kwargs):
+    sender = MTProtoSender(None, loggers=Loggers(), **kwargs)
+    sender._user_connected = True  # send() only enqueues, no loops needed
+    return sender
+
+
+async def _answer(sender, *indices):
+    """Answers the queued requests at the given positions of the batch."""
+    batch, _ = await sender._send_queue.get()
+    for i in indices:
+        batch[i].future.set_result(None)
+    await asyncio.sleep(0)
+    return batch
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_holds_back_requests():
+    created = []
+    sender = _make_sender(max_in_flight=2, trace_callback=lambda stage, state: (
+        stage == 'created' and created.append(state.request)))
+    futures = [sender.send(PingRequest(i)) for i in range(3)]
+    await asyncio.sleep(0)
+    assert len(sender._send_queue) == 2
+    assert sender.queue_depth == 3
+
+    # The request waiting for room wasn't serialized yet
+    assert created == [PingRequest(0), PingRequest(1)]
+
+    await _answer(sender, 0)
+    await asyncio.sleep(0)
+    assert created[-1] == PingRequest(2)
+    assert len(sender._send_queue) == 1
+    assert sender.wait_count == 1
+    assert not futures[2].done()
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_keeps_lists_together():
+    sender = _make_sender(max_in_flight=2)
+    sender.send(PingRequest(0))
+    rest = sender.send([PingRequest(1), PingRequest(2)])
+    await asyncio.sleep(0)
+    assert len(sender._send_queue) == 1
+
+    # A list larger than the limit goes through on its own
+    await _answer(sender, 0)
+    await asyncio.sleep(0)
+    assert len(sender._send_queue) == 2
+
+    # Anything sent after it waits for room
+    sender.send(PingRequest(3))
+    await asyncio.sleep(0)
+    assert len(sender._send_queue) == 2
+    await _answer(sender, 0, 1)
+    assert await asyncio.gather(*rest) == [None, None]
+    await asyncio.sleep(0)
+    assert len(sender._send_queue) == 1
+
+
+@pytest.mark.asyncio
+async def test_max_in_flight_cancel_waiting():
+    sender = _make_sender(max_in_flight=1)
+    sender.send(PingRequest(0))
+    waiting = sender.send(PingRequest(1))
+    last = sender.send(PingRequest(2))
+    await asyncio.sleep(0)
+    assert sender.queue_depth == 3
+
+    # Cancelling a request waiting for room makes it leave the line
+    waiting.cancel()
+    await asyncio.sleep(0.01)
+    assert sender.queue_depth == 2
+
+    await _answer(sender, 0)
+    await asyncio.sleep(0)
+    batch, _ = await sender._send_queue.get()
+    assert [state.request for state in batch] == [PingRequest(2)]
+    assert batch[0].future is last
+
+
+@pytest.mark.asyncio
+async def test_trace_callback_sees_every_stage():
+    stages = []
+    sender = _make_sender(
+        trace_callback=lambda stage, state, *error: stages.append((stage, error)))
+
+    future = sender.send(PingRequest(1))
+    batch, _ = await sender._send_queue.get()
+    state = batch[0]
+    sender._pending_state[state.msg_id] = state
+
+    await sender._handle_rpc_result(TLMessage(
+        0, 0, RpcResult(state.msg_id, None, RpcError(400, 'SOME_ERROR'))))
+    with pytest.raises(RPCError) as e:
+        await future
+
+    assert [stage for stage, _ in stages] == ['created', 'packed', 'result', 'error']
+    assert stages[-1][1] == (e.value,)
+
+
+@pytest.mark.asyncio
+async def test_trace_callback_ignores_internal_states():
+    traced = []
+    sender = _make_sender(
+        trace_callback=lambda stage, state, *error: traced.append(state.request))
+
+    sender.send(PingRequest(1))
+    sender._send_queue.append(RequestState(MsgsAck([1])))
+    batch, _ = await sender._send_queue.get()
+    sender._trace_batch('encrypted', batch)
+
+    assert len(batch) == 2
+    assert all(isinstance(request, PingRequest) for request in traced)
+    assert len(traced) == 3  # created, packed and encrypted
+
+
+@pytest.mark.asyncio
+async def test_senders_sharing_metrics_keep_their_own_gauges():
+    shared = metrics.Metrics(registry=False)
+    main = _make_sender(metrics=shared)
+    pool = _make_sender(metrics=shared, metrics_label='pool-1')
+
+    main.send(PingRequest(0))
+    main.send(PingRequest(1))
+    main._record_sent([])
+    pool._record_sent([])
+
+    assert shared.get('send_queue_depth', 'main') == 2
+    assert shared.get('send_queue_depth', 'pool-1') == 0
+
+
+class _BrokenKeyConnection:
+    """Answers everything with the 404 sent for unknown auth keys."""
+    _connected = True
+
+    async def recv(self):
+        return struct.pack('<i', -404)
+
+    async def disconnect(self):
+        pass
+
+    def needs_long_poll(self):
+        return False
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('manage_auth_key', [True, False])
+async def test_broken_auth_key(manage_auth_key):
+    key = os.urandom(256)
+    sender = MTProtoSender(AuthKey(key), loggers=Loggers(),
+                           manage_auth_key=manage_auth_key)
+    sender._user_connected = True
+    sender._connection = _BrokenKeyConnection()
+    sender._disconnected = asyncio.get_event_loop().create_future()
+
+    await sender._recv_loop()
+    assert sender.auth_key.key == (None if manage_auth_key else key)
+    with pytest.raises(InvalidBufferError):
+        await sender.disconnected
+
+
+@pytest.mark.asyncio
+async def test_unmanaged_auth_key_is_never_generated():
+    sender = MTProtoSender(None, loggers=Loggers(), manage_auth_key=False)
+    with pytest.raises(ConnectionError):
+        await sender.connect(_BrokenKeyConnection())
+    assert not sender.is_connected()
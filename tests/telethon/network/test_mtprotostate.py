@@ -0,0 +1,99 @@
+"""
+tests for telethon.network.mtprotostate
+"""
+import datetime
+import os
+import struct
+from hashlib import sha256
+
+import pytest
+
+from telethon.crypto import AES, AuthKey
+from telethon.errors import SecurityError
+from telethon.extensions import BinaryReader
+from telethon.network.mtprotostate import MTProtoState
+from telethon.tl import types
+from telethon.tl.core import LazyUpdate, MessageContainer
+
+from ...fakeserver import Loggers
+
+
+def _encrypt_from_server(state, msg_id, seq_no, obj):
+    """Encrypts the object as the server would send it to the state."""
+    body = bytes(obj)
+    plain = struct.pack('<qqqii', 0, state.id, msg_id, seq_no, len(body)) + body
+    plain += os.urandom(-(len(plain) + 12) % 16 + 12)
+    key = state.auth_key.key
+    msg_key = sha256(key[96:128] + plain).digest()[8:24]
+    aes_key, aes_iv = MTProtoState._calc_key(key, msg_key, False)
+    return (struct.pack('<Q', state.auth_key.key_id) + msg_key
+            + AES.encrypt_ige(plain, aes_key, aes_iv))
+
+
+def _update_short(update):
+    return bytes(types.UpdateShort(update, datetime.datetime(
+        2020, 1, 1, tzinfo=datetime.timezone.utc)))
+
+
+def test_update_short_is_read_lazily():
+    state = MTProtoState(None, Loggers(), lazy_updates=True)
+    update = types.UpdateUserStatus(123, types.UserStatusRecently())
+    data = _update_short(update)
+
+    short = state._read_lazily(BinaryReader(data), len(data))
+    assert isinstance(short, types.UpdateShort)
+    assert isinstance(short.update, LazyUpdate)
+    assert short.update.CONSTRUCTOR_ID == types.UpdateUserStatus.CONSTRUCTOR_ID
+    assert bytes(short.update.decode()) == bytes(update)
+    assert bytes(short) == data
+
+
+def test_lazy_updates_inside_containers():
+    state = MTProtoState(None, Loggers(), lazy_updates=True)
+    inner = [
+        _update_short(types.UpdateUserStatus(1, types.UserStatusEmpty())),
+        bytes(types.UpdatesTooLong()),
+    ]
+    data = struct.pack('<Ii', MessageContainer.CONSTRUCTOR_ID, len(inner))
+    for i, body in enumerate(inner):
+        data += struct.pack('<qii', i, 0, len(body)) + body
+
+    container = state._read_lazily(BinaryReader(data), len(data))
+    assert isinstance(container.messages[0].obj.update, LazyUpdate)
+    assert container.messages[1].obj == types.UpdatesTooLong()
+
+
+def test_salts_follow_the_schedule():
+    state = MTProtoState(None, Loggers())
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    hour = datetime.timedelta(hours=1)
+    state.set_future_salts(types.FutureSalts(0, now, [
+        types.FutureSalt(now + hour, now + 2 * hour, 2),
+        types.FutureSalt(now - hour, now + hour, 1),
+    ]))
+    assert state.salt == 1
+    assert state.update_salt() > 3600
+
+    state.time_offset = 3601
+    assert 0 < state.update_salt() < 3600
+    assert state.salt == 2
+
+    state.reset()
+    assert state.update_salt() <= 0
+    assert state.salt == 2
+
+
+def test_decrypt_in_two_steps():
+    state = MTProtoState(AuthKey(os.urandom(256)), Loggers())
+    obj = types.UpdateUserStatus(123, types.UserStatusRecently())
+    body = _encrypt_from_server(state, 1234, 5, obj)
+
+    # The first step may run in another thread, the second reads the object
+    message = state.unpack_message(state.decrypt_message_body(body))
+    one_step = state.decrypt_message_data(body)
+    for m in (message, one_step):
+        assert (m.msg_id, m.seq_no, bytes(m.obj)) == (1234, 5, bytes(obj))
+
+    tampered = body[:-16] + bytes(16)
+    with pytest.raises(SecurityError):
+        state.decrypt_message_body(tampered)
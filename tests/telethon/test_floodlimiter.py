@@ -0,0 +1,62 @@
+"""
+tests for telethon.floodlimiter
+"""
+from unittest import mock
+
+from telethon.floodlimiter import FloodLimiter
+from telethon.tl import functions, types
+
+
+def _send(chat_id):
+    return functions.messages.SendMessageRequest(
+        types.InputPeerChat(chat_id), 'hi', random_id=1)
+
+
+def test_rate_is_learnt_from_flood_waits():
+    limiter = FloodLimiter(burst=1)
+    with mock.patch('time.monotonic') as monotonic:
+        # Unknown methods are never paced, 10 per second here
+        for i in range(11):
+            monotonic.return_value = i / 10
+            assert limiter.reserve(_send(1)) == 0
+
+        limiter.flood_wait(_send(1), 30)
+        assert limiter.reserve(_send(1)) == 30  # waits and then half as fast
+        assert round(limiter.reserve(_send(1)), 3) == 30.2
+        assert limiter.reserve(functions.updates.GetStateRequest()) == 0
+
+        # Successes recover the rate up to 90% of what caused the wait
+        for _ in range(100):
+            limiter.succeeded(_send(1))
+        monotonic.return_value = 100
+        limiter.reserve(_send(1))
+        assert round(limiter.reserve(_send(1)), 3) == round(1 / 9, 3)
+
+
+def test_slow_mode_is_per_chat():
+    limiter = FloodLimiter()
+    with mock.patch('time.monotonic') as monotonic:
+        # Only the time left is known at first
+        monotonic.return_value = 0
+        limiter.slow_mode_wait(_send(1), 50)
+        assert limiter.reserve(_send(1)) == 50
+        assert limiter.reserve(_send(2)) == 0
+
+        # But with a message that went through, the whole period is
+        monotonic.return_value = 50
+        limiter.succeeded(_send(1))
+        monotonic.return_value = 70
+        limiter.slow_mode_wait(_send(1), 40)
+        assert limiter.reserve(_send(1)) == 40
+        assert limiter.reserve(_send(1)) == 100
+
+
+def test_released_slots_do_not_delay_the_rest():
+    limiter = FloodLimiter(burst=1)
+    with mock.patch('time.monotonic') as monotonic:
+        monotonic.return_value = 0
+        limiter.flood_wait(_send(1), 2)
+        delay = limiter.reserve(_send(1))
+        for _ in range(100):
+            limiter.release(_send(1))
+            assert limiter.reserve(_send(1)) == delay
@@ -0,0 +1,32 @@
+"""
+tests for telethon.metrics
+"""
+from telethon import metrics
+
+
+def test_export_prometheus():
+    registry = metrics.Registry()
+    first = metrics.Metrics({'client': 'a'}, registry=registry)
+    second = metrics.Metrics({'client': 'b'}, registry=registry)
+
+    first.inc('requests_total', 'GetConfigRequest')
+    first.inc('requests_total', 'GetConfigRequest')
+    second.inc('bytes_sent_total', value=100)
+    first.observe('request_latency_seconds', 0.2, 'GetConfigRequest')
+    first.observe('request_latency_seconds', 60, 'GetConfigRequest')
+
+    assert first.get('requests_total', 'GetConfigRequest') == 2
+    assert first.get('request_latency_seconds', 'GetConfigRequest').count == 2
+
+    lines = metrics.export_prometheus(registry).splitlines()
+    assert '# TYPE telethon_requests_total counter' in lines
+    assert 'telethon_requests_total{client="a",request="GetConfigRequest"} 2' in lines
+    assert 'telethon_bytes_sent_total{client="b"} 100' in lines
+    assert 'telethon_request_latency_seconds_bucket' \
+           '{client="a",request="GetConfigRequest",le="0.25"} 1' in lines
+    assert 'telethon_request_latency_seconds_bucket' \
+           '{client="a",request="GetConfigRequest",le="+Inf"} 2' in lines
+    assert 'telethon_request_latency_seconds_count' \
+           '{client="a",request="GetConfigRequest"} 2' in lines
+
+    assert metrics.export_prometheus(metrics.Metrics(registry=False)) == ''
@@ -33,3 +33,21 @@ def test_fancy_rpcerror_capture_pickle():
     unpickled_error = pickle.loads(pickle.dumps(error))
     _assert_equality(error, unpickled_error)
     assert error.new_dc == unpickled_error.new_dc
+
+
+def test_tlobject_pickle():
+    # Generated types only have slots, custom ones (like Message) a __dict__ too
+    from telethon.tl import types
+
+    user = types.User(id=1, first_name='first', status=types.UserStatusRecently())
+    user.participant = types.ChannelParticipant(user_id=1, date=None)
+    message = types.Message(id=1, peer_id=types.PeerUser(1), date=None, message='hi')
+
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        unpickled_user = pickle.loads(pickle.dumps(user, protocol))
+        assert unpickled_user == user
+        assert unpickled_user.participant == user.participant
+
+        unpickled_message = pickle.loads(pickle.dumps(message, protocol))
+        assert unpickled_message == message
+        assert unpickled_message.message == 'hi'
@@ -0,0 +1,55 @@
+"""
+tests for telethon.responsecache
+"""
+from unittest import mock
+
+from telethon.responsecache import ResponseCache
+from telethon.tl import functions, types
+
+
+def _full_channel(channel_id):
+    return functions.channels.GetFullChannelRequest(types.InputChannel(channel_id, 0))
+
+
+def test_results_expire():
+    cache = ResponseCache()
+    request = _full_channel(1)
+    assert cache.get(request) is None
+
+    cache.add(request, 'result')
+    assert cache.get(_full_channel(1)) == 'result'
+    assert cache.get(_full_channel(2)) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    with mock.patch('time.monotonic', return_value=float('inf')):
+        assert cache.get(request) is None
+    assert len(cache) == 0
+
+
+def test_only_cacheable_requests_are_kept():
+    cache = ResponseCache({functions.help.GetConfigRequest: 0}, max_size=2)
+    cache.add(functions.help.GetConfigRequest(), 'config')
+    cache.add(functions.updates.GetStateRequest(), 'state')
+    assert len(cache) == 0
+
+    for i in range(3):
+        cache.add(_full_channel(i), i)
+    assert len(cache) == 2
+    assert cache.get(_full_channel(0)) is None
+
+
+def test_invalidate():
+    cache = ResponseCache()
+    cache.add(_full_channel(1), 1)
+    cache.add(_full_channel(2), 2)
+    cache.add(functions.help.GetNearestDcRequest(), 'dc')
+
+    cache.invalidate(_full_channel(1))
+    assert cache.get(_full_channel(1)) is None
+    assert cache.get(_full_channel(2)) == 2
+
+    cache.invalidate(functions.channels.GetFullChannelRequest)
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
@@ -0,0 +1,41 @@
+"""
+tests for telethon.tl.core.gzippacked
+"""
+import os
+
+from telethon.extensions import BinaryReader
+from telethon.tl.core import GzipPacked
+
+
+def _is_gzipped(data):
+    return data[:4] == GzipPacked.CONSTRUCTOR_ID.to_bytes(4, 'little')
+
+
+def test_compressible_data_is_gzipped():
+    data = b'telethon' * 4096
+    packed = GzipPacked.gzip_if_smaller(True, data)
+    assert _is_gzipped(packed)
+    assert len(packed) < len(data)
+    assert GzipPacked.read(BinaryReader(packed)) == data
+
+    # Only requests are ever compressed
+    assert GzipPacked.gzip_if_smaller(False, data) is data
+
+
+def test_incompressible_data_is_sent_raw():
+    data = os.urandom(32 * 1024)
+    assert not GzipPacked._compressible(data)
+    assert GzipPacked.gzip_if_smaller(True, data) is data
+
+
+def test_only_a_sample_of_large_data_is_looked_at():
+    # Compressible except for the start and middle, which are sampled
+    data = bytearray(16 * 1024)
+    data[:2048] = os.urandom(2048)
+    data[8192:8192 + 2048] = os.urandom(2048)
+    assert not GzipPacked._compressible(data)
+    assert GzipPacked.gzip_if_smaller(True, data) is data
+
+    # Below the threshold, compressing is always attempted
+    small = bytes(data[:8192])
+    assert _is_gzipped(GzipPacked.gzip_if_smaller(True, small))
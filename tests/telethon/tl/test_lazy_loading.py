@@ -0,0 +1,61 @@
+"""
+tests for the lazily loaded modules of telethon.tl
+"""
+import pathlib
+
+import pytest
+
+import telethon
+from telethon.client.users import _coalesced_ids
+from telethon.responsecache import ResponseCache
+from telethon.tl import TLRequest, types, functions
+from telethon.tl.alltlobjects import tlobjects
+
+from ...import_benchmark import measure
+
+
+def test_import_loads_few_modules():
+    tl = pathlib.Path(telethon.__file__).parent / 'tl'
+    generated = sum(1 for d in ('types', 'functions')
+                    for _ in (tl / d).glob('*.py'))
+
+    # Importing everything used to take hundreds of milliseconds
+    assert measure()['modules'] < generated / 5
+
+
+def test_names_are_loaded_on_access():
+    assert 'Message' in dir(types)
+    assert 'messages' in dir(types)
+    assert types.messages.Messages.__name__ == 'Messages'
+    assert functions.messages.GetHistoryRequest.__name__ == 'GetHistoryRequest'
+    with pytest.raises(AttributeError):
+        types.NotAType
+
+
+@pytest.mark.parametrize('module,names', [
+    ('telethon.tl.types', ['WebPageAttributeStory', 'TypeMessage', 'messages']),
+    ('telethon.tl.types.messages', ['Messages']),
+    ('telethon.tl.functions', ['messages', 'PingRequest']),
+])
+def test_star_imports_load_everything(module, names):
+    scope = {}
+    exec('from {} import *'.format(module), scope)
+    for name in names:
+        assert name in scope
+    assert 'importlib' not in scope
+
+
+def test_tlobjects_table():
+    cid = types.UpdateUserTyping.CONSTRUCTOR_ID
+    assert cid in tlobjects
+    assert tlobjects.get(cid) is types.UpdateUserTyping
+    assert tlobjects[types.messages.Messages.CONSTRUCTOR_ID] is types.messages.Messages
+    assert tlobjects.get(0) is None
+    assert len(tlobjects) == len(list(tlobjects.values()))
+
+
+def test_request_tables_are_resolved():
+    # These are kept by name to not import them until they're used
+    for cid in set(ResponseCache().ttls) | _coalesced_ids():
+        assert issubclass(tlobjects[cid], TLRequest)
+    assert functions.help.GetConfigRequest.CONSTRUCTOR_ID in _coalesced_ids()
@@ -0,0 +1,72 @@
+"""
+Benchmark of serializing and deserializing some of the most common types.
+Run it from the root of the repository::
+
+    python -m tests.tl_benchmark --help
+
+For each type, it reports how long ``bytes(obj)`` and reading the object
+back with a `BinaryReader` take, as the best of several runs.
+"""
+import argparse
+import datetime
+import timeit
+
+from telethon.extensions import BinaryReader
+from telethon.tl import types
+
+from .memory_benchmark import _message, _user
+
+_DATE = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def objects():
+    """
+    Returns ``{name: object}`` with the objects to benchmark.
+    """
+    message = _message(7, _DATE)
+    return {
+        'Message': message,
+        'User': _user(1),
+        'Channel': types.Channel(
+            id=1234, title='Some channel', photo=types.ChatPhotoEmpty(),
+            date=_DATE, access_hash=1, username='somechannel', megagroup=True,
+            participants_count=1000
+        ),
+        'UpdateNewMessage': types.UpdateNewMessage(
+            message=message, pts=100, pts_count=1),
+        'UpdateShort': types.UpdateShort(
+            update=types.UpdateUserStatus(
+                user_id=1, status=types.UserStatusOnline(_DATE)),
+            date=_DATE
+        ),
+    }
+
+
+def _read(data):
+    with BinaryReader(data) as reader:
+        return reader.tgread_object()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=20000,
+                        help='operations in each run')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='runs to take the best of')
+    args = parser.parse_args()
+
+    print('{:>20}{:>15}{:>15}'.format('type', 'write us', 'read us'))
+    for name, obj in objects().items():
+        data = bytes(obj)
+        assert bytes(_read(data)) == data
+
+        write = min(timeit.repeat(
+            lambda: bytes(obj), number=args.number, repeat=args.repeat))
+        read = min(timeit.repeat(
+            lambda: _read(data), number=args.number, repeat=args.repeat))
+        print('{:>20}{:>15.2f}{:>15.2f}'.format(
+            name, write / args.number * 1e6, read / args.number * 1e6))
+
+
+if __name__ == '__main__':
+    main()